@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/analyzedtestvariant/predicate.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/analyzedtestvariant/predicate.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.analysis.proto.v1 import predicate as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_predicate__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nGgo.chromium.org/luci/analysis/proto/analyzedtestvariant/predicate.proto\x12!luci.analysis.analyzedtestvariant\x1a\x36go.chromium.org/luci/analysis/proto/v1/predicate.proto\"\x93\x01\n\tPredicate\x12\x16\n\x0etest_id_regexp\x18\x01 \x01(\t\x12\x33\n\x07variant\x18\x02 \x01(\x0b\x32\".luci.analysis.v1.VariantPredicate\x12\x39\n\x06status\x18\x03 \x01(\x0e\x32).luci.analysis.analyzedtestvariant.Status*\x93\x01\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x1a\n\x16HAS_UNEXPECTED_RESULTS\x10\x05\x12\t\n\x05\x46LAKY\x10\n\x12\x1b\n\x17\x43ONSISTENTLY_UNEXPECTED\x10\x14\x12\x19\n\x15\x43ONSISTENTLY_EXPECTED\x10\x1e\x12\x12\n\x0eNO_NEW_RESULTS\x10(B?Z=go.chromium.org/luci/analysis/proto/analyzedtestvariant;atvpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.analyzedtestvariant.predicate_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z=go.chromium.org/luci/analysis/proto/analyzedtestvariant;atvpb'
+  _globals['_STATUS']._serialized_start=317
+  _globals['_STATUS']._serialized_end=464
+  _globals['_PREDICATE']._serialized_start=167
+  _globals['_PREDICATE']._serialized_end=314
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,33 @@
+from PB.go.chromium.org.luci.analysis.proto.v1 import predicate as _predicate_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    STATUS_UNSPECIFIED: _ClassVar[Status]
+    HAS_UNEXPECTED_RESULTS: _ClassVar[Status]
+    FLAKY: _ClassVar[Status]
+    CONSISTENTLY_UNEXPECTED: _ClassVar[Status]
+    CONSISTENTLY_EXPECTED: _ClassVar[Status]
+    NO_NEW_RESULTS: _ClassVar[Status]
+STATUS_UNSPECIFIED: Status
+HAS_UNEXPECTED_RESULTS: Status
+FLAKY: Status
+CONSISTENTLY_UNEXPECTED: Status
+CONSISTENTLY_EXPECTED: Status
+NO_NEW_RESULTS: Status
+
+class Predicate(_message.Message):
+    __slots__ = ("test_id_regexp", "variant", "status")
+    TEST_ID_REGEXP_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    test_id_regexp: str
+    variant: _predicate_pb2.VariantPredicate
+    status: Status
+    def __init__(self, test_id_regexp: _Optional[str] = ..., variant: _Optional[_Union[_predicate_pb2.VariantPredicate, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ...) -> None: ...
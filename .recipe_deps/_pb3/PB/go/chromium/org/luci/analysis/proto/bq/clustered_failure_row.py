@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/clustered_failure_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/clustered_failure_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import failure_reason as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_failure__reason__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nBgo.chromium.org/luci/analysis/proto/bq/clustered_failure_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/bq/common.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a;go.chromium.org/luci/analysis/proto/v1/failure_reason.proto\"\xd5\r\n\x13\x43lusteredFailureRow\x12\x0f\n\x07project\x18\' \x01(\t\x12\x19\n\x11\x63luster_algorithm\x18\x01 \x01(\t\x12\x12\n\ncluster_id\x18\x02 \x01(\t\x12\x1a\n\x12test_result_system\x18\x03 \x01(\t\x12\x1e\n\x16ingested_invocation_id\x18\x15 \x01(\t\x12\x16\n\x0etest_result_id\x18\x04 \x01(\t\x12\x30\n\x0clast_updated\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x32\n\x0epartition_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0bis_included\x18\x07 \x01(\x08\x12&\n\x1eis_included_with_high_priority\x18\x08 \x01(\x08\x12\x10\n\x08\x63hunk_id\x18\t \x01(\t\x12\x13\n\x0b\x63hunk_index\x18\n \x01(\x03\x12\r\n\x05realm\x18\x0b \x01(\t\x12<\n\x12test_id_structured\x18- \x01(\x0b\x32 .luci.analysis.bq.TestIdentifier\x12\x0f\n\x07test_id\x18\x0c \x01(\t\x12\x18\n\x10previous_test_id\x18. \x01(\t\x12-\n\x07variant\x18\r \x03(\x0b\x32\x1c.luci.analysis.v1.StringPair\x12*\n\x04tags\x18  \x03(\x0b\x32\x1c.luci.analysis.v1.StringPair\x12\x14\n\x0cvariant_hash\x18\x0e \x01(\t\x12\x37\n\x0e\x66\x61ilure_reason\x18\x0f \x01(\x0b\x32\x1f.luci.analysis.v1.FailureReason\x12\x46\n\x16\x62ug_tracking_component\x18\x10 \x01(\x0b\x32&.luci.analysis.v1.BugTrackingComponent\x12.\n\nstart_time\x18\x11 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08\x64uration\x18\x12 \x01(\x01\x12K\n\x0c\x65xonerations\x18! \x03(\x0b\x32\x35.luci.analysis.bq.ClusteredFailureRow.TestExoneration\x12:\n\x10presubmit_run_id\x18\x14 \x01(\x0b\x32 .luci.analysis.v1.PresubmitRunId\x12\x1b\n\x13presubmit_run_owner\x18\x1d \x01(\t\x12\x1a\n\x12presubmit_run_mode\x18\" \x01(\t\x12\x1c\n\x14presubmit_run_status\x18# \x01(\t\x12\x14\n\x0c\x62uild_status\x18$ \x01(\t\x12\x16\n\x0e\x62uild_critical\x18% \x01(\x08\x12(\n ingested_invocation_result_index\x18\x16 \x01(\x03\x12(\n ingested_invocation_result_count\x18\x17 \x01(\x03\x12&\n\x1eis_ingested_invocation_blocked\x18\x18 \x01(\x08\x12\x13\n\x0btest_run_id\x18\x19 \x01(\t\x12\x1d\n\x15test_run_result_index\x18\x1a \x01(\x03\x12\x1d\n\x15test_run_result_count\x18\x1b \x01(\x03\x12\x1b\n\x13is_test_run_blocked\x18\x1c \x01(\x08\x12*\n\x07sources\x18( \x01(\x0b\x32\x19.luci.analysis.v1.Sources\x12/\n\nsource_ref\x18) \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12\x17\n\x0fsource_ref_hash\x18* \x01(\t\x12 \n\x18\x62uild_gardener_rotations\x18+ \x03(\t\x12T\n\x13test_variant_branch\x18, \x01(\x0b\x32\x37.luci.analysis.bq.ClusteredFailureRow.TestVariantBranch\x1a\x46\n\x0fTestExoneration\x12\x33\n\x06reason\x18\x01 \x01(\x0e\x32#.luci.analysis.v1.ExonerationReason\x1al\n\x11TestVariantBranch\x12\x1a\n\x12\x66laky_verdicts_24h\x18\x01 \x01(\x03\x12\x1f\n\x17unexpected_verdicts_24h\x18\x02 \x01(\x03\x12\x1a\n\x12total_verdicts_24h\x18\x03 \x01(\x03J\x04\x08\x13\x10\x14J\x04\x08\x1f\x10 J\x04\x08\x1e\x10\x1fJ\x04\x08&\x10\'B-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.clustered_failure_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_CLUSTEREDFAILUREROW']._serialized_start=343
+  _globals['_CLUSTEREDFAILUREROW']._serialized_end=2092
+  _globals['_CLUSTEREDFAILUREROW_TESTEXONERATION']._serialized_start=1888
+  _globals['_CLUSTEREDFAILUREROW_TESTEXONERATION']._serialized_end=1958
+  _globals['_CLUSTEREDFAILUREROW_TESTVARIANTBRANCH']._serialized_start=1960
+  _globals['_CLUSTEREDFAILUREROW_TESTVARIANTBRANCH']._serialized_end=2068
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/common.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/analysis/proto/bq/common.proto\x12\x10luci.analysis.bq\x1a/go.chromium.org/luci/common/bq/pb/options.proto\"\xb8\x01\n\x0eTestIdentifier\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x15\n\rmodule_scheme\x18\x02 \x01(\t\x12\"\n\x0emodule_variant\x18\x03 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12\x1b\n\x13module_variant_hash\x18\x04 \x01(\t\x12\x13\n\x0b\x63oarse_name\x18\x05 \x01(\t\x12\x11\n\tfine_name\x18\x06 \x01(\t\x12\x11\n\tcase_name\x18\x07 \x01(\t\"{\n\x12TestIdentifierBase\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x15\n\rmodule_scheme\x18\x02 \x01(\t\x12\x13\n\x0b\x63oarse_name\x18\x05 \x01(\t\x12\x11\n\tfine_name\x18\x06 \x01(\t\x12\x11\n\tcase_name\x18\x07 \x01(\t\"q\n\x18RootInvocationDefinition\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1e\n\nproperties\x18\x03 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12\x17\n\x0fproperties_hash\x18\x04 \x01(\t\"m\n\x0f\x42uildDescriptor\x12\x41\n\randroid_build\x18\x01 \x01(\x0b\x32(.luci.analysis.bq.AndroidBuildDescriptorH\x00\x42\x0c\n\ndefinitionJ\x04\x08\x02\x10\x03R\x03url\"d\n\x16\x41ndroidBuildDescriptor\x12\x12\n\ndata_realm\x18\x01 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x02 \x01(\t\x12\x14\n\x0c\x62uild_target\x18\x03 \x01(\t\x12\x10\n\x08\x62uild_id\x18\x04 \x01(\tB-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_TESTIDENTIFIER'].fields_by_name['module_variant']._loaded_options = None
+  _globals['_TESTIDENTIFIER'].fields_by_name['module_variant']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_ROOTINVOCATIONDEFINITION'].fields_by_name['properties']._loaded_options = None
+  _globals['_ROOTINVOCATIONDEFINITION'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTIDENTIFIER']._serialized_start=123
+  _globals['_TESTIDENTIFIER']._serialized_end=307
+  _globals['_TESTIDENTIFIERBASE']._serialized_start=309
+  _globals['_TESTIDENTIFIERBASE']._serialized_end=432
+  _globals['_ROOTINVOCATIONDEFINITION']._serialized_start=434
+  _globals['_ROOTINVOCATIONDEFINITION']._serialized_end=547
+  _globals['_BUILDDESCRIPTOR']._serialized_start=549
+  _globals['_BUILDDESCRIPTOR']._serialized_end=658
+  _globals['_ANDROIDBUILDDESCRIPTOR']._serialized_start=660
+  _globals['_ANDROIDBUILDDESCRIPTOR']._serialized_end=760
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,69 @@
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestIdentifier(_message.Message):
+    __slots__ = ("module_name", "module_scheme", "module_variant", "module_variant_hash", "coarse_name", "fine_name", "case_name")
+    MODULE_NAME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_SCHEME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    COARSE_NAME_FIELD_NUMBER: _ClassVar[int]
+    FINE_NAME_FIELD_NUMBER: _ClassVar[int]
+    CASE_NAME_FIELD_NUMBER: _ClassVar[int]
+    module_name: str
+    module_scheme: str
+    module_variant: str
+    module_variant_hash: str
+    coarse_name: str
+    fine_name: str
+    case_name: str
+    def __init__(self, module_name: _Optional[str] = ..., module_scheme: _Optional[str] = ..., module_variant: _Optional[str] = ..., module_variant_hash: _Optional[str] = ..., coarse_name: _Optional[str] = ..., fine_name: _Optional[str] = ..., case_name: _Optional[str] = ...) -> None: ...
+
+class TestIdentifierBase(_message.Message):
+    __slots__ = ("module_name", "module_scheme", "coarse_name", "fine_name", "case_name")
+    MODULE_NAME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_SCHEME_FIELD_NUMBER: _ClassVar[int]
+    COARSE_NAME_FIELD_NUMBER: _ClassVar[int]
+    FINE_NAME_FIELD_NUMBER: _ClassVar[int]
+    CASE_NAME_FIELD_NUMBER: _ClassVar[int]
+    module_name: str
+    module_scheme: str
+    coarse_name: str
+    fine_name: str
+    case_name: str
+    def __init__(self, module_name: _Optional[str] = ..., module_scheme: _Optional[str] = ..., coarse_name: _Optional[str] = ..., fine_name: _Optional[str] = ..., case_name: _Optional[str] = ...) -> None: ...
+
+class RootInvocationDefinition(_message.Message):
+    __slots__ = ("system", "name", "properties", "properties_hash")
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_HASH_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    name: str
+    properties: str
+    properties_hash: str
+    def __init__(self, system: _Optional[str] = ..., name: _Optional[str] = ..., properties: _Optional[str] = ..., properties_hash: _Optional[str] = ...) -> None: ...
+
+class BuildDescriptor(_message.Message):
+    __slots__ = ("android_build",)
+    ANDROID_BUILD_FIELD_NUMBER: _ClassVar[int]
+    android_build: AndroidBuildDescriptor
+    def __init__(self, android_build: _Optional[_Union[AndroidBuildDescriptor, _Mapping]] = ...) -> None: ...
+
+class AndroidBuildDescriptor(_message.Message):
+    __slots__ = ("data_realm", "branch", "build_target", "build_id")
+    DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    BUILD_TARGET_FIELD_NUMBER: _ClassVar[int]
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    data_realm: str
+    branch: str
+    build_target: str
+    build_id: str
+    def __init__(self, data_realm: _Optional[str] = ..., branch: _Optional[str] = ..., build_target: _Optional[str] = ..., build_id: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/failure_association_rules_history_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/failure_association_rules_history_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import rules as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_rules__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nRgo.chromium.org/luci/analysis/proto/bq/failure_association_rules_history_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x32go.chromium.org/luci/analysis/proto/v1/rules.proto\"\x85\x06\n!FailureAssociationRulesHistoryRow\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0f\n\x07rule_id\x18\x03 \x01(\t\x12\x17\n\x0frule_definition\x18\x04 \x01(\t\x12>\n\x1apredicate_last_update_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x44\n\x03\x62ug\x18\x06 \x01(\x0b\x32\x37.luci.analysis.bq.FailureAssociationRulesHistoryRow.Bug\x12\x11\n\tis_active\x18\x07 \x01(\x08\x12\x17\n\x0fis_managing_bug\x18\x08 \x01(\x08\x12 \n\x18is_managing_bug_priority\x18\t \x01(\x08\x12M\n)is_managing_bug_priority_last_update_time\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x33\n\x0esource_cluster\x18\x0b \x01(\x0b\x32\x1b.luci.analysis.v1.ClusterId\x12\x42\n\x14\x62ug_management_state\x18\x0c \x01(\x0b\x32$.luci.analysis.v1.BugManagementState\x12/\n\x0b\x63reate_time\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12>\n\x1alast_auditable_update_time\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x34\n\x10last_update_time\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x31\n\rexported_time\x18\x10 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a!\n\x03\x42ug\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\tB-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.failure_association_rules_history_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_FAILUREASSOCIATIONRULESHISTORYROW']._serialized_start=243
+  _globals['_FAILUREASSOCIATIONRULESHISTORYROW']._serialized_end=1016
+  _globals['_FAILUREASSOCIATIONRULESHISTORYROW_BUG']._serialized_start=983
+  _globals['_FAILUREASSOCIATIONRULESHISTORYROW_BUG']._serialized_end=1016
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,54 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import rules as _rules_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class FailureAssociationRulesHistoryRow(_message.Message):
+    __slots__ = ("name", "project", "rule_id", "rule_definition", "predicate_last_update_time", "bug", "is_active", "is_managing_bug", "is_managing_bug_priority", "is_managing_bug_priority_last_update_time", "source_cluster", "bug_management_state", "create_time", "last_auditable_update_time", "last_update_time", "exported_time")
+    class Bug(_message.Message):
+        __slots__ = ("system", "id")
+        SYSTEM_FIELD_NUMBER: _ClassVar[int]
+        ID_FIELD_NUMBER: _ClassVar[int]
+        system: str
+        id: str
+        def __init__(self, system: _Optional[str] = ..., id: _Optional[str] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    RULE_ID_FIELD_NUMBER: _ClassVar[int]
+    RULE_DEFINITION_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_LAST_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    BUG_FIELD_NUMBER: _ClassVar[int]
+    IS_ACTIVE_FIELD_NUMBER: _ClassVar[int]
+    IS_MANAGING_BUG_FIELD_NUMBER: _ClassVar[int]
+    IS_MANAGING_BUG_PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    IS_MANAGING_BUG_PRIORITY_LAST_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_CLUSTER_FIELD_NUMBER: _ClassVar[int]
+    BUG_MANAGEMENT_STATE_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    LAST_AUDITABLE_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    LAST_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    EXPORTED_TIME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    project: str
+    rule_id: str
+    rule_definition: str
+    predicate_last_update_time: _timestamp_pb2.Timestamp
+    bug: FailureAssociationRulesHistoryRow.Bug
+    is_active: bool
+    is_managing_bug: bool
+    is_managing_bug_priority: bool
+    is_managing_bug_priority_last_update_time: _timestamp_pb2.Timestamp
+    source_cluster: _common_pb2.ClusterId
+    bug_management_state: _rules_pb2.BugManagementState
+    create_time: _timestamp_pb2.Timestamp
+    last_auditable_update_time: _timestamp_pb2.Timestamp
+    last_update_time: _timestamp_pb2.Timestamp
+    exported_time: _timestamp_pb2.Timestamp
+    def __init__(self, name: _Optional[str] = ..., project: _Optional[str] = ..., rule_id: _Optional[str] = ..., rule_definition: _Optional[str] = ..., predicate_last_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., bug: _Optional[_Union[FailureAssociationRulesHistoryRow.Bug, _Mapping]] = ..., is_active: bool = ..., is_managing_bug: bool = ..., is_managing_bug_priority: bool = ..., is_managing_bug_priority_last_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., source_cluster: _Optional[_Union[_common_pb2.ClusterId, _Mapping]] = ..., bug_management_state: _Optional[_Union[_rules_pb2.BugManagementState, _Mapping]] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_auditable_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., exported_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/failure_attribute_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/failure_attribute_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nBgo.chromium.org/luci/analysis/proto/bq/failure_attribute_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\"\xd5\x01\n\x13\x46\x61ilureAttributeRow\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x1a\n\x12test_result_system\x18\x02 \x01(\t\x12\x1e\n\x16ingested_invocation_id\x18\x03 \x01(\t\x12\x16\n\x0etest_result_id\x18\x04 \x01(\t\x12\x32\n\x0epartition_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12%\n\x1d\x61ttributed_filtered_run_count\x18\x06 \x01(\x03\x42-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.failure_attribute_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_FAILUREATTRIBUTEROW']._serialized_start=122
+  _globals['_FAILUREATTRIBUTEROW']._serialized_end=335
+# @@protoc_insertion_point(module_scope)
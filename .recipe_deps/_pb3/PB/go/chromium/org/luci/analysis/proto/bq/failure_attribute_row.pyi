@@ -0,0 +1,25 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class FailureAttributeRow(_message.Message):
+    __slots__ = ("project", "test_result_system", "ingested_invocation_id", "test_result_id", "partition_time", "attributed_filtered_run_count")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULT_SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    INGESTED_INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTED_FILTERED_RUN_COUNT_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_result_system: str
+    ingested_invocation_id: str
+    test_result_id: str
+    partition_time: _timestamp_pb2.Timestamp
+    attributed_filtered_run_count: int
+    def __init__(self, project: _Optional[str] = ..., test_result_system: _Optional[str] = ..., ingested_invocation_id: _Optional[str] = ..., test_result_id: _Optional[str] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., attributed_filtered_run_count: _Optional[int] = ...) -> None: ...
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/grouped_changepoint_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/grouped_changepoint_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nDgo.chromium.org/luci/analysis/proto/bq/grouped_changepoint_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\"\xcb\x04\n\x15GroupedChangepointRow\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12\x10\n\x08ref_hash\x18\x04 \x01(\t\x12\x1b\n\x07variant\x18\x05 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12(\n\x03ref\x18\x06 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12&\n\x1eunexpected_source_verdict_rate\x18\x07 \x01(\x01\x12/\n\'previous_unexpected_source_verdict_rate\x18\x08 \x01(\x01\x12%\n\x1dprevious_nominal_end_position\x18\t \x01(\x03\x12\x16\n\x0estart_position\x18\n \x01(\x03\x12\'\n\x1fstart_position_lower_bound_99th\x18\x0b \x01(\x03\x12\'\n\x1fstart_position_upper_bound_99th\x18\x0c \x01(\x03\x12.\n\nstart_hour\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x33\n\x0fstart_hour_week\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0btest_id_num\x18\x0f \x01(\x03\x12\x10\n\x08group_id\x18\x10 \x01(\t\x12+\n\x07version\x18\x11 \x01(\x0b\x32\x1a.google.protobuf.TimestampB-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.grouped_changepoint_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_GROUPEDCHANGEPOINTROW'].fields_by_name['variant']._loaded_options = None
+  _globals['_GROUPEDCHANGEPOINTROW'].fields_by_name['variant']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_GROUPEDCHANGEPOINTROW']._serialized_start=227
+  _globals['_GROUPEDCHANGEPOINTROW']._serialized_end=814
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,49 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GroupedChangepointRow(_message.Message):
+    __slots__ = ("project", "test_id", "variant_hash", "ref_hash", "variant", "ref", "unexpected_source_verdict_rate", "previous_unexpected_source_verdict_rate", "previous_nominal_end_position", "start_position", "start_position_lower_bound_99th", "start_position_upper_bound_99th", "start_hour", "start_hour_week", "test_id_num", "group_id", "version")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    UNEXPECTED_SOURCE_VERDICT_RATE_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_UNEXPECTED_SOURCE_VERDICT_RATE_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_NOMINAL_END_POSITION_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_LOWER_BOUND_99TH_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_UPPER_BOUND_99TH_FIELD_NUMBER: _ClassVar[int]
+    START_HOUR_FIELD_NUMBER: _ClassVar[int]
+    START_HOUR_WEEK_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_NUM_FIELD_NUMBER: _ClassVar[int]
+    GROUP_ID_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    variant_hash: str
+    ref_hash: str
+    variant: str
+    ref: _sources_pb2.SourceRef
+    unexpected_source_verdict_rate: float
+    previous_unexpected_source_verdict_rate: float
+    previous_nominal_end_position: int
+    start_position: int
+    start_position_lower_bound_99th: int
+    start_position_upper_bound_99th: int
+    start_hour: _timestamp_pb2.Timestamp
+    start_hour_week: _timestamp_pb2.Timestamp
+    test_id_num: int
+    group_id: str
+    version: _timestamp_pb2.Timestamp
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., ref_hash: _Optional[str] = ..., variant: _Optional[str] = ..., ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., unexpected_source_verdict_rate: _Optional[float] = ..., previous_unexpected_source_verdict_rate: _Optional[float] = ..., previous_nominal_end_position: _Optional[int] = ..., start_position: _Optional[int] = ..., start_position_lower_bound_99th: _Optional[int] = ..., start_position_upper_bound_99th: _Optional[int] = ..., start_hour: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., start_hour_week: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., test_id_num: _Optional[int] = ..., group_id: _Optional[str] = ..., version: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,45 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as _ants_common_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AntsArtifactRow(_message.Message):
+    __slots__ = ("build_type", "build_id", "build_provider", "branch", "build_target", "invocation_id", "work_unit_id", "test_result_id", "name", "size", "content_type", "creation_time", "artifact_type", "completion_time", "insert_time")
+    BUILD_TYPE_FIELD_NUMBER: _ClassVar[int]
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    BUILD_PROVIDER_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    BUILD_TARGET_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    WORK_UNIT_ID_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    CREATION_TIME_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    COMPLETION_TIME_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    build_type: _ants_common_pb2.BuildType
+    build_id: str
+    build_provider: str
+    branch: str
+    build_target: str
+    invocation_id: str
+    work_unit_id: str
+    test_result_id: str
+    name: str
+    size: int
+    content_type: str
+    creation_time: int
+    artifact_type: str
+    completion_time: _timestamp_pb2.Timestamp
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, build_type: _Optional[_Union[_ants_common_pb2.BuildType, str]] = ..., build_id: _Optional[str] = ..., build_provider: _Optional[str] = ..., branch: _Optional[str] = ..., build_target: _Optional[str] = ..., invocation_id: _Optional[str] = ..., work_unit_id: _Optional[str] = ..., test_result_id: _Optional[str] = ..., name: _Optional[str] = ..., size: _Optional[int] = ..., content_type: _Optional[str] = ..., creation_time: _Optional[int] = ..., artifact_type: _Optional[str] = ..., completion_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/legacy/ants_common.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/legacy/ants_common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n?go.chromium.org/luci/analysis/proto/bq/legacy/ants_common.proto\x12\x17luci.analysis.bq.legacy\")\n\nStringPair\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"X\n\x06Timing\x12\x1a\n\x12\x63reation_timestamp\x18\x01 \x01(\x03\x12\x1a\n\x12\x63omplete_timestamp\x18\x02 \x01(\x03\x12\x16\n\x0e\x63reation_month\x18\x03 \x01(\t\"\xc2\x01\n\tDebugInfo\x12\x15\n\rerror_message\x18\x01 \x01(\t\x12\r\n\x05trace\x18\x02 \x01(\t\x12\x36\n\nerror_type\x18\x03 \x01(\x0e\x32\".luci.analysis.bq.legacy.ErrorType\x12\x19\n\x11phase_in_progress\x18\x04 \x01(\t\x12\x12\n\nerror_name\x18\x05 \x01(\t\x12\x12\n\nerror_code\x18\x06 \x01(\x03\x12\x14\n\x0c\x65rror_origin\x18\x07 \x01(\t\"\x82\x01\n\rSkippedReason\x12\x38\n\x0breason_type\x18\x01 \x01(\x0e\x32#.luci.analysis.bq.legacy.ReasonType\x12\x0f\n\x07trigger\x18\x02 \x01(\t\x12\x16\n\x0ereason_message\x18\x03 \x01(\t\x12\x0e\n\x06\x62ug_id\x18\x04 \x01(\t\"M\n\x04Test\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x37\n\nproperties\x18\x02 \x03(\x0b\x32#.luci.analysis.bq.legacy.StringPair\"S\n\x14\x41\x63onfigFlagOverrides\x12;\n\raconfig_flags\x18\x01 \x03(\x0b\x32$.luci.analysis.bq.legacy.AconfigFlag\"\xb4\x03\n\x0b\x41\x63onfigFlag\x12\x14\n\x0c\x66lag_package\x18\x01 \x01(\t\x12\x11\n\tflag_name\x18\x02 \x01(\t\x12\x16\n\x0e\x66lag_namespace\x18\x03 \x01(\t\x12\x39\n\x05state\x18\x04 \x01(\x0e\x32*.luci.analysis.bq.legacy.AconfigFlag.State\x12\x43\n\npermission\x18\x05 \x01(\x0e\x32/.luci.analysis.bq.legacy.AconfigFlag.Permission\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x0b\n\x03\x62ug\x18\x07 \x01(\t\"T\n\x05State\x12\x1a\n\x16\x46LAG_STATE_UNSPECIFIED\x10\x00\x12\x16\n\x12\x46LAG_STATE_ENABLED\x10\x01\x12\x17\n\x13\x46LAG_STATE_DISABLED\x10\x02\"l\n\nPermission\x12\x1f\n\x1b\x46LAG_PERMISSION_UNSPECIFIED\x10\x00\x12\x1d\n\x19\x46LAG_PERMISSION_READ_ONLY\x10\x01\x12\x1e\n\x1a\x46LAG_PERMISSION_READ_WRITE\x10\x02*g\n\tBuildType\x12\x1a\n\x16\x42UILD_TYPE_UNSPECIFIED\x10\x00\x12\r\n\tSUBMITTED\x10\x01\x12\x0b\n\x07PENDING\x10\x02\x12\x0c\n\x08\x45XTERNAL\x10\x03\x12\t\n\x05TRAIN\x10\x04\x12\t\n\x05LOCAL\x10\x05*\x9d\x01\n\x0eSchedulerState\x12\x1f\n\x1bSCHEDULER_STATE_UNSPECIFIED\x10\x00\x12\n\n\x06QUEUED\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\t\n\x05\x45RROR\x10\x03\x12\r\n\tCOMPLETED\x10\x04\x12\r\n\tCANCELLED\x10\x05\x12\x1b\n\x17SCHEDULER_STATE_PENDING\x10\x06\x12\x0b\n\x07SKIPPED\x10\x07*\xe2\x01\n\tErrorType\x12\x1a\n\x16\x45RROR_TYPE_UNSPECIFIED\x10\x00\x12\x10\n\x0cTEST_FAILURE\x10\x01\x12\x0b\n\x07TIMEOUT\x10\x02\x12\x12\n\x0eTEST_CANCELLED\x10\x03\x12\x0f\n\x0bINFRA_ERROR\x10\x04\x12\x1d\n\x19SYSTEM_UNDER_TEST_CRASHED\x10\x05\x12\x10\n\x0cNOT_EXECUTED\x10\x06\x12\x1a\n\x16LOST_SYSTEM_UNDER_TEST\x10\x07\x12\x14\n\x10\x44\x45PENDENCY_ISSUE\x10\x08\x12\x12\n\x0e\x43USTOMER_ISSUE\x10\t*9\n\nReasonType\x12\x16\n\x12REASON_UNSPECIFIED\x10\x00\x12\x13\n\x0fREASON_DEMOTION\x10\x01\x42\x34Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.legacy.ants_common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpb'
+  _globals['_BUILDTYPE']._serialized_start=1158
+  _globals['_BUILDTYPE']._serialized_end=1261
+  _globals['_SCHEDULERSTATE']._serialized_start=1264
+  _globals['_SCHEDULERSTATE']._serialized_end=1421
+  _globals['_ERRORTYPE']._serialized_start=1424
+  _globals['_ERRORTYPE']._serialized_end=1650
+  _globals['_REASONTYPE']._serialized_start=1652
+  _globals['_REASONTYPE']._serialized_end=1709
+  _globals['_STRINGPAIR']._serialized_start=92
+  _globals['_STRINGPAIR']._serialized_end=133
+  _globals['_TIMING']._serialized_start=135
+  _globals['_TIMING']._serialized_end=223
+  _globals['_DEBUGINFO']._serialized_start=226
+  _globals['_DEBUGINFO']._serialized_end=420
+  _globals['_SKIPPEDREASON']._serialized_start=423
+  _globals['_SKIPPEDREASON']._serialized_end=553
+  _globals['_TEST']._serialized_start=555
+  _globals['_TEST']._serialized_end=632
+  _globals['_ACONFIGFLAGOVERRIDES']._serialized_start=634
+  _globals['_ACONFIGFLAGOVERRIDES']._serialized_end=717
+  _globals['_ACONFIGFLAG']._serialized_start=720
+  _globals['_ACONFIGFLAG']._serialized_end=1156
+  _globals['_ACONFIGFLAG_STATE']._serialized_start=962
+  _globals['_ACONFIGFLAG_STATE']._serialized_end=1046
+  _globals['_ACONFIGFLAG_PERMISSION']._serialized_start=1048
+  _globals['_ACONFIGFLAG_PERMISSION']._serialized_end=1156
+# @@protoc_insertion_point(module_scope)
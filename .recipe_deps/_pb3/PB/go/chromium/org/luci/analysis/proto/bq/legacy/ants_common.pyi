@@ -0,0 +1,168 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BuildType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    BUILD_TYPE_UNSPECIFIED: _ClassVar[BuildType]
+    SUBMITTED: _ClassVar[BuildType]
+    PENDING: _ClassVar[BuildType]
+    EXTERNAL: _ClassVar[BuildType]
+    TRAIN: _ClassVar[BuildType]
+    LOCAL: _ClassVar[BuildType]
+
+class SchedulerState(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SCHEDULER_STATE_UNSPECIFIED: _ClassVar[SchedulerState]
+    QUEUED: _ClassVar[SchedulerState]
+    RUNNING: _ClassVar[SchedulerState]
+    ERROR: _ClassVar[SchedulerState]
+    COMPLETED: _ClassVar[SchedulerState]
+    CANCELLED: _ClassVar[SchedulerState]
+    SCHEDULER_STATE_PENDING: _ClassVar[SchedulerState]
+    SKIPPED: _ClassVar[SchedulerState]
+
+class ErrorType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    ERROR_TYPE_UNSPECIFIED: _ClassVar[ErrorType]
+    TEST_FAILURE: _ClassVar[ErrorType]
+    TIMEOUT: _ClassVar[ErrorType]
+    TEST_CANCELLED: _ClassVar[ErrorType]
+    INFRA_ERROR: _ClassVar[ErrorType]
+    SYSTEM_UNDER_TEST_CRASHED: _ClassVar[ErrorType]
+    NOT_EXECUTED: _ClassVar[ErrorType]
+    LOST_SYSTEM_UNDER_TEST: _ClassVar[ErrorType]
+    DEPENDENCY_ISSUE: _ClassVar[ErrorType]
+    CUSTOMER_ISSUE: _ClassVar[ErrorType]
+
+class ReasonType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    REASON_UNSPECIFIED: _ClassVar[ReasonType]
+    REASON_DEMOTION: _ClassVar[ReasonType]
+BUILD_TYPE_UNSPECIFIED: BuildType
+SUBMITTED: BuildType
+PENDING: BuildType
+EXTERNAL: BuildType
+TRAIN: BuildType
+LOCAL: BuildType
+SCHEDULER_STATE_UNSPECIFIED: SchedulerState
+QUEUED: SchedulerState
+RUNNING: SchedulerState
+ERROR: SchedulerState
+COMPLETED: SchedulerState
+CANCELLED: SchedulerState
+SCHEDULER_STATE_PENDING: SchedulerState
+SKIPPED: SchedulerState
+ERROR_TYPE_UNSPECIFIED: ErrorType
+TEST_FAILURE: ErrorType
+TIMEOUT: ErrorType
+TEST_CANCELLED: ErrorType
+INFRA_ERROR: ErrorType
+SYSTEM_UNDER_TEST_CRASHED: ErrorType
+NOT_EXECUTED: ErrorType
+LOST_SYSTEM_UNDER_TEST: ErrorType
+DEPENDENCY_ISSUE: ErrorType
+CUSTOMER_ISSUE: ErrorType
+REASON_UNSPECIFIED: ReasonType
+REASON_DEMOTION: ReasonType
+
+class StringPair(_message.Message):
+    __slots__ = ("name", "value")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    value: str
+    def __init__(self, name: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+
+class Timing(_message.Message):
+    __slots__ = ("creation_timestamp", "complete_timestamp", "creation_month")
+    CREATION_TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    COMPLETE_TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    CREATION_MONTH_FIELD_NUMBER: _ClassVar[int]
+    creation_timestamp: int
+    complete_timestamp: int
+    creation_month: str
+    def __init__(self, creation_timestamp: _Optional[int] = ..., complete_timestamp: _Optional[int] = ..., creation_month: _Optional[str] = ...) -> None: ...
+
+class DebugInfo(_message.Message):
+    __slots__ = ("error_message", "trace", "error_type", "phase_in_progress", "error_name", "error_code", "error_origin")
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    TRACE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_TYPE_FIELD_NUMBER: _ClassVar[int]
+    PHASE_IN_PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_NAME_FIELD_NUMBER: _ClassVar[int]
+    ERROR_CODE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_ORIGIN_FIELD_NUMBER: _ClassVar[int]
+    error_message: str
+    trace: str
+    error_type: ErrorType
+    phase_in_progress: str
+    error_name: str
+    error_code: int
+    error_origin: str
+    def __init__(self, error_message: _Optional[str] = ..., trace: _Optional[str] = ..., error_type: _Optional[_Union[ErrorType, str]] = ..., phase_in_progress: _Optional[str] = ..., error_name: _Optional[str] = ..., error_code: _Optional[int] = ..., error_origin: _Optional[str] = ...) -> None: ...
+
+class SkippedReason(_message.Message):
+    __slots__ = ("reason_type", "trigger", "reason_message", "bug_id")
+    REASON_TYPE_FIELD_NUMBER: _ClassVar[int]
+    TRIGGER_FIELD_NUMBER: _ClassVar[int]
+    REASON_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    BUG_ID_FIELD_NUMBER: _ClassVar[int]
+    reason_type: ReasonType
+    trigger: str
+    reason_message: str
+    bug_id: str
+    def __init__(self, reason_type: _Optional[_Union[ReasonType, str]] = ..., trigger: _Optional[str] = ..., reason_message: _Optional[str] = ..., bug_id: _Optional[str] = ...) -> None: ...
+
+class Test(_message.Message):
+    __slots__ = ("name", "properties")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    properties: _containers.RepeatedCompositeFieldContainer[StringPair]
+    def __init__(self, name: _Optional[str] = ..., properties: _Optional[_Iterable[_Union[StringPair, _Mapping]]] = ...) -> None: ...
+
+class AconfigFlagOverrides(_message.Message):
+    __slots__ = ("aconfig_flags",)
+    ACONFIG_FLAGS_FIELD_NUMBER: _ClassVar[int]
+    aconfig_flags: _containers.RepeatedCompositeFieldContainer[AconfigFlag]
+    def __init__(self, aconfig_flags: _Optional[_Iterable[_Union[AconfigFlag, _Mapping]]] = ...) -> None: ...
+
+class AconfigFlag(_message.Message):
+    __slots__ = ("flag_package", "flag_name", "flag_namespace", "state", "permission", "description", "bug")
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        FLAG_STATE_UNSPECIFIED: _ClassVar[AconfigFlag.State]
+        FLAG_STATE_ENABLED: _ClassVar[AconfigFlag.State]
+        FLAG_STATE_DISABLED: _ClassVar[AconfigFlag.State]
+    FLAG_STATE_UNSPECIFIED: AconfigFlag.State
+    FLAG_STATE_ENABLED: AconfigFlag.State
+    FLAG_STATE_DISABLED: AconfigFlag.State
+    class Permission(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        FLAG_PERMISSION_UNSPECIFIED: _ClassVar[AconfigFlag.Permission]
+        FLAG_PERMISSION_READ_ONLY: _ClassVar[AconfigFlag.Permission]
+        FLAG_PERMISSION_READ_WRITE: _ClassVar[AconfigFlag.Permission]
+    FLAG_PERMISSION_UNSPECIFIED: AconfigFlag.Permission
+    FLAG_PERMISSION_READ_ONLY: AconfigFlag.Permission
+    FLAG_PERMISSION_READ_WRITE: AconfigFlag.Permission
+    FLAG_PACKAGE_FIELD_NUMBER: _ClassVar[int]
+    FLAG_NAME_FIELD_NUMBER: _ClassVar[int]
+    FLAG_NAMESPACE_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    PERMISSION_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    BUG_FIELD_NUMBER: _ClassVar[int]
+    flag_package: str
+    flag_name: str
+    flag_namespace: str
+    state: AconfigFlag.State
+    permission: AconfigFlag.Permission
+    description: str
+    bug: str
+    def __init__(self, flag_package: _Optional[str] = ..., flag_name: _Optional[str] = ..., flag_namespace: _Optional[str] = ..., state: _Optional[_Union[AconfigFlag.State, str]] = ..., permission: _Optional[_Union[AconfigFlag.Permission, str]] = ..., description: _Optional[str] = ..., bug: _Optional[str] = ...) -> None: ...
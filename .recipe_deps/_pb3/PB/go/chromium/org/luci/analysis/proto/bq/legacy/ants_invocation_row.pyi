@@ -0,0 +1,63 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as _ants_common_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AntsInvocationRow(_message.Message):
+    __slots__ = ("build_id", "invocation_id", "scheduler_state", "test", "properties", "test_labels", "primary_build", "extra_builds", "timing", "runner", "scheduler", "summary", "trigger", "users", "tags", "test_definition_id", "completion_time", "insert_time")
+    class AndroidBuild(_message.Message):
+        __slots__ = ("build_provider", "branch", "build_target", "build_id")
+        BUILD_PROVIDER_FIELD_NUMBER: _ClassVar[int]
+        BRANCH_FIELD_NUMBER: _ClassVar[int]
+        BUILD_TARGET_FIELD_NUMBER: _ClassVar[int]
+        BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+        build_provider: str
+        branch: str
+        build_target: str
+        build_id: str
+        def __init__(self, build_provider: _Optional[str] = ..., branch: _Optional[str] = ..., build_target: _Optional[str] = ..., build_id: _Optional[str] = ...) -> None: ...
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    SCHEDULER_STATE_FIELD_NUMBER: _ClassVar[int]
+    TEST_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    TEST_LABELS_FIELD_NUMBER: _ClassVar[int]
+    PRIMARY_BUILD_FIELD_NUMBER: _ClassVar[int]
+    EXTRA_BUILDS_FIELD_NUMBER: _ClassVar[int]
+    TIMING_FIELD_NUMBER: _ClassVar[int]
+    RUNNER_FIELD_NUMBER: _ClassVar[int]
+    SCHEDULER_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_FIELD_NUMBER: _ClassVar[int]
+    TRIGGER_FIELD_NUMBER: _ClassVar[int]
+    USERS_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    TEST_DEFINITION_ID_FIELD_NUMBER: _ClassVar[int]
+    COMPLETION_TIME_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    build_id: str
+    invocation_id: str
+    scheduler_state: _ants_common_pb2.SchedulerState
+    test: _ants_common_pb2.Test
+    properties: _containers.RepeatedCompositeFieldContainer[_ants_common_pb2.StringPair]
+    test_labels: _containers.RepeatedScalarFieldContainer[str]
+    primary_build: AntsInvocationRow.AndroidBuild
+    extra_builds: _containers.RepeatedCompositeFieldContainer[AntsInvocationRow.AndroidBuild]
+    timing: _ants_common_pb2.Timing
+    runner: str
+    scheduler: str
+    summary: str
+    trigger: str
+    users: _containers.RepeatedScalarFieldContainer[str]
+    tags: _containers.RepeatedScalarFieldContainer[str]
+    test_definition_id: str
+    completion_time: _timestamp_pb2.Timestamp
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, build_id: _Optional[str] = ..., invocation_id: _Optional[str] = ..., scheduler_state: _Optional[_Union[_ants_common_pb2.SchedulerState, str]] = ..., test: _Optional[_Union[_ants_common_pb2.Test, _Mapping]] = ..., properties: _Optional[_Iterable[_Union[_ants_common_pb2.StringPair, _Mapping]]] = ..., test_labels: _Optional[_Iterable[str]] = ..., primary_build: _Optional[_Union[AntsInvocationRow.AndroidBuild, _Mapping]] = ..., extra_builds: _Optional[_Iterable[_Union[AntsInvocationRow.AndroidBuild, _Mapping]]] = ..., timing: _Optional[_Union[_ants_common_pb2.Timing, _Mapping]] = ..., runner: _Optional[str] = ..., scheduler: _Optional[str] = ..., summary: _Optional[str] = ..., trigger: _Optional[str] = ..., users: _Optional[_Iterable[str]] = ..., tags: _Optional[_Iterable[str]] = ..., test_definition_id: _Optional[str] = ..., completion_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
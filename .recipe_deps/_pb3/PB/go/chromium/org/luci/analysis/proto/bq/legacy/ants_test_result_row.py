@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/legacy/ants_test_result_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/legacy/ants_test_result_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_legacy_dot_ants__common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nHgo.chromium.org/luci/analysis/proto/bq/legacy/ants_test_result_row.proto\x12\x17luci.analysis.bq.legacy\x1a\x1fgoogle/protobuf/timestamp.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\x1a?go.chromium.org/luci/analysis/proto/bq/legacy/ants_common.proto\"\xd3\x0f\n\x11\x41ntsTestResultRow\x12\x36\n\nbuild_type\x18\x01 \x01(\x0e\x32\".luci.analysis.bq.legacy.BuildType\x12\x10\n\x08\x62uild_id\x18\x02 \x01(\t\x12\x16\n\x0e\x62uild_provider\x18\x03 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x04 \x01(\t\x12\x14\n\x0c\x62uild_target\x18\x05 \x01(\t\x12\x16\n\x0etest_result_id\x18\x06 \x01(\t\x12\x14\n\x0cwork_unit_id\x18\x07 \x01(\t\x12\x15\n\rinvocation_id\x18\x08 \x01(\t\x12R\n\x0ftest_identifier\x18\t \x01(\x0b\x32\x39.luci.analysis.bq.legacy.AntsTestResultRow.TestIdentifier\x12[\n\x18previous_test_identifier\x18\x1e \x01(\x0b\x32\x39.luci.analysis.bq.legacy.AntsTestResultRow.TestIdentifier\x12J\n\x0btest_status\x18\n \x01(\x0e\x32\x35.luci.analysis.bq.legacy.AntsTestResultRow.TestStatus\x12\x36\n\ndebug_info\x18\x0b \x01(\x0b\x32\".luci.analysis.bq.legacy.DebugInfo\x12/\n\x06timing\x18\r \x01(\x0b\x32\x1f.luci.analysis.bq.legacy.Timing\x12\x37\n\nproperties\x18\x0e \x03(\x0b\x32#.luci.analysis.bq.legacy.StringPair\x12\x16\n\x0e\x61ttempt_number\x18\x0f \x01(\x05\x12\x12\n\nrun_number\x18\x10 \x01(\x05\x12X\n\x12\x61ggregation_detail\x18\x11 \x01(\x0b\x32<.luci.analysis.bq.legacy.AntsTestResultRow.AggregationDetail\x12\x1c\n\x14test_identifier_hash\x18\x12 \x01(\t\x12\x1a\n\x12test_identifier_id\x18\x13 \x01(\t\x12\x1a\n\x12test_definition_id\x18\x14 \x01(\t\x12\x18\n\x10\x66laky_test_cases\x18\x15 \x01(\x03\x12!\n\x19parent_test_identifier_id\x18\x16 \x01(\t\x12+\n\x04test\x18\x17 \x01(\x0b\x32\x1d.luci.analysis.bq.legacy.Test\x12\x15\n\rflaky_modules\x18\x18 \x01(\x05\x12>\n\x0eskipped_reason\x18\x19 \x01(\x0b\x32&.luci.analysis.bq.legacy.SkippedReason\x12\x0c\n\x04hour\x18\x1a \x01(\t\x12\x0f\n\x07test_id\x18\x1b \x01(\t\x12\x33\n\x0f\x63ompletion_time\x18\x1c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12J\n\x0binsert_time\x18\x1d \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x19\xe2\xbc$\x15\x12\x13\x43URRENT_TIMESTAMP()\x1a\xce\x01\n\x0eTestIdentifier\x12\x0e\n\x06module\x18\x01 \x01(\t\x12>\n\x11module_parameters\x18\x02 \x03(\x0b\x32#.luci.analysis.bq.legacy.StringPair\x12\x1e\n\x16module_parameters_hash\x18\x03 \x01(\t\x12\x12\n\ntest_class\x18\x04 \x01(\t\x12\x12\n\nclass_name\x18\x05 \x01(\t\x12\x14\n\x0cpackage_name\x18\x06 \x01(\t\x12\x0e\n\x06method\x18\x07 \x01(\t\x1a\xdc\x01\n\x11\x41ggregationDetail\x12V\n\x11\x61ggregation_level\x18\x01 \x01(\x0e\x32;.luci.analysis.bq.legacy.AntsTestResultRow.AggregationLevel\x12X\n\x12status_aggregation\x18\x02 \x03(\x0b\x32<.luci.analysis.bq.legacy.AntsTestResultRow.StatusAggregation\x12\x15\n\rmodule_errors\x18\x03 \x01(\x03\x1ag\n\x11StatusAggregation\x12\x45\n\x06status\x18\x01 \x01(\x0e\x32\x35.luci.analysis.bq.legacy.AntsTestResultRow.TestStatus\x12\x0b\n\x03num\x18\x02 \x01(\x03\"\x84\x01\n\nTestStatus\x12\x1b\n\x17TEST_STATUS_UNSPECIFIED\x10\x00\x12\x08\n\x04PASS\x10\x01\x12\x08\n\x04\x46\x41IL\x10\x02\x12\x0b\n\x07IGNORED\x10\x03\x12\x16\n\x12\x41SSUMPTION_FAILURE\x10\x04\x12\x0e\n\nTEST_ERROR\x10\x05\x12\x10\n\x0cTEST_SKIPPED\x10\x06\"u\n\x10\x41ggregationLevel\x12!\n\x1d\x41GGREGATION_LEVEL_UNSPECIFIED\x10\x00\x12\x0e\n\nINVOCATION\x10\x01\x12\n\n\x06MODULE\x10\x02\x12\x0b\n\x07PACKAGE\x10\x03\x12\t\n\x05\x43LASS\x10\x04\x12\n\n\x06METHOD\x10\x05\x42\x34Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.legacy.ants_test_result_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpb'
+  _globals['_ANTSTESTRESULTROW'].fields_by_name['insert_time']._loaded_options = None
+  _globals['_ANTSTESTRESULTROW'].fields_by_name['insert_time']._serialized_options = b'\342\274$\025\022\023CURRENT_TIMESTAMP()'
+  _globals['_ANTSTESTRESULTROW']._serialized_start=249
+  _globals['_ANTSTESTRESULTROW']._serialized_end=2252
+  _globals['_ANTSTESTRESULTROW_TESTIDENTIFIER']._serialized_start=1464
+  _globals['_ANTSTESTRESULTROW_TESTIDENTIFIER']._serialized_end=1670
+  _globals['_ANTSTESTRESULTROW_AGGREGATIONDETAIL']._serialized_start=1673
+  _globals['_ANTSTESTRESULTROW_AGGREGATIONDETAIL']._serialized_end=1893
+  _globals['_ANTSTESTRESULTROW_STATUSAGGREGATION']._serialized_start=1895
+  _globals['_ANTSTESTRESULTROW_STATUSAGGREGATION']._serialized_end=1998
+  _globals['_ANTSTESTRESULTROW_TESTSTATUS']._serialized_start=2001
+  _globals['_ANTSTESTRESULTROW_TESTSTATUS']._serialized_end=2133
+  _globals['_ANTSTESTRESULTROW_AGGREGATIONLEVEL']._serialized_start=2135
+  _globals['_ANTSTESTRESULTROW_AGGREGATIONLEVEL']._serialized_end=2252
+# @@protoc_insertion_point(module_scope)
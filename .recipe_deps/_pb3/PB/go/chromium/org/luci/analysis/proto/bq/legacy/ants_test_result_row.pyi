@@ -0,0 +1,138 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as _ants_common_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AntsTestResultRow(_message.Message):
+    __slots__ = ("build_type", "build_id", "build_provider", "branch", "build_target", "test_result_id", "work_unit_id", "invocation_id", "test_identifier", "previous_test_identifier", "test_status", "debug_info", "timing", "properties", "attempt_number", "run_number", "aggregation_detail", "test_identifier_hash", "test_identifier_id", "test_definition_id", "flaky_test_cases", "parent_test_identifier_id", "test", "flaky_modules", "skipped_reason", "hour", "test_id", "completion_time", "insert_time")
+    class TestStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        TEST_STATUS_UNSPECIFIED: _ClassVar[AntsTestResultRow.TestStatus]
+        PASS: _ClassVar[AntsTestResultRow.TestStatus]
+        FAIL: _ClassVar[AntsTestResultRow.TestStatus]
+        IGNORED: _ClassVar[AntsTestResultRow.TestStatus]
+        ASSUMPTION_FAILURE: _ClassVar[AntsTestResultRow.TestStatus]
+        TEST_ERROR: _ClassVar[AntsTestResultRow.TestStatus]
+        TEST_SKIPPED: _ClassVar[AntsTestResultRow.TestStatus]
+    TEST_STATUS_UNSPECIFIED: AntsTestResultRow.TestStatus
+    PASS: AntsTestResultRow.TestStatus
+    FAIL: AntsTestResultRow.TestStatus
+    IGNORED: AntsTestResultRow.TestStatus
+    ASSUMPTION_FAILURE: AntsTestResultRow.TestStatus
+    TEST_ERROR: AntsTestResultRow.TestStatus
+    TEST_SKIPPED: AntsTestResultRow.TestStatus
+    class AggregationLevel(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        AGGREGATION_LEVEL_UNSPECIFIED: _ClassVar[AntsTestResultRow.AggregationLevel]
+        INVOCATION: _ClassVar[AntsTestResultRow.AggregationLevel]
+        MODULE: _ClassVar[AntsTestResultRow.AggregationLevel]
+        PACKAGE: _ClassVar[AntsTestResultRow.AggregationLevel]
+        CLASS: _ClassVar[AntsTestResultRow.AggregationLevel]
+        METHOD: _ClassVar[AntsTestResultRow.AggregationLevel]
+    AGGREGATION_LEVEL_UNSPECIFIED: AntsTestResultRow.AggregationLevel
+    INVOCATION: AntsTestResultRow.AggregationLevel
+    MODULE: AntsTestResultRow.AggregationLevel
+    PACKAGE: AntsTestResultRow.AggregationLevel
+    CLASS: AntsTestResultRow.AggregationLevel
+    METHOD: AntsTestResultRow.AggregationLevel
+    class TestIdentifier(_message.Message):
+        __slots__ = ("module", "module_parameters", "module_parameters_hash", "test_class", "class_name", "package_name", "method")
+        MODULE_FIELD_NUMBER: _ClassVar[int]
+        MODULE_PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+        MODULE_PARAMETERS_HASH_FIELD_NUMBER: _ClassVar[int]
+        TEST_CLASS_FIELD_NUMBER: _ClassVar[int]
+        CLASS_NAME_FIELD_NUMBER: _ClassVar[int]
+        PACKAGE_NAME_FIELD_NUMBER: _ClassVar[int]
+        METHOD_FIELD_NUMBER: _ClassVar[int]
+        module: str
+        module_parameters: _containers.RepeatedCompositeFieldContainer[_ants_common_pb2.StringPair]
+        module_parameters_hash: str
+        test_class: str
+        class_name: str
+        package_name: str
+        method: str
+        def __init__(self, module: _Optional[str] = ..., module_parameters: _Optional[_Iterable[_Union[_ants_common_pb2.StringPair, _Mapping]]] = ..., module_parameters_hash: _Optional[str] = ..., test_class: _Optional[str] = ..., class_name: _Optional[str] = ..., package_name: _Optional[str] = ..., method: _Optional[str] = ...) -> None: ...
+    class AggregationDetail(_message.Message):
+        __slots__ = ("aggregation_level", "status_aggregation", "module_errors")
+        AGGREGATION_LEVEL_FIELD_NUMBER: _ClassVar[int]
+        STATUS_AGGREGATION_FIELD_NUMBER: _ClassVar[int]
+        MODULE_ERRORS_FIELD_NUMBER: _ClassVar[int]
+        aggregation_level: AntsTestResultRow.AggregationLevel
+        status_aggregation: _containers.RepeatedCompositeFieldContainer[AntsTestResultRow.StatusAggregation]
+        module_errors: int
+        def __init__(self, aggregation_level: _Optional[_Union[AntsTestResultRow.AggregationLevel, str]] = ..., status_aggregation: _Optional[_Iterable[_Union[AntsTestResultRow.StatusAggregation, _Mapping]]] = ..., module_errors: _Optional[int] = ...) -> None: ...
+    class StatusAggregation(_message.Message):
+        __slots__ = ("status", "num")
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        NUM_FIELD_NUMBER: _ClassVar[int]
+        status: AntsTestResultRow.TestStatus
+        num: int
+        def __init__(self, status: _Optional[_Union[AntsTestResultRow.TestStatus, str]] = ..., num: _Optional[int] = ...) -> None: ...
+    BUILD_TYPE_FIELD_NUMBER: _ClassVar[int]
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    BUILD_PROVIDER_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    BUILD_TARGET_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    WORK_UNIT_ID_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    TEST_IDENTIFIER_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_TEST_IDENTIFIER_FIELD_NUMBER: _ClassVar[int]
+    TEST_STATUS_FIELD_NUMBER: _ClassVar[int]
+    DEBUG_INFO_FIELD_NUMBER: _ClassVar[int]
+    TIMING_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    ATTEMPT_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    RUN_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    AGGREGATION_DETAIL_FIELD_NUMBER: _ClassVar[int]
+    TEST_IDENTIFIER_HASH_FIELD_NUMBER: _ClassVar[int]
+    TEST_IDENTIFIER_ID_FIELD_NUMBER: _ClassVar[int]
+    TEST_DEFINITION_ID_FIELD_NUMBER: _ClassVar[int]
+    FLAKY_TEST_CASES_FIELD_NUMBER: _ClassVar[int]
+    PARENT_TEST_IDENTIFIER_ID_FIELD_NUMBER: _ClassVar[int]
+    TEST_FIELD_NUMBER: _ClassVar[int]
+    FLAKY_MODULES_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_REASON_FIELD_NUMBER: _ClassVar[int]
+    HOUR_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    COMPLETION_TIME_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    build_type: _ants_common_pb2.BuildType
+    build_id: str
+    build_provider: str
+    branch: str
+    build_target: str
+    test_result_id: str
+    work_unit_id: str
+    invocation_id: str
+    test_identifier: AntsTestResultRow.TestIdentifier
+    previous_test_identifier: AntsTestResultRow.TestIdentifier
+    test_status: AntsTestResultRow.TestStatus
+    debug_info: _ants_common_pb2.DebugInfo
+    timing: _ants_common_pb2.Timing
+    properties: _containers.RepeatedCompositeFieldContainer[_ants_common_pb2.StringPair]
+    attempt_number: int
+    run_number: int
+    aggregation_detail: AntsTestResultRow.AggregationDetail
+    test_identifier_hash: str
+    test_identifier_id: str
+    test_definition_id: str
+    flaky_test_cases: int
+    parent_test_identifier_id: str
+    test: _ants_common_pb2.Test
+    flaky_modules: int
+    skipped_reason: _ants_common_pb2.SkippedReason
+    hour: str
+    test_id: str
+    completion_time: _timestamp_pb2.Timestamp
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, build_type: _Optional[_Union[_ants_common_pb2.BuildType, str]] = ..., build_id: _Optional[str] = ..., build_provider: _Optional[str] = ..., branch: _Optional[str] = ..., build_target: _Optional[str] = ..., test_result_id: _Optional[str] = ..., work_unit_id: _Optional[str] = ..., invocation_id: _Optional[str] = ..., test_identifier: _Optional[_Union[AntsTestResultRow.TestIdentifier, _Mapping]] = ..., previous_test_identifier: _Optional[_Union[AntsTestResultRow.TestIdentifier, _Mapping]] = ..., test_status: _Optional[_Union[AntsTestResultRow.TestStatus, str]] = ..., debug_info: _Optional[_Union[_ants_common_pb2.DebugInfo, _Mapping]] = ..., timing: _Optional[_Union[_ants_common_pb2.Timing, _Mapping]] = ..., properties: _Optional[_Iterable[_Union[_ants_common_pb2.StringPair, _Mapping]]] = ..., attempt_number: _Optional[int] = ..., run_number: _Optional[int] = ..., aggregation_detail: _Optional[_Union[AntsTestResultRow.AggregationDetail, _Mapping]] = ..., test_identifier_hash: _Optional[str] = ..., test_identifier_id: _Optional[str] = ..., test_definition_id: _Optional[str] = ..., flaky_test_cases: _Optional[int] = ..., parent_test_identifier_id: _Optional[str] = ..., test: _Optional[_Union[_ants_common_pb2.Test, _Mapping]] = ..., flaky_modules: _Optional[int] = ..., skipped_reason: _Optional[_Union[_ants_common_pb2.SkippedReason, _Mapping]] = ..., hour: _Optional[str] = ..., test_id: _Optional[str] = ..., completion_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
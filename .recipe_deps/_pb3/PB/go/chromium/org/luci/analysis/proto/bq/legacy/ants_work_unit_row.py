@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/legacy/ants_work_unit_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/legacy/ants_work_unit_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_legacy_dot_ants__common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nFgo.chromium.org/luci/analysis/proto/bq/legacy/ants_work_unit_row.proto\x12\x17luci.analysis.bq.legacy\x1a\x1fgoogle/protobuf/timestamp.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\x1a?go.chromium.org/luci/analysis/proto/bq/legacy/ants_common.proto\"\x8b\x07\n\x0f\x41ntsWorkUnitRow\x12\x36\n\nbuild_type\x18\x01 \x01(\x0e\x32\".luci.analysis.bq.legacy.BuildType\x12\x10\n\x08\x62uild_id\x18\x02 \x01(\t\x12\x16\n\x0e\x62uild_provider\x18\x03 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x04 \x01(\t\x12\x14\n\x0c\x62uild_target\x18\x05 \x01(\t\x12\x0c\n\x04name\x18\x06 \x01(\t\x12\n\n\x02id\x18\x07 \x01(\t\x12\x11\n\tparent_id\x18\x08 \x01(\t\x12\x15\n\rinvocation_id\x18\t \x01(\t\x12/\n\x06timing\x18\n \x01(\x0b\x32\x1f.luci.analysis.bq.legacy.Timing\x12\x37\n\nproperties\x18\x0b \x03(\x0b\x32#.luci.analysis.bq.legacy.StringPair\x12\x0e\n\x06labels\x18\x0c \x03(\t\x12\x36\n\x05state\x18\r \x01(\x0e\x32\'.luci.analysis.bq.legacy.SchedulerState\x12\x36\n\ndebug_info\x18\x0e \x01(\x0b\x32\".luci.analysis.bq.legacy.DebugInfo\x12\x0c\n\x04type\x18\x0f \x01(\t\x12H\n\x0bmodule_info\x18\x10 \x01(\x0b\x32\x33.luci.analysis.bq.legacy.AntsWorkUnitRow.ModuleInfo\x12>\n\x0eskipped_reason\x18\x11 \x01(\x0b\x32&.luci.analysis.bq.legacy.SkippedReason\x12M\n\x16\x61\x63onfig_flag_overrides\x18\x12 \x01(\x0b\x32-.luci.analysis.bq.legacy.AconfigFlagOverrides\x12\x33\n\x0f\x63ompletion_time\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12J\n\x0binsert_time\x18\x14 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x19\xe2\xbc$\x15\x12\x13\x43URRENT_TIMESTAMP()\x1aZ\n\nModuleInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12>\n\x11module_parameters\x18\x02 \x03(\x0b\x32#.luci.analysis.bq.legacy.StringPairB4Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.legacy.ants_work_unit_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpb'
+  _globals['_ANTSWORKUNITROW'].fields_by_name['insert_time']._loaded_options = None
+  _globals['_ANTSWORKUNITROW'].fields_by_name['insert_time']._serialized_options = b'\342\274$\025\022\023CURRENT_TIMESTAMP()'
+  _globals['_ANTSWORKUNITROW']._serialized_start=247
+  _globals['_ANTSWORKUNITROW']._serialized_end=1154
+  _globals['_ANTSWORKUNITROW_MODULEINFO']._serialized_start=1064
+  _globals['_ANTSWORKUNITROW_MODULEINFO']._serialized_end=1154
+# @@protoc_insertion_point(module_scope)
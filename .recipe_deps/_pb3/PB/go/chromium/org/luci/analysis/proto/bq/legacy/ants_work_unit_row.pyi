@@ -0,0 +1,63 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as _ants_common_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AntsWorkUnitRow(_message.Message):
+    __slots__ = ("build_type", "build_id", "build_provider", "branch", "build_target", "name", "id", "parent_id", "invocation_id", "timing", "properties", "labels", "state", "debug_info", "type", "module_info", "skipped_reason", "aconfig_flag_overrides", "completion_time", "insert_time")
+    class ModuleInfo(_message.Message):
+        __slots__ = ("name", "module_parameters")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        MODULE_PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        module_parameters: _containers.RepeatedCompositeFieldContainer[_ants_common_pb2.StringPair]
+        def __init__(self, name: _Optional[str] = ..., module_parameters: _Optional[_Iterable[_Union[_ants_common_pb2.StringPair, _Mapping]]] = ...) -> None: ...
+    BUILD_TYPE_FIELD_NUMBER: _ClassVar[int]
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    BUILD_PROVIDER_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    BUILD_TARGET_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    PARENT_ID_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    TIMING_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    LABELS_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    DEBUG_INFO_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    MODULE_INFO_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_REASON_FIELD_NUMBER: _ClassVar[int]
+    ACONFIG_FLAG_OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    COMPLETION_TIME_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    build_type: _ants_common_pb2.BuildType
+    build_id: str
+    build_provider: str
+    branch: str
+    build_target: str
+    name: str
+    id: str
+    parent_id: str
+    invocation_id: str
+    timing: _ants_common_pb2.Timing
+    properties: _containers.RepeatedCompositeFieldContainer[_ants_common_pb2.StringPair]
+    labels: _containers.RepeatedScalarFieldContainer[str]
+    state: _ants_common_pb2.SchedulerState
+    debug_info: _ants_common_pb2.DebugInfo
+    type: str
+    module_info: AntsWorkUnitRow.ModuleInfo
+    skipped_reason: _ants_common_pb2.SkippedReason
+    aconfig_flag_overrides: _ants_common_pb2.AconfigFlagOverrides
+    completion_time: _timestamp_pb2.Timestamp
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, build_type: _Optional[_Union[_ants_common_pb2.BuildType, str]] = ..., build_id: _Optional[str] = ..., build_provider: _Optional[str] = ..., branch: _Optional[str] = ..., build_target: _Optional[str] = ..., name: _Optional[str] = ..., id: _Optional[str] = ..., parent_id: _Optional[str] = ..., invocation_id: _Optional[str] = ..., timing: _Optional[_Union[_ants_common_pb2.Timing, _Mapping]] = ..., properties: _Optional[_Iterable[_Union[_ants_common_pb2.StringPair, _Mapping]]] = ..., labels: _Optional[_Iterable[str]] = ..., state: _Optional[_Union[_ants_common_pb2.SchedulerState, str]] = ..., debug_info: _Optional[_Union[_ants_common_pb2.DebugInfo, _Mapping]] = ..., type: _Optional[str] = ..., module_info: _Optional[_Union[AntsWorkUnitRow.ModuleInfo, _Mapping]] = ..., skipped_reason: _Optional[_Union[_ants_common_pb2.SkippedReason, _Mapping]] = ..., aconfig_flag_overrides: _Optional[_Union[_ants_common_pb2.AconfigFlagOverrides, _Mapping]] = ..., completion_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/legacy/properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/legacy/properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_legacy_dot_ants__common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n>go.chromium.org/luci/analysis/proto/bq/legacy/properties.proto\x12\x17luci.analysis.bq.legacy\x1a?go.chromium.org/luci/analysis/proto/bq/legacy/ants_common.proto\"~\n\x12WorkUnitProperties\x12M\n\x16\x61\x63onfig_flag_overrides\x18\x01 \x01(\x0b\x32-.luci.analysis.bq.legacy.AconfigFlagOverrides\x12\x19\n\x11\x61nts_work_unit_id\x18\x02 \x01(\t\"\xa8\x01\n\x14TestResultProperties\x12M\n\x16\x61\x63onfig_flag_overrides\x18\x01 \x01(\x0b\x32-.luci.analysis.bq.legacy.AconfigFlagOverrides\x12\x41\n\x0c\x61nts_test_id\x18\x02 \x01(\x0b\x32+.luci.analysis.bq.legacy.AntsTestIdentifier\"\x88\x01\n\x12\x41ntsTestIdentifier\x12\x0e\n\x06module\x18\x01 \x01(\t\x12>\n\x11module_parameters\x18\x02 \x03(\x0b\x32#.luci.analysis.bq.legacy.StringPair\x12\x12\n\ntest_class\x18\x03 \x01(\t\x12\x0e\n\x06method\x18\x04 \x01(\tB4Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.legacy.properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z2go.chromium.org/luci/analysis/proto/bq/legacy;bqpb'
+  _globals['_WORKUNITPROPERTIES']._serialized_start=156
+  _globals['_WORKUNITPROPERTIES']._serialized_end=282
+  _globals['_TESTRESULTPROPERTIES']._serialized_start=285
+  _globals['_TESTRESULTPROPERTIES']._serialized_end=453
+  _globals['_ANTSTESTIDENTIFIER']._serialized_start=456
+  _globals['_ANTSTESTIDENTIFIER']._serialized_end=592
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,36 @@
+from PB.go.chromium.org.luci.analysis.proto.bq.legacy import ants_common as _ants_common_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class WorkUnitProperties(_message.Message):
+    __slots__ = ("aconfig_flag_overrides", "ants_work_unit_id")
+    ACONFIG_FLAG_OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    ANTS_WORK_UNIT_ID_FIELD_NUMBER: _ClassVar[int]
+    aconfig_flag_overrides: _ants_common_pb2.AconfigFlagOverrides
+    ants_work_unit_id: str
+    def __init__(self, aconfig_flag_overrides: _Optional[_Union[_ants_common_pb2.AconfigFlagOverrides, _Mapping]] = ..., ants_work_unit_id: _Optional[str] = ...) -> None: ...
+
+class TestResultProperties(_message.Message):
+    __slots__ = ("aconfig_flag_overrides", "ants_test_id")
+    ACONFIG_FLAG_OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    ANTS_TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    aconfig_flag_overrides: _ants_common_pb2.AconfigFlagOverrides
+    ants_test_id: AntsTestIdentifier
+    def __init__(self, aconfig_flag_overrides: _Optional[_Union[_ants_common_pb2.AconfigFlagOverrides, _Mapping]] = ..., ants_test_id: _Optional[_Union[AntsTestIdentifier, _Mapping]] = ...) -> None: ...
+
+class AntsTestIdentifier(_message.Message):
+    __slots__ = ("module", "module_parameters", "test_class", "method")
+    MODULE_FIELD_NUMBER: _ClassVar[int]
+    MODULE_PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+    TEST_CLASS_FIELD_NUMBER: _ClassVar[int]
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    module: str
+    module_parameters: _containers.RepeatedCompositeFieldContainer[_ants_common_pb2.StringPair]
+    test_class: str
+    method: str
+    def __init__(self, module: _Optional[str] = ..., module_parameters: _Optional[_Iterable[_Union[_ants_common_pb2.StringPair, _Mapping]]] = ..., test_class: _Optional[str] = ..., method: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/test_metadata.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/test_metadata.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__metadata__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n:go.chromium.org/luci/analysis/proto/bq/test_metadata.proto\x12\x10luci.analysis.bq\x1a/go.chromium.org/luci/common/bq/pb/options.proto\x1a:go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto\"\xda\x01\n\x0cTestMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x30\n\x08location\x18\x02 \x01(\x0b\x32\x1e.luci.resultdb.v1.TestLocation\x12\x35\n\rbug_component\x18\x03 \x01(\x0b\x32\x1e.luci.resultdb.v1.BugComponent\x12\x19\n\x11properties_schema\x18\x04 \x01(\t\x12\x1e\n\nproperties\x18\x05 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12\x18\n\x10previous_test_id\x18\x06 \x01(\tB-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.test_metadata_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_TESTMETADATA'].fields_by_name['properties']._loaded_options = None
+  _globals['_TESTMETADATA'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTMETADATA']._serialized_start=190
+  _globals['_TESTMETADATA']._serialized_end=408
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,24 @@
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as _test_metadata_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestMetadata(_message.Message):
+    __slots__ = ("name", "location", "bug_component", "properties_schema", "properties", "previous_test_id")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    BUG_COMPONENT_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_SCHEMA_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    location: _test_metadata_pb2.TestLocation
+    bug_component: _test_metadata_pb2.BugComponent
+    properties_schema: str
+    properties: str
+    previous_test_id: str
+    def __init__(self, name: _Optional[str] = ..., location: _Optional[_Union[_test_metadata_pb2.TestLocation, _Mapping]] = ..., bug_component: _Optional[_Union[_test_metadata_pb2.BugComponent, _Mapping]] = ..., properties_schema: _Optional[str] = ..., properties: _Optional[str] = ..., previous_test_id: _Optional[str] = ...) -> None: ...
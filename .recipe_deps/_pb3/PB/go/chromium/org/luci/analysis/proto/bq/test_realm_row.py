@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/test_realm_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/test_realm_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;go.chromium.org/luci/analysis/proto/bq/test_realm_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/bq/common.proto\"\xbb\x02\n\x0cTestRealmRow\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\r\n\x05realm\x18\x03 \x01(\t\x12\x15\n\rtest_id_lower\x18\x04 \x01(\t\x12@\n\x12test_id_structured\x18\x05 \x01(\x0b\x32$.luci.analysis.bq.TestIdentifierBase\x12\x46\n\x18test_id_structured_lower\x18\x06 \x01(\x0b\x32$.luci.analysis.bq.TestIdentifierBase\x12\x11\n\ttest_name\x18\x08 \x01(\t\x12\x17\n\x0ftest_name_lower\x18\t \x01(\t\x12-\n\tlast_seen\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampB-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.test_realm_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_TESTREALMROW']._serialized_start=168
+  _globals['_TESTREALMROW']._serialized_end=483
+# @@protoc_insertion_point(module_scope)
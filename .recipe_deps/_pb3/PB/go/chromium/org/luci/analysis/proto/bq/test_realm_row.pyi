@@ -0,0 +1,32 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as _common_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestRealmRow(_message.Message):
+    __slots__ = ("project", "test_id", "realm", "test_id_lower", "test_id_structured", "test_id_structured_lower", "test_name", "test_name_lower", "last_seen")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_LOWER_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_LOWER_FIELD_NUMBER: _ClassVar[int]
+    TEST_NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_NAME_LOWER_FIELD_NUMBER: _ClassVar[int]
+    LAST_SEEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    realm: str
+    test_id_lower: str
+    test_id_structured: _common_pb2.TestIdentifierBase
+    test_id_structured_lower: _common_pb2.TestIdentifierBase
+    test_name: str
+    test_name_lower: str
+    last_seen: _timestamp_pb2.Timestamp
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., realm: _Optional[str] = ..., test_id_lower: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifierBase, _Mapping]] = ..., test_id_structured_lower: _Optional[_Union[_common_pb2.TestIdentifierBase, _Mapping]] = ..., test_name: _Optional[str] = ..., test_name_lower: _Optional[str] = ..., last_seen: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
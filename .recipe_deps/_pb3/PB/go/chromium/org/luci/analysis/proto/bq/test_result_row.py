@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/test_result_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/test_result_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_test__metadata__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import test_verdict as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_test__verdict__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_failure__reason__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import skipped_reason as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_skipped__reason__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<go.chromium.org/luci/analysis/proto/bq/test_result_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/bq/common.proto\x1a:go.chromium.org/luci/analysis/proto/bq/test_metadata.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a\x39go.chromium.org/luci/analysis/proto/v1/test_verdict.proto\x1a;go.chromium.org/luci/resultdb/proto/v1/failure_reason.proto\x1a;go.chromium.org/luci/resultdb/proto/v1/skipped_reason.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\"\x98\x0b\n\rTestResultRow\x12\x0f\n\x07project\x18\x01 \x01(\t\x12<\n\x12test_id_structured\x18\x18 \x01(\x0b\x32 .luci.analysis.bq.TestIdentifier\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x1b\n\x07variant\x18\x03 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12\x14\n\x0cvariant_hash\x18\x04 \x01(\t\x12\x44\n\ninvocation\x18\x05 \x01(\x0b\x32\x30.luci.analysis.bq.TestResultRow.InvocationRecord\x12\x32\n\x0epartition_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12<\n\x06parent\x18\x07 \x01(\x0b\x32,.luci.analysis.bq.TestResultRow.ParentRecord\x12\x0c\n\x04name\x18\x08 \x01(\t\x12\x11\n\tresult_id\x18\t \x01(\t\x12\x10\n\x08\x65xpected\x18\n \x01(\x08\x12\x32\n\x06status\x18\x0b \x01(\x0e\x32\".luci.analysis.v1.TestResultStatus\x12\x36\n\tstatus_v2\x18\x19 \x01(\x0e\x32#.luci.analysis.v1.TestResult.Status\x12\x14\n\x0csummary_html\x18\x0c \x01(\t\x12.\n\nstart_time\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x15\n\rduration_secs\x18\x0e \x01(\x01\x12*\n\x04tags\x18\x0f \x03(\x0b\x32\x1c.luci.analysis.v1.StringPair\x12\x37\n\x0e\x66\x61ilure_reason\x18\x10 \x01(\x0b\x32\x1f.luci.resultdb.v1.FailureReason\x12\x13\n\x0bskip_reason\x18\x11 \x01(\t\x12\x37\n\x0eskipped_reason\x18\x1a \x01(\x0b\x32\x1f.luci.resultdb.v1.SkippedReason\x12\x1e\n\nproperties\x18\x12 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12*\n\x07sources\x18\x13 \x01(\x0b\x32\x19.luci.analysis.v1.Sources\x12/\n\nsource_ref\x18\x14 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12N\n\x1aroot_invocation_definition\x18\x1c \x01(\x0b\x32*.luci.analysis.bq.RootInvocationDefinition\x12\x38\n\rprimary_build\x18\x1d \x01(\x0b\x32!.luci.analysis.bq.BuildDescriptor\x12\x17\n\x0fsource_ref_hash\x18\x15 \x01(\t\x12\x35\n\rtest_metadata\x18\x16 \x01(\x0b\x32\x1e.luci.analysis.bq.TestMetadata\x12\x43\n\x14\x66ramework_extensions\x18\x1b \x01(\x0b\x32%.luci.resultdb.v1.FrameworkExtensions\x12/\n\x0binsert_time\x18\x17 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1aI\n\x10InvocationRecord\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05realm\x18\x02 \x01(\t\x12\x1a\n\x12is_root_invocation\x18\x03 \x01(\x08\x1au\n\x0cParentRecord\x12\n\n\x02id\x18\x01 \x01(\t\x12*\n\x04tags\x18\x02 \x03(\x0b\x32\x1c.luci.analysis.v1.StringPair\x12\r\n\x05realm\x18\x03 \x01(\t\x12\x1e\n\nproperties\x18\x04 \x01(\tB\n\xe2\xbc$\x06\n\x04JSONB-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.test_result_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_TESTRESULTROW_PARENTRECORD'].fields_by_name['properties']._loaded_options = None
+  _globals['_TESTRESULTROW_PARENTRECORD'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTRESULTROW'].fields_by_name['variant']._loaded_options = None
+  _globals['_TESTRESULTROW'].fields_by_name['variant']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTRESULTROW'].fields_by_name['properties']._loaded_options = None
+  _globals['_TESTRESULTROW'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTRESULTROW']._serialized_start=624
+  _globals['_TESTRESULTROW']._serialized_end=2056
+  _globals['_TESTRESULTROW_INVOCATIONRECORD']._serialized_start=1864
+  _globals['_TESTRESULTROW_INVOCATIONRECORD']._serialized_end=1937
+  _globals['_TESTRESULTROW_PARENTRECORD']._serialized_start=1939
+  _globals['_TESTRESULTROW_PARENTRECORD']._serialized_end=2056
+# @@protoc_insertion_point(module_scope)
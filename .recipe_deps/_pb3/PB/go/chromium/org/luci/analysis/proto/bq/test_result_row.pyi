@@ -0,0 +1,101 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import test_metadata as _test_metadata_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2_1
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import test_verdict as _test_verdict_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as _failure_reason_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import skipped_reason as _skipped_reason_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestResultRow(_message.Message):
+    __slots__ = ("project", "test_id_structured", "test_id", "variant", "variant_hash", "invocation", "partition_time", "parent", "name", "result_id", "expected", "status", "status_v2", "summary_html", "start_time", "duration_secs", "tags", "failure_reason", "skip_reason", "skipped_reason", "properties", "sources", "source_ref", "root_invocation_definition", "primary_build", "source_ref_hash", "test_metadata", "framework_extensions", "insert_time")
+    class InvocationRecord(_message.Message):
+        __slots__ = ("id", "realm", "is_root_invocation")
+        ID_FIELD_NUMBER: _ClassVar[int]
+        REALM_FIELD_NUMBER: _ClassVar[int]
+        IS_ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        realm: str
+        is_root_invocation: bool
+        def __init__(self, id: _Optional[str] = ..., realm: _Optional[str] = ..., is_root_invocation: bool = ...) -> None: ...
+    class ParentRecord(_message.Message):
+        __slots__ = ("id", "tags", "realm", "properties")
+        ID_FIELD_NUMBER: _ClassVar[int]
+        TAGS_FIELD_NUMBER: _ClassVar[int]
+        REALM_FIELD_NUMBER: _ClassVar[int]
+        PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        tags: _containers.RepeatedCompositeFieldContainer[_common_pb2_1.StringPair]
+        realm: str
+        properties: str
+        def __init__(self, id: _Optional[str] = ..., tags: _Optional[_Iterable[_Union[_common_pb2_1.StringPair, _Mapping]]] = ..., realm: _Optional[str] = ..., properties: _Optional[str] = ...) -> None: ...
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    EXPECTED_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_HTML_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    DURATION_SECS_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    FAILURE_REASON_FIELD_NUMBER: _ClassVar[int]
+    SKIP_REASON_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_REASON_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_REF_FIELD_NUMBER: _ClassVar[int]
+    ROOT_INVOCATION_DEFINITION_FIELD_NUMBER: _ClassVar[int]
+    PRIMARY_BUILD_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    TEST_METADATA_FIELD_NUMBER: _ClassVar[int]
+    FRAMEWORK_EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    variant: str
+    variant_hash: str
+    invocation: TestResultRow.InvocationRecord
+    partition_time: _timestamp_pb2.Timestamp
+    parent: TestResultRow.ParentRecord
+    name: str
+    result_id: str
+    expected: bool
+    status: _test_verdict_pb2.TestResultStatus
+    status_v2: _common_pb2_1.TestResult.Status
+    summary_html: str
+    start_time: _timestamp_pb2.Timestamp
+    duration_secs: float
+    tags: _containers.RepeatedCompositeFieldContainer[_common_pb2_1.StringPair]
+    failure_reason: _failure_reason_pb2.FailureReason
+    skip_reason: str
+    skipped_reason: _skipped_reason_pb2.SkippedReason
+    properties: str
+    sources: _sources_pb2.Sources
+    source_ref: _sources_pb2.SourceRef
+    root_invocation_definition: _common_pb2.RootInvocationDefinition
+    primary_build: _common_pb2.BuildDescriptor
+    source_ref_hash: str
+    test_metadata: _test_metadata_pb2.TestMetadata
+    framework_extensions: _test_result_pb2.FrameworkExtensions
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, project: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., variant: _Optional[str] = ..., variant_hash: _Optional[str] = ..., invocation: _Optional[_Union[TestResultRow.InvocationRecord, _Mapping]] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., parent: _Optional[_Union[TestResultRow.ParentRecord, _Mapping]] = ..., name: _Optional[str] = ..., result_id: _Optional[str] = ..., expected: bool = ..., status: _Optional[_Union[_test_verdict_pb2.TestResultStatus, str]] = ..., status_v2: _Optional[_Union[_common_pb2_1.TestResult.Status, str]] = ..., summary_html: _Optional[str] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., duration_secs: _Optional[float] = ..., tags: _Optional[_Iterable[_Union[_common_pb2_1.StringPair, _Mapping]]] = ..., failure_reason: _Optional[_Union[_failure_reason_pb2.FailureReason, _Mapping]] = ..., skip_reason: _Optional[str] = ..., skipped_reason: _Optional[_Union[_skipped_reason_pb2.SkippedReason, _Mapping]] = ..., properties: _Optional[str] = ..., sources: _Optional[_Union[_sources_pb2.Sources, _Mapping]] = ..., source_ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., root_invocation_definition: _Optional[_Union[_common_pb2.RootInvocationDefinition, _Mapping]] = ..., primary_build: _Optional[_Union[_common_pb2.BuildDescriptor, _Mapping]] = ..., source_ref_hash: _Optional[str] = ..., test_metadata: _Optional[_Union[_test_metadata_pb2.TestMetadata, _Mapping]] = ..., framework_extensions: _Optional[_Union[_test_result_pb2.FrameworkExtensions, _Mapping]] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
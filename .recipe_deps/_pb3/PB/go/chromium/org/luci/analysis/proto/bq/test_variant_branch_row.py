@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/test_variant_branch_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/test_variant_branch_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nDgo.chromium.org/luci/analysis/proto/bq/test_variant_branch_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/bq/common.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\"\xe6\x02\n\x14TestVariantBranchRow\x12\x0f\n\x07project\x18\x01 \x01(\t\x12<\n\x12test_id_structured\x18\n \x01(\x0b\x32 .luci.analysis.bq.TestIdentifier\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x1b\n\x07variant\x18\x05 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12\x10\n\x08ref_hash\x18\x04 \x01(\t\x12(\n\x03ref\x18\x06 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12+\n\x08segments\x18\x07 \x03(\x0b\x32\x19.luci.analysis.bq.Segment\x12%\n\x1dhas_recent_unexpected_results\x18\x08 \x01(\x03\x12+\n\x07version\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xc7\x06\n\x07Segment\x12\x1d\n\x15has_start_changepoint\x18\x01 \x01(\x08\x12\x16\n\x0estart_position\x18\x02 \x01(\x03\x12\'\n\x1fstart_position_lower_bound_99th\x18\x03 \x01(\x03\x12\'\n\x1fstart_position_upper_bound_99th\x18\x04 \x01(\x03\x12.\n\nstart_hour\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0c\x65nd_position\x18\x06 \x01(\x03\x12,\n\x08\x65nd_hour\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x30\n\x06\x63ounts\x18\x08 \x01(\x0b\x32 .luci.analysis.bq.Segment.Counts\x1a\x8c\x04\n\x06\x43ounts\x12\x1a\n\x12unexpected_results\x18\x01 \x01(\x03\x12\x15\n\rtotal_results\x18\x02 \x01(\x03\x12\x1f\n\x17\x65xpected_passed_results\x18\n \x01(\x03\x12\x1f\n\x17\x65xpected_failed_results\x18\x0b \x01(\x03\x12 \n\x18\x65xpected_crashed_results\x18\x0c \x01(\x03\x12 \n\x18\x65xpected_aborted_results\x18\r \x01(\x03\x12!\n\x19unexpected_passed_results\x18\x0e \x01(\x03\x12!\n\x19unexpected_failed_results\x18\x0f \x01(\x03\x12\"\n\x1aunexpected_crashed_results\x18\x10 \x01(\x03\x12\"\n\x1aunexpected_aborted_results\x18\x11 \x01(\x03\x12!\n\x19unexpected_unretried_runs\x18\x03 \x01(\x03\x12#\n\x1bunexpected_after_retry_runs\x18\x04 \x01(\x03\x12\x12\n\nflaky_runs\x18\x05 \x01(\x03\x12\x12\n\ntotal_runs\x18\x06 \x01(\x03\x12\x1b\n\x13unexpected_verdicts\x18\x07 \x01(\x03\x12\x16\n\x0e\x66laky_verdicts\x18\x08 \x01(\x03\x12\x16\n\x0etotal_verdicts\x18\t \x01(\x03\x42-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.test_variant_branch_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_TESTVARIANTBRANCHROW'].fields_by_name['variant']._loaded_options = None
+  _globals['_TESTVARIANTBRANCHROW'].fields_by_name['variant']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTVARIANTBRANCHROW']._serialized_start=280
+  _globals['_TESTVARIANTBRANCHROW']._serialized_end=638
+  _globals['_SEGMENT']._serialized_start=641
+  _globals['_SEGMENT']._serialized_end=1480
+  _globals['_SEGMENT_COUNTS']._serialized_start=956
+  _globals['_SEGMENT_COUNTS']._serialized_end=1480
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,94 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestVariantBranchRow(_message.Message):
+    __slots__ = ("project", "test_id_structured", "test_id", "variant", "variant_hash", "ref_hash", "ref", "segments", "has_recent_unexpected_results", "version")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    SEGMENTS_FIELD_NUMBER: _ClassVar[int]
+    HAS_RECENT_UNEXPECTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    variant: str
+    variant_hash: str
+    ref_hash: str
+    ref: _sources_pb2.SourceRef
+    segments: _containers.RepeatedCompositeFieldContainer[Segment]
+    has_recent_unexpected_results: int
+    version: _timestamp_pb2.Timestamp
+    def __init__(self, project: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., variant: _Optional[str] = ..., variant_hash: _Optional[str] = ..., ref_hash: _Optional[str] = ..., ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., segments: _Optional[_Iterable[_Union[Segment, _Mapping]]] = ..., has_recent_unexpected_results: _Optional[int] = ..., version: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class Segment(_message.Message):
+    __slots__ = ("has_start_changepoint", "start_position", "start_position_lower_bound_99th", "start_position_upper_bound_99th", "start_hour", "end_position", "end_hour", "counts")
+    class Counts(_message.Message):
+        __slots__ = ("unexpected_results", "total_results", "expected_passed_results", "expected_failed_results", "expected_crashed_results", "expected_aborted_results", "unexpected_passed_results", "unexpected_failed_results", "unexpected_crashed_results", "unexpected_aborted_results", "unexpected_unretried_runs", "unexpected_after_retry_runs", "flaky_runs", "total_runs", "unexpected_verdicts", "flaky_verdicts", "total_verdicts")
+        UNEXPECTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_PASSED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_FAILED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_CRASHED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_ABORTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_PASSED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_FAILED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_CRASHED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_ABORTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_UNRETRIED_RUNS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_AFTER_RETRY_RUNS_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_RUNS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_RUNS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        unexpected_results: int
+        total_results: int
+        expected_passed_results: int
+        expected_failed_results: int
+        expected_crashed_results: int
+        expected_aborted_results: int
+        unexpected_passed_results: int
+        unexpected_failed_results: int
+        unexpected_crashed_results: int
+        unexpected_aborted_results: int
+        unexpected_unretried_runs: int
+        unexpected_after_retry_runs: int
+        flaky_runs: int
+        total_runs: int
+        unexpected_verdicts: int
+        flaky_verdicts: int
+        total_verdicts: int
+        def __init__(self, unexpected_results: _Optional[int] = ..., total_results: _Optional[int] = ..., expected_passed_results: _Optional[int] = ..., expected_failed_results: _Optional[int] = ..., expected_crashed_results: _Optional[int] = ..., expected_aborted_results: _Optional[int] = ..., unexpected_passed_results: _Optional[int] = ..., unexpected_failed_results: _Optional[int] = ..., unexpected_crashed_results: _Optional[int] = ..., unexpected_aborted_results: _Optional[int] = ..., unexpected_unretried_runs: _Optional[int] = ..., unexpected_after_retry_runs: _Optional[int] = ..., flaky_runs: _Optional[int] = ..., total_runs: _Optional[int] = ..., unexpected_verdicts: _Optional[int] = ..., flaky_verdicts: _Optional[int] = ..., total_verdicts: _Optional[int] = ...) -> None: ...
+    HAS_START_CHANGEPOINT_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_LOWER_BOUND_99TH_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_UPPER_BOUND_99TH_FIELD_NUMBER: _ClassVar[int]
+    START_HOUR_FIELD_NUMBER: _ClassVar[int]
+    END_POSITION_FIELD_NUMBER: _ClassVar[int]
+    END_HOUR_FIELD_NUMBER: _ClassVar[int]
+    COUNTS_FIELD_NUMBER: _ClassVar[int]
+    has_start_changepoint: bool
+    start_position: int
+    start_position_lower_bound_99th: int
+    start_position_upper_bound_99th: int
+    start_hour: _timestamp_pb2.Timestamp
+    end_position: int
+    end_hour: _timestamp_pb2.Timestamp
+    counts: Segment.Counts
+    def __init__(self, has_start_changepoint: bool = ..., start_position: _Optional[int] = ..., start_position_lower_bound_99th: _Optional[int] = ..., start_position_upper_bound_99th: _Optional[int] = ..., start_hour: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_position: _Optional[int] = ..., end_hour: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., counts: _Optional[_Union[Segment.Counts, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/bq/test_verdict_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/bq/test_verdict_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_bq_dot_test__metadata__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import test_verdict as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_test__verdict__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_failure__reason__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import skipped_reason as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_skipped__reason__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n=go.chromium.org/luci/analysis/proto/bq/test_verdict_row.proto\x12\x10luci.analysis.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/bq/common.proto\x1a:go.chromium.org/luci/analysis/proto/bq/test_metadata.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a\x39go.chromium.org/luci/analysis/proto/v1/test_verdict.proto\x1a;go.chromium.org/luci/resultdb/proto/v1/failure_reason.proto\x1a;go.chromium.org/luci/resultdb/proto/v1/skipped_reason.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\"\xb5\x14\n\x0eTestVerdictRow\x12\x0f\n\x07project\x18\x01 \x01(\t\x12<\n\x12test_id_structured\x18\x12 \x01(\x0b\x32 .luci.analysis.bq.TestIdentifier\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x1b\n\x07variant\x18\x03 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12\x14\n\x0cvariant_hash\x18\x04 \x01(\t\x12\x45\n\ninvocation\x18\x05 \x01(\x0b\x32\x31.luci.analysis.bq.TestVerdictRow.InvocationRecord\x12\x32\n\x0epartition_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x33\n\x06status\x18\x07 \x01(\x0e\x32#.luci.analysis.v1.TestVerdictStatus\x12\x37\n\tstatus_v2\x18\x13 \x01(\x0e\x32$.luci.analysis.v1.TestVerdict.Status\x12\x45\n\x0fstatus_override\x18\x14 \x01(\x0e\x32,.luci.analysis.v1.TestVerdict.StatusOverride\x12<\n\x07results\x18\x08 \x03(\x0b\x32+.luci.analysis.bq.TestVerdictRow.TestResult\x12\x42\n\x0c\x65xonerations\x18\t \x03(\x0b\x32,.luci.analysis.bq.TestVerdictRow.Exoneration\x12;\n\x06\x63ounts\x18\n \x01(\x0b\x32\'.luci.analysis.bq.TestVerdictRow.CountsB\x02\x18\x01\x12<\n\tcounts_v2\x18\x15 \x01(\x0b\x32).luci.analysis.bq.TestVerdictRow.CountsV2\x12L\n\x11\x62uildbucket_build\x18\x0b \x01(\x0b\x32\x31.luci.analysis.bq.TestVerdictRow.BuildbucketBuild\x12O\n\x13\x63hange_verifier_run\x18\x0c \x01(\x0b\x32\x32.luci.analysis.bq.TestVerdictRow.ChangeVerifierRun\x12*\n\x07sources\x18\r \x01(\x0b\x32\x19.luci.analysis.v1.Sources\x12/\n\nsource_ref\x18\x0f \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12\x17\n\x0fsource_ref_hash\x18\x10 \x01(\t\x12\x35\n\rtest_metadata\x18\x0e \x01(\x0b\x32\x1e.luci.analysis.bq.TestMetadata\x12/\n\x0binsert_time\x18\x11 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1ay\n\x10InvocationRecord\x12\n\n\x02id\x18\x01 \x01(\t\x12*\n\x04tags\x18\x02 \x03(\x0b\x32\x1c.luci.analysis.v1.StringPair\x12\r\n\x05realm\x18\x03 \x01(\t\x12\x1e\n\nproperties\x18\x04 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x1a$\n\x16ParentInvocationRecord\x12\n\n\x02id\x18\x01 \x01(\t\x1a\xf0\x04\n\nTestResult\x12G\n\x06parent\x18\x01 \x01(\x0b\x32\x37.luci.analysis.bq.TestVerdictRow.ParentInvocationRecord\x12\x0c\n\x04name\x18\x0b \x01(\t\x12\x11\n\tresult_id\x18\x02 \x01(\t\x12\x14\n\x08\x65xpected\x18\x03 \x01(\x08\x42\x02\x18\x01\x12\x36\n\x06status\x18\x04 \x01(\x0e\x32\".luci.analysis.v1.TestResultStatusB\x02\x18\x01\x12\x36\n\tstatus_v2\x18\r \x01(\x0e\x32#.luci.analysis.v1.TestResult.Status\x12\x14\n\x0csummary_html\x18\x05 \x01(\t\x12.\n\nstart_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08\x64uration\x18\x07 \x01(\x01\x12*\n\x04tags\x18\x08 \x03(\x0b\x32\x1c.luci.analysis.v1.StringPair\x12\x37\n\x0e\x66\x61ilure_reason\x18\t \x01(\x0b\x32\x1f.luci.resultdb.v1.FailureReason\x12\x17\n\x0bskip_reason\x18\x0c \x01(\tB\x02\x18\x01\x12\x37\n\x0eskipped_reason\x18\x0e \x01(\x0b\x32\x1f.luci.resultdb.v1.SkippedReason\x12\x43\n\x14\x66ramework_extensions\x18\x0f \x01(\x0b\x32%.luci.resultdb.v1.FrameworkExtensions\x12\x1e\n\nproperties\x18\n \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x1a\\\n\x0b\x45xoneration\x12\x18\n\x10\x65xplanation_html\x18\x01 \x01(\t\x12\x33\n\x06reason\x18\x02 \x01(\x0e\x32#.luci.analysis.v1.ExonerationReason\x1a\xa5\x01\n\x06\x43ounts\x12\x16\n\nunexpected\x18\x01 \x01(\x03\x42\x02\x18\x01\x12\x11\n\x05total\x18\x02 \x01(\x03\x42\x02\x18\x01\x12\"\n\x16unexpected_non_skipped\x18\x03 \x01(\x03\x42\x02\x18\x01\x12-\n!unexpected_non_skipped_non_passed\x18\x04 \x01(\x03\x42\x02\x18\x01\x12\x1d\n\x11total_non_skipped\x18\x05 \x01(\x03\x42\x02\x18\x01\x1ax\n\x08\x43ountsV2\x12\x0e\n\x06passed\x18\x01 \x01(\x03\x12\x0e\n\x06\x66\x61iled\x18\x02 \x01(\x03\x12\x0f\n\x07skipped\x18\x03 \x01(\x03\x12\x19\n\x11\x65xecution_errored\x18\x04 \x01(\x03\x12\x11\n\tprecluded\x18\x05 \x01(\x03\x12\r\n\x05total\x18\x06 \x01(\x03\x1a\xd3\x01\n\x10\x42uildbucketBuild\x12\n\n\x02id\x18\x01 \x01(\x03\x12J\n\x07\x62uilder\x18\x02 \x01(\x0b\x32\x39.luci.analysis.bq.TestVerdictRow.BuildbucketBuild.Builder\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x1a\n\x12gardener_rotations\x18\x04 \x03(\t\x1a;\n\x07\x42uilder\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0e\n\x06\x62ucket\x18\x02 \x01(\t\x12\x0f\n\x07\x62uilder\x18\x03 \x01(\t\x1a|\n\x11\x43hangeVerifierRun\x12\n\n\x02id\x18\x01 \x01(\t\x12\x30\n\x04mode\x18\x02 \x01(\x0e\x32\".luci.analysis.v1.PresubmitRunMode\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x19\n\x11is_build_critical\x18\x04 \x01(\x08\x42-Z+go.chromium.org/luci/analysis/proto/bq;bqpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.bq.test_verdict_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/analysis/proto/bq;bqpb'
+  _globals['_TESTVERDICTROW_INVOCATIONRECORD'].fields_by_name['properties']._loaded_options = None
+  _globals['_TESTVERDICTROW_INVOCATIONRECORD'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['expected']._loaded_options = None
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['expected']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['status']._loaded_options = None
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['status']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['skip_reason']._loaded_options = None
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['skip_reason']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['properties']._loaded_options = None
+  _globals['_TESTVERDICTROW_TESTRESULT'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['unexpected']._loaded_options = None
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['unexpected']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['total']._loaded_options = None
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['total']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['unexpected_non_skipped']._loaded_options = None
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['unexpected_non_skipped']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['unexpected_non_skipped_non_passed']._loaded_options = None
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['unexpected_non_skipped_non_passed']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['total_non_skipped']._loaded_options = None
+  _globals['_TESTVERDICTROW_COUNTS'].fields_by_name['total_non_skipped']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW'].fields_by_name['variant']._loaded_options = None
+  _globals['_TESTVERDICTROW'].fields_by_name['variant']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTVERDICTROW'].fields_by_name['counts']._loaded_options = None
+  _globals['_TESTVERDICTROW'].fields_by_name['counts']._serialized_options = b'\030\001'
+  _globals['_TESTVERDICTROW']._serialized_start=625
+  _globals['_TESTVERDICTROW']._serialized_end=3238
+  _globals['_TESTVERDICTROW_INVOCATIONRECORD']._serialized_start=1728
+  _globals['_TESTVERDICTROW_INVOCATIONRECORD']._serialized_end=1849
+  _globals['_TESTVERDICTROW_PARENTINVOCATIONRECORD']._serialized_start=1851
+  _globals['_TESTVERDICTROW_PARENTINVOCATIONRECORD']._serialized_end=1887
+  _globals['_TESTVERDICTROW_TESTRESULT']._serialized_start=1890
+  _globals['_TESTVERDICTROW_TESTRESULT']._serialized_end=2514
+  _globals['_TESTVERDICTROW_EXONERATION']._serialized_start=2516
+  _globals['_TESTVERDICTROW_EXONERATION']._serialized_end=2608
+  _globals['_TESTVERDICTROW_COUNTS']._serialized_start=2611
+  _globals['_TESTVERDICTROW_COUNTS']._serialized_end=2776
+  _globals['_TESTVERDICTROW_COUNTSV2']._serialized_start=2778
+  _globals['_TESTVERDICTROW_COUNTSV2']._serialized_end=2898
+  _globals['_TESTVERDICTROW_BUILDBUCKETBUILD']._serialized_start=2901
+  _globals['_TESTVERDICTROW_BUILDBUCKETBUILD']._serialized_end=3112
+  _globals['_TESTVERDICTROW_BUILDBUCKETBUILD_BUILDER']._serialized_start=3053
+  _globals['_TESTVERDICTROW_BUILDBUCKETBUILD_BUILDER']._serialized_end=3112
+  _globals['_TESTVERDICTROW_CHANGEVERIFIERRUN']._serialized_start=3114
+  _globals['_TESTVERDICTROW_CHANGEVERIFIERRUN']._serialized_end=3238
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,180 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.bq import test_metadata as _test_metadata_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2_1
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import test_verdict as _test_verdict_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as _failure_reason_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import skipped_reason as _skipped_reason_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestVerdictRow(_message.Message):
+    __slots__ = ("project", "test_id_structured", "test_id", "variant", "variant_hash", "invocation", "partition_time", "status", "status_v2", "status_override", "results", "exonerations", "counts", "counts_v2", "buildbucket_build", "change_verifier_run", "sources", "source_ref", "source_ref_hash", "test_metadata", "insert_time")
+    class InvocationRecord(_message.Message):
+        __slots__ = ("id", "tags", "realm", "properties")
+        ID_FIELD_NUMBER: _ClassVar[int]
+        TAGS_FIELD_NUMBER: _ClassVar[int]
+        REALM_FIELD_NUMBER: _ClassVar[int]
+        PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        tags: _containers.RepeatedCompositeFieldContainer[_common_pb2_1.StringPair]
+        realm: str
+        properties: str
+        def __init__(self, id: _Optional[str] = ..., tags: _Optional[_Iterable[_Union[_common_pb2_1.StringPair, _Mapping]]] = ..., realm: _Optional[str] = ..., properties: _Optional[str] = ...) -> None: ...
+    class ParentInvocationRecord(_message.Message):
+        __slots__ = ("id",)
+        ID_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        def __init__(self, id: _Optional[str] = ...) -> None: ...
+    class TestResult(_message.Message):
+        __slots__ = ("parent", "name", "result_id", "expected", "status", "status_v2", "summary_html", "start_time", "duration", "tags", "failure_reason", "skip_reason", "skipped_reason", "framework_extensions", "properties")
+        PARENT_FIELD_NUMBER: _ClassVar[int]
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+        SUMMARY_HTML_FIELD_NUMBER: _ClassVar[int]
+        START_TIME_FIELD_NUMBER: _ClassVar[int]
+        DURATION_FIELD_NUMBER: _ClassVar[int]
+        TAGS_FIELD_NUMBER: _ClassVar[int]
+        FAILURE_REASON_FIELD_NUMBER: _ClassVar[int]
+        SKIP_REASON_FIELD_NUMBER: _ClassVar[int]
+        SKIPPED_REASON_FIELD_NUMBER: _ClassVar[int]
+        FRAMEWORK_EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+        PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+        parent: TestVerdictRow.ParentInvocationRecord
+        name: str
+        result_id: str
+        expected: bool
+        status: _test_verdict_pb2.TestResultStatus
+        status_v2: _common_pb2_1.TestResult.Status
+        summary_html: str
+        start_time: _timestamp_pb2.Timestamp
+        duration: float
+        tags: _containers.RepeatedCompositeFieldContainer[_common_pb2_1.StringPair]
+        failure_reason: _failure_reason_pb2.FailureReason
+        skip_reason: str
+        skipped_reason: _skipped_reason_pb2.SkippedReason
+        framework_extensions: _test_result_pb2.FrameworkExtensions
+        properties: str
+        def __init__(self, parent: _Optional[_Union[TestVerdictRow.ParentInvocationRecord, _Mapping]] = ..., name: _Optional[str] = ..., result_id: _Optional[str] = ..., expected: bool = ..., status: _Optional[_Union[_test_verdict_pb2.TestResultStatus, str]] = ..., status_v2: _Optional[_Union[_common_pb2_1.TestResult.Status, str]] = ..., summary_html: _Optional[str] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., duration: _Optional[float] = ..., tags: _Optional[_Iterable[_Union[_common_pb2_1.StringPair, _Mapping]]] = ..., failure_reason: _Optional[_Union[_failure_reason_pb2.FailureReason, _Mapping]] = ..., skip_reason: _Optional[str] = ..., skipped_reason: _Optional[_Union[_skipped_reason_pb2.SkippedReason, _Mapping]] = ..., framework_extensions: _Optional[_Union[_test_result_pb2.FrameworkExtensions, _Mapping]] = ..., properties: _Optional[str] = ...) -> None: ...
+    class Exoneration(_message.Message):
+        __slots__ = ("explanation_html", "reason")
+        EXPLANATION_HTML_FIELD_NUMBER: _ClassVar[int]
+        REASON_FIELD_NUMBER: _ClassVar[int]
+        explanation_html: str
+        reason: _common_pb2_1.ExonerationReason
+        def __init__(self, explanation_html: _Optional[str] = ..., reason: _Optional[_Union[_common_pb2_1.ExonerationReason, str]] = ...) -> None: ...
+    class Counts(_message.Message):
+        __slots__ = ("unexpected", "total", "unexpected_non_skipped", "unexpected_non_skipped_non_passed", "total_non_skipped")
+        UNEXPECTED_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_NON_SKIPPED_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_NON_SKIPPED_NON_PASSED_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_NON_SKIPPED_FIELD_NUMBER: _ClassVar[int]
+        unexpected: int
+        total: int
+        unexpected_non_skipped: int
+        unexpected_non_skipped_non_passed: int
+        total_non_skipped: int
+        def __init__(self, unexpected: _Optional[int] = ..., total: _Optional[int] = ..., unexpected_non_skipped: _Optional[int] = ..., unexpected_non_skipped_non_passed: _Optional[int] = ..., total_non_skipped: _Optional[int] = ...) -> None: ...
+    class CountsV2(_message.Message):
+        __slots__ = ("passed", "failed", "skipped", "execution_errored", "precluded", "total")
+        PASSED_FIELD_NUMBER: _ClassVar[int]
+        FAILED_FIELD_NUMBER: _ClassVar[int]
+        SKIPPED_FIELD_NUMBER: _ClassVar[int]
+        EXECUTION_ERRORED_FIELD_NUMBER: _ClassVar[int]
+        PRECLUDED_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_FIELD_NUMBER: _ClassVar[int]
+        passed: int
+        failed: int
+        skipped: int
+        execution_errored: int
+        precluded: int
+        total: int
+        def __init__(self, passed: _Optional[int] = ..., failed: _Optional[int] = ..., skipped: _Optional[int] = ..., execution_errored: _Optional[int] = ..., precluded: _Optional[int] = ..., total: _Optional[int] = ...) -> None: ...
+    class BuildbucketBuild(_message.Message):
+        __slots__ = ("id", "builder", "status", "gardener_rotations")
+        class Builder(_message.Message):
+            __slots__ = ("project", "bucket", "builder")
+            PROJECT_FIELD_NUMBER: _ClassVar[int]
+            BUCKET_FIELD_NUMBER: _ClassVar[int]
+            BUILDER_FIELD_NUMBER: _ClassVar[int]
+            project: str
+            bucket: str
+            builder: str
+            def __init__(self, project: _Optional[str] = ..., bucket: _Optional[str] = ..., builder: _Optional[str] = ...) -> None: ...
+        ID_FIELD_NUMBER: _ClassVar[int]
+        BUILDER_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        GARDENER_ROTATIONS_FIELD_NUMBER: _ClassVar[int]
+        id: int
+        builder: TestVerdictRow.BuildbucketBuild.Builder
+        status: str
+        gardener_rotations: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, id: _Optional[int] = ..., builder: _Optional[_Union[TestVerdictRow.BuildbucketBuild.Builder, _Mapping]] = ..., status: _Optional[str] = ..., gardener_rotations: _Optional[_Iterable[str]] = ...) -> None: ...
+    class ChangeVerifierRun(_message.Message):
+        __slots__ = ("id", "mode", "status", "is_build_critical")
+        ID_FIELD_NUMBER: _ClassVar[int]
+        MODE_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        IS_BUILD_CRITICAL_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        mode: _common_pb2_1.PresubmitRunMode
+        status: str
+        is_build_critical: bool
+        def __init__(self, id: _Optional[str] = ..., mode: _Optional[_Union[_common_pb2_1.PresubmitRunMode, str]] = ..., status: _Optional[str] = ..., is_build_critical: bool = ...) -> None: ...
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+    STATUS_OVERRIDE_FIELD_NUMBER: _ClassVar[int]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    EXONERATIONS_FIELD_NUMBER: _ClassVar[int]
+    COUNTS_FIELD_NUMBER: _ClassVar[int]
+    COUNTS_V2_FIELD_NUMBER: _ClassVar[int]
+    BUILDBUCKET_BUILD_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_VERIFIER_RUN_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_REF_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    TEST_METADATA_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    variant: str
+    variant_hash: str
+    invocation: TestVerdictRow.InvocationRecord
+    partition_time: _timestamp_pb2.Timestamp
+    status: _test_verdict_pb2.TestVerdictStatus
+    status_v2: _test_verdict_pb2.TestVerdict.Status
+    status_override: _test_verdict_pb2.TestVerdict.StatusOverride
+    results: _containers.RepeatedCompositeFieldContainer[TestVerdictRow.TestResult]
+    exonerations: _containers.RepeatedCompositeFieldContainer[TestVerdictRow.Exoneration]
+    counts: TestVerdictRow.Counts
+    counts_v2: TestVerdictRow.CountsV2
+    buildbucket_build: TestVerdictRow.BuildbucketBuild
+    change_verifier_run: TestVerdictRow.ChangeVerifierRun
+    sources: _sources_pb2.Sources
+    source_ref: _sources_pb2.SourceRef
+    source_ref_hash: str
+    test_metadata: _test_metadata_pb2.TestMetadata
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, project: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., variant: _Optional[str] = ..., variant_hash: _Optional[str] = ..., invocation: _Optional[_Union[TestVerdictRow.InvocationRecord, _Mapping]] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., status: _Optional[_Union[_test_verdict_pb2.TestVerdictStatus, str]] = ..., status_v2: _Optional[_Union[_test_verdict_pb2.TestVerdict.Status, str]] = ..., status_override: _Optional[_Union[_test_verdict_pb2.TestVerdict.StatusOverride, str]] = ..., results: _Optional[_Iterable[_Union[TestVerdictRow.TestResult, _Mapping]]] = ..., exonerations: _Optional[_Iterable[_Union[TestVerdictRow.Exoneration, _Mapping]]] = ..., counts: _Optional[_Union[TestVerdictRow.Counts, _Mapping]] = ..., counts_v2: _Optional[_Union[TestVerdictRow.CountsV2, _Mapping]] = ..., buildbucket_build: _Optional[_Union[TestVerdictRow.BuildbucketBuild, _Mapping]] = ..., change_verifier_run: _Optional[_Union[TestVerdictRow.ChangeVerifierRun, _Mapping]] = ..., sources: _Optional[_Union[_sources_pb2.Sources, _Mapping]] = ..., source_ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., source_ref_hash: _Optional[str] = ..., test_metadata: _Optional[_Union[_test_metadata_pb2.TestMetadata, _Mapping]] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
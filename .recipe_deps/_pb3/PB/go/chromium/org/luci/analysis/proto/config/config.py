@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/config/config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/config/config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7go.chromium.org/luci/analysis/proto/config/config.proto\x12\x14luci.analysis.config\"\xe2\x03\n\x06\x43onfig\x12\x19\n\x11monorail_hostname\x18\x01 \x01(\t\x12\x18\n\x10\x63hunk_gcs_bucket\x18\x02 \x01(\t\x12\x1c\n\x14reclustering_workers\x18\x03 \x01(\x03\x12%\n\x1dreclustering_interval_minutes\x18\x04 \x01(\x03\x12\x1b\n\x13\x62ug_updates_enabled\x18\x05 \x01(\x08\x12H\n\x15test_variant_analysis\x18\x06 \x01(\x0b\x32).luci.analysis.config.TestVariantAnalysis\x12\x32\n\tingestion\x18\x07 \x01(\x0b\x32\x1f.luci.analysis.config.Ingestion\x12\x44\n\x13test_verdict_export\x18\x08 \x01(\x0b\x32\'.luci.analysis.config.TestVerdictExport\x12:\n\nclustering\x18\t \x01(\x0b\x32&.luci.analysis.config.ClusteringSystem\x12\x41\n\x0e\x62ug_management\x18\n \x01(\x0b\x32).luci.analysis.config.BugManagementSystem\"G\n\x13TestVariantAnalysis\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x1f\n\x17\x62igquery_export_enabled\x18\x02 \x01(\x08\"?\n\x10\x43lusteringSystem\x12+\n#query_test_variant_analysis_enabled\x18\x01 \x01(\x08\"I\n\tIngestion\x12!\n\x19project_allowlist_enabled\x18\x01 \x01(\x08\x12\x19\n\x11project_allowlist\x18\x02 \x03(\t\"$\n\x11TestVerdictExport\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\">\n\x13\x42ugManagementSystem\x12\'\n\x1fpolicy_based_management_enabled\x18\x01 \x01(\x08\x42\x35Z3go.chromium.org/luci/analysis/proto/config;configpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.config.config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z3go.chromium.org/luci/analysis/proto/config;configpb'
+  _globals['_CONFIG']._serialized_start=82
+  _globals['_CONFIG']._serialized_end=564
+  _globals['_TESTVARIANTANALYSIS']._serialized_start=566
+  _globals['_TESTVARIANTANALYSIS']._serialized_end=637
+  _globals['_CLUSTERINGSYSTEM']._serialized_start=639
+  _globals['_CLUSTERINGSYSTEM']._serialized_end=702
+  _globals['_INGESTION']._serialized_start=704
+  _globals['_INGESTION']._serialized_end=777
+  _globals['_TESTVERDICTEXPORT']._serialized_start=779
+  _globals['_TESTVERDICTEXPORT']._serialized_end=815
+  _globals['_BUGMANAGEMENTSYSTEM']._serialized_start=817
+  _globals['_BUGMANAGEMENTSYSTEM']._serialized_end=879
+# @@protoc_insertion_point(module_scope)
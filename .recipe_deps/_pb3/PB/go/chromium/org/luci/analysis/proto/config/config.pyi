@@ -0,0 +1,65 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Config(_message.Message):
+    __slots__ = ("monorail_hostname", "chunk_gcs_bucket", "reclustering_workers", "reclustering_interval_minutes", "bug_updates_enabled", "test_variant_analysis", "ingestion", "test_verdict_export", "clustering", "bug_management")
+    MONORAIL_HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_GCS_BUCKET_FIELD_NUMBER: _ClassVar[int]
+    RECLUSTERING_WORKERS_FIELD_NUMBER: _ClassVar[int]
+    RECLUSTERING_INTERVAL_MINUTES_FIELD_NUMBER: _ClassVar[int]
+    BUG_UPDATES_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANT_ANALYSIS_FIELD_NUMBER: _ClassVar[int]
+    INGESTION_FIELD_NUMBER: _ClassVar[int]
+    TEST_VERDICT_EXPORT_FIELD_NUMBER: _ClassVar[int]
+    CLUSTERING_FIELD_NUMBER: _ClassVar[int]
+    BUG_MANAGEMENT_FIELD_NUMBER: _ClassVar[int]
+    monorail_hostname: str
+    chunk_gcs_bucket: str
+    reclustering_workers: int
+    reclustering_interval_minutes: int
+    bug_updates_enabled: bool
+    test_variant_analysis: TestVariantAnalysis
+    ingestion: Ingestion
+    test_verdict_export: TestVerdictExport
+    clustering: ClusteringSystem
+    bug_management: BugManagementSystem
+    def __init__(self, monorail_hostname: _Optional[str] = ..., chunk_gcs_bucket: _Optional[str] = ..., reclustering_workers: _Optional[int] = ..., reclustering_interval_minutes: _Optional[int] = ..., bug_updates_enabled: bool = ..., test_variant_analysis: _Optional[_Union[TestVariantAnalysis, _Mapping]] = ..., ingestion: _Optional[_Union[Ingestion, _Mapping]] = ..., test_verdict_export: _Optional[_Union[TestVerdictExport, _Mapping]] = ..., clustering: _Optional[_Union[ClusteringSystem, _Mapping]] = ..., bug_management: _Optional[_Union[BugManagementSystem, _Mapping]] = ...) -> None: ...
+
+class TestVariantAnalysis(_message.Message):
+    __slots__ = ("enabled", "bigquery_export_enabled")
+    ENABLED_FIELD_NUMBER: _ClassVar[int]
+    BIGQUERY_EXPORT_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    enabled: bool
+    bigquery_export_enabled: bool
+    def __init__(self, enabled: bool = ..., bigquery_export_enabled: bool = ...) -> None: ...
+
+class ClusteringSystem(_message.Message):
+    __slots__ = ("query_test_variant_analysis_enabled",)
+    QUERY_TEST_VARIANT_ANALYSIS_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    query_test_variant_analysis_enabled: bool
+    def __init__(self, query_test_variant_analysis_enabled: bool = ...) -> None: ...
+
+class Ingestion(_message.Message):
+    __slots__ = ("project_allowlist_enabled", "project_allowlist")
+    PROJECT_ALLOWLIST_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_ALLOWLIST_FIELD_NUMBER: _ClassVar[int]
+    project_allowlist_enabled: bool
+    project_allowlist: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, project_allowlist_enabled: bool = ..., project_allowlist: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class TestVerdictExport(_message.Message):
+    __slots__ = ("enabled",)
+    ENABLED_FIELD_NUMBER: _ClassVar[int]
+    enabled: bool
+    def __init__(self, enabled: bool = ...) -> None: ...
+
+class BugManagementSystem(_message.Message):
+    __slots__ = ("policy_based_management_enabled",)
+    POLICY_BASED_MANAGEMENT_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    policy_based_management_enabled: bool
+    def __init__(self, policy_based_management_enabled: bool = ...) -> None: ...
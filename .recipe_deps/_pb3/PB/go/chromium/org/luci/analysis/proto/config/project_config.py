@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/config/project_config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/config/project_config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.config import test_variant_analysis_config as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_config_dot_test__variant__analysis__config__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n?go.chromium.org/luci/analysis/proto/config/project_config.proto\x12\x14luci.analysis.config\x1a\x1fgoogle/protobuf/timestamp.proto\x1aMgo.chromium.org/luci/analysis/proto/config/test_variant_analysis_config.proto\"\xe0\x05\n\rProjectConfig\x12?\n\x10project_metadata\x18\x06 \x01(\x0b\x32%.luci.analysis.config.ProjectMetadata\x12\x30\n\x0clast_updated\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x34\n\nclustering\x18\x05 \x01(\x0b\x32 .luci.analysis.config.Clustering\x12;\n\x0e\x62ug_management\x18\t \x01(\x0b\x32#.luci.analysis.config.BugManagement\x12.\n\x07metrics\x18\x0b \x01(\x0b\x32\x1d.luci.analysis.config.Metrics\x12L\n\x17test_stability_criteria\x18\x0c \x01(\x0b\x32+.luci.analysis.config.TestStabilityCriteria\x12\x31\n\x06realms\x18\x03 \x03(\x0b\x32!.luci.analysis.config.RealmConfig\x12\x33\n\nbug_system\x18\x07 \x01(\x0e\x32\x1f.luci.analysis.config.BugSystem\x12\x37\n\x08monorail\x18\x01 \x01(\x0b\x32%.luci.analysis.config.MonorailProject\x12\x39\n\tbuganizer\x18\x08 \x01(\x0b\x32&.luci.analysis.config.BuganizerProject\x12\x43\n\x14\x62ug_filing_threshold\x18\x02 \x01(\x0b\x32%.luci.analysis.config.ImpactThreshold\x12J\n\x15\x62ug_filing_thresholds\x18\n \x03(\x0b\x32+.luci.analysis.config.ImpactMetricThreshold\"\'\n\x0fProjectMetadata\x12\x14\n\x0c\x64isplay_name\x18\x01 \x01(\t\"\x8a\x02\n\x07Metrics\x12?\n\toverrides\x18\x01 \x03(\x0b\x32,.luci.analysis.config.Metrics.MetricOverride\x1a\xbd\x01\n\x0eMetricOverride\x12\x11\n\tmetric_id\x18\x01 \x01(\t\x12\x17\n\nis_default\x18\x02 \x01(\x08H\x00\x88\x01\x01\x12\x1a\n\rsort_priority\x18\x03 \x01(\x05H\x01\x88\x01\x01\x12%\n\x18show_in_metrics_selector\x18\x04 \x01(\x08H\x02\x88\x01\x01\x42\r\n\x0b_is_defaultB\x10\n\x0e_sort_priorityB\x1b\n\x19_show_in_metrics_selector\"\xa9\x05\n\rBugManagement\x12&\n\x1e\x64isable_duplicate_bug_comments\x18\x01 \x01(\x08\x12;\n\x08policies\x18\x02 \x03(\x0b\x32).luci.analysis.config.BugManagementPolicy\x12;\n\x12\x64\x65\x66\x61ult_bug_system\x18\x03 \x01(\x0e\x32\x1f.luci.analysis.config.BugSystem\x12\x39\n\tbuganizer\x18\x04 \x01(\x0b\x32&.luci.analysis.config.BuganizerProject\x12\x37\n\x08monorail\x18\x05 \x01(\x0b\x32%.luci.analysis.config.MonorailProject\x12Q\n\rno_validation\x18\x06 \x01(\x0b\x32\x38.luci.analysis.config.BugManagement.NoInvalidationActionH\x00\x12W\n\x0breopen_bugs\x18\x07 \x01(\x0b\x32@.luci.analysis.config.BugManagement.ReopenBugsInvalidationActionH\x00\x12Z\n\rfile_new_bugs\x18\x08 \x01(\x0b\x32\x41.luci.analysis.config.BugManagement.FileNewBugsInvalidationActionH\x00\x1a\x16\n\x14NoInvalidationAction\x1a\x1e\n\x1cReopenBugsInvalidationAction\x1a\x1f\n\x1d\x46ileNewBugsInvalidationActionB!\n\x1f\x62ug_closure_invalidation_action\"\xd4\x06\n\x13\x42ugManagementPolicy\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06owners\x18\x02 \x03(\t\x12\x1b\n\x13human_readable_name\x18\x03 \x01(\t\x12\x39\n\x08priority\x18\x04 \x01(\x0e\x32\'.luci.analysis.config.BuganizerPriority\x12\x41\n\x07metrics\x18\x05 \x03(\x0b\x32\x30.luci.analysis.config.BugManagementPolicy.Metric\x12J\n\x0b\x65xplanation\x18\x06 \x01(\x0b\x32\x35.luci.analysis.config.BugManagementPolicy.Explanation\x12K\n\x0c\x62ug_template\x18\x07 \x01(\x0b\x32\x35.luci.analysis.config.BugManagementPolicy.BugTemplate\x1a\xa7\x01\n\x06Metric\x12\x11\n\tmetric_id\x18\x01 \x01(\t\x12\x43\n\x14\x61\x63tivation_threshold\x18\x02 \x01(\x0b\x32%.luci.analysis.config.MetricThreshold\x12\x45\n\x16\x64\x65\x61\x63tivation_threshold\x18\x03 \x01(\x0b\x32%.luci.analysis.config.MetricThreshold\x1a\x38\n\x0b\x45xplanation\x12\x14\n\x0cproblem_html\x18\x01 \x01(\t\x12\x13\n\x0b\x61\x63tion_html\x18\x02 \x01(\t\x1a\x88\x02\n\x0b\x42ugTemplate\x12\x18\n\x10\x63omment_template\x18\x01 \x01(\t\x12R\n\tbuganizer\x18\x02 \x01(\x0b\x32?.luci.analysis.config.BugManagementPolicy.BugTemplate.Buganizer\x12P\n\x08monorail\x18\x03 \x01(\x0b\x32>.luci.analysis.config.BugManagementPolicy.BugTemplate.Monorail\x1a\x1d\n\tBuganizer\x12\x10\n\x08hotlists\x18\x01 \x03(\x03\x1a\x1a\n\x08Monorail\x12\x0e\n\x06labels\x18\x01 \x03(\t\"\xe9\x03\n\x0fImpactThreshold\x12\x42\n\x13test_results_failed\x18\x04 \x01(\x0b\x32%.luci.analysis.config.MetricThreshold\x12?\n\x10test_runs_failed\x18\x05 \x01(\x0b\x32%.luci.analysis.config.MetricThreshold\x12\x44\n\x15presubmit_runs_failed\x18\x06 \x01(\x0b\x32%.luci.analysis.config.MetricThreshold\x12K\n\x1c\x63ritical_failures_exonerated\x18\x07 \x01(\x0b\x32%.luci.analysis.config.MetricThreshold\x12#\n\x16unexpected_failures_1d\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12#\n\x16unexpected_failures_3d\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12#\n\x16unexpected_failures_7d\x18\x03 \x01(\x03H\x02\x88\x01\x01\x42\x19\n\x17_unexpected_failures_1dB\x19\n\x17_unexpected_failures_3dB\x19\n\x17_unexpected_failures_7d\"d\n\x15ImpactMetricThreshold\x12\x11\n\tmetric_id\x18\x01 \x01(\t\x12\x38\n\tthreshold\x18\x02 \x01(\x0b\x32%.luci.analysis.config.MetricThreshold\"\x7f\n\x0fMetricThreshold\x12\x14\n\x07one_day\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x16\n\tthree_day\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x16\n\tseven_day\x18\x03 \x01(\x03H\x02\x88\x01\x01\x42\n\n\x08_one_dayB\x0c\n\n_three_dayB\x0c\n\n_seven_day\"\xc4\x02\n\x0fMonorailProject\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x46\n\x14\x64\x65\x66\x61ult_field_values\x18\x02 \x03(\x0b\x32(.luci.analysis.config.MonorailFieldValue\x12\x19\n\x11priority_field_id\x18\x03 \x01(\x03\x12:\n\npriorities\x18\x04 \x03(\x0b\x32&.luci.analysis.config.MonorailPriority\x12#\n\x1bpriority_hysteresis_percent\x18\x05 \x01(\x03\x12\x16\n\x0e\x64isplay_prefix\x18\x06 \x01(\t\x12\x19\n\x11monorail_hostname\x18\x07 \x01(\t\x12)\n!file_without_restrict_view_google\x18\x08 \x01(\x08\"5\n\x12MonorailFieldValue\x12\x10\n\x08\x66ield_id\x18\x01 \x01(\x03\x12\r\n\x05value\x18\x02 \x01(\t\"\x9f\x01\n\x10MonorailPriority\x12\x10\n\x08priority\x18\x01 \x01(\t\x12\x38\n\tthreshold\x18\x02 \x01(\x0b\x32%.luci.analysis.config.ImpactThreshold\x12?\n\nthresholds\x18\x03 \x03(\x0b\x32+.luci.analysis.config.ImpactMetricThreshold\"k\n\x0bRealmConfig\x12\x0c\n\x04name\x18\x01 \x01(\t\x12N\n\x15test_variant_analysis\x18\x02 \x01(\x0b\x32/.luci.analysis.config.TestVariantAnalysisConfig\"q\n\nClustering\x12\x45\n\x0ftest_name_rules\x18\x01 \x03(\x0b\x32,.luci.analysis.config.TestNameClusteringRule\x12\x1c\n\x14reason_mask_patterns\x18\x02 \x03(\t\"N\n\x16TestNameClusteringRule\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07pattern\x18\x02 \x01(\t\x12\x15\n\rlike_template\x18\x03 \x01(\t\" \n\x12\x42uganizerComponent\x12\n\n\x02id\x18\x01 \x01(\x03\"\xc2\x03\n\x10\x42uganizerProject\x12\x43\n\x11\x64\x65\x66\x61ult_component\x18\x01 \x01(\x0b\x32(.luci.analysis.config.BuganizerComponent\x12#\n\x1bpriority_hysteresis_percent\x18\x02 \x01(\x03\x12Q\n\x11priority_mappings\x18\x03 \x03(\x0b\x32\x36.luci.analysis.config.BuganizerProject.PriorityMapping\x12\'\n\x1f\x66ile_without_limit_view_trusted\x18\x04 \x01(\x08\x1a\xc7\x01\n\x0fPriorityMapping\x12\x39\n\x08priority\x18\x01 \x01(\x0e\x32\'.luci.analysis.config.BuganizerPriority\x12\x38\n\tthreshold\x18\x02 \x01(\x0b\x32%.luci.analysis.config.ImpactThreshold\x12?\n\nthresholds\x18\x03 \x03(\x0b\x32+.luci.analysis.config.ImpactMetricThreshold\"\x97\x03\n\x15TestStabilityCriteria\x12U\n\x0c\x66\x61ilure_rate\x18\x01 \x01(\x0b\x32?.luci.analysis.config.TestStabilityCriteria.FailureRateCriteria\x12Q\n\nflake_rate\x18\x02 \x01(\x0b\x32=.luci.analysis.config.TestStabilityCriteria.FlakeRateCriteria\x1aW\n\x13\x46\x61ilureRateCriteria\x12\x19\n\x11\x66\x61ilure_threshold\x18\x01 \x01(\x05\x12%\n\x1d\x63onsecutive_failure_threshold\x18\x02 \x01(\x05\x1a{\n\x11\x46lakeRateCriteria\x12\x12\n\nmin_window\x18\x01 \x01(\x05\x12\x17\n\x0f\x66lake_threshold\x18\x02 \x01(\x05\x12\x1c\n\x14\x66lake_rate_threshold\x18\x03 \x01(\x01\x12\x1b\n\x13\x66lake_threshold_1wd\x18\x04 \x01(\x05*D\n\tBugSystem\x12\x1a\n\x16\x42UG_SYSTEM_UNSPECIFIED\x10\x00\x12\x0c\n\x08MONORAIL\x10\x01\x12\r\n\tBUGANIZER\x10\x02*_\n\x11\x42uganizerPriority\x12\"\n\x1e\x42UGANIZER_PRIORITY_UNSPECIFIED\x10\x00\x12\x06\n\x02P0\x10\x01\x12\x06\n\x02P1\x10\x02\x12\x06\n\x02P2\x10\x03\x12\x06\n\x02P3\x10\x04\x12\x06\n\x02P4\x10\x05\x42\x35Z3go.chromium.org/luci/analysis/proto/config;configpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.config.project_config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z3go.chromium.org/luci/analysis/proto/config;configpb'
+  _globals['_BUGSYSTEM']._serialized_start=5257
+  _globals['_BUGSYSTEM']._serialized_end=5325
+  _globals['_BUGANIZERPRIORITY']._serialized_start=5327
+  _globals['_BUGANIZERPRIORITY']._serialized_end=5422
+  _globals['_PROJECTCONFIG']._serialized_start=202
+  _globals['_PROJECTCONFIG']._serialized_end=938
+  _globals['_PROJECTMETADATA']._serialized_start=940
+  _globals['_PROJECTMETADATA']._serialized_end=979
+  _globals['_METRICS']._serialized_start=982
+  _globals['_METRICS']._serialized_end=1248
+  _globals['_METRICS_METRICOVERRIDE']._serialized_start=1059
+  _globals['_METRICS_METRICOVERRIDE']._serialized_end=1248
+  _globals['_BUGMANAGEMENT']._serialized_start=1251
+  _globals['_BUGMANAGEMENT']._serialized_end=1932
+  _globals['_BUGMANAGEMENT_NOINVALIDATIONACTION']._serialized_start=1810
+  _globals['_BUGMANAGEMENT_NOINVALIDATIONACTION']._serialized_end=1832
+  _globals['_BUGMANAGEMENT_REOPENBUGSINVALIDATIONACTION']._serialized_start=1834
+  _globals['_BUGMANAGEMENT_REOPENBUGSINVALIDATIONACTION']._serialized_end=1864
+  _globals['_BUGMANAGEMENT_FILENEWBUGSINVALIDATIONACTION']._serialized_start=1866
+  _globals['_BUGMANAGEMENT_FILENEWBUGSINVALIDATIONACTION']._serialized_end=1897
+  _globals['_BUGMANAGEMENTPOLICY']._serialized_start=1935
+  _globals['_BUGMANAGEMENTPOLICY']._serialized_end=2787
+  _globals['_BUGMANAGEMENTPOLICY_METRIC']._serialized_start=2295
+  _globals['_BUGMANAGEMENTPOLICY_METRIC']._serialized_end=2462
+  _globals['_BUGMANAGEMENTPOLICY_EXPLANATION']._serialized_start=2464
+  _globals['_BUGMANAGEMENTPOLICY_EXPLANATION']._serialized_end=2520
+  _globals['_BUGMANAGEMENTPOLICY_BUGTEMPLATE']._serialized_start=2523
+  _globals['_BUGMANAGEMENTPOLICY_BUGTEMPLATE']._serialized_end=2787
+  _globals['_BUGMANAGEMENTPOLICY_BUGTEMPLATE_BUGANIZER']._serialized_start=2730
+  _globals['_BUGMANAGEMENTPOLICY_BUGTEMPLATE_BUGANIZER']._serialized_end=2759
+  _globals['_BUGMANAGEMENTPOLICY_BUGTEMPLATE_MONORAIL']._serialized_start=2761
+  _globals['_BUGMANAGEMENTPOLICY_BUGTEMPLATE_MONORAIL']._serialized_end=2787
+  _globals['_IMPACTTHRESHOLD']._serialized_start=2790
+  _globals['_IMPACTTHRESHOLD']._serialized_end=3279
+  _globals['_IMPACTMETRICTHRESHOLD']._serialized_start=3281
+  _globals['_IMPACTMETRICTHRESHOLD']._serialized_end=3381
+  _globals['_METRICTHRESHOLD']._serialized_start=3383
+  _globals['_METRICTHRESHOLD']._serialized_end=3510
+  _globals['_MONORAILPROJECT']._serialized_start=3513
+  _globals['_MONORAILPROJECT']._serialized_end=3837
+  _globals['_MONORAILFIELDVALUE']._serialized_start=3839
+  _globals['_MONORAILFIELDVALUE']._serialized_end=3892
+  _globals['_MONORAILPRIORITY']._serialized_start=3895
+  _globals['_MONORAILPRIORITY']._serialized_end=4054
+  _globals['_REALMCONFIG']._serialized_start=4056
+  _globals['_REALMCONFIG']._serialized_end=4163
+  _globals['_CLUSTERING']._serialized_start=4165
+  _globals['_CLUSTERING']._serialized_end=4278
+  _globals['_TESTNAMECLUSTERINGRULE']._serialized_start=4280
+  _globals['_TESTNAMECLUSTERINGRULE']._serialized_end=4358
+  _globals['_BUGANIZERCOMPONENT']._serialized_start=4360
+  _globals['_BUGANIZERCOMPONENT']._serialized_end=4392
+  _globals['_BUGANIZERPROJECT']._serialized_start=4395
+  _globals['_BUGANIZERPROJECT']._serialized_end=4845
+  _globals['_BUGANIZERPROJECT_PRIORITYMAPPING']._serialized_start=4646
+  _globals['_BUGANIZERPROJECT_PRIORITYMAPPING']._serialized_end=4845
+  _globals['_TESTSTABILITYCRITERIA']._serialized_start=4848
+  _globals['_TESTSTABILITYCRITERIA']._serialized_end=5255
+  _globals['_TESTSTABILITYCRITERIA_FAILURERATECRITERIA']._serialized_start=5043
+  _globals['_TESTSTABILITYCRITERIA_FAILURERATECRITERIA']._serialized_end=5130
+  _globals['_TESTSTABILITYCRITERIA_FLAKERATECRITERIA']._serialized_start=5132
+  _globals['_TESTSTABILITYCRITERIA_FLAKERATECRITERIA']._serialized_end=5255
+# @@protoc_insertion_point(module_scope)
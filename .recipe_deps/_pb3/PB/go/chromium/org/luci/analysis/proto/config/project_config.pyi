@@ -0,0 +1,322 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.config import test_variant_analysis_config as _test_variant_analysis_config_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BugSystem(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    BUG_SYSTEM_UNSPECIFIED: _ClassVar[BugSystem]
+    MONORAIL: _ClassVar[BugSystem]
+    BUGANIZER: _ClassVar[BugSystem]
+
+class BuganizerPriority(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    BUGANIZER_PRIORITY_UNSPECIFIED: _ClassVar[BuganizerPriority]
+    P0: _ClassVar[BuganizerPriority]
+    P1: _ClassVar[BuganizerPriority]
+    P2: _ClassVar[BuganizerPriority]
+    P3: _ClassVar[BuganizerPriority]
+    P4: _ClassVar[BuganizerPriority]
+BUG_SYSTEM_UNSPECIFIED: BugSystem
+MONORAIL: BugSystem
+BUGANIZER: BugSystem
+BUGANIZER_PRIORITY_UNSPECIFIED: BuganizerPriority
+P0: BuganizerPriority
+P1: BuganizerPriority
+P2: BuganizerPriority
+P3: BuganizerPriority
+P4: BuganizerPriority
+
+class ProjectConfig(_message.Message):
+    __slots__ = ("project_metadata", "last_updated", "clustering", "bug_management", "metrics", "test_stability_criteria", "realms", "bug_system", "monorail", "buganizer", "bug_filing_threshold", "bug_filing_thresholds")
+    PROJECT_METADATA_FIELD_NUMBER: _ClassVar[int]
+    LAST_UPDATED_FIELD_NUMBER: _ClassVar[int]
+    CLUSTERING_FIELD_NUMBER: _ClassVar[int]
+    BUG_MANAGEMENT_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    TEST_STABILITY_CRITERIA_FIELD_NUMBER: _ClassVar[int]
+    REALMS_FIELD_NUMBER: _ClassVar[int]
+    BUG_SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_FIELD_NUMBER: _ClassVar[int]
+    BUGANIZER_FIELD_NUMBER: _ClassVar[int]
+    BUG_FILING_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+    BUG_FILING_THRESHOLDS_FIELD_NUMBER: _ClassVar[int]
+    project_metadata: ProjectMetadata
+    last_updated: _timestamp_pb2.Timestamp
+    clustering: Clustering
+    bug_management: BugManagement
+    metrics: Metrics
+    test_stability_criteria: TestStabilityCriteria
+    realms: _containers.RepeatedCompositeFieldContainer[RealmConfig]
+    bug_system: BugSystem
+    monorail: MonorailProject
+    buganizer: BuganizerProject
+    bug_filing_threshold: ImpactThreshold
+    bug_filing_thresholds: _containers.RepeatedCompositeFieldContainer[ImpactMetricThreshold]
+    def __init__(self, project_metadata: _Optional[_Union[ProjectMetadata, _Mapping]] = ..., last_updated: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., clustering: _Optional[_Union[Clustering, _Mapping]] = ..., bug_management: _Optional[_Union[BugManagement, _Mapping]] = ..., metrics: _Optional[_Union[Metrics, _Mapping]] = ..., test_stability_criteria: _Optional[_Union[TestStabilityCriteria, _Mapping]] = ..., realms: _Optional[_Iterable[_Union[RealmConfig, _Mapping]]] = ..., bug_system: _Optional[_Union[BugSystem, str]] = ..., monorail: _Optional[_Union[MonorailProject, _Mapping]] = ..., buganizer: _Optional[_Union[BuganizerProject, _Mapping]] = ..., bug_filing_threshold: _Optional[_Union[ImpactThreshold, _Mapping]] = ..., bug_filing_thresholds: _Optional[_Iterable[_Union[ImpactMetricThreshold, _Mapping]]] = ...) -> None: ...
+
+class ProjectMetadata(_message.Message):
+    __slots__ = ("display_name",)
+    DISPLAY_NAME_FIELD_NUMBER: _ClassVar[int]
+    display_name: str
+    def __init__(self, display_name: _Optional[str] = ...) -> None: ...
+
+class Metrics(_message.Message):
+    __slots__ = ("overrides",)
+    class MetricOverride(_message.Message):
+        __slots__ = ("metric_id", "is_default", "sort_priority", "show_in_metrics_selector")
+        METRIC_ID_FIELD_NUMBER: _ClassVar[int]
+        IS_DEFAULT_FIELD_NUMBER: _ClassVar[int]
+        SORT_PRIORITY_FIELD_NUMBER: _ClassVar[int]
+        SHOW_IN_METRICS_SELECTOR_FIELD_NUMBER: _ClassVar[int]
+        metric_id: str
+        is_default: bool
+        sort_priority: int
+        show_in_metrics_selector: bool
+        def __init__(self, metric_id: _Optional[str] = ..., is_default: bool = ..., sort_priority: _Optional[int] = ..., show_in_metrics_selector: bool = ...) -> None: ...
+    OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    overrides: _containers.RepeatedCompositeFieldContainer[Metrics.MetricOverride]
+    def __init__(self, overrides: _Optional[_Iterable[_Union[Metrics.MetricOverride, _Mapping]]] = ...) -> None: ...
+
+class BugManagement(_message.Message):
+    __slots__ = ("disable_duplicate_bug_comments", "policies", "default_bug_system", "buganizer", "monorail", "no_validation", "reopen_bugs", "file_new_bugs")
+    class NoInvalidationAction(_message.Message):
+        __slots__ = ()
+        def __init__(self) -> None: ...
+    class ReopenBugsInvalidationAction(_message.Message):
+        __slots__ = ()
+        def __init__(self) -> None: ...
+    class FileNewBugsInvalidationAction(_message.Message):
+        __slots__ = ()
+        def __init__(self) -> None: ...
+    DISABLE_DUPLICATE_BUG_COMMENTS_FIELD_NUMBER: _ClassVar[int]
+    POLICIES_FIELD_NUMBER: _ClassVar[int]
+    DEFAULT_BUG_SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    BUGANIZER_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_FIELD_NUMBER: _ClassVar[int]
+    NO_VALIDATION_FIELD_NUMBER: _ClassVar[int]
+    REOPEN_BUGS_FIELD_NUMBER: _ClassVar[int]
+    FILE_NEW_BUGS_FIELD_NUMBER: _ClassVar[int]
+    disable_duplicate_bug_comments: bool
+    policies: _containers.RepeatedCompositeFieldContainer[BugManagementPolicy]
+    default_bug_system: BugSystem
+    buganizer: BuganizerProject
+    monorail: MonorailProject
+    no_validation: BugManagement.NoInvalidationAction
+    reopen_bugs: BugManagement.ReopenBugsInvalidationAction
+    file_new_bugs: BugManagement.FileNewBugsInvalidationAction
+    def __init__(self, disable_duplicate_bug_comments: bool = ..., policies: _Optional[_Iterable[_Union[BugManagementPolicy, _Mapping]]] = ..., default_bug_system: _Optional[_Union[BugSystem, str]] = ..., buganizer: _Optional[_Union[BuganizerProject, _Mapping]] = ..., monorail: _Optional[_Union[MonorailProject, _Mapping]] = ..., no_validation: _Optional[_Union[BugManagement.NoInvalidationAction, _Mapping]] = ..., reopen_bugs: _Optional[_Union[BugManagement.ReopenBugsInvalidationAction, _Mapping]] = ..., file_new_bugs: _Optional[_Union[BugManagement.FileNewBugsInvalidationAction, _Mapping]] = ...) -> None: ...
+
+class BugManagementPolicy(_message.Message):
+    __slots__ = ("id", "owners", "human_readable_name", "priority", "metrics", "explanation", "bug_template")
+    class Metric(_message.Message):
+        __slots__ = ("metric_id", "activation_threshold", "deactivation_threshold")
+        METRIC_ID_FIELD_NUMBER: _ClassVar[int]
+        ACTIVATION_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        DEACTIVATION_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        metric_id: str
+        activation_threshold: MetricThreshold
+        deactivation_threshold: MetricThreshold
+        def __init__(self, metric_id: _Optional[str] = ..., activation_threshold: _Optional[_Union[MetricThreshold, _Mapping]] = ..., deactivation_threshold: _Optional[_Union[MetricThreshold, _Mapping]] = ...) -> None: ...
+    class Explanation(_message.Message):
+        __slots__ = ("problem_html", "action_html")
+        PROBLEM_HTML_FIELD_NUMBER: _ClassVar[int]
+        ACTION_HTML_FIELD_NUMBER: _ClassVar[int]
+        problem_html: str
+        action_html: str
+        def __init__(self, problem_html: _Optional[str] = ..., action_html: _Optional[str] = ...) -> None: ...
+    class BugTemplate(_message.Message):
+        __slots__ = ("comment_template", "buganizer", "monorail")
+        class Buganizer(_message.Message):
+            __slots__ = ("hotlists",)
+            HOTLISTS_FIELD_NUMBER: _ClassVar[int]
+            hotlists: _containers.RepeatedScalarFieldContainer[int]
+            def __init__(self, hotlists: _Optional[_Iterable[int]] = ...) -> None: ...
+        class Monorail(_message.Message):
+            __slots__ = ("labels",)
+            LABELS_FIELD_NUMBER: _ClassVar[int]
+            labels: _containers.RepeatedScalarFieldContainer[str]
+            def __init__(self, labels: _Optional[_Iterable[str]] = ...) -> None: ...
+        COMMENT_TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+        BUGANIZER_FIELD_NUMBER: _ClassVar[int]
+        MONORAIL_FIELD_NUMBER: _ClassVar[int]
+        comment_template: str
+        buganizer: BugManagementPolicy.BugTemplate.Buganizer
+        monorail: BugManagementPolicy.BugTemplate.Monorail
+        def __init__(self, comment_template: _Optional[str] = ..., buganizer: _Optional[_Union[BugManagementPolicy.BugTemplate.Buganizer, _Mapping]] = ..., monorail: _Optional[_Union[BugManagementPolicy.BugTemplate.Monorail, _Mapping]] = ...) -> None: ...
+    ID_FIELD_NUMBER: _ClassVar[int]
+    OWNERS_FIELD_NUMBER: _ClassVar[int]
+    HUMAN_READABLE_NAME_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    EXPLANATION_FIELD_NUMBER: _ClassVar[int]
+    BUG_TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    owners: _containers.RepeatedScalarFieldContainer[str]
+    human_readable_name: str
+    priority: BuganizerPriority
+    metrics: _containers.RepeatedCompositeFieldContainer[BugManagementPolicy.Metric]
+    explanation: BugManagementPolicy.Explanation
+    bug_template: BugManagementPolicy.BugTemplate
+    def __init__(self, id: _Optional[str] = ..., owners: _Optional[_Iterable[str]] = ..., human_readable_name: _Optional[str] = ..., priority: _Optional[_Union[BuganizerPriority, str]] = ..., metrics: _Optional[_Iterable[_Union[BugManagementPolicy.Metric, _Mapping]]] = ..., explanation: _Optional[_Union[BugManagementPolicy.Explanation, _Mapping]] = ..., bug_template: _Optional[_Union[BugManagementPolicy.BugTemplate, _Mapping]] = ...) -> None: ...
+
+class ImpactThreshold(_message.Message):
+    __slots__ = ("test_results_failed", "test_runs_failed", "presubmit_runs_failed", "critical_failures_exonerated", "unexpected_failures_1d", "unexpected_failures_3d", "unexpected_failures_7d")
+    TEST_RESULTS_FAILED_FIELD_NUMBER: _ClassVar[int]
+    TEST_RUNS_FAILED_FIELD_NUMBER: _ClassVar[int]
+    PRESUBMIT_RUNS_FAILED_FIELD_NUMBER: _ClassVar[int]
+    CRITICAL_FAILURES_EXONERATED_FIELD_NUMBER: _ClassVar[int]
+    UNEXPECTED_FAILURES_1D_FIELD_NUMBER: _ClassVar[int]
+    UNEXPECTED_FAILURES_3D_FIELD_NUMBER: _ClassVar[int]
+    UNEXPECTED_FAILURES_7D_FIELD_NUMBER: _ClassVar[int]
+    test_results_failed: MetricThreshold
+    test_runs_failed: MetricThreshold
+    presubmit_runs_failed: MetricThreshold
+    critical_failures_exonerated: MetricThreshold
+    unexpected_failures_1d: int
+    unexpected_failures_3d: int
+    unexpected_failures_7d: int
+    def __init__(self, test_results_failed: _Optional[_Union[MetricThreshold, _Mapping]] = ..., test_runs_failed: _Optional[_Union[MetricThreshold, _Mapping]] = ..., presubmit_runs_failed: _Optional[_Union[MetricThreshold, _Mapping]] = ..., critical_failures_exonerated: _Optional[_Union[MetricThreshold, _Mapping]] = ..., unexpected_failures_1d: _Optional[int] = ..., unexpected_failures_3d: _Optional[int] = ..., unexpected_failures_7d: _Optional[int] = ...) -> None: ...
+
+class ImpactMetricThreshold(_message.Message):
+    __slots__ = ("metric_id", "threshold")
+    METRIC_ID_FIELD_NUMBER: _ClassVar[int]
+    THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+    metric_id: str
+    threshold: MetricThreshold
+    def __init__(self, metric_id: _Optional[str] = ..., threshold: _Optional[_Union[MetricThreshold, _Mapping]] = ...) -> None: ...
+
+class MetricThreshold(_message.Message):
+    __slots__ = ("one_day", "three_day", "seven_day")
+    ONE_DAY_FIELD_NUMBER: _ClassVar[int]
+    THREE_DAY_FIELD_NUMBER: _ClassVar[int]
+    SEVEN_DAY_FIELD_NUMBER: _ClassVar[int]
+    one_day: int
+    three_day: int
+    seven_day: int
+    def __init__(self, one_day: _Optional[int] = ..., three_day: _Optional[int] = ..., seven_day: _Optional[int] = ...) -> None: ...
+
+class MonorailProject(_message.Message):
+    __slots__ = ("project", "default_field_values", "priority_field_id", "priorities", "priority_hysteresis_percent", "display_prefix", "monorail_hostname", "file_without_restrict_view_google")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    DEFAULT_FIELD_VALUES_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_ID_FIELD_NUMBER: _ClassVar[int]
+    PRIORITIES_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_HYSTERESIS_PERCENT_FIELD_NUMBER: _ClassVar[int]
+    DISPLAY_PREFIX_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    FILE_WITHOUT_RESTRICT_VIEW_GOOGLE_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    default_field_values: _containers.RepeatedCompositeFieldContainer[MonorailFieldValue]
+    priority_field_id: int
+    priorities: _containers.RepeatedCompositeFieldContainer[MonorailPriority]
+    priority_hysteresis_percent: int
+    display_prefix: str
+    monorail_hostname: str
+    file_without_restrict_view_google: bool
+    def __init__(self, project: _Optional[str] = ..., default_field_values: _Optional[_Iterable[_Union[MonorailFieldValue, _Mapping]]] = ..., priority_field_id: _Optional[int] = ..., priorities: _Optional[_Iterable[_Union[MonorailPriority, _Mapping]]] = ..., priority_hysteresis_percent: _Optional[int] = ..., display_prefix: _Optional[str] = ..., monorail_hostname: _Optional[str] = ..., file_without_restrict_view_google: bool = ...) -> None: ...
+
+class MonorailFieldValue(_message.Message):
+    __slots__ = ("field_id", "value")
+    FIELD_ID_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    field_id: int
+    value: str
+    def __init__(self, field_id: _Optional[int] = ..., value: _Optional[str] = ...) -> None: ...
+
+class MonorailPriority(_message.Message):
+    __slots__ = ("priority", "threshold", "thresholds")
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+    THRESHOLDS_FIELD_NUMBER: _ClassVar[int]
+    priority: str
+    threshold: ImpactThreshold
+    thresholds: _containers.RepeatedCompositeFieldContainer[ImpactMetricThreshold]
+    def __init__(self, priority: _Optional[str] = ..., threshold: _Optional[_Union[ImpactThreshold, _Mapping]] = ..., thresholds: _Optional[_Iterable[_Union[ImpactMetricThreshold, _Mapping]]] = ...) -> None: ...
+
+class RealmConfig(_message.Message):
+    __slots__ = ("name", "test_variant_analysis")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANT_ANALYSIS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    test_variant_analysis: _test_variant_analysis_config_pb2.TestVariantAnalysisConfig
+    def __init__(self, name: _Optional[str] = ..., test_variant_analysis: _Optional[_Union[_test_variant_analysis_config_pb2.TestVariantAnalysisConfig, _Mapping]] = ...) -> None: ...
+
+class Clustering(_message.Message):
+    __slots__ = ("test_name_rules", "reason_mask_patterns")
+    TEST_NAME_RULES_FIELD_NUMBER: _ClassVar[int]
+    REASON_MASK_PATTERNS_FIELD_NUMBER: _ClassVar[int]
+    test_name_rules: _containers.RepeatedCompositeFieldContainer[TestNameClusteringRule]
+    reason_mask_patterns: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, test_name_rules: _Optional[_Iterable[_Union[TestNameClusteringRule, _Mapping]]] = ..., reason_mask_patterns: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class TestNameClusteringRule(_message.Message):
+    __slots__ = ("name", "pattern", "like_template")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PATTERN_FIELD_NUMBER: _ClassVar[int]
+    LIKE_TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    pattern: str
+    like_template: str
+    def __init__(self, name: _Optional[str] = ..., pattern: _Optional[str] = ..., like_template: _Optional[str] = ...) -> None: ...
+
+class BuganizerComponent(_message.Message):
+    __slots__ = ("id",)
+    ID_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    def __init__(self, id: _Optional[int] = ...) -> None: ...
+
+class BuganizerProject(_message.Message):
+    __slots__ = ("default_component", "priority_hysteresis_percent", "priority_mappings", "file_without_limit_view_trusted")
+    class PriorityMapping(_message.Message):
+        __slots__ = ("priority", "threshold", "thresholds")
+        PRIORITY_FIELD_NUMBER: _ClassVar[int]
+        THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        THRESHOLDS_FIELD_NUMBER: _ClassVar[int]
+        priority: BuganizerPriority
+        threshold: ImpactThreshold
+        thresholds: _containers.RepeatedCompositeFieldContainer[ImpactMetricThreshold]
+        def __init__(self, priority: _Optional[_Union[BuganizerPriority, str]] = ..., threshold: _Optional[_Union[ImpactThreshold, _Mapping]] = ..., thresholds: _Optional[_Iterable[_Union[ImpactMetricThreshold, _Mapping]]] = ...) -> None: ...
+    DEFAULT_COMPONENT_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_HYSTERESIS_PERCENT_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_MAPPINGS_FIELD_NUMBER: _ClassVar[int]
+    FILE_WITHOUT_LIMIT_VIEW_TRUSTED_FIELD_NUMBER: _ClassVar[int]
+    default_component: BuganizerComponent
+    priority_hysteresis_percent: int
+    priority_mappings: _containers.RepeatedCompositeFieldContainer[BuganizerProject.PriorityMapping]
+    file_without_limit_view_trusted: bool
+    def __init__(self, default_component: _Optional[_Union[BuganizerComponent, _Mapping]] = ..., priority_hysteresis_percent: _Optional[int] = ..., priority_mappings: _Optional[_Iterable[_Union[BuganizerProject.PriorityMapping, _Mapping]]] = ..., file_without_limit_view_trusted: bool = ...) -> None: ...
+
+class TestStabilityCriteria(_message.Message):
+    __slots__ = ("failure_rate", "flake_rate")
+    class FailureRateCriteria(_message.Message):
+        __slots__ = ("failure_threshold", "consecutive_failure_threshold")
+        FAILURE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        CONSECUTIVE_FAILURE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        failure_threshold: int
+        consecutive_failure_threshold: int
+        def __init__(self, failure_threshold: _Optional[int] = ..., consecutive_failure_threshold: _Optional[int] = ...) -> None: ...
+    class FlakeRateCriteria(_message.Message):
+        __slots__ = ("min_window", "flake_threshold", "flake_rate_threshold", "flake_threshold_1wd")
+        MIN_WINDOW_FIELD_NUMBER: _ClassVar[int]
+        FLAKE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        FLAKE_RATE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        FLAKE_THRESHOLD_1WD_FIELD_NUMBER: _ClassVar[int]
+        min_window: int
+        flake_threshold: int
+        flake_rate_threshold: float
+        flake_threshold_1wd: int
+        def __init__(self, min_window: _Optional[int] = ..., flake_threshold: _Optional[int] = ..., flake_rate_threshold: _Optional[float] = ..., flake_threshold_1wd: _Optional[int] = ...) -> None: ...
+    FAILURE_RATE_FIELD_NUMBER: _ClassVar[int]
+    FLAKE_RATE_FIELD_NUMBER: _ClassVar[int]
+    failure_rate: TestStabilityCriteria.FailureRateCriteria
+    flake_rate: TestStabilityCriteria.FlakeRateCriteria
+    def __init__(self, failure_rate: _Optional[_Union[TestStabilityCriteria.FailureRateCriteria, _Mapping]] = ..., flake_rate: _Optional[_Union[TestStabilityCriteria.FlakeRateCriteria, _Mapping]] = ...) -> None: ...
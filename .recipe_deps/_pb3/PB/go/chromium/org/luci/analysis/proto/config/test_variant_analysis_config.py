@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/config/test_variant_analysis_config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/config/test_variant_analysis_config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from PB.go.chromium.org.luci.analysis.proto.analyzedtestvariant import predicate as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_analyzedtestvariant_dot_predicate__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nMgo.chromium.org/luci/analysis/proto/config/test_variant_analysis_config.proto\x12\x14luci.analysis.config\x1a\x1egoogle/protobuf/duration.proto\x1aGgo.chromium.org/luci/analysis/proto/analyzedtestvariant/predicate.proto\"\xdc\x01\n\x0e\x42igQueryExport\x12\x41\n\x05table\x18\x01 \x01(\x0b\x32\x32.luci.analysis.config.BigQueryExport.BigQueryTable\x12?\n\tpredicate\x18\x02 \x01(\x0b\x32,.luci.analysis.analyzedtestvariant.Predicate\x1a\x46\n\rBigQueryTable\x12\x15\n\rcloud_project\x18\x01 \x01(\t\x12\x0f\n\x07\x64\x61taset\x18\x02 \x01(\t\x12\r\n\x05table\x18\x03 \x01(\t\"\xa5\x01\n\x15UpdateTestVariantTask\x12\x44\n!update_test_variant_task_interval\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x46\n#test_variant_status_update_duration\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration\"\xa4\x01\n\x19TestVariantAnalysisConfig\x12M\n\x18update_test_variant_task\x18\x01 \x01(\x0b\x32+.luci.analysis.config.UpdateTestVariantTask\x12\x38\n\nbq_exports\x18\x02 \x03(\x0b\x32$.luci.analysis.config.BigQueryExportB5Z3go.chromium.org/luci/analysis/proto/config;configpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.config.test_variant_analysis_config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z3go.chromium.org/luci/analysis/proto/config;configpb'
+  _globals['_BIGQUERYEXPORT']._serialized_start=209
+  _globals['_BIGQUERYEXPORT']._serialized_end=429
+  _globals['_BIGQUERYEXPORT_BIGQUERYTABLE']._serialized_start=359
+  _globals['_BIGQUERYEXPORT_BIGQUERYTABLE']._serialized_end=429
+  _globals['_UPDATETESTVARIANTTASK']._serialized_start=432
+  _globals['_UPDATETESTVARIANTTASK']._serialized_end=597
+  _globals['_TESTVARIANTANALYSISCONFIG']._serialized_start=600
+  _globals['_TESTVARIANTANALYSISCONFIG']._serialized_end=764
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,44 @@
+import datetime
+
+from google.protobuf import duration_pb2 as _duration_pb2
+from PB.go.chromium.org.luci.analysis.proto.analyzedtestvariant import predicate as _predicate_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BigQueryExport(_message.Message):
+    __slots__ = ("table", "predicate")
+    class BigQueryTable(_message.Message):
+        __slots__ = ("cloud_project", "dataset", "table")
+        CLOUD_PROJECT_FIELD_NUMBER: _ClassVar[int]
+        DATASET_FIELD_NUMBER: _ClassVar[int]
+        TABLE_FIELD_NUMBER: _ClassVar[int]
+        cloud_project: str
+        dataset: str
+        table: str
+        def __init__(self, cloud_project: _Optional[str] = ..., dataset: _Optional[str] = ..., table: _Optional[str] = ...) -> None: ...
+    TABLE_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    table: BigQueryExport.BigQueryTable
+    predicate: _predicate_pb2.Predicate
+    def __init__(self, table: _Optional[_Union[BigQueryExport.BigQueryTable, _Mapping]] = ..., predicate: _Optional[_Union[_predicate_pb2.Predicate, _Mapping]] = ...) -> None: ...
+
+class UpdateTestVariantTask(_message.Message):
+    __slots__ = ("update_test_variant_task_interval", "test_variant_status_update_duration")
+    UPDATE_TEST_VARIANT_TASK_INTERVAL_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANT_STATUS_UPDATE_DURATION_FIELD_NUMBER: _ClassVar[int]
+    update_test_variant_task_interval: _duration_pb2.Duration
+    test_variant_status_update_duration: _duration_pb2.Duration
+    def __init__(self, update_test_variant_task_interval: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., test_variant_status_update_duration: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ...) -> None: ...
+
+class TestVariantAnalysisConfig(_message.Message):
+    __slots__ = ("update_test_variant_task", "bq_exports")
+    UPDATE_TEST_VARIANT_TASK_FIELD_NUMBER: _ClassVar[int]
+    BQ_EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    update_test_variant_task: UpdateTestVariantTask
+    bq_exports: _containers.RepeatedCompositeFieldContainer[BigQueryExport]
+    def __init__(self, update_test_variant_task: _Optional[_Union[UpdateTestVariantTask, _Mapping]] = ..., bq_exports: _Optional[_Iterable[_Union[BigQueryExport, _Mapping]]] = ...) -> None: ...
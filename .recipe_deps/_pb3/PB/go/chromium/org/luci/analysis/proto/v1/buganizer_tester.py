@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/buganizer_tester.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/buganizer_tester.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n=go.chromium.org/luci/analysis/proto/v1/buganizer_tester.proto\x12\x10luci.analysis.v1\"\x1a\n\x18\x43reateSampleIssueRequest\"-\n\x19\x43reateSampleIssueResponse\x12\x10\n\x08issue_id\x18\x01 \x01(\x03\x32\x81\x01\n\x0f\x42uganizerTester\x12n\n\x11\x43reateSampleIssue\x12*.luci.analysis.v1.CreateSampleIssueRequest\x1a+.luci.analysis.v1.CreateSampleIssueResponse\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.buganizer_tester_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_CREATESAMPLEISSUEREQUEST']._serialized_start=83
+  _globals['_CREATESAMPLEISSUEREQUEST']._serialized_end=109
+  _globals['_CREATESAMPLEISSUERESPONSE']._serialized_start=111
+  _globals['_CREATESAMPLEISSUERESPONSE']._serialized_end=156
+  _globals['_BUGANIZERTESTER']._serialized_start=159
+  _globals['_BUGANIZERTESTER']._serialized_end=288
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,15 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class CreateSampleIssueRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class CreateSampleIssueResponse(_message.Message):
+    __slots__ = ("issue_id",)
+    ISSUE_ID_FIELD_NUMBER: _ClassVar[int]
+    issue_id: int
+    def __init__(self, issue_id: _Optional[int] = ...) -> None: ...
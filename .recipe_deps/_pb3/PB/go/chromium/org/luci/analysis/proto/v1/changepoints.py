@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/changepoints.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/changepoints.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/analysis/proto/v1/changepoints.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\"\xb2\x01\n+QueryChangepointGroupSummariesRequestLegacy\x12\x0f\n\x07project\x18\x01 \x01(\t\x12?\n\tpredicate\x18\x02 \x01(\x0b\x32,.luci.analysis.v1.ChangepointPredicateLegacy\x12\x31\n\rbegin_of_week\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x9a\x01\n%QueryChangepointGroupSummariesRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x39\n\tpredicate\x18\x02 \x01(\x0b\x32&.luci.analysis.v1.ChangepointPredicate\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"\x82\x01\n\x1a\x43hangepointPredicateLegacy\x12\x16\n\x0etest_id_prefix\x18\x01 \x01(\t\x12L\n$unexpected_verdict_rate_change_range\x18\x02 \x01(\x0b\x32\x1e.luci.analysis.v1.NumericRange\"/\n\x14\x43hangepointPredicate\x12\x17\n\x0ftest_id_contain\x18\x01 \x01(\t\"r\n,QueryChangepointGroupSummariesResponseLegacy\x12\x42\n\x0fgroup_summaries\x18\x01 \x03(\x0b\x32).luci.analysis.v1.ChangepointGroupSummary\"\x85\x01\n&QueryChangepointGroupSummariesResponse\x12\x42\n\x0fgroup_summaries\x18\x01 \x03(\x0b\x32).luci.analysis.v1.ChangepointGroupSummary\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\x99\x01\n\x17\x43hangepointGroupSummary\x12<\n\x15\x63\x61nonical_changepoint\x18\x01 \x01(\x0b\x32\x1d.luci.analysis.v1.Changepoint\x12@\n\nstatistics\x18\x02 \x01(\x0b\x32,.luci.analysis.v1.ChangepointGroupStatistics\"\xd7\x06\n\x1a\x43hangepointGroupStatistics\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x65\n\x1eunexpected_verdict_rate_before\x18\x02 \x01(\x0b\x32=.luci.analysis.v1.ChangepointGroupStatistics.RateDistribution\x12\x64\n\x1dunexpected_verdict_rate_after\x18\x03 \x01(\x0b\x32=.luci.analysis.v1.ChangepointGroupStatistics.RateDistribution\x12\x66\n\x1funexpected_verdict_rate_current\x18\x04 \x01(\x0b\x32=.luci.analysis.v1.ChangepointGroupStatistics.RateDistribution\x12\x66\n\x1eunexpected_verdict_rate_change\x18\x05 \x01(\x0b\x32>.luci.analysis.v1.ChangepointGroupStatistics.RateChangeBuckets\x1a\xf8\x01\n\x10RateDistribution\x12\x0f\n\x07\x61verage\x18\x01 \x01(\x02\x12Z\n\x07\x62uckets\x18\x02 \x01(\x0b\x32I.luci.analysis.v1.ChangepointGroupStatistics.RateDistribution.RateBuckets\x1aw\n\x0bRateBuckets\x12\x1c\n\x14\x63ount_less_5_percent\x18\x01 \x01(\x05\x12*\n\"count_above_5_less_than_95_percent\x18\x02 \x01(\x05\x12\x1e\n\x16\x63ount_above_95_percent\x18\x03 \x01(\x05\x1a\x91\x01\n\x11RateChangeBuckets\x12\'\n\x1f\x63ount_increased_0_to_20_percent\x18\x01 \x01(\x05\x12(\n count_increased_20_to_50_percent\x18\x02 \x01(\x05\x12)\n!count_increased_50_to_100_percent\x18\x03 \x01(\x05\"\xec\x02\n\x1fQueryChangepointsInGroupRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12Z\n\tgroup_key\x18\x02 \x01(\x0b\x32G.luci.analysis.v1.QueryChangepointsInGroupRequest.ChangepointIdentifier\x12\x39\n\tpredicate\x18\x03 \x01(\x0b\x32&.luci.analysis.v1.ChangepointPredicate\x1a\xa0\x01\n\x15\x43hangepointIdentifier\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x02 \x01(\t\x12\x10\n\x08ref_hash\x18\x03 \x01(\t\x12\x1e\n\x16nominal_start_position\x18\x04 \x01(\x03\x12.\n\nstart_hour\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"W\n QueryChangepointsInGroupResponse\x12\x33\n\x0c\x63hangepoints\x18\x01 \x03(\x0b\x32\x1d.luci.analysis.v1.Changepoint\"\xfe\x02\n\x0b\x43hangepoint\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12*\n\x07variant\x18\x0e \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12\x10\n\x08ref_hash\x18\x04 \x01(\t\x12(\n\x03ref\x18\x05 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12.\n\nstart_hour\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x1fstart_position_lower_bound_99th\x18\n \x01(\x03\x12\'\n\x1fstart_position_upper_bound_99th\x18\x0b \x01(\x03\x12\x1e\n\x16nominal_start_position\x18\x0c \x01(\x03\x12-\n%previous_segment_nominal_end_position\x18\r \x01(\x03\x32\xc5\x03\n\x0c\x43hangepoints\x12\xa1\x01\n\x1eQueryChangepointGroupSummaries\x12=.luci.analysis.v1.QueryChangepointGroupSummariesRequestLegacy\x1a>.luci.analysis.v1.QueryChangepointGroupSummariesResponseLegacy\"\x00\x12\x8a\x01\n\x13QueryGroupSummaries\x12\x37.luci.analysis.v1.QueryChangepointGroupSummariesRequest\x1a\x38.luci.analysis.v1.QueryChangepointGroupSummariesResponse\"\x00\x12\x83\x01\n\x18QueryChangepointsInGroup\x12\x31.luci.analysis.v1.QueryChangepointsInGroupRequest\x1a\x32.luci.analysis.v1.QueryChangepointsInGroupResponse\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.changepoints_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESREQUESTLEGACY']._serialized_start=220
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESREQUESTLEGACY']._serialized_end=398
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESREQUEST']._serialized_start=401
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESREQUEST']._serialized_end=555
+  _globals['_CHANGEPOINTPREDICATELEGACY']._serialized_start=558
+  _globals['_CHANGEPOINTPREDICATELEGACY']._serialized_end=688
+  _globals['_CHANGEPOINTPREDICATE']._serialized_start=690
+  _globals['_CHANGEPOINTPREDICATE']._serialized_end=737
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESRESPONSELEGACY']._serialized_start=739
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESRESPONSELEGACY']._serialized_end=853
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESRESPONSE']._serialized_start=856
+  _globals['_QUERYCHANGEPOINTGROUPSUMMARIESRESPONSE']._serialized_end=989
+  _globals['_CHANGEPOINTGROUPSUMMARY']._serialized_start=992
+  _globals['_CHANGEPOINTGROUPSUMMARY']._serialized_end=1145
+  _globals['_CHANGEPOINTGROUPSTATISTICS']._serialized_start=1148
+  _globals['_CHANGEPOINTGROUPSTATISTICS']._serialized_end=2003
+  _globals['_CHANGEPOINTGROUPSTATISTICS_RATEDISTRIBUTION']._serialized_start=1607
+  _globals['_CHANGEPOINTGROUPSTATISTICS_RATEDISTRIBUTION']._serialized_end=1855
+  _globals['_CHANGEPOINTGROUPSTATISTICS_RATEDISTRIBUTION_RATEBUCKETS']._serialized_start=1736
+  _globals['_CHANGEPOINTGROUPSTATISTICS_RATEDISTRIBUTION_RATEBUCKETS']._serialized_end=1855
+  _globals['_CHANGEPOINTGROUPSTATISTICS_RATECHANGEBUCKETS']._serialized_start=1858
+  _globals['_CHANGEPOINTGROUPSTATISTICS_RATECHANGEBUCKETS']._serialized_end=2003
+  _globals['_QUERYCHANGEPOINTSINGROUPREQUEST']._serialized_start=2006
+  _globals['_QUERYCHANGEPOINTSINGROUPREQUEST']._serialized_end=2370
+  _globals['_QUERYCHANGEPOINTSINGROUPREQUEST_CHANGEPOINTIDENTIFIER']._serialized_start=2210
+  _globals['_QUERYCHANGEPOINTSINGROUPREQUEST_CHANGEPOINTIDENTIFIER']._serialized_end=2370
+  _globals['_QUERYCHANGEPOINTSINGROUPRESPONSE']._serialized_start=2372
+  _globals['_QUERYCHANGEPOINTSINGROUPRESPONSE']._serialized_end=2459
+  _globals['_CHANGEPOINT']._serialized_start=2462
+  _globals['_CHANGEPOINT']._serialized_end=2844
+  _globals['_CHANGEPOINTS']._serialized_start=2847
+  _globals['_CHANGEPOINTS']._serialized_end=3300
+# @@protoc_insertion_point(module_scope)
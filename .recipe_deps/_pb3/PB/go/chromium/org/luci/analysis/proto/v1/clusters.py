@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/clusters.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/clusters.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import failure_reason as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_failure__reason__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5go.chromium.org/luci/analysis/proto/v1/clusters.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a;go.chromium.org/luci/analysis/proto/v1/failure_reason.proto\"\xd1\x01\n\x0e\x43lusterRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x41\n\x0ctest_results\x18\x02 \x03(\x0b\x32+.luci.analysis.v1.ClusterRequest.TestResult\x1ak\n\nTestResult\x12\x13\n\x0brequest_tag\x18\x01 \x01(\t\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x37\n\x0e\x66\x61ilure_reason\x18\x03 \x01(\x0b\x32\x1f.luci.analysis.v1.FailureReason\"\x9b\x03\n\x0f\x43lusterResponse\x12U\n\x16\x63lustered_test_results\x18\x01 \x03(\x0b\x32\x35.luci.analysis.v1.ClusterResponse.ClusteredTestResult\x12?\n\x12\x63lustering_version\x18\x02 \x01(\x0b\x32#.luci.analysis.v1.ClusteringVersion\x1a\xef\x01\n\x13\x43lusteredTestResult\x12\x13\n\x0brequest_tag\x18\x01 \x01(\t\x12T\n\x08\x63lusters\x18\x02 \x03(\x0b\x32\x42.luci.analysis.v1.ClusterResponse.ClusteredTestResult.ClusterEntry\x1am\n\x0c\x43lusterEntry\x12/\n\ncluster_id\x18\x01 \x01(\x0b\x32\x1b.luci.analysis.v1.ClusterId\x12,\n\x03\x62ug\x18\x02 \x01(\x0b\x32\x1f.luci.analysis.v1.AssociatedBug\"\x96\x01\n\x11\x43lusteringVersion\x12\x1a\n\x12\x61lgorithms_version\x18\x01 \x01(\x05\x12\x31\n\rrules_version\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x32\n\x0e\x63onfig_version\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"!\n\x11GetClusterRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xc6\x03\n\x07\x43luster\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0bhas_example\x18\x02 \x01(\x08\x12\r\n\x05title\x18\x03 \x01(\t\x12\x37\n\x07metrics\x18\n \x03(\x0b\x32&.luci.analysis.v1.Cluster.MetricsEntry\x12+\n#equivalent_failure_association_rule\x18\x07 \x01(\t\x1a\x19\n\x06\x43ounts\x12\x0f\n\x07nominal\x18\x01 \x01(\x03\x1a\xad\x01\n\x0eTimewiseCounts\x12\x31\n\x07one_day\x18\x02 \x01(\x0b\x32 .luci.analysis.v1.Cluster.Counts\x12\x33\n\tthree_day\x18\x03 \x01(\x0b\x32 .luci.analysis.v1.Cluster.Counts\x12\x33\n\tseven_day\x18\x04 \x01(\x0b\x32 .luci.analysis.v1.Cluster.Counts\x1aX\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.luci.analysis.v1.Cluster.TimewiseCounts:\x02\x38\x01\".\n\x1eGetReclusteringProgressRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xa6\x01\n\x14ReclusteringProgress\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1a\n\x12progress_per_mille\x18\x02 \x01(\x05\x12\x31\n\x04last\x18\x05 \x01(\x0b\x32#.luci.analysis.v1.ClusteringVersion\x12\x31\n\x04next\x18\x06 \x01(\x0b\x32#.luci.analysis.v1.ClusteringVersion\"\xcf\x01\n\x1cQueryClusterSummariesRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x16\n\x0e\x66\x61ilure_filter\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x0f\n\x07metrics\x18\x04 \x03(\t\x12/\n\ntime_range\x18\x05 \x01(\x0b\x32\x1b.luci.analysis.v1.TimeRange\x12\x32\n\x04view\x18\x06 \x01(\x0e\x32$.luci.analysis.v1.ClusterSummaryView\"\\\n\x1dQueryClusterSummariesResponse\x12;\n\x11\x63luster_summaries\x18\x01 \x03(\x0b\x32 .luci.analysis.v1.ClusterSummary\"\xd3\x02\n\x0e\x43lusterSummary\x12/\n\ncluster_id\x18\x01 \x01(\x0b\x32\x1b.luci.analysis.v1.ClusterId\x12\r\n\x05title\x18\x02 \x01(\t\x12,\n\x03\x62ug\x18\x03 \x01(\x0b\x32\x1f.luci.analysis.v1.AssociatedBug\x12>\n\x07metrics\x18\x07 \x03(\x0b\x32-.luci.analysis.v1.ClusterSummary.MetricsEntry\x1a\x35\n\x0bMetricValue\x12\r\n\x05value\x18\x01 \x01(\x03\x12\x17\n\x0f\x64\x61ily_breakdown\x18\x02 \x03(\x03\x1a\\\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.luci.analysis.v1.ClusterSummary.MetricValue:\x02\x38\x01\"D\n\x1bQueryClusterFailuresRequest\x12\x0e\n\x06parent\x18\x01 \x01(\t\x12\x15\n\rmetric_filter\x18\x02 \x01(\t\"Z\n\x1cQueryClusterFailuresResponse\x12:\n\x08\x66\x61ilures\x18\x01 \x03(\x0b\x32(.luci.analysis.v1.DistinctClusterFailure\"\xa4\x06\n\x16\x44istinctClusterFailure\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12\x32\n\x0epartition_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12L\n\rpresubmit_run\x18\x04 \x01(\x0b\x32\x35.luci.analysis.v1.DistinctClusterFailure.PresubmitRun\x12\x19\n\x11is_build_critical\x18\x05 \x01(\x08\x12J\n\x0c\x65xonerations\x18\x06 \x03(\x0b\x32\x34.luci.analysis.v1.DistinctClusterFailure.Exoneration\x12\x33\n\x0c\x62uild_status\x18\x07 \x01(\x0e\x32\x1d.luci.analysis.v1.BuildStatus\x12\x1e\n\x16ingested_invocation_id\x18\x08 \x01(\t\x12&\n\x1eis_ingested_invocation_blocked\x18\t \x01(\x08\x12\x31\n\x0b\x63hangelists\x18\n \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\x12\r\n\x05\x63ount\x18\x0b \x01(\x05\x12\x1d\n\x15\x66\x61ilure_reason_prefix\x18\x0c \x01(\t\x1a\x42\n\x0b\x45xoneration\x12\x33\n\x06reason\x18\x01 \x01(\x0e\x32#.luci.analysis.v1.ExonerationReason\x1a\xc1\x01\n\x0cPresubmitRun\x12:\n\x10presubmit_run_id\x18\x01 \x01(\x0b\x32 .luci.analysis.v1.PresubmitRunId\x12\r\n\x05owner\x18\x02 \x01(\t\x12\x30\n\x04mode\x18\x03 \x01(\x0e\x32\".luci.analysis.v1.PresubmitRunMode\x12\x34\n\x06status\x18\x04 \x01(\x0e\x32$.luci.analysis.v1.PresubmitRunStatus\";\n)QueryClusterExoneratedTestVariantsRequest\x12\x0e\n\x06parent\x18\x01 \x01(\t\"s\n*QueryClusterExoneratedTestVariantsResponse\x12\x45\n\rtest_variants\x18\x01 \x03(\x0b\x32..luci.analysis.v1.ClusterExoneratedTestVariant\"\xb7\x01\n\x1c\x43lusterExoneratedTestVariant\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12$\n\x1c\x63ritical_failures_exonerated\x18\x03 \x01(\x05\x12\x34\n\x10last_exoneration\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"B\n0QueryClusterExoneratedTestVariantBranchesRequest\x12\x0e\n\x06parent\x18\x01 \x01(\t\"\x88\x01\n1QueryClusterExoneratedTestVariantBranchesResponse\x12S\n\x15test_variant_branches\x18\x01 \x03(\x0b\x32\x34.luci.analysis.v1.ClusterExoneratedTestVariantBranch\"\xff\x01\n\"ClusterExoneratedTestVariantBranch\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12*\n\x07variant\x18\x03 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12/\n\nsource_ref\x18\x04 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12$\n\x1c\x63ritical_failures_exonerated\x18\x05 \x01(\x05\x12\x34\n\x10last_exoneration\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"d\n\x1aQueryClusterHistoryRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x16\n\x0e\x66\x61ilure_filter\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ys\x18\x03 \x01(\x05\x12\x0f\n\x07metrics\x18\x04 \x03(\t\"P\n\x1bQueryClusterHistoryResponse\x12\x31\n\x04\x64\x61ys\x18\x01 \x03(\x0b\x32#.luci.analysis.v1.ClusterHistoryDay\"\x94\x01\n\x11\x43lusterHistoryDay\x12\x41\n\x07metrics\x18\x01 \x03(\x0b\x32\x30.luci.analysis.v1.ClusterHistoryDay.MetricsEntry\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01*O\n\x12\x43lusterSummaryView\x12$\n CLUSTER_SUMMARY_VIEW_UNSPECIFIED\x10\x00\x12\t\n\x05\x42\x41SIC\x10\x01\x12\x08\n\x04\x46ULL\x10\x02\x32\xcf\x07\n\x08\x43lusters\x12P\n\x07\x43luster\x12 .luci.analysis.v1.ClusterRequest\x1a!.luci.analysis.v1.ClusterResponse\"\x00\x12G\n\x03Get\x12#.luci.analysis.v1.GetClusterRequest\x1a\x19.luci.analysis.v1.Cluster\"\x00\x12u\n\x17GetReclusteringProgress\x12\x30.luci.analysis.v1.GetReclusteringProgressRequest\x1a&.luci.analysis.v1.ReclusteringProgress\"\x00\x12z\n\x15QueryClusterSummaries\x12..luci.analysis.v1.QueryClusterSummariesRequest\x1a/.luci.analysis.v1.QueryClusterSummariesResponse\"\x00\x12w\n\x14QueryClusterFailures\x12-.luci.analysis.v1.QueryClusterFailuresRequest\x1a..luci.analysis.v1.QueryClusterFailuresResponse\"\x00\x12\x9a\x01\n\x1bQueryExoneratedTestVariants\x12;.luci.analysis.v1.QueryClusterExoneratedTestVariantsRequest\x1a<.luci.analysis.v1.QueryClusterExoneratedTestVariantsResponse\"\x00\x12\xaf\x01\n\"QueryExoneratedTestVariantBranches\x12\x42.luci.analysis.v1.QueryClusterExoneratedTestVariantBranchesRequest\x1a\x43.luci.analysis.v1.QueryClusterExoneratedTestVariantBranchesResponse\"\x00\x12m\n\x0cQueryHistory\x12,.luci.analysis.v1.QueryClusterHistoryRequest\x1a-.luci.analysis.v1.QueryClusterHistoryResponse\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.clusters_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_CLUSTER_METRICSENTRY']._loaded_options = None
+  _globals['_CLUSTER_METRICSENTRY']._serialized_options = b'8\001'
+  _globals['_CLUSTERSUMMARY_METRICSENTRY']._loaded_options = None
+  _globals['_CLUSTERSUMMARY_METRICSENTRY']._serialized_options = b'8\001'
+  _globals['_CLUSTERHISTORYDAY_METRICSENTRY']._loaded_options = None
+  _globals['_CLUSTERHISTORYDAY_METRICSENTRY']._serialized_options = b'8\001'
+  _globals['_CLUSTERSUMMARYVIEW']._serialized_start=4543
+  _globals['_CLUSTERSUMMARYVIEW']._serialized_end=4622
+  _globals['_CLUSTERREQUEST']._serialized_start=277
+  _globals['_CLUSTERREQUEST']._serialized_end=486
+  _globals['_CLUSTERREQUEST_TESTRESULT']._serialized_start=379
+  _globals['_CLUSTERREQUEST_TESTRESULT']._serialized_end=486
+  _globals['_CLUSTERRESPONSE']._serialized_start=489
+  _globals['_CLUSTERRESPONSE']._serialized_end=900
+  _globals['_CLUSTERRESPONSE_CLUSTEREDTESTRESULT']._serialized_start=661
+  _globals['_CLUSTERRESPONSE_CLUSTEREDTESTRESULT']._serialized_end=900
+  _globals['_CLUSTERRESPONSE_CLUSTEREDTESTRESULT_CLUSTERENTRY']._serialized_start=791
+  _globals['_CLUSTERRESPONSE_CLUSTEREDTESTRESULT_CLUSTERENTRY']._serialized_end=900
+  _globals['_CLUSTERINGVERSION']._serialized_start=903
+  _globals['_CLUSTERINGVERSION']._serialized_end=1053
+  _globals['_GETCLUSTERREQUEST']._serialized_start=1055
+  _globals['_GETCLUSTERREQUEST']._serialized_end=1088
+  _globals['_CLUSTER']._serialized_start=1091
+  _globals['_CLUSTER']._serialized_end=1545
+  _globals['_CLUSTER_COUNTS']._serialized_start=1254
+  _globals['_CLUSTER_COUNTS']._serialized_end=1279
+  _globals['_CLUSTER_TIMEWISECOUNTS']._serialized_start=1282
+  _globals['_CLUSTER_TIMEWISECOUNTS']._serialized_end=1455
+  _globals['_CLUSTER_METRICSENTRY']._serialized_start=1457
+  _globals['_CLUSTER_METRICSENTRY']._serialized_end=1545
+  _globals['_GETRECLUSTERINGPROGRESSREQUEST']._serialized_start=1547
+  _globals['_GETRECLUSTERINGPROGRESSREQUEST']._serialized_end=1593
+  _globals['_RECLUSTERINGPROGRESS']._serialized_start=1596
+  _globals['_RECLUSTERINGPROGRESS']._serialized_end=1762
+  _globals['_QUERYCLUSTERSUMMARIESREQUEST']._serialized_start=1765
+  _globals['_QUERYCLUSTERSUMMARIESREQUEST']._serialized_end=1972
+  _globals['_QUERYCLUSTERSUMMARIESRESPONSE']._serialized_start=1974
+  _globals['_QUERYCLUSTERSUMMARIESRESPONSE']._serialized_end=2066
+  _globals['_CLUSTERSUMMARY']._serialized_start=2069
+  _globals['_CLUSTERSUMMARY']._serialized_end=2408
+  _globals['_CLUSTERSUMMARY_METRICVALUE']._serialized_start=2261
+  _globals['_CLUSTERSUMMARY_METRICVALUE']._serialized_end=2314
+  _globals['_CLUSTERSUMMARY_METRICSENTRY']._serialized_start=2316
+  _globals['_CLUSTERSUMMARY_METRICSENTRY']._serialized_end=2408
+  _globals['_QUERYCLUSTERFAILURESREQUEST']._serialized_start=2410
+  _globals['_QUERYCLUSTERFAILURESREQUEST']._serialized_end=2478
+  _globals['_QUERYCLUSTERFAILURESRESPONSE']._serialized_start=2480
+  _globals['_QUERYCLUSTERFAILURESRESPONSE']._serialized_end=2570
+  _globals['_DISTINCTCLUSTERFAILURE']._serialized_start=2573
+  _globals['_DISTINCTCLUSTERFAILURE']._serialized_end=3377
+  _globals['_DISTINCTCLUSTERFAILURE_EXONERATION']._serialized_start=3115
+  _globals['_DISTINCTCLUSTERFAILURE_EXONERATION']._serialized_end=3181
+  _globals['_DISTINCTCLUSTERFAILURE_PRESUBMITRUN']._serialized_start=3184
+  _globals['_DISTINCTCLUSTERFAILURE_PRESUBMITRUN']._serialized_end=3377
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTSREQUEST']._serialized_start=3379
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTSREQUEST']._serialized_end=3438
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTSRESPONSE']._serialized_start=3440
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTSRESPONSE']._serialized_end=3555
+  _globals['_CLUSTEREXONERATEDTESTVARIANT']._serialized_start=3558
+  _globals['_CLUSTEREXONERATEDTESTVARIANT']._serialized_end=3741
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTBRANCHESREQUEST']._serialized_start=3743
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTBRANCHESREQUEST']._serialized_end=3809
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTBRANCHESRESPONSE']._serialized_start=3812
+  _globals['_QUERYCLUSTEREXONERATEDTESTVARIANTBRANCHESRESPONSE']._serialized_end=3948
+  _globals['_CLUSTEREXONERATEDTESTVARIANTBRANCH']._serialized_start=3951
+  _globals['_CLUSTEREXONERATEDTESTVARIANTBRANCH']._serialized_end=4206
+  _globals['_QUERYCLUSTERHISTORYREQUEST']._serialized_start=4208
+  _globals['_QUERYCLUSTERHISTORYREQUEST']._serialized_end=4308
+  _globals['_QUERYCLUSTERHISTORYRESPONSE']._serialized_start=4310
+  _globals['_QUERYCLUSTERHISTORYRESPONSE']._serialized_end=4390
+  _globals['_CLUSTERHISTORYDAY']._serialized_start=4393
+  _globals['_CLUSTERHISTORYDAY']._serialized_end=4541
+  _globals['_CLUSTERHISTORYDAY_METRICSENTRY']._serialized_start=4495
+  _globals['_CLUSTERHISTORYDAY_METRICSENTRY']._serialized_end=4541
+  _globals['_CLUSTERS']._serialized_start=4625
+  _globals['_CLUSTERS']._serialized_end=5600
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/common.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/analysis/proto/v1/common.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"e\n\tTimeRange\x12,\n\x08\x65\x61rliest\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12*\n\x06latest\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"*\n\x0cTestResultId\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\"f\n\x07Variant\x12/\n\x03\x64\x65\x66\x18\x01 \x03(\x0b\x32\".luci.analysis.v1.Variant.DefEntry\x1a*\n\x08\x44\x65\x66\x45ntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xc7\x01\n\x0eTestIdentifier\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x15\n\rmodule_scheme\x18\x02 \x01(\t\x12\x31\n\x0emodule_variant\x18\x03 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12\x1b\n\x13module_variant_hash\x18\x04 \x01(\t\x12\x13\n\x0b\x63oarse_name\x18\x05 \x01(\t\x12\x11\n\tfine_name\x18\x06 \x01(\t\x12\x11\n\tcase_name\x18\x07 \x01(\t\"J\n\x12\x46latTestIdentifier\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\tJ\x04\x08\x02\x10\x03R\x07variant\"(\n\nStringPair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"9\n\x14\x42ugTrackingComponent\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\x11\n\tcomponent\x18\x02 \x01(\t\",\n\x0ePresubmitRunId\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\"W\n\rAssociatedBug\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x17\n\tlink_text\x18\x03 \x01(\tB\x04\xe2\x41\x01\x03\x12\x11\n\x03url\x18\x04 \x01(\tB\x04\xe2\x41\x01\x03\"*\n\tClusterId\x12\x11\n\talgorithm\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\"8\n\x0cNumericRange\x12\x13\n\x0blower_bound\x18\x01 \x01(\x02\x12\x13\n\x0bupper_bound\x18\x02 \x01(\x02\"y\n\nTestResult\"k\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\n\n\x06PASSED\x10\x01\x12\n\n\x06\x46\x41ILED\x10\x02\x12\x0b\n\x07SKIPPED\x10\x03\x12\x15\n\x11\x45XECUTION_ERRORED\x10\x04\x12\r\n\tPRECLUDED\x10\x05*\x9a\x01\n\x0b\x42uildStatus\x12\x1c\n\x18\x42UILD_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14\x42UILD_STATUS_SUCCESS\x10\x01\x12\x18\n\x14\x42UILD_STATUS_FAILURE\x10\x02\x12\x1e\n\x1a\x42UILD_STATUS_INFRA_FAILURE\x10\x03\x12\x19\n\x15\x42UILD_STATUS_CANCELED\x10\x04*\x8f\x01\n\x11\x45xonerationReason\x12\"\n\x1e\x45XONERATION_REASON_UNSPECIFIED\x10\x00\x12\x16\n\x12OCCURS_ON_MAINLINE\x10\x01\x12\x17\n\x13OCCURS_ON_OTHER_CLS\x10\x02\x12\x10\n\x0cNOT_CRITICAL\x10\x03\x12\x13\n\x0fUNEXPECTED_PASS\x10\x04*]\n\x0fSubmittedFilter\x12 \n\x1cSUBMITTED_FILTER_UNSPECIFIED\x10\x00\x12\x12\n\x0eONLY_SUBMITTED\x10\x01\x12\x14\n\x10ONLY_UNSUBMITTED\x10\x02*z\n\x10PresubmitRunMode\x12\"\n\x1ePRESUBMIT_RUN_MODE_UNSPECIFIED\x10\x00\x12\x0b\n\x07\x44RY_RUN\x10\x01\x12\x0c\n\x08\x46ULL_RUN\x10\x02\x12\x11\n\rQUICK_DRY_RUN\x10\x03\x12\x14\n\x10NEW_PATCHSET_RUN\x10\x04*\xa2\x01\n\x12PresubmitRunStatus\x12$\n PRESUBMIT_RUN_STATUS_UNSPECIFIED\x10\x00\x12\"\n\x1ePRESUBMIT_RUN_STATUS_SUCCEEDED\x10\x01\x12\x1f\n\x1bPRESUBMIT_RUN_STATUS_FAILED\x10\x02\x12!\n\x1dPRESUBMIT_RUN_STATUS_CANCELED\x10\x03\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_VARIANT_DEFENTRY']._loaded_options = None
+  _globals['_VARIANT_DEFENTRY']._serialized_options = b'8\001'
+  _globals['_ASSOCIATEDBUG'].fields_by_name['link_text']._loaded_options = None
+  _globals['_ASSOCIATEDBUG'].fields_by_name['link_text']._serialized_options = b'\342A\001\003'
+  _globals['_ASSOCIATEDBUG'].fields_by_name['url']._loaded_options = None
+  _globals['_ASSOCIATEDBUG'].fields_by_name['url']._serialized_options = b'\342A\001\003'
+  _globals['_BUILDSTATUS']._serialized_start=1130
+  _globals['_BUILDSTATUS']._serialized_end=1284
+  _globals['_EXONERATIONREASON']._serialized_start=1287
+  _globals['_EXONERATIONREASON']._serialized_end=1430
+  _globals['_SUBMITTEDFILTER']._serialized_start=1432
+  _globals['_SUBMITTEDFILTER']._serialized_end=1525
+  _globals['_PRESUBMITRUNMODE']._serialized_start=1527
+  _globals['_PRESUBMITRUNMODE']._serialized_end=1649
+  _globals['_PRESUBMITRUNSTATUS']._serialized_start=1652
+  _globals['_PRESUBMITRUNSTATUS']._serialized_end=1814
+  _globals['_TIMERANGE']._serialized_start=139
+  _globals['_TIMERANGE']._serialized_end=240
+  _globals['_TESTRESULTID']._serialized_start=242
+  _globals['_TESTRESULTID']._serialized_end=284
+  _globals['_VARIANT']._serialized_start=286
+  _globals['_VARIANT']._serialized_end=388
+  _globals['_VARIANT_DEFENTRY']._serialized_start=346
+  _globals['_VARIANT_DEFENTRY']._serialized_end=388
+  _globals['_TESTIDENTIFIER']._serialized_start=391
+  _globals['_TESTIDENTIFIER']._serialized_end=590
+  _globals['_FLATTESTIDENTIFIER']._serialized_start=592
+  _globals['_FLATTESTIDENTIFIER']._serialized_end=666
+  _globals['_STRINGPAIR']._serialized_start=668
+  _globals['_STRINGPAIR']._serialized_end=708
+  _globals['_BUGTRACKINGCOMPONENT']._serialized_start=710
+  _globals['_BUGTRACKINGCOMPONENT']._serialized_end=767
+  _globals['_PRESUBMITRUNID']._serialized_start=769
+  _globals['_PRESUBMITRUNID']._serialized_end=813
+  _globals['_ASSOCIATEDBUG']._serialized_start=815
+  _globals['_ASSOCIATEDBUG']._serialized_end=902
+  _globals['_CLUSTERID']._serialized_start=904
+  _globals['_CLUSTERID']._serialized_end=946
+  _globals['_NUMERICRANGE']._serialized_start=948
+  _globals['_NUMERICRANGE']._serialized_end=1004
+  _globals['_TESTRESULT']._serialized_start=1006
+  _globals['_TESTRESULT']._serialized_end=1127
+  _globals['_TESTRESULT_STATUS']._serialized_start=1020
+  _globals['_TESTRESULT_STATUS']._serialized_end=1127
+# @@protoc_insertion_point(module_scope)
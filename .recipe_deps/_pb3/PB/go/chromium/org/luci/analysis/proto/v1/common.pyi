@@ -0,0 +1,194 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BuildStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    BUILD_STATUS_UNSPECIFIED: _ClassVar[BuildStatus]
+    BUILD_STATUS_SUCCESS: _ClassVar[BuildStatus]
+    BUILD_STATUS_FAILURE: _ClassVar[BuildStatus]
+    BUILD_STATUS_INFRA_FAILURE: _ClassVar[BuildStatus]
+    BUILD_STATUS_CANCELED: _ClassVar[BuildStatus]
+
+class ExonerationReason(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    EXONERATION_REASON_UNSPECIFIED: _ClassVar[ExonerationReason]
+    OCCURS_ON_MAINLINE: _ClassVar[ExonerationReason]
+    OCCURS_ON_OTHER_CLS: _ClassVar[ExonerationReason]
+    NOT_CRITICAL: _ClassVar[ExonerationReason]
+    UNEXPECTED_PASS: _ClassVar[ExonerationReason]
+
+class SubmittedFilter(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SUBMITTED_FILTER_UNSPECIFIED: _ClassVar[SubmittedFilter]
+    ONLY_SUBMITTED: _ClassVar[SubmittedFilter]
+    ONLY_UNSUBMITTED: _ClassVar[SubmittedFilter]
+
+class PresubmitRunMode(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    PRESUBMIT_RUN_MODE_UNSPECIFIED: _ClassVar[PresubmitRunMode]
+    DRY_RUN: _ClassVar[PresubmitRunMode]
+    FULL_RUN: _ClassVar[PresubmitRunMode]
+    QUICK_DRY_RUN: _ClassVar[PresubmitRunMode]
+    NEW_PATCHSET_RUN: _ClassVar[PresubmitRunMode]
+
+class PresubmitRunStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    PRESUBMIT_RUN_STATUS_UNSPECIFIED: _ClassVar[PresubmitRunStatus]
+    PRESUBMIT_RUN_STATUS_SUCCEEDED: _ClassVar[PresubmitRunStatus]
+    PRESUBMIT_RUN_STATUS_FAILED: _ClassVar[PresubmitRunStatus]
+    PRESUBMIT_RUN_STATUS_CANCELED: _ClassVar[PresubmitRunStatus]
+BUILD_STATUS_UNSPECIFIED: BuildStatus
+BUILD_STATUS_SUCCESS: BuildStatus
+BUILD_STATUS_FAILURE: BuildStatus
+BUILD_STATUS_INFRA_FAILURE: BuildStatus
+BUILD_STATUS_CANCELED: BuildStatus
+EXONERATION_REASON_UNSPECIFIED: ExonerationReason
+OCCURS_ON_MAINLINE: ExonerationReason
+OCCURS_ON_OTHER_CLS: ExonerationReason
+NOT_CRITICAL: ExonerationReason
+UNEXPECTED_PASS: ExonerationReason
+SUBMITTED_FILTER_UNSPECIFIED: SubmittedFilter
+ONLY_SUBMITTED: SubmittedFilter
+ONLY_UNSUBMITTED: SubmittedFilter
+PRESUBMIT_RUN_MODE_UNSPECIFIED: PresubmitRunMode
+DRY_RUN: PresubmitRunMode
+FULL_RUN: PresubmitRunMode
+QUICK_DRY_RUN: PresubmitRunMode
+NEW_PATCHSET_RUN: PresubmitRunMode
+PRESUBMIT_RUN_STATUS_UNSPECIFIED: PresubmitRunStatus
+PRESUBMIT_RUN_STATUS_SUCCEEDED: PresubmitRunStatus
+PRESUBMIT_RUN_STATUS_FAILED: PresubmitRunStatus
+PRESUBMIT_RUN_STATUS_CANCELED: PresubmitRunStatus
+
+class TimeRange(_message.Message):
+    __slots__ = ("earliest", "latest")
+    EARLIEST_FIELD_NUMBER: _ClassVar[int]
+    LATEST_FIELD_NUMBER: _ClassVar[int]
+    earliest: _timestamp_pb2.Timestamp
+    latest: _timestamp_pb2.Timestamp
+    def __init__(self, earliest: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., latest: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class TestResultId(_message.Message):
+    __slots__ = ("system", "id")
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    id: str
+    def __init__(self, system: _Optional[str] = ..., id: _Optional[str] = ...) -> None: ...
+
+class Variant(_message.Message):
+    __slots__ = ()
+    class DefEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    DEF_FIELD_NUMBER: _ClassVar[int]
+    def __init__(self, **kwargs) -> None: ...
+
+class TestIdentifier(_message.Message):
+    __slots__ = ("module_name", "module_scheme", "module_variant", "module_variant_hash", "coarse_name", "fine_name", "case_name")
+    MODULE_NAME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_SCHEME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    COARSE_NAME_FIELD_NUMBER: _ClassVar[int]
+    FINE_NAME_FIELD_NUMBER: _ClassVar[int]
+    CASE_NAME_FIELD_NUMBER: _ClassVar[int]
+    module_name: str
+    module_scheme: str
+    module_variant: Variant
+    module_variant_hash: str
+    coarse_name: str
+    fine_name: str
+    case_name: str
+    def __init__(self, module_name: _Optional[str] = ..., module_scheme: _Optional[str] = ..., module_variant: _Optional[_Union[Variant, _Mapping]] = ..., module_variant_hash: _Optional[str] = ..., coarse_name: _Optional[str] = ..., fine_name: _Optional[str] = ..., case_name: _Optional[str] = ...) -> None: ...
+
+class FlatTestIdentifier(_message.Message):
+    __slots__ = ("test_id", "variant_hash")
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant_hash: str
+    def __init__(self, test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ...) -> None: ...
+
+class StringPair(_message.Message):
+    __slots__ = ("key", "value")
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    key: str
+    value: str
+    def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+
+class BugTrackingComponent(_message.Message):
+    __slots__ = ("system", "component")
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    COMPONENT_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    component: str
+    def __init__(self, system: _Optional[str] = ..., component: _Optional[str] = ...) -> None: ...
+
+class PresubmitRunId(_message.Message):
+    __slots__ = ("system", "id")
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    id: str
+    def __init__(self, system: _Optional[str] = ..., id: _Optional[str] = ...) -> None: ...
+
+class AssociatedBug(_message.Message):
+    __slots__ = ("system", "id", "link_text", "url")
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    LINK_TEXT_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    id: str
+    link_text: str
+    url: str
+    def __init__(self, system: _Optional[str] = ..., id: _Optional[str] = ..., link_text: _Optional[str] = ..., url: _Optional[str] = ...) -> None: ...
+
+class ClusterId(_message.Message):
+    __slots__ = ("algorithm", "id")
+    ALGORITHM_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    algorithm: str
+    id: str
+    def __init__(self, algorithm: _Optional[str] = ..., id: _Optional[str] = ...) -> None: ...
+
+class NumericRange(_message.Message):
+    __slots__ = ("lower_bound", "upper_bound")
+    LOWER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    UPPER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    lower_bound: float
+    upper_bound: float
+    def __init__(self, lower_bound: _Optional[float] = ..., upper_bound: _Optional[float] = ...) -> None: ...
+
+class TestResult(_message.Message):
+    __slots__ = ()
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_UNSPECIFIED: _ClassVar[TestResult.Status]
+        PASSED: _ClassVar[TestResult.Status]
+        FAILED: _ClassVar[TestResult.Status]
+        SKIPPED: _ClassVar[TestResult.Status]
+        EXECUTION_ERRORED: _ClassVar[TestResult.Status]
+        PRECLUDED: _ClassVar[TestResult.Status]
+    STATUS_UNSPECIFIED: TestResult.Status
+    PASSED: TestResult.Status
+    FAILED: TestResult.Status
+    SKIPPED: TestResult.Status
+    EXECUTION_ERRORED: TestResult.Status
+    PRECLUDED: TestResult.Status
+    def __init__(self) -> None: ...
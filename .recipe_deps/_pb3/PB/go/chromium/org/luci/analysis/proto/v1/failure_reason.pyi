@@ -0,0 +1,11 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class FailureReason(_message.Message):
+    __slots__ = ("primary_error_message",)
+    PRIMARY_ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    primary_error_message: str
+    def __init__(self, primary_error_message: _Optional[str] = ...) -> None: ...
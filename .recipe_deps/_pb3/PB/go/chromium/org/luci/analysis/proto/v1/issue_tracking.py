@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/issue_tracking.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/issue_tracking.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;go.chromium.org/luci/analysis/proto/v1/issue_tracking.proto\x12\x10luci.analysis.v1\"\x93\x01\n\x0c\x42ugComponent\x12@\n\rissue_tracker\x18\x01 \x01(\x0b\x32\'.luci.analysis.v1.IssueTrackerComponentH\x00\x12\x37\n\x08monorail\x18\x02 \x01(\x0b\x32#.luci.analysis.v1.MonorailComponentH\x00\x42\x08\n\x06system\"-\n\x15IssueTrackerComponent\x12\x14\n\x0c\x63omponent_id\x18\x01 \x01(\x03\"3\n\x11MonorailComponent\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t*_\n\x11\x42uganizerPriority\x12\"\n\x1e\x42UGANIZER_PRIORITY_UNSPECIFIED\x10\x00\x12\x06\n\x02P0\x10\x01\x12\x06\n\x02P1\x10\x02\x12\x06\n\x02P2\x10\x03\x12\x06\n\x02P3\x10\x04\x12\x06\n\x02P4\x10\x05\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.issue_tracking_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_BUGANIZERPRIORITY']._serialized_start=331
+  _globals['_BUGANIZERPRIORITY']._serialized_end=426
+  _globals['_BUGCOMPONENT']._serialized_start=82
+  _globals['_BUGCOMPONENT']._serialized_end=229
+  _globals['_ISSUETRACKERCOMPONENT']._serialized_start=231
+  _globals['_ISSUETRACKERCOMPONENT']._serialized_end=276
+  _globals['_MONORAILCOMPONENT']._serialized_start=278
+  _globals['_MONORAILCOMPONENT']._serialized_end=329
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,44 @@
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BuganizerPriority(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    BUGANIZER_PRIORITY_UNSPECIFIED: _ClassVar[BuganizerPriority]
+    P0: _ClassVar[BuganizerPriority]
+    P1: _ClassVar[BuganizerPriority]
+    P2: _ClassVar[BuganizerPriority]
+    P3: _ClassVar[BuganizerPriority]
+    P4: _ClassVar[BuganizerPriority]
+BUGANIZER_PRIORITY_UNSPECIFIED: BuganizerPriority
+P0: BuganizerPriority
+P1: BuganizerPriority
+P2: BuganizerPriority
+P3: BuganizerPriority
+P4: BuganizerPriority
+
+class BugComponent(_message.Message):
+    __slots__ = ("issue_tracker", "monorail")
+    ISSUE_TRACKER_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_FIELD_NUMBER: _ClassVar[int]
+    issue_tracker: IssueTrackerComponent
+    monorail: MonorailComponent
+    def __init__(self, issue_tracker: _Optional[_Union[IssueTrackerComponent, _Mapping]] = ..., monorail: _Optional[_Union[MonorailComponent, _Mapping]] = ...) -> None: ...
+
+class IssueTrackerComponent(_message.Message):
+    __slots__ = ("component_id",)
+    COMPONENT_ID_FIELD_NUMBER: _ClassVar[int]
+    component_id: int
+    def __init__(self, component_id: _Optional[int] = ...) -> None: ...
+
+class MonorailComponent(_message.Message):
+    __slots__ = ("project", "value")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    value: str
+    def __init__(self, project: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
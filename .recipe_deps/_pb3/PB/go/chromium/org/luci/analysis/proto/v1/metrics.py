@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/metrics.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/metrics.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n4go.chromium.org/luci/analysis/proto/v1/metrics.proto\x12\x10luci.analysis.v1\"+\n\x19ListProjectMetricsRequest\x12\x0e\n\x06parent\x18\x01 \x01(\t\"N\n\x1aListProjectMetricsResponse\x12\x30\n\x07metrics\x18\x01 \x03(\x0b\x32\x1f.luci.analysis.v1.ProjectMetric\"\x8d\x01\n\rProjectMetric\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tmetric_id\x18\x02 \x01(\t\x12\x1b\n\x13human_readable_name\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x12\n\nis_default\x18\x05 \x01(\x08\x12\x15\n\rsort_priority\x18\x06 \x01(\x05\x32x\n\x07Metrics\x12m\n\x0eListForProject\x12+.luci.analysis.v1.ListProjectMetricsRequest\x1a,.luci.analysis.v1.ListProjectMetricsResponse\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.metrics_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_LISTPROJECTMETRICSREQUEST']._serialized_start=74
+  _globals['_LISTPROJECTMETRICSREQUEST']._serialized_end=117
+  _globals['_LISTPROJECTMETRICSRESPONSE']._serialized_start=119
+  _globals['_LISTPROJECTMETRICSRESPONSE']._serialized_end=197
+  _globals['_PROJECTMETRIC']._serialized_start=200
+  _globals['_PROJECTMETRIC']._serialized_end=341
+  _globals['_METRICS']._serialized_start=343
+  _globals['_METRICS']._serialized_end=463
+# @@protoc_insertion_point(module_scope)
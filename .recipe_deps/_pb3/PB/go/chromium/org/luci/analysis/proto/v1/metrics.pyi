@@ -0,0 +1,35 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ListProjectMetricsRequest(_message.Message):
+    __slots__ = ("parent",)
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    def __init__(self, parent: _Optional[str] = ...) -> None: ...
+
+class ListProjectMetricsResponse(_message.Message):
+    __slots__ = ("metrics",)
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    metrics: _containers.RepeatedCompositeFieldContainer[ProjectMetric]
+    def __init__(self, metrics: _Optional[_Iterable[_Union[ProjectMetric, _Mapping]]] = ...) -> None: ...
+
+class ProjectMetric(_message.Message):
+    __slots__ = ("name", "metric_id", "human_readable_name", "description", "is_default", "sort_priority")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    METRIC_ID_FIELD_NUMBER: _ClassVar[int]
+    HUMAN_READABLE_NAME_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    IS_DEFAULT_FIELD_NUMBER: _ClassVar[int]
+    SORT_PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    metric_id: str
+    human_readable_name: str
+    description: str
+    is_default: bool
+    sort_priority: int
+    def __init__(self, name: _Optional[str] = ..., metric_id: _Optional[str] = ..., human_readable_name: _Optional[str] = ..., description: _Optional[str] = ..., is_default: bool = ..., sort_priority: _Optional[int] = ...) -> None: ...
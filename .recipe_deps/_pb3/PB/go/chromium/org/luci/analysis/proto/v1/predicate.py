@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/predicate.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/predicate.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6go.chromium.org/luci/analysis/proto/v1/predicate.proto\x12\x10luci.analysis.v1\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\"\x92\x01\n\x10VariantPredicate\x12+\n\x06\x65quals\x18\x01 \x01(\x0b\x32\x19.luci.analysis.v1.VariantH\x00\x12-\n\x08\x63ontains\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.VariantH\x00\x12\x15\n\x0bhash_equals\x18\x03 \x01(\tH\x00\x42\x0b\n\tpredicate\"\x83\x02\n\x14TestVerdictPredicate\x12\x11\n\tsub_realm\x18\x01 \x01(\t\x12=\n\x11variant_predicate\x18\x02 \x01(\x0b\x32\".luci.analysis.v1.VariantPredicate\x12;\n\x10submitted_filter\x18\x03 \x01(\x0e\x32!.luci.analysis.v1.SubmittedFilter\x12\x39\n\x14partition_time_range\x18\x04 \x01(\x0b\x32\x1b.luci.analysis.v1.TimeRange\x12!\n\x19include_bisection_results\x18\x05 \x01(\x08\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.predicate_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_VARIANTPREDICATE']._serialized_start=130
+  _globals['_VARIANTPREDICATE']._serialized_end=276
+  _globals['_TESTVERDICTPREDICATE']._serialized_start=279
+  _globals['_TESTVERDICTPREDICATE']._serialized_end=538
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,31 @@
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class VariantPredicate(_message.Message):
+    __slots__ = ("equals", "contains", "hash_equals")
+    EQUALS_FIELD_NUMBER: _ClassVar[int]
+    CONTAINS_FIELD_NUMBER: _ClassVar[int]
+    HASH_EQUALS_FIELD_NUMBER: _ClassVar[int]
+    equals: _common_pb2.Variant
+    contains: _common_pb2.Variant
+    hash_equals: str
+    def __init__(self, equals: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., contains: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., hash_equals: _Optional[str] = ...) -> None: ...
+
+class TestVerdictPredicate(_message.Message):
+    __slots__ = ("sub_realm", "variant_predicate", "submitted_filter", "partition_time_range", "include_bisection_results")
+    SUB_REALM_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    SUBMITTED_FILTER_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_RANGE_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_BISECTION_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    sub_realm: str
+    variant_predicate: VariantPredicate
+    submitted_filter: _common_pb2.SubmittedFilter
+    partition_time_range: _common_pb2.TimeRange
+    include_bisection_results: bool
+    def __init__(self, sub_realm: _Optional[str] = ..., variant_predicate: _Optional[_Union[VariantPredicate, _Mapping]] = ..., submitted_filter: _Optional[_Union[_common_pb2.SubmittedFilter, str]] = ..., partition_time_range: _Optional[_Union[_common_pb2.TimeRange, _Mapping]] = ..., include_bisection_results: bool = ...) -> None: ...
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/projects.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/projects.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.analysis.proto.v1 import issue_tracking as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_issue__tracking__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import project as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_project__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5go.chromium.org/luci/analysis/proto/v1/projects.proto\x12\x10luci.analysis.v1\x1a;go.chromium.org/luci/analysis/proto/v1/issue_tracking.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/project.proto\"\x15\n\x13ListProjectsRequest\"C\n\x14ListProjectsResponse\x12+\n\x08projects\x18\x01 \x03(\x0b\x32\x19.luci.analysis.v1.Project\"\'\n\x17GetProjectConfigRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"n\n\rProjectConfig\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x37\n\x0e\x62ug_management\x18\x06 \x01(\x0b\x32\x1f.luci.analysis.v1.BugManagementJ\x04\x08\x02\x10\x03J\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05J\x04\x08\x05\x10\x06\"}\n\rBugManagement\x12\x37\n\x08policies\x18\x01 \x03(\x0b\x32%.luci.analysis.v1.BugManagementPolicy\x12\x33\n\x08monorail\x18\x02 \x01(\x0b\x32!.luci.analysis.v1.MonorailProject\"\xe8\x03\n\x13\x42ugManagementPolicy\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06owners\x18\x06 \x03(\t\x12\x1b\n\x13human_readable_name\x18\x02 \x01(\t\x12\x35\n\x08priority\x18\x03 \x01(\x0e\x32#.luci.analysis.v1.BuganizerPriority\x12=\n\x07metrics\x18\x04 \x03(\x0b\x32,.luci.analysis.v1.BugManagementPolicy.Metric\x12\x46\n\x0b\x65xplanation\x18\x05 \x01(\x0b\x32\x31.luci.analysis.v1.BugManagementPolicy.Explanation\x1a\x9f\x01\n\x06Metric\x12\x11\n\tmetric_id\x18\x01 \x01(\t\x12?\n\x14\x61\x63tivation_threshold\x18\x02 \x01(\x0b\x32!.luci.analysis.v1.MetricThreshold\x12\x41\n\x16\x64\x65\x61\x63tivation_threshold\x18\x03 \x01(\x0b\x32!.luci.analysis.v1.MetricThreshold\x1a\x38\n\x0b\x45xplanation\x12\x14\n\x0cproblem_html\x18\x01 \x01(\t\x12\x13\n\x0b\x61\x63tion_html\x18\x02 \x01(\t\"@\n\x0fMonorailProject\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x16\n\x0e\x64isplay_prefix\x18\x02 \x01(\tJ\x04\x08\x03\x10\x04\"\x7f\n\x0fMetricThreshold\x12\x14\n\x07one_day\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x16\n\tthree_day\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x16\n\tseven_day\x18\x03 \x01(\x03H\x02\x88\x01\x01\x42\n\n\x08_one_dayB\x0c\n\n_three_dayB\x0c\n\n_seven_day2\xbe\x01\n\x08Projects\x12Y\n\tGetConfig\x12).luci.analysis.v1.GetProjectConfigRequest\x1a\x1f.luci.analysis.v1.ProjectConfig\"\x00\x12W\n\x04List\x12%.luci.analysis.v1.ListProjectsRequest\x1a&.luci.analysis.v1.ListProjectsResponse\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.projects_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_LISTPROJECTSREQUEST']._serialized_start=190
+  _globals['_LISTPROJECTSREQUEST']._serialized_end=211
+  _globals['_LISTPROJECTSRESPONSE']._serialized_start=213
+  _globals['_LISTPROJECTSRESPONSE']._serialized_end=280
+  _globals['_GETPROJECTCONFIGREQUEST']._serialized_start=282
+  _globals['_GETPROJECTCONFIGREQUEST']._serialized_end=321
+  _globals['_PROJECTCONFIG']._serialized_start=323
+  _globals['_PROJECTCONFIG']._serialized_end=433
+  _globals['_BUGMANAGEMENT']._serialized_start=435
+  _globals['_BUGMANAGEMENT']._serialized_end=560
+  _globals['_BUGMANAGEMENTPOLICY']._serialized_start=563
+  _globals['_BUGMANAGEMENTPOLICY']._serialized_end=1051
+  _globals['_BUGMANAGEMENTPOLICY_METRIC']._serialized_start=834
+  _globals['_BUGMANAGEMENTPOLICY_METRIC']._serialized_end=993
+  _globals['_BUGMANAGEMENTPOLICY_EXPLANATION']._serialized_start=995
+  _globals['_BUGMANAGEMENTPOLICY_EXPLANATION']._serialized_end=1051
+  _globals['_MONORAILPROJECT']._serialized_start=1053
+  _globals['_MONORAILPROJECT']._serialized_end=1117
+  _globals['_METRICTHRESHOLD']._serialized_start=1119
+  _globals['_METRICTHRESHOLD']._serialized_end=1246
+  _globals['_PROJECTS']._serialized_start=1249
+  _globals['_PROJECTS']._serialized_end=1439
+# @@protoc_insertion_point(module_scope)
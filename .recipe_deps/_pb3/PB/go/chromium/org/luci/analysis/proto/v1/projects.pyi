@@ -0,0 +1,91 @@
+from PB.go.chromium.org.luci.analysis.proto.v1 import issue_tracking as _issue_tracking_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import project as _project_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ListProjectsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class ListProjectsResponse(_message.Message):
+    __slots__ = ("projects",)
+    PROJECTS_FIELD_NUMBER: _ClassVar[int]
+    projects: _containers.RepeatedCompositeFieldContainer[_project_pb2.Project]
+    def __init__(self, projects: _Optional[_Iterable[_Union[_project_pb2.Project, _Mapping]]] = ...) -> None: ...
+
+class GetProjectConfigRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class ProjectConfig(_message.Message):
+    __slots__ = ("name", "bug_management")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    BUG_MANAGEMENT_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    bug_management: BugManagement
+    def __init__(self, name: _Optional[str] = ..., bug_management: _Optional[_Union[BugManagement, _Mapping]] = ...) -> None: ...
+
+class BugManagement(_message.Message):
+    __slots__ = ("policies", "monorail")
+    POLICIES_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_FIELD_NUMBER: _ClassVar[int]
+    policies: _containers.RepeatedCompositeFieldContainer[BugManagementPolicy]
+    monorail: MonorailProject
+    def __init__(self, policies: _Optional[_Iterable[_Union[BugManagementPolicy, _Mapping]]] = ..., monorail: _Optional[_Union[MonorailProject, _Mapping]] = ...) -> None: ...
+
+class BugManagementPolicy(_message.Message):
+    __slots__ = ("id", "owners", "human_readable_name", "priority", "metrics", "explanation")
+    class Metric(_message.Message):
+        __slots__ = ("metric_id", "activation_threshold", "deactivation_threshold")
+        METRIC_ID_FIELD_NUMBER: _ClassVar[int]
+        ACTIVATION_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        DEACTIVATION_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        metric_id: str
+        activation_threshold: MetricThreshold
+        deactivation_threshold: MetricThreshold
+        def __init__(self, metric_id: _Optional[str] = ..., activation_threshold: _Optional[_Union[MetricThreshold, _Mapping]] = ..., deactivation_threshold: _Optional[_Union[MetricThreshold, _Mapping]] = ...) -> None: ...
+    class Explanation(_message.Message):
+        __slots__ = ("problem_html", "action_html")
+        PROBLEM_HTML_FIELD_NUMBER: _ClassVar[int]
+        ACTION_HTML_FIELD_NUMBER: _ClassVar[int]
+        problem_html: str
+        action_html: str
+        def __init__(self, problem_html: _Optional[str] = ..., action_html: _Optional[str] = ...) -> None: ...
+    ID_FIELD_NUMBER: _ClassVar[int]
+    OWNERS_FIELD_NUMBER: _ClassVar[int]
+    HUMAN_READABLE_NAME_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    EXPLANATION_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    owners: _containers.RepeatedScalarFieldContainer[str]
+    human_readable_name: str
+    priority: _issue_tracking_pb2.BuganizerPriority
+    metrics: _containers.RepeatedCompositeFieldContainer[BugManagementPolicy.Metric]
+    explanation: BugManagementPolicy.Explanation
+    def __init__(self, id: _Optional[str] = ..., owners: _Optional[_Iterable[str]] = ..., human_readable_name: _Optional[str] = ..., priority: _Optional[_Union[_issue_tracking_pb2.BuganizerPriority, str]] = ..., metrics: _Optional[_Iterable[_Union[BugManagementPolicy.Metric, _Mapping]]] = ..., explanation: _Optional[_Union[BugManagementPolicy.Explanation, _Mapping]] = ...) -> None: ...
+
+class MonorailProject(_message.Message):
+    __slots__ = ("project", "display_prefix")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    DISPLAY_PREFIX_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    display_prefix: str
+    def __init__(self, project: _Optional[str] = ..., display_prefix: _Optional[str] = ...) -> None: ...
+
+class MetricThreshold(_message.Message):
+    __slots__ = ("one_day", "three_day", "seven_day")
+    ONE_DAY_FIELD_NUMBER: _ClassVar[int]
+    THREE_DAY_FIELD_NUMBER: _ClassVar[int]
+    SEVEN_DAY_FIELD_NUMBER: _ClassVar[int]
+    one_day: int
+    three_day: int
+    seven_day: int
+    def __init__(self, one_day: _Optional[int] = ..., three_day: _Optional[int] = ..., seven_day: _Optional[int] = ...) -> None: ...
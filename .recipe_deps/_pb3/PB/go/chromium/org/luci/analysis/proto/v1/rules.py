@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/rules.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/rules.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import failure_reason as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_failure__reason__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import issue_tracking as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_issue__tracking__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2go.chromium.org/luci/analysis/proto/v1/rules.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a;go.chromium.org/luci/analysis/proto/v1/failure_reason.proto\x1a;go.chromium.org/luci/analysis/proto/v1/issue_tracking.proto\"\x89\x06\n\x04Rule\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\x07project\x18\x02 \x01(\tB\x04\xe2\x41\x01\x03\x12\x15\n\x07rule_id\x18\x03 \x01(\tB\x04\xe2\x41\x01\x03\x12\x1d\n\x0frule_definition\x18\x04 \x01(\tB\x04\xe2\x41\x01\x02\x12\x32\n\x03\x62ug\x18\x05 \x01(\x0b\x32\x1f.luci.analysis.v1.AssociatedBugB\x04\xe2\x41\x01\x02\x12\x11\n\tis_active\x18\x06 \x01(\x08\x12\x17\n\x0fis_managing_bug\x18\x0e \x01(\x08\x12 \n\x18is_managing_bug_priority\x18\x0f \x01(\x08\x12M\n)is_managing_bug_priority_last_update_time\x18\x10 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x33\n\x0esource_cluster\x18\x07 \x01(\x0b\x32\x1b.luci.analysis.v1.ClusterId\x12H\n\x14\x62ug_management_state\x18\x11 \x01(\x0b\x32$.luci.analysis.v1.BugManagementStateB\x04\xe2\x41\x01\x03\x12\x35\n\x0b\x63reate_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x19\n\x0b\x63reate_user\x18\t \x01(\tB\x04\xe2\x41\x01\x03\x12\x44\n\x1alast_auditable_update_time\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12(\n\x1alast_auditable_update_user\x18\x13 \x01(\tB\x04\xe2\x41\x01\x03\x12:\n\x10last_update_time\x18\n \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x44\n\x1apredicate_last_update_time\x18\r \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x0c\n\x04\x65tag\x18\x0c \x01(\tJ\x04\x08\x0b\x10\x0c\"\x88\x02\n\x12\x42ugManagementState\x12\x46\n\x0cpolicy_state\x18\x01 \x03(\x0b\x32\x30.luci.analysis.v1.BugManagementState.PolicyState\x1a\xa9\x01\n\x0bPolicyState\x12\x11\n\tpolicy_id\x18\x01 \x01(\t\x12\x11\n\tis_active\x18\x02 \x01(\x08\x12\x38\n\x14last_activation_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12:\n\x16last_deactivation_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"$\n\x0eGetRuleRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"(\n\x10ListRulesRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\":\n\x11ListRulesResponse\x12%\n\x05rules\x18\x01 \x03(\x0b\x32\x16.luci.analysis.v1.Rule\"U\n\x11\x43reateRuleRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12*\n\x04rule\x18\x02 \x01(\x0b\x32\x16.luci.analysis.v1.RuleB\x04\xe2\x41\x01\x02\"\x84\x01\n\x11UpdateRuleRequest\x12*\n\x04rule\x18\x01 \x01(\x0b\x32\x16.luci.analysis.v1.RuleB\x04\xe2\x41\x01\x02\x12\x35\n\x0bupdate_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskB\x04\xe2\x41\x01\x02\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\":\n\x10LookupBugRequest\x12\x14\n\x06system\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x10\n\x02id\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\"\"\n\x11LookupBugResponse\x12\r\n\x05rules\x18\x02 \x03(\t\"\xd8\x01\n\x1aPrepareRuleDefaultsRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12L\n\x0btest_result\x18\x02 \x01(\x0b\x32\x37.luci.analysis.v1.PrepareRuleDefaultsRequest.TestResult\x1aV\n\nTestResult\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x37\n\x0e\x66\x61ilure_reason\x18\x02 \x01(\x0b\x32\x1f.luci.analysis.v1.FailureReason\"C\n\x1bPrepareRuleDefaultsResponse\x12$\n\x04rule\x18\x01 \x01(\x0b\x32\x16.luci.analysis.v1.Rule\"\xee\x03\n\x1d\x43reateRuleWithNewIssueRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12*\n\x04rule\x18\x02 \x01(\x0b\x32\x16.luci.analysis.v1.RuleB\x04\xe2\x41\x01\x02\x12\x44\n\x05issue\x18\x03 \x01(\x0b\x32\x35.luci.analysis.v1.CreateRuleWithNewIssueRequest.Issue\x1a\xc4\x02\n\x05Issue\x12\x37\n\tcomponent\x18\x01 \x01(\x0b\x32\x1e.luci.analysis.v1.BugComponentB\x04\xe2\x41\x01\x02\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\x12\x35\n\x08priority\x18\x04 \x01(\x0e\x32#.luci.analysis.v1.BuganizerPriority\x12\\\n\x0c\x61\x63\x63\x65ss_limit\x18\x05 \x01(\x0e\x32\x46.luci.analysis.v1.CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit\"M\n\x10IssueAccessLimit\x12\"\n\x1eISSUE_ACCESS_LIMIT_UNSPECIFIED\x10\x00\x12\x08\n\x04None\x10\x01\x12\x0b\n\x07Trusted\x10\x04\x32\xda\x04\n\x05Rules\x12\x41\n\x03Get\x12 .luci.analysis.v1.GetRuleRequest\x1a\x16.luci.analysis.v1.Rule\"\x00\x12Q\n\x04List\x12\".luci.analysis.v1.ListRulesRequest\x1a#.luci.analysis.v1.ListRulesResponse\"\x00\x12G\n\x06\x43reate\x12#.luci.analysis.v1.CreateRuleRequest\x1a\x16.luci.analysis.v1.Rule\"\x00\x12G\n\x06Update\x12#.luci.analysis.v1.UpdateRuleRequest\x1a\x16.luci.analysis.v1.Rule\"\x00\x12V\n\tLookupBug\x12\".luci.analysis.v1.LookupBugRequest\x1a#.luci.analysis.v1.LookupBugResponse\"\x00\x12p\n\x0fPrepareDefaults\x12,.luci.analysis.v1.PrepareRuleDefaultsRequest\x1a-.luci.analysis.v1.PrepareRuleDefaultsResponse\"\x00\x12_\n\x12\x43reateWithNewIssue\x12/.luci.analysis.v1.CreateRuleWithNewIssueRequest\x1a\x16.luci.analysis.v1.Rule\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.rules_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_RULE'].fields_by_name['project']._loaded_options = None
+  _globals['_RULE'].fields_by_name['project']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['rule_id']._loaded_options = None
+  _globals['_RULE'].fields_by_name['rule_id']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['rule_definition']._loaded_options = None
+  _globals['_RULE'].fields_by_name['rule_definition']._serialized_options = b'\342A\001\002'
+  _globals['_RULE'].fields_by_name['bug']._loaded_options = None
+  _globals['_RULE'].fields_by_name['bug']._serialized_options = b'\342A\001\002'
+  _globals['_RULE'].fields_by_name['bug_management_state']._loaded_options = None
+  _globals['_RULE'].fields_by_name['bug_management_state']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['create_time']._loaded_options = None
+  _globals['_RULE'].fields_by_name['create_time']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['create_user']._loaded_options = None
+  _globals['_RULE'].fields_by_name['create_user']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['last_auditable_update_time']._loaded_options = None
+  _globals['_RULE'].fields_by_name['last_auditable_update_time']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['last_auditable_update_user']._loaded_options = None
+  _globals['_RULE'].fields_by_name['last_auditable_update_user']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['last_update_time']._loaded_options = None
+  _globals['_RULE'].fields_by_name['last_update_time']._serialized_options = b'\342A\001\003'
+  _globals['_RULE'].fields_by_name['predicate_last_update_time']._loaded_options = None
+  _globals['_RULE'].fields_by_name['predicate_last_update_time']._serialized_options = b'\342A\001\003'
+  _globals['_GETRULEREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_GETRULEREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_LISTRULESREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_LISTRULESREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_CREATERULEREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_CREATERULEREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_CREATERULEREQUEST'].fields_by_name['rule']._loaded_options = None
+  _globals['_CREATERULEREQUEST'].fields_by_name['rule']._serialized_options = b'\342A\001\002'
+  _globals['_UPDATERULEREQUEST'].fields_by_name['rule']._loaded_options = None
+  _globals['_UPDATERULEREQUEST'].fields_by_name['rule']._serialized_options = b'\342A\001\002'
+  _globals['_UPDATERULEREQUEST'].fields_by_name['update_mask']._loaded_options = None
+  _globals['_UPDATERULEREQUEST'].fields_by_name['update_mask']._serialized_options = b'\342A\001\002'
+  _globals['_LOOKUPBUGREQUEST'].fields_by_name['system']._loaded_options = None
+  _globals['_LOOKUPBUGREQUEST'].fields_by_name['system']._serialized_options = b'\342A\001\002'
+  _globals['_LOOKUPBUGREQUEST'].fields_by_name['id']._loaded_options = None
+  _globals['_LOOKUPBUGREQUEST'].fields_by_name['id']._serialized_options = b'\342A\001\002'
+  _globals['_PREPARERULEDEFAULTSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_PREPARERULEDEFAULTSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_CREATERULEWITHNEWISSUEREQUEST_ISSUE'].fields_by_name['component']._loaded_options = None
+  _globals['_CREATERULEWITHNEWISSUEREQUEST_ISSUE'].fields_by_name['component']._serialized_options = b'\342A\001\002'
+  _globals['_CREATERULEWITHNEWISSUEREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_CREATERULEWITHNEWISSUEREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_CREATERULEWITHNEWISSUEREQUEST'].fields_by_name['rule']._loaded_options = None
+  _globals['_CREATERULEWITHNEWISSUEREQUEST'].fields_by_name['rule']._serialized_options = b'\342A\001\002'
+  _globals['_RULE']._serialized_start=348
+  _globals['_RULE']._serialized_end=1125
+  _globals['_BUGMANAGEMENTSTATE']._serialized_start=1128
+  _globals['_BUGMANAGEMENTSTATE']._serialized_end=1392
+  _globals['_BUGMANAGEMENTSTATE_POLICYSTATE']._serialized_start=1223
+  _globals['_BUGMANAGEMENTSTATE_POLICYSTATE']._serialized_end=1392
+  _globals['_GETRULEREQUEST']._serialized_start=1394
+  _globals['_GETRULEREQUEST']._serialized_end=1430
+  _globals['_LISTRULESREQUEST']._serialized_start=1432
+  _globals['_LISTRULESREQUEST']._serialized_end=1472
+  _globals['_LISTRULESRESPONSE']._serialized_start=1474
+  _globals['_LISTRULESRESPONSE']._serialized_end=1532
+  _globals['_CREATERULEREQUEST']._serialized_start=1534
+  _globals['_CREATERULEREQUEST']._serialized_end=1619
+  _globals['_UPDATERULEREQUEST']._serialized_start=1622
+  _globals['_UPDATERULEREQUEST']._serialized_end=1754
+  _globals['_LOOKUPBUGREQUEST']._serialized_start=1756
+  _globals['_LOOKUPBUGREQUEST']._serialized_end=1814
+  _globals['_LOOKUPBUGRESPONSE']._serialized_start=1816
+  _globals['_LOOKUPBUGRESPONSE']._serialized_end=1850
+  _globals['_PREPARERULEDEFAULTSREQUEST']._serialized_start=1853
+  _globals['_PREPARERULEDEFAULTSREQUEST']._serialized_end=2069
+  _globals['_PREPARERULEDEFAULTSREQUEST_TESTRESULT']._serialized_start=1983
+  _globals['_PREPARERULEDEFAULTSREQUEST_TESTRESULT']._serialized_end=2069
+  _globals['_PREPARERULEDEFAULTSRESPONSE']._serialized_start=2071
+  _globals['_PREPARERULEDEFAULTSRESPONSE']._serialized_end=2138
+  _globals['_CREATERULEWITHNEWISSUEREQUEST']._serialized_start=2141
+  _globals['_CREATERULEWITHNEWISSUEREQUEST']._serialized_end=2635
+  _globals['_CREATERULEWITHNEWISSUEREQUEST_ISSUE']._serialized_start=2311
+  _globals['_CREATERULEWITHNEWISSUEREQUEST_ISSUE']._serialized_end=2635
+  _globals['_CREATERULEWITHNEWISSUEREQUEST_ISSUE_ISSUEACCESSLIMIT']._serialized_start=2558
+  _globals['_CREATERULEWITHNEWISSUEREQUEST_ISSUE_ISSUEACCESSLIMIT']._serialized_end=2635
+  _globals['_RULES']._serialized_start=2638
+  _globals['_RULES']._serialized_end=3240
+# @@protoc_insertion_point(module_scope)
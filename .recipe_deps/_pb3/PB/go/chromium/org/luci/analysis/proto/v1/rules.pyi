@@ -0,0 +1,175 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import field_mask_pb2 as _field_mask_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import failure_reason as _failure_reason_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import issue_tracking as _issue_tracking_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Rule(_message.Message):
+    __slots__ = ("name", "project", "rule_id", "rule_definition", "bug", "is_active", "is_managing_bug", "is_managing_bug_priority", "is_managing_bug_priority_last_update_time", "source_cluster", "bug_management_state", "create_time", "create_user", "last_auditable_update_time", "last_auditable_update_user", "last_update_time", "predicate_last_update_time", "etag")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    RULE_ID_FIELD_NUMBER: _ClassVar[int]
+    RULE_DEFINITION_FIELD_NUMBER: _ClassVar[int]
+    BUG_FIELD_NUMBER: _ClassVar[int]
+    IS_ACTIVE_FIELD_NUMBER: _ClassVar[int]
+    IS_MANAGING_BUG_FIELD_NUMBER: _ClassVar[int]
+    IS_MANAGING_BUG_PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    IS_MANAGING_BUG_PRIORITY_LAST_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_CLUSTER_FIELD_NUMBER: _ClassVar[int]
+    BUG_MANAGEMENT_STATE_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    CREATE_USER_FIELD_NUMBER: _ClassVar[int]
+    LAST_AUDITABLE_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    LAST_AUDITABLE_UPDATE_USER_FIELD_NUMBER: _ClassVar[int]
+    LAST_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_LAST_UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    project: str
+    rule_id: str
+    rule_definition: str
+    bug: _common_pb2.AssociatedBug
+    is_active: bool
+    is_managing_bug: bool
+    is_managing_bug_priority: bool
+    is_managing_bug_priority_last_update_time: _timestamp_pb2.Timestamp
+    source_cluster: _common_pb2.ClusterId
+    bug_management_state: BugManagementState
+    create_time: _timestamp_pb2.Timestamp
+    create_user: str
+    last_auditable_update_time: _timestamp_pb2.Timestamp
+    last_auditable_update_user: str
+    last_update_time: _timestamp_pb2.Timestamp
+    predicate_last_update_time: _timestamp_pb2.Timestamp
+    etag: str
+    def __init__(self, name: _Optional[str] = ..., project: _Optional[str] = ..., rule_id: _Optional[str] = ..., rule_definition: _Optional[str] = ..., bug: _Optional[_Union[_common_pb2.AssociatedBug, _Mapping]] = ..., is_active: bool = ..., is_managing_bug: bool = ..., is_managing_bug_priority: bool = ..., is_managing_bug_priority_last_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., source_cluster: _Optional[_Union[_common_pb2.ClusterId, _Mapping]] = ..., bug_management_state: _Optional[_Union[BugManagementState, _Mapping]] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., create_user: _Optional[str] = ..., last_auditable_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_auditable_update_user: _Optional[str] = ..., last_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., predicate_last_update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., etag: _Optional[str] = ...) -> None: ...
+
+class BugManagementState(_message.Message):
+    __slots__ = ("policy_state",)
+    class PolicyState(_message.Message):
+        __slots__ = ("policy_id", "is_active", "last_activation_time", "last_deactivation_time")
+        POLICY_ID_FIELD_NUMBER: _ClassVar[int]
+        IS_ACTIVE_FIELD_NUMBER: _ClassVar[int]
+        LAST_ACTIVATION_TIME_FIELD_NUMBER: _ClassVar[int]
+        LAST_DEACTIVATION_TIME_FIELD_NUMBER: _ClassVar[int]
+        policy_id: str
+        is_active: bool
+        last_activation_time: _timestamp_pb2.Timestamp
+        last_deactivation_time: _timestamp_pb2.Timestamp
+        def __init__(self, policy_id: _Optional[str] = ..., is_active: bool = ..., last_activation_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., last_deactivation_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+    POLICY_STATE_FIELD_NUMBER: _ClassVar[int]
+    policy_state: _containers.RepeatedCompositeFieldContainer[BugManagementState.PolicyState]
+    def __init__(self, policy_state: _Optional[_Iterable[_Union[BugManagementState.PolicyState, _Mapping]]] = ...) -> None: ...
+
+class GetRuleRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class ListRulesRequest(_message.Message):
+    __slots__ = ("parent",)
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    def __init__(self, parent: _Optional[str] = ...) -> None: ...
+
+class ListRulesResponse(_message.Message):
+    __slots__ = ("rules",)
+    RULES_FIELD_NUMBER: _ClassVar[int]
+    rules: _containers.RepeatedCompositeFieldContainer[Rule]
+    def __init__(self, rules: _Optional[_Iterable[_Union[Rule, _Mapping]]] = ...) -> None: ...
+
+class CreateRuleRequest(_message.Message):
+    __slots__ = ("parent", "rule")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    RULE_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    rule: Rule
+    def __init__(self, parent: _Optional[str] = ..., rule: _Optional[_Union[Rule, _Mapping]] = ...) -> None: ...
+
+class UpdateRuleRequest(_message.Message):
+    __slots__ = ("rule", "update_mask", "etag")
+    RULE_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_MASK_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    rule: Rule
+    update_mask: _field_mask_pb2.FieldMask
+    etag: str
+    def __init__(self, rule: _Optional[_Union[Rule, _Mapping]] = ..., update_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ..., etag: _Optional[str] = ...) -> None: ...
+
+class LookupBugRequest(_message.Message):
+    __slots__ = ("system", "id")
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    id: str
+    def __init__(self, system: _Optional[str] = ..., id: _Optional[str] = ...) -> None: ...
+
+class LookupBugResponse(_message.Message):
+    __slots__ = ("rules",)
+    RULES_FIELD_NUMBER: _ClassVar[int]
+    rules: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, rules: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class PrepareRuleDefaultsRequest(_message.Message):
+    __slots__ = ("parent", "test_result")
+    class TestResult(_message.Message):
+        __slots__ = ("test_id", "failure_reason")
+        TEST_ID_FIELD_NUMBER: _ClassVar[int]
+        FAILURE_REASON_FIELD_NUMBER: _ClassVar[int]
+        test_id: str
+        failure_reason: _failure_reason_pb2.FailureReason
+        def __init__(self, test_id: _Optional[str] = ..., failure_reason: _Optional[_Union[_failure_reason_pb2.FailureReason, _Mapping]] = ...) -> None: ...
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULT_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    test_result: PrepareRuleDefaultsRequest.TestResult
+    def __init__(self, parent: _Optional[str] = ..., test_result: _Optional[_Union[PrepareRuleDefaultsRequest.TestResult, _Mapping]] = ...) -> None: ...
+
+class PrepareRuleDefaultsResponse(_message.Message):
+    __slots__ = ("rule",)
+    RULE_FIELD_NUMBER: _ClassVar[int]
+    rule: Rule
+    def __init__(self, rule: _Optional[_Union[Rule, _Mapping]] = ...) -> None: ...
+
+class CreateRuleWithNewIssueRequest(_message.Message):
+    __slots__ = ("parent", "rule", "issue")
+    class Issue(_message.Message):
+        __slots__ = ("component", "title", "comment", "priority", "access_limit")
+        class IssueAccessLimit(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+            __slots__ = ()
+            ISSUE_ACCESS_LIMIT_UNSPECIFIED: _ClassVar[CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit]
+            None: _ClassVar[CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit]
+            Trusted: _ClassVar[CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit]
+        ISSUE_ACCESS_LIMIT_UNSPECIFIED: CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit
+        None: CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit
+        Trusted: CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit
+        COMPONENT_FIELD_NUMBER: _ClassVar[int]
+        TITLE_FIELD_NUMBER: _ClassVar[int]
+        COMMENT_FIELD_NUMBER: _ClassVar[int]
+        PRIORITY_FIELD_NUMBER: _ClassVar[int]
+        ACCESS_LIMIT_FIELD_NUMBER: _ClassVar[int]
+        component: _issue_tracking_pb2.BugComponent
+        title: str
+        comment: str
+        priority: _issue_tracking_pb2.BuganizerPriority
+        access_limit: CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit
+        def __init__(self, component: _Optional[_Union[_issue_tracking_pb2.BugComponent, _Mapping]] = ..., title: _Optional[str] = ..., comment: _Optional[str] = ..., priority: _Optional[_Union[_issue_tracking_pb2.BuganizerPriority, str]] = ..., access_limit: _Optional[_Union[CreateRuleWithNewIssueRequest.Issue.IssueAccessLimit, str]] = ...) -> None: ...
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    RULE_FIELD_NUMBER: _ClassVar[int]
+    ISSUE_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    rule: Rule
+    issue: CreateRuleWithNewIssueRequest.Issue
+    def __init__(self, parent: _Optional[str] = ..., rule: _Optional[_Union[Rule, _Mapping]] = ..., issue: _Optional[_Union[CreateRuleWithNewIssueRequest.Issue, _Mapping]] = ...) -> None: ...
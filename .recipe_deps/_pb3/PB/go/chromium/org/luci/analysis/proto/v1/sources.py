@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/sources.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/sources.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n4go.chromium.org/luci/analysis/proto/v1/sources.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/api/field_behavior.proto\"\xe7\x01\n\x07Sources\x12\x39\n\x0egitiles_commit\x18\x01 \x01(\x0b\x32\x1f.luci.analysis.v1.GitilesCommitH\x00\x12J\n\x17submitted_android_build\x18\x04 \x01(\x0b\x32\'.luci.analysis.v1.SubmittedAndroidBuildH\x00\x12\x33\n\x0b\x63hangelists\x18\x02 \x03(\x0b\x32\x1e.luci.analysis.v1.GerritChange\x12\x10\n\x08is_dirty\x18\x03 \x01(\x08\x42\x0e\n\x0c\x62\x61se_sources\"b\n\rGitilesCommit\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\x12\x13\n\x0b\x63ommit_hash\x18\x04 \x01(\t\x12\x10\n\x08position\x18\x05 \x01(\x03\"M\n\x15SubmittedAndroidBuild\x12\x12\n\ndata_realm\x18\x01 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x02 \x01(\t\x12\x10\n\x08\x62uild_id\x18\x03 \x01(\x03\"\x90\x01\n\x0cGerritChange\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x05 \x01(\t\x12\x0e\n\x06\x63hange\x18\x02 \x01(\x03\x12\x10\n\x08patchset\x18\x03 \x01(\x03\x12?\n\nowner_kind\x18\x04 \x01(\x0e\x32%.luci.analysis.v1.ChangelistOwnerKindB\x04\xe2\x41\x01\x03\"\x85\x01\n\tSourceRef\x12/\n\x07gitiles\x18\x01 \x01(\x0b\x32\x1c.luci.analysis.v1.GitilesRefH\x00\x12=\n\randroid_build\x18\x02 \x01(\x0b\x32$.luci.analysis.v1.AndroidBuildBranchH\x00\x42\x08\n\x06system\"8\n\nGitilesRef\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\"8\n\x12\x41ndroidBuildBranch\x12\x12\n\ndata_realm\x18\x01 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x02 \x01(\t\"w\n\nChangelist\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0e\n\x06\x63hange\x18\x02 \x01(\x03\x12\x10\n\x08patchset\x18\x03 \x01(\x05\x12\x39\n\nowner_kind\x18\x04 \x01(\x0e\x32%.luci.analysis.v1.ChangelistOwnerKind*R\n\x13\x43hangelistOwnerKind\x12 \n\x1c\x43HANGELIST_OWNER_UNSPECIFIED\x10\x00\x12\t\n\x05HUMAN\x10\x01\x12\x0e\n\nAUTOMATION\x10\x02\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.sources_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_GERRITCHANGE'].fields_by_name['owner_kind']._loaded_options = None
+  _globals['_GERRITCHANGE'].fields_by_name['owner_kind']._serialized_options = b'\342A\001\003'
+  _globals['_CHANGELISTOWNERKIND']._serialized_start=1040
+  _globals['_CHANGELISTOWNERKIND']._serialized_end=1122
+  _globals['_SOURCES']._serialized_start=108
+  _globals['_SOURCES']._serialized_end=339
+  _globals['_GITILESCOMMIT']._serialized_start=341
+  _globals['_GITILESCOMMIT']._serialized_end=439
+  _globals['_SUBMITTEDANDROIDBUILD']._serialized_start=441
+  _globals['_SUBMITTEDANDROIDBUILD']._serialized_end=518
+  _globals['_GERRITCHANGE']._serialized_start=521
+  _globals['_GERRITCHANGE']._serialized_end=665
+  _globals['_SOURCEREF']._serialized_start=668
+  _globals['_SOURCEREF']._serialized_end=801
+  _globals['_GITILESREF']._serialized_start=803
+  _globals['_GITILESREF']._serialized_end=859
+  _globals['_ANDROIDBUILDBRANCH']._serialized_start=861
+  _globals['_ANDROIDBUILDBRANCH']._serialized_end=917
+  _globals['_CHANGELIST']._serialized_start=919
+  _globals['_CHANGELIST']._serialized_end=1038
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,106 @@
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ChangelistOwnerKind(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    CHANGELIST_OWNER_UNSPECIFIED: _ClassVar[ChangelistOwnerKind]
+    HUMAN: _ClassVar[ChangelistOwnerKind]
+    AUTOMATION: _ClassVar[ChangelistOwnerKind]
+CHANGELIST_OWNER_UNSPECIFIED: ChangelistOwnerKind
+HUMAN: ChangelistOwnerKind
+AUTOMATION: ChangelistOwnerKind
+
+class Sources(_message.Message):
+    __slots__ = ("gitiles_commit", "submitted_android_build", "changelists", "is_dirty")
+    GITILES_COMMIT_FIELD_NUMBER: _ClassVar[int]
+    SUBMITTED_ANDROID_BUILD_FIELD_NUMBER: _ClassVar[int]
+    CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+    IS_DIRTY_FIELD_NUMBER: _ClassVar[int]
+    gitiles_commit: GitilesCommit
+    submitted_android_build: SubmittedAndroidBuild
+    changelists: _containers.RepeatedCompositeFieldContainer[GerritChange]
+    is_dirty: bool
+    def __init__(self, gitiles_commit: _Optional[_Union[GitilesCommit, _Mapping]] = ..., submitted_android_build: _Optional[_Union[SubmittedAndroidBuild, _Mapping]] = ..., changelists: _Optional[_Iterable[_Union[GerritChange, _Mapping]]] = ..., is_dirty: bool = ...) -> None: ...
+
+class GitilesCommit(_message.Message):
+    __slots__ = ("host", "project", "ref", "commit_hash", "position")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_HASH_FIELD_NUMBER: _ClassVar[int]
+    POSITION_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    ref: str
+    commit_hash: str
+    position: int
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ..., commit_hash: _Optional[str] = ..., position: _Optional[int] = ...) -> None: ...
+
+class SubmittedAndroidBuild(_message.Message):
+    __slots__ = ("data_realm", "branch", "build_id")
+    DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    data_realm: str
+    branch: str
+    build_id: int
+    def __init__(self, data_realm: _Optional[str] = ..., branch: _Optional[str] = ..., build_id: _Optional[int] = ...) -> None: ...
+
+class GerritChange(_message.Message):
+    __slots__ = ("host", "project", "change", "patchset", "owner_kind")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_FIELD_NUMBER: _ClassVar[int]
+    PATCHSET_FIELD_NUMBER: _ClassVar[int]
+    OWNER_KIND_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    change: int
+    patchset: int
+    owner_kind: ChangelistOwnerKind
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., change: _Optional[int] = ..., patchset: _Optional[int] = ..., owner_kind: _Optional[_Union[ChangelistOwnerKind, str]] = ...) -> None: ...
+
+class SourceRef(_message.Message):
+    __slots__ = ("gitiles", "android_build")
+    GITILES_FIELD_NUMBER: _ClassVar[int]
+    ANDROID_BUILD_FIELD_NUMBER: _ClassVar[int]
+    gitiles: GitilesRef
+    android_build: AndroidBuildBranch
+    def __init__(self, gitiles: _Optional[_Union[GitilesRef, _Mapping]] = ..., android_build: _Optional[_Union[AndroidBuildBranch, _Mapping]] = ...) -> None: ...
+
+class GitilesRef(_message.Message):
+    __slots__ = ("host", "project", "ref")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    ref: str
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ...) -> None: ...
+
+class AndroidBuildBranch(_message.Message):
+    __slots__ = ("data_realm", "branch")
+    DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    data_realm: str
+    branch: str
+    def __init__(self, data_realm: _Optional[str] = ..., branch: _Optional[str] = ...) -> None: ...
+
+class Changelist(_message.Message):
+    __slots__ = ("host", "change", "patchset", "owner_kind")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_FIELD_NUMBER: _ClassVar[int]
+    PATCHSET_FIELD_NUMBER: _ClassVar[int]
+    OWNER_KIND_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    change: int
+    patchset: int
+    owner_kind: ChangelistOwnerKind
+    def __init__(self, host: _Optional[str] = ..., change: _Optional[int] = ..., patchset: _Optional[int] = ..., owner_kind: _Optional[_Union[ChangelistOwnerKind, str]] = ...) -> None: ...
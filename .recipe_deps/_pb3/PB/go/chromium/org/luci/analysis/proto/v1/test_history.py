@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/test_history.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/test_history.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import predicate as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_predicate__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import test_verdict as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_test__verdict__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/analysis/proto/v1/test_history.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x36go.chromium.org/luci/analysis/proto/v1/predicate.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\x1a\x39go.chromium.org/luci/analysis/proto/v1/test_verdict.proto\"\xd0\x01\n\x17QueryTestHistoryRequest\x12\x15\n\x07project\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x15\n\x07test_id\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12?\n\tpredicate\x18\x03 \x01(\x0b\x32&.luci.analysis.v1.TestVerdictPredicateB\x04\xe2\x41\x01\x02\x12\x1f\n\x17\x66ollow_test_id_renaming\x18\x06 \x01(\x08\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"d\n\x18QueryTestHistoryResponse\x12/\n\x08verdicts\x18\x01 \x03(\x0b\x32\x1d.luci.analysis.v1.TestVerdict\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xd5\x01\n\x1cQueryTestHistoryStatsRequest\x12\x15\n\x07project\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x15\n\x07test_id\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12?\n\tpredicate\x18\x03 \x01(\x0b\x32&.luci.analysis.v1.TestVerdictPredicateB\x04\xe2\x41\x01\x02\x12\x1f\n\x17\x66ollow_test_id_renaming\x18\x06 \x01(\x08\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"\xe0\x05\n\x1dQueryTestHistoryStatsResponse\x12\x45\n\x06groups\x18\x01 \x03(\x0b\x32\x35.luci.analysis.v1.QueryTestHistoryStatsResponse.Group\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x1a\xde\x04\n\x05Group\x12\x32\n\x0epartition_time\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0cvariant_hash\x18\x02 \x01(\t\x12[\n\x0everdict_counts\x18\t \x01(\x0b\x32\x43.luci.analysis.v1.QueryTestHistoryStatsResponse.Group.VerdictCounts\x12\x1c\n\x10unexpected_count\x18\x03 \x01(\x05\x42\x02\x18\x01\x12&\n\x1aunexpectedly_skipped_count\x18\x04 \x01(\x05\x42\x02\x18\x01\x12\x17\n\x0b\x66laky_count\x18\x05 \x01(\x05\x42\x02\x18\x01\x12\x1c\n\x10\x65xonerated_count\x18\x06 \x01(\x05\x42\x02\x18\x01\x12\x1a\n\x0e\x65xpected_count\x18\x07 \x01(\x05\x42\x02\x18\x01\x12\x36\n\x13passed_avg_duration\x18\x08 \x01(\x0b\x32\x19.google.protobuf.Duration\x1a\xdc\x01\n\rVerdictCounts\x12\x0e\n\x06\x66\x61iled\x18\x01 \x01(\x05\x12\r\n\x05\x66laky\x18\x02 \x01(\x05\x12\x0e\n\x06passed\x18\x03 \x01(\x05\x12\x0f\n\x07skipped\x18\x04 \x01(\x05\x12\x19\n\x11\x65xecution_errored\x18\x05 \x01(\x05\x12\x11\n\tprecluded\x18\x06 \x01(\x05\x12\x19\n\x11\x66\x61iled_exonerated\x18\x07 \x01(\x05\x12$\n\x1c\x65xecution_errored_exonerated\x18\x08 \x01(\x05\x12\x1c\n\x14precluded_exonerated\x18\t \x01(\x05\"\xde\x01\n\x14QueryVariantsRequest\x12\x15\n\x07project\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x15\n\x07test_id\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12\x11\n\tsub_realm\x18\x03 \x01(\t\x12=\n\x11variant_predicate\x18\x06 \x01(\x0b\x32\".luci.analysis.v1.VariantPredicate\x12\x1f\n\x17\x66ollow_test_id_renaming\x18\x07 \x01(\x08\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"\xc8\x01\n\x15QueryVariantsResponse\x12\x45\n\x08variants\x18\x01 \x03(\x0b\x32\x33.luci.analysis.v1.QueryVariantsResponse.VariantInfo\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x1aO\n\x0bVariantInfo\x12\x14\n\x0cvariant_hash\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\"\x9f\x01\n\x11QueryTestsRequest\x12\x15\n\x07project\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x1f\n\x11test_id_substring\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12\x11\n\tsub_realm\x18\x03 \x01(\t\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\x12\x18\n\x10\x63\x61se_insensitive\x18\x06 \x01(\x08\"?\n\x12QueryTestsResponse\x12\x10\n\x08test_ids\x18\x01 \x03(\t\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\x9f\x01\n\x18QueryRecentPassesRequest\x12\x15\n\x07project\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x15\n\x07test_id\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12\x1a\n\x0cvariant_hash\x18\x03 \x01(\tB\x04\xe2\x41\x01\x02\x12*\n\x07sources\x18\x05 \x01(\x0b\x32\x19.luci.analysis.v1.Sources\x12\r\n\x05limit\x18\x06 \x01(\x05\"\x8e\x01\n\x19QueryRecentPassesResponse\x12R\n\x0fpassing_results\x18\x01 \x03(\x0b\x32\x39.luci.analysis.v1.QueryRecentPassesResponse.PassingResult\x1a\x1d\n\rPassingResult\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xc8\x02\n\x1cQuerySourceVerdictsV2Request\x12\x0f\n\x07project\x18\x01 \x01(\t\x12>\n\x12test_id_structured\x18\x02 \x01(\x0b\x32 .luci.analysis.v1.TestIdentifierH\x00\x12<\n\x0ctest_id_flat\x18\x03 \x01(\x0b\x32$.luci.analysis.v1.FlatTestIdentifierH\x00\x12/\n\nsource_ref\x18\x04 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12\x17\n\x0fsource_ref_hash\x18\t \x01(\t\x12\x0e\n\x06\x66ilter\x18\x05 \x01(\t\x12\x10\n\x08order_by\x18\x06 \x01(\t\x12\x11\n\tpage_size\x18\x07 \x01(\x05\x12\x12\n\npage_token\x18\x08 \x01(\tB\x06\n\x04test\"r\n\x1dQuerySourceVerdictsV2Response\x12\x38\n\x0fsource_verdicts\x18\x01 \x03(\x0b\x32\x1f.luci.analysis.v1.SourceVerdict\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xeb\x03\n\rSourceVerdict\x12\x10\n\x08position\x18\x01 \x01(\x03\x12\x34\n\x06status\x18\x02 \x01(\x0e\x32$.luci.analysis.v1.TestVerdict.Status\x12@\n\x12\x61pproximate_status\x18\x03 \x01(\x0e\x32$.luci.analysis.v1.TestVerdict.Status\x12R\n\x13invocation_verdicts\x18\x04 \x03(\x0b\x32\x35.luci.analysis.v1.SourceVerdict.InvocationTestVerdict\x1a\xfb\x01\n\x15InvocationTestVerdict\x12\x17\n\x0froot_invocation\x18\x01 \x01(\t\x12\x12\n\ninvocation\x18\x02 \x01(\t\x12\x32\n\x0epartition_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x34\n\x06status\x18\x04 \x01(\x0e\x32$.luci.analysis.v1.TestVerdict.Status\x12\x31\n\x0b\x63hangelists\x18\x05 \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\x12\x18\n\x10is_sources_dirty\x18\x06 \x01(\x08\x32\x89\x05\n\x0bTestHistory\x12`\n\x05Query\x12).luci.analysis.v1.QueryTestHistoryRequest\x1a*.luci.analysis.v1.QueryTestHistoryResponse\"\x00\x12o\n\nQueryStats\x12..luci.analysis.v1.QueryTestHistoryStatsRequest\x1a/.luci.analysis.v1.QueryTestHistoryStatsResponse\"\x00\x12\x62\n\rQueryVariants\x12&.luci.analysis.v1.QueryVariantsRequest\x1a\'.luci.analysis.v1.QueryVariantsResponse\"\x00\x12Y\n\nQueryTests\x12#.luci.analysis.v1.QueryTestsRequest\x1a$.luci.analysis.v1.QueryTestsResponse\"\x00\x12n\n\x11QueryRecentPasses\x12*.luci.analysis.v1.QueryRecentPassesRequest\x1a+.luci.analysis.v1.QueryRecentPassesResponse\"\x00\x12x\n\x13QuerySourceVerdicts\x12..luci.analysis.v1.QuerySourceVerdictsV2Request\x1a/.luci.analysis.v1.QuerySourceVerdictsV2Response\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.test_history_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_QUERYTESTHISTORYREQUEST'].fields_by_name['project']._loaded_options = None
+  _globals['_QUERYTESTHISTORYREQUEST'].fields_by_name['project']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTHISTORYREQUEST'].fields_by_name['test_id']._loaded_options = None
+  _globals['_QUERYTESTHISTORYREQUEST'].fields_by_name['test_id']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTHISTORYREQUEST'].fields_by_name['predicate']._loaded_options = None
+  _globals['_QUERYTESTHISTORYREQUEST'].fields_by_name['predicate']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTHISTORYSTATSREQUEST'].fields_by_name['project']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSREQUEST'].fields_by_name['project']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTHISTORYSTATSREQUEST'].fields_by_name['test_id']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSREQUEST'].fields_by_name['test_id']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTHISTORYSTATSREQUEST'].fields_by_name['predicate']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSREQUEST'].fields_by_name['predicate']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['unexpected_count']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['unexpected_count']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['unexpectedly_skipped_count']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['unexpectedly_skipped_count']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['flaky_count']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['flaky_count']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['exonerated_count']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['exonerated_count']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['expected_count']._loaded_options = None
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP'].fields_by_name['expected_count']._serialized_options = b'\030\001'
+  _globals['_QUERYVARIANTSREQUEST'].fields_by_name['project']._loaded_options = None
+  _globals['_QUERYVARIANTSREQUEST'].fields_by_name['project']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYVARIANTSREQUEST'].fields_by_name['test_id']._loaded_options = None
+  _globals['_QUERYVARIANTSREQUEST'].fields_by_name['test_id']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTSREQUEST'].fields_by_name['project']._loaded_options = None
+  _globals['_QUERYTESTSREQUEST'].fields_by_name['project']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTSREQUEST'].fields_by_name['test_id_substring']._loaded_options = None
+  _globals['_QUERYTESTSREQUEST'].fields_by_name['test_id_substring']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYRECENTPASSESREQUEST'].fields_by_name['project']._loaded_options = None
+  _globals['_QUERYRECENTPASSESREQUEST'].fields_by_name['project']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYRECENTPASSESREQUEST'].fields_by_name['test_id']._loaded_options = None
+  _globals['_QUERYRECENTPASSESREQUEST'].fields_by_name['test_id']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYRECENTPASSESREQUEST'].fields_by_name['variant_hash']._loaded_options = None
+  _globals['_QUERYRECENTPASSESREQUEST'].fields_by_name['variant_hash']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTHISTORYREQUEST']._serialized_start=400
+  _globals['_QUERYTESTHISTORYREQUEST']._serialized_end=608
+  _globals['_QUERYTESTHISTORYRESPONSE']._serialized_start=610
+  _globals['_QUERYTESTHISTORYRESPONSE']._serialized_end=710
+  _globals['_QUERYTESTHISTORYSTATSREQUEST']._serialized_start=713
+  _globals['_QUERYTESTHISTORYSTATSREQUEST']._serialized_end=926
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE']._serialized_start=929
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE']._serialized_end=1665
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP']._serialized_start=1059
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP']._serialized_end=1665
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP_VERDICTCOUNTS']._serialized_start=1445
+  _globals['_QUERYTESTHISTORYSTATSRESPONSE_GROUP_VERDICTCOUNTS']._serialized_end=1665
+  _globals['_QUERYVARIANTSREQUEST']._serialized_start=1668
+  _globals['_QUERYVARIANTSREQUEST']._serialized_end=1890
+  _globals['_QUERYVARIANTSRESPONSE']._serialized_start=1893
+  _globals['_QUERYVARIANTSRESPONSE']._serialized_end=2093
+  _globals['_QUERYVARIANTSRESPONSE_VARIANTINFO']._serialized_start=2014
+  _globals['_QUERYVARIANTSRESPONSE_VARIANTINFO']._serialized_end=2093
+  _globals['_QUERYTESTSREQUEST']._serialized_start=2096
+  _globals['_QUERYTESTSREQUEST']._serialized_end=2255
+  _globals['_QUERYTESTSRESPONSE']._serialized_start=2257
+  _globals['_QUERYTESTSRESPONSE']._serialized_end=2320
+  _globals['_QUERYRECENTPASSESREQUEST']._serialized_start=2323
+  _globals['_QUERYRECENTPASSESREQUEST']._serialized_end=2482
+  _globals['_QUERYRECENTPASSESRESPONSE']._serialized_start=2485
+  _globals['_QUERYRECENTPASSESRESPONSE']._serialized_end=2627
+  _globals['_QUERYRECENTPASSESRESPONSE_PASSINGRESULT']._serialized_start=2598
+  _globals['_QUERYRECENTPASSESRESPONSE_PASSINGRESULT']._serialized_end=2627
+  _globals['_QUERYSOURCEVERDICTSV2REQUEST']._serialized_start=2630
+  _globals['_QUERYSOURCEVERDICTSV2REQUEST']._serialized_end=2958
+  _globals['_QUERYSOURCEVERDICTSV2RESPONSE']._serialized_start=2960
+  _globals['_QUERYSOURCEVERDICTSV2RESPONSE']._serialized_end=3074
+  _globals['_SOURCEVERDICT']._serialized_start=3077
+  _globals['_SOURCEVERDICT']._serialized_end=3568
+  _globals['_SOURCEVERDICT_INVOCATIONTESTVERDICT']._serialized_start=3317
+  _globals['_SOURCEVERDICT_INVOCATIONTESTVERDICT']._serialized_end=3568
+  _globals['_TESTHISTORY']._serialized_start=3571
+  _globals['_TESTHISTORY']._serialized_end=4220
+# @@protoc_insertion_point(module_scope)
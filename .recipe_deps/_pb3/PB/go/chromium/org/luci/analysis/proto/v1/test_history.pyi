@@ -0,0 +1,245 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import predicate as _predicate_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import test_verdict as _test_verdict_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class QueryTestHistoryRequest(_message.Message):
+    __slots__ = ("project", "test_id", "predicate", "follow_test_id_renaming", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    FOLLOW_TEST_ID_RENAMING_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    predicate: _predicate_pb2.TestVerdictPredicate
+    follow_test_id_renaming: bool
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., predicate: _Optional[_Union[_predicate_pb2.TestVerdictPredicate, _Mapping]] = ..., follow_test_id_renaming: bool = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestHistoryResponse(_message.Message):
+    __slots__ = ("verdicts", "next_page_token")
+    VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    verdicts: _containers.RepeatedCompositeFieldContainer[_test_verdict_pb2.TestVerdict]
+    next_page_token: str
+    def __init__(self, verdicts: _Optional[_Iterable[_Union[_test_verdict_pb2.TestVerdict, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestHistoryStatsRequest(_message.Message):
+    __slots__ = ("project", "test_id", "predicate", "follow_test_id_renaming", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    FOLLOW_TEST_ID_RENAMING_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    predicate: _predicate_pb2.TestVerdictPredicate
+    follow_test_id_renaming: bool
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., predicate: _Optional[_Union[_predicate_pb2.TestVerdictPredicate, _Mapping]] = ..., follow_test_id_renaming: bool = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestHistoryStatsResponse(_message.Message):
+    __slots__ = ("groups", "next_page_token")
+    class Group(_message.Message):
+        __slots__ = ("partition_time", "variant_hash", "verdict_counts", "unexpected_count", "unexpectedly_skipped_count", "flaky_count", "exonerated_count", "expected_count", "passed_avg_duration")
+        class VerdictCounts(_message.Message):
+            __slots__ = ("failed", "flaky", "passed", "skipped", "execution_errored", "precluded", "failed_exonerated", "execution_errored_exonerated", "precluded_exonerated")
+            FAILED_FIELD_NUMBER: _ClassVar[int]
+            FLAKY_FIELD_NUMBER: _ClassVar[int]
+            PASSED_FIELD_NUMBER: _ClassVar[int]
+            SKIPPED_FIELD_NUMBER: _ClassVar[int]
+            EXECUTION_ERRORED_FIELD_NUMBER: _ClassVar[int]
+            PRECLUDED_FIELD_NUMBER: _ClassVar[int]
+            FAILED_EXONERATED_FIELD_NUMBER: _ClassVar[int]
+            EXECUTION_ERRORED_EXONERATED_FIELD_NUMBER: _ClassVar[int]
+            PRECLUDED_EXONERATED_FIELD_NUMBER: _ClassVar[int]
+            failed: int
+            flaky: int
+            passed: int
+            skipped: int
+            execution_errored: int
+            precluded: int
+            failed_exonerated: int
+            execution_errored_exonerated: int
+            precluded_exonerated: int
+            def __init__(self, failed: _Optional[int] = ..., flaky: _Optional[int] = ..., passed: _Optional[int] = ..., skipped: _Optional[int] = ..., execution_errored: _Optional[int] = ..., precluded: _Optional[int] = ..., failed_exonerated: _Optional[int] = ..., execution_errored_exonerated: _Optional[int] = ..., precluded_exonerated: _Optional[int] = ...) -> None: ...
+        PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+        VERDICT_COUNTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_COUNT_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTEDLY_SKIPPED_COUNT_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_COUNT_FIELD_NUMBER: _ClassVar[int]
+        EXONERATED_COUNT_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_COUNT_FIELD_NUMBER: _ClassVar[int]
+        PASSED_AVG_DURATION_FIELD_NUMBER: _ClassVar[int]
+        partition_time: _timestamp_pb2.Timestamp
+        variant_hash: str
+        verdict_counts: QueryTestHistoryStatsResponse.Group.VerdictCounts
+        unexpected_count: int
+        unexpectedly_skipped_count: int
+        flaky_count: int
+        exonerated_count: int
+        expected_count: int
+        passed_avg_duration: _duration_pb2.Duration
+        def __init__(self, partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., variant_hash: _Optional[str] = ..., verdict_counts: _Optional[_Union[QueryTestHistoryStatsResponse.Group.VerdictCounts, _Mapping]] = ..., unexpected_count: _Optional[int] = ..., unexpectedly_skipped_count: _Optional[int] = ..., flaky_count: _Optional[int] = ..., exonerated_count: _Optional[int] = ..., expected_count: _Optional[int] = ..., passed_avg_duration: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ...) -> None: ...
+    GROUPS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    groups: _containers.RepeatedCompositeFieldContainer[QueryTestHistoryStatsResponse.Group]
+    next_page_token: str
+    def __init__(self, groups: _Optional[_Iterable[_Union[QueryTestHistoryStatsResponse.Group, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryVariantsRequest(_message.Message):
+    __slots__ = ("project", "test_id", "sub_realm", "variant_predicate", "follow_test_id_renaming", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    SUB_REALM_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    FOLLOW_TEST_ID_RENAMING_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    sub_realm: str
+    variant_predicate: _predicate_pb2.VariantPredicate
+    follow_test_id_renaming: bool
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., sub_realm: _Optional[str] = ..., variant_predicate: _Optional[_Union[_predicate_pb2.VariantPredicate, _Mapping]] = ..., follow_test_id_renaming: bool = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryVariantsResponse(_message.Message):
+    __slots__ = ("variants", "next_page_token")
+    class VariantInfo(_message.Message):
+        __slots__ = ("variant_hash", "variant")
+        VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_FIELD_NUMBER: _ClassVar[int]
+        variant_hash: str
+        variant: _common_pb2.Variant
+        def __init__(self, variant_hash: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ...) -> None: ...
+    VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    variants: _containers.RepeatedCompositeFieldContainer[QueryVariantsResponse.VariantInfo]
+    next_page_token: str
+    def __init__(self, variants: _Optional[_Iterable[_Union[QueryVariantsResponse.VariantInfo, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestsRequest(_message.Message):
+    __slots__ = ("project", "test_id_substring", "sub_realm", "page_size", "page_token", "case_insensitive")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_SUBSTRING_FIELD_NUMBER: _ClassVar[int]
+    SUB_REALM_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    CASE_INSENSITIVE_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id_substring: str
+    sub_realm: str
+    page_size: int
+    page_token: str
+    case_insensitive: bool
+    def __init__(self, project: _Optional[str] = ..., test_id_substring: _Optional[str] = ..., sub_realm: _Optional[str] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., case_insensitive: bool = ...) -> None: ...
+
+class QueryTestsResponse(_message.Message):
+    __slots__ = ("test_ids", "next_page_token")
+    TEST_IDS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    test_ids: _containers.RepeatedScalarFieldContainer[str]
+    next_page_token: str
+    def __init__(self, test_ids: _Optional[_Iterable[str]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryRecentPassesRequest(_message.Message):
+    __slots__ = ("project", "test_id", "variant_hash", "sources", "limit")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    variant_hash: str
+    sources: _sources_pb2.Sources
+    limit: int
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., sources: _Optional[_Union[_sources_pb2.Sources, _Mapping]] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class QueryRecentPassesResponse(_message.Message):
+    __slots__ = ("passing_results",)
+    class PassingResult(_message.Message):
+        __slots__ = ("name",)
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        def __init__(self, name: _Optional[str] = ...) -> None: ...
+    PASSING_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    passing_results: _containers.RepeatedCompositeFieldContainer[QueryRecentPassesResponse.PassingResult]
+    def __init__(self, passing_results: _Optional[_Iterable[_Union[QueryRecentPassesResponse.PassingResult, _Mapping]]] = ...) -> None: ...
+
+class QuerySourceVerdictsV2Request(_message.Message):
+    __slots__ = ("project", "test_id_structured", "test_id_flat", "source_ref", "source_ref_hash", "filter", "order_by", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FLAT_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_REF_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    FILTER_FIELD_NUMBER: _ClassVar[int]
+    ORDER_BY_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id_flat: _common_pb2.FlatTestIdentifier
+    source_ref: _sources_pb2.SourceRef
+    source_ref_hash: str
+    filter: str
+    order_by: str
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id_flat: _Optional[_Union[_common_pb2.FlatTestIdentifier, _Mapping]] = ..., source_ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., source_ref_hash: _Optional[str] = ..., filter: _Optional[str] = ..., order_by: _Optional[str] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QuerySourceVerdictsV2Response(_message.Message):
+    __slots__ = ("source_verdicts", "next_page_token")
+    SOURCE_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    source_verdicts: _containers.RepeatedCompositeFieldContainer[SourceVerdict]
+    next_page_token: str
+    def __init__(self, source_verdicts: _Optional[_Iterable[_Union[SourceVerdict, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class SourceVerdict(_message.Message):
+    __slots__ = ("position", "status", "approximate_status", "invocation_verdicts")
+    class InvocationTestVerdict(_message.Message):
+        __slots__ = ("root_invocation", "invocation", "partition_time", "status", "changelists", "is_sources_dirty")
+        ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+        INVOCATION_FIELD_NUMBER: _ClassVar[int]
+        PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+        IS_SOURCES_DIRTY_FIELD_NUMBER: _ClassVar[int]
+        root_invocation: str
+        invocation: str
+        partition_time: _timestamp_pb2.Timestamp
+        status: _test_verdict_pb2.TestVerdict.Status
+        changelists: _containers.RepeatedCompositeFieldContainer[_sources_pb2.Changelist]
+        is_sources_dirty: bool
+        def __init__(self, root_invocation: _Optional[str] = ..., invocation: _Optional[str] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., status: _Optional[_Union[_test_verdict_pb2.TestVerdict.Status, str]] = ..., changelists: _Optional[_Iterable[_Union[_sources_pb2.Changelist, _Mapping]]] = ..., is_sources_dirty: bool = ...) -> None: ...
+    POSITION_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    APPROXIMATE_STATUS_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    position: int
+    status: _test_verdict_pb2.TestVerdict.Status
+    approximate_status: _test_verdict_pb2.TestVerdict.Status
+    invocation_verdicts: _containers.RepeatedCompositeFieldContainer[SourceVerdict.InvocationTestVerdict]
+    def __init__(self, position: _Optional[int] = ..., status: _Optional[_Union[_test_verdict_pb2.TestVerdict.Status, str]] = ..., approximate_status: _Optional[_Union[_test_verdict_pb2.TestVerdict.Status, str]] = ..., invocation_verdicts: _Optional[_Iterable[_Union[SourceVerdict.InvocationTestVerdict, _Mapping]]] = ...) -> None: ...
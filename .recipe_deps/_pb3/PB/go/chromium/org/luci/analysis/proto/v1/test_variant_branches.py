@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/test_variant_branches.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/test_variant_branches.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nBgo.chromium.org/luci/analysis/proto/v1/test_variant_branches.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x19google/protobuf/any.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\"4\n\x1eGetRawTestVariantBranchRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"\xb9\x03\n\x14TestVariantBranchRaw\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0f\n\x07test_id\x18\x03 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x04 \x01(\t\x12\x10\n\x08ref_hash\x18\x05 \x01(\t\x12*\n\x07variant\x18\x06 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12(\n\x03ref\x18\x07 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12\x30\n\x12\x66inalized_segments\x18\x08 \x01(\x0b\x32\x14.google.protobuf.Any\x12\x30\n\x12\x66inalizing_segment\x18\t \x01(\x0b\x32\x14.google.protobuf.Any\x12(\n\nstatistics\x18\x0c \x01(\x0b\x32\x14.google.protobuf.Any\x12\x31\n\nhot_buffer\x18\n \x01(\x0b\x32\x1d.luci.analysis.v1.InputBuffer\x12\x32\n\x0b\x63old_buffer\x18\x0b \x01(\x0b\x32\x1d.luci.analysis.v1.InputBuffer\"\xd1\x03\n\x0bInputBuffer\x12\x0e\n\x06length\x18\x01 \x01(\x03\x12/\n\x04runs\x18\x02 \x03(\x0b\x32!.luci.analysis.v1.InputBuffer.Run\x1a\x80\x03\n\x03Run\x12\x16\n\x0e\x63ommitPosition\x18\x01 \x01(\x03\x12(\n\x04hour\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x38\n\x06\x63ounts\x18\x03 \x01(\x0b\x32(.luci.analysis.v1.InputBuffer.Run.Counts\x1a\xfc\x01\n\x06\x43ounts\x12\x1b\n\x13\x65xpected_pass_count\x18\x01 \x01(\x03\x12\x1b\n\x13\x65xpected_fail_count\x18\x02 \x01(\x03\x12\x1c\n\x14\x65xpected_crash_count\x18\x03 \x01(\x03\x12\x1c\n\x14\x65xpected_abort_count\x18\x04 \x01(\x03\x12\x1d\n\x15unexpected_pass_count\x18\x05 \x01(\x03\x12\x1d\n\x15unexpected_fail_count\x18\x06 \x01(\x03\x12\x1e\n\x16unexpected_crash_count\x18\x07 \x01(\x03\x12\x1e\n\x16unexpected_abort_count\x18\x08 \x01(\x03\"7\n BatchGetTestVariantBranchRequest\x12\x13\n\x05names\x18\x01 \x03(\tB\x04\xe2\x41\x01\x02\"g\n!BatchGetTestVariantBranchResponse\x12\x42\n\x15test_variant_branches\x18\x01 \x03(\x0b\x32#.luci.analysis.v1.TestVariantBranch\"\x92\x01\n\x1dQueryTestVariantBranchRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12(\n\x03ref\x18\x03 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"{\n\x1eQueryTestVariantBranchResponse\x12@\n\x13test_variant_branch\x18\x01 \x03(\x0b\x32#.luci.analysis.v1.TestVariantBranch\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xee\x01\n\x11TestVariantBranch\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0f\n\x07test_id\x18\x03 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x04 \x01(\t\x12\x10\n\x08ref_hash\x18\x05 \x01(\t\x12*\n\x07variant\x18\x06 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12(\n\x03ref\x18\x07 \x01(\x0b\x32\x1b.luci.analysis.v1.SourceRef\x12+\n\x08segments\x18\x08 \x03(\x0b\x32\x19.luci.analysis.v1.Segment\"\xdc\x07\n\x07Segment\x12\x1d\n\x15has_start_changepoint\x18\x01 \x01(\x08\x12\x16\n\x0estart_position\x18\x02 \x01(\x03\x12\'\n\x1fstart_position_lower_bound_99th\x18\x03 \x01(\x03\x12\'\n\x1fstart_position_upper_bound_99th\x18\x04 \x01(\x03\x12S\n\x1bstart_position_distribution\x18\t \x01(\x0b\x32..luci.analysis.v1.Segment.PositionDistribution\x12.\n\nstart_hour\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0c\x65nd_position\x18\x06 \x01(\x03\x12,\n\x08\x65nd_hour\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x30\n\x06\x63ounts\x18\x08 \x01(\x0b\x32 .luci.analysis.v1.Segment.Counts\x1a>\n\x14PositionDistribution\x12\x0c\n\x04\x63\x64\x66s\x18\x01 \x03(\x01\x12\x18\n\x10source_positions\x18\x02 \x03(\x03\x1a\x8c\x04\n\x06\x43ounts\x12\x1a\n\x12unexpected_results\x18\x01 \x01(\x05\x12\x15\n\rtotal_results\x18\x02 \x01(\x05\x12\x1f\n\x17\x65xpected_passed_results\x18\x03 \x01(\x05\x12\x1f\n\x17\x65xpected_failed_results\x18\x04 \x01(\x05\x12 \n\x18\x65xpected_crashed_results\x18\x05 \x01(\x05\x12 \n\x18\x65xpected_aborted_results\x18\x06 \x01(\x05\x12!\n\x19unexpected_passed_results\x18\x07 \x01(\x05\x12!\n\x19unexpected_failed_results\x18\x08 \x01(\x05\x12\"\n\x1aunexpected_crashed_results\x18\t \x01(\x05\x12\"\n\x1aunexpected_aborted_results\x18\n \x01(\x05\x12!\n\x19unexpected_unretried_runs\x18\x0b \x01(\x05\x12#\n\x1bunexpected_after_retry_runs\x18\x0c \x01(\x05\x12\x12\n\nflaky_runs\x18\r \x01(\x05\x12\x12\n\ntotal_runs\x18\x0e \x01(\x05\x12\x1b\n\x13unexpected_verdicts\x18\x0f \x01(\x05\x12\x16\n\x0e\x66laky_verdicts\x18\x10 \x01(\x05\x12\x16\n\x0etotal_verdicts\x18\x11 \x01(\x05\"h\n\x1aQuerySourceVerdictsRequest\x12\x0e\n\x06parent\x18\x01 \x01(\t\x12\x1d\n\x15start_source_position\x18\x02 \x01(\x03\x12\x1b\n\x13\x65nd_source_position\x18\x03 \x01(\x03\"\xff\x04\n\x1bQuerySourceVerdictsResponse\x12T\n\x0fsource_verdicts\x18\x01 \x03(\x0b\x32;.luci.analysis.v1.QuerySourceVerdictsResponse.SourceVerdict\x1a\xd8\x01\n\x0bTestVerdict\x12\x15\n\rinvocation_id\x18\x01 \x01(\t\x12\x32\n\x0epartition_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12K\n\x06status\x18\x03 \x01(\x0e\x32;.luci.analysis.v1.QuerySourceVerdictsResponse.VerdictStatus\x12\x31\n\x0b\x63hangelists\x18\x04 \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\x1a\xbb\x01\n\rSourceVerdict\x12\x10\n\x08position\x18\x01 \x01(\x03\x12K\n\x06status\x18\x02 \x01(\x0e\x32;.luci.analysis.v1.QuerySourceVerdictsResponse.VerdictStatus\x12K\n\x08verdicts\x18\x03 \x03(\x0b\x32\x39.luci.analysis.v1.QuerySourceVerdictsResponse.TestVerdict\"q\n\rVerdictStatus\x12*\n&VERDICT_EXPECTATION_STATUS_UNSPECIFIED\x10\x00\x12\x0e\n\nUNEXPECTED\x10\x01\x12\x0c\n\x08\x45XPECTED\x10\x02\x12\t\n\x05\x46LAKY\x10\x03\x12\x0b\n\x07SKIPPED\x10\x04\"\x98\x02\n!QueryChangepointAIAnalysisRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12\x10\n\x08ref_hash\x18\x04 \x01(\t\x12\x1d\n\x15start_source_position\x18\x05 \x01(\x03\x12Y\n\x0eprompt_options\x18\x06 \x01(\x0b\x32\x41.luci.analysis.v1.QueryChangepointAIAnalysisRequest.PromptOptions\x1a/\n\rPromptOptions\x12\x0e\n\x06prefix\x18\x01 \x01(\t\x12\x0e\n\x06suffix\x18\x02 \x01(\t\"O\n\"QueryChangepointAIAnalysisResponse\x12\x19\n\x11\x61nalysis_markdown\x18\x01 \x01(\t\x12\x0e\n\x06prompt\x18\x02 \x01(\t2\xe2\x04\n\x13TestVariantBranches\x12\x64\n\x06GetRaw\x12\x30.luci.analysis.v1.GetRawTestVariantBranchRequest\x1a&.luci.analysis.v1.TestVariantBranchRaw\"\x00\x12u\n\x08\x42\x61tchGet\x12\x32.luci.analysis.v1.BatchGetTestVariantBranchRequest\x1a\x33.luci.analysis.v1.BatchGetTestVariantBranchResponse\"\x00\x12l\n\x05Query\x12/.luci.analysis.v1.QueryTestVariantBranchRequest\x1a\x30.luci.analysis.v1.QueryTestVariantBranchResponse\"\x00\x12t\n\x13QuerySourceVerdicts\x12,.luci.analysis.v1.QuerySourceVerdictsRequest\x1a-.luci.analysis.v1.QuerySourceVerdictsResponse\"\x00\x12\x89\x01\n\x1aQueryChangepointAIAnalysis\x12\x33.luci.analysis.v1.QueryChangepointAIAnalysisRequest\x1a\x34.luci.analysis.v1.QueryChangepointAIAnalysisResponse\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.test_variant_branches_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_GETRAWTESTVARIANTBRANCHREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_GETRAWTESTVARIANTBRANCHREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHGETTESTVARIANTBRANCHREQUEST'].fields_by_name['names']._loaded_options = None
+  _globals['_BATCHGETTESTVARIANTBRANCHREQUEST'].fields_by_name['names']._serialized_options = b'\342A\001\002'
+  _globals['_GETRAWTESTVARIANTBRANCHREQUEST']._serialized_start=288
+  _globals['_GETRAWTESTVARIANTBRANCHREQUEST']._serialized_end=340
+  _globals['_TESTVARIANTBRANCHRAW']._serialized_start=343
+  _globals['_TESTVARIANTBRANCHRAW']._serialized_end=784
+  _globals['_INPUTBUFFER']._serialized_start=787
+  _globals['_INPUTBUFFER']._serialized_end=1252
+  _globals['_INPUTBUFFER_RUN']._serialized_start=868
+  _globals['_INPUTBUFFER_RUN']._serialized_end=1252
+  _globals['_INPUTBUFFER_RUN_COUNTS']._serialized_start=1000
+  _globals['_INPUTBUFFER_RUN_COUNTS']._serialized_end=1252
+  _globals['_BATCHGETTESTVARIANTBRANCHREQUEST']._serialized_start=1254
+  _globals['_BATCHGETTESTVARIANTBRANCHREQUEST']._serialized_end=1309
+  _globals['_BATCHGETTESTVARIANTBRANCHRESPONSE']._serialized_start=1311
+  _globals['_BATCHGETTESTVARIANTBRANCHRESPONSE']._serialized_end=1414
+  _globals['_QUERYTESTVARIANTBRANCHREQUEST']._serialized_start=1417
+  _globals['_QUERYTESTVARIANTBRANCHREQUEST']._serialized_end=1563
+  _globals['_QUERYTESTVARIANTBRANCHRESPONSE']._serialized_start=1565
+  _globals['_QUERYTESTVARIANTBRANCHRESPONSE']._serialized_end=1688
+  _globals['_TESTVARIANTBRANCH']._serialized_start=1691
+  _globals['_TESTVARIANTBRANCH']._serialized_end=1929
+  _globals['_SEGMENT']._serialized_start=1932
+  _globals['_SEGMENT']._serialized_end=2920
+  _globals['_SEGMENT_POSITIONDISTRIBUTION']._serialized_start=2331
+  _globals['_SEGMENT_POSITIONDISTRIBUTION']._serialized_end=2393
+  _globals['_SEGMENT_COUNTS']._serialized_start=2396
+  _globals['_SEGMENT_COUNTS']._serialized_end=2920
+  _globals['_QUERYSOURCEVERDICTSREQUEST']._serialized_start=2922
+  _globals['_QUERYSOURCEVERDICTSREQUEST']._serialized_end=3026
+  _globals['_QUERYSOURCEVERDICTSRESPONSE']._serialized_start=3029
+  _globals['_QUERYSOURCEVERDICTSRESPONSE']._serialized_end=3668
+  _globals['_QUERYSOURCEVERDICTSRESPONSE_TESTVERDICT']._serialized_start=3147
+  _globals['_QUERYSOURCEVERDICTSRESPONSE_TESTVERDICT']._serialized_end=3363
+  _globals['_QUERYSOURCEVERDICTSRESPONSE_SOURCEVERDICT']._serialized_start=3366
+  _globals['_QUERYSOURCEVERDICTSRESPONSE_SOURCEVERDICT']._serialized_end=3553
+  _globals['_QUERYSOURCEVERDICTSRESPONSE_VERDICTSTATUS']._serialized_start=3555
+  _globals['_QUERYSOURCEVERDICTSRESPONSE_VERDICTSTATUS']._serialized_end=3668
+  _globals['_QUERYCHANGEPOINTAIANALYSISREQUEST']._serialized_start=3671
+  _globals['_QUERYCHANGEPOINTAIANALYSISREQUEST']._serialized_end=3951
+  _globals['_QUERYCHANGEPOINTAIANALYSISREQUEST_PROMPTOPTIONS']._serialized_start=3904
+  _globals['_QUERYCHANGEPOINTAIANALYSISREQUEST_PROMPTOPTIONS']._serialized_end=3951
+  _globals['_QUERYCHANGEPOINTAIANALYSISRESPONSE']._serialized_start=3953
+  _globals['_QUERYCHANGEPOINTAIANALYSISRESPONSE']._serialized_end=4032
+  _globals['_TESTVARIANTBRANCHES']._serialized_start=4035
+  _globals['_TESTVARIANTBRANCHES']._serialized_end=4645
+# @@protoc_insertion_point(module_scope)
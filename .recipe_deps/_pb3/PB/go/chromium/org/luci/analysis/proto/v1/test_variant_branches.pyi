@@ -0,0 +1,284 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import any_pb2 as _any_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetRawTestVariantBranchRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class TestVariantBranchRaw(_message.Message):
+    __slots__ = ("name", "project", "test_id", "variant_hash", "ref_hash", "variant", "ref", "finalized_segments", "finalizing_segment", "statistics", "hot_buffer", "cold_buffer")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    FINALIZED_SEGMENTS_FIELD_NUMBER: _ClassVar[int]
+    FINALIZING_SEGMENT_FIELD_NUMBER: _ClassVar[int]
+    STATISTICS_FIELD_NUMBER: _ClassVar[int]
+    HOT_BUFFER_FIELD_NUMBER: _ClassVar[int]
+    COLD_BUFFER_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    project: str
+    test_id: str
+    variant_hash: str
+    ref_hash: str
+    variant: _common_pb2.Variant
+    ref: _sources_pb2.SourceRef
+    finalized_segments: _any_pb2.Any
+    finalizing_segment: _any_pb2.Any
+    statistics: _any_pb2.Any
+    hot_buffer: InputBuffer
+    cold_buffer: InputBuffer
+    def __init__(self, name: _Optional[str] = ..., project: _Optional[str] = ..., test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., ref_hash: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., finalized_segments: _Optional[_Union[_any_pb2.Any, _Mapping]] = ..., finalizing_segment: _Optional[_Union[_any_pb2.Any, _Mapping]] = ..., statistics: _Optional[_Union[_any_pb2.Any, _Mapping]] = ..., hot_buffer: _Optional[_Union[InputBuffer, _Mapping]] = ..., cold_buffer: _Optional[_Union[InputBuffer, _Mapping]] = ...) -> None: ...
+
+class InputBuffer(_message.Message):
+    __slots__ = ("length", "runs")
+    class Run(_message.Message):
+        __slots__ = ("commitPosition", "hour", "counts")
+        class Counts(_message.Message):
+            __slots__ = ("expected_pass_count", "expected_fail_count", "expected_crash_count", "expected_abort_count", "unexpected_pass_count", "unexpected_fail_count", "unexpected_crash_count", "unexpected_abort_count")
+            EXPECTED_PASS_COUNT_FIELD_NUMBER: _ClassVar[int]
+            EXPECTED_FAIL_COUNT_FIELD_NUMBER: _ClassVar[int]
+            EXPECTED_CRASH_COUNT_FIELD_NUMBER: _ClassVar[int]
+            EXPECTED_ABORT_COUNT_FIELD_NUMBER: _ClassVar[int]
+            UNEXPECTED_PASS_COUNT_FIELD_NUMBER: _ClassVar[int]
+            UNEXPECTED_FAIL_COUNT_FIELD_NUMBER: _ClassVar[int]
+            UNEXPECTED_CRASH_COUNT_FIELD_NUMBER: _ClassVar[int]
+            UNEXPECTED_ABORT_COUNT_FIELD_NUMBER: _ClassVar[int]
+            expected_pass_count: int
+            expected_fail_count: int
+            expected_crash_count: int
+            expected_abort_count: int
+            unexpected_pass_count: int
+            unexpected_fail_count: int
+            unexpected_crash_count: int
+            unexpected_abort_count: int
+            def __init__(self, expected_pass_count: _Optional[int] = ..., expected_fail_count: _Optional[int] = ..., expected_crash_count: _Optional[int] = ..., expected_abort_count: _Optional[int] = ..., unexpected_pass_count: _Optional[int] = ..., unexpected_fail_count: _Optional[int] = ..., unexpected_crash_count: _Optional[int] = ..., unexpected_abort_count: _Optional[int] = ...) -> None: ...
+        COMMITPOSITION_FIELD_NUMBER: _ClassVar[int]
+        HOUR_FIELD_NUMBER: _ClassVar[int]
+        COUNTS_FIELD_NUMBER: _ClassVar[int]
+        commitPosition: int
+        hour: _timestamp_pb2.Timestamp
+        counts: InputBuffer.Run.Counts
+        def __init__(self, commitPosition: _Optional[int] = ..., hour: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., counts: _Optional[_Union[InputBuffer.Run.Counts, _Mapping]] = ...) -> None: ...
+    LENGTH_FIELD_NUMBER: _ClassVar[int]
+    RUNS_FIELD_NUMBER: _ClassVar[int]
+    length: int
+    runs: _containers.RepeatedCompositeFieldContainer[InputBuffer.Run]
+    def __init__(self, length: _Optional[int] = ..., runs: _Optional[_Iterable[_Union[InputBuffer.Run, _Mapping]]] = ...) -> None: ...
+
+class BatchGetTestVariantBranchRequest(_message.Message):
+    __slots__ = ("names",)
+    NAMES_FIELD_NUMBER: _ClassVar[int]
+    names: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, names: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class BatchGetTestVariantBranchResponse(_message.Message):
+    __slots__ = ("test_variant_branches",)
+    TEST_VARIANT_BRANCHES_FIELD_NUMBER: _ClassVar[int]
+    test_variant_branches: _containers.RepeatedCompositeFieldContainer[TestVariantBranch]
+    def __init__(self, test_variant_branches: _Optional[_Iterable[_Union[TestVariantBranch, _Mapping]]] = ...) -> None: ...
+
+class QueryTestVariantBranchRequest(_message.Message):
+    __slots__ = ("project", "test_id", "ref", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    ref: _sources_pb2.SourceRef
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestVariantBranchResponse(_message.Message):
+    __slots__ = ("test_variant_branch", "next_page_token")
+    TEST_VARIANT_BRANCH_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    test_variant_branch: _containers.RepeatedCompositeFieldContainer[TestVariantBranch]
+    next_page_token: str
+    def __init__(self, test_variant_branch: _Optional[_Iterable[_Union[TestVariantBranch, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class TestVariantBranch(_message.Message):
+    __slots__ = ("name", "project", "test_id", "variant_hash", "ref_hash", "variant", "ref", "segments")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    SEGMENTS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    project: str
+    test_id: str
+    variant_hash: str
+    ref_hash: str
+    variant: _common_pb2.Variant
+    ref: _sources_pb2.SourceRef
+    segments: _containers.RepeatedCompositeFieldContainer[Segment]
+    def __init__(self, name: _Optional[str] = ..., project: _Optional[str] = ..., test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., ref_hash: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., ref: _Optional[_Union[_sources_pb2.SourceRef, _Mapping]] = ..., segments: _Optional[_Iterable[_Union[Segment, _Mapping]]] = ...) -> None: ...
+
+class Segment(_message.Message):
+    __slots__ = ("has_start_changepoint", "start_position", "start_position_lower_bound_99th", "start_position_upper_bound_99th", "start_position_distribution", "start_hour", "end_position", "end_hour", "counts")
+    class PositionDistribution(_message.Message):
+        __slots__ = ("cdfs", "source_positions")
+        CDFS_FIELD_NUMBER: _ClassVar[int]
+        SOURCE_POSITIONS_FIELD_NUMBER: _ClassVar[int]
+        cdfs: _containers.RepeatedScalarFieldContainer[float]
+        source_positions: _containers.RepeatedScalarFieldContainer[int]
+        def __init__(self, cdfs: _Optional[_Iterable[float]] = ..., source_positions: _Optional[_Iterable[int]] = ...) -> None: ...
+    class Counts(_message.Message):
+        __slots__ = ("unexpected_results", "total_results", "expected_passed_results", "expected_failed_results", "expected_crashed_results", "expected_aborted_results", "unexpected_passed_results", "unexpected_failed_results", "unexpected_crashed_results", "unexpected_aborted_results", "unexpected_unretried_runs", "unexpected_after_retry_runs", "flaky_runs", "total_runs", "unexpected_verdicts", "flaky_verdicts", "total_verdicts")
+        UNEXPECTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_PASSED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_FAILED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_CRASHED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_ABORTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_PASSED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_FAILED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_CRASHED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_ABORTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_UNRETRIED_RUNS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_AFTER_RETRY_RUNS_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_RUNS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_RUNS_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        unexpected_results: int
+        total_results: int
+        expected_passed_results: int
+        expected_failed_results: int
+        expected_crashed_results: int
+        expected_aborted_results: int
+        unexpected_passed_results: int
+        unexpected_failed_results: int
+        unexpected_crashed_results: int
+        unexpected_aborted_results: int
+        unexpected_unretried_runs: int
+        unexpected_after_retry_runs: int
+        flaky_runs: int
+        total_runs: int
+        unexpected_verdicts: int
+        flaky_verdicts: int
+        total_verdicts: int
+        def __init__(self, unexpected_results: _Optional[int] = ..., total_results: _Optional[int] = ..., expected_passed_results: _Optional[int] = ..., expected_failed_results: _Optional[int] = ..., expected_crashed_results: _Optional[int] = ..., expected_aborted_results: _Optional[int] = ..., unexpected_passed_results: _Optional[int] = ..., unexpected_failed_results: _Optional[int] = ..., unexpected_crashed_results: _Optional[int] = ..., unexpected_aborted_results: _Optional[int] = ..., unexpected_unretried_runs: _Optional[int] = ..., unexpected_after_retry_runs: _Optional[int] = ..., flaky_runs: _Optional[int] = ..., total_runs: _Optional[int] = ..., unexpected_verdicts: _Optional[int] = ..., flaky_verdicts: _Optional[int] = ..., total_verdicts: _Optional[int] = ...) -> None: ...
+    HAS_START_CHANGEPOINT_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_LOWER_BOUND_99TH_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_UPPER_BOUND_99TH_FIELD_NUMBER: _ClassVar[int]
+    START_POSITION_DISTRIBUTION_FIELD_NUMBER: _ClassVar[int]
+    START_HOUR_FIELD_NUMBER: _ClassVar[int]
+    END_POSITION_FIELD_NUMBER: _ClassVar[int]
+    END_HOUR_FIELD_NUMBER: _ClassVar[int]
+    COUNTS_FIELD_NUMBER: _ClassVar[int]
+    has_start_changepoint: bool
+    start_position: int
+    start_position_lower_bound_99th: int
+    start_position_upper_bound_99th: int
+    start_position_distribution: Segment.PositionDistribution
+    start_hour: _timestamp_pb2.Timestamp
+    end_position: int
+    end_hour: _timestamp_pb2.Timestamp
+    counts: Segment.Counts
+    def __init__(self, has_start_changepoint: bool = ..., start_position: _Optional[int] = ..., start_position_lower_bound_99th: _Optional[int] = ..., start_position_upper_bound_99th: _Optional[int] = ..., start_position_distribution: _Optional[_Union[Segment.PositionDistribution, _Mapping]] = ..., start_hour: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_position: _Optional[int] = ..., end_hour: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., counts: _Optional[_Union[Segment.Counts, _Mapping]] = ...) -> None: ...
+
+class QuerySourceVerdictsRequest(_message.Message):
+    __slots__ = ("parent", "start_source_position", "end_source_position")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    START_SOURCE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    END_SOURCE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    start_source_position: int
+    end_source_position: int
+    def __init__(self, parent: _Optional[str] = ..., start_source_position: _Optional[int] = ..., end_source_position: _Optional[int] = ...) -> None: ...
+
+class QuerySourceVerdictsResponse(_message.Message):
+    __slots__ = ("source_verdicts",)
+    class VerdictStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        VERDICT_EXPECTATION_STATUS_UNSPECIFIED: _ClassVar[QuerySourceVerdictsResponse.VerdictStatus]
+        UNEXPECTED: _ClassVar[QuerySourceVerdictsResponse.VerdictStatus]
+        EXPECTED: _ClassVar[QuerySourceVerdictsResponse.VerdictStatus]
+        FLAKY: _ClassVar[QuerySourceVerdictsResponse.VerdictStatus]
+        SKIPPED: _ClassVar[QuerySourceVerdictsResponse.VerdictStatus]
+    VERDICT_EXPECTATION_STATUS_UNSPECIFIED: QuerySourceVerdictsResponse.VerdictStatus
+    UNEXPECTED: QuerySourceVerdictsResponse.VerdictStatus
+    EXPECTED: QuerySourceVerdictsResponse.VerdictStatus
+    FLAKY: QuerySourceVerdictsResponse.VerdictStatus
+    SKIPPED: QuerySourceVerdictsResponse.VerdictStatus
+    class TestVerdict(_message.Message):
+        __slots__ = ("invocation_id", "partition_time", "status", "changelists")
+        INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+        PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+        invocation_id: str
+        partition_time: _timestamp_pb2.Timestamp
+        status: QuerySourceVerdictsResponse.VerdictStatus
+        changelists: _containers.RepeatedCompositeFieldContainer[_sources_pb2.Changelist]
+        def __init__(self, invocation_id: _Optional[str] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., status: _Optional[_Union[QuerySourceVerdictsResponse.VerdictStatus, str]] = ..., changelists: _Optional[_Iterable[_Union[_sources_pb2.Changelist, _Mapping]]] = ...) -> None: ...
+    class SourceVerdict(_message.Message):
+        __slots__ = ("position", "status", "verdicts")
+        POSITION_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        position: int
+        status: QuerySourceVerdictsResponse.VerdictStatus
+        verdicts: _containers.RepeatedCompositeFieldContainer[QuerySourceVerdictsResponse.TestVerdict]
+        def __init__(self, position: _Optional[int] = ..., status: _Optional[_Union[QuerySourceVerdictsResponse.VerdictStatus, str]] = ..., verdicts: _Optional[_Iterable[_Union[QuerySourceVerdictsResponse.TestVerdict, _Mapping]]] = ...) -> None: ...
+    SOURCE_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    source_verdicts: _containers.RepeatedCompositeFieldContainer[QuerySourceVerdictsResponse.SourceVerdict]
+    def __init__(self, source_verdicts: _Optional[_Iterable[_Union[QuerySourceVerdictsResponse.SourceVerdict, _Mapping]]] = ...) -> None: ...
+
+class QueryChangepointAIAnalysisRequest(_message.Message):
+    __slots__ = ("project", "test_id", "variant_hash", "ref_hash", "start_source_position", "prompt_options")
+    class PromptOptions(_message.Message):
+        __slots__ = ("prefix", "suffix")
+        PREFIX_FIELD_NUMBER: _ClassVar[int]
+        SUFFIX_FIELD_NUMBER: _ClassVar[int]
+        prefix: str
+        suffix: str
+        def __init__(self, prefix: _Optional[str] = ..., suffix: _Optional[str] = ...) -> None: ...
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    START_SOURCE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    PROMPT_OPTIONS_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_id: str
+    variant_hash: str
+    ref_hash: str
+    start_source_position: int
+    prompt_options: QueryChangepointAIAnalysisRequest.PromptOptions
+    def __init__(self, project: _Optional[str] = ..., test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., ref_hash: _Optional[str] = ..., start_source_position: _Optional[int] = ..., prompt_options: _Optional[_Union[QueryChangepointAIAnalysisRequest.PromptOptions, _Mapping]] = ...) -> None: ...
+
+class QueryChangepointAIAnalysisResponse(_message.Message):
+    __slots__ = ("analysis_markdown", "prompt")
+    ANALYSIS_MARKDOWN_FIELD_NUMBER: _ClassVar[int]
+    PROMPT_FIELD_NUMBER: _ClassVar[int]
+    analysis_markdown: str
+    prompt: str
+    def __init__(self, analysis_markdown: _Optional[str] = ..., prompt: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/test_variants.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/test_variants.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n:go.chromium.org/luci/analysis/proto/v1/test_variants.proto\x12\x10luci.analysis.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/analysis/proto/v1/common.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\"\xf0\x01\n\"QueryTestVariantFailureRateRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12W\n\rtest_variants\x18\x02 \x03(\x0b\x32@.luci.analysis.v1.QueryTestVariantFailureRateRequest.TestVariant\x1a`\n\x0bTestVariant\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\"\xc1\x02\n#QueryTestVariantFailureRateResponse\x12Q\n\tintervals\x18\x01 \x03(\x0b\x32>.luci.analysis.v1.QueryTestVariantFailureRateResponse.Interval\x12G\n\rtest_variants\x18\x02 \x03(\x0b\x32\x30.luci.analysis.v1.TestVariantFailureRateAnalysis\x1a~\n\x08Interval\x12\x14\n\x0cinterval_age\x18\x01 \x01(\x05\x12.\n\nstart_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xef\x06\n\x1eTestVariantFailureRateAnalysis\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12V\n\x0einterval_stats\x18\x04 \x03(\x0b\x32>.luci.analysis.v1.TestVariantFailureRateAnalysis.IntervalStats\x12\x63\n\x1arun_flaky_verdict_examples\x18\x05 \x03(\x0b\x32?.luci.analysis.v1.TestVariantFailureRateAnalysis.VerdictExample\x12W\n\x0frecent_verdicts\x18\x06 \x03(\x0b\x32>.luci.analysis.v1.TestVariantFailureRateAnalysis.RecentVerdict\x1a\x93\x01\n\rIntervalStats\x12\x14\n\x0cinterval_age\x18\x01 \x01(\x05\x12#\n\x1btotal_run_expected_verdicts\x18\x02 \x01(\x05\x12 \n\x18total_run_flaky_verdicts\x18\x03 \x01(\x05\x12%\n\x1dtotal_run_unexpected_verdicts\x18\x04 \x01(\x05\x1a\x97\x01\n\x0eVerdictExample\x12\x32\n\x0epartition_time\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1e\n\x16ingested_invocation_id\x18\x02 \x01(\t\x12\x31\n\x0b\x63hangelists\x18\x03 \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\x1a\xb3\x01\n\rRecentVerdict\x12\x32\n\x0epartition_time\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1e\n\x16ingested_invocation_id\x18\x02 \x01(\t\x12\x31\n\x0b\x63hangelists\x18\x03 \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\x12\x1b\n\x13has_unexpected_runs\x18\x04 \x01(\x08\"\xa9\x02\n QueryTestVariantStabilityRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12]\n\rtest_variants\x18\x02 \x03(\x0b\x32\x46.luci.analysis.v1.QueryTestVariantStabilityRequest.TestVariantPosition\x1a\x94\x01\n\x13TestVariantPosition\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12*\n\x07sources\x18\x04 \x01(\x0b\x32\x19.luci.analysis.v1.Sources\"\xa5\x01\n!QueryTestVariantStabilityResponse\x12\x45\n\rtest_variants\x18\x01 \x03(\x0b\x32..luci.analysis.v1.TestVariantStabilityAnalysis\x12\x39\n\x08\x63riteria\x18\x02 \x01(\x0b\x32\'.luci.analysis.v1.TestStabilityCriteria\"\x8f\x03\n\x15TestStabilityCriteria\x12Q\n\x0c\x66\x61ilure_rate\x18\x01 \x01(\x0b\x32;.luci.analysis.v1.TestStabilityCriteria.FailureRateCriteria\x12M\n\nflake_rate\x18\x02 \x01(\x0b\x32\x39.luci.analysis.v1.TestStabilityCriteria.FlakeRateCriteria\x1aW\n\x13\x46\x61ilureRateCriteria\x12\x19\n\x11\x66\x61ilure_threshold\x18\x01 \x01(\x05\x12%\n\x1d\x63onsecutive_failure_threshold\x18\x02 \x01(\x05\x1a{\n\x11\x46lakeRateCriteria\x12\x12\n\nmin_window\x18\x01 \x01(\x05\x12\x17\n\x0f\x66lake_threshold\x18\x02 \x01(\x05\x12\x1c\n\x14\x66lake_rate_threshold\x18\x03 \x01(\x01\x12\x1b\n\x13\x66lake_threshold_1wd\x18\x04 \x01(\x05\"\xf5\x08\n\x1cTestVariantStabilityAnalysis\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.analysis.v1.Variant\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12P\n\x0c\x66\x61ilure_rate\x18\x04 \x01(\x0b\x32:.luci.analysis.v1.TestVariantStabilityAnalysis.FailureRate\x12L\n\nflake_rate\x18\x05 \x01(\x0b\x32\x38.luci.analysis.v1.TestVariantStabilityAnalysis.FlakeRate\x1a\xff\x02\n\x0b\x46\x61ilureRate\x12\x0e\n\x06is_met\x18\x01 \x01(\x08\x12\x1c\n\x14unexpected_test_runs\x18\x02 \x01(\x05\x12(\n consecutive_unexpected_test_runs\x18\x03 \x01(\x05\x12\x61\n\x0frecent_verdicts\x18\x04 \x03(\x0b\x32H.luci.analysis.v1.TestVariantStabilityAnalysis.FailureRate.RecentVerdict\x1a\xb4\x01\n\rRecentVerdict\x12\x10\n\x08position\x18\x01 \x01(\x03\x12\x31\n\x0b\x63hangelists\x18\x02 \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\x12\x18\n\x10root_invocations\x18\x06 \x03(\t\x12\x17\n\x0binvocations\x18\x03 \x03(\tB\x02\x18\x01\x12\x17\n\x0funexpected_runs\x18\x04 \x01(\x05\x12\x12\n\ntotal_runs\x18\x05 \x01(\x05\x1a\xdf\x03\n\tFlakeRate\x12\x0e\n\x06is_met\x18\x01 \x01(\x08\x12\x1a\n\x12run_flaky_verdicts\x18\x02 \x01(\x05\x12\x16\n\x0etotal_verdicts\x18\x03 \x01(\x05\x12_\n\x0e\x66lake_examples\x18\x04 \x03(\x0b\x32G.luci.analysis.v1.TestVariantStabilityAnalysis.FlakeRate.VerdictExample\x12\x16\n\x0estart_position\x18\x05 \x01(\x03\x12\x14\n\x0c\x65nd_position\x18\x06 \x01(\x03\x12\x1e\n\x16run_flaky_verdicts_1wd\x18\x07 \x01(\x05\x12\x1a\n\x12start_position_1wd\x18\x08 \x01(\x03\x12\x18\n\x10\x65nd_position_1wd\x18\t \x01(\x03\x12\x1e\n\x16run_flaky_verdicts_12h\x18\n \x01(\x05\x1a\x88\x01\n\x0eVerdictExample\x12\x10\n\x08position\x18\x01 \x01(\x03\x12\x31\n\x0b\x63hangelists\x18\x02 \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\x12\x18\n\x10root_invocations\x18\x04 \x03(\t\x12\x17\n\x0binvocations\x18\x03 \x03(\tB\x02\x18\x01\x32\x8f\x02\n\x0cTestVariants\x12\x81\x01\n\x10QueryFailureRate\x12\x34.luci.analysis.v1.QueryTestVariantFailureRateRequest\x1a\x35.luci.analysis.v1.QueryTestVariantFailureRateResponse\"\x00\x12{\n\x0eQueryStability\x12\x32.luci.analysis.v1.QueryTestVariantStabilityRequest\x1a\x33.luci.analysis.v1.QueryTestVariantStabilityResponse\"\x00\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.test_variants_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FAILURERATE_RECENTVERDICT'].fields_by_name['invocations']._loaded_options = None
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FAILURERATE_RECENTVERDICT'].fields_by_name['invocations']._serialized_options = b'\030\001'
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FLAKERATE_VERDICTEXAMPLE'].fields_by_name['invocations']._loaded_options = None
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FLAKERATE_VERDICTEXAMPLE'].fields_by_name['invocations']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTVARIANTFAILURERATEREQUEST']._serialized_start=221
+  _globals['_QUERYTESTVARIANTFAILURERATEREQUEST']._serialized_end=461
+  _globals['_QUERYTESTVARIANTFAILURERATEREQUEST_TESTVARIANT']._serialized_start=365
+  _globals['_QUERYTESTVARIANTFAILURERATEREQUEST_TESTVARIANT']._serialized_end=461
+  _globals['_QUERYTESTVARIANTFAILURERATERESPONSE']._serialized_start=464
+  _globals['_QUERYTESTVARIANTFAILURERATERESPONSE']._serialized_end=785
+  _globals['_QUERYTESTVARIANTFAILURERATERESPONSE_INTERVAL']._serialized_start=659
+  _globals['_QUERYTESTVARIANTFAILURERATERESPONSE_INTERVAL']._serialized_end=785
+  _globals['_TESTVARIANTFAILURERATEANALYSIS']._serialized_start=788
+  _globals['_TESTVARIANTFAILURERATEANALYSIS']._serialized_end=1667
+  _globals['_TESTVARIANTFAILURERATEANALYSIS_INTERVALSTATS']._serialized_start=1184
+  _globals['_TESTVARIANTFAILURERATEANALYSIS_INTERVALSTATS']._serialized_end=1331
+  _globals['_TESTVARIANTFAILURERATEANALYSIS_VERDICTEXAMPLE']._serialized_start=1334
+  _globals['_TESTVARIANTFAILURERATEANALYSIS_VERDICTEXAMPLE']._serialized_end=1485
+  _globals['_TESTVARIANTFAILURERATEANALYSIS_RECENTVERDICT']._serialized_start=1488
+  _globals['_TESTVARIANTFAILURERATEANALYSIS_RECENTVERDICT']._serialized_end=1667
+  _globals['_QUERYTESTVARIANTSTABILITYREQUEST']._serialized_start=1670
+  _globals['_QUERYTESTVARIANTSTABILITYREQUEST']._serialized_end=1967
+  _globals['_QUERYTESTVARIANTSTABILITYREQUEST_TESTVARIANTPOSITION']._serialized_start=1819
+  _globals['_QUERYTESTVARIANTSTABILITYREQUEST_TESTVARIANTPOSITION']._serialized_end=1967
+  _globals['_QUERYTESTVARIANTSTABILITYRESPONSE']._serialized_start=1970
+  _globals['_QUERYTESTVARIANTSTABILITYRESPONSE']._serialized_end=2135
+  _globals['_TESTSTABILITYCRITERIA']._serialized_start=2138
+  _globals['_TESTSTABILITYCRITERIA']._serialized_end=2537
+  _globals['_TESTSTABILITYCRITERIA_FAILURERATECRITERIA']._serialized_start=2325
+  _globals['_TESTSTABILITYCRITERIA_FAILURERATECRITERIA']._serialized_end=2412
+  _globals['_TESTSTABILITYCRITERIA_FLAKERATECRITERIA']._serialized_start=2414
+  _globals['_TESTSTABILITYCRITERIA_FLAKERATECRITERIA']._serialized_end=2537
+  _globals['_TESTVARIANTSTABILITYANALYSIS']._serialized_start=2540
+  _globals['_TESTVARIANTSTABILITYANALYSIS']._serialized_end=3681
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FAILURERATE']._serialized_start=2816
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FAILURERATE']._serialized_end=3199
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FAILURERATE_RECENTVERDICT']._serialized_start=3019
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FAILURERATE_RECENTVERDICT']._serialized_end=3199
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FLAKERATE']._serialized_start=3202
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FLAKERATE']._serialized_end=3681
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FLAKERATE_VERDICTEXAMPLE']._serialized_start=3545
+  _globals['_TESTVARIANTSTABILITYANALYSIS_FLAKERATE_VERDICTEXAMPLE']._serialized_end=3681
+  _globals['_TESTVARIANTS']._serialized_start=3684
+  _globals['_TESTVARIANTS']._serialized_end=3955
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,220 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class QueryTestVariantFailureRateRequest(_message.Message):
+    __slots__ = ("project", "test_variants")
+    class TestVariant(_message.Message):
+        __slots__ = ("test_id", "variant", "variant_hash")
+        TEST_ID_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+        test_id: str
+        variant: _common_pb2.Variant
+        variant_hash: str
+        def __init__(self, test_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., variant_hash: _Optional[str] = ...) -> None: ...
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_variants: _containers.RepeatedCompositeFieldContainer[QueryTestVariantFailureRateRequest.TestVariant]
+    def __init__(self, project: _Optional[str] = ..., test_variants: _Optional[_Iterable[_Union[QueryTestVariantFailureRateRequest.TestVariant, _Mapping]]] = ...) -> None: ...
+
+class QueryTestVariantFailureRateResponse(_message.Message):
+    __slots__ = ("intervals", "test_variants")
+    class Interval(_message.Message):
+        __slots__ = ("interval_age", "start_time", "end_time")
+        INTERVAL_AGE_FIELD_NUMBER: _ClassVar[int]
+        START_TIME_FIELD_NUMBER: _ClassVar[int]
+        END_TIME_FIELD_NUMBER: _ClassVar[int]
+        interval_age: int
+        start_time: _timestamp_pb2.Timestamp
+        end_time: _timestamp_pb2.Timestamp
+        def __init__(self, interval_age: _Optional[int] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+    INTERVALS_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    intervals: _containers.RepeatedCompositeFieldContainer[QueryTestVariantFailureRateResponse.Interval]
+    test_variants: _containers.RepeatedCompositeFieldContainer[TestVariantFailureRateAnalysis]
+    def __init__(self, intervals: _Optional[_Iterable[_Union[QueryTestVariantFailureRateResponse.Interval, _Mapping]]] = ..., test_variants: _Optional[_Iterable[_Union[TestVariantFailureRateAnalysis, _Mapping]]] = ...) -> None: ...
+
+class TestVariantFailureRateAnalysis(_message.Message):
+    __slots__ = ("test_id", "variant", "variant_hash", "interval_stats", "run_flaky_verdict_examples", "recent_verdicts")
+    class IntervalStats(_message.Message):
+        __slots__ = ("interval_age", "total_run_expected_verdicts", "total_run_flaky_verdicts", "total_run_unexpected_verdicts")
+        INTERVAL_AGE_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_RUN_EXPECTED_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_RUN_FLAKY_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_RUN_UNEXPECTED_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        interval_age: int
+        total_run_expected_verdicts: int
+        total_run_flaky_verdicts: int
+        total_run_unexpected_verdicts: int
+        def __init__(self, interval_age: _Optional[int] = ..., total_run_expected_verdicts: _Optional[int] = ..., total_run_flaky_verdicts: _Optional[int] = ..., total_run_unexpected_verdicts: _Optional[int] = ...) -> None: ...
+    class VerdictExample(_message.Message):
+        __slots__ = ("partition_time", "ingested_invocation_id", "changelists")
+        PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+        INGESTED_INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+        CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+        partition_time: _timestamp_pb2.Timestamp
+        ingested_invocation_id: str
+        changelists: _containers.RepeatedCompositeFieldContainer[_sources_pb2.Changelist]
+        def __init__(self, partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., ingested_invocation_id: _Optional[str] = ..., changelists: _Optional[_Iterable[_Union[_sources_pb2.Changelist, _Mapping]]] = ...) -> None: ...
+    class RecentVerdict(_message.Message):
+        __slots__ = ("partition_time", "ingested_invocation_id", "changelists", "has_unexpected_runs")
+        PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+        INGESTED_INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+        CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+        HAS_UNEXPECTED_RUNS_FIELD_NUMBER: _ClassVar[int]
+        partition_time: _timestamp_pb2.Timestamp
+        ingested_invocation_id: str
+        changelists: _containers.RepeatedCompositeFieldContainer[_sources_pb2.Changelist]
+        has_unexpected_runs: bool
+        def __init__(self, partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., ingested_invocation_id: _Optional[str] = ..., changelists: _Optional[_Iterable[_Union[_sources_pb2.Changelist, _Mapping]]] = ..., has_unexpected_runs: bool = ...) -> None: ...
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    INTERVAL_STATS_FIELD_NUMBER: _ClassVar[int]
+    RUN_FLAKY_VERDICT_EXAMPLES_FIELD_NUMBER: _ClassVar[int]
+    RECENT_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant: _common_pb2.Variant
+    variant_hash: str
+    interval_stats: _containers.RepeatedCompositeFieldContainer[TestVariantFailureRateAnalysis.IntervalStats]
+    run_flaky_verdict_examples: _containers.RepeatedCompositeFieldContainer[TestVariantFailureRateAnalysis.VerdictExample]
+    recent_verdicts: _containers.RepeatedCompositeFieldContainer[TestVariantFailureRateAnalysis.RecentVerdict]
+    def __init__(self, test_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., variant_hash: _Optional[str] = ..., interval_stats: _Optional[_Iterable[_Union[TestVariantFailureRateAnalysis.IntervalStats, _Mapping]]] = ..., run_flaky_verdict_examples: _Optional[_Iterable[_Union[TestVariantFailureRateAnalysis.VerdictExample, _Mapping]]] = ..., recent_verdicts: _Optional[_Iterable[_Union[TestVariantFailureRateAnalysis.RecentVerdict, _Mapping]]] = ...) -> None: ...
+
+class QueryTestVariantStabilityRequest(_message.Message):
+    __slots__ = ("project", "test_variants")
+    class TestVariantPosition(_message.Message):
+        __slots__ = ("test_id", "variant", "variant_hash", "sources")
+        TEST_ID_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+        SOURCES_FIELD_NUMBER: _ClassVar[int]
+        test_id: str
+        variant: _common_pb2.Variant
+        variant_hash: str
+        sources: _sources_pb2.Sources
+        def __init__(self, test_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., variant_hash: _Optional[str] = ..., sources: _Optional[_Union[_sources_pb2.Sources, _Mapping]] = ...) -> None: ...
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    test_variants: _containers.RepeatedCompositeFieldContainer[QueryTestVariantStabilityRequest.TestVariantPosition]
+    def __init__(self, project: _Optional[str] = ..., test_variants: _Optional[_Iterable[_Union[QueryTestVariantStabilityRequest.TestVariantPosition, _Mapping]]] = ...) -> None: ...
+
+class QueryTestVariantStabilityResponse(_message.Message):
+    __slots__ = ("test_variants", "criteria")
+    TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    CRITERIA_FIELD_NUMBER: _ClassVar[int]
+    test_variants: _containers.RepeatedCompositeFieldContainer[TestVariantStabilityAnalysis]
+    criteria: TestStabilityCriteria
+    def __init__(self, test_variants: _Optional[_Iterable[_Union[TestVariantStabilityAnalysis, _Mapping]]] = ..., criteria: _Optional[_Union[TestStabilityCriteria, _Mapping]] = ...) -> None: ...
+
+class TestStabilityCriteria(_message.Message):
+    __slots__ = ("failure_rate", "flake_rate")
+    class FailureRateCriteria(_message.Message):
+        __slots__ = ("failure_threshold", "consecutive_failure_threshold")
+        FAILURE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        CONSECUTIVE_FAILURE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        failure_threshold: int
+        consecutive_failure_threshold: int
+        def __init__(self, failure_threshold: _Optional[int] = ..., consecutive_failure_threshold: _Optional[int] = ...) -> None: ...
+    class FlakeRateCriteria(_message.Message):
+        __slots__ = ("min_window", "flake_threshold", "flake_rate_threshold", "flake_threshold_1wd")
+        MIN_WINDOW_FIELD_NUMBER: _ClassVar[int]
+        FLAKE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        FLAKE_RATE_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+        FLAKE_THRESHOLD_1WD_FIELD_NUMBER: _ClassVar[int]
+        min_window: int
+        flake_threshold: int
+        flake_rate_threshold: float
+        flake_threshold_1wd: int
+        def __init__(self, min_window: _Optional[int] = ..., flake_threshold: _Optional[int] = ..., flake_rate_threshold: _Optional[float] = ..., flake_threshold_1wd: _Optional[int] = ...) -> None: ...
+    FAILURE_RATE_FIELD_NUMBER: _ClassVar[int]
+    FLAKE_RATE_FIELD_NUMBER: _ClassVar[int]
+    failure_rate: TestStabilityCriteria.FailureRateCriteria
+    flake_rate: TestStabilityCriteria.FlakeRateCriteria
+    def __init__(self, failure_rate: _Optional[_Union[TestStabilityCriteria.FailureRateCriteria, _Mapping]] = ..., flake_rate: _Optional[_Union[TestStabilityCriteria.FlakeRateCriteria, _Mapping]] = ...) -> None: ...
+
+class TestVariantStabilityAnalysis(_message.Message):
+    __slots__ = ("test_id", "variant", "variant_hash", "failure_rate", "flake_rate")
+    class FailureRate(_message.Message):
+        __slots__ = ("is_met", "unexpected_test_runs", "consecutive_unexpected_test_runs", "recent_verdicts")
+        class RecentVerdict(_message.Message):
+            __slots__ = ("position", "changelists", "root_invocations", "invocations", "unexpected_runs", "total_runs")
+            POSITION_FIELD_NUMBER: _ClassVar[int]
+            CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+            ROOT_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+            INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+            UNEXPECTED_RUNS_FIELD_NUMBER: _ClassVar[int]
+            TOTAL_RUNS_FIELD_NUMBER: _ClassVar[int]
+            position: int
+            changelists: _containers.RepeatedCompositeFieldContainer[_sources_pb2.Changelist]
+            root_invocations: _containers.RepeatedScalarFieldContainer[str]
+            invocations: _containers.RepeatedScalarFieldContainer[str]
+            unexpected_runs: int
+            total_runs: int
+            def __init__(self, position: _Optional[int] = ..., changelists: _Optional[_Iterable[_Union[_sources_pb2.Changelist, _Mapping]]] = ..., root_invocations: _Optional[_Iterable[str]] = ..., invocations: _Optional[_Iterable[str]] = ..., unexpected_runs: _Optional[int] = ..., total_runs: _Optional[int] = ...) -> None: ...
+        IS_MET_FIELD_NUMBER: _ClassVar[int]
+        UNEXPECTED_TEST_RUNS_FIELD_NUMBER: _ClassVar[int]
+        CONSECUTIVE_UNEXPECTED_TEST_RUNS_FIELD_NUMBER: _ClassVar[int]
+        RECENT_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        is_met: bool
+        unexpected_test_runs: int
+        consecutive_unexpected_test_runs: int
+        recent_verdicts: _containers.RepeatedCompositeFieldContainer[TestVariantStabilityAnalysis.FailureRate.RecentVerdict]
+        def __init__(self, is_met: bool = ..., unexpected_test_runs: _Optional[int] = ..., consecutive_unexpected_test_runs: _Optional[int] = ..., recent_verdicts: _Optional[_Iterable[_Union[TestVariantStabilityAnalysis.FailureRate.RecentVerdict, _Mapping]]] = ...) -> None: ...
+    class FlakeRate(_message.Message):
+        __slots__ = ("is_met", "run_flaky_verdicts", "total_verdicts", "flake_examples", "start_position", "end_position", "run_flaky_verdicts_1wd", "start_position_1wd", "end_position_1wd", "run_flaky_verdicts_12h")
+        class VerdictExample(_message.Message):
+            __slots__ = ("position", "changelists", "root_invocations", "invocations")
+            POSITION_FIELD_NUMBER: _ClassVar[int]
+            CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+            ROOT_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+            INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+            position: int
+            changelists: _containers.RepeatedCompositeFieldContainer[_sources_pb2.Changelist]
+            root_invocations: _containers.RepeatedScalarFieldContainer[str]
+            invocations: _containers.RepeatedScalarFieldContainer[str]
+            def __init__(self, position: _Optional[int] = ..., changelists: _Optional[_Iterable[_Union[_sources_pb2.Changelist, _Mapping]]] = ..., root_invocations: _Optional[_Iterable[str]] = ..., invocations: _Optional[_Iterable[str]] = ...) -> None: ...
+        IS_MET_FIELD_NUMBER: _ClassVar[int]
+        RUN_FLAKY_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        TOTAL_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+        FLAKE_EXAMPLES_FIELD_NUMBER: _ClassVar[int]
+        START_POSITION_FIELD_NUMBER: _ClassVar[int]
+        END_POSITION_FIELD_NUMBER: _ClassVar[int]
+        RUN_FLAKY_VERDICTS_1WD_FIELD_NUMBER: _ClassVar[int]
+        START_POSITION_1WD_FIELD_NUMBER: _ClassVar[int]
+        END_POSITION_1WD_FIELD_NUMBER: _ClassVar[int]
+        RUN_FLAKY_VERDICTS_12H_FIELD_NUMBER: _ClassVar[int]
+        is_met: bool
+        run_flaky_verdicts: int
+        total_verdicts: int
+        flake_examples: _containers.RepeatedCompositeFieldContainer[TestVariantStabilityAnalysis.FlakeRate.VerdictExample]
+        start_position: int
+        end_position: int
+        run_flaky_verdicts_1wd: int
+        start_position_1wd: int
+        end_position_1wd: int
+        run_flaky_verdicts_12h: int
+        def __init__(self, is_met: bool = ..., run_flaky_verdicts: _Optional[int] = ..., total_verdicts: _Optional[int] = ..., flake_examples: _Optional[_Iterable[_Union[TestVariantStabilityAnalysis.FlakeRate.VerdictExample, _Mapping]]] = ..., start_position: _Optional[int] = ..., end_position: _Optional[int] = ..., run_flaky_verdicts_1wd: _Optional[int] = ..., start_position_1wd: _Optional[int] = ..., end_position_1wd: _Optional[int] = ..., run_flaky_verdicts_12h: _Optional[int] = ...) -> None: ...
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    FAILURE_RATE_FIELD_NUMBER: _ClassVar[int]
+    FLAKE_RATE_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant: _common_pb2.Variant
+    variant_hash: str
+    failure_rate: TestVariantStabilityAnalysis.FailureRate
+    flake_rate: TestVariantStabilityAnalysis.FlakeRate
+    def __init__(self, test_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., variant_hash: _Optional[str] = ..., failure_rate: _Optional[_Union[TestVariantStabilityAnalysis.FailureRate, _Mapping]] = ..., flake_rate: _Optional[_Union[TestVariantStabilityAnalysis.FlakeRate, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/analysis/proto/v1/test_verdict.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/analysis/proto/v1/test_verdict.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as go_dot_chromium_dot_org_dot_luci_dot_analysis_dot_proto_dot_v1_dot_sources__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/analysis/proto/v1/test_verdict.proto\x12\x10luci.analysis.v1\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x34go.chromium.org/luci/analysis/proto/v1/sources.proto\"\xf2\x04\n\x0bTestVerdict\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x02 \x01(\t\x12\x15\n\rinvocation_id\x18\x03 \x01(\t\x12\x37\n\x06status\x18\x04 \x01(\x0e\x32#.luci.analysis.v1.TestVerdictStatusB\x02\x18\x01\x12\x37\n\tstatus_v2\x18\x08 \x01(\x0e\x32$.luci.analysis.v1.TestVerdict.Status\x12\x45\n\x0fstatus_override\x18\t \x01(\x0e\x32,.luci.analysis.v1.TestVerdict.StatusOverride\x12\x32\n\x0epartition_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x36\n\x13passed_avg_duration\x18\x06 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x31\n\x0b\x63hangelists\x18\x07 \x03(\x0b\x32\x1c.luci.analysis.v1.Changelist\"v\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\n\n\x06\x46\x41ILED\x10\n\x12\x15\n\x11\x45XECUTION_ERRORED\x10\x14\x12\r\n\tPRECLUDED\x10\x1e\x12\t\n\x05\x46LAKY\x10(\x12\x0b\n\x07SKIPPED\x10\x32\x12\n\n\x06PASSED\x10<\"U\n\x0eStatusOverride\x12\x1f\n\x1bSTATUS_OVERRIDE_UNSPECIFIED\x10\x00\x12\x12\n\x0eNOT_OVERRIDDEN\x10\x01\x12\x0e\n\nEXONERATED\x10\x02*j\n\x10TestResultStatus\x12\"\n\x1eTEST_RESULT_STATUS_UNSPECIFIED\x10\x00\x12\x08\n\x04PASS\x10\x01\x12\x08\n\x04\x46\x41IL\x10\x02\x12\t\n\x05\x43RASH\x10\x03\x12\t\n\x05\x41\x42ORT\x10\x04\x12\x08\n\x04SKIP\x10\x05*\x8b\x01\n\x11TestVerdictStatus\x12#\n\x1fTEST_VERDICT_STATUS_UNSPECIFIED\x10\x00\x12\x0e\n\nUNEXPECTED\x10\n\x12\x18\n\x14UNEXPECTEDLY_SKIPPED\x10\x14\x12\t\n\x05\x46LAKY\x10\x1e\x12\x0e\n\nEXONERATED\x10(\x12\x0c\n\x08\x45XPECTED\x10\x32\x42\x33Z1go.chromium.org/luci/analysis/proto/v1;analysispbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.analysis.proto.v1.test_verdict_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/analysis/proto/v1;analysispb'
+  _globals['_TESTVERDICT'].fields_by_name['status']._loaded_options = None
+  _globals['_TESTVERDICT'].fields_by_name['status']._serialized_options = b'\030\001'
+  _globals['_TESTRESULTSTATUS']._serialized_start=827
+  _globals['_TESTRESULTSTATUS']._serialized_end=933
+  _globals['_TESTVERDICTSTATUS']._serialized_start=936
+  _globals['_TESTVERDICTSTATUS']._serialized_end=1075
+  _globals['_TESTVERDICT']._serialized_start=199
+  _globals['_TESTVERDICT']._serialized_end=825
+  _globals['_TESTVERDICT_STATUS']._serialized_start=620
+  _globals['_TESTVERDICT_STATUS']._serialized_end=738
+  _globals['_TESTVERDICT_STATUSOVERRIDE']._serialized_start=740
+  _globals['_TESTVERDICT_STATUSOVERRIDE']._serialized_end=825
+# @@protoc_insertion_point(module_scope)
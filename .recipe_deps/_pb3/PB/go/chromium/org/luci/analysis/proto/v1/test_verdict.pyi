@@ -0,0 +1,89 @@
+import datetime
+
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.analysis.proto.v1 import sources as _sources_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestResultStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TEST_RESULT_STATUS_UNSPECIFIED: _ClassVar[TestResultStatus]
+    PASS: _ClassVar[TestResultStatus]
+    FAIL: _ClassVar[TestResultStatus]
+    CRASH: _ClassVar[TestResultStatus]
+    ABORT: _ClassVar[TestResultStatus]
+    SKIP: _ClassVar[TestResultStatus]
+
+class TestVerdictStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TEST_VERDICT_STATUS_UNSPECIFIED: _ClassVar[TestVerdictStatus]
+    UNEXPECTED: _ClassVar[TestVerdictStatus]
+    UNEXPECTEDLY_SKIPPED: _ClassVar[TestVerdictStatus]
+    FLAKY: _ClassVar[TestVerdictStatus]
+    EXONERATED: _ClassVar[TestVerdictStatus]
+    EXPECTED: _ClassVar[TestVerdictStatus]
+TEST_RESULT_STATUS_UNSPECIFIED: TestResultStatus
+PASS: TestResultStatus
+FAIL: TestResultStatus
+CRASH: TestResultStatus
+ABORT: TestResultStatus
+SKIP: TestResultStatus
+TEST_VERDICT_STATUS_UNSPECIFIED: TestVerdictStatus
+UNEXPECTED: TestVerdictStatus
+UNEXPECTEDLY_SKIPPED: TestVerdictStatus
+FLAKY: TestVerdictStatus
+EXONERATED: TestVerdictStatus
+EXPECTED: TestVerdictStatus
+
+class TestVerdict(_message.Message):
+    __slots__ = ("test_id", "variant_hash", "invocation_id", "status", "status_v2", "status_override", "partition_time", "passed_avg_duration", "changelists")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_UNSPECIFIED: _ClassVar[TestVerdict.Status]
+        FAILED: _ClassVar[TestVerdict.Status]
+        EXECUTION_ERRORED: _ClassVar[TestVerdict.Status]
+        PRECLUDED: _ClassVar[TestVerdict.Status]
+        FLAKY: _ClassVar[TestVerdict.Status]
+        SKIPPED: _ClassVar[TestVerdict.Status]
+        PASSED: _ClassVar[TestVerdict.Status]
+    STATUS_UNSPECIFIED: TestVerdict.Status
+    FAILED: TestVerdict.Status
+    EXECUTION_ERRORED: TestVerdict.Status
+    PRECLUDED: TestVerdict.Status
+    FLAKY: TestVerdict.Status
+    SKIPPED: TestVerdict.Status
+    PASSED: TestVerdict.Status
+    class StatusOverride(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_OVERRIDE_UNSPECIFIED: _ClassVar[TestVerdict.StatusOverride]
+        NOT_OVERRIDDEN: _ClassVar[TestVerdict.StatusOverride]
+        EXONERATED: _ClassVar[TestVerdict.StatusOverride]
+    STATUS_OVERRIDE_UNSPECIFIED: TestVerdict.StatusOverride
+    NOT_OVERRIDDEN: TestVerdict.StatusOverride
+    EXONERATED: TestVerdict.StatusOverride
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+    STATUS_OVERRIDE_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    PASSED_AVG_DURATION_FIELD_NUMBER: _ClassVar[int]
+    CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant_hash: str
+    invocation_id: str
+    status: TestVerdictStatus
+    status_v2: TestVerdict.Status
+    status_override: TestVerdict.StatusOverride
+    partition_time: _timestamp_pb2.Timestamp
+    passed_avg_duration: _duration_pb2.Duration
+    changelists: _containers.RepeatedCompositeFieldContainer[_sources_pb2.Changelist]
+    def __init__(self, test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., invocation_id: _Optional[str] = ..., status: _Optional[_Union[TestVerdictStatus, str]] = ..., status_v2: _Optional[_Union[TestVerdict.Status, str]] = ..., status_override: _Optional[_Union[TestVerdict.StatusOverride, str]] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., passed_avg_duration: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., changelists: _Optional[_Iterable[_Union[_sources_pb2.Changelist, _Mapping]]] = ...) -> None: ...
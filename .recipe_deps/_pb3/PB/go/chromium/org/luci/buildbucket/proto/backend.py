@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/backend.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/backend.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from PB.google.rpc import status as google_dot_rpc_dot_status__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import launcher as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_launcher__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import task as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_task__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n4go.chromium.org/luci/buildbucket/proto/backend.proto\x12\x0e\x62uildbucket.v2\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x17google/rpc/status.proto\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\x1a\x35go.chromium.org/luci/buildbucket/proto/launcher.proto\x1a\x31go.chromium.org/luci/buildbucket/proto/task.proto\"\x80\x07\n\x0eRunTaskRequest\x12\x0e\n\x06target\x18\x01 \x01(\t\x12\'\n\x1bregister_backend_task_token\x18\x02 \x01(\tB\x02\x18\x01\x12\r\n\x05realm\x18\x03 \x01(\t\x12=\n\x05\x61gent\x18\x04 \x01(\x0b\x32..buildbucket.v2.RunTaskRequest.AgentExecutable\x12\x12\n\nagent_args\x18\x05 \x03(\t\x12-\n\x07secrets\x18\x06 \x01(\x0b\x32\x1c.buildbucket.v2.BuildSecrets\x12\x18\n\x10\x62uildbucket_host\x18\x07 \x01(\t\x12\x10\n\x08\x62uild_id\x18\x08 \x01(\t\x12\x36\n\ndimensions\x18\t \x03(\x0b\x32\".buildbucket.v2.RequestedDimension\x12\x32\n\x0estart_deadline\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x34\n\x11\x65xecution_timeout\x18\x0b \x01(\x0b\x32\x19.google.protobuf.Duration\x12/\n\x0cgrace_period\x18\x0c \x01(\x0b\x32\x19.google.protobuf.Duration\x12*\n\x06\x63\x61\x63hes\x18\r \x03(\x0b\x32\x1a.buildbucket.v2.CacheEntry\x12/\n\x0e\x62\x61\x63kend_config\x18\x0e \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x13\n\x0b\x65xperiments\x18\x0f \x03(\t\x12\x12\n\nrequest_id\x18\x10 \x01(\t\x12\x14\n\x0cpubsub_topic\x18\x11 \x01(\t\x1a\x88\x02\n\x0f\x41gentExecutable\x12J\n\x06source\x18\x01 \x03(\x0b\x32:.buildbucket.v2.RunTaskRequest.AgentExecutable.SourceEntry\x1a>\n\x0b\x41gentSource\x12\x0e\n\x06sha256\x18\x01 \x01(\t\x12\x12\n\nsize_bytes\x18\x02 \x01(\x03\x12\x0b\n\x03url\x18\x03 \x01(\t\x1ai\n\x0bSourceEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12I\n\x05value\x18\x02 \x01(\x0b\x32:.buildbucket.v2.RunTaskRequest.AgentExecutable.AgentSource:\x02\x38\x01\"5\n\x0fRunTaskResponse\x12\"\n\x04task\x18\x01 \x01(\x0b\x32\x14.buildbucket.v2.Task\"=\n\x11\x46\x65tchTasksRequest\x12(\n\x08task_ids\x18\x01 \x03(\x0b\x32\x16.buildbucket.v2.TaskID\"\xb7\x01\n\x12\x46\x65tchTasksResponse\x12>\n\tresponses\x18\x01 \x03(\x0b\x32+.buildbucket.v2.FetchTasksResponse.Response\x1a\x61\n\x08Response\x12$\n\x04task\x18\x01 \x01(\x0b\x32\x14.buildbucket.v2.TaskH\x00\x12#\n\x05\x65rror\x18\x64 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\n\n\x08response\">\n\x12\x43\x61ncelTasksRequest\x12(\n\x08task_ids\x18\x01 \x03(\x0b\x32\x16.buildbucket.v2.TaskID\"\xde\x01\n\x13\x43\x61ncelTasksResponse\x12#\n\x05tasks\x18\x01 \x03(\x0b\x32\x14.buildbucket.v2.Task\x12?\n\tresponses\x18\x02 \x03(\x0b\x32,.buildbucket.v2.CancelTasksResponse.Response\x1a\x61\n\x08Response\x12$\n\x04task\x18\x01 \x01(\x0b\x32\x14.buildbucket.v2.TaskH\x00\x12#\n\x05\x65rror\x18\x64 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\n\n\x08response\"\xae\x01\n\x16ValidateConfigsRequest\x12\x45\n\x07\x63onfigs\x18\x01 \x03(\x0b\x32\x34.buildbucket.v2.ValidateConfigsRequest.ConfigContext\x1aM\n\rConfigContext\x12\x0e\n\x06target\x18\x01 \x01(\t\x12,\n\x0b\x63onfig_json\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\"\x92\x01\n\x17ValidateConfigsResponse\x12J\n\rconfig_errors\x18\x01 \x03(\x0b\x32\x33.buildbucket.v2.ValidateConfigsResponse.ErrorDetail\x1a+\n\x0b\x45rrorDetail\x12\r\n\x05index\x18\x01 \x01(\x05\x12\r\n\x05\x65rror\x18\x02 \x01(\t2\xf2\x02\n\x0bTaskBackend\x12L\n\x07RunTask\x12\x1e.buildbucket.v2.RunTaskRequest\x1a\x1f.buildbucket.v2.RunTaskResponse\"\x00\x12U\n\nFetchTasks\x12!.buildbucket.v2.FetchTasksRequest\x1a\".buildbucket.v2.FetchTasksResponse\"\x00\x12X\n\x0b\x43\x61ncelTasks\x12\".buildbucket.v2.CancelTasksRequest\x1a#.buildbucket.v2.CancelTasksResponse\"\x00\x12\x64\n\x0fValidateConfigs\x12&.buildbucket.v2.ValidateConfigsRequest\x1a\'.buildbucket.v2.ValidateConfigsResponse\"\x00\x32_\n\x0fTaskBackendLite\x12L\n\x07RunTask\x12\x1e.buildbucket.v2.RunTaskRequest\x1a\x1f.buildbucket.v2.RunTaskResponse\"\x00\x42\x36Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.backend_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE_SOURCEENTRY']._loaded_options = None
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE_SOURCEENTRY']._serialized_options = b'8\001'
+  _globals['_RUNTASKREQUEST'].fields_by_name['register_backend_task_token']._loaded_options = None
+  _globals['_RUNTASKREQUEST'].fields_by_name['register_backend_task_token']._serialized_options = b'\030\001'
+  _globals['_RUNTASKREQUEST']._serialized_start=352
+  _globals['_RUNTASKREQUEST']._serialized_end=1248
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE']._serialized_start=984
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE']._serialized_end=1248
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE_AGENTSOURCE']._serialized_start=1079
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE_AGENTSOURCE']._serialized_end=1141
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE_SOURCEENTRY']._serialized_start=1143
+  _globals['_RUNTASKREQUEST_AGENTEXECUTABLE_SOURCEENTRY']._serialized_end=1248
+  _globals['_RUNTASKRESPONSE']._serialized_start=1250
+  _globals['_RUNTASKRESPONSE']._serialized_end=1303
+  _globals['_FETCHTASKSREQUEST']._serialized_start=1305
+  _globals['_FETCHTASKSREQUEST']._serialized_end=1366
+  _globals['_FETCHTASKSRESPONSE']._serialized_start=1369
+  _globals['_FETCHTASKSRESPONSE']._serialized_end=1552
+  _globals['_FETCHTASKSRESPONSE_RESPONSE']._serialized_start=1455
+  _globals['_FETCHTASKSRESPONSE_RESPONSE']._serialized_end=1552
+  _globals['_CANCELTASKSREQUEST']._serialized_start=1554
+  _globals['_CANCELTASKSREQUEST']._serialized_end=1616
+  _globals['_CANCELTASKSRESPONSE']._serialized_start=1619
+  _globals['_CANCELTASKSRESPONSE']._serialized_end=1841
+  _globals['_CANCELTASKSRESPONSE_RESPONSE']._serialized_start=1455
+  _globals['_CANCELTASKSRESPONSE_RESPONSE']._serialized_end=1552
+  _globals['_VALIDATECONFIGSREQUEST']._serialized_start=1844
+  _globals['_VALIDATECONFIGSREQUEST']._serialized_end=2018
+  _globals['_VALIDATECONFIGSREQUEST_CONFIGCONTEXT']._serialized_start=1941
+  _globals['_VALIDATECONFIGSREQUEST_CONFIGCONTEXT']._serialized_end=2018
+  _globals['_VALIDATECONFIGSRESPONSE']._serialized_start=2021
+  _globals['_VALIDATECONFIGSRESPONSE']._serialized_end=2167
+  _globals['_VALIDATECONFIGSRESPONSE_ERRORDETAIL']._serialized_start=2124
+  _globals['_VALIDATECONFIGSRESPONSE_ERRORDETAIL']._serialized_end=2167
+  _globals['_TASKBACKEND']._serialized_start=2170
+  _globals['_TASKBACKEND']._serialized_end=2540
+  _globals['_TASKBACKENDLITE']._serialized_start=2542
+  _globals['_TASKBACKENDLITE']._serialized_end=2637
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/build.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/build.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import build_field_visibility as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_build__field__visibility__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_builder__common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import field_option as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_field__option__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import step as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_step__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import task as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_task__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_invocation__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2go.chromium.org/luci/buildbucket/proto/build.proto\x12\x0e\x62uildbucket.v2\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x43go.chromium.org/luci/buildbucket/proto/build_field_visibility.proto\x1a;go.chromium.org/luci/buildbucket/proto/builder_common.proto\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\x1a\x39go.chromium.org/luci/buildbucket/proto/field_option.proto\x1a\x31go.chromium.org/luci/buildbucket/proto/step.proto\x1a\x31go.chromium.org/luci/buildbucket/proto/task.proto\x1a\x37go.chromium.org/luci/resultdb/proto/v1/invocation.proto\"\xaa\x0f\n\x05\x42uild\x12\x15\n\x02id\x18\x01 \x01(\x03\x42\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x03\x12\x37\n\x07\x62uilder\x18\x02 \x01(\x0b\x32\x19.buildbucket.v2.BuilderIDB\x0b\x8a\xc3\x1a\x02\x08\x02\xb8\xce\xbc\x03\x02\x12=\n\x0c\x62uilder_info\x18\" \x01(\x0b\x32!.buildbucket.v2.Build.BuilderInfoB\x04\xe2\x41\x01\x03\x12\x19\n\x06number\x18\x03 \x01(\x05\x42\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x02\x12\x18\n\ncreated_by\x18\x04 \x01(\tB\x04\xe2\x41\x01\x03\x12\x10\n\x08view_url\x18\x05 \x01(\t\x12\x19\n\x0b\x63\x61nceled_by\x18\x17 \x01(\tB\x04\xe2\x41\x01\x03\x12:\n\x0b\x63reate_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x02\x12\x39\n\nstart_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x02\x12\x37\n\x08\x65nd_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x02\x12:\n\x0bupdate_time\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampB\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x02\x12:\n\x0b\x63\x61ncel_time\x18  \x01(\x0b\x32\x1a.google.protobuf.TimestampB\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x02\x12\x33\n\x06status\x18\x0c \x01(\x0e\x32\x16.buildbucket.v2.StatusB\x0b\x8a\xc3\x1a\x02\x08\x03\xb8\xce\xbc\x03\x03\x12 \n\x10summary_markdown\x18\x14 \x01(\tB\x06\x8a\xc3\x1a\x02\x08\x03\x12%\n\x15\x63\x61ncellation_markdown\x18! \x01(\tB\x06\x8a\xc3\x1a\x02\x08\x03\x12\x30\n\x08\x63ritical\x18\x15 \x01(\x0e\x32\x17.buildbucket.v2.TrinaryB\x05\xb8\xce\xbc\x03\x02\x12\x42\n\x0estatus_details\x18\x16 \x01(\x0b\x32\x1d.buildbucket.v2.StatusDetailsB\x0b\x8a\xc3\x1a\x02\x08\x03\xb8\xce\xbc\x03\x03\x12\x32\n\x05input\x18\x0f \x01(\x0b\x32\x1b.buildbucket.v2.Build.InputB\x06\x8a\xc3\x1a\x02\x08\x02\x12\x34\n\x06output\x18\x10 \x01(\x0b\x32\x1c.buildbucket.v2.Build.OutputB\x06\x8a\xc3\x1a\x02\x08\x03\x12+\n\x05steps\x18\x11 \x03(\x0b\x32\x14.buildbucket.v2.StepB\x06\x8a\xc3\x1a\x02\x08\x03\x12\x31\n\x05infra\x18\x12 \x01(\x0b\x32\x1a.buildbucket.v2.BuildInfraB\x06\x8a\xc3\x1a\x02\x08\x02\x12(\n\x04tags\x18\x13 \x03(\x0b\x32\x1a.buildbucket.v2.StringPair\x12/\n\x03\x65xe\x18\x18 \x01(\x0b\x32\x1a.buildbucket.v2.ExecutableB\x06\x8a\xc3\x1a\x02\x08\x02\x12\x0e\n\x06\x63\x61nary\x18\x19 \x01(\x08\x12\x35\n\x12scheduling_timeout\x18\x1a \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x34\n\x11\x65xecution_timeout\x18\x1b \x01(\x0b\x32\x19.google.protobuf.Duration\x12/\n\x0cgrace_period\x18\x1d \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x19\n\x11wait_for_capacity\x18\x1c \x01(\x08\x12!\n\x12\x63\x61n_outlive_parent\x18\x1e \x01(\x08\x42\x05\xb8\xce\xbc\x03\x03\x12\x1f\n\x0c\x61ncestor_ids\x18\x1f \x03(\x03\x42\t\xe2\x41\x01\x03\xb8\xce\xbc\x03\x03\x12*\n\tretriable\x18# \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x1a\xda\x01\n\x05Input\x12+\n\nproperties\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\x12<\n\x0egitiles_commit\x18\x02 \x01(\x0b\x32\x1d.buildbucket.v2.GitilesCommitB\x05\xb8\xce\xbc\x03\x02\x12;\n\x0egerrit_changes\x18\x03 \x03(\x0b\x32\x1c.buildbucket.v2.GerritChangeB\x05\xb8\xce\xbc\x03\x02\x12\x14\n\x0c\x65xperimental\x18\x05 \x01(\x08\x12\x13\n\x0b\x65xperiments\x18\x06 \x03(\t\x1a\xa8\x02\n\x06Output\x12+\n\nproperties\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x35\n\x0egitiles_commit\x18\x03 \x01(\x0b\x32\x1d.buildbucket.v2.GitilesCommit\x12!\n\x04logs\x18\x05 \x03(\x0b\x32\x13.buildbucket.v2.Log\x12&\n\x06status\x18\x06 \x01(\x0e\x32\x16.buildbucket.v2.Status\x12\x35\n\x0estatus_details\x18\x07 \x01(\x0b\x32\x1d.buildbucket.v2.StatusDetails\x12\x18\n\x0csummary_html\x18\x08 \x01(\tB\x02\x18\x01\x12\x18\n\x10summary_markdown\x18\x02 \x01(\tJ\x04\x08\x04\x10\x05\x1a\"\n\x0b\x42uilderInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\tJ\x04\x08\r\x10\x0eJ\x04\x08\x0e\x10\x0f\"\x98\x03\n\x0cInputDataRef\x12/\n\x03\x63\x61s\x18\x01 \x01(\x0b\x32 .buildbucket.v2.InputDataRef.CASH\x00\x12\x31\n\x04\x63ipd\x18\x02 \x01(\x0b\x32!.buildbucket.v2.InputDataRef.CIPDH\x00\x12\x0f\n\x07on_path\x18\x03 \x03(\t\x1a\x80\x01\n\x03\x43\x41S\x12\x14\n\x0c\x63\x61s_instance\x18\x01 \x01(\t\x12\x37\n\x06\x64igest\x18\x02 \x01(\x0b\x32\'.buildbucket.v2.InputDataRef.CAS.Digest\x1a*\n\x06\x44igest\x12\x0c\n\x04hash\x18\x01 \x01(\t\x12\x12\n\nsize_bytes\x18\x02 \x01(\x03\x1a}\n\x04\x43IPD\x12\x0e\n\x06server\x18\x01 \x01(\t\x12\x38\n\x05specs\x18\x02 \x03(\x0b\x32).buildbucket.v2.InputDataRef.CIPD.PkgSpec\x1a+\n\x07PkgSpec\x12\x0f\n\x07package\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\tB\x0b\n\tdata_typeJ\x04\x08\x04\x10\x05\"\xa3\x04\n\x0fResolvedDataRef\x12\x32\n\x03\x63\x61s\x18\x01 \x01(\x0b\x32#.buildbucket.v2.ResolvedDataRef.CASH\x00\x12\x34\n\x04\x63ipd\x18\x02 \x01(\x0b\x32$.buildbucket.v2.ResolvedDataRef.CIPDH\x00\x1ap\n\x06Timing\x12\x31\n\x0e\x66\x65tch_duration\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x33\n\x10install_duration\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration\x1a=\n\x03\x43\x41S\x12\x36\n\x06timing\x18\x01 \x01(\x0b\x32&.buildbucket.v2.ResolvedDataRef.Timing\x1a\xe7\x01\n\x04\x43IPD\x12;\n\x05specs\x18\x02 \x03(\x0b\x32,.buildbucket.v2.ResolvedDataRef.CIPD.PkgSpec\x1a\xa1\x01\n\x07PkgSpec\x12\x0f\n\x07skipped\x18\x01 \x01(\x08\x12\x0f\n\x07package\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x12+\n\nwas_cached\x18\x04 \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12\x36\n\x06timing\x18\x05 \x01(\x0b\x32&.buildbucket.v2.ResolvedDataRef.TimingB\x0b\n\tdata_type\"\x93#\n\nBuildInfra\x12\x43\n\x0b\x62uildbucket\x18\x01 \x01(\x0b\x32&.buildbucket.v2.BuildInfra.BuildbucketB\x06\x8a\xc3\x1a\x02\x08\x02\x12\x35\n\x08swarming\x18\x02 \x01(\x0b\x32#.buildbucket.v2.BuildInfra.Swarming\x12\x39\n\x06logdog\x18\x03 \x01(\x0b\x32!.buildbucket.v2.BuildInfra.LogDogB\x06\x8a\xc3\x1a\x02\x08\x02\x12\x31\n\x06recipe\x18\x04 \x01(\x0b\x32!.buildbucket.v2.BuildInfra.Recipe\x12<\n\x08resultdb\x18\x05 \x01(\x0b\x32#.buildbucket.v2.BuildInfra.ResultDBB\x05\xb8\xce\xbc\x03\x02\x12\x33\n\x07\x62\x62\x61gent\x18\x06 \x01(\x0b\x32\".buildbucket.v2.BuildInfra.BBAgent\x12\x33\n\x07\x62\x61\x63kend\x18\x07 \x01(\x0b\x32\".buildbucket.v2.BuildInfra.Backend\x12+\n\x03led\x18\x08 \x01(\x0b\x32\x1e.buildbucket.v2.BuildInfra.Led\x12\x33\n\x07turboci\x18\t \x01(\x0b\x32\".buildbucket.v2.BuildInfra.TurboCI\x1a\xcb\x14\n\x0b\x42uildbucket\x12\x1f\n\x17service_config_revision\x18\x02 \x01(\t\x12\x35\n\x14requested_properties\x18\x05 \x01(\x0b\x32\x17.google.protobuf.Struct\x12@\n\x14requested_dimensions\x18\x06 \x03(\x0b\x32\".buildbucket.v2.RequestedDimension\x12\x10\n\x08hostname\x18\x07 \x01(\t\x12Y\n\x12\x65xperiment_reasons\x18\x08 \x03(\x0b\x32=.buildbucket.v2.BuildInfra.Buildbucket.ExperimentReasonsEntry\x12Y\n\x10\x61gent_executable\x18\t \x03(\x0b\x32;.buildbucket.v2.BuildInfra.Buildbucket.AgentExecutableEntryB\x02\x18\x01\x12\x43\n\x05\x61gent\x18\n \x01(\x0b\x32,.buildbucket.v2.BuildInfra.Buildbucket.AgentB\x06\x8a\xc3\x1a\x02\x08\x02\x12!\n\x19known_public_gerrit_hosts\x18\x0b \x03(\t\x12\x14\n\x0c\x62uild_number\x18\x0c \x01(\x08\x1a\x9d\r\n\x05\x41gent\x12I\n\x05input\x18\x01 \x01(\x0b\x32\x32.buildbucket.v2.BuildInfra.Buildbucket.Agent.InputB\x06\x8a\xc3\x1a\x02\x08\x02\x12K\n\x06output\x18\x02 \x01(\x0b\x32\x33.buildbucket.v2.BuildInfra.Buildbucket.Agent.OutputB\x06\x8a\xc3\x1a\x02\x08\x03\x12K\n\x06source\x18\x03 \x01(\x0b\x32\x33.buildbucket.v2.BuildInfra.Buildbucket.Agent.SourceB\x06\x8a\xc3\x1a\x02\x08\x02\x12L\n\x08purposes\x18\x04 \x03(\x0b\x32:.buildbucket.v2.BuildInfra.Buildbucket.Agent.PurposesEntry\x12\x35\n\x11\x63ipd_client_cache\x18\x05 \x01(\x0b\x32\x1a.buildbucket.v2.CacheEntry\x12\x37\n\x13\x63ipd_packages_cache\x18\x06 \x01(\x0b\x32\x1a.buildbucket.v2.CacheEntry\x1a\xc7\x02\n\x06Source\x12H\n\x04\x63ipd\x18\x01 \x01(\x0b\x32\x38.buildbucket.v2.BuildInfra.Buildbucket.Agent.Source.CIPDH\x00\x1a\xe5\x01\n\x04\x43IPD\x12\x0f\n\x07package\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x0e\n\x06server\x18\x03 \x01(\t\x12q\n\x12resolved_instances\x18\x04 \x03(\x0b\x32O.buildbucket.v2.BuildInfra.Buildbucket.Agent.Source.CIPD.ResolvedInstancesEntryB\x04\xe2\x41\x01\x03\x1a\x38\n\x16ResolvedInstancesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x0b\n\tdata_type\x1a\xc8\x02\n\x05Input\x12J\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32<.buildbucket.v2.BuildInfra.Buildbucket.Agent.Input.DataEntry\x12W\n\x0b\x63ipd_source\x18\x02 \x03(\x0b\x32\x42.buildbucket.v2.BuildInfra.Buildbucket.Agent.Input.CipdSourceEntry\x1aI\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.buildbucket.v2.InputDataRef:\x02\x38\x01\x1aO\n\x0f\x43ipdSourceEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.buildbucket.v2.InputDataRef:\x02\x38\x01\x1a\x9a\x03\n\x06Output\x12\\\n\rresolved_data\x18\x01 \x03(\x0b\x32\x45.buildbucket.v2.BuildInfra.Buildbucket.Agent.Output.ResolvedDataEntry\x12&\n\x06status\x18\x02 \x01(\x0e\x32\x16.buildbucket.v2.Status\x12\x35\n\x0estatus_details\x18\x03 \x01(\x0b\x32\x1d.buildbucket.v2.StatusDetails\x12\x18\n\x0csummary_html\x18\x04 \x01(\tB\x02\x18\x01\x12\x16\n\x0e\x61gent_platform\x18\x05 \x01(\t\x12\x31\n\x0etotal_duration\x18\x06 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x18\n\x10summary_markdown\x18\x07 \x01(\t\x1aT\n\x11ResolvedDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12.\n\x05value\x18\x02 \x01(\x0b\x32\x1f.buildbucket.v2.ResolvedDataRef:\x02\x38\x01\x1a\x65\n\rPurposesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0e\x32\x34.buildbucket.v2.BuildInfra.Buildbucket.Agent.Purpose:\x02\x38\x01\"X\n\x07Purpose\x12\x17\n\x13PURPOSE_UNSPECIFIED\x10\x00\x12\x17\n\x13PURPOSE_EXE_PAYLOAD\x10\x01\x12\x1b\n\x17PURPOSE_BBAGENT_UTILITY\x10\x02\x1aq\n\x16\x45xperimentReasonsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x46\n\x05value\x18\x02 \x01(\x0e\x32\x37.buildbucket.v2.BuildInfra.Buildbucket.ExperimentReason:\x02\x38\x01\x1aW\n\x14\x41gentExecutableEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12.\n\x05value\x18\x02 \x01(\x0b\x32\x1f.buildbucket.v2.ResolvedDataRef:\x02\x38\x01\"\xe9\x01\n\x10\x45xperimentReason\x12\x1b\n\x17\x45XPERIMENT_REASON_UNSET\x10\x00\x12$\n EXPERIMENT_REASON_GLOBAL_DEFAULT\x10\x01\x12$\n EXPERIMENT_REASON_BUILDER_CONFIG\x10\x02\x12$\n EXPERIMENT_REASON_GLOBAL_MINIMUM\x10\x03\x12\x1f\n\x1b\x45XPERIMENT_REASON_REQUESTED\x10\x04\x12%\n!EXPERIMENT_REASON_GLOBAL_INACTIVE\x10\x05J\x04\x08\x04\x10\x05\x1a\xa6\x03\n\x08Swarming\x12\x18\n\x08hostname\x18\x01 \x01(\tB\x06\x8a\xc3\x1a\x02\x08\x02\x12\x15\n\x07task_id\x18\x02 \x01(\tB\x04\xe2\x41\x01\x03\x12\x15\n\rparent_run_id\x18\t \x01(\t\x12\x1c\n\x14task_service_account\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12;\n\x0ftask_dimensions\x18\x05 \x03(\x0b\x32\".buildbucket.v2.RequestedDimension\x12\x32\n\x0e\x62ot_dimensions\x18\x06 \x03(\x0b\x32\x1a.buildbucket.v2.StringPair\x12>\n\x06\x63\x61\x63hes\x18\x07 \x03(\x0b\x32..buildbucket.v2.BuildInfra.Swarming.CacheEntry\x1aq\n\nCacheEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x36\n\x13wait_for_warm_cache\x18\x03 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x0f\n\x07\x65nv_var\x18\x04 \x01(\t\x1a\x43\n\x06LogDog\x12\x18\n\x08hostname\x18\x01 \x01(\tB\x06\x8a\xc3\x1a\x02\x08\x02\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0e\n\x06prefix\x18\x03 \x01(\t\x1a,\n\x06Recipe\x12\x14\n\x0c\x63ipd_package\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x1a\xbf\x01\n\x08ResultDB\x12\x18\n\x08hostname\x18\x01 \x01(\tB\x06\x8a\xc3\x1a\x02\x08\x02\x12\x18\n\ninvocation\x18\x02 \x01(\tB\x04\xe2\x41\x01\x03\x12\x0e\n\x06\x65nable\x18\x03 \x01(\x08\x12\x34\n\nbq_exports\x18\x04 \x03(\x0b\x32 .luci.resultdb.v1.BigQueryExport\x12\x39\n\x0fhistory_options\x18\x05 \x01(\x0b\x32 .luci.resultdb.v1.HistoryOptions\x1a\x1e\n\x03Led\x12\x17\n\x0fshadowed_bucket\x18\x01 \x01(\t\x1a\xb9\x02\n\x07\x42\x42\x41gent\x12\x14\n\x0cpayload_path\x18\x01 \x01(\t\x12\x11\n\tcache_dir\x18\x02 \x01(\t\x12%\n\x19known_public_gerrit_hosts\x18\x03 \x03(\tB\x02\x18\x01\x12;\n\x05input\x18\x04 \x01(\x0b\x32(.buildbucket.v2.BuildInfra.BBAgent.InputB\x02\x18\x01\x1a\xa0\x01\n\x05Input\x12K\n\rcipd_packages\x18\x01 \x03(\x0b\x32\x34.buildbucket.v2.BuildInfra.BBAgent.Input.CIPDPackage\x1aJ\n\x0b\x43IPDPackage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x0e\n\x06server\x18\x03 \x01(\t\x12\x0c\n\x04path\x18\x04 \x01(\t\x1a\xd1\x01\n\x07\x42\x61\x63kend\x12\'\n\x06\x63onfig\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\"\n\x04task\x18\x02 \x01(\x0b\x32\x14.buildbucket.v2.Task\x12*\n\x06\x63\x61\x63hes\x18\x03 \x03(\x0b\x32\x1a.buildbucket.v2.CacheEntry\x12;\n\x0ftask_dimensions\x18\x05 \x03(\x0b\x32\".buildbucket.v2.RequestedDimension\x12\x10\n\x08hostname\x18\x06 \x01(\t\x1a\x35\n\x07TurboCI\x12\x10\n\x08hostname\x18\x01 \x01(\t\x12\x18\n\x10stage_attempt_id\x18\x02 \x01(\tB6Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.build_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_BUILD_INPUT'].fields_by_name['gitiles_commit']._loaded_options = None
+  _globals['_BUILD_INPUT'].fields_by_name['gitiles_commit']._serialized_options = b'\270\316\274\003\002'
+  _globals['_BUILD_INPUT'].fields_by_name['gerrit_changes']._loaded_options = None
+  _globals['_BUILD_INPUT'].fields_by_name['gerrit_changes']._serialized_options = b'\270\316\274\003\002'
+  _globals['_BUILD_OUTPUT'].fields_by_name['summary_html']._loaded_options = None
+  _globals['_BUILD_OUTPUT'].fields_by_name['summary_html']._serialized_options = b'\030\001'
+  _globals['_BUILD'].fields_by_name['id']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['id']._serialized_options = b'\342A\001\003\270\316\274\003\003'
+  _globals['_BUILD'].fields_by_name['builder']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['builder']._serialized_options = b'\212\303\032\002\010\002\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['builder_info']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['builder_info']._serialized_options = b'\342A\001\003'
+  _globals['_BUILD'].fields_by_name['number']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['number']._serialized_options = b'\342A\001\003\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['created_by']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['created_by']._serialized_options = b'\342A\001\003'
+  _globals['_BUILD'].fields_by_name['canceled_by']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['canceled_by']._serialized_options = b'\342A\001\003'
+  _globals['_BUILD'].fields_by_name['create_time']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['create_time']._serialized_options = b'\342A\001\003\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['start_time']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['start_time']._serialized_options = b'\342A\001\003\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['end_time']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['end_time']._serialized_options = b'\342A\001\003\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['update_time']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['update_time']._serialized_options = b'\342A\001\003\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['cancel_time']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['cancel_time']._serialized_options = b'\342A\001\003\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['status']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['status']._serialized_options = b'\212\303\032\002\010\003\270\316\274\003\003'
+  _globals['_BUILD'].fields_by_name['summary_markdown']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['summary_markdown']._serialized_options = b'\212\303\032\002\010\003'
+  _globals['_BUILD'].fields_by_name['cancellation_markdown']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['cancellation_markdown']._serialized_options = b'\212\303\032\002\010\003'
+  _globals['_BUILD'].fields_by_name['critical']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['critical']._serialized_options = b'\270\316\274\003\002'
+  _globals['_BUILD'].fields_by_name['status_details']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['status_details']._serialized_options = b'\212\303\032\002\010\003\270\316\274\003\003'
+  _globals['_BUILD'].fields_by_name['input']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['input']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILD'].fields_by_name['output']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['output']._serialized_options = b'\212\303\032\002\010\003'
+  _globals['_BUILD'].fields_by_name['steps']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['steps']._serialized_options = b'\212\303\032\002\010\003'
+  _globals['_BUILD'].fields_by_name['infra']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['infra']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILD'].fields_by_name['exe']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['exe']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILD'].fields_by_name['can_outlive_parent']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['can_outlive_parent']._serialized_options = b'\270\316\274\003\003'
+  _globals['_BUILD'].fields_by_name['ancestor_ids']._loaded_options = None
+  _globals['_BUILD'].fields_by_name['ancestor_ids']._serialized_options = b'\342A\001\003\270\316\274\003\003'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD_RESOLVEDINSTANCESENTRY']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD_RESOLVEDINSTANCESENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD'].fields_by_name['resolved_instances']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD'].fields_by_name['resolved_instances']._serialized_options = b'\342A\001\003'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_DATAENTRY']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_DATAENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_CIPDSOURCEENTRY']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_CIPDSOURCEENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT_RESOLVEDDATAENTRY']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT_RESOLVEDDATAENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT'].fields_by_name['summary_html']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT'].fields_by_name['summary_html']._serialized_options = b'\030\001'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_PURPOSESENTRY']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_PURPOSESENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT'].fields_by_name['input']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT'].fields_by_name['input']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT'].fields_by_name['output']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT'].fields_by_name['output']._serialized_options = b'\212\303\032\002\010\003'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT'].fields_by_name['source']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT'].fields_by_name['source']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA_BUILDBUCKET_EXPERIMENTREASONSENTRY']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_EXPERIMENTREASONSENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENTEXECUTABLEENTRY']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENTEXECUTABLEENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDINFRA_BUILDBUCKET'].fields_by_name['agent_executable']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET'].fields_by_name['agent_executable']._serialized_options = b'\030\001'
+  _globals['_BUILDINFRA_BUILDBUCKET'].fields_by_name['agent']._loaded_options = None
+  _globals['_BUILDINFRA_BUILDBUCKET'].fields_by_name['agent']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA_SWARMING'].fields_by_name['hostname']._loaded_options = None
+  _globals['_BUILDINFRA_SWARMING'].fields_by_name['hostname']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA_SWARMING'].fields_by_name['task_id']._loaded_options = None
+  _globals['_BUILDINFRA_SWARMING'].fields_by_name['task_id']._serialized_options = b'\342A\001\003'
+  _globals['_BUILDINFRA_LOGDOG'].fields_by_name['hostname']._loaded_options = None
+  _globals['_BUILDINFRA_LOGDOG'].fields_by_name['hostname']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA_RESULTDB'].fields_by_name['hostname']._loaded_options = None
+  _globals['_BUILDINFRA_RESULTDB'].fields_by_name['hostname']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA_RESULTDB'].fields_by_name['invocation']._loaded_options = None
+  _globals['_BUILDINFRA_RESULTDB'].fields_by_name['invocation']._serialized_options = b'\342A\001\003'
+  _globals['_BUILDINFRA_BBAGENT'].fields_by_name['known_public_gerrit_hosts']._loaded_options = None
+  _globals['_BUILDINFRA_BBAGENT'].fields_by_name['known_public_gerrit_hosts']._serialized_options = b'\030\001'
+  _globals['_BUILDINFRA_BBAGENT'].fields_by_name['input']._loaded_options = None
+  _globals['_BUILDINFRA_BBAGENT'].fields_by_name['input']._serialized_options = b'\030\001'
+  _globals['_BUILDINFRA'].fields_by_name['buildbucket']._loaded_options = None
+  _globals['_BUILDINFRA'].fields_by_name['buildbucket']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA'].fields_by_name['logdog']._loaded_options = None
+  _globals['_BUILDINFRA'].fields_by_name['logdog']._serialized_options = b'\212\303\032\002\010\002'
+  _globals['_BUILDINFRA'].fields_by_name['resultdb']._loaded_options = None
+  _globals['_BUILDINFRA'].fields_by_name['resultdb']._serialized_options = b'\270\316\274\003\002'
+  _globals['_BUILD']._serialized_start=600
+  _globals['_BUILD']._serialized_end=2562
+  _globals['_BUILD_INPUT']._serialized_start=1997
+  _globals['_BUILD_INPUT']._serialized_end=2215
+  _globals['_BUILD_OUTPUT']._serialized_start=2218
+  _globals['_BUILD_OUTPUT']._serialized_end=2514
+  _globals['_BUILD_BUILDERINFO']._serialized_start=2516
+  _globals['_BUILD_BUILDERINFO']._serialized_end=2550
+  _globals['_INPUTDATAREF']._serialized_start=2565
+  _globals['_INPUTDATAREF']._serialized_end=2973
+  _globals['_INPUTDATAREF_CAS']._serialized_start=2699
+  _globals['_INPUTDATAREF_CAS']._serialized_end=2827
+  _globals['_INPUTDATAREF_CAS_DIGEST']._serialized_start=2785
+  _globals['_INPUTDATAREF_CAS_DIGEST']._serialized_end=2827
+  _globals['_INPUTDATAREF_CIPD']._serialized_start=2829
+  _globals['_INPUTDATAREF_CIPD']._serialized_end=2954
+  _globals['_INPUTDATAREF_CIPD_PKGSPEC']._serialized_start=2911
+  _globals['_INPUTDATAREF_CIPD_PKGSPEC']._serialized_end=2954
+  _globals['_RESOLVEDDATAREF']._serialized_start=2976
+  _globals['_RESOLVEDDATAREF']._serialized_end=3523
+  _globals['_RESOLVEDDATAREF_TIMING']._serialized_start=3101
+  _globals['_RESOLVEDDATAREF_TIMING']._serialized_end=3213
+  _globals['_RESOLVEDDATAREF_CAS']._serialized_start=3215
+  _globals['_RESOLVEDDATAREF_CAS']._serialized_end=3276
+  _globals['_RESOLVEDDATAREF_CIPD']._serialized_start=3279
+  _globals['_RESOLVEDDATAREF_CIPD']._serialized_end=3510
+  _globals['_RESOLVEDDATAREF_CIPD_PKGSPEC']._serialized_start=3349
+  _globals['_RESOLVEDDATAREF_CIPD_PKGSPEC']._serialized_end=3510
+  _globals['_BUILDINFRA']._serialized_start=3526
+  _globals['_BUILDINFRA']._serialized_end=8025
+  _globals['_BUILDINFRA_BUILDBUCKET']._serialized_start=4041
+  _globals['_BUILDINFRA_BUILDBUCKET']._serialized_end=6676
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT']._serialized_start=4537
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT']._serialized_end=6230
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE']._serialized_start=4966
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE']._serialized_end=5293
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD']._serialized_start=5051
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD']._serialized_end=5280
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD_RESOLVEDINSTANCESENTRY']._serialized_start=5224
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_SOURCE_CIPD_RESOLVEDINSTANCESENTRY']._serialized_end=5280
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT']._serialized_start=5296
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT']._serialized_end=5624
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_DATAENTRY']._serialized_start=5470
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_DATAENTRY']._serialized_end=5543
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_CIPDSOURCEENTRY']._serialized_start=5545
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_INPUT_CIPDSOURCEENTRY']._serialized_end=5624
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT']._serialized_start=5627
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT']._serialized_end=6037
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT_RESOLVEDDATAENTRY']._serialized_start=5953
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_OUTPUT_RESOLVEDDATAENTRY']._serialized_end=6037
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_PURPOSESENTRY']._serialized_start=6039
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_PURPOSESENTRY']._serialized_end=6140
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_PURPOSE']._serialized_start=6142
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENT_PURPOSE']._serialized_end=6230
+  _globals['_BUILDINFRA_BUILDBUCKET_EXPERIMENTREASONSENTRY']._serialized_start=6232
+  _globals['_BUILDINFRA_BUILDBUCKET_EXPERIMENTREASONSENTRY']._serialized_end=6345
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENTEXECUTABLEENTRY']._serialized_start=6347
+  _globals['_BUILDINFRA_BUILDBUCKET_AGENTEXECUTABLEENTRY']._serialized_end=6434
+  _globals['_BUILDINFRA_BUILDBUCKET_EXPERIMENTREASON']._serialized_start=6437
+  _globals['_BUILDINFRA_BUILDBUCKET_EXPERIMENTREASON']._serialized_end=6670
+  _globals['_BUILDINFRA_SWARMING']._serialized_start=6679
+  _globals['_BUILDINFRA_SWARMING']._serialized_end=7101
+  _globals['_BUILDINFRA_SWARMING_CACHEENTRY']._serialized_start=6988
+  _globals['_BUILDINFRA_SWARMING_CACHEENTRY']._serialized_end=7101
+  _globals['_BUILDINFRA_LOGDOG']._serialized_start=7103
+  _globals['_BUILDINFRA_LOGDOG']._serialized_end=7170
+  _globals['_BUILDINFRA_RECIPE']._serialized_start=7172
+  _globals['_BUILDINFRA_RECIPE']._serialized_end=7216
+  _globals['_BUILDINFRA_RESULTDB']._serialized_start=7219
+  _globals['_BUILDINFRA_RESULTDB']._serialized_end=7410
+  _globals['_BUILDINFRA_LED']._serialized_start=7412
+  _globals['_BUILDINFRA_LED']._serialized_end=7442
+  _globals['_BUILDINFRA_BBAGENT']._serialized_start=7445
+  _globals['_BUILDINFRA_BBAGENT']._serialized_end=7758
+  _globals['_BUILDINFRA_BBAGENT_INPUT']._serialized_start=7598
+  _globals['_BUILDINFRA_BBAGENT_INPUT']._serialized_end=7758
+  _globals['_BUILDINFRA_BBAGENT_INPUT_CIPDPACKAGE']._serialized_start=7684
+  _globals['_BUILDINFRA_BBAGENT_INPUT_CIPDPACKAGE']._serialized_end=7758
+  _globals['_BUILDINFRA_BACKEND']._serialized_start=7761
+  _globals['_BUILDINFRA_BACKEND']._serialized_end=7970
+  _globals['_BUILDINFRA_TURBOCI']._serialized_start=7972
+  _globals['_BUILDINFRA_TURBOCI']._serialized_end=8025
+# @@protoc_insertion_point(module_scope)
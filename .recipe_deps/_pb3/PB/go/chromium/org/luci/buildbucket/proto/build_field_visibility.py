@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/build_field_visibility.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/build_field_visibility.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nCgo.chromium.org/luci/buildbucket/proto/build_field_visibility.proto\x12\x0e\x62uildbucket.v2\x1a google/protobuf/descriptor.proto*\x92\x01\n\x14\x42uildFieldVisibility\x12 \n\x1c\x46IELD_VISIBILITY_UNSPECIFIED\x10\x00\x12\x19\n\x15\x42UILDS_GET_PERMISSION\x10\x01\x12!\n\x1d\x42UILDS_GET_LIMITED_PERMISSION\x10\x02\x12\x1a\n\x16\x42UILDS_LIST_PERMISSION\x10\x03:[\n\x0cvisible_with\x12\x1d.google.protobuf.FieldOptions\x18\xe7\xc9\x37 \x01(\x0e\x32$.buildbucket.v2.BuildFieldVisibilityB6Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.build_field_visibility_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_BUILDFIELDVISIBILITY']._serialized_start=122
+  _globals['_BUILDFIELDVISIBILITY']._serialized_end=268
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,19 @@
+from google.protobuf import descriptor_pb2 as _descriptor_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from typing import ClassVar as _ClassVar
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BuildFieldVisibility(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    FIELD_VISIBILITY_UNSPECIFIED: _ClassVar[BuildFieldVisibility]
+    BUILDS_GET_PERMISSION: _ClassVar[BuildFieldVisibility]
+    BUILDS_GET_LIMITED_PERMISSION: _ClassVar[BuildFieldVisibility]
+    BUILDS_LIST_PERMISSION: _ClassVar[BuildFieldVisibility]
+FIELD_VISIBILITY_UNSPECIFIED: BuildFieldVisibility
+BUILDS_GET_PERMISSION: BuildFieldVisibility
+BUILDS_GET_LIMITED_PERMISSION: BuildFieldVisibility
+BUILDS_LIST_PERMISSION: BuildFieldVisibility
+VISIBLE_WITH_FIELD_NUMBER: _ClassVar[int]
+visible_with: _descriptor.FieldDescriptor
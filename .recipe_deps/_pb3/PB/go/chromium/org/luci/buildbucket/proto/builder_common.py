@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/builder_common.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/builder_common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import field_option as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_field__option__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import project_config as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_project__config__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;go.chromium.org/luci/buildbucket/proto/builder_common.proto\x12\x0e\x62uildbucket.v2\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\x1a\x39go.chromium.org/luci/buildbucket/proto/field_option.proto\x1a;go.chromium.org/luci/buildbucket/proto/project_config.proto\"\x7f\n\tBuilderID\x12%\n\x07project\x18\x01 \x01(\tB\x14\x9a\xc3\x1a\x10SetBuilderHealth\x12$\n\x06\x62ucket\x18\x02 \x01(\tB\x14\x9a\xc3\x1a\x10SetBuilderHealth\x12%\n\x07\x62uilder\x18\x03 \x01(\tB\x14\x9a\xc3\x1a\x10SetBuilderHealth\"N\n\x0f\x42uilderMetadata\x12\r\n\x05owner\x18\x01 \x01(\t\x12,\n\x06health\x18\x02 \x01(\x0b\x32\x1c.buildbucket.v2.HealthStatus\"\x93\x01\n\x0b\x42uilderItem\x12%\n\x02id\x18\x01 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12*\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x1a.buildbucket.BuilderConfig\x12\x31\n\x08metadata\x18\x03 \x01(\x0b\x32\x1f.buildbucket.v2.BuilderMetadataB6Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.builder_common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_BUILDERID'].fields_by_name['project']._loaded_options = None
+  _globals['_BUILDERID'].fields_by_name['project']._serialized_options = b'\232\303\032\020SetBuilderHealth'
+  _globals['_BUILDERID'].fields_by_name['bucket']._loaded_options = None
+  _globals['_BUILDERID'].fields_by_name['bucket']._serialized_options = b'\232\303\032\020SetBuilderHealth'
+  _globals['_BUILDERID'].fields_by_name['builder']._loaded_options = None
+  _globals['_BUILDERID'].fields_by_name['builder']._serialized_options = b'\232\303\032\020SetBuilderHealth'
+  _globals['_BUILDERID']._serialized_start=252
+  _globals['_BUILDERID']._serialized_end=379
+  _globals['_BUILDERMETADATA']._serialized_start=381
+  _globals['_BUILDERMETADATA']._serialized_end=459
+  _globals['_BUILDERITEM']._serialized_start=462
+  _globals['_BUILDERITEM']._serialized_end=609
+# @@protoc_insertion_point(module_scope)
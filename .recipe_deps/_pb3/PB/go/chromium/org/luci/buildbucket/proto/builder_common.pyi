@@ -0,0 +1,37 @@
+from PB.go.chromium.org.luci.buildbucket.proto import common as _common_pb2
+from PB.go.chromium.org.luci.buildbucket.proto import field_option as _field_option_pb2
+from PB.go.chromium.org.luci.buildbucket.proto import project_config as _project_config_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BuilderID(_message.Message):
+    __slots__ = ("project", "bucket", "builder")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    BUCKET_FIELD_NUMBER: _ClassVar[int]
+    BUILDER_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    bucket: str
+    builder: str
+    def __init__(self, project: _Optional[str] = ..., bucket: _Optional[str] = ..., builder: _Optional[str] = ...) -> None: ...
+
+class BuilderMetadata(_message.Message):
+    __slots__ = ("owner", "health")
+    OWNER_FIELD_NUMBER: _ClassVar[int]
+    HEALTH_FIELD_NUMBER: _ClassVar[int]
+    owner: str
+    health: _common_pb2.HealthStatus
+    def __init__(self, owner: _Optional[str] = ..., health: _Optional[_Union[_common_pb2.HealthStatus, _Mapping]] = ...) -> None: ...
+
+class BuilderItem(_message.Message):
+    __slots__ = ("id", "config", "metadata")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    id: BuilderID
+    config: _project_config_pb2.BuilderConfig
+    metadata: BuilderMetadata
+    def __init__(self, id: _Optional[_Union[BuilderID, _Mapping]] = ..., config: _Optional[_Union[_project_config_pb2.BuilderConfig, _Mapping]] = ..., metadata: _Optional[_Union[BuilderMetadata, _Mapping]] = ...) -> None: ...
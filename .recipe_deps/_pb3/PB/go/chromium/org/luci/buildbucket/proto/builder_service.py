@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/builder_service.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/builder_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from PB.google.rpc import status as google_dot_rpc_dot_status__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_builder__common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<go.chromium.org/luci/buildbucket/proto/builder_service.proto\x12\x0e\x62uildbucket.v2\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x17google/rpc/status.proto\x1a;go.chromium.org/luci/buildbucket/proto/builder_common.proto\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\"e\n\x11GetBuilderRequest\x12%\n\x02id\x18\x01 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12)\n\x04mask\x18\x02 \x01(\x0b\x32\x1b.buildbucket.v2.BuilderMask\"]\n\x13ListBuildersRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0e\n\x06\x62ucket\x18\x02 \x01(\t\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"^\n\x14ListBuildersResponse\x12-\n\x08\x62uilders\x18\x01 \x03(\x0b\x32\x1b.buildbucket.v2.BuilderItem\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xd2\x01\n\x17SetBuilderHealthRequest\x12\x45\n\x06health\x18\x01 \x03(\x0b\x32\x35.buildbucket.v2.SetBuilderHealthRequest.BuilderHealth\x1ap\n\rBuilderHealth\x12+\n\x02id\x18\x01 \x01(\x0b\x32\x19.buildbucket.v2.BuilderIDB\x04\xe2\x41\x01\x02\x12\x32\n\x06health\x18\x02 \x01(\x0b\x32\x1c.buildbucket.v2.HealthStatusB\x04\xe2\x41\x01\x02\"\xc7\x01\n\x18SetBuilderHealthResponse\x12\x44\n\tresponses\x18\x01 \x03(\x0b\x32\x31.buildbucket.v2.SetBuilderHealthResponse.Response\x1a\x65\n\x08Response\x12(\n\x06result\x18\x01 \x01(\x0b\x32\x16.google.protobuf.EmptyH\x00\x12#\n\x05\x65rror\x18\x64 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\n\n\x08response\"\xab\x01\n\x0b\x42uilderMask\x12\x39\n\x04type\x18\x01 \x01(\x0e\x32+.buildbucket.v2.BuilderMask.BuilderMaskType\"a\n\x0f\x42uilderMaskType\x12!\n\x1d\x42UILDER_MASK_TYPE_UNSPECIFIED\x10\x00\x12\x0f\n\x0b\x43ONFIG_ONLY\x10\x01\x12\x07\n\x03\x41LL\x10\x02\x12\x11\n\rMETADATA_ONLY\x10\x03\x32\xa0\x02\n\x08\x42uilders\x12N\n\nGetBuilder\x12!.buildbucket.v2.GetBuilderRequest\x1a\x1b.buildbucket.v2.BuilderItem\"\x00\x12[\n\x0cListBuilders\x12#.buildbucket.v2.ListBuildersRequest\x1a$.buildbucket.v2.ListBuildersResponse\"\x00\x12g\n\x10SetBuilderHealth\x12\'.buildbucket.v2.SetBuilderHealthRequest\x1a(.buildbucket.v2.SetBuilderHealthResponse\"\x00\x42\x36Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.builder_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_SETBUILDERHEALTHREQUEST_BUILDERHEALTH'].fields_by_name['id']._loaded_options = None
+  _globals['_SETBUILDERHEALTHREQUEST_BUILDERHEALTH'].fields_by_name['id']._serialized_options = b'\342A\001\002'
+  _globals['_SETBUILDERHEALTHREQUEST_BUILDERHEALTH'].fields_by_name['health']._loaded_options = None
+  _globals['_SETBUILDERHEALTHREQUEST_BUILDERHEALTH'].fields_by_name['health']._serialized_options = b'\342A\001\002'
+  _globals['_GETBUILDERREQUEST']._serialized_start=281
+  _globals['_GETBUILDERREQUEST']._serialized_end=382
+  _globals['_LISTBUILDERSREQUEST']._serialized_start=384
+  _globals['_LISTBUILDERSREQUEST']._serialized_end=477
+  _globals['_LISTBUILDERSRESPONSE']._serialized_start=479
+  _globals['_LISTBUILDERSRESPONSE']._serialized_end=573
+  _globals['_SETBUILDERHEALTHREQUEST']._serialized_start=576
+  _globals['_SETBUILDERHEALTHREQUEST']._serialized_end=786
+  _globals['_SETBUILDERHEALTHREQUEST_BUILDERHEALTH']._serialized_start=674
+  _globals['_SETBUILDERHEALTHREQUEST_BUILDERHEALTH']._serialized_end=786
+  _globals['_SETBUILDERHEALTHRESPONSE']._serialized_start=789
+  _globals['_SETBUILDERHEALTHRESPONSE']._serialized_end=988
+  _globals['_SETBUILDERHEALTHRESPONSE_RESPONSE']._serialized_start=887
+  _globals['_SETBUILDERHEALTHRESPONSE_RESPONSE']._serialized_end=988
+  _globals['_BUILDERMASK']._serialized_start=991
+  _globals['_BUILDERMASK']._serialized_end=1162
+  _globals['_BUILDERMASK_BUILDERMASKTYPE']._serialized_start=1065
+  _globals['_BUILDERMASK_BUILDERMASKTYPE']._serialized_end=1162
+  _globals['_BUILDERS']._serialized_start=1165
+  _globals['_BUILDERS']._serialized_end=1453
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/builds_service.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/builds_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from PB.google.rpc import status as google_dot_rpc_dot_status__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import build as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_build__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_builder__common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import notification as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_notification__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import project_config as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_project__config__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import service_config as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_service__config__pb2
+from PB.go.chromium.org.luci.common.proto.structmask import structmask as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_structmask_dot_structmask__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;go.chromium.org/luci/buildbucket/proto/builds_service.proto\x12\x0e\x62uildbucket.v2\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1egoogle/protobuf/duration.proto\x1a google/protobuf/field_mask.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x17google/rpc/status.proto\x1a\x32go.chromium.org/luci/buildbucket/proto/build.proto\x1a;go.chromium.org/luci/buildbucket/proto/builder_common.proto\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\x1a\x39go.chromium.org/luci/buildbucket/proto/notification.proto\x1a;go.chromium.org/luci/buildbucket/proto/project_config.proto\x1a;go.chromium.org/luci/buildbucket/proto/service_config.proto\x1a=go.chromium.org/luci/common/proto/structmask/structmask.proto\"\xb8\x01\n\x0fGetBuildRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12*\n\x07\x62uilder\x18\x02 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12\x14\n\x0c\x62uild_number\x18\x03 \x01(\x05\x12.\n\x06\x66ields\x18\x64 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskB\x02\x18\x01\x12\'\n\x04mask\x18\x65 \x01(\x0b\x32\x19.buildbucket.v2.BuildMask\"\xc8\x01\n\x13SearchBuildsRequest\x12\x31\n\tpredicate\x18\x01 \x01(\x0b\x32\x1e.buildbucket.v2.BuildPredicate\x12.\n\x06\x66ields\x18\x64 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskB\x02\x18\x01\x12\'\n\x04mask\x18g \x01(\x0b\x32\x19.buildbucket.v2.BuildMask\x12\x11\n\tpage_size\x18\x65 \x01(\x05\x12\x12\n\npage_token\x18\x66 \x01(\t\"V\n\x14SearchBuildsResponse\x12%\n\x06\x62uilds\x18\x01 \x03(\x0b\x32\x15.buildbucket.v2.Build\x12\x17\n\x0fnext_page_token\x18\x64 \x01(\t\"\x90\x03\n\x0c\x42\x61tchRequest\x12\x36\n\x08requests\x18\x01 \x03(\x0b\x32$.buildbucket.v2.BatchRequest.Request\x1a\xc7\x02\n\x07Request\x12\x34\n\tget_build\x18\x01 \x01(\x0b\x32\x1f.buildbucket.v2.GetBuildRequestH\x00\x12<\n\rsearch_builds\x18\x02 \x01(\x0b\x32#.buildbucket.v2.SearchBuildsRequestH\x00\x12>\n\x0eschedule_build\x18\x03 \x01(\x0b\x32$.buildbucket.v2.ScheduleBuildRequestH\x00\x12:\n\x0c\x63\x61ncel_build\x18\x04 \x01(\x0b\x32\".buildbucket.v2.CancelBuildRequestH\x00\x12\x41\n\x10get_build_status\x18\x05 \x01(\x0b\x32%.buildbucket.v2.GetBuildStatusRequestH\x00\x42\t\n\x07request\"\x86\x03\n\rBatchResponse\x12\x39\n\tresponses\x18\x01 \x03(\x0b\x32&.buildbucket.v2.BatchResponse.Response\x1a\xb9\x02\n\x08Response\x12*\n\tget_build\x18\x01 \x01(\x0b\x32\x15.buildbucket.v2.BuildH\x00\x12=\n\rsearch_builds\x18\x02 \x01(\x0b\x32$.buildbucket.v2.SearchBuildsResponseH\x00\x12/\n\x0eschedule_build\x18\x03 \x01(\x0b\x32\x15.buildbucket.v2.BuildH\x00\x12-\n\x0c\x63\x61ncel_build\x18\x04 \x01(\x0b\x32\x15.buildbucket.v2.BuildH\x00\x12\x31\n\x10get_build_status\x18\x05 \x01(\x0b\x32\x15.buildbucket.v2.BuildH\x00\x12#\n\x05\x65rror\x18\x64 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\n\n\x08response\"\xc4\x01\n\x12UpdateBuildRequest\x12$\n\x05\x62uild\x18\x01 \x01(\x0b\x32\x15.buildbucket.v2.Build\x12/\n\x0bupdate_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12.\n\x06\x66ields\x18\x64 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskB\x02\x18\x01\x12\'\n\x04mask\x18\x65 \x01(\x0b\x32\x19.buildbucket.v2.BuildMask\"\xa7\x0b\n\x14ScheduleBuildRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x19\n\x11template_build_id\x18\x02 \x01(\x03\x12*\n\x07\x62uilder\x18\x03 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12\'\n\x06\x63\x61nary\x18\x04 \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12-\n\x0c\x65xperimental\x18\x05 \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12J\n\x0b\x65xperiments\x18\x10 \x03(\x0b\x32\x35.buildbucket.v2.ScheduleBuildRequest.ExperimentsEntry\x12+\n\nproperties\x18\x06 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x35\n\x0egitiles_commit\x18\x07 \x01(\x0b\x32\x1d.buildbucket.v2.GitilesCommit\x12\x34\n\x0egerrit_changes\x18\x08 \x03(\x0b\x32\x1c.buildbucket.v2.GerritChange\x12(\n\x04tags\x18\t \x03(\x0b\x32\x1a.buildbucket.v2.StringPair\x12\x36\n\ndimensions\x18\n \x03(\x0b\x32\".buildbucket.v2.RequestedDimension\x12\x10\n\x08priority\x18\x0b \x01(\x05\x12\x32\n\x06notify\x18\x0c \x01(\x0b\x32\".buildbucket.v2.NotificationConfig\x12.\n\x06\x66ields\x18\x64 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskB\x02\x18\x01\x12\'\n\x04mask\x18\x65 \x01(\x0b\x32\x19.buildbucket.v2.BuildMask\x12)\n\x08\x63ritical\x18\r \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12\'\n\x03\x65xe\x18\x0e \x01(\x0b\x32\x1a.buildbucket.v2.Executable\x12?\n\x08swarming\x18\x0f \x01(\x0b\x32-.buildbucket.v2.ScheduleBuildRequest.Swarming\x12\x35\n\x12scheduling_timeout\x18\x11 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x34\n\x11\x65xecution_timeout\x18\x12 \x01(\x0b\x32\x19.google.protobuf.Duration\x12/\n\x0cgrace_period\x18\x13 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x0f\n\x07\x64ry_run\x18\x14 \x01(\x08\x12\x33\n\x12\x63\x61n_outlive_parent\x18\x15 \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12\x17\n\x0fparent_build_id\x18\x19 \x01(\x03\x12*\n\tretriable\x18\x16 \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12\x46\n\x0cshadow_input\x18\x17 \x01(\x0b\x32\x30.buildbucket.v2.ScheduleBuildRequest.ShadowInput\x12?\n\x08resultdb\x18\x18 \x01(\x0b\x32-.buildbucket.v2.ScheduleBuildRequest.ResultDB\x1a\x32\n\x10\x45xperimentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x08:\x02\x38\x01\x1a!\n\x08Swarming\x12\x15\n\rparent_run_id\x18\x01 \x01(\t\x1a*\n\x0bShadowInput\x12\x1b\n\x13inherit_from_parent\x18\x01 \x01(\x08\x1a+\n\x08ResultDB\x12\x1f\n\x17is_export_root_override\x18\x01 \x01(\x08\"\x93\x01\n\x12\x43\x61ncelBuildRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x18\n\x10summary_markdown\x18\x02 \x01(\t\x12.\n\x06\x66ields\x18\x64 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskB\x02\x18\x01\x12\'\n\x04mask\x18\x65 \x01(\x0b\x32\x19.buildbucket.v2.BuildMask\"}\n\x12\x43reateBuildRequest\x12*\n\x05\x62uild\x18\x01 \x01(\x0b\x32\x15.buildbucket.v2.BuildB\x04\xe2\x41\x01\x02\x12\x12\n\nrequest_id\x18\x02 \x01(\t\x12\'\n\x04mask\x18\x03 \x01(\x0b\x32\x19.buildbucket.v2.BuildMask\"\xe1\x01\n\x16SynthesizeBuildRequest\x12\x19\n\x11template_build_id\x18\x01 \x01(\x03\x12*\n\x07\x62uilder\x18\x02 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12L\n\x0b\x65xperiments\x18\x03 \x03(\x0b\x32\x37.buildbucket.v2.SynthesizeBuildRequest.ExperimentsEntry\x1a\x32\n\x10\x45xperimentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x08:\x02\x38\x01\"\\\n\x11StartBuildRequest\x12\x18\n\nrequest_id\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x16\n\x08\x62uild_id\x18\x02 \x01(\x03\x42\x04\xe2\x41\x01\x02\x12\x15\n\x07task_id\x18\x03 \x01(\tB\x04\xe2\x41\x01\x02\"s\n\x12StartBuildResponse\x12$\n\x05\x62uild\x18\x01 \x01(\x0b\x32\x15.buildbucket.v2.Build\x12\x1a\n\x12update_build_token\x18\x02 \x01(\t\x12\x1b\n\x13stage_attempt_token\x18\x03 \x01(\t\"e\n\x15GetBuildStatusRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12*\n\x07\x62uilder\x18\x02 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12\x14\n\x0c\x62uild_number\x18\x03 \x01(\x05\"\xb9\x01\n\x1a\x43ustomMetricPreviewRequest\x12\x16\n\x08\x62uild_id\x18\x01 \x01(\x03\x42\x04\xe2\x41\x01\x02\x12\x44\n\x11metric_definition\x18\x02 \x01(\x0b\x32#.buildbucket.CustomMetricDefinitionB\x04\xe2\x41\x01\x02\x12\x34\n\x0bmetric_base\x18\x03 \x01(\x0e\x32\x1d.buildbucket.CustomMetricBaseH\x00\x42\x07\n\x05\x63lass\"\xb6\x01\n\x1b\x43ustomMetricPreviewResponse\x12\x44\n\x06report\x18\x01 \x01(\x0b\x32\x32.buildbucket.v2.CustomMetricPreviewResponse.ReportH\x00\x12\x0f\n\x05\x65rror\x18\x64 \x01(\tH\x00\x1a\x34\n\x06Report\x12*\n\x06\x66ields\x18\x01 \x03(\x0b\x32\x1a.buildbucket.v2.StringPairB\n\n\x08response\"\x93\x02\n\tBuildMask\x12*\n\x06\x66ields\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x30\n\x10input_properties\x18\x02 \x03(\x0b\x32\x16.structmask.StructMask\x12\x31\n\x11output_properties\x18\x03 \x03(\x0b\x32\x16.structmask.StructMask\x12\x34\n\x14requested_properties\x18\x04 \x03(\x0b\x32\x16.structmask.StructMask\x12\x12\n\nall_fields\x18\x05 \x01(\x08\x12+\n\x0bstep_status\x18\x06 \x03(\x0e\x32\x16.buildbucket.v2.Status\"\xf6\x03\n\x0e\x42uildPredicate\x12*\n\x07\x62uilder\x18\x01 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12&\n\x06status\x18\x02 \x01(\x0e\x32\x16.buildbucket.v2.Status\x12\x34\n\x0egerrit_changes\x18\x03 \x03(\x0b\x32\x1c.buildbucket.v2.GerritChange\x12<\n\x15output_gitiles_commit\x18\x04 \x01(\x0b\x32\x1d.buildbucket.v2.GitilesCommit\x12\x12\n\ncreated_by\x18\x05 \x01(\t\x12(\n\x04tags\x18\x06 \x03(\x0b\x32\x1a.buildbucket.v2.StringPair\x12.\n\x0b\x63reate_time\x18\x07 \x01(\x0b\x32\x19.buildbucket.v2.TimeRange\x12\x1c\n\x14include_experimental\x18\x08 \x01(\x08\x12)\n\x05\x62uild\x18\t \x01(\x0b\x32\x1a.buildbucket.v2.BuildRange\x12\'\n\x06\x63\x61nary\x18\n \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12\x13\n\x0b\x65xperiments\x18\x0b \x03(\t\x12\x15\n\rdescendant_of\x18\x0c \x01(\x03\x12\x10\n\x08\x63hild_of\x18\r \x01(\x03\":\n\nBuildRange\x12\x16\n\x0estart_build_id\x18\x01 \x01(\x03\x12\x14\n\x0c\x65nd_build_id\x18\x02 \x01(\x03\x32\x96\x07\n\x06\x42uilds\x12\x44\n\x08GetBuild\x12\x1f.buildbucket.v2.GetBuildRequest\x1a\x15.buildbucket.v2.Build\"\x00\x12[\n\x0cSearchBuilds\x12#.buildbucket.v2.SearchBuildsRequest\x1a$.buildbucket.v2.SearchBuildsResponse\"\x00\x12J\n\x0bUpdateBuild\x12\".buildbucket.v2.UpdateBuildRequest\x1a\x15.buildbucket.v2.Build\"\x00\x12N\n\rScheduleBuild\x12$.buildbucket.v2.ScheduleBuildRequest\x1a\x15.buildbucket.v2.Build\"\x00\x12J\n\x0b\x43\x61ncelBuild\x12\".buildbucket.v2.CancelBuildRequest\x1a\x15.buildbucket.v2.Build\"\x00\x12\x46\n\x05\x42\x61tch\x12\x1c.buildbucket.v2.BatchRequest\x1a\x1d.buildbucket.v2.BatchResponse\"\x00\x12J\n\x0b\x43reateBuild\x12\".buildbucket.v2.CreateBuildRequest\x1a\x15.buildbucket.v2.Build\"\x00\x12R\n\x0fSynthesizeBuild\x12&.buildbucket.v2.SynthesizeBuildRequest\x1a\x15.buildbucket.v2.Build\"\x00\x12P\n\x0eGetBuildStatus\x12%.buildbucket.v2.GetBuildStatusRequest\x1a\x15.buildbucket.v2.Build\"\x00\x12U\n\nStartBuild\x12!.buildbucket.v2.StartBuildRequest\x1a\".buildbucket.v2.StartBuildResponse\"\x00\x12p\n\x13\x43ustomMetricPreview\x12*.buildbucket.v2.CustomMetricPreviewRequest\x1a+.buildbucket.v2.CustomMetricPreviewResponse\"\x00\x42\x36Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.builds_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_GETBUILDREQUEST'].fields_by_name['fields']._loaded_options = None
+  _globals['_GETBUILDREQUEST'].fields_by_name['fields']._serialized_options = b'\030\001'
+  _globals['_SEARCHBUILDSREQUEST'].fields_by_name['fields']._loaded_options = None
+  _globals['_SEARCHBUILDSREQUEST'].fields_by_name['fields']._serialized_options = b'\030\001'
+  _globals['_UPDATEBUILDREQUEST'].fields_by_name['fields']._loaded_options = None
+  _globals['_UPDATEBUILDREQUEST'].fields_by_name['fields']._serialized_options = b'\030\001'
+  _globals['_SCHEDULEBUILDREQUEST_EXPERIMENTSENTRY']._loaded_options = None
+  _globals['_SCHEDULEBUILDREQUEST_EXPERIMENTSENTRY']._serialized_options = b'8\001'
+  _globals['_SCHEDULEBUILDREQUEST'].fields_by_name['fields']._loaded_options = None
+  _globals['_SCHEDULEBUILDREQUEST'].fields_by_name['fields']._serialized_options = b'\030\001'
+  _globals['_CANCELBUILDREQUEST'].fields_by_name['fields']._loaded_options = None
+  _globals['_CANCELBUILDREQUEST'].fields_by_name['fields']._serialized_options = b'\030\001'
+  _globals['_CREATEBUILDREQUEST'].fields_by_name['build']._loaded_options = None
+  _globals['_CREATEBUILDREQUEST'].fields_by_name['build']._serialized_options = b'\342A\001\002'
+  _globals['_SYNTHESIZEBUILDREQUEST_EXPERIMENTSENTRY']._loaded_options = None
+  _globals['_SYNTHESIZEBUILDREQUEST_EXPERIMENTSENTRY']._serialized_options = b'8\001'
+  _globals['_STARTBUILDREQUEST'].fields_by_name['request_id']._loaded_options = None
+  _globals['_STARTBUILDREQUEST'].fields_by_name['request_id']._serialized_options = b'\342A\001\002'
+  _globals['_STARTBUILDREQUEST'].fields_by_name['build_id']._loaded_options = None
+  _globals['_STARTBUILDREQUEST'].fields_by_name['build_id']._serialized_options = b'\342A\001\002'
+  _globals['_STARTBUILDREQUEST'].fields_by_name['task_id']._loaded_options = None
+  _globals['_STARTBUILDREQUEST'].fields_by_name['task_id']._serialized_options = b'\342A\001\002'
+  _globals['_CUSTOMMETRICPREVIEWREQUEST'].fields_by_name['build_id']._loaded_options = None
+  _globals['_CUSTOMMETRICPREVIEWREQUEST'].fields_by_name['build_id']._serialized_options = b'\342A\001\002'
+  _globals['_CUSTOMMETRICPREVIEWREQUEST'].fields_by_name['metric_definition']._loaded_options = None
+  _globals['_CUSTOMMETRICPREVIEWREQUEST'].fields_by_name['metric_definition']._serialized_options = b'\342A\001\002'
+  _globals['_GETBUILDREQUEST']._serialized_start=644
+  _globals['_GETBUILDREQUEST']._serialized_end=828
+  _globals['_SEARCHBUILDSREQUEST']._serialized_start=831
+  _globals['_SEARCHBUILDSREQUEST']._serialized_end=1031
+  _globals['_SEARCHBUILDSRESPONSE']._serialized_start=1033
+  _globals['_SEARCHBUILDSRESPONSE']._serialized_end=1119
+  _globals['_BATCHREQUEST']._serialized_start=1122
+  _globals['_BATCHREQUEST']._serialized_end=1522
+  _globals['_BATCHREQUEST_REQUEST']._serialized_start=1195
+  _globals['_BATCHREQUEST_REQUEST']._serialized_end=1522
+  _globals['_BATCHRESPONSE']._serialized_start=1525
+  _globals['_BATCHRESPONSE']._serialized_end=1915
+  _globals['_BATCHRESPONSE_RESPONSE']._serialized_start=1602
+  _globals['_BATCHRESPONSE_RESPONSE']._serialized_end=1915
+  _globals['_UPDATEBUILDREQUEST']._serialized_start=1918
+  _globals['_UPDATEBUILDREQUEST']._serialized_end=2114
+  _globals['_SCHEDULEBUILDREQUEST']._serialized_start=2117
+  _globals['_SCHEDULEBUILDREQUEST']._serialized_end=3564
+  _globals['_SCHEDULEBUILDREQUEST_EXPERIMENTSENTRY']._serialized_start=3390
+  _globals['_SCHEDULEBUILDREQUEST_EXPERIMENTSENTRY']._serialized_end=3440
+  _globals['_SCHEDULEBUILDREQUEST_SWARMING']._serialized_start=3442
+  _globals['_SCHEDULEBUILDREQUEST_SWARMING']._serialized_end=3475
+  _globals['_SCHEDULEBUILDREQUEST_SHADOWINPUT']._serialized_start=3477
+  _globals['_SCHEDULEBUILDREQUEST_SHADOWINPUT']._serialized_end=3519
+  _globals['_SCHEDULEBUILDREQUEST_RESULTDB']._serialized_start=3521
+  _globals['_SCHEDULEBUILDREQUEST_RESULTDB']._serialized_end=3564
+  _globals['_CANCELBUILDREQUEST']._serialized_start=3567
+  _globals['_CANCELBUILDREQUEST']._serialized_end=3714
+  _globals['_CREATEBUILDREQUEST']._serialized_start=3716
+  _globals['_CREATEBUILDREQUEST']._serialized_end=3841
+  _globals['_SYNTHESIZEBUILDREQUEST']._serialized_start=3844
+  _globals['_SYNTHESIZEBUILDREQUEST']._serialized_end=4069
+  _globals['_SYNTHESIZEBUILDREQUEST_EXPERIMENTSENTRY']._serialized_start=3390
+  _globals['_SYNTHESIZEBUILDREQUEST_EXPERIMENTSENTRY']._serialized_end=3440
+  _globals['_STARTBUILDREQUEST']._serialized_start=4071
+  _globals['_STARTBUILDREQUEST']._serialized_end=4163
+  _globals['_STARTBUILDRESPONSE']._serialized_start=4165
+  _globals['_STARTBUILDRESPONSE']._serialized_end=4280
+  _globals['_GETBUILDSTATUSREQUEST']._serialized_start=4282
+  _globals['_GETBUILDSTATUSREQUEST']._serialized_end=4383
+  _globals['_CUSTOMMETRICPREVIEWREQUEST']._serialized_start=4386
+  _globals['_CUSTOMMETRICPREVIEWREQUEST']._serialized_end=4571
+  _globals['_CUSTOMMETRICPREVIEWRESPONSE']._serialized_start=4574
+  _globals['_CUSTOMMETRICPREVIEWRESPONSE']._serialized_end=4756
+  _globals['_CUSTOMMETRICPREVIEWRESPONSE_REPORT']._serialized_start=4692
+  _globals['_CUSTOMMETRICPREVIEWRESPONSE_REPORT']._serialized_end=4744
+  _globals['_BUILDMASK']._serialized_start=4759
+  _globals['_BUILDMASK']._serialized_end=5034
+  _globals['_BUILDPREDICATE']._serialized_start=5037
+  _globals['_BUILDPREDICATE']._serialized_end=5539
+  _globals['_BUILDRANGE']._serialized_start=5541
+  _globals['_BUILDRANGE']._serialized_end=5599
+  _globals['_BUILDS']._serialized_start=5602
+  _globals['_BUILDS']._serialized_end=6520
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/common.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/buildbucket/proto/common.proto\x12\x0e\x62uildbucket.v2\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"V\n\nExecutable\x12\x14\n\x0c\x63ipd_package\x18\x01 \x01(\t\x12\x14\n\x0c\x63ipd_version\x18\x02 \x01(\t\x12\x0b\n\x03\x63md\x18\x03 \x03(\t\x12\x0f\n\x07wrapper\x18\x04 \x03(\t\"\xc3\x01\n\rStatusDetails\x12M\n\x13resource_exhaustion\x18\x03 \x01(\x0b\x32\x30.buildbucket.v2.StatusDetails.ResourceExhaustion\x12\x36\n\x07timeout\x18\x04 \x01(\x0b\x32%.buildbucket.v2.StatusDetails.Timeout\x1a\x14\n\x12ResourceExhaustion\x1a\t\n\x07TimeoutJ\x04\x08\x01\x10\x02J\x04\x08\x02\x10\x03\"2\n\x03Log\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08view_url\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\"O\n\x0cGerritChange\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0e\n\x06\x63hange\x18\x03 \x01(\x03\x12\x10\n\x08patchset\x18\x04 \x01(\x03\"Y\n\rGitilesCommit\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\n\n\x02id\x18\x03 \x01(\t\x12\x0b\n\x03ref\x18\x04 \x01(\t\x12\x10\n\x08position\x18\x05 \x01(\r\"(\n\nStringPair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"i\n\tTimeRange\x12.\n\nstart_time\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"_\n\x12RequestedDimension\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x12-\n\nexpiration\x18\x03 \x01(\x0b\x32\x19.google.protobuf.Duration\"q\n\nCacheEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x36\n\x13wait_for_warm_cache\x18\x03 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x0f\n\x07\x65nv_var\x18\x04 \x01(\t\"\x88\x04\n\x0cHealthStatus\x12\x14\n\x0chealth_score\x18\x01 \x01(\x03\x12G\n\x0ehealth_metrics\x18\x02 \x03(\x0b\x32/.buildbucket.v2.HealthStatus.HealthMetricsEntry\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12=\n\tdoc_links\x18\x04 \x03(\x0b\x32*.buildbucket.v2.HealthStatus.DocLinksEntry\x12?\n\ndata_links\x18\x05 \x03(\x0b\x32+.buildbucket.v2.HealthStatus.DataLinksEntry\x12\x16\n\x08reporter\x18\x06 \x01(\tB\x04\xe2\x41\x01\x03\x12\x37\n\rreported_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x1a\n\x12\x63ontact_team_email\x18\x08 \x01(\t\x1a\x34\n\x12HealthMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x02:\x02\x38\x01\x1a/\n\rDocLinksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x30\n\x0e\x44\x61taLinksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01*\x87\x01\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\r\n\tSCHEDULED\x10\x01\x12\x0b\n\x07STARTED\x10\x02\x12\x0e\n\nENDED_MASK\x10\x04\x12\x0b\n\x07SUCCESS\x10\x0c\x12\x0b\n\x07\x46\x41ILURE\x10\x14\x12\x11\n\rINFRA_FAILURE\x10$\x12\x0c\n\x08\x43\x41NCELED\x10\x44*%\n\x07Trinary\x12\t\n\x05UNSET\x10\x00\x12\x07\n\x03YES\x10\x01\x12\x06\n\x02NO\x10\x02*!\n\x0b\x43ompression\x12\x08\n\x04ZLIB\x10\x00\x12\x08\n\x04ZSTD\x10\x01\x42\x36Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_HEALTHSTATUS_HEALTHMETRICSENTRY']._loaded_options = None
+  _globals['_HEALTHSTATUS_HEALTHMETRICSENTRY']._serialized_options = b'8\001'
+  _globals['_HEALTHSTATUS_DOCLINKSENTRY']._loaded_options = None
+  _globals['_HEALTHSTATUS_DOCLINKSENTRY']._serialized_options = b'8\001'
+  _globals['_HEALTHSTATUS_DATALINKSENTRY']._loaded_options = None
+  _globals['_HEALTHSTATUS_DATALINKSENTRY']._serialized_options = b'8\001'
+  _globals['_HEALTHSTATUS'].fields_by_name['reporter']._loaded_options = None
+  _globals['_HEALTHSTATUS'].fields_by_name['reporter']._serialized_options = b'\342A\001\003'
+  _globals['_HEALTHSTATUS'].fields_by_name['reported_time']._loaded_options = None
+  _globals['_HEALTHSTATUS'].fields_by_name['reported_time']._serialized_options = b'\342A\001\003'
+  _globals['_STATUS']._serialized_start=1564
+  _globals['_STATUS']._serialized_end=1699
+  _globals['_TRINARY']._serialized_start=1701
+  _globals['_TRINARY']._serialized_end=1738
+  _globals['_COMPRESSION']._serialized_start=1740
+  _globals['_COMPRESSION']._serialized_end=1773
+  _globals['_EXECUTABLE']._serialized_start=169
+  _globals['_EXECUTABLE']._serialized_end=255
+  _globals['_STATUSDETAILS']._serialized_start=258
+  _globals['_STATUSDETAILS']._serialized_end=453
+  _globals['_STATUSDETAILS_RESOURCEEXHAUSTION']._serialized_start=410
+  _globals['_STATUSDETAILS_RESOURCEEXHAUSTION']._serialized_end=430
+  _globals['_STATUSDETAILS_TIMEOUT']._serialized_start=432
+  _globals['_STATUSDETAILS_TIMEOUT']._serialized_end=441
+  _globals['_LOG']._serialized_start=455
+  _globals['_LOG']._serialized_end=505
+  _globals['_GERRITCHANGE']._serialized_start=507
+  _globals['_GERRITCHANGE']._serialized_end=586
+  _globals['_GITILESCOMMIT']._serialized_start=588
+  _globals['_GITILESCOMMIT']._serialized_end=677
+  _globals['_STRINGPAIR']._serialized_start=679
+  _globals['_STRINGPAIR']._serialized_end=719
+  _globals['_TIMERANGE']._serialized_start=721
+  _globals['_TIMERANGE']._serialized_end=826
+  _globals['_REQUESTEDDIMENSION']._serialized_start=828
+  _globals['_REQUESTEDDIMENSION']._serialized_end=923
+  _globals['_CACHEENTRY']._serialized_start=925
+  _globals['_CACHEENTRY']._serialized_end=1038
+  _globals['_HEALTHSTATUS']._serialized_start=1041
+  _globals['_HEALTHSTATUS']._serialized_end=1561
+  _globals['_HEALTHSTATUS_HEALTHMETRICSENTRY']._serialized_start=1410
+  _globals['_HEALTHSTATUS_HEALTHMETRICSENTRY']._serialized_end=1462
+  _globals['_HEALTHSTATUS_DOCLINKSENTRY']._serialized_start=1464
+  _globals['_HEALTHSTATUS_DOCLINKSENTRY']._serialized_end=1511
+  _globals['_HEALTHSTATUS_DATALINKSENTRY']._serialized_start=1513
+  _globals['_HEALTHSTATUS_DATALINKSENTRY']._serialized_end=1561
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/field_option.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/field_option.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/buildbucket/proto/field_option.proto\x12\x0e\x62uildbucket.v2\x1a google/protobuf/descriptor.proto\x1a\x1fgoogle/api/field_behavior.proto\"K\n\x16\x43reateBuildFieldOption\x12\x31\n\x0e\x66ield_behavior\x18\x01 \x01(\x0e\x32\x19.google.api.FieldBehavior:j\n\x19\x63reate_build_field_option\x12\x1d.google.protobuf.FieldOptions\x18\xb1\xa8\x03 \x01(\x0b\x32&.buildbucket.v2.CreateBuildFieldOption:8\n\x0frequired_by_rpc\x12\x1d.google.protobuf.FieldOptions\x18\xb3\xa8\x03 \x03(\tB6Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.field_option_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_CREATEBUILDFIELDOPTION']._serialized_start=144
+  _globals['_CREATEBUILDFIELDOPTION']._serialized_end=219
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,17 @@
+from google.protobuf import descriptor_pb2 as _descriptor_pb2
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+CREATE_BUILD_FIELD_OPTION_FIELD_NUMBER: _ClassVar[int]
+create_build_field_option: _descriptor.FieldDescriptor
+REQUIRED_BY_RPC_FIELD_NUMBER: _ClassVar[int]
+required_by_rpc: _descriptor.FieldDescriptor
+
+class CreateBuildFieldOption(_message.Message):
+    __slots__ = ("field_behavior",)
+    FIELD_BEHAVIOR_FIELD_NUMBER: _ClassVar[int]
+    field_behavior: _field_behavior_pb2.FieldBehavior
+    def __init__(self, field_behavior: _Optional[_Union[_field_behavior_pb2.FieldBehavior, str]] = ...) -> None: ...
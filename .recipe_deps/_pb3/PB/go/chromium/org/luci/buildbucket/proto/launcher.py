@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/launcher.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/launcher.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.buildbucket.proto import build as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_build__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5go.chromium.org/luci/buildbucket/proto/launcher.proto\x12\x0e\x62uildbucket.v2\x1a\x32go.chromium.org/luci/buildbucket/proto/build.proto\"h\n\x0c\x42uildSecrets\x12\x13\n\x0b\x62uild_token\x18\x01 \x01(\t\x12(\n resultdb_invocation_update_token\x18\x02 \x01(\t\x12\x19\n\x11start_build_token\x18\x03 \x01(\t\"\x98\x01\n\x0b\x42\x42\x41gentArgs\x12\x17\n\x0f\x65xecutable_path\x18\x01 \x01(\t\x12\x14\n\x0cpayload_path\x18\x05 \x01(\t\x12\x11\n\tcache_dir\x18\x02 \x01(\t\x12!\n\x19known_public_gerrit_hosts\x18\x03 \x03(\t\x12$\n\x05\x62uild\x18\x04 \x01(\x0b\x32\x15.buildbucket.v2.Build\"Y\n\x17\x42uildbucketAgentContext\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12-\n\x07secrets\x18\x02 \x01(\x0b\x32\x1c.buildbucket.v2.BuildSecretsB6Z4go.chromium.org/luci/buildbucket/proto;buildbucketpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.launcher_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb'
+  _globals['_BUILDSECRETS']._serialized_start=125
+  _globals['_BUILDSECRETS']._serialized_end=229
+  _globals['_BBAGENTARGS']._serialized_start=232
+  _globals['_BBAGENTARGS']._serialized_end=384
+  _globals['_BUILDBUCKETAGENTCONTEXT']._serialized_start=386
+  _globals['_BUILDBUCKETAGENTCONTEXT']._serialized_end=475
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,40 @@
+from PB.go.chromium.org.luci.buildbucket.proto import build as _build_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BuildSecrets(_message.Message):
+    __slots__ = ("build_token", "resultdb_invocation_update_token", "start_build_token")
+    BUILD_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    RESULTDB_INVOCATION_UPDATE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    START_BUILD_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    build_token: str
+    resultdb_invocation_update_token: str
+    start_build_token: str
+    def __init__(self, build_token: _Optional[str] = ..., resultdb_invocation_update_token: _Optional[str] = ..., start_build_token: _Optional[str] = ...) -> None: ...
+
+class BBAgentArgs(_message.Message):
+    __slots__ = ("executable_path", "payload_path", "cache_dir", "known_public_gerrit_hosts", "build")
+    EXECUTABLE_PATH_FIELD_NUMBER: _ClassVar[int]
+    PAYLOAD_PATH_FIELD_NUMBER: _ClassVar[int]
+    CACHE_DIR_FIELD_NUMBER: _ClassVar[int]
+    KNOWN_PUBLIC_GERRIT_HOSTS_FIELD_NUMBER: _ClassVar[int]
+    BUILD_FIELD_NUMBER: _ClassVar[int]
+    executable_path: str
+    payload_path: str
+    cache_dir: str
+    known_public_gerrit_hosts: _containers.RepeatedScalarFieldContainer[str]
+    build: _build_pb2.Build
+    def __init__(self, executable_path: _Optional[str] = ..., payload_path: _Optional[str] = ..., cache_dir: _Optional[str] = ..., known_public_gerrit_hosts: _Optional[_Iterable[str]] = ..., build: _Optional[_Union[_build_pb2.Build, _Mapping]] = ...) -> None: ...
+
+class BuildbucketAgentContext(_message.Message):
+    __slots__ = ("task_id", "secrets")
+    TASK_ID_FIELD_NUMBER: _ClassVar[int]
+    SECRETS_FIELD_NUMBER: _ClassVar[int]
+    task_id: str
+    secrets: BuildSecrets
+    def __init__(self, task_id: _Optional[str] = ..., secrets: _Optional[_Union[BuildSecrets, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,22 @@
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class PRPCRequestLog(_message.Message):
+    __slots__ = ("id", "parent", "creation_time", "duration", "method", "user")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    CREATION_TIME_FIELD_NUMBER: _ClassVar[int]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    USER_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    parent: str
+    creation_time: int
+    duration: int
+    method: str
+    user: str
+    def __init__(self, id: _Optional[str] = ..., parent: _Optional[str] = ..., creation_time: _Optional[int] = ..., duration: _Optional[int] = ..., method: _Optional[str] = ..., user: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/buildbucket/proto/project_config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/buildbucket/proto/project_config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+from PB.go.chromium.org.luci.common.proto import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_options__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_invocation__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;go.chromium.org/luci/buildbucket/proto/project_config.proto\x12\x0b\x62uildbucket\x1a\x1egoogle/protobuf/duration.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\x1a/go.chromium.org/luci/common/proto/options.proto\x1a\x37go.chromium.org/luci/resultdb/proto/v1/invocation.proto\"\x86\x01\n\x03\x41\x63l\x12\'\n\x04role\x18\x01 \x01(\x0e\x32\x15.buildbucket.Acl.RoleB\x02\x18\x01\x12\x11\n\x05group\x18\x02 \x01(\tB\x02\x18\x01\x12\x14\n\x08identity\x18\x03 \x01(\tB\x02\x18\x01\"-\n\x04Role\x12\n\n\x06READER\x10\x00\x12\r\n\tSCHEDULER\x10\x01\x12\n\n\x06WRITER\x10\x02\"\x87\x12\n\rBuilderConfig\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x33\n\x07\x62\x61\x63kend\x18  \x01(\x0b\x32\".buildbucket.BuilderConfig.Backend\x12\x37\n\x0b\x62\x61\x63kend_alt\x18! \x01(\x0b\x32\".buildbucket.BuilderConfig.Backend\x12\x15\n\rswarming_host\x18\x15 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x06 \x01(\t\x12\x15\n\rswarming_tags\x18\x02 \x03(\t\x12\x12\n\ndimensions\x18\x03 \x03(\t\x12\x31\n\x06recipe\x18\x04 \x01(\x0b\x32!.buildbucket.BuilderConfig.Recipe\x12\'\n\x03\x65xe\x18\x17 \x01(\x0b\x32\x1a.buildbucket.v2.Executable\x12\x18\n\nproperties\x18\x18 \x01(\tB\x04\xa8\xfe#\x01\x12\"\n\x1a\x61llowed_property_overrides\x18\" \x03(\t\x12\x10\n\x08priority\x18\x05 \x01(\r\x12\x1e\n\x16\x65xecution_timeout_secs\x18\x07 \x01(\r\x12\x1e\n\x16heartbeat_timeout_secs\x18\' \x01(\r\x12\x17\n\x0f\x65xpiration_secs\x18\x14 \x01(\r\x12/\n\x0cgrace_period\x18\x1f \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x32\n\x11wait_for_capacity\x18\x1d \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12\x35\n\x06\x63\x61\x63hes\x18\t \x03(\x0b\x32%.buildbucket.BuilderConfig.CacheEntry\x12*\n\rbuild_numbers\x18\x10 \x01(\x0e\x32\x13.buildbucket.Toggle\x12\x17\n\x0fservice_account\x18\x0c \x01(\t\x12\x33\n\x16\x61uto_builder_dimension\x18\x11 \x01(\x0e\x32\x13.buildbucket.Toggle\x12)\n\x0c\x65xperimental\x18\x12 \x01(\x0e\x32\x13.buildbucket.Toggle\x12\x45\n\x1ftask_template_canary_percentage\x18\x16 \x01(\x0b\x32\x1c.google.protobuf.UInt32Value\x12@\n\x0b\x65xperiments\x18\x1c \x03(\x0b\x32+.buildbucket.BuilderConfig.ExperimentsEntry\x12)\n\x08\x63ritical\x18\x19 \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12\x35\n\x08resultdb\x18\x1a \x01(\x0b\x32#.buildbucket.BuilderConfig.ResultDB\x12\x18\n\x10\x64\x65scription_html\x18\x1e \x01(\t\x12W\n\x1ashadow_builder_adjustments\x18# \x01(\x0b\x32\x33.buildbucket.BuilderConfig.ShadowBuilderAdjustments\x12*\n\tretriable\x18$ \x01(\x0e\x32\x17.buildbucket.v2.Trinary\x12S\n\x1c\x62uilder_health_metrics_links\x18% \x01(\x0b\x32-.buildbucket.BuilderConfig.BuilderHealthLinks\x12\x1a\n\x12\x63ontact_team_email\x18& \x01(\t\x12\x46\n\x19\x63ustom_metric_definitions\x18( \x03(\x0b\x32#.buildbucket.CustomMetricDefinition\x12\x1d\n\x15max_concurrent_builds\x18) \x01(\r\x1a[\n\nCacheEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12 \n\x18wait_for_warm_cache_secs\x18\x03 \x01(\x05\x12\x0f\n\x07\x65nv_var\x18\x04 \x01(\t\x1ar\n\x06Recipe\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0c\x63ipd_package\x18\x06 \x01(\t\x12\x14\n\x0c\x63ipd_version\x18\x05 \x01(\t\x12\x12\n\nproperties\x18\x03 \x03(\t\x12\x14\n\x0cproperties_j\x18\x04 \x03(\tJ\x04\x08\x01\x10\x02\x1a\x8b\x01\n\x08ResultDB\x12\x0e\n\x06\x65nable\x18\x01 \x01(\x08\x12\x34\n\nbq_exports\x18\x02 \x03(\x0b\x32 .luci.resultdb.v1.BigQueryExport\x12\x39\n\x0fhistory_options\x18\x03 \x01(\x0b\x32 .luci.resultdb.v1.HistoryOptions\x1a\x34\n\x07\x42\x61\x63kend\x12\x0e\n\x06target\x18\x01 \x01(\t\x12\x19\n\x0b\x63onfig_json\x18\x02 \x01(\tB\x04\xa8\xfe#\x01\x1a\x32\n\x10\x45xperimentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1ao\n\x18ShadowBuilderAdjustments\x12\x17\n\x0fservice_account\x18\x01 \x01(\t\x12\x0c\n\x04pool\x18\x02 \x01(\t\x12\x18\n\nproperties\x18\x03 \x01(\tB\x04\xa8\xfe#\x01\x12\x12\n\ndimensions\x18\x04 \x03(\t\x1a\x99\x02\n\x12\x42uilderHealthLinks\x12N\n\tdoc_links\x18\x01 \x03(\x0b\x32;.buildbucket.BuilderConfig.BuilderHealthLinks.DocLinksEntry\x12P\n\ndata_links\x18\x02 \x03(\x0b\x32<.buildbucket.BuilderConfig.BuilderHealthLinks.DataLinksEntry\x1a/\n\rDocLinksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x30\n\x0e\x44\x61taLinksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01J\x04\x08\x08\x10\tJ\x04\x08\x0b\x10\x0cJ\x04\x08\r\x10\x0eJ\x04\x08\x0f\x10\x10J\x04\x08\x13\x10\x14J\x04\x08\x1b\x10\x1cJ\x04\x08\n\x10\x0b\"\x91\x01\n\x08Swarming\x12,\n\x08\x62uilders\x18\x04 \x03(\x0b\x32\x1a.buildbucket.BuilderConfig\x12\x45\n\x1ftask_template_canary_percentage\x18\x05 \x01(\x0b\x32\x1c.google.protobuf.UInt32ValueJ\x04\x08\x01\x10\x02J\x04\x08\x02\x10\x03J\x04\x08\x03\x10\x04\"\xfd\x02\n\x06\x42ucket\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\"\n\x04\x61\x63ls\x18\x02 \x03(\x0b\x32\x10.buildbucket.AclB\x02\x18\x01\x12\'\n\x08swarming\x18\x03 \x01(\x0b\x32\x15.buildbucket.Swarming\x12\x0e\n\x06shadow\x18\x05 \x01(\t\x12\x34\n\x0b\x63onstraints\x18\x06 \x01(\x0b\x32\x1f.buildbucket.Bucket.Constraints\x12L\n\x18\x64ynamic_builder_template\x18\x07 \x01(\x0b\x32*.buildbucket.Bucket.DynamicBuilderTemplate\x1a\x36\n\x0b\x43onstraints\x12\r\n\x05pools\x18\x01 \x03(\t\x12\x18\n\x10service_accounts\x18\x02 \x03(\t\x1a\x46\n\x16\x44ynamicBuilderTemplate\x12,\n\x08template\x18\x01 \x01(\x0b\x32\x1a.buildbucket.BuilderConfigJ\x04\x08\x04\x10\x05\"\xa9\x02\n\x0e\x42uildbucketCfg\x12$\n\x07\x62uckets\x18\x01 \x03(\x0b\x32\x13.buildbucket.Bucket\x12?\n\rcommon_config\x18\x05 \x01(\x0b\x32(.buildbucket.BuildbucketCfg.CommonConfig\x1aG\n\x05Topic\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x30\n\x0b\x63ompression\x18\x02 \x01(\x0e\x32\x1b.buildbucket.v2.Compression\x1aU\n\x0c\x43ommonConfig\x12\x45\n\x1a\x62uilds_notification_topics\x18\x01 \x03(\x0b\x32!.buildbucket.BuildbucketCfg.TopicJ\x04\x08\x02\x10\x03J\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05\"\xba\x01\n\x16\x43ustomMetricDefinition\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\npredicates\x18\x02 \x03(\t\x12J\n\x0c\x65xtra_fields\x18\x03 \x03(\x0b\x32\x34.buildbucket.CustomMetricDefinition.ExtraFieldsEntry\x1a\x32\n\x10\x45xtraFieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01*$\n\x06Toggle\x12\t\n\x05UNSET\x10\x00\x12\x07\n\x03YES\x10\x01\x12\x06\n\x02NO\x10\x02\x42tZ4go.chromium.org/luci/buildbucket/proto;buildbucketpb\xa2\xfe#:\n8https://config.luci.app/schemas/projects:buildbucket.cfgb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.buildbucket.proto.project_config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z4go.chromium.org/luci/buildbucket/proto;buildbucketpb\242\376#:\n8https://config.luci.app/schemas/projects:buildbucket.cfg'
+  _globals['_ACL'].fields_by_name['role']._loaded_options = None
+  _globals['_ACL'].fields_by_name['role']._serialized_options = b'\030\001'
+  _globals['_ACL'].fields_by_name['group']._loaded_options = None
+  _globals['_ACL'].fields_by_name['group']._serialized_options = b'\030\001'
+  _globals['_ACL'].fields_by_name['identity']._loaded_options = None
+  _globals['_ACL'].fields_by_name['identity']._serialized_options = b'\030\001'
+  _globals['_BUILDERCONFIG_BACKEND'].fields_by_name['config_json']._loaded_options = None
+  _globals['_BUILDERCONFIG_BACKEND'].fields_by_name['config_json']._serialized_options = b'\250\376#\001'
+  _globals['_BUILDERCONFIG_EXPERIMENTSENTRY']._loaded_options = None
+  _globals['_BUILDERCONFIG_EXPERIMENTSENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDERCONFIG_SHADOWBUILDERADJUSTMENTS'].fields_by_name['properties']._loaded_options = None
+  _globals['_BUILDERCONFIG_SHADOWBUILDERADJUSTMENTS'].fields_by_name['properties']._serialized_options = b'\250\376#\001'
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DOCLINKSENTRY']._loaded_options = None
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DOCLINKSENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DATALINKSENTRY']._loaded_options = None
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DATALINKSENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDERCONFIG'].fields_by_name['properties']._loaded_options = None
+  _globals['_BUILDERCONFIG'].fields_by_name['properties']._serialized_options = b'\250\376#\001'
+  _globals['_BUCKET'].fields_by_name['acls']._loaded_options = None
+  _globals['_BUCKET'].fields_by_name['acls']._serialized_options = b'\030\001'
+  _globals['_CUSTOMMETRICDEFINITION_EXTRAFIELDSENTRY']._loaded_options = None
+  _globals['_CUSTOMMETRICDEFINITION_EXTRAFIELDSENTRY']._serialized_options = b'8\001'
+  _globals['_TOGGLE']._serialized_start=3771
+  _globals['_TOGGLE']._serialized_end=3807
+  _globals['_ACL']._serialized_start=300
+  _globals['_ACL']._serialized_end=434
+  _globals['_ACL_ROLE']._serialized_start=389
+  _globals['_ACL_ROLE']._serialized_end=434
+  _globals['_BUILDERCONFIG']._serialized_start=437
+  _globals['_BUILDERCONFIG']._serialized_end=2748
+  _globals['_BUILDERCONFIG_CACHEENTRY']._serialized_start=1854
+  _globals['_BUILDERCONFIG_CACHEENTRY']._serialized_end=1945
+  _globals['_BUILDERCONFIG_RECIPE']._serialized_start=1947
+  _globals['_BUILDERCONFIG_RECIPE']._serialized_end=2061
+  _globals['_BUILDERCONFIG_RESULTDB']._serialized_start=2064
+  _globals['_BUILDERCONFIG_RESULTDB']._serialized_end=2203
+  _globals['_BUILDERCONFIG_BACKEND']._serialized_start=2205
+  _globals['_BUILDERCONFIG_BACKEND']._serialized_end=2257
+  _globals['_BUILDERCONFIG_EXPERIMENTSENTRY']._serialized_start=2259
+  _globals['_BUILDERCONFIG_EXPERIMENTSENTRY']._serialized_end=2309
+  _globals['_BUILDERCONFIG_SHADOWBUILDERADJUSTMENTS']._serialized_start=2311
+  _globals['_BUILDERCONFIG_SHADOWBUILDERADJUSTMENTS']._serialized_end=2422
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS']._serialized_start=2425
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS']._serialized_end=2706
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DOCLINKSENTRY']._serialized_start=2609
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DOCLINKSENTRY']._serialized_end=2656
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DATALINKSENTRY']._serialized_start=2658
+  _globals['_BUILDERCONFIG_BUILDERHEALTHLINKS_DATALINKSENTRY']._serialized_end=2706
+  _globals['_SWARMING']._serialized_start=2751
+  _globals['_SWARMING']._serialized_end=2896
+  _globals['_BUCKET']._serialized_start=2899
+  _globals['_BUCKET']._serialized_end=3280
+  _globals['_BUCKET_CONSTRAINTS']._serialized_start=3148
+  _globals['_BUCKET_CONSTRAINTS']._serialized_end=3202
+  _globals['_BUCKET_DYNAMICBUILDERTEMPLATE']._serialized_start=3204
+  _globals['_BUCKET_DYNAMICBUILDERTEMPLATE']._serialized_end=3274
+  _globals['_BUILDBUCKETCFG']._serialized_start=3283
+  _globals['_BUILDBUCKETCFG']._serialized_end=3580
+  _globals['_BUILDBUCKETCFG_TOPIC']._serialized_start=3404
+  _globals['_BUILDBUCKETCFG_TOPIC']._serialized_end=3475
+  _globals['_BUILDBUCKETCFG_COMMONCONFIG']._serialized_start=3477
+  _globals['_BUILDBUCKETCFG_COMMONCONFIG']._serialized_end=3562
+  _globals['_CUSTOMMETRICDEFINITION']._serialized_start=3583
+  _globals['_CUSTOMMETRICDEFINITION']._serialized_end=3769
+  _globals['_CUSTOMMETRICDEFINITION_EXTRAFIELDSENTRY']._serialized_start=3719
+  _globals['_CUSTOMMETRICDEFINITION_EXTRAFIELDSENTRY']._serialized_end=3769
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,264 @@
+import datetime
+
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import wrappers_pb2 as _wrappers_pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as _common_pb2
+from PB.go.chromium.org.luci.common.proto import options as _options_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as _invocation_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Toggle(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    UNSET: _ClassVar[Toggle]
+    YES: _ClassVar[Toggle]
+    NO: _ClassVar[Toggle]
+UNSET: Toggle
+YES: Toggle
+NO: Toggle
+
+class Acl(_message.Message):
+    __slots__ = ("role", "group", "identity")
+    class Role(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        READER: _ClassVar[Acl.Role]
+        SCHEDULER: _ClassVar[Acl.Role]
+        WRITER: _ClassVar[Acl.Role]
+    READER: Acl.Role
+    SCHEDULER: Acl.Role
+    WRITER: Acl.Role
+    ROLE_FIELD_NUMBER: _ClassVar[int]
+    GROUP_FIELD_NUMBER: _ClassVar[int]
+    IDENTITY_FIELD_NUMBER: _ClassVar[int]
+    role: Acl.Role
+    group: str
+    identity: str
+    def __init__(self, role: _Optional[_Union[Acl.Role, str]] = ..., group: _Optional[str] = ..., identity: _Optional[str] = ...) -> None: ...
+
+class BuilderConfig(_message.Message):
+    __slots__ = ("name", "backend", "backend_alt", "swarming_host", "category", "swarming_tags", "dimensions", "recipe", "exe", "properties", "allowed_property_overrides", "priority", "execution_timeout_secs", "heartbeat_timeout_secs", "expiration_secs", "grace_period", "wait_for_capacity", "caches", "build_numbers", "service_account", "auto_builder_dimension", "experimental", "task_template_canary_percentage", "experiments", "critical", "resultdb", "description_html", "shadow_builder_adjustments", "retriable", "builder_health_metrics_links", "contact_team_email", "custom_metric_definitions", "max_concurrent_builds")
+    class CacheEntry(_message.Message):
+        __slots__ = ("name", "path", "wait_for_warm_cache_secs", "env_var")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        WAIT_FOR_WARM_CACHE_SECS_FIELD_NUMBER: _ClassVar[int]
+        ENV_VAR_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        path: str
+        wait_for_warm_cache_secs: int
+        env_var: str
+        def __init__(self, name: _Optional[str] = ..., path: _Optional[str] = ..., wait_for_warm_cache_secs: _Optional[int] = ..., env_var: _Optional[str] = ...) -> None: ...
+    class Recipe(_message.Message):
+        __slots__ = ("name", "cipd_package", "cipd_version", "properties", "properties_j")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        CIPD_PACKAGE_FIELD_NUMBER: _ClassVar[int]
+        CIPD_VERSION_FIELD_NUMBER: _ClassVar[int]
+        PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+        PROPERTIES_J_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        cipd_package: str
+        cipd_version: str
+        properties: _containers.RepeatedScalarFieldContainer[str]
+        properties_j: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, name: _Optional[str] = ..., cipd_package: _Optional[str] = ..., cipd_version: _Optional[str] = ..., properties: _Optional[_Iterable[str]] = ..., properties_j: _Optional[_Iterable[str]] = ...) -> None: ...
+    class ResultDB(_message.Message):
+        __slots__ = ("enable", "bq_exports", "history_options")
+        ENABLE_FIELD_NUMBER: _ClassVar[int]
+        BQ_EXPORTS_FIELD_NUMBER: _ClassVar[int]
+        HISTORY_OPTIONS_FIELD_NUMBER: _ClassVar[int]
+        enable: bool
+        bq_exports: _containers.RepeatedCompositeFieldContainer[_invocation_pb2.BigQueryExport]
+        history_options: _invocation_pb2.HistoryOptions
+        def __init__(self, enable: bool = ..., bq_exports: _Optional[_Iterable[_Union[_invocation_pb2.BigQueryExport, _Mapping]]] = ..., history_options: _Optional[_Union[_invocation_pb2.HistoryOptions, _Mapping]] = ...) -> None: ...
+    class Backend(_message.Message):
+        __slots__ = ("target", "config_json")
+        TARGET_FIELD_NUMBER: _ClassVar[int]
+        CONFIG_JSON_FIELD_NUMBER: _ClassVar[int]
+        target: str
+        config_json: str
+        def __init__(self, target: _Optional[str] = ..., config_json: _Optional[str] = ...) -> None: ...
+    class ExperimentsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    class ShadowBuilderAdjustments(_message.Message):
+        __slots__ = ("service_account", "pool", "properties", "dimensions")
+        SERVICE_ACCOUNT_FIELD_NUMBER: _ClassVar[int]
+        POOL_FIELD_NUMBER: _ClassVar[int]
+        PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+        DIMENSIONS_FIELD_NUMBER: _ClassVar[int]
+        service_account: str
+        pool: str
+        properties: str
+        dimensions: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, service_account: _Optional[str] = ..., pool: _Optional[str] = ..., properties: _Optional[str] = ..., dimensions: _Optional[_Iterable[str]] = ...) -> None: ...
+    class BuilderHealthLinks(_message.Message):
+        __slots__ = ("doc_links", "data_links")
+        class DocLinksEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: str
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+        class DataLinksEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: str
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+        DOC_LINKS_FIELD_NUMBER: _ClassVar[int]
+        DATA_LINKS_FIELD_NUMBER: _ClassVar[int]
+        doc_links: _containers.ScalarMap[str, str]
+        data_links: _containers.ScalarMap[str, str]
+        def __init__(self, doc_links: _Optional[_Mapping[str, str]] = ..., data_links: _Optional[_Mapping[str, str]] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    BACKEND_FIELD_NUMBER: _ClassVar[int]
+    BACKEND_ALT_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_HOST_FIELD_NUMBER: _ClassVar[int]
+    CATEGORY_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_TAGS_FIELD_NUMBER: _ClassVar[int]
+    DIMENSIONS_FIELD_NUMBER: _ClassVar[int]
+    RECIPE_FIELD_NUMBER: _ClassVar[int]
+    EXE_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    ALLOWED_PROPERTY_OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    EXECUTION_TIMEOUT_SECS_FIELD_NUMBER: _ClassVar[int]
+    HEARTBEAT_TIMEOUT_SECS_FIELD_NUMBER: _ClassVar[int]
+    EXPIRATION_SECS_FIELD_NUMBER: _ClassVar[int]
+    GRACE_PERIOD_FIELD_NUMBER: _ClassVar[int]
+    WAIT_FOR_CAPACITY_FIELD_NUMBER: _ClassVar[int]
+    CACHES_FIELD_NUMBER: _ClassVar[int]
+    BUILD_NUMBERS_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_ACCOUNT_FIELD_NUMBER: _ClassVar[int]
+    AUTO_BUILDER_DIMENSION_FIELD_NUMBER: _ClassVar[int]
+    EXPERIMENTAL_FIELD_NUMBER: _ClassVar[int]
+    TASK_TEMPLATE_CANARY_PERCENTAGE_FIELD_NUMBER: _ClassVar[int]
+    EXPERIMENTS_FIELD_NUMBER: _ClassVar[int]
+    CRITICAL_FIELD_NUMBER: _ClassVar[int]
+    RESULTDB_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_HTML_FIELD_NUMBER: _ClassVar[int]
+    SHADOW_BUILDER_ADJUSTMENTS_FIELD_NUMBER: _ClassVar[int]
+    RETRIABLE_FIELD_NUMBER: _ClassVar[int]
+    BUILDER_HEALTH_METRICS_LINKS_FIELD_NUMBER: _ClassVar[int]
+    CONTACT_TEAM_EMAIL_FIELD_NUMBER: _ClassVar[int]
+    CUSTOM_METRIC_DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    MAX_CONCURRENT_BUILDS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    backend: BuilderConfig.Backend
+    backend_alt: BuilderConfig.Backend
+    swarming_host: str
+    category: str
+    swarming_tags: _containers.RepeatedScalarFieldContainer[str]
+    dimensions: _containers.RepeatedScalarFieldContainer[str]
+    recipe: BuilderConfig.Recipe
+    exe: _common_pb2.Executable
+    properties: str
+    allowed_property_overrides: _containers.RepeatedScalarFieldContainer[str]
+    priority: int
+    execution_timeout_secs: int
+    heartbeat_timeout_secs: int
+    expiration_secs: int
+    grace_period: _duration_pb2.Duration
+    wait_for_capacity: _common_pb2.Trinary
+    caches: _containers.RepeatedCompositeFieldContainer[BuilderConfig.CacheEntry]
+    build_numbers: Toggle
+    service_account: str
+    auto_builder_dimension: Toggle
+    experimental: Toggle
+    task_template_canary_percentage: _wrappers_pb2.UInt32Value
+    experiments: _containers.ScalarMap[str, int]
+    critical: _common_pb2.Trinary
+    resultdb: BuilderConfig.ResultDB
+    description_html: str
+    shadow_builder_adjustments: BuilderConfig.ShadowBuilderAdjustments
+    retriable: _common_pb2.Trinary
+    builder_health_metrics_links: BuilderConfig.BuilderHealthLinks
+    contact_team_email: str
+    custom_metric_definitions: _containers.RepeatedCompositeFieldContainer[CustomMetricDefinition]
+    max_concurrent_builds: int
+    def __init__(self, name: _Optional[str] = ..., backend: _Optional[_Union[BuilderConfig.Backend, _Mapping]] = ..., backend_alt: _Optional[_Union[BuilderConfig.Backend, _Mapping]] = ..., swarming_host: _Optional[str] = ..., category: _Optional[str] = ..., swarming_tags: _Optional[_Iterable[str]] = ..., dimensions: _Optional[_Iterable[str]] = ..., recipe: _Optional[_Union[BuilderConfig.Recipe, _Mapping]] = ..., exe: _Optional[_Union[_common_pb2.Executable, _Mapping]] = ..., properties: _Optional[str] = ..., allowed_property_overrides: _Optional[_Iterable[str]] = ..., priority: _Optional[int] = ..., execution_timeout_secs: _Optional[int] = ..., heartbeat_timeout_secs: _Optional[int] = ..., expiration_secs: _Optional[int] = ..., grace_period: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., wait_for_capacity: _Optional[_Union[_common_pb2.Trinary, str]] = ..., caches: _Optional[_Iterable[_Union[BuilderConfig.CacheEntry, _Mapping]]] = ..., build_numbers: _Optional[_Union[Toggle, str]] = ..., service_account: _Optional[str] = ..., auto_builder_dimension: _Optional[_Union[Toggle, str]] = ..., experimental: _Optional[_Union[Toggle, str]] = ..., task_template_canary_percentage: _Optional[_Union[_wrappers_pb2.UInt32Value, _Mapping]] = ..., experiments: _Optional[_Mapping[str, int]] = ..., critical: _Optional[_Union[_common_pb2.Trinary, str]] = ..., resultdb: _Optional[_Union[BuilderConfig.ResultDB, _Mapping]] = ..., description_html: _Optional[str] = ..., shadow_builder_adjustments: _Optional[_Union[BuilderConfig.ShadowBuilderAdjustments, _Mapping]] = ..., retriable: _Optional[_Union[_common_pb2.Trinary, str]] = ..., builder_health_metrics_links: _Optional[_Union[BuilderConfig.BuilderHealthLinks, _Mapping]] = ..., contact_team_email: _Optional[str] = ..., custom_metric_definitions: _Optional[_Iterable[_Union[CustomMetricDefinition, _Mapping]]] = ..., max_concurrent_builds: _Optional[int] = ...) -> None: ...
+
+class Swarming(_message.Message):
+    __slots__ = ("builders", "task_template_canary_percentage")
+    BUILDERS_FIELD_NUMBER: _ClassVar[int]
+    TASK_TEMPLATE_CANARY_PERCENTAGE_FIELD_NUMBER: _ClassVar[int]
+    builders: _containers.RepeatedCompositeFieldContainer[BuilderConfig]
+    task_template_canary_percentage: _wrappers_pb2.UInt32Value
+    def __init__(self, builders: _Optional[_Iterable[_Union[BuilderConfig, _Mapping]]] = ..., task_template_canary_percentage: _Optional[_Union[_wrappers_pb2.UInt32Value, _Mapping]] = ...) -> None: ...
+
+class Bucket(_message.Message):
+    __slots__ = ("name", "acls", "swarming", "shadow", "constraints", "dynamic_builder_template")
+    class Constraints(_message.Message):
+        __slots__ = ("pools", "service_accounts")
+        POOLS_FIELD_NUMBER: _ClassVar[int]
+        SERVICE_ACCOUNTS_FIELD_NUMBER: _ClassVar[int]
+        pools: _containers.RepeatedScalarFieldContainer[str]
+        service_accounts: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, pools: _Optional[_Iterable[str]] = ..., service_accounts: _Optional[_Iterable[str]] = ...) -> None: ...
+    class DynamicBuilderTemplate(_message.Message):
+        __slots__ = ("template",)
+        TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+        template: BuilderConfig
+        def __init__(self, template: _Optional[_Union[BuilderConfig, _Mapping]] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ACLS_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_FIELD_NUMBER: _ClassVar[int]
+    SHADOW_FIELD_NUMBER: _ClassVar[int]
+    CONSTRAINTS_FIELD_NUMBER: _ClassVar[int]
+    DYNAMIC_BUILDER_TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    acls: _containers.RepeatedCompositeFieldContainer[Acl]
+    swarming: Swarming
+    shadow: str
+    constraints: Bucket.Constraints
+    dynamic_builder_template: Bucket.DynamicBuilderTemplate
+    def __init__(self, name: _Optional[str] = ..., acls: _Optional[_Iterable[_Union[Acl, _Mapping]]] = ..., swarming: _Optional[_Union[Swarming, _Mapping]] = ..., shadow: _Optional[str] = ..., constraints: _Optional[_Union[Bucket.Constraints, _Mapping]] = ..., dynamic_builder_template: _Optional[_Union[Bucket.DynamicBuilderTemplate, _Mapping]] = ...) -> None: ...
+
+class BuildbucketCfg(_message.Message):
+    __slots__ = ("buckets", "common_config")
+    class Topic(_message.Message):
+        __slots__ = ("name", "compression")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        COMPRESSION_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        compression: _common_pb2.Compression
+        def __init__(self, name: _Optional[str] = ..., compression: _Optional[_Union[_common_pb2.Compression, str]] = ...) -> None: ...
+    class CommonConfig(_message.Message):
+        __slots__ = ("builds_notification_topics",)
+        BUILDS_NOTIFICATION_TOPICS_FIELD_NUMBER: _ClassVar[int]
+        builds_notification_topics: _containers.RepeatedCompositeFieldContainer[BuildbucketCfg.Topic]
+        def __init__(self, builds_notification_topics: _Optional[_Iterable[_Union[BuildbucketCfg.Topic, _Mapping]]] = ...) -> None: ...
+    BUCKETS_FIELD_NUMBER: _ClassVar[int]
+    COMMON_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    buckets: _containers.RepeatedCompositeFieldContainer[Bucket]
+    common_config: BuildbucketCfg.CommonConfig
+    def __init__(self, buckets: _Optional[_Iterable[_Union[Bucket, _Mapping]]] = ..., common_config: _Optional[_Union[BuildbucketCfg.CommonConfig, _Mapping]] = ...) -> None: ...
+
+class CustomMetricDefinition(_message.Message):
+    __slots__ = ("name", "predicates", "extra_fields")
+    class ExtraFieldsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PREDICATES_FIELD_NUMBER: _ClassVar[int]
+    EXTRA_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    predicates: _containers.RepeatedScalarFieldContainer[str]
+    extra_fields: _containers.ScalarMap[str, str]
+    def __init__(self, name: _Optional[str] = ..., predicates: _Optional[_Iterable[str]] = ..., extra_fields: _Optional[_Mapping[str, str]] = ...) -> None: ...
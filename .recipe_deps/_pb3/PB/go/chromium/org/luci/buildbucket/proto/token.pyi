@@ -0,0 +1,44 @@
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TokenBody(_message.Message):
+    __slots__ = ("build_id", "purpose", "state")
+    class Purpose(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        PURPOSE_UNSPECIFIED: _ClassVar[TokenBody.Purpose]
+        BUILD: _ClassVar[TokenBody.Purpose]
+        TASK: _ClassVar[TokenBody.Purpose]
+        START_BUILD: _ClassVar[TokenBody.Purpose]
+        START_BUILD_TASK: _ClassVar[TokenBody.Purpose]
+    PURPOSE_UNSPECIFIED: TokenBody.Purpose
+    BUILD: TokenBody.Purpose
+    TASK: TokenBody.Purpose
+    START_BUILD: TokenBody.Purpose
+    START_BUILD_TASK: TokenBody.Purpose
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    PURPOSE_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    build_id: int
+    purpose: TokenBody.Purpose
+    state: bytes
+    def __init__(self, build_id: _Optional[int] = ..., purpose: _Optional[_Union[TokenBody.Purpose, str]] = ..., state: _Optional[bytes] = ...) -> None: ...
+
+class TokenEnvelope(_message.Message):
+    __slots__ = ("version", "payload")
+    class Version(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        VERSION_UNSPECIFIED: _ClassVar[TokenEnvelope.Version]
+        UNENCRYPTED_PASSWORD_LIKE: _ClassVar[TokenEnvelope.Version]
+        ENCRYPTED: _ClassVar[TokenEnvelope.Version]
+    VERSION_UNSPECIFIED: TokenEnvelope.Version
+    UNENCRYPTED_PASSWORD_LIKE: TokenEnvelope.Version
+    ENCRYPTED: TokenEnvelope.Version
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    PAYLOAD_FIELD_NUMBER: _ClassVar[int]
+    version: TokenEnvelope.Version
+    payload: bytes
+    def __init__(self, version: _Optional[_Union[TokenEnvelope.Version, str]] = ..., payload: _Optional[bytes] = ...) -> None: ...
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/bq/pb/options.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/bq/pb/options.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/go.chromium.org/luci/common/bq/pb/options.proto\x12\x08\x62qschema\x1a google/protobuf/descriptor.proto\"6\n\x0c\x46ieldOptions\x12\x0f\n\x07\x62q_type\x18\x01 \x01(\t\x12\x15\n\rdefault_value\x18\x02 \x01(\t:H\n\x07options\x12\x1d.google.protobuf.FieldOptions\x18\xcc\xc7\x04 \x01(\x0b\x32\x16.bqschema.FieldOptionsB#Z!go.chromium.org/luci/common/bq/pb')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.bq.pb.options_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z!go.chromium.org/luci/common/bq/pb'
+  _globals['_FIELDOPTIONS']._serialized_start=95
+  _globals['_FIELDOPTIONS']._serialized_end=149
+# @@protoc_insertion_point(module_scope)
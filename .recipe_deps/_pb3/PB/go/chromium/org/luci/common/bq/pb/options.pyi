@@ -0,0 +1,16 @@
+from google.protobuf import descriptor_pb2 as _descriptor_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+OPTIONS_FIELD_NUMBER: _ClassVar[int]
+options: _descriptor.FieldDescriptor
+
+class FieldOptions(_message.Message):
+    __slots__ = ("bq_type", "default_value")
+    BQ_TYPE_FIELD_NUMBER: _ClassVar[int]
+    DEFAULT_VALUE_FIELD_NUMBER: _ClassVar[int]
+    bq_type: str
+    default_value: str
+    def __init__(self, bq_type: _Optional[str] = ..., default_value: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/config/project_config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/config/project_config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.common.proto import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n=go.chromium.org/luci/common/proto/config/project_config.proto\x12\x06\x63onfig\x1a/go.chromium.org/luci/common/proto/options.proto\"\\\n\nProjectCfg\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x61\x63\x63\x65ss\x18\x02 \x03(\t\x12\x30\n\x07lucicfg\x18\x03 \x01(\x0b\x32\x19.config.GeneratorMetadataB\x04\xb0\xfe#\x01\"\xed\x01\n\x11GeneratorMetadata\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\x14\n\x0cpackage_name\x18\x07 \x01(\t\x12\x13\n\x0bpackage_dir\x18\x05 \x01(\t\x12\x12\n\nconfig_dir\x18\x02 \x01(\t\x12\x13\n\x0b\x65ntry_point\x18\x03 \x01(\t\x12\x31\n\x04vars\x18\x04 \x03(\x0b\x32#.config.GeneratorMetadata.VarsEntry\x12\x13\n\x0b\x65xperiments\x18\x06 \x03(\t\x1a+\n\tVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"V\n\x07RefsCfg\x12!\n\x04refs\x18\x01 \x03(\x0b\x32\x13.config.RefsCfg.Ref\x1a(\n\x03Ref\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x63onfig_path\x18\x03 \x01(\tBdZ(go.chromium.org/luci/common/proto/config\xa2\xfe#6\n4https://config.luci.app/schemas/projects:project.cfgb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.config.project_config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z(go.chromium.org/luci/common/proto/config\242\376#6\n4https://config.luci.app/schemas/projects:project.cfg'
+  _globals['_PROJECTCFG'].fields_by_name['lucicfg']._loaded_options = None
+  _globals['_PROJECTCFG'].fields_by_name['lucicfg']._serialized_options = b'\260\376#\001'
+  _globals['_GENERATORMETADATA_VARSENTRY']._loaded_options = None
+  _globals['_GENERATORMETADATA_VARSENTRY']._serialized_options = b'8\001'
+  _globals['_PROJECTCFG']._serialized_start=122
+  _globals['_PROJECTCFG']._serialized_end=214
+  _globals['_GENERATORMETADATA']._serialized_start=217
+  _globals['_GENERATORMETADATA']._serialized_end=454
+  _globals['_GENERATORMETADATA_VARSENTRY']._serialized_start=411
+  _globals['_GENERATORMETADATA_VARSENTRY']._serialized_end=454
+  _globals['_REFSCFG']._serialized_start=456
+  _globals['_REFSCFG']._serialized_end=542
+  _globals['_REFSCFG_REF']._serialized_start=502
+  _globals['_REFSCFG_REF']._serialized_end=542
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,56 @@
+from PB.go.chromium.org.luci.common.proto import options as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ProjectCfg(_message.Message):
+    __slots__ = ("name", "access", "lucicfg")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ACCESS_FIELD_NUMBER: _ClassVar[int]
+    LUCICFG_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    access: _containers.RepeatedScalarFieldContainer[str]
+    lucicfg: GeneratorMetadata
+    def __init__(self, name: _Optional[str] = ..., access: _Optional[_Iterable[str]] = ..., lucicfg: _Optional[_Union[GeneratorMetadata, _Mapping]] = ...) -> None: ...
+
+class GeneratorMetadata(_message.Message):
+    __slots__ = ("version", "package_name", "package_dir", "config_dir", "entry_point", "vars", "experiments")
+    class VarsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    PACKAGE_NAME_FIELD_NUMBER: _ClassVar[int]
+    PACKAGE_DIR_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_DIR_FIELD_NUMBER: _ClassVar[int]
+    ENTRY_POINT_FIELD_NUMBER: _ClassVar[int]
+    VARS_FIELD_NUMBER: _ClassVar[int]
+    EXPERIMENTS_FIELD_NUMBER: _ClassVar[int]
+    version: str
+    package_name: str
+    package_dir: str
+    config_dir: str
+    entry_point: str
+    vars: _containers.ScalarMap[str, str]
+    experiments: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, version: _Optional[str] = ..., package_name: _Optional[str] = ..., package_dir: _Optional[str] = ..., config_dir: _Optional[str] = ..., entry_point: _Optional[str] = ..., vars: _Optional[_Mapping[str, str]] = ..., experiments: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class RefsCfg(_message.Message):
+    __slots__ = ("refs",)
+    class Ref(_message.Message):
+        __slots__ = ("name", "config_path")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        CONFIG_PATH_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        config_path: str
+        def __init__(self, name: _Optional[str] = ..., config_path: _Optional[str] = ...) -> None: ...
+    REFS_FIELD_NUMBER: _ClassVar[int]
+    refs: _containers.RepeatedCompositeFieldContainer[RefsCfg.Ref]
+    def __init__(self, refs: _Optional[_Iterable[_Union[RefsCfg.Ref, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/config/service_config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/config/service_config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n=go.chromium.org/luci/common/proto/config/service_config.proto\x12\x06\x63onfig\x1a\x1bgoogle/protobuf/empty.proto\":\n\x0fGitilesLocation\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x0b\n\x03ref\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\"V\n\x0eIdentityConfig\x12\x1d\n\x15service_account_email\x18\x01 \x01(\t\x12%\n\x1dstaging_service_account_email\x18\x02 \x01(\t\"1\n\rBillingConfig\x12 \n\x18\x62illing_cloud_project_id\x18\x01 \x01(\x04\"K\n\x08Location\x12\x33\n\x10gitiles_location\x18\x01 \x01(\x0b\x32\x17.config.GitilesLocationH\x00\x42\n\n\x08location\"\xdf\x01\n\x07Project\x12\n\n\x02id\x18\x01 \x01(\t\x12\x33\n\x10gitiles_location\x18\x04 \x01(\x0b\x32\x17.config.GitilesLocationH\x00\x12/\n\x0fidentity_config\x18\x03 \x01(\x0b\x32\x16.config.IdentityConfig\x12\x10\n\x08owned_by\x18\x05 \x01(\t\x12-\n\x0e\x62illing_config\x18\x06 \x01(\x0b\x32\x15.config.BillingConfigB\n\n\x08locationJ\x04\x08\x02\x10\x03R\x0f\x63onfig_location\"M\n\x04Team\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1b\n\x13maintenance_contact\x18\x02 \x03(\t\x12\x1a\n\x12\x65scalation_contact\x18\x03 \x03(\t\"M\n\x0bProjectsCfg\x12!\n\x08projects\x18\x01 \x03(\x0b\x32\x0f.config.Project\x12\x1b\n\x05teams\x18\x02 \x03(\x0b\x32\x0c.config.Team\"\xbc\x01\n\x07Service\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06owners\x18\x02 \x03(\t\x12\x14\n\x0cmetadata_url\x18\x04 \x01(\t\x12\x10\n\x08hostname\x18\x07 \x01(\t\x12\x0e\n\x06\x61\x63\x63\x65ss\x18\x05 \x03(\t\x12)\n\x08jwt_auth\x18\x06 \x01(\x0b\x32\x17.config.Service.JWTAuth\x1a\x1b\n\x07JWTAuth\x12\x10\n\x08\x61udience\x18\x01 \x01(\tJ\x04\x08\x03\x10\x04R\x0f\x63onfig_location\"s\n\x16ServiceDynamicMetadata\x12\x0f\n\x07version\x18\x01 \x01(\t\x12%\n\nvalidation\x18\x02 \x01(\x0b\x32\x11.config.Validator\x12!\n\x19supports_gzip_compression\x18\x03 \x01(\x08\"0\n\x0bServicesCfg\x12!\n\x08services\x18\x01 \x03(\x0b\x32\x0f.config.Service\"\xcc\x02\n\x06\x41\x63lCfg\x12\x1c\n\x14project_access_group\x18\x02 \x01(\t\x12 \n\x18project_validation_group\x18\x08 \x01(\t\x12\x1e\n\x16project_reimport_group\x18\t \x01(\t\x12\x1c\n\x14service_access_group\x18\x07 \x01(\t\x12 \n\x18service_validation_group\x18\n \x01(\t\x12\x1e\n\x16service_reimport_group\x18\x0b \x01(\tJ\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05J\x04\x08\x05\x10\x06J\x04\x08\x06\x10\x07J\x04\x08\x0c\x10\rR\x18\x63onfig_get_by_hash_groupR\x0b\x61\x64min_groupR\x10validation_groupR\x0ereimport_groupR\x1blegacy_project_access_group\"\xe9\x01\n\tImportCfg\x12*\n\x07gitiles\x18\x01 \x01(\x0b\x32\x19.config.ImportCfg.Gitiles\x1a\xaf\x01\n\x07Gitiles\x12\x1a\n\x12\x66\x65tch_log_deadline\x18\x01 \x01(\x05\x12\x1e\n\x16\x66\x65tch_archive_deadline\x18\x02 \x01(\x05\x12\"\n\x1aproject_config_default_ref\x18\x03 \x01(\t\x12#\n\x1bproject_config_default_path\x18\x04 \x01(\t\x12\x1f\n\x17ref_config_default_path\x18\x05 \x01(\t\"]\n\nSchemasCfg\x12*\n\x07schemas\x18\x01 \x03(\x0b\x32\x19.config.SchemasCfg.Schema\x1a#\n\x06Schema\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\"1\n\rConfigPattern\x12\x12\n\nconfig_set\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"A\n\tValidator\x12\'\n\x08patterns\x18\x01 \x03(\x0b\x32\x15.config.ConfigPattern\x12\x0b\n\x03url\x18\x02 \x01(\t\"M\n\x18ValidationRequestMessage\x12\x12\n\nconfig_set\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\x0c\"\x91\x02\n\x19ValidationResponseMessage\x12;\n\x08messages\x18\x01 \x03(\x0b\x32).config.ValidationResponseMessage.Message\x1a\x63\n\x07Message\x12\x0c\n\x04path\x18\x01 \x01(\t\x12<\n\x08severity\x18\x02 \x01(\x0e\x32*.config.ValidationResponseMessage.Severity\x12\x0c\n\x04text\x18\x03 \x01(\t\"R\n\x08Severity\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x44\x45\x42UG\x10\n\x12\x08\n\x04INFO\x10\x14\x12\x0b\n\x07WARNING\x10\x1e\x12\t\n\x05\x45RROR\x10(\x12\x0c\n\x08\x43RITICAL\x10\x32\"A\n\x0fServiceMetadata\x12.\n\x0f\x63onfig_patterns\x18\x01 \x03(\x0b\x32\x15.config.ConfigPattern\"\xec\x01\n\x16ValidateConfigsRequest\x12\x12\n\nconfig_set\x18\x01 \x01(\t\x12\x33\n\x05\x66iles\x18\x02 \x01(\x0b\x32$.config.ValidateConfigsRequest.Files\x1a;\n\x05\x46iles\x12\x32\n\x05\x66iles\x18\x01 \x03(\x0b\x32#.config.ValidateConfigsRequest.File\x1aL\n\x04\x46ile\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x15\n\x0braw_content\x18\x02 \x01(\x0cH\x00\x12\x14\n\nsigned_url\x18\x03 \x01(\tH\x00\x42\t\n\x07\x63ontent\"\xf6\x01\n\x10ValidationResult\x12\x32\n\x08messages\x18\x01 \x03(\x0b\x32 .config.ValidationResult.Message\x1aZ\n\x07Message\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x33\n\x08severity\x18\x02 \x01(\x0e\x32!.config.ValidationResult.Severity\x12\x0c\n\x04text\x18\x03 \x01(\t\"R\n\x08Severity\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x44\x45\x42UG\x10\n\x12\x08\n\x04INFO\x10\x14\x12\x0b\n\x07WARNING\x10\x1e\x12\t\n\x05\x45RROR\x10(\x12\x0c\n\x08\x43RITICAL\x10\x32\x32\x9b\x01\n\x08\x43onsumer\x12@\n\x0bGetMetadata\x12\x16.google.protobuf.Empty\x1a\x17.config.ServiceMetadata\"\x00\x12M\n\x0fValidateConfigs\x12\x1e.config.ValidateConfigsRequest\x1a\x18.config.ValidationResult\"\x00\x42*Z(go.chromium.org/luci/common/proto/configb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.config.service_config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z(go.chromium.org/luci/common/proto/config'
+  _globals['_GITILESLOCATION']._serialized_start=102
+  _globals['_GITILESLOCATION']._serialized_end=160
+  _globals['_IDENTITYCONFIG']._serialized_start=162
+  _globals['_IDENTITYCONFIG']._serialized_end=248
+  _globals['_BILLINGCONFIG']._serialized_start=250
+  _globals['_BILLINGCONFIG']._serialized_end=299
+  _globals['_LOCATION']._serialized_start=301
+  _globals['_LOCATION']._serialized_end=376
+  _globals['_PROJECT']._serialized_start=379
+  _globals['_PROJECT']._serialized_end=602
+  _globals['_TEAM']._serialized_start=604
+  _globals['_TEAM']._serialized_end=681
+  _globals['_PROJECTSCFG']._serialized_start=683
+  _globals['_PROJECTSCFG']._serialized_end=760
+  _globals['_SERVICE']._serialized_start=763
+  _globals['_SERVICE']._serialized_end=951
+  _globals['_SERVICE_JWTAUTH']._serialized_start=901
+  _globals['_SERVICE_JWTAUTH']._serialized_end=928
+  _globals['_SERVICEDYNAMICMETADATA']._serialized_start=953
+  _globals['_SERVICEDYNAMICMETADATA']._serialized_end=1068
+  _globals['_SERVICESCFG']._serialized_start=1070
+  _globals['_SERVICESCFG']._serialized_end=1118
+  _globals['_ACLCFG']._serialized_start=1121
+  _globals['_ACLCFG']._serialized_end=1453
+  _globals['_IMPORTCFG']._serialized_start=1456
+  _globals['_IMPORTCFG']._serialized_end=1689
+  _globals['_IMPORTCFG_GITILES']._serialized_start=1514
+  _globals['_IMPORTCFG_GITILES']._serialized_end=1689
+  _globals['_SCHEMASCFG']._serialized_start=1691
+  _globals['_SCHEMASCFG']._serialized_end=1784
+  _globals['_SCHEMASCFG_SCHEMA']._serialized_start=1749
+  _globals['_SCHEMASCFG_SCHEMA']._serialized_end=1784
+  _globals['_CONFIGPATTERN']._serialized_start=1786
+  _globals['_CONFIGPATTERN']._serialized_end=1835
+  _globals['_VALIDATOR']._serialized_start=1837
+  _globals['_VALIDATOR']._serialized_end=1902
+  _globals['_VALIDATIONREQUESTMESSAGE']._serialized_start=1904
+  _globals['_VALIDATIONREQUESTMESSAGE']._serialized_end=1981
+  _globals['_VALIDATIONRESPONSEMESSAGE']._serialized_start=1984
+  _globals['_VALIDATIONRESPONSEMESSAGE']._serialized_end=2257
+  _globals['_VALIDATIONRESPONSEMESSAGE_MESSAGE']._serialized_start=2074
+  _globals['_VALIDATIONRESPONSEMESSAGE_MESSAGE']._serialized_end=2173
+  _globals['_VALIDATIONRESPONSEMESSAGE_SEVERITY']._serialized_start=2175
+  _globals['_VALIDATIONRESPONSEMESSAGE_SEVERITY']._serialized_end=2257
+  _globals['_SERVICEMETADATA']._serialized_start=2259
+  _globals['_SERVICEMETADATA']._serialized_end=2324
+  _globals['_VALIDATECONFIGSREQUEST']._serialized_start=2327
+  _globals['_VALIDATECONFIGSREQUEST']._serialized_end=2563
+  _globals['_VALIDATECONFIGSREQUEST_FILES']._serialized_start=2426
+  _globals['_VALIDATECONFIGSREQUEST_FILES']._serialized_end=2485
+  _globals['_VALIDATECONFIGSREQUEST_FILE']._serialized_start=2487
+  _globals['_VALIDATECONFIGSREQUEST_FILE']._serialized_end=2563
+  _globals['_VALIDATIONRESULT']._serialized_start=2566
+  _globals['_VALIDATIONRESULT']._serialized_end=2812
+  _globals['_VALIDATIONRESULT_MESSAGE']._serialized_start=2638
+  _globals['_VALIDATIONRESULT_MESSAGE']._serialized_end=2728
+  _globals['_VALIDATIONRESULT_SEVERITY']._serialized_start=2175
+  _globals['_VALIDATIONRESULT_SEVERITY']._serialized_end=2257
+  _globals['_CONSUMER']._serialized_start=2815
+  _globals['_CONSUMER']._serialized_end=2970
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,268 @@
+from google.protobuf import empty_pb2 as _empty_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GitilesLocation(_message.Message):
+    __slots__ = ("repo", "ref", "path")
+    REPO_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    repo: str
+    ref: str
+    path: str
+    def __init__(self, repo: _Optional[str] = ..., ref: _Optional[str] = ..., path: _Optional[str] = ...) -> None: ...
+
+class IdentityConfig(_message.Message):
+    __slots__ = ("service_account_email", "staging_service_account_email")
+    SERVICE_ACCOUNT_EMAIL_FIELD_NUMBER: _ClassVar[int]
+    STAGING_SERVICE_ACCOUNT_EMAIL_FIELD_NUMBER: _ClassVar[int]
+    service_account_email: str
+    staging_service_account_email: str
+    def __init__(self, service_account_email: _Optional[str] = ..., staging_service_account_email: _Optional[str] = ...) -> None: ...
+
+class BillingConfig(_message.Message):
+    __slots__ = ("billing_cloud_project_id",)
+    BILLING_CLOUD_PROJECT_ID_FIELD_NUMBER: _ClassVar[int]
+    billing_cloud_project_id: int
+    def __init__(self, billing_cloud_project_id: _Optional[int] = ...) -> None: ...
+
+class Location(_message.Message):
+    __slots__ = ("gitiles_location",)
+    GITILES_LOCATION_FIELD_NUMBER: _ClassVar[int]
+    gitiles_location: GitilesLocation
+    def __init__(self, gitiles_location: _Optional[_Union[GitilesLocation, _Mapping]] = ...) -> None: ...
+
+class Project(_message.Message):
+    __slots__ = ("id", "gitiles_location", "identity_config", "owned_by", "billing_config")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    GITILES_LOCATION_FIELD_NUMBER: _ClassVar[int]
+    IDENTITY_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    OWNED_BY_FIELD_NUMBER: _ClassVar[int]
+    BILLING_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    gitiles_location: GitilesLocation
+    identity_config: IdentityConfig
+    owned_by: str
+    billing_config: BillingConfig
+    def __init__(self, id: _Optional[str] = ..., gitiles_location: _Optional[_Union[GitilesLocation, _Mapping]] = ..., identity_config: _Optional[_Union[IdentityConfig, _Mapping]] = ..., owned_by: _Optional[str] = ..., billing_config: _Optional[_Union[BillingConfig, _Mapping]] = ...) -> None: ...
+
+class Team(_message.Message):
+    __slots__ = ("name", "maintenance_contact", "escalation_contact")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    MAINTENANCE_CONTACT_FIELD_NUMBER: _ClassVar[int]
+    ESCALATION_CONTACT_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    maintenance_contact: _containers.RepeatedScalarFieldContainer[str]
+    escalation_contact: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, name: _Optional[str] = ..., maintenance_contact: _Optional[_Iterable[str]] = ..., escalation_contact: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ProjectsCfg(_message.Message):
+    __slots__ = ("projects", "teams")
+    PROJECTS_FIELD_NUMBER: _ClassVar[int]
+    TEAMS_FIELD_NUMBER: _ClassVar[int]
+    projects: _containers.RepeatedCompositeFieldContainer[Project]
+    teams: _containers.RepeatedCompositeFieldContainer[Team]
+    def __init__(self, projects: _Optional[_Iterable[_Union[Project, _Mapping]]] = ..., teams: _Optional[_Iterable[_Union[Team, _Mapping]]] = ...) -> None: ...
+
+class Service(_message.Message):
+    __slots__ = ("id", "owners", "metadata_url", "hostname", "access", "jwt_auth")
+    class JWTAuth(_message.Message):
+        __slots__ = ("audience",)
+        AUDIENCE_FIELD_NUMBER: _ClassVar[int]
+        audience: str
+        def __init__(self, audience: _Optional[str] = ...) -> None: ...
+    ID_FIELD_NUMBER: _ClassVar[int]
+    OWNERS_FIELD_NUMBER: _ClassVar[int]
+    METADATA_URL_FIELD_NUMBER: _ClassVar[int]
+    HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    ACCESS_FIELD_NUMBER: _ClassVar[int]
+    JWT_AUTH_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    owners: _containers.RepeatedScalarFieldContainer[str]
+    metadata_url: str
+    hostname: str
+    access: _containers.RepeatedScalarFieldContainer[str]
+    jwt_auth: Service.JWTAuth
+    def __init__(self, id: _Optional[str] = ..., owners: _Optional[_Iterable[str]] = ..., metadata_url: _Optional[str] = ..., hostname: _Optional[str] = ..., access: _Optional[_Iterable[str]] = ..., jwt_auth: _Optional[_Union[Service.JWTAuth, _Mapping]] = ...) -> None: ...
+
+class ServiceDynamicMetadata(_message.Message):
+    __slots__ = ("version", "validation", "supports_gzip_compression")
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    VALIDATION_FIELD_NUMBER: _ClassVar[int]
+    SUPPORTS_GZIP_COMPRESSION_FIELD_NUMBER: _ClassVar[int]
+    version: str
+    validation: Validator
+    supports_gzip_compression: bool
+    def __init__(self, version: _Optional[str] = ..., validation: _Optional[_Union[Validator, _Mapping]] = ..., supports_gzip_compression: bool = ...) -> None: ...
+
+class ServicesCfg(_message.Message):
+    __slots__ = ("services",)
+    SERVICES_FIELD_NUMBER: _ClassVar[int]
+    services: _containers.RepeatedCompositeFieldContainer[Service]
+    def __init__(self, services: _Optional[_Iterable[_Union[Service, _Mapping]]] = ...) -> None: ...
+
+class AclCfg(_message.Message):
+    __slots__ = ("project_access_group", "project_validation_group", "project_reimport_group", "service_access_group", "service_validation_group", "service_reimport_group")
+    PROJECT_ACCESS_GROUP_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_VALIDATION_GROUP_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_REIMPORT_GROUP_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_ACCESS_GROUP_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_VALIDATION_GROUP_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_REIMPORT_GROUP_FIELD_NUMBER: _ClassVar[int]
+    project_access_group: str
+    project_validation_group: str
+    project_reimport_group: str
+    service_access_group: str
+    service_validation_group: str
+    service_reimport_group: str
+    def __init__(self, project_access_group: _Optional[str] = ..., project_validation_group: _Optional[str] = ..., project_reimport_group: _Optional[str] = ..., service_access_group: _Optional[str] = ..., service_validation_group: _Optional[str] = ..., service_reimport_group: _Optional[str] = ...) -> None: ...
+
+class ImportCfg(_message.Message):
+    __slots__ = ("gitiles",)
+    class Gitiles(_message.Message):
+        __slots__ = ("fetch_log_deadline", "fetch_archive_deadline", "project_config_default_ref", "project_config_default_path", "ref_config_default_path")
+        FETCH_LOG_DEADLINE_FIELD_NUMBER: _ClassVar[int]
+        FETCH_ARCHIVE_DEADLINE_FIELD_NUMBER: _ClassVar[int]
+        PROJECT_CONFIG_DEFAULT_REF_FIELD_NUMBER: _ClassVar[int]
+        PROJECT_CONFIG_DEFAULT_PATH_FIELD_NUMBER: _ClassVar[int]
+        REF_CONFIG_DEFAULT_PATH_FIELD_NUMBER: _ClassVar[int]
+        fetch_log_deadline: int
+        fetch_archive_deadline: int
+        project_config_default_ref: str
+        project_config_default_path: str
+        ref_config_default_path: str
+        def __init__(self, fetch_log_deadline: _Optional[int] = ..., fetch_archive_deadline: _Optional[int] = ..., project_config_default_ref: _Optional[str] = ..., project_config_default_path: _Optional[str] = ..., ref_config_default_path: _Optional[str] = ...) -> None: ...
+    GITILES_FIELD_NUMBER: _ClassVar[int]
+    gitiles: ImportCfg.Gitiles
+    def __init__(self, gitiles: _Optional[_Union[ImportCfg.Gitiles, _Mapping]] = ...) -> None: ...
+
+class SchemasCfg(_message.Message):
+    __slots__ = ("schemas",)
+    class Schema(_message.Message):
+        __slots__ = ("name", "url")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        URL_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        url: str
+        def __init__(self, name: _Optional[str] = ..., url: _Optional[str] = ...) -> None: ...
+    SCHEMAS_FIELD_NUMBER: _ClassVar[int]
+    schemas: _containers.RepeatedCompositeFieldContainer[SchemasCfg.Schema]
+    def __init__(self, schemas: _Optional[_Iterable[_Union[SchemasCfg.Schema, _Mapping]]] = ...) -> None: ...
+
+class ConfigPattern(_message.Message):
+    __slots__ = ("config_set", "path")
+    CONFIG_SET_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    config_set: str
+    path: str
+    def __init__(self, config_set: _Optional[str] = ..., path: _Optional[str] = ...) -> None: ...
+
+class Validator(_message.Message):
+    __slots__ = ("patterns", "url")
+    PATTERNS_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    patterns: _containers.RepeatedCompositeFieldContainer[ConfigPattern]
+    url: str
+    def __init__(self, patterns: _Optional[_Iterable[_Union[ConfigPattern, _Mapping]]] = ..., url: _Optional[str] = ...) -> None: ...
+
+class ValidationRequestMessage(_message.Message):
+    __slots__ = ("config_set", "path", "content")
+    CONFIG_SET_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    config_set: str
+    path: str
+    content: bytes
+    def __init__(self, config_set: _Optional[str] = ..., path: _Optional[str] = ..., content: _Optional[bytes] = ...) -> None: ...
+
+class ValidationResponseMessage(_message.Message):
+    __slots__ = ("messages",)
+    class Severity(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        UNKNOWN: _ClassVar[ValidationResponseMessage.Severity]
+        DEBUG: _ClassVar[ValidationResponseMessage.Severity]
+        INFO: _ClassVar[ValidationResponseMessage.Severity]
+        WARNING: _ClassVar[ValidationResponseMessage.Severity]
+        ERROR: _ClassVar[ValidationResponseMessage.Severity]
+        CRITICAL: _ClassVar[ValidationResponseMessage.Severity]
+    UNKNOWN: ValidationResponseMessage.Severity
+    DEBUG: ValidationResponseMessage.Severity
+    INFO: ValidationResponseMessage.Severity
+    WARNING: ValidationResponseMessage.Severity
+    ERROR: ValidationResponseMessage.Severity
+    CRITICAL: ValidationResponseMessage.Severity
+    class Message(_message.Message):
+        __slots__ = ("path", "severity", "text")
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        SEVERITY_FIELD_NUMBER: _ClassVar[int]
+        TEXT_FIELD_NUMBER: _ClassVar[int]
+        path: str
+        severity: ValidationResponseMessage.Severity
+        text: str
+        def __init__(self, path: _Optional[str] = ..., severity: _Optional[_Union[ValidationResponseMessage.Severity, str]] = ..., text: _Optional[str] = ...) -> None: ...
+    MESSAGES_FIELD_NUMBER: _ClassVar[int]
+    messages: _containers.RepeatedCompositeFieldContainer[ValidationResponseMessage.Message]
+    def __init__(self, messages: _Optional[_Iterable[_Union[ValidationResponseMessage.Message, _Mapping]]] = ...) -> None: ...
+
+class ServiceMetadata(_message.Message):
+    __slots__ = ("config_patterns",)
+    CONFIG_PATTERNS_FIELD_NUMBER: _ClassVar[int]
+    config_patterns: _containers.RepeatedCompositeFieldContainer[ConfigPattern]
+    def __init__(self, config_patterns: _Optional[_Iterable[_Union[ConfigPattern, _Mapping]]] = ...) -> None: ...
+
+class ValidateConfigsRequest(_message.Message):
+    __slots__ = ("config_set", "files")
+    class Files(_message.Message):
+        __slots__ = ("files",)
+        FILES_FIELD_NUMBER: _ClassVar[int]
+        files: _containers.RepeatedCompositeFieldContainer[ValidateConfigsRequest.File]
+        def __init__(self, files: _Optional[_Iterable[_Union[ValidateConfigsRequest.File, _Mapping]]] = ...) -> None: ...
+    class File(_message.Message):
+        __slots__ = ("path", "raw_content", "signed_url")
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        RAW_CONTENT_FIELD_NUMBER: _ClassVar[int]
+        SIGNED_URL_FIELD_NUMBER: _ClassVar[int]
+        path: str
+        raw_content: bytes
+        signed_url: str
+        def __init__(self, path: _Optional[str] = ..., raw_content: _Optional[bytes] = ..., signed_url: _Optional[str] = ...) -> None: ...
+    CONFIG_SET_FIELD_NUMBER: _ClassVar[int]
+    FILES_FIELD_NUMBER: _ClassVar[int]
+    config_set: str
+    files: ValidateConfigsRequest.Files
+    def __init__(self, config_set: _Optional[str] = ..., files: _Optional[_Union[ValidateConfigsRequest.Files, _Mapping]] = ...) -> None: ...
+
+class ValidationResult(_message.Message):
+    __slots__ = ("messages",)
+    class Severity(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        UNKNOWN: _ClassVar[ValidationResult.Severity]
+        DEBUG: _ClassVar[ValidationResult.Severity]
+        INFO: _ClassVar[ValidationResult.Severity]
+        WARNING: _ClassVar[ValidationResult.Severity]
+        ERROR: _ClassVar[ValidationResult.Severity]
+        CRITICAL: _ClassVar[ValidationResult.Severity]
+    UNKNOWN: ValidationResult.Severity
+    DEBUG: ValidationResult.Severity
+    INFO: ValidationResult.Severity
+    WARNING: ValidationResult.Severity
+    ERROR: ValidationResult.Severity
+    CRITICAL: ValidationResult.Severity
+    class Message(_message.Message):
+        __slots__ = ("path", "severity", "text")
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        SEVERITY_FIELD_NUMBER: _ClassVar[int]
+        TEXT_FIELD_NUMBER: _ClassVar[int]
+        path: str
+        severity: ValidationResult.Severity
+        text: str
+        def __init__(self, path: _Optional[str] = ..., severity: _Optional[_Union[ValidationResult.Severity, str]] = ..., text: _Optional[str] = ...) -> None: ...
+    MESSAGES_FIELD_NUMBER: _ClassVar[int]
+    messages: _containers.RepeatedCompositeFieldContainer[ValidationResult.Message]
+    def __init__(self, messages: _Optional[_Iterable[_Union[ValidationResult.Message, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/examples/examples.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/examples/examples.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/common/proto/examples/examples.proto\x12\x08\x65xamples\"4\n\x0bListRequest\x12\x12\n\npage_token\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\"8\n\x0cListResponse\x12\x0f\n\x07records\x18\x01 \x03(\t\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\tB,Z*go.chromium.org/luci/common/proto/examplesb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.examples.examples_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z*go.chromium.org/luci/common/proto/examples'
+  _globals['_LISTREQUEST']._serialized_start=71
+  _globals['_LISTREQUEST']._serialized_end=123
+  _globals['_LISTRESPONSE']._serialized_start=125
+  _globals['_LISTRESPONSE']._serialized_end=181
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/findings/findings.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/findings/findings.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/common/proto/findings/findings.proto\x12\rluci.findings\"4\n\x08\x46indings\x12(\n\x08\x66indings\x18\x01 \x03(\x0b\x32\x16.luci.findings.Finding\"\xc5\x02\n\x07\x46inding\x12\x10\n\x08\x63\x61tegory\x18\x01 \x01(\t\x12)\n\x08location\x18\x02 \x01(\x0b\x32\x17.luci.findings.Location\x12\x0f\n\x07message\x18\x03 \x01(\t\x12<\n\x0eseverity_level\x18\x04 \x01(\x0e\x32$.luci.findings.Finding.SeverityLevel\x12!\n\x05\x66ixes\x18\x05 \x03(\x0b\x32\x12.luci.findings.Fix\x12\x0b\n\x03url\x18\x06 \x01(\t\"~\n\rSeverityLevel\x12\x1e\n\x1aSEVERITY_LEVEL_UNSPECIFIED\x10\x00\x12\x17\n\x13SEVERITY_LEVEL_INFO\x10\x01\x12\x1a\n\x16SEVERITY_LEVEL_WARNING\x10\x02\x12\x18\n\x14SEVERITY_LEVEL_ERROR\x10\x03\"\xd4\x02\n\x08Location\x12J\n\x11gerrit_change_ref\x18\x01 \x01(\x0b\x32-.luci.findings.Location.GerritChangeReferenceH\x00\x12\x11\n\tfile_path\x18\x02 \x01(\t\x12,\n\x05range\x18\x03 \x01(\x0b\x32\x1d.luci.findings.Location.Range\x1aX\n\x15GerritChangeReference\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0e\n\x06\x63hange\x18\x03 \x01(\x03\x12\x10\n\x08patchset\x18\x04 \x01(\x03\x1aW\n\x05Range\x12\x12\n\nstart_line\x18\x01 \x01(\x05\x12\x14\n\x0cstart_column\x18\x02 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x03 \x01(\x05\x12\x12\n\nend_column\x18\x04 \x01(\x05\x42\x08\n\x06source\"\x9f\x01\n\x03\x46ix\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x34\n\x0creplacements\x18\x02 \x03(\x0b\x32\x1e.luci.findings.Fix.Replacement\x1aM\n\x0bReplacement\x12)\n\x08location\x18\x01 \x01(\x0b\x32\x17.luci.findings.Location\x12\x13\n\x0bnew_content\x18\x02 \x01(\tB5Z3go.chromium.org/luci/common/proto/findings;findingsb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.findings.findings_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z3go.chromium.org/luci/common/proto/findings;findings'
+  _globals['_FINDINGS']._serialized_start=76
+  _globals['_FINDINGS']._serialized_end=128
+  _globals['_FINDING']._serialized_start=131
+  _globals['_FINDING']._serialized_end=456
+  _globals['_FINDING_SEVERITYLEVEL']._serialized_start=330
+  _globals['_FINDING_SEVERITYLEVEL']._serialized_end=456
+  _globals['_LOCATION']._serialized_start=459
+  _globals['_LOCATION']._serialized_end=799
+  _globals['_LOCATION_GERRITCHANGEREFERENCE']._serialized_start=612
+  _globals['_LOCATION_GERRITCHANGEREFERENCE']._serialized_end=700
+  _globals['_LOCATION_RANGE']._serialized_start=702
+  _globals['_LOCATION_RANGE']._serialized_end=789
+  _globals['_FIX']._serialized_start=802
+  _globals['_FIX']._serialized_end=961
+  _globals['_FIX_REPLACEMENT']._serialized_start=884
+  _globals['_FIX_REPLACEMENT']._serialized_end=961
+# @@protoc_insertion_point(module_scope)
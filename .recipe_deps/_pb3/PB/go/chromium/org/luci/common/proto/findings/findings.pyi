@@ -0,0 +1,87 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Findings(_message.Message):
+    __slots__ = ("findings",)
+    FINDINGS_FIELD_NUMBER: _ClassVar[int]
+    findings: _containers.RepeatedCompositeFieldContainer[Finding]
+    def __init__(self, findings: _Optional[_Iterable[_Union[Finding, _Mapping]]] = ...) -> None: ...
+
+class Finding(_message.Message):
+    __slots__ = ("category", "location", "message", "severity_level", "fixes", "url")
+    class SeverityLevel(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        SEVERITY_LEVEL_UNSPECIFIED: _ClassVar[Finding.SeverityLevel]
+        SEVERITY_LEVEL_INFO: _ClassVar[Finding.SeverityLevel]
+        SEVERITY_LEVEL_WARNING: _ClassVar[Finding.SeverityLevel]
+        SEVERITY_LEVEL_ERROR: _ClassVar[Finding.SeverityLevel]
+    SEVERITY_LEVEL_UNSPECIFIED: Finding.SeverityLevel
+    SEVERITY_LEVEL_INFO: Finding.SeverityLevel
+    SEVERITY_LEVEL_WARNING: Finding.SeverityLevel
+    SEVERITY_LEVEL_ERROR: Finding.SeverityLevel
+    CATEGORY_FIELD_NUMBER: _ClassVar[int]
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    SEVERITY_LEVEL_FIELD_NUMBER: _ClassVar[int]
+    FIXES_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    category: str
+    location: Location
+    message: str
+    severity_level: Finding.SeverityLevel
+    fixes: _containers.RepeatedCompositeFieldContainer[Fix]
+    url: str
+    def __init__(self, category: _Optional[str] = ..., location: _Optional[_Union[Location, _Mapping]] = ..., message: _Optional[str] = ..., severity_level: _Optional[_Union[Finding.SeverityLevel, str]] = ..., fixes: _Optional[_Iterable[_Union[Fix, _Mapping]]] = ..., url: _Optional[str] = ...) -> None: ...
+
+class Location(_message.Message):
+    __slots__ = ("gerrit_change_ref", "file_path", "range")
+    class GerritChangeReference(_message.Message):
+        __slots__ = ("host", "project", "change", "patchset")
+        HOST_FIELD_NUMBER: _ClassVar[int]
+        PROJECT_FIELD_NUMBER: _ClassVar[int]
+        CHANGE_FIELD_NUMBER: _ClassVar[int]
+        PATCHSET_FIELD_NUMBER: _ClassVar[int]
+        host: str
+        project: str
+        change: int
+        patchset: int
+        def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., change: _Optional[int] = ..., patchset: _Optional[int] = ...) -> None: ...
+    class Range(_message.Message):
+        __slots__ = ("start_line", "start_column", "end_line", "end_column")
+        START_LINE_FIELD_NUMBER: _ClassVar[int]
+        START_COLUMN_FIELD_NUMBER: _ClassVar[int]
+        END_LINE_FIELD_NUMBER: _ClassVar[int]
+        END_COLUMN_FIELD_NUMBER: _ClassVar[int]
+        start_line: int
+        start_column: int
+        end_line: int
+        end_column: int
+        def __init__(self, start_line: _Optional[int] = ..., start_column: _Optional[int] = ..., end_line: _Optional[int] = ..., end_column: _Optional[int] = ...) -> None: ...
+    GERRIT_CHANGE_REF_FIELD_NUMBER: _ClassVar[int]
+    FILE_PATH_FIELD_NUMBER: _ClassVar[int]
+    RANGE_FIELD_NUMBER: _ClassVar[int]
+    gerrit_change_ref: Location.GerritChangeReference
+    file_path: str
+    range: Location.Range
+    def __init__(self, gerrit_change_ref: _Optional[_Union[Location.GerritChangeReference, _Mapping]] = ..., file_path: _Optional[str] = ..., range: _Optional[_Union[Location.Range, _Mapping]] = ...) -> None: ...
+
+class Fix(_message.Message):
+    __slots__ = ("description", "replacements")
+    class Replacement(_message.Message):
+        __slots__ = ("location", "new_content")
+        LOCATION_FIELD_NUMBER: _ClassVar[int]
+        NEW_CONTENT_FIELD_NUMBER: _ClassVar[int]
+        location: Location
+        new_content: str
+        def __init__(self, location: _Optional[_Union[Location, _Mapping]] = ..., new_content: _Optional[str] = ...) -> None: ...
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REPLACEMENTS_FIELD_NUMBER: _ClassVar[int]
+    description: str
+    replacements: _containers.RepeatedCompositeFieldContainer[Fix.Replacement]
+    def __init__(self, description: _Optional[str] = ..., replacements: _Optional[_Iterable[_Union[Fix.Replacement, _Mapping]]] = ...) -> None: ...
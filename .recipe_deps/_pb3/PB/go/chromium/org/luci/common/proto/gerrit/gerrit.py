@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/gerrit/gerrit.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/gerrit/gerrit.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5go.chromium.org/luci/common/proto/gerrit/gerrit.proto\x12\x06gerrit\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\xc9\x02\n\rNotifyDetails\x12\x33\n\nrecipients\x18\x01 \x03(\x0b\x32\x1f.gerrit.NotifyDetails.Recipient\x1a\x18\n\x04Info\x12\x10\n\x08\x61\x63\x63ounts\x18\x01 \x03(\x03\x1ar\n\tRecipient\x12;\n\x0erecipient_type\x18\x01 \x01(\x0e\x32#.gerrit.NotifyDetails.RecipientType\x12(\n\x04info\x18\x02 \x01(\x0b\x32\x1a.gerrit.NotifyDetails.Info\"u\n\rRecipientType\x12\x1e\n\x1aRECIPIENT_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11RECIPIENT_TYPE_TO\x10\x01\x12\x15\n\x11RECIPIENT_TYPE_CC\x10\x02\x12\x16\n\x12RECIPIENT_TYPE_BCC\x10\x03\"h\n\x12ListChangesRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12$\n\x07options\x18\x02 \x03(\x0e\x32\x13.gerrit.QueryOption\x12\r\n\x05limit\x18\x03 \x01(\x03\x12\x0e\n\x06offset\x18\x04 \x01(\x03\"P\n\x13ListChangesResponse\x12#\n\x07\x63hanges\x18\x01 \x03(\x0b\x32\x12.gerrit.ChangeInfo\x12\x14\n\x0cmore_changes\x18\x02 \x01(\x08\"g\n\x10GetChangeRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12$\n\x07options\x18\x02 \x03(\x0e\x32\x13.gerrit.QueryOption\x12\x0f\n\x07project\x18\x03 \x01(\t\x12\x0c\n\x04meta\x18\x04 \x01(\t\"x\n\x0b\x41\x63\x63ountInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x18\n\x10secondary_emails\x18\x03 \x03(\t\x12\x10\n\x08username\x18\x04 \x01(\t\x12\x12\n\naccount_id\x18\x05 \x01(\x03\x12\x0c\n\x04tags\x18\x06 \x03(\t\",\n\rGitPersonInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\"\x86\x07\n\nChangeInfo\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\"\n\x05owner\x18\x02 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12\x0f\n\x07project\x18\x03 \x01(\t\x12\x0b\n\x03ref\x18\x04 \x01(\t\x12$\n\x06status\x18\x05 \x01(\x0e\x32\x14.gerrit.ChangeStatus\x12\x18\n\x10\x63urrent_revision\x18\x06 \x01(\t\x12\x34\n\trevisions\x18\x07 \x03(\x0b\x32!.gerrit.ChangeInfo.RevisionsEntry\x12.\n\x06labels\x18\x08 \x03(\x0b\x32\x1e.gerrit.ChangeInfo.LabelsEntry\x12+\n\x08messages\x18\t \x03(\x0b\x32\x19.gerrit.ChangeMessageInfo\x12-\n\x0crequirements\x18\x0e \x03(\x0b\x32\x13.gerrit.RequirementB\x02\x18\x01\x12\x13\n\x0bsubmittable\x18\n \x01(\x08\x12\x12\n\nis_private\x18\r \x01(\x08\x12\x10\n\x08hashtags\x18\x13 \x03(\t\x12+\n\x07\x63reated\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12+\n\x07updated\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12-\n\tsubmitted\x18\x15 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\trevert_of\x18\x0f \x01(\x03\x12\x1d\n\x15\x63herry_pick_of_change\x18\x10 \x01(\x03\x12,\n\treviewers\x18\x11 \x01(\x0b\x32\x19.gerrit.ReviewerStatusMap\x12\x13\n\x0bmeta_rev_id\x18\x12 \x01(\t\x12@\n\x13submit_requirements\x18\x14 \x03(\x0b\x32#.gerrit.SubmitRequirementResultInfo\x12\x0f\n\x07subject\x18\x16 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x17 \x01(\t\x1a\x46\n\x0eRevisionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.gerrit.RevisionInfo:\x02\x38\x01\x1a@\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12 \n\x05value\x18\x02 \x01(\x0b\x32\x11.gerrit.LabelInfo:\x02\x38\x01\"\x83\x01\n\x11ReviewerStatusMap\x12&\n\treviewers\x18\x01 \x03(\x0b\x32\x13.gerrit.AccountInfo\x12 \n\x03\x63\x63s\x18\x02 \x03(\x0b\x32\x13.gerrit.AccountInfo\x12$\n\x07removed\x18\x03 \x03(\x0b\x32\x13.gerrit.AccountInfo\"\xf6\x03\n\x0cRevisionInfo\x12\'\n\x04kind\x18\x01 \x01(\x0e\x32\x19.gerrit.RevisionInfo.Kind\x12\x0e\n\x06number\x18\x02 \x01(\x05\x12%\n\x08uploader\x18\x03 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12\x0b\n\x03ref\x18\x04 \x01(\t\x12+\n\x07\x63reated\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\"\n\x06\x63ommit\x18\x05 \x01(\x0b\x32\x12.gerrit.CommitInfo\x12.\n\x05\x66iles\x18\x06 \x03(\x0b\x32\x1f.gerrit.RevisionInfo.FilesEntry\x1a>\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1f\n\x05value\x18\x02 \x01(\x0b\x32\x10.gerrit.FileInfo:\x02\x38\x01\"\xa2\x01\n\x04Kind\x12\x10\n\x0cKIND_INVALID\x10\x00\x12\n\n\x06REWORK\x10\x01\x12\x12\n\x0eTRIVIAL_REBASE\x10\x02\x12\x1d\n\x19MERGE_FIRST_PARENT_UPDATE\x10\x03\x12\x12\n\x0eNO_CODE_CHANGE\x10\x04\x12\r\n\tNO_CHANGE\x10\x05\x12&\n\"TRIVIAL_REBASE_WITH_MESSAGE_UPDATE\x10\x06\"\x92\x01\n\nCommitInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12*\n\x07parents\x18\x02 \x03(\x0b\x32\x19.gerrit.CommitInfo.Parent\x12\x0f\n\x07message\x18\x03 \x01(\t\x12%\n\x06\x61uthor\x18\x04 \x01(\x0b\x32\x15.gerrit.GitPersonInfo\x1a\x14\n\x06Parent\x12\n\n\x02id\x18\x01 \x01(\t\"\xf5\x02\n\tLabelInfo\x12\x10\n\x08optional\x18\x01 \x01(\x08\x12%\n\x08\x61pproved\x18\x02 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12%\n\x08rejected\x18\x03 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12(\n\x0brecommended\x18\x04 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12%\n\x08\x64isliked\x18\x05 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12\x10\n\x08\x62locking\x18\x06 \x01(\x08\x12\r\n\x05value\x18\x07 \x01(\x05\x12\x15\n\rdefault_value\x18\x08 \x01(\x05\x12!\n\x03\x61ll\x18\t \x03(\x0b\x32\x14.gerrit.ApprovalInfo\x12-\n\x06values\x18\n \x03(\x0b\x32\x1d.gerrit.LabelInfo.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xc5\x01\n\x0c\x41pprovalInfo\x12!\n\x04user\x18\x01 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12\r\n\x05value\x18\x02 \x01(\x05\x12\x37\n\x16permitted_voting_range\x18\x03 \x01(\x0b\x32\x17.gerrit.VotingRangeInfo\x12(\n\x04\x64\x61te\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0b\n\x03tag\x18\x05 \x01(\t\x12\x13\n\x0bpost_submit\x18\x06 \x01(\x08\"+\n\x0fVotingRangeInfo\x12\x0b\n\x03min\x18\x01 \x01(\x05\x12\x0b\n\x03max\x18\x02 \x01(\x05\"\xb6\x01\n\x11\x43hangeMessageInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12#\n\x06\x61uthor\x18\x02 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12(\n\x0breal_author\x18\x03 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12(\n\x04\x64\x61te\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07message\x18\x05 \x01(\t\x12\x0b\n\x03tag\x18\x06 \x01(\t\"\xed\x01\n\x0bRequirement\x12*\n\x06status\x18\x01 \x01(\x0e\x32\x1a.gerrit.Requirement.Status\x12\x15\n\rfallback_text\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\"\x8c\x01\n\x06Status\x12\"\n\x1eREQUIREMENT_STATUS_UNSPECIFIED\x10\x00\x12\x19\n\x15REQUIREMENT_STATUS_OK\x10\x01\x12 \n\x1cREQUIREMENT_STATUS_NOT_READY\x10\x02\x12!\n\x1dREQUIREMENT_STATUS_RULE_ERROR\x10\x03\"\xda\x01\n\x08\x46ileInfo\x12\'\n\x06status\x18\x01 \x01(\x0e\x32\x17.gerrit.FileInfo.Status\x12\x0e\n\x06\x62inary\x18\x02 \x01(\x08\x12\x10\n\x08old_path\x18\x03 \x01(\t\x12\x16\n\x0elines_inserted\x18\x04 \x01(\x05\x12\x15\n\rlines_deleted\x18\x05 \x01(\x05\x12\x12\n\nsize_delta\x18\x06 \x01(\x03\x12\x0c\n\x04size\x18\x07 \x01(\x03\"2\n\x06Status\x12\x05\n\x01M\x10\x00\x12\x05\n\x01\x41\x10\x01\x12\x05\n\x01\x44\x10\x02\x12\x05\n\x01R\x10\x03\x12\x05\n\x01\x43\x10\x04\x12\x05\n\x01W\x10\x05\"y\n\x13\x43reateChangeRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0b\n\x03ref\x18\x02 \x01(\t\x12\x0f\n\x07subject\x18\x03 \x01(\t\x12\x13\n\x0b\x62\x61se_commit\x18\x04 \x01(\t\x12\x1e\n\x06notify\x18\x05 \x01(\x0e\x32\x0e.gerrit.Notify\"6\n\x13SubmitChangeRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\"M\n\x15SubmitRevisionRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x13\n\x0brevision_id\x18\x02 \x01(\t\x12\x0f\n\x07project\x18\x05 \x01(\t\"2\n\nSubmitInfo\x12$\n\x06status\x18\x01 \x01(\x0e\x32\x14.gerrit.ChangeStatus\"c\n\x1c\x43hangeEditFileContentRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x11\n\tfile_path\x18\x03 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\x0c\"R\n\x1c\x44\x65leteEditFileContentRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x11\n\tfile_path\x18\x03 \x01(\t\";\n\x18\x43hangeEditPublishRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\"G\n\x13RevertChangeRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"H\n\x14\x41\x62\x61ndonChangeRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"\x94\x02\n\x12\x41\x64\x64ReviewerRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x10\n\x08reviewer\x18\x03 \x01(\t\x12/\n\x05state\x18\x04 \x01(\x0e\x32 .gerrit.AddReviewerRequest.State\x12\x11\n\tconfirmed\x18\x05 \x01(\x08\x12\x1e\n\x06notify\x18\x06 \x01(\x0e\x32\x0e.gerrit.Notify\"g\n\x05State\x12\"\n\x1e\x41\x44\x44_REVIEWER_STATE_UNSPECIFIED\x10\x00\x12\x1f\n\x1b\x41\x44\x44_REVIEWER_STATE_REVIEWER\x10\x01\x12\x19\n\x15\x41\x44\x44_REVIEWER_STATE_CC\x10\x02\"\x9e\x01\n\x0cReviewerInfo\x12$\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x13.gerrit.AccountInfo\x12\x36\n\tapprovals\x18\x02 \x03(\x0b\x32#.gerrit.ReviewerInfo.ApprovalsEntry\x1a\x30\n\x0e\x41pprovalsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"\x8e\x01\n\x11\x41\x64\x64ReviewerResult\x12\r\n\x05input\x18\x01 \x01(\t\x12\'\n\treviewers\x18\x02 \x03(\x0b\x32\x14.gerrit.ReviewerInfo\x12!\n\x03\x63\x63s\x18\x03 \x03(\x0b\x32\x14.gerrit.ReviewerInfo\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12\x0f\n\x07\x63onfirm\x18\x05 \x01(\x08\"L\n\x15\x44\x65leteReviewerRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x12\n\naccount_id\x18\x03 \x01(\t\"\xa8\x04\n\x10SetReviewRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x13\n\x0brevision_id\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x34\n\x06labels\x18\x05 \x03(\x0b\x32$.gerrit.SetReviewRequest.LabelsEntry\x12\x0b\n\x03tag\x18\x06 \x01(\t\x12\x1e\n\x06notify\x18\x07 \x01(\x0e\x32\x0e.gerrit.Notify\x12-\n\x0enotify_details\x18\x08 \x01(\x0b\x32\x15.gerrit.NotifyDetails\x12\x14\n\x0con_behalf_of\x18\t \x01(\x03\x12\r\n\x05ready\x18\n \x01(\x08\x12\x18\n\x10work_in_progress\x18\x0b \x01(\x08\x12\x37\n\x14\x61\x64\x64_to_attention_set\x18\x0c \x03(\x0b\x32\x19.gerrit.AttentionSetInput\x12<\n\x19remove_from_attention_set\x18\r \x03(\x0b\x32\x19.gerrit.AttentionSetInput\x12,\n$ignore_automatic_attention_set_rules\x18\x0e \x01(\x08\x12(\n\treviewers\x18\x0f \x03(\x0b\x32\x15.gerrit.ReviewerInput\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"\xbc\x01\n\rReviewerInput\x12\x10\n\x08reviewer\x18\x01 \x01(\t\x12*\n\x05state\x18\x02 \x01(\x0e\x32\x1b.gerrit.ReviewerInput.State\"m\n\x05State\x12$\n REVIEWER_INPUT_STATE_UNSPECIFIED\x10\x00\x12!\n\x1dREVIEWER_INPUT_STATE_REVIEWER\x10\x01\x12\x1b\n\x17REVIEWER_INPUT_STATE_CC\x10\x02\"\xf4\x01\n\x0cReviewResult\x12\x30\n\x06labels\x18\x01 \x03(\x0b\x32 .gerrit.ReviewResult.LabelsEntry\x12\x36\n\treviewers\x18\x02 \x03(\x0b\x32#.gerrit.ReviewResult.ReviewersEntry\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1aK\n\x0eReviewersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.gerrit.AddReviewerResult:\x02\x38\x01\"`\n\x13\x41ttentionSetRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12(\n\x05input\x18\x06 \x01(\x0b\x32\x19.gerrit.AttentionSetInput\"\x80\x01\n\x11\x41ttentionSetInput\x12\x0c\n\x04user\x18\x01 \x01(\t\x12\x0e\n\x06reason\x18\x02 \x01(\t\x12\x1e\n\x06notify\x18\x03 \x01(\x0e\x32\x0e.gerrit.Notify\x12-\n\x0enotify_details\x18\x04 \x01(\x0b\x32\x15.gerrit.NotifyDetails\"\x88\x01\n\x13GetMergeableRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x13\n\x0brevision_id\x18\x03 \x01(\t\x12\x0e\n\x06source\x18\x04 \x01(\t\x12+\n\x08strategy\x18\x05 \x01(\x0e\x32\x19.gerrit.MergeableStrategy\"\x8a\x03\n\rMergeableInfo\x12\x35\n\x0bsubmit_type\x18\x01 \x01(\x0e\x32 .gerrit.MergeableInfo.SubmitType\x12+\n\x08strategy\x18\x02 \x01(\x0e\x32\x19.gerrit.MergeableStrategy\x12\x11\n\tmergeable\x18\x03 \x01(\x08\x12\x15\n\rcommit_merged\x18\x04 \x01(\x08\x12\x16\n\x0e\x63ontent_merged\x18\x05 \x01(\x08\x12\x11\n\tconflicts\x18\x06 \x03(\t\x12\x16\n\x0emergeable_into\x18\x07 \x03(\t\"\xa7\x01\n\nSubmitType\x12\x1b\n\x17SUBMIT_TYPE_UNSPECIFIED\x10\x00\x12\x16\n\x12MERGE_IF_NECESSARY\x10\x01\x12\x15\n\x11\x46\x41ST_FORWARD_ONLY\x10\x02\x12\x17\n\x13REBASE_IF_NECESSARY\x10\x03\x12\x11\n\rREBASE_ALWAYS\x10\x04\x12\x10\n\x0cMERGE_ALWAYS\x10\x05\x12\x0f\n\x0b\x43HERRY_PICK\x10\x06\"\x7f\n\x10ListFilesRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x13\n\x0brevision_id\x18\x03 \x01(\t\x12\x17\n\x0fsubstring_query\x18\x04 \x01(\t\x12\x0e\n\x06parent\x18\x05 \x01(\x03\x12\x0c\n\x04\x62\x61se\x18\x06 \x01(\t\"\x88\x01\n\x11ListFilesResponse\x12\x33\n\x05\x66iles\x18\x01 \x03(\x0b\x32$.gerrit.ListFilesResponse.FilesEntry\x1a>\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1f\n\x05value\x18\x02 \x01(\x0b\x32\x10.gerrit.FileInfo:\x02\x38\x01\"P\n\x18GetRelatedChangesRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x13\n\x0brevision_id\x18\x03 \x01(\t\"\x8a\x02\n\x19GetRelatedChangesResponse\x12\x42\n\x07\x63hanges\x18\x01 \x03(\x0b\x32\x31.gerrit.GetRelatedChangesResponse.ChangeAndCommit\x1a\xa8\x01\n\x0f\x43hangeAndCommit\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\"\n\x06\x63ommit\x18\x02 \x01(\x0b\x32\x12.gerrit.CommitInfo\x12\x0e\n\x06number\x18\x03 \x01(\x03\x12\x10\n\x08patchset\x18\x04 \x01(\x03\x12\x18\n\x10\x63urrent_patchset\x18\x05 \x01(\x03\x12$\n\x06status\x18\x06 \x01(\x0e\x32\x14.gerrit.ChangeStatus\"#\n\x13ListProjectsRequest\x12\x0c\n\x04refs\x18\x01 \x03(\t\";\n\x0bWebLinkInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x11\n\timage_url\x18\x03 \x01(\t\"\xe5\x02\n\x0bProjectInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06parent\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12(\n\x05state\x18\x04 \x01(\x0e\x32\x19.gerrit.ProjectInfo.State\x12+\n\x04refs\x18\x05 \x03(\x0b\x32\x1d.gerrit.ProjectInfo.RefsEntry\x12&\n\tweb_links\x18\x06 \x03(\x0b\x32\x13.gerrit.WebLinkInfo\x1a+\n\tRefsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"w\n\x05State\x12\x1d\n\x19PROJECT_STATE_UNSPECIFIED\x10\x00\x12\x18\n\x14PROJECT_STATE_ACTIVE\x10\x01\x12\x1b\n\x17PROJECT_STATE_READ_ONLY\x10\x02\x12\x18\n\x14PROJECT_STATE_HIDDEN\x10\x03\"\x9a\x01\n\x14ListProjectsResponse\x12<\n\x08Projects\x18\x01 \x03(\x0b\x32*.gerrit.ListProjectsResponse.ProjectsEntry\x1a\x44\n\rProjectsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\"\n\x05value\x18\x02 \x01(\x0b\x32\x13.gerrit.ProjectInfo:\x02\x38\x01\".\n\x0eRefInfoRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0b\n\x03ref\x18\x02 \x01(\t\"(\n\x07RefInfo\x12\x0b\n\x03ref\x18\x01 \x01(\t\x12\x10\n\x08revision\x18\x02 \x01(\t\"5\n\x0e\x41\x63\x63ountOptions\x12\x0f\n\x07\x64\x65tails\x18\x01 \x01(\x08\x12\x12\n\nall_emails\x18\x02 \x01(\x08\"l\n\x15ListFileOwnersRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0b\n\x03ref\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\x12\'\n\x07options\x18\x04 \x01(\x0b\x32\x16.gerrit.AccountOptions\"1\n\tOwnerInfo\x12$\n\x07\x61\x63\x63ount\x18\x01 \x01(\x0b\x32\x13.gerrit.AccountInfo\"7\n\x12ListOwnersResponse\x12!\n\x06owners\x18\x01 \x03(\x0b\x32\x11.gerrit.OwnerInfo\"K\n\tEmailInfo\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x11\n\tpreferred\x18\x02 \x01(\x08\x12\x1c\n\x14pending_confirmation\x18\x03 \x01(\x08\")\n\x18ListAccountEmailsRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\">\n\x19ListAccountEmailsResponse\x12!\n\x06\x65mails\x18\x01 \x03(\x0b\x32\x11.gerrit.EmailInfo\"0\n\x10\x43heckRaptRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0b\n\x03ref\x18\x02 \x01(\t\"B\n\x11\x43heckRaptResponse\x12\x16\n\x0ehas_valid_rapt\x18\x01 \x01(\x08\x12\x15\n\rrapt_required\x18\x02 \x01(\x08\"7\n\x14GetPureRevertRequest\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\"(\n\x0ePureRevertInfo\x12\x16\n\x0eis_pure_revert\x18\x01 \x01(\x08\"\x92\x04\n\x1bSubmitRequirementResultInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12:\n\x06status\x18\x03 \x01(\x0e\x32*.gerrit.SubmitRequirementResultInfo.Status\x12\x11\n\tis_legacy\x18\x04 \x01(\x08\x12P\n\x1f\x61pplicability_expression_result\x18\x05 \x01(\x0b\x32\'.gerrit.SubmitRequirementExpressionInfo\x12Q\n submittability_expression_result\x18\x06 \x01(\x0b\x32\'.gerrit.SubmitRequirementExpressionInfo\x12K\n\x1aoverride_expression_result\x18\x07 \x01(\x0b\x32\'.gerrit.SubmitRequirementExpressionInfo\"\x8e\x01\n\x06Status\x12)\n%SUBMIT_REQUIREMENT_STATUS_UNSPECIFIED\x10\x00\x12\r\n\tSATISFIED\x10\x01\x12\x0f\n\x0bUNSATISFIED\x10\x02\x12\x0e\n\nOVERRIDDEN\x10\x03\x12\x12\n\x0eNOT_APPLICABLE\x10\x04\x12\t\n\x05\x45RROR\x10\x05\x12\n\n\x06\x46ORCED\x10\x06\"\x8d\x01\n\x1fSubmitRequirementExpressionInfo\x12\x12\n\nexpression\x18\x01 \x01(\t\x12\x11\n\tfulfilled\x18\x02 \x01(\x08\x12\x15\n\rpassing_atoms\x18\x03 \x03(\t\x12\x15\n\rfailing_atoms\x18\x04 \x03(\t\x12\x15\n\rerror_message\x18\x05 \x01(\t\"v\n\x12GetMetaDiffRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0e\n\x06number\x18\x02 \x01(\x03\x12\x0b\n\x03old\x18\x03 \x01(\t\x12\x0c\n\x04meta\x18\x04 \x01(\t\x12$\n\x07options\x18\x05 \x03(\x0e\x32\x13.gerrit.QueryOption\"\xac\x01\n\x08MetaDiff\x12!\n\x05\x61\x64\x64\x65\x64\x18\x01 \x01(\x0b\x32\x12.gerrit.ChangeInfo\x12#\n\x07removed\x18\x02 \x01(\x0b\x32\x12.gerrit.ChangeInfo\x12+\n\x0fold_change_info\x18\x03 \x01(\x0b\x32\x12.gerrit.ChangeInfo\x12+\n\x0fnew_change_info\x18\x04 \x01(\x0b\x32\x12.gerrit.ChangeInfo*\x89\x04\n\x0bQueryOption\x12\x16\n\x12OPTION_UNSPECIFIED\x10\x00\x12\n\n\x06LABELS\x10\x01\x12\x13\n\x0f\x44\x45TAILED_LABELS\x10\x02\x12\x14\n\x10\x43URRENT_REVISION\x10\x04\x12\x11\n\rALL_REVISIONS\x10\x08\x12\x12\n\x0e\x43URRENT_COMMIT\x10\x10\x12\x0f\n\x0b\x41LL_COMMITS\x10 \x12\x11\n\rCURRENT_FILES\x10@\x12\x0e\n\tALL_FILES\x10\x80\x01\x12\x16\n\x11\x44\x45TAILED_ACCOUNTS\x10\x80\x02\x12\x15\n\x10REVIEWER_UPDATES\x10\x80\x04\x12\r\n\x08MESSAGES\x10\x80\x08\x12\x14\n\x0f\x43URRENT_ACTIONS\x10\x80\x10\x12\x13\n\x0e\x43HANGE_ACTIONS\x10\x80 \x12\r\n\x08REVIEWED\x10\x80@\x12\x14\n\x0eSKIP_MERGEABLE\x10\x80\x80\x01\x12\x11\n\x0bSUBMITTABLE\x10\x80\x80\x02\x12\x0f\n\tWEB_LINKS\x10\x80\x80\x04\x12\x0b\n\x05\x43HECK\x10\x80\x80\x08\x12\x14\n\x0e\x43OMMIT_FOOTERS\x10\x80\x80\x10\x12\x17\n\x11PUSH_CERTIFICATES\x10\x80\x80 \x12\x12\n\x0cTRACKING_IDS\x10\x80\x80@\x12\x18\n\x11\x44OWNLOAD_COMMANDS\x10\x80\x80\x80\x01\x12\x1a\n\x13SUBMIT_REQUIREMENTS\x10\x80\x80\x80\x02\x12\x18\n\x10MAX_QUERY_OPTION\x10\x80\x80\x80\x80\x04*o\n\x06Notify\x12\x16\n\x12NOTIFY_UNSPECIFIED\x10\x00\x12\x0f\n\x0bNOTIFY_NONE\x10\x01\x12\x10\n\x0cNOTIFY_OWNER\x10\x02\x12\x1a\n\x16NOTIFY_OWNER_REVIEWERS\x10\x03\x12\x0e\n\nNOTIFY_ALL\x10\x04*M\n\x0c\x43hangeStatus\x12\x19\n\x15\x43HANGE_STATUS_INVALID\x10\x00\x12\x07\n\x03NEW\x10\x01\x12\n\n\x06MERGED\x10\x02\x12\r\n\tABANDONED\x10\x03*\x85\x01\n\x11MergeableStrategy\x12\"\n\x1eMERGEABLE_STRATEGY_UNSPECIFIED\x10\x00\x12\r\n\tRECURSIVE\x10\x01\x12\x0b\n\x07RESOLVE\x10\x02\x12\x1a\n\x16SIMPLE_TWO_WAY_IN_CORE\x10\x03\x12\x08\n\x04OURS\x10\x04\x12\n\n\x06THEIRS\x10\x05\x32\xb5\r\n\x06Gerrit\x12I\n\x0cListProjects\x12\x1b.gerrit.ListProjectsRequest\x1a\x1c.gerrit.ListProjectsResponse\x12\x35\n\nGetRefInfo\x12\x16.gerrit.RefInfoRequest\x1a\x0f.gerrit.RefInfo\x12K\n\x0eListFileOwners\x12\x1d.gerrit.ListFileOwnersRequest\x1a\x1a.gerrit.ListOwnersResponse\x12X\n\x11ListAccountEmails\x12 .gerrit.ListAccountEmailsRequest\x1a!.gerrit.ListAccountEmailsResponse\x12@\n\tCheckRapt\x12\x18.gerrit.CheckRaptRequest\x1a\x19.gerrit.CheckRaptResponse\x12\x46\n\x0bListChanges\x12\x1a.gerrit.ListChangesRequest\x1a\x1b.gerrit.ListChangesResponse\x12\x39\n\tGetChange\x12\x18.gerrit.GetChangeRequest\x1a\x12.gerrit.ChangeInfo\x12\x42\n\x0cGetMergeable\x12\x1b.gerrit.GetMergeableRequest\x1a\x15.gerrit.MergeableInfo\x12@\n\tListFiles\x12\x18.gerrit.ListFilesRequest\x1a\x19.gerrit.ListFilesResponse\x12X\n\x11GetRelatedChanges\x12 .gerrit.GetRelatedChangesRequest\x1a!.gerrit.GetRelatedChangesResponse\x12\x45\n\rGetPureRevert\x12\x1c.gerrit.GetPureRevertRequest\x1a\x16.gerrit.PureRevertInfo\x12;\n\x0bGetMetaDiff\x12\x1a.gerrit.GetMetaDiffRequest\x1a\x10.gerrit.MetaDiff\x12?\n\x0c\x43reateChange\x12\x1b.gerrit.CreateChangeRequest\x1a\x12.gerrit.ChangeInfo\x12U\n\x15\x43hangeEditFileContent\x12$.gerrit.ChangeEditFileContentRequest\x1a\x16.google.protobuf.Empty\x12U\n\x15\x44\x65leteEditFileContent\x12$.gerrit.DeleteEditFileContentRequest\x1a\x16.google.protobuf.Empty\x12M\n\x11\x43hangeEditPublish\x12 .gerrit.ChangeEditPublishRequest\x1a\x16.google.protobuf.Empty\x12\x44\n\x0b\x41\x64\x64Reviewer\x12\x1a.gerrit.AddReviewerRequest\x1a\x19.gerrit.AddReviewerResult\x12G\n\x0e\x44\x65leteReviewer\x12\x1d.gerrit.DeleteReviewerRequest\x1a\x16.google.protobuf.Empty\x12;\n\tSetReview\x12\x18.gerrit.SetReviewRequest\x1a\x14.gerrit.ReviewResult\x12\x45\n\x11\x41\x64\x64ToAttentionSet\x12\x1b.gerrit.AttentionSetRequest\x1a\x13.gerrit.AccountInfo\x12?\n\x0cSubmitChange\x12\x1b.gerrit.SubmitChangeRequest\x1a\x12.gerrit.ChangeInfo\x12?\n\x0cRevertChange\x12\x1b.gerrit.RevertChangeRequest\x1a\x12.gerrit.ChangeInfo\x12\x41\n\rAbandonChange\x12\x1c.gerrit.AbandonChangeRequest\x1a\x12.gerrit.ChangeInfo\x12\x43\n\x0eSubmitRevision\x12\x1d.gerrit.SubmitRevisionRequest\x1a\x12.gerrit.SubmitInfoB3Z1go.chromium.org/luci/common/proto/gerrit;gerritpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.gerrit.gerrit_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/common/proto/gerrit;gerritpb'
+  _globals['_CHANGEINFO_REVISIONSENTRY']._loaded_options = None
+  _globals['_CHANGEINFO_REVISIONSENTRY']._serialized_options = b'8\001'
+  _globals['_CHANGEINFO_LABELSENTRY']._loaded_options = None
+  _globals['_CHANGEINFO_LABELSENTRY']._serialized_options = b'8\001'
+  _globals['_CHANGEINFO'].fields_by_name['requirements']._loaded_options = None
+  _globals['_CHANGEINFO'].fields_by_name['requirements']._serialized_options = b'\030\001'
+  _globals['_REVISIONINFO_FILESENTRY']._loaded_options = None
+  _globals['_REVISIONINFO_FILESENTRY']._serialized_options = b'8\001'
+  _globals['_LABELINFO_VALUESENTRY']._loaded_options = None
+  _globals['_LABELINFO_VALUESENTRY']._serialized_options = b'8\001'
+  _globals['_REVIEWERINFO_APPROVALSENTRY']._loaded_options = None
+  _globals['_REVIEWERINFO_APPROVALSENTRY']._serialized_options = b'8\001'
+  _globals['_SETREVIEWREQUEST_LABELSENTRY']._loaded_options = None
+  _globals['_SETREVIEWREQUEST_LABELSENTRY']._serialized_options = b'8\001'
+  _globals['_REVIEWRESULT_LABELSENTRY']._loaded_options = None
+  _globals['_REVIEWRESULT_LABELSENTRY']._serialized_options = b'8\001'
+  _globals['_REVIEWRESULT_REVIEWERSENTRY']._loaded_options = None
+  _globals['_REVIEWRESULT_REVIEWERSENTRY']._serialized_options = b'8\001'
+  _globals['_LISTFILESRESPONSE_FILESENTRY']._loaded_options = None
+  _globals['_LISTFILESRESPONSE_FILESENTRY']._serialized_options = b'8\001'
+  _globals['_PROJECTINFO_REFSENTRY']._loaded_options = None
+  _globals['_PROJECTINFO_REFSENTRY']._serialized_options = b'8\001'
+  _globals['_LISTPROJECTSRESPONSE_PROJECTSENTRY']._loaded_options = None
+  _globals['_LISTPROJECTSRESPONSE_PROJECTSENTRY']._serialized_options = b'8\001'
+  _globals['_QUERYOPTION']._serialized_start=9975
+  _globals['_QUERYOPTION']._serialized_end=10496
+  _globals['_NOTIFY']._serialized_start=10498
+  _globals['_NOTIFY']._serialized_end=10609
+  _globals['_CHANGESTATUS']._serialized_start=10611
+  _globals['_CHANGESTATUS']._serialized_end=10688
+  _globals['_MERGEABLESTRATEGY']._serialized_start=10691
+  _globals['_MERGEABLESTRATEGY']._serialized_end=10824
+  _globals['_NOTIFYDETAILS']._serialized_start=128
+  _globals['_NOTIFYDETAILS']._serialized_end=457
+  _globals['_NOTIFYDETAILS_INFO']._serialized_start=198
+  _globals['_NOTIFYDETAILS_INFO']._serialized_end=222
+  _globals['_NOTIFYDETAILS_RECIPIENT']._serialized_start=224
+  _globals['_NOTIFYDETAILS_RECIPIENT']._serialized_end=338
+  _globals['_NOTIFYDETAILS_RECIPIENTTYPE']._serialized_start=340
+  _globals['_NOTIFYDETAILS_RECIPIENTTYPE']._serialized_end=457
+  _globals['_LISTCHANGESREQUEST']._serialized_start=459
+  _globals['_LISTCHANGESREQUEST']._serialized_end=563
+  _globals['_LISTCHANGESRESPONSE']._serialized_start=565
+  _globals['_LISTCHANGESRESPONSE']._serialized_end=645
+  _globals['_GETCHANGEREQUEST']._serialized_start=647
+  _globals['_GETCHANGEREQUEST']._serialized_end=750
+  _globals['_ACCOUNTINFO']._serialized_start=752
+  _globals['_ACCOUNTINFO']._serialized_end=872
+  _globals['_GITPERSONINFO']._serialized_start=874
+  _globals['_GITPERSONINFO']._serialized_end=918
+  _globals['_CHANGEINFO']._serialized_start=921
+  _globals['_CHANGEINFO']._serialized_end=1823
+  _globals['_CHANGEINFO_REVISIONSENTRY']._serialized_start=1687
+  _globals['_CHANGEINFO_REVISIONSENTRY']._serialized_end=1757
+  _globals['_CHANGEINFO_LABELSENTRY']._serialized_start=1759
+  _globals['_CHANGEINFO_LABELSENTRY']._serialized_end=1823
+  _globals['_REVIEWERSTATUSMAP']._serialized_start=1826
+  _globals['_REVIEWERSTATUSMAP']._serialized_end=1957
+  _globals['_REVISIONINFO']._serialized_start=1960
+  _globals['_REVISIONINFO']._serialized_end=2462
+  _globals['_REVISIONINFO_FILESENTRY']._serialized_start=2235
+  _globals['_REVISIONINFO_FILESENTRY']._serialized_end=2297
+  _globals['_REVISIONINFO_KIND']._serialized_start=2300
+  _globals['_REVISIONINFO_KIND']._serialized_end=2462
+  _globals['_COMMITINFO']._serialized_start=2465
+  _globals['_COMMITINFO']._serialized_end=2611
+  _globals['_COMMITINFO_PARENT']._serialized_start=2591
+  _globals['_COMMITINFO_PARENT']._serialized_end=2611
+  _globals['_LABELINFO']._serialized_start=2614
+  _globals['_LABELINFO']._serialized_end=2987
+  _globals['_LABELINFO_VALUESENTRY']._serialized_start=2942
+  _globals['_LABELINFO_VALUESENTRY']._serialized_end=2987
+  _globals['_APPROVALINFO']._serialized_start=2990
+  _globals['_APPROVALINFO']._serialized_end=3187
+  _globals['_VOTINGRANGEINFO']._serialized_start=3189
+  _globals['_VOTINGRANGEINFO']._serialized_end=3232
+  _globals['_CHANGEMESSAGEINFO']._serialized_start=3235
+  _globals['_CHANGEMESSAGEINFO']._serialized_end=3417
+  _globals['_REQUIREMENT']._serialized_start=3420
+  _globals['_REQUIREMENT']._serialized_end=3657
+  _globals['_REQUIREMENT_STATUS']._serialized_start=3517
+  _globals['_REQUIREMENT_STATUS']._serialized_end=3657
+  _globals['_FILEINFO']._serialized_start=3660
+  _globals['_FILEINFO']._serialized_end=3878
+  _globals['_FILEINFO_STATUS']._serialized_start=3828
+  _globals['_FILEINFO_STATUS']._serialized_end=3878
+  _globals['_CREATECHANGEREQUEST']._serialized_start=3880
+  _globals['_CREATECHANGEREQUEST']._serialized_end=4001
+  _globals['_SUBMITCHANGEREQUEST']._serialized_start=4003
+  _globals['_SUBMITCHANGEREQUEST']._serialized_end=4057
+  _globals['_SUBMITREVISIONREQUEST']._serialized_start=4059
+  _globals['_SUBMITREVISIONREQUEST']._serialized_end=4136
+  _globals['_SUBMITINFO']._serialized_start=4138
+  _globals['_SUBMITINFO']._serialized_end=4188
+  _globals['_CHANGEEDITFILECONTENTREQUEST']._serialized_start=4190
+  _globals['_CHANGEEDITFILECONTENTREQUEST']._serialized_end=4289
+  _globals['_DELETEEDITFILECONTENTREQUEST']._serialized_start=4291
+  _globals['_DELETEEDITFILECONTENTREQUEST']._serialized_end=4373
+  _globals['_CHANGEEDITPUBLISHREQUEST']._serialized_start=4375
+  _globals['_CHANGEEDITPUBLISHREQUEST']._serialized_end=4434
+  _globals['_REVERTCHANGEREQUEST']._serialized_start=4436
+  _globals['_REVERTCHANGEREQUEST']._serialized_end=4507
+  _globals['_ABANDONCHANGEREQUEST']._serialized_start=4509
+  _globals['_ABANDONCHANGEREQUEST']._serialized_end=4581
+  _globals['_ADDREVIEWERREQUEST']._serialized_start=4584
+  _globals['_ADDREVIEWERREQUEST']._serialized_end=4860
+  _globals['_ADDREVIEWERREQUEST_STATE']._serialized_start=4757
+  _globals['_ADDREVIEWERREQUEST_STATE']._serialized_end=4860
+  _globals['_REVIEWERINFO']._serialized_start=4863
+  _globals['_REVIEWERINFO']._serialized_end=5021
+  _globals['_REVIEWERINFO_APPROVALSENTRY']._serialized_start=4973
+  _globals['_REVIEWERINFO_APPROVALSENTRY']._serialized_end=5021
+  _globals['_ADDREVIEWERRESULT']._serialized_start=5024
+  _globals['_ADDREVIEWERRESULT']._serialized_end=5166
+  _globals['_DELETEREVIEWERREQUEST']._serialized_start=5168
+  _globals['_DELETEREVIEWERREQUEST']._serialized_end=5244
+  _globals['_SETREVIEWREQUEST']._serialized_start=5247
+  _globals['_SETREVIEWREQUEST']._serialized_end=5799
+  _globals['_SETREVIEWREQUEST_LABELSENTRY']._serialized_start=5754
+  _globals['_SETREVIEWREQUEST_LABELSENTRY']._serialized_end=5799
+  _globals['_REVIEWERINPUT']._serialized_start=5802
+  _globals['_REVIEWERINPUT']._serialized_end=5990
+  _globals['_REVIEWERINPUT_STATE']._serialized_start=5881
+  _globals['_REVIEWERINPUT_STATE']._serialized_end=5990
+  _globals['_REVIEWRESULT']._serialized_start=5993
+  _globals['_REVIEWRESULT']._serialized_end=6237
+  _globals['_REVIEWRESULT_LABELSENTRY']._serialized_start=5754
+  _globals['_REVIEWRESULT_LABELSENTRY']._serialized_end=5799
+  _globals['_REVIEWRESULT_REVIEWERSENTRY']._serialized_start=6162
+  _globals['_REVIEWRESULT_REVIEWERSENTRY']._serialized_end=6237
+  _globals['_ATTENTIONSETREQUEST']._serialized_start=6239
+  _globals['_ATTENTIONSETREQUEST']._serialized_end=6335
+  _globals['_ATTENTIONSETINPUT']._serialized_start=6338
+  _globals['_ATTENTIONSETINPUT']._serialized_end=6466
+  _globals['_GETMERGEABLEREQUEST']._serialized_start=6469
+  _globals['_GETMERGEABLEREQUEST']._serialized_end=6605
+  _globals['_MERGEABLEINFO']._serialized_start=6608
+  _globals['_MERGEABLEINFO']._serialized_end=7002
+  _globals['_MERGEABLEINFO_SUBMITTYPE']._serialized_start=6835
+  _globals['_MERGEABLEINFO_SUBMITTYPE']._serialized_end=7002
+  _globals['_LISTFILESREQUEST']._serialized_start=7004
+  _globals['_LISTFILESREQUEST']._serialized_end=7131
+  _globals['_LISTFILESRESPONSE']._serialized_start=7134
+  _globals['_LISTFILESRESPONSE']._serialized_end=7270
+  _globals['_LISTFILESRESPONSE_FILESENTRY']._serialized_start=2235
+  _globals['_LISTFILESRESPONSE_FILESENTRY']._serialized_end=2297
+  _globals['_GETRELATEDCHANGESREQUEST']._serialized_start=7272
+  _globals['_GETRELATEDCHANGESREQUEST']._serialized_end=7352
+  _globals['_GETRELATEDCHANGESRESPONSE']._serialized_start=7355
+  _globals['_GETRELATEDCHANGESRESPONSE']._serialized_end=7621
+  _globals['_GETRELATEDCHANGESRESPONSE_CHANGEANDCOMMIT']._serialized_start=7453
+  _globals['_GETRELATEDCHANGESRESPONSE_CHANGEANDCOMMIT']._serialized_end=7621
+  _globals['_LISTPROJECTSREQUEST']._serialized_start=7623
+  _globals['_LISTPROJECTSREQUEST']._serialized_end=7658
+  _globals['_WEBLINKINFO']._serialized_start=7660
+  _globals['_WEBLINKINFO']._serialized_end=7719
+  _globals['_PROJECTINFO']._serialized_start=7722
+  _globals['_PROJECTINFO']._serialized_end=8079
+  _globals['_PROJECTINFO_REFSENTRY']._serialized_start=7915
+  _globals['_PROJECTINFO_REFSENTRY']._serialized_end=7958
+  _globals['_PROJECTINFO_STATE']._serialized_start=7960
+  _globals['_PROJECTINFO_STATE']._serialized_end=8079
+  _globals['_LISTPROJECTSRESPONSE']._serialized_start=8082
+  _globals['_LISTPROJECTSRESPONSE']._serialized_end=8236
+  _globals['_LISTPROJECTSRESPONSE_PROJECTSENTRY']._serialized_start=8168
+  _globals['_LISTPROJECTSRESPONSE_PROJECTSENTRY']._serialized_end=8236
+  _globals['_REFINFOREQUEST']._serialized_start=8238
+  _globals['_REFINFOREQUEST']._serialized_end=8284
+  _globals['_REFINFO']._serialized_start=8286
+  _globals['_REFINFO']._serialized_end=8326
+  _globals['_ACCOUNTOPTIONS']._serialized_start=8328
+  _globals['_ACCOUNTOPTIONS']._serialized_end=8381
+  _globals['_LISTFILEOWNERSREQUEST']._serialized_start=8383
+  _globals['_LISTFILEOWNERSREQUEST']._serialized_end=8491
+  _globals['_OWNERINFO']._serialized_start=8493
+  _globals['_OWNERINFO']._serialized_end=8542
+  _globals['_LISTOWNERSRESPONSE']._serialized_start=8544
+  _globals['_LISTOWNERSRESPONSE']._serialized_end=8599
+  _globals['_EMAILINFO']._serialized_start=8601
+  _globals['_EMAILINFO']._serialized_end=8676
+  _globals['_LISTACCOUNTEMAILSREQUEST']._serialized_start=8678
+  _globals['_LISTACCOUNTEMAILSREQUEST']._serialized_end=8719
+  _globals['_LISTACCOUNTEMAILSRESPONSE']._serialized_start=8721
+  _globals['_LISTACCOUNTEMAILSRESPONSE']._serialized_end=8783
+  _globals['_CHECKRAPTREQUEST']._serialized_start=8785
+  _globals['_CHECKRAPTREQUEST']._serialized_end=8833
+  _globals['_CHECKRAPTRESPONSE']._serialized_start=8835
+  _globals['_CHECKRAPTRESPONSE']._serialized_end=8901
+  _globals['_GETPUREREVERTREQUEST']._serialized_start=8903
+  _globals['_GETPUREREVERTREQUEST']._serialized_end=8958
+  _globals['_PUREREVERTINFO']._serialized_start=8960
+  _globals['_PUREREVERTINFO']._serialized_end=9000
+  _globals['_SUBMITREQUIREMENTRESULTINFO']._serialized_start=9003
+  _globals['_SUBMITREQUIREMENTRESULTINFO']._serialized_end=9533
+  _globals['_SUBMITREQUIREMENTRESULTINFO_STATUS']._serialized_start=9391
+  _globals['_SUBMITREQUIREMENTRESULTINFO_STATUS']._serialized_end=9533
+  _globals['_SUBMITREQUIREMENTEXPRESSIONINFO']._serialized_start=9536
+  _globals['_SUBMITREQUIREMENTEXPRESSIONINFO']._serialized_end=9677
+  _globals['_GETMETADIFFREQUEST']._serialized_start=9679
+  _globals['_GETMETADIFFREQUEST']._serialized_end=9797
+  _globals['_METADIFF']._serialized_start=9800
+  _globals['_METADIFF']._serialized_end=9972
+  _globals['_GERRIT']._serialized_start=10827
+  _globals['_GERRIT']._serialized_end=12544
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,1041 @@
+import datetime
+
+from google.protobuf import empty_pb2 as _empty_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class QueryOption(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    OPTION_UNSPECIFIED: _ClassVar[QueryOption]
+    LABELS: _ClassVar[QueryOption]
+    DETAILED_LABELS: _ClassVar[QueryOption]
+    CURRENT_REVISION: _ClassVar[QueryOption]
+    ALL_REVISIONS: _ClassVar[QueryOption]
+    CURRENT_COMMIT: _ClassVar[QueryOption]
+    ALL_COMMITS: _ClassVar[QueryOption]
+    CURRENT_FILES: _ClassVar[QueryOption]
+    ALL_FILES: _ClassVar[QueryOption]
+    DETAILED_ACCOUNTS: _ClassVar[QueryOption]
+    REVIEWER_UPDATES: _ClassVar[QueryOption]
+    MESSAGES: _ClassVar[QueryOption]
+    CURRENT_ACTIONS: _ClassVar[QueryOption]
+    CHANGE_ACTIONS: _ClassVar[QueryOption]
+    REVIEWED: _ClassVar[QueryOption]
+    SKIP_MERGEABLE: _ClassVar[QueryOption]
+    SUBMITTABLE: _ClassVar[QueryOption]
+    WEB_LINKS: _ClassVar[QueryOption]
+    CHECK: _ClassVar[QueryOption]
+    COMMIT_FOOTERS: _ClassVar[QueryOption]
+    PUSH_CERTIFICATES: _ClassVar[QueryOption]
+    TRACKING_IDS: _ClassVar[QueryOption]
+    DOWNLOAD_COMMANDS: _ClassVar[QueryOption]
+    SUBMIT_REQUIREMENTS: _ClassVar[QueryOption]
+    MAX_QUERY_OPTION: _ClassVar[QueryOption]
+
+class Notify(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    NOTIFY_UNSPECIFIED: _ClassVar[Notify]
+    NOTIFY_NONE: _ClassVar[Notify]
+    NOTIFY_OWNER: _ClassVar[Notify]
+    NOTIFY_OWNER_REVIEWERS: _ClassVar[Notify]
+    NOTIFY_ALL: _ClassVar[Notify]
+
+class ChangeStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    CHANGE_STATUS_INVALID: _ClassVar[ChangeStatus]
+    NEW: _ClassVar[ChangeStatus]
+    MERGED: _ClassVar[ChangeStatus]
+    ABANDONED: _ClassVar[ChangeStatus]
+
+class MergeableStrategy(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    MERGEABLE_STRATEGY_UNSPECIFIED: _ClassVar[MergeableStrategy]
+    RECURSIVE: _ClassVar[MergeableStrategy]
+    RESOLVE: _ClassVar[MergeableStrategy]
+    SIMPLE_TWO_WAY_IN_CORE: _ClassVar[MergeableStrategy]
+    OURS: _ClassVar[MergeableStrategy]
+    THEIRS: _ClassVar[MergeableStrategy]
+OPTION_UNSPECIFIED: QueryOption
+LABELS: QueryOption
+DETAILED_LABELS: QueryOption
+CURRENT_REVISION: QueryOption
+ALL_REVISIONS: QueryOption
+CURRENT_COMMIT: QueryOption
+ALL_COMMITS: QueryOption
+CURRENT_FILES: QueryOption
+ALL_FILES: QueryOption
+DETAILED_ACCOUNTS: QueryOption
+REVIEWER_UPDATES: QueryOption
+MESSAGES: QueryOption
+CURRENT_ACTIONS: QueryOption
+CHANGE_ACTIONS: QueryOption
+REVIEWED: QueryOption
+SKIP_MERGEABLE: QueryOption
+SUBMITTABLE: QueryOption
+WEB_LINKS: QueryOption
+CHECK: QueryOption
+COMMIT_FOOTERS: QueryOption
+PUSH_CERTIFICATES: QueryOption
+TRACKING_IDS: QueryOption
+DOWNLOAD_COMMANDS: QueryOption
+SUBMIT_REQUIREMENTS: QueryOption
+MAX_QUERY_OPTION: QueryOption
+NOTIFY_UNSPECIFIED: Notify
+NOTIFY_NONE: Notify
+NOTIFY_OWNER: Notify
+NOTIFY_OWNER_REVIEWERS: Notify
+NOTIFY_ALL: Notify
+CHANGE_STATUS_INVALID: ChangeStatus
+NEW: ChangeStatus
+MERGED: ChangeStatus
+ABANDONED: ChangeStatus
+MERGEABLE_STRATEGY_UNSPECIFIED: MergeableStrategy
+RECURSIVE: MergeableStrategy
+RESOLVE: MergeableStrategy
+SIMPLE_TWO_WAY_IN_CORE: MergeableStrategy
+OURS: MergeableStrategy
+THEIRS: MergeableStrategy
+
+class NotifyDetails(_message.Message):
+    __slots__ = ("recipients",)
+    class RecipientType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        RECIPIENT_TYPE_UNSPECIFIED: _ClassVar[NotifyDetails.RecipientType]
+        RECIPIENT_TYPE_TO: _ClassVar[NotifyDetails.RecipientType]
+        RECIPIENT_TYPE_CC: _ClassVar[NotifyDetails.RecipientType]
+        RECIPIENT_TYPE_BCC: _ClassVar[NotifyDetails.RecipientType]
+    RECIPIENT_TYPE_UNSPECIFIED: NotifyDetails.RecipientType
+    RECIPIENT_TYPE_TO: NotifyDetails.RecipientType
+    RECIPIENT_TYPE_CC: NotifyDetails.RecipientType
+    RECIPIENT_TYPE_BCC: NotifyDetails.RecipientType
+    class Info(_message.Message):
+        __slots__ = ("accounts",)
+        ACCOUNTS_FIELD_NUMBER: _ClassVar[int]
+        accounts: _containers.RepeatedScalarFieldContainer[int]
+        def __init__(self, accounts: _Optional[_Iterable[int]] = ...) -> None: ...
+    class Recipient(_message.Message):
+        __slots__ = ("recipient_type", "info")
+        RECIPIENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+        INFO_FIELD_NUMBER: _ClassVar[int]
+        recipient_type: NotifyDetails.RecipientType
+        info: NotifyDetails.Info
+        def __init__(self, recipient_type: _Optional[_Union[NotifyDetails.RecipientType, str]] = ..., info: _Optional[_Union[NotifyDetails.Info, _Mapping]] = ...) -> None: ...
+    RECIPIENTS_FIELD_NUMBER: _ClassVar[int]
+    recipients: _containers.RepeatedCompositeFieldContainer[NotifyDetails.Recipient]
+    def __init__(self, recipients: _Optional[_Iterable[_Union[NotifyDetails.Recipient, _Mapping]]] = ...) -> None: ...
+
+class ListChangesRequest(_message.Message):
+    __slots__ = ("query", "options", "limit", "offset")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    OPTIONS_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    query: str
+    options: _containers.RepeatedScalarFieldContainer[QueryOption]
+    limit: int
+    offset: int
+    def __init__(self, query: _Optional[str] = ..., options: _Optional[_Iterable[_Union[QueryOption, str]]] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+
+class ListChangesResponse(_message.Message):
+    __slots__ = ("changes", "more_changes")
+    CHANGES_FIELD_NUMBER: _ClassVar[int]
+    MORE_CHANGES_FIELD_NUMBER: _ClassVar[int]
+    changes: _containers.RepeatedCompositeFieldContainer[ChangeInfo]
+    more_changes: bool
+    def __init__(self, changes: _Optional[_Iterable[_Union[ChangeInfo, _Mapping]]] = ..., more_changes: bool = ...) -> None: ...
+
+class GetChangeRequest(_message.Message):
+    __slots__ = ("number", "options", "project", "meta")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    OPTIONS_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    META_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    options: _containers.RepeatedScalarFieldContainer[QueryOption]
+    project: str
+    meta: str
+    def __init__(self, number: _Optional[int] = ..., options: _Optional[_Iterable[_Union[QueryOption, str]]] = ..., project: _Optional[str] = ..., meta: _Optional[str] = ...) -> None: ...
+
+class AccountInfo(_message.Message):
+    __slots__ = ("name", "email", "secondary_emails", "username", "account_id", "tags")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    SECONDARY_EMAILS_FIELD_NUMBER: _ClassVar[int]
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    ACCOUNT_ID_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    email: str
+    secondary_emails: _containers.RepeatedScalarFieldContainer[str]
+    username: str
+    account_id: int
+    tags: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, name: _Optional[str] = ..., email: _Optional[str] = ..., secondary_emails: _Optional[_Iterable[str]] = ..., username: _Optional[str] = ..., account_id: _Optional[int] = ..., tags: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GitPersonInfo(_message.Message):
+    __slots__ = ("name", "email")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    email: str
+    def __init__(self, name: _Optional[str] = ..., email: _Optional[str] = ...) -> None: ...
+
+class ChangeInfo(_message.Message):
+    __slots__ = ("number", "owner", "project", "ref", "status", "current_revision", "revisions", "labels", "messages", "requirements", "submittable", "is_private", "hashtags", "created", "updated", "submitted", "revert_of", "cherry_pick_of_change", "reviewers", "meta_rev_id", "submit_requirements", "subject", "branch")
+    class RevisionsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: RevisionInfo
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[RevisionInfo, _Mapping]] = ...) -> None: ...
+    class LabelsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: LabelInfo
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[LabelInfo, _Mapping]] = ...) -> None: ...
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    OWNER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    CURRENT_REVISION_FIELD_NUMBER: _ClassVar[int]
+    REVISIONS_FIELD_NUMBER: _ClassVar[int]
+    LABELS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGES_FIELD_NUMBER: _ClassVar[int]
+    REQUIREMENTS_FIELD_NUMBER: _ClassVar[int]
+    SUBMITTABLE_FIELD_NUMBER: _ClassVar[int]
+    IS_PRIVATE_FIELD_NUMBER: _ClassVar[int]
+    HASHTAGS_FIELD_NUMBER: _ClassVar[int]
+    CREATED_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_FIELD_NUMBER: _ClassVar[int]
+    SUBMITTED_FIELD_NUMBER: _ClassVar[int]
+    REVERT_OF_FIELD_NUMBER: _ClassVar[int]
+    CHERRY_PICK_OF_CHANGE_FIELD_NUMBER: _ClassVar[int]
+    REVIEWERS_FIELD_NUMBER: _ClassVar[int]
+    META_REV_ID_FIELD_NUMBER: _ClassVar[int]
+    SUBMIT_REQUIREMENTS_FIELD_NUMBER: _ClassVar[int]
+    SUBJECT_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    owner: AccountInfo
+    project: str
+    ref: str
+    status: ChangeStatus
+    current_revision: str
+    revisions: _containers.MessageMap[str, RevisionInfo]
+    labels: _containers.MessageMap[str, LabelInfo]
+    messages: _containers.RepeatedCompositeFieldContainer[ChangeMessageInfo]
+    requirements: _containers.RepeatedCompositeFieldContainer[Requirement]
+    submittable: bool
+    is_private: bool
+    hashtags: _containers.RepeatedScalarFieldContainer[str]
+    created: _timestamp_pb2.Timestamp
+    updated: _timestamp_pb2.Timestamp
+    submitted: _timestamp_pb2.Timestamp
+    revert_of: int
+    cherry_pick_of_change: int
+    reviewers: ReviewerStatusMap
+    meta_rev_id: str
+    submit_requirements: _containers.RepeatedCompositeFieldContainer[SubmitRequirementResultInfo]
+    subject: str
+    branch: str
+    def __init__(self, number: _Optional[int] = ..., owner: _Optional[_Union[AccountInfo, _Mapping]] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ..., status: _Optional[_Union[ChangeStatus, str]] = ..., current_revision: _Optional[str] = ..., revisions: _Optional[_Mapping[str, RevisionInfo]] = ..., labels: _Optional[_Mapping[str, LabelInfo]] = ..., messages: _Optional[_Iterable[_Union[ChangeMessageInfo, _Mapping]]] = ..., requirements: _Optional[_Iterable[_Union[Requirement, _Mapping]]] = ..., submittable: bool = ..., is_private: bool = ..., hashtags: _Optional[_Iterable[str]] = ..., created: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., updated: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., submitted: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., revert_of: _Optional[int] = ..., cherry_pick_of_change: _Optional[int] = ..., reviewers: _Optional[_Union[ReviewerStatusMap, _Mapping]] = ..., meta_rev_id: _Optional[str] = ..., submit_requirements: _Optional[_Iterable[_Union[SubmitRequirementResultInfo, _Mapping]]] = ..., subject: _Optional[str] = ..., branch: _Optional[str] = ...) -> None: ...
+
+class ReviewerStatusMap(_message.Message):
+    __slots__ = ("reviewers", "ccs", "removed")
+    REVIEWERS_FIELD_NUMBER: _ClassVar[int]
+    CCS_FIELD_NUMBER: _ClassVar[int]
+    REMOVED_FIELD_NUMBER: _ClassVar[int]
+    reviewers: _containers.RepeatedCompositeFieldContainer[AccountInfo]
+    ccs: _containers.RepeatedCompositeFieldContainer[AccountInfo]
+    removed: _containers.RepeatedCompositeFieldContainer[AccountInfo]
+    def __init__(self, reviewers: _Optional[_Iterable[_Union[AccountInfo, _Mapping]]] = ..., ccs: _Optional[_Iterable[_Union[AccountInfo, _Mapping]]] = ..., removed: _Optional[_Iterable[_Union[AccountInfo, _Mapping]]] = ...) -> None: ...
+
+class RevisionInfo(_message.Message):
+    __slots__ = ("kind", "number", "uploader", "ref", "created", "description", "commit", "files")
+    class Kind(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        KIND_INVALID: _ClassVar[RevisionInfo.Kind]
+        REWORK: _ClassVar[RevisionInfo.Kind]
+        TRIVIAL_REBASE: _ClassVar[RevisionInfo.Kind]
+        MERGE_FIRST_PARENT_UPDATE: _ClassVar[RevisionInfo.Kind]
+        NO_CODE_CHANGE: _ClassVar[RevisionInfo.Kind]
+        NO_CHANGE: _ClassVar[RevisionInfo.Kind]
+        TRIVIAL_REBASE_WITH_MESSAGE_UPDATE: _ClassVar[RevisionInfo.Kind]
+    KIND_INVALID: RevisionInfo.Kind
+    REWORK: RevisionInfo.Kind
+    TRIVIAL_REBASE: RevisionInfo.Kind
+    MERGE_FIRST_PARENT_UPDATE: RevisionInfo.Kind
+    NO_CODE_CHANGE: RevisionInfo.Kind
+    NO_CHANGE: RevisionInfo.Kind
+    TRIVIAL_REBASE_WITH_MESSAGE_UPDATE: RevisionInfo.Kind
+    class FilesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: FileInfo
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[FileInfo, _Mapping]] = ...) -> None: ...
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    UPLOADER_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    CREATED_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_FIELD_NUMBER: _ClassVar[int]
+    FILES_FIELD_NUMBER: _ClassVar[int]
+    kind: RevisionInfo.Kind
+    number: int
+    uploader: AccountInfo
+    ref: str
+    created: _timestamp_pb2.Timestamp
+    description: str
+    commit: CommitInfo
+    files: _containers.MessageMap[str, FileInfo]
+    def __init__(self, kind: _Optional[_Union[RevisionInfo.Kind, str]] = ..., number: _Optional[int] = ..., uploader: _Optional[_Union[AccountInfo, _Mapping]] = ..., ref: _Optional[str] = ..., created: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., description: _Optional[str] = ..., commit: _Optional[_Union[CommitInfo, _Mapping]] = ..., files: _Optional[_Mapping[str, FileInfo]] = ...) -> None: ...
+
+class CommitInfo(_message.Message):
+    __slots__ = ("id", "parents", "message", "author")
+    class Parent(_message.Message):
+        __slots__ = ("id",)
+        ID_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        def __init__(self, id: _Optional[str] = ...) -> None: ...
+    ID_FIELD_NUMBER: _ClassVar[int]
+    PARENTS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    AUTHOR_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    parents: _containers.RepeatedCompositeFieldContainer[CommitInfo.Parent]
+    message: str
+    author: GitPersonInfo
+    def __init__(self, id: _Optional[str] = ..., parents: _Optional[_Iterable[_Union[CommitInfo.Parent, _Mapping]]] = ..., message: _Optional[str] = ..., author: _Optional[_Union[GitPersonInfo, _Mapping]] = ...) -> None: ...
+
+class LabelInfo(_message.Message):
+    __slots__ = ("optional", "approved", "rejected", "recommended", "disliked", "blocking", "value", "default_value", "all", "values")
+    class ValuesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: int
+        value: str
+        def __init__(self, key: _Optional[int] = ..., value: _Optional[str] = ...) -> None: ...
+    OPTIONAL_FIELD_NUMBER: _ClassVar[int]
+    APPROVED_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_FIELD_NUMBER: _ClassVar[int]
+    RECOMMENDED_FIELD_NUMBER: _ClassVar[int]
+    DISLIKED_FIELD_NUMBER: _ClassVar[int]
+    BLOCKING_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    DEFAULT_VALUE_FIELD_NUMBER: _ClassVar[int]
+    ALL_FIELD_NUMBER: _ClassVar[int]
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    optional: bool
+    approved: AccountInfo
+    rejected: AccountInfo
+    recommended: AccountInfo
+    disliked: AccountInfo
+    blocking: bool
+    value: int
+    default_value: int
+    all: _containers.RepeatedCompositeFieldContainer[ApprovalInfo]
+    values: _containers.ScalarMap[int, str]
+    def __init__(self, optional: bool = ..., approved: _Optional[_Union[AccountInfo, _Mapping]] = ..., rejected: _Optional[_Union[AccountInfo, _Mapping]] = ..., recommended: _Optional[_Union[AccountInfo, _Mapping]] = ..., disliked: _Optional[_Union[AccountInfo, _Mapping]] = ..., blocking: bool = ..., value: _Optional[int] = ..., default_value: _Optional[int] = ..., all: _Optional[_Iterable[_Union[ApprovalInfo, _Mapping]]] = ..., values: _Optional[_Mapping[int, str]] = ...) -> None: ...
+
+class ApprovalInfo(_message.Message):
+    __slots__ = ("user", "value", "permitted_voting_range", "date", "tag", "post_submit")
+    USER_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    PERMITTED_VOTING_RANGE_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    TAG_FIELD_NUMBER: _ClassVar[int]
+    POST_SUBMIT_FIELD_NUMBER: _ClassVar[int]
+    user: AccountInfo
+    value: int
+    permitted_voting_range: VotingRangeInfo
+    date: _timestamp_pb2.Timestamp
+    tag: str
+    post_submit: bool
+    def __init__(self, user: _Optional[_Union[AccountInfo, _Mapping]] = ..., value: _Optional[int] = ..., permitted_voting_range: _Optional[_Union[VotingRangeInfo, _Mapping]] = ..., date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., tag: _Optional[str] = ..., post_submit: bool = ...) -> None: ...
+
+class VotingRangeInfo(_message.Message):
+    __slots__ = ("min", "max")
+    MIN_FIELD_NUMBER: _ClassVar[int]
+    MAX_FIELD_NUMBER: _ClassVar[int]
+    min: int
+    max: int
+    def __init__(self, min: _Optional[int] = ..., max: _Optional[int] = ...) -> None: ...
+
+class ChangeMessageInfo(_message.Message):
+    __slots__ = ("id", "author", "real_author", "date", "message", "tag")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    AUTHOR_FIELD_NUMBER: _ClassVar[int]
+    REAL_AUTHOR_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    TAG_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    author: AccountInfo
+    real_author: AccountInfo
+    date: _timestamp_pb2.Timestamp
+    message: str
+    tag: str
+    def __init__(self, id: _Optional[str] = ..., author: _Optional[_Union[AccountInfo, _Mapping]] = ..., real_author: _Optional[_Union[AccountInfo, _Mapping]] = ..., date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., message: _Optional[str] = ..., tag: _Optional[str] = ...) -> None: ...
+
+class Requirement(_message.Message):
+    __slots__ = ("status", "fallback_text", "type")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        REQUIREMENT_STATUS_UNSPECIFIED: _ClassVar[Requirement.Status]
+        REQUIREMENT_STATUS_OK: _ClassVar[Requirement.Status]
+        REQUIREMENT_STATUS_NOT_READY: _ClassVar[Requirement.Status]
+        REQUIREMENT_STATUS_RULE_ERROR: _ClassVar[Requirement.Status]
+    REQUIREMENT_STATUS_UNSPECIFIED: Requirement.Status
+    REQUIREMENT_STATUS_OK: Requirement.Status
+    REQUIREMENT_STATUS_NOT_READY: Requirement.Status
+    REQUIREMENT_STATUS_RULE_ERROR: Requirement.Status
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    FALLBACK_TEXT_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    status: Requirement.Status
+    fallback_text: str
+    type: str
+    def __init__(self, status: _Optional[_Union[Requirement.Status, str]] = ..., fallback_text: _Optional[str] = ..., type: _Optional[str] = ...) -> None: ...
+
+class FileInfo(_message.Message):
+    __slots__ = ("status", "binary", "old_path", "lines_inserted", "lines_deleted", "size_delta", "size")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        M: _ClassVar[FileInfo.Status]
+        A: _ClassVar[FileInfo.Status]
+        D: _ClassVar[FileInfo.Status]
+        R: _ClassVar[FileInfo.Status]
+        C: _ClassVar[FileInfo.Status]
+        W: _ClassVar[FileInfo.Status]
+    M: FileInfo.Status
+    A: FileInfo.Status
+    D: FileInfo.Status
+    R: FileInfo.Status
+    C: FileInfo.Status
+    W: FileInfo.Status
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    BINARY_FIELD_NUMBER: _ClassVar[int]
+    OLD_PATH_FIELD_NUMBER: _ClassVar[int]
+    LINES_INSERTED_FIELD_NUMBER: _ClassVar[int]
+    LINES_DELETED_FIELD_NUMBER: _ClassVar[int]
+    SIZE_DELTA_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    status: FileInfo.Status
+    binary: bool
+    old_path: str
+    lines_inserted: int
+    lines_deleted: int
+    size_delta: int
+    size: int
+    def __init__(self, status: _Optional[_Union[FileInfo.Status, str]] = ..., binary: bool = ..., old_path: _Optional[str] = ..., lines_inserted: _Optional[int] = ..., lines_deleted: _Optional[int] = ..., size_delta: _Optional[int] = ..., size: _Optional[int] = ...) -> None: ...
+
+class CreateChangeRequest(_message.Message):
+    __slots__ = ("project", "ref", "subject", "base_commit", "notify")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    SUBJECT_FIELD_NUMBER: _ClassVar[int]
+    BASE_COMMIT_FIELD_NUMBER: _ClassVar[int]
+    NOTIFY_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    ref: str
+    subject: str
+    base_commit: str
+    notify: Notify
+    def __init__(self, project: _Optional[str] = ..., ref: _Optional[str] = ..., subject: _Optional[str] = ..., base_commit: _Optional[str] = ..., notify: _Optional[_Union[Notify, str]] = ...) -> None: ...
+
+class SubmitChangeRequest(_message.Message):
+    __slots__ = ("number", "project")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ...) -> None: ...
+
+class SubmitRevisionRequest(_message.Message):
+    __slots__ = ("number", "revision_id", "project")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    REVISION_ID_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    revision_id: str
+    project: str
+    def __init__(self, number: _Optional[int] = ..., revision_id: _Optional[str] = ..., project: _Optional[str] = ...) -> None: ...
+
+class SubmitInfo(_message.Message):
+    __slots__ = ("status",)
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    status: ChangeStatus
+    def __init__(self, status: _Optional[_Union[ChangeStatus, str]] = ...) -> None: ...
+
+class ChangeEditFileContentRequest(_message.Message):
+    __slots__ = ("number", "project", "file_path", "content")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    FILE_PATH_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    file_path: str
+    content: bytes
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., file_path: _Optional[str] = ..., content: _Optional[bytes] = ...) -> None: ...
+
+class DeleteEditFileContentRequest(_message.Message):
+    __slots__ = ("number", "project", "file_path")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    FILE_PATH_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    file_path: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., file_path: _Optional[str] = ...) -> None: ...
+
+class ChangeEditPublishRequest(_message.Message):
+    __slots__ = ("number", "project")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ...) -> None: ...
+
+class RevertChangeRequest(_message.Message):
+    __slots__ = ("number", "project", "message")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    message: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., message: _Optional[str] = ...) -> None: ...
+
+class AbandonChangeRequest(_message.Message):
+    __slots__ = ("number", "project", "message")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    message: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., message: _Optional[str] = ...) -> None: ...
+
+class AddReviewerRequest(_message.Message):
+    __slots__ = ("number", "project", "reviewer", "state", "confirmed", "notify")
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        ADD_REVIEWER_STATE_UNSPECIFIED: _ClassVar[AddReviewerRequest.State]
+        ADD_REVIEWER_STATE_REVIEWER: _ClassVar[AddReviewerRequest.State]
+        ADD_REVIEWER_STATE_CC: _ClassVar[AddReviewerRequest.State]
+    ADD_REVIEWER_STATE_UNSPECIFIED: AddReviewerRequest.State
+    ADD_REVIEWER_STATE_REVIEWER: AddReviewerRequest.State
+    ADD_REVIEWER_STATE_CC: AddReviewerRequest.State
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REVIEWER_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    CONFIRMED_FIELD_NUMBER: _ClassVar[int]
+    NOTIFY_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    reviewer: str
+    state: AddReviewerRequest.State
+    confirmed: bool
+    notify: Notify
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., reviewer: _Optional[str] = ..., state: _Optional[_Union[AddReviewerRequest.State, str]] = ..., confirmed: bool = ..., notify: _Optional[_Union[Notify, str]] = ...) -> None: ...
+
+class ReviewerInfo(_message.Message):
+    __slots__ = ("account", "approvals")
+    class ApprovalsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    ACCOUNT_FIELD_NUMBER: _ClassVar[int]
+    APPROVALS_FIELD_NUMBER: _ClassVar[int]
+    account: AccountInfo
+    approvals: _containers.ScalarMap[str, int]
+    def __init__(self, account: _Optional[_Union[AccountInfo, _Mapping]] = ..., approvals: _Optional[_Mapping[str, int]] = ...) -> None: ...
+
+class AddReviewerResult(_message.Message):
+    __slots__ = ("input", "reviewers", "ccs", "error", "confirm")
+    INPUT_FIELD_NUMBER: _ClassVar[int]
+    REVIEWERS_FIELD_NUMBER: _ClassVar[int]
+    CCS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    CONFIRM_FIELD_NUMBER: _ClassVar[int]
+    input: str
+    reviewers: _containers.RepeatedCompositeFieldContainer[ReviewerInfo]
+    ccs: _containers.RepeatedCompositeFieldContainer[ReviewerInfo]
+    error: str
+    confirm: bool
+    def __init__(self, input: _Optional[str] = ..., reviewers: _Optional[_Iterable[_Union[ReviewerInfo, _Mapping]]] = ..., ccs: _Optional[_Iterable[_Union[ReviewerInfo, _Mapping]]] = ..., error: _Optional[str] = ..., confirm: bool = ...) -> None: ...
+
+class DeleteReviewerRequest(_message.Message):
+    __slots__ = ("number", "project", "account_id")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    ACCOUNT_ID_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    account_id: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., account_id: _Optional[str] = ...) -> None: ...
+
+class SetReviewRequest(_message.Message):
+    __slots__ = ("number", "project", "revision_id", "message", "labels", "tag", "notify", "notify_details", "on_behalf_of", "ready", "work_in_progress", "add_to_attention_set", "remove_from_attention_set", "ignore_automatic_attention_set_rules", "reviewers")
+    class LabelsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REVISION_ID_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    LABELS_FIELD_NUMBER: _ClassVar[int]
+    TAG_FIELD_NUMBER: _ClassVar[int]
+    NOTIFY_FIELD_NUMBER: _ClassVar[int]
+    NOTIFY_DETAILS_FIELD_NUMBER: _ClassVar[int]
+    ON_BEHALF_OF_FIELD_NUMBER: _ClassVar[int]
+    READY_FIELD_NUMBER: _ClassVar[int]
+    WORK_IN_PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    ADD_TO_ATTENTION_SET_FIELD_NUMBER: _ClassVar[int]
+    REMOVE_FROM_ATTENTION_SET_FIELD_NUMBER: _ClassVar[int]
+    IGNORE_AUTOMATIC_ATTENTION_SET_RULES_FIELD_NUMBER: _ClassVar[int]
+    REVIEWERS_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    revision_id: str
+    message: str
+    labels: _containers.ScalarMap[str, int]
+    tag: str
+    notify: Notify
+    notify_details: NotifyDetails
+    on_behalf_of: int
+    ready: bool
+    work_in_progress: bool
+    add_to_attention_set: _containers.RepeatedCompositeFieldContainer[AttentionSetInput]
+    remove_from_attention_set: _containers.RepeatedCompositeFieldContainer[AttentionSetInput]
+    ignore_automatic_attention_set_rules: bool
+    reviewers: _containers.RepeatedCompositeFieldContainer[ReviewerInput]
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., revision_id: _Optional[str] = ..., message: _Optional[str] = ..., labels: _Optional[_Mapping[str, int]] = ..., tag: _Optional[str] = ..., notify: _Optional[_Union[Notify, str]] = ..., notify_details: _Optional[_Union[NotifyDetails, _Mapping]] = ..., on_behalf_of: _Optional[int] = ..., ready: bool = ..., work_in_progress: bool = ..., add_to_attention_set: _Optional[_Iterable[_Union[AttentionSetInput, _Mapping]]] = ..., remove_from_attention_set: _Optional[_Iterable[_Union[AttentionSetInput, _Mapping]]] = ..., ignore_automatic_attention_set_rules: bool = ..., reviewers: _Optional[_Iterable[_Union[ReviewerInput, _Mapping]]] = ...) -> None: ...
+
+class ReviewerInput(_message.Message):
+    __slots__ = ("reviewer", "state")
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        REVIEWER_INPUT_STATE_UNSPECIFIED: _ClassVar[ReviewerInput.State]
+        REVIEWER_INPUT_STATE_REVIEWER: _ClassVar[ReviewerInput.State]
+        REVIEWER_INPUT_STATE_CC: _ClassVar[ReviewerInput.State]
+    REVIEWER_INPUT_STATE_UNSPECIFIED: ReviewerInput.State
+    REVIEWER_INPUT_STATE_REVIEWER: ReviewerInput.State
+    REVIEWER_INPUT_STATE_CC: ReviewerInput.State
+    REVIEWER_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    reviewer: str
+    state: ReviewerInput.State
+    def __init__(self, reviewer: _Optional[str] = ..., state: _Optional[_Union[ReviewerInput.State, str]] = ...) -> None: ...
+
+class ReviewResult(_message.Message):
+    __slots__ = ("labels", "reviewers")
+    class LabelsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    class ReviewersEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: AddReviewerResult
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[AddReviewerResult, _Mapping]] = ...) -> None: ...
+    LABELS_FIELD_NUMBER: _ClassVar[int]
+    REVIEWERS_FIELD_NUMBER: _ClassVar[int]
+    labels: _containers.ScalarMap[str, int]
+    reviewers: _containers.MessageMap[str, AddReviewerResult]
+    def __init__(self, labels: _Optional[_Mapping[str, int]] = ..., reviewers: _Optional[_Mapping[str, AddReviewerResult]] = ...) -> None: ...
+
+class AttentionSetRequest(_message.Message):
+    __slots__ = ("number", "project", "input")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    INPUT_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    input: AttentionSetInput
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., input: _Optional[_Union[AttentionSetInput, _Mapping]] = ...) -> None: ...
+
+class AttentionSetInput(_message.Message):
+    __slots__ = ("user", "reason", "notify", "notify_details")
+    USER_FIELD_NUMBER: _ClassVar[int]
+    REASON_FIELD_NUMBER: _ClassVar[int]
+    NOTIFY_FIELD_NUMBER: _ClassVar[int]
+    NOTIFY_DETAILS_FIELD_NUMBER: _ClassVar[int]
+    user: str
+    reason: str
+    notify: Notify
+    notify_details: NotifyDetails
+    def __init__(self, user: _Optional[str] = ..., reason: _Optional[str] = ..., notify: _Optional[_Union[Notify, str]] = ..., notify_details: _Optional[_Union[NotifyDetails, _Mapping]] = ...) -> None: ...
+
+class GetMergeableRequest(_message.Message):
+    __slots__ = ("number", "project", "revision_id", "source", "strategy")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REVISION_ID_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_FIELD_NUMBER: _ClassVar[int]
+    STRATEGY_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    revision_id: str
+    source: str
+    strategy: MergeableStrategy
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., revision_id: _Optional[str] = ..., source: _Optional[str] = ..., strategy: _Optional[_Union[MergeableStrategy, str]] = ...) -> None: ...
+
+class MergeableInfo(_message.Message):
+    __slots__ = ("submit_type", "strategy", "mergeable", "commit_merged", "content_merged", "conflicts", "mergeable_into")
+    class SubmitType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        SUBMIT_TYPE_UNSPECIFIED: _ClassVar[MergeableInfo.SubmitType]
+        MERGE_IF_NECESSARY: _ClassVar[MergeableInfo.SubmitType]
+        FAST_FORWARD_ONLY: _ClassVar[MergeableInfo.SubmitType]
+        REBASE_IF_NECESSARY: _ClassVar[MergeableInfo.SubmitType]
+        REBASE_ALWAYS: _ClassVar[MergeableInfo.SubmitType]
+        MERGE_ALWAYS: _ClassVar[MergeableInfo.SubmitType]
+        CHERRY_PICK: _ClassVar[MergeableInfo.SubmitType]
+    SUBMIT_TYPE_UNSPECIFIED: MergeableInfo.SubmitType
+    MERGE_IF_NECESSARY: MergeableInfo.SubmitType
+    FAST_FORWARD_ONLY: MergeableInfo.SubmitType
+    REBASE_IF_NECESSARY: MergeableInfo.SubmitType
+    REBASE_ALWAYS: MergeableInfo.SubmitType
+    MERGE_ALWAYS: MergeableInfo.SubmitType
+    CHERRY_PICK: MergeableInfo.SubmitType
+    SUBMIT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    STRATEGY_FIELD_NUMBER: _ClassVar[int]
+    MERGEABLE_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_MERGED_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_MERGED_FIELD_NUMBER: _ClassVar[int]
+    CONFLICTS_FIELD_NUMBER: _ClassVar[int]
+    MERGEABLE_INTO_FIELD_NUMBER: _ClassVar[int]
+    submit_type: MergeableInfo.SubmitType
+    strategy: MergeableStrategy
+    mergeable: bool
+    commit_merged: bool
+    content_merged: bool
+    conflicts: _containers.RepeatedScalarFieldContainer[str]
+    mergeable_into: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, submit_type: _Optional[_Union[MergeableInfo.SubmitType, str]] = ..., strategy: _Optional[_Union[MergeableStrategy, str]] = ..., mergeable: bool = ..., commit_merged: bool = ..., content_merged: bool = ..., conflicts: _Optional[_Iterable[str]] = ..., mergeable_into: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ListFilesRequest(_message.Message):
+    __slots__ = ("number", "project", "revision_id", "substring_query", "parent", "base")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REVISION_ID_FIELD_NUMBER: _ClassVar[int]
+    SUBSTRING_QUERY_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    BASE_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    revision_id: str
+    substring_query: str
+    parent: int
+    base: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., revision_id: _Optional[str] = ..., substring_query: _Optional[str] = ..., parent: _Optional[int] = ..., base: _Optional[str] = ...) -> None: ...
+
+class ListFilesResponse(_message.Message):
+    __slots__ = ("files",)
+    class FilesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: FileInfo
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[FileInfo, _Mapping]] = ...) -> None: ...
+    FILES_FIELD_NUMBER: _ClassVar[int]
+    files: _containers.MessageMap[str, FileInfo]
+    def __init__(self, files: _Optional[_Mapping[str, FileInfo]] = ...) -> None: ...
+
+class GetRelatedChangesRequest(_message.Message):
+    __slots__ = ("number", "project", "revision_id")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REVISION_ID_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    revision_id: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ..., revision_id: _Optional[str] = ...) -> None: ...
+
+class GetRelatedChangesResponse(_message.Message):
+    __slots__ = ("changes",)
+    class ChangeAndCommit(_message.Message):
+        __slots__ = ("project", "commit", "number", "patchset", "current_patchset", "status")
+        PROJECT_FIELD_NUMBER: _ClassVar[int]
+        COMMIT_FIELD_NUMBER: _ClassVar[int]
+        NUMBER_FIELD_NUMBER: _ClassVar[int]
+        PATCHSET_FIELD_NUMBER: _ClassVar[int]
+        CURRENT_PATCHSET_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        project: str
+        commit: CommitInfo
+        number: int
+        patchset: int
+        current_patchset: int
+        status: ChangeStatus
+        def __init__(self, project: _Optional[str] = ..., commit: _Optional[_Union[CommitInfo, _Mapping]] = ..., number: _Optional[int] = ..., patchset: _Optional[int] = ..., current_patchset: _Optional[int] = ..., status: _Optional[_Union[ChangeStatus, str]] = ...) -> None: ...
+    CHANGES_FIELD_NUMBER: _ClassVar[int]
+    changes: _containers.RepeatedCompositeFieldContainer[GetRelatedChangesResponse.ChangeAndCommit]
+    def __init__(self, changes: _Optional[_Iterable[_Union[GetRelatedChangesResponse.ChangeAndCommit, _Mapping]]] = ...) -> None: ...
+
+class ListProjectsRequest(_message.Message):
+    __slots__ = ("refs",)
+    REFS_FIELD_NUMBER: _ClassVar[int]
+    refs: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, refs: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class WebLinkInfo(_message.Message):
+    __slots__ = ("name", "url", "image_url")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_URL_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    url: str
+    image_url: str
+    def __init__(self, name: _Optional[str] = ..., url: _Optional[str] = ..., image_url: _Optional[str] = ...) -> None: ...
+
+class ProjectInfo(_message.Message):
+    __slots__ = ("name", "parent", "description", "state", "refs", "web_links")
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        PROJECT_STATE_UNSPECIFIED: _ClassVar[ProjectInfo.State]
+        PROJECT_STATE_ACTIVE: _ClassVar[ProjectInfo.State]
+        PROJECT_STATE_READ_ONLY: _ClassVar[ProjectInfo.State]
+        PROJECT_STATE_HIDDEN: _ClassVar[ProjectInfo.State]
+    PROJECT_STATE_UNSPECIFIED: ProjectInfo.State
+    PROJECT_STATE_ACTIVE: ProjectInfo.State
+    PROJECT_STATE_READ_ONLY: ProjectInfo.State
+    PROJECT_STATE_HIDDEN: ProjectInfo.State
+    class RefsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    REFS_FIELD_NUMBER: _ClassVar[int]
+    WEB_LINKS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    parent: str
+    description: str
+    state: ProjectInfo.State
+    refs: _containers.ScalarMap[str, str]
+    web_links: _containers.RepeatedCompositeFieldContainer[WebLinkInfo]
+    def __init__(self, name: _Optional[str] = ..., parent: _Optional[str] = ..., description: _Optional[str] = ..., state: _Optional[_Union[ProjectInfo.State, str]] = ..., refs: _Optional[_Mapping[str, str]] = ..., web_links: _Optional[_Iterable[_Union[WebLinkInfo, _Mapping]]] = ...) -> None: ...
+
+class ListProjectsResponse(_message.Message):
+    __slots__ = ("Projects",)
+    class ProjectsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: ProjectInfo
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[ProjectInfo, _Mapping]] = ...) -> None: ...
+    PROJECTS_FIELD_NUMBER: _ClassVar[int]
+    Projects: _containers.MessageMap[str, ProjectInfo]
+    def __init__(self, Projects: _Optional[_Mapping[str, ProjectInfo]] = ...) -> None: ...
+
+class RefInfoRequest(_message.Message):
+    __slots__ = ("project", "ref")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    ref: str
+    def __init__(self, project: _Optional[str] = ..., ref: _Optional[str] = ...) -> None: ...
+
+class RefInfo(_message.Message):
+    __slots__ = ("ref", "revision")
+    REF_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    ref: str
+    revision: str
+    def __init__(self, ref: _Optional[str] = ..., revision: _Optional[str] = ...) -> None: ...
+
+class AccountOptions(_message.Message):
+    __slots__ = ("details", "all_emails")
+    DETAILS_FIELD_NUMBER: _ClassVar[int]
+    ALL_EMAILS_FIELD_NUMBER: _ClassVar[int]
+    details: bool
+    all_emails: bool
+    def __init__(self, details: bool = ..., all_emails: bool = ...) -> None: ...
+
+class ListFileOwnersRequest(_message.Message):
+    __slots__ = ("project", "ref", "path", "options")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    OPTIONS_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    ref: str
+    path: str
+    options: AccountOptions
+    def __init__(self, project: _Optional[str] = ..., ref: _Optional[str] = ..., path: _Optional[str] = ..., options: _Optional[_Union[AccountOptions, _Mapping]] = ...) -> None: ...
+
+class OwnerInfo(_message.Message):
+    __slots__ = ("account",)
+    ACCOUNT_FIELD_NUMBER: _ClassVar[int]
+    account: AccountInfo
+    def __init__(self, account: _Optional[_Union[AccountInfo, _Mapping]] = ...) -> None: ...
+
+class ListOwnersResponse(_message.Message):
+    __slots__ = ("owners",)
+    OWNERS_FIELD_NUMBER: _ClassVar[int]
+    owners: _containers.RepeatedCompositeFieldContainer[OwnerInfo]
+    def __init__(self, owners: _Optional[_Iterable[_Union[OwnerInfo, _Mapping]]] = ...) -> None: ...
+
+class EmailInfo(_message.Message):
+    __slots__ = ("email", "preferred", "pending_confirmation")
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    PREFERRED_FIELD_NUMBER: _ClassVar[int]
+    PENDING_CONFIRMATION_FIELD_NUMBER: _ClassVar[int]
+    email: str
+    preferred: bool
+    pending_confirmation: bool
+    def __init__(self, email: _Optional[str] = ..., preferred: bool = ..., pending_confirmation: bool = ...) -> None: ...
+
+class ListAccountEmailsRequest(_message.Message):
+    __slots__ = ("email",)
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    email: str
+    def __init__(self, email: _Optional[str] = ...) -> None: ...
+
+class ListAccountEmailsResponse(_message.Message):
+    __slots__ = ("emails",)
+    EMAILS_FIELD_NUMBER: _ClassVar[int]
+    emails: _containers.RepeatedCompositeFieldContainer[EmailInfo]
+    def __init__(self, emails: _Optional[_Iterable[_Union[EmailInfo, _Mapping]]] = ...) -> None: ...
+
+class CheckRaptRequest(_message.Message):
+    __slots__ = ("project", "ref")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    ref: str
+    def __init__(self, project: _Optional[str] = ..., ref: _Optional[str] = ...) -> None: ...
+
+class CheckRaptResponse(_message.Message):
+    __slots__ = ("has_valid_rapt", "rapt_required")
+    HAS_VALID_RAPT_FIELD_NUMBER: _ClassVar[int]
+    RAPT_REQUIRED_FIELD_NUMBER: _ClassVar[int]
+    has_valid_rapt: bool
+    rapt_required: bool
+    def __init__(self, has_valid_rapt: bool = ..., rapt_required: bool = ...) -> None: ...
+
+class GetPureRevertRequest(_message.Message):
+    __slots__ = ("number", "project")
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    project: str
+    def __init__(self, number: _Optional[int] = ..., project: _Optional[str] = ...) -> None: ...
+
+class PureRevertInfo(_message.Message):
+    __slots__ = ("is_pure_revert",)
+    IS_PURE_REVERT_FIELD_NUMBER: _ClassVar[int]
+    is_pure_revert: bool
+    def __init__(self, is_pure_revert: bool = ...) -> None: ...
+
+class SubmitRequirementResultInfo(_message.Message):
+    __slots__ = ("name", "description", "status", "is_legacy", "applicability_expression_result", "submittability_expression_result", "override_expression_result")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        SUBMIT_REQUIREMENT_STATUS_UNSPECIFIED: _ClassVar[SubmitRequirementResultInfo.Status]
+        SATISFIED: _ClassVar[SubmitRequirementResultInfo.Status]
+        UNSATISFIED: _ClassVar[SubmitRequirementResultInfo.Status]
+        OVERRIDDEN: _ClassVar[SubmitRequirementResultInfo.Status]
+        NOT_APPLICABLE: _ClassVar[SubmitRequirementResultInfo.Status]
+        ERROR: _ClassVar[SubmitRequirementResultInfo.Status]
+        FORCED: _ClassVar[SubmitRequirementResultInfo.Status]
+    SUBMIT_REQUIREMENT_STATUS_UNSPECIFIED: SubmitRequirementResultInfo.Status
+    SATISFIED: SubmitRequirementResultInfo.Status
+    UNSATISFIED: SubmitRequirementResultInfo.Status
+    OVERRIDDEN: SubmitRequirementResultInfo.Status
+    NOT_APPLICABLE: SubmitRequirementResultInfo.Status
+    ERROR: SubmitRequirementResultInfo.Status
+    FORCED: SubmitRequirementResultInfo.Status
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IS_LEGACY_FIELD_NUMBER: _ClassVar[int]
+    APPLICABILITY_EXPRESSION_RESULT_FIELD_NUMBER: _ClassVar[int]
+    SUBMITTABILITY_EXPRESSION_RESULT_FIELD_NUMBER: _ClassVar[int]
+    OVERRIDE_EXPRESSION_RESULT_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    description: str
+    status: SubmitRequirementResultInfo.Status
+    is_legacy: bool
+    applicability_expression_result: SubmitRequirementExpressionInfo
+    submittability_expression_result: SubmitRequirementExpressionInfo
+    override_expression_result: SubmitRequirementExpressionInfo
+    def __init__(self, name: _Optional[str] = ..., description: _Optional[str] = ..., status: _Optional[_Union[SubmitRequirementResultInfo.Status, str]] = ..., is_legacy: bool = ..., applicability_expression_result: _Optional[_Union[SubmitRequirementExpressionInfo, _Mapping]] = ..., submittability_expression_result: _Optional[_Union[SubmitRequirementExpressionInfo, _Mapping]] = ..., override_expression_result: _Optional[_Union[SubmitRequirementExpressionInfo, _Mapping]] = ...) -> None: ...
+
+class SubmitRequirementExpressionInfo(_message.Message):
+    __slots__ = ("expression", "fulfilled", "passing_atoms", "failing_atoms", "error_message")
+    EXPRESSION_FIELD_NUMBER: _ClassVar[int]
+    FULFILLED_FIELD_NUMBER: _ClassVar[int]
+    PASSING_ATOMS_FIELD_NUMBER: _ClassVar[int]
+    FAILING_ATOMS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    expression: str
+    fulfilled: bool
+    passing_atoms: _containers.RepeatedScalarFieldContainer[str]
+    failing_atoms: _containers.RepeatedScalarFieldContainer[str]
+    error_message: str
+    def __init__(self, expression: _Optional[str] = ..., fulfilled: bool = ..., passing_atoms: _Optional[_Iterable[str]] = ..., failing_atoms: _Optional[_Iterable[str]] = ..., error_message: _Optional[str] = ...) -> None: ...
+
+class GetMetaDiffRequest(_message.Message):
+    __slots__ = ("project", "number", "old", "meta", "options")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    OLD_FIELD_NUMBER: _ClassVar[int]
+    META_FIELD_NUMBER: _ClassVar[int]
+    OPTIONS_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    number: int
+    old: str
+    meta: str
+    options: _containers.RepeatedScalarFieldContainer[QueryOption]
+    def __init__(self, project: _Optional[str] = ..., number: _Optional[int] = ..., old: _Optional[str] = ..., meta: _Optional[str] = ..., options: _Optional[_Iterable[_Union[QueryOption, str]]] = ...) -> None: ...
+
+class MetaDiff(_message.Message):
+    __slots__ = ("added", "removed", "old_change_info", "new_change_info")
+    ADDED_FIELD_NUMBER: _ClassVar[int]
+    REMOVED_FIELD_NUMBER: _ClassVar[int]
+    OLD_CHANGE_INFO_FIELD_NUMBER: _ClassVar[int]
+    NEW_CHANGE_INFO_FIELD_NUMBER: _ClassVar[int]
+    added: ChangeInfo
+    removed: ChangeInfo
+    old_change_info: ChangeInfo
+    new_change_info: ChangeInfo
+    def __init__(self, added: _Optional[_Union[ChangeInfo, _Mapping]] = ..., removed: _Optional[_Union[ChangeInfo, _Mapping]] = ..., old_change_info: _Optional[_Union[ChangeInfo, _Mapping]] = ..., new_change_info: _Optional[_Union[ChangeInfo, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/gerrit/source_repo_event.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/gerrit/source_repo_event.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n@go.chromium.org/luci/common/proto/gerrit/source_repo_event.proto\x12\x06gerrit\x1a\x1fgoogle/protobuf/timestamp.proto\"\xba\x06\n\x0fSourceRepoEvent\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12.\n\nevent_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x42\n\x10ref_update_event\x18\x04 \x01(\x0b\x32&.gerrit.SourceRepoEvent.RefUpdateEventH\x00\x12\x44\n\x11\x63reate_repo_event\x18\x05 \x01(\x0b\x32\'.gerrit.SourceRepoEvent.CreateRepoEventH\x00\x12\x44\n\x11\x64\x65lete_repo_event\x18\x06 \x01(\x0b\x32\'.gerrit.SourceRepoEvent.DeleteRepoEventH\x00\x1a\xdc\x03\n\x0eRefUpdateEvent\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12K\n\x0bref_updates\x18\x02 \x03(\x0b\x32\x36.gerrit.SourceRepoEvent.RefUpdateEvent.RefUpdatesEntry\x1a\x88\x02\n\tRefUpdate\x12\x10\n\x08ref_name\x18\x01 \x01(\t\x12P\n\x0bupdate_type\x18\x02 \x01(\x0e\x32;.gerrit.SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType\x12\x0e\n\x06old_id\x18\x03 \x01(\t\x12\x0e\n\x06new_id\x18\x04 \x01(\t\"w\n\nUpdateType\x12\x1b\n\x17UPDATE_TYPE_UNSPECIFIED\x10\x00\x12\n\n\x06\x43REATE\x10\x01\x12\x17\n\x13UPDATE_FAST_FORWARD\x10\x02\x12\x1b\n\x17UPDATE_NON_FAST_FORWARD\x10\x03\x12\n\n\x06\x44\x45LETE\x10\x04\x1a\x63\n\x0fRefUpdatesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12?\n\x05value\x18\x02 \x01(\x0b\x32\x30.gerrit.SourceRepoEvent.RefUpdateEvent.RefUpdate:\x02\x38\x01\x1a\x11\n\x0f\x43reateRepoEvent\x1a\x11\n\x0f\x44\x65leteRepoEventB\x07\n\x05\x65ventB3Z1go.chromium.org/luci/common/proto/gerrit;gerritpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.gerrit.source_repo_event_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/common/proto/gerrit;gerritpb'
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATESENTRY']._loaded_options = None
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATESENTRY']._serialized_options = b'8\001'
+  _globals['_SOURCEREPOEVENT']._serialized_start=110
+  _globals['_SOURCEREPOEVENT']._serialized_end=936
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT']._serialized_start=413
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT']._serialized_end=889
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATE']._serialized_start=524
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATE']._serialized_end=788
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATE_UPDATETYPE']._serialized_start=669
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATE_UPDATETYPE']._serialized_end=788
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATESENTRY']._serialized_start=790
+  _globals['_SOURCEREPOEVENT_REFUPDATEEVENT_REFUPDATESENTRY']._serialized_end=889
+  _globals['_SOURCEREPOEVENT_CREATEREPOEVENT']._serialized_start=891
+  _globals['_SOURCEREPOEVENT_CREATEREPOEVENT']._serialized_end=908
+  _globals['_SOURCEREPOEVENT_DELETEREPOEVENT']._serialized_start=910
+  _globals['_SOURCEREPOEVENT_DELETEREPOEVENT']._serialized_end=927
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,70 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SourceRepoEvent(_message.Message):
+    __slots__ = ("name", "url", "event_time", "ref_update_event", "create_repo_event", "delete_repo_event")
+    class RefUpdateEvent(_message.Message):
+        __slots__ = ("email", "ref_updates")
+        class RefUpdate(_message.Message):
+            __slots__ = ("ref_name", "update_type", "old_id", "new_id")
+            class UpdateType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+                __slots__ = ()
+                UPDATE_TYPE_UNSPECIFIED: _ClassVar[SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType]
+                CREATE: _ClassVar[SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType]
+                UPDATE_FAST_FORWARD: _ClassVar[SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType]
+                UPDATE_NON_FAST_FORWARD: _ClassVar[SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType]
+                DELETE: _ClassVar[SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType]
+            UPDATE_TYPE_UNSPECIFIED: SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType
+            CREATE: SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType
+            UPDATE_FAST_FORWARD: SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType
+            UPDATE_NON_FAST_FORWARD: SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType
+            DELETE: SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType
+            REF_NAME_FIELD_NUMBER: _ClassVar[int]
+            UPDATE_TYPE_FIELD_NUMBER: _ClassVar[int]
+            OLD_ID_FIELD_NUMBER: _ClassVar[int]
+            NEW_ID_FIELD_NUMBER: _ClassVar[int]
+            ref_name: str
+            update_type: SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType
+            old_id: str
+            new_id: str
+            def __init__(self, ref_name: _Optional[str] = ..., update_type: _Optional[_Union[SourceRepoEvent.RefUpdateEvent.RefUpdate.UpdateType, str]] = ..., old_id: _Optional[str] = ..., new_id: _Optional[str] = ...) -> None: ...
+        class RefUpdatesEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: SourceRepoEvent.RefUpdateEvent.RefUpdate
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[SourceRepoEvent.RefUpdateEvent.RefUpdate, _Mapping]] = ...) -> None: ...
+        EMAIL_FIELD_NUMBER: _ClassVar[int]
+        REF_UPDATES_FIELD_NUMBER: _ClassVar[int]
+        email: str
+        ref_updates: _containers.MessageMap[str, SourceRepoEvent.RefUpdateEvent.RefUpdate]
+        def __init__(self, email: _Optional[str] = ..., ref_updates: _Optional[_Mapping[str, SourceRepoEvent.RefUpdateEvent.RefUpdate]] = ...) -> None: ...
+    class CreateRepoEvent(_message.Message):
+        __slots__ = ()
+        def __init__(self) -> None: ...
+    class DeleteRepoEvent(_message.Message):
+        __slots__ = ()
+        def __init__(self) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    EVENT_TIME_FIELD_NUMBER: _ClassVar[int]
+    REF_UPDATE_EVENT_FIELD_NUMBER: _ClassVar[int]
+    CREATE_REPO_EVENT_FIELD_NUMBER: _ClassVar[int]
+    DELETE_REPO_EVENT_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    url: str
+    event_time: _timestamp_pb2.Timestamp
+    ref_update_event: SourceRepoEvent.RefUpdateEvent
+    create_repo_event: SourceRepoEvent.CreateRepoEvent
+    delete_repo_event: SourceRepoEvent.DeleteRepoEvent
+    def __init__(self, name: _Optional[str] = ..., url: _Optional[str] = ..., event_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., ref_update_event: _Optional[_Union[SourceRepoEvent.RefUpdateEvent, _Mapping]] = ..., create_repo_event: _Optional[_Union[SourceRepoEvent.CreateRepoEvent, _Mapping]] = ..., delete_repo_event: _Optional[_Union[SourceRepoEvent.DeleteRepoEvent, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/git/commit.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/git/commit.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2go.chromium.org/luci/common/proto/git/commit.proto\x12\x03git\x1a\x1fgoogle/protobuf/timestamp.proto\"\xec\x03\n\x06\x43ommit\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04tree\x18\x02 \x01(\t\x12\x0f\n\x07parents\x18\x03 \x03(\t\x12 \n\x06\x61uthor\x18\x04 \x01(\x0b\x32\x10.git.Commit.User\x12#\n\tcommitter\x18\x05 \x01(\x0b\x32\x10.git.Commit.User\x12\x0f\n\x07message\x18\x06 \x01(\t\x12\'\n\ttree_diff\x18\x07 \x03(\x0b\x32\x14.git.Commit.TreeDiff\x1aM\n\x04User\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12(\n\x04time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\xe6\x01\n\x08TreeDiff\x12-\n\x04type\x18\x01 \x01(\x0e\x32\x1f.git.Commit.TreeDiff.ChangeType\x12\x0e\n\x06old_id\x18\x02 \x01(\t\x12\x10\n\x08old_mode\x18\x03 \x01(\r\x12\x10\n\x08old_path\x18\x04 \x01(\t\x12\x0e\n\x06new_id\x18\x05 \x01(\t\x12\x10\n\x08new_mode\x18\x06 \x01(\r\x12\x10\n\x08new_path\x18\x07 \x01(\t\"C\n\nChangeType\x12\x07\n\x03\x41\x44\x44\x10\x00\x12\x08\n\x04\x43OPY\x10\x01\x12\n\n\x06\x44\x45LETE\x10\x02\x12\n\n\x06MODIFY\x10\x03\x12\n\n\x06RENAME\x10\x04\"u\n\x04\x46ile\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0c\n\x04mode\x18\x03 \x01(\r\x12\x1c\n\x04type\x18\x04 \x01(\x0e\x32\x0e.git.File.Type\"\'\n\x04Type\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x08\n\x04TREE\x10\x01\x12\x08\n\x04\x42LOB\x10\x02\x42\'Z%go.chromium.org/luci/common/proto/gitb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.git.commit_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z%go.chromium.org/luci/common/proto/git'
+  _globals['_COMMIT']._serialized_start=93
+  _globals['_COMMIT']._serialized_end=585
+  _globals['_COMMIT_USER']._serialized_start=275
+  _globals['_COMMIT_USER']._serialized_end=352
+  _globals['_COMMIT_TREEDIFF']._serialized_start=355
+  _globals['_COMMIT_TREEDIFF']._serialized_end=585
+  _globals['_COMMIT_TREEDIFF_CHANGETYPE']._serialized_start=518
+  _globals['_COMMIT_TREEDIFF_CHANGETYPE']._serialized_end=585
+  _globals['_FILE']._serialized_start=587
+  _globals['_FILE']._serialized_end=704
+  _globals['_FILE_TYPE']._serialized_start=665
+  _globals['_FILE_TYPE']._serialized_end=704
+# @@protoc_insertion_point(module_scope)
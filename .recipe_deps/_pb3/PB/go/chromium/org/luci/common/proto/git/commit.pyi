@@ -0,0 +1,87 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Commit(_message.Message):
+    __slots__ = ("id", "tree", "parents", "author", "committer", "message", "tree_diff")
+    class User(_message.Message):
+        __slots__ = ("name", "email", "time")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        EMAIL_FIELD_NUMBER: _ClassVar[int]
+        TIME_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        email: str
+        time: _timestamp_pb2.Timestamp
+        def __init__(self, name: _Optional[str] = ..., email: _Optional[str] = ..., time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+    class TreeDiff(_message.Message):
+        __slots__ = ("type", "old_id", "old_mode", "old_path", "new_id", "new_mode", "new_path")
+        class ChangeType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+            __slots__ = ()
+            ADD: _ClassVar[Commit.TreeDiff.ChangeType]
+            COPY: _ClassVar[Commit.TreeDiff.ChangeType]
+            DELETE: _ClassVar[Commit.TreeDiff.ChangeType]
+            MODIFY: _ClassVar[Commit.TreeDiff.ChangeType]
+            RENAME: _ClassVar[Commit.TreeDiff.ChangeType]
+        ADD: Commit.TreeDiff.ChangeType
+        COPY: Commit.TreeDiff.ChangeType
+        DELETE: Commit.TreeDiff.ChangeType
+        MODIFY: Commit.TreeDiff.ChangeType
+        RENAME: Commit.TreeDiff.ChangeType
+        TYPE_FIELD_NUMBER: _ClassVar[int]
+        OLD_ID_FIELD_NUMBER: _ClassVar[int]
+        OLD_MODE_FIELD_NUMBER: _ClassVar[int]
+        OLD_PATH_FIELD_NUMBER: _ClassVar[int]
+        NEW_ID_FIELD_NUMBER: _ClassVar[int]
+        NEW_MODE_FIELD_NUMBER: _ClassVar[int]
+        NEW_PATH_FIELD_NUMBER: _ClassVar[int]
+        type: Commit.TreeDiff.ChangeType
+        old_id: str
+        old_mode: int
+        old_path: str
+        new_id: str
+        new_mode: int
+        new_path: str
+        def __init__(self, type: _Optional[_Union[Commit.TreeDiff.ChangeType, str]] = ..., old_id: _Optional[str] = ..., old_mode: _Optional[int] = ..., old_path: _Optional[str] = ..., new_id: _Optional[str] = ..., new_mode: _Optional[int] = ..., new_path: _Optional[str] = ...) -> None: ...
+    ID_FIELD_NUMBER: _ClassVar[int]
+    TREE_FIELD_NUMBER: _ClassVar[int]
+    PARENTS_FIELD_NUMBER: _ClassVar[int]
+    AUTHOR_FIELD_NUMBER: _ClassVar[int]
+    COMMITTER_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    TREE_DIFF_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    tree: str
+    parents: _containers.RepeatedScalarFieldContainer[str]
+    author: Commit.User
+    committer: Commit.User
+    message: str
+    tree_diff: _containers.RepeatedCompositeFieldContainer[Commit.TreeDiff]
+    def __init__(self, id: _Optional[str] = ..., tree: _Optional[str] = ..., parents: _Optional[_Iterable[str]] = ..., author: _Optional[_Union[Commit.User, _Mapping]] = ..., committer: _Optional[_Union[Commit.User, _Mapping]] = ..., message: _Optional[str] = ..., tree_diff: _Optional[_Iterable[_Union[Commit.TreeDiff, _Mapping]]] = ...) -> None: ...
+
+class File(_message.Message):
+    __slots__ = ("id", "path", "mode", "type")
+    class Type(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        UNKNOWN: _ClassVar[File.Type]
+        TREE: _ClassVar[File.Type]
+        BLOB: _ClassVar[File.Type]
+    UNKNOWN: File.Type
+    TREE: File.Type
+    BLOB: File.Type
+    ID_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    MODE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    path: str
+    mode: int
+    type: File.Type
+    def __init__(self, id: _Optional[str] = ..., path: _Optional[str] = ..., mode: _Optional[int] = ..., type: _Optional[_Union[File.Type, str]] = ...) -> None: ...
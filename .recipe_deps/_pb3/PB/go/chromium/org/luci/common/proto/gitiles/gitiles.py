@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/gitiles/gitiles.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/gitiles/gitiles.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.common.proto.git import commit as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_git_dot_commit__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7go.chromium.org/luci/common/proto/gitiles/gitiles.proto\x12\x07gitiles\x1a\x32go.chromium.org/luci/common/proto/git/commit.proto\"\x97\x01\n\nLogRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x12\n\ncommittish\x18\x03 \x01(\t\x12\x1c\n\x14\x65xclude_ancestors_of\x18\x02 \x01(\t\x12\x11\n\ttree_diff\x18\x04 \x01(\x08\x12\x0c\n\x04path\x18\x0c \x01(\t\x12\x12\n\npage_token\x18\n \x01(\t\x12\x11\n\tpage_size\x18\x0b \x01(\x05\"@\n\x0bLogResponse\x12\x18\n\x03log\x18\x01 \x03(\x0b\x32\x0b.git.Commit\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"1\n\x0bRefsRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x11\n\trefs_path\x18\x02 \x01(\t\"y\n\x0cRefsResponse\x12\x37\n\trevisions\x18\x02 \x03(\x0b\x32$.gitiles.RefsResponse.RevisionsEntry\x1a\x30\n\x0eRevisionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xa9\x01\n\x0e\x41rchiveRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0b\n\x03ref\x18\x02 \x01(\t\x12.\n\x06\x66ormat\x18\x03 \x01(\x0e\x32\x1e.gitiles.ArchiveRequest.Format\x12\x0c\n\x04path\x18\x04 \x01(\t\";\n\x06\x46ormat\x12\x0b\n\x07Invalid\x10\x00\x12\x08\n\x04GZIP\x10\x01\x12\x07\n\x03TAR\x10\x02\x12\t\n\x05\x42ZIP2\x10\x03\x12\x06\n\x02XZ\x10\x04\"5\n\x0f\x41rchiveResponse\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x10\n\x08\x63ontents\x18\x02 \x01(\x0c\"\xaf\x01\n\x13\x44ownloadFileRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x12\n\ncommittish\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\x12\x33\n\x06\x66ormat\x18\x04 \x01(\x0e\x32#.gitiles.DownloadFileRequest.Format\"0\n\x06\x46ormat\x12\x12\n\x0e\x46ORMAT_INVALID\x10\x00\x12\x08\n\x04TEXT\x10\x01\x12\x08\n\x04JSON\x10\x02\"(\n\x14\x44ownloadFileResponse\x12\x10\n\x08\x63ontents\x18\x01 \x01(\t\"V\n\x13\x44ownloadDiffRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x12\n\ncommittish\x18\x02 \x01(\t\x12\x0c\n\x04\x62\x61se\x18\x04 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\"(\n\x14\x44ownloadDiffResponse\x12\x10\n\x08\x63ontents\x18\x01 \x01(\t\"!\n\x11GetProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"*\n\x07Project\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tclone_url\x18\x02 \x01(\t\"\x11\n\x0fProjectsRequest\"$\n\x10ProjectsResponse\x12\x10\n\x08projects\x18\x01 \x03(\t\"E\n\x10ListFilesRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x12\n\ncommittish\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\"-\n\x11ListFilesResponse\x12\x18\n\x05\x66iles\x18\x01 \x03(\x0b\x32\t.git.File2\x99\x04\n\x07Gitiles\x12\x32\n\x03Log\x12\x13.gitiles.LogRequest\x1a\x14.gitiles.LogResponse\"\x00\x12\x35\n\x04Refs\x12\x14.gitiles.RefsRequest\x1a\x15.gitiles.RefsResponse\"\x00\x12>\n\x07\x41rchive\x12\x17.gitiles.ArchiveRequest\x1a\x18.gitiles.ArchiveResponse\"\x00\x12M\n\x0c\x44ownloadFile\x12\x1c.gitiles.DownloadFileRequest\x1a\x1d.gitiles.DownloadFileResponse\"\x00\x12M\n\x0c\x44ownloadDiff\x12\x1c.gitiles.DownloadDiffRequest\x1a\x1d.gitiles.DownloadDiffResponse\"\x00\x12<\n\nGetProject\x12\x1a.gitiles.GetProjectRequest\x1a\x10.gitiles.Project\"\x00\x12\x41\n\x08Projects\x12\x18.gitiles.ProjectsRequest\x1a\x19.gitiles.ProjectsResponse\"\x00\x12\x44\n\tListFiles\x12\x19.gitiles.ListFilesRequest\x1a\x1a.gitiles.ListFilesResponse\"\x00\x42+Z)go.chromium.org/luci/common/proto/gitilesb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.gitiles.gitiles_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z)go.chromium.org/luci/common/proto/gitiles'
+  _globals['_REFSRESPONSE_REVISIONSENTRY']._loaded_options = None
+  _globals['_REFSRESPONSE_REVISIONSENTRY']._serialized_options = b'8\001'
+  _globals['_LOGREQUEST']._serialized_start=121
+  _globals['_LOGREQUEST']._serialized_end=272
+  _globals['_LOGRESPONSE']._serialized_start=274
+  _globals['_LOGRESPONSE']._serialized_end=338
+  _globals['_REFSREQUEST']._serialized_start=340
+  _globals['_REFSREQUEST']._serialized_end=389
+  _globals['_REFSRESPONSE']._serialized_start=391
+  _globals['_REFSRESPONSE']._serialized_end=512
+  _globals['_REFSRESPONSE_REVISIONSENTRY']._serialized_start=464
+  _globals['_REFSRESPONSE_REVISIONSENTRY']._serialized_end=512
+  _globals['_ARCHIVEREQUEST']._serialized_start=515
+  _globals['_ARCHIVEREQUEST']._serialized_end=684
+  _globals['_ARCHIVEREQUEST_FORMAT']._serialized_start=625
+  _globals['_ARCHIVEREQUEST_FORMAT']._serialized_end=684
+  _globals['_ARCHIVERESPONSE']._serialized_start=686
+  _globals['_ARCHIVERESPONSE']._serialized_end=739
+  _globals['_DOWNLOADFILEREQUEST']._serialized_start=742
+  _globals['_DOWNLOADFILEREQUEST']._serialized_end=917
+  _globals['_DOWNLOADFILEREQUEST_FORMAT']._serialized_start=869
+  _globals['_DOWNLOADFILEREQUEST_FORMAT']._serialized_end=917
+  _globals['_DOWNLOADFILERESPONSE']._serialized_start=919
+  _globals['_DOWNLOADFILERESPONSE']._serialized_end=959
+  _globals['_DOWNLOADDIFFREQUEST']._serialized_start=961
+  _globals['_DOWNLOADDIFFREQUEST']._serialized_end=1047
+  _globals['_DOWNLOADDIFFRESPONSE']._serialized_start=1049
+  _globals['_DOWNLOADDIFFRESPONSE']._serialized_end=1089
+  _globals['_GETPROJECTREQUEST']._serialized_start=1091
+  _globals['_GETPROJECTREQUEST']._serialized_end=1124
+  _globals['_PROJECT']._serialized_start=1126
+  _globals['_PROJECT']._serialized_end=1168
+  _globals['_PROJECTSREQUEST']._serialized_start=1170
+  _globals['_PROJECTSREQUEST']._serialized_end=1187
+  _globals['_PROJECTSRESPONSE']._serialized_start=1189
+  _globals['_PROJECTSRESPONSE']._serialized_end=1225
+  _globals['_LISTFILESREQUEST']._serialized_start=1227
+  _globals['_LISTFILESREQUEST']._serialized_end=1296
+  _globals['_LISTFILESRESPONSE']._serialized_start=1298
+  _globals['_LISTFILESRESPONSE']._serialized_end=1343
+  _globals['_GITILES']._serialized_start=1346
+  _globals['_GITILES']._serialized_end=1883
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,172 @@
+from PB.go.chromium.org.luci.common.proto.git import commit as _commit_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class LogRequest(_message.Message):
+    __slots__ = ("project", "committish", "exclude_ancestors_of", "tree_diff", "path", "page_token", "page_size")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    COMMITTISH_FIELD_NUMBER: _ClassVar[int]
+    EXCLUDE_ANCESTORS_OF_FIELD_NUMBER: _ClassVar[int]
+    TREE_DIFF_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    committish: str
+    exclude_ancestors_of: str
+    tree_diff: bool
+    path: str
+    page_token: str
+    page_size: int
+    def __init__(self, project: _Optional[str] = ..., committish: _Optional[str] = ..., exclude_ancestors_of: _Optional[str] = ..., tree_diff: bool = ..., path: _Optional[str] = ..., page_token: _Optional[str] = ..., page_size: _Optional[int] = ...) -> None: ...
+
+class LogResponse(_message.Message):
+    __slots__ = ("log", "next_page_token")
+    LOG_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    log: _containers.RepeatedCompositeFieldContainer[_commit_pb2.Commit]
+    next_page_token: str
+    def __init__(self, log: _Optional[_Iterable[_Union[_commit_pb2.Commit, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class RefsRequest(_message.Message):
+    __slots__ = ("project", "refs_path")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REFS_PATH_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    refs_path: str
+    def __init__(self, project: _Optional[str] = ..., refs_path: _Optional[str] = ...) -> None: ...
+
+class RefsResponse(_message.Message):
+    __slots__ = ("revisions",)
+    class RevisionsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    REVISIONS_FIELD_NUMBER: _ClassVar[int]
+    revisions: _containers.ScalarMap[str, str]
+    def __init__(self, revisions: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class ArchiveRequest(_message.Message):
+    __slots__ = ("project", "ref", "format", "path")
+    class Format(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        Invalid: _ClassVar[ArchiveRequest.Format]
+        GZIP: _ClassVar[ArchiveRequest.Format]
+        TAR: _ClassVar[ArchiveRequest.Format]
+        BZIP2: _ClassVar[ArchiveRequest.Format]
+        XZ: _ClassVar[ArchiveRequest.Format]
+    Invalid: ArchiveRequest.Format
+    GZIP: ArchiveRequest.Format
+    TAR: ArchiveRequest.Format
+    BZIP2: ArchiveRequest.Format
+    XZ: ArchiveRequest.Format
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    ref: str
+    format: ArchiveRequest.Format
+    path: str
+    def __init__(self, project: _Optional[str] = ..., ref: _Optional[str] = ..., format: _Optional[_Union[ArchiveRequest.Format, str]] = ..., path: _Optional[str] = ...) -> None: ...
+
+class ArchiveResponse(_message.Message):
+    __slots__ = ("filename", "contents")
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    CONTENTS_FIELD_NUMBER: _ClassVar[int]
+    filename: str
+    contents: bytes
+    def __init__(self, filename: _Optional[str] = ..., contents: _Optional[bytes] = ...) -> None: ...
+
+class DownloadFileRequest(_message.Message):
+    __slots__ = ("project", "committish", "path", "format")
+    class Format(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        FORMAT_INVALID: _ClassVar[DownloadFileRequest.Format]
+        TEXT: _ClassVar[DownloadFileRequest.Format]
+        JSON: _ClassVar[DownloadFileRequest.Format]
+    FORMAT_INVALID: DownloadFileRequest.Format
+    TEXT: DownloadFileRequest.Format
+    JSON: DownloadFileRequest.Format
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    COMMITTISH_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    committish: str
+    path: str
+    format: DownloadFileRequest.Format
+    def __init__(self, project: _Optional[str] = ..., committish: _Optional[str] = ..., path: _Optional[str] = ..., format: _Optional[_Union[DownloadFileRequest.Format, str]] = ...) -> None: ...
+
+class DownloadFileResponse(_message.Message):
+    __slots__ = ("contents",)
+    CONTENTS_FIELD_NUMBER: _ClassVar[int]
+    contents: str
+    def __init__(self, contents: _Optional[str] = ...) -> None: ...
+
+class DownloadDiffRequest(_message.Message):
+    __slots__ = ("project", "committish", "base", "path")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    COMMITTISH_FIELD_NUMBER: _ClassVar[int]
+    BASE_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    committish: str
+    base: str
+    path: str
+    def __init__(self, project: _Optional[str] = ..., committish: _Optional[str] = ..., base: _Optional[str] = ..., path: _Optional[str] = ...) -> None: ...
+
+class DownloadDiffResponse(_message.Message):
+    __slots__ = ("contents",)
+    CONTENTS_FIELD_NUMBER: _ClassVar[int]
+    contents: str
+    def __init__(self, contents: _Optional[str] = ...) -> None: ...
+
+class GetProjectRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class Project(_message.Message):
+    __slots__ = ("name", "clone_url")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    CLONE_URL_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    clone_url: str
+    def __init__(self, name: _Optional[str] = ..., clone_url: _Optional[str] = ...) -> None: ...
+
+class ProjectsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class ProjectsResponse(_message.Message):
+    __slots__ = ("projects",)
+    PROJECTS_FIELD_NUMBER: _ClassVar[int]
+    projects: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, projects: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ListFilesRequest(_message.Message):
+    __slots__ = ("project", "committish", "path")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    COMMITTISH_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    committish: str
+    path: str
+    def __init__(self, project: _Optional[str] = ..., committish: _Optional[str] = ..., path: _Optional[str] = ...) -> None: ...
+
+class ListFilesResponse(_message.Message):
+    __slots__ = ("files",)
+    FILES_FIELD_NUMBER: _ClassVar[int]
+    files: _containers.RepeatedCompositeFieldContainer[_commit_pb2.File]
+    def __init__(self, files: _Optional[_Iterable[_Union[_commit_pb2.File, _Mapping]]] = ...) -> None: ...
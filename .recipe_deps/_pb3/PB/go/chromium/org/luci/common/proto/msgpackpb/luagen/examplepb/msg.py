@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/msgpackpb/luagen/examplepb/msg.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/msgpackpb/luagen/examplepb/msg.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nFgo.chromium.org/luci/common/proto/msgpackpb/luagen/examplepb/msg.proto\x12<go.chromium.org.luci.common.proto.msgpackpb.luagen.examplepb\x1a\x1egoogle/protobuf/duration.proto\"\xec\x05\n\x0bTestMessage\x12\x0f\n\x07\x62oolval\x18\x02 \x01(\x08\x12\x0e\n\x06intval\x18\x03 \x01(\x03\x12\x0f\n\x07uintval\x18\x04 \x01(\x04\x12\x14\n\x0cshort_intval\x18\x05 \x01(\x05\x12\x15\n\rshort_uintval\x18\x06 \x01(\r\x12\x0e\n\x06strval\x18\x07 \x01(\t\x12\x10\n\x08\x66loatval\x18\x08 \x01(\x01\x12\x16\n\x0eshort_floatval\x18\t \x01(\x02\x12R\n\x05value\x18\n \x01(\x0e\x32\x43.go.chromium.org.luci.common.proto.msgpackpb.luagen.examplepb.VALUE\x12i\n\x08mapfield\x18\x0b \x03(\x0b\x32W.go.chromium.org.luci.common.proto.msgpackpb.luagen.examplepb.TestMessage.MapfieldEntry\x12+\n\x08\x64uration\x18\x0c \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x0f\n\x07strings\x18\r \x03(\t\x12\x61\n\x0esingle_recurse\x18\x0e \x01(\x0b\x32I.go.chromium.org.luci.common.proto.msgpackpb.luagen.examplepb.TestMessage\x12\x62\n\x0fmulti_recursion\x18\x0f \x03(\x0b\x32I.go.chromium.org.luci.common.proto.msgpackpb.luagen.examplepb.TestMessage\x1az\n\rMapfieldEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12X\n\x05value\x18\x02 \x01(\x0b\x32I.go.chromium.org.luci.common.proto.msgpackpb.luagen.examplepb.TestMessage:\x02\x38\x01J\x04\x08\x01\x10\x02*#\n\x05VALUE\x12\x08\n\x04ZERO\x10\x00\x12\x07\n\x03ONE\x10\x01\x12\x07\n\x03TWO\x10\x02\x42HZFgo.chromium.org/luci/common/proto/msgpackpb/luagen/examplepb;examplepbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.msgpackpb.luagen.examplepb.msg_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'ZFgo.chromium.org/luci/common/proto/msgpackpb/luagen/examplepb;examplepb'
+  _globals['_TESTMESSAGE_MAPFIELDENTRY']._loaded_options = None
+  _globals['_TESTMESSAGE_MAPFIELDENTRY']._serialized_options = b'8\001'
+  _globals['_VALUE']._serialized_start=919
+  _globals['_VALUE']._serialized_end=954
+  _globals['_TESTMESSAGE']._serialized_start=169
+  _globals['_TESTMESSAGE']._serialized_end=917
+  _globals['_TESTMESSAGE_MAPFIELDENTRY']._serialized_start=789
+  _globals['_TESTMESSAGE_MAPFIELDENTRY']._serialized_end=911
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,59 @@
+import datetime
+
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class VALUE(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    ZERO: _ClassVar[VALUE]
+    ONE: _ClassVar[VALUE]
+    TWO: _ClassVar[VALUE]
+ZERO: VALUE
+ONE: VALUE
+TWO: VALUE
+
+class TestMessage(_message.Message):
+    __slots__ = ("boolval", "intval", "uintval", "short_intval", "short_uintval", "strval", "floatval", "short_floatval", "value", "mapfield", "duration", "strings", "single_recurse", "multi_recursion")
+    class MapfieldEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: TestMessage
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[TestMessage, _Mapping]] = ...) -> None: ...
+    BOOLVAL_FIELD_NUMBER: _ClassVar[int]
+    INTVAL_FIELD_NUMBER: _ClassVar[int]
+    UINTVAL_FIELD_NUMBER: _ClassVar[int]
+    SHORT_INTVAL_FIELD_NUMBER: _ClassVar[int]
+    SHORT_UINTVAL_FIELD_NUMBER: _ClassVar[int]
+    STRVAL_FIELD_NUMBER: _ClassVar[int]
+    FLOATVAL_FIELD_NUMBER: _ClassVar[int]
+    SHORT_FLOATVAL_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    MAPFIELD_FIELD_NUMBER: _ClassVar[int]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    STRINGS_FIELD_NUMBER: _ClassVar[int]
+    SINGLE_RECURSE_FIELD_NUMBER: _ClassVar[int]
+    MULTI_RECURSION_FIELD_NUMBER: _ClassVar[int]
+    boolval: bool
+    intval: int
+    uintval: int
+    short_intval: int
+    short_uintval: int
+    strval: str
+    floatval: float
+    short_floatval: float
+    value: VALUE
+    mapfield: _containers.MessageMap[str, TestMessage]
+    duration: _duration_pb2.Duration
+    strings: _containers.RepeatedScalarFieldContainer[str]
+    single_recurse: TestMessage
+    multi_recursion: _containers.RepeatedCompositeFieldContainer[TestMessage]
+    def __init__(self, boolval: bool = ..., intval: _Optional[int] = ..., uintval: _Optional[int] = ..., short_intval: _Optional[int] = ..., short_uintval: _Optional[int] = ..., strval: _Optional[str] = ..., floatval: _Optional[float] = ..., short_floatval: _Optional[float] = ..., value: _Optional[_Union[VALUE, str]] = ..., mapfield: _Optional[_Mapping[str, TestMessage]] = ..., duration: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., strings: _Optional[_Iterable[str]] = ..., single_recurse: _Optional[_Union[TestMessage, _Mapping]] = ..., multi_recursion: _Optional[_Iterable[_Union[TestMessage, _Mapping]]] = ...) -> None: ...
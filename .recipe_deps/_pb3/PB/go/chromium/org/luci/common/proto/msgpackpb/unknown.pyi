@@ -0,0 +1,11 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class UnknownFields(_message.Message):
+    __slots__ = ("msgpackpb_data",)
+    MSGPACKPB_DATA_FIELD_NUMBER: _ClassVar[int]
+    msgpackpb_data: bytes
+    def __init__(self, msgpackpb_data: _Optional[bytes] = ...) -> None: ...
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/options.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/options.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/go.chromium.org/luci/common/proto/options.proto\x12\x04luci\x1a google/protobuf/descriptor.proto\"\x1b\n\x08Metadata\x12\x0f\n\x07\x64oc_url\x18\x01 \x01(\t**\n\x11TextPBFieldFormat\x12\x0b\n\x07\x44\x45\x46\x41ULT\x10\x00\x12\x08\n\x04JSON\x10\x01:E\n\rfile_metadata\x12\x1c.google.protobuf.FileOptions\x18\xe4\xbf\x04 \x01(\x0b\x32\x0e.luci.Metadata:P\n\x0etext_pb_format\x12\x1d.google.protobuf.FieldOptions\x18\xe5\xbf\x04 \x01(\x0e\x32\x17.luci.TextPBFieldFormat:7\n\x0elucicfg_ignore\x12\x1d.google.protobuf.FieldOptions\x18\xe6\xbf\x04 \x01(\x08\x42#Z!go.chromium.org/luci/common/proto')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.options_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z!go.chromium.org/luci/common/proto'
+  _globals['_TEXTPBFIELDFORMAT']._serialized_start=120
+  _globals['_TEXTPBFIELDFORMAT']._serialized_end=162
+  _globals['_METADATA']._serialized_start=91
+  _globals['_METADATA']._serialized_end=118
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,26 @@
+from google.protobuf import descriptor_pb2 as _descriptor_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TextPBFieldFormat(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    DEFAULT: _ClassVar[TextPBFieldFormat]
+    JSON: _ClassVar[TextPBFieldFormat]
+DEFAULT: TextPBFieldFormat
+JSON: TextPBFieldFormat
+FILE_METADATA_FIELD_NUMBER: _ClassVar[int]
+file_metadata: _descriptor.FieldDescriptor
+TEXT_PB_FORMAT_FIELD_NUMBER: _ClassVar[int]
+text_pb_format: _descriptor.FieldDescriptor
+LUCICFG_IGNORE_FIELD_NUMBER: _ClassVar[int]
+lucicfg_ignore: _descriptor.FieldDescriptor
+
+class Metadata(_message.Message):
+    __slots__ = ("doc_url",)
+    DOC_URL_FIELD_NUMBER: _ClassVar[int]
+    doc_url: str
+    def __init__(self, doc_url: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/realms/realms_config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/realms/realms_config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.common.proto import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<go.chromium.org/luci/common/proto/realms/realms_config.proto\x12\x0c\x61uth_service\x1a/go.chromium.org/luci/common/proto/options.proto\"`\n\tRealmsCfg\x12#\n\x06realms\x18\x01 \x03(\x0b\x32\x13.auth_service.Realm\x12.\n\x0c\x63ustom_roles\x18\x02 \x03(\x0b\x32\x18.auth_service.CustomRole\"k\n\x05Realm\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x65xtends\x18\x02 \x03(\t\x12\'\n\x08\x62indings\x18\x03 \x03(\x0b\x32\x15.auth_service.Binding\x12\x1a\n\x12\x65nforce_in_service\x18\x04 \x03(\t\"X\n\x07\x42inding\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x12\n\nprincipals\x18\x02 \x03(\t\x12+\n\nconditions\x18\x03 \x03(\x0b\x32\x17.auth_service.Condition\"\x8e\x01\n\tCondition\x12@\n\x08restrict\x18\x01 \x01(\x0b\x32,.auth_service.Condition.AttributeRestrictionH\x00\x1a\x39\n\x14\x41ttributeRestriction\x12\x11\n\tattribute\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x02 \x03(\tB\x04\n\x02op\"@\n\nCustomRole\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x65xtends\x18\x02 \x03(\t\x12\x13\n\x0bpermissions\x18\x03 \x03(\tBjZ/go.chromium.org/luci/common/proto/realms;realms\xa2\xfe#5\n3https://config.luci.app/schemas/projects:realms.cfgb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.realms.realms_config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z/go.chromium.org/luci/common/proto/realms;realms\242\376#5\n3https://config.luci.app/schemas/projects:realms.cfg'
+  _globals['_REALMSCFG']._serialized_start=127
+  _globals['_REALMSCFG']._serialized_end=223
+  _globals['_REALM']._serialized_start=225
+  _globals['_REALM']._serialized_end=332
+  _globals['_BINDING']._serialized_start=334
+  _globals['_BINDING']._serialized_end=422
+  _globals['_CONDITION']._serialized_start=425
+  _globals['_CONDITION']._serialized_end=567
+  _globals['_CONDITION_ATTRIBUTERESTRICTION']._serialized_start=504
+  _globals['_CONDITION_ATTRIBUTERESTRICTION']._serialized_end=561
+  _globals['_CUSTOMROLE']._serialized_start=569
+  _globals['_CUSTOMROLE']._serialized_end=633
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,61 @@
+from PB.go.chromium.org.luci.common.proto import options as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class RealmsCfg(_message.Message):
+    __slots__ = ("realms", "custom_roles")
+    REALMS_FIELD_NUMBER: _ClassVar[int]
+    CUSTOM_ROLES_FIELD_NUMBER: _ClassVar[int]
+    realms: _containers.RepeatedCompositeFieldContainer[Realm]
+    custom_roles: _containers.RepeatedCompositeFieldContainer[CustomRole]
+    def __init__(self, realms: _Optional[_Iterable[_Union[Realm, _Mapping]]] = ..., custom_roles: _Optional[_Iterable[_Union[CustomRole, _Mapping]]] = ...) -> None: ...
+
+class Realm(_message.Message):
+    __slots__ = ("name", "extends", "bindings", "enforce_in_service")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    EXTENDS_FIELD_NUMBER: _ClassVar[int]
+    BINDINGS_FIELD_NUMBER: _ClassVar[int]
+    ENFORCE_IN_SERVICE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    extends: _containers.RepeatedScalarFieldContainer[str]
+    bindings: _containers.RepeatedCompositeFieldContainer[Binding]
+    enforce_in_service: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, name: _Optional[str] = ..., extends: _Optional[_Iterable[str]] = ..., bindings: _Optional[_Iterable[_Union[Binding, _Mapping]]] = ..., enforce_in_service: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class Binding(_message.Message):
+    __slots__ = ("role", "principals", "conditions")
+    ROLE_FIELD_NUMBER: _ClassVar[int]
+    PRINCIPALS_FIELD_NUMBER: _ClassVar[int]
+    CONDITIONS_FIELD_NUMBER: _ClassVar[int]
+    role: str
+    principals: _containers.RepeatedScalarFieldContainer[str]
+    conditions: _containers.RepeatedCompositeFieldContainer[Condition]
+    def __init__(self, role: _Optional[str] = ..., principals: _Optional[_Iterable[str]] = ..., conditions: _Optional[_Iterable[_Union[Condition, _Mapping]]] = ...) -> None: ...
+
+class Condition(_message.Message):
+    __slots__ = ("restrict",)
+    class AttributeRestriction(_message.Message):
+        __slots__ = ("attribute", "values")
+        ATTRIBUTE_FIELD_NUMBER: _ClassVar[int]
+        VALUES_FIELD_NUMBER: _ClassVar[int]
+        attribute: str
+        values: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, attribute: _Optional[str] = ..., values: _Optional[_Iterable[str]] = ...) -> None: ...
+    RESTRICT_FIELD_NUMBER: _ClassVar[int]
+    restrict: Condition.AttributeRestriction
+    def __init__(self, restrict: _Optional[_Union[Condition.AttributeRestriction, _Mapping]] = ...) -> None: ...
+
+class CustomRole(_message.Message):
+    __slots__ = ("name", "extends", "permissions")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    EXTENDS_FIELD_NUMBER: _ClassVar[int]
+    PERMISSIONS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    extends: _containers.RepeatedScalarFieldContainer[str]
+    permissions: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, name: _Optional[str] = ..., extends: _Optional[_Iterable[str]] = ..., permissions: _Optional[_Iterable[str]] = ...) -> None: ...
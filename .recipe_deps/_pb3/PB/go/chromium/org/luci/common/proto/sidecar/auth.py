@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/sidecar/auth.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/sidecar/auth.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.rpc import status as google_dot_rpc_dot_status__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n4go.chromium.org/luci/common/proto/sidecar/auth.proto\x12\x0cluci.sidecar\x1a\x17google/rpc/status.proto\"\x8f\x02\n\x13\x41uthenticateRequest\x12<\n\x08protocol\x18\x01 \x01(\x0e\x32*.luci.sidecar.AuthenticateRequest.Protocol\x12<\n\x08metadata\x18\x02 \x03(\x0b\x32*.luci.sidecar.AuthenticateRequest.Metadata\x12\x0e\n\x06groups\x18\x03 \x03(\t\x1a&\n\x08Metadata\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"D\n\x08Protocol\x12\x18\n\x14PROTOCOL_UNSPECIFIED\x10\x00\x12\t\n\x05HTTP1\x10\x01\x12\t\n\x05HTTP2\x10\x02\x12\x08\n\x04GRPC\x10\x03\"\xd5\x03\n\x14\x41uthenticateResponse\x12\x10\n\x08identity\x18\x01 \x01(\t\x12-\n\x0bserver_info\x18\x02 \x01(\x0b\x32\x18.luci.sidecar.ServerInfo\x12\x0e\n\x06groups\x18\x03 \x03(\t\x12#\n\x05\x65rror\x18\n \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x12\x41\n\tanonymous\x18\x0b \x01(\x0b\x32,.luci.sidecar.AuthenticateResponse.AnonymousH\x00\x12\x37\n\x04user\x18\x0c \x01(\x0b\x32\'.luci.sidecar.AuthenticateResponse.UserH\x00\x12=\n\x07project\x18\r \x01(\x0b\x32*.luci.sidecar.AuthenticateResponse.ProjectH\x00\x1a\x0b\n\tAnonymous\x1aG\n\x04User\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07picture\x18\x03 \x01(\t\x12\x11\n\tclient_id\x18\x04 \x01(\t\x1a+\n\x07Project\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0f\n\x07service\x18\x02 \x01(\tB\t\n\x07outcome\"3\n\x0fIsMemberRequest\x12\x10\n\x08identity\x18\x01 \x01(\t\x12\x0e\n\x06groups\x18\x02 \x03(\t\"T\n\x10IsMemberResponse\x12\x11\n\tis_member\x18\x01 \x01(\x08\x12-\n\x0bserver_info\x18\x02 \x01(\x0b\x32\x18.luci.sidecar.ServerInfo\"\xc6\x01\n\x14HasPermissionRequest\x12\x10\n\x08identity\x18\x01 \x01(\t\x12\x12\n\npermission\x18\x02 \x01(\t\x12\r\n\x05realm\x18\x03 \x01(\t\x12\x46\n\nattributes\x18\x04 \x03(\x0b\x32\x32.luci.sidecar.HasPermissionRequest.AttributesEntry\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"^\n\x15HasPermissionResponse\x12\x16\n\x0ehas_permission\x18\x01 \x01(\x08\x12-\n\x0bserver_info\x18\x02 \x01(\x0b\x32\x18.luci.sidecar.ServerInfo\"\x97\x01\n\nServerInfo\x12\x17\n\x0fsidecar_service\x18\x01 \x01(\t\x12\x13\n\x0bsidecar_job\x18\x02 \x01(\t\x12\x14\n\x0csidecar_host\x18\x03 \x01(\t\x12\x17\n\x0fsidecar_version\x18\x04 \x01(\t\x12\x17\n\x0f\x61uth_db_service\x18\x05 \x01(\t\x12\x13\n\x0b\x61uth_db_rev\x18\x06 \x01(\x03\x32\x82\x02\n\x04\x41uth\x12U\n\x0c\x41uthenticate\x12!.luci.sidecar.AuthenticateRequest\x1a\".luci.sidecar.AuthenticateResponse\x12I\n\x08IsMember\x12\x1d.luci.sidecar.IsMemberRequest\x1a\x1e.luci.sidecar.IsMemberResponse\x12X\n\rHasPermission\x12\".luci.sidecar.HasPermissionRequest\x1a#.luci.sidecar.HasPermissionResponseB+Z)go.chromium.org/luci/common/proto/sidecarb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.sidecar.auth_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z)go.chromium.org/luci/common/proto/sidecar'
+  _globals['_HASPERMISSIONREQUEST_ATTRIBUTESENTRY']._loaded_options = None
+  _globals['_HASPERMISSIONREQUEST_ATTRIBUTESENTRY']._serialized_options = b'8\001'
+  _globals['_AUTHENTICATEREQUEST']._serialized_start=96
+  _globals['_AUTHENTICATEREQUEST']._serialized_end=367
+  _globals['_AUTHENTICATEREQUEST_METADATA']._serialized_start=259
+  _globals['_AUTHENTICATEREQUEST_METADATA']._serialized_end=297
+  _globals['_AUTHENTICATEREQUEST_PROTOCOL']._serialized_start=299
+  _globals['_AUTHENTICATEREQUEST_PROTOCOL']._serialized_end=367
+  _globals['_AUTHENTICATERESPONSE']._serialized_start=370
+  _globals['_AUTHENTICATERESPONSE']._serialized_end=839
+  _globals['_AUTHENTICATERESPONSE_ANONYMOUS']._serialized_start=699
+  _globals['_AUTHENTICATERESPONSE_ANONYMOUS']._serialized_end=710
+  _globals['_AUTHENTICATERESPONSE_USER']._serialized_start=712
+  _globals['_AUTHENTICATERESPONSE_USER']._serialized_end=783
+  _globals['_AUTHENTICATERESPONSE_PROJECT']._serialized_start=785
+  _globals['_AUTHENTICATERESPONSE_PROJECT']._serialized_end=828
+  _globals['_ISMEMBERREQUEST']._serialized_start=841
+  _globals['_ISMEMBERREQUEST']._serialized_end=892
+  _globals['_ISMEMBERRESPONSE']._serialized_start=894
+  _globals['_ISMEMBERRESPONSE']._serialized_end=978
+  _globals['_HASPERMISSIONREQUEST']._serialized_start=981
+  _globals['_HASPERMISSIONREQUEST']._serialized_end=1179
+  _globals['_HASPERMISSIONREQUEST_ATTRIBUTESENTRY']._serialized_start=1130
+  _globals['_HASPERMISSIONREQUEST_ATTRIBUTESENTRY']._serialized_end=1179
+  _globals['_HASPERMISSIONRESPONSE']._serialized_start=1181
+  _globals['_HASPERMISSIONRESPONSE']._serialized_end=1275
+  _globals['_SERVERINFO']._serialized_start=1278
+  _globals['_SERVERINFO']._serialized_end=1429
+  _globals['_AUTH']._serialized_start=1432
+  _globals['_AUTH']._serialized_end=1690
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/srcman/manifest.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/srcman/manifest.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7go.chromium.org/luci/common/proto/srcman/manifest.proto\x12\x06srcman\"\xf9\x04\n\x08Manifest\x12\x0f\n\x07version\x18\x01 \x01(\x05\x12\x36\n\x0b\x64irectories\x18\x02 \x03(\x0b\x32!.srcman.Manifest.DirectoriesEntry\x1a\x88\x01\n\x0bGitCheckout\x12\x10\n\x08repo_url\x18\x01 \x01(\t\x12\x11\n\tfetch_url\x18\x02 \x01(\t\x12\x10\n\x08revision\x18\x03 \x01(\t\x12\x11\n\tfetch_ref\x18\x04 \x01(\t\x12\x16\n\x0epatch_revision\x18\x05 \x01(\t\x12\x17\n\x0fpatch_fetch_ref\x18\x06 \x01(\t\x1aL\n\x0b\x43IPDPackage\x12\x17\n\x0fpackage_pattern\x18\x01 \x01(\t\x12\x13\n\x0binstance_id\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x1a\xfa\x01\n\tDirectory\x12\x32\n\x0cgit_checkout\x18\x01 \x01(\x0b\x32\x1c.srcman.Manifest.GitCheckout\x12\x18\n\x10\x63ipd_server_host\x18\x02 \x01(\t\x12\x41\n\x0c\x63ipd_package\x18\x04 \x03(\x0b\x32+.srcman.Manifest.Directory.CipdPackageEntry\x1aP\n\x10\x43ipdPackageEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.srcman.Manifest.CIPDPackage:\x02\x38\x01J\x04\x08\x05\x10\x06J\x04\x08\x06\x10\x07\x1aN\n\x10\x44irectoriesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.srcman.Manifest.Directory:\x02\x38\x01\"+\n\x0cManifestLink\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x0e\n\x06sha256\x18\x02 \x01(\x0c\x42*Z(go.chromium.org/luci/common/proto/srcmanb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.srcman.manifest_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z(go.chromium.org/luci/common/proto/srcman'
+  _globals['_MANIFEST_DIRECTORY_CIPDPACKAGEENTRY']._loaded_options = None
+  _globals['_MANIFEST_DIRECTORY_CIPDPACKAGEENTRY']._serialized_options = b'8\001'
+  _globals['_MANIFEST_DIRECTORIESENTRY']._loaded_options = None
+  _globals['_MANIFEST_DIRECTORIESENTRY']._serialized_options = b'8\001'
+  _globals['_MANIFEST']._serialized_start=68
+  _globals['_MANIFEST']._serialized_end=701
+  _globals['_MANIFEST_GITCHECKOUT']._serialized_start=154
+  _globals['_MANIFEST_GITCHECKOUT']._serialized_end=290
+  _globals['_MANIFEST_CIPDPACKAGE']._serialized_start=292
+  _globals['_MANIFEST_CIPDPACKAGE']._serialized_end=368
+  _globals['_MANIFEST_DIRECTORY']._serialized_start=371
+  _globals['_MANIFEST_DIRECTORY']._serialized_end=621
+  _globals['_MANIFEST_DIRECTORY_CIPDPACKAGEENTRY']._serialized_start=529
+  _globals['_MANIFEST_DIRECTORY_CIPDPACKAGEENTRY']._serialized_end=609
+  _globals['_MANIFEST_DIRECTORIESENTRY']._serialized_start=623
+  _globals['_MANIFEST_DIRECTORIESENTRY']._serialized_end=701
+  _globals['_MANIFESTLINK']._serialized_start=703
+  _globals['_MANIFESTLINK']._serialized_end=746
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,70 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Manifest(_message.Message):
+    __slots__ = ("version", "directories")
+    class GitCheckout(_message.Message):
+        __slots__ = ("repo_url", "fetch_url", "revision", "fetch_ref", "patch_revision", "patch_fetch_ref")
+        REPO_URL_FIELD_NUMBER: _ClassVar[int]
+        FETCH_URL_FIELD_NUMBER: _ClassVar[int]
+        REVISION_FIELD_NUMBER: _ClassVar[int]
+        FETCH_REF_FIELD_NUMBER: _ClassVar[int]
+        PATCH_REVISION_FIELD_NUMBER: _ClassVar[int]
+        PATCH_FETCH_REF_FIELD_NUMBER: _ClassVar[int]
+        repo_url: str
+        fetch_url: str
+        revision: str
+        fetch_ref: str
+        patch_revision: str
+        patch_fetch_ref: str
+        def __init__(self, repo_url: _Optional[str] = ..., fetch_url: _Optional[str] = ..., revision: _Optional[str] = ..., fetch_ref: _Optional[str] = ..., patch_revision: _Optional[str] = ..., patch_fetch_ref: _Optional[str] = ...) -> None: ...
+    class CIPDPackage(_message.Message):
+        __slots__ = ("package_pattern", "instance_id", "version")
+        PACKAGE_PATTERN_FIELD_NUMBER: _ClassVar[int]
+        INSTANCE_ID_FIELD_NUMBER: _ClassVar[int]
+        VERSION_FIELD_NUMBER: _ClassVar[int]
+        package_pattern: str
+        instance_id: str
+        version: str
+        def __init__(self, package_pattern: _Optional[str] = ..., instance_id: _Optional[str] = ..., version: _Optional[str] = ...) -> None: ...
+    class Directory(_message.Message):
+        __slots__ = ("git_checkout", "cipd_server_host", "cipd_package")
+        class CipdPackageEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Manifest.CIPDPackage
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Manifest.CIPDPackage, _Mapping]] = ...) -> None: ...
+        GIT_CHECKOUT_FIELD_NUMBER: _ClassVar[int]
+        CIPD_SERVER_HOST_FIELD_NUMBER: _ClassVar[int]
+        CIPD_PACKAGE_FIELD_NUMBER: _ClassVar[int]
+        git_checkout: Manifest.GitCheckout
+        cipd_server_host: str
+        cipd_package: _containers.MessageMap[str, Manifest.CIPDPackage]
+        def __init__(self, git_checkout: _Optional[_Union[Manifest.GitCheckout, _Mapping]] = ..., cipd_server_host: _Optional[str] = ..., cipd_package: _Optional[_Mapping[str, Manifest.CIPDPackage]] = ...) -> None: ...
+    class DirectoriesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: Manifest.Directory
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Manifest.Directory, _Mapping]] = ...) -> None: ...
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    DIRECTORIES_FIELD_NUMBER: _ClassVar[int]
+    version: int
+    directories: _containers.MessageMap[str, Manifest.Directory]
+    def __init__(self, version: _Optional[int] = ..., directories: _Optional[_Mapping[str, Manifest.Directory]] = ...) -> None: ...
+
+class ManifestLink(_message.Message):
+    __slots__ = ("url", "sha256")
+    URL_FIELD_NUMBER: _ClassVar[int]
+    SHA256_FIELD_NUMBER: _ClassVar[int]
+    url: str
+    sha256: bytes
+    def __init__(self, url: _Optional[str] = ..., sha256: _Optional[bytes] = ...) -> None: ...
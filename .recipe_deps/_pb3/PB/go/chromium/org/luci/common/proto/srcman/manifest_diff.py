@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/common/proto/srcman/manifest_diff.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/common/proto/srcman/manifest_diff.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.common.proto.git import commit as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_git_dot_commit__pb2
+from PB.go.chromium.org.luci.common.proto.srcman import manifest as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_srcman_dot_manifest__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<go.chromium.org/luci/common/proto/srcman/manifest_diff.proto\x12\x06srcman\x1a\x32go.chromium.org/luci/common/proto/git/commit.proto\x1a\x37go.chromium.org/luci/common/proto/srcman/manifest.proto\"\xe0\x06\n\x0cManifestDiff\x12\x1d\n\x03old\x18\x01 \x01(\x0b\x32\x10.srcman.Manifest\x12\x1d\n\x03new\x18\x02 \x01(\x0b\x32\x10.srcman.Manifest\x12*\n\x07overall\x18\x03 \x01(\x0e\x32\x19.srcman.ManifestDiff.Stat\x12:\n\x0b\x64irectories\x18\x04 \x03(\x0b\x32%.srcman.ManifestDiff.DirectoriesEntry\x1a\xc9\x01\n\x0bGitCheckout\x12*\n\x07overall\x18\x01 \x01(\x0e\x32\x19.srcman.ManifestDiff.Stat\x12+\n\x08revision\x18\x02 \x01(\x0e\x32\x19.srcman.ManifestDiff.Stat\x12\x31\n\x0epatch_revision\x18\x03 \x01(\x0e\x32\x19.srcman.ManifestDiff.Stat\x12\x10\n\x08repo_url\x18\x04 \x01(\t\x12\x1c\n\x07history\x18\x05 \x03(\x0b\x32\x0b.git.Commit\x1a\xc6\x02\n\tDirectory\x12*\n\x07overall\x18\x01 \x01(\x0e\x32\x19.srcman.ManifestDiff.Stat\x12\x36\n\x0cgit_checkout\x18\x02 \x01(\x0b\x32 .srcman.ManifestDiff.GitCheckout\x12\x33\n\x10\x63ipd_server_host\x18\x03 \x01(\x0e\x32\x19.srcman.ManifestDiff.Stat\x12\x45\n\x0c\x63ipd_package\x18\x04 \x03(\x0b\x32/.srcman.ManifestDiff.Directory.CipdPackageEntry\x1aM\n\x10\x43ipdPackageEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0e\x32\x19.srcman.ManifestDiff.Stat:\x02\x38\x01J\x04\x08\x05\x10\x06J\x04\x08\x06\x10\x07\x1aR\n\x10\x44irectoriesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x1e.srcman.ManifestDiff.Directory:\x02\x38\x01\"A\n\x04Stat\x12\t\n\x05\x45QUAL\x10\x00\x12\t\n\x05\x41\x44\x44\x45\x44\x10\x01\x12\x0b\n\x07REMOVED\x10\x02\x12\x0c\n\x08MODIFIED\x10\x04\x12\x08\n\x04\x44IFF\x10\x0c\x42*Z(go.chromium.org/luci/common/proto/srcmanb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.common.proto.srcman.manifest_diff_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z(go.chromium.org/luci/common/proto/srcman'
+  _globals['_MANIFESTDIFF_DIRECTORY_CIPDPACKAGEENTRY']._loaded_options = None
+  _globals['_MANIFESTDIFF_DIRECTORY_CIPDPACKAGEENTRY']._serialized_options = b'8\001'
+  _globals['_MANIFESTDIFF_DIRECTORIESENTRY']._loaded_options = None
+  _globals['_MANIFESTDIFF_DIRECTORIESENTRY']._serialized_options = b'8\001'
+  _globals['_MANIFESTDIFF']._serialized_start=182
+  _globals['_MANIFESTDIFF']._serialized_end=1046
+  _globals['_MANIFESTDIFF_GITCHECKOUT']._serialized_start=365
+  _globals['_MANIFESTDIFF_GITCHECKOUT']._serialized_end=566
+  _globals['_MANIFESTDIFF_DIRECTORY']._serialized_start=569
+  _globals['_MANIFESTDIFF_DIRECTORY']._serialized_end=895
+  _globals['_MANIFESTDIFF_DIRECTORY_CIPDPACKAGEENTRY']._serialized_start=806
+  _globals['_MANIFESTDIFF_DIRECTORY_CIPDPACKAGEENTRY']._serialized_end=883
+  _globals['_MANIFESTDIFF_DIRECTORIESENTRY']._serialized_start=897
+  _globals['_MANIFESTDIFF_DIRECTORIESENTRY']._serialized_end=979
+  _globals['_MANIFESTDIFF_STAT']._serialized_start=981
+  _globals['_MANIFESTDIFF_STAT']._serialized_end=1046
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,72 @@
+from PB.go.chromium.org.luci.common.proto.git import commit as _commit_pb2
+from PB.go.chromium.org.luci.common.proto.srcman import manifest as _manifest_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ManifestDiff(_message.Message):
+    __slots__ = ("old", "new", "overall", "directories")
+    class Stat(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        EQUAL: _ClassVar[ManifestDiff.Stat]
+        ADDED: _ClassVar[ManifestDiff.Stat]
+        REMOVED: _ClassVar[ManifestDiff.Stat]
+        MODIFIED: _ClassVar[ManifestDiff.Stat]
+        DIFF: _ClassVar[ManifestDiff.Stat]
+    EQUAL: ManifestDiff.Stat
+    ADDED: ManifestDiff.Stat
+    REMOVED: ManifestDiff.Stat
+    MODIFIED: ManifestDiff.Stat
+    DIFF: ManifestDiff.Stat
+    class GitCheckout(_message.Message):
+        __slots__ = ("overall", "revision", "patch_revision", "repo_url", "history")
+        OVERALL_FIELD_NUMBER: _ClassVar[int]
+        REVISION_FIELD_NUMBER: _ClassVar[int]
+        PATCH_REVISION_FIELD_NUMBER: _ClassVar[int]
+        REPO_URL_FIELD_NUMBER: _ClassVar[int]
+        HISTORY_FIELD_NUMBER: _ClassVar[int]
+        overall: ManifestDiff.Stat
+        revision: ManifestDiff.Stat
+        patch_revision: ManifestDiff.Stat
+        repo_url: str
+        history: _containers.RepeatedCompositeFieldContainer[_commit_pb2.Commit]
+        def __init__(self, overall: _Optional[_Union[ManifestDiff.Stat, str]] = ..., revision: _Optional[_Union[ManifestDiff.Stat, str]] = ..., patch_revision: _Optional[_Union[ManifestDiff.Stat, str]] = ..., repo_url: _Optional[str] = ..., history: _Optional[_Iterable[_Union[_commit_pb2.Commit, _Mapping]]] = ...) -> None: ...
+    class Directory(_message.Message):
+        __slots__ = ("overall", "git_checkout", "cipd_server_host", "cipd_package")
+        class CipdPackageEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: ManifestDiff.Stat
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[ManifestDiff.Stat, str]] = ...) -> None: ...
+        OVERALL_FIELD_NUMBER: _ClassVar[int]
+        GIT_CHECKOUT_FIELD_NUMBER: _ClassVar[int]
+        CIPD_SERVER_HOST_FIELD_NUMBER: _ClassVar[int]
+        CIPD_PACKAGE_FIELD_NUMBER: _ClassVar[int]
+        overall: ManifestDiff.Stat
+        git_checkout: ManifestDiff.GitCheckout
+        cipd_server_host: ManifestDiff.Stat
+        cipd_package: _containers.ScalarMap[str, ManifestDiff.Stat]
+        def __init__(self, overall: _Optional[_Union[ManifestDiff.Stat, str]] = ..., git_checkout: _Optional[_Union[ManifestDiff.GitCheckout, _Mapping]] = ..., cipd_server_host: _Optional[_Union[ManifestDiff.Stat, str]] = ..., cipd_package: _Optional[_Mapping[str, ManifestDiff.Stat]] = ...) -> None: ...
+    class DirectoriesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: ManifestDiff.Directory
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[ManifestDiff.Directory, _Mapping]] = ...) -> None: ...
+    OLD_FIELD_NUMBER: _ClassVar[int]
+    NEW_FIELD_NUMBER: _ClassVar[int]
+    OVERALL_FIELD_NUMBER: _ClassVar[int]
+    DIRECTORIES_FIELD_NUMBER: _ClassVar[int]
+    old: _manifest_pb2.Manifest
+    new: _manifest_pb2.Manifest
+    overall: ManifestDiff.Stat
+    directories: _containers.MessageMap[str, ManifestDiff.Directory]
+    def __init__(self, old: _Optional[_Union[_manifest_pb2.Manifest, _Mapping]] = ..., new: _Optional[_Union[_manifest_pb2.Manifest, _Mapping]] = ..., overall: _Optional[_Union[ManifestDiff.Stat, str]] = ..., directories: _Optional[_Mapping[str, ManifestDiff.Directory]] = ...) -> None: ...
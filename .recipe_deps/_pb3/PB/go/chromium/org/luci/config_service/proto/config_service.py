@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/config_service/proto/config_service.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/config_service/proto/config_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.common.proto.config import service_config as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_config_dot_service__config__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n>go.chromium.org/luci/config_service/proto/config_service.proto\x12\x11\x63onfig.service.v2\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a=go.chromium.org/luci/common/proto/config/service_config.proto\"x\n\x10GetConfigRequest\x12\x12\n\nconfig_set\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x16\n\x0e\x63ontent_sha256\x18\x03 \x01(\t\x12*\n\x06\x66ields\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"\xa7\x01\n\x06\x43onfig\x12\x12\n\nconfig_set\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x15\n\x0braw_content\x18\x03 \x01(\x0cH\x00\x12\x14\n\nsigned_url\x18\x04 \x01(\tH\x00\x12\x16\n\x0e\x63ontent_sha256\x18\x05 \x01(\t\x12\x0c\n\x04size\x18\x08 \x01(\x03\x12\x10\n\x08revision\x18\x06 \x01(\t\x12\x0b\n\x03url\x18\x07 \x01(\tB\t\n\x07\x63ontent\"T\n\x18GetProjectConfigsRequest\x12\x0c\n\x04path\x18\x01 \x01(\t\x12*\n\x06\x66ields\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"G\n\x19GetProjectConfigsResponse\x12*\n\x07\x63onfigs\x18\x01 \x03(\x0b\x32\x19.config.service.v2.Config\"\x9f\x01\n\x16ValidateConfigsRequest\x12\x12\n\nconfig_set\x18\x01 \x01(\t\x12G\n\x0b\x66ile_hashes\x18\x02 \x03(\x0b\x32\x32.config.service.v2.ValidateConfigsRequest.FileHash\x1a(\n\x08\x46ileHash\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06sha256\x18\x02 \x01(\t\"\xd4\x01\n\x1b\x42\x61\x64ValidationRequestFixInfo\x12O\n\x0cupload_files\x18\x01 \x03(\x0b\x32\x39.config.service.v2.BadValidationRequestFixInfo.UploadFile\x12\x1b\n\x13unvalidatable_files\x18\x02 \x03(\t\x1aG\n\nUploadFile\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x12\n\nsigned_url\x18\x02 \x01(\t\x12\x17\n\x0fmax_config_size\x18\x03 \x01(\x03\"\xc3\x01\n\x15ListConfigSetsRequest\x12H\n\x06\x64omain\x18\x01 \x01(\x0e\x32\x38.config.service.v2.ListConfigSetsRequest.ConfigSetDomain\x12*\n\x06\x66ields\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"4\n\x0f\x43onfigSetDomain\x12\x07\n\x03\x41LL\x10\x00\x12\x0b\n\x07SERVICE\x10\x01\x12\x0b\n\x07PROJECT\x10\x02\"K\n\x16ListConfigSetsResponse\x12\x31\n\x0b\x63onfig_sets\x18\x01 \x03(\x0b\x32\x1c.config.service.v2.ConfigSet\"\xb4\x04\n\tConfigSet\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x37\n\x08revision\x18\x03 \x01(\x0b\x32%.config.service.v2.ConfigSet.Revision\x12\x16\n\nfile_paths\x18\x04 \x03(\tB\x02\x18\x01\x12\x41\n\x13last_import_attempt\x18\x05 \x01(\x0b\x32$.config.service.v2.ConfigSet.Attempt\x12*\n\x07\x63onfigs\x18\x06 \x03(\x0b\x32\x19.config.service.v2.Config\x1a\x81\x01\n\x08Revision\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x17\n\x0f\x63ommitter_email\x18\x03 \x01(\t\x12\x14\n\x0c\x61uthor_email\x18\x05 \x01(\t\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\xc7\x01\n\x07\x41ttempt\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x37\n\x08revision\x18\x03 \x01(\x0b\x32%.config.service.v2.ConfigSet.Revision\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x32\n\x10validationResult\x18\x05 \x01(\x0b\x32\x18.config.ValidationResult\"U\n\x13GetConfigSetRequest\x12\x12\n\nconfig_set\x18\x01 \x01(\t\x12*\n\x06\x66ields\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask2\xe5\x03\n\x07\x43onfigs\x12M\n\tGetConfig\x12#.config.service.v2.GetConfigRequest\x1a\x19.config.service.v2.Config\"\x00\x12p\n\x11GetProjectConfigs\x12+.config.service.v2.GetProjectConfigsRequest\x1a,.config.service.v2.GetProjectConfigsResponse\"\x00\x12g\n\x0eListConfigSets\x12(.config.service.v2.ListConfigSetsRequest\x1a).config.service.v2.ListConfigSetsResponse\"\x00\x12V\n\x0cGetConfigSet\x12&.config.service.v2.GetConfigSetRequest\x1a\x1c.config.service.v2.ConfigSet\"\x00\x12X\n\x0fValidateConfigs\x12).config.service.v2.ValidateConfigsRequest\x1a\x18.config.ValidationResult\"\x00\x42\x37Z2go.chromium.org/luci/config_service/proto;configpb\x90\x01\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.config_service.proto.config_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z2go.chromium.org/luci/config_service/proto;configpb\220\001\001'
+  _globals['_CONFIGSET'].fields_by_name['file_paths']._loaded_options = None
+  _globals['_CONFIGSET'].fields_by_name['file_paths']._serialized_options = b'\030\001'
+  _globals['_GETCONFIGREQUEST']._serialized_start=215
+  _globals['_GETCONFIGREQUEST']._serialized_end=335
+  _globals['_CONFIG']._serialized_start=338
+  _globals['_CONFIG']._serialized_end=505
+  _globals['_GETPROJECTCONFIGSREQUEST']._serialized_start=507
+  _globals['_GETPROJECTCONFIGSREQUEST']._serialized_end=591
+  _globals['_GETPROJECTCONFIGSRESPONSE']._serialized_start=593
+  _globals['_GETPROJECTCONFIGSRESPONSE']._serialized_end=664
+  _globals['_VALIDATECONFIGSREQUEST']._serialized_start=667
+  _globals['_VALIDATECONFIGSREQUEST']._serialized_end=826
+  _globals['_VALIDATECONFIGSREQUEST_FILEHASH']._serialized_start=786
+  _globals['_VALIDATECONFIGSREQUEST_FILEHASH']._serialized_end=826
+  _globals['_BADVALIDATIONREQUESTFIXINFO']._serialized_start=829
+  _globals['_BADVALIDATIONREQUESTFIXINFO']._serialized_end=1041
+  _globals['_BADVALIDATIONREQUESTFIXINFO_UPLOADFILE']._serialized_start=970
+  _globals['_BADVALIDATIONREQUESTFIXINFO_UPLOADFILE']._serialized_end=1041
+  _globals['_LISTCONFIGSETSREQUEST']._serialized_start=1044
+  _globals['_LISTCONFIGSETSREQUEST']._serialized_end=1239
+  _globals['_LISTCONFIGSETSREQUEST_CONFIGSETDOMAIN']._serialized_start=1187
+  _globals['_LISTCONFIGSETSREQUEST_CONFIGSETDOMAIN']._serialized_end=1239
+  _globals['_LISTCONFIGSETSRESPONSE']._serialized_start=1241
+  _globals['_LISTCONFIGSETSRESPONSE']._serialized_end=1316
+  _globals['_CONFIGSET']._serialized_start=1319
+  _globals['_CONFIGSET']._serialized_end=1883
+  _globals['_CONFIGSET_REVISION']._serialized_start=1552
+  _globals['_CONFIGSET_REVISION']._serialized_end=1681
+  _globals['_CONFIGSET_ATTEMPT']._serialized_start=1684
+  _globals['_CONFIGSET_ATTEMPT']._serialized_end=1883
+  _globals['_GETCONFIGSETREQUEST']._serialized_start=1885
+  _globals['_GETCONFIGSETREQUEST']._serialized_end=1970
+  _globals['_CONFIGS']._serialized_start=1973
+  _globals['_CONFIGS']._serialized_end=2458
+_builder.BuildServices(DESCRIPTOR, 'go.chromium.org.luci.config_service.proto.config_service_pb2', _globals)
+# @@protoc_insertion_point(module_scope)
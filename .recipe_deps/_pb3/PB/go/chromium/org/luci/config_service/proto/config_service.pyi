@@ -0,0 +1,168 @@
+import datetime
+
+from google.protobuf import field_mask_pb2 as _field_mask_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.proto.config import service_config as _service_config_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import service as _service
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetConfigRequest(_message.Message):
+    __slots__ = ("config_set", "path", "content_sha256", "fields")
+    CONFIG_SET_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_SHA256_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    config_set: str
+    path: str
+    content_sha256: str
+    fields: _field_mask_pb2.FieldMask
+    def __init__(self, config_set: _Optional[str] = ..., path: _Optional[str] = ..., content_sha256: _Optional[str] = ..., fields: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class Config(_message.Message):
+    __slots__ = ("config_set", "path", "raw_content", "signed_url", "content_sha256", "size", "revision", "url")
+    CONFIG_SET_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    RAW_CONTENT_FIELD_NUMBER: _ClassVar[int]
+    SIGNED_URL_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_SHA256_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    config_set: str
+    path: str
+    raw_content: bytes
+    signed_url: str
+    content_sha256: str
+    size: int
+    revision: str
+    url: str
+    def __init__(self, config_set: _Optional[str] = ..., path: _Optional[str] = ..., raw_content: _Optional[bytes] = ..., signed_url: _Optional[str] = ..., content_sha256: _Optional[str] = ..., size: _Optional[int] = ..., revision: _Optional[str] = ..., url: _Optional[str] = ...) -> None: ...
+
+class GetProjectConfigsRequest(_message.Message):
+    __slots__ = ("path", "fields")
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    path: str
+    fields: _field_mask_pb2.FieldMask
+    def __init__(self, path: _Optional[str] = ..., fields: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class GetProjectConfigsResponse(_message.Message):
+    __slots__ = ("configs",)
+    CONFIGS_FIELD_NUMBER: _ClassVar[int]
+    configs: _containers.RepeatedCompositeFieldContainer[Config]
+    def __init__(self, configs: _Optional[_Iterable[_Union[Config, _Mapping]]] = ...) -> None: ...
+
+class ValidateConfigsRequest(_message.Message):
+    __slots__ = ("config_set", "file_hashes")
+    class FileHash(_message.Message):
+        __slots__ = ("path", "sha256")
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        SHA256_FIELD_NUMBER: _ClassVar[int]
+        path: str
+        sha256: str
+        def __init__(self, path: _Optional[str] = ..., sha256: _Optional[str] = ...) -> None: ...
+    CONFIG_SET_FIELD_NUMBER: _ClassVar[int]
+    FILE_HASHES_FIELD_NUMBER: _ClassVar[int]
+    config_set: str
+    file_hashes: _containers.RepeatedCompositeFieldContainer[ValidateConfigsRequest.FileHash]
+    def __init__(self, config_set: _Optional[str] = ..., file_hashes: _Optional[_Iterable[_Union[ValidateConfigsRequest.FileHash, _Mapping]]] = ...) -> None: ...
+
+class BadValidationRequestFixInfo(_message.Message):
+    __slots__ = ("upload_files", "unvalidatable_files")
+    class UploadFile(_message.Message):
+        __slots__ = ("path", "signed_url", "max_config_size")
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        SIGNED_URL_FIELD_NUMBER: _ClassVar[int]
+        MAX_CONFIG_SIZE_FIELD_NUMBER: _ClassVar[int]
+        path: str
+        signed_url: str
+        max_config_size: int
+        def __init__(self, path: _Optional[str] = ..., signed_url: _Optional[str] = ..., max_config_size: _Optional[int] = ...) -> None: ...
+    UPLOAD_FILES_FIELD_NUMBER: _ClassVar[int]
+    UNVALIDATABLE_FILES_FIELD_NUMBER: _ClassVar[int]
+    upload_files: _containers.RepeatedCompositeFieldContainer[BadValidationRequestFixInfo.UploadFile]
+    unvalidatable_files: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, upload_files: _Optional[_Iterable[_Union[BadValidationRequestFixInfo.UploadFile, _Mapping]]] = ..., unvalidatable_files: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ListConfigSetsRequest(_message.Message):
+    __slots__ = ("domain", "fields")
+    class ConfigSetDomain(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        ALL: _ClassVar[ListConfigSetsRequest.ConfigSetDomain]
+        SERVICE: _ClassVar[ListConfigSetsRequest.ConfigSetDomain]
+        PROJECT: _ClassVar[ListConfigSetsRequest.ConfigSetDomain]
+    ALL: ListConfigSetsRequest.ConfigSetDomain
+    SERVICE: ListConfigSetsRequest.ConfigSetDomain
+    PROJECT: ListConfigSetsRequest.ConfigSetDomain
+    DOMAIN_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    domain: ListConfigSetsRequest.ConfigSetDomain
+    fields: _field_mask_pb2.FieldMask
+    def __init__(self, domain: _Optional[_Union[ListConfigSetsRequest.ConfigSetDomain, str]] = ..., fields: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class ListConfigSetsResponse(_message.Message):
+    __slots__ = ("config_sets",)
+    CONFIG_SETS_FIELD_NUMBER: _ClassVar[int]
+    config_sets: _containers.RepeatedCompositeFieldContainer[ConfigSet]
+    def __init__(self, config_sets: _Optional[_Iterable[_Union[ConfigSet, _Mapping]]] = ...) -> None: ...
+
+class ConfigSet(_message.Message):
+    __slots__ = ("name", "url", "revision", "file_paths", "last_import_attempt", "configs")
+    class Revision(_message.Message):
+        __slots__ = ("id", "url", "committer_email", "author_email", "timestamp")
+        ID_FIELD_NUMBER: _ClassVar[int]
+        URL_FIELD_NUMBER: _ClassVar[int]
+        COMMITTER_EMAIL_FIELD_NUMBER: _ClassVar[int]
+        AUTHOR_EMAIL_FIELD_NUMBER: _ClassVar[int]
+        TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        url: str
+        committer_email: str
+        author_email: str
+        timestamp: _timestamp_pb2.Timestamp
+        def __init__(self, id: _Optional[str] = ..., url: _Optional[str] = ..., committer_email: _Optional[str] = ..., author_email: _Optional[str] = ..., timestamp: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+    class Attempt(_message.Message):
+        __slots__ = ("message", "success", "revision", "timestamp", "validationResult")
+        MESSAGE_FIELD_NUMBER: _ClassVar[int]
+        SUCCESS_FIELD_NUMBER: _ClassVar[int]
+        REVISION_FIELD_NUMBER: _ClassVar[int]
+        TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+        VALIDATIONRESULT_FIELD_NUMBER: _ClassVar[int]
+        message: str
+        success: bool
+        revision: ConfigSet.Revision
+        timestamp: _timestamp_pb2.Timestamp
+        validationResult: _service_config_pb2.ValidationResult
+        def __init__(self, message: _Optional[str] = ..., success: bool = ..., revision: _Optional[_Union[ConfigSet.Revision, _Mapping]] = ..., timestamp: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., validationResult: _Optional[_Union[_service_config_pb2.ValidationResult, _Mapping]] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    FILE_PATHS_FIELD_NUMBER: _ClassVar[int]
+    LAST_IMPORT_ATTEMPT_FIELD_NUMBER: _ClassVar[int]
+    CONFIGS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    url: str
+    revision: ConfigSet.Revision
+    file_paths: _containers.RepeatedScalarFieldContainer[str]
+    last_import_attempt: ConfigSet.Attempt
+    configs: _containers.RepeatedCompositeFieldContainer[Config]
+    def __init__(self, name: _Optional[str] = ..., url: _Optional[str] = ..., revision: _Optional[_Union[ConfigSet.Revision, _Mapping]] = ..., file_paths: _Optional[_Iterable[str]] = ..., last_import_attempt: _Optional[_Union[ConfigSet.Attempt, _Mapping]] = ..., configs: _Optional[_Iterable[_Union[Config, _Mapping]]] = ...) -> None: ...
+
+class GetConfigSetRequest(_message.Message):
+    __slots__ = ("config_set", "fields")
+    CONFIG_SET_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    config_set: str
+    fields: _field_mask_pb2.FieldMask
+    def __init__(self, config_set: _Optional[str] = ..., fields: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class Configs(_service.service): ...
+
+class Configs_Stub(Configs): ...
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/config/v2/config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/config/v2/config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from PB.validate import validate as validate_dot_validate__pb2
+from PB.go.chromium.org.luci.common.proto import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_options__pb2
+from PB.go.chromium.org.luci.cv.api.v1 import run as go_dot_chromium_dot_org_dot_luci_dot_cv_dot_api_dot_v1_dot_run__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2go.chromium.org/luci/cv/api/config/v2/config.proto\x12\tcv.config\x1a\x1egoogle/protobuf/duration.proto\x1a\x17validate/validate.proto\x1a/go.chromium.org/luci/common/proto/options.proto\x1a(go.chromium.org/luci/cv/api/v1/run.proto\"\xd1\x03\n\x06\x43onfig\x12\x1f\n\x13\x64raining_start_time\x18\x01 \x01(\tB\x02\x18\x01\x12\x1a\n\x0e\x63q_status_host\x18\x02 \x01(\tB\x02\x18\x01\x12\x30\n\x0esubmit_options\x18\x03 \x01(\x0b\x32\x18.cv.config.SubmitOptions\x12-\n\rconfig_groups\x18\x04 \x03(\x0b\x32\x16.cv.config.ConfigGroup\x12\x35\n\x16project_scoped_account\x18\x05 \x01(\x0e\x32\x11.cv.config.ToggleB\x02\x18\x01\x12$\n\x1chonor_gerrit_linked_accounts\x18\x06 \x01(\x08\x12\x42\n\x14gerrit_listener_type\x18\x07 \x01(\x0e\x32$.cv.config.Config.GerritListenerType\"\x87\x01\n\x12GerritListenerType\x12$\n GERRIT_LISTENER_TYPE_UNSPECIFIED\x10\x00\x12\x1f\n\x1bGERRIT_LISTENER_TYPE_PUBSUB\x10\x01\x12*\n\"GERRIT_LISTENER_TYPE_LEGACY_POLLER\x10\x02\x1a\x02\x08\x01\"\x90\n\n\x0b\x43onfigGroup\x12\x0c\n\x04name\x18\x06 \x01(\t\x12-\n\x06gerrit\x18\x01 \x03(\x0b\x32\x1d.cv.config.ConfigGroup.Gerrit\x12*\n\x0b\x63ombine_cls\x18\x04 \x01(\x0b\x32\x15.cv.config.CombineCLs\x12\'\n\tverifiers\x18\x02 \x01(\x0b\x32\x14.cv.config.Verifiers\x12#\n\x08\x66\x61llback\x18\x05 \x01(\x0e\x32\x11.cv.config.Toggle\x12)\n\x10\x61\x64\x64itional_modes\x18\x07 \x03(\x0b\x32\x0f.cv.config.Mode\x12)\n\x0buser_limits\x18\x08 \x03(\x0b\x32\x14.cv.config.UserLimit\x12\x30\n\x12user_limit_default\x18\t \x01(\x0b\x32\x14.cv.config.UserLimit\x12\x46\n\x0cpost_actions\x18\n \x03(\x0b\x32!.cv.config.ConfigGroup.PostActionB\r\xfa\x42\n\x92\x01\x07\"\x05\x8a\x01\x02\x10\x01\x12R\n\x12tryjob_experiments\x18\x0b \x03(\x0b\x32\'.cv.config.ConfigGroup.TryjobExperimentB\r\xfa\x42\n\x92\x01\x07\"\x05\x8a\x01\x02\x10\x01\x1a\x97\x01\n\x06Gerrit\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x37\n\x08projects\x18\x02 \x03(\x0b\x32%.cv.config.ConfigGroup.Gerrit.Project\x1aG\n\x07Project\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nref_regexp\x18\x02 \x03(\t\x12\x1a\n\x12ref_regexp_exclude\x18\x03 \x03(\t\x1a\xd9\x03\n\nPostAction\x12\x15\n\x04name\x18\x01 \x01(\tB\x07\xfa\x42\x04r\x02\x10\x01\x12Z\n\nconditions\x18\x02 \x03(\x0b\x32\x35.cv.config.ConfigGroup.PostAction.TriggeringConditionB\x0f\xfa\x42\x0c\x92\x01\t\x08\x01\"\x05\x8a\x01\x02\x10\x01\x12P\n\x12vote_gerrit_labels\x18\x03 \x01(\x0b\x32\x32.cv.config.ConfigGroup.PostAction.VoteGerritLabelsH\x00\x1a\x62\n\x13TriggeringCondition\x12\x15\n\x04mode\x18\x01 \x01(\tB\x07\xfa\x42\x04r\x02\x10\x01\x12\x34\n\x08statuses\x18\x02 \x03(\x0e\x32\x11.cv.v1.Run.StatusB\x0f\xfa\x42\x0c\x92\x01\t\x08\x01\"\x05\x82\x01\x02\x10\x01\x1a\x92\x01\n\x10VoteGerritLabels\x12P\n\x05votes\x18\x01 \x03(\x0b\x32\x37.cv.config.ConfigGroup.PostAction.VoteGerritLabels.VoteB\x08\xfa\x42\x05\x92\x01\x02\x08\x01\x1a,\n\x04Vote\x12\x15\n\x04name\x18\x01 \x01(\tB\x07\xfa\x42\x04r\x02\x10\x01\x12\r\n\x05value\x18\x02 \x01(\x05\x42\r\n\x06\x61\x63tion\x12\x03\xf8\x42\x01\x1a\xa9\x01\n\x10TryjobExperiment\x12\x15\n\x04name\x18\x01 \x01(\tB\x07\xfa\x42\x04r\x02\x10\x01\x12\x44\n\tcondition\x18\x02 \x01(\x0b\x32\x31.cv.config.ConfigGroup.TryjobExperiment.Condition\x1a\x38\n\tCondition\x12+\n\x15owner_group_allowlist\x18\x01 \x03(\tB\x0c\xfa\x42\t\x92\x01\x06\"\x04r\x02\x10\x01J\x04\x08\x03\x10\x04\"R\n\rSubmitOptions\x12\x11\n\tmax_burst\x18\x01 \x01(\x05\x12.\n\x0b\x62urst_delay\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration\"\xcc\x01\n\x04Mode\x12M\n\x04name\x18\x01 \x01(\tB?\xfa\x42<r:2\x13^[A-Z][A-Z_]{0,39}$Z\x07\x44RY_RUNZ\x08\x46ULL_RUNZ\x10NEW_PATCHSET_RUN\x12!\n\x0e\x63q_label_value\x18\x02 \x01(\x05\x42\t\xfa\x42\x06\x1a\x04\x30\x01\x30\x02\x12/\n\x10triggering_label\x18\x03 \x01(\tB\x15\xfa\x42\x12r\x10\x10\x01Z\x0c\x43ommit-Queue\x12!\n\x10triggering_value\x18\x04 \x01(\x05\x42\x07\xfa\x42\x04\x1a\x02 \x00\"D\n\nCombineCLs\x12\x36\n\x13stabilization_delay\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\"\xf1\x0e\n\tVerifiers\x12?\n\x11gerrit_cq_ability\x18\x01 \x01(\x0b\x32$.cv.config.Verifiers.GerritCQAbility\x12\x34\n\x0btree_status\x18\x02 \x01(\x0b\x32\x1f.cv.config.Verifiers.TreeStatus\x12+\n\x06tryjob\x18\x03 \x01(\x0b\x32\x1b.cv.config.Verifiers.Tryjob\x12/\n\x08\x63qlinter\x18\x04 \x01(\x0b\x32\x1d.cv.config.Verifiers.CQLinter\x12\'\n\x04\x66\x61ke\x18\x05 \x01(\x0b\x32\x19.cv.config.Verifiers.Fake\x1a\xd7\x02\n\x0fGerritCQAbility\x12\x16\n\x0e\x63ommitter_list\x18\x01 \x03(\t\x12\x1b\n\x13\x64ry_run_access_list\x18\x02 \x03(\t\x12$\n\x1cnew_patchset_run_access_list\x18\x05 \x03(\t\x12#\n\x1b\x61llow_submit_with_open_deps\x18\x03 \x01(\x08\x12Q\n\x1a\x61llow_owner_if_submittable\x18\x04 \x01(\x0e\x32-.cv.config.Verifiers.GerritCQAbility.CQAction\x12\x1d\n\x15trust_dry_runner_deps\x18\x06 \x01(\x08\x12\"\n\x1a\x61llow_non_owner_dry_runner\x18\x07 \x01(\x08\".\n\x08\x43QAction\x12\t\n\x05UNSET\x10\x00\x12\x0b\n\x07\x44RY_RUN\x10\x01\x12\n\n\x06\x43OMMIT\x10\x02\x1a\x30\n\nTreeStatus\x12\x11\n\ttree_name\x18\x02 \x01(\t\x12\x0f\n\x03url\x18\x01 \x01(\tB\x02\x18\x01\x1a\x90\t\n\x06Tryjob\x12\x35\n\x08\x62uilders\x18\x01 \x03(\x0b\x32#.cv.config.Verifiers.Tryjob.Builder\x12=\n\x0cretry_config\x18\x02 \x01(\x0b\x32\'.cv.config.Verifiers.Tryjob.RetryConfig\x12\x33\n\x14\x63\x61ncel_stale_tryjobs\x18\x03 \x01(\x0e\x32\x11.cv.config.ToggleB\x02\x18\x01\x1a\xd3\x05\n\x07\x42uilder\x12\x0c\n\x04host\x18\x10 \x01(\t\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x17\n\x0fincludable_only\x18\t \x01(\x08\x12\x32\n\x11result_visibility\x18\n \x01(\x0e\x32\x17.cv.config.CommentLevel\x12\x15\n\rdisable_reuse\x18\x02 \x01(\x08\x12\x1d\n\x15\x64isable_reuse_footers\x18\x12 \x03(\t\x12\'\n\x0c\x63\x61ncel_stale\x18\x0b \x01(\x0e\x32\x11.cv.config.Toggle\x12\x1d\n\x15\x65xperiment_percentage\x18\x04 \x01(\x02\x12\x44\n\requivalent_to\x18\x05 \x01(\x0b\x32-.cv.config.Verifiers.Tryjob.EquivalentBuilder\x12L\n\x10location_filters\x18\x0f \x03(\x0b\x32\x32.cv.config.Verifiers.Tryjob.Builder.LocationFilter\x12\x1d\n\x15owner_whitelist_group\x18\x08 \x03(\t\x12\x16\n\x0emode_allowlist\x18\x0e \x03(\t\x12\x44\n\x0cskip_footers\x18\x11 \x03(\x0b\x32..cv.config.Verifiers.Tryjob.Builder.SkipFooter\x1a\x8c\x01\n\x0eLocationFilter\x12\x1a\n\x12gerrit_host_regexp\x18\x01 \x01(\t\x12\x1d\n\x15gerrit_project_regexp\x18\x02 \x01(\t\x12\x19\n\x11gerrit_ref_regexp\x18\x05 \x01(\t\x12\x13\n\x0bpath_regexp\x18\x03 \x01(\t\x12\x0f\n\x07\x65xclude\x18\x04 \x01(\x08\x1a/\n\nSkipFooter\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x14\n\x0cvalue_regexp\x18\x02 \x01(\tJ\x04\x08\x03\x10\x04J\x04\x08\x0c\x10\rJ\x04\x08\r\x10\x0e\x1aT\n\x11\x45quivalentBuilder\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\npercentage\x18\x02 \x01(\x02\x12\x1d\n\x15owner_whitelist_group\x18\x03 \x01(\t\x1a!\n\x11IncludableBuilder\x12\x0c\n\x04name\x18\x01 \x01(\t\x1a\x8b\x01\n\x0bRetryConfig\x12\x14\n\x0csingle_quota\x18\x01 \x01(\x05\x12\x14\n\x0cglobal_quota\x18\x02 \x01(\x05\x12\x16\n\x0e\x66\x61ilure_weight\x18\x03 \x01(\x05\x12 \n\x18transient_failure_weight\x18\x04 \x01(\x05\x12\x16\n\x0etimeout_weight\x18\x05 \x01(\x05\x1a\n\n\x08\x43QLinter\x1a;\n\x04\x46\x61ke\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x0e\x65ventual_state\x18\x02 \x01(\t\x12\r\n\x05\x64\x65lay\x18\x03 \x01(\x05\"\xc3\x02\n\tUserLimit\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nprincipals\x18\x02 \x03(\t\x12%\n\x03run\x18\x05 \x01(\x0b\x32\x18.cv.config.UserLimit.Run\x12+\n\x06tryjob\x18\x06 \x01(\x0b\x32\x1b.cv.config.UserLimit.Tryjob\x1a\x36\n\x05Limit\x12\x0f\n\x05value\x18\x01 \x01(\x03H\x00\x12\x13\n\tunlimited\x18\x02 \x01(\x08H\x00\x42\x07\n\x05limit\x1aN\n\x03Run\x12.\n\nmax_active\x18\x01 \x01(\x0b\x32\x1a.cv.config.UserLimit.Limit\x12\x17\n\x0freach_limit_msg\x18\x02 \x01(\t\x1a\x38\n\x06Tryjob\x12.\n\nmax_active\x18\x01 \x01(\x0b\x32\x1a.cv.config.UserLimit.Limit*]\n\x0c\x43ommentLevel\x12\x17\n\x13\x43OMMENT_LEVEL_UNSET\x10\x00\x12\x16\n\x12\x43OMMENT_LEVEL_FULL\x10\x01\x12\x1c\n\x18\x43OMMENT_LEVEL_RESTRICTED\x10\x02*$\n\x06Toggle\x12\t\n\x05UNSET\x10\x00\x12\x07\n\x03YES\x10\x01\x12\x06\n\x02NO\x10\x02\x42lZ+go.chromium.org/luci/cv/api/config/v2;cfgpb\xa2\xfe#;\n9https://config.luci.app/schemas/projects:commit-queue.cfgb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.config.v2.config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z+go.chromium.org/luci/cv/api/config/v2;cfgpb\242\376#;\n9https://config.luci.app/schemas/projects:commit-queue.cfg'
+  _globals['_CONFIG_GERRITLISTENERTYPE'].values_by_name["GERRIT_LISTENER_TYPE_LEGACY_POLLER"]._loaded_options = None
+  _globals['_CONFIG_GERRITLISTENERTYPE'].values_by_name["GERRIT_LISTENER_TYPE_LEGACY_POLLER"]._serialized_options = b'\010\001'
+  _globals['_CONFIG'].fields_by_name['draining_start_time']._loaded_options = None
+  _globals['_CONFIG'].fields_by_name['draining_start_time']._serialized_options = b'\030\001'
+  _globals['_CONFIG'].fields_by_name['cq_status_host']._loaded_options = None
+  _globals['_CONFIG'].fields_by_name['cq_status_host']._serialized_options = b'\030\001'
+  _globals['_CONFIG'].fields_by_name['project_scoped_account']._loaded_options = None
+  _globals['_CONFIG'].fields_by_name['project_scoped_account']._serialized_options = b'\030\001'
+  _globals['_CONFIGGROUP_POSTACTION_TRIGGERINGCONDITION'].fields_by_name['mode']._loaded_options = None
+  _globals['_CONFIGGROUP_POSTACTION_TRIGGERINGCONDITION'].fields_by_name['mode']._serialized_options = b'\372B\004r\002\020\001'
+  _globals['_CONFIGGROUP_POSTACTION_TRIGGERINGCONDITION'].fields_by_name['statuses']._loaded_options = None
+  _globals['_CONFIGGROUP_POSTACTION_TRIGGERINGCONDITION'].fields_by_name['statuses']._serialized_options = b'\372B\014\222\001\t\010\001\"\005\202\001\002\020\001'
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS_VOTE'].fields_by_name['name']._loaded_options = None
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS_VOTE'].fields_by_name['name']._serialized_options = b'\372B\004r\002\020\001'
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS'].fields_by_name['votes']._loaded_options = None
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS'].fields_by_name['votes']._serialized_options = b'\372B\005\222\001\002\010\001'
+  _globals['_CONFIGGROUP_POSTACTION'].oneofs_by_name['action']._loaded_options = None
+  _globals['_CONFIGGROUP_POSTACTION'].oneofs_by_name['action']._serialized_options = b'\370B\001'
+  _globals['_CONFIGGROUP_POSTACTION'].fields_by_name['name']._loaded_options = None
+  _globals['_CONFIGGROUP_POSTACTION'].fields_by_name['name']._serialized_options = b'\372B\004r\002\020\001'
+  _globals['_CONFIGGROUP_POSTACTION'].fields_by_name['conditions']._loaded_options = None
+  _globals['_CONFIGGROUP_POSTACTION'].fields_by_name['conditions']._serialized_options = b'\372B\014\222\001\t\010\001\"\005\212\001\002\020\001'
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT_CONDITION'].fields_by_name['owner_group_allowlist']._loaded_options = None
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT_CONDITION'].fields_by_name['owner_group_allowlist']._serialized_options = b'\372B\t\222\001\006\"\004r\002\020\001'
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT'].fields_by_name['name']._loaded_options = None
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT'].fields_by_name['name']._serialized_options = b'\372B\004r\002\020\001'
+  _globals['_CONFIGGROUP'].fields_by_name['post_actions']._loaded_options = None
+  _globals['_CONFIGGROUP'].fields_by_name['post_actions']._serialized_options = b'\372B\n\222\001\007\"\005\212\001\002\020\001'
+  _globals['_CONFIGGROUP'].fields_by_name['tryjob_experiments']._loaded_options = None
+  _globals['_CONFIGGROUP'].fields_by_name['tryjob_experiments']._serialized_options = b'\372B\n\222\001\007\"\005\212\001\002\020\001'
+  _globals['_MODE'].fields_by_name['name']._loaded_options = None
+  _globals['_MODE'].fields_by_name['name']._serialized_options = b'\372B<r:2\023^[A-Z][A-Z_]{0,39}$Z\007DRY_RUNZ\010FULL_RUNZ\020NEW_PATCHSET_RUN'
+  _globals['_MODE'].fields_by_name['cq_label_value']._loaded_options = None
+  _globals['_MODE'].fields_by_name['cq_label_value']._serialized_options = b'\372B\006\032\0040\0010\002'
+  _globals['_MODE'].fields_by_name['triggering_label']._loaded_options = None
+  _globals['_MODE'].fields_by_name['triggering_label']._serialized_options = b'\372B\022r\020\020\001Z\014Commit-Queue'
+  _globals['_MODE'].fields_by_name['triggering_value']._loaded_options = None
+  _globals['_MODE'].fields_by_name['triggering_value']._serialized_options = b'\372B\004\032\002 \000'
+  _globals['_VERIFIERS_TREESTATUS'].fields_by_name['url']._loaded_options = None
+  _globals['_VERIFIERS_TREESTATUS'].fields_by_name['url']._serialized_options = b'\030\001'
+  _globals['_VERIFIERS_TRYJOB'].fields_by_name['cancel_stale_tryjobs']._loaded_options = None
+  _globals['_VERIFIERS_TRYJOB'].fields_by_name['cancel_stale_tryjobs']._serialized_options = b'\030\001'
+  _globals['_COMMENTLEVEL']._serialized_start=4575
+  _globals['_COMMENTLEVEL']._serialized_end=4668
+  _globals['_TOGGLE']._serialized_start=4670
+  _globals['_TOGGLE']._serialized_end=4706
+  _globals['_CONFIG']._serialized_start=214
+  _globals['_CONFIG']._serialized_end=679
+  _globals['_CONFIG_GERRITLISTENERTYPE']._serialized_start=544
+  _globals['_CONFIG_GERRITLISTENERTYPE']._serialized_end=679
+  _globals['_CONFIGGROUP']._serialized_start=682
+  _globals['_CONFIGGROUP']._serialized_end=1978
+  _globals['_CONFIGGROUP_GERRIT']._serialized_start=1173
+  _globals['_CONFIGGROUP_GERRIT']._serialized_end=1324
+  _globals['_CONFIGGROUP_GERRIT_PROJECT']._serialized_start=1253
+  _globals['_CONFIGGROUP_GERRIT_PROJECT']._serialized_end=1324
+  _globals['_CONFIGGROUP_POSTACTION']._serialized_start=1327
+  _globals['_CONFIGGROUP_POSTACTION']._serialized_end=1800
+  _globals['_CONFIGGROUP_POSTACTION_TRIGGERINGCONDITION']._serialized_start=1538
+  _globals['_CONFIGGROUP_POSTACTION_TRIGGERINGCONDITION']._serialized_end=1636
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS']._serialized_start=1639
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS']._serialized_end=1785
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS_VOTE']._serialized_start=1741
+  _globals['_CONFIGGROUP_POSTACTION_VOTEGERRITLABELS_VOTE']._serialized_end=1785
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT']._serialized_start=1803
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT']._serialized_end=1972
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT_CONDITION']._serialized_start=1916
+  _globals['_CONFIGGROUP_TRYJOBEXPERIMENT_CONDITION']._serialized_end=1972
+  _globals['_SUBMITOPTIONS']._serialized_start=1980
+  _globals['_SUBMITOPTIONS']._serialized_end=2062
+  _globals['_MODE']._serialized_start=2065
+  _globals['_MODE']._serialized_end=2269
+  _globals['_COMBINECLS']._serialized_start=2271
+  _globals['_COMBINECLS']._serialized_end=2339
+  _globals['_VERIFIERS']._serialized_start=2342
+  _globals['_VERIFIERS']._serialized_end=4247
+  _globals['_VERIFIERS_GERRITCQABILITY']._serialized_start=2610
+  _globals['_VERIFIERS_GERRITCQABILITY']._serialized_end=2953
+  _globals['_VERIFIERS_GERRITCQABILITY_CQACTION']._serialized_start=2907
+  _globals['_VERIFIERS_GERRITCQABILITY_CQACTION']._serialized_end=2953
+  _globals['_VERIFIERS_TREESTATUS']._serialized_start=2955
+  _globals['_VERIFIERS_TREESTATUS']._serialized_end=3003
+  _globals['_VERIFIERS_TRYJOB']._serialized_start=3006
+  _globals['_VERIFIERS_TRYJOB']._serialized_end=4174
+  _globals['_VERIFIERS_TRYJOB_BUILDER']._serialized_start=3188
+  _globals['_VERIFIERS_TRYJOB_BUILDER']._serialized_end=3911
+  _globals['_VERIFIERS_TRYJOB_BUILDER_LOCATIONFILTER']._serialized_start=3704
+  _globals['_VERIFIERS_TRYJOB_BUILDER_LOCATIONFILTER']._serialized_end=3844
+  _globals['_VERIFIERS_TRYJOB_BUILDER_SKIPFOOTER']._serialized_start=3846
+  _globals['_VERIFIERS_TRYJOB_BUILDER_SKIPFOOTER']._serialized_end=3893
+  _globals['_VERIFIERS_TRYJOB_EQUIVALENTBUILDER']._serialized_start=3913
+  _globals['_VERIFIERS_TRYJOB_EQUIVALENTBUILDER']._serialized_end=3997
+  _globals['_VERIFIERS_TRYJOB_INCLUDABLEBUILDER']._serialized_start=3999
+  _globals['_VERIFIERS_TRYJOB_INCLUDABLEBUILDER']._serialized_end=4032
+  _globals['_VERIFIERS_TRYJOB_RETRYCONFIG']._serialized_start=4035
+  _globals['_VERIFIERS_TRYJOB_RETRYCONFIG']._serialized_end=4174
+  _globals['_VERIFIERS_CQLINTER']._serialized_start=4176
+  _globals['_VERIFIERS_CQLINTER']._serialized_end=4186
+  _globals['_VERIFIERS_FAKE']._serialized_start=4188
+  _globals['_VERIFIERS_FAKE']._serialized_end=4247
+  _globals['_USERLIMIT']._serialized_start=4250
+  _globals['_USERLIMIT']._serialized_end=4573
+  _globals['_USERLIMIT_LIMIT']._serialized_start=4381
+  _globals['_USERLIMIT_LIMIT']._serialized_end=4435
+  _globals['_USERLIMIT_RUN']._serialized_start=4437
+  _globals['_USERLIMIT_RUN']._serialized_end=4515
+  _globals['_USERLIMIT_TRYJOB']._serialized_start=4517
+  _globals['_USERLIMIT_TRYJOB']._serialized_end=4573
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/recipe/v1/cq.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/recipe/v1/cq.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.go.chromium.org/luci/cv/api/recipe/v1/cq.proto\x12\tcq.recipe\"}\n\x05Input\x12\x0e\n\x06\x61\x63tive\x18\x01 \x01(\x08\x12\x0f\n\x07\x64ry_run\x18\x02 \x01(\x08\x12\x14\n\x0c\x65xperimental\x18\x03 \x01(\x08\x12\x11\n\ttop_level\x18\x04 \x01(\x08\x12\x10\n\x08run_mode\x18\x05 \x01(\t\x12\x18\n\x10owner_is_googler\x18\x14 \x01(\x08\"\xda\x02\n\x06Output\x12\x1b\n\x13triggered_build_ids\x18\x01 \x03(\x03\x12&\n\x05retry\x18\x02 \x01(\x0e\x32\x17.cq.recipe.Output.Retry\x12*\n\x05reuse\x18\x03 \x03(\x0b\x32\x17.cq.recipe.Output.ReuseB\x02\x18\x01\x12\x32\n\x0breusability\x18\x04 \x01(\x0b\x32\x1d.cq.recipe.Output.Reusability\x1a*\n\x05Reuse\x12\x13\n\x0bmode_regexp\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x65ny\x18\x02 \x01(\x08\x1a%\n\x0bReusability\x12\x16\n\x0emode_allowlist\x18\x04 \x03(\t\"X\n\x05Retry\x12\x1c\n\x18OUTPUT_RETRY_UNSPECIFIED\x10\x00\x12\x18\n\x14OUTPUT_RETRY_ALLOWED\x10\x01\x12\x17\n\x13OUTPUT_RETRY_DENIED\x10\x02\x42.Z,go.chromium.org/luci/cv/api/recipe/v1;recipeb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.recipe.v1.cq_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z,go.chromium.org/luci/cv/api/recipe/v1;recipe'
+  _globals['_OUTPUT'].fields_by_name['reuse']._loaded_options = None
+  _globals['_OUTPUT'].fields_by_name['reuse']._serialized_options = b'\030\001'
+  _globals['_INPUT']._serialized_start=61
+  _globals['_INPUT']._serialized_end=186
+  _globals['_OUTPUT']._serialized_start=189
+  _globals['_OUTPUT']._serialized_end=535
+  _globals['_OUTPUT_REUSE']._serialized_start=364
+  _globals['_OUTPUT_REUSE']._serialized_end=406
+  _globals['_OUTPUT_REUSABILITY']._serialized_start=408
+  _globals['_OUTPUT_REUSABILITY']._serialized_end=445
+  _globals['_OUTPUT_RETRY']._serialized_start=447
+  _globals['_OUTPUT_RETRY']._serialized_end=535
+# @@protoc_insertion_point(module_scope)
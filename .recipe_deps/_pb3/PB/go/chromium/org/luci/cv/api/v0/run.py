@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/v0/run.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/v0/run.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.cv.api.v0 import tryjob as go_dot_chromium_dot_org_dot_luci_dot_cv_dot_api_dot_v0_dot_tryjob__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(go.chromium.org/luci/cv/api/v0/run.proto\x12\x05\x63v.v0\x1a\x1fgoogle/protobuf/timestamp.proto\x1a+go.chromium.org/luci/cv/api/v0/tryjob.proto\"\xda\x05\n\x03Run\x12\n\n\x02id\x18\x01 \x01(\t\x12!\n\x06status\x18\x02 \x01(\x0e\x32\x11.cv.v0.Run.Status\x12\x10\n\x08\x65version\x18\x03 \x01(\x03\x12\x0c\n\x04mode\x18\x04 \x01(\t\x12/\n\x0b\x63reate_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nstart_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0bupdate_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05owner\x18\t \x01(\t\x12\x12\n\ncreated_by\x18\r \x01(\t\x12\x11\n\tbilled_to\x18\x0f \x01(\t\x12 \n\x03\x63ls\x18\n \x03(\x0b\x32\x13.cv.v0.GerritChange\x12\"\n\x07tryjobs\x18\x0b \x03(\x0b\x32\r.cv.v0.TryjobB\x02\x18\x01\x12\x33\n\x12tryjob_invocations\x18\x0e \x03(\x0b\x32\x17.cv.v0.TryjobInvocation\x12)\n\nsubmission\x18\x0c \x01(\x0b\x32\x15.cv.v0.Run.Submission\x1a\x45\n\nSubmission\x12\x1c\n\x14submitted_cl_indexes\x18\x02 \x03(\x05\x12\x19\n\x11\x66\x61iled_cl_indexes\x18\x03 \x03(\x05\"\xa0\x01\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x1a\n\x16WAITING_FOR_SUBMISSION\x10\x04\x12\x0e\n\nSUBMITTING\x10\x05\x12\x0e\n\nENDED_MASK\x10@\x12\r\n\tSUCCEEDED\x10\x41\x12\n\n\x06\x46\x41ILED\x10\x42\x12\r\n\tCANCELLED\x10\x43\">\n\x0cGerritChange\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0e\n\x06\x63hange\x18\x02 \x01(\x03\x12\x10\n\x08patchset\x18\x03 \x01(\x05\x42%Z#go.chromium.org/luci/cv/api/v0;cvpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.v0.run_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z#go.chromium.org/luci/cv/api/v0;cvpb'
+  _globals['_RUN'].fields_by_name['tryjobs']._loaded_options = None
+  _globals['_RUN'].fields_by_name['tryjobs']._serialized_options = b'\030\001'
+  _globals['_RUN']._serialized_start=130
+  _globals['_RUN']._serialized_end=860
+  _globals['_RUN_SUBMISSION']._serialized_start=628
+  _globals['_RUN_SUBMISSION']._serialized_end=697
+  _globals['_RUN_STATUS']._serialized_start=700
+  _globals['_RUN_STATUS']._serialized_end=860
+  _globals['_GERRITCHANGE']._serialized_start=862
+  _globals['_GERRITCHANGE']._serialized_end=924
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,83 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.cv.api.v0 import tryjob as _tryjob_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Run(_message.Message):
+    __slots__ = ("id", "status", "eversion", "mode", "create_time", "start_time", "update_time", "end_time", "owner", "created_by", "billed_to", "cls", "tryjobs", "tryjob_invocations", "submission")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_UNSPECIFIED: _ClassVar[Run.Status]
+        PENDING: _ClassVar[Run.Status]
+        RUNNING: _ClassVar[Run.Status]
+        WAITING_FOR_SUBMISSION: _ClassVar[Run.Status]
+        SUBMITTING: _ClassVar[Run.Status]
+        ENDED_MASK: _ClassVar[Run.Status]
+        SUCCEEDED: _ClassVar[Run.Status]
+        FAILED: _ClassVar[Run.Status]
+        CANCELLED: _ClassVar[Run.Status]
+    STATUS_UNSPECIFIED: Run.Status
+    PENDING: Run.Status
+    RUNNING: Run.Status
+    WAITING_FOR_SUBMISSION: Run.Status
+    SUBMITTING: Run.Status
+    ENDED_MASK: Run.Status
+    SUCCEEDED: Run.Status
+    FAILED: Run.Status
+    CANCELLED: Run.Status
+    class Submission(_message.Message):
+        __slots__ = ("submitted_cl_indexes", "failed_cl_indexes")
+        SUBMITTED_CL_INDEXES_FIELD_NUMBER: _ClassVar[int]
+        FAILED_CL_INDEXES_FIELD_NUMBER: _ClassVar[int]
+        submitted_cl_indexes: _containers.RepeatedScalarFieldContainer[int]
+        failed_cl_indexes: _containers.RepeatedScalarFieldContainer[int]
+        def __init__(self, submitted_cl_indexes: _Optional[_Iterable[int]] = ..., failed_cl_indexes: _Optional[_Iterable[int]] = ...) -> None: ...
+    ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    EVERSION_FIELD_NUMBER: _ClassVar[int]
+    MODE_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_FIELD_NUMBER: _ClassVar[int]
+    OWNER_FIELD_NUMBER: _ClassVar[int]
+    CREATED_BY_FIELD_NUMBER: _ClassVar[int]
+    BILLED_TO_FIELD_NUMBER: _ClassVar[int]
+    CLS_FIELD_NUMBER: _ClassVar[int]
+    TRYJOBS_FIELD_NUMBER: _ClassVar[int]
+    TRYJOB_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    SUBMISSION_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    status: Run.Status
+    eversion: int
+    mode: str
+    create_time: _timestamp_pb2.Timestamp
+    start_time: _timestamp_pb2.Timestamp
+    update_time: _timestamp_pb2.Timestamp
+    end_time: _timestamp_pb2.Timestamp
+    owner: str
+    created_by: str
+    billed_to: str
+    cls: _containers.RepeatedCompositeFieldContainer[GerritChange]
+    tryjobs: _containers.RepeatedCompositeFieldContainer[_tryjob_pb2.Tryjob]
+    tryjob_invocations: _containers.RepeatedCompositeFieldContainer[_tryjob_pb2.TryjobInvocation]
+    submission: Run.Submission
+    def __init__(self, id: _Optional[str] = ..., status: _Optional[_Union[Run.Status, str]] = ..., eversion: _Optional[int] = ..., mode: _Optional[str] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., owner: _Optional[str] = ..., created_by: _Optional[str] = ..., billed_to: _Optional[str] = ..., cls: _Optional[_Iterable[_Union[GerritChange, _Mapping]]] = ..., tryjobs: _Optional[_Iterable[_Union[_tryjob_pb2.Tryjob, _Mapping]]] = ..., tryjob_invocations: _Optional[_Iterable[_Union[_tryjob_pb2.TryjobInvocation, _Mapping]]] = ..., submission: _Optional[_Union[Run.Submission, _Mapping]] = ...) -> None: ...
+
+class GerritChange(_message.Message):
+    __slots__ = ("host", "change", "patchset")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_FIELD_NUMBER: _ClassVar[int]
+    PATCHSET_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    change: int
+    patchset: int
+    def __init__(self, host: _Optional[str] = ..., change: _Optional[int] = ..., patchset: _Optional[int] = ...) -> None: ...
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/v0/service_gerrit.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/v0/service_gerrit.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.cv.api.v0 import run as go_dot_chromium_dot_org_dot_luci_dot_cv_dot_api_dot_v0_dot_run__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/cv/api/v0/service_gerrit.proto\x12\x05\x63v.v0\x1a\x1fgoogle/protobuf/timestamp.proto\x1a(go.chromium.org/luci/cv/api/v0/run.proto\"A\n\x13GetCLRunInfoRequest\x12*\n\rgerrit_change\x18\x01 \x01(\x0b\x32\x13.cv.v0.GerritChange\"\x8c\x04\n\x14GetCLRunInfoResponse\x12;\n\x0eruns_as_origin\x18\x01 \x03(\x0b\x32#.cv.v0.GetCLRunInfoResponse.RunInfo\x12\x38\n\x0bruns_as_dep\x18\x02 \x03(\x0b\x32#.cv.v0.GetCLRunInfoResponse.RunInfo\x12\x43\n\x10\x64\x65p_change_infos\x18\x03 \x03(\x0b\x32).cv.v0.GetCLRunInfoResponse.DepChangeInfo\x1a\xb0\x01\n\x07RunInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12/\n\x0b\x63reate_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nstart_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12*\n\rorigin_change\x18\x04 \x01(\x0b\x32\x13.cv.v0.GerritChange\x12\x0c\n\x04mode\x18\x05 \x01(\t\x1a\x84\x01\n\rDepChangeInfo\x12*\n\rgerrit_change\x18\x01 \x01(\x0b\x32\x13.cv.v0.GerritChange\x12\x31\n\x04runs\x18\x02 \x03(\x0b\x32#.cv.v0.GetCLRunInfoResponse.RunInfo\x12\x14\n\x0c\x63hange_owner\x18\x03 \x01(\t2\\\n\x11GerritIntegration\x12G\n\x0cGetCLRunInfo\x12\x1a.cv.v0.GetCLRunInfoRequest\x1a\x1b.cv.v0.GetCLRunInfoResponseB%Z#go.chromium.org/luci/cv/api/v0;cvpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.v0.service_gerrit_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z#go.chromium.org/luci/cv/api/v0;cvpb'
+  _globals['_GETCLRUNINFOREQUEST']._serialized_start=137
+  _globals['_GETCLRUNINFOREQUEST']._serialized_end=202
+  _globals['_GETCLRUNINFORESPONSE']._serialized_start=205
+  _globals['_GETCLRUNINFORESPONSE']._serialized_end=729
+  _globals['_GETCLRUNINFORESPONSE_RUNINFO']._serialized_start=418
+  _globals['_GETCLRUNINFORESPONSE_RUNINFO']._serialized_end=594
+  _globals['_GETCLRUNINFORESPONSE_DEPCHANGEINFO']._serialized_start=597
+  _globals['_GETCLRUNINFORESPONSE_DEPCHANGEINFO']._serialized_end=729
+  _globals['_GERRITINTEGRATION']._serialized_start=731
+  _globals['_GERRITINTEGRATION']._serialized_end=823
+# @@protoc_insertion_point(module_scope)
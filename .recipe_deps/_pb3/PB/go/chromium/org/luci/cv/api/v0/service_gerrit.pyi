@@ -0,0 +1,49 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.cv.api.v0 import run as _run_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetCLRunInfoRequest(_message.Message):
+    __slots__ = ("gerrit_change",)
+    GERRIT_CHANGE_FIELD_NUMBER: _ClassVar[int]
+    gerrit_change: _run_pb2.GerritChange
+    def __init__(self, gerrit_change: _Optional[_Union[_run_pb2.GerritChange, _Mapping]] = ...) -> None: ...
+
+class GetCLRunInfoResponse(_message.Message):
+    __slots__ = ("runs_as_origin", "runs_as_dep", "dep_change_infos")
+    class RunInfo(_message.Message):
+        __slots__ = ("id", "create_time", "start_time", "origin_change", "mode")
+        ID_FIELD_NUMBER: _ClassVar[int]
+        CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+        START_TIME_FIELD_NUMBER: _ClassVar[int]
+        ORIGIN_CHANGE_FIELD_NUMBER: _ClassVar[int]
+        MODE_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        create_time: _timestamp_pb2.Timestamp
+        start_time: _timestamp_pb2.Timestamp
+        origin_change: _run_pb2.GerritChange
+        mode: str
+        def __init__(self, id: _Optional[str] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., origin_change: _Optional[_Union[_run_pb2.GerritChange, _Mapping]] = ..., mode: _Optional[str] = ...) -> None: ...
+    class DepChangeInfo(_message.Message):
+        __slots__ = ("gerrit_change", "runs", "change_owner")
+        GERRIT_CHANGE_FIELD_NUMBER: _ClassVar[int]
+        RUNS_FIELD_NUMBER: _ClassVar[int]
+        CHANGE_OWNER_FIELD_NUMBER: _ClassVar[int]
+        gerrit_change: _run_pb2.GerritChange
+        runs: _containers.RepeatedCompositeFieldContainer[GetCLRunInfoResponse.RunInfo]
+        change_owner: str
+        def __init__(self, gerrit_change: _Optional[_Union[_run_pb2.GerritChange, _Mapping]] = ..., runs: _Optional[_Iterable[_Union[GetCLRunInfoResponse.RunInfo, _Mapping]]] = ..., change_owner: _Optional[str] = ...) -> None: ...
+    RUNS_AS_ORIGIN_FIELD_NUMBER: _ClassVar[int]
+    RUNS_AS_DEP_FIELD_NUMBER: _ClassVar[int]
+    DEP_CHANGE_INFOS_FIELD_NUMBER: _ClassVar[int]
+    runs_as_origin: _containers.RepeatedCompositeFieldContainer[GetCLRunInfoResponse.RunInfo]
+    runs_as_dep: _containers.RepeatedCompositeFieldContainer[GetCLRunInfoResponse.RunInfo]
+    dep_change_infos: _containers.RepeatedCompositeFieldContainer[GetCLRunInfoResponse.DepChangeInfo]
+    def __init__(self, runs_as_origin: _Optional[_Iterable[_Union[GetCLRunInfoResponse.RunInfo, _Mapping]]] = ..., runs_as_dep: _Optional[_Iterable[_Union[GetCLRunInfoResponse.RunInfo, _Mapping]]] = ..., dep_change_infos: _Optional[_Iterable[_Union[GetCLRunInfoResponse.DepChangeInfo, _Mapping]]] = ...) -> None: ...
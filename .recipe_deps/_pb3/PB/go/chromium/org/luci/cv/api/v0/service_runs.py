@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/v0/service_runs.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/v0/service_runs.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.cv.api.v0 import run as go_dot_chromium_dot_org_dot_luci_dot_cv_dot_api_dot_v0_dot_run__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n1go.chromium.org/luci/cv/api/v0/service_runs.proto\x12\x05\x63v.v0\x1a(go.chromium.org/luci/cv/api/v0/run.proto\"\x1b\n\rGetRunRequest\x12\n\n\x02id\x18\x01 \x01(\t\"b\n\x11SearchRunsRequest\x12&\n\tpredicate\x18\x01 \x01(\x0b\x32\x13.cv.v0.RunPredicate\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\"G\n\x12SearchRunsResponse\x12\x18\n\x04runs\x18\x01 \x03(\x0b\x32\n.cv.v0.Run\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"L\n\x0cRunPredicate\x12\x0f\n\x07project\x18\x01 \x01(\t\x12+\n\x0egerrit_changes\x18\x02 \x03(\x0b\x32\x13.cv.v0.GerritChange2u\n\x04Runs\x12*\n\x06GetRun\x12\x14.cv.v0.GetRunRequest\x1a\n.cv.v0.Run\x12\x41\n\nSearchRuns\x12\x18.cv.v0.SearchRunsRequest\x1a\x19.cv.v0.SearchRunsResponseB%Z#go.chromium.org/luci/cv/api/v0;cvpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.v0.service_runs_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z#go.chromium.org/luci/cv/api/v0;cvpb'
+  _globals['_GETRUNREQUEST']._serialized_start=102
+  _globals['_GETRUNREQUEST']._serialized_end=129
+  _globals['_SEARCHRUNSREQUEST']._serialized_start=131
+  _globals['_SEARCHRUNSREQUEST']._serialized_end=229
+  _globals['_SEARCHRUNSRESPONSE']._serialized_start=231
+  _globals['_SEARCHRUNSRESPONSE']._serialized_end=302
+  _globals['_RUNPREDICATE']._serialized_start=304
+  _globals['_RUNPREDICATE']._serialized_end=380
+  _globals['_RUNS']._serialized_start=382
+  _globals['_RUNS']._serialized_end=499
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,40 @@
+from PB.go.chromium.org.luci.cv.api.v0 import run as _run_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetRunRequest(_message.Message):
+    __slots__ = ("id",)
+    ID_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    def __init__(self, id: _Optional[str] = ...) -> None: ...
+
+class SearchRunsRequest(_message.Message):
+    __slots__ = ("predicate", "page_size", "page_token")
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    predicate: RunPredicate
+    page_size: int
+    page_token: str
+    def __init__(self, predicate: _Optional[_Union[RunPredicate, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class SearchRunsResponse(_message.Message):
+    __slots__ = ("runs", "next_page_token")
+    RUNS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    runs: _containers.RepeatedCompositeFieldContainer[_run_pb2.Run]
+    next_page_token: str
+    def __init__(self, runs: _Optional[_Iterable[_Union[_run_pb2.Run, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class RunPredicate(_message.Message):
+    __slots__ = ("project", "gerrit_changes")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    GERRIT_CHANGES_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    gerrit_changes: _containers.RepeatedCompositeFieldContainer[_run_pb2.GerritChange]
+    def __init__(self, project: _Optional[str] = ..., gerrit_changes: _Optional[_Iterable[_Union[_run_pb2.GerritChange, _Mapping]]] = ...) -> None: ...
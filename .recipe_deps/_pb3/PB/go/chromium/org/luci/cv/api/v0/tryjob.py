@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/v0/tryjob.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/v0/tryjob.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_builder__common__pb2
+from PB.go.chromium.org.luci.cv.api.config.v2 import config as go_dot_chromium_dot_org_dot_luci_dot_cv_dot_api_dot_config_dot_v2_dot_config__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+go.chromium.org/luci/cv/api/v0/tryjob.proto\x12\x05\x63v.v0\x1a;go.chromium.org/luci/buildbucket/proto/builder_common.proto\x1a\x32go.chromium.org/luci/cv/api/config/v2/config.proto\"\x84\x04\n\x06Tryjob\x12$\n\x06status\x18\x02 \x01(\x0e\x32\x14.cv.v0.Tryjob.Status\x12$\n\x06result\x18\x03 \x01(\x0b\x32\x14.cv.v0.Tryjob.Result\x12\x10\n\x08\x63ritical\x18\x04 \x01(\x08\x12\r\n\x05reuse\x18\x05 \x01(\x08\x1a\x9d\x02\n\x06Result\x12+\n\x06status\x18\x01 \x01(\x0e\x32\x1b.cv.v0.Tryjob.Result.Status\x12\x37\n\x0b\x62uildbucket\x18\x05 \x01(\x0b\x32 .cv.v0.Tryjob.Result.BuildbucketH\x00\x1a\x1f\n\x0b\x42uildbucket\x12\n\n\x02id\x18\x01 \x01(\x03J\x04\x08\x02\x10\x03\"\x80\x01\n\x06Status\x12\x1d\n\x19RESULT_STATUS_UNSPECIFIED\x10\x00\x12\x0b\n\x07UNKNOWN\x10\x01\x12\r\n\tSUCCEEDED\x10\x02\x12\x16\n\x12\x46\x41ILED_PERMANENTLY\x10\x03\x12\x16\n\x12\x46\x41ILED_TRANSIENTLY\x10\x04\x12\x0b\n\x07TIMEOUT\x10\x05\x42\t\n\x07\x62\x61\x63kend\"g\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\r\n\tTRIGGERED\x10\x02\x12\t\n\x05\x45NDED\x10\x03\x12\r\n\tCANCELLED\x10\x04\x12\x0f\n\x0bUNTRIGGERED\x10\x05J\x04\x08\x01\x10\x02\"\xa6\x01\n\x0cTryjobResult\x12\x36\n\x0b\x62uildbucket\x18\x01 \x01(\x0b\x32\x1f.cv.v0.TryjobResult.BuildbucketH\x00\x1aS\n\x0b\x42uildbucket\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\x03\x12*\n\x07\x62uilder\x18\x03 \x01(\x0b\x32\x19.buildbucket.v2.BuilderIDB\t\n\x07\x62\x61\x63kend\"\x9d\x02\n\x10TryjobInvocation\x12;\n\x0e\x62uilder_config\x18\x01 \x01(\x0b\x32#.cv.config.Verifiers.Tryjob.Builder\x12#\n\x06status\x18\x02 \x01(\x0e\x32\x13.cv.v0.TryjobStatus\x12\x10\n\x08\x63ritical\x18\x03 \x01(\x08\x12\x31\n\x08\x61ttempts\x18\x04 \x03(\x0b\x32\x1f.cv.v0.TryjobInvocation.Attempt\x1a\x62\n\x07\x41ttempt\x12#\n\x06status\x18\x01 \x01(\x0e\x32\x13.cv.v0.TryjobStatus\x12#\n\x06result\x18\x02 \x01(\x0b\x32\x13.cv.v0.TryjobResult\x12\r\n\x05reuse\x18\x03 \x01(\x08*\x82\x01\n\x0cTryjobStatus\x12\x1d\n\x19TRYJOB_STATUS_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\r\n\tSUCCEEDED\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\x12\r\n\tCANCELLED\x10\x05\x12\x0f\n\x0bUNTRIGGERED\x10\x06\x42%Z#go.chromium.org/luci/cv/api/v0;cvpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.v0.tryjob_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z#go.chromium.org/luci/cv/api/v0;cvpb'
+  _globals['_TRYJOBSTATUS']._serialized_start=1144
+  _globals['_TRYJOBSTATUS']._serialized_end=1274
+  _globals['_TRYJOB']._serialized_start=168
+  _globals['_TRYJOB']._serialized_end=684
+  _globals['_TRYJOB_RESULT']._serialized_start=288
+  _globals['_TRYJOB_RESULT']._serialized_end=573
+  _globals['_TRYJOB_RESULT_BUILDBUCKET']._serialized_start=400
+  _globals['_TRYJOB_RESULT_BUILDBUCKET']._serialized_end=431
+  _globals['_TRYJOB_RESULT_STATUS']._serialized_start=434
+  _globals['_TRYJOB_RESULT_STATUS']._serialized_end=562
+  _globals['_TRYJOB_STATUS']._serialized_start=575
+  _globals['_TRYJOB_STATUS']._serialized_end=678
+  _globals['_TRYJOBRESULT']._serialized_start=687
+  _globals['_TRYJOBRESULT']._serialized_end=853
+  _globals['_TRYJOBRESULT_BUILDBUCKET']._serialized_start=759
+  _globals['_TRYJOBRESULT_BUILDBUCKET']._serialized_end=842
+  _globals['_TRYJOBINVOCATION']._serialized_start=856
+  _globals['_TRYJOBINVOCATION']._serialized_end=1141
+  _globals['_TRYJOBINVOCATION_ATTEMPT']._serialized_start=1043
+  _globals['_TRYJOBINVOCATION_ATTEMPT']._serialized_end=1141
+# @@protoc_insertion_point(module_scope)
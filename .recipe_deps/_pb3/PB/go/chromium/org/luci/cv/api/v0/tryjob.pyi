@@ -0,0 +1,115 @@
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as _builder_common_pb2
+from PB.go.chromium.org.luci.cv.api.config.v2 import config as _config_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TryjobStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TRYJOB_STATUS_UNSPECIFIED: _ClassVar[TryjobStatus]
+    PENDING: _ClassVar[TryjobStatus]
+    RUNNING: _ClassVar[TryjobStatus]
+    SUCCEEDED: _ClassVar[TryjobStatus]
+    FAILED: _ClassVar[TryjobStatus]
+    CANCELLED: _ClassVar[TryjobStatus]
+    UNTRIGGERED: _ClassVar[TryjobStatus]
+TRYJOB_STATUS_UNSPECIFIED: TryjobStatus
+PENDING: TryjobStatus
+RUNNING: TryjobStatus
+SUCCEEDED: TryjobStatus
+FAILED: TryjobStatus
+CANCELLED: TryjobStatus
+UNTRIGGERED: TryjobStatus
+
+class Tryjob(_message.Message):
+    __slots__ = ("status", "result", "critical", "reuse")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_UNSPECIFIED: _ClassVar[Tryjob.Status]
+        PENDING: _ClassVar[Tryjob.Status]
+        TRIGGERED: _ClassVar[Tryjob.Status]
+        ENDED: _ClassVar[Tryjob.Status]
+        CANCELLED: _ClassVar[Tryjob.Status]
+        UNTRIGGERED: _ClassVar[Tryjob.Status]
+    STATUS_UNSPECIFIED: Tryjob.Status
+    PENDING: Tryjob.Status
+    TRIGGERED: Tryjob.Status
+    ENDED: Tryjob.Status
+    CANCELLED: Tryjob.Status
+    UNTRIGGERED: Tryjob.Status
+    class Result(_message.Message):
+        __slots__ = ("status", "buildbucket")
+        class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+            __slots__ = ()
+            RESULT_STATUS_UNSPECIFIED: _ClassVar[Tryjob.Result.Status]
+            UNKNOWN: _ClassVar[Tryjob.Result.Status]
+            SUCCEEDED: _ClassVar[Tryjob.Result.Status]
+            FAILED_PERMANENTLY: _ClassVar[Tryjob.Result.Status]
+            FAILED_TRANSIENTLY: _ClassVar[Tryjob.Result.Status]
+            TIMEOUT: _ClassVar[Tryjob.Result.Status]
+        RESULT_STATUS_UNSPECIFIED: Tryjob.Result.Status
+        UNKNOWN: Tryjob.Result.Status
+        SUCCEEDED: Tryjob.Result.Status
+        FAILED_PERMANENTLY: Tryjob.Result.Status
+        FAILED_TRANSIENTLY: Tryjob.Result.Status
+        TIMEOUT: Tryjob.Result.Status
+        class Buildbucket(_message.Message):
+            __slots__ = ("id",)
+            ID_FIELD_NUMBER: _ClassVar[int]
+            id: int
+            def __init__(self, id: _Optional[int] = ...) -> None: ...
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        BUILDBUCKET_FIELD_NUMBER: _ClassVar[int]
+        status: Tryjob.Result.Status
+        buildbucket: Tryjob.Result.Buildbucket
+        def __init__(self, status: _Optional[_Union[Tryjob.Result.Status, str]] = ..., buildbucket: _Optional[_Union[Tryjob.Result.Buildbucket, _Mapping]] = ...) -> None: ...
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    RESULT_FIELD_NUMBER: _ClassVar[int]
+    CRITICAL_FIELD_NUMBER: _ClassVar[int]
+    REUSE_FIELD_NUMBER: _ClassVar[int]
+    status: Tryjob.Status
+    result: Tryjob.Result
+    critical: bool
+    reuse: bool
+    def __init__(self, status: _Optional[_Union[Tryjob.Status, str]] = ..., result: _Optional[_Union[Tryjob.Result, _Mapping]] = ..., critical: bool = ..., reuse: bool = ...) -> None: ...
+
+class TryjobResult(_message.Message):
+    __slots__ = ("buildbucket",)
+    class Buildbucket(_message.Message):
+        __slots__ = ("host", "id", "builder")
+        HOST_FIELD_NUMBER: _ClassVar[int]
+        ID_FIELD_NUMBER: _ClassVar[int]
+        BUILDER_FIELD_NUMBER: _ClassVar[int]
+        host: str
+        id: int
+        builder: _builder_common_pb2.BuilderID
+        def __init__(self, host: _Optional[str] = ..., id: _Optional[int] = ..., builder: _Optional[_Union[_builder_common_pb2.BuilderID, _Mapping]] = ...) -> None: ...
+    BUILDBUCKET_FIELD_NUMBER: _ClassVar[int]
+    buildbucket: TryjobResult.Buildbucket
+    def __init__(self, buildbucket: _Optional[_Union[TryjobResult.Buildbucket, _Mapping]] = ...) -> None: ...
+
+class TryjobInvocation(_message.Message):
+    __slots__ = ("builder_config", "status", "critical", "attempts")
+    class Attempt(_message.Message):
+        __slots__ = ("status", "result", "reuse")
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        RESULT_FIELD_NUMBER: _ClassVar[int]
+        REUSE_FIELD_NUMBER: _ClassVar[int]
+        status: TryjobStatus
+        result: TryjobResult
+        reuse: bool
+        def __init__(self, status: _Optional[_Union[TryjobStatus, str]] = ..., result: _Optional[_Union[TryjobResult, _Mapping]] = ..., reuse: bool = ...) -> None: ...
+    BUILDER_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    CRITICAL_FIELD_NUMBER: _ClassVar[int]
+    ATTEMPTS_FIELD_NUMBER: _ClassVar[int]
+    builder_config: _config_pb2.Verifiers.Tryjob.Builder
+    status: TryjobStatus
+    critical: bool
+    attempts: _containers.RepeatedCompositeFieldContainer[TryjobInvocation.Attempt]
+    def __init__(self, builder_config: _Optional[_Union[_config_pb2.Verifiers.Tryjob.Builder, _Mapping]] = ..., status: _Optional[_Union[TryjobStatus, str]] = ..., critical: bool = ..., attempts: _Optional[_Iterable[_Union[TryjobInvocation.Attempt, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/v1/pubsub.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/v1/pubsub.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.cv.api.v1 import run as go_dot_chromium_dot_org_dot_luci_dot_cv_dot_api_dot_v1_dot_run__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+go.chromium.org/luci/cv/api/v1/pubsub.proto\x12\x05\x63v.v1\x1a(go.chromium.org/luci/cv/api/v1/run.proto\"^\n\tPubSubRun\x12\n\n\x02id\x18\x01 \x01(\t\x12!\n\x06status\x18\x02 \x01(\x0e\x32\x11.cv.v1.Run.Status\x12\x10\n\x08\x65version\x18\x03 \x01(\x03\x12\x10\n\x08hostname\x18\x04 \x01(\tB%Z#go.chromium.org/luci/cv/api/v1;cvpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.v1.pubsub_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z#go.chromium.org/luci/cv/api/v1;cvpb'
+  _globals['_PUBSUBRUN']._serialized_start=96
+  _globals['_PUBSUBRUN']._serialized_end=190
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,18 @@
+from PB.go.chromium.org.luci.cv.api.v1 import run as _run_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class PubSubRun(_message.Message):
+    __slots__ = ("id", "status", "eversion", "hostname")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    EVERSION_FIELD_NUMBER: _ClassVar[int]
+    HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    status: _run_pb2.Run.Status
+    eversion: int
+    hostname: str
+    def __init__(self, id: _Optional[str] = ..., status: _Optional[_Union[_run_pb2.Run.Status, str]] = ..., eversion: _Optional[int] = ..., hostname: _Optional[str] = ...) -> None: ...
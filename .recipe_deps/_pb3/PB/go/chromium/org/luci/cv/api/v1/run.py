@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/cv/api/v1/run.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/cv/api/v1/run.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(go.chromium.org/luci/cv/api/v1/run.proto\x12\x05\x63v.v1\"\xe9\x01\n\x03Run\x12\n\n\x02id\x18\x01 \x01(\t\x12!\n\x06status\x18\x02 \x01(\x0e\x32\x11.cv.v1.Run.Status\x12\x10\n\x08\x65version\x18\x03 \x01(\x03\"\xa0\x01\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x1a\n\x16WAITING_FOR_SUBMISSION\x10\x04\x12\x0e\n\nSUBMITTING\x10\x05\x12\x0e\n\nENDED_MASK\x10@\x12\r\n\tSUCCEEDED\x10\x41\x12\n\n\x06\x46\x41ILED\x10\x42\x12\r\n\tCANCELLED\x10\x43\x42%Z#go.chromium.org/luci/cv/api/v1;cvpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.cv.api.v1.run_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z#go.chromium.org/luci/cv/api/v1;cvpb'
+  _globals['_RUN']._serialized_start=52
+  _globals['_RUN']._serialized_end=285
+  _globals['_RUN_STATUS']._serialized_start=125
+  _globals['_RUN_STATUS']._serialized_end=285
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/gce/api/config/v1/config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/gce/api/config/v1/config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.type import dayofweek as google_dot_type_dot_dayofweek__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from PB.go.chromium.org.luci.common.proto import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/gce/api/config/v1/config.proto\x12\x06\x63onfig\x1a\x1bgoogle/type/dayofweek.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a/go.chromium.org/luci/common/proto/options.proto\".\n\x0eServiceAccount\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\r\n\x05scope\x18\x02 \x03(\t\"6\n\x0c\x41\x63\x63\x65ssConfig\x12&\n\x04type\x18\x01 \x01(\x0e\x32\x18.config.AccessConfigType\"d\n\x10NetworkInterface\x12+\n\raccess_config\x18\x01 \x03(\x0b\x32\x14.config.AccessConfig\x12\x0f\n\x07network\x18\x02 \x01(\t\x12\x12\n\nsubnetwork\x18\x03 \x01(\t\"\x95\x01\n\x04\x44isk\x12\r\n\x05image\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\x12\x0c\n\x04type\x18\x03 \x01(\t\x12(\n\tinterface\x18\x04 \x01(\x0e\x32\x15.config.DiskInterface\x12\x18\n\x10provisioned_iops\x18\x05 \x01(\x03\x12\x1e\n\x16provisioned_throughput\x18\x06 \x01(\x03\"@\n\x08Metadata\x12\x13\n\tfrom_text\x18\x01 \x01(\tH\x00\x12\x13\n\tfrom_file\x18\x02 \x01(\tH\x00\x42\n\n\x08metadata\"[\n\x0cNodeAffinity\x12\x0b\n\x03key\x18\x01 \x01(\t\x12.\n\x08operator\x18\x02 \x01(\x0e\x32\x1c.config.NodeAffinityOperator\x12\x0e\n\x06values\x18\x03 \x03(\t\"9\n\nScheduling\x12+\n\rnode_affinity\x18\x01 \x03(\x0b\x32\x14.config.NodeAffinity\"\xc2\x05\n\x02VM\x12\x1a\n\x04\x64isk\x18\x01 \x03(\x0b\x32\x0c.config.Disk\x12\x14\n\x0cmachine_type\x18\x02 \x01(\t\x12\"\n\x08metadata\x18\x03 \x03(\x0b\x32\x10.config.Metadata\x12\x18\n\x10min_cpu_platform\x18\x04 \x01(\t\x12\x33\n\x11network_interface\x18\x05 \x03(\x0b\x32\x18.config.NetworkInterface\x12\x0f\n\x07project\x18\x06 \x01(\t\x12/\n\x0fservice_account\x18\x07 \x03(\x0b\x32\x16.config.ServiceAccount\x12\x0b\n\x03tag\x18\x08 \x03(\t\x12\x0c\n\x04zone\x18\t \x01(\t\x12&\n\nscheduling\x18\n \x01(\x0b\x32\x12.config.Scheduling\x12$\n\x05label\x18\x0b \x03(\x0b\x32\x15.config.VM.LabelEntry\x12$\n\x1c\x64isable_integrity_monitoring\x18\x0c \x01(\x08\x12\x1a\n\x12\x65nable_secure_boot\x18\r \x01(\x08\x12\x14\n\x0c\x64isable_vtpm\x18\x0e \x01(\x08\x12#\n\x1b\x65nable_confidential_compute\x18\x0f \x01(\x08\x12\x19\n\x11\x66orce_send_fields\x18\x10 \x03(\t\x12\x13\n\x0bnull_fields\x18\x11 \x03(\t\x12\'\n\x0bgcp_channel\x18\x12 \x01(\x0e\x32\x12.config.GCPChannel\x12\x46\n\x1bperformance_monitoring_unit\x18\x13 \x01(\x0e\x32!.config.PerformanceMonitoringUnit\x12 \n\x18terminate_on_maintenance\x18\x14 \x01(\x08\x1a,\n\nLabelEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\";\n\nTimePeriod\x12\x12\n\x08\x64uration\x18\x01 \x01(\tH\x00\x12\x11\n\x07seconds\x18\x02 \x01(\x03H\x00\x42\x06\n\x04time\"P\n\tTimeOfDay\x12#\n\x03\x64\x61y\x18\x01 \x01(\x0e\x32\x16.google.type.DayOfWeek\x12\x10\n\x08location\x18\x02 \x01(\t\x12\x0c\n\x04time\x18\x03 \x01(\t\"p\n\x08Schedule\x12\"\n\x06length\x18\x02 \x01(\x0b\x32\x12.config.TimePeriod\x12 \n\x05start\x18\x03 \x01(\x0b\x32\x11.config.TimeOfDay\x12\x0b\n\x03min\x18\x04 \x01(\x05\x12\x0b\n\x03max\x18\x05 \x01(\x05J\x04\x08\x01\x10\x02\"J\n\x06\x41mount\x12 \n\x06\x63hange\x18\x02 \x03(\x0b\x32\x10.config.Schedule\x12\x0b\n\x03min\x18\x03 \x01(\x05\x12\x0b\n\x03max\x18\x04 \x01(\x05J\x04\x08\x01\x10\x02\"\xf3\x02\n\x06\x43onfig\x12\x1e\n\x06\x61mount\x18\x01 \x01(\x0b\x32\x0e.config.Amount\x12\x1e\n\nattributes\x18\x02 \x01(\x0b\x32\n.config.VM\x12$\n\x08lifetime\x18\x03 \x01(\x0b\x32\x12.config.TimePeriod\x12\x0e\n\x06prefix\x18\x04 \x01(\t\x12\x10\n\x08swarming\x18\x06 \x01(\t\x12#\n\x07timeout\x18\x07 \x01(\x0b\x32\x12.config.TimePeriod\x12\r\n\x05owner\x18\t \x03(\t\x12&\n\x04\x64uts\x18\n \x03(\x0b\x32\x18.config.Config.DutsEntry\x12\x10\n\x08revision\x18\x05 \x01(\t\x12\x16\n\x0e\x63urrent_amount\x18\x08 \x01(\x05\x12\x16\n\x0eswarming_pools\x18\x0b \x03(\t\x1a\x43\n\tDutsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Empty:\x02\x38\x01\"&\n\x07\x43onfigs\x12\x1b\n\x03vms\x18\x01 \x03(\x0b\x32\x0e.config.Config*&\n\x10\x41\x63\x63\x65ssConfigType\x12\x12\n\x0eONE_TO_ONE_NAT\x10\x00*#\n\rDiskInterface\x12\x08\n\x04SCSI\x10\x00\x12\x08\n\x04NVME\x10\x01*D\n\x14NodeAffinityOperator\x12\x18\n\x14OPERATOR_UNSPECIFIED\x10\x00\x12\x06\n\x02IN\x10\x01\x12\n\n\x06NOT_IN\x10\x02*n\n\nGCPChannel\x12\x1b\n\x17GCP_CHANNEL_UNSPECIFIED\x10\x00\x12\x16\n\x12GCP_CHANNEL_STABLE\x10\x01\x12\x14\n\x10GCP_CHANNEL_BETA\x10\x02\x12\x15\n\x11GCP_CHANNEL_ALPHA\x10\x03*w\n\x19PerformanceMonitoringUnit\x12+\n\'PERFORMANCE_MONITORING_UNIT_UNSPECIFIED\x10\x00\x12\x11\n\rARCHITECTURAL\x10\x01\x12\x0c\n\x08\x45NHANCED\x10\x02\x12\x0c\n\x08STANDARD\x10\x03\x42rZ-go.chromium.org/luci/gce/api/config/v1;config\xa2\xfe#?\n=https://config.luci.app/schemas/services/gce-provider:vms.cfgb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.gce.api.config.v1.config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z-go.chromium.org/luci/gce/api/config/v1;config\242\376#?\n=https://config.luci.app/schemas/services/gce-provider:vms.cfg'
+  _globals['_VM_LABELENTRY']._loaded_options = None
+  _globals['_VM_LABELENTRY']._serialized_options = b'8\001'
+  _globals['_CONFIG_DUTSENTRY']._loaded_options = None
+  _globals['_CONFIG_DUTSENTRY']._serialized_options = b'8\001'
+  _globals['_ACCESSCONFIGTYPE']._serialized_start=2202
+  _globals['_ACCESSCONFIGTYPE']._serialized_end=2240
+  _globals['_DISKINTERFACE']._serialized_start=2242
+  _globals['_DISKINTERFACE']._serialized_end=2277
+  _globals['_NODEAFFINITYOPERATOR']._serialized_start=2279
+  _globals['_NODEAFFINITYOPERATOR']._serialized_end=2347
+  _globals['_GCPCHANNEL']._serialized_start=2349
+  _globals['_GCPCHANNEL']._serialized_end=2459
+  _globals['_PERFORMANCEMONITORINGUNIT']._serialized_start=2461
+  _globals['_PERFORMANCEMONITORINGUNIT']._serialized_end=2580
+  _globals['_SERVICEACCOUNT']._serialized_start=170
+  _globals['_SERVICEACCOUNT']._serialized_end=216
+  _globals['_ACCESSCONFIG']._serialized_start=218
+  _globals['_ACCESSCONFIG']._serialized_end=272
+  _globals['_NETWORKINTERFACE']._serialized_start=274
+  _globals['_NETWORKINTERFACE']._serialized_end=374
+  _globals['_DISK']._serialized_start=377
+  _globals['_DISK']._serialized_end=526
+  _globals['_METADATA']._serialized_start=528
+  _globals['_METADATA']._serialized_end=592
+  _globals['_NODEAFFINITY']._serialized_start=594
+  _globals['_NODEAFFINITY']._serialized_end=685
+  _globals['_SCHEDULING']._serialized_start=687
+  _globals['_SCHEDULING']._serialized_end=744
+  _globals['_VM']._serialized_start=747
+  _globals['_VM']._serialized_end=1453
+  _globals['_VM_LABELENTRY']._serialized_start=1409
+  _globals['_VM_LABELENTRY']._serialized_end=1453
+  _globals['_TIMEPERIOD']._serialized_start=1455
+  _globals['_TIMEPERIOD']._serialized_end=1514
+  _globals['_TIMEOFDAY']._serialized_start=1516
+  _globals['_TIMEOFDAY']._serialized_end=1596
+  _globals['_SCHEDULE']._serialized_start=1598
+  _globals['_SCHEDULE']._serialized_end=1710
+  _globals['_AMOUNT']._serialized_start=1712
+  _globals['_AMOUNT']._serialized_end=1786
+  _globals['_CONFIG']._serialized_start=1789
+  _globals['_CONFIG']._serialized_end=2160
+  _globals['_CONFIG_DUTSENTRY']._serialized_start=2093
+  _globals['_CONFIG_DUTSENTRY']._serialized_end=2160
+  _globals['_CONFIGS']._serialized_start=2162
+  _globals['_CONFIGS']._serialized_end=2200
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,248 @@
+from PB.google.type import dayofweek as _dayofweek_pb2
+from google.protobuf import empty_pb2 as _empty_pb2
+from PB.go.chromium.org.luci.common.proto import options as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AccessConfigType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    ONE_TO_ONE_NAT: _ClassVar[AccessConfigType]
+
+class DiskInterface(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SCSI: _ClassVar[DiskInterface]
+    NVME: _ClassVar[DiskInterface]
+
+class NodeAffinityOperator(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    OPERATOR_UNSPECIFIED: _ClassVar[NodeAffinityOperator]
+    IN: _ClassVar[NodeAffinityOperator]
+    NOT_IN: _ClassVar[NodeAffinityOperator]
+
+class GCPChannel(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    GCP_CHANNEL_UNSPECIFIED: _ClassVar[GCPChannel]
+    GCP_CHANNEL_STABLE: _ClassVar[GCPChannel]
+    GCP_CHANNEL_BETA: _ClassVar[GCPChannel]
+    GCP_CHANNEL_ALPHA: _ClassVar[GCPChannel]
+
+class PerformanceMonitoringUnit(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    PERFORMANCE_MONITORING_UNIT_UNSPECIFIED: _ClassVar[PerformanceMonitoringUnit]
+    ARCHITECTURAL: _ClassVar[PerformanceMonitoringUnit]
+    ENHANCED: _ClassVar[PerformanceMonitoringUnit]
+    STANDARD: _ClassVar[PerformanceMonitoringUnit]
+ONE_TO_ONE_NAT: AccessConfigType
+SCSI: DiskInterface
+NVME: DiskInterface
+OPERATOR_UNSPECIFIED: NodeAffinityOperator
+IN: NodeAffinityOperator
+NOT_IN: NodeAffinityOperator
+GCP_CHANNEL_UNSPECIFIED: GCPChannel
+GCP_CHANNEL_STABLE: GCPChannel
+GCP_CHANNEL_BETA: GCPChannel
+GCP_CHANNEL_ALPHA: GCPChannel
+PERFORMANCE_MONITORING_UNIT_UNSPECIFIED: PerformanceMonitoringUnit
+ARCHITECTURAL: PerformanceMonitoringUnit
+ENHANCED: PerformanceMonitoringUnit
+STANDARD: PerformanceMonitoringUnit
+
+class ServiceAccount(_message.Message):
+    __slots__ = ("email", "scope")
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    SCOPE_FIELD_NUMBER: _ClassVar[int]
+    email: str
+    scope: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, email: _Optional[str] = ..., scope: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class AccessConfig(_message.Message):
+    __slots__ = ("type",)
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    type: AccessConfigType
+    def __init__(self, type: _Optional[_Union[AccessConfigType, str]] = ...) -> None: ...
+
+class NetworkInterface(_message.Message):
+    __slots__ = ("access_config", "network", "subnetwork")
+    ACCESS_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    NETWORK_FIELD_NUMBER: _ClassVar[int]
+    SUBNETWORK_FIELD_NUMBER: _ClassVar[int]
+    access_config: _containers.RepeatedCompositeFieldContainer[AccessConfig]
+    network: str
+    subnetwork: str
+    def __init__(self, access_config: _Optional[_Iterable[_Union[AccessConfig, _Mapping]]] = ..., network: _Optional[str] = ..., subnetwork: _Optional[str] = ...) -> None: ...
+
+class Disk(_message.Message):
+    __slots__ = ("image", "size", "type", "interface", "provisioned_iops", "provisioned_throughput")
+    IMAGE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    INTERFACE_FIELD_NUMBER: _ClassVar[int]
+    PROVISIONED_IOPS_FIELD_NUMBER: _ClassVar[int]
+    PROVISIONED_THROUGHPUT_FIELD_NUMBER: _ClassVar[int]
+    image: str
+    size: int
+    type: str
+    interface: DiskInterface
+    provisioned_iops: int
+    provisioned_throughput: int
+    def __init__(self, image: _Optional[str] = ..., size: _Optional[int] = ..., type: _Optional[str] = ..., interface: _Optional[_Union[DiskInterface, str]] = ..., provisioned_iops: _Optional[int] = ..., provisioned_throughput: _Optional[int] = ...) -> None: ...
+
+class Metadata(_message.Message):
+    __slots__ = ("from_text", "from_file")
+    FROM_TEXT_FIELD_NUMBER: _ClassVar[int]
+    FROM_FILE_FIELD_NUMBER: _ClassVar[int]
+    from_text: str
+    from_file: str
+    def __init__(self, from_text: _Optional[str] = ..., from_file: _Optional[str] = ...) -> None: ...
+
+class NodeAffinity(_message.Message):
+    __slots__ = ("key", "operator", "values")
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    OPERATOR_FIELD_NUMBER: _ClassVar[int]
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    key: str
+    operator: NodeAffinityOperator
+    values: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, key: _Optional[str] = ..., operator: _Optional[_Union[NodeAffinityOperator, str]] = ..., values: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class Scheduling(_message.Message):
+    __slots__ = ("node_affinity",)
+    NODE_AFFINITY_FIELD_NUMBER: _ClassVar[int]
+    node_affinity: _containers.RepeatedCompositeFieldContainer[NodeAffinity]
+    def __init__(self, node_affinity: _Optional[_Iterable[_Union[NodeAffinity, _Mapping]]] = ...) -> None: ...
+
+class VM(_message.Message):
+    __slots__ = ("disk", "machine_type", "metadata", "min_cpu_platform", "network_interface", "project", "service_account", "tag", "zone", "scheduling", "label", "disable_integrity_monitoring", "enable_secure_boot", "disable_vtpm", "enable_confidential_compute", "force_send_fields", "null_fields", "gcp_channel", "performance_monitoring_unit", "terminate_on_maintenance")
+    class LabelEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    DISK_FIELD_NUMBER: _ClassVar[int]
+    MACHINE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    MIN_CPU_PLATFORM_FIELD_NUMBER: _ClassVar[int]
+    NETWORK_INTERFACE_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_ACCOUNT_FIELD_NUMBER: _ClassVar[int]
+    TAG_FIELD_NUMBER: _ClassVar[int]
+    ZONE_FIELD_NUMBER: _ClassVar[int]
+    SCHEDULING_FIELD_NUMBER: _ClassVar[int]
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    DISABLE_INTEGRITY_MONITORING_FIELD_NUMBER: _ClassVar[int]
+    ENABLE_SECURE_BOOT_FIELD_NUMBER: _ClassVar[int]
+    DISABLE_VTPM_FIELD_NUMBER: _ClassVar[int]
+    ENABLE_CONFIDENTIAL_COMPUTE_FIELD_NUMBER: _ClassVar[int]
+    FORCE_SEND_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    NULL_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    GCP_CHANNEL_FIELD_NUMBER: _ClassVar[int]
+    PERFORMANCE_MONITORING_UNIT_FIELD_NUMBER: _ClassVar[int]
+    TERMINATE_ON_MAINTENANCE_FIELD_NUMBER: _ClassVar[int]
+    disk: _containers.RepeatedCompositeFieldContainer[Disk]
+    machine_type: str
+    metadata: _containers.RepeatedCompositeFieldContainer[Metadata]
+    min_cpu_platform: str
+    network_interface: _containers.RepeatedCompositeFieldContainer[NetworkInterface]
+    project: str
+    service_account: _containers.RepeatedCompositeFieldContainer[ServiceAccount]
+    tag: _containers.RepeatedScalarFieldContainer[str]
+    zone: str
+    scheduling: Scheduling
+    label: _containers.ScalarMap[str, str]
+    disable_integrity_monitoring: bool
+    enable_secure_boot: bool
+    disable_vtpm: bool
+    enable_confidential_compute: bool
+    force_send_fields: _containers.RepeatedScalarFieldContainer[str]
+    null_fields: _containers.RepeatedScalarFieldContainer[str]
+    gcp_channel: GCPChannel
+    performance_monitoring_unit: PerformanceMonitoringUnit
+    terminate_on_maintenance: bool
+    def __init__(self, disk: _Optional[_Iterable[_Union[Disk, _Mapping]]] = ..., machine_type: _Optional[str] = ..., metadata: _Optional[_Iterable[_Union[Metadata, _Mapping]]] = ..., min_cpu_platform: _Optional[str] = ..., network_interface: _Optional[_Iterable[_Union[NetworkInterface, _Mapping]]] = ..., project: _Optional[str] = ..., service_account: _Optional[_Iterable[_Union[ServiceAccount, _Mapping]]] = ..., tag: _Optional[_Iterable[str]] = ..., zone: _Optional[str] = ..., scheduling: _Optional[_Union[Scheduling, _Mapping]] = ..., label: _Optional[_Mapping[str, str]] = ..., disable_integrity_monitoring: bool = ..., enable_secure_boot: bool = ..., disable_vtpm: bool = ..., enable_confidential_compute: bool = ..., force_send_fields: _Optional[_Iterable[str]] = ..., null_fields: _Optional[_Iterable[str]] = ..., gcp_channel: _Optional[_Union[GCPChannel, str]] = ..., performance_monitoring_unit: _Optional[_Union[PerformanceMonitoringUnit, str]] = ..., terminate_on_maintenance: bool = ...) -> None: ...
+
+class TimePeriod(_message.Message):
+    __slots__ = ("duration", "seconds")
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    SECONDS_FIELD_NUMBER: _ClassVar[int]
+    duration: str
+    seconds: int
+    def __init__(self, duration: _Optional[str] = ..., seconds: _Optional[int] = ...) -> None: ...
+
+class TimeOfDay(_message.Message):
+    __slots__ = ("day", "location", "time")
+    DAY_FIELD_NUMBER: _ClassVar[int]
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    TIME_FIELD_NUMBER: _ClassVar[int]
+    day: _dayofweek_pb2.DayOfWeek
+    location: str
+    time: str
+    def __init__(self, day: _Optional[_Union[_dayofweek_pb2.DayOfWeek, str]] = ..., location: _Optional[str] = ..., time: _Optional[str] = ...) -> None: ...
+
+class Schedule(_message.Message):
+    __slots__ = ("length", "start", "min", "max")
+    LENGTH_FIELD_NUMBER: _ClassVar[int]
+    START_FIELD_NUMBER: _ClassVar[int]
+    MIN_FIELD_NUMBER: _ClassVar[int]
+    MAX_FIELD_NUMBER: _ClassVar[int]
+    length: TimePeriod
+    start: TimeOfDay
+    min: int
+    max: int
+    def __init__(self, length: _Optional[_Union[TimePeriod, _Mapping]] = ..., start: _Optional[_Union[TimeOfDay, _Mapping]] = ..., min: _Optional[int] = ..., max: _Optional[int] = ...) -> None: ...
+
+class Amount(_message.Message):
+    __slots__ = ("change", "min", "max")
+    CHANGE_FIELD_NUMBER: _ClassVar[int]
+    MIN_FIELD_NUMBER: _ClassVar[int]
+    MAX_FIELD_NUMBER: _ClassVar[int]
+    change: _containers.RepeatedCompositeFieldContainer[Schedule]
+    min: int
+    max: int
+    def __init__(self, change: _Optional[_Iterable[_Union[Schedule, _Mapping]]] = ..., min: _Optional[int] = ..., max: _Optional[int] = ...) -> None: ...
+
+class Config(_message.Message):
+    __slots__ = ("amount", "attributes", "lifetime", "prefix", "swarming", "timeout", "owner", "duts", "revision", "current_amount", "swarming_pools")
+    class DutsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: _empty_pb2.Empty
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[_empty_pb2.Empty, _Mapping]] = ...) -> None: ...
+    AMOUNT_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTES_FIELD_NUMBER: _ClassVar[int]
+    LIFETIME_FIELD_NUMBER: _ClassVar[int]
+    PREFIX_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_FIELD_NUMBER: _ClassVar[int]
+    OWNER_FIELD_NUMBER: _ClassVar[int]
+    DUTS_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    CURRENT_AMOUNT_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_POOLS_FIELD_NUMBER: _ClassVar[int]
+    amount: Amount
+    attributes: VM
+    lifetime: TimePeriod
+    prefix: str
+    swarming: str
+    timeout: TimePeriod
+    owner: _containers.RepeatedScalarFieldContainer[str]
+    duts: _containers.MessageMap[str, _empty_pb2.Empty]
+    revision: str
+    current_amount: int
+    swarming_pools: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, amount: _Optional[_Union[Amount, _Mapping]] = ..., attributes: _Optional[_Union[VM, _Mapping]] = ..., lifetime: _Optional[_Union[TimePeriod, _Mapping]] = ..., prefix: _Optional[str] = ..., swarming: _Optional[str] = ..., timeout: _Optional[_Union[TimePeriod, _Mapping]] = ..., owner: _Optional[_Iterable[str]] = ..., duts: _Optional[_Mapping[str, _empty_pb2.Empty]] = ..., revision: _Optional[str] = ..., current_amount: _Optional[int] = ..., swarming_pools: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class Configs(_message.Message):
+    __slots__ = ("vms",)
+    VMS_FIELD_NUMBER: _ClassVar[int]
+    vms: _containers.RepeatedCompositeFieldContainer[Config]
+    def __init__(self, vms: _Optional[_Iterable[_Union[Config, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/gce/api/config/v1/service.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/gce/api/config/v1/service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+from PB.go.chromium.org.luci.gce.api.config.v1 import config as go_dot_chromium_dot_org_dot_luci_dot_gce_dot_api_dot_config_dot_v1_dot_config__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n4go.chromium.org/luci/gce/api/config/v1/service.proto\x12\x06\x63onfig\x1a\x1bgoogle/protobuf/empty.proto\x1a google/protobuf/field_mask.proto\x1a\x33go.chromium.org/luci/gce/api/config/v1/config.proto\"\x1b\n\rDeleteRequest\x12\n\n\x02id\x18\x01 \x01(\t\";\n\rEnsureRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1e\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x0e.config.Config\"\x18\n\nGetRequest\x12\n\n\x02id\x18\x01 \x01(\t\"4\n\x0bListRequest\x12\x12\n\npage_token\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\"H\n\x0cListResponse\x12\x1f\n\x07\x63onfigs\x18\x01 \x03(\x0b\x32\x0e.config.Config\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"l\n\rUpdateRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1e\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x0e.config.Config\x12/\n\x0bupdate_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask2\x88\x02\n\rConfiguration\x12\x37\n\x06\x44\x65lete\x12\x15.config.DeleteRequest\x1a\x16.google.protobuf.Empty\x12/\n\x06\x45nsure\x12\x15.config.EnsureRequest\x1a\x0e.config.Config\x12)\n\x03Get\x12\x12.config.GetRequest\x1a\x0e.config.Config\x12\x31\n\x04List\x12\x13.config.ListRequest\x1a\x14.config.ListResponse\x12/\n\x06Update\x12\x15.config.UpdateRequest\x1a\x0e.config.ConfigB/Z-go.chromium.org/luci/gce/api/config/v1;configb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.gce.api.config.v1.service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z-go.chromium.org/luci/gce/api/config/v1;config'
+  _globals['_DELETEREQUEST']._serialized_start=180
+  _globals['_DELETEREQUEST']._serialized_end=207
+  _globals['_ENSUREREQUEST']._serialized_start=209
+  _globals['_ENSUREREQUEST']._serialized_end=268
+  _globals['_GETREQUEST']._serialized_start=270
+  _globals['_GETREQUEST']._serialized_end=294
+  _globals['_LISTREQUEST']._serialized_start=296
+  _globals['_LISTREQUEST']._serialized_end=348
+  _globals['_LISTRESPONSE']._serialized_start=350
+  _globals['_LISTRESPONSE']._serialized_end=422
+  _globals['_UPDATEREQUEST']._serialized_start=424
+  _globals['_UPDATEREQUEST']._serialized_end=532
+  _globals['_CONFIGURATION']._serialized_start=535
+  _globals['_CONFIGURATION']._serialized_end=799
+# @@protoc_insertion_point(module_scope)
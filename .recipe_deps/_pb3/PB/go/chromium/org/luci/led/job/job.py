@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/led/job/job.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/led/job/job.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import launcher as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_launcher__pb2
+from PB.go.chromium.org.luci.swarming.proto.api_v2 import swarming as go_dot_chromium_dot_org_dot_luci_dot_swarming_dot_proto_dot_api__v2_dot_swarming__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n&go.chromium.org/luci/led/job/job.proto\x12\x03job\x1a\x1egoogle/protobuf/duration.proto\x1a\x35go.chromium.org/luci/buildbucket/proto/launcher.proto\x1a\x39go.chromium.org/luci/swarming/proto/api_v2/swarming.proto\"\xa3\x03\n\x0b\x42uildbucket\x12\x31\n\x0c\x62\x62\x61gent_args\x18\x01 \x01(\x0b\x32\x1b.buildbucket.v2.BBAgentArgs\x12/\n\rcipd_packages\x18\x02 \x03(\x0b\x32\x18.swarming.v2.CipdPackage\x12)\n\x08\x65nv_vars\x18\x03 \x03(\x0b\x32\x17.swarming.v2.StringPair\x12\x31\n\x0c\x65nv_prefixes\x18\x04 \x03(\x0b\x32\x1b.swarming.v2.StringListPair\x12\x12\n\nextra_tags\x18\x05 \x03(\t\x12\x35\n\x12\x62ot_ping_tolerance\x18\x07 \x01(\x0b\x32\x19.google.protobuf.Duration\x12-\n\x0b\x63ontainment\x18\x08 \x01(\x0b\x32\x18.swarming.v2.Containment\x12\x16\n\x0elegacy_kitchen\x18\t \x01(\x08\x12\x0c\n\x04name\x18\n \x01(\t\x12\x1e\n\x16\x66inal_build_proto_path\x18\x0b \x01(\t\x12\x12\n\nreal_build\x18\x0c \x01(\x08\"|\n\x08Swarming\x12)\n\x04task\x18\x01 \x01(\x0b\x32\x1b.swarming.v2.NewTaskRequest\x12\x10\n\x08hostname\x18\x02 \x01(\t\x12\x33\n\x10\x63\x61s_user_payload\x18\x03 \x01(\x0b\x32\x19.swarming.v2.CASReference\"d\n\nDefinition\x12\'\n\x0b\x62uildbucket\x18\x01 \x01(\x0b\x32\x10.job.BuildbucketH\x00\x12!\n\x08swarming\x18\x02 \x01(\x0b\x32\r.job.SwarmingH\x00\x42\n\n\x08job_typeB\"Z go.chromium.org/luci/led/job;jobb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.led.job.job_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z go.chromium.org/luci/led/job;job'
+  _globals['_BUILDBUCKET']._serialized_start=194
+  _globals['_BUILDBUCKET']._serialized_end=613
+  _globals['_SWARMING']._serialized_start=615
+  _globals['_SWARMING']._serialized_end=739
+  _globals['_DEFINITION']._serialized_start=741
+  _globals['_DEFINITION']._serialized_end=841
+# @@protoc_insertion_point(module_scope)
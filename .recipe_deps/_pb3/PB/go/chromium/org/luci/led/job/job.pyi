@@ -0,0 +1,56 @@
+import datetime
+
+from google.protobuf import duration_pb2 as _duration_pb2
+from PB.go.chromium.org.luci.buildbucket.proto import launcher as _launcher_pb2
+from PB.go.chromium.org.luci.swarming.proto.api_v2 import swarming as _swarming_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Buildbucket(_message.Message):
+    __slots__ = ("bbagent_args", "cipd_packages", "env_vars", "env_prefixes", "extra_tags", "bot_ping_tolerance", "containment", "legacy_kitchen", "name", "final_build_proto_path", "real_build")
+    BBAGENT_ARGS_FIELD_NUMBER: _ClassVar[int]
+    CIPD_PACKAGES_FIELD_NUMBER: _ClassVar[int]
+    ENV_VARS_FIELD_NUMBER: _ClassVar[int]
+    ENV_PREFIXES_FIELD_NUMBER: _ClassVar[int]
+    EXTRA_TAGS_FIELD_NUMBER: _ClassVar[int]
+    BOT_PING_TOLERANCE_FIELD_NUMBER: _ClassVar[int]
+    CONTAINMENT_FIELD_NUMBER: _ClassVar[int]
+    LEGACY_KITCHEN_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    FINAL_BUILD_PROTO_PATH_FIELD_NUMBER: _ClassVar[int]
+    REAL_BUILD_FIELD_NUMBER: _ClassVar[int]
+    bbagent_args: _launcher_pb2.BBAgentArgs
+    cipd_packages: _containers.RepeatedCompositeFieldContainer[_swarming_pb2.CipdPackage]
+    env_vars: _containers.RepeatedCompositeFieldContainer[_swarming_pb2.StringPair]
+    env_prefixes: _containers.RepeatedCompositeFieldContainer[_swarming_pb2.StringListPair]
+    extra_tags: _containers.RepeatedScalarFieldContainer[str]
+    bot_ping_tolerance: _duration_pb2.Duration
+    containment: _swarming_pb2.Containment
+    legacy_kitchen: bool
+    name: str
+    final_build_proto_path: str
+    real_build: bool
+    def __init__(self, bbagent_args: _Optional[_Union[_launcher_pb2.BBAgentArgs, _Mapping]] = ..., cipd_packages: _Optional[_Iterable[_Union[_swarming_pb2.CipdPackage, _Mapping]]] = ..., env_vars: _Optional[_Iterable[_Union[_swarming_pb2.StringPair, _Mapping]]] = ..., env_prefixes: _Optional[_Iterable[_Union[_swarming_pb2.StringListPair, _Mapping]]] = ..., extra_tags: _Optional[_Iterable[str]] = ..., bot_ping_tolerance: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., containment: _Optional[_Union[_swarming_pb2.Containment, _Mapping]] = ..., legacy_kitchen: bool = ..., name: _Optional[str] = ..., final_build_proto_path: _Optional[str] = ..., real_build: bool = ...) -> None: ...
+
+class Swarming(_message.Message):
+    __slots__ = ("task", "hostname", "cas_user_payload")
+    TASK_FIELD_NUMBER: _ClassVar[int]
+    HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    CAS_USER_PAYLOAD_FIELD_NUMBER: _ClassVar[int]
+    task: _swarming_pb2.NewTaskRequest
+    hostname: str
+    cas_user_payload: _swarming_pb2.CASReference
+    def __init__(self, task: _Optional[_Union[_swarming_pb2.NewTaskRequest, _Mapping]] = ..., hostname: _Optional[str] = ..., cas_user_payload: _Optional[_Union[_swarming_pb2.CASReference, _Mapping]] = ...) -> None: ...
+
+class Definition(_message.Message):
+    __slots__ = ("buildbucket", "swarming")
+    BUILDBUCKET_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_FIELD_NUMBER: _ClassVar[int]
+    buildbucket: Buildbucket
+    swarming: Swarming
+    def __init__(self, buildbucket: _Optional[_Union[Buildbucket, _Mapping]] = ..., swarming: _Optional[_Union[Swarming, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/lucictx/sections.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/lucictx/sections.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+go.chromium.org/luci/lucictx/sections.proto\x12\x07lucictx\"\xa6\x01\n\tLocalAuth\x12\x1a\n\x08rpc_port\x18\x01 \x01(\rR\x08rpc_port\x12\x16\n\x06secret\x18\x02 \x01(\x0cR\x06secret\x12\x35\n\x08\x61\x63\x63ounts\x18\x03 \x03(\x0b\x32\x19.lucictx.LocalAuthAccountR\x08\x61\x63\x63ounts\x12.\n\x12\x64\x65\x66\x61ult_account_id\x18\x04 \x01(\tR\x12\x64\x65\x66\x61ult_account_id\"8\n\x10LocalAuthAccount\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x14\n\x05\x65mail\x18\x02 \x01(\tR\x05\x65mail\"Q\n\x08Swarming\x12\"\n\x0csecret_bytes\x18\x01 \x01(\x0cR\x0csecret_bytes\x12!\n\x04task\x18\x02 \x01(\x0b\x32\r.lucictx.TaskR\x04task\"`\n\x04Task\x12\x16\n\x06server\x18\x01 \x01(\tR\x06server\x12\x18\n\x07task_id\x18\x02 \x01(\tR\x07task_id\x12&\n\x0e\x62ot_dimensions\x18\x03 \x03(\tR\x0e\x62ot_dimensions\"\'\n\x07LUCIExe\x12\x1c\n\tcache_dir\x18\x01 \x01(\tR\tcache_dir\"\x1b\n\x05Realm\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\"s\n\x08ResultDB\x12\x1a\n\x08hostname\x18\x01 \x01(\tR\x08hostname\x12K\n\x12\x63urrent_invocation\x18\x02 \x01(\x0b\x32\x1b.lucictx.ResultDBInvocationR\x12\x63urrent_invocation\"L\n\x12ResultDBInvocation\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\"\n\x0cupdate_token\x18\x02 \x01(\tR\x0cupdate_token\"F\n\nResultSink\x12\x18\n\x07\x61\x64\x64ress\x18\x01 \x01(\tR\x07\x61\x64\x64ress\x12\x1e\n\nauth_token\x18\x02 \x01(\tR\nauth_token\"T\n\x08\x44\x65\x61\x64line\x12$\n\rsoft_deadline\x18\x01 \x01(\x01R\rsoft_deadline\x12\"\n\x0cgrace_period\x18\x02 \x01(\x01R\x0cgrace_period\"]\n\x0b\x42uildbucket\x12\x1a\n\x08hostname\x18\x01 \x01(\tR\x08hostname\x12\x32\n\x14schedule_build_token\x18\x02 \x01(\tR\x14schedule_build_token\"\x1f\n\x07TurboCI\x12\x14\n\x05token\x18\x01 \x01(\tR\x05tokenB&Z$go.chromium.org/luci/lucictx;lucictxb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.lucictx.sections_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z$go.chromium.org/luci/lucictx;lucictx'
+  _globals['_LOCALAUTH']._serialized_start=57
+  _globals['_LOCALAUTH']._serialized_end=223
+  _globals['_LOCALAUTHACCOUNT']._serialized_start=225
+  _globals['_LOCALAUTHACCOUNT']._serialized_end=281
+  _globals['_SWARMING']._serialized_start=283
+  _globals['_SWARMING']._serialized_end=364
+  _globals['_TASK']._serialized_start=366
+  _globals['_TASK']._serialized_end=462
+  _globals['_LUCIEXE']._serialized_start=464
+  _globals['_LUCIEXE']._serialized_end=503
+  _globals['_REALM']._serialized_start=505
+  _globals['_REALM']._serialized_end=532
+  _globals['_RESULTDB']._serialized_start=534
+  _globals['_RESULTDB']._serialized_end=649
+  _globals['_RESULTDBINVOCATION']._serialized_start=651
+  _globals['_RESULTDBINVOCATION']._serialized_end=727
+  _globals['_RESULTSINK']._serialized_start=729
+  _globals['_RESULTSINK']._serialized_end=799
+  _globals['_DEADLINE']._serialized_start=801
+  _globals['_DEADLINE']._serialized_end=885
+  _globals['_BUILDBUCKET']._serialized_start=887
+  _globals['_BUILDBUCKET']._serialized_end=980
+  _globals['_TURBOCI']._serialized_start=982
+  _globals['_TURBOCI']._serialized_end=1013
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,103 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class LocalAuth(_message.Message):
+    __slots__ = ("rpc_port", "secret", "accounts", "default_account_id")
+    RPC_PORT_FIELD_NUMBER: _ClassVar[int]
+    SECRET_FIELD_NUMBER: _ClassVar[int]
+    ACCOUNTS_FIELD_NUMBER: _ClassVar[int]
+    DEFAULT_ACCOUNT_ID_FIELD_NUMBER: _ClassVar[int]
+    rpc_port: int
+    secret: bytes
+    accounts: _containers.RepeatedCompositeFieldContainer[LocalAuthAccount]
+    default_account_id: str
+    def __init__(self, rpc_port: _Optional[int] = ..., secret: _Optional[bytes] = ..., accounts: _Optional[_Iterable[_Union[LocalAuthAccount, _Mapping]]] = ..., default_account_id: _Optional[str] = ...) -> None: ...
+
+class LocalAuthAccount(_message.Message):
+    __slots__ = ("id", "email")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    email: str
+    def __init__(self, id: _Optional[str] = ..., email: _Optional[str] = ...) -> None: ...
+
+class Swarming(_message.Message):
+    __slots__ = ("secret_bytes", "task")
+    SECRET_BYTES_FIELD_NUMBER: _ClassVar[int]
+    TASK_FIELD_NUMBER: _ClassVar[int]
+    secret_bytes: bytes
+    task: Task
+    def __init__(self, secret_bytes: _Optional[bytes] = ..., task: _Optional[_Union[Task, _Mapping]] = ...) -> None: ...
+
+class Task(_message.Message):
+    __slots__ = ("server", "task_id", "bot_dimensions")
+    SERVER_FIELD_NUMBER: _ClassVar[int]
+    TASK_ID_FIELD_NUMBER: _ClassVar[int]
+    BOT_DIMENSIONS_FIELD_NUMBER: _ClassVar[int]
+    server: str
+    task_id: str
+    bot_dimensions: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, server: _Optional[str] = ..., task_id: _Optional[str] = ..., bot_dimensions: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class LUCIExe(_message.Message):
+    __slots__ = ("cache_dir",)
+    CACHE_DIR_FIELD_NUMBER: _ClassVar[int]
+    cache_dir: str
+    def __init__(self, cache_dir: _Optional[str] = ...) -> None: ...
+
+class Realm(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class ResultDB(_message.Message):
+    __slots__ = ("hostname", "current_invocation")
+    HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    CURRENT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    hostname: str
+    current_invocation: ResultDBInvocation
+    def __init__(self, hostname: _Optional[str] = ..., current_invocation: _Optional[_Union[ResultDBInvocation, _Mapping]] = ...) -> None: ...
+
+class ResultDBInvocation(_message.Message):
+    __slots__ = ("name", "update_token")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    update_token: str
+    def __init__(self, name: _Optional[str] = ..., update_token: _Optional[str] = ...) -> None: ...
+
+class ResultSink(_message.Message):
+    __slots__ = ("address", "auth_token")
+    ADDRESS_FIELD_NUMBER: _ClassVar[int]
+    AUTH_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    address: str
+    auth_token: str
+    def __init__(self, address: _Optional[str] = ..., auth_token: _Optional[str] = ...) -> None: ...
+
+class Deadline(_message.Message):
+    __slots__ = ("soft_deadline", "grace_period")
+    SOFT_DEADLINE_FIELD_NUMBER: _ClassVar[int]
+    GRACE_PERIOD_FIELD_NUMBER: _ClassVar[int]
+    soft_deadline: float
+    grace_period: float
+    def __init__(self, soft_deadline: _Optional[float] = ..., grace_period: _Optional[float] = ...) -> None: ...
+
+class Buildbucket(_message.Message):
+    __slots__ = ("hostname", "schedule_build_token")
+    HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    SCHEDULE_BUILD_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    hostname: str
+    schedule_build_token: str
+    def __init__(self, hostname: _Optional[str] = ..., schedule_build_token: _Optional[str] = ...) -> None: ...
+
+class TurboCI(_message.Message):
+    __slots__ = ("token",)
+    TOKEN_FIELD_NUMBER: _ClassVar[int]
+    token: str
+    def __init__(self, token: _Optional[str] = ...) -> None: ...
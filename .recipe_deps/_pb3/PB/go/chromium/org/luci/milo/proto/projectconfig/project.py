@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/milo/proto/projectconfig/project.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/milo/proto/projectconfig/project.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_builder__common__pb2
+from PB.go.chromium.org.luci.common.proto import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;go.chromium.org/luci/milo/proto/projectconfig/project.proto\x12\x17luci.milo.projectconfig\x1a;go.chromium.org/luci/buildbucket/proto/builder_common.proto\x1a/go.chromium.org/luci/common/proto/options.proto\"\x8c\x02\n\x07Project\x12\x32\n\x08\x63onsoles\x18\x02 \x03(\x0b\x32 .luci.milo.projectconfig.Console\x12\x30\n\x07headers\x18\x03 \x03(\x0b\x32\x1f.luci.milo.projectconfig.Header\x12\x10\n\x08logo_url\x18\x04 \x01(\t\x12\x1b\n\x13ignored_builder_ids\x18\x07 \x03(\t\x12\x18\n\x10\x62ug_url_template\x18\x08 \x01(\t\x12@\n\x0fmetadata_config\x18\t \x01(\x0b\x32\'.luci.milo.projectconfig.MetadataConfigJ\x04\x08\x01\x10\x02J\x04\x08\x05\x10\x06J\x04\x08\x06\x10\x07\".\n\x04Link\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x0b\n\x03\x61lt\x18\x03 \x01(\t\"J\n\x06Oncall\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12%\n\x1dshow_primary_secondary_labels\x18\x03 \x01(\x08\"G\n\tLinkGroup\x12\x0c\n\x04name\x18\x01 \x01(\t\x12,\n\x05links\x18\x02 \x03(\x0b\x32\x1d.luci.milo.projectconfig.Link\"X\n\x13\x43onsoleSummaryGroup\x12,\n\x05title\x18\x01 \x01(\x0b\x32\x1d.luci.milo.projectconfig.Link\x12\x13\n\x0b\x63onsole_ids\x18\x02 \x03(\t\"\xec\x01\n\x06Header\x12\x30\n\x07oncalls\x18\x01 \x03(\x0b\x32\x1f.luci.milo.projectconfig.Oncall\x12\x31\n\x05links\x18\x02 \x03(\x0b\x32\".luci.milo.projectconfig.LinkGroup\x12\x44\n\x0e\x63onsole_groups\x18\x03 \x03(\x0b\x32,.luci.milo.projectconfig.ConsoleSummaryGroup\x12\x18\n\x10tree_status_host\x18\x04 \x01(\t\x12\x11\n\ttree_name\x18\x06 \x01(\t\x12\n\n\x02id\x18\x05 \x01(\t\"\xc1\x03\n\x07\x43onsole\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08repo_url\x18\x03 \x01(\t\x12\x0c\n\x04refs\x18\x0e \x03(\t\x12\x13\n\x0b\x65xclude_ref\x18\r \x01(\t\x12\x15\n\rmanifest_name\x18\x05 \x01(\t\x12\x32\n\x08\x62uilders\x18\x06 \x03(\x0b\x32 .luci.milo.projectconfig.Builder\x12\x13\n\x0b\x66\x61vicon_url\x18\x07 \x01(\t\x12/\n\x06header\x18\t \x01(\x0b\x32\x1f.luci.milo.projectconfig.Header\x12\x11\n\theader_id\x18\n \x01(\t\x12#\n\x1binclude_experimental_builds\x18\x0b \x01(\x08\x12\x19\n\x11\x62uilder_view_only\x18\x0c \x01(\x08\x12\x1c\n\x14\x64\x65\x66\x61ult_commit_limit\x18\x0f \x01(\x05\x12\x16\n\x0e\x64\x65\x66\x61ult_expand\x18\x10 \x01(\x08\x12\x18\n\x10\x65xternal_project\x18\x11 \x01(\t\x12\x13\n\x0b\x65xternal_id\x18\x12 \x01(\t\x12\r\n\x05realm\x18\x13 \x01(\tJ\x04\x08\x08\x10\tJ\x04\x08\x04\x10\x05R\x03ref\"d\n\x07\x42uilder\x12\x0c\n\x04name\x18\x01 \x01(\t\x12%\n\x02id\x18\x04 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x12\n\nshort_name\x18\x03 \x01(\t\"X\n\x0eMetadataConfig\x12\x46\n\x18test_metadata_properties\x18\x01 \x03(\x0b\x32$.luci.milo.projectconfig.DisplayRule\"Z\n\x0b\x44isplayRule\x12\x0e\n\x06schema\x18\x01 \x01(\t\x12;\n\rdisplay_items\x18\x02 \x03(\x0b\x32$.luci.milo.projectconfig.DisplayItem\"1\n\x0b\x44isplayItem\x12\x14\n\x0c\x64isplay_name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\tB{Z=go.chromium.org/luci/milo/proto/projectconfig;projectconfigpb\xa2\xfe#8\n6https://config.luci.app/schemas/projects:luci-milo.cfgb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.milo.proto.projectconfig.project_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z=go.chromium.org/luci/milo/proto/projectconfig;projectconfigpb\242\376#8\n6https://config.luci.app/schemas/projects:luci-milo.cfg'
+  _globals['_PROJECT']._serialized_start=199
+  _globals['_PROJECT']._serialized_end=467
+  _globals['_LINK']._serialized_start=469
+  _globals['_LINK']._serialized_end=515
+  _globals['_ONCALL']._serialized_start=517
+  _globals['_ONCALL']._serialized_end=591
+  _globals['_LINKGROUP']._serialized_start=593
+  _globals['_LINKGROUP']._serialized_end=664
+  _globals['_CONSOLESUMMARYGROUP']._serialized_start=666
+  _globals['_CONSOLESUMMARYGROUP']._serialized_end=754
+  _globals['_HEADER']._serialized_start=757
+  _globals['_HEADER']._serialized_end=993
+  _globals['_CONSOLE']._serialized_start=996
+  _globals['_CONSOLE']._serialized_end=1445
+  _globals['_BUILDER']._serialized_start=1447
+  _globals['_BUILDER']._serialized_end=1547
+  _globals['_METADATACONFIG']._serialized_start=1549
+  _globals['_METADATACONFIG']._serialized_end=1637
+  _globals['_DISPLAYRULE']._serialized_start=1639
+  _globals['_DISPLAYRULE']._serialized_end=1729
+  _globals['_DISPLAYITEM']._serialized_start=1731
+  _globals['_DISPLAYITEM']._serialized_end=1780
+# @@protoc_insertion_point(module_scope)
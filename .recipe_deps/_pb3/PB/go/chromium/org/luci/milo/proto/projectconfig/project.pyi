@@ -0,0 +1,149 @@
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as _builder_common_pb2
+from PB.go.chromium.org.luci.common.proto import options as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Project(_message.Message):
+    __slots__ = ("consoles", "headers", "logo_url", "ignored_builder_ids", "bug_url_template", "metadata_config")
+    CONSOLES_FIELD_NUMBER: _ClassVar[int]
+    HEADERS_FIELD_NUMBER: _ClassVar[int]
+    LOGO_URL_FIELD_NUMBER: _ClassVar[int]
+    IGNORED_BUILDER_IDS_FIELD_NUMBER: _ClassVar[int]
+    BUG_URL_TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+    METADATA_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    consoles: _containers.RepeatedCompositeFieldContainer[Console]
+    headers: _containers.RepeatedCompositeFieldContainer[Header]
+    logo_url: str
+    ignored_builder_ids: _containers.RepeatedScalarFieldContainer[str]
+    bug_url_template: str
+    metadata_config: MetadataConfig
+    def __init__(self, consoles: _Optional[_Iterable[_Union[Console, _Mapping]]] = ..., headers: _Optional[_Iterable[_Union[Header, _Mapping]]] = ..., logo_url: _Optional[str] = ..., ignored_builder_ids: _Optional[_Iterable[str]] = ..., bug_url_template: _Optional[str] = ..., metadata_config: _Optional[_Union[MetadataConfig, _Mapping]] = ...) -> None: ...
+
+class Link(_message.Message):
+    __slots__ = ("text", "url", "alt")
+    TEXT_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    ALT_FIELD_NUMBER: _ClassVar[int]
+    text: str
+    url: str
+    alt: str
+    def __init__(self, text: _Optional[str] = ..., url: _Optional[str] = ..., alt: _Optional[str] = ...) -> None: ...
+
+class Oncall(_message.Message):
+    __slots__ = ("name", "url", "show_primary_secondary_labels")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    SHOW_PRIMARY_SECONDARY_LABELS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    url: str
+    show_primary_secondary_labels: bool
+    def __init__(self, name: _Optional[str] = ..., url: _Optional[str] = ..., show_primary_secondary_labels: bool = ...) -> None: ...
+
+class LinkGroup(_message.Message):
+    __slots__ = ("name", "links")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    LINKS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    links: _containers.RepeatedCompositeFieldContainer[Link]
+    def __init__(self, name: _Optional[str] = ..., links: _Optional[_Iterable[_Union[Link, _Mapping]]] = ...) -> None: ...
+
+class ConsoleSummaryGroup(_message.Message):
+    __slots__ = ("title", "console_ids")
+    TITLE_FIELD_NUMBER: _ClassVar[int]
+    CONSOLE_IDS_FIELD_NUMBER: _ClassVar[int]
+    title: Link
+    console_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, title: _Optional[_Union[Link, _Mapping]] = ..., console_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class Header(_message.Message):
+    __slots__ = ("oncalls", "links", "console_groups", "tree_status_host", "tree_name", "id")
+    ONCALLS_FIELD_NUMBER: _ClassVar[int]
+    LINKS_FIELD_NUMBER: _ClassVar[int]
+    CONSOLE_GROUPS_FIELD_NUMBER: _ClassVar[int]
+    TREE_STATUS_HOST_FIELD_NUMBER: _ClassVar[int]
+    TREE_NAME_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    oncalls: _containers.RepeatedCompositeFieldContainer[Oncall]
+    links: _containers.RepeatedCompositeFieldContainer[LinkGroup]
+    console_groups: _containers.RepeatedCompositeFieldContainer[ConsoleSummaryGroup]
+    tree_status_host: str
+    tree_name: str
+    id: str
+    def __init__(self, oncalls: _Optional[_Iterable[_Union[Oncall, _Mapping]]] = ..., links: _Optional[_Iterable[_Union[LinkGroup, _Mapping]]] = ..., console_groups: _Optional[_Iterable[_Union[ConsoleSummaryGroup, _Mapping]]] = ..., tree_status_host: _Optional[str] = ..., tree_name: _Optional[str] = ..., id: _Optional[str] = ...) -> None: ...
+
+class Console(_message.Message):
+    __slots__ = ("id", "name", "repo_url", "refs", "exclude_ref", "manifest_name", "builders", "favicon_url", "header", "header_id", "include_experimental_builds", "builder_view_only", "default_commit_limit", "default_expand", "external_project", "external_id", "realm")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    REPO_URL_FIELD_NUMBER: _ClassVar[int]
+    REFS_FIELD_NUMBER: _ClassVar[int]
+    EXCLUDE_REF_FIELD_NUMBER: _ClassVar[int]
+    MANIFEST_NAME_FIELD_NUMBER: _ClassVar[int]
+    BUILDERS_FIELD_NUMBER: _ClassVar[int]
+    FAVICON_URL_FIELD_NUMBER: _ClassVar[int]
+    HEADER_FIELD_NUMBER: _ClassVar[int]
+    HEADER_ID_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_EXPERIMENTAL_BUILDS_FIELD_NUMBER: _ClassVar[int]
+    BUILDER_VIEW_ONLY_FIELD_NUMBER: _ClassVar[int]
+    DEFAULT_COMMIT_LIMIT_FIELD_NUMBER: _ClassVar[int]
+    DEFAULT_EXPAND_FIELD_NUMBER: _ClassVar[int]
+    EXTERNAL_PROJECT_FIELD_NUMBER: _ClassVar[int]
+    EXTERNAL_ID_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    name: str
+    repo_url: str
+    refs: _containers.RepeatedScalarFieldContainer[str]
+    exclude_ref: str
+    manifest_name: str
+    builders: _containers.RepeatedCompositeFieldContainer[Builder]
+    favicon_url: str
+    header: Header
+    header_id: str
+    include_experimental_builds: bool
+    builder_view_only: bool
+    default_commit_limit: int
+    default_expand: bool
+    external_project: str
+    external_id: str
+    realm: str
+    def __init__(self, id: _Optional[str] = ..., name: _Optional[str] = ..., repo_url: _Optional[str] = ..., refs: _Optional[_Iterable[str]] = ..., exclude_ref: _Optional[str] = ..., manifest_name: _Optional[str] = ..., builders: _Optional[_Iterable[_Union[Builder, _Mapping]]] = ..., favicon_url: _Optional[str] = ..., header: _Optional[_Union[Header, _Mapping]] = ..., header_id: _Optional[str] = ..., include_experimental_builds: bool = ..., builder_view_only: bool = ..., default_commit_limit: _Optional[int] = ..., default_expand: bool = ..., external_project: _Optional[str] = ..., external_id: _Optional[str] = ..., realm: _Optional[str] = ...) -> None: ...
+
+class Builder(_message.Message):
+    __slots__ = ("name", "id", "category", "short_name")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    CATEGORY_FIELD_NUMBER: _ClassVar[int]
+    SHORT_NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    id: _builder_common_pb2.BuilderID
+    category: str
+    short_name: str
+    def __init__(self, name: _Optional[str] = ..., id: _Optional[_Union[_builder_common_pb2.BuilderID, _Mapping]] = ..., category: _Optional[str] = ..., short_name: _Optional[str] = ...) -> None: ...
+
+class MetadataConfig(_message.Message):
+    __slots__ = ("test_metadata_properties",)
+    TEST_METADATA_PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    test_metadata_properties: _containers.RepeatedCompositeFieldContainer[DisplayRule]
+    def __init__(self, test_metadata_properties: _Optional[_Iterable[_Union[DisplayRule, _Mapping]]] = ...) -> None: ...
+
+class DisplayRule(_message.Message):
+    __slots__ = ("schema", "display_items")
+    SCHEMA_FIELD_NUMBER: _ClassVar[int]
+    DISPLAY_ITEMS_FIELD_NUMBER: _ClassVar[int]
+    schema: str
+    display_items: _containers.RepeatedCompositeFieldContainer[DisplayItem]
+    def __init__(self, schema: _Optional[str] = ..., display_items: _Optional[_Iterable[_Union[DisplayItem, _Mapping]]] = ...) -> None: ...
+
+class DisplayItem(_message.Message):
+    __slots__ = ("display_name", "path")
+    DISPLAY_NAME_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    display_name: str
+    path: str
+    def __init__(self, display_name: _Optional[str] = ..., path: _Optional[str] = ...) -> None: ...
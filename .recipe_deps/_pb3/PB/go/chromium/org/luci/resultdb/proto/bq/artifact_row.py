@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/bq/artifact_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/bq/artifact_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.resultdb.proto.bq import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_bq_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/resultdb/proto/bq/artifact_row.proto\x12\x10luci.resultdb.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/resultdb/proto/bq/common.proto\"\x91\x02\n\x15TextArtifactRowLegacy\x12\x34\n\x08\x65xported\x18\x01 \x01(\x0b\x32\".luci.resultdb.bq.InvocationRecord\x12\x32\n\x06parent\x18\x02 \x01(\x0b\x32\".luci.resultdb.bq.InvocationRecord\x12\x0f\n\x07test_id\x18\x03 \x01(\t\x12\x11\n\tresult_id\x18\x04 \x01(\t\x12\x13\n\x0b\x61rtifact_id\x18\x05 \x01(\t\x12\x10\n\x08shard_id\x18\x06 \x01(\x05\x12\x0f\n\x07\x63ontent\x18\x07 \x01(\t\x12\x32\n\x0epartition_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampB1Z/go.chromium.org/luci/resultdb/proto/bq;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.bq.artifact_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z/go.chromium.org/luci/resultdb/proto/bq;resultpb'
+  _globals['_TEXTARTIFACTROWLEGACY']._serialized_start=166
+  _globals['_TEXTARTIFACTROWLEGACY']._serialized_end=439
+# @@protoc_insertion_point(module_scope)
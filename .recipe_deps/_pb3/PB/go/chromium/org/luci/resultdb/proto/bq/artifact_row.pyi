@@ -0,0 +1,30 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.resultdb.proto.bq import common as _common_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TextArtifactRowLegacy(_message.Message):
+    __slots__ = ("exported", "parent", "test_id", "result_id", "artifact_id", "shard_id", "content", "partition_time")
+    EXPORTED_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    SHARD_ID_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    exported: _common_pb2.InvocationRecord
+    parent: _common_pb2.InvocationRecord
+    test_id: str
+    result_id: str
+    artifact_id: str
+    shard_id: int
+    content: str
+    partition_time: _timestamp_pb2.Timestamp
+    def __init__(self, exported: _Optional[_Union[_common_pb2.InvocationRecord, _Mapping]] = ..., parent: _Optional[_Union[_common_pb2.InvocationRecord, _Mapping]] = ..., test_id: _Optional[str] = ..., result_id: _Optional[str] = ..., artifact_id: _Optional[str] = ..., shard_id: _Optional[int] = ..., content: _Optional[str] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
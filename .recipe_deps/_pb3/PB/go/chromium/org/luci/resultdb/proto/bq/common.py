@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/bq/common.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/bq/common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/resultdb/proto/bq/common.proto\x12\x10luci.resultdb.bq\x1a\x1cgoogle/protobuf/struct.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\"\x92\x01\n\x10InvocationRecord\x12\n\n\x02id\x18\x01 \x01(\t\x12*\n\x04tags\x18\x02 \x03(\x0b\x32\x1c.luci.resultdb.v1.StringPair\x12\r\n\x05realm\x18\x03 \x01(\t\x12\x37\n\nproperties\x18\x04 \x01(\x0b\x32\x17.google.protobuf.StructB\n\xe2\xbc$\x06\n\x04JSONB1Z/go.chromium.org/luci/resultdb/proto/bq;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.bq.common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z/go.chromium.org/luci/resultdb/proto/bq;resultpb'
+  _globals['_INVOCATIONRECORD'].fields_by_name['properties']._loaded_options = None
+  _globals['_INVOCATIONRECORD'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_INVOCATIONRECORD']._serialized_start=206
+  _globals['_INVOCATIONRECORD']._serialized_end=352
+# @@protoc_insertion_point(module_scope)
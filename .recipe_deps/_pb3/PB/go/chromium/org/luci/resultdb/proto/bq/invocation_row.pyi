@@ -0,0 +1,40 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InvocationRow(_message.Message):
+    __slots__ = ("project", "realm", "id", "create_time", "tags", "finalize_time", "included_invocations", "is_export_root", "producer_resource", "properties", "extended_properties", "partition_time")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    FINALIZE_TIME_FIELD_NUMBER: _ClassVar[int]
+    INCLUDED_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    IS_EXPORT_ROOT_FIELD_NUMBER: _ClassVar[int]
+    PRODUCER_RESOURCE_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    EXTENDED_PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    realm: str
+    id: str
+    create_time: _timestamp_pb2.Timestamp
+    tags: _containers.RepeatedCompositeFieldContainer[_common_pb2.StringPair]
+    finalize_time: _timestamp_pb2.Timestamp
+    included_invocations: _containers.RepeatedScalarFieldContainer[str]
+    is_export_root: bool
+    producer_resource: str
+    properties: str
+    extended_properties: str
+    partition_time: _timestamp_pb2.Timestamp
+    def __init__(self, project: _Optional[str] = ..., realm: _Optional[str] = ..., id: _Optional[str] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., tags: _Optional[_Iterable[_Union[_common_pb2.StringPair, _Mapping]]] = ..., finalize_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., included_invocations: _Optional[_Iterable[str]] = ..., is_export_root: bool = ..., producer_resource: _Optional[str] = ..., properties: _Optional[str] = ..., extended_properties: _Optional[str] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/bq/test_result_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/bq/test_result_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+from PB.go.chromium.org.luci.resultdb.proto.bq import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_bq_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_invocation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__metadata__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_failure__reason__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<go.chromium.org/luci/resultdb/proto/bq/test_result_row.proto\x12\x10luci.resultdb.bq\x1a\x1egoogle/protobuf/duration.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\x1a\x33go.chromium.org/luci/resultdb/proto/bq/common.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a\x37go.chromium.org/luci/resultdb/proto/v1/invocation.proto\x1a:go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto\x1a;go.chromium.org/luci/resultdb/proto/v1/failure_reason.proto\"\x94\x06\n\rTestResultRow\x12\x34\n\x08\x65xported\x18\x01 \x01(\x0b\x32\".luci.resultdb.bq.InvocationRecord\x12\x32\n\x06parent\x18\x02 \x01(\x0b\x32\".luci.resultdb.bq.InvocationRecord\x12\x0c\n\x04name\x18\x11 \x01(\t\x12\x0f\n\x07test_id\x18\x03 \x01(\t\x12\x11\n\tresult_id\x18\x04 \x01(\t\x12-\n\x07variant\x18\x05 \x03(\x0b\x32\x1c.luci.resultdb.v1.StringPair\x12\x14\n\x0cvariant_hash\x18\x06 \x01(\t\x12\x10\n\x08\x65xpected\x18\x07 \x01(\x08\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x14\n\x0csummary_html\x18\t \x01(\t\x12.\n\nstart_time\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12+\n\x08\x64uration\x18\x0b \x01(\x0b\x32\x19.google.protobuf.Duration\x12*\n\x04tags\x18\x0c \x03(\x0b\x32\x1c.luci.resultdb.v1.StringPair\x12\x12\n\nexonerated\x18\r \x01(\x08\x12*\n\x07sources\x18\x14 \x01(\x0b\x32\x19.luci.resultdb.v1.Sources\x12\x32\n\x0epartition_time\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x35\n\rtest_metadata\x18\x10 \x01(\x0b\x32\x1e.luci.resultdb.v1.TestMetadata\x12\x37\n\x0e\x66\x61ilure_reason\x18\x12 \x01(\x0b\x32\x1f.luci.resultdb.v1.FailureReason\x12\x37\n\nproperties\x18\x13 \x01(\x0b\x32\x17.google.protobuf.StructB\n\xe2\xbc$\x06\n\x04JSON\x12\x13\n\x0bskip_reason\x18\x15 \x01(\t\x12/\n\x0binsert_time\x18\x16 \x01(\x0b\x32\x1a.google.protobuf.TimestampB1Z/go.chromium.org/luci/resultdb/proto/bq;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.bq.test_result_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z/go.chromium.org/luci/resultdb/proto/bq;resultpb'
+  _globals['_TESTRESULTROW'].fields_by_name['properties']._loaded_options = None
+  _globals['_TESTRESULTROW'].fields_by_name['properties']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TESTRESULTROW']._serialized_start=511
+  _globals['_TESTRESULTROW']._serialized_end=1299
+# @@protoc_insertion_point(module_scope)
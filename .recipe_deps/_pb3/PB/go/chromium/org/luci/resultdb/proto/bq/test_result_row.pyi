@@ -0,0 +1,64 @@
+import datetime
+
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from PB.go.chromium.org.luci.resultdb.proto.bq import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2_1
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as _invocation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as _test_metadata_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as _failure_reason_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestResultRow(_message.Message):
+    __slots__ = ("exported", "parent", "name", "test_id", "result_id", "variant", "variant_hash", "expected", "status", "summary_html", "start_time", "duration", "tags", "exonerated", "sources", "partition_time", "test_metadata", "failure_reason", "properties", "skip_reason", "insert_time")
+    EXPORTED_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    EXPECTED_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_HTML_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    EXONERATED_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    TEST_METADATA_FIELD_NUMBER: _ClassVar[int]
+    FAILURE_REASON_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    SKIP_REASON_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    exported: _common_pb2.InvocationRecord
+    parent: _common_pb2.InvocationRecord
+    name: str
+    test_id: str
+    result_id: str
+    variant: _containers.RepeatedCompositeFieldContainer[_common_pb2_1.StringPair]
+    variant_hash: str
+    expected: bool
+    status: str
+    summary_html: str
+    start_time: _timestamp_pb2.Timestamp
+    duration: _duration_pb2.Duration
+    tags: _containers.RepeatedCompositeFieldContainer[_common_pb2_1.StringPair]
+    exonerated: bool
+    sources: _common_pb2_1.Sources
+    partition_time: _timestamp_pb2.Timestamp
+    test_metadata: _test_metadata_pb2.TestMetadata
+    failure_reason: _failure_reason_pb2.FailureReason
+    properties: _struct_pb2.Struct
+    skip_reason: str
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, exported: _Optional[_Union[_common_pb2.InvocationRecord, _Mapping]] = ..., parent: _Optional[_Union[_common_pb2.InvocationRecord, _Mapping]] = ..., name: _Optional[str] = ..., test_id: _Optional[str] = ..., result_id: _Optional[str] = ..., variant: _Optional[_Iterable[_Union[_common_pb2_1.StringPair, _Mapping]]] = ..., variant_hash: _Optional[str] = ..., expected: bool = ..., status: _Optional[str] = ..., summary_html: _Optional[str] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., duration: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., tags: _Optional[_Iterable[_Union[_common_pb2_1.StringPair, _Mapping]]] = ..., exonerated: bool = ..., sources: _Optional[_Union[_common_pb2_1.Sources, _Mapping]] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., test_metadata: _Optional[_Union[_test_metadata_pb2.TestMetadata, _Mapping]] = ..., failure_reason: _Optional[_Union[_failure_reason_pb2.FailureReason, _Mapping]] = ..., properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., skip_reason: _Optional[str] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/bq/text_artifact_row.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/bq/text_artifact_row.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_bq_dot_pb_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n>go.chromium.org/luci/resultdb/proto/bq/text_artifact_row.proto\x12\x10luci.resultdb.bq\x1a\x1fgoogle/protobuf/timestamp.proto\x1a/go.chromium.org/luci/common/bq/pb/options.proto\"\xb3\x04\n\x0fTextArtifactRow\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\r\n\x05realm\x18\x02 \x01(\t\x12\x15\n\rinvocation_id\x18\x03 \x01(\t\x12\x0f\n\x07test_id\x18\x04 \x01(\t\x12\x11\n\tresult_id\x18\x05 \x01(\t\x12\x13\n\x0b\x61rtifact_id\x18\x06 \x01(\t\x12\x12\n\nnum_shards\x18\x07 \x01(\x05\x12\x10\n\x08shard_id\x18\x08 \x01(\x05\x12\x14\n\x0c\x63ontent_type\x18\t \x01(\t\x12\x0f\n\x07\x63ontent\x18\n \x01(\t\x12\x1d\n\x15\x61rtifact_content_size\x18\x0b \x01(\x05\x12\x1a\n\x12shard_content_size\x18\x0c \x01(\x05\x12\x32\n\x0epartition_time\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0btest_status\x18\x0f \x01(\t\x12\x16\n\x0etest_status_v2\x18\x15 \x01(\t\x12 \n\x0ctest_variant\x18\x10 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12\x19\n\x11test_variant_hash\x18\x11 \x01(\t\x12,\n\x18invocation_variant_union\x18\x12 \x01(\tB\n\xe2\xbc$\x06\n\x04JSON\x12%\n\x1dinvocation_variant_union_hash\x18\x13 \x01(\t\x12/\n\x0binsert_time\x18\x14 \x01(\x0b\x32\x1a.google.protobuf.TimestampJ\x04\x08\x0e\x10\x0f\x42\x31Z/go.chromium.org/luci/resultdb/proto/bq;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.bq.text_artifact_row_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z/go.chromium.org/luci/resultdb/proto/bq;resultpb'
+  _globals['_TEXTARTIFACTROW'].fields_by_name['test_variant']._loaded_options = None
+  _globals['_TEXTARTIFACTROW'].fields_by_name['test_variant']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TEXTARTIFACTROW'].fields_by_name['invocation_variant_union']._loaded_options = None
+  _globals['_TEXTARTIFACTROW'].fields_by_name['invocation_variant_union']._serialized_options = b'\342\274$\006\n\004JSON'
+  _globals['_TEXTARTIFACTROW']._serialized_start=167
+  _globals['_TEXTARTIFACTROW']._serialized_end=730
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,54 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.common.bq.pb import options as _options_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TextArtifactRow(_message.Message):
+    __slots__ = ("project", "realm", "invocation_id", "test_id", "result_id", "artifact_id", "num_shards", "shard_id", "content_type", "content", "artifact_content_size", "shard_content_size", "partition_time", "test_status", "test_status_v2", "test_variant", "test_variant_hash", "invocation_variant_union", "invocation_variant_union_hash", "insert_time")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    NUM_SHARDS_FIELD_NUMBER: _ClassVar[int]
+    SHARD_ID_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_CONTENT_SIZE_FIELD_NUMBER: _ClassVar[int]
+    SHARD_CONTENT_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    TEST_STATUS_FIELD_NUMBER: _ClassVar[int]
+    TEST_STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANT_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_VARIANT_UNION_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_VARIANT_UNION_HASH_FIELD_NUMBER: _ClassVar[int]
+    INSERT_TIME_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    realm: str
+    invocation_id: str
+    test_id: str
+    result_id: str
+    artifact_id: str
+    num_shards: int
+    shard_id: int
+    content_type: str
+    content: str
+    artifact_content_size: int
+    shard_content_size: int
+    partition_time: _timestamp_pb2.Timestamp
+    test_status: str
+    test_status_v2: str
+    test_variant: str
+    test_variant_hash: str
+    invocation_variant_union: str
+    invocation_variant_union_hash: str
+    insert_time: _timestamp_pb2.Timestamp
+    def __init__(self, project: _Optional[str] = ..., realm: _Optional[str] = ..., invocation_id: _Optional[str] = ..., test_id: _Optional[str] = ..., result_id: _Optional[str] = ..., artifact_id: _Optional[str] = ..., num_shards: _Optional[int] = ..., shard_id: _Optional[int] = ..., content_type: _Optional[str] = ..., content: _Optional[str] = ..., artifact_content_size: _Optional[int] = ..., shard_content_size: _Optional[int] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., test_status: _Optional[str] = ..., test_status_v2: _Optional[str] = ..., test_variant: _Optional[str] = ..., test_variant_hash: _Optional[str] = ..., invocation_variant_union: _Optional[str] = ..., invocation_variant_union_hash: _Optional[str] = ..., insert_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/config/config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/config/config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.resultdb.proto.config import scheme as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_config_dot_scheme__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7go.chromium.org/luci/resultdb/proto/config/config.proto\x12\x14luci.resultdb.config\x1a\x37go.chromium.org/luci/resultdb/proto/config/scheme.proto\"\xa5\x03\n\x06\x43onfig\x12O\n\x19\x62q_artifact_export_config\x18\x01 \x01(\x0b\x32,.luci.resultdb.config.BqArtifactExportConfig\x12Y\n#bq_artifact_exporter_service_config\x18\x02 \x01(\x0b\x32,.luci.resultdb.config.BqArtifactExportConfig\x12-\n\x07schemes\x18\x03 \x03(\x0b\x32\x1c.luci.resultdb.config.Scheme\x12>\n\x10producer_systems\x18\x04 \x03(\x0b\x32$.luci.resultdb.config.ProducerSystem\x12\x39\n\randroid_build\x18\x05 \x01(\x0b\x32\".luci.resultdb.config.AndroidBuild\x12\x45\n\x1atest_ids_with_higher_limit\x18\x06 \x03(\x0b\x32!.luci.resultdb.config.TestIdEntry\"A\n\x16\x42qArtifactExportConfig\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x16\n\x0e\x65xport_percent\x18\x02 \x01(\x03\"\xa7\x02\n\x0eProducerSystem\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\x14\n\x0cname_pattern\x18\x02 \x01(\t\x12\x1a\n\x12\x64\x61ta_realm_pattern\x18\x03 \x01(\t\x12\x18\n\x10validate_callers\x18\x04 \x01(\x08\x12\x14\n\x0curl_template\x18\x05 \x01(\t\x12\x64\n\x1aurl_template_by_data_realm\x18\x06 \x03(\x0b\x32@.luci.resultdb.config.ProducerSystem.UrlTemplateByDataRealmEntry\x1a=\n\x1bUrlTemplateByDataRealmEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x92\x02\n\x0c\x41ndroidBuild\x12\x1a\n\x12\x64\x61ta_realm_pattern\x18\x01 \x01(\t\x12G\n\x0b\x64\x61ta_realms\x18\x02 \x03(\x0b\x32\x32.luci.resultdb.config.AndroidBuild.DataRealmsEntry\x1a\x34\n\x11\x42yDataRealmConfig\x12\x1f\n\x17\x66ull_build_url_template\x18\x01 \x01(\t\x1ag\n\x0f\x44\x61taRealmsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0b\x32\x34.luci.resultdb.config.AndroidBuild.ByDataRealmConfig:\x02\x38\x01\"g\n\x0bTestIdEntry\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x13\n\x0b\x63oarse_name\x18\x02 \x01(\t\x12\x11\n\tfine_name\x18\x03 \x01(\t\x12\x1b\n\x13module_name_pattern\x18\x04 \x01(\tB5Z3go.chromium.org/luci/resultdb/proto/config;configpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.config.config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z3go.chromium.org/luci/resultdb/proto/config;configpb'
+  _globals['_PRODUCERSYSTEM_URLTEMPLATEBYDATAREALMENTRY']._loaded_options = None
+  _globals['_PRODUCERSYSTEM_URLTEMPLATEBYDATAREALMENTRY']._serialized_options = b'8\001'
+  _globals['_ANDROIDBUILD_DATAREALMSENTRY']._loaded_options = None
+  _globals['_ANDROIDBUILD_DATAREALMSENTRY']._serialized_options = b'8\001'
+  _globals['_CONFIG']._serialized_start=139
+  _globals['_CONFIG']._serialized_end=560
+  _globals['_BQARTIFACTEXPORTCONFIG']._serialized_start=562
+  _globals['_BQARTIFACTEXPORTCONFIG']._serialized_end=627
+  _globals['_PRODUCERSYSTEM']._serialized_start=630
+  _globals['_PRODUCERSYSTEM']._serialized_end=925
+  _globals['_PRODUCERSYSTEM_URLTEMPLATEBYDATAREALMENTRY']._serialized_start=864
+  _globals['_PRODUCERSYSTEM_URLTEMPLATEBYDATAREALMENTRY']._serialized_end=925
+  _globals['_ANDROIDBUILD']._serialized_start=928
+  _globals['_ANDROIDBUILD']._serialized_end=1202
+  _globals['_ANDROIDBUILD_BYDATAREALMCONFIG']._serialized_start=1045
+  _globals['_ANDROIDBUILD_BYDATAREALMCONFIG']._serialized_end=1097
+  _globals['_ANDROIDBUILD_DATAREALMSENTRY']._serialized_start=1099
+  _globals['_ANDROIDBUILD_DATAREALMSENTRY']._serialized_end=1202
+  _globals['_TESTIDENTRY']._serialized_start=1204
+  _globals['_TESTIDENTRY']._serialized_end=1307
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,87 @@
+from PB.go.chromium.org.luci.resultdb.proto.config import scheme as _scheme_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Config(_message.Message):
+    __slots__ = ("bq_artifact_export_config", "bq_artifact_exporter_service_config", "schemes", "producer_systems", "android_build", "test_ids_with_higher_limit")
+    BQ_ARTIFACT_EXPORT_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    BQ_ARTIFACT_EXPORTER_SERVICE_CONFIG_FIELD_NUMBER: _ClassVar[int]
+    SCHEMES_FIELD_NUMBER: _ClassVar[int]
+    PRODUCER_SYSTEMS_FIELD_NUMBER: _ClassVar[int]
+    ANDROID_BUILD_FIELD_NUMBER: _ClassVar[int]
+    TEST_IDS_WITH_HIGHER_LIMIT_FIELD_NUMBER: _ClassVar[int]
+    bq_artifact_export_config: BqArtifactExportConfig
+    bq_artifact_exporter_service_config: BqArtifactExportConfig
+    schemes: _containers.RepeatedCompositeFieldContainer[_scheme_pb2.Scheme]
+    producer_systems: _containers.RepeatedCompositeFieldContainer[ProducerSystem]
+    android_build: AndroidBuild
+    test_ids_with_higher_limit: _containers.RepeatedCompositeFieldContainer[TestIdEntry]
+    def __init__(self, bq_artifact_export_config: _Optional[_Union[BqArtifactExportConfig, _Mapping]] = ..., bq_artifact_exporter_service_config: _Optional[_Union[BqArtifactExportConfig, _Mapping]] = ..., schemes: _Optional[_Iterable[_Union[_scheme_pb2.Scheme, _Mapping]]] = ..., producer_systems: _Optional[_Iterable[_Union[ProducerSystem, _Mapping]]] = ..., android_build: _Optional[_Union[AndroidBuild, _Mapping]] = ..., test_ids_with_higher_limit: _Optional[_Iterable[_Union[TestIdEntry, _Mapping]]] = ...) -> None: ...
+
+class BqArtifactExportConfig(_message.Message):
+    __slots__ = ("enabled", "export_percent")
+    ENABLED_FIELD_NUMBER: _ClassVar[int]
+    EXPORT_PERCENT_FIELD_NUMBER: _ClassVar[int]
+    enabled: bool
+    export_percent: int
+    def __init__(self, enabled: bool = ..., export_percent: _Optional[int] = ...) -> None: ...
+
+class ProducerSystem(_message.Message):
+    __slots__ = ("system", "name_pattern", "data_realm_pattern", "validate_callers", "url_template", "url_template_by_data_realm")
+    class UrlTemplateByDataRealmEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    NAME_PATTERN_FIELD_NUMBER: _ClassVar[int]
+    DATA_REALM_PATTERN_FIELD_NUMBER: _ClassVar[int]
+    VALIDATE_CALLERS_FIELD_NUMBER: _ClassVar[int]
+    URL_TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+    URL_TEMPLATE_BY_DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    name_pattern: str
+    data_realm_pattern: str
+    validate_callers: bool
+    url_template: str
+    url_template_by_data_realm: _containers.ScalarMap[str, str]
+    def __init__(self, system: _Optional[str] = ..., name_pattern: _Optional[str] = ..., data_realm_pattern: _Optional[str] = ..., validate_callers: bool = ..., url_template: _Optional[str] = ..., url_template_by_data_realm: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class AndroidBuild(_message.Message):
+    __slots__ = ("data_realm_pattern", "data_realms")
+    class ByDataRealmConfig(_message.Message):
+        __slots__ = ("full_build_url_template",)
+        FULL_BUILD_URL_TEMPLATE_FIELD_NUMBER: _ClassVar[int]
+        full_build_url_template: str
+        def __init__(self, full_build_url_template: _Optional[str] = ...) -> None: ...
+    class DataRealmsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: AndroidBuild.ByDataRealmConfig
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[AndroidBuild.ByDataRealmConfig, _Mapping]] = ...) -> None: ...
+    DATA_REALM_PATTERN_FIELD_NUMBER: _ClassVar[int]
+    DATA_REALMS_FIELD_NUMBER: _ClassVar[int]
+    data_realm_pattern: str
+    data_realms: _containers.MessageMap[str, AndroidBuild.ByDataRealmConfig]
+    def __init__(self, data_realm_pattern: _Optional[str] = ..., data_realms: _Optional[_Mapping[str, AndroidBuild.ByDataRealmConfig]] = ...) -> None: ...
+
+class TestIdEntry(_message.Message):
+    __slots__ = ("module_name", "coarse_name", "fine_name", "module_name_pattern")
+    MODULE_NAME_FIELD_NUMBER: _ClassVar[int]
+    COARSE_NAME_FIELD_NUMBER: _ClassVar[int]
+    FINE_NAME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_NAME_PATTERN_FIELD_NUMBER: _ClassVar[int]
+    module_name: str
+    coarse_name: str
+    fine_name: str
+    module_name_pattern: str
+    def __init__(self, module_name: _Optional[str] = ..., coarse_name: _Optional[str] = ..., fine_name: _Optional[str] = ..., module_name_pattern: _Optional[str] = ...) -> None: ...
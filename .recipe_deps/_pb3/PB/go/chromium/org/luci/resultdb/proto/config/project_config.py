@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/config/project_config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/config/project_config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n?go.chromium.org/luci/resultdb/proto/config/project_config.proto\x12\x14luci.resultdb.config\"\x87\x01\n\rProjectConfig\x12:\n\x0egcs_allow_list\x18\x01 \x03(\x0b\x32\".luci.resultdb.config.GcsAllowList\x12:\n\x0erbe_allow_list\x18\x02 \x03(\x0b\x32\".luci.resultdb.config.RbeAllowList\".\n\x0cGcsAllowList\x12\r\n\x05users\x18\x01 \x03(\t\x12\x0f\n\x07\x62uckets\x18\x02 \x03(\t\"0\n\x0cRbeAllowList\x12\r\n\x05users\x18\x01 \x03(\t\x12\x11\n\tinstances\x18\x02 \x03(\tB5Z3go.chromium.org/luci/resultdb/proto/config;configpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.config.project_config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z3go.chromium.org/luci/resultdb/proto/config;configpb'
+  _globals['_PROJECTCONFIG']._serialized_start=90
+  _globals['_PROJECTCONFIG']._serialized_end=225
+  _globals['_GCSALLOWLIST']._serialized_start=227
+  _globals['_GCSALLOWLIST']._serialized_end=273
+  _globals['_RBEALLOWLIST']._serialized_start=275
+  _globals['_RBEALLOWLIST']._serialized_end=323
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,31 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ProjectConfig(_message.Message):
+    __slots__ = ("gcs_allow_list", "rbe_allow_list")
+    GCS_ALLOW_LIST_FIELD_NUMBER: _ClassVar[int]
+    RBE_ALLOW_LIST_FIELD_NUMBER: _ClassVar[int]
+    gcs_allow_list: _containers.RepeatedCompositeFieldContainer[GcsAllowList]
+    rbe_allow_list: _containers.RepeatedCompositeFieldContainer[RbeAllowList]
+    def __init__(self, gcs_allow_list: _Optional[_Iterable[_Union[GcsAllowList, _Mapping]]] = ..., rbe_allow_list: _Optional[_Iterable[_Union[RbeAllowList, _Mapping]]] = ...) -> None: ...
+
+class GcsAllowList(_message.Message):
+    __slots__ = ("users", "buckets")
+    USERS_FIELD_NUMBER: _ClassVar[int]
+    BUCKETS_FIELD_NUMBER: _ClassVar[int]
+    users: _containers.RepeatedScalarFieldContainer[str]
+    buckets: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, users: _Optional[_Iterable[str]] = ..., buckets: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class RbeAllowList(_message.Message):
+    __slots__ = ("users", "instances")
+    USERS_FIELD_NUMBER: _ClassVar[int]
+    INSTANCES_FIELD_NUMBER: _ClassVar[int]
+    users: _containers.RepeatedScalarFieldContainer[str]
+    instances: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, users: _Optional[_Iterable[str]] = ..., instances: _Optional[_Iterable[str]] = ...) -> None: ...
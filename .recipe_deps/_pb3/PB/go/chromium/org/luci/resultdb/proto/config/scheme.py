@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/config/scheme.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/config/scheme.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7go.chromium.org/luci/resultdb/proto/config/scheme.proto\x12\x14luci.resultdb.config\"\x8a\x02\n\x06Scheme\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1b\n\x13human_readable_name\x18\x02 \x01(\t\x12\x32\n\x06\x63oarse\x18\x03 \x01(\x0b\x32\".luci.resultdb.config.Scheme.Level\x12\x30\n\x04\x66ine\x18\x04 \x01(\x0b\x32\".luci.resultdb.config.Scheme.Level\x12\x30\n\x04\x63\x61se\x18\x05 \x01(\x0b\x32\".luci.resultdb.config.Scheme.Level\x1a?\n\x05Level\x12\x1b\n\x13human_readable_name\x18\x01 \x01(\t\x12\x19\n\x11validation_regexp\x18\x02 \x01(\tB5Z3go.chromium.org/luci/resultdb/proto/config;configpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.config.scheme_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z3go.chromium.org/luci/resultdb/proto/config;configpb'
+  _globals['_SCHEME']._serialized_start=82
+  _globals['_SCHEME']._serialized_end=348
+  _globals['_SCHEME_LEVEL']._serialized_start=285
+  _globals['_SCHEME_LEVEL']._serialized_end=348
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/artifact.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/artifact.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5go.chromium.org/luci/resultdb/proto/v1/artifact.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\"\xcd\x03\n\x08\x41rtifact\x12\x13\n\x04name\x18\x01 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x42\n\x12test_id_structured\x18\x0c \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifierB\x04\xe2\x41\x01\x05\x12\x16\n\x07test_id\x18\r \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x17\n\tresult_id\x18\x0e \x01(\tB\x04\xe2\x41\x01\x05\x12\x13\n\x0b\x61rtifact_id\x18\x02 \x01(\t\x12\x17\n\tfetch_url\x18\x03 \x01(\tB\x04\xe2\x41\x01\x03\x12>\n\x14\x66\x65tch_url_expiration\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x14\n\x0c\x63ontent_type\x18\x05 \x01(\t\x12\x12\n\nsize_bytes\x18\x06 \x01(\x03\x12\x16\n\x08\x63ontents\x18\x07 \x01(\x0c\x42\x04\xe2\x41\x01\x04\x12\x0f\n\x07gcs_uri\x18\x08 \x01(\t\x12\x35\n\x0btest_status\x18\t \x01(\x0e\x32\x1c.luci.resultdb.v1.TestStatusB\x02\x18\x01\x12\x17\n\thas_lines\x18\x0b \x01(\x08\x42\x04\xe2\x41\x01\x03\x12\x0f\n\x07rbe_uri\x18\x0f \x01(\t\x12\x15\n\rartifact_type\x18\x10 \x01(\t\"\xaa\x02\n\x0c\x41rtifactLine\x12\x0e\n\x06number\x18\x01 \x01(\x03\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x39\n\x08severity\x18\x03 \x01(\x0e\x32\'.luci.resultdb.v1.ArtifactLine.Severity\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\x0c\"\x8e\x01\n\x08Severity\x12\x18\n\x14SEVERITY_UNSPECIFIED\x10\x00\x12\x0b\n\x07VERBOSE\x10\n\x12\t\n\x05TRACE\x10\x14\x12\t\n\x05\x44\x45\x42UG\x10\x1e\x12\x08\n\x04INFO\x10(\x12\n\n\x06NOTICE\x10\x32\x12\x0b\n\x07WARNING\x10<\x12\t\n\x05\x45RROR\x10\x46\x12\x0c\n\x08\x43RITICAL\x10P\x12\t\n\x05\x46\x41TAL\x10ZBP\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.artifact_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_ARTIFACT'].fields_by_name['name']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['name']._serialized_options = b'\342A\002\003\005'
+  _globals['_ARTIFACT'].fields_by_name['test_id_structured']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['test_id_structured']._serialized_options = b'\342A\001\005'
+  _globals['_ARTIFACT'].fields_by_name['test_id']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['test_id']._serialized_options = b'\342A\002\003\005'
+  _globals['_ARTIFACT'].fields_by_name['result_id']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['result_id']._serialized_options = b'\342A\001\005'
+  _globals['_ARTIFACT'].fields_by_name['fetch_url']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['fetch_url']._serialized_options = b'\342A\001\003'
+  _globals['_ARTIFACT'].fields_by_name['fetch_url_expiration']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['fetch_url_expiration']._serialized_options = b'\342A\001\003'
+  _globals['_ARTIFACT'].fields_by_name['contents']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['contents']._serialized_options = b'\342A\001\004'
+  _globals['_ARTIFACT'].fields_by_name['test_status']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['test_status']._serialized_options = b'\030\001'
+  _globals['_ARTIFACT'].fields_by_name['has_lines']._loaded_options = None
+  _globals['_ARTIFACT'].fields_by_name['has_lines']._serialized_options = b'\342A\001\003'
+  _globals['_ARTIFACT']._serialized_start=253
+  _globals['_ARTIFACT']._serialized_end=714
+  _globals['_ARTIFACTLINE']._serialized_start=717
+  _globals['_ARTIFACTLINE']._serialized_end=1015
+  _globals['_ARTIFACTLINE_SEVERITY']._serialized_start=873
+  _globals['_ARTIFACTLINE_SEVERITY']._serialized_end=1015
+# @@protoc_insertion_point(module_scope)
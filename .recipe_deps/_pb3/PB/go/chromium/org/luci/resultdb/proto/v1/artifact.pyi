@@ -0,0 +1,81 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Artifact(_message.Message):
+    __slots__ = ("name", "test_id_structured", "test_id", "result_id", "artifact_id", "fetch_url", "fetch_url_expiration", "content_type", "size_bytes", "contents", "gcs_uri", "test_status", "has_lines", "rbe_uri", "artifact_type")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    FETCH_URL_FIELD_NUMBER: _ClassVar[int]
+    FETCH_URL_EXPIRATION_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_BYTES_FIELD_NUMBER: _ClassVar[int]
+    CONTENTS_FIELD_NUMBER: _ClassVar[int]
+    GCS_URI_FIELD_NUMBER: _ClassVar[int]
+    TEST_STATUS_FIELD_NUMBER: _ClassVar[int]
+    HAS_LINES_FIELD_NUMBER: _ClassVar[int]
+    RBE_URI_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    result_id: str
+    artifact_id: str
+    fetch_url: str
+    fetch_url_expiration: _timestamp_pb2.Timestamp
+    content_type: str
+    size_bytes: int
+    contents: bytes
+    gcs_uri: str
+    test_status: _test_result_pb2.TestStatus
+    has_lines: bool
+    rbe_uri: str
+    artifact_type: str
+    def __init__(self, name: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., result_id: _Optional[str] = ..., artifact_id: _Optional[str] = ..., fetch_url: _Optional[str] = ..., fetch_url_expiration: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., content_type: _Optional[str] = ..., size_bytes: _Optional[int] = ..., contents: _Optional[bytes] = ..., gcs_uri: _Optional[str] = ..., test_status: _Optional[_Union[_test_result_pb2.TestStatus, str]] = ..., has_lines: bool = ..., rbe_uri: _Optional[str] = ..., artifact_type: _Optional[str] = ...) -> None: ...
+
+class ArtifactLine(_message.Message):
+    __slots__ = ("number", "timestamp", "severity", "content")
+    class Severity(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        SEVERITY_UNSPECIFIED: _ClassVar[ArtifactLine.Severity]
+        VERBOSE: _ClassVar[ArtifactLine.Severity]
+        TRACE: _ClassVar[ArtifactLine.Severity]
+        DEBUG: _ClassVar[ArtifactLine.Severity]
+        INFO: _ClassVar[ArtifactLine.Severity]
+        NOTICE: _ClassVar[ArtifactLine.Severity]
+        WARNING: _ClassVar[ArtifactLine.Severity]
+        ERROR: _ClassVar[ArtifactLine.Severity]
+        CRITICAL: _ClassVar[ArtifactLine.Severity]
+        FATAL: _ClassVar[ArtifactLine.Severity]
+    SEVERITY_UNSPECIFIED: ArtifactLine.Severity
+    VERBOSE: ArtifactLine.Severity
+    TRACE: ArtifactLine.Severity
+    DEBUG: ArtifactLine.Severity
+    INFO: ArtifactLine.Severity
+    NOTICE: ArtifactLine.Severity
+    WARNING: ArtifactLine.Severity
+    ERROR: ArtifactLine.Severity
+    CRITICAL: ArtifactLine.Severity
+    FATAL: ArtifactLine.Severity
+    NUMBER_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    SEVERITY_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    number: int
+    timestamp: _timestamp_pb2.Timestamp
+    severity: ArtifactLine.Severity
+    content: bytes
+    def __init__(self, number: _Optional[int] = ..., timestamp: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., severity: _Optional[_Union[ArtifactLine.Severity, str]] = ..., content: _Optional[bytes] = ...) -> None: ...
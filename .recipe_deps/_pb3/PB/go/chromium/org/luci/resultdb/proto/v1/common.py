@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/common.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/resultdb/proto/v1/common.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\"f\n\x07Variant\x12/\n\x03\x64\x65\x66\x18\x01 \x03(\x0b\x32\".luci.resultdb.v1.Variant.DefEntry\x1a*\n\x08\x44\x65\x66\x45ntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"(\n\nStringPair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"\xc7\x01\n\x0eTestIdentifier\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x15\n\rmodule_scheme\x18\x02 \x01(\t\x12\x31\n\x0emodule_variant\x18\x03 \x01(\x0b\x32\x19.luci.resultdb.v1.Variant\x12\x1b\n\x13module_variant_hash\x18\x04 \x01(\t\x12\x13\n\x0b\x63oarse_name\x18\x05 \x01(\t\x12\x11\n\tfine_name\x18\x06 \x01(\t\x12\x11\n\tcase_name\x18\x07 \x01(\t\"w\n\x14TestIdentifierPrefix\x12\x31\n\x05level\x18\x01 \x01(\x0e\x32\".luci.resultdb.v1.AggregationLevel\x12,\n\x02id\x18\x02 \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifier\"\x8e\x01\n\x10ModuleIdentifier\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x15\n\rmodule_scheme\x18\x02 \x01(\t\x12\x31\n\x0emodule_variant\x18\x03 \x01(\x0b\x32\x19.luci.resultdb.v1.Variant\x12\x1b\n\x13module_variant_hash\x18\x04 \x01(\t\"J\n\x12\x46latTestIdentifier\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\tJ\x04\x08\x02\x10\x03R\x07variant\"b\n\rGitilesCommit\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\x12\x13\n\x0b\x63ommit_hash\x18\x04 \x01(\t\x12\x10\n\x08position\x18\x05 \x01(\x03\"O\n\x0cGerritChange\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0e\n\x06\x63hange\x18\x03 \x01(\x03\x12\x10\n\x08patchset\x18\x04 \x01(\x03\"M\n\x15SubmittedAndroidBuild\x12\x12\n\ndata_realm\x18\x01 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x02 \x01(\t\x12\x10\n\x08\x62uild_id\x18\x03 \x01(\x03\"\xe7\x01\n\x07Sources\x12\x39\n\x0egitiles_commit\x18\x01 \x01(\x0b\x32\x1f.luci.resultdb.v1.GitilesCommitH\x00\x12J\n\x17submitted_android_build\x18\x04 \x01(\x0b\x32\'.luci.resultdb.v1.SubmittedAndroidBuildH\x00\x12\x33\n\x0b\x63hangelists\x18\x02 \x03(\x0b\x32\x1e.luci.resultdb.v1.GerritChange\x12\x10\n\x08is_dirty\x18\x03 \x01(\x08\x42\x0e\n\x0c\x62\x61se_sources\"N\n\x0e\x43ommitPosition\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\x12\x10\n\x08position\x18\x04 \x01(\x03\"\x85\x01\n\tSourceRef\x12/\n\x07gitiles\x18\x01 \x01(\x0b\x32\x1c.luci.resultdb.v1.GitilesRefH\x00\x12=\n\randroid_build\x18\x02 \x01(\x0b\x32$.luci.resultdb.v1.AndroidBuildBranchH\x00\x42\x08\n\x06system\"8\n\nGitilesRef\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\"8\n\x12\x41ndroidBuildBranch\x12\x12\n\ndata_realm\x18\x01 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x02 \x01(\t\"\xa4\x02\n\x18RootInvocationDefinition\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12I\n\nproperties\x18\x03 \x01(\x0b\x32\x35.luci.resultdb.v1.RootInvocationDefinition.Properties\x12\x17\n\x0fproperties_hash\x18\x04 \x01(\t\x1a\x85\x01\n\nProperties\x12K\n\x03\x64\x65\x66\x18\x01 \x03(\x0b\x32>.luci.resultdb.v1.RootInvocationDefinition.Properties.DefEntry\x1a*\n\x08\x44\x65\x66\x45ntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"u\n\x0f\x42uildDescriptor\x12\x41\n\randroid_build\x18\x01 \x01(\x0b\x32(.luci.resultdb.v1.AndroidBuildDescriptorH\x00\x12\x11\n\x03url\x18\x02 \x01(\tB\x04\xe2\x41\x01\x03\x42\x0c\n\ndefinition\"d\n\x16\x41ndroidBuildDescriptor\x12\x12\n\ndata_realm\x18\x01 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x02 \x01(\t\x12\x14\n\x0c\x62uild_target\x18\x03 \x01(\t\x12\x10\n\x08\x62uild_id\x18\x04 \x01(\t\"W\n\x10ProducerResource\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\x12\n\ndata_realm\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x11\n\x03url\x18\x04 \x01(\tB\x04\xe2\x41\x01\x03*q\n\x10\x41ggregationLevel\x12!\n\x1d\x41GGREGATION_LEVEL_UNSPECIFIED\x10\x00\x12\x0e\n\nINVOCATION\x10\x01\x12\n\n\x06MODULE\x10\x02\x12\n\n\x06\x43OARSE\x10\x03\x12\x08\n\x04\x46INE\x10\x04\x12\x08\n\x04\x43\x41SE\x10\x05*a\n\x0cWorkUnitView\x12\x1e\n\x1aWORK_UNIT_VIEW_UNSPECIFIED\x10\x00\x12\x18\n\x14WORK_UNIT_VIEW_BASIC\x10\x01\x12\x17\n\x13WORK_UNIT_VIEW_FULL\x10\x02*m\n\x0fTestVerdictView\x12!\n\x1dTEST_VERDICT_VIEW_UNSPECIFIED\x10\x00\x12\x1b\n\x17TEST_VERDICT_VIEW_BASIC\x10\x01\x12\x1a\n\x16TEST_VERDICT_VIEW_FULL\x10\x02\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_VARIANT_DEFENTRY']._loaded_options = None
+  _globals['_VARIANT_DEFENTRY']._serialized_options = b'8\001'
+  _globals['_ROOTINVOCATIONDEFINITION_PROPERTIES_DEFENTRY']._loaded_options = None
+  _globals['_ROOTINVOCATIONDEFINITION_PROPERTIES_DEFENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDDESCRIPTOR'].fields_by_name['url']._loaded_options = None
+  _globals['_BUILDDESCRIPTOR'].fields_by_name['url']._serialized_options = b'\342A\001\003'
+  _globals['_PRODUCERRESOURCE'].fields_by_name['url']._loaded_options = None
+  _globals['_PRODUCERRESOURCE'].fields_by_name['url']._serialized_options = b'\342A\001\003'
+  _globals['_AGGREGATIONLEVEL']._serialized_start=2227
+  _globals['_AGGREGATIONLEVEL']._serialized_end=2340
+  _globals['_WORKUNITVIEW']._serialized_start=2342
+  _globals['_WORKUNITVIEW']._serialized_end=2439
+  _globals['_TESTVERDICTVIEW']._serialized_start=2441
+  _globals['_TESTVERDICTVIEW']._serialized_end=2550
+  _globals['_VARIANT']._serialized_start=106
+  _globals['_VARIANT']._serialized_end=208
+  _globals['_VARIANT_DEFENTRY']._serialized_start=166
+  _globals['_VARIANT_DEFENTRY']._serialized_end=208
+  _globals['_STRINGPAIR']._serialized_start=210
+  _globals['_STRINGPAIR']._serialized_end=250
+  _globals['_TESTIDENTIFIER']._serialized_start=253
+  _globals['_TESTIDENTIFIER']._serialized_end=452
+  _globals['_TESTIDENTIFIERPREFIX']._serialized_start=454
+  _globals['_TESTIDENTIFIERPREFIX']._serialized_end=573
+  _globals['_MODULEIDENTIFIER']._serialized_start=576
+  _globals['_MODULEIDENTIFIER']._serialized_end=718
+  _globals['_FLATTESTIDENTIFIER']._serialized_start=720
+  _globals['_FLATTESTIDENTIFIER']._serialized_end=794
+  _globals['_GITILESCOMMIT']._serialized_start=796
+  _globals['_GITILESCOMMIT']._serialized_end=894
+  _globals['_GERRITCHANGE']._serialized_start=896
+  _globals['_GERRITCHANGE']._serialized_end=975
+  _globals['_SUBMITTEDANDROIDBUILD']._serialized_start=977
+  _globals['_SUBMITTEDANDROIDBUILD']._serialized_end=1054
+  _globals['_SOURCES']._serialized_start=1057
+  _globals['_SOURCES']._serialized_end=1288
+  _globals['_COMMITPOSITION']._serialized_start=1290
+  _globals['_COMMITPOSITION']._serialized_end=1368
+  _globals['_SOURCEREF']._serialized_start=1371
+  _globals['_SOURCEREF']._serialized_end=1504
+  _globals['_GITILESREF']._serialized_start=1506
+  _globals['_GITILESREF']._serialized_end=1562
+  _globals['_ANDROIDBUILDBRANCH']._serialized_start=1564
+  _globals['_ANDROIDBUILDBRANCH']._serialized_end=1620
+  _globals['_ROOTINVOCATIONDEFINITION']._serialized_start=1623
+  _globals['_ROOTINVOCATIONDEFINITION']._serialized_end=1915
+  _globals['_ROOTINVOCATIONDEFINITION_PROPERTIES']._serialized_start=1782
+  _globals['_ROOTINVOCATIONDEFINITION_PROPERTIES']._serialized_end=1915
+  _globals['_ROOTINVOCATIONDEFINITION_PROPERTIES_DEFENTRY']._serialized_start=166
+  _globals['_ROOTINVOCATIONDEFINITION_PROPERTIES_DEFENTRY']._serialized_end=208
+  _globals['_BUILDDESCRIPTOR']._serialized_start=1917
+  _globals['_BUILDDESCRIPTOR']._serialized_end=2034
+  _globals['_ANDROIDBUILDDESCRIPTOR']._serialized_start=2036
+  _globals['_ANDROIDBUILDDESCRIPTOR']._serialized_end=2136
+  _globals['_PRODUCERRESOURCE']._serialized_start=2138
+  _globals['_PRODUCERRESOURCE']._serialized_end=2225
+# @@protoc_insertion_point(module_scope)
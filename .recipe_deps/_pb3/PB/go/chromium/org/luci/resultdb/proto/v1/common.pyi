@@ -0,0 +1,249 @@
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AggregationLevel(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    AGGREGATION_LEVEL_UNSPECIFIED: _ClassVar[AggregationLevel]
+    INVOCATION: _ClassVar[AggregationLevel]
+    MODULE: _ClassVar[AggregationLevel]
+    COARSE: _ClassVar[AggregationLevel]
+    FINE: _ClassVar[AggregationLevel]
+    CASE: _ClassVar[AggregationLevel]
+
+class WorkUnitView(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    WORK_UNIT_VIEW_UNSPECIFIED: _ClassVar[WorkUnitView]
+    WORK_UNIT_VIEW_BASIC: _ClassVar[WorkUnitView]
+    WORK_UNIT_VIEW_FULL: _ClassVar[WorkUnitView]
+
+class TestVerdictView(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TEST_VERDICT_VIEW_UNSPECIFIED: _ClassVar[TestVerdictView]
+    TEST_VERDICT_VIEW_BASIC: _ClassVar[TestVerdictView]
+    TEST_VERDICT_VIEW_FULL: _ClassVar[TestVerdictView]
+AGGREGATION_LEVEL_UNSPECIFIED: AggregationLevel
+INVOCATION: AggregationLevel
+MODULE: AggregationLevel
+COARSE: AggregationLevel
+FINE: AggregationLevel
+CASE: AggregationLevel
+WORK_UNIT_VIEW_UNSPECIFIED: WorkUnitView
+WORK_UNIT_VIEW_BASIC: WorkUnitView
+WORK_UNIT_VIEW_FULL: WorkUnitView
+TEST_VERDICT_VIEW_UNSPECIFIED: TestVerdictView
+TEST_VERDICT_VIEW_BASIC: TestVerdictView
+TEST_VERDICT_VIEW_FULL: TestVerdictView
+
+class Variant(_message.Message):
+    __slots__ = ()
+    class DefEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    DEF_FIELD_NUMBER: _ClassVar[int]
+    def __init__(self, **kwargs) -> None: ...
+
+class StringPair(_message.Message):
+    __slots__ = ("key", "value")
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    key: str
+    value: str
+    def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+
+class TestIdentifier(_message.Message):
+    __slots__ = ("module_name", "module_scheme", "module_variant", "module_variant_hash", "coarse_name", "fine_name", "case_name")
+    MODULE_NAME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_SCHEME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    COARSE_NAME_FIELD_NUMBER: _ClassVar[int]
+    FINE_NAME_FIELD_NUMBER: _ClassVar[int]
+    CASE_NAME_FIELD_NUMBER: _ClassVar[int]
+    module_name: str
+    module_scheme: str
+    module_variant: Variant
+    module_variant_hash: str
+    coarse_name: str
+    fine_name: str
+    case_name: str
+    def __init__(self, module_name: _Optional[str] = ..., module_scheme: _Optional[str] = ..., module_variant: _Optional[_Union[Variant, _Mapping]] = ..., module_variant_hash: _Optional[str] = ..., coarse_name: _Optional[str] = ..., fine_name: _Optional[str] = ..., case_name: _Optional[str] = ...) -> None: ...
+
+class TestIdentifierPrefix(_message.Message):
+    __slots__ = ("level", "id")
+    LEVEL_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    level: AggregationLevel
+    id: TestIdentifier
+    def __init__(self, level: _Optional[_Union[AggregationLevel, str]] = ..., id: _Optional[_Union[TestIdentifier, _Mapping]] = ...) -> None: ...
+
+class ModuleIdentifier(_message.Message):
+    __slots__ = ("module_name", "module_scheme", "module_variant", "module_variant_hash")
+    MODULE_NAME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_SCHEME_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_FIELD_NUMBER: _ClassVar[int]
+    MODULE_VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    module_name: str
+    module_scheme: str
+    module_variant: Variant
+    module_variant_hash: str
+    def __init__(self, module_name: _Optional[str] = ..., module_scheme: _Optional[str] = ..., module_variant: _Optional[_Union[Variant, _Mapping]] = ..., module_variant_hash: _Optional[str] = ...) -> None: ...
+
+class FlatTestIdentifier(_message.Message):
+    __slots__ = ("test_id", "variant_hash")
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant_hash: str
+    def __init__(self, test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ...) -> None: ...
+
+class GitilesCommit(_message.Message):
+    __slots__ = ("host", "project", "ref", "commit_hash", "position")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_HASH_FIELD_NUMBER: _ClassVar[int]
+    POSITION_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    ref: str
+    commit_hash: str
+    position: int
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ..., commit_hash: _Optional[str] = ..., position: _Optional[int] = ...) -> None: ...
+
+class GerritChange(_message.Message):
+    __slots__ = ("host", "project", "change", "patchset")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_FIELD_NUMBER: _ClassVar[int]
+    PATCHSET_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    change: int
+    patchset: int
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., change: _Optional[int] = ..., patchset: _Optional[int] = ...) -> None: ...
+
+class SubmittedAndroidBuild(_message.Message):
+    __slots__ = ("data_realm", "branch", "build_id")
+    DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    data_realm: str
+    branch: str
+    build_id: int
+    def __init__(self, data_realm: _Optional[str] = ..., branch: _Optional[str] = ..., build_id: _Optional[int] = ...) -> None: ...
+
+class Sources(_message.Message):
+    __slots__ = ("gitiles_commit", "submitted_android_build", "changelists", "is_dirty")
+    GITILES_COMMIT_FIELD_NUMBER: _ClassVar[int]
+    SUBMITTED_ANDROID_BUILD_FIELD_NUMBER: _ClassVar[int]
+    CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+    IS_DIRTY_FIELD_NUMBER: _ClassVar[int]
+    gitiles_commit: GitilesCommit
+    submitted_android_build: SubmittedAndroidBuild
+    changelists: _containers.RepeatedCompositeFieldContainer[GerritChange]
+    is_dirty: bool
+    def __init__(self, gitiles_commit: _Optional[_Union[GitilesCommit, _Mapping]] = ..., submitted_android_build: _Optional[_Union[SubmittedAndroidBuild, _Mapping]] = ..., changelists: _Optional[_Iterable[_Union[GerritChange, _Mapping]]] = ..., is_dirty: bool = ...) -> None: ...
+
+class CommitPosition(_message.Message):
+    __slots__ = ("host", "project", "ref", "position")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    POSITION_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    ref: str
+    position: int
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ..., position: _Optional[int] = ...) -> None: ...
+
+class SourceRef(_message.Message):
+    __slots__ = ("gitiles", "android_build")
+    GITILES_FIELD_NUMBER: _ClassVar[int]
+    ANDROID_BUILD_FIELD_NUMBER: _ClassVar[int]
+    gitiles: GitilesRef
+    android_build: AndroidBuildBranch
+    def __init__(self, gitiles: _Optional[_Union[GitilesRef, _Mapping]] = ..., android_build: _Optional[_Union[AndroidBuildBranch, _Mapping]] = ...) -> None: ...
+
+class GitilesRef(_message.Message):
+    __slots__ = ("host", "project", "ref")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    ref: str
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ...) -> None: ...
+
+class AndroidBuildBranch(_message.Message):
+    __slots__ = ("data_realm", "branch")
+    DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    data_realm: str
+    branch: str
+    def __init__(self, data_realm: _Optional[str] = ..., branch: _Optional[str] = ...) -> None: ...
+
+class RootInvocationDefinition(_message.Message):
+    __slots__ = ("system", "name", "properties", "properties_hash")
+    class Properties(_message.Message):
+        __slots__ = ()
+        class DefEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: str
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+        DEF_FIELD_NUMBER: _ClassVar[int]
+        def __init__(self, **kwargs) -> None: ...
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_HASH_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    name: str
+    properties: RootInvocationDefinition.Properties
+    properties_hash: str
+    def __init__(self, system: _Optional[str] = ..., name: _Optional[str] = ..., properties: _Optional[_Union[RootInvocationDefinition.Properties, _Mapping]] = ..., properties_hash: _Optional[str] = ...) -> None: ...
+
+class BuildDescriptor(_message.Message):
+    __slots__ = ("android_build", "url")
+    ANDROID_BUILD_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    android_build: AndroidBuildDescriptor
+    url: str
+    def __init__(self, android_build: _Optional[_Union[AndroidBuildDescriptor, _Mapping]] = ..., url: _Optional[str] = ...) -> None: ...
+
+class AndroidBuildDescriptor(_message.Message):
+    __slots__ = ("data_realm", "branch", "build_target", "build_id")
+    DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    BUILD_TARGET_FIELD_NUMBER: _ClassVar[int]
+    BUILD_ID_FIELD_NUMBER: _ClassVar[int]
+    data_realm: str
+    branch: str
+    build_target: str
+    build_id: str
+    def __init__(self, data_realm: _Optional[str] = ..., branch: _Optional[str] = ..., build_target: _Optional[str] = ..., build_id: _Optional[str] = ...) -> None: ...
+
+class ProducerResource(_message.Message):
+    __slots__ = ("system", "data_realm", "name", "url")
+    SYSTEM_FIELD_NUMBER: _ClassVar[int]
+    DATA_REALM_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    system: str
+    data_realm: str
+    name: str
+    url: str
+    def __init__(self, system: _Optional[str] = ..., data_realm: _Optional[str] = ..., name: _Optional[str] = ..., url: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,37 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class FailureReason(_message.Message):
+    __slots__ = ("kind", "primary_error_message", "errors", "truncated_errors_count")
+    class Kind(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        KIND_UNSPECIFIED: _ClassVar[FailureReason.Kind]
+        ORDINARY: _ClassVar[FailureReason.Kind]
+        CRASH: _ClassVar[FailureReason.Kind]
+        TIMEOUT: _ClassVar[FailureReason.Kind]
+    KIND_UNSPECIFIED: FailureReason.Kind
+    ORDINARY: FailureReason.Kind
+    CRASH: FailureReason.Kind
+    TIMEOUT: FailureReason.Kind
+    class Error(_message.Message):
+        __slots__ = ("message", "trace")
+        MESSAGE_FIELD_NUMBER: _ClassVar[int]
+        TRACE_FIELD_NUMBER: _ClassVar[int]
+        message: str
+        trace: str
+        def __init__(self, message: _Optional[str] = ..., trace: _Optional[str] = ...) -> None: ...
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    PRIMARY_ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ERRORS_FIELD_NUMBER: _ClassVar[int]
+    TRUNCATED_ERRORS_COUNT_FIELD_NUMBER: _ClassVar[int]
+    kind: FailureReason.Kind
+    primary_error_message: str
+    errors: _containers.RepeatedCompositeFieldContainer[FailureReason.Error]
+    truncated_errors_count: int
+    def __init__(self, kind: _Optional[_Union[FailureReason.Kind, str]] = ..., primary_error_message: _Optional[str] = ..., errors: _Optional[_Iterable[_Union[FailureReason.Error, _Mapping]]] = ..., truncated_errors_count: _Optional[int] = ...) -> None: ...
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/instruction.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/instruction.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n8go.chromium.org/luci/resultdb/proto/v1/instruction.proto\x12\x10luci.resultdb.v1\"C\n\x0cInstructions\x12\x33\n\x0cinstructions\x18\x01 \x03(\x0b\x32\x1d.luci.resultdb.v1.Instruction\"\xf9\x01\n\x0bInstruction\x12\n\n\x02id\x18\x01 \x01(\t\x12/\n\x04type\x18\x02 \x01(\x0e\x32!.luci.resultdb.v1.InstructionType\x12\x44\n\x15targeted_instructions\x18\x03 \x03(\x0b\x32%.luci.resultdb.v1.TargetedInstruction\x12?\n\x12instruction_filter\x18\x04 \x01(\x0b\x32#.luci.resultdb.v1.InstructionFilter\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x18\n\x10\x64\x65scriptive_name\x18\x06 \x01(\t\"o\n\x11InstructionFilter\x12K\n\x0einvocation_ids\x18\x01 \x01(\x0b\x32\x31.luci.resultdb.v1.InstructionFilterByInvocationIDH\x00\x42\r\n\x0b\x66ilter_type\"L\n\x1fInstructionFilterByInvocationID\x12\x16\n\x0einvocation_ids\x18\x01 \x03(\t\x12\x11\n\trecursive\x18\x02 \x01(\x08\"\x9b\x01\n\x13TargetedInstruction\x12\x34\n\x07targets\x18\x01 \x03(\x0e\x32#.luci.resultdb.v1.InstructionTarget\x12=\n\x0c\x64\x65pendencies\x18\x02 \x03(\x0b\x32\'.luci.resultdb.v1.InstructionDependency\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\"F\n\x15InstructionDependency\x12\x15\n\rinvocation_id\x18\x01 \x01(\t\x12\x16\n\x0einstruction_id\x18\x02 \x01(\t*\\\n\x11InstructionTarget\x12\"\n\x1eINSTRUCTION_TARGET_UNSPECIFIED\x10\x00\x12\t\n\x05LOCAL\x10\x01\x12\n\n\x06REMOTE\x10\x02\x12\x0c\n\x08PREBUILT\x10\x03*f\n\x0fInstructionType\x12 \n\x1cINSTRUCTION_TYPE_UNSPECIFIED\x10\x00\x12\x14\n\x10STEP_INSTRUCTION\x10\x01\x12\x1b\n\x17TEST_RESULT_INSTRUCTION\x10\x02\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.instruction_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_INSTRUCTIONTARGET']._serialized_start=820
+  _globals['_INSTRUCTIONTARGET']._serialized_end=912
+  _globals['_INSTRUCTIONTYPE']._serialized_start=914
+  _globals['_INSTRUCTIONTYPE']._serialized_end=1016
+  _globals['_INSTRUCTIONS']._serialized_start=78
+  _globals['_INSTRUCTIONS']._serialized_end=145
+  _globals['_INSTRUCTION']._serialized_start=148
+  _globals['_INSTRUCTION']._serialized_end=397
+  _globals['_INSTRUCTIONFILTER']._serialized_start=399
+  _globals['_INSTRUCTIONFILTER']._serialized_end=510
+  _globals['_INSTRUCTIONFILTERBYINVOCATIONID']._serialized_start=512
+  _globals['_INSTRUCTIONFILTERBYINVOCATIONID']._serialized_end=588
+  _globals['_TARGETEDINSTRUCTION']._serialized_start=591
+  _globals['_TARGETEDINSTRUCTION']._serialized_end=746
+  _globals['_INSTRUCTIONDEPENDENCY']._serialized_start=748
+  _globals['_INSTRUCTIONDEPENDENCY']._serialized_end=818
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,82 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InstructionTarget(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    INSTRUCTION_TARGET_UNSPECIFIED: _ClassVar[InstructionTarget]
+    LOCAL: _ClassVar[InstructionTarget]
+    REMOTE: _ClassVar[InstructionTarget]
+    PREBUILT: _ClassVar[InstructionTarget]
+
+class InstructionType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    INSTRUCTION_TYPE_UNSPECIFIED: _ClassVar[InstructionType]
+    STEP_INSTRUCTION: _ClassVar[InstructionType]
+    TEST_RESULT_INSTRUCTION: _ClassVar[InstructionType]
+INSTRUCTION_TARGET_UNSPECIFIED: InstructionTarget
+LOCAL: InstructionTarget
+REMOTE: InstructionTarget
+PREBUILT: InstructionTarget
+INSTRUCTION_TYPE_UNSPECIFIED: InstructionType
+STEP_INSTRUCTION: InstructionType
+TEST_RESULT_INSTRUCTION: InstructionType
+
+class Instructions(_message.Message):
+    __slots__ = ("instructions",)
+    INSTRUCTIONS_FIELD_NUMBER: _ClassVar[int]
+    instructions: _containers.RepeatedCompositeFieldContainer[Instruction]
+    def __init__(self, instructions: _Optional[_Iterable[_Union[Instruction, _Mapping]]] = ...) -> None: ...
+
+class Instruction(_message.Message):
+    __slots__ = ("id", "type", "targeted_instructions", "instruction_filter", "name", "descriptive_name")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    TARGETED_INSTRUCTIONS_FIELD_NUMBER: _ClassVar[int]
+    INSTRUCTION_FILTER_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTIVE_NAME_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    type: InstructionType
+    targeted_instructions: _containers.RepeatedCompositeFieldContainer[TargetedInstruction]
+    instruction_filter: InstructionFilter
+    name: str
+    descriptive_name: str
+    def __init__(self, id: _Optional[str] = ..., type: _Optional[_Union[InstructionType, str]] = ..., targeted_instructions: _Optional[_Iterable[_Union[TargetedInstruction, _Mapping]]] = ..., instruction_filter: _Optional[_Union[InstructionFilter, _Mapping]] = ..., name: _Optional[str] = ..., descriptive_name: _Optional[str] = ...) -> None: ...
+
+class InstructionFilter(_message.Message):
+    __slots__ = ("invocation_ids",)
+    INVOCATION_IDS_FIELD_NUMBER: _ClassVar[int]
+    invocation_ids: InstructionFilterByInvocationID
+    def __init__(self, invocation_ids: _Optional[_Union[InstructionFilterByInvocationID, _Mapping]] = ...) -> None: ...
+
+class InstructionFilterByInvocationID(_message.Message):
+    __slots__ = ("invocation_ids", "recursive")
+    INVOCATION_IDS_FIELD_NUMBER: _ClassVar[int]
+    RECURSIVE_FIELD_NUMBER: _ClassVar[int]
+    invocation_ids: _containers.RepeatedScalarFieldContainer[str]
+    recursive: bool
+    def __init__(self, invocation_ids: _Optional[_Iterable[str]] = ..., recursive: bool = ...) -> None: ...
+
+class TargetedInstruction(_message.Message):
+    __slots__ = ("targets", "dependencies", "content")
+    TARGETS_FIELD_NUMBER: _ClassVar[int]
+    DEPENDENCIES_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    targets: _containers.RepeatedScalarFieldContainer[InstructionTarget]
+    dependencies: _containers.RepeatedCompositeFieldContainer[InstructionDependency]
+    content: str
+    def __init__(self, targets: _Optional[_Iterable[_Union[InstructionTarget, str]]] = ..., dependencies: _Optional[_Iterable[_Union[InstructionDependency, _Mapping]]] = ..., content: _Optional[str] = ...) -> None: ...
+
+class InstructionDependency(_message.Message):
+    __slots__ = ("invocation_id", "instruction_id")
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    INSTRUCTION_ID_FIELD_NUMBER: _ClassVar[int]
+    invocation_id: str
+    instruction_id: str
+    def __init__(self, invocation_id: _Optional[str] = ..., instruction_id: _Optional[str] = ...) -> None: ...
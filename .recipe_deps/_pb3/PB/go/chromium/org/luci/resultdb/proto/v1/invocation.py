@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/invocation.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/invocation.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import instruction as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_instruction__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import predicate as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_predicate__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7go.chromium.org/luci/resultdb/proto/v1/invocation.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/instruction.proto\x1a\x36go.chromium.org/luci/resultdb/proto/v1/predicate.proto\"\x9e\t\n\nInvocation\x12\x13\n\x04name\x18\x01 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x31\n\x05state\x18\x02 \x01(\x0e\x32\".luci.resultdb.v1.Invocation.State\x12\x36\n\x0b\x63reate_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x05\xe2\x41\x02\x03\x05\x12*\n\x04tags\x18\x05 \x03(\x0b\x32\x1c.luci.resultdb.v1.StringPair\x12=\n\x13\x66inalize_start_time\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x37\n\rfinalize_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12,\n\x08\x64\x65\x61\x64line\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1c\n\x14included_invocations\x18\x08 \x03(\t\x12\x1c\n\x0eis_export_root\x18\x15 \x01(\x08\x42\x04\xe2\x41\x01\x05\x12\x35\n\tmodule_id\x18\x19 \x01(\x0b\x32\".luci.resultdb.v1.ModuleIdentifier\x12:\n\x10\x62igquery_exports\x18\t \x03(\x0b\x32 .luci.resultdb.v1.BigQueryExport\x12\x18\n\ncreated_by\x18\n \x01(\tB\x04\xe2\x41\x01\x03\x12\x19\n\x11producer_resource\x18\x0b \x01(\t\x12\r\n\x05realm\x18\x0c \x01(\t\x12=\n\x0fhistory_options\x18\r \x01(\x0b\x32 .luci.resultdb.v1.HistoryOptionsB\x02\x18\x01\x12+\n\nproperties\x18\x0e \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x31\n\x0bsource_spec\x18\x0f \x01(\x0b\x32\x1c.luci.resultdb.v1.SourceSpec\x12\x1c\n\x14is_source_spec_final\x18\x14 \x01(\x08\x12\x13\n\x0b\x62\x61seline_id\x18\x10 \x01(\t\x12\x34\n\x0cinstructions\x18\x17 \x01(\x0b\x32\x1e.luci.resultdb.v1.Instructions\x12?\n\x16TestResultVariantUnion\x18\x18 \x01(\x0b\x32\x19.luci.resultdb.v1.VariantB\x04\xe2\x41\x01\x03\x12Q\n\x13\x65xtended_properties\x18\x16 \x03(\x0b\x32\x34.luci.resultdb.v1.Invocation.ExtendedPropertiesEntry\x1aR\n\x17\x45xtendedPropertiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct:\x02\x38\x01\"I\n\x05State\x12\x15\n\x11STATE_UNSPECIFIED\x10\x00\x12\n\n\x06\x41\x43TIVE\x10\x01\x12\x0e\n\nFINALIZING\x10\x02\x12\r\n\tFINALIZED\x10\x03J\x04\x08\x03\x10\x04J\x04\x08\x11\x10\x12J\x04\x08\x12\x10\x13\"\x84\x03\n\x0e\x42igQueryExport\x12\x15\n\x07project\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x15\n\x07\x64\x61taset\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12\x13\n\x05table\x18\x03 \x01(\tB\x04\xe2\x41\x01\x02\x12\x44\n\x0ctest_results\x18\x04 \x01(\x0b\x32,.luci.resultdb.v1.BigQueryExport.TestResultsH\x00\x12H\n\x0etext_artifacts\x18\x06 \x01(\x0b\x32..luci.resultdb.v1.BigQueryExport.TextArtifactsH\x00\x1aG\n\x0bTestResults\x12\x38\n\tpredicate\x18\x01 \x01(\x0b\x32%.luci.resultdb.v1.TestResultPredicate\x1aG\n\rTextArtifacts\x12\x36\n\tpredicate\x18\x01 \x01(\x0b\x32#.luci.resultdb.v1.ArtifactPredicateB\r\n\x0bresult_type\"l\n\x0eHistoryOptions\x12$\n\x18use_invocation_timestamp\x18\x01 \x01(\x08\x42\x02\x18\x01\x12\x34\n\x06\x63ommit\x18\x02 \x01(\x0b\x32 .luci.resultdb.v1.CommitPositionB\x02\x18\x01\"I\n\nSourceSpec\x12*\n\x07sources\x18\x01 \x01(\x0b\x32\x19.luci.resultdb.v1.Sources\x12\x0f\n\x07inherit\x18\x02 \x01(\x08\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.invocation_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_INVOCATION_EXTENDEDPROPERTIESENTRY']._loaded_options = None
+  _globals['_INVOCATION_EXTENDEDPROPERTIESENTRY']._serialized_options = b'8\001'
+  _globals['_INVOCATION'].fields_by_name['name']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['name']._serialized_options = b'\342A\002\003\005'
+  _globals['_INVOCATION'].fields_by_name['create_time']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['create_time']._serialized_options = b'\342A\002\003\005'
+  _globals['_INVOCATION'].fields_by_name['finalize_start_time']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['finalize_start_time']._serialized_options = b'\342A\001\003'
+  _globals['_INVOCATION'].fields_by_name['finalize_time']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['finalize_time']._serialized_options = b'\342A\001\003'
+  _globals['_INVOCATION'].fields_by_name['is_export_root']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['is_export_root']._serialized_options = b'\342A\001\005'
+  _globals['_INVOCATION'].fields_by_name['created_by']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['created_by']._serialized_options = b'\342A\001\003'
+  _globals['_INVOCATION'].fields_by_name['history_options']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['history_options']._serialized_options = b'\030\001'
+  _globals['_INVOCATION'].fields_by_name['TestResultVariantUnion']._loaded_options = None
+  _globals['_INVOCATION'].fields_by_name['TestResultVariantUnion']._serialized_options = b'\342A\001\003'
+  _globals['_BIGQUERYEXPORT'].fields_by_name['project']._loaded_options = None
+  _globals['_BIGQUERYEXPORT'].fields_by_name['project']._serialized_options = b'\342A\001\002'
+  _globals['_BIGQUERYEXPORT'].fields_by_name['dataset']._loaded_options = None
+  _globals['_BIGQUERYEXPORT'].fields_by_name['dataset']._serialized_options = b'\342A\001\002'
+  _globals['_BIGQUERYEXPORT'].fields_by_name['table']._loaded_options = None
+  _globals['_BIGQUERYEXPORT'].fields_by_name['table']._serialized_options = b'\342A\001\002'
+  _globals['_HISTORYOPTIONS'].fields_by_name['use_invocation_timestamp']._loaded_options = None
+  _globals['_HISTORYOPTIONS'].fields_by_name['use_invocation_timestamp']._serialized_options = b'\030\001'
+  _globals['_HISTORYOPTIONS'].fields_by_name['commit']._loaded_options = None
+  _globals['_HISTORYOPTIONS'].fields_by_name['commit']._serialized_options = b'\030\001'
+  _globals['_INVOCATION']._serialized_start=341
+  _globals['_INVOCATION']._serialized_end=1523
+  _globals['_INVOCATION_EXTENDEDPROPERTIESENTRY']._serialized_start=1348
+  _globals['_INVOCATION_EXTENDEDPROPERTIESENTRY']._serialized_end=1430
+  _globals['_INVOCATION_STATE']._serialized_start=1432
+  _globals['_INVOCATION_STATE']._serialized_end=1505
+  _globals['_BIGQUERYEXPORT']._serialized_start=1526
+  _globals['_BIGQUERYEXPORT']._serialized_end=1914
+  _globals['_BIGQUERYEXPORT_TESTRESULTS']._serialized_start=1755
+  _globals['_BIGQUERYEXPORT_TESTRESULTS']._serialized_end=1826
+  _globals['_BIGQUERYEXPORT_TEXTARTIFACTS']._serialized_start=1828
+  _globals['_BIGQUERYEXPORT_TEXTARTIFACTS']._serialized_end=1899
+  _globals['_HISTORYOPTIONS']._serialized_start=1916
+  _globals['_HISTORYOPTIONS']._serialized_end=2024
+  _globals['_SOURCESPEC']._serialized_start=2026
+  _globals['_SOURCESPEC']._serialized_end=2099
+# @@protoc_insertion_point(module_scope)
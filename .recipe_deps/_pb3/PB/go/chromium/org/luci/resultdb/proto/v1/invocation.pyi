@@ -0,0 +1,121 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import instruction as _instruction_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import predicate as _predicate_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Invocation(_message.Message):
+    __slots__ = ("name", "state", "create_time", "tags", "finalize_start_time", "finalize_time", "deadline", "included_invocations", "is_export_root", "module_id", "bigquery_exports", "created_by", "producer_resource", "realm", "history_options", "properties", "source_spec", "is_source_spec_final", "baseline_id", "instructions", "TestResultVariantUnion", "extended_properties")
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATE_UNSPECIFIED: _ClassVar[Invocation.State]
+        ACTIVE: _ClassVar[Invocation.State]
+        FINALIZING: _ClassVar[Invocation.State]
+        FINALIZED: _ClassVar[Invocation.State]
+    STATE_UNSPECIFIED: Invocation.State
+    ACTIVE: Invocation.State
+    FINALIZING: Invocation.State
+    FINALIZED: Invocation.State
+    class ExtendedPropertiesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: _struct_pb2.Struct
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    FINALIZE_START_TIME_FIELD_NUMBER: _ClassVar[int]
+    FINALIZE_TIME_FIELD_NUMBER: _ClassVar[int]
+    DEADLINE_FIELD_NUMBER: _ClassVar[int]
+    INCLUDED_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    IS_EXPORT_ROOT_FIELD_NUMBER: _ClassVar[int]
+    MODULE_ID_FIELD_NUMBER: _ClassVar[int]
+    BIGQUERY_EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    CREATED_BY_FIELD_NUMBER: _ClassVar[int]
+    PRODUCER_RESOURCE_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    HISTORY_OPTIONS_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_SPEC_FIELD_NUMBER: _ClassVar[int]
+    IS_SOURCE_SPEC_FINAL_FIELD_NUMBER: _ClassVar[int]
+    BASELINE_ID_FIELD_NUMBER: _ClassVar[int]
+    INSTRUCTIONS_FIELD_NUMBER: _ClassVar[int]
+    TESTRESULTVARIANTUNION_FIELD_NUMBER: _ClassVar[int]
+    EXTENDED_PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    state: Invocation.State
+    create_time: _timestamp_pb2.Timestamp
+    tags: _containers.RepeatedCompositeFieldContainer[_common_pb2.StringPair]
+    finalize_start_time: _timestamp_pb2.Timestamp
+    finalize_time: _timestamp_pb2.Timestamp
+    deadline: _timestamp_pb2.Timestamp
+    included_invocations: _containers.RepeatedScalarFieldContainer[str]
+    is_export_root: bool
+    module_id: _common_pb2.ModuleIdentifier
+    bigquery_exports: _containers.RepeatedCompositeFieldContainer[BigQueryExport]
+    created_by: str
+    producer_resource: str
+    realm: str
+    history_options: HistoryOptions
+    properties: _struct_pb2.Struct
+    source_spec: SourceSpec
+    is_source_spec_final: bool
+    baseline_id: str
+    instructions: _instruction_pb2.Instructions
+    TestResultVariantUnion: _common_pb2.Variant
+    extended_properties: _containers.MessageMap[str, _struct_pb2.Struct]
+    def __init__(self, name: _Optional[str] = ..., state: _Optional[_Union[Invocation.State, str]] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., tags: _Optional[_Iterable[_Union[_common_pb2.StringPair, _Mapping]]] = ..., finalize_start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., finalize_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., deadline: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., included_invocations: _Optional[_Iterable[str]] = ..., is_export_root: bool = ..., module_id: _Optional[_Union[_common_pb2.ModuleIdentifier, _Mapping]] = ..., bigquery_exports: _Optional[_Iterable[_Union[BigQueryExport, _Mapping]]] = ..., created_by: _Optional[str] = ..., producer_resource: _Optional[str] = ..., realm: _Optional[str] = ..., history_options: _Optional[_Union[HistoryOptions, _Mapping]] = ..., properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., source_spec: _Optional[_Union[SourceSpec, _Mapping]] = ..., is_source_spec_final: bool = ..., baseline_id: _Optional[str] = ..., instructions: _Optional[_Union[_instruction_pb2.Instructions, _Mapping]] = ..., TestResultVariantUnion: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., extended_properties: _Optional[_Mapping[str, _struct_pb2.Struct]] = ...) -> None: ...
+
+class BigQueryExport(_message.Message):
+    __slots__ = ("project", "dataset", "table", "test_results", "text_artifacts")
+    class TestResults(_message.Message):
+        __slots__ = ("predicate",)
+        PREDICATE_FIELD_NUMBER: _ClassVar[int]
+        predicate: _predicate_pb2.TestResultPredicate
+        def __init__(self, predicate: _Optional[_Union[_predicate_pb2.TestResultPredicate, _Mapping]] = ...) -> None: ...
+    class TextArtifacts(_message.Message):
+        __slots__ = ("predicate",)
+        PREDICATE_FIELD_NUMBER: _ClassVar[int]
+        predicate: _predicate_pb2.ArtifactPredicate
+        def __init__(self, predicate: _Optional[_Union[_predicate_pb2.ArtifactPredicate, _Mapping]] = ...) -> None: ...
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    DATASET_FIELD_NUMBER: _ClassVar[int]
+    TABLE_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    TEXT_ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    dataset: str
+    table: str
+    test_results: BigQueryExport.TestResults
+    text_artifacts: BigQueryExport.TextArtifacts
+    def __init__(self, project: _Optional[str] = ..., dataset: _Optional[str] = ..., table: _Optional[str] = ..., test_results: _Optional[_Union[BigQueryExport.TestResults, _Mapping]] = ..., text_artifacts: _Optional[_Union[BigQueryExport.TextArtifacts, _Mapping]] = ...) -> None: ...
+
+class HistoryOptions(_message.Message):
+    __slots__ = ("use_invocation_timestamp", "commit")
+    USE_INVOCATION_TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_FIELD_NUMBER: _ClassVar[int]
+    use_invocation_timestamp: bool
+    commit: _common_pb2.CommitPosition
+    def __init__(self, use_invocation_timestamp: bool = ..., commit: _Optional[_Union[_common_pb2.CommitPosition, _Mapping]] = ...) -> None: ...
+
+class SourceSpec(_message.Message):
+    __slots__ = ("sources", "inherit")
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    INHERIT_FIELD_NUMBER: _ClassVar[int]
+    sources: _common_pb2.Sources
+    inherit: bool
+    def __init__(self, sources: _Optional[_Union[_common_pb2.Sources, _Mapping]] = ..., inherit: bool = ...) -> None: ...
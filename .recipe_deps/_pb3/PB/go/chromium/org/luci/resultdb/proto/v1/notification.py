@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/notification.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/notification.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import work_unit as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_work__unit__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import root_invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_root__invocation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_aggregation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__aggregation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/resultdb/proto/v1/notification.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a\x36go.chromium.org/luci/resultdb/proto/v1/work_unit.proto\x1a<go.chromium.org/luci/resultdb/proto/v1/root_invocation.proto\x1a=go.chromium.org/luci/resultdb/proto/v1/test_aggregation.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\"\xa4\x01\n\x1fInvocationFinalizedNotification\x12\x12\n\ninvocation\x18\x01 \x01(\t\x12\r\n\x05realm\x18\x02 \x01(\t\x12\x16\n\x0eis_export_root\x18\x03 \x01(\x08\x12\x15\n\rresultdb_host\x18\x04 \x01(\t\x12/\n\x0b\x63reate_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"w\n#RootInvocationFinalizedNotification\x12\x39\n\x0froot_invocation\x18\x01 \x01(\x0b\x32 .luci.resultdb.v1.RootInvocation\x12\x15\n\rresultdb_host\x18\x02 \x01(\t\"\x85\x02\n$InvocationReadyForExportNotification\x12\x15\n\rresultdb_host\x18\x06 \x01(\t\x12\x17\n\x0froot_invocation\x18\x01 \x01(\t\x12\x1d\n\x15root_invocation_realm\x18\x02 \x01(\t\x12\x34\n\x10root_create_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\ninvocation\x18\x03 \x01(\t\x12\x18\n\x10invocation_realm\x18\x04 \x01(\t\x12*\n\x07sources\x18\x05 \x01(\x0b\x32\x19.luci.resultdb.v1.Sources\"\x84\x03\n\x17TestResultsNotification\x12\x62\n\x19test_results_by_work_unit\x18\x01 \x03(\x0b\x32?.luci.resultdb.v1.TestResultsNotification.TestResultsByWorkUnit\x12\x15\n\rresultdb_host\x18\x02 \x01(\t\x12\x19\n\x11\x64\x65\x64uplication_key\x18\x04 \x01(\t\x12J\n\x18root_invocation_metadata\x18\x05 \x01(\x0b\x32(.luci.resultdb.v1.RootInvocationMetadata\x1a\x80\x01\n\x15TestResultsByWorkUnit\x12\x32\n\x0ctest_results\x18\x02 \x03(\x0b\x32\x1c.luci.resultdb.v1.TestResult\x12-\n\twork_unit\x18\x03 \x01(\x0b\x32\x1a.luci.resultdb.v1.WorkUnitJ\x04\x08\x01\x10\x02J\x04\x08\x03\x10\x04\"\xbd\x01\n\x15WorkUnitsNotification\x12K\n\nwork_units\x18\x01 \x03(\x0b\x32\x37.luci.resultdb.v1.WorkUnitsNotification.WorkUnitDetails\x12\x15\n\rresultdb_host\x18\x02 \x01(\t\x1a@\n\x0fWorkUnitDetails\x12\x16\n\x0ework_unit_name\x18\x01 \x01(\t\x12\x15\n\rhas_artifacts\x18\x02 \x01(\x08\"\xcb\x01\n\x1cTestAggregationsNotification\x12\x17\n\x0froot_invocation\x18\x01 \x01(\t\x12<\n\x11test_aggregations\x18\x02 \x03(\x0b\x32!.luci.resultdb.v1.TestAggregation\x12\x15\n\rresultdb_host\x18\x03 \x01(\t\x12=\n\x11\x61ggregation_level\x18\x04 \x01(\x0e\x32\".luci.resultdb.v1.AggregationLevelBP\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.notification_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_INVOCATIONFINALIZEDNOTIFICATION']._serialized_start=405
+  _globals['_INVOCATIONFINALIZEDNOTIFICATION']._serialized_end=569
+  _globals['_ROOTINVOCATIONFINALIZEDNOTIFICATION']._serialized_start=571
+  _globals['_ROOTINVOCATIONFINALIZEDNOTIFICATION']._serialized_end=690
+  _globals['_INVOCATIONREADYFOREXPORTNOTIFICATION']._serialized_start=693
+  _globals['_INVOCATIONREADYFOREXPORTNOTIFICATION']._serialized_end=954
+  _globals['_TESTRESULTSNOTIFICATION']._serialized_start=957
+  _globals['_TESTRESULTSNOTIFICATION']._serialized_end=1345
+  _globals['_TESTRESULTSNOTIFICATION_TESTRESULTSBYWORKUNIT']._serialized_start=1211
+  _globals['_TESTRESULTSNOTIFICATION_TESTRESULTSBYWORKUNIT']._serialized_end=1339
+  _globals['_WORKUNITSNOTIFICATION']._serialized_start=1348
+  _globals['_WORKUNITSNOTIFICATION']._serialized_end=1537
+  _globals['_WORKUNITSNOTIFICATION_WORKUNITDETAILS']._serialized_start=1473
+  _globals['_WORKUNITSNOTIFICATION_WORKUNITDETAILS']._serialized_end=1537
+  _globals['_TESTAGGREGATIONSNOTIFICATION']._serialized_start=1540
+  _globals['_TESTAGGREGATIONSNOTIFICATION']._serialized_end=1743
+# @@protoc_insertion_point(module_scope)
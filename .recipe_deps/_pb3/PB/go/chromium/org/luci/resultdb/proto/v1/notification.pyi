@@ -0,0 +1,101 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import work_unit as _work_unit_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import root_invocation as _root_invocation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_aggregation as _test_aggregation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InvocationFinalizedNotification(_message.Message):
+    __slots__ = ("invocation", "realm", "is_export_root", "resultdb_host", "create_time")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    IS_EXPORT_ROOT_FIELD_NUMBER: _ClassVar[int]
+    RESULTDB_HOST_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    invocation: str
+    realm: str
+    is_export_root: bool
+    resultdb_host: str
+    create_time: _timestamp_pb2.Timestamp
+    def __init__(self, invocation: _Optional[str] = ..., realm: _Optional[str] = ..., is_export_root: bool = ..., resultdb_host: _Optional[str] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class RootInvocationFinalizedNotification(_message.Message):
+    __slots__ = ("root_invocation", "resultdb_host")
+    ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    RESULTDB_HOST_FIELD_NUMBER: _ClassVar[int]
+    root_invocation: _root_invocation_pb2.RootInvocation
+    resultdb_host: str
+    def __init__(self, root_invocation: _Optional[_Union[_root_invocation_pb2.RootInvocation, _Mapping]] = ..., resultdb_host: _Optional[str] = ...) -> None: ...
+
+class InvocationReadyForExportNotification(_message.Message):
+    __slots__ = ("resultdb_host", "root_invocation", "root_invocation_realm", "root_create_time", "invocation", "invocation_realm", "sources")
+    RESULTDB_HOST_FIELD_NUMBER: _ClassVar[int]
+    ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    ROOT_INVOCATION_REALM_FIELD_NUMBER: _ClassVar[int]
+    ROOT_CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_REALM_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    resultdb_host: str
+    root_invocation: str
+    root_invocation_realm: str
+    root_create_time: _timestamp_pb2.Timestamp
+    invocation: str
+    invocation_realm: str
+    sources: _common_pb2.Sources
+    def __init__(self, resultdb_host: _Optional[str] = ..., root_invocation: _Optional[str] = ..., root_invocation_realm: _Optional[str] = ..., root_create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., invocation: _Optional[str] = ..., invocation_realm: _Optional[str] = ..., sources: _Optional[_Union[_common_pb2.Sources, _Mapping]] = ...) -> None: ...
+
+class TestResultsNotification(_message.Message):
+    __slots__ = ("test_results_by_work_unit", "resultdb_host", "deduplication_key", "root_invocation_metadata")
+    class TestResultsByWorkUnit(_message.Message):
+        __slots__ = ("test_results", "work_unit")
+        TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        WORK_UNIT_FIELD_NUMBER: _ClassVar[int]
+        test_results: _containers.RepeatedCompositeFieldContainer[_test_result_pb2.TestResult]
+        work_unit: _work_unit_pb2.WorkUnit
+        def __init__(self, test_results: _Optional[_Iterable[_Union[_test_result_pb2.TestResult, _Mapping]]] = ..., work_unit: _Optional[_Union[_work_unit_pb2.WorkUnit, _Mapping]] = ...) -> None: ...
+    TEST_RESULTS_BY_WORK_UNIT_FIELD_NUMBER: _ClassVar[int]
+    RESULTDB_HOST_FIELD_NUMBER: _ClassVar[int]
+    DEDUPLICATION_KEY_FIELD_NUMBER: _ClassVar[int]
+    ROOT_INVOCATION_METADATA_FIELD_NUMBER: _ClassVar[int]
+    test_results_by_work_unit: _containers.RepeatedCompositeFieldContainer[TestResultsNotification.TestResultsByWorkUnit]
+    resultdb_host: str
+    deduplication_key: str
+    root_invocation_metadata: _root_invocation_pb2.RootInvocationMetadata
+    def __init__(self, test_results_by_work_unit: _Optional[_Iterable[_Union[TestResultsNotification.TestResultsByWorkUnit, _Mapping]]] = ..., resultdb_host: _Optional[str] = ..., deduplication_key: _Optional[str] = ..., root_invocation_metadata: _Optional[_Union[_root_invocation_pb2.RootInvocationMetadata, _Mapping]] = ...) -> None: ...
+
+class WorkUnitsNotification(_message.Message):
+    __slots__ = ("work_units", "resultdb_host")
+    class WorkUnitDetails(_message.Message):
+        __slots__ = ("work_unit_name", "has_artifacts")
+        WORK_UNIT_NAME_FIELD_NUMBER: _ClassVar[int]
+        HAS_ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+        work_unit_name: str
+        has_artifacts: bool
+        def __init__(self, work_unit_name: _Optional[str] = ..., has_artifacts: bool = ...) -> None: ...
+    WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    RESULTDB_HOST_FIELD_NUMBER: _ClassVar[int]
+    work_units: _containers.RepeatedCompositeFieldContainer[WorkUnitsNotification.WorkUnitDetails]
+    resultdb_host: str
+    def __init__(self, work_units: _Optional[_Iterable[_Union[WorkUnitsNotification.WorkUnitDetails, _Mapping]]] = ..., resultdb_host: _Optional[str] = ...) -> None: ...
+
+class TestAggregationsNotification(_message.Message):
+    __slots__ = ("root_invocation", "test_aggregations", "resultdb_host", "aggregation_level")
+    ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    TEST_AGGREGATIONS_FIELD_NUMBER: _ClassVar[int]
+    RESULTDB_HOST_FIELD_NUMBER: _ClassVar[int]
+    AGGREGATION_LEVEL_FIELD_NUMBER: _ClassVar[int]
+    root_invocation: str
+    test_aggregations: _containers.RepeatedCompositeFieldContainer[_test_aggregation_pb2.TestAggregation]
+    resultdb_host: str
+    aggregation_level: _common_pb2.AggregationLevel
+    def __init__(self, root_invocation: _Optional[str] = ..., test_aggregations: _Optional[_Iterable[_Union[_test_aggregation_pb2.TestAggregation, _Mapping]]] = ..., resultdb_host: _Optional[str] = ..., aggregation_level: _Optional[_Union[_common_pb2.AggregationLevel, str]] = ...) -> None: ...
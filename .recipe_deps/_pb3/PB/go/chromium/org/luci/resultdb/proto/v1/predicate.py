@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/predicate.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/predicate.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_aggregation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__aggregation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_verdict as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__verdict__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6go.chromium.org/luci/resultdb/proto/v1/predicate.proto\x12\x10luci.resultdb.v1\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a=go.chromium.org/luci/resultdb/proto/v1/test_aggregation.proto\x1a\x39go.chromium.org/luci/resultdb/proto/v1/test_verdict.proto\"\xac\x02\n\x13TestResultPredicate\x12\x16\n\x0etest_id_regexp\x18\x01 \x01(\t\x12\x33\n\x07variant\x18\x02 \x01(\x0b\x32\".luci.resultdb.v1.VariantPredicate\x12\x44\n\nexpectancy\x18\x03 \x01(\x0e\x32\x30.luci.resultdb.v1.TestResultPredicate.Expectancy\x12\x1a\n\x12\x65xclude_exonerated\x18\x04 \x01(\x08\"f\n\nExpectancy\x12\x07\n\x03\x41LL\x10\x00\x12$\n VARIANTS_WITH_UNEXPECTED_RESULTS\x10\x01\x12)\n%VARIANTS_WITH_ONLY_UNEXPECTED_RESULTS\x10\x02\"g\n\x18TestExonerationPredicate\x12\x16\n\x0etest_id_regexp\x18\x01 \x01(\t\x12\x33\n\x07variant\x18\x02 \x01(\x0b\x32\".luci.resultdb.v1.VariantPredicate\"{\n\x10VariantPredicate\x12+\n\x06\x65quals\x18\x01 \x01(\x0b\x32\x19.luci.resultdb.v1.VariantH\x00\x12-\n\x08\x63ontains\x18\x02 \x01(\x0b\x32\x19.luci.resultdb.v1.VariantH\x00\x42\x0b\n\tpredicate\"\xdd\x03\n\x11\x41rtifactPredicate\x12I\n\x0c\x66ollow_edges\x18\x01 \x01(\x0b\x32/.luci.resultdb.v1.ArtifactPredicate.EdgeTypeSetB\x02\x18\x01\x12G\n\rartifact_kind\x18\x07 \x01(\x0e\x32\x30.luci.resultdb.v1.ArtifactPredicate.ArtifactKind\x12\x12\n\nwork_units\x18\x08 \x03(\t\x12H\n\x15test_result_predicate\x18\x02 \x01(\x0b\x32%.luci.resultdb.v1.TestResultPredicateB\x02\x18\x01\x12\x1b\n\x13\x63ontent_type_regexp\x18\x03 \x01(\t\x12\x1a\n\x12\x61rtifact_id_regexp\x18\x04 \x01(\t\x12\x1c\n\x14\x61rtifact_type_regexp\x18\x05 \x01(\t\x1a\x41\n\x0b\x45\x64geTypeSet\x12\x1c\n\x14included_invocations\x18\x01 \x01(\x08\x12\x14\n\x0ctest_results\x18\x02 \x01(\x08\"<\n\x0c\x41rtifactKind\x12\x1d\n\x19\x41RTIFACT_KIND_UNSPECIFIED\x10\x00\x12\r\n\tWORK_UNIT\x10\x01\"D\n\x15TestMetadataPredicate\x12\x10\n\x08test_ids\x18\x01 \x03(\t\x12\x19\n\x11previous_test_ids\x18\x02 \x03(\t\")\n\x11WorkUnitPredicate\x12\x14\n\x0c\x61ncestors_of\x18\x01 \x01(\t\"\xb8\x03\n\x18TestAggregationPredicate\x12=\n\x11\x61ggregation_level\x18\x01 \x01(\x0e\x32\".luci.resultdb.v1.AggregationLevel\x12\x42\n\x12test_prefix_filter\x18\x02 \x01(\x0b\x32&.luci.resultdb.v1.TestIdentifierPrefix\x12\x17\n\x0f\x63ontents_filter\x18\x03 \x01(\t\x12N\n\rstatus_filter\x18\x05 \x01(\x0b\x32\x37.luci.resultdb.v1.TestAggregationPredicate.StatusFilter\x1a\xa1\x01\n\x0cStatusFilter\x12J\n\x18verdict_effective_status\x18\x01 \x03(\x0e\x32(.luci.resultdb.v1.VerdictEffectiveStatus\x12\x45\n\rmodule_status\x18\x02 \x03(\x0e\x32..luci.resultdb.v1.TestAggregation.ModuleStatusJ\x04\x08\x04\x10\x05R\x06\x66ilter\"\xd9\x01\n\x14TestVerdictPredicate\x12\x42\n\x12test_prefix_filter\x18\x01 \x01(\x0b\x32&.luci.resultdb.v1.TestIdentifierPrefix\x12#\n\x1b\x63ontains_test_result_filter\x18\x02 \x01(\t\x12J\n\x18\x65\x66\x66\x65\x63tive_verdict_status\x18\x04 \x03(\x0e\x32(.luci.resultdb.v1.VerdictEffectiveStatusJ\x04\x08\x03\x10\x04R\x06\x66ilterBP\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.predicate_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_ARTIFACTPREDICATE'].fields_by_name['follow_edges']._loaded_options = None
+  _globals['_ARTIFACTPREDICATE'].fields_by_name['follow_edges']._serialized_options = b'\030\001'
+  _globals['_ARTIFACTPREDICATE'].fields_by_name['test_result_predicate']._loaded_options = None
+  _globals['_ARTIFACTPREDICATE'].fields_by_name['test_result_predicate']._serialized_options = b'\030\001'
+  _globals['_TESTRESULTPREDICATE']._serialized_start=252
+  _globals['_TESTRESULTPREDICATE']._serialized_end=552
+  _globals['_TESTRESULTPREDICATE_EXPECTANCY']._serialized_start=450
+  _globals['_TESTRESULTPREDICATE_EXPECTANCY']._serialized_end=552
+  _globals['_TESTEXONERATIONPREDICATE']._serialized_start=554
+  _globals['_TESTEXONERATIONPREDICATE']._serialized_end=657
+  _globals['_VARIANTPREDICATE']._serialized_start=659
+  _globals['_VARIANTPREDICATE']._serialized_end=782
+  _globals['_ARTIFACTPREDICATE']._serialized_start=785
+  _globals['_ARTIFACTPREDICATE']._serialized_end=1262
+  _globals['_ARTIFACTPREDICATE_EDGETYPESET']._serialized_start=1135
+  _globals['_ARTIFACTPREDICATE_EDGETYPESET']._serialized_end=1200
+  _globals['_ARTIFACTPREDICATE_ARTIFACTKIND']._serialized_start=1202
+  _globals['_ARTIFACTPREDICATE_ARTIFACTKIND']._serialized_end=1262
+  _globals['_TESTMETADATAPREDICATE']._serialized_start=1264
+  _globals['_TESTMETADATAPREDICATE']._serialized_end=1332
+  _globals['_WORKUNITPREDICATE']._serialized_start=1334
+  _globals['_WORKUNITPREDICATE']._serialized_end=1375
+  _globals['_TESTAGGREGATIONPREDICATE']._serialized_start=1378
+  _globals['_TESTAGGREGATIONPREDICATE']._serialized_end=1818
+  _globals['_TESTAGGREGATIONPREDICATE_STATUSFILTER']._serialized_start=1643
+  _globals['_TESTAGGREGATIONPREDICATE_STATUSFILTER']._serialized_end=1804
+  _globals['_TESTVERDICTPREDICATE']._serialized_start=1821
+  _globals['_TESTVERDICTPREDICATE']._serialized_end=2038
+# @@protoc_insertion_point(module_scope)
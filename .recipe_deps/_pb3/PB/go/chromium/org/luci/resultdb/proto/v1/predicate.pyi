@@ -0,0 +1,121 @@
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_aggregation as _test_aggregation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_verdict as _test_verdict_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestResultPredicate(_message.Message):
+    __slots__ = ("test_id_regexp", "variant", "expectancy", "exclude_exonerated")
+    class Expectancy(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        ALL: _ClassVar[TestResultPredicate.Expectancy]
+        VARIANTS_WITH_UNEXPECTED_RESULTS: _ClassVar[TestResultPredicate.Expectancy]
+        VARIANTS_WITH_ONLY_UNEXPECTED_RESULTS: _ClassVar[TestResultPredicate.Expectancy]
+    ALL: TestResultPredicate.Expectancy
+    VARIANTS_WITH_UNEXPECTED_RESULTS: TestResultPredicate.Expectancy
+    VARIANTS_WITH_ONLY_UNEXPECTED_RESULTS: TestResultPredicate.Expectancy
+    TEST_ID_REGEXP_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    EXPECTANCY_FIELD_NUMBER: _ClassVar[int]
+    EXCLUDE_EXONERATED_FIELD_NUMBER: _ClassVar[int]
+    test_id_regexp: str
+    variant: VariantPredicate
+    expectancy: TestResultPredicate.Expectancy
+    exclude_exonerated: bool
+    def __init__(self, test_id_regexp: _Optional[str] = ..., variant: _Optional[_Union[VariantPredicate, _Mapping]] = ..., expectancy: _Optional[_Union[TestResultPredicate.Expectancy, str]] = ..., exclude_exonerated: bool = ...) -> None: ...
+
+class TestExonerationPredicate(_message.Message):
+    __slots__ = ("test_id_regexp", "variant")
+    TEST_ID_REGEXP_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    test_id_regexp: str
+    variant: VariantPredicate
+    def __init__(self, test_id_regexp: _Optional[str] = ..., variant: _Optional[_Union[VariantPredicate, _Mapping]] = ...) -> None: ...
+
+class VariantPredicate(_message.Message):
+    __slots__ = ("equals", "contains")
+    EQUALS_FIELD_NUMBER: _ClassVar[int]
+    CONTAINS_FIELD_NUMBER: _ClassVar[int]
+    equals: _common_pb2.Variant
+    contains: _common_pb2.Variant
+    def __init__(self, equals: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., contains: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ...) -> None: ...
+
+class ArtifactPredicate(_message.Message):
+    __slots__ = ("follow_edges", "artifact_kind", "work_units", "test_result_predicate", "content_type_regexp", "artifact_id_regexp", "artifact_type_regexp")
+    class ArtifactKind(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        ARTIFACT_KIND_UNSPECIFIED: _ClassVar[ArtifactPredicate.ArtifactKind]
+        WORK_UNIT: _ClassVar[ArtifactPredicate.ArtifactKind]
+    ARTIFACT_KIND_UNSPECIFIED: ArtifactPredicate.ArtifactKind
+    WORK_UNIT: ArtifactPredicate.ArtifactKind
+    class EdgeTypeSet(_message.Message):
+        __slots__ = ("included_invocations", "test_results")
+        INCLUDED_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+        TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+        included_invocations: bool
+        test_results: bool
+        def __init__(self, included_invocations: bool = ..., test_results: bool = ...) -> None: ...
+    FOLLOW_EDGES_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_KIND_FIELD_NUMBER: _ClassVar[int]
+    WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULT_PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_TYPE_REGEXP_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_REGEXP_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_TYPE_REGEXP_FIELD_NUMBER: _ClassVar[int]
+    follow_edges: ArtifactPredicate.EdgeTypeSet
+    artifact_kind: ArtifactPredicate.ArtifactKind
+    work_units: _containers.RepeatedScalarFieldContainer[str]
+    test_result_predicate: TestResultPredicate
+    content_type_regexp: str
+    artifact_id_regexp: str
+    artifact_type_regexp: str
+    def __init__(self, follow_edges: _Optional[_Union[ArtifactPredicate.EdgeTypeSet, _Mapping]] = ..., artifact_kind: _Optional[_Union[ArtifactPredicate.ArtifactKind, str]] = ..., work_units: _Optional[_Iterable[str]] = ..., test_result_predicate: _Optional[_Union[TestResultPredicate, _Mapping]] = ..., content_type_regexp: _Optional[str] = ..., artifact_id_regexp: _Optional[str] = ..., artifact_type_regexp: _Optional[str] = ...) -> None: ...
+
+class TestMetadataPredicate(_message.Message):
+    __slots__ = ("test_ids", "previous_test_ids")
+    TEST_IDS_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_TEST_IDS_FIELD_NUMBER: _ClassVar[int]
+    test_ids: _containers.RepeatedScalarFieldContainer[str]
+    previous_test_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, test_ids: _Optional[_Iterable[str]] = ..., previous_test_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class WorkUnitPredicate(_message.Message):
+    __slots__ = ("ancestors_of",)
+    ANCESTORS_OF_FIELD_NUMBER: _ClassVar[int]
+    ancestors_of: str
+    def __init__(self, ancestors_of: _Optional[str] = ...) -> None: ...
+
+class TestAggregationPredicate(_message.Message):
+    __slots__ = ("aggregation_level", "test_prefix_filter", "contents_filter", "status_filter")
+    class StatusFilter(_message.Message):
+        __slots__ = ("verdict_effective_status", "module_status")
+        VERDICT_EFFECTIVE_STATUS_FIELD_NUMBER: _ClassVar[int]
+        MODULE_STATUS_FIELD_NUMBER: _ClassVar[int]
+        verdict_effective_status: _containers.RepeatedScalarFieldContainer[_test_verdict_pb2.VerdictEffectiveStatus]
+        module_status: _containers.RepeatedScalarFieldContainer[_test_aggregation_pb2.TestAggregation.ModuleStatus]
+        def __init__(self, verdict_effective_status: _Optional[_Iterable[_Union[_test_verdict_pb2.VerdictEffectiveStatus, str]]] = ..., module_status: _Optional[_Iterable[_Union[_test_aggregation_pb2.TestAggregation.ModuleStatus, str]]] = ...) -> None: ...
+    AGGREGATION_LEVEL_FIELD_NUMBER: _ClassVar[int]
+    TEST_PREFIX_FILTER_FIELD_NUMBER: _ClassVar[int]
+    CONTENTS_FILTER_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FILTER_FIELD_NUMBER: _ClassVar[int]
+    aggregation_level: _common_pb2.AggregationLevel
+    test_prefix_filter: _common_pb2.TestIdentifierPrefix
+    contents_filter: str
+    status_filter: TestAggregationPredicate.StatusFilter
+    def __init__(self, aggregation_level: _Optional[_Union[_common_pb2.AggregationLevel, str]] = ..., test_prefix_filter: _Optional[_Union[_common_pb2.TestIdentifierPrefix, _Mapping]] = ..., contents_filter: _Optional[str] = ..., status_filter: _Optional[_Union[TestAggregationPredicate.StatusFilter, _Mapping]] = ...) -> None: ...
+
+class TestVerdictPredicate(_message.Message):
+    __slots__ = ("test_prefix_filter", "contains_test_result_filter", "effective_verdict_status")
+    TEST_PREFIX_FILTER_FIELD_NUMBER: _ClassVar[int]
+    CONTAINS_TEST_RESULT_FILTER_FIELD_NUMBER: _ClassVar[int]
+    EFFECTIVE_VERDICT_STATUS_FIELD_NUMBER: _ClassVar[int]
+    test_prefix_filter: _common_pb2.TestIdentifierPrefix
+    contains_test_result_filter: str
+    effective_verdict_status: _containers.RepeatedScalarFieldContainer[_test_verdict_pb2.VerdictEffectiveStatus]
+    def __init__(self, test_prefix_filter: _Optional[_Union[_common_pb2.TestIdentifierPrefix, _Mapping]] = ..., contains_test_result_filter: _Optional[str] = ..., effective_verdict_status: _Optional[_Iterable[_Union[_test_verdict_pb2.VerdictEffectiveStatus, str]]] = ...) -> None: ...
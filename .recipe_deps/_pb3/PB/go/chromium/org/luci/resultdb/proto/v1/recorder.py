@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/recorder.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/recorder.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import artifact as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_artifact__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_invocation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import root_invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_root__invocation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__exoneration__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import work_unit as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_work__unit__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5go.chromium.org/luci/resultdb/proto/v1/recorder.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a google/protobuf/field_mask.proto\x1a\x35go.chromium.org/luci/resultdb/proto/v1/artifact.proto\x1a\x37go.chromium.org/luci/resultdb/proto/v1/invocation.proto\x1a<go.chromium.org/luci/resultdb/proto/v1/root_invocation.proto\x1a=go.chromium.org/luci/resultdb/proto/v1/test_exoneration.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\x1a\x36go.chromium.org/luci/resultdb/proto/v1/work_unit.proto\"\xc2\x01\n\x1b\x43reateRootInvocationRequest\x12 \n\x12root_invocation_id\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x39\n\x0froot_invocation\x18\x02 \x01(\x0b\x32 .luci.resultdb.v1.RootInvocation\x12\x32\n\x0eroot_work_unit\x18\x03 \x01(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\x12\x12\n\nrequest_id\x18\x04 \x01(\t\"\x8d\x01\n\x1c\x43reateRootInvocationResponse\x12\x39\n\x0froot_invocation\x18\x01 \x01(\x0b\x32 .luci.resultdb.v1.RootInvocation\x12\x32\n\x0eroot_work_unit\x18\x02 \x01(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\"\xa3\x01\n\x1bUpdateRootInvocationRequest\x12?\n\x0froot_invocation\x18\x01 \x01(\x0b\x32 .luci.resultdb.v1.RootInvocationB\x04\xe2\x41\x01\x02\x12/\n\x0bupdate_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"\x86\x01\n\x15\x43reateWorkUnitRequest\x12\x0e\n\x06parent\x18\x01 \x01(\t\x12\x1a\n\x0cwork_unit_id\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12-\n\twork_unit\x18\x03 \x01(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\x12\x12\n\nrequest_id\x18\x04 \x01(\t\"l\n\x1b\x42\x61tchCreateWorkUnitsRequest\x12\x39\n\x08requests\x18\x01 \x03(\x0b\x32\'.luci.resultdb.v1.CreateWorkUnitRequest\x12\x12\n\nrequest_id\x18\x02 \x01(\t\"e\n\x1c\x42\x61tchCreateWorkUnitsResponse\x12.\n\nwork_units\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\x12\x15\n\rupdate_tokens\x18\x02 \x03(\t\"\x91\x01\n\x15UpdateWorkUnitRequest\x12\x33\n\twork_unit\x18\x01 \x01(\x0b\x32\x1a.luci.resultdb.v1.WorkUnitB\x04\xe2\x41\x01\x02\x12/\n\x0bupdate_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"l\n\x1b\x42\x61tchUpdateWorkUnitsRequest\x12\x39\n\x08requests\x18\x01 \x03(\x0b\x32\'.luci.resultdb.v1.UpdateWorkUnitRequest\x12\x12\n\nrequest_id\x18\x02 \x01(\t\"N\n\x1c\x42\x61tchUpdateWorkUnitsResponse\x12.\n\nwork_units\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\"~\n\x17\x46inalizeWorkUnitRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x35\n\x05state\x18\x02 \x01(\x0e\x32 .luci.resultdb.v1.WorkUnit.StateB\x04\xe2\x41\x01\x02\x12\x18\n\x10summary_markdown\x18\x03 \x01(\t\"\xbf\x02\n\"FinalizeWorkUnitDescendantsRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x35\n\x05state\x18\x02 \x01(\x0e\x32 .luci.resultdb.v1.WorkUnit.StateB\x04\xe2\x41\x01\x02\x12\x18\n\x10summary_markdown\x18\x04 \x01(\t\x12\x62\n\x12\x66inalization_scope\x18\x03 \x01(\x0e\x32\x46.luci.resultdb.v1.FinalizeWorkUnitDescendantsRequest.FinalizationScope\"V\n\x11\x46inalizationScope\x12\"\n\x1e\x46INALIZATION_SCOPE_UNSPECIFIED\x10\x00\x12\x1d\n\x19PREFIXED_DESCENDANTS_ONLY\x10\x01\"\\\n\x1d\x42\x61tchFinalizeWorkUnitsRequest\x12;\n\x08requests\x18\x01 \x03(\x0b\x32).luci.resultdb.v1.FinalizeWorkUnitRequest\"P\n\x1e\x42\x61tchFinalizeWorkUnitsResponse\x12.\n\nwork_units\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\"D\n DelegateWorkUnitInclusionRequest\x12\x11\n\twork_unit\x18\x01 \x01(\t\x12\r\n\x05realm\x18\x02 \x01(\t\"#\n!DelegateWorkUnitInclusionResponse\"|\n\x17\x43reateInvocationRequest\x12\x1b\n\rinvocation_id\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x30\n\ninvocation\x18\x02 \x01(\x0b\x32\x1c.luci.resultdb.v1.Invocation\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"p\n\x1d\x42\x61tchCreateInvocationsRequest\x12;\n\x08requests\x18\x01 \x03(\x0b\x32).luci.resultdb.v1.CreateInvocationRequest\x12\x12\n\nrequest_id\x18\x02 \x01(\t\"j\n\x1e\x42\x61tchCreateInvocationsResponse\x12\x31\n\x0binvocations\x18\x01 \x03(\x0b\x32\x1c.luci.resultdb.v1.Invocation\x12\x15\n\rupdate_tokens\x18\x02 \x03(\t\"\x82\x01\n\x17UpdateInvocationRequest\x12\x36\n\ninvocation\x18\x01 \x01(\x0b\x32\x1c.luci.resultdb.v1.InvocationB\x04\xe2\x41\x01\x02\x12/\n\x0bupdate_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"/\n\x19\x46inalizeInvocationRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"{\n UpdateIncludedInvocationsRequest\x12\"\n\x14including_invocation\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x17\n\x0f\x61\x64\x64_invocations\x18\x02 \x03(\t\x12\x1a\n\x12remove_invocations\x18\x03 \x03(\t\"W\n\x1eMarkInvocationSubmittedRequest\x12\x1d\n\x0froot_invocation\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\x12\x16\n\ninvocation\x18\x01 \x01(\tB\x02\x18\x01\"\x94\x01\n\x17\x43reateTestResultRequest\x12\x14\n\x06parent\x18\x04 \x01(\tB\x04\xe2\x41\x01\x02\x12\x16\n\ninvocation\x18\x01 \x01(\tB\x02\x18\x01\x12\x37\n\x0btest_result\x18\x02 \x01(\x0b\x32\x1c.luci.resultdb.v1.TestResultB\x04\xe2\x41\x01\x02\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"\x98\x01\n\x1d\x42\x61tchCreateTestResultsRequest\x12\x0e\n\x06parent\x18\x04 \x01(\t\x12\x16\n\ninvocation\x18\x01 \x01(\tB\x02\x18\x01\x12;\n\x08requests\x18\x02 \x03(\x0b\x32).luci.resultdb.v1.CreateTestResultRequest\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"T\n\x1e\x42\x61tchCreateTestResultsResponse\x12\x32\n\x0ctest_results\x18\x01 \x03(\x0b\x32\x1c.luci.resultdb.v1.TestResult\"\xa3\x01\n\x1c\x43reateTestExonerationRequest\x12\x14\n\x06parent\x18\x04 \x01(\tB\x04\xe2\x41\x01\x02\x12\x16\n\ninvocation\x18\x01 \x01(\tB\x02\x18\x01\x12\x41\n\x10test_exoneration\x18\x02 \x01(\x0b\x32!.luci.resultdb.v1.TestExonerationB\x04\xe2\x41\x01\x02\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"\xa2\x01\n\"BatchCreateTestExonerationsRequest\x12\x0e\n\x06parent\x18\x04 \x01(\t\x12\x16\n\ninvocation\x18\x01 \x01(\tB\x02\x18\x01\x12@\n\x08requests\x18\x02 \x03(\x0b\x32..luci.resultdb.v1.CreateTestExonerationRequest\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"c\n#BatchCreateTestExonerationsResponse\x12<\n\x11test_exonerations\x18\x01 \x03(\x0b\x32!.luci.resultdb.v1.TestExoneration\"u\n\x15\x43reateArtifactRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x32\n\x08\x61rtifact\x18\x02 \x01(\x0b\x32\x1a.luci.resultdb.v1.ArtifactB\x04\xe2\x41\x01\x02\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"|\n\x1b\x42\x61tchCreateArtifactsRequest\x12\x0e\n\x06parent\x18\x03 \x01(\t\x12\x39\n\x08requests\x18\x02 \x03(\x0b\x32\'.luci.resultdb.v1.CreateArtifactRequest\x12\x12\n\nrequest_id\x18\x04 \x01(\t\"M\n\x1c\x42\x61tchCreateArtifactsResponse\x12-\n\tartifacts\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.Artifact2\xd4\x14\n\x08Recorder\x12w\n\x14\x43reateRootInvocation\x12-.luci.resultdb.v1.CreateRootInvocationRequest\x1a..luci.resultdb.v1.CreateRootInvocationResponse\"\x00\x12i\n\x14UpdateRootInvocation\x12-.luci.resultdb.v1.UpdateRootInvocationRequest\x1a .luci.resultdb.v1.RootInvocation\"\x00\x12\x63\n\x11GetRootInvocation\x12*.luci.resultdb.v1.GetRootInvocationRequest\x1a .luci.resultdb.v1.RootInvocation\"\x00\x12W\n\x0e\x43reateWorkUnit\x12\'.luci.resultdb.v1.CreateWorkUnitRequest\x1a\x1a.luci.resultdb.v1.WorkUnit\"\x00\x12w\n\x14\x42\x61tchCreateWorkUnits\x12-.luci.resultdb.v1.BatchCreateWorkUnitsRequest\x1a..luci.resultdb.v1.BatchCreateWorkUnitsResponse\"\x00\x12W\n\x0eUpdateWorkUnit\x12\'.luci.resultdb.v1.UpdateWorkUnitRequest\x1a\x1a.luci.resultdb.v1.WorkUnit\"\x00\x12w\n\x14\x42\x61tchUpdateWorkUnits\x12-.luci.resultdb.v1.BatchUpdateWorkUnitsRequest\x1a..luci.resultdb.v1.BatchUpdateWorkUnitsResponse\"\x00\x12Q\n\x0bGetWorkUnit\x12$.luci.resultdb.v1.GetWorkUnitRequest\x1a\x1a.luci.resultdb.v1.WorkUnit\"\x00\x12n\n\x11\x42\x61tchGetWorkUnits\x12*.luci.resultdb.v1.BatchGetWorkUnitsRequest\x1a+.luci.resultdb.v1.BatchGetWorkUnitsResponse\"\x00\x12[\n\x10\x46inalizeWorkUnit\x12).luci.resultdb.v1.FinalizeWorkUnitRequest\x1a\x1a.luci.resultdb.v1.WorkUnit\"\x00\x12}\n\x16\x42\x61tchFinalizeWorkUnits\x12/.luci.resultdb.v1.BatchFinalizeWorkUnitsRequest\x1a\x30.luci.resultdb.v1.BatchFinalizeWorkUnitsResponse\"\x00\x12m\n\x1b\x46inalizeWorkUnitDescendants\x12\x34.luci.resultdb.v1.FinalizeWorkUnitDescendantsRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x86\x01\n\x19\x44\x65legateWorkUnitInclusion\x12\x32.luci.resultdb.v1.DelegateWorkUnitInclusionRequest\x1a\x33.luci.resultdb.v1.DelegateWorkUnitInclusionResponse\"\x00\x12\x65\n\x17MarkInvocationSubmitted\x12\x30.luci.resultdb.v1.MarkInvocationSubmittedRequest\x1a\x16.google.protobuf.Empty\"\x00\x12]\n\x10\x43reateTestResult\x12).luci.resultdb.v1.CreateTestResultRequest\x1a\x1c.luci.resultdb.v1.TestResult\"\x00\x12}\n\x16\x42\x61tchCreateTestResults\x12/.luci.resultdb.v1.BatchCreateTestResultsRequest\x1a\x30.luci.resultdb.v1.BatchCreateTestResultsResponse\"\x00\x12l\n\x15\x43reateTestExoneration\x12..luci.resultdb.v1.CreateTestExonerationRequest\x1a!.luci.resultdb.v1.TestExoneration\"\x00\x12\x8c\x01\n\x1b\x42\x61tchCreateTestExonerations\x12\x34.luci.resultdb.v1.BatchCreateTestExonerationsRequest\x1a\x35.luci.resultdb.v1.BatchCreateTestExonerationsResponse\"\x00\x12w\n\x14\x42\x61tchCreateArtifacts\x12-.luci.resultdb.v1.BatchCreateArtifactsRequest\x1a..luci.resultdb.v1.BatchCreateArtifactsResponse\"\x00\x12]\n\x10\x43reateInvocation\x12).luci.resultdb.v1.CreateInvocationRequest\x1a\x1c.luci.resultdb.v1.Invocation\"\x00\x12}\n\x16\x42\x61tchCreateInvocations\x12/.luci.resultdb.v1.BatchCreateInvocationsRequest\x1a\x30.luci.resultdb.v1.BatchCreateInvocationsResponse\"\x00\x12]\n\x10UpdateInvocation\x12).luci.resultdb.v1.UpdateInvocationRequest\x1a\x1c.luci.resultdb.v1.Invocation\"\x00\x12\x61\n\x12\x46inalizeInvocation\x12+.luci.resultdb.v1.FinalizeInvocationRequest\x1a\x1c.luci.resultdb.v1.Invocation\"\x00\x12i\n\x19UpdateIncludedInvocations\x12\x32.luci.resultdb.v1.UpdateIncludedInvocationsRequest\x1a\x16.google.protobuf.Empty\"\x00\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.recorder_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_CREATEROOTINVOCATIONREQUEST'].fields_by_name['root_invocation_id']._loaded_options = None
+  _globals['_CREATEROOTINVOCATIONREQUEST'].fields_by_name['root_invocation_id']._serialized_options = b'\342A\001\002'
+  _globals['_UPDATEROOTINVOCATIONREQUEST'].fields_by_name['root_invocation']._loaded_options = None
+  _globals['_UPDATEROOTINVOCATIONREQUEST'].fields_by_name['root_invocation']._serialized_options = b'\342A\001\002'
+  _globals['_CREATEWORKUNITREQUEST'].fields_by_name['work_unit_id']._loaded_options = None
+  _globals['_CREATEWORKUNITREQUEST'].fields_by_name['work_unit_id']._serialized_options = b'\342A\001\002'
+  _globals['_UPDATEWORKUNITREQUEST'].fields_by_name['work_unit']._loaded_options = None
+  _globals['_UPDATEWORKUNITREQUEST'].fields_by_name['work_unit']._serialized_options = b'\342A\001\002'
+  _globals['_FINALIZEWORKUNITREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_FINALIZEWORKUNITREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_FINALIZEWORKUNITREQUEST'].fields_by_name['state']._loaded_options = None
+  _globals['_FINALIZEWORKUNITREQUEST'].fields_by_name['state']._serialized_options = b'\342A\001\002'
+  _globals['_FINALIZEWORKUNITDESCENDANTSREQUEST'].fields_by_name['state']._loaded_options = None
+  _globals['_FINALIZEWORKUNITDESCENDANTSREQUEST'].fields_by_name['state']._serialized_options = b'\342A\001\002'
+  _globals['_CREATEINVOCATIONREQUEST'].fields_by_name['invocation_id']._loaded_options = None
+  _globals['_CREATEINVOCATIONREQUEST'].fields_by_name['invocation_id']._serialized_options = b'\342A\001\002'
+  _globals['_UPDATEINVOCATIONREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_UPDATEINVOCATIONREQUEST'].fields_by_name['invocation']._serialized_options = b'\342A\001\002'
+  _globals['_FINALIZEINVOCATIONREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_FINALIZEINVOCATIONREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_UPDATEINCLUDEDINVOCATIONSREQUEST'].fields_by_name['including_invocation']._loaded_options = None
+  _globals['_UPDATEINCLUDEDINVOCATIONSREQUEST'].fields_by_name['including_invocation']._serialized_options = b'\342A\001\002'
+  _globals['_MARKINVOCATIONSUBMITTEDREQUEST'].fields_by_name['root_invocation']._loaded_options = None
+  _globals['_MARKINVOCATIONSUBMITTEDREQUEST'].fields_by_name['root_invocation']._serialized_options = b'\342A\001\002'
+  _globals['_MARKINVOCATIONSUBMITTEDREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_MARKINVOCATIONSUBMITTEDREQUEST'].fields_by_name['invocation']._serialized_options = b'\030\001'
+  _globals['_CREATETESTRESULTREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_CREATETESTRESULTREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_CREATETESTRESULTREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_CREATETESTRESULTREQUEST'].fields_by_name['invocation']._serialized_options = b'\030\001'
+  _globals['_CREATETESTRESULTREQUEST'].fields_by_name['test_result']._loaded_options = None
+  _globals['_CREATETESTRESULTREQUEST'].fields_by_name['test_result']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHCREATETESTRESULTSREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_BATCHCREATETESTRESULTSREQUEST'].fields_by_name['invocation']._serialized_options = b'\030\001'
+  _globals['_CREATETESTEXONERATIONREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_CREATETESTEXONERATIONREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_CREATETESTEXONERATIONREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_CREATETESTEXONERATIONREQUEST'].fields_by_name['invocation']._serialized_options = b'\030\001'
+  _globals['_CREATETESTEXONERATIONREQUEST'].fields_by_name['test_exoneration']._loaded_options = None
+  _globals['_CREATETESTEXONERATIONREQUEST'].fields_by_name['test_exoneration']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHCREATETESTEXONERATIONSREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_BATCHCREATETESTEXONERATIONSREQUEST'].fields_by_name['invocation']._serialized_options = b'\030\001'
+  _globals['_CREATEARTIFACTREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_CREATEARTIFACTREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_CREATEARTIFACTREQUEST'].fields_by_name['artifact']._loaded_options = None
+  _globals['_CREATEARTIFACTREQUEST'].fields_by_name['artifact']._serialized_options = b'\342A\001\002'
+  _globals['_CREATEROOTINVOCATIONREQUEST']._serialized_start=523
+  _globals['_CREATEROOTINVOCATIONREQUEST']._serialized_end=717
+  _globals['_CREATEROOTINVOCATIONRESPONSE']._serialized_start=720
+  _globals['_CREATEROOTINVOCATIONRESPONSE']._serialized_end=861
+  _globals['_UPDATEROOTINVOCATIONREQUEST']._serialized_start=864
+  _globals['_UPDATEROOTINVOCATIONREQUEST']._serialized_end=1027
+  _globals['_CREATEWORKUNITREQUEST']._serialized_start=1030
+  _globals['_CREATEWORKUNITREQUEST']._serialized_end=1164
+  _globals['_BATCHCREATEWORKUNITSREQUEST']._serialized_start=1166
+  _globals['_BATCHCREATEWORKUNITSREQUEST']._serialized_end=1274
+  _globals['_BATCHCREATEWORKUNITSRESPONSE']._serialized_start=1276
+  _globals['_BATCHCREATEWORKUNITSRESPONSE']._serialized_end=1377
+  _globals['_UPDATEWORKUNITREQUEST']._serialized_start=1380
+  _globals['_UPDATEWORKUNITREQUEST']._serialized_end=1525
+  _globals['_BATCHUPDATEWORKUNITSREQUEST']._serialized_start=1527
+  _globals['_BATCHUPDATEWORKUNITSREQUEST']._serialized_end=1635
+  _globals['_BATCHUPDATEWORKUNITSRESPONSE']._serialized_start=1637
+  _globals['_BATCHUPDATEWORKUNITSRESPONSE']._serialized_end=1715
+  _globals['_FINALIZEWORKUNITREQUEST']._serialized_start=1717
+  _globals['_FINALIZEWORKUNITREQUEST']._serialized_end=1843
+  _globals['_FINALIZEWORKUNITDESCENDANTSREQUEST']._serialized_start=1846
+  _globals['_FINALIZEWORKUNITDESCENDANTSREQUEST']._serialized_end=2165
+  _globals['_FINALIZEWORKUNITDESCENDANTSREQUEST_FINALIZATIONSCOPE']._serialized_start=2079
+  _globals['_FINALIZEWORKUNITDESCENDANTSREQUEST_FINALIZATIONSCOPE']._serialized_end=2165
+  _globals['_BATCHFINALIZEWORKUNITSREQUEST']._serialized_start=2167
+  _globals['_BATCHFINALIZEWORKUNITSREQUEST']._serialized_end=2259
+  _globals['_BATCHFINALIZEWORKUNITSRESPONSE']._serialized_start=2261
+  _globals['_BATCHFINALIZEWORKUNITSRESPONSE']._serialized_end=2341
+  _globals['_DELEGATEWORKUNITINCLUSIONREQUEST']._serialized_start=2343
+  _globals['_DELEGATEWORKUNITINCLUSIONREQUEST']._serialized_end=2411
+  _globals['_DELEGATEWORKUNITINCLUSIONRESPONSE']._serialized_start=2413
+  _globals['_DELEGATEWORKUNITINCLUSIONRESPONSE']._serialized_end=2448
+  _globals['_CREATEINVOCATIONREQUEST']._serialized_start=2450
+  _globals['_CREATEINVOCATIONREQUEST']._serialized_end=2574
+  _globals['_BATCHCREATEINVOCATIONSREQUEST']._serialized_start=2576
+  _globals['_BATCHCREATEINVOCATIONSREQUEST']._serialized_end=2688
+  _globals['_BATCHCREATEINVOCATIONSRESPONSE']._serialized_start=2690
+  _globals['_BATCHCREATEINVOCATIONSRESPONSE']._serialized_end=2796
+  _globals['_UPDATEINVOCATIONREQUEST']._serialized_start=2799
+  _globals['_UPDATEINVOCATIONREQUEST']._serialized_end=2929
+  _globals['_FINALIZEINVOCATIONREQUEST']._serialized_start=2931
+  _globals['_FINALIZEINVOCATIONREQUEST']._serialized_end=2978
+  _globals['_UPDATEINCLUDEDINVOCATIONSREQUEST']._serialized_start=2980
+  _globals['_UPDATEINCLUDEDINVOCATIONSREQUEST']._serialized_end=3103
+  _globals['_MARKINVOCATIONSUBMITTEDREQUEST']._serialized_start=3105
+  _globals['_MARKINVOCATIONSUBMITTEDREQUEST']._serialized_end=3192
+  _globals['_CREATETESTRESULTREQUEST']._serialized_start=3195
+  _globals['_CREATETESTRESULTREQUEST']._serialized_end=3343
+  _globals['_BATCHCREATETESTRESULTSREQUEST']._serialized_start=3346
+  _globals['_BATCHCREATETESTRESULTSREQUEST']._serialized_end=3498
+  _globals['_BATCHCREATETESTRESULTSRESPONSE']._serialized_start=3500
+  _globals['_BATCHCREATETESTRESULTSRESPONSE']._serialized_end=3584
+  _globals['_CREATETESTEXONERATIONREQUEST']._serialized_start=3587
+  _globals['_CREATETESTEXONERATIONREQUEST']._serialized_end=3750
+  _globals['_BATCHCREATETESTEXONERATIONSREQUEST']._serialized_start=3753
+  _globals['_BATCHCREATETESTEXONERATIONSREQUEST']._serialized_end=3915
+  _globals['_BATCHCREATETESTEXONERATIONSRESPONSE']._serialized_start=3917
+  _globals['_BATCHCREATETESTEXONERATIONSRESPONSE']._serialized_end=4016
+  _globals['_CREATEARTIFACTREQUEST']._serialized_start=4018
+  _globals['_CREATEARTIFACTREQUEST']._serialized_end=4135
+  _globals['_BATCHCREATEARTIFACTSREQUEST']._serialized_start=4137
+  _globals['_BATCHCREATEARTIFACTSREQUEST']._serialized_end=4261
+  _globals['_BATCHCREATEARTIFACTSRESPONSE']._serialized_start=4263
+  _globals['_BATCHCREATEARTIFACTSRESPONSE']._serialized_end=4340
+  _globals['_RECORDER']._serialized_start=4343
+  _globals['_RECORDER']._serialized_end=6987
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,295 @@
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import empty_pb2 as _empty_pb2
+from google.protobuf import field_mask_pb2 as _field_mask_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import artifact as _artifact_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as _invocation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import root_invocation as _root_invocation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as _test_exoneration_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import work_unit as _work_unit_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class CreateRootInvocationRequest(_message.Message):
+    __slots__ = ("root_invocation_id", "root_invocation", "root_work_unit", "request_id")
+    ROOT_INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    ROOT_WORK_UNIT_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    root_invocation_id: str
+    root_invocation: _root_invocation_pb2.RootInvocation
+    root_work_unit: _work_unit_pb2.WorkUnit
+    request_id: str
+    def __init__(self, root_invocation_id: _Optional[str] = ..., root_invocation: _Optional[_Union[_root_invocation_pb2.RootInvocation, _Mapping]] = ..., root_work_unit: _Optional[_Union[_work_unit_pb2.WorkUnit, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class CreateRootInvocationResponse(_message.Message):
+    __slots__ = ("root_invocation", "root_work_unit")
+    ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    ROOT_WORK_UNIT_FIELD_NUMBER: _ClassVar[int]
+    root_invocation: _root_invocation_pb2.RootInvocation
+    root_work_unit: _work_unit_pb2.WorkUnit
+    def __init__(self, root_invocation: _Optional[_Union[_root_invocation_pb2.RootInvocation, _Mapping]] = ..., root_work_unit: _Optional[_Union[_work_unit_pb2.WorkUnit, _Mapping]] = ...) -> None: ...
+
+class UpdateRootInvocationRequest(_message.Message):
+    __slots__ = ("root_invocation", "update_mask", "request_id")
+    ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_MASK_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    root_invocation: _root_invocation_pb2.RootInvocation
+    update_mask: _field_mask_pb2.FieldMask
+    request_id: str
+    def __init__(self, root_invocation: _Optional[_Union[_root_invocation_pb2.RootInvocation, _Mapping]] = ..., update_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class CreateWorkUnitRequest(_message.Message):
+    __slots__ = ("parent", "work_unit_id", "work_unit", "request_id")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    WORK_UNIT_ID_FIELD_NUMBER: _ClassVar[int]
+    WORK_UNIT_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    work_unit_id: str
+    work_unit: _work_unit_pb2.WorkUnit
+    request_id: str
+    def __init__(self, parent: _Optional[str] = ..., work_unit_id: _Optional[str] = ..., work_unit: _Optional[_Union[_work_unit_pb2.WorkUnit, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateWorkUnitsRequest(_message.Message):
+    __slots__ = ("requests", "request_id")
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    requests: _containers.RepeatedCompositeFieldContainer[CreateWorkUnitRequest]
+    request_id: str
+    def __init__(self, requests: _Optional[_Iterable[_Union[CreateWorkUnitRequest, _Mapping]]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateWorkUnitsResponse(_message.Message):
+    __slots__ = ("work_units", "update_tokens")
+    WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_TOKENS_FIELD_NUMBER: _ClassVar[int]
+    work_units: _containers.RepeatedCompositeFieldContainer[_work_unit_pb2.WorkUnit]
+    update_tokens: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, work_units: _Optional[_Iterable[_Union[_work_unit_pb2.WorkUnit, _Mapping]]] = ..., update_tokens: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class UpdateWorkUnitRequest(_message.Message):
+    __slots__ = ("work_unit", "update_mask", "request_id")
+    WORK_UNIT_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_MASK_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    work_unit: _work_unit_pb2.WorkUnit
+    update_mask: _field_mask_pb2.FieldMask
+    request_id: str
+    def __init__(self, work_unit: _Optional[_Union[_work_unit_pb2.WorkUnit, _Mapping]] = ..., update_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchUpdateWorkUnitsRequest(_message.Message):
+    __slots__ = ("requests", "request_id")
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    requests: _containers.RepeatedCompositeFieldContainer[UpdateWorkUnitRequest]
+    request_id: str
+    def __init__(self, requests: _Optional[_Iterable[_Union[UpdateWorkUnitRequest, _Mapping]]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchUpdateWorkUnitsResponse(_message.Message):
+    __slots__ = ("work_units",)
+    WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    work_units: _containers.RepeatedCompositeFieldContainer[_work_unit_pb2.WorkUnit]
+    def __init__(self, work_units: _Optional[_Iterable[_Union[_work_unit_pb2.WorkUnit, _Mapping]]] = ...) -> None: ...
+
+class FinalizeWorkUnitRequest(_message.Message):
+    __slots__ = ("name", "state", "summary_markdown")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_MARKDOWN_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    state: _work_unit_pb2.WorkUnit.State
+    summary_markdown: str
+    def __init__(self, name: _Optional[str] = ..., state: _Optional[_Union[_work_unit_pb2.WorkUnit.State, str]] = ..., summary_markdown: _Optional[str] = ...) -> None: ...
+
+class FinalizeWorkUnitDescendantsRequest(_message.Message):
+    __slots__ = ("name", "state", "summary_markdown", "finalization_scope")
+    class FinalizationScope(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        FINALIZATION_SCOPE_UNSPECIFIED: _ClassVar[FinalizeWorkUnitDescendantsRequest.FinalizationScope]
+        PREFIXED_DESCENDANTS_ONLY: _ClassVar[FinalizeWorkUnitDescendantsRequest.FinalizationScope]
+    FINALIZATION_SCOPE_UNSPECIFIED: FinalizeWorkUnitDescendantsRequest.FinalizationScope
+    PREFIXED_DESCENDANTS_ONLY: FinalizeWorkUnitDescendantsRequest.FinalizationScope
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_MARKDOWN_FIELD_NUMBER: _ClassVar[int]
+    FINALIZATION_SCOPE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    state: _work_unit_pb2.WorkUnit.State
+    summary_markdown: str
+    finalization_scope: FinalizeWorkUnitDescendantsRequest.FinalizationScope
+    def __init__(self, name: _Optional[str] = ..., state: _Optional[_Union[_work_unit_pb2.WorkUnit.State, str]] = ..., summary_markdown: _Optional[str] = ..., finalization_scope: _Optional[_Union[FinalizeWorkUnitDescendantsRequest.FinalizationScope, str]] = ...) -> None: ...
+
+class BatchFinalizeWorkUnitsRequest(_message.Message):
+    __slots__ = ("requests",)
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    requests: _containers.RepeatedCompositeFieldContainer[FinalizeWorkUnitRequest]
+    def __init__(self, requests: _Optional[_Iterable[_Union[FinalizeWorkUnitRequest, _Mapping]]] = ...) -> None: ...
+
+class BatchFinalizeWorkUnitsResponse(_message.Message):
+    __slots__ = ("work_units",)
+    WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    work_units: _containers.RepeatedCompositeFieldContainer[_work_unit_pb2.WorkUnit]
+    def __init__(self, work_units: _Optional[_Iterable[_Union[_work_unit_pb2.WorkUnit, _Mapping]]] = ...) -> None: ...
+
+class DelegateWorkUnitInclusionRequest(_message.Message):
+    __slots__ = ("work_unit", "realm")
+    WORK_UNIT_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    work_unit: str
+    realm: str
+    def __init__(self, work_unit: _Optional[str] = ..., realm: _Optional[str] = ...) -> None: ...
+
+class DelegateWorkUnitInclusionResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class CreateInvocationRequest(_message.Message):
+    __slots__ = ("invocation_id", "invocation", "request_id")
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    invocation_id: str
+    invocation: _invocation_pb2.Invocation
+    request_id: str
+    def __init__(self, invocation_id: _Optional[str] = ..., invocation: _Optional[_Union[_invocation_pb2.Invocation, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateInvocationsRequest(_message.Message):
+    __slots__ = ("requests", "request_id")
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    requests: _containers.RepeatedCompositeFieldContainer[CreateInvocationRequest]
+    request_id: str
+    def __init__(self, requests: _Optional[_Iterable[_Union[CreateInvocationRequest, _Mapping]]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateInvocationsResponse(_message.Message):
+    __slots__ = ("invocations", "update_tokens")
+    INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_TOKENS_FIELD_NUMBER: _ClassVar[int]
+    invocations: _containers.RepeatedCompositeFieldContainer[_invocation_pb2.Invocation]
+    update_tokens: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, invocations: _Optional[_Iterable[_Union[_invocation_pb2.Invocation, _Mapping]]] = ..., update_tokens: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class UpdateInvocationRequest(_message.Message):
+    __slots__ = ("invocation", "update_mask")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_MASK_FIELD_NUMBER: _ClassVar[int]
+    invocation: _invocation_pb2.Invocation
+    update_mask: _field_mask_pb2.FieldMask
+    def __init__(self, invocation: _Optional[_Union[_invocation_pb2.Invocation, _Mapping]] = ..., update_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class FinalizeInvocationRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class UpdateIncludedInvocationsRequest(_message.Message):
+    __slots__ = ("including_invocation", "add_invocations", "remove_invocations")
+    INCLUDING_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    ADD_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    REMOVE_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    including_invocation: str
+    add_invocations: _containers.RepeatedScalarFieldContainer[str]
+    remove_invocations: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, including_invocation: _Optional[str] = ..., add_invocations: _Optional[_Iterable[str]] = ..., remove_invocations: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class MarkInvocationSubmittedRequest(_message.Message):
+    __slots__ = ("root_invocation", "invocation")
+    ROOT_INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    root_invocation: str
+    invocation: str
+    def __init__(self, root_invocation: _Optional[str] = ..., invocation: _Optional[str] = ...) -> None: ...
+
+class CreateTestResultRequest(_message.Message):
+    __slots__ = ("parent", "invocation", "test_result", "request_id")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    TEST_RESULT_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    invocation: str
+    test_result: _test_result_pb2.TestResult
+    request_id: str
+    def __init__(self, parent: _Optional[str] = ..., invocation: _Optional[str] = ..., test_result: _Optional[_Union[_test_result_pb2.TestResult, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateTestResultsRequest(_message.Message):
+    __slots__ = ("parent", "invocation", "requests", "request_id")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    invocation: str
+    requests: _containers.RepeatedCompositeFieldContainer[CreateTestResultRequest]
+    request_id: str
+    def __init__(self, parent: _Optional[str] = ..., invocation: _Optional[str] = ..., requests: _Optional[_Iterable[_Union[CreateTestResultRequest, _Mapping]]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateTestResultsResponse(_message.Message):
+    __slots__ = ("test_results",)
+    TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    test_results: _containers.RepeatedCompositeFieldContainer[_test_result_pb2.TestResult]
+    def __init__(self, test_results: _Optional[_Iterable[_Union[_test_result_pb2.TestResult, _Mapping]]] = ...) -> None: ...
+
+class CreateTestExonerationRequest(_message.Message):
+    __slots__ = ("parent", "invocation", "test_exoneration", "request_id")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    TEST_EXONERATION_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    invocation: str
+    test_exoneration: _test_exoneration_pb2.TestExoneration
+    request_id: str
+    def __init__(self, parent: _Optional[str] = ..., invocation: _Optional[str] = ..., test_exoneration: _Optional[_Union[_test_exoneration_pb2.TestExoneration, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateTestExonerationsRequest(_message.Message):
+    __slots__ = ("parent", "invocation", "requests", "request_id")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    invocation: str
+    requests: _containers.RepeatedCompositeFieldContainer[CreateTestExonerationRequest]
+    request_id: str
+    def __init__(self, parent: _Optional[str] = ..., invocation: _Optional[str] = ..., requests: _Optional[_Iterable[_Union[CreateTestExonerationRequest, _Mapping]]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateTestExonerationsResponse(_message.Message):
+    __slots__ = ("test_exonerations",)
+    TEST_EXONERATIONS_FIELD_NUMBER: _ClassVar[int]
+    test_exonerations: _containers.RepeatedCompositeFieldContainer[_test_exoneration_pb2.TestExoneration]
+    def __init__(self, test_exonerations: _Optional[_Iterable[_Union[_test_exoneration_pb2.TestExoneration, _Mapping]]] = ...) -> None: ...
+
+class CreateArtifactRequest(_message.Message):
+    __slots__ = ("parent", "artifact", "request_id")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    artifact: _artifact_pb2.Artifact
+    request_id: str
+    def __init__(self, parent: _Optional[str] = ..., artifact: _Optional[_Union[_artifact_pb2.Artifact, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateArtifactsRequest(_message.Message):
+    __slots__ = ("parent", "requests", "request_id")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    requests: _containers.RepeatedCompositeFieldContainer[CreateArtifactRequest]
+    request_id: str
+    def __init__(self, parent: _Optional[str] = ..., requests: _Optional[_Iterable[_Union[CreateArtifactRequest, _Mapping]]] = ..., request_id: _Optional[str] = ...) -> None: ...
+
+class BatchCreateArtifactsResponse(_message.Message):
+    __slots__ = ("artifacts",)
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    artifacts: _containers.RepeatedCompositeFieldContainer[_artifact_pb2.Artifact]
+    def __init__(self, artifacts: _Optional[_Iterable[_Union[_artifact_pb2.Artifact, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/resultdb.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/resultdb.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import artifact as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_artifact__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import instruction as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_instruction__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_invocation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import predicate as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_predicate__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import root_invocation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_root__invocation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_aggregation as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__aggregation__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__exoneration__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_variant as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__variant__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_verdict as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__verdict__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__metadata__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import work_unit as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_work__unit__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5go.chromium.org/luci/resultdb/proto/v1/resultdb.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1fgoogle/api/field_behavior.proto\x1a google/protobuf/field_mask.proto\x1a\x35go.chromium.org/luci/resultdb/proto/v1/artifact.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/instruction.proto\x1a\x37go.chromium.org/luci/resultdb/proto/v1/invocation.proto\x1a\x36go.chromium.org/luci/resultdb/proto/v1/predicate.proto\x1a<go.chromium.org/luci/resultdb/proto/v1/root_invocation.proto\x1a=go.chromium.org/luci/resultdb/proto/v1/test_aggregation.proto\x1a=go.chromium.org/luci/resultdb/proto/v1/test_exoneration.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\x1a\x39go.chromium.org/luci/resultdb/proto/v1/test_variant.proto\x1a\x39go.chromium.org/luci/resultdb/proto/v1/test_verdict.proto\x1a:go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto\x1a\x36go.chromium.org/luci/resultdb/proto/v1/work_unit.proto\"*\n\x14GetInvocationRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"5\n\x1fQueryRootInvocationNamesRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"A\n QueryRootInvocationNamesResponse\x12\x1d\n\x15root_invocation_names\x18\x01 \x03(\t\"*\n\x14GetTestResultRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"\x88\x01\n\x16ListTestResultsRequest\x12\x18\n\ninvocation\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12-\n\tread_mask\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"f\n\x17ListTestResultsResponse\x12\x32\n\x0ctest_results\x18\x01 \x03(\x0b\x32\x1c.luci.resultdb.v1.TestResult\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\")\n\x19GetTestExonerationRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"^\n\x1bListTestExonerationsRequest\x12\x18\n\ninvocation\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\"u\n\x1cListTestExonerationsResponse\x12<\n\x11test_exonerations\x18\x01 \x03(\x0b\x32!.luci.resultdb.v1.TestExoneration\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xbe\x01\n\x17QueryTestResultsRequest\x12\x13\n\x0binvocations\x18\x01 \x03(\t\x12\x38\n\tpredicate\x18\x02 \x01(\x0b\x32%.luci.resultdb.v1.TestResultPredicate\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\x12-\n\tread_mask\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"g\n\x18QueryTestResultsResponse\x12\x32\n\x0ctest_results\x18\x01 \x03(\x0b\x32\x1c.luci.resultdb.v1.TestResult\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\x9f\x01\n\x1cQueryTestExonerationsRequest\x12\x13\n\x0binvocations\x18\x01 \x03(\t\x12\x43\n\tpredicate\x18\x02 \x01(\x0b\x32*.luci.resultdb.v1.TestExonerationPredicateB\x04\xe2\x41\x01\x02\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"v\n\x1dQueryTestExonerationsResponse\x12<\n\x11test_exonerations\x18\x01 \x03(\x0b\x32!.luci.resultdb.v1.TestExoneration\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"7\n QueryTestResultStatisticsRequest\x12\x13\n\x0binvocations\x18\x01 \x03(\t\"?\n!QueryTestResultStatisticsResponse\x12\x1a\n\x12total_test_results\x18\x01 \x01(\x03\"(\n\x12GetArtifactRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"\x82\x01\n\x14ListArtifactsRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12-\n\tread_mask\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"_\n\x15ListArtifactsResponse\x12-\n\tartifacts\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.Artifact\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xca\x01\n\x15QueryArtifactsRequest\x12\x13\n\x0binvocations\x18\x01 \x03(\t\x12\x0e\n\x06parent\x18\x08 \x01(\t\x12\x36\n\tpredicate\x18\x02 \x01(\x0b\x32#.luci.resultdb.v1.ArtifactPredicate\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\x12-\n\tread_mask\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"`\n\x16QueryArtifactsResponse\x12-\n\tartifacts\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.Artifact\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"=\n\x18ListArtifactLinesRequest\x12\x0e\n\x06parent\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\"J\n\x19ListArtifactLinesResponse\x12-\n\x05lines\x18\x01 \x03(\x0b\x32\x1e.luci.resultdb.v1.ArtifactLine\"\x8e\x02\n\x1b\x43ompareArtifactLinesRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x17\n\x0fpassing_results\x18\x02 \x03(\t\x12\x11\n\tartifacts\x18\x06 \x03(\t\x12@\n\x04view\x18\x03 \x01(\x0e\x32\x32.luci.resultdb.v1.CompareArtifactLinesRequest.View\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"F\n\x04View\x12\x14\n\x10VIEW_UNSPECIFIED\x10\x00\x12\x0f\n\x0bRANGES_ONLY\x10\x01\x12\x17\n\x13RANGES_WITH_CONTENT\x10\x02\"\xbb\x02\n\x1c\x43ompareArtifactLinesResponse\x12\\\n\x13\x66\x61ilure_only_ranges\x18\x01 \x03(\x0b\x32?.luci.resultdb.v1.CompareArtifactLinesResponse.FailureOnlyRange\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\"\n\x16used_passing_artifacts\x18\x03 \x03(\tB\x02\x18\x01\x12\x11\n\tartifacts\x18\x04 \x03(\t\x1am\n\x10\x46\x61ilureOnlyRange\x12\x12\n\nstart_line\x18\x01 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x02 \x01(\x05\x12\x12\n\nstart_byte\x18\x03 \x01(\x03\x12\x10\n\x08\x65nd_byte\x18\x04 \x01(\x03\x12\r\n\x05lines\x18\x05 \x03(\t\"\x92\x02\n\x18QueryTestVariantsRequest\x12\x14\n\x06parent\x18\x0b \x01(\tB\x04\xe2\x41\x01\x02\x12\x17\n\x0binvocations\x18\x02 \x03(\tB\x02\x18\x01\x12\x39\n\tpredicate\x18\x06 \x01(\x0b\x32&.luci.resultdb.v1.TestVariantPredicate\x12\x14\n\x0cresult_limit\x18\x08 \x01(\x05\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\x12-\n\tread_mask\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x10\n\x08order_by\x18\t \x01(\t\x12\x0e\n\x06\x66ilter\x18\n \x01(\t\"\x80\x02\n\x19QueryTestVariantsResponse\x12\x34\n\rtest_variants\x18\x01 \x03(\x0b\x32\x1d.luci.resultdb.v1.TestVariant\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12I\n\x07sources\x18\x03 \x03(\x0b\x32\x38.luci.resultdb.v1.QueryTestVariantsResponse.SourcesEntry\x1aI\n\x0cSourcesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.luci.resultdb.v1.Sources:\x02\x38\x01\"n\n\x1bQueryRunTestVerdictsRequest\x12\x12\n\ninvocation\x18\x01 \x01(\t\x12\x14\n\x0cresult_limit\x18\x02 \x01(\x05\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"t\n\x1cQueryRunTestVerdictsResponse\x12;\n\x11run_test_verdicts\x18\x01 \x03(\x0b\x32 .luci.resultdb.v1.RunTestVerdict\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xc8\x02\n\x1b\x42\x61tchGetTestVariantsRequest\x12\x14\n\x06parent\x18\x04 \x01(\tB\x04\xe2\x41\x01\x02\x12\x16\n\ninvocation\x18\x01 \x01(\tB\x02\x18\x01\x12Z\n\rtest_variants\x18\x02 \x03(\x0b\x32\x43.luci.resultdb.v1.BatchGetTestVariantsRequest.TestVariantIdentifier\x12\x14\n\x0cresult_limit\x18\x03 \x01(\x05\x1a\x88\x01\n\x15TestVariantIdentifier\x12<\n\x12test_id_structured\x18\x03 \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifier\x12\x15\n\x07test_id\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x1a\n\x0cvariant_hash\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\"\xed\x01\n\x1c\x42\x61tchGetTestVariantsResponse\x12\x34\n\rtest_variants\x18\x01 \x03(\x0b\x32\x1d.luci.resultdb.v1.TestVariant\x12L\n\x07sources\x18\x02 \x03(\x0b\x32;.luci.resultdb.v1.BatchGetTestVariantsResponse.SourcesEntry\x1aI\n\x0cSourcesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.luci.resultdb.v1.Sources:\x02\x38\x01\"\xc8\x02\n\x1b\x42\x61tchGetTestVerdictsRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12J\n\x05tests\x18\x02 \x03(\x0b\x32;.luci.resultdb.v1.BatchGetTestVerdictsRequest.NominatedTest\x12/\n\x04view\x18\x03 \x01(\x0e\x32!.luci.resultdb.v1.TestVerdictView\x1a\x95\x01\n\rNominatedTest\x12>\n\x12test_id_structured\x18\x01 \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifierH\x00\x12<\n\x0ctest_id_flat\x18\x02 \x01(\x0b\x32$.luci.resultdb.v1.FlatTestIdentifierH\x00\x42\x06\n\x04test\"T\n\x1c\x42\x61tchGetTestVerdictsResponse\x12\x34\n\rtest_verdicts\x18\x01 \x03(\x0b\x32\x1d.luci.resultdb.v1.TestVerdict\"\x94\x01\n\x18QueryTestMetadataRequest\x12\x15\n\x07project\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12:\n\tpredicate\x18\x02 \x01(\x0b\x32\'.luci.resultdb.v1.TestMetadataPredicate\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"p\n\x19QueryTestMetadataResponse\x12:\n\x0ctestMetadata\x18\x01 \x03(\x0b\x32$.luci.resultdb.v1.TestMetadataDetail\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"O\n\x1bQueryNewTestVariantsRequest\x12\x18\n\ninvocation\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x16\n\x08\x62\x61seline\x18\x02 \x01(\tB\x04\xe2\x41\x01\x02\"\xcc\x01\n\x1cQueryNewTestVariantsResponse\x12\x19\n\x11is_baseline_ready\x18\x01 \x01(\x08\x12X\n\x11new_test_variants\x18\x02 \x03(\x0b\x32=.luci.resultdb.v1.QueryNewTestVariantsResponse.NewTestVariant\x1a\x37\n\x0eNewTestVariant\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x02 \x01(\t\"%\n\x15GetInstructionRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"E\n\x17QueryInstructionRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65pendency_max_depth\x18\x02 \x01(\x05\"\x97\x01\n\x18QueryInstructionResponse\x12\x32\n\x0binstruction\x18\x01 \x01(\x0b\x32\x1d.luci.resultdb.v1.Instruction\x12G\n\x11\x64\x65pendency_chains\x18\x02 \x03(\x0b\x32,.luci.resultdb.v1.InstructionDependencyChain\"\xef\x01\n\x1aInstructionDependencyChain\x12\x33\n\x06target\x18\x01 \x01(\x0e\x32#.luci.resultdb.v1.InstructionTarget\x12@\n\x05nodes\x18\x02 \x03(\x0b\x32\x31.luci.resultdb.v1.InstructionDependencyChain.Node\x1aZ\n\x04Node\x12\x18\n\x10instruction_name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\x18\n\x10\x64\x65scriptive_name\x18\x04 \x01(\t\"\xee\x02\n%QueryTestVariantArtifactGroupsRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12?\n\rsearch_string\x18\x02 \x01(\x0b\x32(.luci.resultdb.v1.ArtifactContentMatcher\x12\x34\n\x0ftest_id_matcher\x18\x03 \x01(\x0b\x32\x1b.luci.resultdb.v1.IDMatcher\x12\x38\n\x13\x61rtifact_id_matcher\x18\x04 \x01(\x0b\x32\x1b.luci.resultdb.v1.IDMatcher\x12.\n\nstart_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tpage_size\x18\x07 \x01(\x05\x12\x12\n\npage_token\x18\x08 \x01(\t\"\xe3\x02\n&QueryTestVariantArtifactGroupsResponse\x12S\n\x06groups\x18\x01 \x03(\x0b\x32\x43.luci.resultdb.v1.QueryTestVariantArtifactGroupsResponse.MatchGroup\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x1a\xca\x01\n\nMatchGroup\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x02 \x01(\t\x12*\n\x07variant\x18\x03 \x01(\x0b\x32\x19.luci.resultdb.v1.Variant\x12\x13\n\x0b\x61rtifact_id\x18\x04 \x01(\t\x12<\n\tartifacts\x18\x05 \x03(\x0b\x32).luci.resultdb.v1.ArtifactMatchingContent\x12\x16\n\x0ematching_count\x18\x06 \x01(\x05\"\xb5\x02\n QueryTestVariantArtifactsRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12?\n\rsearch_string\x18\x02 \x01(\x0b\x32(.luci.resultdb.v1.ArtifactContentMatcher\x12\x0f\n\x07test_id\x18\x03 \x01(\t\x12\x14\n\x0cvariant_hash\x18\x04 \x01(\t\x12\x13\n\x0b\x61rtifact_id\x18\x05 \x01(\t\x12.\n\nstart_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tpage_size\x18\x08 \x01(\x05\x12\x12\n\npage_token\x18\t \x01(\t\"z\n!QueryTestVariantArtifactsResponse\x12<\n\tartifacts\x18\x01 \x03(\x0b\x32).luci.resultdb.v1.ArtifactMatchingContent\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xbe\x02\n+QueryInvocationVariantArtifactGroupsRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12?\n\rsearch_string\x18\x02 \x01(\x0b\x32(.luci.resultdb.v1.ArtifactContentMatcher\x12\x38\n\x13\x61rtifact_id_matcher\x18\x03 \x01(\x0b\x32\x1b.luci.resultdb.v1.IDMatcher\x12.\n\nstart_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tpage_size\x18\x06 \x01(\x05\x12\x12\n\npage_token\x18\x07 \x01(\t\"\xea\x02\n,QueryInvocationVariantArtifactGroupsResponse\x12Y\n\x06groups\x18\x01 \x03(\x0b\x32I.luci.resultdb.v1.QueryInvocationVariantArtifactGroupsResponse.MatchGroup\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x1a\xc5\x01\n\nMatchGroup\x12\x1a\n\x12variant_union_hash\x18\x01 \x01(\t\x12\x30\n\rvariant_union\x18\x02 \x01(\x0b\x32\x19.luci.resultdb.v1.Variant\x12\x13\n\x0b\x61rtifact_id\x18\x03 \x01(\t\x12<\n\tartifacts\x18\x04 \x03(\x0b\x32).luci.resultdb.v1.ArtifactMatchingContent\x12\x16\n\x0ematching_count\x18\x05 \x01(\x05\"\xb0\x02\n&QueryInvocationVariantArtifactsRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12?\n\rsearch_string\x18\x02 \x01(\x0b\x32(.luci.resultdb.v1.ArtifactContentMatcher\x12\x1a\n\x12variant_union_hash\x18\x03 \x01(\t\x12\x13\n\x0b\x61rtifact_id\x18\x04 \x01(\t\x12.\n\nstart_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tpage_size\x18\x07 \x01(\x05\x12\x12\n\npage_token\x18\x08 \x01(\t\"\x80\x01\n\'QueryInvocationVariantArtifactsResponse\x12<\n\tartifacts\x18\x01 \x03(\x0b\x32).luci.resultdb.v1.ArtifactMatchingContent\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xd3\x02\n\x17\x41rtifactMatchingContent\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x32\n\x0epartition_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x35\n\x0btest_status\x18\x03 \x01(\x0e\x32\x1c.luci.resultdb.v1.TestStatusB\x02\x18\x01\x12;\n\x0etest_status_v2\x18\x06 \x01(\x0e\x32#.luci.resultdb.v1.TestResult.Status\x12\x0f\n\x07snippet\x18\x04 \x01(\t\x12@\n\x07matches\x18\x05 \x03(\x0b\x32/.luci.resultdb.v1.ArtifactMatchingContent.Match\x1a/\n\x05Match\x12\x13\n\x0bstart_index\x18\x01 \x01(\x05\x12\x11\n\tend_index\x18\x02 \x01(\x05\"O\n\x16\x41rtifactContentMatcher\x12\x17\n\rregex_contain\x18\x01 \x01(\tH\x00\x12\x11\n\x07\x63ontain\x18\x02 \x01(\tH\x00\x42\t\n\x07matcher\"C\n\tIDMatcher\x12\x14\n\nhas_prefix\x18\x01 \x01(\tH\x00\x12\x15\n\x0b\x65xact_equal\x18\x02 \x01(\tH\x00\x42\t\n\x07matcher\"\xac\x01\n\x1cQueryTestAggregationsRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12=\n\tpredicate\x18\x02 \x01(\x0b\x32*.luci.resultdb.v1.TestAggregationPredicate\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"q\n\x1dQueryTestAggregationsResponse\x12\x37\n\x0c\x61ggregations\x18\x01 \x03(\x0b\x32!.luci.resultdb.v1.TestAggregation\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xe9\x01\n\x18QueryTestVerdictsRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x39\n\tpredicate\x18\x02 \x01(\x0b\x32&.luci.resultdb.v1.TestVerdictPredicate\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12/\n\x04view\x18\x07 \x01(\x0e\x32!.luci.resultdb.v1.TestVerdictView\x12\x11\n\tpage_size\x18\x05 \x01(\x05\x12\x12\n\npage_token\x18\x06 \x01(\tJ\x04\x08\x04\x10\x05R\x0cresult_limit\"j\n\x19QueryTestVerdictsResponse\x12\x34\n\rtest_verdicts\x18\x01 \x03(\x0b\x32\x1d.luci.resultdb.v1.TestVerdict\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t2\xf4\x1c\n\x08ResultDB\x12\x63\n\x11GetRootInvocation\x12*.luci.resultdb.v1.GetRootInvocationRequest\x1a .luci.resultdb.v1.RootInvocation\"\x00\x12Q\n\x0bGetWorkUnit\x12$.luci.resultdb.v1.GetWorkUnitRequest\x1a\x1a.luci.resultdb.v1.WorkUnit\"\x00\x12n\n\x11\x42\x61tchGetWorkUnits\x12*.luci.resultdb.v1.BatchGetWorkUnitsRequest\x1a+.luci.resultdb.v1.BatchGetWorkUnitsResponse\"\x00\x12\x65\n\x0eQueryWorkUnits\x12\'.luci.resultdb.v1.QueryWorkUnitsRequest\x1a(.luci.resultdb.v1.QueryWorkUnitsResponse\"\x00\x12W\n\rGetTestResult\x12&.luci.resultdb.v1.GetTestResultRequest\x1a\x1c.luci.resultdb.v1.TestResult\"\x00\x12h\n\x0fListTestResults\x12(.luci.resultdb.v1.ListTestResultsRequest\x1a).luci.resultdb.v1.ListTestResultsResponse\"\x00\x12\x66\n\x12GetTestExoneration\x12+.luci.resultdb.v1.GetTestExonerationRequest\x1a!.luci.resultdb.v1.TestExoneration\"\x00\x12w\n\x14ListTestExonerations\x12-.luci.resultdb.v1.ListTestExonerationsRequest\x1a..luci.resultdb.v1.ListTestExonerationsResponse\"\x00\x12k\n\x10QueryTestResults\x12).luci.resultdb.v1.QueryTestResultsRequest\x1a*.luci.resultdb.v1.QueryTestResultsResponse\"\x00\x12z\n\x15QueryTestExonerations\x12..luci.resultdb.v1.QueryTestExonerationsRequest\x1a/.luci.resultdb.v1.QueryTestExonerationsResponse\"\x00\x12w\n\x14QueryNewTestVariants\x12-.luci.resultdb.v1.QueryNewTestVariantsRequest\x1a..luci.resultdb.v1.QueryNewTestVariantsResponse\"\x00\x12n\n\x11QueryTestMetadata\x12*.luci.resultdb.v1.QueryTestMetadataRequest\x1a+.luci.resultdb.v1.QueryTestMetadataResponse\"\x00\x12Z\n\x0eGetInstruction\x12\'.luci.resultdb.v1.GetInstructionRequest\x1a\x1d.luci.resultdb.v1.Instruction\"\x00\x12k\n\x10QueryInstruction\x12).luci.resultdb.v1.QueryInstructionRequest\x1a*.luci.resultdb.v1.QueryInstructionResponse\"\x00\x12z\n\x15QueryTestAggregations\x12..luci.resultdb.v1.QueryTestAggregationsRequest\x1a/.luci.resultdb.v1.QueryTestAggregationsResponse\"\x00\x12n\n\x11QueryTestVerdicts\x12*.luci.resultdb.v1.QueryTestVerdictsRequest\x1a+.luci.resultdb.v1.QueryTestVerdictsResponse\"\x00\x12w\n\x14\x42\x61tchGetTestVerdicts\x12-.luci.resultdb.v1.BatchGetTestVerdictsRequest\x1a..luci.resultdb.v1.BatchGetTestVerdictsResponse\"\x00\x12Q\n\x0bGetArtifact\x12$.luci.resultdb.v1.GetArtifactRequest\x1a\x1a.luci.resultdb.v1.Artifact\"\x00\x12\x62\n\rListArtifacts\x12&.luci.resultdb.v1.ListArtifactsRequest\x1a\'.luci.resultdb.v1.ListArtifactsResponse\"\x00\x12\x65\n\x0eQueryArtifacts\x12\'.luci.resultdb.v1.QueryArtifactsRequest\x1a(.luci.resultdb.v1.QueryArtifactsResponse\"\x00\x12n\n\x11ListArtifactLines\x12*.luci.resultdb.v1.ListArtifactLinesRequest\x1a+.luci.resultdb.v1.ListArtifactLinesResponse\"\x00\x12w\n\x14\x43ompareArtifactLines\x12-.luci.resultdb.v1.CompareArtifactLinesRequest\x1a..luci.resultdb.v1.CompareArtifactLinesResponse\"\x00\x12\x95\x01\n\x1eQueryTestVariantArtifactGroups\x12\x37.luci.resultdb.v1.QueryTestVariantArtifactGroupsRequest\x1a\x38.luci.resultdb.v1.QueryTestVariantArtifactGroupsResponse\"\x00\x12\x86\x01\n\x19QueryTestVariantArtifacts\x12\x32.luci.resultdb.v1.QueryTestVariantArtifactsRequest\x1a\x33.luci.resultdb.v1.QueryTestVariantArtifactsResponse\"\x00\x12\xa7\x01\n$QueryInvocationVariantArtifactGroups\x12=.luci.resultdb.v1.QueryInvocationVariantArtifactGroupsRequest\x1a>.luci.resultdb.v1.QueryInvocationVariantArtifactGroupsResponse\"\x00\x12\x98\x01\n\x1fQueryInvocationVariantArtifacts\x12\x38.luci.resultdb.v1.QueryInvocationVariantArtifactsRequest\x1a\x39.luci.resultdb.v1.QueryInvocationVariantArtifactsResponse\"\x00\x12W\n\rGetInvocation\x12&.luci.resultdb.v1.GetInvocationRequest\x1a\x1c.luci.resultdb.v1.Invocation\"\x00\x12\x83\x01\n\x18QueryRootInvocationNames\x12\x31.luci.resultdb.v1.QueryRootInvocationNamesRequest\x1a\x32.luci.resultdb.v1.QueryRootInvocationNamesResponse\"\x00\x12w\n\x14QueryRunTestVerdicts\x12-.luci.resultdb.v1.QueryRunTestVerdictsRequest\x1a..luci.resultdb.v1.QueryRunTestVerdictsResponse\"\x00\x12n\n\x11QueryTestVariants\x12*.luci.resultdb.v1.QueryTestVariantsRequest\x1a+.luci.resultdb.v1.QueryTestVariantsResponse\"\x00\x12w\n\x14\x42\x61tchGetTestVariants\x12-.luci.resultdb.v1.BatchGetTestVariantsRequest\x1a..luci.resultdb.v1.BatchGetTestVariantsResponse\"\x00\x12\x86\x01\n\x19QueryTestResultStatistics\x12\x32.luci.resultdb.v1.QueryTestResultStatisticsRequest\x1a\x33.luci.resultdb.v1.QueryTestResultStatisticsResponse\"\x00\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.resultdb_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_GETINVOCATIONREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_GETINVOCATIONREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYROOTINVOCATIONNAMESREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_QUERYROOTINVOCATIONNAMESREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_GETTESTRESULTREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_GETTESTRESULTREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_LISTTESTRESULTSREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_LISTTESTRESULTSREQUEST'].fields_by_name['invocation']._serialized_options = b'\342A\001\002'
+  _globals['_LISTTESTEXONERATIONSREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_LISTTESTEXONERATIONSREQUEST'].fields_by_name['invocation']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTEXONERATIONSREQUEST'].fields_by_name['predicate']._loaded_options = None
+  _globals['_QUERYTESTEXONERATIONSREQUEST'].fields_by_name['predicate']._serialized_options = b'\342A\001\002'
+  _globals['_GETARTIFACTREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_GETARTIFACTREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_LISTARTIFACTSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_LISTARTIFACTSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_COMPAREARTIFACTLINESREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_COMPAREARTIFACTLINESREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_COMPAREARTIFACTLINESRESPONSE'].fields_by_name['used_passing_artifacts']._loaded_options = None
+  _globals['_COMPAREARTIFACTLINESRESPONSE'].fields_by_name['used_passing_artifacts']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTVARIANTSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_QUERYTESTVARIANTSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTVARIANTSREQUEST'].fields_by_name['invocations']._loaded_options = None
+  _globals['_QUERYTESTVARIANTSREQUEST'].fields_by_name['invocations']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTVARIANTSRESPONSE_SOURCESENTRY']._loaded_options = None
+  _globals['_QUERYTESTVARIANTSRESPONSE_SOURCESENTRY']._serialized_options = b'8\001'
+  _globals['_BATCHGETTESTVARIANTSREQUEST_TESTVARIANTIDENTIFIER'].fields_by_name['test_id']._loaded_options = None
+  _globals['_BATCHGETTESTVARIANTSREQUEST_TESTVARIANTIDENTIFIER'].fields_by_name['test_id']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHGETTESTVARIANTSREQUEST_TESTVARIANTIDENTIFIER'].fields_by_name['variant_hash']._loaded_options = None
+  _globals['_BATCHGETTESTVARIANTSREQUEST_TESTVARIANTIDENTIFIER'].fields_by_name['variant_hash']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHGETTESTVARIANTSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_BATCHGETTESTVARIANTSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHGETTESTVARIANTSREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_BATCHGETTESTVARIANTSREQUEST'].fields_by_name['invocation']._serialized_options = b'\030\001'
+  _globals['_BATCHGETTESTVARIANTSRESPONSE_SOURCESENTRY']._loaded_options = None
+  _globals['_BATCHGETTESTVARIANTSRESPONSE_SOURCESENTRY']._serialized_options = b'8\001'
+  _globals['_BATCHGETTESTVERDICTSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_BATCHGETTESTVERDICTSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTMETADATAREQUEST'].fields_by_name['project']._loaded_options = None
+  _globals['_QUERYTESTMETADATAREQUEST'].fields_by_name['project']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYNEWTESTVARIANTSREQUEST'].fields_by_name['invocation']._loaded_options = None
+  _globals['_QUERYNEWTESTVARIANTSREQUEST'].fields_by_name['invocation']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYNEWTESTVARIANTSREQUEST'].fields_by_name['baseline']._loaded_options = None
+  _globals['_QUERYNEWTESTVARIANTSREQUEST'].fields_by_name['baseline']._serialized_options = b'\342A\001\002'
+  _globals['_ARTIFACTMATCHINGCONTENT'].fields_by_name['test_status']._loaded_options = None
+  _globals['_ARTIFACTMATCHINGCONTENT'].fields_by_name['test_status']._serialized_options = b'\030\001'
+  _globals['_QUERYTESTAGGREGATIONSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_QUERYTESTAGGREGATIONSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYTESTVERDICTSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_QUERYTESTVERDICTSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_GETINVOCATIONREQUEST']._serialized_start=934
+  _globals['_GETINVOCATIONREQUEST']._serialized_end=976
+  _globals['_QUERYROOTINVOCATIONNAMESREQUEST']._serialized_start=978
+  _globals['_QUERYROOTINVOCATIONNAMESREQUEST']._serialized_end=1031
+  _globals['_QUERYROOTINVOCATIONNAMESRESPONSE']._serialized_start=1033
+  _globals['_QUERYROOTINVOCATIONNAMESRESPONSE']._serialized_end=1098
+  _globals['_GETTESTRESULTREQUEST']._serialized_start=1100
+  _globals['_GETTESTRESULTREQUEST']._serialized_end=1142
+  _globals['_LISTTESTRESULTSREQUEST']._serialized_start=1145
+  _globals['_LISTTESTRESULTSREQUEST']._serialized_end=1281
+  _globals['_LISTTESTRESULTSRESPONSE']._serialized_start=1283
+  _globals['_LISTTESTRESULTSRESPONSE']._serialized_end=1385
+  _globals['_GETTESTEXONERATIONREQUEST']._serialized_start=1387
+  _globals['_GETTESTEXONERATIONREQUEST']._serialized_end=1428
+  _globals['_LISTTESTEXONERATIONSREQUEST']._serialized_start=1430
+  _globals['_LISTTESTEXONERATIONSREQUEST']._serialized_end=1524
+  _globals['_LISTTESTEXONERATIONSRESPONSE']._serialized_start=1526
+  _globals['_LISTTESTEXONERATIONSRESPONSE']._serialized_end=1643
+  _globals['_QUERYTESTRESULTSREQUEST']._serialized_start=1646
+  _globals['_QUERYTESTRESULTSREQUEST']._serialized_end=1836
+  _globals['_QUERYTESTRESULTSRESPONSE']._serialized_start=1838
+  _globals['_QUERYTESTRESULTSRESPONSE']._serialized_end=1941
+  _globals['_QUERYTESTEXONERATIONSREQUEST']._serialized_start=1944
+  _globals['_QUERYTESTEXONERATIONSREQUEST']._serialized_end=2103
+  _globals['_QUERYTESTEXONERATIONSRESPONSE']._serialized_start=2105
+  _globals['_QUERYTESTEXONERATIONSRESPONSE']._serialized_end=2223
+  _globals['_QUERYTESTRESULTSTATISTICSREQUEST']._serialized_start=2225
+  _globals['_QUERYTESTRESULTSTATISTICSREQUEST']._serialized_end=2280
+  _globals['_QUERYTESTRESULTSTATISTICSRESPONSE']._serialized_start=2282
+  _globals['_QUERYTESTRESULTSTATISTICSRESPONSE']._serialized_end=2345
+  _globals['_GETARTIFACTREQUEST']._serialized_start=2347
+  _globals['_GETARTIFACTREQUEST']._serialized_end=2387
+  _globals['_LISTARTIFACTSREQUEST']._serialized_start=2390
+  _globals['_LISTARTIFACTSREQUEST']._serialized_end=2520
+  _globals['_LISTARTIFACTSRESPONSE']._serialized_start=2522
+  _globals['_LISTARTIFACTSRESPONSE']._serialized_end=2617
+  _globals['_QUERYARTIFACTSREQUEST']._serialized_start=2620
+  _globals['_QUERYARTIFACTSREQUEST']._serialized_end=2822
+  _globals['_QUERYARTIFACTSRESPONSE']._serialized_start=2824
+  _globals['_QUERYARTIFACTSRESPONSE']._serialized_end=2920
+  _globals['_LISTARTIFACTLINESREQUEST']._serialized_start=2922
+  _globals['_LISTARTIFACTLINESREQUEST']._serialized_end=2983
+  _globals['_LISTARTIFACTLINESRESPONSE']._serialized_start=2985
+  _globals['_LISTARTIFACTLINESRESPONSE']._serialized_end=3059
+  _globals['_COMPAREARTIFACTLINESREQUEST']._serialized_start=3062
+  _globals['_COMPAREARTIFACTLINESREQUEST']._serialized_end=3332
+  _globals['_COMPAREARTIFACTLINESREQUEST_VIEW']._serialized_start=3262
+  _globals['_COMPAREARTIFACTLINESREQUEST_VIEW']._serialized_end=3332
+  _globals['_COMPAREARTIFACTLINESRESPONSE']._serialized_start=3335
+  _globals['_COMPAREARTIFACTLINESRESPONSE']._serialized_end=3650
+  _globals['_COMPAREARTIFACTLINESRESPONSE_FAILUREONLYRANGE']._serialized_start=3541
+  _globals['_COMPAREARTIFACTLINESRESPONSE_FAILUREONLYRANGE']._serialized_end=3650
+  _globals['_QUERYTESTVARIANTSREQUEST']._serialized_start=3653
+  _globals['_QUERYTESTVARIANTSREQUEST']._serialized_end=3927
+  _globals['_QUERYTESTVARIANTSRESPONSE']._serialized_start=3930
+  _globals['_QUERYTESTVARIANTSRESPONSE']._serialized_end=4186
+  _globals['_QUERYTESTVARIANTSRESPONSE_SOURCESENTRY']._serialized_start=4113
+  _globals['_QUERYTESTVARIANTSRESPONSE_SOURCESENTRY']._serialized_end=4186
+  _globals['_QUERYRUNTESTVERDICTSREQUEST']._serialized_start=4188
+  _globals['_QUERYRUNTESTVERDICTSREQUEST']._serialized_end=4298
+  _globals['_QUERYRUNTESTVERDICTSRESPONSE']._serialized_start=4300
+  _globals['_QUERYRUNTESTVERDICTSRESPONSE']._serialized_end=4416
+  _globals['_BATCHGETTESTVARIANTSREQUEST']._serialized_start=4419
+  _globals['_BATCHGETTESTVARIANTSREQUEST']._serialized_end=4747
+  _globals['_BATCHGETTESTVARIANTSREQUEST_TESTVARIANTIDENTIFIER']._serialized_start=4611
+  _globals['_BATCHGETTESTVARIANTSREQUEST_TESTVARIANTIDENTIFIER']._serialized_end=4747
+  _globals['_BATCHGETTESTVARIANTSRESPONSE']._serialized_start=4750
+  _globals['_BATCHGETTESTVARIANTSRESPONSE']._serialized_end=4987
+  _globals['_BATCHGETTESTVARIANTSRESPONSE_SOURCESENTRY']._serialized_start=4113
+  _globals['_BATCHGETTESTVARIANTSRESPONSE_SOURCESENTRY']._serialized_end=4186
+  _globals['_BATCHGETTESTVERDICTSREQUEST']._serialized_start=4990
+  _globals['_BATCHGETTESTVERDICTSREQUEST']._serialized_end=5318
+  _globals['_BATCHGETTESTVERDICTSREQUEST_NOMINATEDTEST']._serialized_start=5169
+  _globals['_BATCHGETTESTVERDICTSREQUEST_NOMINATEDTEST']._serialized_end=5318
+  _globals['_BATCHGETTESTVERDICTSRESPONSE']._serialized_start=5320
+  _globals['_BATCHGETTESTVERDICTSRESPONSE']._serialized_end=5404
+  _globals['_QUERYTESTMETADATAREQUEST']._serialized_start=5407
+  _globals['_QUERYTESTMETADATAREQUEST']._serialized_end=5555
+  _globals['_QUERYTESTMETADATARESPONSE']._serialized_start=5557
+  _globals['_QUERYTESTMETADATARESPONSE']._serialized_end=5669
+  _globals['_QUERYNEWTESTVARIANTSREQUEST']._serialized_start=5671
+  _globals['_QUERYNEWTESTVARIANTSREQUEST']._serialized_end=5750
+  _globals['_QUERYNEWTESTVARIANTSRESPONSE']._serialized_start=5753
+  _globals['_QUERYNEWTESTVARIANTSRESPONSE']._serialized_end=5957
+  _globals['_QUERYNEWTESTVARIANTSRESPONSE_NEWTESTVARIANT']._serialized_start=5902
+  _globals['_QUERYNEWTESTVARIANTSRESPONSE_NEWTESTVARIANT']._serialized_end=5957
+  _globals['_GETINSTRUCTIONREQUEST']._serialized_start=5959
+  _globals['_GETINSTRUCTIONREQUEST']._serialized_end=5996
+  _globals['_QUERYINSTRUCTIONREQUEST']._serialized_start=5998
+  _globals['_QUERYINSTRUCTIONREQUEST']._serialized_end=6067
+  _globals['_QUERYINSTRUCTIONRESPONSE']._serialized_start=6070
+  _globals['_QUERYINSTRUCTIONRESPONSE']._serialized_end=6221
+  _globals['_INSTRUCTIONDEPENDENCYCHAIN']._serialized_start=6224
+  _globals['_INSTRUCTIONDEPENDENCYCHAIN']._serialized_end=6463
+  _globals['_INSTRUCTIONDEPENDENCYCHAIN_NODE']._serialized_start=6373
+  _globals['_INSTRUCTIONDEPENDENCYCHAIN_NODE']._serialized_end=6463
+  _globals['_QUERYTESTVARIANTARTIFACTGROUPSREQUEST']._serialized_start=6466
+  _globals['_QUERYTESTVARIANTARTIFACTGROUPSREQUEST']._serialized_end=6832
+  _globals['_QUERYTESTVARIANTARTIFACTGROUPSRESPONSE']._serialized_start=6835
+  _globals['_QUERYTESTVARIANTARTIFACTGROUPSRESPONSE']._serialized_end=7190
+  _globals['_QUERYTESTVARIANTARTIFACTGROUPSRESPONSE_MATCHGROUP']._serialized_start=6988
+  _globals['_QUERYTESTVARIANTARTIFACTGROUPSRESPONSE_MATCHGROUP']._serialized_end=7190
+  _globals['_QUERYTESTVARIANTARTIFACTSREQUEST']._serialized_start=7193
+  _globals['_QUERYTESTVARIANTARTIFACTSREQUEST']._serialized_end=7502
+  _globals['_QUERYTESTVARIANTARTIFACTSRESPONSE']._serialized_start=7504
+  _globals['_QUERYTESTVARIANTARTIFACTSRESPONSE']._serialized_end=7626
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTGROUPSREQUEST']._serialized_start=7629
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTGROUPSREQUEST']._serialized_end=7947
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTGROUPSRESPONSE']._serialized_start=7950
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTGROUPSRESPONSE']._serialized_end=8312
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTGROUPSRESPONSE_MATCHGROUP']._serialized_start=8115
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTGROUPSRESPONSE_MATCHGROUP']._serialized_end=8312
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTSREQUEST']._serialized_start=8315
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTSREQUEST']._serialized_end=8619
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTSRESPONSE']._serialized_start=8622
+  _globals['_QUERYINVOCATIONVARIANTARTIFACTSRESPONSE']._serialized_end=8750
+  _globals['_ARTIFACTMATCHINGCONTENT']._serialized_start=8753
+  _globals['_ARTIFACTMATCHINGCONTENT']._serialized_end=9092
+  _globals['_ARTIFACTMATCHINGCONTENT_MATCH']._serialized_start=9045
+  _globals['_ARTIFACTMATCHINGCONTENT_MATCH']._serialized_end=9092
+  _globals['_ARTIFACTCONTENTMATCHER']._serialized_start=9094
+  _globals['_ARTIFACTCONTENTMATCHER']._serialized_end=9173
+  _globals['_IDMATCHER']._serialized_start=9175
+  _globals['_IDMATCHER']._serialized_end=9242
+  _globals['_QUERYTESTAGGREGATIONSREQUEST']._serialized_start=9245
+  _globals['_QUERYTESTAGGREGATIONSREQUEST']._serialized_end=9417
+  _globals['_QUERYTESTAGGREGATIONSRESPONSE']._serialized_start=9419
+  _globals['_QUERYTESTAGGREGATIONSRESPONSE']._serialized_end=9532
+  _globals['_QUERYTESTVERDICTSREQUEST']._serialized_start=9535
+  _globals['_QUERYTESTVERDICTSREQUEST']._serialized_end=9768
+  _globals['_QUERYTESTVERDICTSRESPONSE']._serialized_start=9770
+  _globals['_QUERYTESTVERDICTSRESPONSE']._serialized_end=9876
+  _globals['_RESULTDB']._serialized_start=9879
+  _globals['_RESULTDB']._serialized_end=13579
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,688 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import field_mask_pb2 as _field_mask_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import artifact as _artifact_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import instruction as _instruction_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import invocation as _invocation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import predicate as _predicate_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import root_invocation as _root_invocation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_aggregation as _test_aggregation_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as _test_exoneration_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_variant as _test_variant_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_verdict as _test_verdict_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as _test_metadata_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import work_unit as _work_unit_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetInvocationRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class QueryRootInvocationNamesRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class QueryRootInvocationNamesResponse(_message.Message):
+    __slots__ = ("root_invocation_names",)
+    ROOT_INVOCATION_NAMES_FIELD_NUMBER: _ClassVar[int]
+    root_invocation_names: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, root_invocation_names: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetTestResultRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class ListTestResultsRequest(_message.Message):
+    __slots__ = ("invocation", "page_size", "page_token", "read_mask")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    invocation: str
+    page_size: int
+    page_token: str
+    read_mask: _field_mask_pb2.FieldMask
+    def __init__(self, invocation: _Optional[str] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class ListTestResultsResponse(_message.Message):
+    __slots__ = ("test_results", "next_page_token")
+    TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    test_results: _containers.RepeatedCompositeFieldContainer[_test_result_pb2.TestResult]
+    next_page_token: str
+    def __init__(self, test_results: _Optional[_Iterable[_Union[_test_result_pb2.TestResult, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class GetTestExonerationRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class ListTestExonerationsRequest(_message.Message):
+    __slots__ = ("invocation", "page_size", "page_token")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    invocation: str
+    page_size: int
+    page_token: str
+    def __init__(self, invocation: _Optional[str] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class ListTestExonerationsResponse(_message.Message):
+    __slots__ = ("test_exonerations", "next_page_token")
+    TEST_EXONERATIONS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    test_exonerations: _containers.RepeatedCompositeFieldContainer[_test_exoneration_pb2.TestExoneration]
+    next_page_token: str
+    def __init__(self, test_exonerations: _Optional[_Iterable[_Union[_test_exoneration_pb2.TestExoneration, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestResultsRequest(_message.Message):
+    __slots__ = ("invocations", "predicate", "page_size", "page_token", "read_mask")
+    INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    invocations: _containers.RepeatedScalarFieldContainer[str]
+    predicate: _predicate_pb2.TestResultPredicate
+    page_size: int
+    page_token: str
+    read_mask: _field_mask_pb2.FieldMask
+    def __init__(self, invocations: _Optional[_Iterable[str]] = ..., predicate: _Optional[_Union[_predicate_pb2.TestResultPredicate, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class QueryTestResultsResponse(_message.Message):
+    __slots__ = ("test_results", "next_page_token")
+    TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    test_results: _containers.RepeatedCompositeFieldContainer[_test_result_pb2.TestResult]
+    next_page_token: str
+    def __init__(self, test_results: _Optional[_Iterable[_Union[_test_result_pb2.TestResult, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestExonerationsRequest(_message.Message):
+    __slots__ = ("invocations", "predicate", "page_size", "page_token")
+    INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    invocations: _containers.RepeatedScalarFieldContainer[str]
+    predicate: _predicate_pb2.TestExonerationPredicate
+    page_size: int
+    page_token: str
+    def __init__(self, invocations: _Optional[_Iterable[str]] = ..., predicate: _Optional[_Union[_predicate_pb2.TestExonerationPredicate, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestExonerationsResponse(_message.Message):
+    __slots__ = ("test_exonerations", "next_page_token")
+    TEST_EXONERATIONS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    test_exonerations: _containers.RepeatedCompositeFieldContainer[_test_exoneration_pb2.TestExoneration]
+    next_page_token: str
+    def __init__(self, test_exonerations: _Optional[_Iterable[_Union[_test_exoneration_pb2.TestExoneration, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestResultStatisticsRequest(_message.Message):
+    __slots__ = ("invocations",)
+    INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    invocations: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, invocations: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class QueryTestResultStatisticsResponse(_message.Message):
+    __slots__ = ("total_test_results",)
+    TOTAL_TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    total_test_results: int
+    def __init__(self, total_test_results: _Optional[int] = ...) -> None: ...
+
+class GetArtifactRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class ListArtifactsRequest(_message.Message):
+    __slots__ = ("parent", "page_size", "page_token", "read_mask")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    page_size: int
+    page_token: str
+    read_mask: _field_mask_pb2.FieldMask
+    def __init__(self, parent: _Optional[str] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class ListArtifactsResponse(_message.Message):
+    __slots__ = ("artifacts", "next_page_token")
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    artifacts: _containers.RepeatedCompositeFieldContainer[_artifact_pb2.Artifact]
+    next_page_token: str
+    def __init__(self, artifacts: _Optional[_Iterable[_Union[_artifact_pb2.Artifact, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryArtifactsRequest(_message.Message):
+    __slots__ = ("invocations", "parent", "predicate", "page_size", "page_token", "read_mask")
+    INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    invocations: _containers.RepeatedScalarFieldContainer[str]
+    parent: str
+    predicate: _predicate_pb2.ArtifactPredicate
+    page_size: int
+    page_token: str
+    read_mask: _field_mask_pb2.FieldMask
+    def __init__(self, invocations: _Optional[_Iterable[str]] = ..., parent: _Optional[str] = ..., predicate: _Optional[_Union[_predicate_pb2.ArtifactPredicate, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class QueryArtifactsResponse(_message.Message):
+    __slots__ = ("artifacts", "next_page_token")
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    artifacts: _containers.RepeatedCompositeFieldContainer[_artifact_pb2.Artifact]
+    next_page_token: str
+    def __init__(self, artifacts: _Optional[_Iterable[_Union[_artifact_pb2.Artifact, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class ListArtifactLinesRequest(_message.Message):
+    __slots__ = ("parent", "page_size")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    page_size: int
+    def __init__(self, parent: _Optional[str] = ..., page_size: _Optional[int] = ...) -> None: ...
+
+class ListArtifactLinesResponse(_message.Message):
+    __slots__ = ("lines",)
+    LINES_FIELD_NUMBER: _ClassVar[int]
+    lines: _containers.RepeatedCompositeFieldContainer[_artifact_pb2.ArtifactLine]
+    def __init__(self, lines: _Optional[_Iterable[_Union[_artifact_pb2.ArtifactLine, _Mapping]]] = ...) -> None: ...
+
+class CompareArtifactLinesRequest(_message.Message):
+    __slots__ = ("name", "passing_results", "artifacts", "view", "page_size", "page_token")
+    class View(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        VIEW_UNSPECIFIED: _ClassVar[CompareArtifactLinesRequest.View]
+        RANGES_ONLY: _ClassVar[CompareArtifactLinesRequest.View]
+        RANGES_WITH_CONTENT: _ClassVar[CompareArtifactLinesRequest.View]
+    VIEW_UNSPECIFIED: CompareArtifactLinesRequest.View
+    RANGES_ONLY: CompareArtifactLinesRequest.View
+    RANGES_WITH_CONTENT: CompareArtifactLinesRequest.View
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PASSING_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    VIEW_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    passing_results: _containers.RepeatedScalarFieldContainer[str]
+    artifacts: _containers.RepeatedScalarFieldContainer[str]
+    view: CompareArtifactLinesRequest.View
+    page_size: int
+    page_token: str
+    def __init__(self, name: _Optional[str] = ..., passing_results: _Optional[_Iterable[str]] = ..., artifacts: _Optional[_Iterable[str]] = ..., view: _Optional[_Union[CompareArtifactLinesRequest.View, str]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class CompareArtifactLinesResponse(_message.Message):
+    __slots__ = ("failure_only_ranges", "next_page_token", "used_passing_artifacts", "artifacts")
+    class FailureOnlyRange(_message.Message):
+        __slots__ = ("start_line", "end_line", "start_byte", "end_byte", "lines")
+        START_LINE_FIELD_NUMBER: _ClassVar[int]
+        END_LINE_FIELD_NUMBER: _ClassVar[int]
+        START_BYTE_FIELD_NUMBER: _ClassVar[int]
+        END_BYTE_FIELD_NUMBER: _ClassVar[int]
+        LINES_FIELD_NUMBER: _ClassVar[int]
+        start_line: int
+        end_line: int
+        start_byte: int
+        end_byte: int
+        lines: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, start_line: _Optional[int] = ..., end_line: _Optional[int] = ..., start_byte: _Optional[int] = ..., end_byte: _Optional[int] = ..., lines: _Optional[_Iterable[str]] = ...) -> None: ...
+    FAILURE_ONLY_RANGES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    USED_PASSING_ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    failure_only_ranges: _containers.RepeatedCompositeFieldContainer[CompareArtifactLinesResponse.FailureOnlyRange]
+    next_page_token: str
+    used_passing_artifacts: _containers.RepeatedScalarFieldContainer[str]
+    artifacts: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, failure_only_ranges: _Optional[_Iterable[_Union[CompareArtifactLinesResponse.FailureOnlyRange, _Mapping]]] = ..., next_page_token: _Optional[str] = ..., used_passing_artifacts: _Optional[_Iterable[str]] = ..., artifacts: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class QueryTestVariantsRequest(_message.Message):
+    __slots__ = ("parent", "invocations", "predicate", "result_limit", "page_size", "page_token", "read_mask", "order_by", "filter")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    RESULT_LIMIT_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    ORDER_BY_FIELD_NUMBER: _ClassVar[int]
+    FILTER_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    invocations: _containers.RepeatedScalarFieldContainer[str]
+    predicate: _test_variant_pb2.TestVariantPredicate
+    result_limit: int
+    page_size: int
+    page_token: str
+    read_mask: _field_mask_pb2.FieldMask
+    order_by: str
+    filter: str
+    def __init__(self, parent: _Optional[str] = ..., invocations: _Optional[_Iterable[str]] = ..., predicate: _Optional[_Union[_test_variant_pb2.TestVariantPredicate, _Mapping]] = ..., result_limit: _Optional[int] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ..., order_by: _Optional[str] = ..., filter: _Optional[str] = ...) -> None: ...
+
+class QueryTestVariantsResponse(_message.Message):
+    __slots__ = ("test_variants", "next_page_token", "sources")
+    class SourcesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: _common_pb2.Sources
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[_common_pb2.Sources, _Mapping]] = ...) -> None: ...
+    TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    test_variants: _containers.RepeatedCompositeFieldContainer[_test_variant_pb2.TestVariant]
+    next_page_token: str
+    sources: _containers.MessageMap[str, _common_pb2.Sources]
+    def __init__(self, test_variants: _Optional[_Iterable[_Union[_test_variant_pb2.TestVariant, _Mapping]]] = ..., next_page_token: _Optional[str] = ..., sources: _Optional[_Mapping[str, _common_pb2.Sources]] = ...) -> None: ...
+
+class QueryRunTestVerdictsRequest(_message.Message):
+    __slots__ = ("invocation", "result_limit", "page_size", "page_token")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    RESULT_LIMIT_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    invocation: str
+    result_limit: int
+    page_size: int
+    page_token: str
+    def __init__(self, invocation: _Optional[str] = ..., result_limit: _Optional[int] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryRunTestVerdictsResponse(_message.Message):
+    __slots__ = ("run_test_verdicts", "next_page_token")
+    RUN_TEST_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    run_test_verdicts: _containers.RepeatedCompositeFieldContainer[_test_variant_pb2.RunTestVerdict]
+    next_page_token: str
+    def __init__(self, run_test_verdicts: _Optional[_Iterable[_Union[_test_variant_pb2.RunTestVerdict, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class BatchGetTestVariantsRequest(_message.Message):
+    __slots__ = ("parent", "invocation", "test_variants", "result_limit")
+    class TestVariantIdentifier(_message.Message):
+        __slots__ = ("test_id_structured", "test_id", "variant_hash")
+        TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+        TEST_ID_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+        test_id_structured: _common_pb2.TestIdentifier
+        test_id: str
+        variant_hash: str
+        def __init__(self, test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ...) -> None: ...
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    RESULT_LIMIT_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    invocation: str
+    test_variants: _containers.RepeatedCompositeFieldContainer[BatchGetTestVariantsRequest.TestVariantIdentifier]
+    result_limit: int
+    def __init__(self, parent: _Optional[str] = ..., invocation: _Optional[str] = ..., test_variants: _Optional[_Iterable[_Union[BatchGetTestVariantsRequest.TestVariantIdentifier, _Mapping]]] = ..., result_limit: _Optional[int] = ...) -> None: ...
+
+class BatchGetTestVariantsResponse(_message.Message):
+    __slots__ = ("test_variants", "sources")
+    class SourcesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: _common_pb2.Sources
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[_common_pb2.Sources, _Mapping]] = ...) -> None: ...
+    TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    test_variants: _containers.RepeatedCompositeFieldContainer[_test_variant_pb2.TestVariant]
+    sources: _containers.MessageMap[str, _common_pb2.Sources]
+    def __init__(self, test_variants: _Optional[_Iterable[_Union[_test_variant_pb2.TestVariant, _Mapping]]] = ..., sources: _Optional[_Mapping[str, _common_pb2.Sources]] = ...) -> None: ...
+
+class BatchGetTestVerdictsRequest(_message.Message):
+    __slots__ = ("parent", "tests", "view")
+    class NominatedTest(_message.Message):
+        __slots__ = ("test_id_structured", "test_id_flat")
+        TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+        TEST_ID_FLAT_FIELD_NUMBER: _ClassVar[int]
+        test_id_structured: _common_pb2.TestIdentifier
+        test_id_flat: _common_pb2.FlatTestIdentifier
+        def __init__(self, test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id_flat: _Optional[_Union[_common_pb2.FlatTestIdentifier, _Mapping]] = ...) -> None: ...
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    TESTS_FIELD_NUMBER: _ClassVar[int]
+    VIEW_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    tests: _containers.RepeatedCompositeFieldContainer[BatchGetTestVerdictsRequest.NominatedTest]
+    view: _common_pb2.TestVerdictView
+    def __init__(self, parent: _Optional[str] = ..., tests: _Optional[_Iterable[_Union[BatchGetTestVerdictsRequest.NominatedTest, _Mapping]]] = ..., view: _Optional[_Union[_common_pb2.TestVerdictView, str]] = ...) -> None: ...
+
+class BatchGetTestVerdictsResponse(_message.Message):
+    __slots__ = ("test_verdicts",)
+    TEST_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    test_verdicts: _containers.RepeatedCompositeFieldContainer[_test_verdict_pb2.TestVerdict]
+    def __init__(self, test_verdicts: _Optional[_Iterable[_Union[_test_verdict_pb2.TestVerdict, _Mapping]]] = ...) -> None: ...
+
+class QueryTestMetadataRequest(_message.Message):
+    __slots__ = ("project", "predicate", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    predicate: _predicate_pb2.TestMetadataPredicate
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., predicate: _Optional[_Union[_predicate_pb2.TestMetadataPredicate, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestMetadataResponse(_message.Message):
+    __slots__ = ("testMetadata", "next_page_token")
+    TESTMETADATA_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    testMetadata: _containers.RepeatedCompositeFieldContainer[_test_metadata_pb2.TestMetadataDetail]
+    next_page_token: str
+    def __init__(self, testMetadata: _Optional[_Iterable[_Union[_test_metadata_pb2.TestMetadataDetail, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryNewTestVariantsRequest(_message.Message):
+    __slots__ = ("invocation", "baseline")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    BASELINE_FIELD_NUMBER: _ClassVar[int]
+    invocation: str
+    baseline: str
+    def __init__(self, invocation: _Optional[str] = ..., baseline: _Optional[str] = ...) -> None: ...
+
+class QueryNewTestVariantsResponse(_message.Message):
+    __slots__ = ("is_baseline_ready", "new_test_variants")
+    class NewTestVariant(_message.Message):
+        __slots__ = ("test_id", "variant_hash")
+        TEST_ID_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+        test_id: str
+        variant_hash: str
+        def __init__(self, test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ...) -> None: ...
+    IS_BASELINE_READY_FIELD_NUMBER: _ClassVar[int]
+    NEW_TEST_VARIANTS_FIELD_NUMBER: _ClassVar[int]
+    is_baseline_ready: bool
+    new_test_variants: _containers.RepeatedCompositeFieldContainer[QueryNewTestVariantsResponse.NewTestVariant]
+    def __init__(self, is_baseline_ready: bool = ..., new_test_variants: _Optional[_Iterable[_Union[QueryNewTestVariantsResponse.NewTestVariant, _Mapping]]] = ...) -> None: ...
+
+class GetInstructionRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class QueryInstructionRequest(_message.Message):
+    __slots__ = ("name", "dependency_max_depth")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    DEPENDENCY_MAX_DEPTH_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    dependency_max_depth: int
+    def __init__(self, name: _Optional[str] = ..., dependency_max_depth: _Optional[int] = ...) -> None: ...
+
+class QueryInstructionResponse(_message.Message):
+    __slots__ = ("instruction", "dependency_chains")
+    INSTRUCTION_FIELD_NUMBER: _ClassVar[int]
+    DEPENDENCY_CHAINS_FIELD_NUMBER: _ClassVar[int]
+    instruction: _instruction_pb2.Instruction
+    dependency_chains: _containers.RepeatedCompositeFieldContainer[InstructionDependencyChain]
+    def __init__(self, instruction: _Optional[_Union[_instruction_pb2.Instruction, _Mapping]] = ..., dependency_chains: _Optional[_Iterable[_Union[InstructionDependencyChain, _Mapping]]] = ...) -> None: ...
+
+class InstructionDependencyChain(_message.Message):
+    __slots__ = ("target", "nodes")
+    class Node(_message.Message):
+        __slots__ = ("instruction_name", "content", "error", "descriptive_name")
+        INSTRUCTION_NAME_FIELD_NUMBER: _ClassVar[int]
+        CONTENT_FIELD_NUMBER: _ClassVar[int]
+        ERROR_FIELD_NUMBER: _ClassVar[int]
+        DESCRIPTIVE_NAME_FIELD_NUMBER: _ClassVar[int]
+        instruction_name: str
+        content: str
+        error: str
+        descriptive_name: str
+        def __init__(self, instruction_name: _Optional[str] = ..., content: _Optional[str] = ..., error: _Optional[str] = ..., descriptive_name: _Optional[str] = ...) -> None: ...
+    TARGET_FIELD_NUMBER: _ClassVar[int]
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    target: _instruction_pb2.InstructionTarget
+    nodes: _containers.RepeatedCompositeFieldContainer[InstructionDependencyChain.Node]
+    def __init__(self, target: _Optional[_Union[_instruction_pb2.InstructionTarget, str]] = ..., nodes: _Optional[_Iterable[_Union[InstructionDependencyChain.Node, _Mapping]]] = ...) -> None: ...
+
+class QueryTestVariantArtifactGroupsRequest(_message.Message):
+    __slots__ = ("project", "search_string", "test_id_matcher", "artifact_id_matcher", "start_time", "end_time", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_STRING_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_MATCHER_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_MATCHER_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    search_string: ArtifactContentMatcher
+    test_id_matcher: IDMatcher
+    artifact_id_matcher: IDMatcher
+    start_time: _timestamp_pb2.Timestamp
+    end_time: _timestamp_pb2.Timestamp
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., search_string: _Optional[_Union[ArtifactContentMatcher, _Mapping]] = ..., test_id_matcher: _Optional[_Union[IDMatcher, _Mapping]] = ..., artifact_id_matcher: _Optional[_Union[IDMatcher, _Mapping]] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestVariantArtifactGroupsResponse(_message.Message):
+    __slots__ = ("groups", "next_page_token")
+    class MatchGroup(_message.Message):
+        __slots__ = ("test_id", "variant_hash", "variant", "artifact_id", "artifacts", "matching_count")
+        TEST_ID_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_FIELD_NUMBER: _ClassVar[int]
+        ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+        ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+        MATCHING_COUNT_FIELD_NUMBER: _ClassVar[int]
+        test_id: str
+        variant_hash: str
+        variant: _common_pb2.Variant
+        artifact_id: str
+        artifacts: _containers.RepeatedCompositeFieldContainer[ArtifactMatchingContent]
+        matching_count: int
+        def __init__(self, test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., artifact_id: _Optional[str] = ..., artifacts: _Optional[_Iterable[_Union[ArtifactMatchingContent, _Mapping]]] = ..., matching_count: _Optional[int] = ...) -> None: ...
+    GROUPS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    groups: _containers.RepeatedCompositeFieldContainer[QueryTestVariantArtifactGroupsResponse.MatchGroup]
+    next_page_token: str
+    def __init__(self, groups: _Optional[_Iterable[_Union[QueryTestVariantArtifactGroupsResponse.MatchGroup, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestVariantArtifactsRequest(_message.Message):
+    __slots__ = ("project", "search_string", "test_id", "variant_hash", "artifact_id", "start_time", "end_time", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_STRING_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    search_string: ArtifactContentMatcher
+    test_id: str
+    variant_hash: str
+    artifact_id: str
+    start_time: _timestamp_pb2.Timestamp
+    end_time: _timestamp_pb2.Timestamp
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., search_string: _Optional[_Union[ArtifactContentMatcher, _Mapping]] = ..., test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ..., artifact_id: _Optional[str] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestVariantArtifactsResponse(_message.Message):
+    __slots__ = ("artifacts", "next_page_token")
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    artifacts: _containers.RepeatedCompositeFieldContainer[ArtifactMatchingContent]
+    next_page_token: str
+    def __init__(self, artifacts: _Optional[_Iterable[_Union[ArtifactMatchingContent, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryInvocationVariantArtifactGroupsRequest(_message.Message):
+    __slots__ = ("project", "search_string", "artifact_id_matcher", "start_time", "end_time", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_STRING_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_MATCHER_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    search_string: ArtifactContentMatcher
+    artifact_id_matcher: IDMatcher
+    start_time: _timestamp_pb2.Timestamp
+    end_time: _timestamp_pb2.Timestamp
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., search_string: _Optional[_Union[ArtifactContentMatcher, _Mapping]] = ..., artifact_id_matcher: _Optional[_Union[IDMatcher, _Mapping]] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryInvocationVariantArtifactGroupsResponse(_message.Message):
+    __slots__ = ("groups", "next_page_token")
+    class MatchGroup(_message.Message):
+        __slots__ = ("variant_union_hash", "variant_union", "artifact_id", "artifacts", "matching_count")
+        VARIANT_UNION_HASH_FIELD_NUMBER: _ClassVar[int]
+        VARIANT_UNION_FIELD_NUMBER: _ClassVar[int]
+        ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+        ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+        MATCHING_COUNT_FIELD_NUMBER: _ClassVar[int]
+        variant_union_hash: str
+        variant_union: _common_pb2.Variant
+        artifact_id: str
+        artifacts: _containers.RepeatedCompositeFieldContainer[ArtifactMatchingContent]
+        matching_count: int
+        def __init__(self, variant_union_hash: _Optional[str] = ..., variant_union: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., artifact_id: _Optional[str] = ..., artifacts: _Optional[_Iterable[_Union[ArtifactMatchingContent, _Mapping]]] = ..., matching_count: _Optional[int] = ...) -> None: ...
+    GROUPS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    groups: _containers.RepeatedCompositeFieldContainer[QueryInvocationVariantArtifactGroupsResponse.MatchGroup]
+    next_page_token: str
+    def __init__(self, groups: _Optional[_Iterable[_Union[QueryInvocationVariantArtifactGroupsResponse.MatchGroup, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryInvocationVariantArtifactsRequest(_message.Message):
+    __slots__ = ("project", "search_string", "variant_union_hash", "artifact_id", "start_time", "end_time", "page_size", "page_token")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_STRING_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_UNION_HASH_FIELD_NUMBER: _ClassVar[int]
+    ARTIFACT_ID_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    search_string: ArtifactContentMatcher
+    variant_union_hash: str
+    artifact_id: str
+    start_time: _timestamp_pb2.Timestamp
+    end_time: _timestamp_pb2.Timestamp
+    page_size: int
+    page_token: str
+    def __init__(self, project: _Optional[str] = ..., search_string: _Optional[_Union[ArtifactContentMatcher, _Mapping]] = ..., variant_union_hash: _Optional[str] = ..., artifact_id: _Optional[str] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryInvocationVariantArtifactsResponse(_message.Message):
+    __slots__ = ("artifacts", "next_page_token")
+    ARTIFACTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    artifacts: _containers.RepeatedCompositeFieldContainer[ArtifactMatchingContent]
+    next_page_token: str
+    def __init__(self, artifacts: _Optional[_Iterable[_Union[ArtifactMatchingContent, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class ArtifactMatchingContent(_message.Message):
+    __slots__ = ("name", "partition_time", "test_status", "test_status_v2", "snippet", "matches")
+    class Match(_message.Message):
+        __slots__ = ("start_index", "end_index")
+        START_INDEX_FIELD_NUMBER: _ClassVar[int]
+        END_INDEX_FIELD_NUMBER: _ClassVar[int]
+        start_index: int
+        end_index: int
+        def __init__(self, start_index: _Optional[int] = ..., end_index: _Optional[int] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PARTITION_TIME_FIELD_NUMBER: _ClassVar[int]
+    TEST_STATUS_FIELD_NUMBER: _ClassVar[int]
+    TEST_STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+    SNIPPET_FIELD_NUMBER: _ClassVar[int]
+    MATCHES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    partition_time: _timestamp_pb2.Timestamp
+    test_status: _test_result_pb2.TestStatus
+    test_status_v2: _test_result_pb2.TestResult.Status
+    snippet: str
+    matches: _containers.RepeatedCompositeFieldContainer[ArtifactMatchingContent.Match]
+    def __init__(self, name: _Optional[str] = ..., partition_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., test_status: _Optional[_Union[_test_result_pb2.TestStatus, str]] = ..., test_status_v2: _Optional[_Union[_test_result_pb2.TestResult.Status, str]] = ..., snippet: _Optional[str] = ..., matches: _Optional[_Iterable[_Union[ArtifactMatchingContent.Match, _Mapping]]] = ...) -> None: ...
+
+class ArtifactContentMatcher(_message.Message):
+    __slots__ = ("regex_contain", "contain")
+    REGEX_CONTAIN_FIELD_NUMBER: _ClassVar[int]
+    CONTAIN_FIELD_NUMBER: _ClassVar[int]
+    regex_contain: str
+    contain: str
+    def __init__(self, regex_contain: _Optional[str] = ..., contain: _Optional[str] = ...) -> None: ...
+
+class IDMatcher(_message.Message):
+    __slots__ = ("has_prefix", "exact_equal")
+    HAS_PREFIX_FIELD_NUMBER: _ClassVar[int]
+    EXACT_EQUAL_FIELD_NUMBER: _ClassVar[int]
+    has_prefix: str
+    exact_equal: str
+    def __init__(self, has_prefix: _Optional[str] = ..., exact_equal: _Optional[str] = ...) -> None: ...
+
+class QueryTestAggregationsRequest(_message.Message):
+    __slots__ = ("parent", "predicate", "order_by", "page_size", "page_token")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    ORDER_BY_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    predicate: _predicate_pb2.TestAggregationPredicate
+    order_by: str
+    page_size: int
+    page_token: str
+    def __init__(self, parent: _Optional[str] = ..., predicate: _Optional[_Union[_predicate_pb2.TestAggregationPredicate, _Mapping]] = ..., order_by: _Optional[str] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestAggregationsResponse(_message.Message):
+    __slots__ = ("aggregations", "next_page_token")
+    AGGREGATIONS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    aggregations: _containers.RepeatedCompositeFieldContainer[_test_aggregation_pb2.TestAggregation]
+    next_page_token: str
+    def __init__(self, aggregations: _Optional[_Iterable[_Union[_test_aggregation_pb2.TestAggregation, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestVerdictsRequest(_message.Message):
+    __slots__ = ("parent", "predicate", "order_by", "view", "page_size", "page_token")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    ORDER_BY_FIELD_NUMBER: _ClassVar[int]
+    VIEW_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    predicate: _predicate_pb2.TestVerdictPredicate
+    order_by: str
+    view: _common_pb2.TestVerdictView
+    page_size: int
+    page_token: str
+    def __init__(self, parent: _Optional[str] = ..., predicate: _Optional[_Union[_predicate_pb2.TestVerdictPredicate, _Mapping]] = ..., order_by: _Optional[str] = ..., view: _Optional[_Union[_common_pb2.TestVerdictView, str]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryTestVerdictsResponse(_message.Message):
+    __slots__ = ("test_verdicts", "next_page_token")
+    TEST_VERDICTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    test_verdicts: _containers.RepeatedCompositeFieldContainer[_test_verdict_pb2.TestVerdict]
+    next_page_token: str
+    def __init__(self, test_verdicts: _Optional[_Iterable[_Union[_test_verdict_pb2.TestVerdict, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/root_invocation.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/root_invocation.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n<go.chromium.org/luci/resultdb/proto/v1/root_invocation.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\"\xe0\n\n\x0eRootInvocation\x12\x13\n\x04name\x18\x01 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12!\n\x12root_invocation_id\x18\x02 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12T\n\x12\x66inalization_state\x18\x03 \x01(\x0e\x32\x32.luci.resultdb.v1.RootInvocation.FinalizationStateB\x04\xe2\x41\x01\x03\x12;\n\x05state\x18\x11 \x01(\x0e\x32&.luci.resultdb.v1.RootInvocation.StateB\x04\xe2\x41\x01\x03\x12\x1e\n\x10summary_markdown\x18\x12 \x01(\tB\x04\xe2\x41\x01\x03\x12\x14\n\x05realm\x18\x04 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x36\n\x0b\x63reate_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x05\xe2\x41\x02\x03\x05\x12\x16\n\x07\x63reator\x18\x06 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x36\n\x0clast_updated\x18\x14 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12=\n\x13\x66inalize_start_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x37\n\rfinalize_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x44\n\x11producer_resource\x18\x19 \x01(\x0b\x32\".luci.resultdb.v1.ProducerResourceB\x05\xe2\x41\x02\x05\x03\x12>\n\ndefinition\x18\x15 \x01(\x0b\x32*.luci.resultdb.v1.RootInvocationDefinition\x12*\n\x07sources\x18\x0b \x01(\x0b\x32\x19.luci.resultdb.v1.Sources\x12\x38\n\rprimary_build\x18\x17 \x01(\x0b\x32!.luci.resultdb.v1.BuildDescriptor\x12\x37\n\x0c\x65xtra_builds\x18\x18 \x03(\x0b\x32!.luci.resultdb.v1.BuildDescriptor\x12*\n\x04tags\x18\r \x03(\x0b\x32\x1c.luci.resultdb.v1.StringPair\x12+\n\nproperties\x18\x0e \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x13\n\x0b\x62\x61seline_id\x18\x0f \x01(\t\x12U\n\x16streaming_export_state\x18\x13 \x01(\x0e\x32\x35.luci.resultdb.v1.RootInvocation.StreamingExportState\x12\x0c\n\x04\x65tag\x18\x10 \x01(\t\"b\n\x11\x46inalizationState\x12\"\n\x1e\x46INALIZATION_STATE_UNSPECIFIED\x10\x00\x12\n\n\x06\x41\x43TIVE\x10\x01\x12\x0e\n\nFINALIZING\x10\x02\x12\r\n\tFINALIZED\x10\x03\"\x85\x01\n\x05State\x12\x15\n\x11STATE_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x14\n\x10\x46INAL_STATE_MASK\x10\x04\x12\r\n\tSUCCEEDED\x10\x0c\x12\x0b\n\x07SKIPPED\x10\x14\x12\n\n\x06\x46\x41ILED\x10$\x12\r\n\tCANCELLED\x10\x44\"i\n\x14StreamingExportState\x12&\n\"STREAMING_EXPORT_STATE_UNSPECIFIED\x10\x00\x12\x15\n\x11WAIT_FOR_METADATA\x10\x01\x12\x12\n\x0eMETADATA_FINAL\x10\x02\".\n\x18GetRootInvocationRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\"\xa0\x03\n\x16RootInvocationMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1a\n\x12root_invocation_id\x18\x02 \x01(\t\x12\r\n\x05realm\x18\x04 \x01(\t\x12/\n\x0b\x63reate_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12=\n\x11producer_resource\x18\x19 \x01(\x0b\x32\".luci.resultdb.v1.ProducerResource\x12>\n\ndefinition\x18\x15 \x01(\x0b\x32*.luci.resultdb.v1.RootInvocationDefinition\x12*\n\x07sources\x18\x0b \x01(\x0b\x32\x19.luci.resultdb.v1.Sources\x12\x38\n\rprimary_build\x18\x17 \x01(\x0b\x32!.luci.resultdb.v1.BuildDescriptor\x12\x37\n\x0c\x65xtra_builds\x18\x18 \x03(\x0b\x32!.luci.resultdb.v1.BuildDescriptorBP\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.root_invocation_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_ROOTINVOCATION'].fields_by_name['name']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['name']._serialized_options = b'\342A\002\003\005'
+  _globals['_ROOTINVOCATION'].fields_by_name['root_invocation_id']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['root_invocation_id']._serialized_options = b'\342A\002\003\005'
+  _globals['_ROOTINVOCATION'].fields_by_name['finalization_state']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['finalization_state']._serialized_options = b'\342A\001\003'
+  _globals['_ROOTINVOCATION'].fields_by_name['state']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['state']._serialized_options = b'\342A\001\003'
+  _globals['_ROOTINVOCATION'].fields_by_name['summary_markdown']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['summary_markdown']._serialized_options = b'\342A\001\003'
+  _globals['_ROOTINVOCATION'].fields_by_name['realm']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['realm']._serialized_options = b'\342A\002\003\005'
+  _globals['_ROOTINVOCATION'].fields_by_name['create_time']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['create_time']._serialized_options = b'\342A\002\003\005'
+  _globals['_ROOTINVOCATION'].fields_by_name['creator']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['creator']._serialized_options = b'\342A\002\003\005'
+  _globals['_ROOTINVOCATION'].fields_by_name['last_updated']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['last_updated']._serialized_options = b'\342A\001\003'
+  _globals['_ROOTINVOCATION'].fields_by_name['finalize_start_time']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['finalize_start_time']._serialized_options = b'\342A\001\003'
+  _globals['_ROOTINVOCATION'].fields_by_name['finalize_time']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['finalize_time']._serialized_options = b'\342A\001\003'
+  _globals['_ROOTINVOCATION'].fields_by_name['producer_resource']._loaded_options = None
+  _globals['_ROOTINVOCATION'].fields_by_name['producer_resource']._serialized_options = b'\342A\002\005\003'
+  _globals['_GETROOTINVOCATIONREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_GETROOTINVOCATIONREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_ROOTINVOCATION']._serialized_start=232
+  _globals['_ROOTINVOCATION']._serialized_end=1608
+  _globals['_ROOTINVOCATION_FINALIZATIONSTATE']._serialized_start=1267
+  _globals['_ROOTINVOCATION_FINALIZATIONSTATE']._serialized_end=1365
+  _globals['_ROOTINVOCATION_STATE']._serialized_start=1368
+  _globals['_ROOTINVOCATION_STATE']._serialized_end=1501
+  _globals['_ROOTINVOCATION_STREAMINGEXPORTSTATE']._serialized_start=1503
+  _globals['_ROOTINVOCATION_STREAMINGEXPORTSTATE']._serialized_end=1608
+  _globals['_GETROOTINVOCATIONREQUEST']._serialized_start=1610
+  _globals['_GETROOTINVOCATIONREQUEST']._serialized_end=1656
+  _globals['_ROOTINVOCATIONMETADATA']._serialized_start=1659
+  _globals['_ROOTINVOCATIONMETADATA']._serialized_end=2075
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,124 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class RootInvocation(_message.Message):
+    __slots__ = ("name", "root_invocation_id", "finalization_state", "state", "summary_markdown", "realm", "create_time", "creator", "last_updated", "finalize_start_time", "finalize_time", "producer_resource", "definition", "sources", "primary_build", "extra_builds", "tags", "properties", "baseline_id", "streaming_export_state", "etag")
+    class FinalizationState(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        FINALIZATION_STATE_UNSPECIFIED: _ClassVar[RootInvocation.FinalizationState]
+        ACTIVE: _ClassVar[RootInvocation.FinalizationState]
+        FINALIZING: _ClassVar[RootInvocation.FinalizationState]
+        FINALIZED: _ClassVar[RootInvocation.FinalizationState]
+    FINALIZATION_STATE_UNSPECIFIED: RootInvocation.FinalizationState
+    ACTIVE: RootInvocation.FinalizationState
+    FINALIZING: RootInvocation.FinalizationState
+    FINALIZED: RootInvocation.FinalizationState
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATE_UNSPECIFIED: _ClassVar[RootInvocation.State]
+        PENDING: _ClassVar[RootInvocation.State]
+        RUNNING: _ClassVar[RootInvocation.State]
+        FINAL_STATE_MASK: _ClassVar[RootInvocation.State]
+        SUCCEEDED: _ClassVar[RootInvocation.State]
+        SKIPPED: _ClassVar[RootInvocation.State]
+        FAILED: _ClassVar[RootInvocation.State]
+        CANCELLED: _ClassVar[RootInvocation.State]
+    STATE_UNSPECIFIED: RootInvocation.State
+    PENDING: RootInvocation.State
+    RUNNING: RootInvocation.State
+    FINAL_STATE_MASK: RootInvocation.State
+    SUCCEEDED: RootInvocation.State
+    SKIPPED: RootInvocation.State
+    FAILED: RootInvocation.State
+    CANCELLED: RootInvocation.State
+    class StreamingExportState(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STREAMING_EXPORT_STATE_UNSPECIFIED: _ClassVar[RootInvocation.StreamingExportState]
+        WAIT_FOR_METADATA: _ClassVar[RootInvocation.StreamingExportState]
+        METADATA_FINAL: _ClassVar[RootInvocation.StreamingExportState]
+    STREAMING_EXPORT_STATE_UNSPECIFIED: RootInvocation.StreamingExportState
+    WAIT_FOR_METADATA: RootInvocation.StreamingExportState
+    METADATA_FINAL: RootInvocation.StreamingExportState
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ROOT_INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    FINALIZATION_STATE_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_MARKDOWN_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    CREATOR_FIELD_NUMBER: _ClassVar[int]
+    LAST_UPDATED_FIELD_NUMBER: _ClassVar[int]
+    FINALIZE_START_TIME_FIELD_NUMBER: _ClassVar[int]
+    FINALIZE_TIME_FIELD_NUMBER: _ClassVar[int]
+    PRODUCER_RESOURCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITION_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    PRIMARY_BUILD_FIELD_NUMBER: _ClassVar[int]
+    EXTRA_BUILDS_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    BASELINE_ID_FIELD_NUMBER: _ClassVar[int]
+    STREAMING_EXPORT_STATE_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    root_invocation_id: str
+    finalization_state: RootInvocation.FinalizationState
+    state: RootInvocation.State
+    summary_markdown: str
+    realm: str
+    create_time: _timestamp_pb2.Timestamp
+    creator: str
+    last_updated: _timestamp_pb2.Timestamp
+    finalize_start_time: _timestamp_pb2.Timestamp
+    finalize_time: _timestamp_pb2.Timestamp
+    producer_resource: _common_pb2.ProducerResource
+    definition: _common_pb2.RootInvocationDefinition
+    sources: _common_pb2.Sources
+    primary_build: _common_pb2.BuildDescriptor
+    extra_builds: _containers.RepeatedCompositeFieldContainer[_common_pb2.BuildDescriptor]
+    tags: _containers.RepeatedCompositeFieldContainer[_common_pb2.StringPair]
+    properties: _struct_pb2.Struct
+    baseline_id: str
+    streaming_export_state: RootInvocation.StreamingExportState
+    etag: str
+    def __init__(self, name: _Optional[str] = ..., root_invocation_id: _Optional[str] = ..., finalization_state: _Optional[_Union[RootInvocation.FinalizationState, str]] = ..., state: _Optional[_Union[RootInvocation.State, str]] = ..., summary_markdown: _Optional[str] = ..., realm: _Optional[str] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., creator: _Optional[str] = ..., last_updated: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., finalize_start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., finalize_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., producer_resource: _Optional[_Union[_common_pb2.ProducerResource, _Mapping]] = ..., definition: _Optional[_Union[_common_pb2.RootInvocationDefinition, _Mapping]] = ..., sources: _Optional[_Union[_common_pb2.Sources, _Mapping]] = ..., primary_build: _Optional[_Union[_common_pb2.BuildDescriptor, _Mapping]] = ..., extra_builds: _Optional[_Iterable[_Union[_common_pb2.BuildDescriptor, _Mapping]]] = ..., tags: _Optional[_Iterable[_Union[_common_pb2.StringPair, _Mapping]]] = ..., properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., baseline_id: _Optional[str] = ..., streaming_export_state: _Optional[_Union[RootInvocation.StreamingExportState, str]] = ..., etag: _Optional[str] = ...) -> None: ...
+
+class GetRootInvocationRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class RootInvocationMetadata(_message.Message):
+    __slots__ = ("name", "root_invocation_id", "realm", "create_time", "producer_resource", "definition", "sources", "primary_build", "extra_builds")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ROOT_INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    PRODUCER_RESOURCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITION_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    PRIMARY_BUILD_FIELD_NUMBER: _ClassVar[int]
+    EXTRA_BUILDS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    root_invocation_id: str
+    realm: str
+    create_time: _timestamp_pb2.Timestamp
+    producer_resource: _common_pb2.ProducerResource
+    definition: _common_pb2.RootInvocationDefinition
+    sources: _common_pb2.Sources
+    primary_build: _common_pb2.BuildDescriptor
+    extra_builds: _containers.RepeatedCompositeFieldContainer[_common_pb2.BuildDescriptor]
+    def __init__(self, name: _Optional[str] = ..., root_invocation_id: _Optional[str] = ..., realm: _Optional[str] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., producer_resource: _Optional[_Union[_common_pb2.ProducerResource, _Mapping]] = ..., definition: _Optional[_Union[_common_pb2.RootInvocationDefinition, _Mapping]] = ..., sources: _Optional[_Union[_common_pb2.Sources, _Mapping]] = ..., primary_build: _Optional[_Union[_common_pb2.BuildDescriptor, _Mapping]] = ..., extra_builds: _Optional[_Iterable[_Union[_common_pb2.BuildDescriptor, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/schema.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/schema.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3go.chromium.org/luci/resultdb/proto/v1/schema.proto\x12\x10luci.resultdb.v1\" \n\x10GetSchemaRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x98\x01\n\x06Schema\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x36\n\x07schemes\x18\x02 \x03(\x0b\x32%.luci.resultdb.v1.Schema.SchemesEntry\x1aH\n\x0cSchemesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\'\n\x05value\x18\x02 \x01(\x0b\x32\x18.luci.resultdb.v1.Scheme:\x02\x38\x01\" \n\x10GetSchemeRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x8c\x02\n\x06Scheme\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x1b\n\x13human_readable_name\x18\x03 \x01(\t\x12.\n\x06\x63oarse\x18\x04 \x01(\x0b\x32\x1e.luci.resultdb.v1.Scheme.Level\x12,\n\x04\x66ine\x18\x05 \x01(\x0b\x32\x1e.luci.resultdb.v1.Scheme.Level\x12,\n\x04\x63\x61se\x18\x06 \x01(\x0b\x32\x1e.luci.resultdb.v1.Scheme.Level\x1a?\n\x05Level\x12\x1b\n\x13human_readable_name\x18\x01 \x01(\t\x12\x19\n\x11validation_regexp\x18\x02 \x01(\t2\x9d\x01\n\x07Schemas\x12\x45\n\x03Get\x12\".luci.resultdb.v1.GetSchemaRequest\x1a\x18.luci.resultdb.v1.Schema\"\x00\x12K\n\tGetScheme\x12\".luci.resultdb.v1.GetSchemeRequest\x1a\x18.luci.resultdb.v1.Scheme\"\x00\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.schema_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_SCHEMA_SCHEMESENTRY']._loaded_options = None
+  _globals['_SCHEMA_SCHEMESENTRY']._serialized_options = b'8\001'
+  _globals['_GETSCHEMAREQUEST']._serialized_start=73
+  _globals['_GETSCHEMAREQUEST']._serialized_end=105
+  _globals['_SCHEMA']._serialized_start=108
+  _globals['_SCHEMA']._serialized_end=260
+  _globals['_SCHEMA_SCHEMESENTRY']._serialized_start=188
+  _globals['_SCHEMA_SCHEMESENTRY']._serialized_end=260
+  _globals['_GETSCHEMEREQUEST']._serialized_start=262
+  _globals['_GETSCHEMEREQUEST']._serialized_end=294
+  _globals['_SCHEME']._serialized_start=297
+  _globals['_SCHEME']._serialized_end=565
+  _globals['_SCHEME_LEVEL']._serialized_start=502
+  _globals['_SCHEME_LEVEL']._serialized_end=565
+  _globals['_SCHEMAS']._serialized_start=568
+  _globals['_SCHEMAS']._serialized_end=725
+# @@protoc_insertion_point(module_scope)
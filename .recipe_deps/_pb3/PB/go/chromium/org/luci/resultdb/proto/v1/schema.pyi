@@ -0,0 +1,57 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetSchemaRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class Schema(_message.Message):
+    __slots__ = ("name", "schemes")
+    class SchemesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: Scheme
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Scheme, _Mapping]] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    SCHEMES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    schemes: _containers.MessageMap[str, Scheme]
+    def __init__(self, name: _Optional[str] = ..., schemes: _Optional[_Mapping[str, Scheme]] = ...) -> None: ...
+
+class GetSchemeRequest(_message.Message):
+    __slots__ = ("name",)
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
+
+class Scheme(_message.Message):
+    __slots__ = ("name", "id", "human_readable_name", "coarse", "fine", "case")
+    class Level(_message.Message):
+        __slots__ = ("human_readable_name", "validation_regexp")
+        HUMAN_READABLE_NAME_FIELD_NUMBER: _ClassVar[int]
+        VALIDATION_REGEXP_FIELD_NUMBER: _ClassVar[int]
+        human_readable_name: str
+        validation_regexp: str
+        def __init__(self, human_readable_name: _Optional[str] = ..., validation_regexp: _Optional[str] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    HUMAN_READABLE_NAME_FIELD_NUMBER: _ClassVar[int]
+    COARSE_FIELD_NUMBER: _ClassVar[int]
+    FINE_FIELD_NUMBER: _ClassVar[int]
+    CASE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    id: str
+    human_readable_name: str
+    coarse: Scheme.Level
+    fine: Scheme.Level
+    case: Scheme.Level
+    def __init__(self, name: _Optional[str] = ..., id: _Optional[str] = ..., human_readable_name: _Optional[str] = ..., coarse: _Optional[_Union[Scheme.Level, _Mapping]] = ..., fine: _Optional[_Union[Scheme.Level, _Mapping]] = ..., case: _Optional[_Union[Scheme.Level, _Mapping]] = ...) -> None: ...
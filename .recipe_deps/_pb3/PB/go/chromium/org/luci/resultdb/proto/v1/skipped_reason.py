@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/skipped_reason.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/skipped_reason.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;go.chromium.org/luci/resultdb/proto/v1/skipped_reason.proto\x12\x10luci.resultdb.v1\"\xd7\x01\n\rSkippedReason\x12\x32\n\x04kind\x18\x01 \x01(\x0e\x32$.luci.resultdb.v1.SkippedReason.Kind\x12\x16\n\x0ereason_message\x18\x02 \x01(\t\x12\r\n\x05trace\x18\x03 \x01(\t\"k\n\x04Kind\x12\x14\n\x10KIND_UNSPECIFIED\x10\x00\x12\x1b\n\x17\x44ISABLED_AT_DECLARATION\x10\x01\x12\x18\n\x14SKIPPED_BY_TEST_BODY\x10\x02\x12\x0b\n\x07\x44\x45MOTED\x10\x03\x12\t\n\x05OTHER\x10\x04\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.skipped_reason_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_SKIPPEDREASON']._serialized_start=82
+  _globals['_SKIPPEDREASON']._serialized_end=297
+  _globals['_SKIPPEDREASON_KIND']._serialized_start=190
+  _globals['_SKIPPEDREASON_KIND']._serialized_end=297
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,28 @@
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SkippedReason(_message.Message):
+    __slots__ = ("kind", "reason_message", "trace")
+    class Kind(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        KIND_UNSPECIFIED: _ClassVar[SkippedReason.Kind]
+        DISABLED_AT_DECLARATION: _ClassVar[SkippedReason.Kind]
+        SKIPPED_BY_TEST_BODY: _ClassVar[SkippedReason.Kind]
+        DEMOTED: _ClassVar[SkippedReason.Kind]
+        OTHER: _ClassVar[SkippedReason.Kind]
+    KIND_UNSPECIFIED: SkippedReason.Kind
+    DISABLED_AT_DECLARATION: SkippedReason.Kind
+    SKIPPED_BY_TEST_BODY: SkippedReason.Kind
+    DEMOTED: SkippedReason.Kind
+    OTHER: SkippedReason.Kind
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    REASON_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    TRACE_FIELD_NUMBER: _ClassVar[int]
+    kind: SkippedReason.Kind
+    reason_message: str
+    trace: str
+    def __init__(self, kind: _Optional[_Union[SkippedReason.Kind, str]] = ..., reason_message: _Optional[str] = ..., trace: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/test_aggregation.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/test_aggregation.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n=go.chromium.org/luci/resultdb/proto/v1/test_aggregation.proto\x12\x10luci.resultdb.v1\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\"\x91\x08\n\x0fTestAggregation\x12\x32\n\x02id\x18\x01 \x01(\x0b\x32&.luci.resultdb.v1.TestIdentifierPrefix\x12<\n\x10next_finer_level\x18\x02 \x01(\x0e\x32\".luci.resultdb.v1.AggregationLevel\x12M\n\x14total_verdict_counts\x18\x03 \x01(\x0b\x32/.luci.resultdb.v1.TestAggregation.VerdictCounts\x12O\n\x16matched_verdict_counts\x18\x06 \x01(\x0b\x32/.luci.resultdb.v1.TestAggregation.VerdictCounts\x12\x45\n\rmodule_status\x18\x04 \x01(\x0e\x32..luci.resultdb.v1.TestAggregation.ModuleStatus\x12\x16\n\x0ematched_module\x18\x07 \x01(\x08\x12R\n\x14module_status_counts\x18\x05 \x01(\x0b\x32\x34.luci.resultdb.v1.TestAggregation.ModuleStatusCounts\x1a\x9d\x02\n\rVerdictCounts\x12\x0e\n\x06\x66\x61iled\x18\x01 \x01(\x05\x12\r\n\x05\x66laky\x18\x02 \x01(\x05\x12\x0e\n\x06passed\x18\x03 \x01(\x05\x12\x0f\n\x07skipped\x18\x04 \x01(\x05\x12\x19\n\x11\x65xecution_errored\x18\x05 \x01(\x05\x12\x11\n\tprecluded\x18\x06 \x01(\x05\x12\x12\n\nexonerated\x18\x07 \x01(\x05\x12\x13\n\x0b\x66\x61iled_base\x18\x08 \x01(\x05\x12\x12\n\nflaky_base\x18\t \x01(\x05\x12\x13\n\x0bpassed_base\x18\n \x01(\x05\x12\x14\n\x0cskipped_base\x18\x0b \x01(\x05\x12\x1e\n\x16\x65xecution_errored_base\x18\x0c \x01(\x05\x12\x16\n\x0eprecluded_base\x18\r \x01(\x05\x1a\x8c\x01\n\x12ModuleStatusCounts\x12\x11\n\tsucceeded\x18\x01 \x01(\x05\x12\r\n\x05\x66laky\x18\x07 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x02 \x01(\x05\x12\x0f\n\x07skipped\x18\x03 \x01(\x05\x12\x11\n\tcancelled\x18\x04 \x01(\x05\x12\x0f\n\x07running\x18\x05 \x01(\x05\x12\x0f\n\x07pending\x18\x06 \x01(\x05\"\x89\x01\n\x0cModuleStatus\x12\x1d\n\x19MODULE_STATUS_UNSPECIFIED\x10\x00\x12\r\n\tSUCCEEDED\x10\x01\x12\t\n\x05\x46LAKY\x10\x07\x12\n\n\x06\x46\x41ILED\x10\x02\x12\x0b\n\x07SKIPPED\x10\x03\x12\r\n\tCANCELLED\x10\x04\x12\x0b\n\x07RUNNING\x10\x05\x12\x0b\n\x07PENDING\x10\x06\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.test_aggregation_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_TESTAGGREGATION']._serialized_start=137
+  _globals['_TESTAGGREGATION']._serialized_end=1178
+  _globals['_TESTAGGREGATION_VERDICTCOUNTS']._serialized_start=610
+  _globals['_TESTAGGREGATION_VERDICTCOUNTS']._serialized_end=895
+  _globals['_TESTAGGREGATION_MODULESTATUSCOUNTS']._serialized_start=898
+  _globals['_TESTAGGREGATION_MODULESTATUSCOUNTS']._serialized_end=1038
+  _globals['_TESTAGGREGATION_MODULESTATUS']._serialized_start=1041
+  _globals['_TESTAGGREGATION_MODULESTATUS']._serialized_end=1178
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,90 @@
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestAggregation(_message.Message):
+    __slots__ = ("id", "next_finer_level", "total_verdict_counts", "matched_verdict_counts", "module_status", "matched_module", "module_status_counts")
+    class ModuleStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        MODULE_STATUS_UNSPECIFIED: _ClassVar[TestAggregation.ModuleStatus]
+        SUCCEEDED: _ClassVar[TestAggregation.ModuleStatus]
+        FLAKY: _ClassVar[TestAggregation.ModuleStatus]
+        FAILED: _ClassVar[TestAggregation.ModuleStatus]
+        SKIPPED: _ClassVar[TestAggregation.ModuleStatus]
+        CANCELLED: _ClassVar[TestAggregation.ModuleStatus]
+        RUNNING: _ClassVar[TestAggregation.ModuleStatus]
+        PENDING: _ClassVar[TestAggregation.ModuleStatus]
+    MODULE_STATUS_UNSPECIFIED: TestAggregation.ModuleStatus
+    SUCCEEDED: TestAggregation.ModuleStatus
+    FLAKY: TestAggregation.ModuleStatus
+    FAILED: TestAggregation.ModuleStatus
+    SKIPPED: TestAggregation.ModuleStatus
+    CANCELLED: TestAggregation.ModuleStatus
+    RUNNING: TestAggregation.ModuleStatus
+    PENDING: TestAggregation.ModuleStatus
+    class VerdictCounts(_message.Message):
+        __slots__ = ("failed", "flaky", "passed", "skipped", "execution_errored", "precluded", "exonerated", "failed_base", "flaky_base", "passed_base", "skipped_base", "execution_errored_base", "precluded_base")
+        FAILED_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_FIELD_NUMBER: _ClassVar[int]
+        PASSED_FIELD_NUMBER: _ClassVar[int]
+        SKIPPED_FIELD_NUMBER: _ClassVar[int]
+        EXECUTION_ERRORED_FIELD_NUMBER: _ClassVar[int]
+        PRECLUDED_FIELD_NUMBER: _ClassVar[int]
+        EXONERATED_FIELD_NUMBER: _ClassVar[int]
+        FAILED_BASE_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_BASE_FIELD_NUMBER: _ClassVar[int]
+        PASSED_BASE_FIELD_NUMBER: _ClassVar[int]
+        SKIPPED_BASE_FIELD_NUMBER: _ClassVar[int]
+        EXECUTION_ERRORED_BASE_FIELD_NUMBER: _ClassVar[int]
+        PRECLUDED_BASE_FIELD_NUMBER: _ClassVar[int]
+        failed: int
+        flaky: int
+        passed: int
+        skipped: int
+        execution_errored: int
+        precluded: int
+        exonerated: int
+        failed_base: int
+        flaky_base: int
+        passed_base: int
+        skipped_base: int
+        execution_errored_base: int
+        precluded_base: int
+        def __init__(self, failed: _Optional[int] = ..., flaky: _Optional[int] = ..., passed: _Optional[int] = ..., skipped: _Optional[int] = ..., execution_errored: _Optional[int] = ..., precluded: _Optional[int] = ..., exonerated: _Optional[int] = ..., failed_base: _Optional[int] = ..., flaky_base: _Optional[int] = ..., passed_base: _Optional[int] = ..., skipped_base: _Optional[int] = ..., execution_errored_base: _Optional[int] = ..., precluded_base: _Optional[int] = ...) -> None: ...
+    class ModuleStatusCounts(_message.Message):
+        __slots__ = ("succeeded", "flaky", "failed", "skipped", "cancelled", "running", "pending")
+        SUCCEEDED_FIELD_NUMBER: _ClassVar[int]
+        FLAKY_FIELD_NUMBER: _ClassVar[int]
+        FAILED_FIELD_NUMBER: _ClassVar[int]
+        SKIPPED_FIELD_NUMBER: _ClassVar[int]
+        CANCELLED_FIELD_NUMBER: _ClassVar[int]
+        RUNNING_FIELD_NUMBER: _ClassVar[int]
+        PENDING_FIELD_NUMBER: _ClassVar[int]
+        succeeded: int
+        flaky: int
+        failed: int
+        skipped: int
+        cancelled: int
+        running: int
+        pending: int
+        def __init__(self, succeeded: _Optional[int] = ..., flaky: _Optional[int] = ..., failed: _Optional[int] = ..., skipped: _Optional[int] = ..., cancelled: _Optional[int] = ..., running: _Optional[int] = ..., pending: _Optional[int] = ...) -> None: ...
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NEXT_FINER_LEVEL_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_VERDICT_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    MATCHED_VERDICT_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    MODULE_STATUS_FIELD_NUMBER: _ClassVar[int]
+    MATCHED_MODULE_FIELD_NUMBER: _ClassVar[int]
+    MODULE_STATUS_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    id: _common_pb2.TestIdentifierPrefix
+    next_finer_level: _common_pb2.AggregationLevel
+    total_verdict_counts: TestAggregation.VerdictCounts
+    matched_verdict_counts: TestAggregation.VerdictCounts
+    module_status: TestAggregation.ModuleStatus
+    matched_module: bool
+    module_status_counts: TestAggregation.ModuleStatusCounts
+    def __init__(self, id: _Optional[_Union[_common_pb2.TestIdentifierPrefix, _Mapping]] = ..., next_finer_level: _Optional[_Union[_common_pb2.AggregationLevel, str]] = ..., total_verdict_counts: _Optional[_Union[TestAggregation.VerdictCounts, _Mapping]] = ..., matched_verdict_counts: _Optional[_Union[TestAggregation.VerdictCounts, _Mapping]] = ..., module_status: _Optional[_Union[TestAggregation.ModuleStatus, str]] = ..., matched_module: bool = ..., module_status_counts: _Optional[_Union[TestAggregation.ModuleStatusCounts, _Mapping]] = ...) -> None: ...
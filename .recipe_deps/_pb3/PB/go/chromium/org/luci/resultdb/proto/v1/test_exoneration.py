@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/test_exoneration.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/test_exoneration.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n=go.chromium.org/luci/resultdb/proto/v1/test_exoneration.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\"\xe4\x02\n\x0fTestExoneration\x12\x13\n\x04name\x18\x01 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x42\n\x12test_id_structured\x18\t \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifierB\x04\xe2\x41\x01\x05\x12\x16\n\x07test_id\x18\x02 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x31\n\x07variant\x18\x03 \x01(\x0b\x32\x19.luci.resultdb.v1.VariantB\x05\xe2\x41\x02\x03\x05\x12\x1d\n\x0e\x65xoneration_id\x18\x04 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x1e\n\x10\x65xplanation_html\x18\x05 \x01(\tB\x04\xe2\x41\x01\x05\x12\x1a\n\x0cvariant_hash\x18\x06 \x01(\tB\x04\xe2\x41\x01\x05\x12\x39\n\x06reason\x18\x07 \x01(\x0e\x32#.luci.resultdb.v1.ExonerationReasonB\x04\xe2\x41\x01\x05\x12\x17\n\tis_masked\x18\x08 \x01(\x08\x42\x04\xe2\x41\x01\x03*\x8f\x01\n\x11\x45xonerationReason\x12\"\n\x1e\x45XONERATION_REASON_UNSPECIFIED\x10\x00\x12\x16\n\x12OCCURS_ON_MAINLINE\x10\x01\x12\x17\n\x13OCCURS_ON_OTHER_CLS\x10\x02\x12\x10\n\x0cNOT_CRITICAL\x10\x03\x12\x13\n\x0fUNEXPECTED_PASS\x10\x04\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.test_exoneration_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_TESTEXONERATION'].fields_by_name['name']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['name']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTEXONERATION'].fields_by_name['test_id_structured']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['test_id_structured']._serialized_options = b'\342A\001\005'
+  _globals['_TESTEXONERATION'].fields_by_name['test_id']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['test_id']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTEXONERATION'].fields_by_name['variant']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['variant']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTEXONERATION'].fields_by_name['exoneration_id']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['exoneration_id']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTEXONERATION'].fields_by_name['explanation_html']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['explanation_html']._serialized_options = b'\342A\001\005'
+  _globals['_TESTEXONERATION'].fields_by_name['variant_hash']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['variant_hash']._serialized_options = b'\342A\001\005'
+  _globals['_TESTEXONERATION'].fields_by_name['reason']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['reason']._serialized_options = b'\342A\001\005'
+  _globals['_TESTEXONERATION'].fields_by_name['is_masked']._loaded_options = None
+  _globals['_TESTEXONERATION'].fields_by_name['is_masked']._serialized_options = b'\342A\001\003'
+  _globals['_EXONERATIONREASON']._serialized_start=529
+  _globals['_EXONERATIONREASON']._serialized_end=672
+  _globals['_TESTEXONERATION']._serialized_start=170
+  _globals['_TESTEXONERATION']._serialized_end=526
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,44 @@
+from PB.google.api import field_behavior as _field_behavior_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ExonerationReason(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    EXONERATION_REASON_UNSPECIFIED: _ClassVar[ExonerationReason]
+    OCCURS_ON_MAINLINE: _ClassVar[ExonerationReason]
+    OCCURS_ON_OTHER_CLS: _ClassVar[ExonerationReason]
+    NOT_CRITICAL: _ClassVar[ExonerationReason]
+    UNEXPECTED_PASS: _ClassVar[ExonerationReason]
+EXONERATION_REASON_UNSPECIFIED: ExonerationReason
+OCCURS_ON_MAINLINE: ExonerationReason
+OCCURS_ON_OTHER_CLS: ExonerationReason
+NOT_CRITICAL: ExonerationReason
+UNEXPECTED_PASS: ExonerationReason
+
+class TestExoneration(_message.Message):
+    __slots__ = ("name", "test_id_structured", "test_id", "variant", "exoneration_id", "explanation_html", "variant_hash", "reason", "is_masked")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    EXONERATION_ID_FIELD_NUMBER: _ClassVar[int]
+    EXPLANATION_HTML_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    REASON_FIELD_NUMBER: _ClassVar[int]
+    IS_MASKED_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    variant: _common_pb2.Variant
+    exoneration_id: str
+    explanation_html: str
+    variant_hash: str
+    reason: ExonerationReason
+    is_masked: bool
+    def __init__(self, name: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., exoneration_id: _Optional[str] = ..., explanation_html: _Optional[str] = ..., variant_hash: _Optional[str] = ..., reason: _Optional[_Union[ExonerationReason, str]] = ..., is_masked: bool = ...) -> None: ...
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n:go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto\x12\x10luci.resultdb.v1\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/api/field_behavior.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\"\xc3\x01\n\x12TestMetadataDetail\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x03\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0f\n\x07test_id\x18\x03 \x01(\t\x12\x10\n\x08ref_hash\x18\x0c \x01(\t\x12/\n\nsource_ref\x18\x04 \x01(\x0b\x32\x1b.luci.resultdb.v1.SourceRef\x12\x34\n\x0ctestMetadata\x18\x05 \x01(\x0b\x32\x1e.luci.resultdb.v1.TestMetadata\"\xeb\x01\n\x0cTestMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x30\n\x08location\x18\x02 \x01(\x0b\x32\x1e.luci.resultdb.v1.TestLocation\x12\x35\n\rbug_component\x18\x03 \x01(\x0b\x32\x1e.luci.resultdb.v1.BugComponent\x12\x1d\n\x11properties_schema\x18\x04 \x01(\tB\x02\x18\x01\x12+\n\nproperties\x18\x05 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x18\n\x10previous_test_id\x18\x06 \x01(\t\"=\n\x0cTestLocation\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x0c\n\x04line\x18\x03 \x01(\x05\"\x93\x01\n\x0c\x42ugComponent\x12@\n\rissue_tracker\x18\x01 \x01(\x0b\x32\'.luci.resultdb.v1.IssueTrackerComponentH\x00\x12\x37\n\x08monorail\x18\x02 \x01(\x0b\x32#.luci.resultdb.v1.MonorailComponentH\x00\x42\x08\n\x06system\"-\n\x15IssueTrackerComponent\x12\x14\n\x0c\x63omponent_id\x18\x01 \x01(\x03\"3\n\x11MonorailComponent\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\tBP\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.test_metadata_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_TESTMETADATADETAIL'].fields_by_name['name']._loaded_options = None
+  _globals['_TESTMETADATADETAIL'].fields_by_name['name']._serialized_options = b'\342A\001\003'
+  _globals['_TESTMETADATA'].fields_by_name['properties_schema']._loaded_options = None
+  _globals['_TESTMETADATA'].fields_by_name['properties_schema']._serialized_options = b'\030\001'
+  _globals['_TESTMETADATADETAIL']._serialized_start=197
+  _globals['_TESTMETADATADETAIL']._serialized_end=392
+  _globals['_TESTMETADATA']._serialized_start=395
+  _globals['_TESTMETADATA']._serialized_end=630
+  _globals['_TESTLOCATION']._serialized_start=632
+  _globals['_TESTLOCATION']._serialized_end=693
+  _globals['_BUGCOMPONENT']._serialized_start=696
+  _globals['_BUGCOMPONENT']._serialized_end=843
+  _globals['_ISSUETRACKERCOMPONENT']._serialized_start=845
+  _globals['_ISSUETRACKERCOMPONENT']._serialized_end=890
+  _globals['_MONORAILCOMPONENT']._serialized_start=892
+  _globals['_MONORAILCOMPONENT']._serialized_end=943
+# @@protoc_insertion_point(module_scope)
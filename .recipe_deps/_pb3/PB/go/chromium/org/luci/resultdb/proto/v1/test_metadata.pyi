@@ -0,0 +1,73 @@
+from google.protobuf import struct_pb2 as _struct_pb2
+from PB.google.api import field_behavior as _field_behavior_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestMetadataDetail(_message.Message):
+    __slots__ = ("name", "project", "test_id", "ref_hash", "source_ref", "testMetadata")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    REF_HASH_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_REF_FIELD_NUMBER: _ClassVar[int]
+    TESTMETADATA_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    project: str
+    test_id: str
+    ref_hash: str
+    source_ref: _common_pb2.SourceRef
+    testMetadata: TestMetadata
+    def __init__(self, name: _Optional[str] = ..., project: _Optional[str] = ..., test_id: _Optional[str] = ..., ref_hash: _Optional[str] = ..., source_ref: _Optional[_Union[_common_pb2.SourceRef, _Mapping]] = ..., testMetadata: _Optional[_Union[TestMetadata, _Mapping]] = ...) -> None: ...
+
+class TestMetadata(_message.Message):
+    __slots__ = ("name", "location", "bug_component", "properties_schema", "properties", "previous_test_id")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    BUG_COMPONENT_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_SCHEMA_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    location: TestLocation
+    bug_component: BugComponent
+    properties_schema: str
+    properties: _struct_pb2.Struct
+    previous_test_id: str
+    def __init__(self, name: _Optional[str] = ..., location: _Optional[_Union[TestLocation, _Mapping]] = ..., bug_component: _Optional[_Union[BugComponent, _Mapping]] = ..., properties_schema: _Optional[str] = ..., properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., previous_test_id: _Optional[str] = ...) -> None: ...
+
+class TestLocation(_message.Message):
+    __slots__ = ("repo", "file_name", "line")
+    REPO_FIELD_NUMBER: _ClassVar[int]
+    FILE_NAME_FIELD_NUMBER: _ClassVar[int]
+    LINE_FIELD_NUMBER: _ClassVar[int]
+    repo: str
+    file_name: str
+    line: int
+    def __init__(self, repo: _Optional[str] = ..., file_name: _Optional[str] = ..., line: _Optional[int] = ...) -> None: ...
+
+class BugComponent(_message.Message):
+    __slots__ = ("issue_tracker", "monorail")
+    ISSUE_TRACKER_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_FIELD_NUMBER: _ClassVar[int]
+    issue_tracker: IssueTrackerComponent
+    monorail: MonorailComponent
+    def __init__(self, issue_tracker: _Optional[_Union[IssueTrackerComponent, _Mapping]] = ..., monorail: _Optional[_Union[MonorailComponent, _Mapping]] = ...) -> None: ...
+
+class IssueTrackerComponent(_message.Message):
+    __slots__ = ("component_id",)
+    COMPONENT_ID_FIELD_NUMBER: _ClassVar[int]
+    component_id: int
+    def __init__(self, component_id: _Optional[int] = ...) -> None: ...
+
+class MonorailComponent(_message.Message):
+    __slots__ = ("project", "value")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    value: str
+    def __init__(self, project: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/test_result.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/test_result.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__metadata__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_failure__reason__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import skipped_reason as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_skipped__reason__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n8go.chromium.org/luci/resultdb/proto/v1/test_result.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a:go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto\x1a;go.chromium.org/luci/resultdb/proto/v1/failure_reason.proto\x1a;go.chromium.org/luci/resultdb/proto/v1/skipped_reason.proto\"\x84\x08\n\nTestResult\x12\x13\n\x04name\x18\x01 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x42\n\x12test_id_structured\x18\x13 \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifierB\x04\xe2\x41\x01\x05\x12\x16\n\x07test_id\x18\x02 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x18\n\tresult_id\x18\x03 \x01(\tB\x05\xe2\x41\x02\x05\x02\x12\x31\n\x07variant\x18\x04 \x01(\x0b\x32\x19.luci.resultdb.v1.VariantB\x05\xe2\x41\x02\x03\x05\x12\x18\n\x08\x65xpected\x18\x05 \x01(\x08\x42\x06\x18\x01\xe2\x41\x01\x05\x12\x34\n\x06status\x18\x06 \x01(\x0e\x32\x1c.luci.resultdb.v1.TestStatusB\x06\x18\x01\xe2\x41\x01\x05\x12\x36\n\tstatus_v2\x18\x14 \x01(\x0e\x32#.luci.resultdb.v1.TestResult.Status\x12\x1a\n\x0csummary_html\x18\x07 \x01(\tB\x04\xe2\x41\x01\x05\x12\x34\n\nstart_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x05\x12\x31\n\x08\x64uration\x18\t \x01(\x0b\x32\x19.google.protobuf.DurationB\x04\xe2\x41\x01\x05\x12\x30\n\x04tags\x18\n \x03(\x0b\x32\x1c.luci.resultdb.v1.StringPairB\x04\xe2\x41\x01\x05\x12\x1b\n\x0cvariant_hash\x18\x0c \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x35\n\rtest_metadata\x18\r \x01(\x0b\x32\x1e.luci.resultdb.v1.TestMetadata\x12\x37\n\x0e\x66\x61ilure_reason\x18\x0e \x01(\x0b\x32\x1f.luci.resultdb.v1.FailureReason\x12+\n\nproperties\x18\x0f \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x17\n\tis_masked\x18\x10 \x01(\x08\x42\x04\xe2\x41\x01\x03\x12\x35\n\x0bskip_reason\x18\x12 \x01(\x0e\x32\x1c.luci.resultdb.v1.SkipReasonB\x02\x18\x01\x12\x37\n\x0eskipped_reason\x18\x15 \x01(\x0b\x32\x1f.luci.resultdb.v1.SkippedReason\x12\x43\n\x14\x66ramework_extensions\x18\x16 \x01(\x0b\x32%.luci.resultdb.v1.FrameworkExtensions\"k\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\n\n\x06PASSED\x10\x01\x12\n\n\x06\x46\x41ILED\x10\x02\x12\x0b\n\x07SKIPPED\x10\x03\x12\x15\n\x11\x45XECUTION_ERRORED\x10\x04\x12\r\n\tPRECLUDED\x10\x05J\x04\x08\x0b\x10\x0c\"B\n\x13\x46rameworkExtensions\x12+\n\x08web_test\x18\x01 \x01(\x0b\x32\x19.luci.resultdb.v1.WebTest\"\xa8\x01\n\x07WebTest\x12\x13\n\x0bis_expected\x18\x01 \x01(\x08\x12\x30\n\x06status\x18\x02 \x01(\x0e\x32 .luci.resultdb.v1.WebTest.Status\"V\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x08\n\x04PASS\x10\x01\x12\x08\n\x04\x46\x41IL\x10\x02\x12\t\n\x05\x43RASH\x10\x03\x12\x0b\n\x07TIMEOUT\x10\x04\x12\x08\n\x04SKIP\x10\x05*\\\n\nTestStatus\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x08\n\x04PASS\x10\x01\x12\x08\n\x04\x46\x41IL\x10\x02\x12\t\n\x05\x43RASH\x10\x03\x12\t\n\x05\x41\x42ORT\x10\x04\x12\x08\n\x04SKIP\x10\x05\x1a\x02\x18\x01*W\n\nSkipReason\x12\x1b\n\x17SKIP_REASON_UNSPECIFIED\x10\x00\x12(\n$AUTOMATICALLY_DISABLED_FOR_FLAKINESS\x10\x01\x1a\x02\x18\x01\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.test_result_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_TESTSTATUS']._loaded_options = None
+  _globals['_TESTSTATUS']._serialized_options = b'\030\001'
+  _globals['_SKIPREASON']._loaded_options = None
+  _globals['_SKIPREASON']._serialized_options = b'\030\001'
+  _globals['_TESTRESULT'].fields_by_name['name']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['name']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTRESULT'].fields_by_name['test_id_structured']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['test_id_structured']._serialized_options = b'\342A\001\005'
+  _globals['_TESTRESULT'].fields_by_name['test_id']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['test_id']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTRESULT'].fields_by_name['result_id']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['result_id']._serialized_options = b'\342A\002\005\002'
+  _globals['_TESTRESULT'].fields_by_name['variant']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['variant']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTRESULT'].fields_by_name['expected']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['expected']._serialized_options = b'\030\001\342A\001\005'
+  _globals['_TESTRESULT'].fields_by_name['status']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['status']._serialized_options = b'\030\001\342A\001\005'
+  _globals['_TESTRESULT'].fields_by_name['summary_html']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['summary_html']._serialized_options = b'\342A\001\005'
+  _globals['_TESTRESULT'].fields_by_name['start_time']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['start_time']._serialized_options = b'\342A\001\005'
+  _globals['_TESTRESULT'].fields_by_name['duration']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['duration']._serialized_options = b'\342A\001\005'
+  _globals['_TESTRESULT'].fields_by_name['tags']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['tags']._serialized_options = b'\342A\001\005'
+  _globals['_TESTRESULT'].fields_by_name['variant_hash']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['variant_hash']._serialized_options = b'\342A\002\003\005'
+  _globals['_TESTRESULT'].fields_by_name['is_masked']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['is_masked']._serialized_options = b'\342A\001\003'
+  _globals['_TESTRESULT'].fields_by_name['skip_reason']._loaded_options = None
+  _globals['_TESTRESULT'].fields_by_name['skip_reason']._serialized_options = b'\030\001'
+  _globals['_TESTSTATUS']._serialized_start=1711
+  _globals['_TESTSTATUS']._serialized_end=1803
+  _globals['_SKIPREASON']._serialized_start=1805
+  _globals['_SKIPREASON']._serialized_end=1892
+  _globals['_TESTRESULT']._serialized_start=442
+  _globals['_TESTRESULT']._serialized_end=1470
+  _globals['_TESTRESULT_STATUS']._serialized_start=1357
+  _globals['_TESTRESULT_STATUS']._serialized_end=1464
+  _globals['_FRAMEWORKEXTENSIONS']._serialized_start=1472
+  _globals['_FRAMEWORKEXTENSIONS']._serialized_end=1538
+  _globals['_WEBTEST']._serialized_start=1541
+  _globals['_WEBTEST']._serialized_end=1709
+  _globals['_WEBTEST_STATUS']._serialized_start=1623
+  _globals['_WEBTEST_STATUS']._serialized_end=1709
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,126 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as _test_metadata_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import failure_reason as _failure_reason_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import skipped_reason as _skipped_reason_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    STATUS_UNSPECIFIED: _ClassVar[TestStatus]
+    PASS: _ClassVar[TestStatus]
+    FAIL: _ClassVar[TestStatus]
+    CRASH: _ClassVar[TestStatus]
+    ABORT: _ClassVar[TestStatus]
+    SKIP: _ClassVar[TestStatus]
+
+class SkipReason(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SKIP_REASON_UNSPECIFIED: _ClassVar[SkipReason]
+    AUTOMATICALLY_DISABLED_FOR_FLAKINESS: _ClassVar[SkipReason]
+STATUS_UNSPECIFIED: TestStatus
+PASS: TestStatus
+FAIL: TestStatus
+CRASH: TestStatus
+ABORT: TestStatus
+SKIP: TestStatus
+SKIP_REASON_UNSPECIFIED: SkipReason
+AUTOMATICALLY_DISABLED_FOR_FLAKINESS: SkipReason
+
+class TestResult(_message.Message):
+    __slots__ = ("name", "test_id_structured", "test_id", "result_id", "variant", "expected", "status", "status_v2", "summary_html", "start_time", "duration", "tags", "variant_hash", "test_metadata", "failure_reason", "properties", "is_masked", "skip_reason", "skipped_reason", "framework_extensions")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_UNSPECIFIED: _ClassVar[TestResult.Status]
+        PASSED: _ClassVar[TestResult.Status]
+        FAILED: _ClassVar[TestResult.Status]
+        SKIPPED: _ClassVar[TestResult.Status]
+        EXECUTION_ERRORED: _ClassVar[TestResult.Status]
+        PRECLUDED: _ClassVar[TestResult.Status]
+    STATUS_UNSPECIFIED: TestResult.Status
+    PASSED: TestResult.Status
+    FAILED: TestResult.Status
+    SKIPPED: TestResult.Status
+    EXECUTION_ERRORED: TestResult.Status
+    PRECLUDED: TestResult.Status
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    RESULT_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    EXPECTED_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_HTML_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    TEST_METADATA_FIELD_NUMBER: _ClassVar[int]
+    FAILURE_REASON_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    IS_MASKED_FIELD_NUMBER: _ClassVar[int]
+    SKIP_REASON_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_REASON_FIELD_NUMBER: _ClassVar[int]
+    FRAMEWORK_EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    result_id: str
+    variant: _common_pb2.Variant
+    expected: bool
+    status: TestStatus
+    status_v2: TestResult.Status
+    summary_html: str
+    start_time: _timestamp_pb2.Timestamp
+    duration: _duration_pb2.Duration
+    tags: _containers.RepeatedCompositeFieldContainer[_common_pb2.StringPair]
+    variant_hash: str
+    test_metadata: _test_metadata_pb2.TestMetadata
+    failure_reason: _failure_reason_pb2.FailureReason
+    properties: _struct_pb2.Struct
+    is_masked: bool
+    skip_reason: SkipReason
+    skipped_reason: _skipped_reason_pb2.SkippedReason
+    framework_extensions: FrameworkExtensions
+    def __init__(self, name: _Optional[str] = ..., test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., result_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., expected: bool = ..., status: _Optional[_Union[TestStatus, str]] = ..., status_v2: _Optional[_Union[TestResult.Status, str]] = ..., summary_html: _Optional[str] = ..., start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., duration: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., tags: _Optional[_Iterable[_Union[_common_pb2.StringPair, _Mapping]]] = ..., variant_hash: _Optional[str] = ..., test_metadata: _Optional[_Union[_test_metadata_pb2.TestMetadata, _Mapping]] = ..., failure_reason: _Optional[_Union[_failure_reason_pb2.FailureReason, _Mapping]] = ..., properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., is_masked: bool = ..., skip_reason: _Optional[_Union[SkipReason, str]] = ..., skipped_reason: _Optional[_Union[_skipped_reason_pb2.SkippedReason, _Mapping]] = ..., framework_extensions: _Optional[_Union[FrameworkExtensions, _Mapping]] = ...) -> None: ...
+
+class FrameworkExtensions(_message.Message):
+    __slots__ = ("web_test",)
+    WEB_TEST_FIELD_NUMBER: _ClassVar[int]
+    web_test: WebTest
+    def __init__(self, web_test: _Optional[_Union[WebTest, _Mapping]] = ...) -> None: ...
+
+class WebTest(_message.Message):
+    __slots__ = ("is_expected", "status")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_UNSPECIFIED: _ClassVar[WebTest.Status]
+        PASS: _ClassVar[WebTest.Status]
+        FAIL: _ClassVar[WebTest.Status]
+        CRASH: _ClassVar[WebTest.Status]
+        TIMEOUT: _ClassVar[WebTest.Status]
+        SKIP: _ClassVar[WebTest.Status]
+    STATUS_UNSPECIFIED: WebTest.Status
+    PASS: WebTest.Status
+    FAIL: WebTest.Status
+    CRASH: WebTest.Status
+    TIMEOUT: WebTest.Status
+    SKIP: WebTest.Status
+    IS_EXPECTED_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    is_expected: bool
+    status: WebTest.Status
+    def __init__(self, is_expected: bool = ..., status: _Optional[_Union[WebTest.Status, str]] = ...) -> None: ...
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/test_variant.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/test_variant.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__exoneration__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__metadata__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_verdict as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__verdict__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/resultdb/proto/v1/test_variant.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a=go.chromium.org/luci/resultdb/proto/v1/test_exoneration.proto\x1a:go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\x1a\x39go.chromium.org/luci/resultdb/proto/v1/test_verdict.proto\"\xe8\x04\n\x0bTestVariant\x12<\n\x12test_id_structured\x18\x0b \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifier\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.resultdb.v1.Variant\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12\x37\n\x06status\x18\x04 \x01(\x0e\x32#.luci.resultdb.v1.TestVariantStatusB\x02\x18\x01\x12\x37\n\tstatus_v2\x18\x0c \x01(\x0e\x32$.luci.resultdb.v1.TestVerdict.Status\x12\x45\n\x0fstatus_override\x18\r \x01(\x0e\x32,.luci.resultdb.v1.TestVerdict.StatusOverride\x12\x33\n\x07results\x18\x05 \x03(\x0b\x32\".luci.resultdb.v1.TestResultBundle\x12\x37\n\x0c\x65xonerations\x18\x06 \x03(\x0b\x32!.luci.resultdb.v1.TestExoneration\x12\x35\n\rtest_metadata\x18\x07 \x01(\x0b\x32\x1e.luci.resultdb.v1.TestMetadata\x12\x17\n\tis_masked\x18\x08 \x01(\x08\x42\x04\xe2\x41\x01\x03\x12\x12\n\nsources_id\x18\t \x01(\t\x12=\n\x0binstruction\x18\n \x01(\x0b\x32$.luci.resultdb.v1.VerdictInstructionB\x02\x18\x01\")\n\x12VerdictInstruction\x12\x13\n\x0binstruction\x18\x01 \x01(\t\"@\n\x10TestResultBundle\x12,\n\x06result\x18\x01 \x01(\x0b\x32\x1c.luci.resultdb.v1.TestResult\"O\n\x14TestVariantPredicate\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32#.luci.resultdb.v1.TestVariantStatusB\x02\x18\x01\"\xcf\x01\n\x0eRunTestVerdict\x12\x0f\n\x07test_id\x18\x01 \x01(\t\x12*\n\x07variant\x18\x02 \x01(\x0b\x32\x19.luci.resultdb.v1.Variant\x12\x14\n\x0cvariant_hash\x18\x03 \x01(\t\x12\x33\n\x07results\x18\x04 \x03(\x0b\x32\".luci.resultdb.v1.TestResultBundle\x12\x35\n\rtest_metadata\x18\x05 \x01(\x0b\x32\x1e.luci.resultdb.v1.TestMetadata*\xa0\x01\n\x11TestVariantStatus\x12#\n\x1fTEST_VARIANT_STATUS_UNSPECIFIED\x10\x00\x12\x0e\n\nUNEXPECTED\x10\n\x12\x18\n\x14UNEXPECTEDLY_SKIPPED\x10\x14\x12\t\n\x05\x46LAKY\x10\x1e\x12\x0e\n\nEXONERATED\x10(\x12\x13\n\x0fUNEXPECTED_MASK\x10-\x12\x0c\n\x08\x45XPECTED\x10\x32\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.test_variant_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_TESTVARIANT'].fields_by_name['status']._loaded_options = None
+  _globals['_TESTVARIANT'].fields_by_name['status']._serialized_options = b'\030\001'
+  _globals['_TESTVARIANT'].fields_by_name['is_masked']._loaded_options = None
+  _globals['_TESTVARIANT'].fields_by_name['is_masked']._serialized_options = b'\342A\001\003'
+  _globals['_TESTVARIANT'].fields_by_name['instruction']._loaded_options = None
+  _globals['_TESTVARIANT'].fields_by_name['instruction']._serialized_options = b'\030\001'
+  _globals['_TESTVARIANTPREDICATE'].fields_by_name['status']._loaded_options = None
+  _globals['_TESTVARIANTPREDICATE'].fields_by_name['status']._serialized_options = b'\030\001'
+  _globals['_TESTVARIANTSTATUS']._serialized_start=1425
+  _globals['_TESTVARIANTSTATUS']._serialized_end=1585
+  _globals['_TESTVARIANT']._serialized_start=406
+  _globals['_TESTVARIANT']._serialized_end=1022
+  _globals['_VERDICTINSTRUCTION']._serialized_start=1024
+  _globals['_VERDICTINSTRUCTION']._serialized_end=1065
+  _globals['_TESTRESULTBUNDLE']._serialized_start=1067
+  _globals['_TESTRESULTBUNDLE']._serialized_end=1131
+  _globals['_TESTVARIANTPREDICATE']._serialized_start=1133
+  _globals['_TESTVARIANTPREDICATE']._serialized_end=1212
+  _globals['_RUNTESTVERDICT']._serialized_start=1215
+  _globals['_RUNTESTVERDICT']._serialized_end=1422
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,93 @@
+from PB.google.api import field_behavior as _field_behavior_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as _test_exoneration_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as _test_metadata_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_verdict as _test_verdict_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestVariantStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TEST_VARIANT_STATUS_UNSPECIFIED: _ClassVar[TestVariantStatus]
+    UNEXPECTED: _ClassVar[TestVariantStatus]
+    UNEXPECTEDLY_SKIPPED: _ClassVar[TestVariantStatus]
+    FLAKY: _ClassVar[TestVariantStatus]
+    EXONERATED: _ClassVar[TestVariantStatus]
+    UNEXPECTED_MASK: _ClassVar[TestVariantStatus]
+    EXPECTED: _ClassVar[TestVariantStatus]
+TEST_VARIANT_STATUS_UNSPECIFIED: TestVariantStatus
+UNEXPECTED: TestVariantStatus
+UNEXPECTEDLY_SKIPPED: TestVariantStatus
+FLAKY: TestVariantStatus
+EXONERATED: TestVariantStatus
+UNEXPECTED_MASK: TestVariantStatus
+EXPECTED: TestVariantStatus
+
+class TestVariant(_message.Message):
+    __slots__ = ("test_id_structured", "test_id", "variant", "variant_hash", "status", "status_v2", "status_override", "results", "exonerations", "test_metadata", "is_masked", "sources_id", "instruction")
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_V2_FIELD_NUMBER: _ClassVar[int]
+    STATUS_OVERRIDE_FIELD_NUMBER: _ClassVar[int]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    EXONERATIONS_FIELD_NUMBER: _ClassVar[int]
+    TEST_METADATA_FIELD_NUMBER: _ClassVar[int]
+    IS_MASKED_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_ID_FIELD_NUMBER: _ClassVar[int]
+    INSTRUCTION_FIELD_NUMBER: _ClassVar[int]
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    variant: _common_pb2.Variant
+    variant_hash: str
+    status: TestVariantStatus
+    status_v2: _test_verdict_pb2.TestVerdict.Status
+    status_override: _test_verdict_pb2.TestVerdict.StatusOverride
+    results: _containers.RepeatedCompositeFieldContainer[TestResultBundle]
+    exonerations: _containers.RepeatedCompositeFieldContainer[_test_exoneration_pb2.TestExoneration]
+    test_metadata: _test_metadata_pb2.TestMetadata
+    is_masked: bool
+    sources_id: str
+    instruction: VerdictInstruction
+    def __init__(self, test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., variant_hash: _Optional[str] = ..., status: _Optional[_Union[TestVariantStatus, str]] = ..., status_v2: _Optional[_Union[_test_verdict_pb2.TestVerdict.Status, str]] = ..., status_override: _Optional[_Union[_test_verdict_pb2.TestVerdict.StatusOverride, str]] = ..., results: _Optional[_Iterable[_Union[TestResultBundle, _Mapping]]] = ..., exonerations: _Optional[_Iterable[_Union[_test_exoneration_pb2.TestExoneration, _Mapping]]] = ..., test_metadata: _Optional[_Union[_test_metadata_pb2.TestMetadata, _Mapping]] = ..., is_masked: bool = ..., sources_id: _Optional[str] = ..., instruction: _Optional[_Union[VerdictInstruction, _Mapping]] = ...) -> None: ...
+
+class VerdictInstruction(_message.Message):
+    __slots__ = ("instruction",)
+    INSTRUCTION_FIELD_NUMBER: _ClassVar[int]
+    instruction: str
+    def __init__(self, instruction: _Optional[str] = ...) -> None: ...
+
+class TestResultBundle(_message.Message):
+    __slots__ = ("result",)
+    RESULT_FIELD_NUMBER: _ClassVar[int]
+    result: _test_result_pb2.TestResult
+    def __init__(self, result: _Optional[_Union[_test_result_pb2.TestResult, _Mapping]] = ...) -> None: ...
+
+class TestVariantPredicate(_message.Message):
+    __slots__ = ("status",)
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    status: TestVariantStatus
+    def __init__(self, status: _Optional[_Union[TestVariantStatus, str]] = ...) -> None: ...
+
+class RunTestVerdict(_message.Message):
+    __slots__ = ("test_id", "variant", "variant_hash", "results", "test_metadata")
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    TEST_METADATA_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant: _common_pb2.Variant
+    variant_hash: str
+    results: _containers.RepeatedCompositeFieldContainer[TestResultBundle]
+    test_metadata: _test_metadata_pb2.TestMetadata
+    def __init__(self, test_id: _Optional[str] = ..., variant: _Optional[_Union[_common_pb2.Variant, _Mapping]] = ..., variant_hash: _Optional[str] = ..., results: _Optional[_Iterable[_Union[TestResultBundle, _Mapping]]] = ..., test_metadata: _Optional[_Union[_test_metadata_pb2.TestMetadata, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/test_verdict.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/test_verdict.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__exoneration__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__metadata__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_test__result__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/resultdb/proto/v1/test_verdict.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a=go.chromium.org/luci/resultdb/proto/v1/test_exoneration.proto\x1a:go.chromium.org/luci/resultdb/proto/v1/test_metadata.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/test_result.proto\"\xec\x04\n\x0bTestVerdict\x12<\n\x12test_id_structured\x18\x01 \x01(\x0b\x32 .luci.resultdb.v1.TestIdentifier\x12\x0f\n\x07test_id\x18\x02 \x01(\t\x12\x34\n\x06status\x18\x05 \x01(\x0e\x32$.luci.resultdb.v1.TestVerdict.Status\x12\x45\n\x0fstatus_override\x18\x06 \x01(\x0e\x32,.luci.resultdb.v1.TestVerdict.StatusOverride\x12-\n\x07results\x18\x07 \x03(\x0b\x32\x1c.luci.resultdb.v1.TestResult\x12\x37\n\x0c\x65xonerations\x18\x08 \x03(\x0b\x32!.luci.resultdb.v1.TestExoneration\x12\x35\n\rtest_metadata\x18\t \x01(\x0b\x32\x1e.luci.resultdb.v1.TestMetadata\x12\x17\n\tis_masked\x18\n \x01(\x08\x42\x04\xe2\x41\x01\x03\"v\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\n\n\x06\x46\x41ILED\x10\n\x12\x15\n\x11\x45XECUTION_ERRORED\x10\x14\x12\r\n\tPRECLUDED\x10\x1e\x12\t\n\x05\x46LAKY\x10(\x12\x0b\n\x07SKIPPED\x10\x32\x12\n\n\x06PASSED\x10<\"U\n\x0eStatusOverride\x12\x1f\n\x1bSTATUS_OVERRIDE_UNSPECIFIED\x10\x00\x12\x12\n\x0eNOT_OVERRIDDEN\x10\x01\x12\x0e\n\nEXONERATED\x10\x02J\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05*\xd7\x02\n\x16VerdictEffectiveStatus\x12(\n$VERDICT_EFFECTIVE_STATUS_UNSPECIFIED\x10\x00\x12#\n\x1fVERDICT_EFFECTIVE_STATUS_FAILED\x10\n\x12.\n*VERDICT_EFFECTIVE_STATUS_EXECUTION_ERRORED\x10\x14\x12&\n\"VERDICT_EFFECTIVE_STATUS_PRECLUDED\x10\x1e\x12\"\n\x1eVERDICT_EFFECTIVE_STATUS_FLAKY\x10(\x12$\n VERDICT_EFFECTIVE_STATUS_SKIPPED\x10\x32\x12#\n\x1fVERDICT_EFFECTIVE_STATUS_PASSED\x10<\x12\'\n#VERDICT_EFFECTIVE_STATUS_EXONERATED\x10\x46\x42P\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.test_verdict_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_TESTVERDICT'].fields_by_name['is_masked']._loaded_options = None
+  _globals['_TESTVERDICT'].fields_by_name['is_masked']._serialized_options = b'\342A\001\003'
+  _globals['_VERDICTEFFECTIVESTATUS']._serialized_start=970
+  _globals['_VERDICTEFFECTIVESTATUS']._serialized_end=1313
+  _globals['_TESTVERDICT']._serialized_start=347
+  _globals['_TESTVERDICT']._serialized_end=967
+  _globals['_TESTVERDICT_STATUS']._serialized_start=750
+  _globals['_TESTVERDICT_STATUS']._serialized_end=868
+  _globals['_TESTVERDICT_STATUSOVERRIDE']._serialized_start=870
+  _globals['_TESTVERDICT_STATUSOVERRIDE']._serialized_end=955
+# @@protoc_insertion_point(module_scope)
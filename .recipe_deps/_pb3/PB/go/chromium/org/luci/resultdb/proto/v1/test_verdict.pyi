@@ -0,0 +1,76 @@
+from PB.google.api import field_behavior as _field_behavior_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_exoneration as _test_exoneration_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_metadata as _test_metadata_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import test_result as _test_result_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class VerdictEffectiveStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    VERDICT_EFFECTIVE_STATUS_UNSPECIFIED: _ClassVar[VerdictEffectiveStatus]
+    VERDICT_EFFECTIVE_STATUS_FAILED: _ClassVar[VerdictEffectiveStatus]
+    VERDICT_EFFECTIVE_STATUS_EXECUTION_ERRORED: _ClassVar[VerdictEffectiveStatus]
+    VERDICT_EFFECTIVE_STATUS_PRECLUDED: _ClassVar[VerdictEffectiveStatus]
+    VERDICT_EFFECTIVE_STATUS_FLAKY: _ClassVar[VerdictEffectiveStatus]
+    VERDICT_EFFECTIVE_STATUS_SKIPPED: _ClassVar[VerdictEffectiveStatus]
+    VERDICT_EFFECTIVE_STATUS_PASSED: _ClassVar[VerdictEffectiveStatus]
+    VERDICT_EFFECTIVE_STATUS_EXONERATED: _ClassVar[VerdictEffectiveStatus]
+VERDICT_EFFECTIVE_STATUS_UNSPECIFIED: VerdictEffectiveStatus
+VERDICT_EFFECTIVE_STATUS_FAILED: VerdictEffectiveStatus
+VERDICT_EFFECTIVE_STATUS_EXECUTION_ERRORED: VerdictEffectiveStatus
+VERDICT_EFFECTIVE_STATUS_PRECLUDED: VerdictEffectiveStatus
+VERDICT_EFFECTIVE_STATUS_FLAKY: VerdictEffectiveStatus
+VERDICT_EFFECTIVE_STATUS_SKIPPED: VerdictEffectiveStatus
+VERDICT_EFFECTIVE_STATUS_PASSED: VerdictEffectiveStatus
+VERDICT_EFFECTIVE_STATUS_EXONERATED: VerdictEffectiveStatus
+
+class TestVerdict(_message.Message):
+    __slots__ = ("test_id_structured", "test_id", "status", "status_override", "results", "exonerations", "test_metadata", "is_masked")
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_UNSPECIFIED: _ClassVar[TestVerdict.Status]
+        FAILED: _ClassVar[TestVerdict.Status]
+        EXECUTION_ERRORED: _ClassVar[TestVerdict.Status]
+        PRECLUDED: _ClassVar[TestVerdict.Status]
+        FLAKY: _ClassVar[TestVerdict.Status]
+        SKIPPED: _ClassVar[TestVerdict.Status]
+        PASSED: _ClassVar[TestVerdict.Status]
+    STATUS_UNSPECIFIED: TestVerdict.Status
+    FAILED: TestVerdict.Status
+    EXECUTION_ERRORED: TestVerdict.Status
+    PRECLUDED: TestVerdict.Status
+    FLAKY: TestVerdict.Status
+    SKIPPED: TestVerdict.Status
+    PASSED: TestVerdict.Status
+    class StatusOverride(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATUS_OVERRIDE_UNSPECIFIED: _ClassVar[TestVerdict.StatusOverride]
+        NOT_OVERRIDDEN: _ClassVar[TestVerdict.StatusOverride]
+        EXONERATED: _ClassVar[TestVerdict.StatusOverride]
+    STATUS_OVERRIDE_UNSPECIFIED: TestVerdict.StatusOverride
+    NOT_OVERRIDDEN: TestVerdict.StatusOverride
+    EXONERATED: TestVerdict.StatusOverride
+    TEST_ID_STRUCTURED_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_OVERRIDE_FIELD_NUMBER: _ClassVar[int]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    EXONERATIONS_FIELD_NUMBER: _ClassVar[int]
+    TEST_METADATA_FIELD_NUMBER: _ClassVar[int]
+    IS_MASKED_FIELD_NUMBER: _ClassVar[int]
+    test_id_structured: _common_pb2.TestIdentifier
+    test_id: str
+    status: TestVerdict.Status
+    status_override: TestVerdict.StatusOverride
+    results: _containers.RepeatedCompositeFieldContainer[_test_result_pb2.TestResult]
+    exonerations: _containers.RepeatedCompositeFieldContainer[_test_exoneration_pb2.TestExoneration]
+    test_metadata: _test_metadata_pb2.TestMetadata
+    is_masked: bool
+    def __init__(self, test_id_structured: _Optional[_Union[_common_pb2.TestIdentifier, _Mapping]] = ..., test_id: _Optional[str] = ..., status: _Optional[_Union[TestVerdict.Status, str]] = ..., status_override: _Optional[_Union[TestVerdict.StatusOverride, str]] = ..., results: _Optional[_Iterable[_Union[_test_result_pb2.TestResult, _Mapping]]] = ..., exonerations: _Optional[_Iterable[_Union[_test_exoneration_pb2.TestExoneration, _Mapping]]] = ..., test_metadata: _Optional[_Union[_test_metadata_pb2.TestMetadata, _Mapping]] = ..., is_masked: bool = ...) -> None: ...
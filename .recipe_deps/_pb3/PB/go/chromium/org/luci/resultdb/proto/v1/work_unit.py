@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/resultdb/proto/v1/work_unit.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/resultdb/proto/v1/work_unit.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_common__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import instruction as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_instruction__pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import predicate as go_dot_chromium_dot_org_dot_luci_dot_resultdb_dot_proto_dot_v1_dot_predicate__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6go.chromium.org/luci/resultdb/proto/v1/work_unit.proto\x12\x10luci.resultdb.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x33go.chromium.org/luci/resultdb/proto/v1/common.proto\x1a\x38go.chromium.org/luci/resultdb/proto/v1/instruction.proto\x1a\x36go.chromium.org/luci/resultdb/proto/v1/predicate.proto\"\xf0\n\n\x08WorkUnit\x12\x13\n\x04name\x18\x01 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x1b\n\x0cwork_unit_id\x18\x02 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x12\n\x04kind\x18\x19 \x01(\tB\x04\xe2\x41\x01\x05\x12/\n\x05state\x18\x16 \x01(\x0e\x32 .luci.resultdb.v1.WorkUnit.State\x12\x18\n\x10summary_markdown\x18\x17 \x01(\t\x12N\n\x12\x66inalization_state\x18\x03 \x01(\x0e\x32,.luci.resultdb.v1.WorkUnit.FinalizationStateB\x04\xe2\x41\x01\x03\x12\x14\n\x05realm\x18\x04 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x36\n\x0b\x63reate_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x05\xe2\x41\x02\x03\x05\x12\x16\n\x07\x63reator\x18\x06 \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x36\n\x0clast_updated\x18\x14 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12=\n\x13\x66inalize_start_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12\x37\n\rfinalize_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x04\xe2\x41\x01\x03\x12,\n\x08\x64\x65\x61\x64line\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x15\n\x06parent\x18\n \x01(\tB\x05\xe2\x41\x02\x03\x05\x12\x1e\n\x10\x63hild_work_units\x18\x0b \x03(\tB\x04\xe2\x41\x01\x03\x12\x1f\n\x11\x63hild_invocations\x18\x0c \x03(\tB\x04\xe2\x41\x01\x03\x12;\n\tmodule_id\x18\x13 \x01(\x0b\x32\".luci.resultdb.v1.ModuleIdentifierB\x04\xe2\x41\x01\x05\x12\x1e\n\x10module_shard_key\x18\x18 \x01(\tB\x04\xe2\x41\x01\x05\x12\x43\n\x11producer_resource\x18\x1a \x01(\x0b\x32\".luci.resultdb.v1.ProducerResourceB\x04\xe2\x41\x01\x05\x12*\n\x04tags\x18\x0e \x03(\x0b\x32\x1c.luci.resultdb.v1.StringPair\x12+\n\nproperties\x18\x0f \x01(\x0b\x32\x17.google.protobuf.Struct\x12O\n\x13\x65xtended_properties\x18\x10 \x03(\x0b\x32\x32.luci.resultdb.v1.WorkUnit.ExtendedPropertiesEntry\x12\x34\n\x0cinstructions\x18\x11 \x01(\x0b\x32\x1e.luci.resultdb.v1.Instructions\x12\x17\n\tis_masked\x18\x12 \x01(\x08\x42\x04\xe2\x41\x01\x03\x12\x0c\n\x04\x65tag\x18\x15 \x01(\t\x1aR\n\x17\x45xtendedPropertiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct:\x02\x38\x01\"\x85\x01\n\x05State\x12\x15\n\x11STATE_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x14\n\x10\x46INAL_STATE_MASK\x10\x04\x12\r\n\tSUCCEEDED\x10\x0c\x12\x0b\n\x07SKIPPED\x10\x14\x12\n\n\x06\x46\x41ILED\x10$\x12\r\n\tCANCELLED\x10\x44\"b\n\x11\x46inalizationState\x12\"\n\x1e\x46INALIZATION_STATE_UNSPECIFIED\x10\x00\x12\n\n\x06\x41\x43TIVE\x10\x01\x12\x0e\n\nFINALIZING\x10\x02\x12\r\n\tFINALIZED\x10\x03\"V\n\x12GetWorkUnitRequest\x12\x12\n\x04name\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12,\n\x04view\x18\x02 \x01(\x0e\x32\x1e.luci.resultdb.v1.WorkUnitView\"s\n\x18\x42\x61tchGetWorkUnitsRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x13\n\x05names\x18\x02 \x03(\tB\x04\xe2\x41\x01\x02\x12,\n\x04view\x18\x03 \x01(\x0e\x32\x1e.luci.resultdb.v1.WorkUnitView\"K\n\x19\x42\x61tchGetWorkUnitsResponse\x12.\n\nwork_units\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\"\xba\x01\n\x15QueryWorkUnitsRequest\x12\x14\n\x06parent\x18\x01 \x01(\tB\x04\xe2\x41\x01\x02\x12\x36\n\tpredicate\x18\x02 \x01(\x0b\x32#.luci.resultdb.v1.WorkUnitPredicate\x12,\n\x04view\x18\x03 \x01(\x0e\x32\x1e.luci.resultdb.v1.WorkUnitView\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"a\n\x16QueryWorkUnitsResponse\x12.\n\nwork_units\x18\x01 \x03(\x0b\x32\x1a.luci.resultdb.v1.WorkUnit\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\tBP\n\x1b\x63om.google.luci.resultdb.v1P\x01Z/go.chromium.org/luci/resultdb/proto/v1;resultpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.resultdb.proto.v1.work_unit_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\033com.google.luci.resultdb.v1P\001Z/go.chromium.org/luci/resultdb/proto/v1;resultpb'
+  _globals['_WORKUNIT_EXTENDEDPROPERTIESENTRY']._loaded_options = None
+  _globals['_WORKUNIT_EXTENDEDPROPERTIESENTRY']._serialized_options = b'8\001'
+  _globals['_WORKUNIT'].fields_by_name['name']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['name']._serialized_options = b'\342A\002\003\005'
+  _globals['_WORKUNIT'].fields_by_name['work_unit_id']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['work_unit_id']._serialized_options = b'\342A\002\003\005'
+  _globals['_WORKUNIT'].fields_by_name['kind']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['kind']._serialized_options = b'\342A\001\005'
+  _globals['_WORKUNIT'].fields_by_name['finalization_state']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['finalization_state']._serialized_options = b'\342A\001\003'
+  _globals['_WORKUNIT'].fields_by_name['realm']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['realm']._serialized_options = b'\342A\002\003\005'
+  _globals['_WORKUNIT'].fields_by_name['create_time']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['create_time']._serialized_options = b'\342A\002\003\005'
+  _globals['_WORKUNIT'].fields_by_name['creator']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['creator']._serialized_options = b'\342A\002\003\005'
+  _globals['_WORKUNIT'].fields_by_name['last_updated']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['last_updated']._serialized_options = b'\342A\001\003'
+  _globals['_WORKUNIT'].fields_by_name['finalize_start_time']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['finalize_start_time']._serialized_options = b'\342A\001\003'
+  _globals['_WORKUNIT'].fields_by_name['finalize_time']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['finalize_time']._serialized_options = b'\342A\001\003'
+  _globals['_WORKUNIT'].fields_by_name['parent']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['parent']._serialized_options = b'\342A\002\003\005'
+  _globals['_WORKUNIT'].fields_by_name['child_work_units']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['child_work_units']._serialized_options = b'\342A\001\003'
+  _globals['_WORKUNIT'].fields_by_name['child_invocations']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['child_invocations']._serialized_options = b'\342A\001\003'
+  _globals['_WORKUNIT'].fields_by_name['module_id']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['module_id']._serialized_options = b'\342A\001\005'
+  _globals['_WORKUNIT'].fields_by_name['module_shard_key']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['module_shard_key']._serialized_options = b'\342A\001\005'
+  _globals['_WORKUNIT'].fields_by_name['producer_resource']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['producer_resource']._serialized_options = b'\342A\001\005'
+  _globals['_WORKUNIT'].fields_by_name['is_masked']._loaded_options = None
+  _globals['_WORKUNIT'].fields_by_name['is_masked']._serialized_options = b'\342A\001\003'
+  _globals['_GETWORKUNITREQUEST'].fields_by_name['name']._loaded_options = None
+  _globals['_GETWORKUNITREQUEST'].fields_by_name['name']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHGETWORKUNITSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_BATCHGETWORKUNITSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_BATCHGETWORKUNITSREQUEST'].fields_by_name['names']._loaded_options = None
+  _globals['_BATCHGETWORKUNITSREQUEST'].fields_by_name['names']._serialized_options = b'\342A\001\002'
+  _globals['_QUERYWORKUNITSREQUEST'].fields_by_name['parent']._loaded_options = None
+  _globals['_QUERYWORKUNITSREQUEST'].fields_by_name['parent']._serialized_options = b'\342A\001\002'
+  _globals['_WORKUNIT']._serialized_start=340
+  _globals['_WORKUNIT']._serialized_end=1732
+  _globals['_WORKUNIT_EXTENDEDPROPERTIESENTRY']._serialized_start=1414
+  _globals['_WORKUNIT_EXTENDEDPROPERTIESENTRY']._serialized_end=1496
+  _globals['_WORKUNIT_STATE']._serialized_start=1499
+  _globals['_WORKUNIT_STATE']._serialized_end=1632
+  _globals['_WORKUNIT_FINALIZATIONSTATE']._serialized_start=1634
+  _globals['_WORKUNIT_FINALIZATIONSTATE']._serialized_end=1732
+  _globals['_GETWORKUNITREQUEST']._serialized_start=1734
+  _globals['_GETWORKUNITREQUEST']._serialized_end=1820
+  _globals['_BATCHGETWORKUNITSREQUEST']._serialized_start=1822
+  _globals['_BATCHGETWORKUNITSREQUEST']._serialized_end=1937
+  _globals['_BATCHGETWORKUNITSRESPONSE']._serialized_start=1939
+  _globals['_BATCHGETWORKUNITSRESPONSE']._serialized_end=2014
+  _globals['_QUERYWORKUNITSREQUEST']._serialized_start=2017
+  _globals['_QUERYWORKUNITSREQUEST']._serialized_end=2203
+  _globals['_QUERYWORKUNITSRESPONSE']._serialized_start=2205
+  _globals['_QUERYWORKUNITSRESPONSE']._serialized_end=2302
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,151 @@
+import datetime
+
+from PB.google.api import field_behavior as _field_behavior_pb2
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import common as _common_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import instruction as _instruction_pb2
+from PB.go.chromium.org.luci.resultdb.proto.v1 import predicate as _predicate_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class WorkUnit(_message.Message):
+    __slots__ = ("name", "work_unit_id", "kind", "state", "summary_markdown", "finalization_state", "realm", "create_time", "creator", "last_updated", "finalize_start_time", "finalize_time", "deadline", "parent", "child_work_units", "child_invocations", "module_id", "module_shard_key", "producer_resource", "tags", "properties", "extended_properties", "instructions", "is_masked", "etag")
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        STATE_UNSPECIFIED: _ClassVar[WorkUnit.State]
+        PENDING: _ClassVar[WorkUnit.State]
+        RUNNING: _ClassVar[WorkUnit.State]
+        FINAL_STATE_MASK: _ClassVar[WorkUnit.State]
+        SUCCEEDED: _ClassVar[WorkUnit.State]
+        SKIPPED: _ClassVar[WorkUnit.State]
+        FAILED: _ClassVar[WorkUnit.State]
+        CANCELLED: _ClassVar[WorkUnit.State]
+    STATE_UNSPECIFIED: WorkUnit.State
+    PENDING: WorkUnit.State
+    RUNNING: WorkUnit.State
+    FINAL_STATE_MASK: WorkUnit.State
+    SUCCEEDED: WorkUnit.State
+    SKIPPED: WorkUnit.State
+    FAILED: WorkUnit.State
+    CANCELLED: WorkUnit.State
+    class FinalizationState(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        FINALIZATION_STATE_UNSPECIFIED: _ClassVar[WorkUnit.FinalizationState]
+        ACTIVE: _ClassVar[WorkUnit.FinalizationState]
+        FINALIZING: _ClassVar[WorkUnit.FinalizationState]
+        FINALIZED: _ClassVar[WorkUnit.FinalizationState]
+    FINALIZATION_STATE_UNSPECIFIED: WorkUnit.FinalizationState
+    ACTIVE: WorkUnit.FinalizationState
+    FINALIZING: WorkUnit.FinalizationState
+    FINALIZED: WorkUnit.FinalizationState
+    class ExtendedPropertiesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: _struct_pb2.Struct
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    WORK_UNIT_ID_FIELD_NUMBER: _ClassVar[int]
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_MARKDOWN_FIELD_NUMBER: _ClassVar[int]
+    FINALIZATION_STATE_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    CREATOR_FIELD_NUMBER: _ClassVar[int]
+    LAST_UPDATED_FIELD_NUMBER: _ClassVar[int]
+    FINALIZE_START_TIME_FIELD_NUMBER: _ClassVar[int]
+    FINALIZE_TIME_FIELD_NUMBER: _ClassVar[int]
+    DEADLINE_FIELD_NUMBER: _ClassVar[int]
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    CHILD_WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    CHILD_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    MODULE_ID_FIELD_NUMBER: _ClassVar[int]
+    MODULE_SHARD_KEY_FIELD_NUMBER: _ClassVar[int]
+    PRODUCER_RESOURCE_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    EXTENDED_PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    INSTRUCTIONS_FIELD_NUMBER: _ClassVar[int]
+    IS_MASKED_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    work_unit_id: str
+    kind: str
+    state: WorkUnit.State
+    summary_markdown: str
+    finalization_state: WorkUnit.FinalizationState
+    realm: str
+    create_time: _timestamp_pb2.Timestamp
+    creator: str
+    last_updated: _timestamp_pb2.Timestamp
+    finalize_start_time: _timestamp_pb2.Timestamp
+    finalize_time: _timestamp_pb2.Timestamp
+    deadline: _timestamp_pb2.Timestamp
+    parent: str
+    child_work_units: _containers.RepeatedScalarFieldContainer[str]
+    child_invocations: _containers.RepeatedScalarFieldContainer[str]
+    module_id: _common_pb2.ModuleIdentifier
+    module_shard_key: str
+    producer_resource: _common_pb2.ProducerResource
+    tags: _containers.RepeatedCompositeFieldContainer[_common_pb2.StringPair]
+    properties: _struct_pb2.Struct
+    extended_properties: _containers.MessageMap[str, _struct_pb2.Struct]
+    instructions: _instruction_pb2.Instructions
+    is_masked: bool
+    etag: str
+    def __init__(self, name: _Optional[str] = ..., work_unit_id: _Optional[str] = ..., kind: _Optional[str] = ..., state: _Optional[_Union[WorkUnit.State, str]] = ..., summary_markdown: _Optional[str] = ..., finalization_state: _Optional[_Union[WorkUnit.FinalizationState, str]] = ..., realm: _Optional[str] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., creator: _Optional[str] = ..., last_updated: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., finalize_start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., finalize_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., deadline: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., parent: _Optional[str] = ..., child_work_units: _Optional[_Iterable[str]] = ..., child_invocations: _Optional[_Iterable[str]] = ..., module_id: _Optional[_Union[_common_pb2.ModuleIdentifier, _Mapping]] = ..., module_shard_key: _Optional[str] = ..., producer_resource: _Optional[_Union[_common_pb2.ProducerResource, _Mapping]] = ..., tags: _Optional[_Iterable[_Union[_common_pb2.StringPair, _Mapping]]] = ..., properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., extended_properties: _Optional[_Mapping[str, _struct_pb2.Struct]] = ..., instructions: _Optional[_Union[_instruction_pb2.Instructions, _Mapping]] = ..., is_masked: bool = ..., etag: _Optional[str] = ...) -> None: ...
+
+class GetWorkUnitRequest(_message.Message):
+    __slots__ = ("name", "view")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    VIEW_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    view: _common_pb2.WorkUnitView
+    def __init__(self, name: _Optional[str] = ..., view: _Optional[_Union[_common_pb2.WorkUnitView, str]] = ...) -> None: ...
+
+class BatchGetWorkUnitsRequest(_message.Message):
+    __slots__ = ("parent", "names", "view")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    NAMES_FIELD_NUMBER: _ClassVar[int]
+    VIEW_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    names: _containers.RepeatedScalarFieldContainer[str]
+    view: _common_pb2.WorkUnitView
+    def __init__(self, parent: _Optional[str] = ..., names: _Optional[_Iterable[str]] = ..., view: _Optional[_Union[_common_pb2.WorkUnitView, str]] = ...) -> None: ...
+
+class BatchGetWorkUnitsResponse(_message.Message):
+    __slots__ = ("work_units",)
+    WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    work_units: _containers.RepeatedCompositeFieldContainer[WorkUnit]
+    def __init__(self, work_units: _Optional[_Iterable[_Union[WorkUnit, _Mapping]]] = ...) -> None: ...
+
+class QueryWorkUnitsRequest(_message.Message):
+    __slots__ = ("parent", "predicate", "view", "page_size", "page_token")
+    PARENT_FIELD_NUMBER: _ClassVar[int]
+    PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    VIEW_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    parent: str
+    predicate: _predicate_pb2.WorkUnitPredicate
+    view: _common_pb2.WorkUnitView
+    page_size: int
+    page_token: str
+    def __init__(self, parent: _Optional[str] = ..., predicate: _Optional[_Union[_predicate_pb2.WorkUnitPredicate, _Mapping]] = ..., view: _Optional[_Union[_common_pb2.WorkUnitView, str]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+
+class QueryWorkUnitsResponse(_message.Message):
+    __slots__ = ("work_units", "next_page_token")
+    WORK_UNITS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    work_units: _containers.RepeatedCompositeFieldContainer[WorkUnit]
+    next_page_token: str
+    def __init__(self, work_units: _Optional[_Iterable[_Union[WorkUnit, _Mapping]]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/scheduler/api/scheduler/v1/scheduler.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/scheduler/api/scheduler/v1/scheduler.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from PB.go.chromium.org.luci.scheduler.api.scheduler.v1 import triggers as go_dot_chromium_dot_org_dot_luci_dot_scheduler_dot_api_dot_scheduler_dot_v1_dot_triggers__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n?go.chromium.org/luci/scheduler/api/scheduler/v1/scheduler.proto\x12\tscheduler\x1a\x1bgoogle/protobuf/empty.proto\x1a>go.chromium.org/luci/scheduler/api/scheduler/v1/triggers.proto\"A\n\x0bJobsRequest\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\x12\x11\n\tpage_size\x18\x03 \x01(\x05\">\n\tJobsReply\x12\x1c\n\x04jobs\x18\x01 \x03(\x0b\x32\x0e.scheduler.Job\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\t\"[\n\x12InvocationsRequest\x12\"\n\x07job_ref\x18\x01 \x01(\x0b\x32\x11.scheduler.JobRef\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\x12\x11\n\tpage_size\x18\x03 \x01(\x05\"S\n\x10InvocationsReply\x12*\n\x0binvocations\x18\x01 \x03(\x0b\x32\x15.scheduler.Invocation\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\t\"\xae\x01\n\x13\x45mitTriggersRequest\x12\x35\n\x07\x62\x61tches\x18\x01 \x03(\x0b\x32$.scheduler.EmitTriggersRequest.Batch\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\x1aM\n\x05\x42\x61tch\x12#\n\x07trigger\x18\x01 \x01(\x0b\x32\x12.scheduler.Trigger\x12\x1f\n\x04jobs\x18\x02 \x03(\x0b\x32\x11.scheduler.JobRef\"&\n\x06JobRef\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0b\n\x03job\x18\x02 \x01(\t\"J\n\rInvocationRef\x12\"\n\x07job_ref\x18\x01 \x01(\x0b\x32\x11.scheduler.JobRef\x12\x15\n\rinvocation_id\x18\x02 \x01(\x03\"o\n\x03Job\x12\"\n\x07job_ref\x18\x01 \x01(\x0b\x32\x11.scheduler.JobRef\x12\x10\n\x08schedule\x18\x02 \x01(\t\x12\"\n\x05state\x18\x03 \x01(\x0b\x32\x13.scheduler.JobState\x12\x0e\n\x06paused\x18\x04 \x01(\x08\"\x1d\n\x08JobState\x12\x11\n\tui_status\x18\x01 \x01(\t\"\xc7\x01\n\nInvocation\x12\x30\n\x0einvocation_ref\x18\x01 \x01(\x0b\x32\x18.scheduler.InvocationRef\x12\x12\n\nstarted_ts\x18\x02 \x01(\x03\x12\x13\n\x0b\x66inished_ts\x18\x03 \x01(\x03\x12\x14\n\x0ctriggered_by\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\r\n\x05\x66inal\x18\x06 \x01(\x08\x12\x17\n\x0f\x63onfig_revision\x18\x07 \x01(\t\x12\x10\n\x08view_url\x18\x08 \x01(\t2\x87\x04\n\tScheduler\x12\x37\n\x07GetJobs\x12\x16.scheduler.JobsRequest\x1a\x14.scheduler.JobsReply\x12L\n\x0eGetInvocations\x12\x1d.scheduler.InvocationsRequest\x1a\x1b.scheduler.InvocationsReply\x12@\n\rGetInvocation\x12\x18.scheduler.InvocationRef\x1a\x15.scheduler.Invocation\x12\x35\n\x08PauseJob\x12\x11.scheduler.JobRef\x1a\x16.google.protobuf.Empty\x12\x36\n\tResumeJob\x12\x11.scheduler.JobRef\x1a\x16.google.protobuf.Empty\x12\x35\n\x08\x41\x62ortJob\x12\x11.scheduler.JobRef\x1a\x16.google.protobuf.Empty\x12\x43\n\x0f\x41\x62ortInvocation\x12\x18.scheduler.InvocationRef\x1a\x16.google.protobuf.Empty\x12\x46\n\x0c\x45mitTriggers\x12\x1e.scheduler.EmitTriggersRequest\x1a\x16.google.protobuf.EmptyB;Z9go.chromium.org/luci/scheduler/api/scheduler/v1;schedulerb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.scheduler.api.scheduler.v1.scheduler_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z9go.chromium.org/luci/scheduler/api/scheduler/v1;scheduler'
+  _globals['_JOBSREQUEST']._serialized_start=171
+  _globals['_JOBSREQUEST']._serialized_end=236
+  _globals['_JOBSREPLY']._serialized_start=238
+  _globals['_JOBSREPLY']._serialized_end=300
+  _globals['_INVOCATIONSREQUEST']._serialized_start=302
+  _globals['_INVOCATIONSREQUEST']._serialized_end=393
+  _globals['_INVOCATIONSREPLY']._serialized_start=395
+  _globals['_INVOCATIONSREPLY']._serialized_end=478
+  _globals['_EMITTRIGGERSREQUEST']._serialized_start=481
+  _globals['_EMITTRIGGERSREQUEST']._serialized_end=655
+  _globals['_EMITTRIGGERSREQUEST_BATCH']._serialized_start=578
+  _globals['_EMITTRIGGERSREQUEST_BATCH']._serialized_end=655
+  _globals['_JOBREF']._serialized_start=657
+  _globals['_JOBREF']._serialized_end=695
+  _globals['_INVOCATIONREF']._serialized_start=697
+  _globals['_INVOCATIONREF']._serialized_end=771
+  _globals['_JOB']._serialized_start=773
+  _globals['_JOB']._serialized_end=884
+  _globals['_JOBSTATE']._serialized_start=886
+  _globals['_JOBSTATE']._serialized_end=915
+  _globals['_INVOCATION']._serialized_start=918
+  _globals['_INVOCATION']._serialized_end=1117
+  _globals['_SCHEDULER']._serialized_start=1120
+  _globals['_SCHEDULER']._serialized_end=1639
+# @@protoc_insertion_point(module_scope)
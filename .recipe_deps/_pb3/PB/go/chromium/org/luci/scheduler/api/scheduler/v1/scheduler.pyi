@@ -0,0 +1,114 @@
+from google.protobuf import empty_pb2 as _empty_pb2
+from PB.go.chromium.org.luci.scheduler.api.scheduler.v1 import triggers as _triggers_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class JobsRequest(_message.Message):
+    __slots__ = ("project", "cursor", "page_size")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    cursor: str
+    page_size: int
+    def __init__(self, project: _Optional[str] = ..., cursor: _Optional[str] = ..., page_size: _Optional[int] = ...) -> None: ...
+
+class JobsReply(_message.Message):
+    __slots__ = ("jobs", "next_cursor")
+    JOBS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    jobs: _containers.RepeatedCompositeFieldContainer[Job]
+    next_cursor: str
+    def __init__(self, jobs: _Optional[_Iterable[_Union[Job, _Mapping]]] = ..., next_cursor: _Optional[str] = ...) -> None: ...
+
+class InvocationsRequest(_message.Message):
+    __slots__ = ("job_ref", "cursor", "page_size")
+    JOB_REF_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    job_ref: JobRef
+    cursor: str
+    page_size: int
+    def __init__(self, job_ref: _Optional[_Union[JobRef, _Mapping]] = ..., cursor: _Optional[str] = ..., page_size: _Optional[int] = ...) -> None: ...
+
+class InvocationsReply(_message.Message):
+    __slots__ = ("invocations", "next_cursor")
+    INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    invocations: _containers.RepeatedCompositeFieldContainer[Invocation]
+    next_cursor: str
+    def __init__(self, invocations: _Optional[_Iterable[_Union[Invocation, _Mapping]]] = ..., next_cursor: _Optional[str] = ...) -> None: ...
+
+class EmitTriggersRequest(_message.Message):
+    __slots__ = ("batches", "timestamp")
+    class Batch(_message.Message):
+        __slots__ = ("trigger", "jobs")
+        TRIGGER_FIELD_NUMBER: _ClassVar[int]
+        JOBS_FIELD_NUMBER: _ClassVar[int]
+        trigger: _triggers_pb2.Trigger
+        jobs: _containers.RepeatedCompositeFieldContainer[JobRef]
+        def __init__(self, trigger: _Optional[_Union[_triggers_pb2.Trigger, _Mapping]] = ..., jobs: _Optional[_Iterable[_Union[JobRef, _Mapping]]] = ...) -> None: ...
+    BATCHES_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    batches: _containers.RepeatedCompositeFieldContainer[EmitTriggersRequest.Batch]
+    timestamp: int
+    def __init__(self, batches: _Optional[_Iterable[_Union[EmitTriggersRequest.Batch, _Mapping]]] = ..., timestamp: _Optional[int] = ...) -> None: ...
+
+class JobRef(_message.Message):
+    __slots__ = ("project", "job")
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    JOB_FIELD_NUMBER: _ClassVar[int]
+    project: str
+    job: str
+    def __init__(self, project: _Optional[str] = ..., job: _Optional[str] = ...) -> None: ...
+
+class InvocationRef(_message.Message):
+    __slots__ = ("job_ref", "invocation_id")
+    JOB_REF_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    job_ref: JobRef
+    invocation_id: int
+    def __init__(self, job_ref: _Optional[_Union[JobRef, _Mapping]] = ..., invocation_id: _Optional[int] = ...) -> None: ...
+
+class Job(_message.Message):
+    __slots__ = ("job_ref", "schedule", "state", "paused")
+    JOB_REF_FIELD_NUMBER: _ClassVar[int]
+    SCHEDULE_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    PAUSED_FIELD_NUMBER: _ClassVar[int]
+    job_ref: JobRef
+    schedule: str
+    state: JobState
+    paused: bool
+    def __init__(self, job_ref: _Optional[_Union[JobRef, _Mapping]] = ..., schedule: _Optional[str] = ..., state: _Optional[_Union[JobState, _Mapping]] = ..., paused: bool = ...) -> None: ...
+
+class JobState(_message.Message):
+    __slots__ = ("ui_status",)
+    UI_STATUS_FIELD_NUMBER: _ClassVar[int]
+    ui_status: str
+    def __init__(self, ui_status: _Optional[str] = ...) -> None: ...
+
+class Invocation(_message.Message):
+    __slots__ = ("invocation_ref", "started_ts", "finished_ts", "triggered_by", "status", "final", "config_revision", "view_url")
+    INVOCATION_REF_FIELD_NUMBER: _ClassVar[int]
+    STARTED_TS_FIELD_NUMBER: _ClassVar[int]
+    FINISHED_TS_FIELD_NUMBER: _ClassVar[int]
+    TRIGGERED_BY_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    FINAL_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_REVISION_FIELD_NUMBER: _ClassVar[int]
+    VIEW_URL_FIELD_NUMBER: _ClassVar[int]
+    invocation_ref: InvocationRef
+    started_ts: int
+    finished_ts: int
+    triggered_by: str
+    status: str
+    final: bool
+    config_revision: str
+    view_url: str
+    def __init__(self, invocation_ref: _Optional[_Union[InvocationRef, _Mapping]] = ..., started_ts: _Optional[int] = ..., finished_ts: _Optional[int] = ..., triggered_by: _Optional[str] = ..., status: _Optional[str] = ..., final: bool = ..., config_revision: _Optional[str] = ..., view_url: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/scheduler/api/scheduler/v1/triggers.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/scheduler/api/scheduler/v1/triggers.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n>go.chromium.org/luci/scheduler/api/scheduler/v1/triggers.proto\x12\tscheduler\x1a\x1cgoogle/protobuf/struct.proto\"\x9a\x02\n\x07Trigger\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12&\n\x04\x63ron\x18( \x01(\x0b\x32\x16.scheduler.CronTriggerH\x00\x12(\n\x05webui\x18) \x01(\x0b\x32\x17.scheduler.WebUITriggerH\x00\x12&\n\x04noop\x18\x32 \x01(\x0b\x32\x16.scheduler.NoopTriggerH\x00\x12,\n\x07gitiles\x18\x33 \x01(\x0b\x32\x19.scheduler.GitilesTriggerH\x00\x12\x34\n\x0b\x62uildbucket\x18\x34 \x01(\x0b\x32\x1d.scheduler.BuildbucketTriggerH\x00\x42\t\n\x07payload\"!\n\x0b\x43ronTrigger\x12\x12\n\ngeneration\x18\x01 \x01(\x03\"\x0e\n\x0cWebUITrigger\"\x1b\n\x0bNoopTrigger\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\"x\n\x0eGitilesTrigger\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x0b\n\x03ref\x18\x02 \x01(\t\x12\x10\n\x08revision\x18\x03 \x01(\t\x12+\n\nproperties\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x0c\n\x04tags\x18\x05 \x03(\t\"O\n\x12\x42uildbucketTrigger\x12+\n\nproperties\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x0c\n\x04tags\x18\x02 \x03(\tB;Z9go.chromium.org/luci/scheduler/api/scheduler/v1;schedulerb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.scheduler.api.scheduler.v1.triggers_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z9go.chromium.org/luci/scheduler/api/scheduler/v1;scheduler'
+  _globals['_TRIGGER']._serialized_start=108
+  _globals['_TRIGGER']._serialized_end=390
+  _globals['_CRONTRIGGER']._serialized_start=392
+  _globals['_CRONTRIGGER']._serialized_end=425
+  _globals['_WEBUITRIGGER']._serialized_start=427
+  _globals['_WEBUITRIGGER']._serialized_end=441
+  _globals['_NOOPTRIGGER']._serialized_start=443
+  _globals['_NOOPTRIGGER']._serialized_end=470
+  _globals['_GITILESTRIGGER']._serialized_start=472
+  _globals['_GITILESTRIGGER']._serialized_end=592
+  _globals['_BUILDBUCKETTRIGGER']._serialized_start=594
+  _globals['_BUILDBUCKETTRIGGER']._serialized_end=673
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,66 @@
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Trigger(_message.Message):
+    __slots__ = ("id", "title", "url", "cron", "webui", "noop", "gitiles", "buildbucket")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    TITLE_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    CRON_FIELD_NUMBER: _ClassVar[int]
+    WEBUI_FIELD_NUMBER: _ClassVar[int]
+    NOOP_FIELD_NUMBER: _ClassVar[int]
+    GITILES_FIELD_NUMBER: _ClassVar[int]
+    BUILDBUCKET_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    title: str
+    url: str
+    cron: CronTrigger
+    webui: WebUITrigger
+    noop: NoopTrigger
+    gitiles: GitilesTrigger
+    buildbucket: BuildbucketTrigger
+    def __init__(self, id: _Optional[str] = ..., title: _Optional[str] = ..., url: _Optional[str] = ..., cron: _Optional[_Union[CronTrigger, _Mapping]] = ..., webui: _Optional[_Union[WebUITrigger, _Mapping]] = ..., noop: _Optional[_Union[NoopTrigger, _Mapping]] = ..., gitiles: _Optional[_Union[GitilesTrigger, _Mapping]] = ..., buildbucket: _Optional[_Union[BuildbucketTrigger, _Mapping]] = ...) -> None: ...
+
+class CronTrigger(_message.Message):
+    __slots__ = ("generation",)
+    GENERATION_FIELD_NUMBER: _ClassVar[int]
+    generation: int
+    def __init__(self, generation: _Optional[int] = ...) -> None: ...
+
+class WebUITrigger(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class NoopTrigger(_message.Message):
+    __slots__ = ("data",)
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    data: str
+    def __init__(self, data: _Optional[str] = ...) -> None: ...
+
+class GitilesTrigger(_message.Message):
+    __slots__ = ("repo", "ref", "revision", "properties", "tags")
+    REPO_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    repo: str
+    ref: str
+    revision: str
+    properties: _struct_pb2.Struct
+    tags: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, repo: _Optional[str] = ..., ref: _Optional[str] = ..., revision: _Optional[str] = ..., properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., tags: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class BuildbucketTrigger(_message.Message):
+    __slots__ = ("properties", "tags")
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    properties: _struct_pb2.Struct
+    tags: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., tags: _Optional[_Iterable[str]] = ...) -> None: ...
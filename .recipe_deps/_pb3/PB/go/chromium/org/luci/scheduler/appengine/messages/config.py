@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/scheduler/appengine/messages/config.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/scheduler/appengine/messages/config.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.common.proto import options as go_dot_chromium_dot_org_dot_luci_dot_common_dot_proto_dot_options__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n>go.chromium.org/luci/scheduler/appengine/messages/config.proto\x12\x10scheduler.config\x1a/go.chromium.org/luci/common/proto/options.proto\x1a\x1egoogle/protobuf/duration.proto\"\xa7\x01\n\rProjectConfig\x12\"\n\x03job\x18\x01 \x03(\x0b\x32\x15.scheduler.config.Job\x12*\n\x07trigger\x18\x02 \x03(\x0b\x32\x19.scheduler.config.Trigger\x12.\n\x08\x61\x63l_sets\x18\x03 \x03(\x0b\x32\x18.scheduler.config.AclSetB\x02\x18\x01J\x04\x08\x04\x10\x05R\x10security_options\"y\n\x03\x41\x63l\x12,\n\x04role\x18\x01 \x01(\x0e\x32\x1a.scheduler.config.Acl.RoleB\x02\x18\x01\x12\x16\n\ngranted_to\x18\x02 \x01(\tB\x02\x18\x01\",\n\x04Role\x12\n\n\x06READER\x10\x00\x12\r\n\tTRIGGERER\x10\x02\x12\t\n\x05OWNER\x10\x01\"C\n\x06\x41\x63lSet\x12\x10\n\x04name\x18\x01 \x01(\tB\x02\x18\x01\x12\'\n\x04\x61\x63ls\x18\x02 \x03(\x0b\x32\x15.scheduler.config.AclB\x02\x18\x01\"\xa3\x02\n\x10TriggeringPolicy\x12\x35\n\x04kind\x18\x01 \x01(\x0e\x32\'.scheduler.config.TriggeringPolicy.Kind\x12\"\n\x1amax_concurrent_invocations\x18\x02 \x01(\x03\x12\x16\n\x0emax_batch_size\x18\x03 \x01(\x03\x12\x10\n\x08log_base\x18\x04 \x01(\x02\x12\x32\n\x0fpending_timeout\x18\x05 \x01(\x0b\x32\x19.google.protobuf.Duration\"V\n\x04Kind\x12\r\n\tUNDEFINED\x10\x00\x12\x13\n\x0fGREEDY_BATCHING\x10\x01\x12\x18\n\x14LOGARITHMIC_BATCHING\x10\x02\x12\x10\n\x0cNEWEST_FIRST\x10\x03\"\xe3\x02\n\x03Job\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05realm\x18\x08 \x01(\t\x12\x10\n\x08schedule\x18\x02 \x01(\t\x12\x10\n\x08\x64isabled\x18\x03 \x01(\x08\x12\'\n\x04\x61\x63ls\x18\x05 \x03(\x0b\x32\x15.scheduler.config.AclB\x02\x18\x01\x12\x14\n\x08\x61\x63l_sets\x18\x06 \x03(\tB\x02\x18\x01\x12=\n\x11triggering_policy\x18\x07 \x01(\x0b\x32\".scheduler.config.TriggeringPolicy\x12(\n\x04noop\x18\x64 \x01(\x0b\x32\x1a.scheduler.config.NoopTask\x12\x31\n\turl_fetch\x18\x65 \x01(\x0b\x32\x1e.scheduler.config.UrlFetchTask\x12\x36\n\x0b\x62uildbucket\x18g \x01(\x0b\x32!.scheduler.config.BuildbucketTaskJ\x04\x08\x04\x10\x05J\x04\x08\x66\x10g\"\xb3\x02\n\x07Trigger\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05realm\x18\x07 \x01(\t\x12\x10\n\x08schedule\x18\x02 \x01(\t\x12\x10\n\x08\x64isabled\x18\x03 \x01(\x08\x12\'\n\x04\x61\x63ls\x18\x04 \x03(\x0b\x32\x15.scheduler.config.AclB\x02\x18\x01\x12\x14\n\x08\x61\x63l_sets\x18\x05 \x03(\tB\x02\x18\x01\x12=\n\x11triggering_policy\x18\x06 \x01(\x0b\x32\".scheduler.config.TriggeringPolicy\x12\x11\n\x08triggers\x18\xc8\x01 \x03(\t\x12(\n\x04noop\x18\x64 \x01(\x0b\x32\x1a.scheduler.config.NoopTask\x12.\n\x07gitiles\x18\x65 \x01(\x0b\x32\x1d.scheduler.config.GitilesTask\"4\n\x08NoopTask\x12\x10\n\x08sleep_ms\x18\x01 \x01(\x03\x12\x16\n\x0etriggers_count\x18\x02 \x01(\x03\"]\n\x0bGitilesTask\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x0c\n\x04refs\x18\x02 \x03(\t\x12\x14\n\x0cpath_regexps\x18\x03 \x03(\t\x12\x1c\n\x14path_regexps_exclude\x18\x04 \x03(\t\"@\n\x0cUrlFetchTask\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x13\n\x0btimeout_sec\x18\x03 \x01(\x05\"d\n\x0f\x42uildbucketTask\x12\x0e\n\x06server\x18\x01 \x01(\t\x12\x0e\n\x06\x62ucket\x18\x02 \x01(\t\x12\x0f\n\x07\x62uilder\x18\x03 \x01(\t\x12\x12\n\nproperties\x18\x04 \x03(\t\x12\x0c\n\x04tags\x18\x05 \x03(\t\"\xdb\x01\n\x0eTaskDefWrapper\x12(\n\x04noop\x18\x01 \x01(\x0b\x32\x1a.scheduler.config.NoopTask\x12\x31\n\turl_fetch\x18\x02 \x01(\x0b\x32\x1e.scheduler.config.UrlFetchTask\x12\x36\n\x0b\x62uildbucket\x18\x04 \x01(\x0b\x32!.scheduler.config.BuildbucketTask\x12.\n\x07gitiles\x18\x05 \x01(\x0b\x32\x1d.scheduler.config.GitilesTaskJ\x04\x08\x03\x10\x04\x42tZ1go.chromium.org/luci/scheduler/appengine/messages\xa2\xfe#=\n;https://config.luci.app/schemas/projects:luci-scheduler.cfgb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.scheduler.appengine.messages.config_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z1go.chromium.org/luci/scheduler/appengine/messages\242\376#=\n;https://config.luci.app/schemas/projects:luci-scheduler.cfg'
+  _globals['_PROJECTCONFIG'].fields_by_name['acl_sets']._loaded_options = None
+  _globals['_PROJECTCONFIG'].fields_by_name['acl_sets']._serialized_options = b'\030\001'
+  _globals['_ACL'].fields_by_name['role']._loaded_options = None
+  _globals['_ACL'].fields_by_name['role']._serialized_options = b'\030\001'
+  _globals['_ACL'].fields_by_name['granted_to']._loaded_options = None
+  _globals['_ACL'].fields_by_name['granted_to']._serialized_options = b'\030\001'
+  _globals['_ACLSET'].fields_by_name['name']._loaded_options = None
+  _globals['_ACLSET'].fields_by_name['name']._serialized_options = b'\030\001'
+  _globals['_ACLSET'].fields_by_name['acls']._loaded_options = None
+  _globals['_ACLSET'].fields_by_name['acls']._serialized_options = b'\030\001'
+  _globals['_JOB'].fields_by_name['acls']._loaded_options = None
+  _globals['_JOB'].fields_by_name['acls']._serialized_options = b'\030\001'
+  _globals['_JOB'].fields_by_name['acl_sets']._loaded_options = None
+  _globals['_JOB'].fields_by_name['acl_sets']._serialized_options = b'\030\001'
+  _globals['_TRIGGER'].fields_by_name['acls']._loaded_options = None
+  _globals['_TRIGGER'].fields_by_name['acls']._serialized_options = b'\030\001'
+  _globals['_TRIGGER'].fields_by_name['acl_sets']._loaded_options = None
+  _globals['_TRIGGER'].fields_by_name['acl_sets']._serialized_options = b'\030\001'
+  _globals['_PROJECTCONFIG']._serialized_start=166
+  _globals['_PROJECTCONFIG']._serialized_end=333
+  _globals['_ACL']._serialized_start=335
+  _globals['_ACL']._serialized_end=456
+  _globals['_ACL_ROLE']._serialized_start=412
+  _globals['_ACL_ROLE']._serialized_end=456
+  _globals['_ACLSET']._serialized_start=458
+  _globals['_ACLSET']._serialized_end=525
+  _globals['_TRIGGERINGPOLICY']._serialized_start=528
+  _globals['_TRIGGERINGPOLICY']._serialized_end=819
+  _globals['_TRIGGERINGPOLICY_KIND']._serialized_start=733
+  _globals['_TRIGGERINGPOLICY_KIND']._serialized_end=819
+  _globals['_JOB']._serialized_start=822
+  _globals['_JOB']._serialized_end=1177
+  _globals['_TRIGGER']._serialized_start=1180
+  _globals['_TRIGGER']._serialized_end=1487
+  _globals['_NOOPTASK']._serialized_start=1489
+  _globals['_NOOPTASK']._serialized_end=1541
+  _globals['_GITILESTASK']._serialized_start=1543
+  _globals['_GITILESTASK']._serialized_end=1636
+  _globals['_URLFETCHTASK']._serialized_start=1638
+  _globals['_URLFETCHTASK']._serialized_end=1702
+  _globals['_BUILDBUCKETTASK']._serialized_start=1704
+  _globals['_BUILDBUCKETTASK']._serialized_end=1804
+  _globals['_TASKDEFWRAPPER']._serialized_start=1807
+  _globals['_TASKDEFWRAPPER']._serialized_end=2026
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,174 @@
+import datetime
+
+from PB.go.chromium.org.luci.common.proto import options as _options_pb2
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ProjectConfig(_message.Message):
+    __slots__ = ("job", "trigger", "acl_sets")
+    JOB_FIELD_NUMBER: _ClassVar[int]
+    TRIGGER_FIELD_NUMBER: _ClassVar[int]
+    ACL_SETS_FIELD_NUMBER: _ClassVar[int]
+    job: _containers.RepeatedCompositeFieldContainer[Job]
+    trigger: _containers.RepeatedCompositeFieldContainer[Trigger]
+    acl_sets: _containers.RepeatedCompositeFieldContainer[AclSet]
+    def __init__(self, job: _Optional[_Iterable[_Union[Job, _Mapping]]] = ..., trigger: _Optional[_Iterable[_Union[Trigger, _Mapping]]] = ..., acl_sets: _Optional[_Iterable[_Union[AclSet, _Mapping]]] = ...) -> None: ...
+
+class Acl(_message.Message):
+    __slots__ = ("role", "granted_to")
+    class Role(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        READER: _ClassVar[Acl.Role]
+        TRIGGERER: _ClassVar[Acl.Role]
+        OWNER: _ClassVar[Acl.Role]
+    READER: Acl.Role
+    TRIGGERER: Acl.Role
+    OWNER: Acl.Role
+    ROLE_FIELD_NUMBER: _ClassVar[int]
+    GRANTED_TO_FIELD_NUMBER: _ClassVar[int]
+    role: Acl.Role
+    granted_to: str
+    def __init__(self, role: _Optional[_Union[Acl.Role, str]] = ..., granted_to: _Optional[str] = ...) -> None: ...
+
+class AclSet(_message.Message):
+    __slots__ = ("name", "acls")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ACLS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    acls: _containers.RepeatedCompositeFieldContainer[Acl]
+    def __init__(self, name: _Optional[str] = ..., acls: _Optional[_Iterable[_Union[Acl, _Mapping]]] = ...) -> None: ...
+
+class TriggeringPolicy(_message.Message):
+    __slots__ = ("kind", "max_concurrent_invocations", "max_batch_size", "log_base", "pending_timeout")
+    class Kind(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        UNDEFINED: _ClassVar[TriggeringPolicy.Kind]
+        GREEDY_BATCHING: _ClassVar[TriggeringPolicy.Kind]
+        LOGARITHMIC_BATCHING: _ClassVar[TriggeringPolicy.Kind]
+        NEWEST_FIRST: _ClassVar[TriggeringPolicy.Kind]
+    UNDEFINED: TriggeringPolicy.Kind
+    GREEDY_BATCHING: TriggeringPolicy.Kind
+    LOGARITHMIC_BATCHING: TriggeringPolicy.Kind
+    NEWEST_FIRST: TriggeringPolicy.Kind
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    MAX_CONCURRENT_INVOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    MAX_BATCH_SIZE_FIELD_NUMBER: _ClassVar[int]
+    LOG_BASE_FIELD_NUMBER: _ClassVar[int]
+    PENDING_TIMEOUT_FIELD_NUMBER: _ClassVar[int]
+    kind: TriggeringPolicy.Kind
+    max_concurrent_invocations: int
+    max_batch_size: int
+    log_base: float
+    pending_timeout: _duration_pb2.Duration
+    def __init__(self, kind: _Optional[_Union[TriggeringPolicy.Kind, str]] = ..., max_concurrent_invocations: _Optional[int] = ..., max_batch_size: _Optional[int] = ..., log_base: _Optional[float] = ..., pending_timeout: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ...) -> None: ...
+
+class Job(_message.Message):
+    __slots__ = ("id", "realm", "schedule", "disabled", "acls", "acl_sets", "triggering_policy", "noop", "url_fetch", "buildbucket")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    SCHEDULE_FIELD_NUMBER: _ClassVar[int]
+    DISABLED_FIELD_NUMBER: _ClassVar[int]
+    ACLS_FIELD_NUMBER: _ClassVar[int]
+    ACL_SETS_FIELD_NUMBER: _ClassVar[int]
+    TRIGGERING_POLICY_FIELD_NUMBER: _ClassVar[int]
+    NOOP_FIELD_NUMBER: _ClassVar[int]
+    URL_FETCH_FIELD_NUMBER: _ClassVar[int]
+    BUILDBUCKET_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    realm: str
+    schedule: str
+    disabled: bool
+    acls: _containers.RepeatedCompositeFieldContainer[Acl]
+    acl_sets: _containers.RepeatedScalarFieldContainer[str]
+    triggering_policy: TriggeringPolicy
+    noop: NoopTask
+    url_fetch: UrlFetchTask
+    buildbucket: BuildbucketTask
+    def __init__(self, id: _Optional[str] = ..., realm: _Optional[str] = ..., schedule: _Optional[str] = ..., disabled: bool = ..., acls: _Optional[_Iterable[_Union[Acl, _Mapping]]] = ..., acl_sets: _Optional[_Iterable[str]] = ..., triggering_policy: _Optional[_Union[TriggeringPolicy, _Mapping]] = ..., noop: _Optional[_Union[NoopTask, _Mapping]] = ..., url_fetch: _Optional[_Union[UrlFetchTask, _Mapping]] = ..., buildbucket: _Optional[_Union[BuildbucketTask, _Mapping]] = ...) -> None: ...
+
+class Trigger(_message.Message):
+    __slots__ = ("id", "realm", "schedule", "disabled", "acls", "acl_sets", "triggering_policy", "triggers", "noop", "gitiles")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    SCHEDULE_FIELD_NUMBER: _ClassVar[int]
+    DISABLED_FIELD_NUMBER: _ClassVar[int]
+    ACLS_FIELD_NUMBER: _ClassVar[int]
+    ACL_SETS_FIELD_NUMBER: _ClassVar[int]
+    TRIGGERING_POLICY_FIELD_NUMBER: _ClassVar[int]
+    TRIGGERS_FIELD_NUMBER: _ClassVar[int]
+    NOOP_FIELD_NUMBER: _ClassVar[int]
+    GITILES_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    realm: str
+    schedule: str
+    disabled: bool
+    acls: _containers.RepeatedCompositeFieldContainer[Acl]
+    acl_sets: _containers.RepeatedScalarFieldContainer[str]
+    triggering_policy: TriggeringPolicy
+    triggers: _containers.RepeatedScalarFieldContainer[str]
+    noop: NoopTask
+    gitiles: GitilesTask
+    def __init__(self, id: _Optional[str] = ..., realm: _Optional[str] = ..., schedule: _Optional[str] = ..., disabled: bool = ..., acls: _Optional[_Iterable[_Union[Acl, _Mapping]]] = ..., acl_sets: _Optional[_Iterable[str]] = ..., triggering_policy: _Optional[_Union[TriggeringPolicy, _Mapping]] = ..., triggers: _Optional[_Iterable[str]] = ..., noop: _Optional[_Union[NoopTask, _Mapping]] = ..., gitiles: _Optional[_Union[GitilesTask, _Mapping]] = ...) -> None: ...
+
+class NoopTask(_message.Message):
+    __slots__ = ("sleep_ms", "triggers_count")
+    SLEEP_MS_FIELD_NUMBER: _ClassVar[int]
+    TRIGGERS_COUNT_FIELD_NUMBER: _ClassVar[int]
+    sleep_ms: int
+    triggers_count: int
+    def __init__(self, sleep_ms: _Optional[int] = ..., triggers_count: _Optional[int] = ...) -> None: ...
+
+class GitilesTask(_message.Message):
+    __slots__ = ("repo", "refs", "path_regexps", "path_regexps_exclude")
+    REPO_FIELD_NUMBER: _ClassVar[int]
+    REFS_FIELD_NUMBER: _ClassVar[int]
+    PATH_REGEXPS_FIELD_NUMBER: _ClassVar[int]
+    PATH_REGEXPS_EXCLUDE_FIELD_NUMBER: _ClassVar[int]
+    repo: str
+    refs: _containers.RepeatedScalarFieldContainer[str]
+    path_regexps: _containers.RepeatedScalarFieldContainer[str]
+    path_regexps_exclude: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, repo: _Optional[str] = ..., refs: _Optional[_Iterable[str]] = ..., path_regexps: _Optional[_Iterable[str]] = ..., path_regexps_exclude: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class UrlFetchTask(_message.Message):
+    __slots__ = ("method", "url", "timeout_sec")
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_SEC_FIELD_NUMBER: _ClassVar[int]
+    method: str
+    url: str
+    timeout_sec: int
+    def __init__(self, method: _Optional[str] = ..., url: _Optional[str] = ..., timeout_sec: _Optional[int] = ...) -> None: ...
+
+class BuildbucketTask(_message.Message):
+    __slots__ = ("server", "bucket", "builder", "properties", "tags")
+    SERVER_FIELD_NUMBER: _ClassVar[int]
+    BUCKET_FIELD_NUMBER: _ClassVar[int]
+    BUILDER_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    server: str
+    bucket: str
+    builder: str
+    properties: _containers.RepeatedScalarFieldContainer[str]
+    tags: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, server: _Optional[str] = ..., bucket: _Optional[str] = ..., builder: _Optional[str] = ..., properties: _Optional[_Iterable[str]] = ..., tags: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class TaskDefWrapper(_message.Message):
+    __slots__ = ("noop", "url_fetch", "buildbucket", "gitiles")
+    NOOP_FIELD_NUMBER: _ClassVar[int]
+    URL_FETCH_FIELD_NUMBER: _ClassVar[int]
+    BUILDBUCKET_FIELD_NUMBER: _ClassVar[int]
+    GITILES_FIELD_NUMBER: _ClassVar[int]
+    noop: NoopTask
+    url_fetch: UrlFetchTask
+    buildbucket: BuildbucketTask
+    gitiles: GitilesTask
+    def __init__(self, noop: _Optional[_Union[NoopTask, _Mapping]] = ..., url_fetch: _Optional[_Union[UrlFetchTask, _Mapping]] = ..., buildbucket: _Optional[_Union[BuildbucketTask, _Mapping]] = ..., gitiles: _Optional[_Union[GitilesTask, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: go.chromium.org/luci/swarming/proto/api_v2/swarming.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'go.chromium.org/luci/swarming/proto/api_v2/swarming.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.google.rpc import status as google_dot_rpc_dot_status__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9go.chromium.org/luci/swarming/proto/api_v2/swarming.proto\x12\x0bswarming.v2\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x17google/rpc/status.proto\"(\n\nStringPair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\",\n\x0eStringListPair\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x03(\t\"\xbc\x01\n\rServerDetails\x12\x16\n\x0eserver_version\x18\x01 \x01(\t\x12\x13\n\x0b\x62ot_version\x18\x02 \x01(\t\x12%\n\x19machine_provider_template\x18\x03 \x01(\tB\x02\x18\x01\x12#\n\x1b\x64isplay_server_url_template\x18\x04 \x01(\t\x12\x17\n\x0bluci_config\x18\x05 \x01(\tB\x02\x18\x01\x12\x19\n\x11\x63\x61s_viewer_server\x18\x06 \x01(\t\")\n\x0e\x42ootstrapToken\x12\x17\n\x0f\x62ootstrap_token\x18\x01 \x01(\t\"\xf4\x01\n\x11\x43lientPermissions\x12\x12\n\ndelete_bot\x18\x01 \x01(\x08\x12\x13\n\x0b\x64\x65lete_bots\x18\x02 \x01(\x08\x12\x15\n\rterminate_bot\x18\x03 \x01(\x08\x12\x17\n\x0bget_configs\x18\x04 \x01(\x08\x42\x02\x18\x01\x12\x17\n\x0bput_configs\x18\x05 \x01(\x08\x42\x02\x18\x01\x12\x13\n\x0b\x63\x61ncel_task\x18\x06 \x01(\x08\x12\x1b\n\x13get_bootstrap_token\x18\x07 \x01(\x08\x12\x14\n\x0c\x63\x61ncel_tasks\x18\x08 \x01(\x08\x12\x11\n\tlist_bots\x18\t \x03(\t\x12\x12\n\nlist_tasks\x18\n \x03(\t\"*\n\x06\x44igest\x12\x0c\n\x04hash\x18\x01 \x01(\t\x12\x12\n\nsize_bytes\x18\x02 \x01(\x03\"I\n\x0c\x43\x41SReference\x12\x14\n\x0c\x63\x61s_instance\x18\x01 \x01(\t\x12#\n\x06\x64igest\x18\x02 \x01(\x0b\x32\x13.swarming.v2.Digest\"B\n\x0b\x43ipdPackage\x12\x14\n\x0cpackage_name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\"y\n\tCipdInput\x12\x0e\n\x06server\x18\x01 \x01(\t\x12\x30\n\x0e\x63lient_package\x18\x02 \x01(\x0b\x32\x18.swarming.v2.CipdPackage\x12*\n\x08packages\x18\x03 \x03(\x0b\x32\x18.swarming.v2.CipdPackage\"h\n\x08\x43ipdPins\x12\x30\n\x0e\x63lient_package\x18\x01 \x01(\x0b\x32\x18.swarming.v2.CipdPackage\x12*\n\x08packages\x18\x02 \x03(\x0b\x32\x18.swarming.v2.CipdPackage\"(\n\nCacheEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"\xf2\x01\n\x0b\x43ontainment\x12\x16\n\x0elower_priority\x18\x01 \x01(\x08\x12\x42\n\x10\x63ontainment_type\x18\x02 \x01(\x0e\x32(.swarming.v2.Containment.ContainmentType\x12\x17\n\x0flimit_processes\x18\x03 \x01(\x03\x12$\n\x1climit_total_committed_memory\x18\x04 \x01(\x03\"H\n\x0f\x43ontainmentType\x12\x11\n\rNOT_SPECIFIED\x10\x00\x12\x08\n\x04NONE\x10\x01\x12\x08\n\x04\x41UTO\x10\x02\x12\x0e\n\nJOB_OBJECT\x10\x03\"\x83\x04\n\x0eTaskProperties\x12\'\n\x06\x63\x61\x63hes\x18\x01 \x03(\x0b\x32\x17.swarming.v2.CacheEntry\x12*\n\ncipd_input\x18\x02 \x01(\x0b\x32\x16.swarming.v2.CipdInput\x12\x0f\n\x07\x63ommand\x18\x03 \x03(\t\x12\x14\n\x0crelative_cwd\x18\x04 \x01(\t\x12+\n\ndimensions\x18\x05 \x03(\x0b\x32\x17.swarming.v2.StringPair\x12$\n\x03\x65nv\x18\x06 \x03(\x0b\x32\x17.swarming.v2.StringPair\x12\x31\n\x0c\x65nv_prefixes\x18\x07 \x03(\x0b\x32\x1b.swarming.v2.StringListPair\x12\x1e\n\x16\x65xecution_timeout_secs\x18\x08 \x01(\x05\x12\x19\n\x11grace_period_secs\x18\t \x01(\x05\x12\x12\n\nidempotent\x18\n \x01(\x08\x12\x31\n\x0e\x63\x61s_input_root\x18\x0b \x01(\x0b\x32\x19.swarming.v2.CASReference\x12\x17\n\x0fio_timeout_secs\x18\x0c \x01(\x05\x12\x0f\n\x07outputs\x18\r \x03(\t\x12\x14\n\x0csecret_bytes\x18\x0e \x01(\x0c\x12-\n\x0b\x63ontainment\x18\x0f \x01(\x0b\x32\x18.swarming.v2.Containment\"p\n\tTaskSlice\x12/\n\nproperties\x18\x01 \x01(\x0b\x32\x1b.swarming.v2.TaskProperties\x12\x17\n\x0f\x65xpiration_secs\x18\x02 \x01(\x05\x12\x19\n\x11wait_for_capacity\x18\x03 \x01(\x08\"\xba\x02\n\x19SwarmingTaskBackendConfig\x12\x10\n\x08priority\x18\x01 \x01(\x05\x12\x1a\n\x12\x62ot_ping_tolerance\x18\x02 \x01(\x03\x12\x15\n\rparent_run_id\x18\x03 \x01(\t\x12\x17\n\x0fservice_account\x18\x04 \x01(\t\x12\x19\n\x11wait_for_capacity\x18\x05 \x01(\x08\x12\x1d\n\x15\x61gent_binary_cipd_pkg\x18\x06 \x01(\t\x12\x1e\n\x16\x61gent_binary_cipd_vers\x18\x07 \x01(\t\x12\"\n\x1a\x61gent_binary_cipd_filename\x18\x08 \x01(\t\x12 \n\x18\x61gent_binary_cipd_server\x18\t \x01(\t\x12\x0c\n\x04tags\x18\n \x03(\t\x12\x11\n\ttask_name\x18\x0b \x01(\t\"\x1d\n\x0bResultDBCfg\x12\x0e\n\x06\x65nable\x18\x01 \x01(\x08\"\xe8\x04\n\x0eNewTaskRequest\x12\x17\n\x0f\x65xpiration_secs\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eparent_task_id\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12/\n\nproperties\x18\x05 \x01(\x0b\x32\x1b.swarming.v2.TaskProperties\x12+\n\x0btask_slices\x18\x06 \x03(\x0b\x32\x16.swarming.v2.TaskSlice\x12\x0c\n\x04tags\x18\x07 \x03(\t\x12\x0c\n\x04user\x18\x08 \x01(\t\x12\x17\n\x0fservice_account\x18\t \x01(\t\x12\x14\n\x0cpubsub_topic\x18\n \x01(\t\x12\x19\n\x11pubsub_auth_token\x18\x0b \x01(\t\x12\x17\n\x0fpubsub_userdata\x18\x0c \x01(\t\x12\x15\n\revaluate_only\x18\r \x01(\x08\x12M\n\x12pool_task_template\x18\x0e \x01(\x0e\x32\x31.swarming.v2.NewTaskRequest.PoolTaskTemplateField\x12\x1f\n\x17\x62ot_ping_tolerance_secs\x18\x0f \x01(\x05\x12\x14\n\x0crequest_uuid\x18\x10 \x01(\t\x12*\n\x08resultdb\x18\x11 \x01(\x0b\x32\x18.swarming.v2.ResultDBCfg\x12\r\n\x05realm\x18\x12 \x01(\t\"P\n\x15PoolTaskTemplateField\x12\x08\n\x04\x41UTO\x10\x00\x12\x11\n\rCANARY_PREFER\x10\x01\x12\x10\n\x0c\x43\x41NARY_NEVER\x10\x02\x12\x08\n\x04SKIP\x10\x03\"\xf2\x03\n\x13TaskRequestResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpiration_secs\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x16\n\x0eparent_task_id\x18\x04 \x01(\t\x12\x10\n\x08priority\x18\x05 \x01(\x05\x12/\n\nproperties\x18\x06 \x01(\x0b\x32\x1b.swarming.v2.TaskProperties\x12\x0c\n\x04tags\x18\x07 \x03(\t\x12.\n\ncreated_ts\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0c\n\x04user\x18\t \x01(\t\x12\x15\n\rauthenticated\x18\n \x01(\t\x12+\n\x0btask_slices\x18\x0b \x03(\x0b\x32\x16.swarming.v2.TaskSlice\x12\x17\n\x0fservice_account\x18\x0c \x01(\t\x12\r\n\x05realm\x18\r \x01(\t\x12*\n\x08resultdb\x18\x0e \x01(\x0b\x32\x18.swarming.v2.ResultDBCfg\x12\x14\n\x0cpubsub_topic\x18\x0f \x01(\t\x12\x17\n\x0fpubsub_userdata\x18\x10 \x01(\t\x12\x1f\n\x17\x62ot_ping_tolerance_secs\x18\x11 \x01(\x05\x12\x14\n\x0crbe_instance\x18\x12 \x01(\t\":\n\x11TaskCancelRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x14\n\x0ckill_running\x18\x02 \x01(\x08\"\xab\x01\n\x12TasksCancelRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\x12\x0c\n\x04tags\x18\x03 \x03(\t\x12\x14\n\x0ckill_running\x18\x04 \x01(\x08\x12)\n\x05start\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x03\x65nd\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\"\n\x0eOperationStats\x12\x10\n\x08\x64uration\x18\x01 \x01(\x02\"\xee\x01\n\x11\x43\x41SOperationStats\x12\x10\n\x08\x64uration\x18\x01 \x01(\x02\x12\x1c\n\x14initial_number_items\x18\x02 \x01(\x05\x12\x14\n\x0cinitial_size\x18\x03 \x01(\x03\x12\x12\n\nitems_cold\x18\x04 \x01(\x0c\x12\x11\n\titems_hot\x18\x05 \x01(\x0c\x12\x16\n\x0enum_items_cold\x18\x06 \x01(\x03\x12\x1e\n\x16total_bytes_items_cold\x18\x07 \x01(\x03\x12\x15\n\rnum_items_hot\x18\x08 \x01(\x03\x12\x1d\n\x15total_bytes_items_hot\x18\t \x01(\x03\"\xae\x03\n\x10PerformanceStats\x12\x14\n\x0c\x62ot_overhead\x18\x01 \x01(\x02\x12\x39\n\x11isolated_download\x18\x02 \x01(\x0b\x32\x1e.swarming.v2.CASOperationStats\x12\x37\n\x0fisolated_upload\x18\x03 \x01(\x0b\x32\x1e.swarming.v2.CASOperationStats\x12\x39\n\x14package_installation\x18\x04 \x01(\x0b\x32\x1b.swarming.v2.OperationStats\x12/\n\ncache_trim\x18\x05 \x01(\x0b\x32\x1b.swarming.v2.OperationStats\x12\x39\n\x14named_caches_install\x18\x06 \x01(\x0b\x32\x1b.swarming.v2.OperationStats\x12;\n\x16named_caches_uninstall\x18\x07 \x01(\x0b\x32\x1b.swarming.v2.OperationStats\x12,\n\x07\x63leanup\x18\x08 \x01(\x0b\x32\x1b.swarming.v2.OperationStats\"7\n\x0e\x43\x61ncelResponse\x12\x10\n\x08\x63\x61nceled\x18\x01 \x01(\x08\x12\x13\n\x0bwas_running\x18\x02 \x01(\x08\"_\n\x13TasksCancelResponse\x12\x0e\n\x06\x63ursor\x18\x01 \x01(\t\x12\'\n\x03now\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07matched\x18\x03 \x01(\x05\"K\n\x12TaskOutputResponse\x12\x0e\n\x06output\x18\x01 \x01(\x0c\x12%\n\x05state\x18\x02 \x01(\x0e\x32\x16.swarming.v2.TaskState\"4\n\x0cResultDBInfo\x12\x10\n\x08hostname\x18\x01 \x01(\t\x12\x12\n\ninvocation\x18\x02 \x01(\t\"\xb5\x08\n\x12TaskResultResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x33\n\x0e\x62ot_dimensions\x18\x02 \x03(\x0b\x32\x1b.swarming.v2.StringListPair\x12\x0e\n\x06\x62ot_id\x18\x03 \x01(\t\x12\x35\n\x11\x62ot_idle_since_ts\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0b\x62ot_version\x18\x05 \x01(\t\x12\x1e\n\x16\x62ot_logs_cloud_project\x18\x06 \x01(\t\x12\x30\n\x0c\x63ompleted_ts\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x16\n\x0e\x63ost_saved_usd\x18\t \x01(\x02\x12.\n\ncreated_ts\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0c\x64\x65\x64uped_from\x18\x0b \x01(\t\x12\x10\n\x08\x64uration\x18\x0c \x01(\x02\x12\x11\n\texit_code\x18\r \x01(\x03\x12\x0f\n\x07\x66\x61ilure\x18\x0e \x01(\x08\x12\x18\n\x10internal_failure\x18\x0f \x01(\x08\x12/\n\x0bmodified_ts\x18\x10 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x32\n\x0f\x63\x61s_output_root\x18\x11 \x01(\x0b\x32\x19.swarming.v2.CASReference\x12\x17\n\x0fserver_versions\x18\x12 \x03(\t\x12.\n\nstarted_ts\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12%\n\x05state\x18\x14 \x01(\x0e\x32\x16.swarming.v2.TaskState\x12\x30\n\x0c\x61\x62\x61ndoned_ts\x18\x15 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tcosts_usd\x18\x16 \x03(\x02\x12\x0c\n\x04name\x18\x17 \x01(\t\x12\x0c\n\x04tags\x18\x18 \x03(\t\x12\x0c\n\x04user\x18\x19 \x01(\t\x12\x38\n\x11performance_stats\x18\x1a \x01(\x0b\x32\x1d.swarming.v2.PerformanceStats\x12(\n\tcipd_pins\x18\x1b \x01(\x0b\x32\x15.swarming.v2.CipdPins\x12\x0e\n\x06run_id\x18\x1c \x01(\t\x12\x1a\n\x12\x63urrent_task_slice\x18\x1d \x01(\x05\x12\x30\n\rresultdb_info\x18\x1e \x01(\x0b\x32\x19.swarming.v2.ResultDBInfo\x12.\n\x0bmissing_cas\x18\x1f \x03(\x0b\x32\x19.swarming.v2.CASReference\x12.\n\x0cmissing_cipd\x18  \x03(\x0b\x32\x18.swarming.v2.CipdPackageJ\x04\x08\x07\x10\x08R\x11\x63hildren_task_ids\"4\n\nTaskStates\x12&\n\x06states\x18\x01 \x03(\x0e\x32\x16.swarming.v2.TaskState\"{\n\x10TaskListResponse\x12\x0e\n\x06\x63ursor\x18\x01 \x01(\t\x12.\n\x05items\x18\x02 \x03(\x0b\x32\x1f.swarming.v2.TaskResultResponse\x12\'\n\x03now\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x80\x01\n\x14TaskRequestsResponse\x12\x0e\n\x06\x63ursor\x18\x01 \x01(\t\x12/\n\x05items\x18\x02 \x03(\x0b\x32 .swarming.v2.TaskRequestResponse\x12\'\n\x03now\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"D\n\nTasksCount\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\'\n\x03now\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x97\x01\n\x1bTaskRequestMetadataResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x31\n\x07request\x18\x02 \x01(\x0b\x32 .swarming.v2.TaskRequestResponse\x12\x34\n\x0btask_result\x18\x03 \x01(\x0b\x32\x1f.swarming.v2.TaskResultResponse\"\xa3\x03\n\x07\x42otInfo\x12\x0e\n\x06\x62ot_id\x18\x01 \x01(\t\x12\x0f\n\x07task_id\x18\x02 \x01(\t\x12\x13\n\x0b\x65xternal_ip\x18\x03 \x01(\t\x12\x18\n\x10\x61uthenticated_as\x18\x04 \x01(\t\x12\x31\n\rfirst_seen_ts\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07is_dead\x18\x06 \x01(\x08\x12\x30\n\x0clast_seen_ts\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0bquarantined\x18\x08 \x01(\x08\x12\x17\n\x0fmaintenance_msg\x18\t \x01(\t\x12/\n\ndimensions\x18\n \x03(\x0b\x32\x1b.swarming.v2.StringListPair\x12\x11\n\ttask_name\x18\x0b \x01(\t\x12\x0f\n\x07version\x18\x0c \x01(\t\x12\r\n\x05state\x18\r \x01(\t\x12\x0f\n\x07\x64\x65leted\x18\x0e \x01(\x08\x12\x12\n\nsession_id\x18\x0f \x01(\t\x12\x1b\n\x13termination_task_id\x18\x10 \x01(\t\"\x8a\x01\n\x13\x42otInfoListResponse\x12\x0e\n\x06\x63ursor\x18\x01 \x01(\t\x12#\n\x05items\x18\x02 \x03(\x0b\x32\x14.swarming.v2.BotInfo\x12\'\n\x03now\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x15\n\rdeath_timeout\x18\x04 \x01(\x05\"\x89\x01\n\tBotsCount\x12\'\n\x03now\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12\x13\n\x0bquarantined\x18\x03 \x01(\x05\x12\x13\n\x0bmaintenance\x18\x04 \x01(\x05\x12\x0c\n\x04\x64\x65\x61\x64\x18\x05 \x01(\x05\x12\x0c\n\x04\x62usy\x18\x06 \x01(\x05\"n\n\x0e\x42otsDimensions\x12\x34\n\x0f\x62ots_dimensions\x18\x01 \x03(\x0b\x32\x1b.swarming.v2.StringListPair\x12&\n\x02ts\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xb2\x02\n\x10\x42otEventResponse\x12&\n\x02ts\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nevent_type\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12/\n\ndimensions\x18\x04 \x03(\x0b\x32\x1b.swarming.v2.StringListPair\x12\r\n\x05state\x18\x05 \x01(\t\x12\x13\n\x0b\x65xternal_ip\x18\x06 \x01(\t\x12\x18\n\x10\x61uthenticated_as\x18\x07 \x01(\t\x12\x0f\n\x07version\x18\x08 \x01(\t\x12\x13\n\x0bquarantined\x18\t \x01(\x08\x12\x17\n\x0fmaintenance_msg\x18\n \x01(\t\x12\x0f\n\x07task_id\x18\x0b \x01(\t\x12\x12\n\nsession_id\x18\x0c \x01(\t\"z\n\x11\x42otEventsResponse\x12\x0e\n\x06\x63ursor\x18\x01 \x01(\t\x12,\n\x05items\x18\x02 \x03(\x0b\x32\x1d.swarming.v2.BotEventResponse\x12\'\n\x03now\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"!\n\x0e\x44\x65leteResponse\x12\x0f\n\x07\x64\x65leted\x18\x01 \x01(\x08\"$\n\x11TerminateResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"\x1c\n\nBotRequest\x12\x0e\n\x06\x62ot_id\x18\x01 \x01(\t\"2\n\x10TerminateRequest\x12\x0e\n\x06\x62ot_id\x18\x01 \x01(\t\x12\x0e\n\x06reason\x18\x02 \x01(\t\"\x95\x01\n\x10\x42otEventsRequest\x12\x0e\n\x06\x62ot_id\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x03 \x01(\t\x12)\n\x05start\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x03\x65nd\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x85\x02\n\x0f\x42otTasksRequest\x12\x0e\n\x06\x62ot_id\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x03 \x01(\t\x12)\n\x05start\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x03\x65nd\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12&\n\x05state\x18\x06 \x01(\x0e\x32\x17.swarming.v2.StateQuery\x12$\n\x04sort\x18\x07 \x01(\x0e\x32\x16.swarming.v2.SortQuery\x12!\n\x19include_performance_stats\x18\x08 \x01(\x08\"\x94\x02\n\x0b\x42otsRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\x12+\n\ndimensions\x18\x03 \x03(\x0b\x32\x17.swarming.v2.StringPair\x12.\n\x0bquarantined\x18\x04 \x01(\x0e\x32\x19.swarming.v2.NullableBool\x12\x31\n\x0ein_maintenance\x18\x05 \x01(\x0e\x32\x19.swarming.v2.NullableBool\x12*\n\x07is_dead\x18\x06 \x01(\x0e\x32\x19.swarming.v2.NullableBool\x12*\n\x07is_busy\x18\x07 \x01(\x0e\x32\x19.swarming.v2.NullableBool\"?\n\x10\x42otsCountRequest\x12+\n\ndimensions\x18\x01 \x03(\x0b\x32\x17.swarming.v2.StringPair\"%\n\x15\x42otsDimensionsRequest\x12\x0c\n\x04pool\x18\x01 \x01(\t\"C\n\x12PermissionsRequest\x12\x0e\n\x06\x62ot_id\x18\x01 \x01(\t\x12\x0f\n\x07task_id\x18\x02 \x01(\t\x12\x0c\n\x04tags\x18\x03 \x03(\t\"$\n\x11TaskStatesRequest\x12\x0f\n\x07task_id\x18\x01 \x03(\t\"\x88\x02\n\x14TasksWithPerfRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\x12)\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12&\n\x05state\x18\x05 \x01(\x0e\x32\x17.swarming.v2.StateQuery\x12$\n\x04sort\x18\x06 \x01(\x0e\x32\x16.swarming.v2.SortQuery\x12\x0c\n\x04tags\x18\x07 \x03(\t\x12!\n\x19include_performance_stats\x18\x08 \x01(\x08\"\xdd\x01\n\x0cTasksRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\x12)\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12&\n\x05state\x18\x05 \x01(\x0e\x32\x17.swarming.v2.StateQuery\x12$\n\x04sort\x18\x06 \x01(\x0e\x32\x16.swarming.v2.SortQuery\x12\x0c\n\x04tags\x18\x07 \x03(\t\"\x9d\x01\n\x11TasksCountRequest\x12)\n\x05start\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x03\x65nd\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12&\n\x05state\x18\x03 \x01(\x0e\x32\x17.swarming.v2.StateQuery\x12\x0c\n\x04tags\x18\x04 \x03(\t\" \n\rTaskIdRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"J\n\x17TaskIdWithOffsetRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0e\n\x06length\x18\x03 \x01(\x03\"K\n\x15TaskIdWithPerfRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12!\n\x19include_performance_stats\x18\x02 \x01(\x08\"L\n\x15\x42\x61tchGetResultRequest\x12\x10\n\x08task_ids\x18\x01 \x03(\t\x12!\n\x19include_performance_stats\x18\x02 \x01(\x08\"\xe2\x01\n\x16\x42\x61tchGetResultResponse\x12\x42\n\x07results\x18\x01 \x03(\x0b\x32\x31.swarming.v2.BatchGetResultResponse.ResultOrError\x1a\x83\x01\n\rResultOrError\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x31\n\x06result\x18\x02 \x01(\x0b\x32\x1f.swarming.v2.TaskResultResponseH\x00\x12#\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07outcome*\xcf\x02\n\nStateQuery\x12\x11\n\rQUERY_PENDING\x10\x00\x12\x11\n\rQUERY_RUNNING\x10\x01\x12\x19\n\x15QUERY_PENDING_RUNNING\x10\x02\x12\x13\n\x0fQUERY_COMPLETED\x10\x03\x12\x1b\n\x17QUERY_COMPLETED_SUCCESS\x10\x04\x12\x1b\n\x17QUERY_COMPLETED_FAILURE\x10\x05\x12\x11\n\rQUERY_EXPIRED\x10\x06\x12\x13\n\x0fQUERY_TIMED_OUT\x10\x07\x12\x12\n\x0eQUERY_BOT_DIED\x10\x08\x12\x12\n\x0eQUERY_CANCELED\x10\t\x12\r\n\tQUERY_ALL\x10\n\x12\x11\n\rQUERY_DEDUPED\x10\x0b\x12\x10\n\x0cQUERY_KILLED\x10\x0c\x12\x15\n\x11QUERY_NO_RESOURCE\x10\r\x12\x16\n\x12QUERY_CLIENT_ERROR\x10\x0e*m\n\tSortQuery\x12\x14\n\x10QUERY_CREATED_TS\x10\x00\x12\x16\n\x12QUERY_COMPLETED_TS\x10\x02\x12\x16\n\x12QUERY_ABANDONED_TS\x10\x03\x12\x14\n\x10QUERY_STARTED_TS\x10\x04\"\x04\x08\x01\x10\x01*-\n\x0cNullableBool\x12\x08\n\x04NULL\x10\x00\x12\t\n\x05\x46\x41LSE\x10\x01\x12\x08\n\x04TRUE\x10\x02*\xab\x01\n\tTaskState\x12\x0b\n\x07INVALID\x10\x00\x12\x0b\n\x07RUNNING\x10\x10\x12\x0b\n\x07PENDING\x10 \x12\x0b\n\x07\x45XPIRED\x10\x30\x12\r\n\tTIMED_OUT\x10@\x12\x0c\n\x08\x42OT_DIED\x10P\x12\x0c\n\x08\x43\x41NCELED\x10`\x12\r\n\tCOMPLETED\x10p\x12\x0b\n\x06KILLED\x10\x80\x01\x12\x10\n\x0bNO_RESOURCE\x10\x80\x02\x12\x11\n\x0c\x43LIENT_ERROR\x10\x80\x04\x32\xcf\x04\n\x04\x42ots\x12\x37\n\x06GetBot\x12\x17.swarming.v2.BotRequest\x1a\x14.swarming.v2.BotInfo\x12\x41\n\tDeleteBot\x12\x17.swarming.v2.BotRequest\x1a\x1b.swarming.v2.DeleteResponse\x12N\n\rListBotEvents\x12\x1d.swarming.v2.BotEventsRequest\x1a\x1e.swarming.v2.BotEventsResponse\x12M\n\x0cTerminateBot\x12\x1d.swarming.v2.TerminateRequest\x1a\x1e.swarming.v2.TerminateResponse\x12K\n\x0cListBotTasks\x12\x1c.swarming.v2.BotTasksRequest\x1a\x1d.swarming.v2.TaskListResponse\x12\x46\n\x08ListBots\x12\x18.swarming.v2.BotsRequest\x1a .swarming.v2.BotInfoListResponse\x12\x42\n\tCountBots\x12\x1d.swarming.v2.BotsCountRequest\x1a\x16.swarming.v2.BotsCount\x12S\n\x10GetBotDimensions\x12\".swarming.v2.BotsDimensionsRequest\x1a\x1b.swarming.v2.BotsDimensions2\xf6\x06\n\x05Tasks\x12P\n\tGetResult\x12\".swarming.v2.TaskIdWithPerfRequest\x1a\x1f.swarming.v2.TaskResultResponse\x12Y\n\x0e\x42\x61tchGetResult\x12\".swarming.v2.BatchGetResultRequest\x1a#.swarming.v2.BatchGetResultResponse\x12J\n\nGetRequest\x12\x1a.swarming.v2.TaskIdRequest\x1a .swarming.v2.TaskRequestResponse\x12I\n\nCancelTask\x12\x1e.swarming.v2.TaskCancelRequest\x1a\x1b.swarming.v2.CancelResponse\x12R\n\tGetStdout\x12$.swarming.v2.TaskIdWithOffsetRequest\x1a\x1f.swarming.v2.TaskOutputResponse\x12P\n\x07NewTask\x12\x1b.swarming.v2.NewTaskRequest\x1a(.swarming.v2.TaskRequestMetadataResponse\x12M\n\tListTasks\x12!.swarming.v2.TasksWithPerfRequest\x1a\x1d.swarming.v2.TaskListResponse\x12I\n\x0eListTaskStates\x12\x1e.swarming.v2.TaskStatesRequest\x1a\x17.swarming.v2.TaskStates\x12P\n\x10ListTaskRequests\x12\x19.swarming.v2.TasksRequest\x1a!.swarming.v2.TaskRequestsResponse\x12P\n\x0b\x43\x61ncelTasks\x12\x1f.swarming.v2.TasksCancelRequest\x1a .swarming.v2.TasksCancelResponse\x12\x45\n\nCountTasks\x12\x1e.swarming.v2.TasksCountRequest\x1a\x17.swarming.v2.TasksCount2\xe0\x01\n\x08Swarming\x12@\n\nGetDetails\x12\x16.google.protobuf.Empty\x1a\x1a.swarming.v2.ServerDetails\x12?\n\x08GetToken\x12\x16.google.protobuf.Empty\x1a\x1b.swarming.v2.BootstrapToken\x12Q\n\x0eGetPermissions\x12\x1f.swarming.v2.PermissionsRequest\x1a\x1e.swarming.v2.ClientPermissionsB2Z0go.chromium.org/luci/swarming/proto/api_v2;apipbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'go.chromium.org.luci.swarming.proto.api_v2.swarming_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z0go.chromium.org/luci/swarming/proto/api_v2;apipb'
+  _globals['_SERVERDETAILS'].fields_by_name['machine_provider_template']._loaded_options = None
+  _globals['_SERVERDETAILS'].fields_by_name['machine_provider_template']._serialized_options = b'\030\001'
+  _globals['_SERVERDETAILS'].fields_by_name['luci_config']._loaded_options = None
+  _globals['_SERVERDETAILS'].fields_by_name['luci_config']._serialized_options = b'\030\001'
+  _globals['_CLIENTPERMISSIONS'].fields_by_name['get_configs']._loaded_options = None
+  _globals['_CLIENTPERMISSIONS'].fields_by_name['get_configs']._serialized_options = b'\030\001'
+  _globals['_CLIENTPERMISSIONS'].fields_by_name['put_configs']._loaded_options = None
+  _globals['_CLIENTPERMISSIONS'].fields_by_name['put_configs']._serialized_options = b'\030\001'
+  _globals['_STATEQUERY']._serialized_start=9831
+  _globals['_STATEQUERY']._serialized_end=10166
+  _globals['_SORTQUERY']._serialized_start=10168
+  _globals['_SORTQUERY']._serialized_end=10277
+  _globals['_NULLABLEBOOL']._serialized_start=10279
+  _globals['_NULLABLEBOOL']._serialized_end=10324
+  _globals['_TASKSTATE']._serialized_start=10327
+  _globals['_TASKSTATE']._serialized_end=10498
+  _globals['_STRINGPAIR']._serialized_start=161
+  _globals['_STRINGPAIR']._serialized_end=201
+  _globals['_STRINGLISTPAIR']._serialized_start=203
+  _globals['_STRINGLISTPAIR']._serialized_end=247
+  _globals['_SERVERDETAILS']._serialized_start=250
+  _globals['_SERVERDETAILS']._serialized_end=438
+  _globals['_BOOTSTRAPTOKEN']._serialized_start=440
+  _globals['_BOOTSTRAPTOKEN']._serialized_end=481
+  _globals['_CLIENTPERMISSIONS']._serialized_start=484
+  _globals['_CLIENTPERMISSIONS']._serialized_end=728
+  _globals['_DIGEST']._serialized_start=730
+  _globals['_DIGEST']._serialized_end=772
+  _globals['_CASREFERENCE']._serialized_start=774
+  _globals['_CASREFERENCE']._serialized_end=847
+  _globals['_CIPDPACKAGE']._serialized_start=849
+  _globals['_CIPDPACKAGE']._serialized_end=915
+  _globals['_CIPDINPUT']._serialized_start=917
+  _globals['_CIPDINPUT']._serialized_end=1038
+  _globals['_CIPDPINS']._serialized_start=1040
+  _globals['_CIPDPINS']._serialized_end=1144
+  _globals['_CACHEENTRY']._serialized_start=1146
+  _globals['_CACHEENTRY']._serialized_end=1186
+  _globals['_CONTAINMENT']._serialized_start=1189
+  _globals['_CONTAINMENT']._serialized_end=1431
+  _globals['_CONTAINMENT_CONTAINMENTTYPE']._serialized_start=1359
+  _globals['_CONTAINMENT_CONTAINMENTTYPE']._serialized_end=1431
+  _globals['_TASKPROPERTIES']._serialized_start=1434
+  _globals['_TASKPROPERTIES']._serialized_end=1949
+  _globals['_TASKSLICE']._serialized_start=1951
+  _globals['_TASKSLICE']._serialized_end=2063
+  _globals['_SWARMINGTASKBACKENDCONFIG']._serialized_start=2066
+  _globals['_SWARMINGTASKBACKENDCONFIG']._serialized_end=2380
+  _globals['_RESULTDBCFG']._serialized_start=2382
+  _globals['_RESULTDBCFG']._serialized_end=2411
+  _globals['_NEWTASKREQUEST']._serialized_start=2414
+  _globals['_NEWTASKREQUEST']._serialized_end=3030
+  _globals['_NEWTASKREQUEST_POOLTASKTEMPLATEFIELD']._serialized_start=2950
+  _globals['_NEWTASKREQUEST_POOLTASKTEMPLATEFIELD']._serialized_end=3030
+  _globals['_TASKREQUESTRESPONSE']._serialized_start=3033
+  _globals['_TASKREQUESTRESPONSE']._serialized_end=3531
+  _globals['_TASKCANCELREQUEST']._serialized_start=3533
+  _globals['_TASKCANCELREQUEST']._serialized_end=3591
+  _globals['_TASKSCANCELREQUEST']._serialized_start=3594
+  _globals['_TASKSCANCELREQUEST']._serialized_end=3765
+  _globals['_OPERATIONSTATS']._serialized_start=3767
+  _globals['_OPERATIONSTATS']._serialized_end=3801
+  _globals['_CASOPERATIONSTATS']._serialized_start=3804
+  _globals['_CASOPERATIONSTATS']._serialized_end=4042
+  _globals['_PERFORMANCESTATS']._serialized_start=4045
+  _globals['_PERFORMANCESTATS']._serialized_end=4475
+  _globals['_CANCELRESPONSE']._serialized_start=4477
+  _globals['_CANCELRESPONSE']._serialized_end=4532
+  _globals['_TASKSCANCELRESPONSE']._serialized_start=4534
+  _globals['_TASKSCANCELRESPONSE']._serialized_end=4629
+  _globals['_TASKOUTPUTRESPONSE']._serialized_start=4631
+  _globals['_TASKOUTPUTRESPONSE']._serialized_end=4706
+  _globals['_RESULTDBINFO']._serialized_start=4708
+  _globals['_RESULTDBINFO']._serialized_end=4760
+  _globals['_TASKRESULTRESPONSE']._serialized_start=4763
+  _globals['_TASKRESULTRESPONSE']._serialized_end=5840
+  _globals['_TASKSTATES']._serialized_start=5842
+  _globals['_TASKSTATES']._serialized_end=5894
+  _globals['_TASKLISTRESPONSE']._serialized_start=5896
+  _globals['_TASKLISTRESPONSE']._serialized_end=6019
+  _globals['_TASKREQUESTSRESPONSE']._serialized_start=6022
+  _globals['_TASKREQUESTSRESPONSE']._serialized_end=6150
+  _globals['_TASKSCOUNT']._serialized_start=6152
+  _globals['_TASKSCOUNT']._serialized_end=6220
+  _globals['_TASKREQUESTMETADATARESPONSE']._serialized_start=6223
+  _globals['_TASKREQUESTMETADATARESPONSE']._serialized_end=6374
+  _globals['_BOTINFO']._serialized_start=6377
+  _globals['_BOTINFO']._serialized_end=6796
+  _globals['_BOTINFOLISTRESPONSE']._serialized_start=6799
+  _globals['_BOTINFOLISTRESPONSE']._serialized_end=6937
+  _globals['_BOTSCOUNT']._serialized_start=6940
+  _globals['_BOTSCOUNT']._serialized_end=7077
+  _globals['_BOTSDIMENSIONS']._serialized_start=7079
+  _globals['_BOTSDIMENSIONS']._serialized_end=7189
+  _globals['_BOTEVENTRESPONSE']._serialized_start=7192
+  _globals['_BOTEVENTRESPONSE']._serialized_end=7498
+  _globals['_BOTEVENTSRESPONSE']._serialized_start=7500
+  _globals['_BOTEVENTSRESPONSE']._serialized_end=7622
+  _globals['_DELETERESPONSE']._serialized_start=7624
+  _globals['_DELETERESPONSE']._serialized_end=7657
+  _globals['_TERMINATERESPONSE']._serialized_start=7659
+  _globals['_TERMINATERESPONSE']._serialized_end=7695
+  _globals['_BOTREQUEST']._serialized_start=7697
+  _globals['_BOTREQUEST']._serialized_end=7725
+  _globals['_TERMINATEREQUEST']._serialized_start=7727
+  _globals['_TERMINATEREQUEST']._serialized_end=7777
+  _globals['_BOTEVENTSREQUEST']._serialized_start=7780
+  _globals['_BOTEVENTSREQUEST']._serialized_end=7929
+  _globals['_BOTTASKSREQUEST']._serialized_start=7932
+  _globals['_BOTTASKSREQUEST']._serialized_end=8193
+  _globals['_BOTSREQUEST']._serialized_start=8196
+  _globals['_BOTSREQUEST']._serialized_end=8472
+  _globals['_BOTSCOUNTREQUEST']._serialized_start=8474
+  _globals['_BOTSCOUNTREQUEST']._serialized_end=8537
+  _globals['_BOTSDIMENSIONSREQUEST']._serialized_start=8539
+  _globals['_BOTSDIMENSIONSREQUEST']._serialized_end=8576
+  _globals['_PERMISSIONSREQUEST']._serialized_start=8578
+  _globals['_PERMISSIONSREQUEST']._serialized_end=8645
+  _globals['_TASKSTATESREQUEST']._serialized_start=8647
+  _globals['_TASKSTATESREQUEST']._serialized_end=8683
+  _globals['_TASKSWITHPERFREQUEST']._serialized_start=8686
+  _globals['_TASKSWITHPERFREQUEST']._serialized_end=8950
+  _globals['_TASKSREQUEST']._serialized_start=8953
+  _globals['_TASKSREQUEST']._serialized_end=9174
+  _globals['_TASKSCOUNTREQUEST']._serialized_start=9177
+  _globals['_TASKSCOUNTREQUEST']._serialized_end=9334
+  _globals['_TASKIDREQUEST']._serialized_start=9336
+  _globals['_TASKIDREQUEST']._serialized_end=9368
+  _globals['_TASKIDWITHOFFSETREQUEST']._serialized_start=9370
+  _globals['_TASKIDWITHOFFSETREQUEST']._serialized_end=9444
+  _globals['_TASKIDWITHPERFREQUEST']._serialized_start=9446
+  _globals['_TASKIDWITHPERFREQUEST']._serialized_end=9521
+  _globals['_BATCHGETRESULTREQUEST']._serialized_start=9523
+  _globals['_BATCHGETRESULTREQUEST']._serialized_end=9599
+  _globals['_BATCHGETRESULTRESPONSE']._serialized_start=9602
+  _globals['_BATCHGETRESULTRESPONSE']._serialized_end=9828
+  _globals['_BATCHGETRESULTRESPONSE_RESULTORERROR']._serialized_start=9697
+  _globals['_BATCHGETRESULTRESPONSE_RESULTORERROR']._serialized_end=9828
+  _globals['_BOTS']._serialized_start=10501
+  _globals['_BOTS']._serialized_end=11092
+  _globals['_TASKS']._serialized_start=11095
+  _globals['_TASKS']._serialized_end=11981
+  _globals['_SWARMING']._serialized_start=11984
+  _globals['_SWARMING']._serialized_end=12208
+# @@protoc_insertion_point(module_scope)
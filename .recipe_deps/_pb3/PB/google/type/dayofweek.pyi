@@ -0,0 +1,24 @@
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from typing import ClassVar as _ClassVar
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class DayOfWeek(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    DAY_OF_WEEK_UNSPECIFIED: _ClassVar[DayOfWeek]
+    MONDAY: _ClassVar[DayOfWeek]
+    TUESDAY: _ClassVar[DayOfWeek]
+    WEDNESDAY: _ClassVar[DayOfWeek]
+    THURSDAY: _ClassVar[DayOfWeek]
+    FRIDAY: _ClassVar[DayOfWeek]
+    SATURDAY: _ClassVar[DayOfWeek]
+    SUNDAY: _ClassVar[DayOfWeek]
+DAY_OF_WEEK_UNSPECIFIED: DayOfWeek
+MONDAY: DayOfWeek
+TUESDAY: DayOfWeek
+WEDNESDAY: DayOfWeek
+THURSDAY: DayOfWeek
+FRIDAY: DayOfWeek
+SATURDAY: DayOfWeek
+SUNDAY: DayOfWeek
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/analyze.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/analyze.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1brecipe_engine/analyze.proto\x12\rrecipe_engine\"\'\n\x05Input\x12\r\n\x05\x66iles\x18\x01 \x03(\t\x12\x0f\n\x07recipes\x18\x02 \x03(\t\"A\n\x06Output\x12\x0f\n\x07recipes\x18\x01 \x03(\t\x12\x17\n\x0finvalid_recipes\x18\x02 \x03(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\tb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.analyze_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUT']._serialized_start=46
+  _globals['_INPUT']._serialized_end=85
+  _globals['_OUTPUT']._serialized_start=87
+  _globals['_OUTPUT']._serialized_end=152
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,25 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Input(_message.Message):
+    __slots__ = ("files", "recipes")
+    FILES_FIELD_NUMBER: _ClassVar[int]
+    RECIPES_FIELD_NUMBER: _ClassVar[int]
+    files: _containers.RepeatedScalarFieldContainer[str]
+    recipes: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, files: _Optional[_Iterable[str]] = ..., recipes: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class Output(_message.Message):
+    __slots__ = ("recipes", "invalid_recipes", "error")
+    RECIPES_FIELD_NUMBER: _ClassVar[int]
+    INVALID_RECIPES_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    recipes: _containers.RepeatedScalarFieldContainer[str]
+    invalid_recipes: _containers.RepeatedScalarFieldContainer[str]
+    error: str
+    def __init__(self, recipes: _Optional[_Iterable[str]] = ..., invalid_recipes: _Optional[_Iterable[str]] = ..., error: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/doc.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/doc.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.recipe_engine import recipes_cfg as recipe__engine_dot_recipes__cfg__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17recipe_engine/doc.proto\x12\rrecipe_engine\x1a\x1frecipe_engine/recipes_cfg.proto\"\xca\x1e\n\x03\x44oc\x1a\xa6\x01\n\x05Known\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\'\n\x04\x66unc\x18\x02 \x01(\x0b\x32\x17.recipe_engine.Doc.FuncH\x00\x12)\n\x05klass\x18\x03 \x01(\x0b\x32\x18.recipe_engine.Doc.ClassH\x00\x1a\x34\n\x06Object\x12\x11\n\x07generic\x18\x01 \x01(\tH\x00\x12\x0f\n\x05known\x18\x02 \x01(\tH\x00\x42\x06\n\x04kindB\x06\n\x04kind\x1a\xc8\x08\n\x06Schema\x12\x32\n\x06struct\x18\x01 \x01(\x0b\x32 .recipe_engine.Doc.Schema.StructH\x00\x12\x36\n\x08sequence\x18\x02 \x01(\x0b\x32\".recipe_engine.Doc.Schema.SequenceH\x00\x12.\n\x04list\x18\x03 \x01(\x0b\x32\x1e.recipe_engine.Doc.Schema.ListH\x00\x12,\n\x03set\x18\x04 \x01(\x0b\x32\x1d.recipe_engine.Doc.Schema.SetH\x00\x12.\n\x04\x64ict\x18\x05 \x01(\x0b\x32\x1e.recipe_engine.Doc.Schema.DictH\x00\x12\x32\n\x06single\x18\x06 \x01(\x0b\x32 .recipe_engine.Doc.Schema.SingleH\x00\x12\x32\n\x06static\x18\x07 \x01(\x0b\x32 .recipe_engine.Doc.Schema.StaticH\x00\x12.\n\x04\x65num\x18\x08 \x01(\x0b\x32\x1e.recipe_engine.Doc.Schema.EnumH\x00\x1a\x94\x01\n\x06Struct\x12?\n\x08type_map\x18\x01 \x03(\x0b\x32-.recipe_engine.Doc.Schema.Struct.TypeMapEntry\x1aI\n\x0cTypeMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.recipe_engine.Doc.Schema:\x02\x38\x01\x1a\x39\n\x08Sequence\x12-\n\ninner_type\x18\x01 \x01(\x0b\x32\x19.recipe_engine.Doc.Schema\x1a@\n\x04List\x12\x38\n\ninner_type\x18\x01 \x03(\x0e\x32$.recipe_engine.Doc.Schema.SimpleType\x1a?\n\x03Set\x12\x38\n\ninner_type\x18\x01 \x03(\x0e\x32$.recipe_engine.Doc.Schema.SimpleType\x1a@\n\x04\x44ict\x12\x38\n\nvalue_type\x18\x01 \x03(\x0e\x32$.recipe_engine.Doc.Schema.SimpleType\x1aj\n\x06Single\x12\x38\n\ninner_type\x18\x01 \x03(\x0e\x32$.recipe_engine.Doc.Schema.SimpleType\x12\x10\n\x08required\x18\x02 \x01(\x08\x12\x14\n\x0c\x64\x65\x66\x61ult_json\x18\x03 \x01(\t\x1a\x1e\n\x06Static\x12\x14\n\x0c\x64\x65\x66\x61ult_json\x18\x01 \x01(\t\x1a-\n\x04\x45num\x12\x13\n\x0bvalues_json\x18\x01 \x03(\t\x12\x10\n\x08required\x18\x02 \x01(\x08\"R\n\nSimpleType\x12\n\n\x06STRING\x10\x00\x12\n\n\x06NUMBER\x10\x01\x12\x0b\n\x07\x42OOLEAN\x10\x02\x12\n\n\x06OBJECT\x10\x03\x12\t\n\x05\x41RRAY\x10\x04\x12\x08\n\x04NULL\x10\x05\x42\x06\n\x04kind\x1a\x90\x01\n\x04\x44\x65ps\x12\x0f\n\x07relpath\x18\x01 \x01(\t\x12\x0e\n\x06lineno\x18\x02 \x01(\x05\x12\x38\n\x0cmodule_links\x18\x03 \x03(\x0b\x32\".recipe_engine.Doc.Deps.ModuleLink\x1a-\n\nModuleLink\x12\x11\n\trepo_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x1a]\n\tParameter\x12\x11\n\tdocstring\x18\x01 \x01(\t\x12\'\n\x04kind\x18\x02 \x01(\x0b\x32\x19.recipe_engine.Doc.Schema\x12\x14\n\x0c\x64\x65\x66\x61ult_json\x18\x03 \x01(\t\x1a\xc1\x01\n\nParameters\x12\x0f\n\x07relpath\x18\x01 \x01(\t\x12\x0e\n\x06lineno\x18\x02 \x01(\x05\x12\x41\n\nparameters\x18\x03 \x03(\x0b\x32-.recipe_engine.Doc.Parameters.ParametersEntry\x1aO\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.recipe_engine.Doc.Parameter:\x02\x38\x01\x1a\xf6\x02\n\x05\x43lass\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07relpath\x18\x02 \x01(\t\x12\x0e\n\x06lineno\x18\x03 \x01(\x05\x12\x11\n\tdocstring\x18\x04 \x01(\t\x12.\n\x05\x62\x61ses\x18\x05 \x03(\x0b\x32\x1f.recipe_engine.Doc.Known.Object\x12\x36\n\x07\x63lasses\x18\x06 \x03(\x0b\x32%.recipe_engine.Doc.Class.ClassesEntry\x12\x32\n\x05\x66uncs\x18\x07 \x03(\x0b\x32#.recipe_engine.Doc.Class.FuncsEntry\x1aH\n\x0c\x43lassesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\'\n\x05value\x18\x02 \x01(\x0b\x32\x18.recipe_engine.Doc.Class:\x02\x38\x01\x1a\x45\n\nFuncsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.recipe_engine.Doc.Func:\x02\x38\x01\x1a\x90\x01\n\x04\x46unc\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07relpath\x18\x02 \x01(\t\x12\x0e\n\x06lineno\x18\x03 \x01(\x05\x12\x11\n\tdocstring\x18\x04 \x01(\t\x12\x33\n\ndecorators\x18\x05 \x03(\x0b\x32\x1f.recipe_engine.Doc.Known.Object\x12\x11\n\tsignature\x18\x06 \x01(\t\x1a\xe6\x03\n\x06Module\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07relpath\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12%\n\x04\x64\x65ps\x18\x04 \x01(\x0b\x32\x17.recipe_engine.Doc.Deps\x12\x31\n\nparameters\x18\x05 \x01(\x0b\x32\x1d.recipe_engine.Doc.Parameters\x12+\n\tapi_class\x18\x06 \x01(\x0b\x32\x18.recipe_engine.Doc.Class\x12\x37\n\x07\x63lasses\x18\x07 \x03(\x0b\x32&.recipe_engine.Doc.Module.ClassesEntry\x12\x33\n\x05\x66uncs\x18\x08 \x03(\x0b\x32$.recipe_engine.Doc.Module.FuncsEntry\x12$\n\x1cpython_version_compatibility\x18\t \x01(\t\x1aH\n\x0c\x43lassesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\'\n\x05value\x18\x02 \x01(\x0b\x32\x18.recipe_engine.Doc.Class:\x02\x38\x01\x1a\x45\n\nFuncsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.recipe_engine.Doc.Func:\x02\x38\x01\x1a\xd2\x04\n\x06Recipe\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07relpath\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12%\n\x04\x64\x65ps\x18\x04 \x01(\x0b\x32\x17.recipe_engine.Doc.Deps\x12\x31\n\nparameters\x18\x05 \x01(\x0b\x32\x1d.recipe_engine.Doc.Parameters\x12\x37\n\x07\x63lasses\x18\x07 \x03(\x0b\x32&.recipe_engine.Doc.Recipe.ClassesEntry\x12\x33\n\x05\x66uncs\x18\x08 \x03(\x0b\x32$.recipe_engine.Doc.Recipe.FuncsEntry\x12\x42\n\rknown_objects\x18\t \x03(\x0b\x32+.recipe_engine.Doc.Recipe.KnownObjectsEntry\x12$\n\x1cpython_version_compatibility\x18\n \x01(\t\x1aH\n\x0c\x43lassesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\'\n\x05value\x18\x02 \x01(\x0b\x32\x18.recipe_engine.Doc.Class:\x02\x38\x01\x1a\x45\n\nFuncsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.recipe_engine.Doc.Func:\x02\x38\x01\x1aM\n\x11KnownObjectsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\'\n\x05value\x18\x02 \x01(\x0b\x32\x18.recipe_engine.Doc.Known:\x02\x38\x01J\x04\x08\x06\x10\x07\x1a\xce\x04\n\x04Repo\x12\x11\n\trepo_name\x18\x01 \x01(\t\x12\x31\n\x05specs\x18\x02 \x03(\x0b\x32\".recipe_engine.Doc.Repo.SpecsEntry\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12\x42\n\x0erecipe_modules\x18\x04 \x03(\x0b\x32*.recipe_engine.Doc.Repo.RecipeModulesEntry\x12\x35\n\x07recipes\x18\x05 \x03(\x0b\x32$.recipe_engine.Doc.Repo.RecipesEntry\x12@\n\rknown_objects\x18\x06 \x03(\x0b\x32).recipe_engine.Doc.Repo.KnownObjectsEntry\x1a\x45\n\nSpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.recipe_engine.RepoSpec:\x02\x38\x01\x1aO\n\x12RecipeModulesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.recipe_engine.Doc.Module:\x02\x38\x01\x1aI\n\x0cRecipesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12(\n\x05value\x18\x02 \x01(\x0b\x32\x19.recipe_engine.Doc.Recipe:\x02\x38\x01\x1aM\n\x11KnownObjectsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\'\n\x05value\x18\x02 \x01(\x0b\x32\x18.recipe_engine.Doc.Known:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.doc_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_DOC_SCHEMA_STRUCT_TYPEMAPENTRY']._loaded_options = None
+  _globals['_DOC_SCHEMA_STRUCT_TYPEMAPENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_PARAMETERS_PARAMETERSENTRY']._loaded_options = None
+  _globals['_DOC_PARAMETERS_PARAMETERSENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_CLASS_CLASSESENTRY']._loaded_options = None
+  _globals['_DOC_CLASS_CLASSESENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_CLASS_FUNCSENTRY']._loaded_options = None
+  _globals['_DOC_CLASS_FUNCSENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_MODULE_CLASSESENTRY']._loaded_options = None
+  _globals['_DOC_MODULE_CLASSESENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_MODULE_FUNCSENTRY']._loaded_options = None
+  _globals['_DOC_MODULE_FUNCSENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_RECIPE_CLASSESENTRY']._loaded_options = None
+  _globals['_DOC_RECIPE_CLASSESENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_RECIPE_FUNCSENTRY']._loaded_options = None
+  _globals['_DOC_RECIPE_FUNCSENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_RECIPE_KNOWNOBJECTSENTRY']._loaded_options = None
+  _globals['_DOC_RECIPE_KNOWNOBJECTSENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_REPO_SPECSENTRY']._loaded_options = None
+  _globals['_DOC_REPO_SPECSENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_REPO_RECIPEMODULESENTRY']._loaded_options = None
+  _globals['_DOC_REPO_RECIPEMODULESENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_REPO_RECIPESENTRY']._loaded_options = None
+  _globals['_DOC_REPO_RECIPESENTRY']._serialized_options = b'8\001'
+  _globals['_DOC_REPO_KNOWNOBJECTSENTRY']._loaded_options = None
+  _globals['_DOC_REPO_KNOWNOBJECTSENTRY']._serialized_options = b'8\001'
+  _globals['_DOC']._serialized_start=76
+  _globals['_DOC']._serialized_end=3990
+  _globals['_DOC_KNOWN']._serialized_start=84
+  _globals['_DOC_KNOWN']._serialized_end=250
+  _globals['_DOC_KNOWN_OBJECT']._serialized_start=190
+  _globals['_DOC_KNOWN_OBJECT']._serialized_end=242
+  _globals['_DOC_SCHEMA']._serialized_start=253
+  _globals['_DOC_SCHEMA']._serialized_end=1349
+  _globals['_DOC_SCHEMA_STRUCT']._serialized_start=666
+  _globals['_DOC_SCHEMA_STRUCT']._serialized_end=814
+  _globals['_DOC_SCHEMA_STRUCT_TYPEMAPENTRY']._serialized_start=741
+  _globals['_DOC_SCHEMA_STRUCT_TYPEMAPENTRY']._serialized_end=814
+  _globals['_DOC_SCHEMA_SEQUENCE']._serialized_start=816
+  _globals['_DOC_SCHEMA_SEQUENCE']._serialized_end=873
+  _globals['_DOC_SCHEMA_LIST']._serialized_start=875
+  _globals['_DOC_SCHEMA_LIST']._serialized_end=939
+  _globals['_DOC_SCHEMA_SET']._serialized_start=941
+  _globals['_DOC_SCHEMA_SET']._serialized_end=1004
+  _globals['_DOC_SCHEMA_DICT']._serialized_start=1006
+  _globals['_DOC_SCHEMA_DICT']._serialized_end=1070
+  _globals['_DOC_SCHEMA_SINGLE']._serialized_start=1072
+  _globals['_DOC_SCHEMA_SINGLE']._serialized_end=1178
+  _globals['_DOC_SCHEMA_STATIC']._serialized_start=1180
+  _globals['_DOC_SCHEMA_STATIC']._serialized_end=1210
+  _globals['_DOC_SCHEMA_ENUM']._serialized_start=1212
+  _globals['_DOC_SCHEMA_ENUM']._serialized_end=1257
+  _globals['_DOC_SCHEMA_SIMPLETYPE']._serialized_start=1259
+  _globals['_DOC_SCHEMA_SIMPLETYPE']._serialized_end=1341
+  _globals['_DOC_DEPS']._serialized_start=1352
+  _globals['_DOC_DEPS']._serialized_end=1496
+  _globals['_DOC_DEPS_MODULELINK']._serialized_start=1451
+  _globals['_DOC_DEPS_MODULELINK']._serialized_end=1496
+  _globals['_DOC_PARAMETER']._serialized_start=1498
+  _globals['_DOC_PARAMETER']._serialized_end=1591
+  _globals['_DOC_PARAMETERS']._serialized_start=1594
+  _globals['_DOC_PARAMETERS']._serialized_end=1787
+  _globals['_DOC_PARAMETERS_PARAMETERSENTRY']._serialized_start=1708
+  _globals['_DOC_PARAMETERS_PARAMETERSENTRY']._serialized_end=1787
+  _globals['_DOC_CLASS']._serialized_start=1790
+  _globals['_DOC_CLASS']._serialized_end=2164
+  _globals['_DOC_CLASS_CLASSESENTRY']._serialized_start=2021
+  _globals['_DOC_CLASS_CLASSESENTRY']._serialized_end=2093
+  _globals['_DOC_CLASS_FUNCSENTRY']._serialized_start=2095
+  _globals['_DOC_CLASS_FUNCSENTRY']._serialized_end=2164
+  _globals['_DOC_FUNC']._serialized_start=2167
+  _globals['_DOC_FUNC']._serialized_end=2311
+  _globals['_DOC_MODULE']._serialized_start=2314
+  _globals['_DOC_MODULE']._serialized_end=2800
+  _globals['_DOC_MODULE_CLASSESENTRY']._serialized_start=2021
+  _globals['_DOC_MODULE_CLASSESENTRY']._serialized_end=2093
+  _globals['_DOC_MODULE_FUNCSENTRY']._serialized_start=2095
+  _globals['_DOC_MODULE_FUNCSENTRY']._serialized_end=2164
+  _globals['_DOC_RECIPE']._serialized_start=2803
+  _globals['_DOC_RECIPE']._serialized_end=3397
+  _globals['_DOC_RECIPE_CLASSESENTRY']._serialized_start=2021
+  _globals['_DOC_RECIPE_CLASSESENTRY']._serialized_end=2093
+  _globals['_DOC_RECIPE_FUNCSENTRY']._serialized_start=2095
+  _globals['_DOC_RECIPE_FUNCSENTRY']._serialized_end=2164
+  _globals['_DOC_RECIPE_KNOWNOBJECTSENTRY']._serialized_start=3314
+  _globals['_DOC_RECIPE_KNOWNOBJECTSENTRY']._serialized_end=3391
+  _globals['_DOC_REPO']._serialized_start=3400
+  _globals['_DOC_REPO']._serialized_end=3990
+  _globals['_DOC_REPO_SPECSENTRY']._serialized_start=3686
+  _globals['_DOC_REPO_SPECSENTRY']._serialized_end=3755
+  _globals['_DOC_REPO_RECIPEMODULESENTRY']._serialized_start=3757
+  _globals['_DOC_REPO_RECIPEMODULESENTRY']._serialized_end=3836
+  _globals['_DOC_REPO_RECIPESENTRY']._serialized_start=3838
+  _globals['_DOC_REPO_RECIPESENTRY']._serialized_end=3911
+  _globals['_DOC_REPO_KNOWNOBJECTSENTRY']._serialized_start=3314
+  _globals['_DOC_REPO_KNOWNOBJECTSENTRY']._serialized_end=3391
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,322 @@
+from PB.recipe_engine import recipes_cfg as _recipes_cfg_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Doc(_message.Message):
+    __slots__ = ()
+    class Known(_message.Message):
+        __slots__ = ("url", "func", "klass")
+        class Object(_message.Message):
+            __slots__ = ("generic", "known")
+            GENERIC_FIELD_NUMBER: _ClassVar[int]
+            KNOWN_FIELD_NUMBER: _ClassVar[int]
+            generic: str
+            known: str
+            def __init__(self, generic: _Optional[str] = ..., known: _Optional[str] = ...) -> None: ...
+        URL_FIELD_NUMBER: _ClassVar[int]
+        FUNC_FIELD_NUMBER: _ClassVar[int]
+        KLASS_FIELD_NUMBER: _ClassVar[int]
+        url: str
+        func: Doc.Func
+        klass: Doc.Class
+        def __init__(self, url: _Optional[str] = ..., func: _Optional[_Union[Doc.Func, _Mapping]] = ..., klass: _Optional[_Union[Doc.Class, _Mapping]] = ...) -> None: ...
+    class Schema(_message.Message):
+        __slots__ = ("struct", "sequence", "list", "set", "dict", "single", "static", "enum")
+        class SimpleType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+            __slots__ = ()
+            STRING: _ClassVar[Doc.Schema.SimpleType]
+            NUMBER: _ClassVar[Doc.Schema.SimpleType]
+            BOOLEAN: _ClassVar[Doc.Schema.SimpleType]
+            OBJECT: _ClassVar[Doc.Schema.SimpleType]
+            ARRAY: _ClassVar[Doc.Schema.SimpleType]
+            NULL: _ClassVar[Doc.Schema.SimpleType]
+        STRING: Doc.Schema.SimpleType
+        NUMBER: Doc.Schema.SimpleType
+        BOOLEAN: Doc.Schema.SimpleType
+        OBJECT: Doc.Schema.SimpleType
+        ARRAY: Doc.Schema.SimpleType
+        NULL: Doc.Schema.SimpleType
+        class Struct(_message.Message):
+            __slots__ = ("type_map",)
+            class TypeMapEntry(_message.Message):
+                __slots__ = ("key", "value")
+                KEY_FIELD_NUMBER: _ClassVar[int]
+                VALUE_FIELD_NUMBER: _ClassVar[int]
+                key: str
+                value: Doc.Schema
+                def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Schema, _Mapping]] = ...) -> None: ...
+            TYPE_MAP_FIELD_NUMBER: _ClassVar[int]
+            type_map: _containers.MessageMap[str, Doc.Schema]
+            def __init__(self, type_map: _Optional[_Mapping[str, Doc.Schema]] = ...) -> None: ...
+        class Sequence(_message.Message):
+            __slots__ = ("inner_type",)
+            INNER_TYPE_FIELD_NUMBER: _ClassVar[int]
+            inner_type: Doc.Schema
+            def __init__(self, inner_type: _Optional[_Union[Doc.Schema, _Mapping]] = ...) -> None: ...
+        class List(_message.Message):
+            __slots__ = ("inner_type",)
+            INNER_TYPE_FIELD_NUMBER: _ClassVar[int]
+            inner_type: _containers.RepeatedScalarFieldContainer[Doc.Schema.SimpleType]
+            def __init__(self, inner_type: _Optional[_Iterable[_Union[Doc.Schema.SimpleType, str]]] = ...) -> None: ...
+        class Set(_message.Message):
+            __slots__ = ("inner_type",)
+            INNER_TYPE_FIELD_NUMBER: _ClassVar[int]
+            inner_type: _containers.RepeatedScalarFieldContainer[Doc.Schema.SimpleType]
+            def __init__(self, inner_type: _Optional[_Iterable[_Union[Doc.Schema.SimpleType, str]]] = ...) -> None: ...
+        class Dict(_message.Message):
+            __slots__ = ("value_type",)
+            VALUE_TYPE_FIELD_NUMBER: _ClassVar[int]
+            value_type: _containers.RepeatedScalarFieldContainer[Doc.Schema.SimpleType]
+            def __init__(self, value_type: _Optional[_Iterable[_Union[Doc.Schema.SimpleType, str]]] = ...) -> None: ...
+        class Single(_message.Message):
+            __slots__ = ("inner_type", "required", "default_json")
+            INNER_TYPE_FIELD_NUMBER: _ClassVar[int]
+            REQUIRED_FIELD_NUMBER: _ClassVar[int]
+            DEFAULT_JSON_FIELD_NUMBER: _ClassVar[int]
+            inner_type: _containers.RepeatedScalarFieldContainer[Doc.Schema.SimpleType]
+            required: bool
+            default_json: str
+            def __init__(self, inner_type: _Optional[_Iterable[_Union[Doc.Schema.SimpleType, str]]] = ..., required: bool = ..., default_json: _Optional[str] = ...) -> None: ...
+        class Static(_message.Message):
+            __slots__ = ("default_json",)
+            DEFAULT_JSON_FIELD_NUMBER: _ClassVar[int]
+            default_json: str
+            def __init__(self, default_json: _Optional[str] = ...) -> None: ...
+        class Enum(_message.Message):
+            __slots__ = ("values_json", "required")
+            VALUES_JSON_FIELD_NUMBER: _ClassVar[int]
+            REQUIRED_FIELD_NUMBER: _ClassVar[int]
+            values_json: _containers.RepeatedScalarFieldContainer[str]
+            required: bool
+            def __init__(self, values_json: _Optional[_Iterable[str]] = ..., required: bool = ...) -> None: ...
+        STRUCT_FIELD_NUMBER: _ClassVar[int]
+        SEQUENCE_FIELD_NUMBER: _ClassVar[int]
+        LIST_FIELD_NUMBER: _ClassVar[int]
+        SET_FIELD_NUMBER: _ClassVar[int]
+        DICT_FIELD_NUMBER: _ClassVar[int]
+        SINGLE_FIELD_NUMBER: _ClassVar[int]
+        STATIC_FIELD_NUMBER: _ClassVar[int]
+        ENUM_FIELD_NUMBER: _ClassVar[int]
+        struct: Doc.Schema.Struct
+        sequence: Doc.Schema.Sequence
+        list: Doc.Schema.List
+        set: Doc.Schema.Set
+        dict: Doc.Schema.Dict
+        single: Doc.Schema.Single
+        static: Doc.Schema.Static
+        enum: Doc.Schema.Enum
+        def __init__(self, struct: _Optional[_Union[Doc.Schema.Struct, _Mapping]] = ..., sequence: _Optional[_Union[Doc.Schema.Sequence, _Mapping]] = ..., list: _Optional[_Union[Doc.Schema.List, _Mapping]] = ..., set: _Optional[_Union[Doc.Schema.Set, _Mapping]] = ..., dict: _Optional[_Union[Doc.Schema.Dict, _Mapping]] = ..., single: _Optional[_Union[Doc.Schema.Single, _Mapping]] = ..., static: _Optional[_Union[Doc.Schema.Static, _Mapping]] = ..., enum: _Optional[_Union[Doc.Schema.Enum, _Mapping]] = ...) -> None: ...
+    class Deps(_message.Message):
+        __slots__ = ("relpath", "lineno", "module_links")
+        class ModuleLink(_message.Message):
+            __slots__ = ("repo_name", "name")
+            REPO_NAME_FIELD_NUMBER: _ClassVar[int]
+            NAME_FIELD_NUMBER: _ClassVar[int]
+            repo_name: str
+            name: str
+            def __init__(self, repo_name: _Optional[str] = ..., name: _Optional[str] = ...) -> None: ...
+        RELPATH_FIELD_NUMBER: _ClassVar[int]
+        LINENO_FIELD_NUMBER: _ClassVar[int]
+        MODULE_LINKS_FIELD_NUMBER: _ClassVar[int]
+        relpath: str
+        lineno: int
+        module_links: _containers.RepeatedCompositeFieldContainer[Doc.Deps.ModuleLink]
+        def __init__(self, relpath: _Optional[str] = ..., lineno: _Optional[int] = ..., module_links: _Optional[_Iterable[_Union[Doc.Deps.ModuleLink, _Mapping]]] = ...) -> None: ...
+    class Parameter(_message.Message):
+        __slots__ = ("docstring", "kind", "default_json")
+        DOCSTRING_FIELD_NUMBER: _ClassVar[int]
+        KIND_FIELD_NUMBER: _ClassVar[int]
+        DEFAULT_JSON_FIELD_NUMBER: _ClassVar[int]
+        docstring: str
+        kind: Doc.Schema
+        default_json: str
+        def __init__(self, docstring: _Optional[str] = ..., kind: _Optional[_Union[Doc.Schema, _Mapping]] = ..., default_json: _Optional[str] = ...) -> None: ...
+    class Parameters(_message.Message):
+        __slots__ = ("relpath", "lineno", "parameters")
+        class ParametersEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Parameter
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Parameter, _Mapping]] = ...) -> None: ...
+        RELPATH_FIELD_NUMBER: _ClassVar[int]
+        LINENO_FIELD_NUMBER: _ClassVar[int]
+        PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+        relpath: str
+        lineno: int
+        parameters: _containers.MessageMap[str, Doc.Parameter]
+        def __init__(self, relpath: _Optional[str] = ..., lineno: _Optional[int] = ..., parameters: _Optional[_Mapping[str, Doc.Parameter]] = ...) -> None: ...
+    class Class(_message.Message):
+        __slots__ = ("name", "relpath", "lineno", "docstring", "bases", "classes", "funcs")
+        class ClassesEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Class
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Class, _Mapping]] = ...) -> None: ...
+        class FuncsEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Func
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Func, _Mapping]] = ...) -> None: ...
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        RELPATH_FIELD_NUMBER: _ClassVar[int]
+        LINENO_FIELD_NUMBER: _ClassVar[int]
+        DOCSTRING_FIELD_NUMBER: _ClassVar[int]
+        BASES_FIELD_NUMBER: _ClassVar[int]
+        CLASSES_FIELD_NUMBER: _ClassVar[int]
+        FUNCS_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        relpath: str
+        lineno: int
+        docstring: str
+        bases: _containers.RepeatedCompositeFieldContainer[Doc.Known.Object]
+        classes: _containers.MessageMap[str, Doc.Class]
+        funcs: _containers.MessageMap[str, Doc.Func]
+        def __init__(self, name: _Optional[str] = ..., relpath: _Optional[str] = ..., lineno: _Optional[int] = ..., docstring: _Optional[str] = ..., bases: _Optional[_Iterable[_Union[Doc.Known.Object, _Mapping]]] = ..., classes: _Optional[_Mapping[str, Doc.Class]] = ..., funcs: _Optional[_Mapping[str, Doc.Func]] = ...) -> None: ...
+    class Func(_message.Message):
+        __slots__ = ("name", "relpath", "lineno", "docstring", "decorators", "signature")
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        RELPATH_FIELD_NUMBER: _ClassVar[int]
+        LINENO_FIELD_NUMBER: _ClassVar[int]
+        DOCSTRING_FIELD_NUMBER: _ClassVar[int]
+        DECORATORS_FIELD_NUMBER: _ClassVar[int]
+        SIGNATURE_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        relpath: str
+        lineno: int
+        docstring: str
+        decorators: _containers.RepeatedCompositeFieldContainer[Doc.Known.Object]
+        signature: str
+        def __init__(self, name: _Optional[str] = ..., relpath: _Optional[str] = ..., lineno: _Optional[int] = ..., docstring: _Optional[str] = ..., decorators: _Optional[_Iterable[_Union[Doc.Known.Object, _Mapping]]] = ..., signature: _Optional[str] = ...) -> None: ...
+    class Module(_message.Message):
+        __slots__ = ("name", "relpath", "docstring", "deps", "parameters", "api_class", "classes", "funcs", "python_version_compatibility")
+        class ClassesEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Class
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Class, _Mapping]] = ...) -> None: ...
+        class FuncsEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Func
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Func, _Mapping]] = ...) -> None: ...
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        RELPATH_FIELD_NUMBER: _ClassVar[int]
+        DOCSTRING_FIELD_NUMBER: _ClassVar[int]
+        DEPS_FIELD_NUMBER: _ClassVar[int]
+        PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+        API_CLASS_FIELD_NUMBER: _ClassVar[int]
+        CLASSES_FIELD_NUMBER: _ClassVar[int]
+        FUNCS_FIELD_NUMBER: _ClassVar[int]
+        PYTHON_VERSION_COMPATIBILITY_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        relpath: str
+        docstring: str
+        deps: Doc.Deps
+        parameters: Doc.Parameters
+        api_class: Doc.Class
+        classes: _containers.MessageMap[str, Doc.Class]
+        funcs: _containers.MessageMap[str, Doc.Func]
+        python_version_compatibility: str
+        def __init__(self, name: _Optional[str] = ..., relpath: _Optional[str] = ..., docstring: _Optional[str] = ..., deps: _Optional[_Union[Doc.Deps, _Mapping]] = ..., parameters: _Optional[_Union[Doc.Parameters, _Mapping]] = ..., api_class: _Optional[_Union[Doc.Class, _Mapping]] = ..., classes: _Optional[_Mapping[str, Doc.Class]] = ..., funcs: _Optional[_Mapping[str, Doc.Func]] = ..., python_version_compatibility: _Optional[str] = ...) -> None: ...
+    class Recipe(_message.Message):
+        __slots__ = ("name", "relpath", "docstring", "deps", "parameters", "classes", "funcs", "known_objects", "python_version_compatibility")
+        class ClassesEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Class
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Class, _Mapping]] = ...) -> None: ...
+        class FuncsEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Func
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Func, _Mapping]] = ...) -> None: ...
+        class KnownObjectsEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Known
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Known, _Mapping]] = ...) -> None: ...
+        NAME_FIELD_NUMBER: _ClassVar[int]
+        RELPATH_FIELD_NUMBER: _ClassVar[int]
+        DOCSTRING_FIELD_NUMBER: _ClassVar[int]
+        DEPS_FIELD_NUMBER: _ClassVar[int]
+        PARAMETERS_FIELD_NUMBER: _ClassVar[int]
+        CLASSES_FIELD_NUMBER: _ClassVar[int]
+        FUNCS_FIELD_NUMBER: _ClassVar[int]
+        KNOWN_OBJECTS_FIELD_NUMBER: _ClassVar[int]
+        PYTHON_VERSION_COMPATIBILITY_FIELD_NUMBER: _ClassVar[int]
+        name: str
+        relpath: str
+        docstring: str
+        deps: Doc.Deps
+        parameters: Doc.Parameters
+        classes: _containers.MessageMap[str, Doc.Class]
+        funcs: _containers.MessageMap[str, Doc.Func]
+        known_objects: _containers.MessageMap[str, Doc.Known]
+        python_version_compatibility: str
+        def __init__(self, name: _Optional[str] = ..., relpath: _Optional[str] = ..., docstring: _Optional[str] = ..., deps: _Optional[_Union[Doc.Deps, _Mapping]] = ..., parameters: _Optional[_Union[Doc.Parameters, _Mapping]] = ..., classes: _Optional[_Mapping[str, Doc.Class]] = ..., funcs: _Optional[_Mapping[str, Doc.Func]] = ..., known_objects: _Optional[_Mapping[str, Doc.Known]] = ..., python_version_compatibility: _Optional[str] = ...) -> None: ...
+    class Repo(_message.Message):
+        __slots__ = ("repo_name", "specs", "docstring", "recipe_modules", "recipes", "known_objects")
+        class SpecsEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: _recipes_cfg_pb2.RepoSpec
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[_recipes_cfg_pb2.RepoSpec, _Mapping]] = ...) -> None: ...
+        class RecipeModulesEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Module
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Module, _Mapping]] = ...) -> None: ...
+        class RecipesEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Recipe
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Recipe, _Mapping]] = ...) -> None: ...
+        class KnownObjectsEntry(_message.Message):
+            __slots__ = ("key", "value")
+            KEY_FIELD_NUMBER: _ClassVar[int]
+            VALUE_FIELD_NUMBER: _ClassVar[int]
+            key: str
+            value: Doc.Known
+            def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Doc.Known, _Mapping]] = ...) -> None: ...
+        REPO_NAME_FIELD_NUMBER: _ClassVar[int]
+        SPECS_FIELD_NUMBER: _ClassVar[int]
+        DOCSTRING_FIELD_NUMBER: _ClassVar[int]
+        RECIPE_MODULES_FIELD_NUMBER: _ClassVar[int]
+        RECIPES_FIELD_NUMBER: _ClassVar[int]
+        KNOWN_OBJECTS_FIELD_NUMBER: _ClassVar[int]
+        repo_name: str
+        specs: _containers.MessageMap[str, _recipes_cfg_pb2.RepoSpec]
+        docstring: str
+        recipe_modules: _containers.MessageMap[str, Doc.Module]
+        recipes: _containers.MessageMap[str, Doc.Recipe]
+        known_objects: _containers.MessageMap[str, Doc.Known]
+        def __init__(self, repo_name: _Optional[str] = ..., specs: _Optional[_Mapping[str, _recipes_cfg_pb2.RepoSpec]] = ..., docstring: _Optional[str] = ..., recipe_modules: _Optional[_Mapping[str, Doc.Module]] = ..., recipes: _Optional[_Mapping[str, Doc.Recipe]] = ..., known_objects: _Optional[_Mapping[str, Doc.Known]] = ...) -> None: ...
+    def __init__(self) -> None: ...
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/engine_properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/engine_properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%recipe_engine/engine_properties.proto\x12\rrecipe_engine\"I\n\x10\x45ngineProperties\x12\x35\n\x0fmemory_profiler\x18\x01 \x01(\x0b\x32\x1c.recipe_engine.MemoryProfler\"(\n\rMemoryProfler\x12\x17\n\x0f\x65nable_snapshot\x18\x01 \x01(\x08\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.engine_properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ENGINEPROPERTIES']._serialized_start=56
+  _globals['_ENGINEPROPERTIES']._serialized_end=129
+  _globals['_MEMORYPROFLER']._serialized_start=131
+  _globals['_MEMORYPROFLER']._serialized_end=171
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,18 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class EngineProperties(_message.Message):
+    __slots__ = ("memory_profiler",)
+    MEMORY_PROFILER_FIELD_NUMBER: _ClassVar[int]
+    memory_profiler: MemoryProfler
+    def __init__(self, memory_profiler: _Optional[_Union[MemoryProfler, _Mapping]] = ...) -> None: ...
+
+class MemoryProfler(_message.Message):
+    __slots__ = ("enable_snapshot",)
+    ENABLE_SNAPSHOT_FIELD_NUMBER: _ClassVar[int]
+    enable_snapshot: bool
+    def __init__(self, enable_snapshot: bool = ...) -> None: ...
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/internal/commands/deps/deps.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/internal/commands/deps/deps.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/recipe_engine/internal/commands/deps/deps.proto\x12$recipe_engine.internal.commands.deps\"\xd8\x02\n\x04\x44\x65ps\x12H\n\x07recipes\x18\x01 \x03(\x0b\x32\x37.recipe_engine.internal.commands.deps.Deps.RecipesEntry\x12H\n\x07modules\x18\x02 \x03(\x0b\x32\x37.recipe_engine.internal.commands.deps.Deps.ModulesEntry\x1a]\n\x0cRecipesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.recipe_engine.internal.commands.deps.DepInfo:\x02\x38\x01\x1a]\n\x0cModulesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.recipe_engine.internal.commands.deps.DepInfo:\x02\x38\x01\"\xef\x01\n\x07\x44\x65pInfo\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12\x11\n\tis_recipe\x18\x04 \x01(\x08\x12K\n\x12\x63laimed_py3_status\x18\x05 \x01(\x0e\x32/.recipe_engine.internal.commands.deps.Py3Status\x12M\n\x14\x65\x66\x66\x65\x63tive_py3_status\x18\x06 \x01(\x0e\x32/.recipe_engine.internal.commands.deps.Py3Status\x12\x0c\n\x04\x64\x65ps\x18\x07 \x03(\t*X\n\tPy3Status\x12\x0e\n\nCANNOT_RUN\x10\x00\x12\x10\n\x0cPYTHON2_ONLY\x10\x01\x12\x17\n\x13PYTHON2_AND_PYTHON3\x10\x02\x12\x10\n\x0cPYTHON3_ONLY\x10\x03\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.internal.commands.deps.deps_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_DEPS_RECIPESENTRY']._loaded_options = None
+  _globals['_DEPS_RECIPESENTRY']._serialized_options = b'8\001'
+  _globals['_DEPS_MODULESENTRY']._loaded_options = None
+  _globals['_DEPS_MODULESENTRY']._serialized_options = b'8\001'
+  _globals['_PY3STATUS']._serialized_start=678
+  _globals['_PY3STATUS']._serialized_end=766
+  _globals['_DEPS']._serialized_start=90
+  _globals['_DEPS']._serialized_end=434
+  _globals['_DEPS_RECIPESENTRY']._serialized_start=246
+  _globals['_DEPS_RECIPESENTRY']._serialized_end=339
+  _globals['_DEPS_MODULESENTRY']._serialized_start=341
+  _globals['_DEPS_MODULESENTRY']._serialized_end=434
+  _globals['_DEPINFO']._serialized_start=437
+  _globals['_DEPINFO']._serialized_end=676
+# @@protoc_insertion_point(module_scope)
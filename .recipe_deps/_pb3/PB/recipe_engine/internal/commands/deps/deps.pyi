@@ -0,0 +1,59 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Py3Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    CANNOT_RUN: _ClassVar[Py3Status]
+    PYTHON2_ONLY: _ClassVar[Py3Status]
+    PYTHON2_AND_PYTHON3: _ClassVar[Py3Status]
+    PYTHON3_ONLY: _ClassVar[Py3Status]
+CANNOT_RUN: Py3Status
+PYTHON2_ONLY: Py3Status
+PYTHON2_AND_PYTHON3: Py3Status
+PYTHON3_ONLY: Py3Status
+
+class Deps(_message.Message):
+    __slots__ = ("recipes", "modules")
+    class RecipesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: DepInfo
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[DepInfo, _Mapping]] = ...) -> None: ...
+    class ModulesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: DepInfo
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[DepInfo, _Mapping]] = ...) -> None: ...
+    RECIPES_FIELD_NUMBER: _ClassVar[int]
+    MODULES_FIELD_NUMBER: _ClassVar[int]
+    recipes: _containers.MessageMap[str, DepInfo]
+    modules: _containers.MessageMap[str, DepInfo]
+    def __init__(self, recipes: _Optional[_Mapping[str, DepInfo]] = ..., modules: _Optional[_Mapping[str, DepInfo]] = ...) -> None: ...
+
+class DepInfo(_message.Message):
+    __slots__ = ("repo", "name", "url", "is_recipe", "claimed_py3_status", "effective_py3_status", "deps")
+    REPO_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    IS_RECIPE_FIELD_NUMBER: _ClassVar[int]
+    CLAIMED_PY3_STATUS_FIELD_NUMBER: _ClassVar[int]
+    EFFECTIVE_PY3_STATUS_FIELD_NUMBER: _ClassVar[int]
+    DEPS_FIELD_NUMBER: _ClassVar[int]
+    repo: str
+    name: str
+    url: str
+    is_recipe: bool
+    claimed_py3_status: Py3Status
+    effective_py3_status: Py3Status
+    deps: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, repo: _Optional[str] = ..., name: _Optional[str] = ..., url: _Optional[str] = ..., is_recipe: bool = ..., claimed_py3_status: _Optional[_Union[Py3Status, str]] = ..., effective_py3_status: _Optional[_Union[Py3Status, str]] = ..., deps: _Optional[_Iterable[str]] = ...) -> None: ...
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/internal/test/runner.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/internal/test/runner.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.recipe_engine import warning as recipe__engine_dot_warning__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(recipe_engine/internal/test/runner.proto\x12\x1brecipe_engine.internal.test\x1a\x1brecipe_engine/warning.proto\x1a\x1egoogle/protobuf/duration.proto\"b\n\x0b\x44\x65scription\x12\x13\n\x0brecipe_name\x18\x01 \x01(\t\x12\x11\n\ttest_name\x18\x02 \x01(\t\x12\x11\n\ttest_data\x18\x03 \x01(\x0c\x12\x18\n\x10result_cache_key\x18\x04 \x01(\t\"\xb4\x06\n\x07Outcome\x12K\n\x0ctest_results\x18\x01 \x03(\x0b\x32\x35.recipe_engine.internal.test.Outcome.TestResultsEntry\x12\x18\n\x10\x63overage_percent\x18\x02 \x01(\x02\x12\x19\n\x11uncovered_modules\x18\x03 \x03(\t\x12 \n\x18unused_expectation_files\x18\x04 \x03(\t\x12\x16\n\x0einternal_error\x18\x05 \x03(\t\x12\x44\n\x08warnings\x18\x06 \x03(\x0b\x32\x32.recipe_engine.internal.test.Outcome.WarningsEntry\x1a\xfc\x02\n\x07Results\x12\x42\n\x04\x64iff\x18\x01 \x01(\x0b\x32\x32.recipe_engine.internal.test.Outcome.Results.LinesH\x00\x12\x11\n\x07removed\x18\x02 \x01(\x08H\x00\x12\x11\n\x07written\x18\x03 \x01(\x08H\x00\x12\x41\n\x05\x63heck\x18\x04 \x03(\x0b\x32\x32.recipe_engine.internal.test.Outcome.Results.Lines\x12\x16\n\x0e\x63rash_mismatch\x18\x05 \x03(\t\x12\x10\n\x08\x62\x61\x64_test\x18\x06 \x03(\t\x12\x16\n\x0einternal_error\x18\x07 \x03(\t\x12+\n\x08\x64uration\x18\x08 \x01(\x0b\x32\x19.google.protobuf.Duration\x12\x10\n\x08warnings\x18\t \x03(\t\x12\x17\n\x0fglobal_warnings\x18\n \x03(\t\x1a\x16\n\x05Lines\x12\r\n\x05lines\x18\x01 \x03(\tB\x12\n\x10\x65xpectation_file\x1a`\n\x10TestResultsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.recipe_engine.internal.test.Outcome.Results:\x02\x38\x01\x1a\x46\n\rWarningsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12$\n\x05value\x18\x02 \x01(\x0b\x32\x15.recipe_engine.Causes:\x02\x38\x01\"_\n\x0c\x43\x61\x63hedResult\x12=\n\x07results\x18\x01 \x01(\x0b\x32,.recipe_engine.internal.test.Outcome.Results\x12\x10\n\x08\x63overage\x18\x02 \x01(\x0c\"m\n\rDaemonRequest\x12\x0f\n\x07version\x18\x05 \x01(\x05\x12\x0c\n\x04ping\x18\x01 \x01(\x08\x12\r\n\x05train\x18\x02 \x01(\x08\x12\x10\n\x08\x63ov_file\x18\x03 \x01(\t\x12\x1c\n\x14\x63over_module_imports\x18\x04 \x01(\x08\"0\n\x0e\x44\x61\x65monResponse\x12\x0b\n\x03pid\x18\x01 \x01(\x05\x12\x11\n\texit_code\x18\x02 \x01(\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.internal.test.runner_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_OUTCOME_TESTRESULTSENTRY']._loaded_options = None
+  _globals['_OUTCOME_TESTRESULTSENTRY']._serialized_options = b'8\001'
+  _globals['_OUTCOME_WARNINGSENTRY']._loaded_options = None
+  _globals['_OUTCOME_WARNINGSENTRY']._serialized_options = b'8\001'
+  _globals['_DESCRIPTION']._serialized_start=134
+  _globals['_DESCRIPTION']._serialized_end=232
+  _globals['_OUTCOME']._serialized_start=235
+  _globals['_OUTCOME']._serialized_end=1055
+  _globals['_OUTCOME_RESULTS']._serialized_start=505
+  _globals['_OUTCOME_RESULTS']._serialized_end=885
+  _globals['_OUTCOME_RESULTS_LINES']._serialized_start=843
+  _globals['_OUTCOME_RESULTS_LINES']._serialized_end=865
+  _globals['_OUTCOME_TESTRESULTSENTRY']._serialized_start=887
+  _globals['_OUTCOME_TESTRESULTSENTRY']._serialized_end=983
+  _globals['_OUTCOME_WARNINGSENTRY']._serialized_start=985
+  _globals['_OUTCOME_WARNINGSENTRY']._serialized_end=1055
+  _globals['_CACHEDRESULT']._serialized_start=1057
+  _globals['_CACHEDRESULT']._serialized_end=1152
+  _globals['_DAEMONREQUEST']._serialized_start=1154
+  _globals['_DAEMONREQUEST']._serialized_end=1263
+  _globals['_DAEMONRESPONSE']._serialized_start=1265
+  _globals['_DAEMONRESPONSE']._serialized_end=1313
+# @@protoc_insertion_point(module_scope)
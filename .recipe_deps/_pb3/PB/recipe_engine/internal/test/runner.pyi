@@ -0,0 +1,111 @@
+import datetime
+
+from PB.recipe_engine import warning as _warning_pb2
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Description(_message.Message):
+    __slots__ = ("recipe_name", "test_name", "test_data", "result_cache_key")
+    RECIPE_NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_NAME_FIELD_NUMBER: _ClassVar[int]
+    TEST_DATA_FIELD_NUMBER: _ClassVar[int]
+    RESULT_CACHE_KEY_FIELD_NUMBER: _ClassVar[int]
+    recipe_name: str
+    test_name: str
+    test_data: bytes
+    result_cache_key: str
+    def __init__(self, recipe_name: _Optional[str] = ..., test_name: _Optional[str] = ..., test_data: _Optional[bytes] = ..., result_cache_key: _Optional[str] = ...) -> None: ...
+
+class Outcome(_message.Message):
+    __slots__ = ("test_results", "coverage_percent", "uncovered_modules", "unused_expectation_files", "internal_error", "warnings")
+    class Results(_message.Message):
+        __slots__ = ("diff", "removed", "written", "check", "crash_mismatch", "bad_test", "internal_error", "duration", "warnings", "global_warnings")
+        class Lines(_message.Message):
+            __slots__ = ("lines",)
+            LINES_FIELD_NUMBER: _ClassVar[int]
+            lines: _containers.RepeatedScalarFieldContainer[str]
+            def __init__(self, lines: _Optional[_Iterable[str]] = ...) -> None: ...
+        DIFF_FIELD_NUMBER: _ClassVar[int]
+        REMOVED_FIELD_NUMBER: _ClassVar[int]
+        WRITTEN_FIELD_NUMBER: _ClassVar[int]
+        CHECK_FIELD_NUMBER: _ClassVar[int]
+        CRASH_MISMATCH_FIELD_NUMBER: _ClassVar[int]
+        BAD_TEST_FIELD_NUMBER: _ClassVar[int]
+        INTERNAL_ERROR_FIELD_NUMBER: _ClassVar[int]
+        DURATION_FIELD_NUMBER: _ClassVar[int]
+        WARNINGS_FIELD_NUMBER: _ClassVar[int]
+        GLOBAL_WARNINGS_FIELD_NUMBER: _ClassVar[int]
+        diff: Outcome.Results.Lines
+        removed: bool
+        written: bool
+        check: _containers.RepeatedCompositeFieldContainer[Outcome.Results.Lines]
+        crash_mismatch: _containers.RepeatedScalarFieldContainer[str]
+        bad_test: _containers.RepeatedScalarFieldContainer[str]
+        internal_error: _containers.RepeatedScalarFieldContainer[str]
+        duration: _duration_pb2.Duration
+        warnings: _containers.RepeatedScalarFieldContainer[str]
+        global_warnings: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, diff: _Optional[_Union[Outcome.Results.Lines, _Mapping]] = ..., removed: bool = ..., written: bool = ..., check: _Optional[_Iterable[_Union[Outcome.Results.Lines, _Mapping]]] = ..., crash_mismatch: _Optional[_Iterable[str]] = ..., bad_test: _Optional[_Iterable[str]] = ..., internal_error: _Optional[_Iterable[str]] = ..., duration: _Optional[_Union[datetime.timedelta, _duration_pb2.Duration, _Mapping]] = ..., warnings: _Optional[_Iterable[str]] = ..., global_warnings: _Optional[_Iterable[str]] = ...) -> None: ...
+    class TestResultsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: Outcome.Results
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[Outcome.Results, _Mapping]] = ...) -> None: ...
+    class WarningsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: _warning_pb2.Causes
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[_warning_pb2.Causes, _Mapping]] = ...) -> None: ...
+    TEST_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    COVERAGE_PERCENT_FIELD_NUMBER: _ClassVar[int]
+    UNCOVERED_MODULES_FIELD_NUMBER: _ClassVar[int]
+    UNUSED_EXPECTATION_FILES_FIELD_NUMBER: _ClassVar[int]
+    INTERNAL_ERROR_FIELD_NUMBER: _ClassVar[int]
+    WARNINGS_FIELD_NUMBER: _ClassVar[int]
+    test_results: _containers.MessageMap[str, Outcome.Results]
+    coverage_percent: float
+    uncovered_modules: _containers.RepeatedScalarFieldContainer[str]
+    unused_expectation_files: _containers.RepeatedScalarFieldContainer[str]
+    internal_error: _containers.RepeatedScalarFieldContainer[str]
+    warnings: _containers.MessageMap[str, _warning_pb2.Causes]
+    def __init__(self, test_results: _Optional[_Mapping[str, Outcome.Results]] = ..., coverage_percent: _Optional[float] = ..., uncovered_modules: _Optional[_Iterable[str]] = ..., unused_expectation_files: _Optional[_Iterable[str]] = ..., internal_error: _Optional[_Iterable[str]] = ..., warnings: _Optional[_Mapping[str, _warning_pb2.Causes]] = ...) -> None: ...
+
+class CachedResult(_message.Message):
+    __slots__ = ("results", "coverage")
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    COVERAGE_FIELD_NUMBER: _ClassVar[int]
+    results: Outcome.Results
+    coverage: bytes
+    def __init__(self, results: _Optional[_Union[Outcome.Results, _Mapping]] = ..., coverage: _Optional[bytes] = ...) -> None: ...
+
+class DaemonRequest(_message.Message):
+    __slots__ = ("version", "ping", "train", "cov_file", "cover_module_imports")
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    PING_FIELD_NUMBER: _ClassVar[int]
+    TRAIN_FIELD_NUMBER: _ClassVar[int]
+    COV_FILE_FIELD_NUMBER: _ClassVar[int]
+    COVER_MODULE_IMPORTS_FIELD_NUMBER: _ClassVar[int]
+    version: int
+    ping: bool
+    train: bool
+    cov_file: str
+    cover_module_imports: bool
+    def __init__(self, version: _Optional[int] = ..., ping: bool = ..., train: bool = ..., cov_file: _Optional[str] = ..., cover_module_imports: bool = ...) -> None: ...
+
+class DaemonResponse(_message.Message):
+    __slots__ = ("pid", "exit_code")
+    PID_FIELD_NUMBER: _ClassVar[int]
+    EXIT_CODE_FIELD_NUMBER: _ClassVar[int]
+    pid: int
+    exit_code: int
+    def __init__(self, pid: _Optional[int] = ..., exit_code: _Optional[int] = ...) -> None: ...
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/recipes_cfg.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/recipes_cfg.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1frecipe_engine/recipes_cfg.proto\x12\rrecipe_engine\"8\n\x07\x44\x65pSpec\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x0e\n\x06\x62ranch\x18\x02 \x01(\t\x12\x10\n\x08revision\x18\x03 \x01(\t\"\x89\x05\n\x15\x41utorollRecipeOptions\x12\x44\n\x07trivial\x18\x01 \x01(\x0b\x32\x33.recipe_engine.AutorollRecipeOptions.TrivialOptions\x12J\n\nnontrivial\x18\x02 \x01(\x0b\x32\x36.recipe_engine.AutorollRecipeOptions.NontrivialOptions\x12\x16\n\x0e\x64isable_reason\x18\x03 \x01(\t\x12\x15\n\rno_cc_authors\x18\x04 \x01(\x08\x12\x11\n\tno_owners\x18\x05 \x01(\x08\x1a\xad\x02\n\x0eTrivialOptions\x12\x12\n\ntbr_emails\x18\x01 \x03(\t\x12\x18\n\x10\x61utomatic_commit\x18\x02 \x01(\x08\x12\x0f\n\x07\x64ry_run\x18\x03 \x01(\x08\x12\x62\n\x13self_approve_method\x18\x04 \x01(\x0e\x32\x45.recipe_engine.AutorollRecipeOptions.TrivialOptions.SelfApproveMethod\"x\n\x11SelfApproveMethod\x12\x16\n\x12\x42OT_COMMIT_APPROVE\x10\x00\x12\x19\n\x15\x43ODE_REVIEW_1_APPROVE\x10\x01\x12\x19\n\x15\x43ODE_REVIEW_2_APPROVE\x10\x02\x12\x15\n\x11NO_LABELS_APPROVE\x10\x03\x1al\n\x11NontrivialOptions\x12\x1d\n\x15\x65xtra_reviewer_emails\x18\x01 \x03(\t\x12 \n\x18\x61utomatic_commit_dry_run\x18\x02 \x01(\x08\x12\x16\n\x0eset_autosubmit\x18\x03 \x01(\x08\"\xbd\x03\n\x08RepoSpec\x12\x13\n\x0b\x61pi_version\x18\x01 \x01(\x05\x12\x11\n\trepo_name\x18\x07 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\x12\x1a\n\x12\x63\x61nonical_repo_url\x18\x03 \x01(\t\x12\x14\n\x0crecipes_path\x18\x04 \x01(\t\x12/\n\x04\x64\x65ps\x18\x05 \x03(\x0b\x32!.recipe_engine.RepoSpec.DepsEntry\x12\x45\n\x17\x61utoroll_recipe_options\x18\x06 \x01(\x0b\x32$.recipe_engine.AutorollRecipeOptions\x12\x0f\n\x07no_docs\x18\x08 \x01(\x08\x12!\n\x19require_py3_compatibility\x18\t \x01(\x08\x12\x10\n\x08py3_only\x18\n \x01(\x08\x12$\n\x1c\x65nforce_test_expected_status\x18\x0b \x01(\x08\x12\x1a\n\x12\x66orbidden_warnings\x18\x0c \x03(\t\x1a\x43\n\tDepsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.recipe_engine.DepSpec:\x02\x38\x01\"\x99\x01\n\x0c\x44\x65pRepoSpecs\x12>\n\nrepo_specs\x18\x01 \x03(\x0b\x32*.recipe_engine.DepRepoSpecs.RepoSpecsEntry\x1aI\n\x0eRepoSpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.recipe_engine.RepoSpec:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.recipes_cfg_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_REPOSPEC_DEPSENTRY']._loaded_options = None
+  _globals['_REPOSPEC_DEPSENTRY']._serialized_options = b'8\001'
+  _globals['_DEPREPOSPECS_REPOSPECSENTRY']._loaded_options = None
+  _globals['_DEPREPOSPECS_REPOSPECSENTRY']._serialized_options = b'8\001'
+  _globals['_DEPSPEC']._serialized_start=50
+  _globals['_DEPSPEC']._serialized_end=106
+  _globals['_AUTOROLLRECIPEOPTIONS']._serialized_start=109
+  _globals['_AUTOROLLRECIPEOPTIONS']._serialized_end=758
+  _globals['_AUTOROLLRECIPEOPTIONS_TRIVIALOPTIONS']._serialized_start=347
+  _globals['_AUTOROLLRECIPEOPTIONS_TRIVIALOPTIONS']._serialized_end=648
+  _globals['_AUTOROLLRECIPEOPTIONS_TRIVIALOPTIONS_SELFAPPROVEMETHOD']._serialized_start=528
+  _globals['_AUTOROLLRECIPEOPTIONS_TRIVIALOPTIONS_SELFAPPROVEMETHOD']._serialized_end=648
+  _globals['_AUTOROLLRECIPEOPTIONS_NONTRIVIALOPTIONS']._serialized_start=650
+  _globals['_AUTOROLLRECIPEOPTIONS_NONTRIVIALOPTIONS']._serialized_end=758
+  _globals['_REPOSPEC']._serialized_start=761
+  _globals['_REPOSPEC']._serialized_end=1206
+  _globals['_REPOSPEC_DEPSENTRY']._serialized_start=1139
+  _globals['_REPOSPEC_DEPSENTRY']._serialized_end=1206
+  _globals['_DEPREPOSPECS']._serialized_start=1209
+  _globals['_DEPREPOSPECS']._serialized_end=1362
+  _globals['_DEPREPOSPECS_REPOSPECSENTRY']._serialized_start=1289
+  _globals['_DEPREPOSPECS_REPOSPECSENTRY']._serialized_end=1362
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,110 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class DepSpec(_message.Message):
+    __slots__ = ("url", "branch", "revision")
+    URL_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    url: str
+    branch: str
+    revision: str
+    def __init__(self, url: _Optional[str] = ..., branch: _Optional[str] = ..., revision: _Optional[str] = ...) -> None: ...
+
+class AutorollRecipeOptions(_message.Message):
+    __slots__ = ("trivial", "nontrivial", "disable_reason", "no_cc_authors", "no_owners")
+    class TrivialOptions(_message.Message):
+        __slots__ = ("tbr_emails", "automatic_commit", "dry_run", "self_approve_method")
+        class SelfApproveMethod(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+            __slots__ = ()
+            BOT_COMMIT_APPROVE: _ClassVar[AutorollRecipeOptions.TrivialOptions.SelfApproveMethod]
+            CODE_REVIEW_1_APPROVE: _ClassVar[AutorollRecipeOptions.TrivialOptions.SelfApproveMethod]
+            CODE_REVIEW_2_APPROVE: _ClassVar[AutorollRecipeOptions.TrivialOptions.SelfApproveMethod]
+            NO_LABELS_APPROVE: _ClassVar[AutorollRecipeOptions.TrivialOptions.SelfApproveMethod]
+        BOT_COMMIT_APPROVE: AutorollRecipeOptions.TrivialOptions.SelfApproveMethod
+        CODE_REVIEW_1_APPROVE: AutorollRecipeOptions.TrivialOptions.SelfApproveMethod
+        CODE_REVIEW_2_APPROVE: AutorollRecipeOptions.TrivialOptions.SelfApproveMethod
+        NO_LABELS_APPROVE: AutorollRecipeOptions.TrivialOptions.SelfApproveMethod
+        TBR_EMAILS_FIELD_NUMBER: _ClassVar[int]
+        AUTOMATIC_COMMIT_FIELD_NUMBER: _ClassVar[int]
+        DRY_RUN_FIELD_NUMBER: _ClassVar[int]
+        SELF_APPROVE_METHOD_FIELD_NUMBER: _ClassVar[int]
+        tbr_emails: _containers.RepeatedScalarFieldContainer[str]
+        automatic_commit: bool
+        dry_run: bool
+        self_approve_method: AutorollRecipeOptions.TrivialOptions.SelfApproveMethod
+        def __init__(self, tbr_emails: _Optional[_Iterable[str]] = ..., automatic_commit: bool = ..., dry_run: bool = ..., self_approve_method: _Optional[_Union[AutorollRecipeOptions.TrivialOptions.SelfApproveMethod, str]] = ...) -> None: ...
+    class NontrivialOptions(_message.Message):
+        __slots__ = ("extra_reviewer_emails", "automatic_commit_dry_run", "set_autosubmit")
+        EXTRA_REVIEWER_EMAILS_FIELD_NUMBER: _ClassVar[int]
+        AUTOMATIC_COMMIT_DRY_RUN_FIELD_NUMBER: _ClassVar[int]
+        SET_AUTOSUBMIT_FIELD_NUMBER: _ClassVar[int]
+        extra_reviewer_emails: _containers.RepeatedScalarFieldContainer[str]
+        automatic_commit_dry_run: bool
+        set_autosubmit: bool
+        def __init__(self, extra_reviewer_emails: _Optional[_Iterable[str]] = ..., automatic_commit_dry_run: bool = ..., set_autosubmit: bool = ...) -> None: ...
+    TRIVIAL_FIELD_NUMBER: _ClassVar[int]
+    NONTRIVIAL_FIELD_NUMBER: _ClassVar[int]
+    DISABLE_REASON_FIELD_NUMBER: _ClassVar[int]
+    NO_CC_AUTHORS_FIELD_NUMBER: _ClassVar[int]
+    NO_OWNERS_FIELD_NUMBER: _ClassVar[int]
+    trivial: AutorollRecipeOptions.TrivialOptions
+    nontrivial: AutorollRecipeOptions.NontrivialOptions
+    disable_reason: str
+    no_cc_authors: bool
+    no_owners: bool
+    def __init__(self, trivial: _Optional[_Union[AutorollRecipeOptions.TrivialOptions, _Mapping]] = ..., nontrivial: _Optional[_Union[AutorollRecipeOptions.NontrivialOptions, _Mapping]] = ..., disable_reason: _Optional[str] = ..., no_cc_authors: bool = ..., no_owners: bool = ...) -> None: ...
+
+class RepoSpec(_message.Message):
+    __slots__ = ("api_version", "repo_name", "project_id", "canonical_repo_url", "recipes_path", "deps", "autoroll_recipe_options", "no_docs", "require_py3_compatibility", "py3_only", "enforce_test_expected_status", "forbidden_warnings")
+    class DepsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: DepSpec
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[DepSpec, _Mapping]] = ...) -> None: ...
+    API_VERSION_FIELD_NUMBER: _ClassVar[int]
+    REPO_NAME_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_ID_FIELD_NUMBER: _ClassVar[int]
+    CANONICAL_REPO_URL_FIELD_NUMBER: _ClassVar[int]
+    RECIPES_PATH_FIELD_NUMBER: _ClassVar[int]
+    DEPS_FIELD_NUMBER: _ClassVar[int]
+    AUTOROLL_RECIPE_OPTIONS_FIELD_NUMBER: _ClassVar[int]
+    NO_DOCS_FIELD_NUMBER: _ClassVar[int]
+    REQUIRE_PY3_COMPATIBILITY_FIELD_NUMBER: _ClassVar[int]
+    PY3_ONLY_FIELD_NUMBER: _ClassVar[int]
+    ENFORCE_TEST_EXPECTED_STATUS_FIELD_NUMBER: _ClassVar[int]
+    FORBIDDEN_WARNINGS_FIELD_NUMBER: _ClassVar[int]
+    api_version: int
+    repo_name: str
+    project_id: str
+    canonical_repo_url: str
+    recipes_path: str
+    deps: _containers.MessageMap[str, DepSpec]
+    autoroll_recipe_options: AutorollRecipeOptions
+    no_docs: bool
+    require_py3_compatibility: bool
+    py3_only: bool
+    enforce_test_expected_status: bool
+    forbidden_warnings: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, api_version: _Optional[int] = ..., repo_name: _Optional[str] = ..., project_id: _Optional[str] = ..., canonical_repo_url: _Optional[str] = ..., recipes_path: _Optional[str] = ..., deps: _Optional[_Mapping[str, DepSpec]] = ..., autoroll_recipe_options: _Optional[_Union[AutorollRecipeOptions, _Mapping]] = ..., no_docs: bool = ..., require_py3_compatibility: bool = ..., py3_only: bool = ..., enforce_test_expected_status: bool = ..., forbidden_warnings: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DepRepoSpecs(_message.Message):
+    __slots__ = ("repo_specs",)
+    class RepoSpecsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: RepoSpec
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[RepoSpec, _Mapping]] = ...) -> None: ...
+    REPO_SPECS_FIELD_NUMBER: _ClassVar[int]
+    repo_specs: _containers.MessageMap[str, RepoSpec]
+    def __init__(self, repo_specs: _Optional[_Mapping[str, RepoSpec]] = ...) -> None: ...
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/result.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/result.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1arecipe_engine/result.proto\x12\rrecipe_engine\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\"Z\n\x06Result\x12\x15\n\x0bjson_result\x18\x01 \x01(\tH\x00\x12)\n\x07\x66\x61ilure\x18\x02 \x01(\x0b\x32\x16.recipe_engine.FailureH\x00\x42\x0e\n\x0coneof_result\"W\n\x07\x46\x61ilure\x12\x14\n\x0chuman_reason\x18\x01 \x01(\t\x12-\n\x07\x66\x61ilure\x18\x05 \x01(\x0b\x32\x1c.recipe_engine.Failure.Dummy\x1a\x07\n\x05\x44ummy\"M\n\tRawResult\x12\x18\n\x10summary_markdown\x18\x01 \x01(\t\x12&\n\x06status\x18\x02 \x01(\x0e\x32\x16.buildbucket.v2.Statusb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.result_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_RESULT']._serialized_start=98
+  _globals['_RESULT']._serialized_end=188
+  _globals['_FAILURE']._serialized_start=190
+  _globals['_FAILURE']._serialized_end=277
+  _globals['_FAILURE_DUMMY']._serialized_start=270
+  _globals['_FAILURE_DUMMY']._serialized_end=277
+  _globals['_RAWRESULT']._serialized_start=279
+  _globals['_RAWRESULT']._serialized_end=356
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,34 @@
+from PB.go.chromium.org.luci.buildbucket.proto import common as _common_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Result(_message.Message):
+    __slots__ = ("json_result", "failure")
+    JSON_RESULT_FIELD_NUMBER: _ClassVar[int]
+    FAILURE_FIELD_NUMBER: _ClassVar[int]
+    json_result: str
+    failure: Failure
+    def __init__(self, json_result: _Optional[str] = ..., failure: _Optional[_Union[Failure, _Mapping]] = ...) -> None: ...
+
+class Failure(_message.Message):
+    __slots__ = ("human_reason", "failure")
+    class Dummy(_message.Message):
+        __slots__ = ()
+        def __init__(self) -> None: ...
+    HUMAN_REASON_FIELD_NUMBER: _ClassVar[int]
+    FAILURE_FIELD_NUMBER: _ClassVar[int]
+    human_reason: str
+    failure: Failure.Dummy
+    def __init__(self, human_reason: _Optional[str] = ..., failure: _Optional[_Union[Failure.Dummy, _Mapping]] = ...) -> None: ...
+
+class RawResult(_message.Message):
+    __slots__ = ("summary_markdown", "status")
+    SUMMARY_MARKDOWN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    summary_markdown: str
+    status: _common_pb2.Status
+    def __init__(self, summary_markdown: _Optional[str] = ..., status: _Optional[_Union[_common_pb2.Status, str]] = ...) -> None: ...
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_engine/warning.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_engine/warning.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1brecipe_engine/warning.proto\x12\rrecipe_engine\"\xc4\x01\n\x14\x44\x65\x66initionCollection\x12*\n\x07warning\x18\x01 \x03(\x0b\x32\x19.recipe_engine.Definition\x12?\n\x14monorail_bug_default\x18\x02 \x01(\x0b\x32!.recipe_engine.MonorailBugDefault\x12?\n\x14google_issue_default\x18\x03 \x01(\x0b\x32!.recipe_engine.GoogleIssueDefault\"\xa5\x01\n\nDefinition\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x03(\t\x12\x10\n\x08\x64\x65\x61\x64line\x18\x03 \x01(\t\x12\x30\n\x0cmonorail_bug\x18\x04 \x03(\x0b\x32\x1a.recipe_engine.MonorailBug\x12\x30\n\x0cgoogle_issue\x18\x05 \x03(\x0b\x32\x1a.recipe_engine.GoogleIssue\"8\n\x0bMonorailBug\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\n\n\x02id\x18\x03 \x01(\r\"\'\n\x0bGoogleIssue\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\r\"\"\n\x12GoogleIssueDefault\x12\x0c\n\x04host\x18\x01 \x01(\t\"3\n\x12MonorailBugDefault\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\".\n\x06\x43\x61uses\x12$\n\x06\x63\x61uses\x18\x01 \x03(\x0b\x32\x14.recipe_engine.Cause\"v\n\x05\x43\x61use\x12,\n\tcall_site\x18\x01 \x01(\x0b\x32\x17.recipe_engine.CallSiteH\x00\x12\x30\n\x0bimport_site\x18\x02 \x01(\x0b\x32\x19.recipe_engine.ImportSiteH\x00\x42\r\n\x0boneof_cause\"X\n\x08\x43\x61llSite\x12\"\n\x04site\x18\x01 \x01(\x0b\x32\x14.recipe_engine.Frame\x12(\n\ncall_stack\x18\x02 \x03(\x0b\x32\x14.recipe_engine.Frame\"J\n\nImportSite\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x10\n\x06module\x18\x02 \x01(\tH\x00\x12\x10\n\x06recipe\x18\x03 \x01(\tH\x00\x42\n\n\x08location\"#\n\x05\x46rame\x12\x0c\n\x04\x66ile\x18\x01 \x01(\t\x12\x0c\n\x04line\x18\x02 \x01(\rb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_engine.warning_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_DEFINITIONCOLLECTION']._serialized_start=47
+  _globals['_DEFINITIONCOLLECTION']._serialized_end=243
+  _globals['_DEFINITION']._serialized_start=246
+  _globals['_DEFINITION']._serialized_end=411
+  _globals['_MONORAILBUG']._serialized_start=413
+  _globals['_MONORAILBUG']._serialized_end=469
+  _globals['_GOOGLEISSUE']._serialized_start=471
+  _globals['_GOOGLEISSUE']._serialized_end=510
+  _globals['_GOOGLEISSUEDEFAULT']._serialized_start=512
+  _globals['_GOOGLEISSUEDEFAULT']._serialized_end=546
+  _globals['_MONORAILBUGDEFAULT']._serialized_start=548
+  _globals['_MONORAILBUGDEFAULT']._serialized_end=599
+  _globals['_CAUSES']._serialized_start=601
+  _globals['_CAUSES']._serialized_end=647
+  _globals['_CAUSE']._serialized_start=649
+  _globals['_CAUSE']._serialized_end=767
+  _globals['_CALLSITE']._serialized_start=769
+  _globals['_CALLSITE']._serialized_end=857
+  _globals['_IMPORTSITE']._serialized_start=859
+  _globals['_IMPORTSITE']._serialized_end=933
+  _globals['_FRAME']._serialized_start=935
+  _globals['_FRAME']._serialized_end=970
+# @@protoc_insertion_point(module_scope)
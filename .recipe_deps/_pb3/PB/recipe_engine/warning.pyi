@@ -0,0 +1,103 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class DefinitionCollection(_message.Message):
+    __slots__ = ("warning", "monorail_bug_default", "google_issue_default")
+    WARNING_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_BUG_DEFAULT_FIELD_NUMBER: _ClassVar[int]
+    GOOGLE_ISSUE_DEFAULT_FIELD_NUMBER: _ClassVar[int]
+    warning: _containers.RepeatedCompositeFieldContainer[Definition]
+    monorail_bug_default: MonorailBugDefault
+    google_issue_default: GoogleIssueDefault
+    def __init__(self, warning: _Optional[_Iterable[_Union[Definition, _Mapping]]] = ..., monorail_bug_default: _Optional[_Union[MonorailBugDefault, _Mapping]] = ..., google_issue_default: _Optional[_Union[GoogleIssueDefault, _Mapping]] = ...) -> None: ...
+
+class Definition(_message.Message):
+    __slots__ = ("name", "description", "deadline", "monorail_bug", "google_issue")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    DEADLINE_FIELD_NUMBER: _ClassVar[int]
+    MONORAIL_BUG_FIELD_NUMBER: _ClassVar[int]
+    GOOGLE_ISSUE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    description: _containers.RepeatedScalarFieldContainer[str]
+    deadline: str
+    monorail_bug: _containers.RepeatedCompositeFieldContainer[MonorailBug]
+    google_issue: _containers.RepeatedCompositeFieldContainer[GoogleIssue]
+    def __init__(self, name: _Optional[str] = ..., description: _Optional[_Iterable[str]] = ..., deadline: _Optional[str] = ..., monorail_bug: _Optional[_Iterable[_Union[MonorailBug, _Mapping]]] = ..., google_issue: _Optional[_Iterable[_Union[GoogleIssue, _Mapping]]] = ...) -> None: ...
+
+class MonorailBug(_message.Message):
+    __slots__ = ("host", "project", "id")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    id: int
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., id: _Optional[int] = ...) -> None: ...
+
+class GoogleIssue(_message.Message):
+    __slots__ = ("host", "id")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    id: int
+    def __init__(self, host: _Optional[str] = ..., id: _Optional[int] = ...) -> None: ...
+
+class GoogleIssueDefault(_message.Message):
+    __slots__ = ("host",)
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    def __init__(self, host: _Optional[str] = ...) -> None: ...
+
+class MonorailBugDefault(_message.Message):
+    __slots__ = ("host", "project")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ...) -> None: ...
+
+class Causes(_message.Message):
+    __slots__ = ("causes",)
+    CAUSES_FIELD_NUMBER: _ClassVar[int]
+    causes: _containers.RepeatedCompositeFieldContainer[Cause]
+    def __init__(self, causes: _Optional[_Iterable[_Union[Cause, _Mapping]]] = ...) -> None: ...
+
+class Cause(_message.Message):
+    __slots__ = ("call_site", "import_site")
+    CALL_SITE_FIELD_NUMBER: _ClassVar[int]
+    IMPORT_SITE_FIELD_NUMBER: _ClassVar[int]
+    call_site: CallSite
+    import_site: ImportSite
+    def __init__(self, call_site: _Optional[_Union[CallSite, _Mapping]] = ..., import_site: _Optional[_Union[ImportSite, _Mapping]] = ...) -> None: ...
+
+class CallSite(_message.Message):
+    __slots__ = ("site", "call_stack")
+    SITE_FIELD_NUMBER: _ClassVar[int]
+    CALL_STACK_FIELD_NUMBER: _ClassVar[int]
+    site: Frame
+    call_stack: _containers.RepeatedCompositeFieldContainer[Frame]
+    def __init__(self, site: _Optional[_Union[Frame, _Mapping]] = ..., call_stack: _Optional[_Iterable[_Union[Frame, _Mapping]]] = ...) -> None: ...
+
+class ImportSite(_message.Message):
+    __slots__ = ("repo", "module", "recipe")
+    REPO_FIELD_NUMBER: _ClassVar[int]
+    MODULE_FIELD_NUMBER: _ClassVar[int]
+    RECIPE_FIELD_NUMBER: _ClassVar[int]
+    repo: str
+    module: str
+    recipe: str
+    def __init__(self, repo: _Optional[str] = ..., module: _Optional[str] = ..., recipe: _Optional[str] = ...) -> None: ...
+
+class Frame(_message.Message):
+    __slots__ = ("file", "line")
+    FILE_FIELD_NUMBER: _ClassVar[int]
+    LINE_FIELD_NUMBER: _ClassVar[int]
+    file: str
+    line: int
+    def __init__(self, file: _Optional[str] = ..., line: _Optional[int] = ...) -> None: ...
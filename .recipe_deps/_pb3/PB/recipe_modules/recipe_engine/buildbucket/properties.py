@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/buildbucket/properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/buildbucket/properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.buildbucket.proto import build as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_build__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9recipe_modules/recipe_engine/buildbucket/properties.proto\x12(recipe_modules.recipe_engine.buildbucket\x1a\x32go.chromium.org/luci/buildbucket/proto/build.proto\"7\n\x0fInputProperties\x12$\n\x05\x62uild\x18\x01 \x01(\x0b\x32\x15.buildbucket.v2.Build\"\x93\x02\n\x15LegacyInputProperties\x12\x12\n\nmastername\x18\x65 \x01(\t\x12\x13\n\x0b\x62uildername\x18\x66 \x01(\t\x12\x13\n\x0b\x62uildnumber\x18g \x01(\x03\x12\x10\n\x08revision\x18h \x01(\t\x12\x1b\n\x13parent_got_revision\x18i \x01(\t\x12\x0e\n\x06\x62ranch\x18j \x01(\t\x12\x15\n\rpatch_storage\x18o \x01(\t\x12\x18\n\x10patch_gerrit_url\x18p \x01(\t\x12\x15\n\rpatch_project\x18q \x01(\t\x12\x13\n\x0bpatch_issue\x18r \x01(\x03\x12\x11\n\tpatch_set\x18s \x01(\x03\x12\r\n\x05issue\x18t \x01(\x03\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.buildbucket.properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES']._serialized_start=155
+  _globals['_INPUTPROPERTIES']._serialized_end=210
+  _globals['_LEGACYINPUTPROPERTIES']._serialized_start=213
+  _globals['_LEGACYINPUTPROPERTIES']._serialized_end=488
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,41 @@
+from PB.go.chromium.org.luci.buildbucket.proto import build as _build_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("build",)
+    BUILD_FIELD_NUMBER: _ClassVar[int]
+    build: _build_pb2.Build
+    def __init__(self, build: _Optional[_Union[_build_pb2.Build, _Mapping]] = ...) -> None: ...
+
+class LegacyInputProperties(_message.Message):
+    __slots__ = ("mastername", "buildername", "buildnumber", "revision", "parent_got_revision", "branch", "patch_storage", "patch_gerrit_url", "patch_project", "patch_issue", "patch_set", "issue")
+    MASTERNAME_FIELD_NUMBER: _ClassVar[int]
+    BUILDERNAME_FIELD_NUMBER: _ClassVar[int]
+    BUILDNUMBER_FIELD_NUMBER: _ClassVar[int]
+    REVISION_FIELD_NUMBER: _ClassVar[int]
+    PARENT_GOT_REVISION_FIELD_NUMBER: _ClassVar[int]
+    BRANCH_FIELD_NUMBER: _ClassVar[int]
+    PATCH_STORAGE_FIELD_NUMBER: _ClassVar[int]
+    PATCH_GERRIT_URL_FIELD_NUMBER: _ClassVar[int]
+    PATCH_PROJECT_FIELD_NUMBER: _ClassVar[int]
+    PATCH_ISSUE_FIELD_NUMBER: _ClassVar[int]
+    PATCH_SET_FIELD_NUMBER: _ClassVar[int]
+    ISSUE_FIELD_NUMBER: _ClassVar[int]
+    mastername: str
+    buildername: str
+    buildnumber: int
+    revision: str
+    parent_got_revision: str
+    branch: str
+    patch_storage: str
+    patch_gerrit_url: str
+    patch_project: str
+    patch_issue: int
+    patch_set: int
+    issue: int
+    def __init__(self, mastername: _Optional[str] = ..., buildername: _Optional[str] = ..., buildnumber: _Optional[int] = ..., revision: _Optional[str] = ..., parent_got_revision: _Optional[str] = ..., branch: _Optional[str] = ..., patch_storage: _Optional[str] = ..., patch_gerrit_url: _Optional[str] = ..., patch_project: _Optional[str] = ..., patch_issue: _Optional[int] = ..., patch_set: _Optional[int] = ..., issue: _Optional[int] = ...) -> None: ...
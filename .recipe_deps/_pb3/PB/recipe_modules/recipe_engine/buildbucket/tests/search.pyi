@@ -0,0 +1,16 @@
+from PB.go.chromium.org.luci.buildbucket.proto import build as _build_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SearchInputProps(_message.Message):
+    __slots__ = ("builds", "dup_predicate")
+    BUILDS_FIELD_NUMBER: _ClassVar[int]
+    DUP_PREDICATE_FIELD_NUMBER: _ClassVar[int]
+    builds: _containers.RepeatedCompositeFieldContainer[_build_pb2.Build]
+    dup_predicate: bool
+    def __init__(self, builds: _Optional[_Iterable[_Union[_build_pb2.Build, _Mapping]]] = ..., dup_predicate: bool = ...) -> None: ...
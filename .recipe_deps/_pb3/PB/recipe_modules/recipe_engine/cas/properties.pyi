@@ -0,0 +1,11 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class EnvProperties(_message.Message):
+    __slots__ = ("SWARMING_SERVER",)
+    SWARMING_SERVER_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_SERVER: str
+    def __init__(self, SWARMING_SERVER: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/cas_input/properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/cas_input/properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7recipe_modules/recipe_engine/cas_input/properties.proto\x12&recipe_modules.recipe_engine.cas_input\"1\n\x08\x43\x61sCache\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\x12\x15\n\rlocal_relpath\x18\x03 \x01(\t\"S\n\x0fInputProperties\x12@\n\x06\x63\x61\x63hes\x18\x01 \x03(\x0b\x32\x30.recipe_modules.recipe_engine.cas_input.CasCacheb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.cas_input.properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_CASCACHE']._serialized_start=99
+  _globals['_CASCACHE']._serialized_end=148
+  _globals['_INPUTPROPERTIES']._serialized_start=150
+  _globals['_INPUTPROPERTIES']._serialized_end=233
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,21 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class CasCache(_message.Message):
+    __slots__ = ("digest", "local_relpath")
+    DIGEST_FIELD_NUMBER: _ClassVar[int]
+    LOCAL_RELPATH_FIELD_NUMBER: _ClassVar[int]
+    digest: str
+    local_relpath: str
+    def __init__(self, digest: _Optional[str] = ..., local_relpath: _Optional[str] = ...) -> None: ...
+
+class InputProperties(_message.Message):
+    __slots__ = ("caches",)
+    CACHES_FIELD_NUMBER: _ClassVar[int]
+    caches: _containers.RepeatedCompositeFieldContainer[CasCache]
+    def __init__(self, caches: _Optional[_Iterable[_Union[CasCache, _Mapping]]] = ...) -> None: ...
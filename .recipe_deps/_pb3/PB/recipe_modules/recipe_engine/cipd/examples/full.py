@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/cipd/examples/full.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/cipd/examples/full.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5recipe_modules/recipe_engine/cipd/examples/full.proto\x12/recipe_modules.recipe_engine.cipd.examples.full\".\n\nPackageDir\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x12\n\nexclusions\x18\x02 \x03(\t\"\xfa\x03\n\x0fInputProperties\x12\x0f\n\x07use_pkg\x18\x01 \x01(\x08\x12\x11\n\tpkg_files\x18\x02 \x03(\t\x12M\n\x08pkg_dirs\x18\x03 \x03(\x0b\x32;.recipe_modules.recipe_engine.cipd.examples.full.PackageDir\x12_\n\x08pkg_vars\x18\x04 \x03(\x0b\x32M.recipe_modules.recipe_engine.cipd.examples.full.InputProperties.PkgVarsEntry\x12\x11\n\tver_files\x18\x05 \x03(\t\x12\x14\n\x0cinstall_mode\x18\x06 \x01(\t\x12\x0c\n\x04refs\x18\x07 \x03(\t\x12X\n\x04tags\x18\x08 \x03(\x0b\x32J.recipe_modules.recipe_engine.cipd.examples.full.InputProperties.TagsEntry\x12\x10\n\x08metadata\x18\t \x03(\t\x12\x13\n\x0bmax_threads\x18\n \x01(\x05\x1a.\n\x0cPkgVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a+\n\tTagsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.cipd.examples.full_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES_PKGVARSENTRY']._loaded_options = None
+  _globals['_INPUTPROPERTIES_PKGVARSENTRY']._serialized_options = b'8\001'
+  _globals['_INPUTPROPERTIES_TAGSENTRY']._loaded_options = None
+  _globals['_INPUTPROPERTIES_TAGSENTRY']._serialized_options = b'8\001'
+  _globals['_PACKAGEDIR']._serialized_start=106
+  _globals['_PACKAGEDIR']._serialized_end=152
+  _globals['_INPUTPROPERTIES']._serialized_start=155
+  _globals['_INPUTPROPERTIES']._serialized_end=661
+  _globals['_INPUTPROPERTIES_PKGVARSENTRY']._serialized_start=570
+  _globals['_INPUTPROPERTIES_PKGVARSENTRY']._serialized_end=616
+  _globals['_INPUTPROPERTIES_TAGSENTRY']._serialized_start=618
+  _globals['_INPUTPROPERTIES_TAGSENTRY']._serialized_end=661
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,53 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class PackageDir(_message.Message):
+    __slots__ = ("path", "exclusions")
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    EXCLUSIONS_FIELD_NUMBER: _ClassVar[int]
+    path: str
+    exclusions: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, path: _Optional[str] = ..., exclusions: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class InputProperties(_message.Message):
+    __slots__ = ("use_pkg", "pkg_files", "pkg_dirs", "pkg_vars", "ver_files", "install_mode", "refs", "tags", "metadata", "max_threads")
+    class PkgVarsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    class TagsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    USE_PKG_FIELD_NUMBER: _ClassVar[int]
+    PKG_FILES_FIELD_NUMBER: _ClassVar[int]
+    PKG_DIRS_FIELD_NUMBER: _ClassVar[int]
+    PKG_VARS_FIELD_NUMBER: _ClassVar[int]
+    VER_FILES_FIELD_NUMBER: _ClassVar[int]
+    INSTALL_MODE_FIELD_NUMBER: _ClassVar[int]
+    REFS_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    MAX_THREADS_FIELD_NUMBER: _ClassVar[int]
+    use_pkg: bool
+    pkg_files: _containers.RepeatedScalarFieldContainer[str]
+    pkg_dirs: _containers.RepeatedCompositeFieldContainer[PackageDir]
+    pkg_vars: _containers.ScalarMap[str, str]
+    ver_files: _containers.RepeatedScalarFieldContainer[str]
+    install_mode: str
+    refs: _containers.RepeatedScalarFieldContainer[str]
+    tags: _containers.ScalarMap[str, str]
+    metadata: _containers.RepeatedScalarFieldContainer[str]
+    max_threads: int
+    def __init__(self, use_pkg: bool = ..., pkg_files: _Optional[_Iterable[str]] = ..., pkg_dirs: _Optional[_Iterable[_Union[PackageDir, _Mapping]]] = ..., pkg_vars: _Optional[_Mapping[str, str]] = ..., ver_files: _Optional[_Iterable[str]] = ..., install_mode: _Optional[str] = ..., refs: _Optional[_Iterable[str]] = ..., tags: _Optional[_Mapping[str, str]] = ..., metadata: _Optional[_Iterable[str]] = ..., max_threads: _Optional[int] = ...) -> None: ...
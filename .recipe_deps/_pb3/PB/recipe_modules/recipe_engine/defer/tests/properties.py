@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/defer/tests/properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/defer/tests/properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9recipe_modules/recipe_engine/defer/tests/properties.proto\x12\x33recipe_modules.recipe_engine.defer.tests.properties\"9\n\x11\x43ollectInputProps\x12\x11\n\texception\x18\x01 \x01(\x08\x12\x11\n\tstep_name\x18\x02 \x01(\t\"9\n\x11\x43ontextInputProps\x12\x11\n\texception\x18\x01 \x01(\x08\x12\x11\n\tstep_name\x18\x02 \x01(\t\"M\n\x10ResultInputProps\x12\x13\n\x0binfra_steps\x18\x01 \x01(\x08\x12\x11\n\texception\x18\x02 \x01(\x08\x12\x11\n\tstep_name\x18\x03 \x01(\t\"%\n\x15NonDeferredInputProps\x12\x0c\n\x04\x66\x61il\x18\x01 \x01(\x08\"$\n\x14SuppressedInputProps\x12\x0c\n\x04\x66\x61il\x18\x01 \x01(\x08\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.defer.tests.properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_COLLECTINPUTPROPS']._serialized_start=114
+  _globals['_COLLECTINPUTPROPS']._serialized_end=171
+  _globals['_CONTEXTINPUTPROPS']._serialized_start=173
+  _globals['_CONTEXTINPUTPROPS']._serialized_end=230
+  _globals['_RESULTINPUTPROPS']._serialized_start=232
+  _globals['_RESULTINPUTPROPS']._serialized_end=309
+  _globals['_NONDEFERREDINPUTPROPS']._serialized_start=311
+  _globals['_NONDEFERREDINPUTPROPS']._serialized_end=348
+  _globals['_SUPPRESSEDINPUTPROPS']._serialized_start=350
+  _globals['_SUPPRESSEDINPUTPROPS']._serialized_end=386
+# @@protoc_insertion_point(module_scope)
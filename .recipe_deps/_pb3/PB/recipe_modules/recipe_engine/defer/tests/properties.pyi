@@ -0,0 +1,43 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class CollectInputProps(_message.Message):
+    __slots__ = ("exception", "step_name")
+    EXCEPTION_FIELD_NUMBER: _ClassVar[int]
+    STEP_NAME_FIELD_NUMBER: _ClassVar[int]
+    exception: bool
+    step_name: str
+    def __init__(self, exception: bool = ..., step_name: _Optional[str] = ...) -> None: ...
+
+class ContextInputProps(_message.Message):
+    __slots__ = ("exception", "step_name")
+    EXCEPTION_FIELD_NUMBER: _ClassVar[int]
+    STEP_NAME_FIELD_NUMBER: _ClassVar[int]
+    exception: bool
+    step_name: str
+    def __init__(self, exception: bool = ..., step_name: _Optional[str] = ...) -> None: ...
+
+class ResultInputProps(_message.Message):
+    __slots__ = ("infra_steps", "exception", "step_name")
+    INFRA_STEPS_FIELD_NUMBER: _ClassVar[int]
+    EXCEPTION_FIELD_NUMBER: _ClassVar[int]
+    STEP_NAME_FIELD_NUMBER: _ClassVar[int]
+    infra_steps: bool
+    exception: bool
+    step_name: str
+    def __init__(self, infra_steps: bool = ..., exception: bool = ..., step_name: _Optional[str] = ...) -> None: ...
+
+class NonDeferredInputProps(_message.Message):
+    __slots__ = ("fail",)
+    FAIL_FIELD_NUMBER: _ClassVar[int]
+    fail: bool
+    def __init__(self, fail: bool = ...) -> None: ...
+
+class SuppressedInputProps(_message.Message):
+    __slots__ = ("fail",)
+    FAIL_FIELD_NUMBER: _ClassVar[int]
+    fail: bool
+    def __init__(self, fail: bool = ...) -> None: ...
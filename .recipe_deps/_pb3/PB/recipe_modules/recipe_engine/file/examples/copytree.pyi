@@ -0,0 +1,15 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Properties(_message.Message):
+    __slots__ = ("symlinks", "hardlink", "allow_override")
+    SYMLINKS_FIELD_NUMBER: _ClassVar[int]
+    HARDLINK_FIELD_NUMBER: _ClassVar[int]
+    ALLOW_OVERRIDE_FIELD_NUMBER: _ClassVar[int]
+    symlinks: bool
+    hardlink: bool
+    allow_override: bool
+    def __init__(self, symlinks: bool = ..., hardlink: bool = ..., allow_override: bool = ...) -> None: ...
@@ -0,0 +1,11 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("script_name",)
+    SCRIPT_NAME_FIELD_NUMBER: _ClassVar[int]
+    script_name: str
+    def __init__(self, script_name: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/led/properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/led/properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.swarming.proto.api_v2 import swarming as go_dot_chromium_dot_org_dot_luci_dot_swarming_dot_proto_dot_api__v2_dot_swarming__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n1recipe_modules/recipe_engine/led/properties.proto\x12 recipe_modules.recipe_engine.led\x1a\x39go.chromium.org/luci/swarming/proto/api_v2/swarming.proto\"\xf6\x01\n\x0fInputProperties\x12O\n\ncipd_input\x18\x03 \x01(\x0b\x32;.recipe_modules.recipe_engine.led.InputProperties.CIPDInput\x12\x12\n\nled_run_id\x18\x04 \x01(\t\x12\x30\n\rrbe_cas_input\x18\x05 \x01(\x0b\x32\x19.swarming.v2.CASReference\x12\x17\n\x0fshadowed_bucket\x18\x06 \x01(\t\x1a-\n\tCIPDInput\x12\x0f\n\x07package\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\tJ\x04\x08\x01\x10\x02\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.led.properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES']._serialized_start=147
+  _globals['_INPUTPROPERTIES']._serialized_end=393
+  _globals['_INPUTPROPERTIES_CIPDINPUT']._serialized_start=342
+  _globals['_INPUTPROPERTIES_CIPDINPUT']._serialized_end=387
+# @@protoc_insertion_point(module_scope)
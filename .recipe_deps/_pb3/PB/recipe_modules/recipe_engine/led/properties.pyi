@@ -0,0 +1,26 @@
+from PB.go.chromium.org.luci.swarming.proto.api_v2 import swarming as _swarming_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("cipd_input", "led_run_id", "rbe_cas_input", "shadowed_bucket")
+    class CIPDInput(_message.Message):
+        __slots__ = ("package", "version")
+        PACKAGE_FIELD_NUMBER: _ClassVar[int]
+        VERSION_FIELD_NUMBER: _ClassVar[int]
+        package: str
+        version: str
+        def __init__(self, package: _Optional[str] = ..., version: _Optional[str] = ...) -> None: ...
+    CIPD_INPUT_FIELD_NUMBER: _ClassVar[int]
+    LED_RUN_ID_FIELD_NUMBER: _ClassVar[int]
+    RBE_CAS_INPUT_FIELD_NUMBER: _ClassVar[int]
+    SHADOWED_BUCKET_FIELD_NUMBER: _ClassVar[int]
+    cipd_input: InputProperties.CIPDInput
+    led_run_id: str
+    rbe_cas_input: _swarming_pb2.CASReference
+    shadowed_bucket: str
+    def __init__(self, cipd_input: _Optional[_Union[InputProperties.CIPDInput, _Mapping]] = ..., led_run_id: _Optional[str] = ..., rbe_cas_input: _Optional[_Union[_swarming_pb2.CASReference, _Mapping]] = ..., shadowed_bucket: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/led/tests/full.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/led/tests/full.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n1recipe_modules/recipe_engine/led/tests/full.proto\x12+recipe_modules.recipe_engine.led.tests.full\"\x97\x03\n\x0fInputProperties\x12k\n\x10\x63hild_properties\x18\x01 \x03(\x0b\x32Q.recipe_modules.recipe_engine.led.tests.full.InputProperties.ChildPropertiesEntry\x12x\n\x17sloppy_child_properties\x18\x02 \x03(\x0b\x32W.recipe_modules.recipe_engine.led.tests.full.InputProperties.SloppyChildPropertiesEntry\x12\x0f\n\x07get_cmd\x18\x03 \x03(\t\x12\x16\n\x0e\x64o_bogus_edits\x18\x04 \x01(\x08\x1a\x36\n\x14\x43hildPropertiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a<\n\x1aSloppyChildPropertiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.led.tests.full_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES_CHILDPROPERTIESENTRY']._loaded_options = None
+  _globals['_INPUTPROPERTIES_CHILDPROPERTIESENTRY']._serialized_options = b'8\001'
+  _globals['_INPUTPROPERTIES_SLOPPYCHILDPROPERTIESENTRY']._loaded_options = None
+  _globals['_INPUTPROPERTIES_SLOPPYCHILDPROPERTIESENTRY']._serialized_options = b'8\001'
+  _globals['_INPUTPROPERTIES']._serialized_start=99
+  _globals['_INPUTPROPERTIES']._serialized_end=506
+  _globals['_INPUTPROPERTIES_CHILDPROPERTIESENTRY']._serialized_start=390
+  _globals['_INPUTPROPERTIES_CHILDPROPERTIESENTRY']._serialized_end=444
+  _globals['_INPUTPROPERTIES_SLOPPYCHILDPROPERTIESENTRY']._serialized_start=446
+  _globals['_INPUTPROPERTIES_SLOPPYCHILDPROPERTIESENTRY']._serialized_end=506
+# @@protoc_insertion_point(module_scope)
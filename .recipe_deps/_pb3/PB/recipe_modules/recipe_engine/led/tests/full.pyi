@@ -0,0 +1,33 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("child_properties", "sloppy_child_properties", "get_cmd", "do_bogus_edits")
+    class ChildPropertiesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    class SloppyChildPropertiesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    CHILD_PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    SLOPPY_CHILD_PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    GET_CMD_FIELD_NUMBER: _ClassVar[int]
+    DO_BOGUS_EDITS_FIELD_NUMBER: _ClassVar[int]
+    child_properties: _containers.ScalarMap[str, str]
+    sloppy_child_properties: _containers.ScalarMap[str, str]
+    get_cmd: _containers.RepeatedScalarFieldContainer[str]
+    do_bogus_edits: bool
+    def __init__(self, child_properties: _Optional[_Mapping[str, str]] = ..., sloppy_child_properties: _Optional[_Mapping[str, str]] = ..., get_cmd: _Optional[_Iterable[str]] = ..., do_bogus_edits: bool = ...) -> None: ...
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/luci_analysis/tests/query_failure_rate_test.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/luci_analysis/tests/query_failure_rate_test.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nNrecipe_modules/recipe_engine/luci_analysis/tests/query_failure_rate_test.proto\x12Hrecipe_modules.recipe_engine.luci_analysis.tests.query_failure_rate_test\"I\n\x0bTestVariant\x12\x17\n\x07test_id\x18\x01 \x01(\tR\x06testId\x12!\n\x0cvariant_hash\x18\x02 \x01(\tR\x0bvariantHash\"|\n\x0fInputProperties\x12i\n\ninput_list\x18\x01 \x03(\x0b\x32U.recipe_modules.recipe_engine.luci_analysis.tests.query_failure_rate_test.TestVariantb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.luci_analysis.tests.query_failure_rate_test_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_TESTVARIANT']._serialized_start=156
+  _globals['_TESTVARIANT']._serialized_end=229
+  _globals['_INPUTPROPERTIES']._serialized_start=231
+  _globals['_INPUTPROPERTIES']._serialized_end=355
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,21 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestVariant(_message.Message):
+    __slots__ = ("test_id", "variant_hash")
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_HASH_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant_hash: str
+    def __init__(self, test_id: _Optional[str] = ..., variant_hash: _Optional[str] = ...) -> None: ...
+
+class InputProperties(_message.Message):
+    __slots__ = ("input_list",)
+    INPUT_LIST_FIELD_NUMBER: _ClassVar[int]
+    input_list: _containers.RepeatedCompositeFieldContainer[TestVariant]
+    def __init__(self, input_list: _Optional[_Iterable[_Union[TestVariant, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/luci_analysis/tests/query_stability_test.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/luci_analysis/tests/query_stability_test.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nKrecipe_modules/recipe_engine/luci_analysis/tests/query_stability_test.proto\x12\x45recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test\"M\n\nChangelist\x12\x0e\n\x06\x63hange\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x10\n\x08patchset\x18\x03 \x01(\t\x12\x0f\n\x07project\x18\x04 \x01(\t\"n\n\rGitilesCommit\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\x12\x1f\n\x0b\x63ommit_hash\x18\x04 \x01(\tR\ncommitHash\x12\x10\n\x08position\x18\x05 \x01(\t\"\xee\x01\n\x07Sources\x12\x66\n\x0b\x63hangelists\x18\x01 \x03(\x0b\x32Q.recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test.Changelist\x12{\n\x0egitiles_commit\x18\x02 \x01(\x0b\x32T.recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test.GitilesCommitR\rgitilesCommit\"\x9b\x01\n\x07Variant\x12\x64\n\x03\x64\x65\x66\x18\x01 \x03(\x0b\x32W.recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test.Variant.DefEntry\x1a*\n\x08\x44\x65\x66\x45ntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xe8\x01\n\x0bTestVariant\x12\x17\n\x07test_id\x18\x01 \x01(\tR\x06testId\x12_\n\x07variant\x18\x02 \x01(\x0b\x32N.recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test.Variant\x12_\n\x07sources\x18\x03 \x01(\x0b\x32N.recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test.Sources\"y\n\x0fInputProperties\x12\x66\n\ninput_list\x18\x01 \x03(\x0b\x32R.recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test.TestVariantb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.luci_analysis.tests.query_stability_test_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_VARIANT_DEFENTRY']._loaded_options = None
+  _globals['_VARIANT_DEFENTRY']._serialized_options = b'8\001'
+  _globals['_CHANGELIST']._serialized_start=150
+  _globals['_CHANGELIST']._serialized_end=227
+  _globals['_GITILESCOMMIT']._serialized_start=229
+  _globals['_GITILESCOMMIT']._serialized_end=339
+  _globals['_SOURCES']._serialized_start=342
+  _globals['_SOURCES']._serialized_end=580
+  _globals['_VARIANT']._serialized_start=583
+  _globals['_VARIANT']._serialized_end=738
+  _globals['_VARIANT_DEFENTRY']._serialized_start=696
+  _globals['_VARIANT_DEFENTRY']._serialized_end=738
+  _globals['_TESTVARIANT']._serialized_start=741
+  _globals['_TESTVARIANT']._serialized_end=973
+  _globals['_INPUTPROPERTIES']._serialized_start=975
+  _globals['_INPUTPROPERTIES']._serialized_end=1096
+# @@protoc_insertion_point(module_scope)
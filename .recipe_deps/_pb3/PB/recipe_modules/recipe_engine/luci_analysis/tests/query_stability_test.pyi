@@ -0,0 +1,69 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Changelist(_message.Message):
+    __slots__ = ("change", "host", "patchset", "project")
+    CHANGE_FIELD_NUMBER: _ClassVar[int]
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PATCHSET_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    change: str
+    host: str
+    patchset: str
+    project: str
+    def __init__(self, change: _Optional[str] = ..., host: _Optional[str] = ..., patchset: _Optional[str] = ..., project: _Optional[str] = ...) -> None: ...
+
+class GitilesCommit(_message.Message):
+    __slots__ = ("host", "project", "ref", "commit_hash", "position")
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_FIELD_NUMBER: _ClassVar[int]
+    REF_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_HASH_FIELD_NUMBER: _ClassVar[int]
+    POSITION_FIELD_NUMBER: _ClassVar[int]
+    host: str
+    project: str
+    ref: str
+    commit_hash: str
+    position: str
+    def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ..., commit_hash: _Optional[str] = ..., position: _Optional[str] = ...) -> None: ...
+
+class Sources(_message.Message):
+    __slots__ = ("changelists", "gitiles_commit")
+    CHANGELISTS_FIELD_NUMBER: _ClassVar[int]
+    GITILES_COMMIT_FIELD_NUMBER: _ClassVar[int]
+    changelists: _containers.RepeatedCompositeFieldContainer[Changelist]
+    gitiles_commit: GitilesCommit
+    def __init__(self, changelists: _Optional[_Iterable[_Union[Changelist, _Mapping]]] = ..., gitiles_commit: _Optional[_Union[GitilesCommit, _Mapping]] = ...) -> None: ...
+
+class Variant(_message.Message):
+    __slots__ = ()
+    class DefEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    DEF_FIELD_NUMBER: _ClassVar[int]
+    def __init__(self, **kwargs) -> None: ...
+
+class TestVariant(_message.Message):
+    __slots__ = ("test_id", "variant", "sources")
+    TEST_ID_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    SOURCES_FIELD_NUMBER: _ClassVar[int]
+    test_id: str
+    variant: Variant
+    sources: Sources
+    def __init__(self, test_id: _Optional[str] = ..., variant: _Optional[_Union[Variant, _Mapping]] = ..., sources: _Optional[_Union[Sources, _Mapping]] = ...) -> None: ...
+
+class InputProperties(_message.Message):
+    __slots__ = ("input_list",)
+    INPUT_LIST_FIELD_NUMBER: _ClassVar[int]
+    input_list: _containers.RepeatedCompositeFieldContainer[TestVariant]
+    def __init__(self, input_list: _Optional[_Iterable[_Union[TestVariant, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,15 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("temp_dir", "cache_dir", "cleanup_dir")
+    TEMP_DIR_FIELD_NUMBER: _ClassVar[int]
+    CACHE_DIR_FIELD_NUMBER: _ClassVar[int]
+    CLEANUP_DIR_FIELD_NUMBER: _ClassVar[int]
+    temp_dir: str
+    cache_dir: str
+    cleanup_dir: str
+    def __init__(self, temp_dir: _Optional[str] = ..., cache_dir: _Optional[str] = ..., cleanup_dir: _Optional[str] = ...) -> None: ...
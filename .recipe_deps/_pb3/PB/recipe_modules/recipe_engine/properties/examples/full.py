@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/properties/examples/full.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/properties/examples/full.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;recipe_modules/recipe_engine/properties/examples/full.proto\x12\x35recipe_modules.recipe_engine.properties.examples.full\x1a\x1cgoogle/protobuf/struct.proto\"\xe3\x01\n\nInputProps\x12_\n\ttest_prop\x18\x01 \x01(\x0b\x32L.recipe_modules.recipe_engine.properties.examples.full.InputProps.SubMessage\x12\x0c\n\x04list\x18\x02 \x03(\t\x12%\n\x04\x64ict\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12$\n\x0fparam_name_test\x18\x04 \x01(\tR\x0b\x66oo.bar-bam\x1a\x19\n\nSubMessage\x12\x0b\n\x03key\x18\x01 \x01(\t\"-\n\x08\x45nvProps\x12\x10\n\x08\x46ROM_ENV\x18\x01 \x01(\t\x12\x0f\n\x07\x45NV_INT\x18\x02 \x01(\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.properties.examples.full_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPS']._serialized_start=149
+  _globals['_INPUTPROPS']._serialized_end=376
+  _globals['_INPUTPROPS_SUBMESSAGE']._serialized_start=351
+  _globals['_INPUTPROPS_SUBMESSAGE']._serialized_end=376
+  _globals['_ENVPROPS']._serialized_start=378
+  _globals['_ENVPROPS']._serialized_end=423
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,33 @@
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProps(_message.Message):
+    __slots__ = ("test_prop", "list", "dict", "param_name_test")
+    class SubMessage(_message.Message):
+        __slots__ = ("key",)
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        def __init__(self, key: _Optional[str] = ...) -> None: ...
+    TEST_PROP_FIELD_NUMBER: _ClassVar[int]
+    LIST_FIELD_NUMBER: _ClassVar[int]
+    DICT_FIELD_NUMBER: _ClassVar[int]
+    PARAM_NAME_TEST_FIELD_NUMBER: _ClassVar[int]
+    test_prop: InputProps.SubMessage
+    list: _containers.RepeatedScalarFieldContainer[str]
+    dict: _struct_pb2.Struct
+    param_name_test: str
+    def __init__(self, test_prop: _Optional[_Union[InputProps.SubMessage, _Mapping]] = ..., list: _Optional[_Iterable[str]] = ..., dict: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., param_name_test: _Optional[str] = ...) -> None: ...
+
+class EnvProps(_message.Message):
+    __slots__ = ("FROM_ENV", "ENV_INT")
+    FROM_ENV_FIELD_NUMBER: _ClassVar[int]
+    ENV_INT_FIELD_NUMBER: _ClassVar[int]
+    FROM_ENV: str
+    ENV_INT: int
+    def __init__(self, FROM_ENV: _Optional[str] = ..., ENV_INT: _Optional[int] = ...) -> None: ...
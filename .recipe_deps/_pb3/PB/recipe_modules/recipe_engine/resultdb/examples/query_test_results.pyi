@@ -0,0 +1,13 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("invocation", "test_id_regexp")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    TEST_ID_REGEXP_FIELD_NUMBER: _ClassVar[int]
+    invocation: str
+    test_id_regexp: str
+    def __init__(self, invocation: _Optional[str] = ..., test_id_regexp: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,17 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("invocation", "test_variant_status", "field_mask_paths")
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    TEST_VARIANT_STATUS_FIELD_NUMBER: _ClassVar[int]
+    FIELD_MASK_PATHS_FIELD_NUMBER: _ClassVar[int]
+    invocation: str
+    test_variant_status: str
+    field_mask_paths: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, invocation: _Optional[str] = ..., test_variant_status: _Optional[str] = ..., field_mask_paths: _Optional[_Iterable[str]] = ...) -> None: ...
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/resultdb/examples/update_invocation.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/resultdb/examples/update_invocation.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nFrecipe_modules/recipe_engine/resultdb/examples/update_invocation.proto\x12@recipe_modules.recipe_engine.resultdb.examples.update_invocation\"\xfb\x03\n\x0fInputProperties\x12\x88\x01\n\x0egitiles_commit\x18\x01 \x01(\x0b\x32_.recipe_modules.recipe_engine.resultdb.examples.update_invocation.InputProperties.GitilesCommitR\x0fgitiles_commits\x12\x86\x01\n\x0egerrit_changes\x18\x02 \x03(\x0b\x32^.recipe_modules.recipe_engine.resultdb.examples.update_invocation.InputProperties.GerritChangeR\x0egerrit_changes\x12\x12\n\ninvocation\x18\x03 \x01(\t\x1ao\n\rGitilesCommit\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\x12\x10\n\x08position\x18\x04 \x01(\r\x12 \n\x0b\x63ommit_hash\x18\x05 \x01(\tR\x0b\x63ommit_hash\x1aO\n\x0cGerritChange\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12\x0e\n\x06\x63hange\x18\x03 \x01(\x03\x12\x10\n\x08patchset\x18\x04 \x01(\x03\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.resultdb.examples.update_invocation_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES']._serialized_start=141
+  _globals['_INPUTPROPERTIES']._serialized_end=648
+  _globals['_INPUTPROPERTIES_GITILESCOMMIT']._serialized_start=456
+  _globals['_INPUTPROPERTIES_GITILESCOMMIT']._serialized_end=567
+  _globals['_INPUTPROPERTIES_GERRITCHANGE']._serialized_start=569
+  _globals['_INPUTPROPERTIES_GERRITCHANGE']._serialized_end=648
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,41 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("gitiles_commit", "gerrit_changes", "invocation")
+    class GitilesCommit(_message.Message):
+        __slots__ = ("host", "project", "ref", "position", "commit_hash")
+        HOST_FIELD_NUMBER: _ClassVar[int]
+        PROJECT_FIELD_NUMBER: _ClassVar[int]
+        REF_FIELD_NUMBER: _ClassVar[int]
+        POSITION_FIELD_NUMBER: _ClassVar[int]
+        COMMIT_HASH_FIELD_NUMBER: _ClassVar[int]
+        host: str
+        project: str
+        ref: str
+        position: int
+        commit_hash: str
+        def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., ref: _Optional[str] = ..., position: _Optional[int] = ..., commit_hash: _Optional[str] = ...) -> None: ...
+    class GerritChange(_message.Message):
+        __slots__ = ("host", "project", "change", "patchset")
+        HOST_FIELD_NUMBER: _ClassVar[int]
+        PROJECT_FIELD_NUMBER: _ClassVar[int]
+        CHANGE_FIELD_NUMBER: _ClassVar[int]
+        PATCHSET_FIELD_NUMBER: _ClassVar[int]
+        host: str
+        project: str
+        change: int
+        patchset: int
+        def __init__(self, host: _Optional[str] = ..., project: _Optional[str] = ..., change: _Optional[int] = ..., patchset: _Optional[int] = ...) -> None: ...
+    GITILES_COMMIT_FIELD_NUMBER: _ClassVar[int]
+    GERRIT_CHANGES_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    gitiles_commit: InputProperties.GitilesCommit
+    gerrit_changes: _containers.RepeatedCompositeFieldContainer[InputProperties.GerritChange]
+    invocation: str
+    def __init__(self, gitiles_commit: _Optional[_Union[InputProperties.GitilesCommit, _Mapping]] = ..., gerrit_changes: _Optional[_Iterable[_Union[InputProperties.GerritChange, _Mapping]]] = ..., invocation: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,11 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("is_experimental",)
+    IS_EXPERIMENTAL_FIELD_NUMBER: _ClassVar[int]
+    is_experimental: bool
+    def __init__(self, is_experimental: bool = ...) -> None: ...
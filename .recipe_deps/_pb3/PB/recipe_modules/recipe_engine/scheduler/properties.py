@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/scheduler/properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/scheduler/properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.scheduler.api.scheduler.v1 import triggers as go_dot_chromium_dot_org_dot_luci_dot_scheduler_dot_api_dot_scheduler_dot_v1_dot_triggers__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7recipe_modules/recipe_engine/scheduler/properties.proto\x12&recipe_modules.recipe_engine.scheduler\x1a>go.chromium.org/luci/scheduler/api/scheduler/v1/triggers.proto\"j\n\x0fInputProperties\x12\x10\n\x08hostname\x18\x01 \x01(\t\x12\x0b\n\x03job\x18\x02 \x01(\t\x12\x12\n\ninvocation\x18\x03 \x01(\t\x12$\n\x08triggers\x18\x04 \x03(\x0b\x32\x12.scheduler.Triggerb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.scheduler.properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES']._serialized_start=163
+  _globals['_INPUTPROPERTIES']._serialized_end=269
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,20 @@
+from PB.go.chromium.org.luci.scheduler.api.scheduler.v1 import triggers as _triggers_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("hostname", "job", "invocation", "triggers")
+    HOSTNAME_FIELD_NUMBER: _ClassVar[int]
+    JOB_FIELD_NUMBER: _ClassVar[int]
+    INVOCATION_FIELD_NUMBER: _ClassVar[int]
+    TRIGGERS_FIELD_NUMBER: _ClassVar[int]
+    hostname: str
+    job: str
+    invocation: str
+    triggers: _containers.RepeatedCompositeFieldContainer[_triggers_pb2.Trigger]
+    def __init__(self, hostname: _Optional[str] = ..., job: _Optional[str] = ..., invocation: _Optional[str] = ..., triggers: _Optional[_Iterable[_Union[_triggers_pb2.Trigger, _Mapping]]] = ...) -> None: ...
@@ -0,0 +1,15 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("key_path", "scopes")
+    KEY_PATH_FIELD_NUMBER: _ClassVar[int]
+    SCOPES_FIELD_NUMBER: _ClassVar[int]
+    key_path: str
+    scopes: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, key_path: _Optional[str] = ..., scopes: _Optional[_Iterable[str]] = ...) -> None: ...
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/step/examples/full.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/step/examples/full.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5recipe_modules/recipe_engine/step/examples/full.proto\x12/recipe_modules.recipe_engine.step.examples.full\"|\n\x0fInputProperties\x12\x1b\n\x13\x61\x63\x63\x65ss_invalid_data\x18\x01 \x01(\x08\x12 \n\x18\x61\x63\x63\x65ss_deep_invalid_data\x18\x02 \x01(\x08\x12\x19\n\x11\x61ssign_extra_junk\x18\x03 \x01(\x08\x12\x0f\n\x07timeout\x18\x04 \x01(\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.step.examples.full_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES']._serialized_start=106
+  _globals['_INPUTPROPERTIES']._serialized_end=230
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,17 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("access_invalid_data", "access_deep_invalid_data", "assign_extra_junk", "timeout")
+    ACCESS_INVALID_DATA_FIELD_NUMBER: _ClassVar[int]
+    ACCESS_DEEP_INVALID_DATA_FIELD_NUMBER: _ClassVar[int]
+    ASSIGN_EXTRA_JUNK_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_FIELD_NUMBER: _ClassVar[int]
+    access_invalid_data: bool
+    access_deep_invalid_data: bool
+    assign_extra_junk: bool
+    timeout: int
+    def __init__(self, access_invalid_data: bool = ..., access_deep_invalid_data: bool = ..., assign_extra_junk: bool = ..., timeout: _Optional[int] = ...) -> None: ...
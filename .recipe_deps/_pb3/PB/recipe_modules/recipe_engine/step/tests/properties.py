@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/step/tests/properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/step/tests/properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.go.chromium.org.luci.buildbucket.proto import build as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_build__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n8recipe_modules/recipe_engine/step/tests/properties.proto\x12\x32recipe_modules.recipe_engine.step.tests.properties\x1a\x32go.chromium.org/luci/buildbucket/proto/build.proto\"\xb0\x02\n\x12SubBuildInputProps\x12`\n\x0boutput_path\x18\x01 \x01(\x0b\x32K.recipe_modules.recipe_engine.step.tests.properties.SubBuildInputProps.Path\x12*\n\x0binput_build\x18\x02 \x01(\x0b\x32\x15.buildbucket.v2.Build\x12\x12\n\ninfra_step\x18\x03 \x01(\x08\x12\x31\n\x12\x65xpected_sub_build\x18\x04 \x01(\x0b\x32\x15.buildbucket.v2.Build\x12\x0e\n\x06legacy\x18\x05 \x01(\x08\x12\x11\n\tuse_delim\x18\x06 \x01(\x08\x1a\"\n\x04Path\x12\x0c\n\x04\x62\x61se\x18\x01 \x01(\t\x12\x0c\n\x04\x66ile\x18\x02 \x01(\tb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.step.tests.properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SUBBUILDINPUTPROPS']._serialized_start=165
+  _globals['_SUBBUILDINPUTPROPS']._serialized_end=469
+  _globals['_SUBBUILDINPUTPROPS_PATH']._serialized_start=435
+  _globals['_SUBBUILDINPUTPROPS_PATH']._serialized_end=469
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,30 @@
+from PB.go.chromium.org.luci.buildbucket.proto import build as _build_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SubBuildInputProps(_message.Message):
+    __slots__ = ("output_path", "input_build", "infra_step", "expected_sub_build", "legacy", "use_delim")
+    class Path(_message.Message):
+        __slots__ = ("base", "file")
+        BASE_FIELD_NUMBER: _ClassVar[int]
+        FILE_FIELD_NUMBER: _ClassVar[int]
+        base: str
+        file: str
+        def __init__(self, base: _Optional[str] = ..., file: _Optional[str] = ...) -> None: ...
+    OUTPUT_PATH_FIELD_NUMBER: _ClassVar[int]
+    INPUT_BUILD_FIELD_NUMBER: _ClassVar[int]
+    INFRA_STEP_FIELD_NUMBER: _ClassVar[int]
+    EXPECTED_SUB_BUILD_FIELD_NUMBER: _ClassVar[int]
+    LEGACY_FIELD_NUMBER: _ClassVar[int]
+    USE_DELIM_FIELD_NUMBER: _ClassVar[int]
+    output_path: SubBuildInputProps.Path
+    input_build: _build_pb2.Build
+    infra_step: bool
+    expected_sub_build: _build_pb2.Build
+    legacy: bool
+    use_delim: bool
+    def __init__(self, output_path: _Optional[_Union[SubBuildInputProps.Path, _Mapping]] = ..., input_build: _Optional[_Union[_build_pb2.Build, _Mapping]] = ..., infra_step: bool = ..., expected_sub_build: _Optional[_Union[_build_pb2.Build, _Mapping]] = ..., legacy: bool = ..., use_delim: bool = ...) -> None: ...
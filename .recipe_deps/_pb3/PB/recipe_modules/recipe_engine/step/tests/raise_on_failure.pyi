@@ -0,0 +1,13 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("infra_step", "set_status_to_exception")
+    INFRA_STEP_FIELD_NUMBER: _ClassVar[int]
+    SET_STATUS_TO_EXCEPTION_FIELD_NUMBER: _ClassVar[int]
+    infra_step: bool
+    set_status_to_exception: bool
+    def __init__(self, infra_step: bool = ..., set_status_to_exception: bool = ...) -> None: ...
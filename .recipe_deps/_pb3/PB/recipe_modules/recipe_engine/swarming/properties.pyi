@@ -0,0 +1,15 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class EnvProperties(_message.Message):
+    __slots__ = ("SWARMING_BOT_ID", "SWARMING_TASK_ID", "SWARMING_SERVER")
+    SWARMING_BOT_ID_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_TASK_ID_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_SERVER_FIELD_NUMBER: _ClassVar[int]
+    SWARMING_BOT_ID: str
+    SWARMING_TASK_ID: str
+    SWARMING_SERVER: str
+    def __init__(self, SWARMING_BOT_ID: _Optional[str] = ..., SWARMING_TASK_ID: _Optional[str] = ..., SWARMING_SERVER: _Optional[str] = ...) -> None: ...
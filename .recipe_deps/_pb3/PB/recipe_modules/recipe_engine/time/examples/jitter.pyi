@@ -0,0 +1,13 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class JitterProps(_message.Message):
+    __slots__ = ("random_output", "expected_outcome")
+    RANDOM_OUTPUT_FIELD_NUMBER: _ClassVar[int]
+    EXPECTED_OUTCOME_FIELD_NUMBER: _ClassVar[int]
+    random_output: float
+    expected_outcome: int
+    def __init__(self, random_output: _Optional[float] = ..., expected_outcome: _Optional[int] = ...) -> None: ...
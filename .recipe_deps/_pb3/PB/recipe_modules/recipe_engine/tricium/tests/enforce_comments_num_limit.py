@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipe_modules/recipe_engine/tricium/tests/enforce_comments_num_limit.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipe_modules/recipe_engine/tricium/tests/enforce_comments_num_limit.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.tricium import data as tricium_dot_data__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nKrecipe_modules/recipe_engine/tricium/tests/enforce_comments_num_limit.proto\x12\x45recipe_modules.recipe_engine.tricium.tests.enforce_comments_num_limit\x1a\x12tricium/data.proto\"=\n\nInputProps\x12/\n\x10\x65xpected_results\x18\x01 \x01(\x0b\x32\x15.tricium.Data.Resultsb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipe_modules.recipe_engine.tricium.tests.enforce_comments_num_limit_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPS']._serialized_start=170
+  _globals['_INPUTPROPS']._serialized_end=231
+# @@protoc_insertion_point(module_scope)
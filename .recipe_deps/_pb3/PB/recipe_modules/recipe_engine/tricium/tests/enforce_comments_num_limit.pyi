@@ -0,0 +1,13 @@
+from PB.tricium import data as _data_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProps(_message.Message):
+    __slots__ = ("expected_results",)
+    EXPECTED_RESULTS_FIELD_NUMBER: _ClassVar[int]
+    expected_results: _data_pb2.Data.Results
+    def __init__(self, expected_results: _Optional[_Union[_data_pb2.Data.Results, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,11 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("dontfakeit",)
+    DONTFAKEIT_FIELD_NUMBER: _ClassVar[int]
+    dontfakeit: bool
+    def __init__(self, dontfakeit: bool = ...) -> None: ...
@@ -0,0 +1,13 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("output_touchfile", "running_touchfile")
+    OUTPUT_TOUCHFILE_FIELD_NUMBER: _ClassVar[int]
+    RUNNING_TOUCHFILE_FIELD_NUMBER: _ClassVar[int]
+    output_touchfile: str
+    running_touchfile: str
+    def __init__(self, output_touchfile: _Optional[str] = ..., running_touchfile: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,11 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProps(_message.Message):
+    __slots__ = ("use_result_type",)
+    USE_RESULT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    use_result_type: bool
+    def __init__(self, use_result_type: bool = ...) -> None: ...
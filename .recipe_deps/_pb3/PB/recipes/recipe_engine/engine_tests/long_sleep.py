@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipes/recipe_engine/engine_tests/long_sleep.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipes/recipe_engine/engine_tests/long_sleep.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3recipes/recipe_engine/engine_tests/long_sleep.proto\x12-recipes.recipe_engine.engine_tests.long_sleep\"\xb8\x01\n\x0fInputProperties\x12\x0f\n\x07recover\x18\x01 \x01(\x08\x12\x62\n\rcheck_retcode\x18\x02 \x01(\x0b\x32K.recipes.recipe_engine.engine_tests.long_sleep.InputProperties.CheckRetcode\x1a\x30\n\x0c\x43heckRetcode\x12\x14\n\x07retcode\x18\x01 \x01(\x05H\x00\x88\x01\x01\x42\n\n\x08_retcodeb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipes.recipe_engine.engine_tests.long_sleep_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_INPUTPROPERTIES']._serialized_start=103
+  _globals['_INPUTPROPERTIES']._serialized_end=287
+  _globals['_INPUTPROPERTIES_CHECKRETCODE']._serialized_start=239
+  _globals['_INPUTPROPERTIES_CHECKRETCODE']._serialized_end=287
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,19 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("recover", "check_retcode")
+    class CheckRetcode(_message.Message):
+        __slots__ = ("retcode",)
+        RETCODE_FIELD_NUMBER: _ClassVar[int]
+        retcode: int
+        def __init__(self, retcode: _Optional[int] = ...) -> None: ...
+    RECOVER_FIELD_NUMBER: _ClassVar[int]
+    CHECK_RETCODE_FIELD_NUMBER: _ClassVar[int]
+    recover: bool
+    check_retcode: InputProperties.CheckRetcode
+    def __init__(self, recover: bool = ..., check_retcode: _Optional[_Union[InputProperties.CheckRetcode, _Mapping]] = ...) -> None: ...
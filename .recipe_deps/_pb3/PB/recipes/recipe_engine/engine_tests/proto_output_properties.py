@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipes/recipe_engine/engine_tests/proto_output_properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipes/recipe_engine/engine_tests/proto_output_properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n@recipes/recipe_engine/engine_tests/proto_output_properties.proto\x12:recipes.recipe_engine.engine_tests.proto_output_properties\"q\n\x06Output\x12\x0b\n\x03str\x18\x01 \x01(\t\x12\x0c\n\x04strs\x18\x02 \x03(\t\x12L\n\x03msg\x18\x03 \x01(\x0b\x32?.recipes.recipe_engine.engine_tests.proto_output_properties.Msg\" \n\x03Msg\x12\x0b\n\x03num\x18\x01 \x01(\x05\x12\x0c\n\x04nums\x18\x02 \x03(\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipes.recipe_engine.engine_tests.proto_output_properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_OUTPUT']._serialized_start=128
+  _globals['_OUTPUT']._serialized_end=241
+  _globals['_MSG']._serialized_start=243
+  _globals['_MSG']._serialized_end=275
+# @@protoc_insertion_point(module_scope)
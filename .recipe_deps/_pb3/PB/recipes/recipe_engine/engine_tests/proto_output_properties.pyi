@@ -0,0 +1,25 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Output(_message.Message):
+    __slots__ = ("str", "strs", "msg")
+    STR_FIELD_NUMBER: _ClassVar[int]
+    STRS_FIELD_NUMBER: _ClassVar[int]
+    MSG_FIELD_NUMBER: _ClassVar[int]
+    str: str
+    strs: _containers.RepeatedScalarFieldContainer[str]
+    msg: Msg
+    def __init__(self, str: _Optional[str] = ..., strs: _Optional[_Iterable[str]] = ..., msg: _Optional[_Union[Msg, _Mapping]] = ...) -> None: ...
+
+class Msg(_message.Message):
+    __slots__ = ("num", "nums")
+    NUM_FIELD_NUMBER: _ClassVar[int]
+    NUMS_FIELD_NUMBER: _ClassVar[int]
+    num: int
+    nums: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, num: _Optional[int] = ..., nums: _Optional[_Iterable[int]] = ...) -> None: ...
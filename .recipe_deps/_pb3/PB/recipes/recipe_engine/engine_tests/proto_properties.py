@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipes/recipe_engine/engine_tests/proto_properties.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipes/recipe_engine/engine_tests/proto_properties.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9recipes/recipe_engine/engine_tests/proto_properties.proto\x12\x33recipes.recipe_engine.engine_tests.proto_properties\"5\n\x0eTestProperties\x12\x0e\n\x06\x61n_int\x18\x01 \x01(\x05\x12\x13\n\x0bsome_string\x18\x02 \x01(\t\"1\n\rEnvProperties\x12\x0f\n\x07STR_ENV\x18\x01 \x01(\t\x12\x0f\n\x07INT_ENV\x18\x02 \x01(\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipes.recipe_engine.engine_tests.proto_properties_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_TESTPROPERTIES']._serialized_start=114
+  _globals['_TESTPROPERTIES']._serialized_end=167
+  _globals['_ENVPROPERTIES']._serialized_start=169
+  _globals['_ENVPROPERTIES']._serialized_end=218
+# @@protoc_insertion_point(module_scope)
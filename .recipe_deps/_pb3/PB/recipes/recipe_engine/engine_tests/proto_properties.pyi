@@ -0,0 +1,21 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestProperties(_message.Message):
+    __slots__ = ("an_int", "some_string")
+    AN_INT_FIELD_NUMBER: _ClassVar[int]
+    SOME_STRING_FIELD_NUMBER: _ClassVar[int]
+    an_int: int
+    some_string: str
+    def __init__(self, an_int: _Optional[int] = ..., some_string: _Optional[str] = ...) -> None: ...
+
+class EnvProperties(_message.Message):
+    __slots__ = ("STR_ENV", "INT_ENV")
+    STR_ENV_FIELD_NUMBER: _ClassVar[int]
+    INT_ENV_FIELD_NUMBER: _ClassVar[int]
+    STR_ENV: str
+    INT_ENV: int
+    def __init__(self, STR_ENV: _Optional[str] = ..., INT_ENV: _Optional[int] = ...) -> None: ...
@@ -0,0 +1,15 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class InputProperties(_message.Message):
+    __slots__ = ("from_recipe", "attribute", "module")
+    FROM_RECIPE_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTE_FIELD_NUMBER: _ClassVar[int]
+    MODULE_FIELD_NUMBER: _ClassVar[int]
+    from_recipe: bool
+    attribute: bool
+    module: bool
+    def __init__(self, from_recipe: bool = ..., attribute: bool = ..., module: bool = ...) -> None: ...
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: recipes/recipe_engine/placeholder.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'recipes/recipe_engine/placeholder.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_builder__common__pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as go_dot_chromium_dot_org_dot_luci_dot_buildbucket_dot_proto_dot_common__pb2
+from PB.turboci.graph.orchestrator.v1 import write_nodes_request as turboci_dot_graph_dot_orchestrator_dot_v1_dot_write__nodes__request__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'recipes/recipe_engine/placeholder.proto\x12!recipes.recipe_engine.placeholder\x1a\x1cgoogle/protobuf/struct.proto\x1a;go.chromium.org/luci/buildbucket/proto/builder_common.proto\x1a\x33go.chromium.org/luci/buildbucket/proto/common.proto\x1a\x37turboci/graph/orchestrator/v1/write_nodes_request.proto\"9\n\x0b\x42uildbucket\x12*\n\x07\x62uilder\x18\x01 \x01(\x0b\x32\x19.buildbucket.v2.BuilderID\"\xaa\x01\n\nChildBuild\x12\n\n\x02id\x18\x01 \x01(\t\x12>\n\tlife_time\x18\x02 \x01(\x0e\x32+.recipes.recipe_engine.placeholder.LifeTime\x12\x45\n\x0b\x62uildbucket\x18\n \x01(\x0b\x32..recipes.recipe_engine.placeholder.BuildbucketH\x00\x42\t\n\x07trigger\"\xba\x01\n\x0cTurboCIWrite\x12L\n\x06reason\x18\x01 \x01(\x0b\x32\x37.turboci.graph.orchestrator.v1.WriteNodesRequest.ReasonH\x00\x88\x01\x01\x12Q\n\x0c\x63heck_writes\x18\x02 \x03(\x0b\x32;.turboci.graph.orchestrator.v1.WriteNodesRequest.CheckWriteB\t\n\x07_reason\"8\n\x0cTurboCIQuery\x12\x18\n\x0bworkplan_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workplan_id\"/\n\x0f\x43ollectChildren\x12\x1c\n\x14\x63hild_build_step_ids\x18\x01 \x03(\t\"\xc4\x04\n\x08\x46\x61keStep\x12\x15\n\rduration_secs\x18\x01 \x01(\x03\x12\x11\n\tstep_text\x18\x02 \x01(\t\x12\x45\n\x05links\x18\x03 \x03(\x0b\x32\x36.recipes.recipe_engine.placeholder.FakeStep.LinksEntry\x12\x43\n\x04logs\x18\x04 \x03(\x0b\x32\x35.recipes.recipe_engine.placeholder.FakeStep.LogsEntry\x12&\n\x06status\x18\x05 \x01(\x0e\x32\x16.buildbucket.v2.Status\x12\x10\n\x08\x63\x61nceled\x18\x06 \x01(\x08\x12\x0f\n\x07timeout\x18\x07 \x01(\x08\x12/\n\x0eset_properties\x18\x08 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x39\n\x08\x63hildren\x18\t \x03(\x0b\x32\'.recipes.recipe_engine.placeholder.Step\x12\x43\n\x04tags\x18\n \x03(\x0b\x32\x35.recipes.recipe_engine.placeholder.FakeStep.TagsEntry\x1a,\n\nLinksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a+\n\tLogsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a+\n\tTagsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x88\x03\n\x04Step\x12\x0c\n\x04name\x18\x01 \x01(\t\x12@\n\tfake_step\x18\x02 \x01(\x0b\x32+.recipes.recipe_engine.placeholder.FakeStepH\x00\x12\x44\n\x0b\x63hild_build\x18\x03 \x01(\x0b\x32-.recipes.recipe_engine.placeholder.ChildBuildH\x00\x12N\n\x10\x63ollect_children\x18\x04 \x01(\x0b\x32\x32.recipes.recipe_engine.placeholder.CollectChildrenH\x00\x12H\n\rturboci_write\x18\x05 \x01(\x0b\x32/.recipes.recipe_engine.placeholder.TurboCIWriteH\x00\x12H\n\rturboci_query\x18\x06 \x01(\x0b\x32/.recipes.recipe_engine.placeholder.TurboCIQueryH\x00\x42\x06\n\x04type\"l\n\nInputProps\x12\x36\n\x05steps\x18\x01 \x03(\x0b\x32\'.recipes.recipe_engine.placeholder.Step\x12&\n\x06status\x18\x04 \x01(\x0e\x32\x16.buildbucket.v2.Status*)\n\x08LifeTime\x12\x0f\n\x0b\x42UILD_BOUND\x10\x00\x12\x0c\n\x08\x44\x45TACHED\x10\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'recipes.recipe_engine.placeholder_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_FAKESTEP_LINKSENTRY']._loaded_options = None
+  _globals['_FAKESTEP_LINKSENTRY']._serialized_options = b'8\001'
+  _globals['_FAKESTEP_LOGSENTRY']._loaded_options = None
+  _globals['_FAKESTEP_LOGSENTRY']._serialized_options = b'8\001'
+  _globals['_FAKESTEP_TAGSENTRY']._loaded_options = None
+  _globals['_FAKESTEP_TAGSENTRY']._serialized_options = b'8\001'
+  _globals['_LIFETIME']._serialized_start=1895
+  _globals['_LIFETIME']._serialized_end=1936
+  _globals['_BUILDBUCKET']._serialized_start=279
+  _globals['_BUILDBUCKET']._serialized_end=336
+  _globals['_CHILDBUILD']._serialized_start=339
+  _globals['_CHILDBUILD']._serialized_end=509
+  _globals['_TURBOCIWRITE']._serialized_start=512
+  _globals['_TURBOCIWRITE']._serialized_end=698
+  _globals['_TURBOCIQUERY']._serialized_start=700
+  _globals['_TURBOCIQUERY']._serialized_end=756
+  _globals['_COLLECTCHILDREN']._serialized_start=758
+  _globals['_COLLECTCHILDREN']._serialized_end=805
+  _globals['_FAKESTEP']._serialized_start=808
+  _globals['_FAKESTEP']._serialized_end=1388
+  _globals['_FAKESTEP_LINKSENTRY']._serialized_start=1254
+  _globals['_FAKESTEP_LINKSENTRY']._serialized_end=1298
+  _globals['_FAKESTEP_LOGSENTRY']._serialized_start=1300
+  _globals['_FAKESTEP_LOGSENTRY']._serialized_end=1343
+  _globals['_FAKESTEP_TAGSENTRY']._serialized_start=1345
+  _globals['_FAKESTEP_TAGSENTRY']._serialized_end=1388
+  _globals['_STEP']._serialized_start=1391
+  _globals['_STEP']._serialized_end=1783
+  _globals['_INPUTPROPS']._serialized_start=1785
+  _globals['_INPUTPROPS']._serialized_end=1893
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,124 @@
+from google.protobuf import struct_pb2 as _struct_pb2
+from PB.go.chromium.org.luci.buildbucket.proto import builder_common as _builder_common_pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as _common_pb2
+from PB.turboci.graph.orchestrator.v1 import write_nodes_request as _write_nodes_request_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class LifeTime(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    BUILD_BOUND: _ClassVar[LifeTime]
+    DETACHED: _ClassVar[LifeTime]
+BUILD_BOUND: LifeTime
+DETACHED: LifeTime
+
+class Buildbucket(_message.Message):
+    __slots__ = ("builder",)
+    BUILDER_FIELD_NUMBER: _ClassVar[int]
+    builder: _builder_common_pb2.BuilderID
+    def __init__(self, builder: _Optional[_Union[_builder_common_pb2.BuilderID, _Mapping]] = ...) -> None: ...
+
+class ChildBuild(_message.Message):
+    __slots__ = ("id", "life_time", "buildbucket")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    LIFE_TIME_FIELD_NUMBER: _ClassVar[int]
+    BUILDBUCKET_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    life_time: LifeTime
+    buildbucket: Buildbucket
+    def __init__(self, id: _Optional[str] = ..., life_time: _Optional[_Union[LifeTime, str]] = ..., buildbucket: _Optional[_Union[Buildbucket, _Mapping]] = ...) -> None: ...
+
+class TurboCIWrite(_message.Message):
+    __slots__ = ("reason", "check_writes")
+    REASON_FIELD_NUMBER: _ClassVar[int]
+    CHECK_WRITES_FIELD_NUMBER: _ClassVar[int]
+    reason: _write_nodes_request_pb2.WriteNodesRequest.Reason
+    check_writes: _containers.RepeatedCompositeFieldContainer[_write_nodes_request_pb2.WriteNodesRequest.CheckWrite]
+    def __init__(self, reason: _Optional[_Union[_write_nodes_request_pb2.WriteNodesRequest.Reason, _Mapping]] = ..., check_writes: _Optional[_Iterable[_Union[_write_nodes_request_pb2.WriteNodesRequest.CheckWrite, _Mapping]]] = ...) -> None: ...
+
+class TurboCIQuery(_message.Message):
+    __slots__ = ("workplan_id",)
+    WORKPLAN_ID_FIELD_NUMBER: _ClassVar[int]
+    workplan_id: str
+    def __init__(self, workplan_id: _Optional[str] = ...) -> None: ...
+
+class CollectChildren(_message.Message):
+    __slots__ = ("child_build_step_ids",)
+    CHILD_BUILD_STEP_IDS_FIELD_NUMBER: _ClassVar[int]
+    child_build_step_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, child_build_step_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class FakeStep(_message.Message):
+    __slots__ = ("duration_secs", "step_text", "links", "logs", "status", "canceled", "timeout", "set_properties", "children", "tags")
+    class LinksEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    class LogsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    class TagsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    DURATION_SECS_FIELD_NUMBER: _ClassVar[int]
+    STEP_TEXT_FIELD_NUMBER: _ClassVar[int]
+    LINKS_FIELD_NUMBER: _ClassVar[int]
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    CANCELED_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_FIELD_NUMBER: _ClassVar[int]
+    SET_PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    CHILDREN_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    duration_secs: int
+    step_text: str
+    links: _containers.ScalarMap[str, str]
+    logs: _containers.ScalarMap[str, str]
+    status: _common_pb2.Status
+    canceled: bool
+    timeout: bool
+    set_properties: _struct_pb2.Struct
+    children: _containers.RepeatedCompositeFieldContainer[Step]
+    tags: _containers.ScalarMap[str, str]
+    def __init__(self, duration_secs: _Optional[int] = ..., step_text: _Optional[str] = ..., links: _Optional[_Mapping[str, str]] = ..., logs: _Optional[_Mapping[str, str]] = ..., status: _Optional[_Union[_common_pb2.Status, str]] = ..., canceled: bool = ..., timeout: bool = ..., set_properties: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., children: _Optional[_Iterable[_Union[Step, _Mapping]]] = ..., tags: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class Step(_message.Message):
+    __slots__ = ("name", "fake_step", "child_build", "collect_children", "turboci_write", "turboci_query")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    FAKE_STEP_FIELD_NUMBER: _ClassVar[int]
+    CHILD_BUILD_FIELD_NUMBER: _ClassVar[int]
+    COLLECT_CHILDREN_FIELD_NUMBER: _ClassVar[int]
+    TURBOCI_WRITE_FIELD_NUMBER: _ClassVar[int]
+    TURBOCI_QUERY_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    fake_step: FakeStep
+    child_build: ChildBuild
+    collect_children: CollectChildren
+    turboci_write: TurboCIWrite
+    turboci_query: TurboCIQuery
+    def __init__(self, name: _Optional[str] = ..., fake_step: _Optional[_Union[FakeStep, _Mapping]] = ..., child_build: _Optional[_Union[ChildBuild, _Mapping]] = ..., collect_children: _Optional[_Union[CollectChildren, _Mapping]] = ..., turboci_write: _Optional[_Union[TurboCIWrite, _Mapping]] = ..., turboci_query: _Optional[_Union[TurboCIQuery, _Mapping]] = ...) -> None: ...
+
+class InputProps(_message.Message):
+    __slots__ = ("steps", "status")
+    STEPS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    steps: _containers.RepeatedCompositeFieldContainer[Step]
+    status: _common_pb2.Status
+    def __init__(self, steps: _Optional[_Iterable[_Union[Step, _Mapping]]] = ..., status: _Optional[_Union[_common_pb2.Status, str]] = ...) -> None: ...
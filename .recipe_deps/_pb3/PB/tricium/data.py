@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: tricium/data.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'tricium/data.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12tricium/data.proto\x12\x07tricium\"\xfe\x08\n\x04\x44\x61ta\x1aM\n\x0bTypeDetails\x12 \n\x04type\x18\x01 \x01(\x0e\x32\x12.tricium.Data.Type\x12\x1c\n\x14is_platform_specific\x18\x02 \x01(\x08\x1a\x7f\n\x0eGitFileDetails\x12\x11\n\tplatforms\x18\x01 \x01(\x03\x12\x12\n\nrepository\x18\x02 \x01(\t\x12\x0b\n\x03ref\x18\x03 \x01(\t\x12!\n\x05\x66iles\x18\x04 \x03(\x0b\x32\x12.tricium.Data.File\x12\x16\n\x0e\x63ommit_message\x18\x05 \x01(\t\x1aU\n\x05\x46iles\x12\x11\n\tplatforms\x18\x01 \x01(\x03\x12!\n\x05\x66iles\x18\x03 \x03(\x0b\x32\x12.tricium.Data.File\x12\x16\n\x0e\x63ommit_message\x18\x04 \x01(\t\x1aM\n\x04\x46ile\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x11\n\tis_binary\x18\x02 \x01(\x08\x12$\n\x06status\x18\x03 \x01(\x0e\x32\x14.tricium.Data.Status\x1aQ\n\x0c\x43langDetails\x12\x11\n\tplatforms\x18\x01 \x01(\x03\x12\x16\n\x0e\x63ompilation_db\x18\x02 \x01(\t\x12\x16\n\x0e\x63omp_dep_paths\x18\x03 \x03(\t\x1a\x45\n\x07Results\x12\x11\n\tplatforms\x18\x01 \x01(\x03\x12\'\n\x08\x63omments\x18\x02 \x03(\x0b\x32\x15.tricium.Data.Comment\x1a\xe8\x01\n\x07\x43omment\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0c\n\x04path\x18\x05 \x01(\t\x12\x12\n\nstart_line\x18\x06 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x07 \x01(\x05\x12\x12\n\nstart_char\x18\x08 \x01(\x05\x12\x10\n\x08\x65nd_char\x18\t \x01(\x05\x12-\n\x0bsuggestions\x18\n \x03(\x0b\x32\x18.tricium.Data.Suggestion\x12\x1f\n\x17show_on_unchanged_lines\x18\x0b \x01(\x08J\x04\x08\x04\x10\x05\x1aR\n\nSuggestion\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12/\n\x0creplacements\x18\x02 \x03(\x0b\x32\x19.tricium.Data.Replacement\x1a|\n\x0bReplacement\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x13\n\x0breplacement\x18\x02 \x01(\t\x12\x12\n\nstart_line\x18\x03 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x04 \x01(\x05\x12\x12\n\nstart_char\x18\x05 \x01(\x05\x12\x10\n\x08\x65nd_char\x18\x06 \x01(\x05\"Q\n\x04Type\x12\x08\n\x04NONE\x10\x00\x12\x14\n\x10GIT_FILE_DETAILS\x10\x01\x12\t\n\x05\x46ILES\x10\x02\x12\x11\n\rCLANG_DETAILS\x10\x03\x12\x0b\n\x07RESULTS\x10\x04\"V\n\x06Status\x12\x0c\n\x08MODIFIED\x10\x00\x12\t\n\x05\x41\x44\x44\x45\x44\x10\x01\x12\x0b\n\x07\x44\x45LETED\x10\x02\x12\x0b\n\x07RENAMED\x10\x03\x12\n\n\x06\x43OPIED\x10\x04\x12\r\n\tREWRITTEN\x10\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'tricium.data_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_DATA']._serialized_start=32
+  _globals['_DATA']._serialized_end=1182
+  _globals['_DATA_TYPEDETAILS']._serialized_start=40
+  _globals['_DATA_TYPEDETAILS']._serialized_end=117
+  _globals['_DATA_GITFILEDETAILS']._serialized_start=119
+  _globals['_DATA_GITFILEDETAILS']._serialized_end=246
+  _globals['_DATA_FILES']._serialized_start=248
+  _globals['_DATA_FILES']._serialized_end=333
+  _globals['_DATA_FILE']._serialized_start=335
+  _globals['_DATA_FILE']._serialized_end=412
+  _globals['_DATA_CLANGDETAILS']._serialized_start=414
+  _globals['_DATA_CLANGDETAILS']._serialized_end=495
+  _globals['_DATA_RESULTS']._serialized_start=497
+  _globals['_DATA_RESULTS']._serialized_end=566
+  _globals['_DATA_COMMENT']._serialized_start=569
+  _globals['_DATA_COMMENT']._serialized_end=801
+  _globals['_DATA_SUGGESTION']._serialized_start=803
+  _globals['_DATA_SUGGESTION']._serialized_end=885
+  _globals['_DATA_REPLACEMENT']._serialized_start=887
+  _globals['_DATA_REPLACEMENT']._serialized_end=1011
+  _globals['_DATA_TYPE']._serialized_start=1013
+  _globals['_DATA_TYPE']._serialized_end=1094
+  _globals['_DATA_STATUS']._serialized_start=1096
+  _globals['_DATA_STATUS']._serialized_end=1182
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,137 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Data(_message.Message):
+    __slots__ = ()
+    class Type(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        NONE: _ClassVar[Data.Type]
+        GIT_FILE_DETAILS: _ClassVar[Data.Type]
+        FILES: _ClassVar[Data.Type]
+        CLANG_DETAILS: _ClassVar[Data.Type]
+        RESULTS: _ClassVar[Data.Type]
+    NONE: Data.Type
+    GIT_FILE_DETAILS: Data.Type
+    FILES: Data.Type
+    CLANG_DETAILS: Data.Type
+    RESULTS: Data.Type
+    class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        MODIFIED: _ClassVar[Data.Status]
+        ADDED: _ClassVar[Data.Status]
+        DELETED: _ClassVar[Data.Status]
+        RENAMED: _ClassVar[Data.Status]
+        COPIED: _ClassVar[Data.Status]
+        REWRITTEN: _ClassVar[Data.Status]
+    MODIFIED: Data.Status
+    ADDED: Data.Status
+    DELETED: Data.Status
+    RENAMED: Data.Status
+    COPIED: Data.Status
+    REWRITTEN: Data.Status
+    class TypeDetails(_message.Message):
+        __slots__ = ("type", "is_platform_specific")
+        TYPE_FIELD_NUMBER: _ClassVar[int]
+        IS_PLATFORM_SPECIFIC_FIELD_NUMBER: _ClassVar[int]
+        type: Data.Type
+        is_platform_specific: bool
+        def __init__(self, type: _Optional[_Union[Data.Type, str]] = ..., is_platform_specific: bool = ...) -> None: ...
+    class GitFileDetails(_message.Message):
+        __slots__ = ("platforms", "repository", "ref", "files", "commit_message")
+        PLATFORMS_FIELD_NUMBER: _ClassVar[int]
+        REPOSITORY_FIELD_NUMBER: _ClassVar[int]
+        REF_FIELD_NUMBER: _ClassVar[int]
+        FILES_FIELD_NUMBER: _ClassVar[int]
+        COMMIT_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+        platforms: int
+        repository: str
+        ref: str
+        files: _containers.RepeatedCompositeFieldContainer[Data.File]
+        commit_message: str
+        def __init__(self, platforms: _Optional[int] = ..., repository: _Optional[str] = ..., ref: _Optional[str] = ..., files: _Optional[_Iterable[_Union[Data.File, _Mapping]]] = ..., commit_message: _Optional[str] = ...) -> None: ...
+    class Files(_message.Message):
+        __slots__ = ("platforms", "files", "commit_message")
+        PLATFORMS_FIELD_NUMBER: _ClassVar[int]
+        FILES_FIELD_NUMBER: _ClassVar[int]
+        COMMIT_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+        platforms: int
+        files: _containers.RepeatedCompositeFieldContainer[Data.File]
+        commit_message: str
+        def __init__(self, platforms: _Optional[int] = ..., files: _Optional[_Iterable[_Union[Data.File, _Mapping]]] = ..., commit_message: _Optional[str] = ...) -> None: ...
+    class File(_message.Message):
+        __slots__ = ("path", "is_binary", "status")
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        IS_BINARY_FIELD_NUMBER: _ClassVar[int]
+        STATUS_FIELD_NUMBER: _ClassVar[int]
+        path: str
+        is_binary: bool
+        status: Data.Status
+        def __init__(self, path: _Optional[str] = ..., is_binary: bool = ..., status: _Optional[_Union[Data.Status, str]] = ...) -> None: ...
+    class ClangDetails(_message.Message):
+        __slots__ = ("platforms", "compilation_db", "comp_dep_paths")
+        PLATFORMS_FIELD_NUMBER: _ClassVar[int]
+        COMPILATION_DB_FIELD_NUMBER: _ClassVar[int]
+        COMP_DEP_PATHS_FIELD_NUMBER: _ClassVar[int]
+        platforms: int
+        compilation_db: str
+        comp_dep_paths: _containers.RepeatedScalarFieldContainer[str]
+        def __init__(self, platforms: _Optional[int] = ..., compilation_db: _Optional[str] = ..., comp_dep_paths: _Optional[_Iterable[str]] = ...) -> None: ...
+    class Results(_message.Message):
+        __slots__ = ("platforms", "comments")
+        PLATFORMS_FIELD_NUMBER: _ClassVar[int]
+        COMMENTS_FIELD_NUMBER: _ClassVar[int]
+        platforms: int
+        comments: _containers.RepeatedCompositeFieldContainer[Data.Comment]
+        def __init__(self, platforms: _Optional[int] = ..., comments: _Optional[_Iterable[_Union[Data.Comment, _Mapping]]] = ...) -> None: ...
+    class Comment(_message.Message):
+        __slots__ = ("id", "category", "message", "path", "start_line", "end_line", "start_char", "end_char", "suggestions", "show_on_unchanged_lines")
+        ID_FIELD_NUMBER: _ClassVar[int]
+        CATEGORY_FIELD_NUMBER: _ClassVar[int]
+        MESSAGE_FIELD_NUMBER: _ClassVar[int]
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        START_LINE_FIELD_NUMBER: _ClassVar[int]
+        END_LINE_FIELD_NUMBER: _ClassVar[int]
+        START_CHAR_FIELD_NUMBER: _ClassVar[int]
+        END_CHAR_FIELD_NUMBER: _ClassVar[int]
+        SUGGESTIONS_FIELD_NUMBER: _ClassVar[int]
+        SHOW_ON_UNCHANGED_LINES_FIELD_NUMBER: _ClassVar[int]
+        id: str
+        category: str
+        message: str
+        path: str
+        start_line: int
+        end_line: int
+        start_char: int
+        end_char: int
+        suggestions: _containers.RepeatedCompositeFieldContainer[Data.Suggestion]
+        show_on_unchanged_lines: bool
+        def __init__(self, id: _Optional[str] = ..., category: _Optional[str] = ..., message: _Optional[str] = ..., path: _Optional[str] = ..., start_line: _Optional[int] = ..., end_line: _Optional[int] = ..., start_char: _Optional[int] = ..., end_char: _Optional[int] = ..., suggestions: _Optional[_Iterable[_Union[Data.Suggestion, _Mapping]]] = ..., show_on_unchanged_lines: bool = ...) -> None: ...
+    class Suggestion(_message.Message):
+        __slots__ = ("description", "replacements")
+        DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+        REPLACEMENTS_FIELD_NUMBER: _ClassVar[int]
+        description: str
+        replacements: _containers.RepeatedCompositeFieldContainer[Data.Replacement]
+        def __init__(self, description: _Optional[str] = ..., replacements: _Optional[_Iterable[_Union[Data.Replacement, _Mapping]]] = ...) -> None: ...
+    class Replacement(_message.Message):
+        __slots__ = ("path", "replacement", "start_line", "end_line", "start_char", "end_char")
+        PATH_FIELD_NUMBER: _ClassVar[int]
+        REPLACEMENT_FIELD_NUMBER: _ClassVar[int]
+        START_LINE_FIELD_NUMBER: _ClassVar[int]
+        END_LINE_FIELD_NUMBER: _ClassVar[int]
+        START_CHAR_FIELD_NUMBER: _ClassVar[int]
+        END_CHAR_FIELD_NUMBER: _ClassVar[int]
+        path: str
+        replacement: str
+        start_line: int
+        end_line: int
+        start_char: int
+        end_char: int
+        def __init__(self, path: _Optional[str] = ..., replacement: _Optional[str] = ..., start_line: _Optional[int] = ..., end_line: _Optional[int] = ..., start_char: _Optional[int] = ..., end_char: _Optional[int] = ...) -> None: ...
+    def __init__(self) -> None: ...
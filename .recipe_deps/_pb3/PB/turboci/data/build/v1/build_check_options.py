@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/build/v1/build_check_options.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/build/v1/build_check_options.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/turboci/data/build/v1/build_check_options.proto\x12\x15turboci.data.build.v1\"\xc1\x02\n\x11\x42uildCheckOptions\x12I\n\x06target\x18\x01 \x01(\x0b\x32\x34.turboci.data.build.v1.BuildCheckOptions.BuildTargetH\x00\x88\x01\x01\x1a\xd5\x01\n\x0b\x42uildTarget\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tnamespace\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x34\n\x07product\x18\x03 \x01(\x0e\x32\x1e.turboci.data.build.v1.ProductH\x02\x88\x01\x01\x12\x15\n\x08platform\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x13\n\x06\x64\x65vice\x18\x05 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x0c\n\n_namespaceB\n\n\x08_productB\x0b\n\t_platformB\t\n\x07_deviceB\t\n\x07_target*^\n\x07Product\x12\x13\n\x0fPRODUCT_UNKNOWN\x10\x00\x12\x13\n\x0fPRODUCT_ANDROID\x10\x01\x12\x13\n\x0fPRODUCT_BROWSER\x10\x02\x12\x14\n\x10PRODUCT_CHROMEOS\x10\x03\x42:P\x01Z6go.chromium.org/turboci/proto/go/data/build/v1;buildpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.build.v1.build_check_options_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z6go.chromium.org/turboci/proto/go/data/build/v1;buildpb'
+  _globals['_PRODUCT']._serialized_start=398
+  _globals['_PRODUCT']._serialized_end=492
+  _globals['_BUILDCHECKOPTIONS']._serialized_start=75
+  _globals['_BUILDCHECKOPTIONS']._serialized_end=396
+  _globals['_BUILDCHECKOPTIONS_BUILDTARGET']._serialized_start=172
+  _globals['_BUILDCHECKOPTIONS_BUILDTARGET']._serialized_end=385
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/build/v1/build_check_results.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/build/v1/build_check_results.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.data.common.v1 import display_message as turboci_dot_data_dot_common_dot_v1_dot_display__message__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/turboci/data/build/v1/build_check_results.proto\x12\x15turboci.data.build.v1\x1a,turboci/data/common/v1/display_message.proto\"\xbc\n\n\x11\x42uildCheckResults\x12\x14\n\x07success\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12\x44\n\x0f\x64isplay_message\x18\x02 \x01(\x0b\x32&.turboci.data.common.v1.DisplayMessageH\x01\x88\x01\x01\x12\x64\n\x17\x61ndroid_build_artifacts\x18\x03 \x01(\x0b\x32>.turboci.data.build.v1.BuildCheckResults.AndroidBuildArtifactsH\x02\x88\x01\x01\x12O\n\x0c\x63\x61s_manifest\x18\x04 \x01(\x0b\x32\x34.turboci.data.build.v1.BuildCheckResults.CasManifestH\x03\x88\x01\x01\x12Q\n\rgcs_artifacts\x18\x05 \x03(\x0b\x32:.turboci.data.build.v1.BuildCheckResults.GcsArtifactsEntry\x12\x15\n\x08view_url\x18\x06 \x01(\tH\x04\x88\x01\x01\x1a\x89\x01\n\x15\x41ndroidBuildArtifacts\x12\x15\n\x08\x62uild_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x06target\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x1a\n\rbuild_attempt\x18\x03 \x01(\tH\x02\x88\x01\x01\x42\x0b\n\t_build_idB\t\n\x07_targetB\x10\n\x0e_build_attempt\x1a\x9a\x02\n\x0b\x43\x61sManifest\x12T\n\x08manifest\x18\x01 \x03(\x0b\x32\x42.turboci.data.build.v1.BuildCheckResults.CasManifest.ManifestEntry\x12\x19\n\x0c\x63\x61s_instance\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x63\x61s_service\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1b\n\x0e\x63lient_version\x18\x04 \x01(\tH\x02\x88\x01\x01\x1a/\n\rManifestEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x0f\n\r_cas_instanceB\x0e\n\x0c_cas_serviceB\x11\n\x0f_client_version\x1a\xba\x02\n\x0cGcsArtifacts\x12\x1f\n\x12root_directory_uri\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x65\n\x11\x66iles_by_category\x18\x02 \x03(\x0b\x32J.turboci.data.build.v1.BuildCheckResults.GcsArtifacts.FilesByCategoryEntry\x1a\x16\n\x05\x46iles\x12\r\n\x05\x66iles\x18\x01 \x03(\t\x1as\n\x14\x46ilesByCategoryEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12J\n\x05value\x18\x02 \x01(\x0b\x32;.turboci.data.build.v1.BuildCheckResults.GcsArtifacts.Files:\x02\x38\x01\x42\x15\n\x13_root_directory_uri\x1aj\n\x11GcsArtifactsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x44\n\x05value\x18\x02 \x01(\x0b\x32\x35.turboci.data.build.v1.BuildCheckResults.GcsArtifacts:\x02\x38\x01\x42\n\n\x08_successB\x12\n\x10_display_messageB\x1a\n\x18_android_build_artifactsB\x0f\n\r_cas_manifestB\x0b\n\t_view_urlB:P\x01Z6go.chromium.org/turboci/proto/go/data/build/v1;buildpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.build.v1.build_check_results_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z6go.chromium.org/turboci/proto/go/data/build/v1;buildpb'
+  _globals['_BUILDCHECKRESULTS_CASMANIFEST_MANIFESTENTRY']._loaded_options = None
+  _globals['_BUILDCHECKRESULTS_CASMANIFEST_MANIFESTENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS_FILESBYCATEGORYENTRY']._loaded_options = None
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS_FILESBYCATEGORYENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTSENTRY']._loaded_options = None
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTSENTRY']._serialized_options = b'8\001'
+  _globals['_BUILDCHECKRESULTS']._serialized_start=121
+  _globals['_BUILDCHECKRESULTS']._serialized_end=1461
+  _globals['_BUILDCHECKRESULTS_ANDROIDBUILDARTIFACTS']._serialized_start=524
+  _globals['_BUILDCHECKRESULTS_ANDROIDBUILDARTIFACTS']._serialized_end=661
+  _globals['_BUILDCHECKRESULTS_CASMANIFEST']._serialized_start=664
+  _globals['_BUILDCHECKRESULTS_CASMANIFEST']._serialized_end=946
+  _globals['_BUILDCHECKRESULTS_CASMANIFEST_MANIFESTENTRY']._serialized_start=847
+  _globals['_BUILDCHECKRESULTS_CASMANIFEST_MANIFESTENTRY']._serialized_end=894
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS']._serialized_start=949
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS']._serialized_end=1263
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS_FILES']._serialized_start=1101
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS_FILES']._serialized_end=1123
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS_FILESBYCATEGORYENTRY']._serialized_start=1125
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTS_FILESBYCATEGORYENTRY']._serialized_end=1240
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTSENTRY']._serialized_start=1265
+  _globals['_BUILDCHECKRESULTS_GCSARTIFACTSENTRY']._serialized_end=1371
+# @@protoc_insertion_point(module_scope)
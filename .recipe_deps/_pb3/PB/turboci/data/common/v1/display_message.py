@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/common/v1/display_message.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/common/v1/display_message.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,turboci/data/common/v1/display_message.proto\x12\x16turboci.data.common.v1\"\xb4\x02\n\x0e\x44isplayMessage\x12\x14\n\x07message\x18\x01 \x01(\tH\x00\x88\x01\x01\x12Q\n\x0emessage_format\x18\x02 \x01(\x0e\x32\x34.turboci.data.common.v1.DisplayMessage.MessageFormatH\x01\x88\x01\x01\"\x99\x01\n\rMessageFormat\x12\x1a\n\x16MESSAGE_FORMAT_UNKNOWN\x10\x00\x12\x1d\n\x19MESSAGE_FORMAT_PLAIN_TEXT\x10\x01\x12\x17\n\x13MESSAGE_FORMAT_HTML\x10\x02\x12\x1b\n\x17MESSAGE_FORMAT_MARKDOWN\x10\x03\x12\x17\n\x13MESSAGE_FORMAT_ANSI\x10\x04\x42\n\n\x08_messageB\x11\n\x0f_message_formatB<P\x01Z8go.chromium.org/turboci/proto/go/data/common/v1;commonpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.common.v1.display_message_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z8go.chromium.org/turboci/proto/go/data/common/v1;commonpb'
+  _globals['_DISPLAYMESSAGE']._serialized_start=73
+  _globals['_DISPLAYMESSAGE']._serialized_end=381
+  _globals['_DISPLAYMESSAGE_MESSAGEFORMAT']._serialized_start=197
+  _globals['_DISPLAYMESSAGE_MESSAGEFORMAT']._serialized_end=350
+# @@protoc_insertion_point(module_scope)
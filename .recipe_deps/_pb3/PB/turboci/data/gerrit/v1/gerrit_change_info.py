@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/gerrit/v1/gerrit_change_info.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/gerrit/v1/gerrit_change_info.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/turboci/data/gerrit/v1/gerrit_change_info.proto\x12\x16turboci.data.gerrit.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"\xf9\x0b\n\x10GerritChangeInfo\x12\x11\n\x04host\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07project\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06\x62ranch\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x18\n\x0b\x66ull_branch\x18\x14 \x01(\tH\x03\x88\x01\x01\x12\x1a\n\rchange_number\x18\x04 \x01(\x03H\x04\x88\x01\x01\x12\x15\n\x08patchset\x18\x05 \x01(\x05H\x05\x88\x01\x01\x12\x44\n\x06status\x18\x06 \x01(\x0e\x32/.turboci.data.gerrit.v1.GerritChangeInfo.StatusH\x06\x88\x01\x01\x12\x36\n\rcreation_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x07\x88\x01\x01\x12?\n\x16last_modification_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x08\x88\x01\x01\x12\x37\n\x0esubmitted_time\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampH\t\x88\x01\x01\x12\x1d\n\x10\x63urrent_revision\x18\n \x01(\tH\n\x88\x01\x01\x12J\n\trevisions\x18\x0b \x03(\x0b\x32\x37.turboci.data.gerrit.v1.GerritChangeInfo.RevisionsEntry\x12\x37\n\x05owner\x18\x0c \x01(\x0b\x32#.turboci.data.gerrit.v1.AccountInfoH\x0b\x88\x01\x01\x12J\n\treviewers\x18\r \x03(\x0b\x32\x37.turboci.data.gerrit.v1.GerritChangeInfo.ReviewersEntry\x12\x44\n\x06labels\x18\x0e \x03(\x0b\x32\x34.turboci.data.gerrit.v1.GerritChangeInfo.LabelsEntry\x12;\n\x08messages\x18\x0f \x03(\x0b\x32).turboci.data.gerrit.v1.ChangeMessageInfo\x12\x16\n\tchange_id\x18\x10 \x01(\tH\x0c\x88\x01\x01\x12\x12\n\x05topic\x18\x11 \x01(\tH\r\x88\x01\x01\x12\x12\n\x05local\x18\x12 \x01(\x08H\x0e\x88\x01\x01\x12\x19\n\x0cis_owner_bot\x18\x13 \x01(\x08H\x0f\x88\x01\x01\x12\x1e\n\x11\x63herrypicked_from\x18\x15 \x01(\tH\x10\x88\x01\x01\x1aV\n\x0eRevisionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x33\n\x05value\x18\x02 \x01(\x0b\x32$.turboci.data.gerrit.v1.RevisionInfo:\x02\x38\x01\x1aV\n\x0eReviewersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x33\n\x05value\x18\x02 \x01(\x0b\x32$.turboci.data.gerrit.v1.AccountInfos:\x02\x38\x01\x1aP\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x30\n\x05value\x18\x02 \x01(\x0b\x32!.turboci.data.gerrit.v1.LabelInfo:\x02\x38\x01\"p\n\x06Status\x12\x12\n\x0eSTATUS_UNKNOWN\x10\x00\x12\x0e\n\nSTATUS_NEW\x10\x01\x12\x11\n\rSTATUS_MERGED\x10\x02\x12\x14\n\x10STATUS_ABANDONED\x10\x03\x12\x19\n\x15STATUS_MERGE_CONFLICT\x10\x04\x42\x07\n\x05_hostB\n\n\x08_projectB\t\n\x07_branchB\x0e\n\x0c_full_branchB\x10\n\x0e_change_numberB\x0b\n\t_patchsetB\t\n\x07_statusB\x10\n\x0e_creation_timeB\x19\n\x17_last_modification_timeB\x11\n\x0f_submitted_timeB\x13\n\x11_current_revisionB\x08\n\x06_ownerB\x0c\n\n_change_idB\x08\n\x06_topicB\x08\n\x06_localB\x0f\n\r_is_owner_botB\x14\n\x12_cherrypicked_from\"\xcd\x02\n\x0b\x41\x63\x63ountInfo\x12\x17\n\naccount_id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x11\n\x04name\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x19\n\x0c\x64isplay_name\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x10secondary_emails\x18\x05 \x03(\t\x12\x15\n\x08username\x18\x06 \x01(\tH\x04\x88\x01\x01\x12\x13\n\x06status\x18\x07 \x01(\tH\x05\x88\x01\x01\x12\x15\n\x08inactive\x18\x08 \x01(\x08H\x06\x88\x01\x01\x12\x14\n\x07\x64\x65leted\x18\t \x01(\x08H\x07\x88\x01\x01\x12\x0c\n\x04tags\x18\n \x03(\tB\r\n\x0b_account_idB\x07\n\x05_nameB\x0f\n\r_display_nameB\x08\n\x06_emailB\x0b\n\t_usernameB\t\n\x07_statusB\x0b\n\t_inactiveB\n\n\x08_deleted\"E\n\x0c\x41\x63\x63ountInfos\x12\x35\n\x08\x61\x63\x63ounts\x18\x01 \x03(\x0b\x32#.turboci.data.gerrit.v1.AccountInfo\"\xe9\x01\n\x0c\x41pprovalInfo\x12\x36\n\x04user\x18\x01 \x01(\x0b\x32#.turboci.data.gerrit.v1.AccountInfoH\x00\x88\x01\x01\x12\x12\n\x05value\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12-\n\x04\x64\x61te\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02\x88\x01\x01\x12\x10\n\x03tag\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x0bpost_submit\x18\x05 \x01(\x08H\x04\x88\x01\x01\x42\x07\n\x05_userB\x08\n\x06_valueB\x07\n\x05_dateB\x06\n\x04_tagB\x0e\n\x0c_post_submit\"\x99\x03\n\x11\x43hangeMessageInfo\x12\x0f\n\x02id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x38\n\x06\x61uthor\x18\x02 \x01(\x0b\x32#.turboci.data.gerrit.v1.AccountInfoH\x01\x88\x01\x01\x12=\n\x0breal_author\x18\x03 \x01(\x0b\x32#.turboci.data.gerrit.v1.AccountInfoH\x02\x88\x01\x01\x12-\n\x04\x64\x61te\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03\x88\x01\x01\x12\x14\n\x07message\x18\x05 \x01(\tH\x04\x88\x01\x01\x12@\n\x13\x61\x63\x63ounts_in_message\x18\x06 \x03(\x0b\x32#.turboci.data.gerrit.v1.AccountInfo\x12\x10\n\x03tag\x18\x07 \x01(\tH\x05\x88\x01\x01\x12\x15\n\x08patchset\x18\x08 \x01(\x05H\x06\x88\x01\x01\x42\x05\n\x03_idB\t\n\x07_authorB\x0e\n\x0c_real_authorB\x07\n\x05_dateB\n\n\x08_messageB\x06\n\x04_tagB\x0b\n\t_patchset\"\xd7\x03\n\nCommitInfo\x12\x16\n\tcommit_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x33\n\x07parents\x18\x02 \x03(\x0b\x32\".turboci.data.gerrit.v1.CommitInfo\x12\x38\n\x06\x61uthor\x18\x03 \x01(\x0b\x32#.turboci.data.gerrit.v1.AccountInfoH\x01\x88\x01\x01\x12;\n\tcommitter\x18\x04 \x01(\x0b\x32#.turboci.data.gerrit.v1.AccountInfoH\x02\x88\x01\x01\x12\x14\n\x07subject\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x14\n\x07message\x18\x06 \x01(\tH\x04\x88\x01\x01\x12\x1c\n\x0fis_robot_commit\x18\x07 \x01(\x08H\x05\x88\x01\x01\x12\x0e\n\x06\x62ug_id\x18\x08 \x03(\x03\x12\x14\n\x07tree_id\x18\t \x01(\tH\x06\x88\x01\x01\x12-\n\x04\x64\x61te\x18\n \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x07\x88\x01\x01\x42\x0c\n\n_commit_idB\t\n\x07_authorB\x0c\n\n_committerB\n\n\x08_subjectB\n\n\x08_messageB\x12\n\x10_is_robot_commitB\n\n\x08_tree_idB\x07\n\x05_date\"\xec\x02\n\x08\x46ileInfo\x12\x15\n\x08old_path\x18\x01 \x01(\tH\x00\x88\x01\x01\x12<\n\x06status\x18\x02 \x01(\x0e\x32\'.turboci.data.gerrit.v1.FileInfo.StatusH\x01\x88\x01\x01\x12\x1b\n\x0elines_inserted\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x1a\n\rlines_deleted\x18\x04 \x01(\x05H\x03\x88\x01\x01\"\x94\x01\n\x06Status\x12\x12\n\x0eSTATUS_UNKNOWN\x10\x00\x12\x10\n\x0cSTATUS_ADDED\x10\x01\x12\x12\n\x0eSTATUS_DELETED\x10\x02\x12\x13\n\x0fSTATUS_MODIFIED\x10\x03\x12\x12\n\x0eSTATUS_RENAMED\x10\x04\x12\x11\n\rSTATUS_COPIED\x10\x05\x12\x14\n\x10STATUS_REWRITTEN\x10\x06\x42\x0b\n\t_old_pathB\t\n\x07_statusB\x11\n\x0f_lines_insertedB\x10\n\x0e_lines_deleted\"\xa2\x02\n\tLabelInfo\x12\x18\n\x0b\x64\x65scription\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05value\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12\x1a\n\rdefault_value\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x31\n\x03\x61ll\x18\x04 \x03(\x0b\x32$.turboci.data.gerrit.v1.ApprovalInfo\x12=\n\x06values\x18\x05 \x03(\x0b\x32-.turboci.data.gerrit.v1.LabelInfo.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x0e\n\x0c_descriptionB\x08\n\x06_valueB\x10\n\x0e_default_value\"\xb1\x05\n\x0cRevisionInfo\x12<\n\x04kind\x18\x01 \x01(\x0e\x32).turboci.data.gerrit.v1.RevisionInfo.KindH\x00\x88\x01\x01\x12\x15\n\x08patchset\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12\x30\n\x07\x63reated\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02\x88\x01\x01\x12:\n\x08uploader\x18\x04 \x01(\x0b\x32#.turboci.data.gerrit.v1.AccountInfoH\x03\x88\x01\x01\x12\x10\n\x03ref\x18\x05 \x01(\tH\x04\x88\x01\x01\x12\x37\n\x06\x63ommit\x18\x06 \x01(\x0b\x32\".turboci.data.gerrit.v1.CommitInfoH\x05\x88\x01\x01\x12>\n\x05\x66iles\x18\x07 \x03(\x0b\x32/.turboci.data.gerrit.v1.RevisionInfo.FilesEntry\x1aN\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12/\n\x05value\x18\x02 \x01(\x0b\x32 .turboci.data.gerrit.v1.FileInfo:\x02\x38\x01\"\xc0\x01\n\x04Kind\x12\x10\n\x0cKIND_UNKNOWN\x10\x00\x12\x0f\n\x0bKIND_REWORK\x10\x01\x12\x17\n\x13KIND_TRIVIAL_REBASE\x10\x02\x12+\n\'KIND_TRIVIAL_REBASE_WITH_MESSAGE_UPDATE\x10\x03\x12\"\n\x1eKIND_MERGE_FIRST_PARENT_UPDATE\x10\x04\x12\x17\n\x13KIND_NO_CODE_CHANGE\x10\x05\x12\x12\n\x0eKIND_NO_CHANGE\x10\x06\x42\x07\n\x05_kindB\x0b\n\t_patchsetB\n\n\x08_createdB\x0b\n\t_uploaderB\x06\n\x04_refB\t\n\x07_commitB<P\x01Z8go.chromium.org/turboci/proto/go/data/gerrit/v1;gerritpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.gerrit.v1.gerrit_change_info_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z8go.chromium.org/turboci/proto/go/data/gerrit/v1;gerritpb'
+  _globals['_GERRITCHANGEINFO_REVISIONSENTRY']._loaded_options = None
+  _globals['_GERRITCHANGEINFO_REVISIONSENTRY']._serialized_options = b'8\001'
+  _globals['_GERRITCHANGEINFO_REVIEWERSENTRY']._loaded_options = None
+  _globals['_GERRITCHANGEINFO_REVIEWERSENTRY']._serialized_options = b'8\001'
+  _globals['_GERRITCHANGEINFO_LABELSENTRY']._loaded_options = None
+  _globals['_GERRITCHANGEINFO_LABELSENTRY']._serialized_options = b'8\001'
+  _globals['_LABELINFO_VALUESENTRY']._loaded_options = None
+  _globals['_LABELINFO_VALUESENTRY']._serialized_options = b'8\001'
+  _globals['_REVISIONINFO_FILESENTRY']._loaded_options = None
+  _globals['_REVISIONINFO_FILESENTRY']._serialized_options = b'8\001'
+  _globals['_GERRITCHANGEINFO']._serialized_start=109
+  _globals['_GERRITCHANGEINFO']._serialized_end=1638
+  _globals['_GERRITCHANGEINFO_REVISIONSENTRY']._serialized_start=1010
+  _globals['_GERRITCHANGEINFO_REVISIONSENTRY']._serialized_end=1096
+  _globals['_GERRITCHANGEINFO_REVIEWERSENTRY']._serialized_start=1098
+  _globals['_GERRITCHANGEINFO_REVIEWERSENTRY']._serialized_end=1184
+  _globals['_GERRITCHANGEINFO_LABELSENTRY']._serialized_start=1186
+  _globals['_GERRITCHANGEINFO_LABELSENTRY']._serialized_end=1266
+  _globals['_GERRITCHANGEINFO_STATUS']._serialized_start=1268
+  _globals['_GERRITCHANGEINFO_STATUS']._serialized_end=1380
+  _globals['_ACCOUNTINFO']._serialized_start=1641
+  _globals['_ACCOUNTINFO']._serialized_end=1974
+  _globals['_ACCOUNTINFOS']._serialized_start=1976
+  _globals['_ACCOUNTINFOS']._serialized_end=2045
+  _globals['_APPROVALINFO']._serialized_start=2048
+  _globals['_APPROVALINFO']._serialized_end=2281
+  _globals['_CHANGEMESSAGEINFO']._serialized_start=2284
+  _globals['_CHANGEMESSAGEINFO']._serialized_end=2693
+  _globals['_COMMITINFO']._serialized_start=2696
+  _globals['_COMMITINFO']._serialized_end=3167
+  _globals['_FILEINFO']._serialized_start=3170
+  _globals['_FILEINFO']._serialized_end=3534
+  _globals['_FILEINFO_STATUS']._serialized_start=3325
+  _globals['_FILEINFO_STATUS']._serialized_end=3473
+  _globals['_LABELINFO']._serialized_start=3537
+  _globals['_LABELINFO']._serialized_end=3827
+  _globals['_LABELINFO_VALUESENTRY']._serialized_start=3738
+  _globals['_LABELINFO_VALUESENTRY']._serialized_end=3783
+  _globals['_REVISIONINFO']._serialized_start=3830
+  _globals['_REVISIONINFO']._serialized_end=4519
+  _globals['_REVISIONINFO_FILESENTRY']._serialized_start=4180
+  _globals['_REVISIONINFO_FILESENTRY']._serialized_end=4258
+  _globals['_REVISIONINFO_KIND']._serialized_start=4261
+  _globals['_REVISIONINFO_KIND']._serialized_end=4453
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/gerrit/v1/gob_source_check_options.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/gerrit/v1/gob_source_check_options.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5turboci/data/gerrit/v1/gob_source_check_options.proto\x12\x16turboci.data.gerrit.v1\"\x8f\t\n\x15GobSourceCheckOptions\x12R\n\x0egerrit_changes\x18\x01 \x03(\x0b\x32:.turboci.data.gerrit.v1.GobSourceCheckOptions.GerritChange\x12^\n\x11\x62\x61se_pinned_repos\x18\x04 \x01(\x0b\x32>.turboci.data.gerrit.v1.GobSourceCheckOptions.PinnedRepoMountsH\x00\x88\x01\x01\x1a\x9d\x01\n\x0cGerritChange\x12\x15\n\x08hostname\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1a\n\rchange_number\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x15\n\x08patchset\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x17\n\x0fmounts_to_apply\x18\x05 \x03(\tB\x0b\n\t_hostnameB\x10\n\x0e_change_numberB\x0b\n\t_patchset\x1a\x8b\x06\n\x10PinnedRepoMounts\x12\x62\n\x0eproject_commit\x18\x01 \x01(\x0b\x32H.turboci.data.gerrit.v1.GobSourceCheckOptions.PinnedRepoMounts.GitCommitH\x00\x12h\n\x0fmanifest_commit\x18\x02 \x01(\x0b\x32M.turboci.data.gerrit.v1.GobSourceCheckOptions.PinnedRepoMounts.ManifestCommitH\x00\x12\x65\n\x0fmount_overrides\x18\x03 \x03(\x0b\x32L.turboci.data.gerrit.v1.GobSourceCheckOptions.PinnedRepoMounts.MountOverride\x1a{\n\tGitCommit\x12\x11\n\x04host\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07project\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x0f\n\x02id\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x10\n\x03ref\x18\x04 \x01(\tH\x03\x88\x01\x01\x42\x07\n\x05_hostB\n\n\x08_projectB\x05\n\x03_idB\x06\n\x04_ref\x1a\x96\x01\n\x0eManifestCommit\x12]\n\x06\x63ommit\x18\x01 \x01(\x0b\x32H.turboci.data.gerrit.v1.GobSourceCheckOptions.PinnedRepoMounts.GitCommitH\x00\x88\x01\x01\x12\x11\n\x04path\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\t\n\x07_commitB\x07\n\x05_path\x1a\x9b\x01\n\rMountOverride\x12_\n\x08override\x18\x01 \x01(\x0b\x32H.turboci.data.gerrit.v1.GobSourceCheckOptions.PinnedRepoMounts.GitCommitH\x00\x88\x01\x01\x12\x12\n\x05mount\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x0b\n\t_overrideB\x08\n\x06_mountB\x0e\n\x0cpinned_reposB\x14\n\x12_base_pinned_reposB<P\x01Z8go.chromium.org/turboci/proto/go/data/gerrit/v1;gerritpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.gerrit.v1.gob_source_check_options_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z8go.chromium.org/turboci/proto/go/data/gerrit/v1;gerritpb'
+  _globals['_GOBSOURCECHECKOPTIONS']._serialized_start=82
+  _globals['_GOBSOURCECHECKOPTIONS']._serialized_end=1249
+  _globals['_GOBSOURCECHECKOPTIONS_GERRITCHANGE']._serialized_start=288
+  _globals['_GOBSOURCECHECKOPTIONS_GERRITCHANGE']._serialized_end=445
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS']._serialized_start=448
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS']._serialized_end=1227
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS_GITCOMMIT']._serialized_start=777
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS_GITCOMMIT']._serialized_end=900
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS_MANIFESTCOMMIT']._serialized_start=903
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS_MANIFESTCOMMIT']._serialized_end=1053
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS_MOUNTOVERRIDE']._serialized_start=1056
+  _globals['_GOBSOURCECHECKOPTIONS_PINNEDREPOMOUNTS_MOUNTOVERRIDE']._serialized_end=1211
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/gerrit/v1/gob_source_check_results.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/gerrit/v1/gob_source_check_results.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.data.gerrit.v1 import gerrit_change_info as turboci_dot_data_dot_gerrit_dot_v1_dot_gerrit__change__info__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n5turboci/data/gerrit/v1/gob_source_check_results.proto\x12\x16turboci.data.gerrit.v1\x1a/turboci/data/gerrit/v1/gerrit_change_info.proto\"R\n\x15GobSourceCheckResults\x12\x39\n\x07\x63hanges\x18\x01 \x03(\x0b\x32(.turboci.data.gerrit.v1.GerritChangeInfoB<P\x01Z8go.chromium.org/turboci/proto/go/data/gerrit/v1;gerritpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.gerrit.v1.gob_source_check_results_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z8go.chromium.org/turboci/proto/go/data/gerrit/v1;gerritpb'
+  _globals['_GOBSOURCECHECKRESULTS']._serialized_start=130
+  _globals['_GOBSOURCECHECKRESULTS']._serialized_end=212
+# @@protoc_insertion_point(module_scope)
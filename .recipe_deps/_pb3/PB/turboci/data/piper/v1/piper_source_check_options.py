@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/piper/v1/piper_source_check_options.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/piper/v1/piper_source_check_options.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6turboci/data/piper/v1/piper_source_check_options.proto\x12\x15turboci.data.piper.v1\"_\n\x17PiperSourceCheckOptions\x12\r\n\x05\x66iles\x18\x01 \x03(\t\x12\x0f\n\x07targets\x18\x02 \x03(\t\x12\x16\n\tcl_number\x18\x03 \x01(\x03H\x00\x88\x01\x01\x42\x0c\n\n_cl_numberB:P\x01Z6go.chromium.org/turboci/proto/go/data/piper/v1;piperpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.piper.v1.piper_source_check_options_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z6go.chromium.org/turboci/proto/go/data/piper/v1;piperpb'
+  _globals['_PIPERSOURCECHECKOPTIONS']._serialized_start=81
+  _globals['_PIPERSOURCECHECKOPTIONS']._serialized_end=176
+# @@protoc_insertion_point(module_scope)
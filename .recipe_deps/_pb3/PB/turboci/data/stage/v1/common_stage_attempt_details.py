@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/stage/v1/common_stage_attempt_details.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/stage/v1/common_stage_attempt_details.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n8turboci/data/stage/v1/common_stage_attempt_details.proto\x12\x15turboci.data.stage.v1\"\x84\x02\n\x19\x43ommonStageAttemptDetails\x12Q\n\tview_urls\x18\x01 \x03(\x0b\x32>.turboci.data.stage.v1.CommonStageAttemptDetails.ViewUrlsEntry\x1al\n\rViewUrlsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12J\n\x05value\x18\x02 \x01(\x0b\x32;.turboci.data.stage.v1.CommonStageAttemptDetails.UrlDetails:\x02\x38\x01\x1a&\n\nUrlDetails\x12\x10\n\x03url\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x06\n\x04_urlB:P\x01Z6go.chromium.org/turboci/proto/go/data/stage/v1;stagepbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.stage.v1.common_stage_attempt_details_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z6go.chromium.org/turboci/proto/go/data/stage/v1;stagepb'
+  _globals['_COMMONSTAGEATTEMPTDETAILS_VIEWURLSENTRY']._loaded_options = None
+  _globals['_COMMONSTAGEATTEMPTDETAILS_VIEWURLSENTRY']._serialized_options = b'8\001'
+  _globals['_COMMONSTAGEATTEMPTDETAILS']._serialized_start=84
+  _globals['_COMMONSTAGEATTEMPTDETAILS']._serialized_end=344
+  _globals['_COMMONSTAGEATTEMPTDETAILS_VIEWURLSENTRY']._serialized_start=196
+  _globals['_COMMONSTAGEATTEMPTDETAILS_VIEWURLSENTRY']._serialized_end=304
+  _globals['_COMMONSTAGEATTEMPTDETAILS_URLDETAILS']._serialized_start=306
+  _globals['_COMMONSTAGEATTEMPTDETAILS_URLDETAILS']._serialized_end=344
+# @@protoc_insertion_point(module_scope)
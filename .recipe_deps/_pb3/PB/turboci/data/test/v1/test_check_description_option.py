@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/data/test/v1/test_check_description_option.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/data/test/v1/test_check_description_option.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.data.common.v1 import display_message as turboci_dot_data_dot_common_dot_v1_dot_display__message__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n8turboci/data/test/v1/test_check_description_option.proto\x12\x14turboci.data.test.v1\x1a,turboci/data/common/v1/display_message.proto\"\x94\x01\n\x1aTestCheckDescriptionOption\x12\x12\n\x05title\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x44\n\x0f\x64isplay_message\x18\x02 \x01(\x0b\x32&.turboci.data.common.v1.DisplayMessageH\x01\x88\x01\x01\x42\x08\n\x06_titleB\x12\n\x10_display_messageB8P\x01Z4go.chromium.org/turboci/proto/go/data/test/v1;testpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.data.test.v1.test_check_description_option_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z4go.chromium.org/turboci/proto/go/data/test/v1;testpb'
+  _globals['_TESTCHECKDESCRIPTIONOPTION']._serialized_start=129
+  _globals['_TESTCHECKDESCRIPTIONOPTION']._serialized_end=277
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,7 @@
+from PB.turboci.graph.executor.v1 import cancel_stage as _cancel_stage_pb2
+from PB.turboci.graph.executor.v1 import run_stage as _run_stage_pb2
+from PB.turboci.graph.executor.v1 import validate_stage as _validate_stage_pb2
+from google.protobuf import descriptor as _descriptor
+from typing import ClassVar as _ClassVar
+
+DESCRIPTOR: _descriptor.FileDescriptor
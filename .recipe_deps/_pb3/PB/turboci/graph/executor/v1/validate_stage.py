@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/executor/v1/validate_stage.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/executor/v1/validate_stage.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.orchestrator.v1 import stage as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_execution_policy as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__execution__policy__pb2
+from PB.turboci.graph.orchestrator.v1 import value_data as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__data__pb2
+from PB.turboci.graph.orchestrator.v1 import workplan as turboci_dot_graph_dot_orchestrator_dot_v1_dot_workplan__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.turboci/graph/executor/v1/validate_stage.proto\x12\x19turboci.graph.executor.v1\x1a)turboci/graph/orchestrator/v1/stage.proto\x1a:turboci/graph/orchestrator/v1/stage_execution_policy.proto\x1a.turboci/graph/orchestrator/v1/value_data.proto\x1a,turboci/graph/orchestrator/v1/workplan.proto\"\xd7\x02\n\x14ValidateStageRequest\x12\x38\n\x05stage\x18\x01 \x01(\x0b\x32$.turboci.graph.orchestrator.v1.StageH\x00\x88\x01\x01\x12>\n\x08workplan\x18\x05 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.WorkPlanH\x01\x88\x01\x01\x12R\n\nvalue_data\x18\x04 \x03(\x0b\x32>.turboci.graph.executor.v1.ValidateStageRequest.ValueDataEntry\x1aZ\n\x0eValueDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.turboci.graph.orchestrator.v1.ValueData:\x02\x38\x01\x42\x08\n\x06_stageB\x0b\n\t_workplan\"\xdc\x01\n\x15ValidateStageResponse\x12X\n\x16stage_execution_policy\x18\x01 \x01(\x0b\x32\x33.turboci.graph.orchestrator.v1.StageExecutionPolicyH\x00\x88\x01\x01\x12\x1e\n\x16stage_service_accounts\x18\x02 \x03(\t\x12\x1b\n\x0estage_sub_type\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x19\n\x17_stage_execution_policyB\x11\n\x0f_stage_sub_typeBAP\x01Z=go.chromium.org/turboci/proto/go/graph/executor/v1;executorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.executor.v1.validate_stage_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z=go.chromium.org/turboci/proto/go/graph/executor/v1;executorpb'
+  _globals['_VALIDATESTAGEREQUEST_VALUEDATAENTRY']._loaded_options = None
+  _globals['_VALIDATESTAGEREQUEST_VALUEDATAENTRY']._serialized_options = b'8\001'
+  _globals['_VALIDATESTAGEREQUEST']._serialized_start=275
+  _globals['_VALIDATESTAGEREQUEST']._serialized_end=618
+  _globals['_VALIDATESTAGEREQUEST_VALUEDATAENTRY']._serialized_start=505
+  _globals['_VALIDATESTAGEREQUEST_VALUEDATAENTRY']._serialized_end=595
+  _globals['_VALIDATESTAGERESPONSE']._serialized_start=621
+  _globals['_VALIDATESTAGERESPONSE']._serialized_end=841
+# @@protoc_insertion_point(module_scope)
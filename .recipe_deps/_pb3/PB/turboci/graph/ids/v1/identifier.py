@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/ids/v1/identifier.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/ids/v1/identifier.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%turboci/graph/ids/v1/identifier.proto\x12\x14turboci.graph.ids.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"\xd2\x03\n\nIdentifier\x12\x33\n\twork_plan\x18\x01 \x01(\x0b\x32\x1e.turboci.graph.ids.v1.WorkPlanH\x00\x12,\n\x05\x63heck\x18\x02 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.CheckH\x00\x12\x39\n\x0c\x63heck_result\x18\x04 \x01(\x0b\x32!.turboci.graph.ids.v1.CheckResultH\x00\x12\x35\n\ncheck_edit\x18\x06 \x01(\x0b\x32\x1f.turboci.graph.ids.v1.CheckEditH\x00\x12,\n\x05stage\x18\x08 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.StageH\x00\x12;\n\rstage_attempt\x18\t \x01(\x0b\x32\".turboci.graph.ids.v1.StageAttemptH\x00\x12\x35\n\nstage_edit\x18\n \x01(\x0b\x32\x1f.turboci.graph.ids.v1.StageEditH\x00\x42\x06\n\x04typeJ\x04\x08\x03\x10\x04J\x04\x08\x05\x10\x06J\x04\x08\x07\x10\x08R\x0c\x63heck_optionR\x12\x63heck_result_datumR\x11\x63heck_edit_option\"\"\n\x08WorkPlan\x12\x0f\n\x02id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x05\n\x03_id\"e\n\x05\x43heck\x12\x36\n\twork_plan\x18\x01 \x01(\x0b\x32\x1e.turboci.graph.ids.v1.WorkPlanH\x00\x88\x01\x01\x12\x0f\n\x02id\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x0c\n\n_work_planB\x05\n\x03_id\"b\n\x0b\x43heckResult\x12/\n\x05\x63heck\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.CheckH\x00\x88\x01\x01\x12\x10\n\x03idx\x18\x02 \x01(\x05H\x01\x88\x01\x01\x42\x08\n\x06_checkB\x06\n\x04_idx\"\x84\x01\n\tCheckEdit\x12/\n\x05\x63heck\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.CheckH\x00\x88\x01\x01\x12\x30\n\x07version\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_checkB\n\n\x08_version\"\x8f\x01\n\x05Stage\x12\x36\n\twork_plan\x18\x01 \x01(\x0b\x32\x1e.turboci.graph.ids.v1.WorkPlanH\x00\x88\x01\x01\x12\x18\n\x0bis_worknode\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12\x0f\n\x02id\x18\x03 \x01(\tH\x02\x88\x01\x01\x42\x0c\n\n_work_planB\x0e\n\x0c_is_worknodeB\x05\n\x03_id\"c\n\x0cStageAttempt\x12/\n\x05stage\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.StageH\x00\x88\x01\x01\x12\x10\n\x03idx\x18\x02 \x01(\x05H\x01\x88\x01\x01\x42\x08\n\x06_stageB\x06\n\x04_idx\"\x84\x01\n\tStageEdit\x12/\n\x05stage\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.StageH\x00\x88\x01\x01\x12\x30\n\x07version\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_stageB\n\n\x08_versionB7P\x01Z3go.chromium.org/turboci/proto/go/graph/ids/v1;idspbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.ids.v1.identifier_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z3go.chromium.org/turboci/proto/go/graph/ids/v1;idspb'
+  _globals['_IDENTIFIER']._serialized_start=97
+  _globals['_IDENTIFIER']._serialized_end=563
+  _globals['_WORKPLAN']._serialized_start=565
+  _globals['_WORKPLAN']._serialized_end=599
+  _globals['_CHECK']._serialized_start=601
+  _globals['_CHECK']._serialized_end=702
+  _globals['_CHECKRESULT']._serialized_start=704
+  _globals['_CHECKRESULT']._serialized_end=802
+  _globals['_CHECKEDIT']._serialized_start=805
+  _globals['_CHECKEDIT']._serialized_end=937
+  _globals['_STAGE']._serialized_start=940
+  _globals['_STAGE']._serialized_end=1083
+  _globals['_STAGEATTEMPT']._serialized_start=1085
+  _globals['_STAGEATTEMPT']._serialized_end=1184
+  _globals['_STAGEEDIT']._serialized_start=1187
+  _globals['_STAGEEDIT']._serialized_end=1319
+# @@protoc_insertion_point(module_scope)
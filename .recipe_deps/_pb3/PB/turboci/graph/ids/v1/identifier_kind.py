@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/ids/v1/identifier_kind.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/ids/v1/identifier_kind.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n*turboci/graph/ids/v1/identifier_kind.proto\x12\x14turboci.graph.ids.v1*\xfe\x02\n\x0eIdentifierKind\x12\x1b\n\x17IDENTIFIER_KIND_UNKNOWN\x10\x00\x12\x1d\n\x19IDENTIFIER_KIND_WORK_PLAN\x10\x01\x12\x19\n\x15IDENTIFIER_KIND_CHECK\x10\x02\x12 \n\x1cIDENTIFIER_KIND_CHECK_RESULT\x10\x04\x12\x1e\n\x1aIDENTIFIER_KIND_CHECK_EDIT\x10\x06\x12\x19\n\x15IDENTIFIER_KIND_STAGE\x10\x08\x12!\n\x1dIDENTIFIER_KIND_STAGE_ATTEMPT\x10\t\x12\x1e\n\x1aIDENTIFIER_KIND_STAGE_EDIT\x10\n\"\x04\x08\x03\x10\x03\"\x04\x08\x05\x10\x05\"\x04\x08\x07\x10\x07*\x1cIDENTIFIER_KIND_CHECK_OPTION*\"IDENTIFIER_KIND_CHECK_RESULT_DATUM*!IDENTIFIER_KIND_CHECK_EDIT_OPTIONB7P\x01Z3go.chromium.org/turboci/proto/go/graph/ids/v1;idspbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.ids.v1.identifier_kind_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001Z3go.chromium.org/turboci/proto/go/graph/ids/v1;idspb'
+  _globals['_IDENTIFIERKIND']._serialized_start=69
+  _globals['_IDENTIFIERKIND']._serialized_end=451
+# @@protoc_insertion_point(module_scope)
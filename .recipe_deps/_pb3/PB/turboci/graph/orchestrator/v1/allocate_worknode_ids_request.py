@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/allocate_worknode_ids_request.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/allocate_worknode_ids_request.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nAturboci/graph/orchestrator/v1/allocate_worknode_ids_request.proto\x12\x1dturboci.graph.orchestrator.v1\x1a%turboci/graph/ids/v1/identifier.proto\"\xa2\x01\n\x1a\x41llocateWorkNodeIDsRequest\x12\x12\n\x05token\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x38\n\x0bworkplan_id\x18\x02 \x01(\x0b\x32\x1e.turboci.graph.ids.v1.WorkPlanH\x01\x88\x01\x01\x12\x12\n\x05\x63ount\x18\x03 \x01(\x05H\x02\x88\x01\x01\x42\x08\n\x06_tokenB\x0e\n\x0c_workplan_idB\x08\n\x06_countBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.allocate_worknode_ids_request_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_ALLOCATEWORKNODEIDSREQUEST']._serialized_start=140
+  _globals['_ALLOCATEWORKNODEIDSREQUEST']._serialized_end=302
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/cancel_workplan_request.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/cancel_workplan_request.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import value_write as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__write__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;turboci/graph/orchestrator/v1/cancel_workplan_request.proto\x12\x1dturboci.graph.orchestrator.v1\x1a%turboci/graph/ids/v1/identifier.proto\x1a/turboci/graph/orchestrator/v1/value_write.proto\"\xc4\x02\n\x15\x43\x61ncelWorkPlanRequest\x12\x12\n\x05token\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x38\n\x0bworkplan_id\x18\x02 \x01(\x0b\x32\x1e.turboci.graph.ids.v1.WorkPlanH\x01\x88\x01\x01\x12P\n\x06reason\x18\x03 \x01(\x0b\x32;.turboci.graph.orchestrator.v1.CancelWorkPlanRequest.ReasonH\x02\x88\x01\x01\x1a\x66\n\x06Reason\x12\x14\n\x07message\x18\x01 \x01(\tH\x00\x88\x01\x01\x12:\n\x07\x64\x65tails\x18\x02 \x03(\x0b\x32).turboci.graph.orchestrator.v1.ValueWriteB\n\n\x08_messageB\x08\n\x06_tokenB\x0e\n\x0c_workplan_idB\t\n\x07_reasonBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.cancel_workplan_request_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_CANCELWORKPLANREQUEST']._serialized_start=183
+  _globals['_CANCELWORKPLANREQUEST']._serialized_end=507
+  _globals['_CANCELWORKPLANREQUEST_REASON']._serialized_start=368
+  _globals['_CANCELWORKPLANREQUEST_REASON']._serialized_end=470
+# @@protoc_insertion_point(module_scope)
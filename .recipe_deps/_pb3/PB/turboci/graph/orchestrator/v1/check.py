@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/check.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/check.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import actor as turboci_dot_graph_dot_orchestrator_dot_v1_dot_actor__pb2
+from PB.turboci.graph.orchestrator.v1 import check_kind as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__kind__pb2
+from PB.turboci.graph.orchestrator.v1 import check_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__state__pb2
+from PB.turboci.graph.orchestrator.v1 import dependencies as turboci_dot_graph_dot_orchestrator_dot_v1_dot_dependencies__pb2
+from PB.turboci.graph.orchestrator.v1 import edit as turboci_dot_graph_dot_orchestrator_dot_v1_dot_edit__pb2
+from PB.turboci.graph.orchestrator.v1 import field_options as turboci_dot_graph_dot_orchestrator_dot_v1_dot_field__options__pb2
+from PB.turboci.graph.orchestrator.v1 import revision as turboci_dot_graph_dot_orchestrator_dot_v1_dot_revision__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_attempt_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__attempt__state__pb2
+from PB.turboci.graph.orchestrator.v1 import value_ref as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__ref__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)turboci/graph/orchestrator/v1/check.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a%turboci/graph/ids/v1/identifier.proto\x1a)turboci/graph/orchestrator/v1/actor.proto\x1a.turboci/graph/orchestrator/v1/check_kind.proto\x1a/turboci/graph/orchestrator/v1/check_state.proto\x1a\x30turboci/graph/orchestrator/v1/dependencies.proto\x1a(turboci/graph/orchestrator/v1/edit.proto\x1a\x31turboci/graph/orchestrator/v1/field_options.proto\x1a,turboci/graph/orchestrator/v1/revision.proto\x1a\x37turboci/graph/orchestrator/v1/stage_attempt_state.proto\x1a-turboci/graph/orchestrator/v1/value_ref.proto\"\xa8\x0c\n\x05\x43heck\x12:\n\nidentifier\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.CheckB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12&\n\x0c\x64isplay_name\x18\x0c \x01(\tB\x0b\x82\x86\xf6\xfb\x0f\x05\n\x03\n\x01\nH\x01\x88\x01\x01\x12\x43\n\ncreated_by\x18\x02 \x01(\x0b\x32$.turboci.graph.orchestrator.v1.ActorB\x04\xe2\x41\x01\x05H\x02\x88\x01\x01\x12\x41\n\x04kind\x18\x03 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.CheckKindB\x04\xe2\x41\x01\x05H\x03\x88\x01\x01\x12\x1b\n\x08sub_type\x18\r \x01(\tB\x04\xe2\x41\x01\x05H\x04\x88\x01\x01\x12\x18\n\x05realm\x18\x04 \x01(\tB\x04\xe2\x41\x01\x05H\x05\x88\x01\x01\x12=\n\x07version\x18\x05 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x06\x88\x01\x01\x12=\n\x05state\x18\x06 \x01(\x0e\x32).turboci.graph.orchestrator.v1.CheckStateH\x07\x88\x01\x01\x12M\n\rstate_history\x18\x07 \x03(\x0b\x32\x36.turboci.graph.orchestrator.v1.Check.StateHistoryEntry\x12S\n\x0c\x64\x65pendencies\x18\x08 \x01(\x0b\x32+.turboci.graph.orchestrator.v1.DependenciesB\x0b\x82\x86\xf6\xfb\x0f\x05\x12\x03\n\x01\x02H\x08\x88\x01\x01\x12\x45\n\x07options\x18\t \x03(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRefB\x0b\x82\x86\xf6\xfb\x0f\x05\n\x03\n\x01\n\x12J\n\x07results\x18\n \x03(\x0b\x32+.turboci.graph.orchestrator.v1.Check.ResultB\x0c\x82\x86\xf6\xfb\x0f\x06\n\x04\n\x02\x14\x1e\x12\x32\n\x05\x65\x64its\x18\x0b \x03(\x0b\x32#.turboci.graph.orchestrator.v1.Edit\x1a\xb3\x01\n\x11StateHistoryEntry\x12\x43\n\x05state\x18\x01 \x01(\x0e\x32).turboci.graph.orchestrator.v1.CheckStateB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12\x43\n\x07version\x18\x02 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionB\x04\xe2\x41\x01\x05H\x01\x88\x01\x01\x42\x08\n\x06_stateB\n\n\x08_version\x1a\xe6\x03\n\x06Result\x12@\n\nidentifier\x18\x01 \x01(\x0b\x32!.turboci.graph.ids.v1.CheckResultB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12>\n\x05owner\x18\x02 \x01(\x0b\x32$.turboci.graph.orchestrator.v1.ActorB\x04\xe2\x41\x01\x05H\x01\x88\x01\x01\x12\x46\n\ncreated_at\x18\x03 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionB\x04\xe2\x41\x01\x05H\x02\x88\x01\x01\x12\x35\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRef\x12\x42\n\x0c\x66inalized_at\x18\x05 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x03\x88\x01\x01\x12L\n\rattempt_state\x18\x06 \x01(\x0e\x32\x30.turboci.graph.orchestrator.v1.StageAttemptStateH\x04\x88\x01\x01\x42\r\n\x0b_identifierB\x08\n\x06_ownerB\r\n\x0b_created_atB\x0f\n\r_finalized_atB\x10\n\x0e_attempt_stateB\r\n\x0b_identifierB\x0f\n\r_display_nameB\r\n\x0b_created_byB\x07\n\x05_kindB\x0b\n\t_sub_typeB\x08\n\x06_realmB\n\n\x08_versionB\x08\n\x06_stateB\x0f\n\r_dependenciesBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.check_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_CHECK_STATEHISTORYENTRY'].fields_by_name['state']._loaded_options = None
+  _globals['_CHECK_STATEHISTORYENTRY'].fields_by_name['state']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK_STATEHISTORYENTRY'].fields_by_name['version']._loaded_options = None
+  _globals['_CHECK_STATEHISTORYENTRY'].fields_by_name['version']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK_RESULT'].fields_by_name['identifier']._loaded_options = None
+  _globals['_CHECK_RESULT'].fields_by_name['identifier']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK_RESULT'].fields_by_name['owner']._loaded_options = None
+  _globals['_CHECK_RESULT'].fields_by_name['owner']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK_RESULT'].fields_by_name['created_at']._loaded_options = None
+  _globals['_CHECK_RESULT'].fields_by_name['created_at']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK'].fields_by_name['identifier']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['identifier']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK'].fields_by_name['display_name']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['display_name']._serialized_options = b'\202\206\366\373\017\005\n\003\n\001\n'
+  _globals['_CHECK'].fields_by_name['created_by']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['created_by']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK'].fields_by_name['kind']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['kind']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK'].fields_by_name['sub_type']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['sub_type']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK'].fields_by_name['realm']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['realm']._serialized_options = b'\342A\001\005'
+  _globals['_CHECK'].fields_by_name['dependencies']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['dependencies']._serialized_options = b'\202\206\366\373\017\005\022\003\n\001\002'
+  _globals['_CHECK'].fields_by_name['options']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['options']._serialized_options = b'\202\206\366\373\017\005\n\003\n\001\n'
+  _globals['_CHECK'].fields_by_name['results']._loaded_options = None
+  _globals['_CHECK'].fields_by_name['results']._serialized_options = b'\202\206\366\373\017\006\n\004\n\002\024\036'
+  _globals['_CHECK']._serialized_start=582
+  _globals['_CHECK']._serialized_end=2158
+  _globals['_CHECK_STATEHISTORYENTRY']._serialized_start=1372
+  _globals['_CHECK_STATEHISTORYENTRY']._serialized_end=1551
+  _globals['_CHECK_RESULT']._serialized_start=1554
+  _globals['_CHECK_RESULT']._serialized_end=2040
+# @@protoc_insertion_point(module_scope)
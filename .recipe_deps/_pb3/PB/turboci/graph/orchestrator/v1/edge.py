@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/edge.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/edge.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import check_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__state__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__state__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(turboci/graph/orchestrator/v1/edge.proto\x12\x1dturboci.graph.orchestrator.v1\x1a%turboci/graph/ids/v1/identifier.proto\x1a/turboci/graph/orchestrator/v1/check_state.proto\x1a/turboci/graph/orchestrator/v1/stage_state.proto\"\xe6\x05\n\x04\x45\x64ge\x12:\n\x05\x63heck\x18\x01 \x01(\x0b\x32).turboci.graph.orchestrator.v1.Edge.CheckH\x00\x12:\n\x05stage\x18\x02 \x01(\x0b\x32).turboci.graph.orchestrator.v1.Edge.StageH\x00\x1a\xac\x02\n\x05\x43heck\x12\x34\n\nidentifier\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.CheckH\x00\x88\x01\x01\x12K\n\tcondition\x18\x02 \x01(\x0b\x32\x33.turboci.graph.orchestrator.v1.Edge.Check.ConditionH\x01\x88\x01\x01\x1a\x82\x01\n\tCondition\x12@\n\x08on_state\x18\x01 \x01(\x0e\x32).turboci.graph.orchestrator.v1.CheckStateH\x00\x88\x01\x01\x12\x17\n\nexpression\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x0b\n\t_on_stateB\r\n\x0b_expressionB\r\n\x0b_identifierB\x0c\n\n_condition\x1a\xac\x02\n\x05Stage\x12\x34\n\nidentifier\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.StageH\x00\x88\x01\x01\x12K\n\tcondition\x18\x02 \x01(\x0b\x32\x33.turboci.graph.orchestrator.v1.Edge.Stage.ConditionH\x01\x88\x01\x01\x1a\x82\x01\n\tCondition\x12@\n\x08on_state\x18\x01 \x01(\x0e\x32).turboci.graph.orchestrator.v1.StageStateH\x00\x88\x01\x01\x12\x17\n\nexpression\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x0b\n\t_on_stateB\r\n\x0b_expressionB\r\n\x0b_identifierB\x0c\n\n_conditionB\x08\n\x06target*Z\n\nResolution\x12\x16\n\x12RESOLUTION_UNKNOWN\x10\x00\x12\x18\n\x14RESOLUTION_SATISFIED\x10\x01\x12\x1a\n\x16RESOLUTION_UNSATISFIED\x10\x02\x42IP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.edge_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_RESOLUTION']._serialized_start=957
+  _globals['_RESOLUTION']._serialized_end=1047
+  _globals['_EDGE']._serialized_start=213
+  _globals['_EDGE']._serialized_end=955
+  _globals['_EDGE_CHECK']._serialized_start=342
+  _globals['_EDGE_CHECK']._serialized_end=642
+  _globals['_EDGE_CHECK_CONDITION']._serialized_start=483
+  _globals['_EDGE_CHECK_CONDITION']._serialized_end=613
+  _globals['_EDGE_STAGE']._serialized_start=645
+  _globals['_EDGE_STAGE']._serialized_end=945
+  _globals['_EDGE_STAGE_CONDITION']._serialized_start=786
+  _globals['_EDGE_STAGE_CONDITION']._serialized_end=916
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/edit.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/edit.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import actor as turboci_dot_graph_dot_orchestrator_dot_v1_dot_actor__pb2
+from PB.turboci.graph.orchestrator.v1 import check_delta as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__delta__pb2
+from PB.turboci.graph.orchestrator.v1 import field_options as turboci_dot_graph_dot_orchestrator_dot_v1_dot_field__options__pb2
+from PB.turboci.graph.orchestrator.v1 import revision as turboci_dot_graph_dot_orchestrator_dot_v1_dot_revision__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_delta as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__delta__pb2
+from PB.turboci.graph.orchestrator.v1 import transaction_details as turboci_dot_graph_dot_orchestrator_dot_v1_dot_transaction__details__pb2
+from PB.turboci.graph.orchestrator.v1 import value_ref as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__ref__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n(turboci/graph/orchestrator/v1/edit.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a%turboci/graph/ids/v1/identifier.proto\x1a)turboci/graph/orchestrator/v1/actor.proto\x1a/turboci/graph/orchestrator/v1/check_delta.proto\x1a\x31turboci/graph/orchestrator/v1/field_options.proto\x1a,turboci/graph/orchestrator/v1/revision.proto\x1a/turboci/graph/orchestrator/v1/stage_delta.proto\x1a\x37turboci/graph/orchestrator/v1/transaction_details.proto\x1a-turboci/graph/orchestrator/v1/value_ref.proto\"\xae\x06\n\x04\x45\x64it\x12\x45\n\x08\x66or_node\x18\x01 \x01(\x0b\x32 .turboci.graph.ids.v1.IdentifierB\x0c\x82\x86\xf6\xfb\x0f\x06\x12\x04\n\x02\x02\x08H\x01\x88\x01\x01\x12=\n\x07version\x18\x02 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x02\x88\x01\x01\x12\x32\n\texpire_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03\x88\x01\x01\x12\x18\n\x05realm\x18\x05 \x01(\tB\x04\xe2\x41\x01\x05H\x04\x88\x01\x01\x12=\n\ncreated_by\x18\x06 \x01(\x0b\x32$.turboci.graph.orchestrator.v1.ActorH\x05\x88\x01\x01\x12\x43\n\x03txn\x18\x0c \x01(\x0b\x32\x31.turboci.graph.orchestrator.v1.TransactionDetailsH\x06\x88\x01\x01\x12G\n\x0ewrite_node_set\x18\r \x03(\x0b\x32 .turboci.graph.ids.v1.IdentifierB\r\x82\x86\xf6\xfb\x0f\x07\x12\x05\n\x03\x02\x08\t\x12?\n\x06reason\x18\x08 \x01(\x0b\x32*.turboci.graph.orchestrator.v1.Edit.ReasonH\x07\x88\x01\x01\x12:\n\x05\x63heck\x18\t \x01(\x0b\x32).turboci.graph.orchestrator.v1.CheckDeltaH\x00\x12:\n\x05stage\x18\n \x01(\x0b\x32).turboci.graph.orchestrator.v1.StageDeltaH\x00\x1a\x64\n\x06Reason\x12\x14\n\x07message\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x38\n\x07\x64\x65tails\x18\x02 \x03(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRefB\n\n\x08_messageB\x07\n\x05\x64\x65ltaB\x0b\n\t_for_nodeB\n\n\x08_versionB\x0c\n\n_expire_atB\x08\n\x06_realmB\r\n\x0b_created_byB\x06\n\x04_txnB\t\n\x07_reasonJ\x04\x08\x07\x10\x08J\x04\x08\x0b\x10\x0c\x42IP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.edit_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_EDIT'].fields_by_name['for_node']._loaded_options = None
+  _globals['_EDIT'].fields_by_name['for_node']._serialized_options = b'\202\206\366\373\017\006\022\004\n\002\002\010'
+  _globals['_EDIT'].fields_by_name['realm']._loaded_options = None
+  _globals['_EDIT'].fields_by_name['realm']._serialized_options = b'\342A\001\005'
+  _globals['_EDIT'].fields_by_name['write_node_set']._loaded_options = None
+  _globals['_EDIT'].fields_by_name['write_node_set']._serialized_options = b'\202\206\366\373\017\007\022\005\n\003\002\010\t'
+  _globals['_EDIT']._serialized_start=523
+  _globals['_EDIT']._serialized_end=1337
+  _globals['_EDIT_REASON']._serialized_start=1133
+  _globals['_EDIT_REASON']._serialized_end=1233
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/field_options.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/field_options.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+from PB.turboci.graph.ids.v1 import identifier_kind as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__kind__pb2
+from PB.turboci.graph.orchestrator.v1 import check_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__state__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n1turboci/graph/orchestrator/v1/field_options.proto\x12\x1dturboci.graph.orchestrator.v1\x1a google/protobuf/descriptor.proto\x1a*turboci/graph/ids/v1/identifier_kind.proto\x1a/turboci/graph/orchestrator/v1/check_state.proto\"\xd0\x03\n\x0c\x46ieldOptions\x12Q\n\x05\x63heck\x18\x01 \x01(\x0b\x32=.turboci.graph.orchestrator.v1.FieldOptions.CheckFieldOptionsH\x00\x88\x01\x01\x12N\n\x02id\x18\x02 \x01(\x0b\x32=.turboci.graph.orchestrator.v1.FieldOptions.IdentifierOptionsH\x01\x88\x01\x01\x12\x1a\n\rcreation_only\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12\"\n\x15realm_inherits_writer\x18\x04 \x01(\x08H\x03\x88\x01\x01\x1aP\n\x11\x43heckFieldOptions\x12;\n\x08\x65\x64itable\x18\x01 \x03(\x0e\x32).turboci.graph.orchestrator.v1.CheckState\x1aN\n\x11IdentifierOptions\x12\x39\n\x07\x61llowed\x18\x01 \x03(\x0e\x32$.turboci.graph.ids.v1.IdentifierKindB\x02\x10\x01\x42\x08\n\x06_checkB\x05\n\x03_idB\x10\n\x0e_creation_onlyB\x18\n\x16_realm_inherits_writer:b\n\x07turboci\x12\x1d.google.protobuf.FieldOptions\x18\xe0\xe0\xbe\xff\x01 \x01(\x0b\x32+.turboci.graph.orchestrator.v1.FieldOptions\x88\x01\x01\x42IP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.field_options_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_FIELDOPTIONS_IDENTIFIEROPTIONS'].fields_by_name['allowed']._loaded_options = None
+  _globals['_FIELDOPTIONS_IDENTIFIEROPTIONS'].fields_by_name['allowed']._serialized_options = b'\020\001'
+  _globals['_FIELDOPTIONS']._serialized_start=212
+  _globals['_FIELDOPTIONS']._serialized_end=676
+  _globals['_FIELDOPTIONS_CHECKFIELDOPTIONS']._serialized_start=455
+  _globals['_FIELDOPTIONS_CHECKFIELDOPTIONS']._serialized_end=535
+  _globals['_FIELDOPTIONS_IDENTIFIEROPTIONS']._serialized_start=537
+  _globals['_FIELDOPTIONS_IDENTIFIEROPTIONS']._serialized_end=615
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,12 @@
+from google.protobuf import descriptor_pb2 as _descriptor_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar
+
+DESCRIPTOR: _descriptor.FileDescriptor
+TURBOCI_RPC_FIELD_NUMBER: _ClassVar[int]
+turboci_rpc: _descriptor.FieldDescriptor
+
+class MethodOptions(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
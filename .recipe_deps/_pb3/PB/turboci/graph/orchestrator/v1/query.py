@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/query.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/query.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import check_kind as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__kind__pb2
+from PB.turboci.graph.orchestrator.v1 import check_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__state__pb2
+from PB.turboci.graph.orchestrator.v1 import field_options as turboci_dot_graph_dot_orchestrator_dot_v1_dot_field__options__pb2
+from PB.turboci.graph.orchestrator.v1 import revision_range as turboci_dot_graph_dot_orchestrator_dot_v1_dot_revision__range__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__state__pb2
+from PB.turboci.graph.orchestrator.v1 import type_set as turboci_dot_graph_dot_orchestrator_dot_v1_dot_type__set__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)turboci/graph/orchestrator/v1/query.proto\x12\x1dturboci.graph.orchestrator.v1\x1a%turboci/graph/ids/v1/identifier.proto\x1a.turboci/graph/orchestrator/v1/check_kind.proto\x1a/turboci/graph/orchestrator/v1/check_state.proto\x1a\x31turboci/graph/orchestrator/v1/field_options.proto\x1a\x32turboci/graph/orchestrator/v1/revision_range.proto\x1a/turboci/graph/orchestrator/v1/stage_state.proto\x1a,turboci/graph/orchestrator/v1/type_set.proto\"\xbf\x11\n\x05Query\x12;\n\x11nodes_in_workplan\x18\x01 \x01(\x0b\x32\x1e.turboci.graph.ids.v1.WorkPlanH\x00\x12[\n\x16nodes_across_workplans\x18\x02 \x01(\x0b\x32\x39.turboci.graph.orchestrator.v1.Query.NodesAcrossWorkPlansH\x00\x12\x45\n\x0bnodes_by_id\x18\x03 \x01(\x0b\x32..turboci.graph.orchestrator.v1.Query.NodesByIDH\x00\x12M\n\rselect_checks\x18\x04 \x01(\x0b\x32\x31.turboci.graph.orchestrator.v1.Query.SelectChecksH\x01\x88\x01\x01\x12M\n\rselect_stages\x18\x05 \x01(\x0b\x32\x31.turboci.graph.orchestrator.v1.Query.SelectStagesH\x02\x88\x01\x01\x12Y\n\x13\x65xpand_dependencies\x18\x06 \x01(\x0b\x32\x37.turboci.graph.orchestrator.v1.Query.ExpandDependenciesH\x03\x88\x01\x01\x12U\n\x11\x65xpand_dependents\x18\x07 \x01(\x0b\x32\x35.turboci.graph.orchestrator.v1.Query.ExpandDependentsH\x04\x88\x01\x01\x12O\n\x0e\x63ollect_checks\x18\x08 \x01(\x0b\x32\x32.turboci.graph.orchestrator.v1.Query.CollectChecksH\x05\x88\x01\x01\x12O\n\x0e\x63ollect_stages\x18\t \x01(\x0b\x32\x32.turboci.graph.orchestrator.v1.Query.CollectStagesH\x06\x88\x01\x01\x1a\x16\n\x14NodesAcrossWorkPlans\x1aJ\n\tNodesByID\x12=\n\x05nodes\x18\x02 \x03(\x0b\x32 .turboci.graph.ids.v1.IdentifierB\x0c\x82\x86\xf6\xfb\x0f\x06\x12\x04\n\x02\x02\x08\x1a\xbe\x03\n\x0cSelectChecks\x12O\n\npredicates\x18\x01 \x03(\x0b\x32;.turboci.graph.orchestrator.v1.Query.SelectChecks.Predicate\x1a\xdc\x02\n\tPredicate\x12;\n\x04kind\x18\x01 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.CheckKindH\x00\x88\x01\x01\x12=\n\x05state\x18\x02 \x01(\x0e\x32).turboci.graph.orchestrator.v1.CheckStateH\x01\x88\x01\x01\x12\x45\n\x10with_option_type\x18\x03 \x01(\x0b\x32&.turboci.graph.orchestrator.v1.TypeSetH\x02\x88\x01\x01\x12J\n\x15with_result_data_type\x18\x04 \x01(\x0b\x32&.turboci.graph.orchestrator.v1.TypeSetH\x03\x88\x01\x01\x42\x07\n\x05_kindB\x08\n\x06_stateB\x13\n\x11_with_option_typeB\x18\n\x16_with_result_data_type\x1a\x8e\x02\n\x0cSelectStages\x12O\n\npredicates\x18\x01 \x03(\x0b\x32;.turboci.graph.orchestrator.v1.Query.SelectStages.Predicate\x1a\xac\x01\n\tPredicate\x12=\n\x05state\x18\x01 \x01(\x0e\x32).turboci.graph.orchestrator.v1.StageStateH\x00\x88\x01\x01\x12\x43\n\x0ewith_args_type\x18\x02 \x01(\x0b\x32&.turboci.graph.orchestrator.v1.TypeSetH\x01\x88\x01\x01\x42\x08\n\x06_stateB\x11\n\x0f_with_args_type\x1a\x64\n\x12\x45xpandDependencies\x12\x45\n\x04mode\x18\x01 \x01(\x0e\x32\x32.turboci.graph.orchestrator.v1.QueryExpandDepsModeH\x00\x88\x01\x01\x42\x07\n\x05_mode\x1a\x62\n\x10\x45xpandDependents\x12\x45\n\x04mode\x18\x01 \x01(\x0e\x32\x32.turboci.graph.orchestrator.v1.QueryExpandDepsModeH\x00\x88\x01\x01\x42\x07\n\x05_mode\x1a\xa7\x01\n\rCollectChecks\x12\x14\n\x07options\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12\x18\n\x0bresult_data\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12@\n\x05\x65\x64its\x18\x03 \x01(\x0b\x32,.turboci.graph.orchestrator.v1.RevisionRangeH\x02\x88\x01\x01\x42\n\n\x08_optionsB\x0e\n\x0c_result_dataB\x08\n\x06_edits\x1a\xb4\x01\n\rCollectStages\x12J\n\x08\x61ttempts\x18\x01 \x01(\x0e\x32\x33.turboci.graph.orchestrator.v1.CollectStageAttemptsH\x00\x88\x01\x01\x12@\n\x05\x65\x64its\x18\x02 \x01(\x0b\x32,.turboci.graph.orchestrator.v1.RevisionRangeH\x01\x88\x01\x01\x42\x0b\n\t_attemptsB\x08\n\x06_editsB\n\n\x08node_setB\x10\n\x0e_select_checksB\x10\n\x0e_select_stagesB\x16\n\x14_expand_dependenciesB\x14\n\x12_expand_dependentsB\x11\n\x0f_collect_checksB\x11\n\x0f_collect_stages*\x81\x01\n\x13QueryExpandDepsMode\x12\"\n\x1eQUERY_EXPAND_DEPS_MODE_UNKNOWN\x10\x00\x12 \n\x1cQUERY_EXPAND_DEPS_MODE_EDGES\x10\x01\x12$\n QUERY_EXPAND_DEPS_MODE_SATISFIED\x10\x02*\x9e\x01\n\x14\x43ollectStageAttempts\x12\"\n\x1e\x43OLLECT_STAGE_ATTEMPTS_UNKNOWN\x10\x00\x12\x1f\n\x1b\x43OLLECT_STAGE_ATTEMPTS_NONE\x10\x01\x12\x1e\n\x1a\x43OLLECT_STAGE_ATTEMPTS_ALL\x10\x02\x12!\n\x1d\x43OLLECT_STAGE_ATTEMPTS_LATEST\x10\x03\x42IP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.query_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_QUERY_NODESBYID'].fields_by_name['nodes']._loaded_options = None
+  _globals['_QUERY_NODESBYID'].fields_by_name['nodes']._serialized_options = b'\202\206\366\373\017\006\022\004\n\002\002\010'
+  _globals['_QUERYEXPANDDEPSMODE']._serialized_start=2653
+  _globals['_QUERYEXPANDDEPSMODE']._serialized_end=2782
+  _globals['_COLLECTSTAGEATTEMPTS']._serialized_start=2785
+  _globals['_COLLECTSTAGEATTEMPTS']._serialized_end=2943
+  _globals['_QUERY']._serialized_start=411
+  _globals['_QUERY']._serialized_end=2650
+  _globals['_QUERY_NODESACROSSWORKPLANS']._serialized_start=1143
+  _globals['_QUERY_NODESACROSSWORKPLANS']._serialized_end=1165
+  _globals['_QUERY_NODESBYID']._serialized_start=1167
+  _globals['_QUERY_NODESBYID']._serialized_end=1241
+  _globals['_QUERY_SELECTCHECKS']._serialized_start=1244
+  _globals['_QUERY_SELECTCHECKS']._serialized_end=1690
+  _globals['_QUERY_SELECTCHECKS_PREDICATE']._serialized_start=1342
+  _globals['_QUERY_SELECTCHECKS_PREDICATE']._serialized_end=1690
+  _globals['_QUERY_SELECTSTAGES']._serialized_start=1693
+  _globals['_QUERY_SELECTSTAGES']._serialized_end=1963
+  _globals['_QUERY_SELECTSTAGES_PREDICATE']._serialized_start=1791
+  _globals['_QUERY_SELECTSTAGES_PREDICATE']._serialized_end=1963
+  _globals['_QUERY_EXPANDDEPENDENCIES']._serialized_start=1965
+  _globals['_QUERY_EXPANDDEPENDENCIES']._serialized_end=2065
+  _globals['_QUERY_EXPANDDEPENDENTS']._serialized_start=2067
+  _globals['_QUERY_EXPANDDEPENDENTS']._serialized_end=2165
+  _globals['_QUERY_COLLECTCHECKS']._serialized_start=2168
+  _globals['_QUERY_COLLECTCHECKS']._serialized_end=2335
+  _globals['_QUERY_COLLECTSTAGES']._serialized_start=2338
+  _globals['_QUERY_COLLECTSTAGES']._serialized_end=2518
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/read_workplan_request.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/read_workplan_request.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.ids.v1 import identifier_kind as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__kind__pb2
+from PB.turboci.graph.orchestrator.v1 import field_options as turboci_dot_graph_dot_orchestrator_dot_v1_dot_field__options__pb2
+from PB.turboci.graph.orchestrator.v1 import revision as turboci_dot_graph_dot_orchestrator_dot_v1_dot_revision__pb2
+from PB.turboci.graph.orchestrator.v1 import value_filter as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__filter__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9turboci/graph/orchestrator/v1/read_workplan_request.proto\x12\x1dturboci.graph.orchestrator.v1\x1a%turboci/graph/ids/v1/identifier.proto\x1a*turboci/graph/ids/v1/identifier_kind.proto\x1a\x31turboci/graph/orchestrator/v1/field_options.proto\x1a,turboci/graph/orchestrator/v1/revision.proto\x1a\x30turboci/graph/orchestrator/v1/value_filter.proto\"\xb4\x03\n\x13ReadWorkPlanRequest\x12\x12\n\x05token\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x38\n\x0bworkplan_id\x18\x02 \x01(\x0b\x32\x1e.turboci.graph.ids.v1.WorkPlanH\x01\x88\x01\x01\x12R\n\x13included_node_types\x18\x03 \x03(\x0e\x32$.turboci.graph.ids.v1.IdentifierKindB\x0f\x82\x86\xf6\xfb\x0f\t\x12\x07\n\x05\x02\x06\x08\t\n\x12\x43\n\rsince_version\x18\x04 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x02\x88\x01\x01\x12\x45\n\x0cvalue_filter\x18\x05 \x01(\x0b\x32*.turboci.graph.orchestrator.v1.ValueFilterH\x03\x88\x01\x01\x12\x1d\n\x10pagination_token\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x08\n\x06_tokenB\x0e\n\x0c_workplan_idB\x10\n\x0e_since_versionB\x0f\n\r_value_filterB\x13\n\x11_pagination_tokenBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.read_workplan_request_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_READWORKPLANREQUEST'].fields_by_name['included_node_types']._loaded_options = None
+  _globals['_READWORKPLANREQUEST'].fields_by_name['included_node_types']._serialized_options = b'\202\206\366\373\017\t\022\007\n\005\002\006\010\t\n'
+  _globals['_READWORKPLANREQUEST']._serialized_start=323
+  _globals['_READWORKPLANREQUEST']._serialized_end=759
+# @@protoc_insertion_point(module_scope)
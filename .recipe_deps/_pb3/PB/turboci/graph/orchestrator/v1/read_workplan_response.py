@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/read_workplan_response.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/read_workplan_response.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.orchestrator.v1 import revision as turboci_dot_graph_dot_orchestrator_dot_v1_dot_revision__pb2
+from PB.turboci.graph.orchestrator.v1 import stage as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__pb2
+from PB.turboci.graph.orchestrator.v1 import value_data as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__data__pb2
+from PB.turboci.graph.orchestrator.v1 import workplan as turboci_dot_graph_dot_orchestrator_dot_v1_dot_workplan__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n:turboci/graph/orchestrator/v1/read_workplan_response.proto\x12\x1dturboci.graph.orchestrator.v1\x1a,turboci/graph/orchestrator/v1/revision.proto\x1a)turboci/graph/orchestrator/v1/stage.proto\x1a.turboci/graph/orchestrator/v1/value_data.proto\x1a,turboci/graph/orchestrator/v1/workplan.proto\"\x8d\x04\n\x14ReadWorkPlanResponse\x12>\n\x08workplan\x18\x01 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.WorkPlanH\x00\x88\x01\x01\x12V\n\nvalue_data\x18\x02 \x03(\x0b\x32\x42.turboci.graph.orchestrator.v1.ReadWorkPlanResponse.ValueDataEntry\x12[\n\x15\x63urrent_attempt_state\x18\x03 \x01(\x0b\x32\x37.turboci.graph.orchestrator.v1.StageAttemptCurrentStateH\x01\x88\x01\x01\x12=\n\x07version\x18\x04 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x02\x88\x01\x01\x12\x1d\n\x10pagination_token\x18\x05 \x01(\tH\x03\x88\x01\x01\x1aZ\n\x0eValueDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.turboci.graph.orchestrator.v1.ValueData:\x02\x38\x01\x42\x0b\n\t_workplanB\x18\n\x16_current_attempt_stateB\n\n\x08_versionB\x13\n\x11_pagination_tokenBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.read_workplan_response_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_READWORKPLANRESPONSE_VALUEDATAENTRY']._loaded_options = None
+  _globals['_READWORKPLANRESPONSE_VALUEDATAENTRY']._serialized_options = b'8\001'
+  _globals['_READWORKPLANRESPONSE']._serialized_start=277
+  _globals['_READWORKPLANRESPONSE']._serialized_end=802
+  _globals['_READWORKPLANRESPONSE_VALUEDATAENTRY']._serialized_start=640
+  _globals['_READWORKPLANRESPONSE_VALUEDATAENTRY']._serialized_end=730
+# @@protoc_insertion_point(module_scope)
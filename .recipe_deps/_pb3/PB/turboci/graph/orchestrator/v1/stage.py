@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/stage.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/stage.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import actor as turboci_dot_graph_dot_orchestrator_dot_v1_dot_actor__pb2
+from PB.turboci.graph.orchestrator.v1 import check_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__state__pb2
+from PB.turboci.graph.orchestrator.v1 import dependencies as turboci_dot_graph_dot_orchestrator_dot_v1_dot_dependencies__pb2
+from PB.turboci.graph.orchestrator.v1 import edit as turboci_dot_graph_dot_orchestrator_dot_v1_dot_edit__pb2
+from PB.turboci.graph.orchestrator.v1 import field_options as turboci_dot_graph_dot_orchestrator_dot_v1_dot_field__options__pb2
+from PB.turboci.graph.orchestrator.v1 import revision as turboci_dot_graph_dot_orchestrator_dot_v1_dot_revision__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_attempt_execution_policy as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__attempt__execution__policy__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_attempt_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__attempt__state__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_concluded_reason as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__concluded__reason__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_execution_policy as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__execution__policy__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__state__pb2
+from PB.turboci.graph.orchestrator.v1 import value_ref as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__ref__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)turboci/graph/orchestrator/v1/stage.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a%turboci/graph/ids/v1/identifier.proto\x1a)turboci/graph/orchestrator/v1/actor.proto\x1a/turboci/graph/orchestrator/v1/check_state.proto\x1a\x30turboci/graph/orchestrator/v1/dependencies.proto\x1a(turboci/graph/orchestrator/v1/edit.proto\x1a\x31turboci/graph/orchestrator/v1/field_options.proto\x1a,turboci/graph/orchestrator/v1/revision.proto\x1a\x42turboci/graph/orchestrator/v1/stage_attempt_execution_policy.proto\x1a\x37turboci/graph/orchestrator/v1/stage_attempt_state.proto\x1a:turboci/graph/orchestrator/v1/stage_concluded_reason.proto\x1a:turboci/graph/orchestrator/v1/stage_execution_policy.proto\x1a/turboci/graph/orchestrator/v1/stage_state.proto\x1a-turboci/graph/orchestrator/v1/value_ref.proto\"\xe8\x1a\n\x05Stage\x12:\n\nidentifier\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.StageB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12\x19\n\x0c\x64isplay_name\x18\x12 \x01(\tH\x01\x88\x01\x01\x12\x43\n\ncreated_by\x18\x02 \x01(\x0b\x32$.turboci.graph.orchestrator.v1.ActorB\x04\xe2\x41\x01\x05H\x02\x88\x01\x01\x12\x18\n\x05realm\x18\x03 \x01(\tB\x04\xe2\x41\x01\x05H\x03\x88\x01\x01\x12@\n\x04\x61rgs\x18\x04 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRefB\x04\xe2\x41\x01\x05H\x04\x88\x01\x01\x12\x15\n\x08sub_type\x18\x13 \x01(\tH\x05\x88\x01\x01\x12=\n\x07version\x18\x05 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x06\x88\x01\x01\x12=\n\x05state\x18\x06 \x01(\x0e\x32).turboci.graph.orchestrator.v1.StageStateH\x07\x88\x01\x01\x12?\n\x0c\x63\x61ncelled_by\x18\x0e \x01(\x0b\x32$.turboci.graph.orchestrator.v1.ActorH\x08\x88\x01\x01\x12\x42\n\x0c\x63\x61ncelled_at\x18\x11 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\t\x88\x01\x01\x12@\n\x06legacy\x18\x10 \x01(\x0b\x32+.turboci.graph.orchestrator.v1.Stage.LegacyH\n\x88\x01\x01\x12M\n\rstate_history\x18\x07 \x03(\x0b\x32\x36.turboci.graph.orchestrator.v1.Stage.StateHistoryEntry\x12T\n\x0c\x64\x65pendencies\x18\x08 \x01(\x0b\x32+.turboci.graph.orchestrator.v1.DependenciesB\x0c\x82\x86\xf6\xfb\x0f\x06\x12\x04\n\x02\x02\x08H\x0b\x88\x01\x01\x12X\n\x10\x65xecution_policy\x18\t \x01(\x0b\x32\x39.turboci.graph.orchestrator.v1.Stage.ExecutionPolicyStateH\x0c\x88\x01\x01\x12>\n\x08\x61ttempts\x18\n \x03(\x0b\x32,.turboci.graph.orchestrator.v1.Stage.Attempt\x12J\n\x0b\x61ssignments\x18\x0b \x03(\x0b\x32/.turboci.graph.orchestrator.v1.Stage.AssignmentB\x04\xe2\x41\x01\x05\x12Y\n\x12\x63ontinuation_group\x18\x0c \x01(\x0b\x32+.turboci.graph.orchestrator.v1.DependenciesB\x0b\x82\x86\xf6\xfb\x0f\x05\x12\x03\n\x01\x08H\r\x88\x01\x01\x12R\n\x10\x63oncluded_reason\x18\r \x01(\x0e\x32\x33.turboci.graph.orchestrator.v1.StageConcludedReasonH\x0e\x88\x01\x01\x12\x32\n\x05\x65\x64its\x18\x0f \x03(\x0b\x32#.turboci.graph.orchestrator.v1.Edit\x1a\x8d\x01\n\x06Legacy\x12>\n\x08worknode\x18\x01 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRefH\x00\x88\x01\x01\x12\x1f\n\x12work_executor_type\x18\x02 \x01(\x05H\x01\x88\x01\x01\x42\x0b\n\t_worknodeB\x15\n\x13_work_executor_type\x1a\xb3\x01\n\x11StateHistoryEntry\x12\x43\n\x05state\x18\x01 \x01(\x0e\x32).turboci.graph.orchestrator.v1.StageStateB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12\x43\n\x07version\x18\x02 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionB\x04\xe2\x41\x01\x05H\x01\x88\x01\x01\x42\x08\n\x06_stateB\n\n\x08_version\x1a\xd2\x01\n\x14\x45xecutionPolicyState\x12Q\n\trequested\x18\x01 \x01(\x0b\x32\x33.turboci.graph.orchestrator.v1.StageExecutionPolicyB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12K\n\tvalidated\x18\x02 \x01(\x0b\x32\x33.turboci.graph.orchestrator.v1.StageExecutionPolicyH\x01\x88\x01\x01\x42\x0c\n\n_requestedB\x0c\n\n_validated\x1a\xfe\t\n\x07\x41ttempt\x12\x41\n\nidentifier\x18\x01 \x01(\x0b\x32\".turboci.graph.ids.v1.StageAttemptB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12=\n\x07version\x18\x02 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x01\x88\x01\x01\x12\x44\n\x0elast_heartbeat\x18\n \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x02\x88\x01\x01\x12\x44\n\x05state\x18\x03 \x01(\x0e\x32\x30.turboci.graph.orchestrator.v1.StageAttemptStateH\x03\x88\x01\x01\x12U\n\rstate_history\x18\x04 \x03(\x0b\x32>.turboci.graph.orchestrator.v1.Stage.Attempt.StateHistoryEntry\x12\x36\n\rwaiting_until\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x04\x88\x01\x01\x12\x18\n\x0bprocess_uid\x18\x05 \x01(\tH\x05\x88\x01\x01\x12\x38\n\x07\x64\x65tails\x18\x06 \x03(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRef\x12G\n\x08progress\x18\x07 \x03(\x0b\x32\x35.turboci.graph.orchestrator.v1.Stage.Attempt.Progress\x12Y\n\x10\x65xecution_policy\x18\x08 \x01(\x0b\x32:.turboci.graph.orchestrator.v1.StageAttemptExecutionPolicyH\x06\x88\x01\x01\x1a\xba\x01\n\x11StateHistoryEntry\x12J\n\x05state\x18\x01 \x01(\x0e\x32\x30.turboci.graph.orchestrator.v1.StageAttemptStateB\x04\xe2\x41\x01\x05H\x00\x88\x01\x01\x12\x43\n\x07version\x18\x02 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionB\x04\xe2\x41\x01\x05H\x01\x88\x01\x01\x42\x08\n\x06_stateB\n\n\x08_version\x1a\xb1\x02\n\x08Progress\x12\x14\n\x07message\x18\x01 \x01(\tH\x00\x88\x01\x01\x12=\n\x07version\x18\x02 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x01\x88\x01\x01\x12\x38\n\x07\x64\x65tails\x18\x03 \x03(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRef\x12=\n\ncreated_by\x18\x04 \x01(\x0b\x32$.turboci.graph.orchestrator.v1.ActorH\x02\x88\x01\x01\x12\x1c\n\x0fidempotency_key\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\n\n\x08_messageB\n\n\x08_versionB\r\n\x0b_created_byB\x12\n\x10_idempotency_keyB\r\n\x0b_identifierB\n\n\x08_versionB\x11\n\x0f_last_heartbeatB\x08\n\x06_stateB\x10\n\x0e_waiting_untilB\x0e\n\x0c_process_uidB\x13\n\x11_execution_policy\x1a\x9c\x01\n\nAssignment\x12\x30\n\x06target\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.CheckH\x00\x88\x01\x01\x12\x42\n\ngoal_state\x18\x02 \x01(\x0e\x32).turboci.graph.orchestrator.v1.CheckStateH\x01\x88\x01\x01\x42\t\n\x07_targetB\r\n\x0b_goal_stateB\r\n\x0b_identifierB\x0f\n\r_display_nameB\r\n\x0b_created_byB\x08\n\x06_realmB\x07\n\x05_argsB\x0b\n\t_sub_typeB\n\n\x08_versionB\x08\n\x06_stateB\x0f\n\r_cancelled_byB\x0f\n\r_cancelled_atB\t\n\x07_legacyB\x0f\n\r_dependenciesB\x13\n\x11_execution_policyB\x15\n\x13_continuation_groupB\x13\n\x11_concluded_reason\"\\\n\x1aStageAttemptClaimedFailure\x12#\n\x16\x63laimed_by_process_uid\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x19\n\x17_claimed_by_process_uid\"\xa0\x03\n\x18StageAttemptCurrentState\x12\x44\n\x05state\x18\x01 \x01(\x0e\x32\x30.turboci.graph.orchestrator.v1.StageAttemptStateH\x00\x88\x01\x01\x12=\n\x07version\x18\x02 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x01\x88\x01\x01\x12\x38\n\x0fupdate_state_by\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02\x88\x01\x01\x12\x35\n\x0cheartbeat_by\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03\x88\x01\x01\x12\x42\n\x0c\x63\x61ncelled_at\x18\x05 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.RevisionH\x04\x88\x01\x01\x42\x08\n\x06_stateB\n\n\x08_versionB\x12\n\x10_update_state_byB\x0f\n\r_heartbeat_byB\x0f\n\r_cancelled_atBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.stage_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_STAGE_STATEHISTORYENTRY'].fields_by_name['state']._loaded_options = None
+  _globals['_STAGE_STATEHISTORYENTRY'].fields_by_name['state']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE_STATEHISTORYENTRY'].fields_by_name['version']._loaded_options = None
+  _globals['_STAGE_STATEHISTORYENTRY'].fields_by_name['version']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE_EXECUTIONPOLICYSTATE'].fields_by_name['requested']._loaded_options = None
+  _globals['_STAGE_EXECUTIONPOLICYSTATE'].fields_by_name['requested']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE_ATTEMPT_STATEHISTORYENTRY'].fields_by_name['state']._loaded_options = None
+  _globals['_STAGE_ATTEMPT_STATEHISTORYENTRY'].fields_by_name['state']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE_ATTEMPT_STATEHISTORYENTRY'].fields_by_name['version']._loaded_options = None
+  _globals['_STAGE_ATTEMPT_STATEHISTORYENTRY'].fields_by_name['version']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE_ATTEMPT'].fields_by_name['identifier']._loaded_options = None
+  _globals['_STAGE_ATTEMPT'].fields_by_name['identifier']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE'].fields_by_name['identifier']._loaded_options = None
+  _globals['_STAGE'].fields_by_name['identifier']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE'].fields_by_name['created_by']._loaded_options = None
+  _globals['_STAGE'].fields_by_name['created_by']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE'].fields_by_name['realm']._loaded_options = None
+  _globals['_STAGE'].fields_by_name['realm']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE'].fields_by_name['args']._loaded_options = None
+  _globals['_STAGE'].fields_by_name['args']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE'].fields_by_name['dependencies']._loaded_options = None
+  _globals['_STAGE'].fields_by_name['dependencies']._serialized_options = b'\202\206\366\373\017\006\022\004\n\002\002\010'
+  _globals['_STAGE'].fields_by_name['assignments']._loaded_options = None
+  _globals['_STAGE'].fields_by_name['assignments']._serialized_options = b'\342A\001\005'
+  _globals['_STAGE'].fields_by_name['continuation_group']._loaded_options = None
+  _globals['_STAGE'].fields_by_name['continuation_group']._serialized_options = b'\202\206\366\373\017\005\022\003\n\001\010'
+  _globals['_STAGE']._serialized_start=804
+  _globals['_STAGE']._serialized_end=4236
+  _globals['_STAGE_LEGACY']._serialized_start=2032
+  _globals['_STAGE_LEGACY']._serialized_end=2173
+  _globals['_STAGE_STATEHISTORYENTRY']._serialized_start=2176
+  _globals['_STAGE_STATEHISTORYENTRY']._serialized_end=2355
+  _globals['_STAGE_EXECUTIONPOLICYSTATE']._serialized_start=2358
+  _globals['_STAGE_EXECUTIONPOLICYSTATE']._serialized_end=2568
+  _globals['_STAGE_ATTEMPT']._serialized_start=2571
+  _globals['_STAGE_ATTEMPT']._serialized_end=3849
+  _globals['_STAGE_ATTEMPT_STATEHISTORYENTRY']._serialized_start=3244
+  _globals['_STAGE_ATTEMPT_STATEHISTORYENTRY']._serialized_end=3430
+  _globals['_STAGE_ATTEMPT_PROGRESS']._serialized_start=3433
+  _globals['_STAGE_ATTEMPT_PROGRESS']._serialized_end=3738
+  _globals['_STAGE_ASSIGNMENT']._serialized_start=3852
+  _globals['_STAGE_ASSIGNMENT']._serialized_end=4008
+  _globals['_STAGEATTEMPTCLAIMEDFAILURE']._serialized_start=4238
+  _globals['_STAGEATTEMPTCLAIMEDFAILURE']._serialized_end=4330
+  _globals['_STAGEATTEMPTCURRENTSTATE']._serialized_start=4333
+  _globals['_STAGEATTEMPTCURRENTSTATE']._serialized_end=4749
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/stage_attempt_state.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/stage_attempt_state.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7turboci/graph/orchestrator/v1/stage_attempt_state.proto\x12\x1dturboci.graph.orchestrator.v1*\xf4\x02\n\x11StageAttemptState\x12\x1f\n\x1bSTAGE_ATTEMPT_STATE_UNKNOWN\x10\x00\x12\x1f\n\x1bSTAGE_ATTEMPT_STATE_PENDING\x10\n\x12!\n\x1dSTAGE_ATTEMPT_STATE_THROTTLED\x10\x14\x12!\n\x1dSTAGE_ATTEMPT_STATE_SCHEDULED\x10\x1e\x12\x1f\n\x1bSTAGE_ATTEMPT_STATE_RUNNING\x10(\x12\"\n\x1eSTAGE_ATTEMPT_STATE_CANCELLING\x10\x32\x12$\n STAGE_ATTEMPT_STATE_TEARING_DOWN\x10<\x12 \n\x1cSTAGE_ATTEMPT_STATE_COMPLETE\x10\x46\x12\"\n\x1eSTAGE_ATTEMPT_STATE_INCOMPLETE\x10P\x12&\n\"STAGE_ATTEMPT_STATE_AWAITING_RETRY\x10ZBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.stage_attempt_state_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_STAGEATTEMPTSTATE']._serialized_start=91
+  _globals['_STAGEATTEMPTSTATE']._serialized_end=463
+# @@protoc_insertion_point(module_scope)
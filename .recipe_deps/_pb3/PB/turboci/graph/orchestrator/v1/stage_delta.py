@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/stage_delta.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/stage_delta.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import dependencies as turboci_dot_graph_dot_orchestrator_dot_v1_dot_dependencies__pb2
+from PB.turboci.graph.orchestrator.v1 import field_options as turboci_dot_graph_dot_orchestrator_dot_v1_dot_field__options__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_attempt_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__attempt__state__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__state__pb2
+from PB.turboci.graph.orchestrator.v1 import value_ref as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__ref__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/turboci/graph/orchestrator/v1/stage_delta.proto\x12\x1dturboci.graph.orchestrator.v1\x1a%turboci/graph/ids/v1/identifier.proto\x1a\x30turboci/graph/orchestrator/v1/dependencies.proto\x1a\x31turboci/graph/orchestrator/v1/field_options.proto\x1a\x37turboci/graph/orchestrator/v1/stage_attempt_state.proto\x1a/turboci/graph/orchestrator/v1/stage_state.proto\x1a-turboci/graph/orchestrator/v1/value_ref.proto\"\xa6\x04\n\nStageDelta\x12=\n\x05state\x18\x01 \x01(\x0e\x32).turboci.graph.orchestrator.v1.StageStateH\x00\x88\x01\x01\x12\x43\n\x08\x61ttempts\x18\x02 \x03(\x0b\x32\x31.turboci.graph.orchestrator.v1.StageDelta.Attempt\x12\x16\n\tcancelled\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12Y\n\x12\x63ontinuation_group\x18\x04 \x01(\x0b\x32+.turboci.graph.orchestrator.v1.DependenciesB\x0b\x82\x86\xf6\xfb\x0f\x05\x12\x03\n\x01\x08H\x02\x88\x01\x01\x1a\xf1\x01\n\x07\x41ttempt\x12;\n\nidentifier\x18\x01 \x01(\x0b\x32\".turboci.graph.ids.v1.StageAttemptH\x00\x88\x01\x01\x12\x44\n\x05state\x18\x02 \x01(\x0e\x32\x30.turboci.graph.orchestrator.v1.StageAttemptStateH\x01\x88\x01\x01\x12\x38\n\x07\x64\x65tails\x18\x03 \x03(\x0b\x32\'.turboci.graph.orchestrator.v1.ValueRef\x12\x10\n\x08progress\x18\x04 \x03(\x03\x42\r\n\x0b_identifierB\x08\n\x06_stateB\x08\n\x06_stateB\x0c\n\n_cancelledB\x15\n\x13_continuation_groupBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.stage_delta_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_STAGEDELTA'].fields_by_name['continuation_group']._loaded_options = None
+  _globals['_STAGEDELTA'].fields_by_name['continuation_group']._serialized_options = b'\202\206\366\373\017\005\022\003\n\001\010'
+  _globals['_STAGEDELTA']._serialized_start=376
+  _globals['_STAGEDELTA']._serialized_end=926
+  _globals['_STAGEDELTA_ATTEMPT']._serialized_start=638
+  _globals['_STAGEDELTA_ATTEMPT']._serialized_end=879
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/stage_execution_policy.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/stage_execution_policy.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_attempt_execution_policy as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__attempt__execution__policy__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n:turboci/graph/orchestrator/v1/stage_execution_policy.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x42turboci/graph/orchestrator/v1/stage_attempt_execution_policy.proto\"\xb1\x04\n\x14StageExecutionPolicy\x12M\n\x05retry\x18\x01 \x01(\x0b\x32\x39.turboci.graph.orchestrator.v1.StageExecutionPolicy.RetryH\x00\x88\x01\x01\x12\x35\n\rstage_timeout\x18\x02 \x01(\x0b\x32\x19.google.protobuf.DurationH\x01\x88\x01\x01\x12)\n\x1c\x65xecute_at_least_one_attempt\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12j\n!attempt_execution_policy_template\x18\x04 \x01(\x0b\x32:.turboci.graph.orchestrator.v1.StageAttemptExecutionPolicyH\x03\x88\x01\x01\x12\x45\n\x1cthrottle_first_attempt_until\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x04\x88\x01\x01\x1a\x31\n\x05Retry\x12\x18\n\x0bmax_retries\x18\x01 \x01(\x05H\x00\x88\x01\x01\x42\x0e\n\x0c_max_retriesB\x08\n\x06_retryB\x10\n\x0e_stage_timeoutB\x1f\n\x1d_execute_at_least_one_attemptB$\n\"_attempt_execution_policy_templateB\x1f\n\x1d_throttle_first_attempt_untilBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.stage_execution_policy_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_STAGEEXECUTIONPOLICY']._serialized_start=227
+  _globals['_STAGEEXECUTIONPOLICY']._serialized_end=788
+  _globals['_STAGEEXECUTIONPOLICY_RETRY']._serialized_start=607
+  _globals['_STAGEEXECUTIONPOLICY_RETRY']._serialized_end=656
+# @@protoc_insertion_point(module_scope)
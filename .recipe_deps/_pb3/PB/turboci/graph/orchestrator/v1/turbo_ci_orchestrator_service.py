@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/turbo_ci_orchestrator_service.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/turbo_ci_orchestrator_service.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.orchestrator.v1 import allocate_worknode_ids_request as turboci_dot_graph_dot_orchestrator_dot_v1_dot_allocate__worknode__ids__request__pb2
+from PB.turboci.graph.orchestrator.v1 import allocate_worknode_ids_response as turboci_dot_graph_dot_orchestrator_dot_v1_dot_allocate__worknode__ids__response__pb2
+from PB.turboci.graph.orchestrator.v1 import cancel_workplan_request as turboci_dot_graph_dot_orchestrator_dot_v1_dot_cancel__workplan__request__pb2
+from PB.turboci.graph.orchestrator.v1 import cancel_workplan_response as turboci_dot_graph_dot_orchestrator_dot_v1_dot_cancel__workplan__response__pb2
+from PB.turboci.graph.orchestrator.v1 import create_workplan_request as turboci_dot_graph_dot_orchestrator_dot_v1_dot_create__workplan__request__pb2
+from PB.turboci.graph.orchestrator.v1 import create_workplan_response as turboci_dot_graph_dot_orchestrator_dot_v1_dot_create__workplan__response__pb2
+from PB.turboci.graph.orchestrator.v1 import query_nodes_request as turboci_dot_graph_dot_orchestrator_dot_v1_dot_query__nodes__request__pb2
+from PB.turboci.graph.orchestrator.v1 import query_nodes_response as turboci_dot_graph_dot_orchestrator_dot_v1_dot_query__nodes__response__pb2
+from PB.turboci.graph.orchestrator.v1 import read_workplan_request as turboci_dot_graph_dot_orchestrator_dot_v1_dot_read__workplan__request__pb2
+from PB.turboci.graph.orchestrator.v1 import read_workplan_response as turboci_dot_graph_dot_orchestrator_dot_v1_dot_read__workplan__response__pb2
+from PB.turboci.graph.orchestrator.v1 import write_nodes_request as turboci_dot_graph_dot_orchestrator_dot_v1_dot_write__nodes__request__pb2
+from PB.turboci.graph.orchestrator.v1 import write_nodes_response as turboci_dot_graph_dot_orchestrator_dot_v1_dot_write__nodes__response__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nAturboci/graph/orchestrator/v1/turbo_ci_orchestrator_service.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x41turboci/graph/orchestrator/v1/allocate_worknode_ids_request.proto\x1a\x42turboci/graph/orchestrator/v1/allocate_worknode_ids_response.proto\x1a;turboci/graph/orchestrator/v1/cancel_workplan_request.proto\x1a<turboci/graph/orchestrator/v1/cancel_workplan_response.proto\x1a;turboci/graph/orchestrator/v1/create_workplan_request.proto\x1a<turboci/graph/orchestrator/v1/create_workplan_response.proto\x1a\x37turboci/graph/orchestrator/v1/query_nodes_request.proto\x1a\x38turboci/graph/orchestrator/v1/query_nodes_response.proto\x1a\x39turboci/graph/orchestrator/v1/read_workplan_request.proto\x1a:turboci/graph/orchestrator/v1/read_workplan_response.proto\x1a\x37turboci/graph/orchestrator/v1/write_nodes_request.proto\x1a\x38turboci/graph/orchestrator/v1/write_nodes_response.proto2\x8d\x06\n\x13TurboCIOrchestrator\x12\x7f\n\x0e\x43reateWorkPlan\x12\x34.turboci.graph.orchestrator.v1.CreateWorkPlanRequest\x1a\x35.turboci.graph.orchestrator.v1.CreateWorkPlanResponse\"\x00\x12s\n\nWriteNodes\x12\x30.turboci.graph.orchestrator.v1.WriteNodesRequest\x1a\x31.turboci.graph.orchestrator.v1.WriteNodesResponse\"\x00\x12s\n\nQueryNodes\x12\x30.turboci.graph.orchestrator.v1.QueryNodesRequest\x1a\x31.turboci.graph.orchestrator.v1.QueryNodesResponse\"\x00\x12y\n\x0cReadWorkPlan\x12\x32.turboci.graph.orchestrator.v1.ReadWorkPlanRequest\x1a\x33.turboci.graph.orchestrator.v1.ReadWorkPlanResponse\"\x00\x12\x8e\x01\n\x13\x41llocateWorkNodeIDs\x12\x39.turboci.graph.orchestrator.v1.AllocateWorkNodeIDsRequest\x1a:.turboci.graph.orchestrator.v1.AllocateWorkNodeIDsResponse\"\x00\x12\x7f\n\x0e\x43\x61ncelWorkPlan\x12\x34.turboci.graph.orchestrator.v1.CancelWorkPlanRequest\x1a\x35.turboci.graph.orchestrator.v1.CancelWorkPlanResponse\"\x00\x42TP\x01ZPgo.chromium.org/turboci/proto/go/graph/orchestrator/v1/grpcpb;orchestratorgrpcpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.turbo_ci_orchestrator_service_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZPgo.chromium.org/turboci/proto/go/graph/orchestrator/v1/grpcpb;orchestratorgrpcpb'
+  _globals['_TURBOCIORCHESTRATOR']._serialized_start=831
+  _globals['_TURBOCIORCHESTRATOR']._serialized_end=1612
+# @@protoc_insertion_point(module_scope)
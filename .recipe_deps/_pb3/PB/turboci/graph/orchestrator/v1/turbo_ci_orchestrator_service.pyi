@@ -0,0 +1,16 @@
+from PB.turboci.graph.orchestrator.v1 import allocate_worknode_ids_request as _allocate_worknode_ids_request_pb2
+from PB.turboci.graph.orchestrator.v1 import allocate_worknode_ids_response as _allocate_worknode_ids_response_pb2
+from PB.turboci.graph.orchestrator.v1 import cancel_workplan_request as _cancel_workplan_request_pb2
+from PB.turboci.graph.orchestrator.v1 import cancel_workplan_response as _cancel_workplan_response_pb2
+from PB.turboci.graph.orchestrator.v1 import create_workplan_request as _create_workplan_request_pb2
+from PB.turboci.graph.orchestrator.v1 import create_workplan_response as _create_workplan_response_pb2
+from PB.turboci.graph.orchestrator.v1 import query_nodes_request as _query_nodes_request_pb2
+from PB.turboci.graph.orchestrator.v1 import query_nodes_response as _query_nodes_response_pb2
+from PB.turboci.graph.orchestrator.v1 import read_workplan_request as _read_workplan_request_pb2
+from PB.turboci.graph.orchestrator.v1 import read_workplan_response as _read_workplan_response_pb2
+from PB.turboci.graph.orchestrator.v1 import write_nodes_request as _write_nodes_request_pb2
+from PB.turboci.graph.orchestrator.v1 import write_nodes_response as _write_nodes_response_pb2
+from google.protobuf import descriptor as _descriptor
+from typing import ClassVar as _ClassVar
+
+DESCRIPTOR: _descriptor.FileDescriptor
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/type_info.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/type_info.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.orchestrator.v1 import type_set as turboci_dot_graph_dot_orchestrator_dot_v1_dot_type__set__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n-turboci/graph/orchestrator/v1/type_info.proto\x12\x1dturboci.graph.orchestrator.v1\x1a,turboci/graph/orchestrator/v1/type_set.proto\"\xc8\x01\n\x08TypeInfo\x12;\n\x06wanted\x18\x01 \x01(\x0b\x32&.turboci.graph.orchestrator.v1.TypeSetH\x00\x88\x01\x01\x12\x1b\n\x0eunknown_jsonpb\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12:\n\x05known\x18\x03 \x01(\x0b\x32&.turboci.graph.orchestrator.v1.TypeSetH\x02\x88\x01\x01\x42\t\n\x07_wantedB\x11\n\x0f_unknown_jsonpbB\x08\n\x06_knownBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.type_info_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_TYPEINFO']._serialized_start=127
+  _globals['_TYPEINFO']._serialized_end=327
+# @@protoc_insertion_point(module_scope)
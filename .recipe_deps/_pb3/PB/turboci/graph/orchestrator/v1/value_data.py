@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/value_data.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/value_data.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.turboci/graph/orchestrator/v1/value_data.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x19google/protobuf/any.proto\"\xf1\x02\n\tValueData\x12&\n\x06\x62inary\x18\x01 \x01(\x0b\x32\x14.google.protobuf.AnyH\x00\x12@\n\x04json\x18\x02 \x01(\x0b\x32\x30.turboci.graph.orchestrator.v1.ValueData.JsonAnyH\x00\x12U\n\x12\x63onversion_failure\x18\x03 \x01(\x0e\x32\x34.turboci.graph.orchestrator.v1.DataConversionFailureH\x01\x88\x01\x01\x1a\x83\x01\n\x07JsonAny\x12\x15\n\x08type_url\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05value\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x1f\n\x12has_unknown_fields\x18\x03 \x01(\x08H\x02\x88\x01\x01\x42\x0b\n\t_type_urlB\x08\n\x06_valueB\x15\n\x13_has_unknown_fieldsB\x06\n\x04\x64\x61taB\x15\n\x13_conversion_failure*\x8a\x01\n\x15\x44\x61taConversionFailure\x12#\n\x1f\x44\x41TA_CONVERSION_FAILURE_UNKNOWN\x10\x00\x12)\n%DATA_CONVERSION_FAILURE_NO_DESCRIPTOR\x10\x01\x12!\n\x1d\x44\x41TA_CONVERSION_FAILURE_ERROR\x10\x02\x42IP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.value_data_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_DATACONVERSIONFAILURE']._serialized_start=481
+  _globals['_DATACONVERSIONFAILURE']._serialized_end=619
+  _globals['_VALUEDATA']._serialized_start=109
+  _globals['_VALUEDATA']._serialized_end=478
+  _globals['_VALUEDATA_JSONANY']._serialized_start=316
+  _globals['_VALUEDATA_JSONANY']._serialized_end=447
+# @@protoc_insertion_point(module_scope)
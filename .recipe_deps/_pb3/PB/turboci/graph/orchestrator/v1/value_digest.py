@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/value_digest.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/value_digest.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0turboci/graph/orchestrator/v1/value_digest.proto\x12\x1dturboci.graph.orchestrator.v1\"\x9b\x01\n\x0bValueDigest\x12\x11\n\x04hash\x18\x01 \x01(\x0cH\x00\x88\x01\x01\x12\x17\n\nsize_bytes\x18\x02 \x01(\x04H\x01\x88\x01\x01\x12?\n\x04\x61lgo\x18\x03 \x01(\x0e\x32,.turboci.graph.orchestrator.v1.ValueHashAlgoH\x02\x88\x01\x01\x42\x07\n\x05_hashB\r\n\x0b_size_bytesB\x07\n\x05_algo*H\n\rValueHashAlgo\x12\x1b\n\x17VALUE_HASH_ALGO_UNKNOWN\x10\x00\x12\x1a\n\x16VALUE_HASH_ALGO_SHA256\x10\x01\x42IP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.value_digest_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_VALUEHASHALGO']._serialized_start=241
+  _globals['_VALUEHASHALGO']._serialized_end=313
+  _globals['_VALUEDIGEST']._serialized_start=84
+  _globals['_VALUEDIGEST']._serialized_end=239
+# @@protoc_insertion_point(module_scope)
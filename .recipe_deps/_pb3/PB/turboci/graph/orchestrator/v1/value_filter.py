@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/value_filter.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/value_filter.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.turboci.graph.orchestrator.v1 import type_info as turboci_dot_graph_dot_orchestrator_dot_v1_dot_type__info__pb2
+from PB.turboci.graph.orchestrator.v1 import value_mask as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__mask__pb2
+from PB.turboci.graph.orchestrator.v1 import value_slot as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__slot__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0turboci/graph/orchestrator/v1/value_filter.proto\x12\x1dturboci.graph.orchestrator.v1\x1a-turboci/graph/orchestrator/v1/type_info.proto\x1a.turboci/graph/orchestrator/v1/value_mask.proto\x1a.turboci/graph/orchestrator/v1/value_slot.proto\"\xda\t\n\x0bValueFilter\x12?\n\ttype_info\x18\x01 \x01(\x0b\x32\'.turboci.graph.orchestrator.v1.TypeInfoH\x00\x88\x01\x01\x12>\n\x0cinclude_data\x18\x0c \x03(\x0e\x32(.turboci.graph.orchestrator.v1.ValueSlot\x12H\n\rcheck_options\x18\x02 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x01\x88\x01\x01\x12L\n\x11\x63heck_result_data\x18\x03 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x02\x88\x01\x01\x12M\n\x12\x63heck_edit_options\x18\x04 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x03\x88\x01\x01\x12Q\n\x16\x63heck_edit_result_data\x18\x05 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x04\x88\x01\x01\x12\x45\n\nstage_args\x18\x06 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x05\x88\x01\x01\x12P\n\x15stage_attempt_details\x18\x07 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x06\x88\x01\x01\x12Y\n\x1estage_attempt_progress_details\x18\x08 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x07\x88\x01\x01\x12U\n\x1astage_edit_attempt_details\x18\t \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\x08\x88\x01\x01\x12^\n#stage_edit_attempt_progress_details\x18\n \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\t\x88\x01\x01\x12P\n\x15stage_legacy_worknode\x18\x0b \x01(\x0e\x32(.turboci.graph.orchestrator.v1.ValueMaskB\x02\x18\x01H\n\x88\x01\x01\x42\x0c\n\n_type_infoB\x10\n\x0e_check_optionsB\x14\n\x12_check_result_dataB\x15\n\x13_check_edit_optionsB\x19\n\x17_check_edit_result_dataB\r\n\x0b_stage_argsB\x18\n\x16_stage_attempt_detailsB!\n\x1f_stage_attempt_progress_detailsB\x1d\n\x1b_stage_edit_attempt_detailsB&\n$_stage_edit_attempt_progress_detailsB\x18\n\x16_stage_legacy_worknodeBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.value_filter_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_VALUEFILTER'].fields_by_name['check_options']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['check_options']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['check_result_data']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['check_result_data']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['check_edit_options']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['check_edit_options']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['check_edit_result_data']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['check_edit_result_data']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['stage_args']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['stage_args']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['stage_attempt_details']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['stage_attempt_details']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['stage_attempt_progress_details']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['stage_attempt_progress_details']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['stage_edit_attempt_details']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['stage_edit_attempt_details']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['stage_edit_attempt_progress_details']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['stage_edit_attempt_progress_details']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER'].fields_by_name['stage_legacy_worknode']._loaded_options = None
+  _globals['_VALUEFILTER'].fields_by_name['stage_legacy_worknode']._serialized_options = b'\030\001'
+  _globals['_VALUEFILTER']._serialized_start=227
+  _globals['_VALUEFILTER']._serialized_end=1469
+# @@protoc_insertion_point(module_scope)
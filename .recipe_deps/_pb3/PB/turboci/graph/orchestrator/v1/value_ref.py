@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/value_ref.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/value_ref.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from PB.google.api import field_behavior as google_dot_api_dot_field__behavior__pb2
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from PB.turboci.graph.orchestrator.v1 import omit_reason as turboci_dot_graph_dot_orchestrator_dot_v1_dot_omit__reason__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n-turboci/graph/orchestrator/v1/value_ref.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x1fgoogle/api/field_behavior.proto\x1a\x19google/protobuf/any.proto\x1a/turboci/graph/orchestrator/v1/omit_reason.proto\"\xfd\x01\n\x08ValueRef\x12\x15\n\x08type_url\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05realm\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06\x64igest\x18\x03 \x01(\tH\x02\x88\x01\x01\x12)\n\x06inline\x18\x04 \x01(\x0b\x32\x14.google.protobuf.AnyH\x03\x88\x01\x01\x12I\n\x0bomit_reason\x18\x05 \x01(\x0e\x32).turboci.graph.orchestrator.v1.OmitReasonB\x04\xe2\x41\x01\x03H\x04\x88\x01\x01\x42\x0b\n\t_type_urlB\x08\n\x06_realmB\t\n\x07_digestB\t\n\x07_inlineB\x0e\n\x0c_omit_reasonBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.value_ref_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_VALUEREF'].fields_by_name['omit_reason']._loaded_options = None
+  _globals['_VALUEREF'].fields_by_name['omit_reason']._serialized_options = b'\342A\001\003'
+  _globals['_VALUEREF']._serialized_start=190
+  _globals['_VALUEREF']._serialized_end=443
+# @@protoc_insertion_point(module_scope)
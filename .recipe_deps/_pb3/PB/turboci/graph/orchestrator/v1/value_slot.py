@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/value_slot.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/value_slot.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.turboci/graph/orchestrator/v1/value_slot.proto\x12\x1dturboci.graph.orchestrator.v1*\xc3\x03\n\tValueSlot\x12\x16\n\x12VALUE_SLOT_UNKNOWN\x10\x00\x12\x1b\n\x17VALUE_SLOT_CHECK_OPTION\x10\x01\x12 \n\x1cVALUE_SLOT_CHECK_RESULT_DATA\x10\x02\x12\'\n#VALUE_SLOT_CHECK_EDIT_REASON_DETAIL\x10\x03\x12 \n\x1cVALUE_SLOT_CHECK_EDIT_OPTION\x10\x04\x12%\n!VALUE_SLOT_CHECK_EDIT_RESULT_DATA\x10\x05\x12\x19\n\x15VALUE_SLOT_STAGE_ARGS\x10\x06\x12$\n VALUE_SLOT_STAGE_LEGACY_WORKNODE\x10\x07\x12\x1d\n\x19VALUE_SLOT_ATTEMPT_DETAIL\x10\x08\x12&\n\"VALUE_SLOT_ATTEMPT_PROGRESS_DETAIL\x10\t\x12\'\n#VALUE_SLOT_STAGE_EDIT_REASON_DETAIL\x10\n\x12(\n$VALUE_SLOT_STAGE_EDIT_ATTEMPT_DETAIL\x10\x0b\x12\x12\n\x0eVALUE_SLOT_ALL\x10\x41\x42IP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.value_slot_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_VALUESLOT']._serialized_start=82
+  _globals['_VALUESLOT']._serialized_end=533
+# @@protoc_insertion_point(module_scope)
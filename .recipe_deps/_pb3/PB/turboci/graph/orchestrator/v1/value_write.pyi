@@ -0,0 +1,15 @@
+from google.protobuf import any_pb2 as _any_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ValueWrite(_message.Message):
+    __slots__ = ("data", "realm")
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    REALM_FIELD_NUMBER: _ClassVar[int]
+    data: _any_pb2.Any
+    realm: str
+    def __init__(self, data: _Optional[_Union[_any_pb2.Any, _Mapping]] = ..., realm: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turboci/graph/orchestrator/v1/write_nodes_request.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'turboci/graph/orchestrator/v1/write_nodes_request.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from PB.turboci.graph.ids.v1 import identifier as turboci_dot_graph_dot_ids_dot_v1_dot_identifier__pb2
+from PB.turboci.graph.orchestrator.v1 import check_kind as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__kind__pb2
+from PB.turboci.graph.orchestrator.v1 import check_state as turboci_dot_graph_dot_orchestrator_dot_v1_dot_check__state__pb2
+from PB.turboci.graph.orchestrator.v1 import edge as turboci_dot_graph_dot_orchestrator_dot_v1_dot_edge__pb2
+from PB.turboci.graph.orchestrator.v1 import field_options as turboci_dot_graph_dot_orchestrator_dot_v1_dot_field__options__pb2
+from PB.turboci.graph.orchestrator.v1 import stage as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_attempt_execution_policy as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__attempt__execution__policy__pb2
+from PB.turboci.graph.orchestrator.v1 import stage_execution_policy as turboci_dot_graph_dot_orchestrator_dot_v1_dot_stage__execution__policy__pb2
+from PB.turboci.graph.orchestrator.v1 import transaction_details as turboci_dot_graph_dot_orchestrator_dot_v1_dot_transaction__details__pb2
+from PB.turboci.graph.orchestrator.v1 import value_write as turboci_dot_graph_dot_orchestrator_dot_v1_dot_value__write__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7turboci/graph/orchestrator/v1/write_nodes_request.proto\x12\x1dturboci.graph.orchestrator.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a%turboci/graph/ids/v1/identifier.proto\x1a.turboci/graph/orchestrator/v1/check_kind.proto\x1a/turboci/graph/orchestrator/v1/check_state.proto\x1a(turboci/graph/orchestrator/v1/edge.proto\x1a\x31turboci/graph/orchestrator/v1/field_options.proto\x1a)turboci/graph/orchestrator/v1/stage.proto\x1a\x42turboci/graph/orchestrator/v1/stage_attempt_execution_policy.proto\x1a:turboci/graph/orchestrator/v1/stage_execution_policy.proto\x1a\x37turboci/graph/orchestrator/v1/transaction_details.proto\x1a/turboci/graph/orchestrator/v1/value_write.proto\"\x95!\n\x11WriteNodesRequest\x12\x12\n\x05token\x18\x01 \x01(\tH\x00\x88\x01\x01\x12L\n\x06reason\x18\x02 \x01(\x0b\x32\x37.turboci.graph.orchestrator.v1.WriteNodesRequest.ReasonH\x01\x88\x01\x01\x12\x43\n\x03txn\x18\x03 \x01(\x0b\x32\x31.turboci.graph.orchestrator.v1.TransactionDetailsH\x02\x88\x01\x01\x12K\n\x06\x63hecks\x18\x04 \x03(\x0b\x32;.turboci.graph.orchestrator.v1.WriteNodesRequest.CheckWrite\x12K\n\x06stages\x18\x05 \x03(\x0b\x32;.turboci.graph.orchestrator.v1.WriteNodesRequest.StageWrite\x12\x62\n\x0f\x63urrent_attempt\x18\x06 \x01(\x0b\x32\x44.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWriteH\x03\x88\x01\x01\x12^\n\rcurrent_stage\x18\x07 \x01(\x0b\x32\x42.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentStageWriteH\x04\x88\x01\x01\x1a\xbd\x01\n\x0f\x44\x65pendencyGroup\x12\x32\n\x05\x65\x64ges\x18\x01 \x03(\x0b\x32#.turboci.graph.orchestrator.v1.Edge\x12P\n\x06groups\x18\x02 \x03(\x0b\x32@.turboci.graph.orchestrator.v1.WriteNodesRequest.DependencyGroup\x12\x16\n\tthreshold\x18\x03 \x01(\x05H\x00\x88\x01\x01\x42\x0c\n\n_threshold\x1a\xa6\x01\n\x14StageAttemptProgress\x12\x14\n\x07message\x18\x01 \x01(\tH\x00\x88\x01\x01\x12:\n\x07\x64\x65tails\x18\x02 \x03(\x0b\x32).turboci.graph.orchestrator.v1.ValueWrite\x12\x1c\n\x0fidempotency_key\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\n\n\x08_messageB\x12\n\x10_idempotency_key\x1a\x66\n\x06Reason\x12\x14\n\x07message\x18\x01 \x01(\tH\x00\x88\x01\x01\x12:\n\x07\x64\x65tails\x18\x02 \x03(\x0b\x32).turboci.graph.orchestrator.v1.ValueWriteB\n\n\x08_message\x1a\xd1\x05\n\nCheckWrite\x12\x34\n\nidentifier\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.CheckH\x00\x88\x01\x01\x12\x1c\n\x05realm\x18\x02 \x01(\tB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01H\x01\x88\x01\x01\x12\x45\n\x04kind\x18\x03 \x01(\x0e\x32(.turboci.graph.orchestrator.v1.CheckKindB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01H\x02\x88\x01\x01\x12\x1f\n\x08sub_type\x18\n \x01(\tB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01H\x03\x88\x01\x01\x12&\n\x0c\x64isplay_name\x18\t \x01(\tB\x0b\x82\x86\xf6\xfb\x0f\x05\n\x03\n\x01\nH\x04\x88\x01\x01\x12G\n\x07options\x18\x04 \x03(\x0b\x32).turboci.graph.orchestrator.v1.ValueWriteB\x0b\x82\x86\xf6\xfb\x0f\x05\n\x03\n\x01\n\x12m\n\x0c\x64\x65pendencies\x18\x05 \x01(\x0b\x32@.turboci.graph.orchestrator.v1.WriteNodesRequest.DependencyGroupB\x10\x82\x86\xf6\xfb\x0f\n\n\x03\n\x01\n\x12\x03\n\x01\x02H\x05\x88\x01\x01\x12L\n\x0bresult_data\x18\x06 \x03(\x0b\x32).turboci.graph.orchestrator.v1.ValueWriteB\x0c\x82\x86\xf6\xfb\x0f\x06\n\x04\n\x02\x14\x1e\x12*\n\x10\x66inalize_results\x18\x07 \x01(\x08\x42\x0b\x82\x86\xf6\xfb\x0f\x05\n\x03\n\x01\x1eH\x06\x88\x01\x01\x12=\n\x05state\x18\x08 \x01(\x0e\x32).turboci.graph.orchestrator.v1.CheckStateH\x07\x88\x01\x01\x42\r\n\x0b_identifierB\x08\n\x06_realmB\x07\n\x05_kindB\x0b\n\t_sub_typeB\x0f\n\r_display_nameB\x0f\n\r_dependenciesB\x13\n\x11_finalize_resultsB\x08\n\x06_state\x1a\x87\x05\n\nStageWrite\x12\x34\n\nidentifier\x18\x01 \x01(\x0b\x32\x1b.turboci.graph.ids.v1.StageH\x00\x88\x01\x01\x12\x46\n\x04\x61rgs\x18\x02 \x01(\x0b\x32).turboci.graph.orchestrator.v1.ValueWriteB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01H\x01\x88\x01\x01\x12\x1c\n\x05realm\x18\x03 \x01(\tB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01H\x02\x88\x01\x01\x12#\n\x0c\x64isplay_name\x18\x08 \x01(\tB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01H\x03\x88\x01\x01\x12k\n\x0c\x64\x65pendencies\x18\x04 \x01(\x0b\x32@.turboci.graph.orchestrator.v1.WriteNodesRequest.DependencyGroupB\x0e\x82\x86\xf6\xfb\x0f\x08\x12\x04\n\x02\x08\x02\x18\x01H\x04\x88\x01\x01\x12l\n requested_stage_execution_policy\x18\x05 \x01(\x0b\x32\x33.turboci.graph.orchestrator.v1.StageExecutionPolicyB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01H\x05\x88\x01\x01\x12N\n\x0b\x61ssignments\x18\x06 \x03(\x0b\x32/.turboci.graph.orchestrator.v1.Stage.AssignmentB\x08\x82\x86\xf6\xfb\x0f\x02\x18\x01\x12\x16\n\tcancelled\x18\x07 \x01(\x08H\x06\x88\x01\x01\x42\r\n\x0b_identifierB\x07\n\x05_argsB\x08\n\x06_realmB\x0f\n\r_display_nameB\x0f\n\r_dependenciesB#\n!_requested_stage_execution_policyB\x0c\n\n_cancelled\x1a\xeb\x0c\n\x13\x43urrentAttemptWrite\x12:\n\x07\x64\x65tails\x18\x01 \x03(\x0b\x32).turboci.graph.orchestrator.v1.ValueWrite\x12W\n\x08progress\x18\x02 \x03(\x0b\x32\x45.turboci.graph.orchestrator.v1.WriteNodesRequest.StageAttemptProgress\x12s\n\x10state_transition\x18\x03 \x01(\x0b\x32T.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWrite.StateTransitionH\x00\x88\x01\x01\x1a\xb4\n\n\x0fStateTransition\x12s\n\tthrottled\x18\x01 \x01(\x0b\x32^.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWrite.StateTransition.ThrottledH\x00\x12s\n\tscheduled\x18\x02 \x01(\x0b\x32^.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWrite.StateTransition.ScheduledH\x00\x12o\n\x07running\x18\x03 \x01(\x0b\x32\\.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWrite.StateTransition.RunningH\x00\x12x\n\x0ctearing_down\x18\x04 \x01(\x0b\x32`.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWrite.StateTransition.TearingDownH\x00\x12q\n\x08\x63omplete\x18\x05 \x01(\x0b\x32].turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWrite.StateTransition.CompleteH\x00\x12u\n\nincomplete\x18\x06 \x01(\x0b\x32_.turboci.graph.orchestrator.v1.WriteNodesRequest.CurrentAttemptWrite.StateTransition.IncompleteH\x00\x1a\x45\n\tThrottled\x12.\n\x05until\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x42\x08\n\x06_until\x1a\x8b\x01\n\tScheduled\x12\x61\n\x18\x61ttempt_execution_policy\x18\x01 \x01(\x0b\x32:.turboci.graph.orchestrator.v1.StageAttemptExecutionPolicyH\x00\x88\x01\x01\x42\x1b\n\x19_attempt_execution_policy\x1a\xb3\x01\n\x07Running\x12\x61\n\x18\x61ttempt_execution_policy\x18\x01 \x01(\x0b\x32:.turboci.graph.orchestrator.v1.StageAttemptExecutionPolicyH\x00\x88\x01\x01\x12\x18\n\x0bprocess_uid\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x1b\n\x19_attempt_execution_policyB\x0e\n\x0c_process_uid\x1a\r\n\x0bTearingDown\x1a\n\n\x08\x43omplete\x1a\xaa\x01\n\nIncomplete\x12\x1f\n\x12\x62lock_new_attempts\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12\x44\n\x1bthrottle_next_attempt_until\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x15\n\x13_block_new_attemptsB\x1e\n\x1c_throttle_next_attempt_untilB\x0f\n\rdesired_stateB\x13\n\x11_state_transition\x1a\x9a\x01\n\x11\x43urrentStageWrite\x12n\n\x12\x63ontinuation_group\x18\x01 \x01(\x0b\x32@.turboci.graph.orchestrator.v1.WriteNodesRequest.DependencyGroupB\x0b\x82\x86\xf6\xfb\x0f\x05\x12\x03\n\x01\x08H\x00\x88\x01\x01\x42\x15\n\x13_continuation_groupB\x08\n\x06_tokenB\t\n\x07_reasonB\x06\n\x04_txnB\x12\n\x10_current_attemptB\x10\n\x0e_current_stageBIP\x01ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turboci.graph.orchestrator.v1.write_nodes_request_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'P\001ZEgo.chromium.org/turboci/proto/go/graph/orchestrator/v1;orchestratorpb'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['realm']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['realm']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['kind']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['kind']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['sub_type']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['sub_type']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['display_name']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['display_name']._serialized_options = b'\202\206\366\373\017\005\n\003\n\001\n'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['options']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['options']._serialized_options = b'\202\206\366\373\017\005\n\003\n\001\n'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['dependencies']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['dependencies']._serialized_options = b'\202\206\366\373\017\n\n\003\n\001\n\022\003\n\001\002'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['result_data']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['result_data']._serialized_options = b'\202\206\366\373\017\006\n\004\n\002\024\036'
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['finalize_results']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CHECKWRITE'].fields_by_name['finalize_results']._serialized_options = b'\202\206\366\373\017\005\n\003\n\001\036'
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['args']._loaded_options = None
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['args']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['realm']._loaded_options = None
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['realm']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['display_name']._loaded_options = None
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['display_name']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['dependencies']._loaded_options = None
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['dependencies']._serialized_options = b'\202\206\366\373\017\010\022\004\n\002\010\002\030\001'
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['requested_stage_execution_policy']._loaded_options = None
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['requested_stage_execution_policy']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['assignments']._loaded_options = None
+  _globals['_WRITENODESREQUEST_STAGEWRITE'].fields_by_name['assignments']._serialized_options = b'\202\206\366\373\017\002\030\001'
+  _globals['_WRITENODESREQUEST_CURRENTSTAGEWRITE'].fields_by_name['continuation_group']._loaded_options = None
+  _globals['_WRITENODESREQUEST_CURRENTSTAGEWRITE'].fields_by_name['continuation_group']._serialized_options = b'\202\206\366\373\017\005\022\003\n\001\010'
+  _globals['_WRITENODESREQUEST']._serialized_start=630
+  _globals['_WRITENODESREQUEST']._serialized_end=4875
+  _globals['_WRITENODESREQUEST_DEPENDENCYGROUP']._serialized_start=1169
+  _globals['_WRITENODESREQUEST_DEPENDENCYGROUP']._serialized_end=1358
+  _globals['_WRITENODESREQUEST_STAGEATTEMPTPROGRESS']._serialized_start=1361
+  _globals['_WRITENODESREQUEST_STAGEATTEMPTPROGRESS']._serialized_end=1527
+  _globals['_WRITENODESREQUEST_REASON']._serialized_start=1529
+  _globals['_WRITENODESREQUEST_REASON']._serialized_end=1631
+  _globals['_WRITENODESREQUEST_CHECKWRITE']._serialized_start=1634
+  _globals['_WRITENODESREQUEST_CHECKWRITE']._serialized_end=2355
+  _globals['_WRITENODESREQUEST_STAGEWRITE']._serialized_start=2358
+  _globals['_WRITENODESREQUEST_STAGEWRITE']._serialized_end=3005
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE']._serialized_start=3008
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE']._serialized_end=4651
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION']._serialized_start=3298
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION']._serialized_end=4630
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_THROTTLED']._serialized_start=4020
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_THROTTLED']._serialized_end=4089
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_SCHEDULED']._serialized_start=4092
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_SCHEDULED']._serialized_end=4231
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_RUNNING']._serialized_start=4234
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_RUNNING']._serialized_end=4413
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_TEARINGDOWN']._serialized_start=4415
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_TEARINGDOWN']._serialized_end=4428
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_COMPLETE']._serialized_start=4430
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_COMPLETE']._serialized_end=4440
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_INCOMPLETE']._serialized_start=4443
+  _globals['_WRITENODESREQUEST_CURRENTATTEMPTWRITE_STATETRANSITION_INCOMPLETE']._serialized_end=4613
+  _globals['_WRITENODESREQUEST_CURRENTSTAGEWRITE']._serialized_start=4654
+  _globals['_WRITENODESREQUEST_CURRENTSTAGEWRITE']._serialized_end=4808
+# @@protoc_insertion_point(module_scope)
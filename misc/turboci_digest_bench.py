@@ -0,0 +1,96 @@
+#!/usr/bin/env vpython3
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+"""Micro-benchmark for turboci.utils.value.Digest.
+
+For small and multi-megabyte values, times (per value):
+  * hash: Computing the digest, bypassing the cache.
+  * cold: Digest.compute of values which aren't cached yet.
+  * warm: Digest.compute of values which were digested before.
+  * many: Digest.compute_many of a batch of values which aren't cached yet.
+
+Requires the recipe protos to be compiled (e.g. by running any recipes.py
+command first).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.append(
+    os.path.join(ROOT, '.recipe_deps', '_pb%d' % sys.version_info[0]))
+
+# pylint: disable=wrong-import-position,protected-access
+from google.protobuf import any_pb2
+
+from turboci.utils.value import digest
+
+SIZES = {
+    'small (64B)': 64,
+    'medium (64KiB)': 64 * 1024,
+    'large (4MiB)': 4 * 1024 * 1024,
+    'huge (32MiB)': 32 * 1024 * 1024,
+}
+
+
+def _values(size: int, count: int) -> list[any_pb2.Any]:
+  return [
+      any_pb2.Any(
+          type_url='type.googleapis.com/bench.Value',
+          value=i.to_bytes(8, 'big') + os.urandom(max(0, size - 8)),
+      ) for i in range(count)
+  ]
+
+
+def _clear_cache():
+  digest._cache = digest._DigestCache(
+      digest._cache.max_entries, digest._cache.max_bytes)
+
+
+def _time(values, fn, clear_cache: bool, repeat: int = 5) -> float:
+  """Returns the best time of `fn(values)` per value, in seconds."""
+  best = float('inf')
+  for _ in range(repeat):
+    if clear_cache:
+      _clear_cache()
+    start = time.perf_counter()
+    fn(values)
+    best = min(best, time.perf_counter() - start)
+  return best / len(values)
+
+
+def _compute_each(values):
+  for val in values:
+    digest.Digest.compute(val)
+
+
+def _hash_each(values):
+  for val in values:
+    digest._compute((val.type_url, val.value))
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument(
+      '--total-bytes', type=int, default=16 * 1024 * 1024,
+      help='Approximate number of bytes to digest in each measurement.')
+  args = parser.parse_args()
+
+  print(f'{"value":>16} {"hash":>12} {"cold":>12} {"warm":>12} {"many":>12}')
+  for name, size in SIZES.items():
+    values = _values(size, max(1, min(1000, args.total_bytes // size)))
+    results = [
+        _time(values, _hash_each, clear_cache=True),
+        _time(values, _compute_each, clear_cache=True),
+        _time(values, _compute_each, clear_cache=False),
+        _time(values, digest.Digest.compute_many, clear_cache=True),
+    ]
+    print(f'{name:>16}' + ''.join(f' {t * 1e6:>10.1f}us' for t in results))
+
+
+if __name__ == '__main__':
+  main()
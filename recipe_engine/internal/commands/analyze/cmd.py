@@ -2,6 +2,7 @@
 # Use of this source code is governed under the Apache License, Version 2.0
 # that can be found in the LICENSE file.
 
+import collections
 import os
 import sys
 
@@ -11,6 +12,8 @@ from google.protobuf import json_format as jsonpb
 
 from PB.recipe_engine.analyze import Input, Output
 
+from .index import DepsIndex, ReverseIndex
+
 GIT = 'git.bat' if sys.platform == 'win32' else 'git'
 
 
@@ -33,12 +36,13 @@ def get_git_attribute_files(repo_root):
       subprocess.check_output(args, text=True).splitlines()]
 
 
-def analyze(recipe_deps, in_data):
+def analyze(recipe_deps, in_data, deps_index=None):
   """Determine which recipes are affected by a list of files.
 
   Args:
     * recipe_deps (RecipeDeps) - All the loaded recipe repos.
     * in_data (analyze_pb2.Input) - The input parameters for the analysis.
+    * deps_index (DepsIndex|None) - The cache of DEPS to use, if any.
 
   Returns an instance of analyze_pb2.Output, representing the result of the
   analysis.
@@ -62,77 +66,61 @@ def analyze(recipe_deps, in_data):
     output.error = 'Some input recipes were invalid'
   valid_recipes = set(in_data.recipes) - set(output.invalid_recipes)
 
-  # Used to look at git attributes later. Maps repo_name to the contents of
-  # its .gitattributes file. Mainly a cache so we only read the file once.
-  git_attr_file_map = {}
-
-  # We look at 4 different sets of files which could affect the recipe.
-  for recipe_name in (r for r in in_data.recipes if r in valid_recipes):
+  recipes = [main_repo.recipes[name] for name in sorted(valid_recipes)]
+  index = ReverseIndex(recipe_deps, recipes, deps_index)
+
+  # Maps recipe name to the reason why it's affected. Every file is looked at
+  # once, rather than once per recipe (and module).
+  reasons = {}
+  recipe_paths = {recipe.path: recipe.name for recipe in recipes}
+  resources_dirs = {recipe.resources_dir: recipe.name for recipe in recipes}
+  modified_resources = collections.defaultdict(list)
+  modified_modules = collections.defaultdict(list)
+  files = set(in_data.files)
+  for fname in sorted(files):
     # 1: The recipes themselves.
-    recipe = main_repo.recipes[recipe_name]
-    isect = set(in_data.files).intersection([recipe.path])
-    if isect:
-      print(
-          'Adding %r to output set; recipe is directly modified: %r'
-          % (recipe_name, sorted(isect)), file=sys.stderr)
-      output.recipes.append(recipe_name)
-      continue
+    if fname in recipe_paths:
+      reasons.setdefault(recipe_paths[fname],
+                         'recipe is directly modified: %r' % ([fname],))
 
     # 2: The recipes' resource files.
-    affected_resources = sorted(
-        fname for fname in in_data.files
-        if fname.startswith(recipe.resources_dir + os.path.sep)
-    )
-    if affected_resources:
-      print(
-          'Adding %r to output set; resource files modified: %r'
-          % (recipe_name, affected_resources), file=sys.stderr)
+    parent = os.path.dirname(fname)
+    while parent != os.path.dirname(parent):
+      if parent in resources_dirs:
+        modified_resources[resources_dirs[parent]].append(fname)
+      parent = os.path.dirname(parent)
+
+    # 3: The modules the recipes transitively depend on.
+    key = index.module_of(fname)
+    if key:
+      modified_modules[key].append(fname)
+
+  for recipe_name, modified in modified_resources.items():
+    reasons.setdefault(recipe_name, 'resource files modified: %r' % modified)
+
+  for key, modified in sorted(modified_modules.items()):
+    mod = recipe_deps.repos[key[0]].modules[key[1]]
+    for recipe_name in index.dependents(key):
+      reasons.setdefault(
+          recipe_name,
+          'recipe module dep %r is modified: %r' % (mod.name, modified))
+
+  # 4: Git attribute files, declared in .gitattribute in the root of the repos
+  # the recipes depend on.
+  for repo_name in index.repos:
+    isect = files.intersection(
+        get_git_attribute_files(recipe_deps.repos[repo_name].path))
+    if isect:
+      for recipe_name in index.repo_dependents(repo_name):
+        reasons.setdefault(
+            recipe_name,
+            'gitattrs overlaps with input files: %r' % sorted(isect))
+
+  for recipe_name in in_data.recipes:
+    if recipe_name in reasons:
+      print('Adding %r to output set; %s' % (recipe_name, reasons[recipe_name]),
+            file=sys.stderr)
       output.recipes.append(recipe_name)
-      continue
-
-    # 3: The modules. This is the list of (repo_name, module_name)
-    queue = set(recipe.normalized_DEPS.values())
-
-    processed = set()
-
-    # Do a Breadth First Search of all the modules this recipe transitively
-    # depends on.
-    while queue:
-      repo_name, module_name = queue.pop()
-      mod = recipe_deps.repos[repo_name].modules[module_name]
-
-      # Any file inside this module modified?
-      isect = set()
-      for fname in in_data.files:
-        if fname.startswith(mod.path + os.path.sep):
-          isect.add(fname)
-      if isect:
-        print(
-            'Adding %r to output set; recipe module dep %r is modified: %r'
-            % (recipe_name, mod.name, sorted(isect)), file=sys.stderr)
-        output.recipes.append(recipe_name)
-        break
-
-      # 4: Git attribute files, declared in .gitattribute in the root of the
-      # repo.
-      if repo_name not in git_attr_file_map:
-        git_attr_file_map[repo_name] = set(
-          get_git_attribute_files(recipe_deps.repos[repo_name].path))
-      isect = set(in_data.files).intersection(git_attr_file_map[repo_name])
-      if isect:
-        print(
-            'Adding %r to output set; gitattrs overlaps with input files: %r'
-            % (recipe_name, sorted(isect)), file=sys.stderr)
-        output.recipes.append(recipe_name)
-        break
-
-      # We've now processed this module, so add it to 'processed' so we don't
-      # process it again.
-      processed.add((repo_name, module_name))
-
-      # Add any DEPS that this module has to the queue, except for anything
-      # we've processed already.
-      queue |= set(mod.normalized_DEPS.values()) - processed
 
   return output
 
@@ -141,7 +129,11 @@ def main(args):
   in_data = jsonpb.Parse(args.input.read(), Input())
   args.input.close()
 
-  data = analyze(args.recipe_deps, in_data)
+  deps_index = DepsIndex(args.recipe_deps.deps_index_path)
+  try:
+    data = analyze(args.recipe_deps, in_data, deps_index)
+  finally:
+    deps_index.save()
   args.output.write(
       jsonpb.MessageToJson(data, always_print_fields_with_no_presence=True))
   return bool(data.error)
@@ -0,0 +1,155 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+"""Indexes of the dependencies between recipes and recipe modules, used to work
+out which recipes can be affected by changes to a set of files (i.e.
+`recipes.py analyze` and `recipes.py test --changed-since`).
+
+Working out the DEPS graph requires executing every recipe file and importing
+every module, so DepsIndex caches the DEPS of each recipe and module (keyed on
+the size and mtime of the file declaring them) in the `.recipe_deps` directory.
+"""
+
+import collections
+import json
+import os
+
+
+def _stamp(path: str) -> list[int] | None:
+  try:
+    st = os.stat(path)
+  except OSError:
+    return None
+  return [st.st_mtime_ns, st.st_size]
+
+
+class DepsIndex:
+  """Cache of the normalized_DEPS of recipes and recipe modules.
+
+  If `path` is None, the cache is only kept in memory.
+  """
+
+  VERSION = 1
+
+  def __init__(self, path: str | None = None):
+    self._path = path
+    self._dirty = False
+    self._data = {'version': self.VERSION, 'recipes': {}, 'modules': {}}
+    if path is None:
+      return
+    try:
+      with open(path) as f:
+        data = json.load(f)
+      if data.get('version') == self.VERSION:
+        self._data = data
+    except (OSError, ValueError):
+      pass
+
+  def _lookup(self, kind: str, key: str, source: str, compute):
+    # Entries are keyed on absolute paths, so that one index can hold the
+    # recipes and modules of all repos.
+    stamp = _stamp(source)
+    entry = self._data[kind].get(key)
+    if entry is None or stamp is None or entry['stamp'] != stamp:
+      entry = {
+          'stamp': stamp,
+          'deps': sorted(set(compute().values())),
+      }
+      self._data[kind][key] = entry
+      self._dirty = True
+    return [tuple(dep) for dep in entry['deps']]
+
+  def recipe(self, recipe) -> list[tuple[str, str]]:
+    """Returns the (repo_name, module_name) DEPS of `recipe`."""
+    return self._lookup('recipes', recipe.path, recipe.path,
+                        lambda: recipe.normalized_DEPS)
+
+  def module(self, module) -> list[tuple[str, str]]:
+    """Returns the (repo_name, module_name) DEPS of `module`."""
+    return self._lookup('modules', module.path,
+                        os.path.join(module.path, '__init__.py'),
+                        lambda: module.normalized_DEPS)
+
+  def save(self) -> None:
+    if self._path is None or not self._dirty:
+      return
+    tmp = self._path + '.tmp'
+    with open(tmp, 'w') as f:
+      json.dump(self._data, f)
+    os.replace(tmp, self._path)
+
+
+class ReverseIndex:
+  """Maps recipe modules, and the files in them, to the recipes which
+  (transitively) depend on them.
+
+  Only `recipes` are indexed, so that callers interested in a handful of recipes
+  don't need to load the DEPS of every recipe in the repo.
+  """
+
+  def __init__(self, recipe_deps, recipes, deps_index: DepsIndex | None = None):
+    """
+    Args:
+      * recipe_deps (RecipeDeps) - All the loaded recipe repos.
+      * recipes (Iterable[Recipe]) - The recipes to index.
+      * deps_index - Where to get the DEPS of recipes and modules from.
+    """
+    self._recipe_deps = recipe_deps
+    self._deps_index = deps_index or DepsIndex()
+    self._closures = {}
+
+    # (repo_name, module_name) -> names of the recipes depending on it.
+    self._dependents = collections.defaultdict(set)
+    # repo_name -> names of the recipes depending on any of its modules.
+    self._repo_dependents = collections.defaultdict(set)
+    for recipe in recipes:
+      for key in frozenset().union(*map(
+          self._module_closure, self._deps_index.recipe(recipe))):
+        self._dependents[key].add(recipe.name)
+        self._repo_dependents[key[0]].add(recipe.name)
+
+    # Maps the directory of every module a recipe depends on to its key.
+    self._module_dirs = {
+        self._module(key).path: key for key in self._dependents
+    }
+
+  def _module(self, key):
+    return self._recipe_deps.repos[key[0]].modules[key[1]]
+
+  def _module_closure(self, key) -> frozenset:
+    ret = self._closures.get(key)
+    if ret is None:
+      # Guard against DEPS cycles; the engine rejects them later anyway.
+      self._closures[key] = frozenset()
+      ret = frozenset([key]).union(*map(
+          self._module_closure, self._deps_index.module(self._module(key))))
+      self._closures[key] = ret
+    return ret
+
+  @property
+  def repos(self) -> list[str]:
+    """The names of the repos whose modules the indexed recipes depend on."""
+    return sorted(self._repo_dependents)
+
+  def dependents(self, key: tuple[str, str]) -> set[str]:
+    """Returns the names of the indexed recipes depending on the module `key`
+    (a (repo_name, module_name) tuple)."""
+    return self._dependents.get(key, set())
+
+  def repo_dependents(self, repo_name: str) -> set[str]:
+    """Returns the names of the indexed recipes depending on any module of the
+    repo `repo_name`."""
+    return self._repo_dependents.get(repo_name, set())
+
+  def module_of(self, path: str) -> tuple[str, str] | None:
+    """Returns the key of the module, depended on by any indexed recipe, which
+    contains the file at (absolute) `path`."""
+    while True:
+      parent = os.path.dirname(path)
+      if parent == path:
+        return None
+      path = parent
+      key = self._module_dirs.get(path)
+      if key:
+        return key
@@ -0,0 +1,121 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+"""A content-addressed cache of the Doc fragments (Doc.Module and Doc.Recipe
+messages) of a recipe repo.
+
+Parsing a module or recipe for its documentation requires both parsing its
+source and importing it (for its normalized DEPS). `recipes.py test run` checks
+README.recipes.md on every invocation, so fragments are cached, keyed on the
+contents of the files they were parsed from; only changed modules and recipes
+need to be parsed again before the Doc.Repo is reassembled.
+
+The cache lives in the `.recipe_deps` directory. It's partitioned by repo and
+by the doc generator/recipes.cfg part of the key, so that entries made by an
+older recipe engine are cleaned up, rather than accumulating forever.
+"""
+
+import hashlib
+import os
+import shutil
+
+# pylint: disable=import-error
+import PB
+
+
+# Bump this to invalidate all existing cache entries.
+_VERSION = b'1'
+
+
+def _hash_file(hasher, path: str) -> None:
+  try:
+    with open(path, 'rb') as f:
+      hasher.update(hashlib.sha256(f.read()).digest())
+  except OSError:
+    hasher.update(b'<missing>')
+
+
+class DocCache:
+  """Looks up and stores the Doc fragments of one recipe repo."""
+
+  def __init__(self, root: str, repo):
+    """
+    Args:
+      * root (str) - RecipeDeps.doc_cache_path.
+      * repo (RecipeRepo) - The repo whose fragments are cached.
+    """
+    hasher = hashlib.sha256(_VERSION)
+    # The output of the parser depends on the parser itself, the Doc proto and
+    # the repo's dependencies (which determine how DEPS are normalized).
+    _hash_file(hasher, os.path.join(os.path.dirname(__file__), 'cmd.py'))
+    _hash_file(hasher, os.path.join(PB.__path__[0], 'csum'))
+    hasher.update(repo.recipes_cfg_pb2.SerializeToString(deterministic=True))
+
+    self._repo_root = os.path.join(root, repo.name)
+    self._partition = hasher.hexdigest()[:16]
+    self._used = set()
+
+  def get(self, msg_type, relpath: str, paths: list[str], parse):
+    """Returns the cached fragment for the module or recipe at `relpath`,
+    calling `parse` to generate it if it's missing or stale.
+
+    Args:
+      * msg_type (type) - Either doc.Doc.Module or doc.Doc.Recipe.
+      * relpath (str) - The (posix) path of the module or recipe in its repo.
+      * paths (list[str]) - The absolute paths of the files the fragment is
+        parsed from.
+      * parse (Callable[[], msg_type|None]) - Parses the fragment. Results of
+        None (i.e. unparsable files) are not cached.
+
+    Returns msg_type|None.
+    """
+    hasher = hashlib.sha256(
+        ('%s\0%s\0' % (msg_type.DESCRIPTOR.full_name, relpath)).encode('utf-8'))
+    for path in paths:
+      _hash_file(hasher, path)
+    digest = hasher.hexdigest()
+    self._used.add(digest)
+
+    path = os.path.join(self._repo_root, self._partition, digest)
+    try:
+      with open(path, 'rb') as f:
+        return msg_type.FromString(f.read())
+    except OSError:
+      pass
+
+    ret = parse()
+    if ret is not None:
+      try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp, 'wb') as f:
+          f.write(ret.SerializeToString())
+        os.replace(tmp, path)
+      except OSError:
+        pass
+    return ret
+
+  def prune(self) -> None:
+    """Removes all entries which weren't looked up since this DocCache was
+    created, and all entries made with a different doc generator or
+    recipes.cfg."""
+    try:
+      partitions = os.listdir(self._repo_root)
+    except OSError:
+      return
+    for name in partitions:
+      if name != self._partition:
+        shutil.rmtree(os.path.join(self._repo_root, name), ignore_errors=True)
+
+    partition = os.path.join(self._repo_root, self._partition)
+    try:
+      names = os.listdir(partition)
+    except OSError:
+      return
+    for name in names:
+      if name not in self._used:
+        try:
+          os.remove(os.path.join(partition, name))
+        except OSError:
+          pass
@@ -35,6 +35,7 @@ from ...recipe_deps import Recipe, RecipeModule, RecipeRepo
 from ...recipe_deps import parse_deps_spec
 
 from . import doc_markdown
+from .cache import DocCache
 
 
 LOGGER = logging.getLogger(__name__)
@@ -576,11 +577,14 @@ def parse_module(module):
   )
 
 
-def parse_repo(repo):
+def parse_repo(repo, cache=None):
   """Parses a recipe repo object into a Doc.Repo.
 
   Args:
     * recipe (RecipeRepo) - The repo to parse.
+    * cache (DocCache|None) - If provided, modules and recipes whose files are
+      unchanged are read from this cache rather than parsed again. Entries for
+      modules and recipes which no longer exist are pruned from it.
 
   Returns Doc.Repo.
   """
@@ -596,16 +600,28 @@ def parse_repo(repo):
     with open(readme, 'rb') as f:
       ret.docstring = f.read()
 
+  def _parse(msg_type, obj, paths, parse):
+    if cache is None:
+      return parse(obj)
+    return cache.get(msg_type, _to_posix(obj.relpath), paths,
+                     lambda: parse(obj))
+
   for module in repo.modules.values():
-    mod = parse_module(module)
+    mod = _parse(doc.Doc.Module, module, [
+        os.path.join(module.path, 'api.py'),
+        os.path.join(module.path, '__init__.py'),
+    ], parse_module)
     if mod:
       ret.recipe_modules[module.name].CopyFrom(mod)
 
   for recipe in repo.recipes.values():
-    recipe = parse_recipe(recipe)
+    recipe = _parse(doc.Doc.Recipe, recipe, [recipe.path], parse_recipe)
     if recipe:
       ret.recipes[recipe.name].CopyFrom(recipe)
 
+  if cache is not None:
+    cache.prune()
+
   return ret
 
 
@@ -665,7 +681,7 @@ def regenerate_doc(repo, output_file):
     * output_file (I/O classes) - where the markdown docs will be printed.
   """
   assert isinstance(repo, RecipeRepo), type(repo)
-  node = parse_repo(repo)
+  node = parse_repo(repo, DocCache(repo.recipe_deps.doc_cache_path, repo))
   _set_known_objects(node)
   doc_markdown.Emit(doc_markdown.Printer(output_file), node)
 
@@ -722,7 +738,7 @@ def main(args):
   if args.recipe:
     node = parse_recipe(args.recipe_deps.recipes[args.recipe])
   else:
-    node = parse_repo(repo)
+    node = parse_repo(repo, DocCache(args.recipe_deps.doc_cache_path, repo))
 
   _set_known_objects(node)
 
@@ -28,6 +28,22 @@ so a test's duration is not necessarily exactly correlated to how long it took
 to execute, but it should correlate pretty closely. You can sort the file with
 `sort -g -k 2 -t $'\\t'` on unix to see the longest tests."""
 
+DAEMON_HELP = """(experimental) Fork test runners from a long-lived background
+daemon which keeps the recipe engine and all recipe modules imported between
+invocations, rather than starting fresh runner processes. The daemon picks up
+changes to recipe and module files, restarts if the recipe engine changes and
+quits after being idle for a while."""
+
+CHANGED_SINCE_HELP = """Only run the tests of recipes which can be affected by
+the changes in the main repo since GIT_REV (including uncommitted and untracked
+files), as determined by the recipe and module DEPS graph. Like --filter, this
+disables the coverage check."""
+
+RESULT_CACHE_HELP = """Don't use or update the cache of passing test results
+(in the .recipe_deps directory). By default, tests whose recipe, recipe module
+DEPS, test data, expectation file and recipe engine are all unchanged since
+they last passed aren't run again."""
+
 
 def add_arguments(parser):
 
@@ -99,6 +115,17 @@ def add_arguments(parser):
       '--show-durations',
       action='store_true', default=False, dest='show_durations',
       help='Show long-running tests even on test failures.')
+  run_p.add_argument(
+      '--daemon',
+      action='store_true', default=False,
+      help=DAEMON_HELP)
+  run_p.add_argument(
+      '--changed-since', metavar='GIT_REV',
+      help=CHANGED_SINCE_HELP)
+  run_p.add_argument(
+      '--no-result-cache',
+      action='store_false', default=True, dest='result_cache',
+      help=RESULT_CACHE_HELP)
 
   helpstr = 'Re-train recipe expectations.'
   train_p = subp.add_parser(
@@ -136,6 +163,17 @@ def add_arguments(parser):
       '--show-durations',
       action='store_true', default=False, dest='show_durations',
       help='Show long-running tests even on test failures.')
+  train_p.add_argument(
+      '--daemon',
+      action='store_true', default=False,
+      help=DAEMON_HELP)
+  train_p.add_argument(
+      '--changed-since', metavar='GIT_REV',
+      help=CHANGED_SINCE_HELP)
+  train_p.add_argument(
+      '--no-result-cache',
+      action='store_false', default=True, dest='result_cache',
+      help=RESULT_CACHE_HELP)
 
   helpstr = 'Print all test names.'
   list_p = subp.add_parser(
@@ -155,6 +193,12 @@ def add_arguments(parser):
   runner_p.add_argument('--cover-module-imports', action='store_true',
                         default=False)
 
+  # The _daemon subcommand is hidden from users, but is started by `--daemon`
+  # to fork runners from.
+  daemon_p = subp.add_parser('_daemon')
+  daemon_p.add_argument('--socket', required=True)
+  daemon_p.add_argument('--idle-timeout', type=float)
+
   def _launch(args):
     if debugger.PROTOCOL == "pdb" and args.subcommand in {'run', 'train'}:
       parser.error(
@@ -175,6 +219,11 @@ def add_arguments(parser):
       except KeyboardInterrupt:
         return 0
 
+    if args.subcommand == '_daemon':
+      from .daemon import serve, DEFAULT_IDLE_TIMEOUT
+      return serve(args.recipe_deps, args.socket,
+                   args.idle_timeout or DEFAULT_IDLE_TIMEOUT)
+
     from .run_train import main
     return main(args)
   parser.set_defaults(func=_launch)
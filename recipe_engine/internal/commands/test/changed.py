@@ -0,0 +1,142 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+"""Selects the recipes whose tests can be affected by the changes made to the
+main repo since a given git revision (i.e. `recipes.py test --changed-since`).
+
+A recipe is affected if its own file, resources or expectations changed, or if
+any file in a recipe module in its transitive DEPS changed. Changes which can
+affect recipes in ways the DEPS graph doesn't capture (protos, recipes.cfg, the
+recipe engine's own code, python files not owned by a recipe or module and
+files marked with the `recipes` git attribute) select everything.
+
+The DEPS graph is shared with `recipes.py analyze` (see analyze/index.py),
+including its on-disk cache in the `.recipe_deps` directory.
+"""
+
+import os
+import sys
+
+from gevent import subprocess
+
+from ...simple_cfg import RECIPES_CFG_LOCATION_REL
+from ..analyze.cmd import GIT, get_git_attribute_files
+from ..analyze.index import DepsIndex, ReverseIndex
+
+
+class ChangedFilesError(Exception):
+  """Raised when the changed files can't be determined from git."""
+
+
+def changed_files(repo_path: str, revision: str) -> list[str]:
+  """Returns the absolute paths of all files in the git checkout at
+  `repo_path` which differ from `revision`.
+
+  This includes uncommitted and untracked (but not ignored) files.
+  """
+  try:
+    diff = subprocess.check_output(
+        [GIT, '-C', repo_path, 'diff', '--name-only', '--relative', '-z',
+         revision, '--'], stderr=subprocess.PIPE)
+    untracked = subprocess.check_output(
+        [GIT, '-C', repo_path, 'ls-files', '--others', '--exclude-standard',
+         '-z'], stderr=subprocess.PIPE)
+  except subprocess.CalledProcessError as ex:
+    raise ChangedFilesError(
+        f'Unable to list files changed since {revision!r}: '
+        f'{ex.stderr.decode("utf-8", "replace").strip()}') from ex
+  return sorted({
+      os.path.join(repo_path, path)
+      for path in (diff + untracked).decode('utf-8').split('\0')
+      if path
+  })
+
+
+def affected_recipes(recipe_deps, files: list[str]) -> set[str] | None:
+  """Returns the names of the main repo's recipes which can be affected by
+  changes to `files` (absolute paths).
+
+  Returns None if every recipe may be affected.
+  """
+  main_repo = recipe_deps.main_repo
+
+  # Maps absolute path -> the recipe name (or module key) which owns it.
+  recipe_paths = {}
+  recipe_dirs = {}
+  for recipe in main_repo.recipes.values():
+    recipe_paths[recipe.path] = recipe.name
+    recipe_dirs[recipe.resources_dir] = recipe.name
+    recipe_dirs[recipe.expectation_dir] = recipe.name
+  module_dirs = {
+      module.path: (main_repo.name, module.name)
+      for module in main_repo.modules.values()
+  }
+
+  def _owner(path, owners):
+    while True:
+      parent = os.path.dirname(path)
+      if parent == path:
+        return None
+      path = parent
+      if path in owners:
+        return owners[path]
+
+  # Files in these directories which aren't owned by a recipe or module. The
+  # engine's code only shows up here when testing the recipe_engine repo itself.
+  everything_prefixes = tuple(
+      os.path.join(p, '') for p in (
+          main_repo.recipes_dir,
+          main_repo.modules_dir,
+          os.path.dirname(
+              os.path.join(main_repo.path, RECIPES_CFG_LOCATION_REL)),
+          os.path.join(recipe_deps.repos['recipe_engine'].path,
+                       'recipe_engine'),
+      ))
+  git_attr_files = set(get_git_attribute_files(main_repo.path))
+
+  # Generated by the engine itself; never interesting.
+  ignored_prefix = os.path.join(recipe_deps.recipe_deps_path, '')
+
+  dirty_recipes = set()
+  dirty_modules = set()
+  for path in files:
+    if path.startswith(ignored_prefix):
+      continue
+
+    if path.endswith('.proto') or path in git_attr_files:
+      print(f'--changed-since: {path!r} may affect all recipes.',
+            file=sys.stderr)
+      return None
+
+    if path in recipe_paths:
+      dirty_recipes.add(recipe_paths[path])
+      continue
+    recipe_name = _owner(path, recipe_dirs)
+    if recipe_name:
+      dirty_recipes.add(recipe_name)
+      continue
+    module_key = _owner(path, module_dirs)
+    if module_key:
+      dirty_modules.add(module_key)
+      continue
+
+    # Any other python file may be imported by recipes or modules (or be part
+    # of the engine), which the DEPS graph knows nothing about.
+    if path.endswith('.py') or path.startswith(everything_prefixes):
+      print(f'--changed-since: {path!r} may affect all recipes.',
+            file=sys.stderr)
+      return None
+
+  if not dirty_recipes and not dirty_modules:
+    return set()
+
+  deps_index = DepsIndex(recipe_deps.deps_index_path)
+  try:
+    index = ReverseIndex(recipe_deps, main_repo.recipes.values(), deps_index)
+  finally:
+    deps_index.save()
+  affected = set(dirty_recipes)
+  for key in dirty_modules:
+    affected.update(index.dependents(key))
+  return affected
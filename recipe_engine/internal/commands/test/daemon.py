@@ -0,0 +1,522 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+"""A long-lived 'warm' daemon for `recipes.py test` runners.
+
+Normally every `test run`/`test train` starts fresh `test _runner` subprocesses,
+each of which has to import gevent, protobuf, the whole PB tree, the recipe
+engine and every recipe module before running a single test case.
+
+With `--daemon`, the orchestrator instead talks to a `test _daemon` process
+over a unix socket. The daemon imports everything once and then forks a new
+runner for every connection, so runners start with all of this already in
+memory. The orchestrator passes the runner's stdin/stdout/stderr file
+descriptors over the socket, so the forked runner speaks exactly the same
+`pipe.read_message`/`write_message` protocol as a `test _runner` subprocess.
+
+At the start of each test run, the orchestrator pings the daemon. On ping, the
+daemon checks the recipe and module files of all repos for changes and
+re-imports only the modules which changed (and the modules which depend on
+them). If the recipe engine itself (or the compiled PB tree) changed, the
+daemon refuses the ping and quits, and the orchestrator starts a new one.
+
+The daemon quits by itself after being idle for a while.
+"""
+
+import hashlib
+import os
+import select
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+
+import gevent
+import gevent.socket
+
+from gevent import subprocess
+from gevent.fileobject import FileObject
+
+# pylint: disable=import-error
+import PB
+from PB.recipe_engine.internal.test.runner import DaemonRequest, DaemonResponse
+
+from ...recipe_deps import RecipeDeps
+from ...recipe_module_importer import RecipeModuleImporter
+
+from .engine_sources import engine_sources
+from .pipe import write_message, read_message
+
+
+# The default number of seconds the daemon waits for a new connection before
+# quitting.
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+# How long the orchestrator waits for a newly spawned daemon to come up.
+_STARTUP_TIMEOUT = 60
+
+# Sent as DaemonRequest.version. Bump this when changing the meaning of
+# DaemonRequest or DaemonResponse.
+PROTOCOL_VERSION = 1
+
+
+def socket_path(cmd: list[str]) -> str:
+  """Returns the unix socket path for a daemon serving runners for `cmd`.
+
+  `cmd` is the `recipes.py` invocation (minus the `test ...` subcommand) which
+  would be used to start a runner subprocess. It includes all the repo paths,
+  so every distinct recipe checkout gets its own daemon.
+
+  This lives in the temp directory rather than in `.recipe_deps`, because unix
+  socket paths are limited to ~100 characters.
+  """
+  digest = hashlib.sha256('\0'.join(cmd).encode('utf-8')).hexdigest()
+  return os.path.join(tempfile.gettempdir(),
+                      'recipes-test-daemon-%d-%s.sock' % (os.getuid(),
+                                                          digest[:16]))
+
+
+# Orchestrator side
+
+
+def _request(path: str, req: DaemonRequest,
+             fds=()) -> tuple[gevent.socket.socket, object, DaemonResponse]:
+  """Connects to the daemon at `path`, sends `req` (with `fds`) and reads the
+  first DaemonResponse.
+
+  Sets `req.version` to PROTOCOL_VERSION.
+
+  Returns (sock, sock_file, response).
+  Raises OSError if the daemon can't be reached, or EOFError if the daemon hung
+  up without responding.
+  """
+  sock = gevent.socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+  try:
+    sock.connect(path)
+    socket.send_fds(sock, [b'\0'], list(fds))
+    sock_file = sock.makefile('rwb')
+    req.version = PROTOCOL_VERSION
+    write_message(sock_file, req)
+    sock_file.flush()
+    return sock, sock_file, read_message(sock_file, DaemonResponse)
+  except:
+    sock.close()
+    raise
+
+
+def _ping(path: str) -> bool:
+  """Returns True iff there's a live, non-stale daemon listening at `path`."""
+  try:
+    sock, _, rsp = _request(path, DaemonRequest(ping=True))
+  except (OSError, EOFError):
+    return False
+  sock.close()
+  return bool(rsp and rsp.pid)
+
+
+def ensure_daemon(cmd: list[str]) -> str | None:
+  """Ensures that a daemon is serving runners for `cmd`, starting one if
+  necessary.
+
+  Returns the daemon's socket path, or None if the daemon couldn't be started.
+  """
+  if not hasattr(os, 'fork'):
+    print('The test daemon is not supported on this platform; '
+          'falling back to regular runners.', file=sys.stderr)
+    return None
+
+  path = socket_path(cmd)
+  if _ping(path):
+    return path
+
+  with open(path + '.log', 'ab') as log:
+    subprocess.Popen(cmd + ['test', '_daemon', '--socket', path],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=log, start_new_session=True)
+
+  deadline = time.monotonic() + _STARTUP_TIMEOUT
+  while time.monotonic() < deadline:
+    gevent.sleep(0.1)
+    if _ping(path):
+      return path
+
+  print(f'Unable to start test daemon (see {path}.log); '
+        'falling back to regular runners.', file=sys.stderr)
+  return None
+
+
+class DaemonRunnerProc:
+  """A runner forked by the daemon.
+
+  Implements the subset of the subprocess.Popen interface which RunnerThread
+  uses.
+  """
+
+  def __init__(self, sock, sock_file, pid, stdin, stdout):
+    self._sock = sock
+    self._sock_file = sock_file
+    self._pid = pid
+    self._exit_code = None
+    self.stdin = stdin
+    self.stdout = stdout
+
+  def kill(self):
+    if self._exit_code is None:
+      try:
+        os.kill(self._pid, signal.SIGKILL)
+      except OSError:
+        pass
+
+  def wait(self):
+    if self._exit_code is None:
+      try:
+        rsp = read_message(self._sock_file, DaemonResponse)
+        # NOTE: An all-default DaemonResponse (i.e. exit_code 0) is sent as an
+        # empty message, which read_message returns as None.
+        self._exit_code = rsp.exit_code if rsp else 0
+      except (OSError, EOFError):
+        self._exit_code = -1
+      self._sock.close()
+    return self._exit_code
+
+
+def start_runner(path: str, is_train: bool, cov_file: str | None,
+                 cover_module_imports: bool) -> DaemonRunnerProc | None:
+  """Asks the daemon at `path` to fork a new runner.
+
+  Returns the DaemonRunnerProc, or None if the daemon couldn't be reached.
+  """
+  stdin_r, stdin_w = os.pipe()
+  stdout_r, stdout_w = os.pipe()
+  try:
+    sock, sock_file, rsp = _request(path, DaemonRequest(
+        train=is_train,
+        cov_file=cov_file or '',
+        cover_module_imports=cover_module_imports,
+    ), fds=(stdin_r, stdout_w, sys.stderr.fileno()))
+  except (OSError, EOFError):
+    sock, rsp = None, None
+  # The runner has its own copies of these now (or failed to start).
+  os.close(stdin_r)
+  os.close(stdout_w)
+  # A refusal (pid 0) is sent as an empty message, i.e. None.
+  if not rsp:
+    if sock:
+      sock.close()
+    os.close(stdin_w)
+    os.close(stdout_r)
+    return None
+  return DaemonRunnerProc(sock, sock_file, rsp.pid,
+                          FileObject(stdin_w, 'wb', bufsize=0),
+                          FileObject(stdout_r, 'rb', bufsize=0))
+
+
+# Daemon side
+
+
+def _source_stamps(recipe_deps) -> dict[str, tuple[int, int]]:
+  """Returns {path: (mtime_ns, size)} for all .py files in the recipes and
+  recipe_modules directories of all repos."""
+  ret = {}
+  for repo in recipe_deps.repos.values():
+    for to_walk in (repo.recipes_dir, repo.modules_dir):
+      for root, _dirs, files in os.walk(to_walk):
+        for fname in files:
+          if fname.endswith('.py'):
+            path = os.path.join(root, fname)
+            try:
+              st = os.stat(path)
+            except OSError:
+              continue
+            ret[path] = (st.st_mtime_ns, st.st_size)
+  return ret
+
+
+def _engine_stamp(recipe_deps) -> tuple:
+  """Returns a value which changes whenever the recipe engine code (see
+  engine_sources.py) or the compiled PB tree changes."""
+  ret = []
+  for path in engine_sources(recipe_deps.repos['recipe_engine'].path):
+    try:
+      st = os.stat(path)
+    except OSError:
+      continue
+    ret.append((path, st.st_mtime_ns, st.st_size))
+  try:
+    with open(os.path.join(PB.__path__[0], 'csum')) as csum:
+      ret.append(csum.read())
+  except OSError:
+    pass
+  return tuple(ret)
+
+
+def _purge_modules(module_keys) -> None:
+  """Removes the given recipe modules (and all their submodules) from
+  sys.modules, so that they'll be re-imported on next use.
+
+  Args:
+    * module_keys (Iterable[tuple[str, str]]|None) - (repo_name, module_name)
+      pairs to purge. If None, purges all recipe modules.
+  """
+  prefixes = None
+  if module_keys is not None:
+    prefixes = tuple(
+        '%s.%s.%s' % (RecipeModuleImporter.PREFIX, repo_name, module_name)
+        for repo_name, module_name in module_keys)
+  for name in list(sys.modules):
+    if not name.startswith(RecipeModuleImporter.PREFIX + '.'):
+      continue
+    if prefixes is None or any(
+        name == prefix or name.startswith(prefix + '.') for prefix in prefixes):
+      del sys.modules[name]
+
+
+def _recreate(recipe_deps: RecipeDeps) -> RecipeDeps:
+  """Creates a new RecipeDeps for the same repos as `recipe_deps`, and installs
+  it as the RECIPE_MODULES importer.
+
+  Any recipe modules left in sys.modules will be reused by the new RecipeDeps.
+  """
+  proto_package = os.path.dirname(PB.__path__[0])
+  # RecipeDeps.create will add this back.
+  sys.path.remove(proto_package)
+  ret = RecipeDeps.create(
+      recipe_deps.main_repo.path,
+      {
+          repo_name: repo.path
+          for repo_name, repo in recipe_deps.repos.items()
+          if repo_name != recipe_deps.main_repo_id
+      },
+      proto_package)
+  sys.meta_path = [
+      RecipeModuleImporter(ret)
+      if isinstance(imp, RecipeModuleImporter) else imp
+      for imp in sys.meta_path
+  ]
+  return ret
+
+
+def _warm(recipe_deps: RecipeDeps) -> None:
+  """Imports all recipe modules and recipes so that forked runners don't have
+  to.
+
+  Errors are ignored here; runners will hit and report them normally.
+  """
+  for repo in recipe_deps.repos.values():
+    for module in repo.modules.values():
+      try:
+        module.API
+        module.CONFIG_CTX
+        module.TEST_API
+      except Exception:  # pylint: disable=broad-except
+        pass
+  for recipe in recipe_deps.main_repo.recipes.values():
+    try:
+      recipe.global_symbols
+    except Exception:  # pylint: disable=broad-except
+      pass
+
+
+class _Daemon:
+  def __init__(self, recipe_deps):
+    self.recipe_deps = recipe_deps
+    self._engine_stamp = _engine_stamp(recipe_deps)
+    self._source_stamps = _source_stamps(recipe_deps)
+    _warm(recipe_deps)
+
+  def is_stale(self) -> bool:
+    return _engine_stamp(self.recipe_deps) != self._engine_stamp
+
+  def reload(self) -> None:
+    """Picks up any changes to recipe and module files since the last reload."""
+    stamps = _source_stamps(self.recipe_deps)
+    changed = {
+        path for path in set(stamps) | set(self._source_stamps)
+        if stamps.get(path) != self._source_stamps.get(path)
+    }
+    self._source_stamps = stamps
+    if not changed:
+      return
+
+    dirty = set()
+    for repo in self.recipe_deps.repos.values():
+      for path in changed:
+        rel = os.path.relpath(path, repo.modules_dir)
+        if not rel.startswith(os.pardir + os.sep):
+          dirty.add((repo.name, rel.split(os.sep, 1)[0]))
+
+    # Modules which DEPS on a changed module may hold references to its code,
+    # so they need to be re-imported too.
+    dependents = {}
+    for repo in self.recipe_deps.repos.values():
+      for module in repo.modules.values():
+        try:
+          deps = module.normalized_DEPS.values()
+        except Exception:  # pylint: disable=broad-except
+          # Couldn't import it before; re-import it regardless.
+          dirty.add((repo.name, module.name))
+          continue
+        for dep in deps:
+          dependents.setdefault(dep, set()).add((repo.name, module.name))
+    to_visit = list(dirty)
+    while to_visit:
+      for dependent in dependents.get(to_visit.pop(), ()):
+        if dependent not in dirty:
+          dirty.add(dependent)
+          to_visit.append(dependent)
+
+    _purge_modules(dirty)
+    self.recipe_deps = _recreate(self.recipe_deps)
+    _warm(self.recipe_deps)
+
+
+def _run_forked_runner(recipe_deps, req: DaemonRequest, fds) -> None:
+  """Runs in the forked child; becomes a `test _runner` process.
+
+  Never returns.
+  """
+  exit_code = 1
+  try:
+    for target, fd in enumerate(fds):
+      os.dup2(fd, target)
+      os.close(fd)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    gevent.reinit()
+
+    if req.cov_file:
+      # The runner needs to cover the import of recipes and modules, so it
+      # can't use the ones the daemon imported.
+      _purge_modules(None)
+      recipe_deps = _recreate(recipe_deps)
+
+    from .runner import main
+    main(recipe_deps, req.cov_file or None, req.train, req.cover_module_imports)
+    exit_code = 0
+  except KeyboardInterrupt:
+    exit_code = 0
+  except BaseException:  # pylint: disable=broad-except
+    traceback.print_exc()
+  finally:
+    try:
+      sys.stdout.flush()
+      sys.stderr.flush()
+    finally:
+      os._exit(exit_code)
+
+
+def serve(recipe_deps, path: str, idle_timeout: float) -> int:
+  """Runs the daemon, listening on `path`.
+
+  Returns the exit code for the `test _daemon` subcommand.
+  """
+  # Don't take over from a live daemon.
+  if os.path.exists(path):
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+      probe.connect(path)
+      return 0
+    except OSError:
+      os.unlink(path)
+    finally:
+      probe.close()
+
+  daemon = _Daemon(recipe_deps)
+
+  listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+  # Create the socket as 0600 right away, so there's no window in which other
+  # users can connect to it.
+  old_umask = os.umask(0o077)
+  try:
+    listener.bind(path)
+  finally:
+    os.umask(old_umask)
+  listener.listen(128)
+  listener_ino = os.stat(path).st_ino
+
+  # pid -> (conn, conn_file) for all live runners.
+  children = {}
+  last_activity = time.monotonic()
+  stopping = False
+
+  def _reap():
+    while children:
+      pid, status = os.waitpid(-1, os.WNOHANG)
+      if not pid:
+        return
+      conn, conn_file = children.pop(pid)
+      try:
+        write_message(conn_file, DaemonResponse(
+            exit_code=os.waitstatus_to_exitcode(status)))
+        conn_file.flush()
+      except OSError:
+        pass
+      conn.close()
+
+  try:
+    while not stopping or children:
+      ready, _, _ = select.select(
+          [] if stopping else [listener], [], [], 0.05 if children else 1)
+      _reap()
+      if not ready:
+        if (not children and
+            time.monotonic() - last_activity > idle_timeout):
+          break
+        continue
+
+      last_activity = time.monotonic()
+      conn, _ = listener.accept()
+      conn_file = conn.makefile('rwb')
+      fds = ()
+      try:
+        _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+        req = read_message(conn_file, DaemonRequest)
+        if req is None or req.version != PROTOCOL_VERSION:
+          # The orchestrator is from a different recipe engine version. Refuse
+          # the request and quit, so that it starts a daemon of its own.
+          print('Refusing request with protocol version %d (want %d).' % (
+              req.version if req else 0, PROTOCOL_VERSION), file=sys.stderr)
+          stopping = True
+        elif req.ping and daemon.is_stale():
+          stopping = True
+        if stopping or req.ping:
+          rsp = DaemonResponse()
+          if not stopping:
+            daemon.reload()
+            rsp.pid = os.getpid()
+          write_message(conn_file, rsp)
+          conn_file.flush()
+          conn.close()
+          if stopping:
+            listener.close()
+            os.unlink(path)
+          continue
+
+        pid = os.fork()
+        if pid == 0:
+          listener.close()
+          for child_conn, _ in children.values():
+            child_conn.close()
+          conn.close()
+          _run_forked_runner(daemon.recipe_deps, req, fds)
+
+        children[pid] = (conn, conn_file)
+        write_message(conn_file, DaemonResponse(pid=pid))
+        conn_file.flush()
+      except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        conn.close()
+      finally:
+        for fd in fds:
+          os.close(fd)
+  finally:
+    if not stopping:
+      listener.close()
+      try:
+        if os.stat(path).st_ino == listener_ino:
+          os.unlink(path)
+      except OSError:
+        pass
+  return 0
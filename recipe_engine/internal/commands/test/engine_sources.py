@@ -0,0 +1,34 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+"""Lists the source files of the recipe engine.
+
+These are all the files (other than recipes and recipe modules) which the
+engine loads while running simulation tests. Both the test daemon (to tell when
+it's stale) and the test result cache (as part of every key) use this list, so
+that they agree on what counts as a change to the engine.
+"""
+
+import os
+
+
+# The top-level packages of the recipe_engine repo which the engine imports.
+#
+# NOTE: `turboci` is a namespace package (it has no __init__.py), so these
+# can't be discovered by looking for packages in the repo.
+PACKAGES = ('recipe_engine', 'turboci')
+
+
+def engine_sources(engine_path: str) -> list[str]:
+  """Returns the absolute paths of all files in the PACKAGES of the recipe
+  engine repo at `engine_path` (in a stable order), excluding compiled python
+  files."""
+  ret = []
+  for package in PACKAGES:
+    for path, dirs, files in os.walk(os.path.join(engine_path, package)):
+      dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+      ret.extend(
+          os.path.join(path, fname)
+          for fname in sorted(files) if not fname.endswith('.pyc'))
+  return ret
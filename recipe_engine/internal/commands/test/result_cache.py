@@ -0,0 +1,186 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+"""A content-addressed cache of passing simulation test results.
+
+The outcome of a simulation test is a function of the recipe (and its
+resources), the sources of all the recipe modules in its transitive DEPS, the
+recipe engine itself (see engine_sources.py), the TestData and the expectation
+file on disk. The orchestrator hashes these inputs into a key for every test
+case; if a passing result for that key is in the cache, the test isn't sent to
+a runner at all.
+
+Entries are written by the runners (which also record the coverage data of the
+test, so that the cached test still counts towards the total coverage) and
+only for tests which passed without writing expectations or issuing warnings.
+
+The cache lives in the `.recipe_deps` directory. It's partitioned by the
+engine/repo-wide part of the key so that entries made by an older recipe engine
+are cleaned up, rather than accumulating forever.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+
+# pylint: disable=import-error
+import PB
+from PB.recipe_engine.internal.test.runner import CachedResult
+
+from ...simple_cfg import RECIPES_CFG_LOCATION_REL
+
+from .engine_sources import engine_sources
+
+
+# Bump this to invalidate all existing cache entries (e.g. when the meaning of
+# a cached result changes).
+_VERSION = b'1'
+
+# Subdirectories of recipe modules which only contain recipes (which are hashed
+# as part of their own test cases); these don't affect other recipes.
+_MODULE_RECIPE_SUBDIRS = frozenset(['examples', 'tests'])
+
+
+def _hash_file(hasher, path: str) -> None:
+  try:
+    with open(path, 'rb') as f:
+      hasher.update(hashlib.sha256(f.read()).digest())
+  except OSError:
+    hasher.update(b'<missing>')
+
+
+def _hash_tree(hasher, root: str, skip_dirs=frozenset()) -> None:
+  """Hashes the paths and contents of all files under `root`."""
+  for path, dirs, files in os.walk(root):
+    dirs[:] = sorted(
+        d for d in dirs if d != '__pycache__' and
+        not (path == root and d in skip_dirs))
+    for fname in sorted(files):
+      if fname.endswith('.pyc'):
+        continue
+      full = os.path.join(path, fname)
+      hasher.update(os.path.relpath(full, root).encode('utf-8') + b'\0')
+      _hash_file(hasher, full)
+
+
+def should_cache(results) -> bool:
+  """Returns True if `results` (Outcome.Results) may be stored in the cache.
+
+  Only passing results are cached, and not ones which issued warnings: the
+  causes of those are only reported once the runner quits, and would be lost for
+  cached tests.
+  """
+  return not (results.diff.lines or results.removed or results.written
+              or results.check or results.crash_mismatch or results.bad_test
+              or results.internal_error or results.warnings)
+
+
+def _entry_path(root: str, key: str) -> str:
+  partition, digest = key.split('/')
+  return os.path.join(root, partition, digest[:2], digest)
+
+
+def store(root: str, key: str, results, cov_data) -> None:
+  """Writes a cache entry. Called by the runner subprocesses.
+
+  Args:
+    * root (str) - RecipeDeps.test_result_cache_path.
+    * key (str) - The key computed by ResultCache.key.
+    * results (Outcome.Results) - The (passing) result of the test.
+    * cov_data (coverage.CoverageData|None) - The coverage of the test.
+  """
+  entry = CachedResult(results=results)
+  if cov_data is not None:
+    entry.coverage = cov_data.dumps()
+
+  path = _entry_path(root, key)
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  tmp = '%s.%d.tmp' % (path, os.getpid())
+  with open(tmp, 'wb') as f:
+    f.write(entry.SerializeToString())
+  os.replace(tmp, path)
+
+
+class ResultCache:
+  """Computes cache keys for test cases and looks up their cached results."""
+
+  def __init__(self, recipe_deps):
+    self._recipe_deps = recipe_deps
+    self._module_digests = {}
+    self._closures = {}
+
+    hasher = hashlib.sha256(_VERSION)
+    hasher.update(sys.version.encode('utf-8'))
+    engine_path = recipe_deps.repos['recipe_engine'].path
+    for path in engine_sources(engine_path):
+      hasher.update(os.path.relpath(path, engine_path).encode('utf-8') + b'\0')
+      _hash_file(hasher, path)
+    _hash_file(hasher, os.path.join(PB.__path__[0], 'csum'))
+    _hash_file(hasher, os.path.join(recipe_deps.main_repo.path,
+                                    RECIPES_CFG_LOCATION_REL))
+    self._global_digest = hasher.hexdigest()[:16]
+
+  def prune(self) -> None:
+    """Removes all entries made with a different recipe engine or recipes.cfg.
+    """
+    root = self._recipe_deps.test_result_cache_path
+    try:
+      names = os.listdir(root)
+    except OSError:
+      return
+    for name in names:
+      if name != self._global_digest:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+  def _module_digest(self, repo_name: str, module_name: str) -> bytes:
+    key = (repo_name, module_name)
+    ret = self._module_digests.get(key)
+    if ret is None:
+      module = self._recipe_deps.repos[repo_name].modules[module_name]
+      hasher = hashlib.sha256(module.full_name.encode('utf-8') + b'\0')
+      _hash_tree(hasher, module.path, _MODULE_RECIPE_SUBDIRS)
+      ret = self._module_digests[key] = hasher.digest()
+    return ret
+
+  def _closure(self, repo_name: str, module_name: str) -> frozenset:
+    key = (repo_name, module_name)
+    ret = self._closures.get(key)
+    if ret is None:
+      # Guard against DEPS cycles; the engine rejects them later anyway.
+      self._closures[key] = frozenset()
+      module = self._recipe_deps.repos[repo_name].modules[module_name]
+      ret = frozenset([key]).union(
+          *(self._closure(*dep) for dep in module.normalized_DEPS.values()))
+      self._closures[key] = ret
+    return ret
+
+  def key(self, recipe, test_case, pickled_test_data: bytes) -> str | None:
+    """Returns the cache key for `test_case` of `recipe`.
+
+    Returns None if the test case can't be cached (because its TestData
+    couldn't be pickled).
+    """
+    if not pickled_test_data:
+      return None
+    hasher = hashlib.sha256(
+        ('%s\0%s\0' % (recipe.name, test_case.name)).encode('utf-8'))
+    _hash_file(hasher, recipe.path)
+    if os.path.isdir(recipe.resources_dir):
+      _hash_tree(hasher, recipe.resources_dir)
+    for dep in sorted(frozenset().union(
+        *(self._closure(*dep) for dep in recipe.normalized_DEPS.values()))):
+      hasher.update(self._module_digest(*dep))
+    _hash_file(hasher, test_case.expect_file)
+    hasher.update(hashlib.sha256(pickled_test_data).digest())
+    return '%s/%s' % (self._global_digest, hasher.hexdigest())
+
+  def get(self, key: str) -> CachedResult | None:
+    """Returns the CachedResult for `key`, if there is one."""
+    try:
+      with open(_entry_path(self._recipe_deps.test_result_cache_path, key),
+                'rb') as f:
+        return CachedResult.FromString(f.read())
+    except Exception:  # pylint: disable=broad-except
+      return None
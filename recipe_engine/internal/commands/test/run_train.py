@@ -5,6 +5,7 @@
 import collections
 import json
 import os
+import pickle
 import shutil
 import tempfile
 
@@ -17,23 +18,55 @@ from google.protobuf import json_format
 # pylint: disable=import-error
 from PB.recipe_engine.internal.test.runner import Description, Outcome
 
+from ...warn import record
 from ..doc.cmd import regenerate_doc, doc_diff
 
-from . import report, test_name
+from . import changed, report, test_name
 from .fail_tracker import FailTracker
+from .result_cache import ResultCache
 from .runner import RunnerThread
+from .scheduler import AffinityScheduler, DepsClosure
 
 
-# TODO(crbug.com/1147793): Remove the second return value after migration.
-def _push_tests(test_filter: test_name.Filter, is_train, main_repo, description_queue,
-                recent_fails):
+def _pickle_test_data(test_case):
+  """Returns the pickled form of `test_case`, or b'' if it cannot be pickled.
+
+  Runners will run GenTests themselves for test cases which could not be
+  pickled (e.g. ones which use lambdas or functions defined inside of the
+  recipe).
   """
+  try:
+    return pickle.dumps(test_case, pickle.HIGHEST_PROTOCOL)
+  except Exception:  # pylint: disable=broad-except
+    return b''
+
+
+# TODO(crbug.com/1147793): Remove the second return value after migration.
+def _push_tests(test_filter: test_name.Filter, is_train, main_repo, scheduler,
+                recent_fails, cov_file, result_cache, outcome_queue):
+  """Runs GenTests for all recipes and pushes a Description for every test
+  case which matches `test_filter` to `scheduler`.
+
+  Each Description carries the pickled TestData (where possible) so that the
+  runner subprocesses don't need to run GenTests again.
+
+  Test cases with a cached passing result aren't pushed to `scheduler`; their
+  result is put directly on `outcome_queue` instead.
+
+  Args:
+    * cov_file (str|None) - If set, coverage for the GenTests functions (and
+      for the test cases with cached results) will be written to this file.
+    * result_cache (ResultCache|None) - The cache of passing test results.
+    * outcome_queue (gevent.queue.Queue) - The queue to put the Outcomes of
+      cached test cases on.
+
   Returns:
     * set - unused_expectation_files
   """
   unused_expectation_files = set()
   used_expectation_files = set()
   test_filenames = collections.defaultdict(dict)
+  deps_closure = DepsClosure(main_repo.recipe_deps)
 
   def push_test(recipe, test_case):
     recipe_filenames = test_filenames[recipe]
@@ -50,13 +83,34 @@ def _push_tests(test_filter: test_name.Filter, is_train, main_repo, description_
           (test_case.name, og_name, expect_file))
 
     recipe_filenames[expect_file] = test_case.name
-    if not test_filter.full_name(f'{recipe.name}.{test_case.name}'):
+    full_name = f'{recipe.name}.{test_case.name}'
+    if not test_filter.full_name(full_name):
       return
 
-    description_queue.put(
+    test_data = _pickle_test_data(test_case)
+    cache_key = None
+    if result_cache:
+      cache_key = result_cache.key(recipe, test_case, test_data)
+    if cache_key:
+      cached = result_cache.get(cache_key)
+      # Entries made by runs without coverage can't be used if we need it.
+      if cached and (cov_data is None or cached.coverage):
+        if cov_data is not None:
+          cached_cov = coverage.CoverageData(no_disk=True)
+          cached_cov.loads(cached.coverage)
+          cov_data.update(cached_cov)
+        outcome = Outcome()
+        outcome.test_results[full_name].CopyFrom(cached.results)
+        outcome_queue.put(outcome)
+        return
+
+    scheduler.put(
         Description(
             recipe_name=recipe.name,
-            test_name=test_case.name))
+            test_name=test_case.name,
+            test_data=test_data,
+            result_cache_key=cache_key or ''),
+        deps_closure(recipe))
 
     gevent.sleep()  # let any blocking threads pick this up
 
@@ -65,6 +119,8 @@ def _push_tests(test_filter: test_name.Filter, is_train, main_repo, description_
   if not test_filter:
     unused_expectation_files.update(main_repo.expectation_paths)
 
+  cov_data = coverage.CoverageData(basename=cov_file) if cov_file else None
+
   # Handle recent fails first
   deferred_tests = []
   for recipe in main_repo.recipes.values():
@@ -74,9 +130,20 @@ def _push_tests(test_filter: test_name.Filter, is_train, main_repo, description_
     if test_filter:
       unused_expectation_files.update(recipe.expectation_paths)
 
+    cov = None
+    if cov_data is not None:
+      # The runners won't execute GenTests for any test cases we manage to
+      # pickle, so we need to collect its coverage here instead.
+      cov = coverage.Coverage(config_file=False, concurrency='gevent',
+                              data_file=None,
+                              include=recipe.coverage_patterns)
+      cov.start()
+
+    has_tests = False
     # Maps expect_file -> original test_name
     try:
       for test_case in recipe.gen_tests():  # User code, could raise
+        has_tests = True
         full_name = recipe.full_name.split('::')[-1] + '.' + test_case.name
         if len(recent_fails) == 0 or full_name in recent_fails:
           push_test(recipe, test_case)
@@ -88,11 +155,21 @@ def _push_tests(test_filter: test_name.Filter, is_train, main_repo, description_
       print('USER CODE ERROR:')
       print(f'Crashed while running GenTests from recipe {recipe.name}')
       raise
+    finally:
+      if cov:
+        cov.stop()
+        # Recipes without any tests are never loaded by the runners, so they
+        # shouldn't be covered by merely running GenTests either.
+        if has_tests:
+          cov_data.update(cov.get_data())
 
   # Test any non-recently-failed cases
   for deferred_test in deferred_tests:
     push_test(*deferred_test)
 
+  if cov_data is not None:
+    cov_data.write()
+
   unused_expectation_files -= used_expectation_files
   if not is_train:
     return sorted(unused_expectation_files)
@@ -103,12 +180,13 @@ def _push_tests(test_filter: test_name.Filter, is_train, main_repo, description_
 
 
 def _run(test_results, recipe_deps, use_emoji, test_filter, is_train,
-         stop, jobs, show_warnings, show_durations):
+         stop, jobs, show_warnings, show_durations, use_daemon,
+         use_result_cache):
   """Run tests in py3 subprocess pools.
   """
   main_repo = recipe_deps.main_repo
 
-  description_queue = gevent.queue.UnboundQueue()
+  scheduler = AffinityScheduler()
 
   # outcome_queue is written to by RunnerThreads; it will either contain Outcome
   # messages, or it will contain one of our RunnerThread instances (to indicate
@@ -124,6 +202,11 @@ def _run(test_results, recipe_deps, use_emoji, test_filter, is_train,
       )
   ))
 
+  result_cache = None
+  if use_result_cache:
+    result_cache = ResultCache(recipe_deps)
+    result_cache.prune()
+
   fail_tracker = FailTracker(recipe_deps.previous_test_failures_path)
   reporter = report.Reporter(recipe_deps, use_emoji, is_train, fail_tracker,
                              show_warnings, show_durations)
@@ -142,17 +225,28 @@ def _run(test_results, recipe_deps, use_emoji, test_filter, is_train,
 
     cov_dir, all_threads = RunnerThread.make_pool(
         recipe_deps,
-        description_queue,
+        scheduler,
         outcome_queue,
         is_train,
         collect_coverage=not test_filter,
-        jobs=jobs)
+        jobs=jobs,
+        use_daemon=use_daemon)
     live_threads[:] = all_threads
 
+    gen_tests_cov_file = None
+    if cov_dir:
+      gen_tests_cov_file = os.path.join(cov_dir, 'gen_tests.coverage')
+
+    # GenTests runs here rather than in the runners, so record any warnings it
+    # issues.
+    record.GLOBAL = record.WarningRecorder(recipe_deps)
     unused_expectation_files = _push_tests(
-        test_filter, is_train, main_repo, description_queue,
-        fail_tracker.recent_fails)
+        test_filter, is_train, main_repo, scheduler,
+        fail_tracker.recent_fails, gen_tests_cov_file, result_cache,
+        outcome_queue)
     test_results.unused_expectation_files.extend(unused_expectation_files)
+    for name, causes in record.GLOBAL.recorded_warnings.items():
+      test_results.warnings[name].causes.extend(causes)
 
     def execute_queue():
       has_fail = False
@@ -195,14 +289,15 @@ def _run(test_results, recipe_deps, use_emoji, test_filter, is_train,
       if (test_filter or (stop and has_fail)) is False:
         data_paths = [t.cov_file for t in all_threads
                       if os.path.isfile(t.cov_file)]
+        if gen_tests_cov_file and os.path.isfile(gen_tests_cov_file):
+          data_paths.append(gen_tests_cov_file)
         if data_paths:
           total_cov.combine(data_paths)
 
       return has_fail
 
-    # Put None poison pill for each thread.
-    for thread in all_threads:
-      description_queue.put(None)
+    # Let each thread know that there are no more tests coming.
+    scheduler.close()
 
     has_fail = execute_queue()
     print()
@@ -255,9 +350,23 @@ def main(args):
             as_string[1:-2]))
 
   repo = args.recipe_deps.main_repo
+
+  if args.changed_since:
+    try:
+      affected = changed.affected_recipes(
+          args.recipe_deps, changed.changed_files(repo.path, args.changed_since))
+    except changed.ChangedFilesError as ex:
+      print(ex)
+      return 1
+    if affected is not None:
+      print(f'Running tests for {len(affected)} recipe(s) affected by changes '
+            f'since {args.changed_since}.')
+      args.test_filter.only_recipes(affected)
+
   try:
     _run(ret, args.recipe_deps, args.use_emoji, args.test_filter, is_train,
-         args.stop, args.jobs, args.show_warnings, args.show_durations)
+         args.stop, args.jobs, args.show_warnings, args.show_durations,
+         args.daemon, args.result_cache)
     _dump()
   except KeyboardInterrupt:
     args.docs = False  # skip docs
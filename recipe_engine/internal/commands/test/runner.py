@@ -7,6 +7,7 @@ import collections.abc
 import errno
 import json
 import os
+import pickle
 import re
 import sys
 import tempfile
@@ -43,6 +44,7 @@ from ...test.execute_test_case import execute_test_case
 from ...turboci import common as turboci_common
 from ...turboci import fake as turboci_fake
 
+from . import daemon, result_cache
 from .expectation_conversion import transform_expectations
 from .pipe import write_message, read_message
 
@@ -275,6 +277,16 @@ def _diff_test(test_results, expect_file, new_expect, is_train):
   if new_expect is None and cur_expect_text is None:
     return
 
+  # Compare the expectations structurally first; this is much cheaper than
+  # normalizing and formatting the (possibly large) expectation as text, and the
+  # expectation usually matches.
+  if new_expect is not None and cur_expect_text is not None:
+    try:
+      if _same_as_json(new_expect, json.loads(cur_expect_text)):
+        return
+    except ValueError:
+      pass  # compare the text below.
+
   new_expect_text = json.dumps(
       _encode_decode(new_expect), sort_keys=True, indent=2)
 
@@ -363,13 +375,10 @@ def _run_test(path_cleaner, test_results, recipe_deps, test_desc, test_data,
       test_case_result.raw_result, test_data, test_results,
       recipe_deps.main_repo.recipes_cfg_pb2.enforce_test_expected_status)
 
-  # Convert the result to a json object by dumping to json, and then parsing.
-  # TODO(iannucci): Use real objects so this only needs to be serialized once.
-  raw_expectations['$result'] = json.loads(
-      jsonpb.MessageToJson(
-          legacy.to_legacy_result(test_case_result.raw_result),
-          always_print_fields_with_no_presence=True,
-      ))
+  raw_expectations['$result'] = jsonpb.MessageToDict(
+      legacy.to_legacy_result(test_case_result.raw_result),
+      always_print_fields_with_no_presence=True,
+  )
 
   if not raw_expectations['$result'].get('failure'): # on success
     if test_case_result.raw_result.summary_markdown: # has markdown populated
@@ -481,16 +490,27 @@ def main(recipe_deps, cov_file, is_train, cover_module_imports):
                                 include=recipe.coverage_patterns)
         cov.start()  # to cover execfile of recipe/module.__init__
 
-      test_data = _get_test_data(test_data_cache, recipe, test_desc.test_name)
+      test_data = _get_test_data(test_data_cache, recipe, test_desc)
       try:
         _run_test(path_cleaner, test_result, recipe_deps, test_desc, test_data,
                   is_train)
       except Exception as ex:  # pylint: disable=broad-except
         test_result.internal_error.append('Uncaught exception: %r' % (ex,))
         test_result.internal_error.extend(traceback.format_exc().splitlines())
+      test_cov_data = None
       if cov:
         cov.stop()
-        cov_data.update(cov.get_data())
+        test_cov_data = cov.get_data()
+        cov_data.update(test_cov_data)
+
+      if (test_desc.result_cache_key and
+          result_cache.should_cache(test_result)):
+        try:
+          result_cache.store(recipe_deps.test_result_cache_path,
+                             test_desc.result_cache_key, test_result,
+                             test_cov_data)
+        except OSError:
+          pass  # The cache is best-effort.
 
     except Exception as ex:  # pylint: disable=broad-except
       result.internal_error.append('Uncaught exception: %r' % (ex,))
@@ -515,8 +535,19 @@ def _read_test_desc() -> Description | None:
         ]+traceback.format_exc().splitlines()))
     return None
 
-def _get_test_data(cache, recipe, test_name):
-  key = (recipe.name, test_name)
+def _get_test_data(cache, recipe, test_desc):
+  """Returns the TestData for `test_desc`.
+
+  Uses the pickled TestData sent by the main process if there is one, otherwise
+  runs GenTests for `recipe` (caching all of its TestData in `cache`).
+  """
+  if test_desc.test_data:
+    try:
+      return pickle.loads(test_desc.test_data)
+    except Exception:  # pylint: disable=broad-except
+      pass  # Fall back to running GenTests ourselves.
+
+  key = (recipe.name, test_desc.test_name)
   if key not in cache:
     for test_data in recipe.gen_tests():
       cache[(recipe.name, test_data.name)] = test_data
@@ -542,6 +573,28 @@ def _encode_decode(obj):
   return obj
 
 
+def _same_as_json(obj, loaded) -> bool:
+  """Returns True if `obj` (a new expectation) encodes to the same JSON data as
+  `loaded` (the parsed expectation file).
+
+  This is strict about types (e.g. True is not 1), and conservatively returns
+  False for anything it doesn't expect in an expectation.
+  """
+  if isinstance(loaded, dict):
+    if not isinstance(obj, dict) or len(obj) != len(loaded):
+      return False
+    for key, value in obj.items():
+      if type(key) is not str or key not in loaded:
+        return False
+      if not _same_as_json(value, loaded[key]):
+        return False
+    return True
+  if isinstance(loaded, list):
+    return (isinstance(obj, (list, tuple)) and len(obj) == len(loaded) and
+            all(map(_same_as_json, obj, loaded)))
+  return type(obj) is type(loaded) and obj == loaded
+
+
 def _make_path_cleaner(recipe_deps):
   """Returns a filtering function which substitutes real paths-on-disk with
   expectation-compatible `RECIPE_REPO[repo name]` mock paths. This only works
@@ -602,13 +655,40 @@ def _make_path_cleaner(recipe_deps):
 
 
 class RunnerThread(gevent.Greenlet):
-  def __init__(self, recipe_deps, description_queue, outcome_queue, is_train,
-               cov_file, cover_module_imports):
+  def __init__(self, recipe_deps, scheduler, outcome_queue, is_train,
+               cov_file, cover_module_imports, daemon_socket=None):
     super().__init__()
 
     self.cov_file = cov_file
     self.exit_code = None
 
+    self._runner_proc = None
+    if daemon_socket:
+      self._runner_proc = daemon.start_runner(
+          daemon_socket, is_train, cov_file, cover_module_imports)
+      if self._runner_proc is None:
+        print('The test daemon did not start a runner; '
+              'falling back to a regular runner.', file=sys.stderr)
+
+    if self._runner_proc is None:
+      cmd = self.recipes_cmd(recipe_deps) + ['test', '_runner']
+      if is_train:
+        cmd.append('--train')
+      if cov_file:
+        cmd.extend(['--cov-file', cov_file])
+        if cover_module_imports:
+          cmd.append('--cover-module-imports')
+
+      self._runner_proc = subprocess.Popen(cmd, bufsize=0,
+                                           stdin=subprocess.PIPE,
+                                           stdout=subprocess.PIPE, stderr=None)
+    self._scheduler = scheduler
+    self._outcome_queue = outcome_queue
+
+  @staticmethod
+  def recipes_cmd(recipe_deps):
+    """Returns the `recipes.py` invocation (without any subcommand) for runners
+    of `recipe_deps`."""
     engine_path = recipe_deps.repos['recipe_engine'].path
 
     cmd = [
@@ -636,23 +716,11 @@ class RunnerThread(gevent.Greenlet):
       if repo_name == recipe_deps.main_repo.name:
         continue
       cmd.extend(['-O', '%s=%s' % (repo_name, repo.path)])
-
-    cmd.extend(['test', '_runner'])
-    if is_train:
-      cmd.append('--train')
-    if cov_file:
-      cmd.extend(['--cov-file', cov_file])
-      if cover_module_imports:
-        cmd.append('--cover-module-imports')
-
-    self._runner_proc = subprocess.Popen(cmd, bufsize=0, stdin=subprocess.PIPE,
-                                         stdout=subprocess.PIPE, stderr=None)
-    self._description_queue = description_queue
-    self._outcome_queue = outcome_queue
+    return cmd
 
   @classmethod
-  def make_pool(cls, recipe_deps, description_queue, outcome_queue, is_train,
-                collect_coverage, jobs):
+  def make_pool(cls, recipe_deps, scheduler, outcome_queue, is_train,
+                collect_coverage, jobs, use_daemon=False):
     """Returns a pool (list) of started RunnerThread instances.
 
     Each RunnerThread owns a `recipes.py test _runner` subprocess and
@@ -663,7 +731,7 @@ class RunnerThread(gevent.Greenlet):
     Args:
 
       * recipe_deps (RecipeDeps)
-      * description_queue (gevent.queue.Queue) - The queue to pull Description
+      * scheduler (AffinityScheduler) - The scheduler to pull Description
         messages from to feed to the runner subprocess.
       * outcome_queue (gevent.queue.Queue) - The queue to push Outcome messages
         sourced from the runner subprocess.
@@ -673,9 +741,15 @@ class RunnerThread(gevent.Greenlet):
       * collect_coverage (bool) - Whether or not to collect coverage. May be
         false if the user specified a test filter.
       * jobs (int) - The number of workers to use for running tests.
+      * use_daemon (bool) - Whether to fork the runners from the warm runner
+        daemon (see daemon.py) rather than starting fresh subprocesses.
 
     Returns List[RunnerThread].
     """
+    daemon_socket = None
+    if use_daemon:
+      daemon_socket = daemon.ensure_daemon(cls.recipes_cmd(recipe_deps))
+
     if collect_coverage:
       cov_dir = tempfile.mkdtemp('.recipe_test_coverage')
       cov_file = lambda tid: os.path.join(cov_dir, 'thread-%d.coverage' % tid)
@@ -687,11 +761,12 @@ class RunnerThread(gevent.Greenlet):
     # no need to duplicate this work to all runners.
     pool = [
         cls(recipe_deps,
-            description_queue,
+            scheduler,
             outcome_queue,
             is_train,
             cov_file(i),
-            cover_module_imports=(i == 0)) for i in range(jobs)
+            cover_module_imports=(i == 0),
+            daemon_socket=daemon_socket) for i in range(jobs)
     ]
     for thread in pool:
       thread.start()
@@ -701,7 +776,7 @@ class RunnerThread(gevent.Greenlet):
   def _run(self):
     try:
       while True:
-        test_desc = self._description_queue.get()
+        test_desc = self._scheduler.get(self)
 
         if not test_desc:
           # Signal to the process that no more test Descriptions will be coming.
@@ -0,0 +1,172 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+"""Hands out test Descriptions to the RunnerThreads of `recipes.py test`.
+
+Every runner subprocess which runs a test for a recipe has to import that
+recipe, instantiate its whole module graph and warm up coverage for it. If test
+cases are simply handed to whichever runner is free, every runner ends up
+paying this cost for every recipe.
+
+AffinityScheduler instead keeps all cases of a recipe on the runner which first
+picked the recipe up, and when a runner needs a new recipe it prefers one whose
+module DEPS closure overlaps the modules it has already loaded. Once all cases
+have been added and there are no unclaimed recipes left, idle runners steal
+cases from the back of the longest backlog so that the tail of the run still
+uses all runners.
+"""
+
+import collections
+
+from typing import Hashable, Iterable
+
+import gevent.event
+
+# pylint: disable=import-error
+from PB.recipe_engine.internal.test.runner import Description
+
+
+# The number of unclaimed recipes (in push order) which are considered when
+# a runner picks up a new recipe. This bounds the cost of each pick on repos
+# with thousands of recipes, while still letting the runner find a recipe close
+# to the ones it has already loaded.
+_PICK_WINDOW = 32
+
+
+class DepsClosure:
+  """Computes (and caches) the transitive module DEPS of recipes."""
+
+  def __init__(self, recipe_deps):
+    self._recipe_deps = recipe_deps
+    self._module_cache = {}
+
+  def _module(self, repo_name: str, module_name: str) -> frozenset[str]:
+    key = (repo_name, module_name)
+    ret = self._module_cache.get(key)
+    if ret is None:
+      # Guard against DEPS cycles; the engine rejects them later anyway.
+      self._module_cache[key] = frozenset()
+      module = self._recipe_deps.repos[repo_name].modules[module_name]
+      ret = frozenset([module.full_name]).union(
+          *(self._module(*dep) for dep in module.normalized_DEPS.values()))
+      self._module_cache[key] = ret
+    return ret
+
+  def __call__(self, recipe) -> frozenset[str]:
+    """Returns the full names of all modules `recipe` transitively depends on.
+    """
+    return frozenset().union(
+        *(self._module(*dep) for dep in recipe.normalized_DEPS.values()))
+
+
+class AffinityScheduler:
+  """A queue of test Descriptions which groups the cases of each recipe onto
+  the same runner.
+
+  Descriptions are added with `put` and fetched per-runner with `get`. Once
+  all Descriptions have been added, call `close`; after this `get` will return
+  None to every runner once there's no more work.
+  """
+
+  def __init__(self):
+    # recipe name -> deque[Description]
+    self._pending = collections.OrderedDict()
+    # recipe name -> frozenset of module names in its DEPS closure.
+    self._deps = {}
+    # recipe names which no runner has claimed yet, in push order.
+    self._unclaimed = collections.OrderedDict()
+
+    # runner -> recipe name it's currently working through.
+    self._current = {}
+    # runner -> set of module names which the runner has loaded so far.
+    self._loaded = collections.defaultdict(set)
+
+    self._closed = False
+    self._available = gevent.event.Event()
+
+  def put(self, desc: Description, deps: Iterable[str] = ()) -> None:
+    """Adds a test Description.
+
+    Args:
+      * desc - The test to run.
+      * deps - The names of the modules which the test's recipe (transitively)
+        depends on.
+    """
+    assert not self._closed, 'put() after close()'
+    queue = self._pending.get(desc.recipe_name)
+    if queue is None:
+      queue = self._pending[desc.recipe_name] = collections.deque()
+      self._deps[desc.recipe_name] = frozenset(deps)
+      if desc.recipe_name not in self._current.values():
+        self._unclaimed[desc.recipe_name] = None
+    queue.append(desc)
+    self._available.set()
+
+  def close(self) -> None:
+    """Indicates that no more Descriptions will be added."""
+    self._closed = True
+    self._available.set()
+
+  def _claim(self, runner: Hashable) -> str | None:
+    """Picks an unclaimed recipe for `runner`, preferring the one which shares
+    the most modules with what `runner` has already loaded."""
+    if not self._unclaimed:
+      return None
+    loaded = self._loaded[runner]
+    best, best_overlap = None, -1
+    for i, recipe_name in enumerate(self._unclaimed):
+      if i >= _PICK_WINDOW:
+        break
+      overlap = len(loaded.intersection(self._deps[recipe_name]))
+      if overlap > best_overlap:
+        best, best_overlap = recipe_name, overlap
+    del self._unclaimed[best]
+    return best
+
+  def _steal(self) -> Description | None:
+    """Takes the last Description of the longest backlog, if any."""
+    victim = max(self._pending.values(), key=len, default=None)
+    if not victim:
+      return None
+    return victim.pop()
+
+  def _next(self, runner: Hashable) -> Description | None:
+    # A runner keeps its current recipe until it claims another one, so that
+    # cases of that recipe which are put while the runner is idle still go to
+    # it.
+    current = self._current.get(runner)
+    if current is not None:
+      queue = self._pending.get(current)
+      if queue:
+        return queue.popleft()
+
+    recipe_name = self._claim(runner)
+    if recipe_name is not None:
+      self._current[runner] = recipe_name
+      self._loaded[runner].update(self._deps[recipe_name])
+      return self._pending[recipe_name].popleft()
+
+    # Until all cases are in, more recipes may still turn up for this runner to
+    # claim; only steal cases from other runners in the tail of the run.
+    if self._closed:
+      return self._steal()
+    return None
+
+  def get(self, runner: Hashable) -> Description | None:
+    """Returns the next Description for `runner` to run.
+
+    Blocks until there's a Description available. Returns None if the
+    scheduler is closed and there's no more work.
+    """
+    while True:
+      desc = self._next(runner)
+      if desc is not None:
+        queue = self._pending[desc.recipe_name]
+        if not queue:
+          del self._pending[desc.recipe_name]
+        return desc
+      if self._closed:
+        return None
+      self._available.clear()
+      self._available.wait()
@@ -36,6 +36,9 @@ class Filter:
   _compiled_recipe_pattern : str = attr.ib(default=None)
   _compiled_test_name_pattern : str = attr.ib(default=None)
 
+  # If set, only recipes with these names match.
+  _recipe_names : set[str] | None = attr.ib(default=None)
+
   def append(self, filt: str):
     """Argparse calls this function with each argument to --filter on the
     command line."""
@@ -49,17 +52,26 @@ class Filter:
     self._recipe_patterns.append(fnmatch.translate(split(filt)[0]))
     self._full_test_name_patterns.append(fnmatch.translate(filt))
 
+  def only_recipes(self, recipe_names: set[str]):
+    """Restricts this filter to only match the given recipes (in addition to
+    any --filter patterns)."""
+    self._recipe_names = set(recipe_names)
+
   def __bool__(self):
     """Returns True if this object has any filter patterns."""
     # NOTE: self._recipe_patterns implies that self._full_test_name_patterns
     # also has values.
-    return bool(self._recipe_patterns)
+    return bool(self._recipe_patterns) or self._recipe_names is not None
 
   def recipe_name(self, recipe_name: str) -> bool:
     """Returns True if `recipe_name` matches the accumulated filter state.
 
     Note that a complete absence of --filter arguments will always return True.
     """
+    if (self._recipe_names is not None and
+        recipe_name not in self._recipe_names):
+      return False
+
     if not self._recipe_patterns:
       return True
 
@@ -41,6 +41,7 @@ from .exceptions import CancelledBuild, RecipeUsageError, CrashEngine
 from .global_shutdown import GLOBAL_SHUTDOWN
 from .resource_semaphore import ResourceWaiter
 from .step_runner import Step
+from .stream import StreamEngine
 
 
 LOG = logging.getLogger(__name__)
@@ -66,6 +67,49 @@ class _ActiveStep:
       self.step_data.presentation.finalize(self.step_stream)
       self.step_stream.close()
 
+
+class _LazyLogStream(StreamEngine.Stream):
+  """A log stream which is buffered in memory, and only opened on its step if
+  `materialize` is called (or it grows past MAX_BUFFER_SIZE).
+
+  Opening a log is expensive for some StreamEngines (e.g. for luciexe it's a new
+  logdog stream plus an update of the Build message), which adds up for logs
+  like `$debug` that every step has, but which are only interesting when
+  something went wrong.
+  """
+
+  MAX_BUFFER_SIZE = 64 * 1024
+
+  def __init__(self, step_stream, log_name):
+    self._step_stream = step_stream
+    self._log_name = log_name
+    self._lines = []
+    self._size = 0
+    self._stream = None
+
+  def write_line(self, line):
+    if self._stream:
+      self._stream.write_line(line)
+      return
+    self._lines.append(line)
+    self._size += len(line) + 1
+    if self._size > self.MAX_BUFFER_SIZE:
+      self.materialize()
+
+  def materialize(self):
+    """Opens the real log stream and writes all buffered lines to it."""
+    if self._stream is None:
+      self._stream = self._step_stream.new_log_stream(self._log_name)
+      for line in self._lines:
+        self._stream.write_line(line)
+      self._lines = []
+
+  def close(self):
+    if self._stream:
+      self._stream.close()
+    self._lines = []
+
+
 class _MemoryProfiler:
   """The memory profiler used in recipe engine that is backed by Pympler.
 
@@ -421,10 +465,13 @@ class RecipeEngine:
       #
       # Otherwise if we open it here, the recipe can run out of file descriptors
       # in the event that it has many, many blocked steps.
+      #
+      # The log is only actually opened on the step if the step doesn't succeed
+      # (or we're debugging); see _LazyLogStream.
       debug_log = None
       try:  # _run_step should never raise an exception, except for GreenletExit
         if GLOBAL_SHUTDOWN.ready():
-          debug_log = step_stream.new_log_stream('$debug')
+          debug_log = _LazyLogStream(step_stream, '$debug')
           debug_log.write_line('GLOBAL_SHUTDOWN already active, skipping step.')
           step_stream.mark_running()   # to set start time, etc.
           raise gevent.GreenletExit()
@@ -433,7 +480,7 @@ class RecipeEngine:
           step_stream.set_summary_markdown(
               'Waiting for resources: `%s`' % (step_config.cost,))
         with self._resource.wait_for(step_config.cost, _if_blocking):
-          debug_log = step_stream.new_log_stream('$debug')
+          debug_log = _LazyLogStream(step_stream, '$debug')
           step_stream.mark_running()
           try:
             self._write_memory_snapshot(
@@ -448,6 +495,9 @@ class RecipeEngine:
         ret.exc_result = attr.evolve(ret.exc_result, was_cancelled=True)
       finally:
         if debug_log:
+          if (ret.presentation.status != 'SUCCESS' or self._memory_profiler or
+              debugger.PROTOCOL or LOG.isEnabledFor(logging.DEBUG)):
+            debug_log.materialize()
           debug_log.close()
 
       ret.finalize()
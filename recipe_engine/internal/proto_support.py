@@ -8,14 +8,18 @@ from __future__ import annotations
 
 import ast
 import errno
+import collections
 import hashlib
 import inspect
+import json
+import multiprocessing
 import os
 import posixpath
 import re
 import shutil
 import sys
 import tempfile
+import time
 
 from typing import Callable
 from io import StringIO
@@ -35,6 +39,26 @@ from .exceptions import BadProtoDefinitions
 
 PROTOC_VERSION = google.protobuf.__version__.encode('utf-8')
 
+# If set to '1', the git blob hashes of .proto files which aren't in the scan
+# manifest yet (e.g. in a fresh checkout) are taken from the git index of their
+# repo, rather than computed, as long as the file is unmodified.
+_GIT_INDEX_ENVVAR = 'RECIPE_PROTO_GIT_INDEX'
+
+# Files modified more recently than this aren't recorded in the scan manifest;
+# another modification within the same mtime tick could otherwise go unnoticed
+# (this is the same as git's "racy clean" problem).
+_RACY_WINDOW_NS = 2 * 10**9
+
+# The name of the file in the PB directory which records the blob hash of the
+# source of every compiled proto, so that later compiles can be incremental.
+_FILE_DIGESTS = 'file_digests.json'
+
+# The minimum number of protos to compile in each protoc invocation.
+_MIN_PROTOC_BATCH = 16
+
+_IMPORT_RE = re.compile(
+    r'^\s*import\s+(public\s+|weak\s+)?"([^"]+)"\s*;', re.MULTILINE)
+
 
 if sys.platform.startswith('win'):
   _BAT = '.bat'
@@ -67,6 +91,105 @@ def _file_checksum(path) -> str:
   return csum.hexdigest()
 
 
+def _git_index_blobhashes(repo_path: str) -> dict[str, str]:
+  """Returns {abspath: git blob hash} for all regular files tracked by git
+  under `repo_path` which are unmodified in the working tree.
+
+  Returns an empty dict if `repo_path` isn't in a git checkout.
+  """
+  git = 'git' + _BAT
+  try:
+    staged = subprocess.check_output(
+        [git, '-C', repo_path, 'ls-files', '--stage', '-z'],
+        stderr=subprocess.DEVNULL)
+    modified = subprocess.check_output(
+        [git, '-C', repo_path, 'diff-files', '--name-only', '--relative',
+         '-z'], stderr=subprocess.DEVNULL)
+  except (OSError, subprocess.CalledProcessError):
+    return {}
+
+  modified = set(modified.decode('utf-8').split('\0'))
+  ret = {}
+  for entry in staged.decode('utf-8').split('\0'):
+    if not entry:
+      continue
+    info, relpath = entry.split('\t', 1)
+    mode, blobhash, stage = info.split(' ')
+    # Skip symlinks, submodules and merge conflicts.
+    if mode not in ('100644', '100755') or stage != '0':
+      continue
+    if relpath not in modified:
+      ret[os.path.normpath(os.path.join(repo_path, relpath))] = blobhash
+  return ret
+
+
+@attr.s
+class _ScanManifest:
+  """Caches the per-file results of scanning repos for protos across engine
+  invocations.
+
+  Each entry is keyed on the absolute path of the file, and is valid as long as
+  the size, mtime and inode of the file are unchanged. The cached value is the
+  git blob hash for .proto files, and the INLINE_PROPERTIES_PROTO (or None) for
+  .py files. When no files changed, gathering protos only needs to stat() every
+  file.
+  """
+  VERSION = 1
+
+  _path: str|None = attr.ib()
+  _old: dict[str, list] = attr.ib(factory=dict)
+  _new: dict[str, list] = attr.ib(factory=dict)
+  _dirty: bool = attr.ib(default=False)
+  _now_ns: int = attr.ib(factory=time.time_ns)
+
+  @classmethod
+  def load(cls, path: str|None) -> _ScanManifest:
+    """Loads the manifest from `path`.
+
+    If `path` is None, returns an empty manifest which is never saved.
+    """
+    ret = cls(path)
+    if path:
+      try:
+        with open(path) as f:
+          data = json.load(f)
+        if data.get('version') == cls.VERSION:
+          ret._old = data['files']
+      except (OSError, ValueError, KeyError):
+        pass
+    return ret
+
+  def lookup(self, path: str, compute: Callable[[], str|None]) -> str|None:
+    """Returns the cached scan result for the file at `path`, or calls
+    `compute()` to get it if the file changed."""
+    st = os.stat(path)
+    stat_key = [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    entry = self._old.get(path)
+    if entry is None or entry[0] != stat_key:
+      entry = [stat_key, compute()]
+      self._dirty = True
+      if st.st_mtime_ns > self._now_ns - _RACY_WINDOW_NS:
+        return entry[1]
+    self._new[path] = entry
+    return entry[1]
+
+  def save(self) -> None:
+    """Writes the manifest back to disk, if anything changed.
+
+    Only the files which were looked up since loading are kept.
+    """
+    if not self._path or not (self._dirty or len(self._new) != len(self._old)):
+      return
+    tmp = f'{self._path}.{os.getpid()}.tmp'
+    try:
+      with open(tmp, 'w') as f:
+        json.dump({'version': self.VERSION, 'files': self._new}, f)
+      os.replace(tmp, self._path)
+    except OSError:
+      pass  # The manifest is only a cache.
+
+
 @attr.s(frozen=True)
 class _ProtoInfo:
   """_ProtoInfo holds information about the proto files found in a recipe repo.
@@ -100,6 +223,7 @@ class _ProtoInfo:
   def create(
       cls, repo: recipe_deps.RecipeRepo, scan_relpath: str,
       dest_namespace: str, relpath: str, synthetic_content: str|None = None,
+      blobhash: str|None = None,
     ) -> _ProtoInfo:
     """Creates a _ProtoInfo.
 
@@ -122,6 +246,7 @@ class _ProtoInfo:
       * synthetic_content - Synthesized content which needs to be written to
         src_abspath when generating. This is deferred until generation to make
         sure that checksum calculation stays a read-only operation.
+      * blobhash - The git blob hash of the proto file, if already known.
 
     Returns a fully populated _ProtoInfo.
     """
@@ -144,7 +269,7 @@ class _ProtoInfo:
 
     if synthetic_content is not None:
       blobhash = _blob_checksum(synthetic_content)
-    else:
+    elif blobhash is None:
       blobhash = _file_checksum(src_abspath)
 
     return cls(src_abspath, relpath, dest_relpath, reserved,
@@ -171,15 +296,17 @@ class _ProtoInfo:
 
   @classmethod
   def inline_create(cls, repo: recipe_deps.RecipeRepo, scan_relpath: str,
-                    dest_namespace: str, relpath: str) -> _ProtoInfo:
-    """Creates a _ProtoInfo from a Python file containing an inline proto."""
-
-    inline_properties_proto: str | None = None
+                    dest_namespace: str, relpath: str,
+                    inline_properties_proto: str | None = None) -> _ProtoInfo:
+    """Creates a _ProtoInfo from a Python file containing an inline proto.
 
+    If `inline_properties_proto` is None, it's read from the Python file.
+    """
     assert relpath.endswith('.py')
     path = posixpath.join(repo.path, relpath)
 
-    inline_properties_proto = cls._find_inline_properties_proto(path)
+    if inline_properties_proto is None:
+      inline_properties_proto = cls._find_inline_properties_proto(path)
 
     assert inline_properties_proto, (
         f'Expected but could not find proto in {path}')
@@ -223,14 +350,37 @@ class _ProtoInfo:
 
 def _gather_proto_info_from_repo(
     repo: recipe_deps.RecipeRepo,
+    manifest: _ScanManifest | None = None,
 ) -> list[_ProtoInfo]:
   """Gathers all protos from the given repo.
 
   Args:
     * repo - The repo to gather all protos from.
+    * manifest - The cache of per-file scan results to use.
 
   Returns List[_ProtoInfo]
   """
+  if manifest is None:
+    manifest = _ScanManifest.load(None)
+
+  git_blobhashes = None
+  def _proto_blobhash(path):
+    nonlocal git_blobhashes
+    if git_blobhashes is None:
+      git_blobhashes = {}
+      if os.environ.get(_GIT_INDEX_ENVVAR) == '1':
+        git_blobhashes = _git_index_blobhashes(repo.path)
+    return git_blobhashes.get(os.path.normpath(path)) or _file_checksum(path)
+
+  def _inline_proto(path):
+    with open(path, 'r', errors='ignore') as ins:
+      contents = ins.read()
+    if not re.search(r'^INLINE_PROPERTIES_PROTO\s*=', contents, re.MULTILINE):
+      return None
+    ret = _ProtoInfo._find_inline_properties_proto(path)
+    assert ret, f'Expected but could not find proto in {path}'
+    return ret
+
   # Tuples of
   #   * fwd-slash path relative to repo.path of where to look for protos.
   #   * fwd-slash namespace prefix of where these protos should go in the global
@@ -264,30 +414,36 @@ def _gather_proto_info_from_repo(
         relname, suffix = os.path.splitext(relpath)
 
         if suffix == '.proto':
+          blobhash = manifest.lookup(path, lambda: _proto_blobhash(path))
           ret.append(
-              _ProtoInfo.create(repo, scan_relpath, dest_namespace, relpath))
+              _ProtoInfo.create(repo, scan_relpath, dest_namespace, relpath,
+                                blobhash=blobhash))
           continue
 
         if suffix == '.py' and not os.path.isfile(f'{relname}.proto'):
-          with open(path, 'r', errors='ignore') as ins:
-            contents = ins.read()
-          if re.search(r'^INLINE_PROPERTIES_PROTO\s*=', contents, re.MULTILINE):
+          inline_proto = manifest.lookup(path, lambda: _inline_proto(path))
+          if inline_proto is not None:
             ret.append(
                 _ProtoInfo.inline_create(repo, scan_relpath, dest_namespace,
-                                         relpath))
+                                         relpath, inline_proto))
           continue
 
-  return sorted(ret)
+  # src_abspath is unique, so this is the same order as sorting by all fields,
+  # without the overhead of the attrs-generated comparison methods.
+  return sorted(ret, key=lambda info: info.src_abspath)
 
 
 def _gather_protos(
     deps: recipe_deps.RecipeDeps,
-) -> tuple[str, list[tuple[str, str]], list[tuple[Path, str]]]:
+    manifest_path: str | None = None,
+) -> tuple[str, list[tuple[str, str]], list[tuple[Path, str]], dict[str, str]]:
   """Gathers all .proto files from all repos, and calculates their collective
   hash.
 
   Args:
     * deps - The loaded recipe dependencies.
+    * manifest_path - If set, the path of the _ScanManifest to use (and
+      update) to avoid re-reading unchanged files.
 
   Returns Tuple[dgst: str, proto_files: List[Tuple[str, str]]]
     * dgst: The 'overall' checksum for all protos which we ought to to have
@@ -298,14 +454,18 @@ def _gather_protos(
     * synthetic_files: a list of abspath + content of synthesized proto files
       which are represented in proto_files, but need to be written to disk
       before compilation.
+    * file_digests: maps the dest_relpath of every proto file to the git blob
+      hash of its content.
 
   Raises BadProtoDefinitions if this finds conflicting or reserved protos.
   """
+  manifest = _ScanManifest.load(manifest_path)
   all_protos: dict[str, list[_ProtoInfo]] = {}
   for repo in deps.repos.values():
-    proto_info = _gather_proto_info_from_repo(repo)
+    proto_info = _gather_proto_info_from_repo(repo, manifest)
     if proto_info:
       all_protos[repo.name] = proto_info
+  manifest.save()
 
   csum = hashlib.sha256()
 
@@ -323,11 +483,12 @@ def _gather_protos(
   reserved: set[str] = set()
   proto_files: list[tuple[str, str]] = []
   synthetic_files: list[tuple[Path, str]] = []
+  file_digests: dict[str, str] = {}
   for repo_name, proto_infos in sorted(all_protos.items()):
     csum.update(repo_name.encode('utf-8'))
     csum.update(b'\0\0')
 
-    for info in sorted(proto_infos):
+    for info in proto_infos:  # already sorted
       duplist = rel_to_projs.setdefault(info.dest_relpath, [])
       duplist.append(repo_name)
       if len(duplist) > 1:
@@ -336,6 +497,7 @@ def _gather_protos(
         reserved.add(info.dest_relpath)
 
       proto_files.append((info.src_abspath, info.dest_relpath))
+      file_digests[info.dest_relpath] = info.blobhash
       if info.synthetic_content is not None:
         synthetic_files.append((Path(info.src_abspath), info.synthetic_content))
 
@@ -365,7 +527,7 @@ def _gather_protos(
 
     raise BadProtoDefinitions(msg)
 
-  return csum.hexdigest(), proto_files, synthetic_files
+  return csum.hexdigest(), proto_files, synthetic_files, file_digests
 
 
 @attr.s
@@ -568,63 +730,164 @@ def _rel_to_abs_replacer(
 
 
 def _collect_protos(
-    argfile_fd: int,
     proto_files: list[tuple[str, str]],
     dest: str,
 ) -> None:
   """Copies all proto_files into dest.
 
-  Writes this list of files to `argfile_fd` which will be passed to protoc.
-
   Args:
-    * argfile_fd: An open writable file descriptor for the argfile.
     * proto_files (List[Tuple[src_abspath: str, dest_relpath: str]])
     * dest: Path to the directory where we should collect the .proto
     files.
+  """
+  _makedirs = _DirMaker()
+  for src_abspath, dest_relpath in proto_files:
+    destpath = os.path.join(dest, dest_relpath)
+    _makedirs(os.path.dirname(destpath))
+    shutil.copyfile(src_abspath, destpath)
 
-  Side-effects:
-    * Each dest_relpath is written to `argfile_fd` on its own line.
-    * Closes `argfile_fd`.
+
+def _compiler_key() -> str:
+  """Returns a value which changes whenever the compiled output of an unchanged
+  proto file may change."""
+  return '%s:%s' % (_file_checksum(__file__), PROTOC_VERSION.decode('utf-8'))
+
+
+def _outputs(dest_relpath: str) -> list[str]:
+  """Returns the relative paths of the files generated for a .proto file."""
+  # This mirrors how protoc derives python module names from .proto paths
+  # (e.g. 'go.chromium.org/a-b.proto' -> 'go/chromium/org/a_b_pb2.py'), minus
+  # the '_pb2' suffix which _rewrite_and_rename drops.
+  base = posixpath.splitext(dest_relpath)[0].replace('-', '_').replace('.', '/')
+  return [base + '.py', base + '.pyi']
+
+
+def _reuse_compiled(old_pb: str, proto_tree: str, file_digests: dict[str, str],
+                    dest: str) -> set[str]:
+  """Copies the compiled output of all protos which are unaffected by the
+  changes since `old_pb` was compiled into `dest`.
+
+  A proto is affected if it changed, or if it imports a proto which was added,
+  changed or removed; the generated code (and type stubs) of a proto depend on
+  the types it imports. Protos which `import public` a changed proto count as
+  changed themselves, since they re-export its types.
+
+  Args:
+    * old_pb: Path to the currently installed PB directory.
+    * proto_tree: Path to the directory with all the collected .proto files.
+    * file_digests: Maps dest_relpath to blob hash for every proto to install.
+    * dest: Path to the destination where the compiled protos should go.
+
+  Returns the set of dest_relpaths which still need to be compiled.
   """
+  everything = set(file_digests)
   try:
-    _makedirs = _DirMaker()
-    for src_abspath, dest_relpath in proto_files:
-      destpath = os.path.join(dest, dest_relpath)
+    with open(os.path.join(old_pb, _FILE_DIGESTS)) as ins:
+      data = json.load(ins)
+    if data['compiler'] != _compiler_key():
+      return everything
+    old_digests = data['files']
+  except (OSError, ValueError, KeyError):
+    return everything
+
+  changed = {rel for rel, blobhash in file_digests.items()
+             if old_digests.get(rel) != blobhash}
+  changed.update(set(old_digests) - everything)
+
+  importers = collections.defaultdict(set)
+  public_importers = collections.defaultdict(set)
+  for rel in file_digests:
+    with open(os.path.join(proto_tree, rel), encoding='utf-8',
+              errors='ignore') as ins:
+      for modifier, imported in _IMPORT_RE.findall(ins.read()):
+        importers[imported].add(rel)
+        if modifier.strip() == 'public':
+          public_importers[imported].add(rel)
+
+  stack = list(changed)
+  while stack:
+    for importer in public_importers[stack.pop()]:
+      if importer not in changed:
+        changed.add(importer)
+        stack.append(importer)
+
+  to_compile = changed & everything
+  for rel in changed:
+    to_compile.update(importers[rel])
+
+  _makedirs = _DirMaker()
+  for rel in sorted(everything - to_compile):
+    outputs = _outputs(rel)
+    if not all(os.path.isfile(os.path.join(old_pb, out)) for out in outputs):
+      to_compile.add(rel)
+      continue
+    for out in outputs:
+      destpath = os.path.join(dest, out)
       _makedirs(os.path.dirname(destpath))
-      shutil.copyfile(src_abspath, destpath)
-      os.write(argfile_fd, dest_relpath.encode('utf-8'))
-      os.write(argfile_fd, b'\n')
-  finally:
-    os.close(argfile_fd)  # for windows
+      try:
+        os.link(os.path.join(old_pb, out), destpath)
+      except OSError:
+        shutil.copyfile(os.path.join(old_pb, out), destpath)
+  return to_compile
 
 
 def _compile_protos(proto_files: list[tuple[str, str]], proto_tree: str,
-                    protoc: str, argfile: str, dest: str) -> None:
+                    protoc: str, to_compile: list[str], tmp_base: str,
+                    dest: str) -> None:
   """Runs protoc over the collected protos, renames them and rewrites their
   imports to make them import from `PB`.
 
+  The protos are compiled in batches by concurrent protoc processes.
+
   Args:
     * proto_files: Protobuf files.
     * proto_tree: Path to the directory with all the collected .proto
       files.
     * protoc: Path to the protoc binary to use.
-    * argfile: Path to a protoc argfile containing a relative path to
-      every .proto file in proto_tree on its own line.
+    * to_compile: The relative paths (in proto_tree) of the .proto files to
+      compile.
+    * tmp_base: Path to a directory for temporary files.
     * dest: Path to the destination where the compiled protos should go.
   """
-  protoc_proc = subprocess.Popen(
-      [protoc, '--python_out', dest, '--pyi_out', dest, '@'+argfile],
-      cwd=proto_tree, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-  output, _ = protoc_proc.communicate()
-  try:
-    os.remove(argfile)
-  except:
-    pass
-
-  if protoc_proc.returncode != 0:
+  def _run_protoc(batches):
+    procs = []
+    for batch in batches:
+      argfile_fd, argfile = tempfile.mkstemp(dir=tmp_base)
+      try:
+        for dest_relpath in batch:
+          os.write(argfile_fd, dest_relpath.encode('utf-8'))
+          os.write(argfile_fd, b'\n')
+      finally:
+        os.close(argfile_fd)  # for windows
+      procs.append((argfile, subprocess.Popen(
+          [protoc, '--python_out', dest, '--pyi_out', dest, '@'+argfile],
+          cwd=proto_tree, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)))
+
+    failed_output = []
+    for argfile, protoc_proc in procs:
+      output, _ = protoc_proc.communicate()
+      try:
+        os.remove(argfile)
+      except:
+        pass
+      if protoc_proc.returncode != 0:
+        failed_output.append(output.decode('utf-8'))
+    return failed_output
+
+  num_batches = max(1, min(multiprocessing.cpu_count(),
+                           len(to_compile) // _MIN_PROTOC_BATCH))
+  failed_output = _run_protoc(
+      [to_compile[i::num_batches] for i in range(num_batches)])
+  if failed_output and num_batches > 1:
+    # Get the errors from a single protoc invocation, so that they're the same
+    # regardless of how the protos were batched.
+    failed_output = _run_protoc([to_compile])
+
+  if failed_output:
     replacer = _rel_to_abs_replacer(proto_files)
     print("Error while compiling protobufs. Output:\n", file=sys.stderr)
-    sys.stderr.write(replacer(output.decode('utf-8')))
+    for output in failed_output:
+      sys.stderr.write(replacer(output))
     sys.exit(1)
 
   rewrite_errors = []
@@ -648,9 +911,13 @@ def _compile_protos(proto_files: list[tuple[str, str]], proto_tree: str,
 
 
 def _install_protos(proto_package_path: str, dgst: str,
-                    proto_files: list[tuple[str, str]]) -> None:
+                    proto_files: list[tuple[str, str]],
+                    file_digests: dict[str, str]) -> None:
   """Installs protos to `{proto_package_path}/PB`.
 
+  Only the protos affected by changes since the currently installed PB was
+  compiled are recompiled; everything else is reused from the current PB.
+
   Args:
     * proto_package_path - The absolute path to the folder where:
       * We should install protoc as '.../protoc/...'
@@ -659,6 +926,7 @@ def _install_protos(proto_package_path: str, dgst: str,
     * dgst - The hexadecimal (lowercase) checksum for the protos we're
       about to install.
     * proto_files: Protobuf files.
+    * file_digests: Maps dest_relpath to blob hash for every proto file.
 
   Side-effects:
     * Ensures that `{proto_package_path}/PB` exists and is the correct
@@ -688,15 +956,20 @@ def _install_protos(proto_package_path: str, dgst: str,
   _DirMaker()(tmp_base)
   proto_tree = tempfile.mkdtemp(dir=tmp_base, prefix='proto_')
   pb_temp = tempfile.mkdtemp(dir=tmp_base, prefix='pb.py_')
-  argfile_fd, argfile = tempfile.mkstemp(dir=tmp_base)
-  _collect_protos(argfile_fd, proto_files, proto_tree)
+  _collect_protos(proto_files, proto_tree)
 
-  protoc = os.path.join(proto_package_path, 'protoc', 'bin', 'protoc')
-  _compile_protos(proto_files, proto_tree, protoc, argfile, pb_temp)
+  dest = os.path.join(proto_package_path, 'PB')
+  to_compile = _reuse_compiled(dest, proto_tree, file_digests, pb_temp)
+  if to_compile:
+    protoc = os.path.join(proto_package_path, 'protoc', 'bin', 'protoc')
+    _compile_protos(proto_files, proto_tree, protoc,
+                    [rel for _, rel in proto_files if rel in to_compile],
+                    tmp_base, pb_temp)
+  with open(os.path.join(pb_temp, _FILE_DIGESTS), 'w') as digests_f:
+    json.dump({'compiler': _compiler_key(), 'files': file_digests}, digests_f)
   with open(os.path.join(pb_temp, 'csum'), 'w') as csum_f:
     csum_f.write(dgst)
 
-  dest = os.path.join(proto_package_path, 'PB')
   # Check the digest again, in case another engine beat us to the punch.
   # This is still racy, but it makes the window substantially smaller.
   if not _check_digest(proto_package_path, dgst):
@@ -748,7 +1021,8 @@ def ensure_compiled(deps: recipe_deps.RecipeDeps,
     proto_package = os.path.join(deps.recipe_deps_path, '_pb3')
     _DirMaker()(proto_package)
 
-    dgst, proto_files, synthetic_files = _gather_protos(deps)
+    dgst, proto_files, synthetic_files, file_digests = _gather_protos(
+        deps, os.path.join(proto_package, 'scan_manifest.json'))
 
     # If the digest already matches, we're done
     if not _check_digest(proto_package, dgst):
@@ -759,7 +1033,7 @@ def ensure_compiled(deps: recipe_deps.RecipeDeps,
 
       # Otherwise, try to compile
       try:
-        _install_protos(proto_package, dgst, proto_files)
+        _install_protos(proto_package, dgst, proto_files, file_digests)
       except:  # pylint: disable=bare-except
         # If some other recipe engine compiled at the same time as us, it may
         # have broken our compilation (e.g. if the other engine cleared tmp out
@@ -68,7 +68,7 @@ from . import fetch
 from . import proto_support
 from . import dev_support
 
-from .attr_util import attr_type, attr_value_is, attr_superclass, attr_dict_type
+from .attr_util import attr_type, attr_value_is, attr_dict_type
 from .exceptions import CyclicalDependencyError, UnknownRecipe, UnknownRepoName
 from .exceptions import RecipeLoadError, RecipeSyntaxError, MalformedRecipeError
 from .exceptions import MalformedModuleError, UnknownRecipeModule
@@ -137,11 +137,27 @@ class RecipeDeps:
     """Returns the location of the .recipe_deps/_pb3 directory."""
     return os.path.join(self.recipe_deps_path, '_pb3')
 
+  @cached_property
+  def doc_cache_path(self) -> str:
+    """Returns the location of the cache of parsed module and recipe docs."""
+    return os.path.join(self.recipe_deps_path, 'doc_cache')
+
   @cached_property
   def previous_test_failures_path(self) -> str:
     """Returns the location of the .previous_failures file."""
     return os.path.join(self.recipe_deps_path, '.previous_test_failures')
 
+  @cached_property
+  def deps_index_path(self) -> str:
+    """Returns the location of the cached DEPS index used by `analyze` and
+    `test --changed-since`."""
+    return os.path.join(self.recipe_deps_path, 'deps_index.json')
+
+  @cached_property
+  def test_result_cache_path(self) -> str:
+    """Returns the location of the cache of passing simulation test results."""
+    return os.path.join(self.recipe_deps_path, 'test_result_cache')
+
   @cached_property
   def warning_definitions(self) -> dict[str, warn_def.Definition]:
     """Returns warning definitions for all repos in this RecipeDeps.
@@ -909,20 +925,16 @@ class Recipe:
     Yields all TestData fixtures for this recipe. Fills in the .expect_file
     property on each with an absolute path to the expectation file.
     """
-    resolved_deps = _resolve(self.repo.recipe_deps, self.normalized_TEST_DEPS,
-                             'TEST_API', None, None)
-    filtered_deps = {
-        local_name: resolved_dep
-        for local_name, resolved_dep in resolved_deps.items()
-        if resolved_dep is not None
-    }
+    resolved_deps = _ModuleGraph(
+        self.repo.recipe_deps,
+        self.normalized_TEST_DEPS).instantiate_test_apis()
 
     test_deps_cls = self.global_symbols.get('TEST_DEPS')
     if dataclasses.is_dataclass(test_deps_cls):
-      api = test_deps_cls(**filtered_deps)
+      api = test_deps_cls(**resolved_deps)
     else:
       api = RecipeTestApi(module=None)
-      api.__dict__.update(filtered_deps)
+      api.__dict__.update(resolved_deps)
 
     for test_data in self.global_symbols['GenTests'](api):
       test_data.expect_file = os.path.join(
@@ -956,6 +968,15 @@ class Recipe:
         self.repo.name, test_deps_spec, self.global_symbols, source=self.path)
 
 
+  @cached_property
+  def module_graph(self) -> _ModuleGraph:
+    """The resolved graph of the recipe modules in this recipe's DEPS closure.
+
+    This is resolved once, and then used by mk_api to instantiate the modules
+    for each run (e.g. each test case) of the recipe.
+    """
+    return _ModuleGraph(self.repo.recipe_deps, self.normalized_DEPS)
+
   def mk_api(self, engine: RecipeEngine,
              test_data: RecipeTestData | None = None) -> RecipeScriptApi:
     """Makes a RecipeScriptApi, suitable for use with run_steps.
@@ -967,8 +988,7 @@ class Recipe:
     """
     test_data = test_data or DisabledTestData()
 
-    resolved_deps = _resolve(
-      self.repo.recipe_deps, self.normalized_DEPS, 'API', engine, test_data)
+    deps = self.module_graph.instantiate(engine, test_data)
     for _, (warning, importer) in enumerate(_collect_import_warnings(self)):
       from .warn import record
       record.GLOBAL.record_import_warning(warning, importer)
@@ -978,7 +998,6 @@ class Recipe:
         ResolvedBasePath.for_recipe_script_resources(test_data.enabled, self))
     repo_path = Path(
         ResolvedBasePath.for_bundled_repo(test_data.enabled, self.repo))
-    deps = {k: v for k, v in resolved_deps.items() if v is not None}
 
     deps_cls = self.global_symbols.get('DEPS')
     if dataclasses.is_dataclass(deps_cls):
@@ -1178,32 +1197,26 @@ def _collect_import_warnings(
 
 
 def _instantiate_test_api(module: RecipeModule,
-                          resolved_deps: dict[str, RecipeTestApi | None]) -> RecipeTestApi:
+                          resolved_deps: dict[str, RecipeTestApi]) -> RecipeTestApi:
   """Instantiates the RecipeTestApi class from the given imported recipe module.
 
   Args:
-    * resolved_deps ({local_name: None|instantiated recipe test api}) - The
-      resolved RecipeTestApi instances which this module has in its DEPS. Deps
-      whose value is None will be omitted. These deps will all be populated on
-      `retval.m` (the ModuleInjectionSite).
+    * resolved_deps ({local_name: instantiated recipe test api}) - The
+      resolved RecipeTestApi instances which this module has in its DEPS. These
+      deps will all be populated on `retval.m` (the ModuleInjectionSite).
 
   Returns the instantiated RecipeTestApi subclass.
   """
   inst = module.TEST_API(module)
   assert isinstance(inst, RecipeTestApi)
-  inst.m.__dict__.update({
-    local_name: resolved_dep
-    for local_name, resolved_dep in resolved_deps.items()
-    if resolved_dep is not None
-  })
+  inst.m.__dict__.update(resolved_deps)
   setattr(inst.m, module.name, inst)
   return inst
 
 
 def _instantiate_api(engine: RecipeEngine, test_data: RecipeTestData,
-                     fqname: str, module: RecipeModule,
-                     test_api: RecipeTestApi,
-                     resolved_deps: dict[str, RecipeApi | None]) -> RecipeApi:
+                     node: _ModuleNode, test_api: RecipeTestApi,
+                     resolved_deps: dict[str, RecipeApi]) -> RecipeApi:
   """Instantiates the RecipeApi subclass from the given imported recipe
   module.
 
@@ -1211,17 +1224,16 @@ def _instantiate_api(engine: RecipeEngine, test_data: RecipeTestData,
     * engine (run.RecipeEngine) - The recipe engine we're going to use to run
       the recipe.
     * test_data (TestData) - The test data for this run.
-    * fqname (string) - The fully qualified 'repo_name/module_name' of the
-      module we're instantiating.
+    * node (_ModuleNode) - The module we're instantiating.
     * test_api (RecipeTestApi) - The instantiated recipe test api object for
       this module.
-    * resolved_deps ({local_name: None|instantiated recipe api}) - The resolved
-      RecipeApi instances which this module has in its DEPS. Deps whose
-      value is None will be omitted. These deps will all be populated on
-      `retval.m` (the ModuleInjectionSite).
+    * resolved_deps ({local_name: instantiated recipe api}) - The resolved
+      RecipeApi instances which this module has in its DEPS. These deps will
+      all be populated on `retval.m` (the ModuleInjectionSite).
 
   Returns the instantiated RecipeApi subclass.
   """
+  module = node.module
   shortname = module.name
   kwargs = {
       'module': module,
@@ -1229,29 +1241,17 @@ def _instantiate_api(engine: RecipeEngine, test_data: RecipeTestData,
       'test_data': test_data.get_module_test_data(shortname)
   }
 
-  imported_module = module.do_import()
+  properties_def, global_properties_def, env_properties_def = (
+      node.properties_defs)
 
-  properties_def = module.PROPERTIES
-  global_properties_def = getattr(imported_module, 'GLOBAL_PROPERTIES', None)
-  env_properties_def = getattr(imported_module, 'ENV_PROPERTIES', None)
-
-  if properties_def and (env_properties_def or global_properties_def):
-    if not proto_support.is_message_class(properties_def):
-      raise ValueError(
-          'Recipe has ENV_PROPERTIES/GLOBAL_PROPERTIES with old-style '
-          'PROPERTIES. Use a proto message for all, or use the old-style '
-          'envvar support.')
-
-  if (proto_support.is_message_class(properties_def)
-      or env_properties_def
-      or global_properties_def):
+  if node.legacy_arg_names is None:
     # New-style Protobuf PROPERTIES.
     args = []
 
     # TODO(iannucci): deduplicate this with recipe invocation code.
     if properties_def:
       args.append(jsonpb.ParseDict(
-          engine.properties.get('$' + fqname, {}),
+          engine.properties.get('$' + node.fqname, {}),
           properties_def(),
           ignore_unknown_fields=True))
 
@@ -1275,9 +1275,10 @@ def _instantiate_api(engine: RecipeEngine, test_data: RecipeTestData,
   else:
     # Old-style Property dict.
     # NOTE: late import to avoid early protobuf import
-    from .property_invoker import invoke_with_properties
-    inst = invoke_with_properties(module.API, engine.properties,
-                                  engine.environ, properties_def, **kwargs)
+    from .property_invoker import _invoke_with_properties
+    inst = _invoke_with_properties(module.API, engine.properties,
+                                   engine.environ, properties_def,
+                                   node.legacy_arg_names, **kwargs)
 
   inst.test_api = test_api
 
@@ -1291,101 +1292,173 @@ def _instantiate_api(engine: RecipeEngine, test_data: RecipeTestData,
 
   # Replace class-level Requirements placeholders in the recipe API with
   # their instance-level real values.
-  for k, v in module.API.__dict__.items():
-    if isinstance(v, UnresolvedRequirement):
-      setattr(inst, k, engine.resolve_requirement(v))
+  for k, v in node.requirements:
+    setattr(inst, k, engine.resolve_requirement(v))
 
   inst.initialize()
   return inst
 
 
-def _resolve(recipe_deps: RecipeDeps, deps_spec: dict[str, tuple[str, str]],
-             variant: str, engine: RecipeEngine | None,
-             test_data: RecipeTestData | None) -> dict[str, RecipeApi | RecipeTestApi | None]:
-  """Resolves a deps_spec to a map of {local_name: api instance}
+class _ModuleNode:
+  """A recipe module in a _ModuleGraph.
 
-  Args:
-    * recipe_deps (RecipeDeps) - The loaded dependency repos.
-    * deps_spec (list|dict) - The normalized DEPS specification as provided by
-      the recipe/module.
-    * variant ('API'|'TEST_API') - Which variant of the dependencies to load.
-    * engine (None|run.RecipeEngine) - The recipe engine which will be used to
-      drive the recipe. Must be None if variant == 'TEST_API'.
-    * test_data (None|TestData) - The test data which will be used for the
-      recipe run. Must be None if variant == 'TEST_API'.
-
-  Returns {'local_name': loaded api instance}.
+  Also holds everything needed to instantiate the module's RecipeApi which
+  doesn't depend on the engine or test data, so that it's only worked out once.
   """
-  assert variant in ('API', 'TEST_API')
-  if variant == 'TEST_API':
-    assert engine is None
-    assert test_data is None
-  else:
+
+  def __init__(self, module: RecipeModule, deps: list[tuple[str, int]]):
+    self.module = module
+    # The fully qualified 'repo_name/module_name' of the module.
+    self.fqname = '%s/%s' % (module.repo.name, module.name)
+    # [(local_name, index of the dependency in _ModuleGraph.nodes)]
+    self.deps = deps
+
+  @cached_property
+  def properties_defs(self) -> tuple[object, object, object]:
+    """Returns the (PROPERTIES, GLOBAL_PROPERTIES, ENV_PROPERTIES) of the
+    module."""
+    imported_module = self.module.do_import()
+
+    properties_def = self.module.PROPERTIES
+    global_properties_def = getattr(imported_module, 'GLOBAL_PROPERTIES', None)
+    env_properties_def = getattr(imported_module, 'ENV_PROPERTIES', None)
+
+    if properties_def and (env_properties_def or global_properties_def):
+      if not proto_support.is_message_class(properties_def):
+        raise ValueError(
+            'Recipe has ENV_PROPERTIES/GLOBAL_PROPERTIES with old-style '
+            'PROPERTIES. Use a proto message for all, or use the old-style '
+            'envvar support.')
+
+    return properties_def, global_properties_def, env_properties_def
+
+  @cached_property
+  def legacy_arg_names(self) -> list[str] | None:
+    """Returns the argument names of the module's RecipeApi constructor if it
+    uses old-style Property dicts, or None if it uses protobuf properties."""
+    properties_def, global_properties_def, env_properties_def = (
+        self.properties_defs)
+    if (proto_support.is_message_class(properties_def)
+        or env_properties_def
+        or global_properties_def):
+      return None
+    arg_names = inspect.getfullargspec(self.module.API.__init__).args
+    arg_names.pop(0)  # 'self'
+    return arg_names
+
+  @cached_property
+  def requirements(self) -> list[tuple[str, UnresolvedRequirement]]:
+    """Returns the class-level Requirements placeholders of the module's
+    RecipeApi as (attribute name, UnresolvedRequirement) tuples."""
+    return [
+        (k, v) for k, v in self.module.API.__dict__.items()
+        if isinstance(v, UnresolvedRequirement)
+    ]
+
+
+class _ModuleGraph:
+  """The resolved dependency graph of a DEPS specification.
+
+  This is a template from which the recipe modules in the spec (and their
+  transitive DEPS) can be instantiated; resolving the graph and inspecting each
+  module happens once, and each instantiation (e.g. for every simulation test
+  case of a recipe) only constructs the RecipeApi and RecipeTestApi objects.
+  """
+
+  def __init__(self, recipe_deps: RecipeDeps,
+               deps_spec: dict[str, tuple[str, str]]):
+    """
+    Args:
+      * recipe_deps (RecipeDeps) - The loaded dependency repos.
+      * deps_spec (dict) - The normalized DEPS specification as provided by
+        the recipe/module.
+
+    Raises CyclicalDependencyError if a module depends on itself.
+    """
+    # All modules in the graph; every module comes after all of its DEPS, and
+    # they are instantiated in this order.
+    self.nodes: list[_ModuleNode] = []
+    # map of (repo_name, module_name) -> index in self.nodes, or None while
+    # its DEPS are being resolved.
+    indices = {}
+
+    def _visit(key, loading_chain):
+      if key in indices:
+        idx = indices[key]
+        if idx is None:
+          first = loading_chain.index(key)
+          raise CyclicalDependencyError(
+            '%r has a cyclical dependency. Loading chain %r.' %
+            ('%s/%s' % key, loading_chain[first:]))
+        return idx
+      indices[key] = None
+      loading_chain = loading_chain + [key]
+
+      module = recipe_deps.repos[key[0]].modules[key[1]]
+      deps = [
+          (local_name, _visit(dep_key, loading_chain))
+          for local_name, dep_key in module.normalized_DEPS.items()
+      ]
+
+      indices[key] = len(self.nodes)
+      self.nodes.append(_ModuleNode(module, deps))
+      return indices[key]
+
+    # [(local_name, index in self.nodes)] of the modules in `deps_spec`.
+    self.deps = [
+        (local_name, _visit(key, []))
+        for local_name, key in deps_spec.items()
+    ]
+
+    # Always instantiate the path module at least once so that string functions
+    # on Path objects work. This extra load doesn't actually attach the loaded
+    # path module to the api return, so if recipes want to use the path module,
+    # they still need to import it. If the recipe already loaded the path module
+    # (somewhere, could be transitively), then this extra load is a no-op.
+    # TODO(iannucci): The way paths work need to be reimplemented sanely :/
+    _visit(('recipe_engine', 'path'), [])
+
+  def instantiate_test_apis(self) -> dict[str, RecipeTestApi]:
+    """Instantiates the RecipeTestApi of every module in the graph.
+
+    Returns {'local_name': RecipeTestApi instance} for the DEPS specification.
+    """
+    test_apis = []
+    for node in self.nodes:
+      test_apis.append(_instantiate_test_api(node.module, {
+          local_name: test_apis[idx] for local_name, idx in node.deps
+      }))
+    return {local_name: test_apis[idx] for local_name, idx in self.deps}
+
+  def instantiate(self, engine: RecipeEngine,
+                  test_data: RecipeTestData) -> dict[str, RecipeApi]:
+    """Instantiates the RecipeApi (and RecipeTestApi) of every module in the
+    graph.
+
+    Args:
+      * engine (run.RecipeEngine) - The recipe engine which will be used to
+        drive the recipe.
+      * test_data (TestData) - The test data which will be used for the recipe
+        run.
+
+    Returns {'local_name': RecipeApi instance} for the DEPS specification.
+    """
     # NOTE: late import to avoid import cycle
     # NOTE: late import to avoid early protobuf import
     from .engine import RecipeEngine
     assert isinstance(engine, RecipeEngine)
     assert isinstance(test_data, BaseTestData)
 
-  @attr.s(frozen=True)
-  class cache_entry:
-    api = attr.ib(validator=optional(attr_superclass(RecipeApi)))
-    test_api = attr.ib(validator=attr_superclass(RecipeTestApi))
-
-    def pick(self):
-      return self.api if variant == 'API' else self.test_api
-
-  # map of (repo_name, module_name) -> cache_entry
-  instance_cache = {}
-
-  def _inner(repo_name, module_name, loading_chain):
-    key = (repo_name, module_name)
-    if key in instance_cache:
-      cached = instance_cache[key]
-      if cached is None:
-        first = loading_chain.index(key)
-        raise CyclicalDependencyError(
-          '%r has a cyclical dependency. Loading chain %r.' %
-          ('%s/%s' % key, loading_chain[first:]))
-      return cached
-    instance_cache[key] = None
-    loading_chain += [key]
-
-    module = recipe_deps.repos[repo_name].modules[module_name]
-    deps_spec = module.normalized_DEPS
-
-    test_api = _instantiate_test_api(
-        module, {
-            local_name: _inner(d_repo_name, d_module, loading_chain).test_api
-            for local_name, (d_repo_name, d_module) in deps_spec.items()
-        })
-
-    fqname = '%s/%s' % (repo_name, module_name)
-    api = None
-    if variant == 'API':
-      api = _instantiate_api(
-          engine, test_data, fqname, module, test_api, {
-              local_name: _inner(d_repo_name, d_module, loading_chain).api
-              for local_name, (d_repo_name, d_module) in deps_spec.items()
-          })
-
-    result = cache_entry(api, test_api)
-
-    instance_cache[key] = result
-    return result
-
-  ret = {
-    local_name: _inner(d_repo_name, d_module, []).pick()
-    for local_name, (d_repo_name, d_module)
-    in deps_spec.items()
-  }
-
-  # Always instantiate the path module at least once so that string functions on
-  # Path objects work. This extra load doesn't actually attach the loaded path
-  # module to the api return, so if recipes want to use the path module, they
-  # still need to import it. If the recipe already loaded the path module
-  # (somewhere, could be transitively), then this extra load is a no-op.
-  # TODO(iannucci): The way paths work need to be reimplemented sanely :/
-  _inner('recipe_engine', 'path', [])
-
-  return ret
+    # Test APIs are instantiated for every run, rather than once with the
+    # graph, because some of them keep state (e.g. counters for fake IDs).
+    test_apis = []
+    apis = []
+    for node in self.nodes:
+      test_api = _instantiate_test_api(node.module, {
+          local_name: test_apis[idx] for local_name, idx in node.deps
+      })
+      test_apis.append(test_api)
+      apis.append(_instantiate_api(engine, test_data, node, test_api, {
+          local_name: apis[idx] for local_name, idx in node.deps
+      }))
+    return {local_name: apis[idx] for local_name, idx in self.deps}
@@ -132,14 +132,17 @@ class SimulationStepRunner(StepRunner):
     # TODO(iannucci): Rationalize these:
     #   * use step.env instead of precursor
     #   * Always omit empty fields (right now cmd is kept)
-    step_obj = attr.asdict(
-        step, filter=lambda attr, value: bool(value))
-    step_obj['name'] = dot_name
-    if 'cmd' not in step_obj:
-      step_obj['cmd'] = []
+    #
+    # This is built directly (rather than with attr.asdict) as it's done for
+    # every step of every test; stdout/stderr are never part of the
+    # expectation, and env comes from the precursor data below.
+    step_obj = {'name': dot_name, 'cmd': list(step.cmd)}
+    if step.cwd:
+      step_obj['cwd'] = step.cwd
+    if step.stdin:
+      step_obj['stdin'] = step.stdin
     precursor = self._step_precursor_data[dot_name]
 
-    step_obj.pop('luci_context', None)
     if step.luci_context:
       lctx = {}
       for name, section in step.luci_context.items():
@@ -159,8 +162,6 @@ class SimulationStepRunner(StepRunner):
       if lctx:
         step_obj['luci_context'] = lctx
 
-    for handle_name in ('stdout', 'stderr'):
-      step_obj.pop(handle_name, None)
     if 'cost' in precursor:
       if precursor['cost'] is None:
         step_obj['cost'] = None
@@ -176,8 +177,6 @@ class SimulationStepRunner(StepRunner):
         k: (v if v is None else v % fake_env)
         for k, v in precursor['env'].items()
       }
-    else:
-      step_obj.pop('env', None)
     if precursor['infra_step']:
       step_obj['infra_step'] = True
     if precursor['allow_subannotations']:
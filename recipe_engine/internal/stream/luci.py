@@ -3,8 +3,11 @@
 # Use of this source code is governed under the Apache License, Version 2.0
 # that can be found in the LICENSE file.
 
+import functools
 import json
 import logging
+import struct
+import time
 import traceback
 import zlib
 
@@ -380,6 +383,146 @@ class LUCIStepStream(StreamEngine.StepStream):
     self._change_cb()
 
 
+# The number of consecutive steps whose encoding is cached (and recomputed) as
+# a unit by _BuildEncoder. Larger groups compress better, smaller groups make
+# an update to a single step cheaper.
+_STEP_GROUP_SIZE = 64
+
+# The interval between two sends of the Build message is at least
+# _MIN_SEND_INTERVAL seconds and at most _MAX_SEND_INTERVAL seconds. Within
+# these limits, it is _SEND_COST_FACTOR times the time it took to encode the
+# previous Build message, so that encoding takes a bounded fraction of the
+# engine's CPU time.
+_MIN_SEND_INTERVAL = 1.0
+_MAX_SEND_INTERVAL = 10.0
+_SEND_COST_FACTOR = 20
+
+_ADLER_BASE = 65521
+
+
+def _varint(value):
+  ret = bytearray()
+  while value > 0x7f:
+    ret.append((value & 0x7f) | 0x80)
+    value >>= 7
+  ret.append(value)
+  return bytes(ret)
+
+
+def _adler32_combine(adler1, adler2, len2):
+  """Returns the adler32 of A+B given adler32(A), adler32(B) and len(B).
+
+  This is zlib's adler32_combine, which isn't exposed by python's zlib module.
+  """
+  rem = len2 % _ADLER_BASE
+  sum1 = adler1 & 0xffff
+  sum2 = (rem * sum1) % _ADLER_BASE
+  sum1 += (adler2 & 0xffff) + _ADLER_BASE - 1
+  sum2 += (adler1 >> 16) + (adler2 >> 16) + _ADLER_BASE - rem
+  return (sum1 % _ADLER_BASE) | ((sum2 % _ADLER_BASE) << 16)
+
+
+@attr.s(slots=True, frozen=True)
+class _DeflatedChunk:
+  """A piece of the serialized Build message, deflated independently of all
+  other pieces."""
+  raw_len = attr.ib()
+  adler = attr.ib()
+  data = attr.ib()
+
+  @classmethod
+  def create(cls, raw):
+    comp = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    # Z_FULL_FLUSH ends the output on a byte boundary and doesn't let later
+    # data refer back to this chunk, so chunks can be concatenated in any
+    # combination.
+    return cls(len(raw), zlib.adler32(raw),
+               comp.compress(raw) + comp.flush(zlib.Z_FULL_FLUSH))
+
+
+class _BuildEncoder:
+  """Encodes the Build message as a zlib-compressed binary proto.
+
+  Unlike `zlib.compress(build.SerializeToString())`, re-encoding the Build
+  after a change to a few of its steps only costs as much as serializing and
+  compressing those steps (plus all the Build fields other than `steps`). This
+  relies on two properties of the formats involved:
+
+    * A serialized message with a repeated field is the concatenation of its
+      other fields and the encodings of the field's elements, in any order.
+    * A zlib stream is a header, any sequence of deflate blocks and the
+      adler32 of the uncompressed data (which can be computed from the
+      adler32s of its pieces).
+
+  The steps are encoded in groups of _STEP_GROUP_SIZE. Every change to a step
+  must be reported with `step_changed`; steps which are changed without this
+  (e.g. through `current_build_proto`) are picked up by `invalidate`.
+  """
+
+  _ZLIB_HEADER = b'\x78\x9c'
+  # A final, empty, fixed-huffman deflate block.
+  _ZLIB_FINAL_BLOCK = b'\x03\x00'
+
+  def __init__(self, build):
+    self._build = build
+    self._steps_tag = _varint(
+        Build.DESCRIPTOR.fields_by_name['steps'].number << 3 | 2)
+    self._groups = []
+    self._dirty = set()
+
+  def step_changed(self, index):
+    self._dirty.add(index // _STEP_GROUP_SIZE)
+
+  def invalidate(self):
+    self._groups = []
+    self._dirty = set()
+
+  def _header(self):
+    """Returns the serialized Build message without its steps."""
+    ret = Build()
+    for field, value in self._build.ListFields():
+      if field.name == 'steps':
+        continue
+      target = getattr(ret, field.name)
+      if field.message_type and field.message_type.GetOptions().map_entry:
+        target.update(value)
+      elif field.is_repeated:
+        target.extend(value)
+      elif field.message_type:
+        target.CopyFrom(value)
+      else:
+        setattr(ret, field.name, value)
+    return ret.SerializeToString()
+
+  def _encode_group(self, index):
+    tag = self._steps_tag
+    return _DeflatedChunk.create(b''.join(
+        tag + _varint(len(data)) + data
+        for data in (
+            step.SerializeToString()
+            for step in self._build.steps[index * _STEP_GROUP_SIZE:
+                                          (index+1) * _STEP_GROUP_SIZE])))
+
+  def encode(self):
+    """Returns the current Build message as a zlib-compressed binary proto."""
+    dirty, self._dirty = self._dirty, set()
+    num_groups = -(-len(self._build.steps) // _STEP_GROUP_SIZE)
+    del self._groups[num_groups:]
+    for index in range(num_groups):
+      if index >= len(self._groups):
+        self._groups.append(self._encode_group(index))
+      elif index in dirty:
+        self._groups[index] = self._encode_group(index)
+
+    chunks = [_DeflatedChunk.create(self._header())] + self._groups
+    adler = 1
+    for chunk in chunks:
+      adler = _adler32_combine(adler, chunk.adler, chunk.raw_len)
+    return b''.join(
+        [self._ZLIB_HEADER] + [chunk.data for chunk in chunks] +
+        [self._ZLIB_FINAL_BLOCK, struct.pack('>I', adler)])
+
+
 @attr.s
 class LUCIStreamEngine(StreamEngine):
   """Implementation of StreamEngine for luciexe mode.
@@ -394,7 +537,8 @@ class LUCIStreamEngine(StreamEngine):
   _export_build_as_json = attr.ib(validator=attr_type(bool))
 
   # The current Build message. This is mutated and then sent with the _send
-  # function (seen as _change_cb in other classes in this file).
+  # function (or _step_changed, seen as _change_cb in other classes in this
+  # file).
   _build_proto = attr.ib(factory=lambda: Build(
       status=common.STARTED,
       output=dict(status=common.STARTED),
@@ -420,6 +564,13 @@ class LUCIStreamEngine(StreamEngine):
   _send_event = attr.ib(default=gevent.event.Event())
   _sender_die = attr.ib(default=False)
 
+  # Caches the encodings of unchanged steps between sends of the Build message.
+  # Not used when exporting the Build as JSONPB.
+  _encoder = attr.ib()
+  @_encoder.default
+  def _encoder_default(self):
+    return _BuildEncoder(self._build_proto)
+
   _sender = attr.ib()
   @_sender.default
   def _sender_default(self):
@@ -428,28 +579,37 @@ class LUCIStreamEngine(StreamEngine):
           jsonpb.MessageToJson(self._build_proto,
                                preserving_proto_field_name=True).encode('utf-8')
           if self._export_build_as_json else
-          zlib.compress(self._build_proto.SerializeToString())
+          self._encoder.encode()
       )
 
     def _send_fn():
+      interval = _MIN_SEND_INTERVAL
       while not self._sender_die:
         # wait until SOMEONE wants to send something.
         self._send_event.wait()
         if self._sender_die:
           break
 
-        # Then wait for a second, in case other updates come in.
-        gevent.sleep(1)
+        # Then wait a bit, in case other updates come in. The wait grows with
+        # the cost of encoding the Build, so that large builds don't spend all
+        # their time re-sending it.
+        gevent.sleep(interval)
 
         # atomically:
         #   clear the event
         #   serialize the current build proto state (part of _do_send)
         # then send the serialized data asynchronously.
         self._send_event.clear()
+        start = time.monotonic()
         _do_send()
+        interval = min(max(
+            (time.monotonic() - start) * _SEND_COST_FACTOR,
+            _MIN_SEND_INTERVAL), _MAX_SEND_INTERVAL)
 
       # One last send before exiting to make sure all build updates are
-      # sent to logdog
+      # sent to logdog. The Build may have been changed through
+      # current_build_proto, so don't reuse any cached step encodings.
+      self._encoder.invalidate()
       _do_send()
 
     return gevent.spawn(_send_fn)
@@ -457,6 +617,10 @@ class LUCIStreamEngine(StreamEngine):
   def _send(self):
     self._send_event.set()
 
+  def _step_changed(self, index):
+    self._encoder.step_changed(index)
+    self._send()
+
   def new_step_stream(self,
                       name_tokens,
                       allow_subannotations,
@@ -467,6 +631,8 @@ class LUCIStreamEngine(StreamEngine):
     step_pb = self._build_proto.steps.add(
         name='|'.join(name_tokens),
         status=common.SCHEDULED)
+    step_changed = functools.partial(
+        self._step_changed, len(self._build_proto.steps) - 1)
 
     ret = LUCIStepStream(
         step_pb,
@@ -474,11 +640,11 @@ class LUCIStreamEngine(StreamEngine):
         self._build_proto.tags,
         step_pb.tags,
         self._build_proto.output.gitiles_commit,
-        self._send,
+        step_changed,
         self._bsc,
         merge_step,
         merge_output_properties_to)
-    self._send()
+    step_changed()
     return ret
 
   def close(self):
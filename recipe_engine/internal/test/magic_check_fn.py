@@ -583,6 +583,66 @@ class PostProcessError(ValueError):
   pass
 
 
+class _LazyStep(Step):
+  """A Step which is only built (from a copy of its expectation dict) when a
+  post_process hook first touches it.
+
+  Most hooks only look at a handful of steps; the rest are handed back to
+  post_process untouched, and can keep their original expectation dict.
+
+  Any attribute access (including `__class__` and `__dict__`, so e.g.
+  `attr.evolve` and `vars` work) materializes the Step, after which it's a
+  plain Step.
+  """
+
+  # pylint: disable=super-init-not-called
+  def __init__(self, step_dict):
+    object.__getattribute__(self, '__dict__')['_step_dict'] = step_dict
+
+  def __getattribute__(self, name):
+    _materialize(self)
+    return getattr(self, name)
+
+  # Special methods are looked up on the type, bypassing __getattribute__.
+
+  def __setattr__(self, name, value):
+    _materialize(self)
+    setattr(self, name, value)
+
+  def __delattr__(self, name):
+    _materialize(self)
+    delattr(self, name)
+
+  def __eq__(self, other):
+    _materialize(self)
+    return self == other
+
+  def __ne__(self, other):
+    _materialize(self)
+    return self != other
+
+  def __repr__(self):
+    _materialize(self)
+    return repr(self)
+
+
+def _lazy_step_dict(step: Step) -> dict | None:
+  """Returns the expectation dict of `step` if it's a _LazyStep which hasn't
+  been materialized, without materializing it."""
+  if type(step) is not _LazyStep:
+    return None
+  return object.__getattribute__(step, '__dict__')['_step_dict']
+
+
+def _materialize(step: _LazyStep) -> None:
+  """Turns `step` into a plain Step, built from a copy of its expectation dict.
+  """
+  state = object.__getattribute__(step, '__dict__')
+  built = Step.from_step_dict(copy.deepcopy(state.pop('_step_dict')))
+  state.update(built.__dict__)
+  object.__setattr__(step, '__class__', Step)
+
+
 def post_process(test_failures: Outcome.Results, raw_expectations,
                  test_data: TestData):
   """Run post processing hooks against the expectations generated by a test.
@@ -604,13 +664,13 @@ def post_process(test_failures: Outcome.Results, raw_expectations,
   """
   failed_checks: list[Check] = []
   for hook, args, kwargs, context in test_data.post_process_hooks:
-    steps = copy.deepcopy(raw_expectations)
+    # Steps are only copied out of raw_expectations if the hook touches them.
+    steps = OrderedDict(
+        (k, copy.deepcopy(v) if k == '$result' else _LazyStep(v))
+        for k, v in raw_expectations.items())
     # The checker MUST be saved to a local variable in order for it to be able
     # to correctly detect the frames to keep when creating a failure backtrace
     check = Checker(context, steps)
-    for k, v in steps.items():
-      if k != '$result':
-        steps[k] = Step.from_step_dict(v)
     try:
       rslt = hook(check, steps, *args, **kwargs)
     except KeyError:
@@ -633,7 +693,11 @@ def post_process(test_failures: Outcome.Results, raw_expectations,
     failed_checks += check.failed_checks
     if rslt is not None:
       for k, v in rslt.items():
-        if isinstance(v, Step):
+        step_dict = _lazy_step_dict(v)
+        if step_dict is not None:
+          # Untouched, so VerifySubset can skip it (it's `is` the original).
+          rslt[k] = step_dict
+        elif isinstance(v, Step):
           rslt[k] = v.to_step_dict()
         else:
           cmd = rslt[k].get('cmd', None)
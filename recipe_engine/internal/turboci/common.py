@@ -376,19 +376,61 @@ def get_check_by_short_id(workplan: WorkPlan, check_id: str) -> Check|None:
   """Finds and returns the Check for the check whose identifier.id is
   `check_id`.
 
-  If this check is not found, returns None."""
-  # TODO (b/483105203): Update data model to index checks and stages by ID to
-  # allow O(1) lookup instead of O(N) lookup. Also remove other comments noting
-  # the O(N) nature of this call in the files where it's used.
+  If this check is not found, returns None.
+
+  NOTE: This scans `workplan.checks`; to look up many checks in the same
+  WorkPlan, use `checks_by_short_id` instead."""
   for check in workplan.checks:
     if check.identifier.id == check_id:
       return check
   return None
 
 
+def checks_by_short_id(workplan: WorkPlan) -> dict[str, Check]:
+  """Returns a map of identifier.id to Check for all checks in `workplan`.
+
+  If several checks have the same identifier.id, the first one is returned,
+  like `get_check_by_short_id` does."""
+  ret: dict[str, Check] = {}
+  for check in workplan.checks:
+    ret.setdefault(check.identifier.id, check)
+  return ret
+
+
 def get_check_by_full_id(workplan: WorkPlan, check_id: str) -> Check|None:
   """Finds and returns the Check for the check whose identifier's string
   representation (e.g. 'L12345:C123') is `check_id`.
 
   If this check is not found, returns None."""
   return get_check_by_short_id(workplan, ids.from_string(check_id).check.id)
+
+
+class WorkPlanBuilder:
+  """Assembles a WorkPlan, keeping track of where each of its checks is.
+
+  This allows the checks of the WorkPlan to be looked up by ID in O(1), rather
+  than by scanning the WorkPlan with `get_check_by_short_id`.
+
+  All checks must be added to `workplan` with `add_check`.
+  """
+
+  def __init__(self, workplan: WorkPlan):
+    self.workplan = workplan
+    # Maps identifier.id to the index of the check in workplan.checks.
+    self._check_idx: dict[str, int] = {}
+    for idx, check in enumerate(workplan.checks):
+      self._check_idx.setdefault(check.identifier.id, idx)
+
+  def get_check(self, check_id: str) -> Check | None:
+    """Equivalent to `get_check_by_full_id(self.workplan, check_id)`."""
+    idx = self._check_idx.get(ids.from_string(check_id).check.id)
+    if idx is None:
+      return None
+    return self.workplan.checks[idx]
+
+  def add_check(self, check: Check) -> Check:
+    """Appends a copy of `check` to the WorkPlan, and returns it."""
+    self._check_idx.setdefault(check.identifier.id, len(self.workplan.checks))
+    ret = self.workplan.checks.add()
+    ret.CopyFrom(check)
+    return ret
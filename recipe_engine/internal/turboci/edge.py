@@ -225,6 +225,44 @@ def resolve_dependencies(deps: Dependencies):
     deps.resolution = resolution
 
 
+def satisfied_edge_targets(deps: Dependencies) -> set[str]:
+  """Returns the string identifiers of the targets of the edges which
+  contributed to the successful resolution of `deps`.
+
+  Returns the empty set if `deps` is not (yet) resolved as SATISFIED.
+  """
+  if deps.resolution != RESOLUTION_SATISFIED:
+    return set()
+
+  # Find all edges which are SATISFIED.
+  satisfied_edges = {
+    idx
+    for idx, event in deps.resolution_events.items()
+    if event.resolution == RESOLUTION_SATISFIED
+  }
+  # compute the set of edges which actually contributed to the successful
+  # resolution of `deps`.
+  #
+  # For any given group, if the group itself is satisfied, this returns the
+  # cumulative set of edges for that group; Otherwise if the group is not
+  # satisfied, returns the empty set.
+  def visit(group: Dependencies.Group) -> set[int]:
+    edges = {idx for idx in group.edges if idx in satisfied_edges}
+    groups: list[set[int]] = [
+      visited for subgroup in group.groups
+      if (visited := visit(subgroup))
+    ]
+    threshold = group.threshold or (len(group.edges) + len(group.groups))
+    if len(edges) + len(groups) < threshold:
+      return set()
+    return edges.union(*groups)
+
+  return {
+    extract_ident_condition(deps.edges[idx])[0]
+    for idx in visit(deps.predicate)
+  }
+
+
 class _DepsState(enum.Enum):
   """Small enum for the state of DependencyIndex._Entry."""
 
@@ -511,64 +549,69 @@ class DependencyIndex:
           f' {node.state}')
 
     if deps.resolution == RESOLUTION_SATISFIED:
-      # Find all edges which are SATISFIED.
-      satisfied_edges = {
-        idx
-        for idx, event in deps.resolution_events.items()
-        if event.resolution == RESOLUTION_SATISFIED
-      }
-      # compute the set of edges which actually contributed to the successful
-      # resolution of `deps`.
-      #
-      # For any given group, if the group itself is satisfied, this returns the
-      # cumulative set of edges for that group; Otherwise if the group is not
-      # satisfied, returns the empty set.
-      def visit(group: Dependencies.Group) -> set[int]:
-        edges = {idx for idx in group.edges if idx in satisfied_edges}
-        groups: list[set[int]] = [
-          visited for subgroup in group.groups
-          if (visited := visit(subgroup))
-        ]
-        threshold = group.threshold or (len(group.edges) + len(group.groups))
-        if len(edges) + len(groups) < threshold:
-          return set()
-        return edges.union(*groups)
-
-      node.satisfied_edges_flat = {
-        extract_ident_condition(deps.edges[idx])[0]
-        for idx in visit(deps.predicate)
-      }
+      node.satisfied_edges_flat = satisfied_edge_targets(deps)
       for target in node.satisfied_edges_flat:
         self._data[target].satisfied_dependents.add(node_ident_str)
 
     node.state = _DepsState.RESOLVED
 
+  def _walk(
+      self,
+      start: Iterable[str],
+      neighbors: Callable[[DependencyIndex._Entry], set[str]],
+      depth: int | None,
+  ) -> set[str]:
+    """Returns the nodes reachable from `start` in at most `depth` steps (or
+    any number of steps, if `depth` is None) along `neighbors`.
+
+    This is a single breadth-first walk for all of `start`, so nodes reachable
+    from several of them are only visited once.
+    """
+    ret: set[str] = set()
+    frontier = list(start)
+    while frontier and depth != 0:
+      if depth is not None:
+        depth -= 1
+      next_frontier: list[str] = []
+      for node_ident_str in frontier:
+        # NOTE: Use .get to avoid adding entries to the defaultdict.
+        if (entry := self._data.get(node_ident_str)) is None:
+          continue
+        for target in neighbors(entry):
+          if target not in ret:
+            ret.add(target)
+            next_frontier.append(target)
+      frontier = next_frontier
+    return ret
+
   def dependencies_of(
       self,
-      node_ident_str: str,
+      node_ident_strs: Iterable[str],
       mode: QueryExpandDepsMode,
+      depth: int | None = 1,
   ) -> set[str]:
-    """Returns nodes which `node_ident_str` depends on."""
-    node = self._data[node_ident_str]
-    edges: set[str]
-    if mode == QueryExpandDepsMode.QUERY_EXPAND_DEPS_MODE_SATISFIED:
-      edges = node.satisfied_edges_flat
-    else:
-      edges = node.edges_flat
+    """Returns nodes which any of `node_ident_strs` depend on.
 
-    return set(edges)
+    By default only returns direct dependencies; `depth` can be used to also
+    return their dependencies (up to `depth` edges away), or the full
+    transitive closure (if None).
+    """
+    if mode == QueryExpandDepsMode.QUERY_EXPAND_DEPS_MODE_SATISFIED:
+      return self._walk(
+          node_ident_strs, lambda entry: entry.satisfied_edges_flat, depth)
+    return self._walk(node_ident_strs, lambda entry: entry.edges_flat, depth)
 
   def dependents_of(
       self,
-      target_ident_str: str,
+      target_ident_strs: Iterable[str],
       mode: QueryExpandDepsMode,
+      depth: int | None = 1,
   ) -> set[str]:
-    """Return nodes which depend on `target_ident_str`."""
-    node = self._data[target_ident_str]
-    edges: set[str]
-    if mode == QueryExpandDepsMode.QUERY_EXPAND_DEPS_MODE_SATISFIED:
-      edges = node.satisfied_dependents
-    else:
-      edges = node.dependents
+    """Return nodes which depend on any of `target_ident_strs`.
 
-    return set(edges)
+    `depth` works the same way as for `dependencies_of`.
+    """
+    if mode == QueryExpandDepsMode.QUERY_EXPAND_DEPS_MODE_SATISFIED:
+      return self._walk(
+          target_ident_strs, lambda entry: entry.satisfied_dependents, depth)
+    return self._walk(target_ident_strs, lambda entry: entry.dependents, depth)
@@ -42,6 +42,7 @@ by this fake, will raise NotImplementedError.
 
 from __future__ import annotations
 
+import bisect
 import time
 import copy
 
@@ -50,7 +51,7 @@ from dataclasses import dataclass, field
 from functools import reduce
 from itertools import chain
 from threading import Lock
-from typing import cast
+from typing import Iterator, cast
 import typing
 
 from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
@@ -66,13 +67,14 @@ from PB.turboci.graph.orchestrator.v1.check_state import (CheckState,
                                                           CHECK_STATE_FINAL)
 from PB.turboci.graph.orchestrator.v1.dependencies import Dependencies
 from PB.turboci.graph.orchestrator.v1.edge import RESOLUTION_SATISFIED
-from PB.turboci.graph.orchestrator.v1.query import Query
+from PB.turboci.graph.orchestrator.v1.query import Query, QueryExpandDepsMode
 from PB.turboci.graph.orchestrator.v1.query_nodes_request import QueryNodesRequest
 from PB.turboci.graph.orchestrator.v1.query_nodes_response import QueryNodesResponse
 from PB.turboci.graph.orchestrator.v1.read_workplan_request import ReadWorkPlanRequest
 from PB.turboci.graph.orchestrator.v1.read_workplan_response import ReadWorkPlanResponse
 from PB.turboci.graph.orchestrator.v1.revision import Revision
 from PB.turboci.graph.orchestrator.v1.type_info import TypeInfo
+from PB.turboci.graph.orchestrator.v1.type_set import TypeSet
 from PB.turboci.graph.orchestrator.v1.value_ref import ValueRef
 from PB.turboci.graph.orchestrator.v1.value_write import ValueWrite
 from PB.turboci.graph.orchestrator.v1.workplan import WorkPlan
@@ -80,19 +82,24 @@ from PB.turboci.graph.orchestrator.v1.write_nodes_request import WriteNodesReque
 from PB.turboci.graph.orchestrator.v1.write_nodes_response import WriteNodesResponse
 from recipe_engine.internal.turboci import check_invariant
 from recipe_engine.internal.turboci import edge
-from recipe_engine.internal.turboci.common import get_check_by_full_id
+from recipe_engine.internal.turboci.common import WorkPlanBuilder
 from recipe_engine.internal.turboci.errors import InvalidArgumentException
 from turboci.utils import ids
 from turboci.utils import client
 
 from .common import TurboCIClient
-from .query_util import type_set_to_re, want_value_ref
+from .query_util import (check_matches_select, type_set_key, type_set_to_re,
+                         type_urls_to_re, want_value_ref)
 
 from turboci.utils import value
 
 
+def _rev_key(rev: Revision) -> tuple[int, int]:
+  return (rev.ts.seconds, rev.ts.nanos)
+
+
 def _is_rev_newer(a: Revision, b: Revision) -> bool:
-  return (a.ts.seconds, a.ts.nanos) > (b.ts.seconds, b.ts.nanos)
+  return _rev_key(a) > _rev_key(b)
 
 
 class _all_nodes_set:
@@ -134,6 +141,215 @@ class _IndexEntrySnapshot:
     )
 
 
+@dataclass
+class _TypeURLIndex:
+  """An index of check ids by the type URLs of their options (or result data).
+
+  The ids of the checks matching a TypeSet are cached and kept up to date as
+  checks are added, so that repeated queries for the same TypeSet don't need to
+  match it against every known type URL again.
+  """
+  MAX_CACHED_TYPE_SETS = 256
+
+  # type_url -> ids
+  by_type: defaultdict[str, set[str]] = field(
+      default_factory=lambda: defaultdict(set))
+
+  # type_set_key -> (matching type_urls, ids with any of those type_urls)
+  #
+  # Ordered from least to most recently used.
+  _matching: dict[tuple[str, ...], tuple[set[str], set[str]]] = field(
+      default_factory=dict)
+
+  def add(self, type_url: str, check_id: str):
+    new_type_url = type_url not in self.by_type
+    self.by_type[type_url].add(check_id)
+    for key, (type_urls, matching_ids) in self._matching.items():
+      if type_url in type_urls:
+        matching_ids.add(check_id)
+      elif new_type_url and type_urls_to_re(key).match(type_url):
+        type_urls.add(type_url)
+        matching_ids.add(check_id)
+
+  def matching(self, ts: TypeSet) -> set[str]:
+    """Returns the ids of the checks with a type URL matching `ts`.
+
+    The returned set must not be modified.
+    """
+    key = type_set_key(ts)
+    cached = self._matching.pop(key, None)
+    if cached is None:
+      pat = type_urls_to_re(key)
+      type_urls = {type_url for type_url in self.by_type if pat.match(type_url)}
+      cached = (type_urls,
+                set().union(*(self.by_type[type_url] for type_url in type_urls)))
+      if len(self._matching) >= self.MAX_CACHED_TYPE_SETS:
+        del self._matching[next(iter(self._matching))]
+    self._matching[key] = cached
+    return cached[1]
+
+
+@dataclass(frozen=True)
+class _CheckSnapshot:
+  """A read-only view of the checks of a FakeTurboCIOrchestrator as of one
+  committed revision.
+
+  Reading from this only ever observes immutable Check messages, so it doesn't
+  need the orchestrator's lock.
+  """
+  # See FakeTurboCIOrchestrator._check_history and _check_order.
+  history: dict[str, list[tuple[tuple[int, int], Check]]]
+  order: list[str]
+
+  revision: Revision
+
+  def get(self, ident_str: str) -> Check | None:
+    versions = self.history.get(ident_str)
+    if not versions:
+      return None
+    idx = bisect.bisect_right(
+        versions, _rev_key(self.revision), key=lambda v: v[0])
+    return versions[idx - 1][1] if idx else None
+
+  def checks(self) -> Iterator[tuple[str, Check]]:
+    # NOTE: Writers may append to `order` concurrently; get() filters out the
+    # checks created after this snapshot.
+    for ident_str in self.order:
+      if (check := self.get(ident_str)) is not None:
+        yield ident_str, check
+
+  def dependencies_of(self, ident_strs: set[str],
+                      mode: QueryExpandDepsMode) -> set[str]:
+    """Like edge.DependencyIndex.dependencies_of, as of this snapshot."""
+    ret: set[str] = set()
+    for ident_str in ident_strs:
+      if (check := self.get(ident_str)) is not None:
+        ret.update(self._edge_targets(check, mode))
+    return ret
+
+  def dependents_of(self, ident_strs: set[str],
+                    mode: QueryExpandDepsMode) -> set[str]:
+    """Like edge.DependencyIndex.dependents_of, as of this snapshot."""
+    return {
+        ident_str for ident_str, check in self.checks()
+        if not ident_strs.isdisjoint(self._edge_targets(check, mode))
+    }
+
+  @staticmethod
+  def _edge_targets(check: Check, mode: QueryExpandDepsMode) -> set[str]:
+    if mode == QueryExpandDepsMode.QUERY_EXPAND_DEPS_MODE_SATISFIED:
+      return edge.satisfied_edge_targets(check.dependencies)
+    return {
+        edge.extract_ident_condition(e)[0] for e in check.dependencies.edges
+    }
+
+
+def _add_check_to_workplan(workplan: WorkPlanBuilder, check_str: str,
+                           check: Check) -> Check:
+  """Adds `check` to `workplan` (if it's not already there) without any option
+  or result data values; those are added by _collect_nodes."""
+  ret = workplan.get_check(check_str)
+  if not ret:
+    ret = workplan.add_check(check)
+
+    for opt in ret.options:
+      opt.inline.ClearField('value')
+
+    for rslt in ret.results:
+      for dat in rslt.data:
+        dat.inline.ClearField('value')
+
+  return ret
+
+
+def _query_node_set(
+    q: Query, exists: typing.Callable[[str], bool]
+) -> tuple[set[str] | _all_nodes_set, dict[str, identifier.Identifier]]:
+  """Returns the nodes which `q` selects from (before its select_checks
+  predicates are applied), and the requested nodes which don't exist."""
+  absent: dict[str, identifier.Identifier] = {}
+  basis: _all_nodes_set | set[str]
+
+  match ns := q.WhichOneof('node_set'):
+    case 'nodes_by_id':
+      basis = set()
+
+      implied_select_checks = False
+      # implied_select_stages = False
+
+      for ident in q.nodes_by_id.nodes:
+        match typ := ident.WhichOneof('type'):
+          case 'check':
+            implied_select_checks = True
+            ident_str = ids.to_string(ident)
+            if exists(ident_str):
+              basis.add(ident_str)
+            else:
+              absent[ident_str] = ident
+
+          case _:
+            raise NotImplementedError(
+                "FakeTurboCIOrchestrator.QueryNodes: "
+                f"`query.nodes_by_id` has unsupported type {typ!r}")
+
+      if implied_select_checks and not q.HasField('select_checks'):
+        q.select_checks.SetInParent()
+
+    case 'nodes_in_workplan':
+      if id := q.nodes_in_workplan.id:
+        raise NotImplementedError(
+          f"FakeTurboCIOrchestrator.QueryNodes: nodes_in_workplan with non-empty id {id!r}")
+
+      basis = _all_nodes_set()
+
+    case _:
+      raise NotImplementedError(
+          f"FakeTurboCIOrchestrator.QueryNodes: `query.{ns}`")
+
+  if q.HasField('select_stages'):
+    raise NotImplementedError(
+        "FakeTurboCIOrchestrator.QueryNodes: `query.select_stages`")
+
+  return basis, absent
+
+
+def _collect_nodes(workplan: WorkPlanBuilder, query: Query,
+                   type_info: TypeInfo,
+                   toCollect: typing.Iterable[tuple[str, Check]],
+                   require: Revision | None):
+  """Collect adds all required nodes to the WorkPlan."""
+  if query.collect_checks.HasField('edits'):
+    raise NotImplementedError(
+        "FakeTurboCIOrchestrator.QueryNodes: `query.collect_checks.edits`")
+  if query.HasField('collect_stages'):
+    raise NotImplementedError(
+        "FakeTurboCIOrchestrator.QueryNodes: `query.collect_stages`")
+
+  collect_opts = query.collect_checks.options
+  collect_result_data = query.collect_checks.result_data
+  pat = type_set_to_re(type_info.wanted)
+
+  for check_str, check in toCollect:
+    if require and _is_rev_newer(check.version, require):
+      raise client.TransactionalPreconditionError(
+          f"node {check_str} newer than {require}")
+
+    # This must already be in workplan
+    workplan_check = workplan.get_check(check_str)
+    assert workplan_check
+
+    if collect_opts:
+      for i, opt in enumerate(check.options):
+        if want_value_ref(pat, opt):
+          workplan_check.options[i].CopyFrom(opt)
+
+    if collect_result_data:
+      for result_idx, result in enumerate(check.results):
+        for data_idx, dat in enumerate(result.data):
+          if want_value_ref(pat, dat):
+            workplan_check.results[result_idx].data[data_idx].CopyFrom(dat)
+
+
 @dataclass
 class FakeTurboCIOrchestrator(TurboCIClient):
   # If set, FakeTurboCIOrchestrator will use a monotonic internal clock for
@@ -152,9 +368,28 @@ class FakeTurboCIOrchestrator(TurboCIClient):
 
   # Map of node id -> Check
   #
+  # The Check messages in here are never mutated once a write is applied; see
+  # _apply_checkwrite_locked.
+  #
   # TODO: use sortedcontainers instead of a dict?
   _checks: dict[str, Check] = field(default_factory=dict)
 
+  # Versioned copies of _checks, for QueryNodes at a snapshot version.
+  #
+  # Map of node id -> [(revision key, Check)], in revision order. Every write
+  # to a check appends its new (immutable) Check, so checks which weren't
+  # written share their Check between revisions.
+  #
+  # Append-only, so that snapshot reads can use it without the lock.
+  _check_history: dict[str, list[tuple[tuple[int, int], Check]]] = field(
+      default_factory=dict)
+  # All node ids in _check_history, in creation order. Append-only.
+  _check_order: list[str] = field(default_factory=list)
+
+  # The last revision whose writes (including edge propagation) are completely
+  # applied. Snapshot reads can't observe anything newer than this.
+  _committed: Revision = field(default_factory=Revision)
+
   def _get_check(self, ident_str: str) -> Check | None:
     # TODO: This function can be removed once _checks is split into per-type tables
     # (it would just be `self._checks.get`.
@@ -183,10 +418,8 @@ class FakeTurboCIOrchestrator(TurboCIClient):
       default_factory=lambda: defaultdict(set))
   _checks_by_state: defaultdict[CheckState, set[str]] = field(
       default_factory=lambda: defaultdict(set))
-  _checks_by_opt_type: defaultdict[str, set[str]] = field(
-      default_factory=lambda: defaultdict(set))
-  _checks_by_result_type: defaultdict[str, set[str]] = field(
-      default_factory=lambda: defaultdict(set))
+  _checks_by_opt_type: _TypeURLIndex = field(default_factory=_TypeURLIndex)
+  _checks_by_result_type: _TypeURLIndex = field(default_factory=_TypeURLIndex)
 
   _dependencies: edge.DependencyIndex = field(
       default_factory=edge.DependencyIndex)
@@ -240,9 +473,9 @@ class FakeTurboCIOrchestrator(TurboCIClient):
 
     # options and result types are only additive
     for typ in cur.option_types - prev.option_types:
-      self._checks_by_opt_type[typ].add(check_id)
+      self._checks_by_opt_type.add(typ, check_id)
     for typ in cur.result_types - prev.result_types:
-      self._checks_by_result_type[typ].add(check_id)
+      self._checks_by_result_type.add(typ, check_id)
 
 
   def _set_check_state(self, check: Check, state: CheckState):
@@ -271,7 +504,10 @@ class FakeTurboCIOrchestrator(TurboCIClient):
         check.version.CopyFrom(self._revision)
 
     if cur := self._checks.get(ident_str):
-      check = cast(Check, cur)
+      # Copy on write; `cur` may be observed by snapshot reads.
+      check = Check()
+      check.CopyFrom(cast(Check, cur))
+      self._checks[ident_str] = check
     else:
       check = Check(
           identifier=write.identifier,
@@ -402,25 +638,22 @@ class FakeTurboCIOrchestrator(TurboCIClient):
     check = self._apply_checkwrite_locked(write, deps)
     self._update_indices_locked(ident_str, idx_snap, check)
 
-  def _ensure_check_in_workplan(self, workplan: WorkPlan,
+    entry = (_rev_key(self._revision), check)
+    if (history := self._check_history.get(ident_str)) is None:
+      self._check_history[ident_str] = [entry]
+      self._check_order.append(ident_str)
+    elif history[-1][0] == entry[0]:
+      # Written again in the same revision, which isn't committed yet.
+      history[-1] = entry
+    else:
+      history.append(entry)
+
+  def _ensure_check_in_workplan(self, workplan: WorkPlanBuilder,
                                 check_str: str) -> Check | tuple[None, None]:
     check = self._checks.get(check_str)
     if check is None:
       return None, None
-
-    ret = get_check_by_full_id(workplan, check_str)
-    if not ret:
-      ret = workplan.checks.add()
-      ret.CopyFrom(check)
-
-      for opt in ret.options:
-        opt.inline.ClearField('value')
-
-      for rslt in ret.results:
-        for dat in rslt.data:
-          dat.inline.ClearField('value')
-
-    return ret
+    return _add_check_to_workplan(workplan, check_str, check)
 
 
   def _select_checks_locked(self, basis: set[str]|_all_nodes_set, sel: Query.SelectChecks|None) -> set[str]:
@@ -443,17 +676,14 @@ class FakeTurboCIOrchestrator(TurboCIClient):
       if st := p.state:
         toIntersect.append(self._checks_by_state[st] & basis)
 
-      if ot := p.with_option_type:
-        pat = type_set_to_re(ot)
-        for type_url, node_ids in self._checks_by_opt_type.items():
-          if pat.match(type_url):
-            toIntersect.append(node_ids & basis)
+      if p.HasField('with_option_type'):
+        toIntersect.append(
+            self._checks_by_opt_type.matching(p.with_option_type) & basis)
 
-      if rdt := p.with_result_data_type:
-        pat = type_set_to_re(rdt)
-        for type_url, node_ids in self._checks_by_result_type.items():
-          if pat.match(type_url):
-            toIntersect.append(node_ids & basis)
+      if p.HasField('with_result_data_type'):
+        toIntersect.append(
+            self._checks_by_result_type.matching(p.with_result_data_type)
+            & basis)
 
       ret.update(reduce(lambda a, b: a&b, toIntersect))
 
@@ -461,53 +691,12 @@ class FakeTurboCIOrchestrator(TurboCIClient):
 
 
   def _select_nodes_locked(
-      self, workplan: WorkPlan, q: Query) -> tuple[
+      self, workplan: WorkPlanBuilder, q: Query) -> tuple[
           set[str],
           dict[str, identifier.Identifier],
       ]:
     """Processes a Query.Select into a set of nodes_ids."""
-    absent: dict[str, identifier.Identifier] = {}
-    basis: _all_nodes_set | set[str]
-
-    match ns := q.WhichOneof('node_set'):
-      case 'nodes_by_id':
-        basis = set()
-
-        implied_select_checks = False
-        # implied_select_stages = False
-
-        for ident in q.nodes_by_id.nodes:
-          match typ := ident.WhichOneof('type'):
-            case 'check':
-              implied_select_checks = True
-              ident_str = ids.to_string(ident)
-              if ident_str in self._checks:
-                basis.add(ident_str)
-              else:
-                absent[ident_str] = ident
-
-            case _:
-              raise NotImplementedError(
-                  "FakeTurboCIOrchestrator.QueryNodes: "
-                  f"`query.nodes_by_id` has unsupported type {typ!r}")
-
-        if implied_select_checks and not q.HasField('select_checks'):
-          q.select_checks.SetInParent()
-
-      case 'nodes_in_workplan':
-        if id := q.nodes_in_workplan.id:
-          raise NotImplementedError(
-            f"FakeTurboCIOrchestrator.QueryNodes: nodes_in_workplan with non-empty id {id!r}")
-
-        basis = _all_nodes_set()
-
-      case _:
-        raise NotImplementedError(
-            f"FakeTurboCIOrchestrator.QueryNodes: `query.{ns}`")
-
-    if q.HasField('select_stages'):
-      raise NotImplementedError(
-          "FakeTurboCIOrchestrator.QueryNodes: `query.select_stages`")
+    basis, absent = _query_node_set(q, self._checks.__contains__)
 
     selected = self._select_checks_locked(basis, q.select_checks)
     for node_id in selected:
@@ -516,7 +705,7 @@ class FakeTurboCIOrchestrator(TurboCIClient):
     return selected, absent
 
 
-  def _expand_nodes_locked(self, workplan: WorkPlan, q: Query,
+  def _expand_nodes_locked(self, workplan: WorkPlanBuilder, q: Query,
                            toCollect: set[str]):
     """Expands the nodes in `toCollect` according to `q`.
 
@@ -526,69 +715,27 @@ class FakeTurboCIOrchestrator(TurboCIClient):
     # Need separate set to avoid changing toCollect while iterating on it.
     to_add: set[str] = set()
 
+    # NOTE: Query can't express expanding more than one edge away yet, so this
+    # uses the default depth of 1.
     if q.HasField('expand_dependencies'):
-      for node_ident_str in toCollect:
-        matches = self._dependencies.dependencies_of(
-            node_ident_str, q.expand_dependencies.mode)
-        for match in matches:
-          self._ensure_check_in_workplan(workplan, match)
-        to_add.update(matches)
+      matches = self._dependencies.dependencies_of(
+          toCollect, q.expand_dependencies.mode)
+      for match in matches:
+        self._ensure_check_in_workplan(workplan, match)
+      to_add.update(matches)
 
     if q.HasField('expand_dependents'):
-      for node_ident_str in toCollect:
-        matches = self._dependencies.dependents_of(
-            node_ident_str, q.expand_dependents.mode)
-        for match in matches:
-          self._ensure_check_in_workplan(workplan, match)
-        to_add.update(matches)
+      matches = self._dependencies.dependents_of(
+          toCollect, q.expand_dependents.mode)
+      for match in matches:
+        self._ensure_check_in_workplan(workplan, match)
+      to_add.update(matches)
 
     toCollect.update(to_add)
 
-  def _collect_nodes_locked(self, workplan: WorkPlan, query: Query,
-                            type_info: TypeInfo,
-                            toCollect: set[str], require: Revision | None):
-    """Collect adds all required nodes to the WorkPlan."""
-    if query.collect_checks.HasField('edits'):
-      raise NotImplementedError(
-          "FakeTurboCIOrchestrator.QueryNodes: `query.collect_checks.edits`")
-    if query.HasField('collect_stages'):
-      raise NotImplementedError(
-          "FakeTurboCIOrchestrator.QueryNodes: `query.collect_stages`")
-
-    collect_opts = query.collect_checks.options
-    collect_result_data = query.collect_checks.result_data
-
-    for check_str in toCollect:
-      check = self._checks[check_str]
-
-      if require and _is_rev_newer(check.version, require):
-        raise client.TransactionalPreconditionError(
-            f"node {check_str} newer than {require}")
-
-      # This must already be in workplan
-      workplan_check = get_check_by_full_id(workplan, check_str)
-      assert workplan_check
-
-      pat = type_set_to_re(type_info.wanted)
-      if collect_opts:
-        for i, opt in enumerate(check.options):
-          if want_value_ref(pat, opt):
-            workplan_check.options[i].CopyFrom(opt)
-
-      if collect_result_data:
-        pat = type_set_to_re(type_info.wanted)
-        for result_idx, result in enumerate(check.results):
-          for data_idx, dat in enumerate(result.data):
-            if want_value_ref(pat, dat):
-              workplan_check.results[result_idx].data[data_idx].CopyFrom(dat)
-
-
   def QueryNodes(self, req: QueryNodesRequest) -> QueryNodesResponse:
     if req.token:
       raise NotImplementedError("FakeTurboCIOrchestrator.QueryNodes: `token`")
-    if req.version.HasField('snapshot'):
-      raise NotImplementedError(
-          "FakeTurboCIOrchestrator.QueryNodes: `version.snapshot`")
     if req.type_info.HasField('unknown_jsonpb'):
       raise NotImplementedError(
           "FakeTurboCIOrchestrator.QueryNodes: `type_info.unknown_jsonpb`")
@@ -596,16 +743,21 @@ class FakeTurboCIOrchestrator(TurboCIClient):
       raise NotImplementedError(
           "FakeTurboCIOrchestrator.QueryNodes: `type_info.known`")
 
+    if req.version.HasField('snapshot'):
+      return self._query_nodes_at_snapshot(req)
+
     with self._lock:
       ret = WorkPlan(
           version=self._revision, identifier=identifier.WorkPlan(id=""))
+      builder = WorkPlanBuilder(ret)
       all_absent: dict[str, identifier.Identifier] = {}
       for query in req.query:
-        toCollect, absent = self._select_nodes_locked(ret, query)
+        toCollect, absent = self._select_nodes_locked(builder, query)
         all_absent.update(absent)
-        self._expand_nodes_locked(ret, query, toCollect)
-        self._collect_nodes_locked(
-            ret, query, req.type_info, toCollect,
+        self._expand_nodes_locked(builder, query, toCollect)
+        _collect_nodes(
+            builder, query, req.type_info,
+            ((check_str, self._checks[check_str]) for check_str in toCollect),
             req.version.require if req.version.HasField('require') else None)
 
     return QueryNodesResponse(
@@ -614,6 +766,61 @@ class FakeTurboCIOrchestrator(TurboCIClient):
         version=self._revision,
     )
 
+  def _query_nodes_at_snapshot(self,
+                               req: QueryNodesRequest) -> QueryNodesResponse:
+    """Implements QueryNodes for `req.version.snapshot`.
+
+    This only reads immutable Check messages from _check_history, so it doesn't
+    take the lock, and doesn't wait for (or block) concurrent writes.
+    """
+    version = req.version.snapshot
+    if _is_rev_newer(version, self._committed):
+      raise InvalidArgumentException(
+          f"QueryNodes: version.snapshot {_rev_key(version)} is newer than "
+          f"the latest revision {_rev_key(self._committed)}")
+    snap = _CheckSnapshot(self._check_history, self._check_order, version)
+
+    ret = WorkPlan(version=version, identifier=identifier.WorkPlan(id=""))
+    builder = WorkPlanBuilder(ret)
+    all_absent: dict[str, identifier.Identifier] = {}
+    for query in req.query:
+      basis, absent = _query_node_set(
+          query, lambda ident_str: snap.get(ident_str) is not None)
+      all_absent.update(absent)
+
+      candidates: typing.Iterable[tuple[str, Check | None]]
+      if isinstance(basis, _all_nodes_set):
+        candidates = snap.checks()
+      else:
+        candidates = ((ident_str, snap.get(ident_str)) for ident_str in basis)
+      toCollect: dict[str, Check] = {
+          ident_str: check
+          for ident_str, check in candidates
+          if check and check_matches_select(check, query.select_checks)
+      }
+
+      # NOTE: Like _expand_nodes_locked, this only expands one edge away.
+      expanded: set[str] = set()
+      if query.HasField('expand_dependencies'):
+        expanded.update(snap.dependencies_of(
+            set(toCollect), query.expand_dependencies.mode))
+      if query.HasField('expand_dependents'):
+        expanded.update(snap.dependents_of(
+            set(toCollect), query.expand_dependents.mode))
+      for ident_str in expanded - toCollect.keys():
+        if (check := snap.get(ident_str)) is not None:
+          toCollect[ident_str] = check
+
+      for ident_str, check in toCollect.items():
+        _add_check_to_workplan(builder, ident_str, check)
+      _collect_nodes(builder, query, req.type_info, toCollect.items(), None)
+
+    return QueryNodesResponse(
+        workplans=[ret],
+        absent=all_absent.values(),
+        version=version,
+    )
+
   def WriteNodes(self, req: WriteNodesRequest) -> WriteNodesResponse:
     if req.token:
       raise NotImplementedError("FakeTurboCIOrchestrator.WriteNodes: `token`")
@@ -741,6 +948,9 @@ class FakeTurboCIOrchestrator(TurboCIClient):
                 'FakeTurboCIOrchestrator: cannot resolve edges for node of'
                 f' type {type(node).__name__}')
 
+      # Publish this write to snapshot reads.
+      self._committed = self._revision
+
     return WriteNodesResponse(written_version=new_version)
 
   def ReadWorkPlan(self, req: ReadWorkPlanRequest) -> ReadWorkPlanResponse:
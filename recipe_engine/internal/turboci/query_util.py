@@ -3,15 +3,24 @@
 # that can be found in the LICENSE file.
 """Util functions for query."""
 
+import functools
 import re
 
+from PB.turboci.graph.orchestrator.v1.check import Check
+from PB.turboci.graph.orchestrator.v1.query import Query
 from PB.turboci.graph.orchestrator.v1.type_set import TypeSet
 from PB.turboci.graph.orchestrator.v1.value_ref import ValueRef
 
 
-def type_set_to_re(ts: TypeSet) -> re.Pattern:
+def type_set_key(ts: TypeSet) -> tuple[str, ...]:
+  """Returns a hashable key for `ts`, suitable for caching its pattern."""
+  return tuple(ts.type_urls)
+
+
+@functools.lru_cache(maxsize=256)
+def type_urls_to_re(type_urls: tuple[str, ...]) -> re.Pattern:
   fragments: list[str] = []
-  for frag in ts.type_urls:
+  for frag in type_urls:
     q = re.escape(frag)
     if q.endswith(r'\*'):
       fragments.append(q.removesuffix(r'\*') + '.*')
@@ -21,5 +30,39 @@ def type_set_to_re(ts: TypeSet) -> re.Pattern:
   return re.compile(f'({")|(".join(fragments)})')
 
 
+def type_set_to_re(ts: TypeSet) -> re.Pattern:
+  return type_urls_to_re(type_set_key(ts))
+
+
 def want_value_ref(pat: re.Pattern, value_ref: ValueRef) -> bool:
   return bool(pat.match(value_ref.type_url))
+
+
+def check_matches_select(check: Check, select_checks: Query.SelectChecks) -> bool:
+  """Returns True iff `check` matches any of the predicates of
+  `select_checks`."""
+  if len(select_checks.predicates) == 0:
+    return True  # Empty predicates list means all checks match.
+
+  for p in select_checks.predicates:
+    match = True
+
+    if p.HasField("kind") and check.kind != p.kind:
+      match = False
+
+    if match and p.HasField("state") and check.state != p.state:
+      match = False
+
+    if match and p.HasField("with_option_type"):
+      pat = type_set_to_re(p.with_option_type)
+      match = any(want_value_ref(pat, opt) for opt in check.options)
+
+    if match and p.HasField("with_result_data_type"):
+      pat = type_set_to_re(p.with_result_data_type)
+      match = any(
+          want_value_ref(pat, d) for r in check.results for d in r.data)
+
+    if match:
+      return True  # Matched at least one predicate (OR logic)
+
+  return False
@@ -24,7 +24,7 @@ from PB.turboci.graph.orchestrator.v1.write_nodes_request import WriteNodesReque
 from PB.turboci.graph.orchestrator.v1.write_nodes_response import WriteNodesResponse
 
 from .common import TurboCIClient
-from .query_util import type_set_to_re, want_value_ref
+from .query_util import check_matches_select
 
 LOG = logging.getLogger(__name__)
 TURBOCI = 'turboci.exe' if sys.platform == 'win32' else 'turboci'
@@ -262,34 +262,6 @@ class TurboCIOrchestrator(TurboCIClient):
     elif q.HasField("nodes_in_workplan"):
       if not q.HasField("collect_checks") or not q.HasField("select_checks"):
         return False
-      return self._check_matches_select(check, q.select_checks)
-
-    return False
-
-  def _check_matches_select(self, check: Check,
-                            select_checks: Query.SelectChecks):
-    if len(select_checks.predicates) == 0:
-      return True  # Empty predicates list means all checks match.
-
-    for p in select_checks.predicates:
-      match = True
-
-      if p.HasField("kind") and check.kind != p.kind:
-        match = False
-
-      if match and p.HasField("state") and check.state != p.state:
-        match = False
-
-      if match and p.HasField("with_option_type"):
-        pat = type_set_to_re(p.with_option_type)
-        match = any(want_value_ref(pat, opt) for opt in check.options)
-
-      if match and p.HasField("with_result_data_type"):
-        pat = type_set_to_re(p.with_result_data_type)
-        match = any(
-            want_value_ref(pat, d) for r in check.results for d in r.data)
-
-      if match:
-        return True  # Matched at least one predicate (OR logic)
+      return check_matches_select(check, q.select_checks)
 
     return False
@@ -491,6 +491,15 @@ def _placeholder_step_data(func, placeholder_name=None):
   return inner
 
 
+def _post_check(check, steps, f, *args, **kwargs):
+  """The hook installed by `post_check` and `assert_workplan`.
+
+  This discards the return value of `f`. It's defined at module level (rather
+  than as a closure) so that TestData using it remains picklable.
+  """
+  f(check, steps, *args, **kwargs)
+
+
 class RecipeTestApi:
   """Provides testing interface for GenTest method.
 
@@ -953,14 +962,12 @@ class RecipeTestApi:
         + api.post_process(DropExpectation)
       )
     """
-    def post_check(check, steps, f, *args, **kwargs):
-      f(check, steps, *args, **kwargs)
     ret = TestData()
     frame = sys._getframe(1)
     filename = frame.f_code.co_filename
     lineno = frame.f_lineno
     context = PostprocessHookContext(func, args, kwargs, filename, lineno)
-    ret.post_process(post_check, (func,) + args, kwargs, context)
+    ret.post_process(_post_check, (func,) + args, kwargs, context)
     return ret
 
   def assert_workplan(self, func, *args, **kwargs):
@@ -987,15 +994,12 @@ class RecipeTestApi:
       yield api.test('whatever', api.assert_workplan(_check_workplan))
     """
 
-    def assert_workplan(check, steps, f, *args, **kwargs):
-      f(check, steps, *args, **kwargs)
-
     ret = TestData()
     frame = sys._getframe(1)
     filename = frame.f_code.co_filename
     lineno = frame.f_lineno
     context = PostprocessHookContext(func, args, kwargs, filename, lineno)
-    ret.assert_workplan(assert_workplan, (func,) + args, kwargs, context)
+    ret.assert_workplan(_post_check, (func,) + args, kwargs, context)
     return ret
 
   def turboci_write_nodes(self, *nodes: WriteNodesRequest.CheckWrite):
@@ -82,6 +82,7 @@ def get_results(msg: typing.Type[_MsgT], check: _check.Check) -> list[_MsgT]:
 from .internal.turboci.common import (
     TurboCIClient,
     check,
+    checks_by_short_id,
     dep_group,
     get_check_by_short_id,
     make_query,
@@ -115,6 +116,7 @@ __all__ = [
     'TurboCIException',
     'check',
     'check_id',
+    'checks_by_short_id',
     'collect_check_ids',
     'dep_group',
     'from_id',
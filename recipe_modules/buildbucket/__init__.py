@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 DEPS = [
+  'futures',
   'json',
   'path',
   'platform',
@@ -12,6 +13,7 @@ DEPS = [
   'resultdb',
   'runtime',
   'step',
+  'time',
   'uuid',
   'warning',
 ]
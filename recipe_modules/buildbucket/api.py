@@ -40,6 +40,26 @@ class Inherit(enum.Enum):
   INHERIT = 1
 
 
+# Adds the details of a Builds.Batch request made on behalf of one API call to
+# the presentation of the batch step, given that call's responses. Returns the
+# ResultDB invocations to include in the current build's invocation.
+PresentFunction = Callable[
+    ['step_data.StepData', Sequence[builds_service_pb2.BatchResponse.Response]],
+    Sequence[str]]
+
+
+class _CoalescedBatch:
+  """The requests of concurrent API calls made under `coalesce_requests()`,
+  to be sent in a single Builds.Batch request."""
+
+  def __init__(self):
+    # (step_name, BatchRequest, BatchResponse for tests, PresentFunction)
+    # tuples, one per API call.
+    self.calls = []
+    self.size = 0
+    self.future = None
+
+
 class BuildbucketApi(recipe_api.RecipeApi):
   """A module for interacting with buildbucket."""
 
@@ -48,6 +68,13 @@ class BuildbucketApi(recipe_api.RecipeApi):
   HOST_PROD = 'cr-buildbucket.appspot.com'
   HOST_DEV = 'cr-buildbucket-dev.appspot.com'
 
+  # The maximum number of requests buildbucket accepts in a Builds.Batch
+  # request.
+  MAX_BATCH_SIZE = 200
+
+  # The initial delay (in secs) between the polls of `iter_collect_builds`.
+  COLLECT_MIN_INTERVAL = 10
+
   # The Build message fields that will be requested by default in buildbucket
   # rpc requests.
   DEFAULT_FIELDS = frozenset({
@@ -98,6 +125,10 @@ class BuildbucketApi(recipe_api.RecipeApi):
 
     self._next_test_build_id = 8922054662172514000
 
+    # See coalesce_requests().
+    self._coalesce_depth = 0
+    self._pending_batch: _CoalescedBatch | None = None
+
   @property
   def host(self) -> str:
     """Hostname of buildbucket to use in API calls.
@@ -120,6 +151,41 @@ class BuildbucketApi(recipe_api.RecipeApi):
     finally:
       self.host = previous_host
 
+  @contextlib.contextmanager
+  def coalesce_requests(self) -> Generator[None, None, None]:
+    """Coalesces requests made concurrently by Futures while in context.
+
+    `get`, `get_multi`, `schedule`, `cancel_build` and the final fetch of
+    `collect_builds` normally each run their own `bb batch` step. Under this
+    context, the requests they make from concurrently running Futures are sent
+    together in as few Builds.Batch requests as the per-batch limit
+    (MAX_BATCH_SIZE) allows, and the responses are handed back to each caller.
+
+    Example:
+    ```python
+        with api.buildbucket.coalesce_requests():
+          futures = [
+              api.futures.spawn(api.buildbucket.schedule, [req])
+              for req in requests
+          ]
+          builds = [f.result()[0] for f in futures]
+    ```
+
+    A request joins the batch which is waiting to be sent; the batch is sent
+    once the Future sending it gets to run, i.e. once every Future which was
+    ready to run has blocked. A batch holding the requests of a single call
+    runs with the step name of that call, as it would without coalescing.
+    Otherwise the step is named 'buildbucket.batch' and is shown under the
+    step which was current when the first of its requests was made.
+
+    Links and errors of all the coalesced calls are shown on the batch step.
+    """
+    self._coalesce_depth += 1
+    try:
+      yield
+    finally:
+      self._coalesce_depth -= 1
+
   def use_service_account_key(self, key_path: config_types.Path | str) -> None:
     """Tells this module to start using given service account key for auth.
 
@@ -667,33 +733,29 @@ class BuildbucketApi(recipe_api.RecipeApi):
       )
       self._next_test_build_id += 1
 
-    step_res, batch_res, has_errors = self._batch_request(
-        step_name or 'buildbucket.schedule', batch_req, test_res)
+    def present(step_res, responses):
+      sub_invocation_names = []
+      # Append build links regardless of errors.
+      for r in responses:
+        if not r.HasField('error'):
+          self._report_build_maybe(
+              step_res, r.schedule_build, url_title_fn=url_title_fn)
 
-    sub_invocation_names = []
-    # Append build links regardless of errors.
-    for r in batch_res.responses:
-      if not r.HasField('error'):
-        self._report_build_maybe(
-            step_res, r.schedule_build, url_title_fn=url_title_fn)
-
-        inv = r.schedule_build.infra.resultdb.invocation
-        if inv:
-          sub_invocation_names.append(inv)
-
-    # Include sub invocations for the successfully created builds regardless
-    # of errors.
-    if include_sub_invs and self.m.resultdb.enabled and sub_invocation_names:
-      self.m.resultdb.include_invocations(
-          invocations=self.m.resultdb.invocation_ids(sub_invocation_names),
-          step_name="include sub resultdb invocations"
-      )
+          inv = r.schedule_build.infra.resultdb.invocation
+          if inv:
+            sub_invocation_names.append(inv)
+      # Include sub invocations for the successfully created builds regardless
+      # of errors.
+      return sub_invocation_names if include_sub_invs else []
+
+    responses, has_errors = self._call_batch(
+        step_name or 'buildbucket.schedule', batch_req, test_res, present)
 
     if has_errors:
       raise self.m.step.InfraFailure('Build creation failed')
 
     # Return Build messages.
-    return [r.schedule_build for r in batch_res.responses]
+    return [r.schedule_build for r in responses]
 
   def _report_build_maybe(
       self,
@@ -938,13 +1000,13 @@ class BuildbucketApi(recipe_api.RecipeApi):
           id=int(build_id),
           status=common_pb2.CANCELED
         ))])
-    _, batch_res, has_errors = self._batch_request(
+    responses, has_errors = self._call_batch(
       step_name or 'buildbucket.cancel', cancel_req, test_res)
 
     if has_errors:
       raise self.m.step.InfraFailure(
         'Failed to cancel build [%s]. Message: %s' %(
-          build_id, batch_res.responses[0].error.message))
+          build_id, responses[0].error.message))
 
     return
 
@@ -955,7 +1017,7 @@ class BuildbucketApi(recipe_api.RecipeApi):
       step_name: str | None = None,
       fields: Set[str] = DEFAULT_FIELDS,
       test_data: Sequence[build_pb2.Build] | None = None,
-  ) -> tuple[step_data.StepData, dict[int, build_pb2.Build]]:
+  ) -> dict[int, build_pb2.Build]:
     """Gets multiple builds.
 
     Args:
@@ -970,7 +1032,7 @@ class BuildbucketApi(recipe_api.RecipeApi):
       A dict {build_id: build_pb2.Build}.
     """
     return self._get_multi(build_ids, url_title_fn, step_name, fields,
-                           test_data)[1]
+                           test_data)
 
   def _get_multi(
       self,
@@ -979,8 +1041,14 @@ class BuildbucketApi(recipe_api.RecipeApi):
       step_name: str | None,
       fields: Set[str],
       test_data: Sequence[build_pb2.Build] | None = None,
-  ) -> tuple[step_data.StepData, dict[int, build_pb2.Build]]:
-    """Implements get_multi, but also returns StepData."""
+      present_builds: Callable[
+          [step_data.StepData, dict[int, build_pb2.Build]], None] | None = None,
+  ) -> dict[int, build_pb2.Build]:
+    """Implements get_multi.
+
+    `present_builds(step_res, builds)`, if given, is called with the fetched
+    builds to add their details to the presentation of the step.
+    """
     batch_req = builds_service_pb2.BatchRequest(
         requests=[
             dict(
@@ -1000,17 +1068,27 @@ class BuildbucketApi(recipe_api.RecipeApi):
               for id in build_ids
           ]
       )
-    step_res, batch_res, has_errors = self._batch_request(
-        step_name or 'buildbucket.get_multi', batch_req, test_res)
-    ret = {}
-    for res in batch_res.responses:
-      if res.HasField('get_build'):
-        b = res.get_build
-        self._report_build_maybe(step_res, b, url_title_fn=url_title_fn)
-        ret[b.id] = b
+
+    def present(step_res, responses):
+      builds = {}
+      for res in responses:
+        if res.HasField('get_build'):
+          b = res.get_build
+          self._report_build_maybe(step_res, b, url_title_fn=url_title_fn)
+          builds[b.id] = b
+      if present_builds:
+        present_builds(step_res, builds)
+      return []
+
+    responses, has_errors = self._call_batch(
+        step_name or 'buildbucket.get_multi', batch_req, test_res, present)
     if has_errors:
       raise self.m.step.InfraFailure('Getting builds failed')
-    return step_res, ret
+    return {
+        res.get_build.id: res.get_build
+        for res in responses
+        if res.HasField('get_build')
+    }
 
   def get(
       self,
@@ -1118,29 +1196,135 @@ class BuildbucketApi(recipe_api.RecipeApi):
         if fields and 'status' not in fields:
           fields = fields[:]
           fields.append('status')
-      step_res, builds = self._get_multi(
-          build_ids, url_title_fn=url_title_fn, step_name='get', fields=fields)
 
-      if raise_if_unsuccessful:
-        unsuccessful_builds = sorted(
+      def unsuccessful(builds):
+        return sorted(
             b.id for b in builds.values()
             if b.status != common_pb2.SUCCESS
         )
-        if unsuccessful_builds:
-          step_res.presentation.status = self.m.step.FAILURE
-          step_res.presentation.logs['unsuccessful_builds'] = [
-              str(b) for b in unsuccessful_builds]
-          raise self.m.step.InfraFailure(
-              'Triggered build(s) did not succeed, unexpectedly')
-      elif mirror_status:
-        bs = list(builds.values())
-        if any(b.status == common_pb2.INFRA_FAILURE for b in bs):
-          step_res.presentation.status = self.m.step.EXCEPTION
-        elif any(b.status == common_pb2.FAILURE for b in bs):
-          step_res.presentation.status = self.m.step.FAILURE
+
+      def present_builds(step_res, builds):
+        if raise_if_unsuccessful:
+          unsuccessful_builds = unsuccessful(builds)
+          if unsuccessful_builds:
+            step_res.presentation.status = self.m.step.FAILURE
+            step_res.presentation.logs['unsuccessful_builds'] = [
+                str(b) for b in unsuccessful_builds]
+        elif mirror_status:
+          bs = list(builds.values())
+          if any(b.status == common_pb2.INFRA_FAILURE for b in bs):
+            step_res.presentation.status = self.m.step.EXCEPTION
+          elif any(b.status == common_pb2.FAILURE for b in bs):
+            step_res.presentation.status = self.m.step.FAILURE
+
+      builds = self._get_multi(
+          build_ids, url_title_fn=url_title_fn, step_name='get', fields=fields,
+          present_builds=present_builds)
+
+      if raise_if_unsuccessful and unsuccessful(builds):
+        raise self.m.step.InfraFailure(
+            'Triggered build(s) did not succeed, unexpectedly')
 
       return builds
 
+  def iter_collect_builds(
+      self,
+      build_ids: Sequence[int | str],
+      interval: int | None = None,
+      timeout: int | None = None,
+      step_name: str | None = None,
+      url_title_fn: UrlTitleFunction | None = None,
+      mirror_status: bool = False,
+      fields: Set[str] = DEFAULT_FIELDS,
+      eager: bool = False,
+  ) -> Generator[build_pb2.Build, None, None]:
+    """Yields the details of each build as soon as it ends.
+
+    Unlike `collect_builds`, which returns once all the builds ended, this lets
+    the caller start follow-up work (e.g. processing results or retrying) for
+    the builds which end early while the others are still running:
+
+    ```python
+        for build in api.buildbucket.iter_collect_builds(build_ids):
+          if build.status != common_pb2.SUCCESS:
+            retry(build)
+    ```
+
+    All the builds which are still running are polled with a single
+    Builds.Batch request. Each poll runs under its own step named `step_name`,
+    which also fetches the details of the builds which ended since the
+    previous poll. The delay between polls starts at COLLECT_MIN_INTERVAL and
+    doubles (up to `interval`) while no build ends.
+
+    Args:
+    * `build_ids`: List of build IDs to wait for.
+    * `interval`: Maximum delay (in secs) between polls. Defaults to 1m.
+    * `timeout`: Maximum time to wait for builds to end. Defaults to 1h.
+    * `step_name`: Custom name for the generated steps.
+    * `url_title_fn`: generates build URL title. See module docstring.
+    * `mirror_status`: mark the step fetching the details of the ended builds
+      as failed/infra-failed if any of them did not succeed.
+    * `fields`: a list of fields to include in the response, names relative
+      to `build_pb2.Build` (e.g. ["tags", "infra.swarming"]).
+    * `eager`: Whether to stop after the first poll which finds ended builds.
+
+    Yields:
+      [Build](https://chromium.googlesource.com/infra/luci/luci-go/+/main/buildbucket/proto/build.proto)
+      messages in the order in which the builds were found to end, and in the
+      order of `build_ids` for builds found in the same poll.
+
+    Raises:
+      `InfraFailure` if polling fails or if some builds did not end within the
+      timeout.
+    """
+    interval = interval or 60
+    timeout = timeout or 3600
+    step_name = step_name or 'buildbucket.collect'
+    if mirror_status:
+      fields = frozenset(fields) | {'status'}
+
+    def present_builds(step_res, builds):
+      bs = list(builds.values())
+      if any(b.status == common_pb2.INFRA_FAILURE for b in bs):
+        step_res.presentation.status = self.m.step.EXCEPTION
+      elif any(b.status == common_pb2.FAILURE for b in bs):
+        step_res.presentation.status = self.m.step.FAILURE
+
+    pending = list(dict.fromkeys(int(b) for b in build_ids))
+    min_delay = delay = min(self.COLLECT_MIN_INTERVAL, interval)
+    waited = 0
+    while pending:
+      with self.m.step.nest(step_name):
+        statuses = self._poll_build_statuses(pending)
+        ended = [
+            b for b in pending
+            if statuses.get(b, common_pb2.STATUS_UNSPECIFIED) &
+            common_pb2.ENDED_MASK
+        ]
+        builds = {}
+        if ended:
+          builds = self._get_multi(
+              ended, url_title_fn=url_title_fn, step_name='get', fields=fields,
+              present_builds=present_builds if mirror_status else None)
+
+      for build_id in ended:
+        yield builds[build_id]
+      if eager and ended:
+        return
+      pending = [b for b in pending if b not in builds]
+      if not pending:
+        return
+
+      if waited >= timeout:
+        raise self.m.step.InfraFailure(
+            'Timed out waiting for build(s) to end: %s' %
+            ', '.join(map(str, pending)))
+      # Builds tend to end in bursts; poll again soon after one ends.
+      delay = min_delay if ended else min(delay * 2, interval)
+      delay = min(delay, timeout - waited)
+      self.m.time.sleep(delay)
+      waited += delay
+
   # Internal.
 
   def _batch_request(
@@ -1205,6 +1389,102 @@ class BuildbucketApi(recipe_api.RecipeApi):
 
     return (step_res, batch_res, has_errors)
 
+  def _call_batch(
+      self,
+      step_name: str,
+      request: builds_service_pb2.BatchRequest,
+      test_response: builds_service_pb2.BatchResponse,
+      present: PresentFunction | None = None,
+  ) -> tuple[Sequence[builds_service_pb2.BatchResponse.Response], bool]:
+    """Makes the Builds.Batch request of a single API call.
+
+    Under `coalesce_requests()`, the request joins the pending batch instead of
+    running its own step.
+
+    Returns (responses, has_errors) tuple, for this call's requests only.
+    """
+    if not self._coalesce_depth:
+      step_res, batch_res, has_errors = self._batch_request(
+          step_name, request, test_response)
+      if present:
+        self._include_sub_invocations(present(step_res, batch_res.responses))
+      return batch_res.responses, has_errors
+
+    batch = self._pending_batch
+    if batch is None or (
+        batch.size + len(request.requests) > self.MAX_BATCH_SIZE):
+      batch = self._pending_batch = _CoalescedBatch()
+      batch.future = self.m.futures.spawn(
+          self._send_coalesced_batch, batch,
+          __name='recipe_engine/buildbucket: batch')
+    index = len(batch.calls)
+    batch.calls.append((step_name, request, test_response, present))
+    batch.size += len(request.requests)
+
+    responses = batch.future.result()[index]
+    return responses, any(r.HasField('error') for r in responses)
+
+  def _send_coalesced_batch(
+      self, batch: _CoalescedBatch
+  ) -> list[Sequence[builds_service_pb2.BatchResponse.Response]]:
+    """Sends the requests of all the calls in `batch` in one Builds.Batch request.
+
+    Returns the responses of each call, in the order of `batch.calls`.
+    """
+    # Calls made from now on start a new batch.
+    if self._pending_batch is batch:
+      self._pending_batch = None
+
+    request = builds_service_pb2.BatchRequest()
+    test_response = builds_service_pb2.BatchResponse()
+    for _, call_request, call_test_response, _ in batch.calls:
+      request.requests.extend(call_request.requests)
+      test_response.responses.extend(call_test_response.responses)
+
+    step_name = 'buildbucket.batch'
+    if len(batch.calls) == 1:
+      step_name = batch.calls[0][0]
+    step_res, batch_res, _ = self._batch_request(
+        step_name, request, test_response)
+
+    ret = []
+    sub_invocation_names = []
+    offset = 0
+    for _, call_request, _, present in batch.calls:
+      count = len(call_request.requests)
+      responses = batch_res.responses[offset:offset + count]
+      offset += count
+      if present:
+        sub_invocation_names.extend(present(step_res, responses))
+      ret.append(responses)
+    self._include_sub_invocations(sub_invocation_names)
+    return ret
+
+  def _poll_build_statuses(self, build_ids: Sequence[int]) -> dict[int, int]:
+    """Returns {build_id: common_pb2.Status} of the given builds."""
+    request = builds_service_pb2.BatchRequest(
+        requests=[dict(get_build_status=dict(id=b)) for b in build_ids])
+    test_response = builds_service_pb2.BatchResponse(responses=[
+        dict(get_build_status=dict(id=b, status=common_pb2.SUCCESS))
+        for b in build_ids
+    ])
+    _, batch_res, has_errors = self._batch_request(
+        'poll', request, test_response)
+    if has_errors:
+      raise self.m.step.InfraFailure('Polling builds failed')
+    return {
+        r.get_build_status.id: r.get_build_status.status
+        for r in batch_res.responses
+        if r.HasField('get_build_status')
+    }
+
+  def _include_sub_invocations(self, invocation_names: Sequence[str]) -> None:
+    if self.m.resultdb.enabled and invocation_names:
+      self.m.resultdb.include_invocations(
+          invocations=self.m.resultdb.invocation_ids(invocation_names),
+          step_name="include sub resultdb invocations"
+      )
+
   def _run_bb(
       self,
       subcommand: str,
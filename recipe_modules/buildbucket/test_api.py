@@ -554,6 +554,22 @@ class BuildbucketTestApi(recipe_test_api.RecipeTestApi):
     step_name = step_name or 'buildbucket.collect'
     return self.simulated_get_multi(builds, step_name='%s.get' % step_name)
 
+  def simulated_collect_poll(self, builds, step_name=None):
+    """Simulates a poll of buildbucket.iter_collect_builds.
+
+    `builds` are Build messages with (at least) the id and status of the builds
+    being polled.
+
+    The polls of iter_collect_builds run under numbered steps, e.g.
+    'buildbucket.collect', 'buildbucket.collect (2)' for the second poll.
+    """
+    step_name = step_name or 'buildbucket.collect'
+    return self._simulated_batch_response(
+        builds_service_pb2.BatchResponse(
+            responses=[dict(get_build_status=b) for b in builds],
+        ),
+        '%s.poll' % step_name)
+
   def simulated_schedule_output(self, batch_response, step_name=None):
     """Simulates a buildbucket.schedule call."""
     return self._simulated_batch_response(
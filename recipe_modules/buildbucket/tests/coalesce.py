@@ -0,0 +1,92 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+from recipe_engine import post_process
+
+from PB.go.chromium.org.luci.buildbucket.proto \
+  import builds_service as builds_service_pb2
+
+DEPS = [
+  'assertions',
+  'buildbucket',
+  'futures',
+  'properties',
+  'step',
+]
+
+
+def RunSteps(api):
+  bb = api.buildbucket
+
+  with bb.coalesce_requests():
+    if api.properties.get('many'):
+      # Batches are split to respect MAX_BATCH_SIZE.
+      futures = [
+          api.futures.spawn(bb.get_multi, range(i * 80, (i + 1) * 80))
+          for i in range(3)
+      ]
+      for f in futures:
+        api.assertions.assertEqual(len(f.result()), 80)
+      return
+
+    futures = [
+        api.futures.spawn(bb.schedule,
+                          [bb.schedule_request(builder='child%d' % i)])
+        for i in range(3)
+    ]
+    builds = [f.result()[0] for f in futures]
+
+    gets = [api.futures.spawn(bb.get, b.id) for b in builds[:2]]
+    cancel = api.futures.spawn(bb.cancel_build, builds[2].id, reason='unneeded')
+    for f, b in zip(gets, builds):
+      api.assertions.assertEqual(f.result().id, b.id)
+    try:
+      cancel.result()
+    except api.step.InfraFailure:
+      api.step.empty('cancel failed')
+
+    # The requests of a single call keep their usual step name.
+    bb.get(builds[0].id)
+
+    collects = [
+        api.futures.spawn(
+            bb.collect_build, b.id, step_name='collect %d' % i,
+            raise_if_unsuccessful=True)
+        for i, b in enumerate(builds[:2])
+    ]
+    for f in collects:
+      f.result()
+
+
+def GenTests(api):
+  yield api.test(
+      'basic',
+      api.post_check(post_process.MustRun, 'buildbucket.batch',
+                     'buildbucket.batch (2)', 'buildbucket.get',
+                     'collect 0.buildbucket.batch'),
+      api.post_check(post_process.DoesNotRun, 'cancel failed'),
+  )
+
+  yield api.test(
+      'cancel error',
+      api.buildbucket.simulated_cancel_output(
+          builds_service_pb2.BatchResponse(responses=[
+              dict(get_build=dict(id=8922054662172514000)),
+              dict(get_build=dict(id=8922054662172514001)),
+              dict(error=dict(code=5, message='not found')),
+          ]), 'buildbucket.batch (2)'),
+      api.post_check(post_process.MustRun, 'cancel failed'),
+      api.post_process(post_process.DropExpectation),
+  )
+
+  yield api.test(
+      'many',
+      api.properties(many=True),
+      api.post_check(post_process.MustRun, 'buildbucket.batch',
+                     'buildbucket.get_multi'),
+      api.post_check(post_process.DoesNotRun, 'buildbucket.batch (2)'),
+      api.post_process(post_process.DropExpectation),
+  )
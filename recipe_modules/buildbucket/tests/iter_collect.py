@@ -0,0 +1,93 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+from recipe_engine import post_process
+
+from PB.go.chromium.org.luci.buildbucket.proto import build as build_pb2
+from PB.go.chromium.org.luci.buildbucket.proto import common as common_pb2
+
+DEPS = [
+  'buildbucket',
+  'json',
+  'properties',
+  'step',
+]
+
+
+def RunSteps(api):
+  for build in api.buildbucket.iter_collect_builds(
+      [1, 2, 3],
+      timeout=api.properties.get('timeout'),
+      mirror_status=True,
+      eager=api.properties.get('eager', False)):
+    api.step.empty('process %d' % build.id,
+                   step_text=common_pb2.Status.Name(build.status))
+
+
+def GenTests(api):
+
+  def poll(n, **statuses):
+    return api.buildbucket.simulated_collect_poll(
+        [
+            build_pb2.Build(id=int(b[1:]), status=s)
+            for b, s in sorted(statuses.items())
+        ],
+        step_name='buildbucket.collect' + (' (%d)' % n if n > 1 else ''))
+
+  def get(n, **statuses):
+    return api.buildbucket.simulated_collect_output(
+        [
+            build_pb2.Build(id=int(b[1:]), status=s)
+            for b, s in sorted(statuses.items())
+        ],
+        step_name='buildbucket.collect' + (' (%d)' % n if n > 1 else ''))
+
+  yield api.test('basic')
+
+  yield api.test(
+      'streaming',
+      poll(1, b1=common_pb2.SUCCESS, b2=common_pb2.STARTED,
+           b3=common_pb2.SCHEDULED),
+      poll(2, b2=common_pb2.STARTED, b3=common_pb2.STARTED),
+      poll(3, b2=common_pb2.FAILURE, b3=common_pb2.INFRA_FAILURE),
+      get(3, b2=common_pb2.FAILURE, b3=common_pb2.INFRA_FAILURE),
+  )
+
+  yield api.test(
+      'eager',
+      api.properties(eager=True),
+      poll(1, b1=common_pb2.STARTED, b2=common_pb2.FAILURE,
+           b3=common_pb2.STARTED),
+      get(1, b2=common_pb2.FAILURE),
+      api.post_check(post_process.MustRun, 'process 2'),
+      api.post_check(post_process.DoesNotRun, 'buildbucket.collect (2)'),
+      api.post_process(post_process.DropExpectation),
+  )
+
+  yield api.test(
+      'timeout',
+      api.properties(timeout=15),
+      poll(1, b1=common_pb2.STARTED, b2=common_pb2.SUCCESS,
+           b3=common_pb2.STARTED),
+      poll(2, b1=common_pb2.STARTED, b3=common_pb2.STARTED),
+      poll(3, b1=common_pb2.STARTED, b3=common_pb2.STARTED),
+      api.post_check(post_process.MustRun, 'process 2'),
+      api.post_check(post_process.DoesNotRun, 'buildbucket.collect (4)'),
+      api.post_check(post_process.SummaryMarkdownRE, '1, 3'),
+      api.post_process(post_process.DropExpectation),
+      status='INFRA_FAILURE',
+  )
+
+  yield api.test(
+      'poll error',
+      api.step_data(
+          'buildbucket.collect.poll',
+          api.json.output_stream(
+              {'responses': [{'error': {'code': 5, 'message': 'not found'}}]},
+              retcode=1)),
+      api.post_process(post_process.DropExpectation),
+      status='INFRA_FAILURE',
+  )
@@ -78,7 +78,7 @@ class CasApi(recipe_api.RecipeApi):
         step_test_data=step_test_data,
         **kwargs)
 
-  def download(self, step_name, digest, output_dir):
+  def download(self, step_name, digest, output_dir, instance=None, cost=None):
     """Downloads a directory tree from a cas server.
 
     Args:
@@ -86,17 +86,24 @@ class CasApi(recipe_api.RecipeApi):
       * step_name (str): name of the step.
       * digest (str): the digest of a cas tree.
       * output_dir (Path): path to an output directory.
+      * instance (str|None): the cas instance to download from. Defaults to
+        `instance`.
+      * cost (ResourceCost|None): the cost of the download step. If not
+        specified, the step's default cost is used.
     """
     cmd = [
         'download',
         '-cas-instance',
-        self.instance,
+        instance or self.instance,
         '-digest',
         digest,
         '-dir',
         output_dir,
     ]
-    return self._run(step_name, cmd)
+    kwargs = {}
+    if cost:
+      kwargs['cost'] = cost
+    return self._run(step_name, cmd, **kwargs)
 
   def viewer_url(self, digest):
     """Return URL of cas viewer."""
@@ -32,6 +32,11 @@ def RunSteps(api):
 
   out = api.path.mkdtemp('cas-output')
   api.cas.download('download', digest, out)
+  # The instance and cost of the download can be set explicitly.
+  api.cas.download(
+      'download from other instance', digest, out,
+      instance='projects/other-cas-server/instances/instance',
+      cost=api.step.ResourceCost(cpu=api.step.CPU_CORE // 4))
 
 
 def GenTests(api):
@@ -334,9 +334,19 @@ class CIPDApi(recipe_api.RecipeApi):
     super().__init__(**kwargs)
     self.max_threads = 0  # 0 means use system CPU count.
     # A mapping from (package, version) to Future for packages installed
-    # via `ensure_tool()`. The Future has no returned value and just used to
-    # synchronize 'ensure' actions.
+    # via `ensure_tool()`. The Future returns a dict of the errors of the tools
+    # in its batch which failed to install (see _install_tool_batch), and is
+    # used to synchronize 'ensure' actions.
     self._installed_tool_package_futures = {}
+    # The batch of tools which new `ensure_tool()` requests join, mapping
+    # (package, version) to the install directory. See _install_tool_batch.
+    self._pending_tool_batch: dict[tuple[str, str], Path] | None = None
+    # The Future of the most recently started batch of tools.
+    self._tool_batch_future = None
+    # The Pin of every tool installed in the shared `cipd_tool` root, by
+    # subdirectory. `cipd ensure` uninstalls packages missing from the ensure
+    # file, so every later ensure of that root must list these too.
+    self._tool_root_pins: dict[str, CIPDApi.Pin] = {}
 
   @contextlib.contextmanager
   def cache_dir(self, directory: Path | None) -> Iterator[None]:
@@ -1109,6 +1119,107 @@ class CIPDApi(recipe_api.RecipeApi):
             package_file.pieces[-1]))
     return self.Pin(**step_result.json.output['result'])
 
+  @staticmethod
+  def _tool_package_parts(package: str) -> list[str]:
+    return [p for p in package.split('/') if '${' not in p]
+
+  def _tool_package_dir(self, package: str, version: str) -> Path:
+    package_parts = self._tool_package_parts(package)
+    package_dir = self.m.path.start_dir.joinpath('cipd_tool', *package_parts)
+    # Hashing the version is the easiest way to produce a string with no special
+    # characters e.g. removing colons which don't work on Windows.
+    return package_dir.joinpath(
+        hashlib.sha256(version.encode('utf-8')).hexdigest())
+
+  def _ensure_tool_root(self, root: Path, batch: dict[tuple[str, str], Path],
+                        name: str = 'ensure_installed') -> None:
+    """Installs the tools in `batch` in the shared tool `root`.
+
+    Tools installed there by earlier batches are listed by their resolved
+    instance, so that `cipd ensure` keeps them without resolving their
+    versions again.
+    """
+    ensure_file = self.EnsureFile()
+    for subdir, pin in sorted(self._tool_root_pins.items()):
+      ensure_file.add_package(pin.package, pin.instance_id, subdir)
+    subdirs = []
+    for (package, version), package_dir in sorted(batch.items()):
+      subdirs.append('/'.join(package_dir.pieces[len(root.pieces):]))
+      ensure_file.add_package(package, version, subdirs[-1])
+    pins = self.ensure(root, ensure_file, name=name)
+    for subdir in subdirs:
+      self._tool_root_pins[subdir] = pins[subdir][0]
+
+  def _install_tool_batch(
+      self, batch: dict[tuple[str, str], Path],
+      previous_batch) -> dict[tuple[str, str], recipe_api.StepFailure]:
+    """Installs a batch of tools requested by `ensure_tool()`.
+
+    Batches are installed one after another. Tools requested while the previous
+    batch is being installed (or before this Future first runs, e.g. by other
+    Futures spawned at the same time) join this batch.
+
+    Every tool is installed in its own subdirectory of the shared
+    `[START_DIR]/cipd_tool` root, with a single `cipd ensure` per batch, so the
+    install directory of a tool doesn't depend on how it was batched. If that
+    fails, each tool of the batch is retried on its own, so that one bad tool
+    doesn't fail the others.
+
+    Returns the error of each tool (by (package, version)) which failed to
+    install.
+    """
+    if previous_batch:
+      # The previous batch's errors are raised to its own callers.
+      previous_batch.exception()
+    self._pending_tool_batch = None
+
+    root = self.m.path.start_dir / 'cipd_tool'
+    if len(batch) == 1:
+      [(package, _)] = batch
+      name = 'install %s' % '/'.join(self._tool_package_parts(package))
+    else:
+      name = 'install %d tools' % len(batch)
+    errors = {}
+    with self.m.step.nest(name):
+      with self.m.context(infra_steps=True):
+        self.m.file.ensure_directory('ensure tool directory', root)
+        try:
+          self._ensure_tool_root(root, batch)
+        except self.m.step.StepFailure as ex:
+          if len(batch) == 1:
+            errors.update(dict.fromkeys(batch, ex))
+          else:
+            for (package, version), package_dir in sorted(batch.items()):
+              try:
+                self._ensure_tool_root(
+                    root, {(package, version): package_dir},
+                    name='ensure_installed %s' %
+                    '/'.join(self._tool_package_parts(package)))
+              except self.m.step.StepFailure as tool_ex:
+                errors[(package, version)] = tool_ex
+    return errors
+
+  def _request_tool(self, package: str, version: str) -> Path:
+    """Adds the tool to the pending batch, unless it was already requested.
+
+    Returns the tool's install directory.
+    """
+    check_type("package", package, str)
+    check_type("version", version, str)
+
+    cache_key = (package, version)
+    package_dir = self._tool_package_dir(package, version)
+    if cache_key not in self._installed_tool_package_futures:
+      if self._pending_tool_batch is None:
+        self._pending_tool_batch = {}
+        self._tool_batch_future = self.m.futures.spawn(
+            self._install_tool_batch, self._pending_tool_batch,
+            self._tool_batch_future,
+            __name='recipe_engine/cipd: install tools')
+      self._pending_tool_batch[cache_key] = package_dir
+      self._installed_tool_package_futures[cache_key] = self._tool_batch_future
+    return package_dir
+
   def ensure_tool(self,
                   package: str,
                   version: str,
@@ -1134,44 +1245,36 @@ class CIPDApi(recipe_api.RecipeApi):
     Returns a Path to the executable.
 
     Future-safe; Multiple concurrent calls for the same (package, version) will
-    block on a single ensure step.
+    block on a single ensure step. Concurrent calls for different packages
+    (e.g. from Futures spawned together) are installed by a single `cipd
+    ensure`. See also `ensure_tools`.
     """
-
-    check_type("package", package, str)
-    check_type("version", version, str)
     check_type("executable_path", executable_path, (str, type(None)))
+    package_dir = self._request_tool(package, version)
+    errors = self._installed_tool_package_futures[(package, version)].result()
+    if (package, version) in errors:
+      raise errors[(package, version)]
 
-    cache_key = (package, version)
-
-    package_parts = [p for p in package.split('/') if '${' not in p]
-    package_dir = self.m.path.start_dir.joinpath('cipd_tool', *package_parts)
-    # Hashing the version is the easiest way to produce a string with no special
-    # characters e.g. removing colons which don't work on Windows.
-    package_dir = package_dir.joinpath(
-        hashlib.sha256(version.encode('utf-8')).hexdigest())
-    basename = package_parts[-1]
-
-    if cache_key not in self._installed_tool_package_futures:
-      name = 'install %s' % ('/'.join(package_parts),)
-
-      def _install_package_thread():
-        with self.m.step.nest(name):
-          with self.m.context(infra_steps=True):
-            self.m.file.ensure_directory('ensure package directory',
-                                         package_dir)
-            self.ensure(
-                package_dir,
-                self.EnsureFile().add_package(package, version))
+    if executable_path is None:
+      executable_path = self._tool_package_parts(package)[-1]
 
-      self._installed_tool_package_futures[cache_key] = self.m.futures.spawn(
-          _install_package_thread, __name='recipe_engine/cipd: '+name)
+    return package_dir / executable_path
 
-    self._installed_tool_package_futures[cache_key].result()
+  def ensure_tools(
+      self,
+      tools: Sequence[tuple[str, str] | tuple[str, str, str | None]],
+  ) -> list[Path]:
+    """Downloads several executables from CIPD with a single `cipd ensure`.
 
-    if executable_path is None:
-      executable_path = basename
+    Args:
+      * tools - (package, version) or (package, version, executable_path)
+        tuples, as for `ensure_tool`.
 
-    return package_dir / executable_path
+    Returns a list with the Path to each executable, in the order of `tools`.
+    """
+    for tool in tools:
+      self._request_tool(tool[0], tool[1])
+    return [self.ensure_tool(*tool) for tool in tools]
 
   def _full_arch(self, arch: str, bits: int | str) -> str:
     bits = int(bits)
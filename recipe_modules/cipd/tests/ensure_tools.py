@@ -0,0 +1,66 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+DEPS = [
+  'cipd',
+  'futures',
+  'path',
+  'step',
+]
+
+
+def RunSteps(api):
+  # Requests made by Futures spawned together are installed by one step.
+  futures = [
+      api.futures.spawn(api.cipd.ensure_tool, pkg, 'latest')
+      for pkg in ('infra/tools/a/${platform}', 'infra/tools/b/${platform}')
+  ]
+  a_exe = futures[0].result()
+  assert a_exe == api.cipd._tool_package_dir(
+      'infra/tools/a/${platform}', 'latest') / 'a', a_exe
+
+  # The next batch shares the root of the first one, so it lists the tools of
+  # the first batch too.
+  exes = api.cipd.ensure_tools([
+      ('infra/tools/c/${platform}', 'latest'),
+      ('infra/tools/a/${platform}', 'latest', 'bin/a'),
+      ('infra/tools/d', 'version:1'),
+  ])
+  assert exes[1] == a_exe.parent / 'bin' / 'a', exes
+
+  # A batch of a single tool is installed in the shared root too.
+  api.cipd.ensure_tools([('infra/tools/e', 'latest')])
+
+  api.step('run tools', [futures[1].result()] + exes)
+
+  # If one tool of a batch fails to install, the others still get installed,
+  # and only the callers of the bad tool get the error.
+  futures = [
+      api.futures.spawn(api.cipd.ensure_tool, pkg, 'latest')
+      for pkg in ('infra/tools/f', 'infra/tools/bad')
+  ]
+  api.step('run f', [futures[0].result()])
+  assert isinstance(futures[1].exception(), api.cipd.Error)
+  try:
+    api.cipd.ensure_tool('infra/tools/worse', 'latest')
+    assert 0  # pragma: no cover
+  except api.cipd.Error:
+    pass
+
+
+def GenTests(api):
+  yield api.test(
+      'basic',
+      api.step_data(
+          'install 2 tools (3).ensure_installed',
+          api.cipd.example_error('no such package: infra/tools/bad')),
+      api.step_data(
+          'install 2 tools (3).ensure_installed infra/tools/bad',
+          api.cipd.example_error('no such package: infra/tools/bad')),
+      api.step_data(
+          'install infra/tools/worse.ensure_installed',
+          api.cipd.example_error('no such package: infra/tools/worse')),
+  )
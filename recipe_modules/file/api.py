@@ -6,10 +6,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import fnmatch
 import hashlib
 import os
-from typing import Any, Callable, Literal, Sequence, TypeVar
+from typing import Any, Callable, Iterator, Literal, Sequence, TypeVar
 
 import google.protobuf
 from recipe_engine import config_types, recipe_api, recipe_test_api, step_data
@@ -88,6 +89,15 @@ class SymlinkTree:
     return self._api.step(name, args, infra_step=True)
 
 
+class _Batch:
+  """The file operations queued by FileApi.batch()."""
+
+  def __init__(self, name: str) -> None:
+    self.name = name
+    # (step name, fileutil.py arguments) of each queued operation.
+    self.ops: list[tuple[str, list[str]]] = []
+
+
 # TODO(iannucci): Introduce the concept of a 'native step' and implement these
 # directly in the current python interpreter without the need for a subprocess
 # invocation.
@@ -122,6 +132,97 @@ class FileApi(recipe_api.RecipeApi):
       return
     return self.m.path.assert_absolute(path_or_placeholder)
 
+  def __init__(self, **kwargs):
+    super().__init__(**kwargs)
+    # The current _Batch, if inside of `batch()`.
+    self._batch: _Batch | None = None
+
+  @contextlib.contextmanager
+  def batch(self, name: str = 'file operations') -> Iterator[None]:
+    """Runs the file operations issued in this context in a single step.
+
+    Every file operation is normally its own step, which starts a new python
+    interpreter. Inside of this context, operations which don't return data
+    (`copy`, `copytree`, `move`, `chmod`, `remove`, `rmtree`, `rmcontents`,
+    `rmglob`, `ensure_directory`, `symlink`, `truncate` and
+    `flatten_single_directories`, when called without placeholders) are
+    instead queued and run, in order, by one step called `name` when the
+    context exits. These operations return None instead of their step.
+
+    Any other file operation first runs the queued operations (as a step
+    called `name`), and then runs as its own step, as usual. Steps which aren't
+    file operations (e.g. `api.step`) do NOT run the queued operations first,
+    so they can't rely on the effects of the operations queued before them
+    until the context exits.
+
+    If an operation in the batch fails, the operations after it aren't run, and
+    a file.Error is raised, naming the failed operation. If the body of the
+    context raises, the operations it queued are dropped.
+
+    Nested `batch()` contexts join the outermost one.
+
+    Example:
+
+        with api.file.batch('prepare workdir'):
+          api.file.rmtree('clean out', out_dir)
+          for d in dirs:
+            api.file.ensure_directory('make %s' % d, out_dir / d)
+    """
+    if self._batch is not None:
+      yield
+      return
+
+    self._batch = _Batch(name)
+    try:
+      yield
+    except BaseException:
+      # The queued operations may depend on work which the body didn't get to
+      # do.
+      self._batch = None
+      raise
+    try:
+      self._flush_batch()
+    finally:
+      self._batch = None
+
+  def _flush_batch(self) -> None:
+    batch = self._batch
+    if not batch or not batch.ops:
+      return
+    names, ops = zip(*batch.ops)
+    batch.ops = []
+    result = self.m.step(
+        batch.name, [
+            'vpython3', '-u',
+            self.resource('fileutil.py'),
+            '--json-output', self.m.json.output(add_json_log=False),
+            'batch', self.m.json.input(list(ops)),
+        ],
+        step_test_data=self.test_api.errno,
+        infra_step=True)
+    result.presentation.logs['operations'] = [
+        '%s: %s' % (name, ' '.join(op)) for name, op in zip(names, ops)]
+    j = result.json.output
+    if not j['ok']:
+      failed = names[j.get('done', len(names) - 1)]
+      result.presentation.status = self.m.step.FAILURE
+      result.presentation.step_text = '%s: %s' % (failed, j['message'])
+      # pylint: disable=nonstandard-exception
+      raise self.Error(failed, j['errno_name'], j['message'])
+
+  def _run_or_queue(
+      self,
+      name: str,
+      args: Sequence[config_types.Path | str | recipe_api.Placeholder],
+  ) -> step_data.StepData | None:
+    """Like _run, but inside of `batch()` the operation is queued (unless any
+    of `args` is a placeholder) and None is returned."""
+    if (self._batch is not None and
+        not any(isinstance(a, recipe_api.Placeholder) for a in args)):
+      self._batch.ops.append((name, [str(a) for a in args]))
+      return None
+    return self._run(name, args)
+
   def _run(
       self,
       name: str,
@@ -129,6 +230,9 @@ class FileApi(recipe_api.RecipeApi):
       step_test_data: Callable[[], recipe_test_api.StepTestData] | None = None,
       stdout: config_types.Path | recipe_api.Placeholder | None = None,
   ) -> step_data.StepData:
+    # Queued operations have to run first.
+    self._flush_batch()
+
     if not step_test_data:
       step_test_data = self.test_api.errno
     args = [
@@ -155,7 +259,7 @@ class FileApi(recipe_api.RecipeApi):
       name: str,
       source: config_types.Path | str | recipe_api.Placeholder,
       dest: config_types.Path | str | recipe_api.Placeholder,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Copies a file (including mode bits) from source to destination on the
     local filesystem.
 
@@ -172,7 +276,7 @@ class FileApi(recipe_api.RecipeApi):
     """
     self._assert_absolute_path_or_placeholder(source)
     self._assert_absolute_path_or_placeholder(dest)
-    result = self._run(name, ['copy', source, dest])
+    result = self._run_or_queue(name, ['copy', source, dest])
     self.m.path.mock_copy_paths(source, dest)
     return result
 
@@ -184,7 +288,7 @@ class FileApi(recipe_api.RecipeApi):
       symlinks: bool = False,
       hardlink: bool = False,
       allow_override: bool = False,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Recursively copies a directory tree.
 
     Behaves identically to shutil.copytree.
@@ -213,7 +317,7 @@ class FileApi(recipe_api.RecipeApi):
       args += ['--hardlink']
     if allow_override:
       args += ['--allow-override']
-    result = self._run(name, ['copytree'] + args + [source, dest])
+    result = self._run_or_queue(name, ['copytree'] + args + [source, dest])
     self.m.path.mock_copy_paths(source, dest)
     return result
 
@@ -223,7 +327,7 @@ class FileApi(recipe_api.RecipeApi):
       path: config_types.Path | str,
       mode: str,
       recursive: bool = False,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Set the access mode for a file or directory.
 
     Args:
@@ -239,14 +343,14 @@ class FileApi(recipe_api.RecipeApi):
     cmd = ['chmod', path, '--mode', mode]
     if recursive:
       cmd.append('--recursive')
-    return self._run(name, cmd)
+    return self._run_or_queue(name, cmd)
 
   def move(
       self,
       name: str,
       source: config_types.Path | str,
       dest: config_types.Path | str,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Moves a file or directory.
 
     Behaves identically to shutil.move.
@@ -260,7 +364,7 @@ class FileApi(recipe_api.RecipeApi):
     """
     self.m.path.assert_absolute(source)
     self.m.path.assert_absolute(dest)
-    result = self._run(name, ['move', source, dest])
+    result = self._run_or_queue(name, ['move', source, dest])
     self.m.path.mock_copy_paths(source, dest)
     self.m.path.mock_remove_paths(source)
     return result
@@ -655,7 +759,7 @@ class FileApi(recipe_api.RecipeApi):
       self,
       name: str,
       source: config_types.Path | str,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Removes a file.
 
     Does not raise Error if the file doesn't exist.
@@ -667,7 +771,7 @@ class FileApi(recipe_api.RecipeApi):
     Raises: file.Error.
     """
     self.m.path.assert_absolute(source)
-    step = self._run(name, ['remove', source])
+    step = self._run_or_queue(name, ['remove', source])
     self.m.path.mock_remove_paths(source)
     return step
 
@@ -715,7 +819,7 @@ class FileApi(recipe_api.RecipeApi):
       name: str,
       dest: config_types.Path | str,
       mode: int = 0o777,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Ensures that `dest` exists and is a directory.
 
     Args:
@@ -728,7 +832,8 @@ class FileApi(recipe_api.RecipeApi):
     Raises: file.Error if the path exists but is not a directory.
     """
     self.m.path.assert_absolute(dest)
-    step = self._run(name, ['ensure-directory', '--mode', oct(mode), dest])
+    step = self._run_or_queue(
+        name, ['ensure-directory', '--mode', oct(mode), dest])
     self.m.path.mock_add_directory(dest)
     return step
 
@@ -764,7 +869,7 @@ class FileApi(recipe_api.RecipeApi):
       self,
       name: str,
       source: config_types.Path | str,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Recursively removes a directory.
 
     This uses a native python on Linux/Mac, and uses `rd` on Windows to avoid
@@ -778,7 +883,7 @@ class FileApi(recipe_api.RecipeApi):
     Raises: file.Error.
     """
     self.m.path.assert_absolute(source)
-    step = self._run(name, ['rmtree', source])
+    step = self._run_or_queue(name, ['rmtree', source])
     self.m.path.mock_remove_paths(str(source))
     return step
 
@@ -786,7 +891,7 @@ class FileApi(recipe_api.RecipeApi):
       self,
       name: str,
       source: config_types.Path | str,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Similar to rmtree, but removes only contents not the directory.
 
     This is useful e.g. when removing contents of current working directory.
@@ -801,7 +906,7 @@ class FileApi(recipe_api.RecipeApi):
     Raises: file.Error.
     """
     self.m.path.assert_absolute(source)
-    step = self._run(name, ['rmcontents', source])
+    step = self._run_or_queue(name, ['rmcontents', source])
     self.m.path.mock_remove_paths(str(source) + self.m.path.sep)
     return step
 
@@ -812,7 +917,7 @@ class FileApi(recipe_api.RecipeApi):
       pattern: str,
       recursive: bool = True,
       include_hidden: bool = True,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Removes all entries in `source` matching the glob `pattern`.
 
     glob rules for `pattern` follow the same syntax as for the stdlib `glob`
@@ -846,7 +951,7 @@ class FileApi(recipe_api.RecipeApi):
     cmd = ['rmglob', source, pattern]
     if include_hidden:
       cmd.append('--hidden')
-    step = self._run(name, cmd)
+    step = self._run_or_queue(name, cmd)
 
     src = str(source)
 
@@ -862,7 +967,7 @@ class FileApi(recipe_api.RecipeApi):
       name: str,
       source: config_types.Path | str | recipe_api.Placeholder,
       linkname: config_types.Path | str | recipe_api.Placeholder,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Creates a symlink on the local filesystem.
 
     Behaves identically to os.symlink.
@@ -876,7 +981,7 @@ class FileApi(recipe_api.RecipeApi):
     """
     self._assert_absolute_path_or_placeholder(source)
     self._assert_absolute_path_or_placeholder(linkname)
-    step = self._run(name, ['symlink', source, linkname])
+    step = self._run_or_queue(name, ['symlink', source, linkname])
     self.m.path.mock_copy_paths(source, linkname)
     return step
 
@@ -893,7 +998,7 @@ class FileApi(recipe_api.RecipeApi):
       name: str,
       path: config_types.Path | str,
       size_mb: int = 100,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Creates an empty file with path and size_mb on the local filesystem.
 
     Args:
@@ -904,13 +1009,13 @@ class FileApi(recipe_api.RecipeApi):
     Raises: file.Error
     """
     self._assert_absolute_path_or_placeholder(path)
-    return self._run(name, ['truncate', path, size_mb])
+    return self._run_or_queue(name, ['truncate', path, size_mb])
 
   def flatten_single_directories(
       self,
       name: str,
       path: config_types.Path | str,
-  ) -> step_data.StepData:
+  ) -> step_data.StepData | None:
     """Flattens singular directories, starting at path.
 
     Example:
@@ -939,4 +1044,4 @@ class FileApi(recipe_api.RecipeApi):
     Raises: file.Error
     """
     self.m.path.assert_absolute(path)
-    return self._run(name, ['flatten_single_directories', path])
+    return self._run_or_queue(name, ['flatten_single_directories', path])
@@ -0,0 +1,76 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+from recipe_engine import post_process
+
+DEPS = [
+  "file",
+  "path",
+  "step",
+]
+
+
+def RunSteps(api):
+  out = api.path.start_dir / 'out'
+
+  with api.file.batch('prepare out'):
+    api.file.rmtree('clean out', out)
+    for name in ('a', 'b', 'c'):
+      api.file.ensure_directory('make %s' % name, out / name)
+    with api.file.batch('ignored'):
+      api.file.truncate('make a/big', out / 'a' / 'big', size_mb=1)
+    # Runs the three operations above before listing `out`.
+    listing = api.file.listdir('list out', out, test_data=['a', 'b', 'c'])
+    assert listing == [out / 'a', out / 'b', out / 'c'], listing
+    api.file.copy('copy a/big', out / 'a' / 'big', out / 'b' / 'big')
+    api.file.move('move b/big', out / 'b' / 'big', out / 'c' / 'big')
+
+  # Empty batches don't run a step.
+  with api.file.batch('nothing'):
+    pass
+
+  try:
+    with api.file.batch('cleanup'):
+      api.file.remove('remove a/big', out / 'a' / 'big')
+      api.file.remove('remove c/big', out / 'c' / 'big')
+    assert False, "never reached"  # pragma: no cover
+  except api.file.Error as e:
+    assert e.errno_name == 'EPERM'
+    assert 'remove c/big' in str(e), str(e)
+
+  # Operations after a failed batch run as usual.
+  api.file.remove('remove a/big', out / 'a' / 'big')
+
+  # Operations queued by a body which raised are dropped.
+  try:
+    with api.file.batch('dropped'):
+      api.file.rmtree('remove b', out / 'b')
+      raise ValueError('oops')
+  except ValueError:
+    pass
+
+  # Steps which aren't file operations don't run the queued operations first;
+  # `list d` runs before `make d` does.
+  with api.file.batch('make d'):
+    api.file.ensure_directory('make d', out / 'd')
+    api.step('list d', ['ls', out / 'd'])
+
+
+def _runs_before(check, steps, first, second):
+  names = list(steps)
+  check(names.index(first) < names.index(second))
+
+
+def GenTests(api):
+  yield api.test(
+      'basic',
+      api.step_data('cleanup', api.file.batch_errno(1, 'EPERM')),
+      api.post_process(post_process.MustRun, 'prepare out', 'list out',
+                       'prepare out (2)', 'cleanup', 'remove a/big'),
+      api.post_process(post_process.DoesNotRun, 'nothing', 'ignored',
+                       'clean out', 'copy a/big', 'dropped'),
+      api.post_process(_runs_before, 'list d', 'make d'),
+  )
@@ -291,13 +291,8 @@ def _CopyForCopytree(src, dest, hardlink):
   else:
     shutil.copy2(src, dest)
 
-def main(args):
-  parser = argparse.ArgumentParser()
-  parser.add_argument('--json-output', required=True,
-                      type=argparse.FileType('w'),
-                      help="path to JSON output file")
-
-  subparsers = parser.add_subparsers()
+def _AddOps(subparsers):
+  """Adds a subparser for every file operation to `subparsers`."""
 
   # Subcommand: rmtree
   subparser = subparsers.add_parser('rmtree',
@@ -463,15 +458,57 @@ def main(args):
   subparser.add_argument('file_path', help='Absolute path for the file.')
   subparser.set_defaults(func=lambda opts: _CalculateHash(opts.file_path))
 
-  # Parse arguments.
-  opts = parser.parse_args(args)
 
-  # Actually do the thing.
+def _OpsParser():
+  parser = argparse.ArgumentParser(prog='fileutil.py batch')
+  _AddOps(parser.add_subparsers())
+  return parser
+
+
+def _Batch(ops_path, data):
+  """Runs the file operations listed (as argument lists) in the JSON file at
+  `ops_path`, in order.
+
+  Stops at the first operation which fails. data['done'] is set to the number
+  of operations which succeeded.
+  """
+  with open(ops_path) as f:
+    ops = json.load(f)
+  parser = _OpsParser()
+  data['done'] = 0
+  for op in ops:
+    opts = parser.parse_args(op)
+    opts.func(opts)
+    data['done'] += 1
+
+
+def main(args):
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--json-output', required=True,
+                      type=argparse.FileType('w'),
+                      help="path to JSON output file")
+
+  subparsers = parser.add_subparsers()
+  _AddOps(subparsers)
+
+  # The result, written to --json-output.
   data = {
     'ok': False,
     'errno_name': '',
     'message': '',
   }
+
+  # Subcommand: batch
+  subparser = subparsers.add_parser('batch',
+      help='Runs many file operations in this process.')
+  subparser.add_argument(
+      'ops', help='A JSON file with a list of operations (argument lists).')
+  subparser.set_defaults(func=lambda opts: _Batch(opts.ops, data))
+
+  # Parse arguments.
+  opts = parser.parse_args(args)
+
+  # Actually do the thing.
   try:
     opts.func(opts)
     data['ok'] = True
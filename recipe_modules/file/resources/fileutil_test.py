@@ -7,9 +7,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
+import tempfile
 import unittest
 from unittest import mock
 
@@ -76,6 +78,51 @@ class RmTreeTest(unittest.TestCase):
           fileutil._RmTree(invalid_path)
 
 
+class BatchTest(unittest.TestCase):
+
+  def setUp(self):
+    tmp = tempfile.TemporaryDirectory()
+    self.addCleanup(tmp.cleanup)
+    self.tmp = tmp.name
+
+  def _batch(self, ops):
+    ops_path = os.path.join(self.tmp, 'ops.json')
+    out_path = os.path.join(self.tmp, 'out.json')
+    with open(ops_path, 'w') as f:
+      json.dump(ops, f)
+    self.assertEqual(
+        fileutil.main(['--json-output', out_path, 'batch', ops_path]), 0)
+    with open(out_path) as f:
+      return json.load(f)
+
+  def test_batch(self):
+    src = os.path.join(self.tmp, 'src')
+    sub = os.path.join(self.tmp, 'sub')
+    with open(src, 'w') as f:
+      f.write('hi')
+    result = self._batch([
+        ['ensure-directory', '--mode', '0o777', sub],
+        ['copy', src, os.path.join(sub, 'dst')],
+        ['remove', src],
+    ])
+    self.assertTrue(result['ok'])
+    self.assertEqual(result['done'], 3)
+    self.assertFalse(os.path.exists(src))
+    self.assertTrue(os.path.isfile(os.path.join(sub, 'dst')))
+
+  def test_batch_stops_at_failure(self):
+    sub = os.path.join(self.tmp, 'sub')
+    result = self._batch([
+        ['ensure-directory', '--mode', '0o777', sub],
+        ['copy', os.path.join(self.tmp, 'missing'), sub],
+        ['rmtree', sub],
+    ])
+    self.assertFalse(result['ok'])
+    self.assertEqual(result['done'], 1)
+    self.assertEqual(result['errno_name'], 'ENOENT')
+    self.assertTrue(os.path.isdir(sub))
+
+
 if __name__ == '__main__':
   if '-v' in sys.argv:
     logging.basicConfig(level=logging.DEBUG)
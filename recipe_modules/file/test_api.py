@@ -180,3 +180,25 @@ class FileTestApi(recipe_test_api.RecipeTestApi):
       # will potentially have descriptive detail.
       data['message'] = 'file command encountered system error '+errno_name
     return self.m.json.output(data)
+
+  def batch_errno(self, failed_op, errno_name):
+    """Provides test mock for the step of a `batch`, causing the operation at
+    index `failed_op` (in the order they were issued) to raise a file.Error
+    exception.
+
+    Args:
+      failed_op (int) - The index of the operation which fails.
+      errno_name (str) - The errno error name that the operation should raise.
+
+    Example:
+      yield (api.test('my_test')
+        + api.step_data('file operations', api.file.batch_errno(1, 'EPERM'))
+      )
+    """
+    data = {
+        'ok': False,
+        'done': failed_op,
+        'errno_name': errno_name,
+        'message': 'file command encountered system error ' + errno_name,
+    }
+    return self.m.json.output(data)
@@ -97,13 +97,28 @@ def _cast_to_path_impl(path_mod, strpath: str) -> config_types.Path:
   return config_types.Path(config_types.ResolvedBasePath(drive), path)
 
 
+class _PathTrieNode:
+  """A node in path_set's trie of path components."""
+  __slots__ = ('children', 'seq')
+
+  def __init__(self) -> None:
+    self.children: dict[str, _PathTrieNode] = {}
+    # If the path ending at this node is in the path_set, the order in which it
+    # was added (relative to the other paths), otherwise None.
+    self.seq: int | None = None
+
+
 class path_set:
   """Implements a set which contains all the parents folders of added
   folders.
 
-  This all boils down to a flat, sorted, list of (strpath, kind) pairs, where
-  kind is reductively just FILE or DIRECTORY. This is a far cry from a real
-  filesystem. See crbug.com/40890779.
+  This all boils down to a flat mapping of strpath to kind, where kind is
+  reductively just FILE or DIRECTORY. This is a far cry from a real filesystem.
+  See crbug.com/40890779.
+
+  The paths are also indexed in a trie of their components (i.e. the strpath
+  split on the path separator), so that finding all the paths contained in
+  a directory only costs as much as the number of paths found.
 
   The initial set of paths is populated via the PathTestApi's files_exist and
   dirs_exist module data. These can either be regular config_types.Path
@@ -155,6 +170,9 @@ class path_set:
     # An entry in self._paths means an object exists in the mock filesystem.
     # The value (either FILE or DIRECTORY) is the type of that object.
     self._paths: dict[str, FileType] = {}
+    # The components of every path in self._paths.
+    self._trie = _PathTrieNode()
+    self._next_seq: int = 0
     for path, kind in initial_paths:
       if not isinstance(path, config_types.Path):  # pragma: no cover
         raise ValueError(
@@ -179,18 +197,47 @@ class path_set:
       self.add(path, kind)
     self._checkout_paths.clear()
 
-  def _is_contained_in(self, path: str, root: str, match_root: bool) -> bool:
-    """Returns True iff `path` is contained in `root`.
-    Returns `match_root` if `path` == `root`.
+  def _contained_in(self, root: str, match_root: bool) -> list[str]:
+    """Returns all paths contained in `root`, in the order they were added.
+
+    A path is contained in `root` if it starts with `root` followed by the path
+    separator (so that "/a/bcdef" is not contained in "/a/b"). `root` itself
+    is included iff `match_root`.
     """
-    if not path.startswith(root):
-      return False
-    if len(path) == len(root):
-      return match_root
-    # Note - this prevents simple lexical failures such as
-    #   "/a/bcdef" in "/a/b"
-    # (both have the prefix "/a/b", but "/a/bcdef" is not contained in "/a/b")
-    return path[len(root)] == self._path_mod.sep
+    sep = self._path_mod.sep
+    node = self._trie
+    pieces = root.split(sep)
+    for piece in pieces:
+      node = node.children.get(piece)
+      if node is None:
+        return []
+
+    ret: list[tuple[int, str]] = []
+    stack: list[tuple[list[str], _PathTrieNode]] = (
+        [(pieces, node)] if match_root else
+        [(pieces + [piece], child) for piece, child in node.children.items()])
+    while stack:
+      pieces, node = stack.pop()
+      if node.seq is not None:
+        ret.append((node.seq, sep.join(pieces)))
+      stack.extend(
+          (pieces + [piece], child) for piece, child in node.children.items())
+    ret.sort()
+    return [path for _, path in ret]
+
+  def _discard(self, path: str) -> None:
+    del self._paths[path]
+    # Unmark the node of `path`, and prune nodes which no longer lead anywhere.
+    nodes = [self._trie]
+    pieces = path.split(self._path_mod.sep)
+    for piece in pieces:
+      nodes.append(nodes[-1].children[piece])
+    nodes[-1].seq = None
+    for piece, parent, node in zip(
+        reversed(pieces), reversed(nodes[:-1]), reversed(nodes[1:])):
+      if node.seq is not None or node.children:
+        break
+      del parent.children[piece]
 
   def add(self, path: str | config_types.Path, kind: FileType):
     """Marks the existence of `path`.
@@ -201,6 +248,12 @@ class path_set:
     sPath: str = str(path)
     prev_path: str|None = None
     while sPath != prev_path:
+      if sPath not in self._paths:
+        node = self._trie
+        for piece in sPath.split(self._path_mod.sep):
+          node = node.children.setdefault(piece, _PathTrieNode())
+        node.seq = self._next_seq
+        self._next_seq += 1
       self._paths[sPath] = kind
       prev_path, sPath = sPath, self._path_mod.dirname(sPath)
       kind = FileType.DIRECTORY
@@ -214,9 +267,8 @@ class path_set:
     """
     source, dest = str(source), str(dest)
     to_add: dict[str, FileType] = {}
-    for p in self._paths:
-      if self._is_contained_in(p, source, match_root=True):
-        to_add[p.replace(source, dest)] = self._paths[p]
+    for p in self._contained_in(source, match_root=True):
+      to_add[p.replace(source, dest)] = self._paths[p]
     for path, kind in to_add.items():
       self.add(path, kind)
 
@@ -233,11 +285,9 @@ class path_set:
     if path[-1] == self._path_mod.sep:
       match_root = False
       path = path.rstrip(self._path_mod.sep)
-    kill_set: set[str] = set(
-        p for p in self._paths
-        if self._is_contained_in(p, path, match_root) and filt(p))
-    for entry in kill_set:
-      del self._paths[entry]
+    for entry in self._contained_in(path, match_root):
+      if filt(entry):
+        self._discard(entry)
 
   def contains(self, path: str) -> bool:
     return path in self._paths
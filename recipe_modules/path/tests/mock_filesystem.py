@@ -0,0 +1,50 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+from recipe_engine.post_process import DropExpectation
+
+DEPS = [
+    'recipe_engine/path',
+]
+
+
+def RunSteps(api):
+  root = api.path.start_dir
+  api.path.mock_add_file(root / 'a' / 'b' / 'file')
+  api.path.mock_add_file(root / 'a' / 'bcdef')
+
+  # Copying something which doesn't exist does nothing.
+  api.path.mock_copy_paths(root / 'nope', root / 'also nope')
+  assert not api.path.exists(root / 'also nope')
+
+  # "a/bcdef" isn't contained in "a/b".
+  api.path.mock_copy_paths(root / 'a' / 'b', root / 'c')
+  assert api.path.isdir(root / 'c')
+  assert api.path.isfile(root / 'c' / 'file')
+  assert not api.path.exists(root / 'cdef')
+
+  # A trailing separator removes the contents, but not the directory itself.
+  api.path.mock_remove_paths(str(root / 'c') + api.path.sep)
+  assert api.path.isdir(root / 'c')
+  assert not api.path.exists(root / 'c' / 'file')
+
+  api.path.mock_remove_paths(
+      root / 'a', should_remove=lambda p: p.endswith('file'))
+  assert api.path.isdir(root / 'a' / 'b')
+  assert not api.path.exists(root / 'a' / 'b' / 'file')
+  assert api.path.isfile(root / 'a' / 'bcdef')
+
+  api.path.mock_remove_paths(root / 'a' / 'b')
+  assert not api.path.exists(root / 'a' / 'b')
+  assert api.path.isfile(root / 'a' / 'bcdef')
+
+  # Paths can be added again after being removed.
+  api.path.mock_add_directory(root / 'a' / 'b')
+  assert api.path.isdir(root / 'a' / 'b')
+
+
+def GenTests(api):
+  yield api.test('basic', api.post_process(DropExpectation))
@@ -11,6 +11,7 @@ DEPS = [
     'cas',
     'cipd',
     'context',
+    'futures',
     'json',
     'path',
     'properties',
@@ -1512,6 +1512,132 @@ class SwarmingApi(recipe_api.RecipeApi):
 
     return parsed_results
 
+  def iter_collect(self, name, tasks, output_dir=None, text_output_dir=None,
+                   timeout=None, verbose=False, download_cost=None):
+    """Yields the results of a set of Swarming tasks as they finish.
+
+    Unlike `collect`, which returns once all the tasks finished, this lets the
+    caller process the results of tasks which finish early while the others
+    are still running. Each step named `name` waits (with
+    `swarming collect -eager`) until at least one of the unfinished tasks
+    finishes.
+
+    Outputs are downloaded separately for each finished task, concurrently
+    with the other downloads and with waiting for the remaining tasks. The
+    text output of the tasks is written to files rather than loaded into the
+    step's logs; see TaskResult.text_output_file.
+
+    Args:
+      name (str): The name of the steps waiting for the tasks.
+      tasks (Iterable(str|TaskRequestMetadata)): A list of task IDs or metadata
+        objects corresponding to tasks to wait for.
+      output_dir (Path|None): Where to download the tasks' CAS outputs. If set
+        to None, they will not be downloaded; else, a given task's outputs
+        will be downloaded to output_dir/<task id>/.
+      text_output_dir (Path|None): Where to write each task's text output, as
+        <task id>.txt. Defaults to a new temporary directory.
+      timeout (str|None): The duration for which to wait for the next task to
+        finish, in the format described by
+        https://golang.org/pkg/time/#ParseDuration. Tasks which are still
+        unfinished then are yielded as results in an unknown state.
+      verbose (bool): Whether to use verbose logs.
+      download_cost (ResourceCost|None): The cost of each download step. If not
+        specified, the step's default cost is used.
+
+    Yields TaskResult objects, in the order in which they become available
+    (and by name for tasks which finished at the same time).
+    """
+    assert self._server
+    assert isinstance(tasks, (list, tuple))
+
+    pending = {}
+    for idx, task in enumerate(tasks):
+      if isinstance(task, basestring):
+        pending[task] = 'my_task_%d' % idx
+      elif isinstance(task, TaskRequestMetadata):
+        pending[task.id] = task.name
+      else:
+        raise ValueError("%s must be a string or TaskRequestMetadata object" %
+                         task.__repr__())  # pragma: no cover
+
+    if text_output_dir is None:
+      text_output_dir = self.m.path.mkdtemp('swarming-output')
+    # See collect().
+    cost = self.m.step.ResourceCost(cpu=int(self.m.step.CPU_CORE / 10))
+
+    def download(result):
+      self.m.cas.download(
+          'download outputs: %s' % result.name, result.cas_outputs.digest,
+          result.output_dir, instance=result.cas_outputs.instance,
+          cost=download_cost)
+      return result
+
+    downloads = []
+    while pending or downloads:
+      ready = []
+      if pending:
+        cmd = [
+            'collect',
+            '-server',
+            self._server,
+            '-task-summary-json',
+            self.m.json.output(),
+            '-task-output-stdout',
+            'dir:%s' % text_output_dir,
+            '-eager',
+        ]
+        if timeout:
+          cmd.extend(['-timeout', timeout])
+        if verbose:
+          cmd.append('-verbose')
+        cmd.extend(pending)
+        test_data = [
+            self.test_api.task_result(id=task_id, name=task_name, output=None)
+            for task_id, task_name in pending.items()
+        ]
+        step = self._run(
+            name,
+            cmd,
+            step_test_data=lambda: self.test_api.collect(test_data),
+            cost=cost,
+        )
+
+        finished = []
+        for task_id, task in step.json.output.items():
+          task_request = self._task_requests.get(
+              (task_id, self._server), [None])[0]
+          result = TaskResult(
+              self.m, task_request, task_id, task,
+              output_dir / task_id if output_dir else None,
+              text_output_dir / f'{task_id}.txt')
+          if result.finalized:
+            pending.pop(task_id, None)
+            finished.append(result)
+        finished.sort(key=lambda result: result.name or '')
+
+        for result in finished:
+          if result.cas_outputs:
+            link_name = 'task cas outputs: %s' % result.name
+            step.presentation.links[link_name] = result.cas_outputs.url
+          if result.output_dir and result.cas_outputs:
+            downloads.append(
+                self.m.futures.spawn(
+                    download, result,
+                    __name='recipe_engine/swarming: download %s' % result.id))
+          else:
+            ready.append(result)
+
+      yield from ready
+
+      # Yield downloaded results; once no task is left to wait for, wait for
+      # the downloads instead.
+      done = [f for f in downloads if f.done]
+      if not pending and not done and downloads:
+        done = self.m.futures.wait(downloads, count=1)
+      for f in done:
+        downloads.remove(f)
+        yield f.result()
+
   def show_request(self, name, task):
     """Retrieve the TaskRequest for a Swarming task.
 
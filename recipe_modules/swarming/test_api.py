@@ -203,6 +203,26 @@ class SwarmingTestApi(recipe_test_api.RecipeTestApi):
 
     return raw_results
 
+  @staticmethod
+  def unfinished_task_result(id, name, state=TaskState.RUNNING):
+    """
+    Returns the raw results of a Swarming task which has not finished yet, as
+    reported by an eager collect.
+
+    Args:
+      id (str): The ID of the task.
+      name (str): The name of the task.
+      state (TaskState): Either TaskState.PENDING or TaskState.RUNNING.
+    """
+    assert state in (TaskState.PENDING, TaskState.RUNNING), state
+    return {
+        'results': {
+            'name': name,
+            'task_id': id,
+            'state': state.name,
+        },
+    }
+
   def collect(self, task_results):
     """Generates test step data for the swarming API collect method.
 
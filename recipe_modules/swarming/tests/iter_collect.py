@@ -0,0 +1,88 @@
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+from recipe_engine import post_process
+
+DEPS = [
+    'path',
+    'properties',
+    'step',
+    'swarming',
+]
+
+
+def RunSteps(api):
+  output_dir = None
+  if api.properties.get('download', True):
+    output_dir = api.path.start_dir / 'outputs'
+  tasks = ['1', '2', '3']
+  if api.properties.get('trigger'):
+    request = api.swarming.task_request().with_name('triggered')
+    request = request.with_slice(
+        0, request[0].with_command(['echo']).with_dimensions(pool='pool'))
+    tasks = api.swarming.trigger('trigger', [request])
+  for result in api.swarming.iter_collect(
+      'collect', tasks,
+      output_dir=output_dir,
+      timeout='1h',
+      verbose=True,
+      download_cost=api.step.ResourceCost(cpu=api.step.CPU_CORE // 4)):
+    api.step.empty(
+        'process %s' % result.name,
+        step_text=result.state.name if result.state else 'unknown')
+
+
+def GenTests(api):
+  TaskState = api.swarming.TaskState
+
+  yield api.test('basic')
+
+  yield api.test(
+      'streaming',
+      api.step_data(
+          'collect',
+          api.swarming.collect([
+              api.swarming.task_result(id='1', name='my_task_0'),
+              api.swarming.unfinished_task_result(id='2', name='my_task_1'),
+              api.swarming.unfinished_task_result(
+                  id='3', name='my_task_2', state=TaskState.PENDING),
+          ])),
+      api.step_data(
+          'collect (2)',
+          api.swarming.collect([
+              api.swarming.task_result(
+                  id='2', name='my_task_1', failure=True),
+              api.swarming.unfinished_task_result(id='3', name='my_task_2'),
+          ])),
+      api.step_data(
+          'collect (3)',
+          api.swarming.collect([
+              api.swarming.task_result(
+                  id='3', name='my_task_2', state=TaskState.TIMED_OUT),
+          ])),
+  )
+
+  yield api.test(
+      'no download',
+      api.properties(download=False),
+      api.step_data(
+          'collect',
+          api.swarming.collect([
+              api.swarming.task_result(id='1', name='my_task_0'),
+              api.swarming.task_result(id='2', name='my_task_1', state=None),
+              api.swarming.unfinished_task_result(id='3', name='my_task_2'),
+          ])),
+      api.post_check(post_process.MustRun, 'process my_task_0', 'process None',
+                     'collect (2)', 'process my_task_2'),
+      api.post_check(post_process.DoesNotRun, 'download outputs: my_task_0'),
+  )
+
+  yield api.test(
+      'triggered',
+      api.properties(trigger=True),
+      api.post_check(post_process.MustRun, 'process triggered'),
+      api.post_process(post_process.DropExpectation),
+  )
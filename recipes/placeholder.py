@@ -492,8 +492,6 @@ def GenTests(api: TEST_DEPS):
       ))
 
   def _assert_workplan(assert_, workplan: WorkPlan):
-    # TODO (b/483105203): get_check_by_short_id() is currently O(N), which readers
-    # might not expect. Remove this comment when we optimize the function later.
     charlie = get_check_by_short_id(workplan, 'charlie')
     assert charlie
     assert_(charlie.identifier.id == 'charlie')
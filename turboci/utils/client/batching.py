@@ -0,0 +1,391 @@
+# Copyright 2026 The Chromium Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""Write batching for TurboCI Orchestrator clients.
+
+BatchingSync and BatchingAsync wrap a Sync or Async client and coalesce
+non-transactional WriteNodes requests issued within a short window into a
+single WriteNodesRequest, allowing several such requests to be in flight at
+once.
+
+Writes are only coalesced when this doesn't change their meaning:
+  * They have no `txn` and no `current_stage`, and don't transition the
+    current attempt (plain heartbeats, details and progress are fine).
+  * They have the same `reason`, `token` and CallOptions.
+  * They don't write the same check or stage (the Orchestrator rejects
+    duplicate writes to a node within one request).
+  * The coalesced request stays within BatchOptions.max_writes and
+    BatchOptions.max_request_bytes.
+
+Any other write is sent in a request of its own.
+
+WriteNodes is atomic, so when a coalesced request fails with a non-retryable
+error, none of its writes were applied. Each write is then re-sent on its own,
+so that every write gets its own result or error.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import threading
+import typing
+
+from PB.turboci.graph.orchestrator.v1 import write_nodes_request as write_nodes_request_pb2
+from PB.turboci.graph.orchestrator.v1 import write_nodes_response as write_nodes_response_pb2
+from turboci.utils import ids
+from turboci.utils.client import clients
+from turboci.utils.client import errors
+from turboci.utils.client import transports
+
+__all__ = [
+    'BatchOptions',
+    'BatchingAsync',
+    'BatchingSync',
+]
+
+
+_FutureT = typing.TypeVar(
+    '_FutureT', concurrent.futures.Future, asyncio.Future
+)
+
+
+@dataclasses.dataclass(kw_only=True)
+class BatchOptions:
+  """Options for BatchingSync and BatchingAsync."""
+
+  # How long (in seconds) a write may wait for other writes to be coalesced
+  # with before it's sent.
+  window_sec: float = 0.05
+
+  # Maximum number of check and stage writes in one coalesced request.
+  max_writes: int = 500
+
+  # Maximum (approximate) size of one coalesced request, in bytes. This should
+  # stay comfortably below the transport's message size limit.
+  max_request_bytes: int = 3 * 1024 * 1024
+
+  # Maximum number of WriteNodes calls in flight at once.
+  max_in_flight: int = 4
+
+
+def _batchable(req: write_nodes_request_pb2.WriteNodesRequest) -> bool:
+  return not (
+      req.HasField('txn')
+      or req.HasField('current_stage')
+      or req.current_attempt.HasField('state_transition')
+  )
+
+
+@dataclasses.dataclass
+class _Batch(typing.Generic[_FutureT]):
+  """WriteNodes requests (and their futures) to send as one request."""
+
+  opts: BatchOptions
+  options: transports.CallOptions | None
+
+  writes: list[
+      tuple[write_nodes_request_pb2.WriteNodesRequest, _FutureT]
+  ] = dataclasses.field(default_factory=list)
+
+  _num_writes: int = 0
+  _num_bytes: int = 0
+  _node_ids: set[str] = dataclasses.field(default_factory=set)
+
+  @property
+  def full(self) -> bool:
+    return (
+        self._num_writes >= self.opts.max_writes
+        or self._num_bytes >= self.opts.max_request_bytes
+    )
+
+  def try_add(
+      self,
+      req: write_nodes_request_pb2.WriteNodesRequest,
+      options: transports.CallOptions | None,
+      fut: _FutureT,
+  ) -> bool:
+    """Adds `req` to this batch, if it can be coalesced with it."""
+    node_ids = {ids.to_string(w.identifier) for w in req.checks}
+    node_ids.update(ids.to_string(w.identifier) for w in req.stages)
+    num_writes = len(req.checks) + len(req.stages)
+    num_bytes = req.ByteSize()
+
+    if self.writes:
+      first = self.writes[0][0]
+      if not (
+          _batchable(req)
+          and _batchable(first)
+          and options == self.options
+          and req.reason == first.reason
+          and req.token == first.token
+          and self._node_ids.isdisjoint(node_ids)
+          and self._num_writes + num_writes <= self.opts.max_writes
+          and self._num_bytes + num_bytes <= self.opts.max_request_bytes
+      ):
+        return False
+
+    self.writes.append((req, fut))
+    self._num_writes += num_writes
+    self._num_bytes += num_bytes
+    self._node_ids.update(node_ids)
+    return True
+
+  def request(self) -> write_nodes_request_pb2.WriteNodesRequest:
+    """Returns the coalesced WriteNodesRequest."""
+    if len(self.writes) == 1:
+      return self.writes[0][0]
+    first = self.writes[0][0]
+    ret = write_nodes_request_pb2.WriteNodesRequest(reason=first.reason)
+    if first.HasField('token'):
+      ret.token = first.token
+    for req, _ in self.writes:
+      ret.checks.extend(req.checks)
+      ret.stages.extend(req.stages)
+      if req.HasField('current_attempt'):
+        ret.current_attempt.MergeFrom(req.current_attempt)
+    return ret
+
+  def should_split(self, exc: Exception) -> bool:
+    """Returns True if the writes of this batch should be re-sent one at a
+    time, after sending the coalesced request raised `exc`."""
+    return (
+        len(self.writes) > 1
+        and isinstance(exc, errors.RPCError)
+        and not isinstance(exc, errors.RetryableRPCError)
+    )
+
+  def resolve(self, rsp: write_nodes_response_pb2.WriteNodesResponse):
+    for _, fut in self.writes:
+      _set_result(fut, rsp)
+
+  def fail(self, exc: Exception):
+    for _, fut in self.writes:
+      _set_exception(fut, exc)
+
+
+def _set_result(fut: _FutureT, rsp: write_nodes_response_pb2.WriteNodesResponse):
+  # NOTE: asyncio futures may have been cancelled by the caller.
+  if not fut.done():
+    fut.set_result(rsp)
+
+
+def _set_exception(fut: _FutureT, exc: Exception):
+  if not fut.done():
+    fut.set_exception(exc)
+
+
+@dataclasses.dataclass(kw_only=True)
+class BatchingSync:
+  """Coalesces the WriteNodes calls made through it to a Sync client.
+
+  `write` queues a write without waiting for it, and returns a Future of its
+  WriteNodesResponse. Queued writes are sent once BatchOptions.window_sec has
+  passed, when the batch is full, or on `flush`. All writes coalesced into one
+  request get the same WriteNodesResponse.
+
+  Writes sent in different requests may be applied in any order when
+  BatchOptions.max_in_flight is more than 1; wait for the result of a write
+  before queuing writes which rely on it (e.g. dependencies on checks it
+  creates).
+
+  Reads made directly with `client` don't observe queued writes; call `flush`
+  first.
+
+  Example:
+    with BatchingSync(client=client) as batcher:
+      for check_write in check_writes:
+        batcher.write(WriteNodesRequest(
+            reason=reason, checks=[check_write]))
+  """
+
+  # (required) The client to send the coalesced requests with.
+  client: clients.Sync
+
+  opts: BatchOptions = dataclasses.field(default_factory=BatchOptions)
+
+  def __post_init__(self):
+    # pylint: disable=attribute-defined-outside-init
+    self._mu = threading.Lock()
+    self._pending: _Batch[concurrent.futures.Future] | None = None
+    self._timer: threading.Timer | None = None
+    self._in_flight: set[concurrent.futures.Future] = set()
+    self._pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=self.opts.max_in_flight,
+        thread_name_prefix='turboci-batching',
+    )
+
+  def write(
+      self,
+      req: write_nodes_request_pb2.WriteNodesRequest,
+      options: transports.CallOptions | None = None,
+  ) -> concurrent.futures.Future[write_nodes_response_pb2.WriteNodesResponse]:
+    """Queues `req` to be sent, possibly coalesced with other writes."""
+    fut: concurrent.futures.Future = concurrent.futures.Future()
+    with self._mu:
+      if self._pending and not self._pending.try_add(req, options, fut):
+        self._flush_locked()
+      if not self._pending:
+        self._pending = _Batch(self.opts, options)
+        self._pending.try_add(req, options, fut)
+        self._timer = threading.Timer(
+            self.opts.window_sec, self._flush_batch, (self._pending,)
+        )
+        self._timer.daemon = True
+        self._timer.start()
+      if self._pending.full or not _batchable(req):
+        self._flush_locked()
+    return fut
+
+  def WriteNodes(
+      self,
+      req: write_nodes_request_pb2.WriteNodesRequest,
+      options: transports.CallOptions | None = None,
+  ) -> write_nodes_response_pb2.WriteNodesResponse:
+    """Sends `req` together with any queued writes, and waits for it."""
+    fut = self.write(req, options)
+    with self._mu:
+      self._flush_locked()
+    return fut.result()
+
+  def flush(self):
+    """Sends all queued writes, and waits for all writes in flight."""
+    with self._mu:
+      self._flush_locked()
+      in_flight = list(self._in_flight)
+    concurrent.futures.wait(in_flight)
+
+  def close(self):
+    """Flushes all writes, and stops accepting new ones."""
+    self.flush()
+    self._pool.shutdown()
+
+  def __enter__(self) -> BatchingSync:
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+    _ = (exc_type, exc_val, exc_tb)
+    self.close()
+
+  def _flush_batch(self, batch: _Batch):
+    with self._mu:
+      if self._pending is batch:
+        self._flush_locked()
+
+  def _flush_locked(self):
+    batch, self._pending = self._pending, None
+    if self._timer:
+      self._timer.cancel()
+      self._timer = None
+    if batch:
+      sent = self._pool.submit(self._send, batch)
+      self._in_flight.add(sent)
+      sent.add_done_callback(self._in_flight.discard)
+
+  def _send(self, batch: _Batch):
+    try:
+      batch.resolve(self.client.WriteNodes(batch.request(), batch.options))
+    except Exception as e:  # pylint: disable=broad-except
+      if not batch.should_split(e):
+        batch.fail(e)
+        return
+      for req, fut in batch.writes:
+        try:
+          _set_result(fut, self.client.WriteNodes(req, batch.options))
+        except Exception as req_e:  # pylint: disable=broad-except
+          _set_exception(fut, req_e)
+
+
+@dataclasses.dataclass(kw_only=True)
+class BatchingAsync:
+  """Coalesces the WriteNodes calls made through it to an Async client.
+
+  This works the same way as BatchingSync, except that `write` returns an
+  asyncio.Future, and that it must be used from a single event loop.
+  """
+
+  # (required) The client to send the coalesced requests with.
+  client: clients.Async
+
+  opts: BatchOptions = dataclasses.field(default_factory=BatchOptions)
+
+  def __post_init__(self):
+    # pylint: disable=attribute-defined-outside-init
+    self._pending: _Batch[asyncio.Future] | None = None
+    self._timer: asyncio.TimerHandle | None = None
+    self._in_flight: set[asyncio.Task] = set()
+    self._sem = asyncio.Semaphore(self.opts.max_in_flight)
+
+  def write(
+      self,
+      req: write_nodes_request_pb2.WriteNodesRequest,
+      options: transports.CallOptions | None = None,
+  ) -> asyncio.Future[write_nodes_response_pb2.WriteNodesResponse]:
+    """Queues `req` to be sent, possibly coalesced with other writes."""
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    if self._pending and not self._pending.try_add(req, options, fut):
+      self._flush()
+    if not self._pending:
+      self._pending = _Batch(self.opts, options)
+      self._pending.try_add(req, options, fut)
+      self._timer = loop.call_later(
+          self.opts.window_sec, self._flush_batch, self._pending
+      )
+    if self._pending.full or not _batchable(req):
+      self._flush()
+    return fut
+
+  async def WriteNodes(
+      self,
+      req: write_nodes_request_pb2.WriteNodesRequest,
+      options: transports.CallOptions | None = None,
+  ) -> write_nodes_response_pb2.WriteNodesResponse:
+    """Sends `req` together with any queued writes, and waits for it."""
+    fut = self.write(req, options)
+    self._flush()
+    return await fut
+
+  async def flush(self):
+    """Sends all queued writes, and waits for all writes in flight."""
+    self._flush()
+    if self._in_flight:
+      await asyncio.wait(list(self._in_flight))
+
+  async def __aenter__(self) -> BatchingAsync:
+    return self
+
+  async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+    _ = (exc_type, exc_val, exc_tb)
+    await self.flush()
+
+  def _flush_batch(self, batch: _Batch):
+    if self._pending is batch:
+      self._flush()
+
+  def _flush(self):
+    batch, self._pending = self._pending, None
+    if self._timer:
+      self._timer.cancel()
+      self._timer = None
+    if batch:
+      sent = asyncio.create_task(self._send(batch))
+      self._in_flight.add(sent)
+      sent.add_done_callback(self._in_flight.discard)
+
+  async def _send(self, batch: _Batch):
+    async with self._sem:
+      try:
+        batch.resolve(
+            await self.client.WriteNodes(batch.request(), batch.options)
+        )
+      except Exception as e:  # pylint: disable=broad-except
+        if not batch.should_split(e):
+          batch.fail(e)
+          return
+        for req, fut in batch.writes:
+          try:
+            _set_result(fut, await self.client.WriteNodes(req, batch.options))
+          except Exception as req_e:  # pylint: disable=broad-except
+            _set_exception(fut, req_e)
@@ -14,15 +14,18 @@ __all__ = [
 ]
 
 import base64
+import collections
+import concurrent.futures
 import hashlib
 import io
+import os
 import struct
+import threading
 import typing
 
 from google.protobuf import any_pb2
 from google.protobuf import message
 from google.protobuf.internal import encoder
-from google.protobuf.internal import wire_format
 
 from PB.turboci.graph.orchestrator.v1 import value_digest as value_digest_pb2
 
@@ -90,6 +93,112 @@ _decode_varint = _varint_decoder()
 _sha256_size = hashlib.sha256().digest_size
 
 
+# (type_url, value) of an Any.
+_AnyFields = tuple[str, bytes]
+
+# The size of the samples of large values used by _cache_key.
+_CACHE_KEY_SAMPLE = 256
+
+
+def _cache_key(fields: _AnyFields) -> typing.Hashable:
+  """Returns the key of `fields` in _DigestCache.
+
+  Hashing all of a large value (as using it as a dict key would) costs nearly
+  as much as computing its digest, so large values are keyed on their length
+  and a sample of their bytes instead. Different values may then have the same
+  key, so lookups compare the actual values as well.
+  """
+  type_url, value = fields
+  n = len(value)
+  if n <= 3 * _CACHE_KEY_SAMPLE:
+    return fields
+  mid = n // 2
+  return (
+      type_url,
+      n,
+      value[:_CACHE_KEY_SAMPLE],
+      value[mid:mid + _CACHE_KEY_SAMPLE],
+      value[-_CACHE_KEY_SAMPLE:],
+  )
+
+
+class _DigestCache:
+  """A thread-safe LRU cache of Digests, keyed on the (type_url, value) of the
+  Any they were computed from.
+
+  The same values tend to be digested over and over again (e.g. each time they
+  are written, or compared with a ValueRef), so this lets them be looked up
+  rather than hashed again. The cache is bounded both by its number of entries
+  and by the total size of the values it holds on to.
+  """
+
+  def __init__(self, max_entries: int, max_bytes: int):
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self._mu = threading.Lock()
+    # _cache_key -> (fields, Digest)
+    self._entries: collections.OrderedDict[
+        typing.Hashable, tuple[_AnyFields, Digest]
+    ] = collections.OrderedDict()
+    self._bytes = 0
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def get(self, fields: _AnyFields) -> Digest | None:
+    key = _cache_key(fields)
+    with self._mu:
+      entry = self._entries.get(key)
+      if entry is None or entry[0] != fields:
+        return None
+      self._entries.move_to_end(key)
+      return entry[1]
+
+  def put(self, fields: _AnyFields, dgst: Digest):
+    size = len(fields[0]) + len(fields[1])
+    if size > self.max_bytes:
+      return
+    key = _cache_key(fields)
+    with self._mu:
+      if (old := self._entries.pop(key, None)) is not None:
+        self._bytes -= len(old[0][0]) + len(old[0][1])
+      self._entries[key] = (fields, dgst)
+      self._bytes += size
+      while (
+          len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+      ):
+        _, ((type_url, value), _) = self._entries.popitem(last=False)
+        self._bytes -= len(type_url) + len(value)
+
+
+_cache = _DigestCache(max_entries=4096, max_bytes=64 * 1024 * 1024)
+
+# Digest.compute_many hashes values in parallel when they add up to at least
+# this many bytes; hashlib releases the GIL while hashing large buffers.
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _compute(fields: _AnyFields) -> Digest:
+  """Calculates the Digest of the Any with the given (type_url, value).
+
+  The deterministic serialization of the Any is hashed as it's written, and its
+  size is counted at the same time.
+  """
+  h = hashlib.sha256(usedforsecurity=False)
+  data_len = 0
+
+  def _write(b: bytes):
+    nonlocal data_len
+    h.update(b)
+    data_len += len(b)
+
+  _write_any_fields(fields[0], fields[1], _write)
+  buf = bytearray(h.digest())
+  _encode_varint(buf.extend, data_len)
+  buf.append(value_digest_pb2.VALUE_HASH_ALGO_SHA256)
+  return Digest(base64.urlsafe_b64encode(buf).rstrip(b'=').decode())
+
+
 class Digest(str):
   """Digest is the string form of the digest in a ValueRef.
 
@@ -102,19 +211,59 @@ class Digest(str):
 
   @staticmethod
   def compute(data: any_pb2.Any) -> Digest:
-    """Calculates a Digest from `data`."""
-
-    h = hashlib.sha256(usedforsecurity=False)
-    data_len = _size_any(data)
-    _write_any_bytes(data, h.update)
-    dgst = h.digest()
-    buf = io.BytesIO()
-    buf.truncate(len(dgst) + wire_format.Int32ByteSizeNoTag(data_len) + 1)
-    buf.write(dgst)
-    _encode_varint(buf.write, data_len)
-    buf.write(value_digest_pb2.VALUE_HASH_ALGO_SHA256.to_bytes(1, 'big'))
-    ret = base64.urlsafe_b64encode(buf.getbuffer()).rstrip(b'=')
-    return Digest(ret.decode())
+    """Calculates a Digest from `data`.
+
+    Digests of recently seen values are cached, keyed on their contents.
+    """
+    fields = (data.type_url, data.value)
+    ret = _cache.get(fields)
+    if ret is None:
+      ret = _compute(fields)
+      _cache.put(fields, ret)
+    return ret
+
+  @staticmethod
+  def compute_many(datas: typing.Iterable[any_pb2.Any]) -> list[Digest]:
+    """Calculates the Digests of all of `datas`, in order.
+
+    Equivalent to calling `compute` for each of `datas`, except that values
+    which occur several times are only hashed once, and that large values are
+    hashed in parallel.
+    """
+    all_fields = [(data.type_url, data.value) for data in datas]
+    ret = [_cache.get(fields) for fields in all_fields]
+
+    # Indices of the distinct values to compute, and of the values which are
+    # the same as one of them.
+    todo: list[int] = []
+    dups: list[tuple[int, int]] = []
+    first_by_key: dict[typing.Hashable, int] = {}
+    for i, fields in enumerate(all_fields):
+      if ret[i] is not None:
+        continue
+      j = first_by_key.setdefault(_cache_key(fields), i)
+      if j != i and all_fields[j] == fields:
+        dups.append((i, j))
+      else:
+        todo.append(i)
+
+    workers = min(len(todo), os.cpu_count() or 1)
+    to_compute = [all_fields[i] for i in todo]
+    if (
+        workers > 1
+        and sum(len(value) for _, value in to_compute) >= _PARALLEL_MIN_BYTES
+    ):
+      with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+        computed = list(pool.map(_compute, to_compute))
+    else:
+      computed = [_compute(fields) for fields in to_compute]
+
+    for i, dgst in zip(todo, computed):
+      ret[i] = dgst
+      _cache.put(all_fields[i], dgst)
+    for i, j in dups:
+      ret[i] = ret[j]
+    return typing.cast(list[Digest], ret)
 
   def to_proto(self) -> value_digest_pb2.ValueDigest:
     """Decodes a Digest to its ValueDigest form.
@@ -162,32 +311,37 @@ _any_value_sizer = typing.cast(
 )
 
 
-def _size_any(data: any_pb2.Any) -> int:
+def _size_any_fields(type_url: str, value: bytes) -> int:
   ret = 0
-  if type_url := data.type_url:
+  if type_url:
     ret += _any_type_url_sizer(type_url)
-  if value := data.value:
+  if value:
     ret += _any_value_sizer(value)
   return ret
 
 
-def _write_any_bytes(data: any_pb2.Any, w: typing.Any):
+def _write_any_fields(type_url: str, value: bytes, w: typing.Any):
   """Write the bytes for an Any to the given writer function.
 
+  NOTE: Accessing `value` of an Any copies it, so this takes the fields of the
+  Any rather than the Any itself, to let callers access them just once.
+
   Args:
-    data: The Any message to write.
+    type_url: The type_url of the Any to write.
+    value: The value of the Any to write.
     w: The writer function to write to (callable taking Buffer as first
       argument). This is hard to make a proper type annotation for in 3.11.
   """
-  if type_url := data.type_url:
+  if type_url:
     _any_type_url_encoder(w, type_url, True)
-  if value := data.value:
+  if value:
     _any_value_tag_encoder(w, value, True)
 
 
 def deterministially_serialize_any(data: any_pb2.Any) -> bytes:
   """Deterministic and error-free function to serialize an Any."""
+  type_url, value = data.type_url, data.value
   buf = io.BytesIO()
-  buf.truncate(_size_any(data))
-  _write_any_bytes(data, buf.write)
+  buf.truncate(_size_any_fields(type_url, value))
+  _write_any_fields(type_url, value, buf.write)
   return buf.getvalue()
@@ -17,6 +17,7 @@ from unittest import mock
 import test_env
 
 from recipe_engine.internal.commands.analyze import cmd as analyze
+from recipe_engine.internal.commands.analyze.index import DepsIndex
 from PB.recipe_engine.analyze import Input, Output
 
 
@@ -196,6 +197,68 @@ class AnalyzeTest(test_env.RecipeEngineUnitTest):
       ))
     self.assertEqual(result, Output())
 
+  def testSharedDependencyAndResources(self):
+    result = self._run(self.MockRecipeDeps(
+        {
+          'foo_module': ['bar_module'],
+          'bar_module': [],
+          'baz_module': [],
+        },
+        {
+          'run_test': ['foo_module'],
+          'run_other_test': ['bar_module'],
+          'last_recipe': ['baz_module'],
+          'unused_recipe': ['bar_module'],
+        }
+      ), git_attr_files=[], in_data=Input(
+          files=[
+            'recipe_modules/bar_module/api.py',
+            'recipes/last_recipe.resources/script.py',
+          ],
+          recipes=['run_test', 'run_other_test', 'last_recipe'],
+      ))
+    self.assertEqual(result, Output(
+      recipes=sorted(['run_test', 'run_other_test', 'last_recipe']),
+    ))
+
+
+class DepsIndexTest(test_env.RecipeEngineUnitTest):
+  def _recipe(self, path, DEPS):
+    # pylint: disable=invalid-name
+    return mock.Mock(path=path, normalized_DEPS=DEPS)
+
+  def testCachedOnDisk(self):
+    index_path = os.path.join(self.tempdir(), 'deps_index.json')
+    recipe_path = self.tempfile()
+    with open(recipe_path, 'w') as f:
+      f.write('DEPS = ["foo"]')
+
+    index = DepsIndex(index_path)
+    self.assertEqual(
+        index.recipe(self._recipe(recipe_path, {'foo': ('main', 'foo')})),
+        [('main', 'foo')])
+    index.save()
+
+    # Unchanged files are served from the cache.
+    index = DepsIndex(index_path)
+    self.assertEqual(
+        index.recipe(self._recipe(recipe_path, {'bar': ('main', 'bar')})),
+        [('main', 'foo')])
+
+    # Changed files are not.
+    with open(recipe_path, 'w') as f:
+      f.write('DEPS = ["bar", "baz"]')
+    self.assertEqual(
+        index.recipe(self._recipe(recipe_path, {'bar': ('main', 'bar')})),
+        [('main', 'bar')])
+
+  def testInMemory(self):
+    index = DepsIndex()
+    self.assertEqual(
+        index.recipe(self._recipe('/does/not/exist.py', {'foo': ('a', 'b')})),
+        [('a', 'b')])
+    index.save()
+
 
 class AnalyzeSmokeTest(test_env.RecipeEngineUnitTest):
   """Small smoke test that makes sure analyze works.
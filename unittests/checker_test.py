@@ -15,6 +15,8 @@ from collections import OrderedDict
 
 import test_env
 
+import attr
+
 from recipe_engine.post_process_inputs import Command
 from recipe_engine.recipe_test_api import PostprocessHookContext, RecipeTestApi
 from recipe_engine.internal.test.magic_check_fn import \
@@ -592,6 +594,60 @@ class TestPostProcessHooks(test_env.RecipeEngineUnitTest):
     ])
     self.assertEqual(len(results.check), 0)
 
+  def test_mutation_without_return(self):
+    d = OrderedDict([
+        ('x', {'name': 'x', 'cmd': ['one', 'two', 'three']}),
+        ('y', {'name': 'y', 'cmd': []}),
+    ])
+    def mutate(check, steps):
+      steps['x'].cmd.append('four')
+      steps['y'].cwd = 'cwd'
+    def body(check, steps):
+      check(steps['x'].cmd == ['one', 'two', 'three'])
+      check(steps['y'].cwd == '')
+    api = self.mkApi()
+    test_data = api.post_process(mutate) + api.post_check(body)
+    results = Outcome.Results()
+    expectations = post_process(results, d, test_data)
+    self.assertEqual(expectations, [
+        {'name': 'x', 'cmd': ['one', 'two', 'three']},
+        {'name': 'y', 'cmd': []},
+    ])
+    self.assertEqual(len(results.check), 0)
+
+  def test_untouched_steps_pass_through(self):
+    x = {'name': 'x', 'cmd': ['one', 'two', 'three']}
+    d = OrderedDict([
+        ('x', x),
+        ('y', {'name': 'y', 'cmd': []}),
+    ])
+    def drop_y(check, steps):
+      del steps['y']
+      return steps
+    test_data = self.mkApi().post_process(drop_y)
+    expectations = post_process(Outcome.Results(), d, test_data)
+    self.assertEqual(expectations, [x])
+    self.assertIs(expectations[0], x)
+
+  def test_evolve_untouched_step(self):
+    d = OrderedDict([
+        ('x', {'name': 'x', 'cmd': ['one', 'two', 'three']}),
+        ('y', {'name': 'y', 'cmd': []}),
+    ])
+    def evolve_x(check, steps):
+      steps['x'] = attr.evolve(steps['x'], cmd=['one'])
+      check(type(steps['x']) is Step)
+      check(vars(steps['y'])['cmd'] == [])
+      return steps
+    results = Outcome.Results()
+    expectations = post_process(
+        results, d, self.mkApi().post_process(evolve_x))
+    self.assertEqual(expectations, [
+        {'name': 'x', 'cmd': ['one']},
+        {'name': 'y', 'cmd': []},
+    ])
+    self.assertEqual(len(results.check), 0)
+
   def test_post_process_failure(self):
     d = OrderedDict([('x', {'name': 'x'})])
     def body(check, steps, *args, **kwargs):
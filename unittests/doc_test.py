@@ -10,9 +10,15 @@ import os
 import subprocess
 import sys
 
+from unittest import mock
+
 import test_env
 
 from recipe_engine.internal.commands.doc import cmd as doc
+from recipe_engine.internal.commands.doc.cache import DocCache
+
+from PB.recipe_engine.doc import Doc
+from PB.recipe_engine.recipes_cfg import RepoSpec
 
 
 class DocSmokeTest(test_env.RecipeEngineUnitTest):
@@ -43,5 +49,54 @@ class TestMockImports(test_env.RecipeEngineUnitTest):
         self.fail('failed to import %r: %s' % (mod, ex))
 
 
+class TestDocCache(test_env.RecipeEngineUnitTest):
+  def setUp(self):
+    super().setUp()
+    self.root = self.tempdir()
+    self.repo = mock.Mock(recipes_cfg_pb2=RepoSpec(repo_name='main'))
+    self.repo.name = 'main'
+    self.recipe_path = os.path.join(self.tempdir(), 'recipe.py')
+    with open(self.recipe_path, 'w') as f:
+      f.write('"""Docs."""')
+
+  def _get(self, cache, docstring):
+    parse = mock.Mock(return_value=Doc.Recipe(docstring=docstring))
+    ret = cache.get(Doc.Recipe, 'recipes/recipe.py', [self.recipe_path], parse)
+    return ret.docstring, parse.called
+
+  def test_cached(self):
+    self.assertEqual(self._get(DocCache(self.root, self.repo), 'Docs.'),
+                     ('Docs.', True))
+    self.assertEqual(self._get(DocCache(self.root, self.repo), 'Other.'),
+                     ('Docs.', False))
+
+    with open(self.recipe_path, 'w') as f:
+      f.write('"""Other."""')
+    self.assertEqual(self._get(DocCache(self.root, self.repo), 'Other.'),
+                     ('Other.', True))
+
+  def test_prune(self):
+    cache = DocCache(self.root, self.repo)
+    self._get(cache, 'Docs.')
+    with open(self.recipe_path, 'w') as f:
+      f.write('"""Other."""')
+    self._get(cache, 'Other.')
+    partition = os.path.join(self.root, 'main', os.listdir(
+        os.path.join(self.root, 'main'))[0])
+    self.assertEqual(len(os.listdir(partition)), 2)
+
+    cache = DocCache(self.root, self.repo)
+    self._get(cache, 'Other.')
+    cache.prune()
+    self.assertEqual(len(os.listdir(partition)), 1)
+
+    # Changing recipes.cfg invalidates everything.
+    self.repo.recipes_cfg_pb2.deps['other'].url = 'https://example.com'
+    cache = DocCache(self.root, self.repo)
+    self.assertEqual(self._get(cache, 'Other.'), ('Other.', True))
+    cache.prune()
+    self.assertFalse(os.path.exists(partition))
+
+
 if __name__ == '__main__':
   test_env.main()
@@ -134,6 +134,7 @@ class MockRecipe:
        recipe_deps.parse_deps_spec().
     """
     self.repo = repo
+    self.name = name
     self.path = os.path.join(repo.path, 'recipes', name) + '.py'
     self.resources_dir = os.path.join(repo.path, 'recipes', name) + '.resources'
     # pylint: disable=invalid-name
@@ -449,6 +449,91 @@ class TestProtoSupport(test_env.RecipeEngineUnitTest):
     self.assertEqual(retcode, 0, output)
     self.assertProtoInOutput({"field": "norp", "fweep": "dorp"}, output)
 
+  def test_update_proto_file_git_index(self):
+    main = self.deps.main_repo
+    env = {'RECIPE_PROTO_GIT_INDEX': '1'}
+
+    def _write_proto(fields):
+      with main.write_file('recipes/cool.proto') as proto:
+        proto.write('''
+          syntax = "proto3";
+          package recipes.main.cool;
+          message CoolData {
+            %s
+          }
+        ''' % fields)
+      # Make the file old enough to be recorded in the scan manifest.
+      path = os.path.join(main.path, 'recipes', 'cool.proto')
+      mtime = os.stat(path).st_mtime - 60
+      os.utime(path, (mtime, mtime))
+
+    def _write_recipe(ctor):
+      with main.write_recipe('cool') as recipe:
+        recipe.imports = [
+          'from PB.recipes.main.cool import CoolData'
+        ]
+        recipe.RunSteps.write('''
+          data = CoolData(%s)
+          api.step('hello!', ['echo', _dumps(data)])
+        ''' % ctor)
+
+    _write_proto('string field = 1;')
+    _write_recipe('field="norp"')
+    main.commit('cool proto')
+
+    output, retcode = main.recipes_py('run', 'cool', env=env)
+    self.assertEqual(retcode, 0, output)
+    self.assertProtoInOutput({"field": "norp"}, output)
+
+    # The modified (uncommitted) file must not use the blob hash in the index.
+    _write_proto('string field = 1; string fweep = 2;')
+    _write_recipe('field="norp", fweep="dorp"')
+
+    output, retcode = main.recipes_py('run', 'cool', env=env)
+    self.assertEqual(retcode, 0, output)
+    self.assertProtoInOutput({"field": "norp", "fweep": "dorp"}, output)
+
+  def test_incremental_compile_recompiles_importers(self):
+    main = self.deps.main_repo
+
+    with main.write_file('recipe_proto/main/common.proto') as proto:
+      proto.write('''
+        syntax = "proto3";
+        package main;
+        message Common {
+          string field = 1;
+        }
+      ''')
+    with main.write_file('recipe_proto/main/user.proto') as proto:
+      proto.write('''
+        syntax = "proto3";
+        package main;
+        import "main/common.proto";
+        message User {
+          Common common = 1;
+        }
+      ''')
+
+    output, retcode = main.recipes_py('fetch')
+    self.assertEqual(retcode, 0, output)
+
+    # user.proto didn't change, but must be recompiled since it imports
+    # common.proto.
+    with main.write_file('recipe_proto/main/common.proto') as proto:
+      proto.write('''
+        syntax = "proto3";
+        package main;
+        message Uncommon {
+          string field = 1;
+        }
+      ''')
+
+    output, retcode = main.recipes_py('fetch')
+    self.assertEqual(retcode, 1, output)
+    self.assertIn(
+        'BASE/recipe_proto/main/user.proto:6:3: "Common" is not defined.',
+        output.replace(main.path, 'BASE').replace('\\', '/'))
+
   def test_conflicting_proto_error(self):
     main = self.deps.main_repo
     upstream = self.deps.add_repo('upstream')
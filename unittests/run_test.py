@@ -47,6 +47,30 @@ class RunTest(test_env.RecipeEngineUnitTest):
     self.assertEqual(retcode, 0,
                      'ret code is not zero. Recipe output\n%s' % output)
 
+  def test_debug_log_only_for_failed_steps(self):
+    deps = self.FakeRecipeDeps()
+
+    with deps.main_repo.write_recipe('my_recipe') as recipe:
+      recipe.DEPS = ['recipe_engine/step']
+      recipe.RunSteps.write('''
+        api.step('good', ['echo', 'thing'])
+        try:
+          api.step('bad', ['false'])
+        except api.step.StepFailure:
+          pass
+      ''')
+      recipe.GenTests.write('pass')
+
+    output, retcode = deps.main_repo.recipes_py('run', 'my_recipe')
+    self.assertEqual(retcode, 0,
+                     'ret code is not zero. Recipe output\n%s' % output)
+    debug_steps = [
+        section.split('@@@', 1)[0]
+        for section in output.split('@@@STEP_CURSOR@')
+        if '@@@STEP_LOG_END@$debug@@@' in section
+    ]
+    self.assertEqual(debug_steps, ['bad'], output)
+
   def test_run_incomplete_deps(self):
     deps = self.FakeRecipeDeps()
 
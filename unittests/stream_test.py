@@ -6,9 +6,14 @@
 from __future__ import annotations
 
 from io import StringIO
+import zlib
 
 import test_env
 
+from PB.go.chromium.org.luci.buildbucket.proto.build import Build
+from PB.go.chromium.org.luci.buildbucket.proto import common
+
+from recipe_engine.internal.stream import luci
 from recipe_engine.internal.stream.annotator import AnnotatorStreamEngine
 from recipe_engine.internal.stream.invariants import StreamEngineInvariants
 from recipe_engine.internal.stream.simulator import SimulationStreamEngine
@@ -147,5 +152,43 @@ bar tries to kiss foo, but foo already left
       with self.assertRaises(AssertionError):
         foo.set_step_tag("", "")
 
+
+class BuildEncoderTest(test_env.RecipeEngineUnitTest):
+  def _decode(self, data):
+    return Build.FromString(zlib.decompress(data))
+
+  def test_adler32_combine(self):
+    a, b = b'hello ' * 1000, b'world' * 70000
+    self.assertEqual(
+        luci._adler32_combine(zlib.adler32(a), zlib.adler32(b), len(b)),
+        zlib.adler32(a + b))
+
+  def test_encode(self):
+    build = Build(status=common.STARTED)
+    build.output.properties['foo'] = 'bar'
+    encoder = luci._BuildEncoder(build)
+    self.assertEqual(self._decode(encoder.encode()), build)
+
+    for i in range(luci._STEP_GROUP_SIZE * 3 + 1):
+      build.steps.add(name='step %d' % i, status=common.SCHEDULED)
+      encoder.step_changed(i)
+    self.assertEqual(self._decode(encoder.encode()), build)
+
+    # Only reported changes to steps are picked up...
+    build.steps[5].status = common.SUCCESS
+    build.steps[luci._STEP_GROUP_SIZE + 1].status = common.FAILURE
+    encoder.step_changed(5)
+    build.summary_markdown = 'hi'
+    decoded = self._decode(encoder.encode())
+    self.assertEqual(decoded.steps[5].status, common.SUCCESS)
+    self.assertEqual(decoded.steps[luci._STEP_GROUP_SIZE + 1].status,
+                     common.SCHEDULED)
+    self.assertEqual(decoded.summary_markdown, 'hi')
+
+    # ... until the encoder is invalidated.
+    encoder.invalidate()
+    self.assertEqual(self._decode(encoder.encode()), build)
+
+
 if __name__ == '__main__':
   test_env.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env vpython3
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+import gevent
+
+import test_env
+
+# pylint: disable=import-error
+from PB.recipe_engine.internal.test.runner import Description
+
+from recipe_engine.internal.commands.test.scheduler import AffinityScheduler
+
+
+def _desc(recipe, test):
+  return Description(recipe_name=recipe, test_name=test)
+
+
+def _names(descs):
+  return [(d.recipe_name, d.test_name) for d in descs]
+
+
+class AffinitySchedulerTest(test_env.RecipeEngineUnitTest):
+  def _drain(self, sched, runner):
+    ret = []
+    while (desc := sched.get(runner)) is not None:
+      ret.append(desc)
+    return ret
+
+  def test_recipe_stays_on_runner(self):
+    sched = AffinityScheduler()
+    for test in ('a', 'b', 'c'):
+      sched.put(_desc('foo', test))
+      sched.put(_desc('bar', test))
+    sched.close()
+
+    self.assertEqual(_names([sched.get(1), sched.get(2), sched.get(1)]), [
+        ('foo', 'a'),
+        ('bar', 'a'),
+        ('foo', 'b'),
+    ])
+
+  def test_prefers_overlapping_deps(self):
+    sched = AffinityScheduler()
+    sched.put(_desc('first', 'a'), ['x/mod1', 'x/mod2'])
+    sched.put(_desc('unrelated', 'a'), ['x/other'])
+    sched.put(_desc('related', 'a'), ['x/mod2'])
+    sched.close()
+
+    self.assertEqual(_names(self._drain(sched, 1)), [
+        ('first', 'a'),
+        ('related', 'a'),
+        ('unrelated', 'a'),
+    ])
+
+  def test_steals_from_tail(self):
+    sched = AffinityScheduler()
+    for test in ('a', 'b', 'c', 'd'):
+      sched.put(_desc('foo', test))
+    sched.close()
+
+    self.assertEqual(_names([sched.get(1)]), [('foo', 'a')])
+    self.assertEqual(_names([sched.get(2)]), [('foo', 'd')])
+    self.assertEqual(_names(self._drain(sched, 1)), [
+        ('foo', 'b'),
+        ('foo', 'c'),
+    ])
+    self.assertIsNone(sched.get(2))
+
+  def test_late_cases_return_to_owner(self):
+    sched = AffinityScheduler()
+    sched.put(_desc('foo', 'a'))
+    self.assertEqual(_names([sched.get(1)]), [('foo', 'a')])
+
+    sched.put(_desc('bar', 'a'))
+    sched.put(_desc('foo', 'b'))
+    sched.close()
+    self.assertEqual(_names(self._drain(sched, 1)), [
+        ('foo', 'b'),
+        ('bar', 'a'),
+    ])
+
+  def test_no_steal_before_close(self):
+    sched = AffinityScheduler()
+    sched.put(_desc('foo', 'a'))
+    self.assertEqual(_names([sched.get(1)]), [('foo', 'a')])
+
+    # Neither the busy runner 1 nor the idle runner 2 takes foo.b from the
+    # runner which owns foo.
+    sched.put(_desc('foo', 'b'))
+    idle = gevent.spawn(sched.get, 2)
+    gevent.sleep()
+    self.assertFalse(idle.ready())
+    self.assertEqual(_names([sched.get(1)]), [('foo', 'b')])
+
+    # The same holds while the owner is waiting for more work.
+    owner = gevent.spawn(sched.get, 1)
+    gevent.sleep()
+    sched.put(_desc('foo', 'c'))
+    gevent.sleep()
+    self.assertEqual(_names([owner.get()]), [('foo', 'c')])
+    self.assertFalse(idle.ready())
+
+    sched.put(_desc('bar', 'a'))
+    sched.close()
+    self.assertEqual(_names([idle.get()]), [('bar', 'a')])
+    self.assertIsNone(sched.get(1))
+    self.assertIsNone(sched.get(2))
+
+  def test_get_blocks_until_put(self):
+    sched = AffinityScheduler()
+    waiter = gevent.spawn(self._drain, sched, 1)
+    gevent.sleep()
+    sched.put(_desc('foo', 'a'))
+    gevent.sleep()
+    sched.put(_desc('foo', 'b'))
+    sched.close()
+    self.assertEqual(_names(waiter.get()), [('foo', 'a'), ('foo', 'b')])
+
+
+if __name__ == '__main__':
+  test_env.main()
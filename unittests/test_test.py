@@ -9,6 +9,9 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import shutil
+import signal
+import sys
 
 from io import StringIO
 from unittest import mock
@@ -22,10 +25,11 @@ import re
 
 import test_env
 
-from PB.recipe_engine.internal.test.runner import Outcome
+from PB.recipe_engine.internal.test.runner import DaemonRequest, Outcome
 
 from recipe_engine.internal.commands import test as test_parser
-from recipe_engine.internal.commands.test import test_name
+from recipe_engine.internal.commands.test import daemon, engine_sources
+from recipe_engine.internal.commands.test import runner, test_name
 
 # pylint: disable=missing-docstring
 
@@ -37,13 +41,14 @@ class Common(test_env.RecipeEngineUnitTest):
 
   def _run_test(self, *args, **kwargs):
     should_fail = kwargs.pop('should_fail', False)
+    env = kwargs.pop('env', {})
     self.assertDictEqual(
         kwargs, {}, 'got additional unexpected kwargs: {!r}'.format(kwargs))
 
     json_out = self.tempfile()
     full_args = ['test'] + list(args) + ['--json', json_out]
 
-    output, retcode = self.main.recipes_py(*full_args)
+    output, retcode = self.main.recipes_py(*full_args, env=env)
     expected_retcode = 1 if should_fail else 0
     self.assertEqual(
         retcode, expected_retcode,
@@ -242,6 +247,22 @@ class TestRun(Common):
         self._run_test('run').data,
         self._outcome_json())
 
+  def test_expectation_failure_type(self):
+    with self.main.write_recipe('foo') as recipe:
+      recipe.RunSteps.write(
+          'api.step("test", ["echo", "bar"], infra_step=True)')
+      # Equal in python (1 == True), but not in JSON.
+      recipe.expectation['basic'] = [
+        {'cmd': ['echo', 'bar'], 'name': 'test', 'infra_step': 1},
+        {'name': '$result'},
+      ]
+
+    self.assertDictEqual(
+        self._run_test('run', should_fail=True).data,
+        self._outcome_json(per_test={
+          'foo.basic': [self.OutcomeType.diff],
+        }))
+
   def test_recipe_not_covered(self):
     with self.main.write_recipe('foo') as recipe:
       recipe.RunSteps.write('''
@@ -353,6 +374,194 @@ class TestRun(Common):
         self._run_test('run').data,
         self._outcome_json())
 
+  def test_unpicklable_test_data(self):
+    # The lambda can't be pickled, so the runner has to fall back to running
+    # GenTests itself for 'second'.
+    with self.main.write_recipe('foo') as recipe:
+      recipe.imports = ['from recipe_engine import post_process']
+      recipe.GenTests.write('''
+        yield (api.test('first')
+          + api.post_check(post_process.DoesNotRun, 'bar')
+        )
+        yield (api.test('second')
+          + api.post_check(lambda check, steps: check('bar' not in steps))
+        )
+      ''')
+
+    self.assertDictEqual(
+        self._run_test('train').data,
+        self._outcome_json(per_test={
+          'foo.first': [self.OutcomeType.written],
+          'foo.second': [self.OutcomeType.written],
+        }))
+    self.assertDictEqual(
+        self._run_test('run').data,
+        self._outcome_json(per_test={
+          'foo.first': [],
+          'foo.second': [],
+        }))
+
+  def test_result_cache(self):
+    with self.main.write_module('foo_module') as mod:
+      mod.api.write('''
+        def step_name(self):
+          return 'step'
+      ''')
+    with self.main.write_recipe('foo_module', 'examples/full') as recipe:
+      recipe.DEPS = ['recipe_engine/step', 'foo_module']
+      recipe.RunSteps.write('api.step(api.foo_module.step_name(), None)')
+    self._run_test('train')
+
+    def _durations(*args, engine=None):
+      timing = self.tempfile()
+      if engine is None:
+        self._run_test('run', '--dump-timing-info', timing, *args)
+      else:
+        output, retcode = self.main.recipes_py(
+            '-O', 'recipe_engine=' + engine, 'test', 'run',
+            '--dump-timing-info', timing, *args)
+        self.assertEqual(retcode, 0, output)
+      with open(timing) as f:
+        return f.read()
+
+    # Cached tests report the duration of the run which cached them.
+    first = _durations()
+    self.assertEqual(_durations(), first)
+    self.assertNotEqual(_durations('--no-result-cache'), first)
+
+    # Any change to the engine invalidates the cache, including its turboci
+    # package. The checkout in .recipe_deps is reset on every run, so change a
+    # copy of it instead.
+    engine = os.path.join(self.tempdir(), 'recipe_engine')
+    shutil.copytree(
+        os.path.join(self.deps.recipe_deps_path, 'recipe_engine'), engine,
+        ignore=shutil.ignore_patterns('.git'))
+    second = _durations(engine=engine)
+    self.assertEqual(_durations(engine=engine), second)
+    with open(os.path.join(engine, 'turboci', 'utils', 'value', 'digest.py'),
+              'a') as f:
+      f.write('\n# changed\n')
+    self.assertNotEqual(_durations(engine=engine), second)
+
+    api_path = os.path.join('recipe_modules', 'foo_module', 'api.py')
+    api_code = self.main.read_file(api_path)
+    with self.main.write_file(api_path) as buf:
+      buf.write(api_code.replace("'step'", "'new step'"))
+    self.assertDictEqual(
+        self._run_test('run', should_fail=True).data,
+        self._outcome_json(per_test={
+          'foo_module:examples/full.basic': [self.OutcomeType.diff],
+        }))
+
+  def test_changed_since(self):
+    with self.main.write_module('foo_module') as mod:
+      mod.api.write('''
+        def step_name(self):
+          return 'step'
+      ''')
+    with self.main.write_recipe('uses_module') as recipe:
+      recipe.DEPS = ['recipe_engine/step', 'foo_module']
+      recipe.RunSteps.write('api.step(api.foo_module.step_name(), None)')
+    with self.main.write_recipe('foo'):
+      pass
+    with self.main.write_recipe('bar'):
+      pass
+    self.main.commit('initial')
+
+    with self.main.write_recipe('bar') as recipe:
+      recipe.RunSteps.write('api.step("test", ["echo", "bar"])')
+    self.assertDictEqual(
+        self._run_test(
+            'run', '--changed-since', 'HEAD', should_fail=True).data,
+        self._outcome_json(per_test={
+          'bar.basic': [self.OutcomeType.diff],
+        }, coverage=0, uncovered_mods=['foo_module']))
+    self.main.commit('change bar')
+
+    api_path = os.path.join('recipe_modules', 'foo_module', 'api.py')
+    api_code = self.main.read_file(api_path)
+    with self.main.write_file(api_path) as buf:
+      buf.write(api_code.replace("'step'", "'new step'"))
+    self.assertDictEqual(
+        self._run_test(
+            'run', '--changed-since', 'HEAD', should_fail=True).data,
+        self._outcome_json(per_test={
+          'uses_module.basic': [self.OutcomeType.diff],
+        }, coverage=0, uncovered_mods=['foo_module']))
+
+    self.assertDictEqual(
+        self._run_test('run', '--changed-since', 'HEAD~1',
+                       should_fail=True).data,
+        self._outcome_json(per_test={
+          'bar.basic': [self.OutcomeType.diff],
+          'uses_module.basic': [self.OutcomeType.diff],
+        }, coverage=0, uncovered_mods=['foo_module']))
+
+    # Python files outside of recipes and modules may be imported by anything.
+    with self.main.write_file(os.path.join('scripts', 'helper.py')) as buf:
+      buf.write('X = 1\n')
+    result = self._run_test(
+        'run', '--changed-since', 'HEAD', should_fail=True)
+    self.assertEqual(sorted(result.data['test_results']),
+                     ['bar.basic', 'foo.basic', 'uses_module.basic'])
+
+  def _stop_daemons(self, daemon_dir):
+    for fname in os.listdir(daemon_dir):
+      if fname.endswith('.sock'):
+        sock, _, rsp = daemon._request(
+            os.path.join(daemon_dir, fname), DaemonRequest(ping=True))
+        sock.close()
+        if rsp:
+          os.kill(rsp.pid, signal.SIGTERM)
+
+  def test_daemon(self):
+    env = {'TMPDIR': self.tempdir()}
+    try:
+      self._test_daemon(env)
+    finally:
+      self._stop_daemons(env['TMPDIR'])
+
+  def _test_daemon(self, env):
+    with self.main.write_module('foo_module') as mod:
+      mod.api.write('''
+        def step_name(self):
+          return 'first'
+      ''')
+    with self.main.write_recipe('foo_module', 'examples/full') as recipe:
+      recipe.DEPS = ['recipe_engine/step', 'foo_module']
+      recipe.RunSteps.write('api.step(api.foo_module.step_name(), None)')
+      del recipe.expectation['basic']
+
+    test_name = 'foo_module:examples/full.basic'
+    self.assertDictEqual(
+        self._run_test('train', '--daemon', env=env).data,
+        self._outcome_json(per_test={
+          test_name: [self.OutcomeType.written],
+        }))
+    self.assertDictEqual(
+        self._run_test('run', '--daemon', env=env).data,
+        self._outcome_json(per_test={test_name: []}))
+    # Without coverage, runners use the modules imported by the daemon.
+    result = self._run_test('run', '--daemon', '--filter', test_name,
+                            '--jobs', '3', env=env)
+    self.assertDictEqual(
+        result.data, self._outcome_json(per_test={test_name: []}, coverage=0))
+    # All the runners (not only the first, which covers module imports) are
+    # forked by the daemon.
+    self.assertNotIn('falling back', result.text_output)
+
+    # The daemon should pick up the changed module.
+    api_path = os.path.join('recipe_modules', 'foo_module', 'api.py')
+    api_code = self.main.read_file(api_path)
+    with self.main.write_file(api_path) as buf:
+      buf.write(api_code.replace("'first'", "'second'"))
+    self.assertDictEqual(
+        self._run_test('run', '--daemon', '--filter', test_name,
+                       should_fail=True, env=env).data,
+        self._outcome_json(per_test={
+          test_name: [self.OutcomeType.diff],
+        }, coverage=0))
+
   def test_docs_change(self):
     with self.main.write_recipe('foo'):
       pass
@@ -723,6 +932,45 @@ class TestRun(Common):
           'foo_module:examples/full.basic': [],
         }))
 
+  def test_module_instances_per_test_case(self):
+    # The test cases of a recipe share its module graph, but each one gets its
+    # own api and test_api objects.
+    with self.main.write_module('foo_module') as mod:
+      mod.api.write('''
+        def step_name(self):
+          return self.test_api.next_name()
+      ''')
+      mod.test_api.write('''
+        def __init__(self, *args, **kwargs):
+          super().__init__(*args, **kwargs)
+          self._count = 0
+
+        def next_name(self):
+          self._count += 1
+          return 'step %d' % self._count
+      ''')
+
+    with self.main.write_recipe('foo_module', 'examples/full') as recipe:
+      recipe.DEPS = ['recipe_engine/step', 'foo_module']
+      recipe.RunSteps.write('api.step(api.foo_module.step_name(), None)')
+      recipe.GenTests.write('''
+        yield api.test("first")
+        yield api.test("second")
+      ''')
+      del recipe.expectation['basic']
+      for name in ('first', 'second'):
+        recipe.expectation[name] = [
+          {'cmd': [], 'name': 'step 1'},
+          {'name': '$result'},
+        ]
+
+    self.assertDictEqual(
+        self._run_test('run', '--jobs', '1').data,
+        self._outcome_json(per_test={
+          'foo_module:examples/full.first': [],
+          'foo_module:examples/full.second': [],
+        }))
+
   def test_duplicate(self):
     with self.main.write_recipe('foo') as recipe:
       recipe.GenTests.write('''
@@ -1138,5 +1386,27 @@ class TestFilter(test_env.RecipeEngineUnitTest):
     self.assertFalse(filt.recipe_name('module:tests/other.test_case'))
 
 
+class TestEngineSources(test_env.RecipeEngineUnitTest):
+  def test_covers_loaded_modules(self):
+    sources = set(engine_sources.engine_sources(test_env.ROOT_DIR))
+    self.assertIn(runner.__file__, sources)
+
+    # Every module which the engine loaded from its own repo (other than
+    # recipes and recipe modules) should be covered.
+    loaded = set()
+    for module in list(sys.modules.values()):
+      path = getattr(module, '__file__', None)
+      if not path:
+        continue
+      rel = os.path.relpath(path, test_env.ROOT_DIR)
+      if rel.split(os.sep, 1)[0] in (os.pardir, '.recipe_deps', 'unittests',
+                                     'recipe_modules', 'recipes'):
+        continue
+      loaded.add(os.path.abspath(path))
+    self.assertTrue(any(path.startswith(
+        os.path.join(test_env.ROOT_DIR, 'turboci', '')) for path in loaded))
+    self.assertEqual(loaded - sources, set())
+
+
 if __name__ == '__main__':
   test_env.main()
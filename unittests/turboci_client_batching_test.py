@@ -0,0 +1,228 @@
+#!/usr/bin/env vpython3
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+import asyncio
+
+import test_env
+
+from PB.turboci.graph.ids.v1.identifier import WorkPlan
+from PB.turboci.graph.orchestrator.v1.query import Query
+from PB.turboci.graph.orchestrator.v1.write_nodes_request import WriteNodesRequest
+
+from recipe_engine import turboci
+from recipe_engine.internal.turboci.fake import FakeTurboCIOrchestrator
+from turboci.utils import client
+
+
+class _FakeTransport:
+  """Sends calls to an in-process FakeTurboCIOrchestrator."""
+
+  def __init__(self, fake: FakeTurboCIOrchestrator):
+    self.fake = fake
+    self.calls: list[WriteNodesRequest] = []
+
+  def call_unary(self, method_name, request, options=None):
+    _ = options
+    self.calls.append(request)
+    return getattr(self.fake, method_name)(request)
+
+
+class _FakeAsyncTransport(_FakeTransport):
+
+  def __init__(self, fake: FakeTurboCIOrchestrator):
+    super().__init__(fake)
+    self.in_flight = 0
+    self.max_in_flight = 0
+
+  async def call_unary(self, method_name, request, options=None):
+    self.in_flight += 1
+    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      await asyncio.sleep(0.01)
+      return super().call_unary(method_name, request, options)
+    finally:
+      self.in_flight -= 1
+
+
+def _write(*checks: WriteNodesRequest.CheckWrite,
+           reason='test write') -> WriteNodesRequest:
+  return WriteNodesRequest(reason=turboci.reason(reason), checks=checks)
+
+
+class BatchingSyncTest(test_env.RecipeEngineUnitTest):
+
+  def setUp(self):
+    super().setUp()
+    self.fake = FakeTurboCIOrchestrator(test_mode=True)
+    self.transport = _FakeTransport(self.fake)
+    self.client = client.Sync(wpid=WorkPlan(), transport=self.transport)
+
+  def batcher(self, **kwargs) -> client.BatchingSync:
+    kwargs.setdefault('window_sec', 60)
+    ret = client.BatchingSync(
+        client=self.client, opts=client.BatchOptions(**kwargs))
+    self.addCleanup(ret.close)
+    return ret
+
+  def check_ids(self):
+    return {
+        c.identifier.id for c in turboci.query_nodes(
+            turboci.make_query(Query.SelectChecks()),
+            client=self.fake).workplans[0].checks
+    }
+
+  def test_coalesce(self):
+    batcher = self.batcher()
+    futs = [
+        batcher.write(_write(turboci.check(f'c{i}', kind='CHECK_KIND_BUILD')))
+        for i in range(10)
+    ]
+    batcher.flush()
+
+    self.assertEqual(len(self.transport.calls), 1)
+    self.assertEqual(len(self.transport.calls[0].checks), 10)
+    self.assertEqual({f.result().written_version.ts.seconds for f in futs},
+                     {1})
+    self.assertEqual(self.check_ids(), {f'c{i}' for i in range(10)})
+
+  def test_write_nodes(self):
+    batcher = self.batcher()
+    batcher.write(_write(turboci.check('a', kind='CHECK_KIND_BUILD')))
+    rsp = batcher.WriteNodes(
+        _write(turboci.check('b', kind='CHECK_KIND_BUILD')))
+
+    self.assertEqual(rsp.written_version.ts.seconds, 1)
+    self.assertEqual(len(self.transport.calls), 1)
+    self.assertEqual(self.check_ids(), {'a', 'b'})
+
+  def test_window(self):
+    batcher = self.batcher(window_sec=0.01)
+    fut = batcher.write(_write(turboci.check('a', kind='CHECK_KIND_BUILD')))
+    self.assertEqual(fut.result(timeout=10).written_version.ts.seconds, 1)
+
+  def test_max_writes(self):
+    batcher = self.batcher(max_writes=4)
+    for i in range(10):
+      batcher.write(_write(turboci.check(f'c{i}', kind='CHECK_KIND_BUILD')))
+    batcher.flush()
+
+    self.assertEqual([len(req.checks) for req in self.transport.calls],
+                     [4, 4, 2])
+
+  def test_max_request_bytes(self):
+    req = _write(turboci.check('c0', kind='CHECK_KIND_BUILD'))
+    batcher = self.batcher(max_request_bytes=req.ByteSize() * 2)
+    for i in range(4):
+      batcher.write(_write(turboci.check(f'c{i}', kind='CHECK_KIND_BUILD')))
+    batcher.flush()
+
+    self.assertEqual([len(req.checks) for req in self.transport.calls], [2, 2])
+
+  def test_incompatible(self):
+    batcher = self.batcher(max_in_flight=1)
+    batcher.write(_write(turboci.check('a', kind='CHECK_KIND_BUILD')))
+    # Same check again.
+    batcher.write(_write(turboci.check('a', state='CHECK_STATE_PLANNED')))
+    # Different reason.
+    batcher.write(
+        _write(turboci.check('b', kind='CHECK_KIND_BUILD'), reason='other'))
+    # Transactional.
+    txn = _write(turboci.check('c', kind='CHECK_KIND_BUILD'))
+    txn.txn.SetInParent()
+    batcher.write(txn)
+    batcher.write(_write(turboci.check('d', kind='CHECK_KIND_BUILD')))
+    batcher.flush()
+
+    self.assertEqual(
+        [[c.identifier.id for c in req.checks] for req in self.transport.calls],
+        [['a'], ['a'], ['b'], ['c'], ['d']])
+
+  def test_error_attribution(self):
+    batcher = self.batcher()
+    ok = batcher.write(_write(turboci.check('a', kind='CHECK_KIND_BUILD')))
+    bad = batcher.write(
+        _write(
+            turboci.check(
+                'b', kind='CHECK_KIND_BUILD',
+                deps=turboci.dep_group('missing'))))
+    batcher.flush()
+
+    self.assertEqual(
+        [[c.identifier.id for c in req.checks] for req in self.transport.calls],
+        [['a', 'b'], ['a'], ['b']])
+    self.assertEqual(ok.result().written_version.ts.seconds, 1)
+    with self.assertRaisesRegex(client.RPCError, 'unsatisfiable'):
+      bad.result()
+    self.assertEqual(self.check_ids(), {'a'})
+
+
+class BatchingAsyncTest(test_env.RecipeEngineUnitTest):
+
+  def setUp(self):
+    super().setUp()
+    self.fake = FakeTurboCIOrchestrator(test_mode=True)
+    self.transport = _FakeAsyncTransport(self.fake)
+    self.client = client.Async(wpid=WorkPlan(), transport=self.transport)
+
+  def test_coalesce(self):
+
+    async def _run():
+      async with client.BatchingAsync(
+          client=self.client,
+          opts=client.BatchOptions(window_sec=60)) as batcher:
+        futs = [
+            batcher.write(
+                _write(turboci.check(f'c{i}', kind='CHECK_KIND_BUILD')))
+            for i in range(10)
+        ]
+      return [f.result() for f in futs]
+
+    rsps = asyncio.run(_run())
+    self.assertEqual(len(self.transport.calls), 1)
+    self.assertEqual({rsp.written_version.ts.seconds for rsp in rsps}, {1})
+
+  def test_in_flight(self):
+
+    async def _run():
+      batcher = client.BatchingAsync(
+          client=self.client,
+          opts=client.BatchOptions(max_writes=1, max_in_flight=3))
+      futs = [
+          batcher.write(
+              _write(turboci.check(f'c{i}', kind='CHECK_KIND_BUILD')))
+          for i in range(6)
+      ]
+      await batcher.flush()
+      return await asyncio.gather(*futs)
+
+    rsps = asyncio.run(_run())
+    self.assertEqual(len(rsps), 6)
+    self.assertEqual(len(self.transport.calls), 6)
+    self.assertEqual(self.transport.max_in_flight, 3)
+
+  def test_error_attribution(self):
+
+    async def _run():
+      batcher = client.BatchingAsync(
+          client=self.client, opts=client.BatchOptions(window_sec=60))
+      ok = batcher.write(_write(turboci.check('a', kind='CHECK_KIND_BUILD')))
+      bad = batcher.write(
+          _write(
+              turboci.check(
+                  'b', kind='CHECK_KIND_BUILD',
+                  deps=turboci.dep_group('missing'))))
+      await batcher.flush()
+      return ok, bad
+
+    ok, bad = asyncio.run(_run())
+    self.assertEqual(len(self.transport.calls), 3)
+    self.assertEqual(ok.result().written_version.ts.seconds, 1)
+    self.assertIsInstance(bad.exception(), client.RPCError)
+
+
+if __name__ == '__main__':
+  test_env.main()
@@ -20,6 +20,7 @@ from google.protobuf.struct_pb2 import Struct, Value as StructValue
 from google.protobuf.proto_json import parse
 
 from PB.turboci.graph.ids.v1 import identifier
+from PB.turboci.graph.orchestrator.v1.check import Check
 from PB.turboci.graph.orchestrator.v1.check_kind import CheckKind
 from PB.turboci.graph.orchestrator.v1.check_state import CheckState
 from PB.turboci.graph.orchestrator.v1.edge import Edge
@@ -29,11 +30,13 @@ from PB.turboci.graph.orchestrator.v1.revision import Revision
 from PB.turboci.graph.orchestrator.v1.type_info import TypeInfo
 from PB.turboci.graph.orchestrator.v1.type_set import TypeSet
 from PB.turboci.graph.orchestrator.v1.value_write import ValueWrite
+from PB.turboci.graph.orchestrator.v1.workplan import WorkPlan
 from PB.turboci.graph.orchestrator.v1.write_nodes_request import WriteNodesRequest
 
 from recipe_engine.internal.turboci import common
 from recipe_engine.turboci import (write_nodes, reason, check, dep_group,
-                                   check_id, query_nodes, make_query)
+                                   check_id, query_nodes, make_query,
+                                   checks_by_short_id)
 
 from turboci.utils import value
 
@@ -240,5 +243,35 @@ class TestWriteNodes(test_env.RecipeEngineUnitTest):
         ))
 
 
+class TestWorkPlanLookup(test_env.RecipeEngineUnitTest):
+  def _workplan(self) -> WorkPlan:
+    ret = WorkPlan()
+    ret.checks.add(identifier=check_id('a'), kind='CHECK_KIND_BUILD')
+    ret.checks.add(identifier=check_id('b'))
+    ret.checks.add(identifier=check_id('a'), kind='CHECK_KIND_TEST')
+    return ret
+
+  def test_checks_by_short_id(self):
+    workplan = self._workplan()
+    checks = checks_by_short_id(workplan)
+    self.assertEqual(sorted(checks), ['a', 'b'])
+    # Same as get_check_by_short_id, the first duplicate wins.
+    self.assertEqual(checks['a'], common.get_check_by_short_id(workplan, 'a'))
+    self.assertEqual(checks['a'].kind, CheckKind.CHECK_KIND_BUILD)
+
+  def test_builder(self):
+    builder = common.WorkPlanBuilder(self._workplan())
+    self.assertEqual(builder.get_check(':Ca').kind, CheckKind.CHECK_KIND_BUILD)
+    self.assertIsNone(builder.get_check(':Cc'))
+
+    added = builder.add_check(
+        Check(identifier=check_id('c'), kind='CHECK_KIND_TEST'))
+    added.state = CheckState.CHECK_STATE_FINAL
+    self.assertEqual(len(builder.workplan.checks), 4)
+    self.assertEqual(builder.get_check(':Cc'), builder.workplan.checks[3])
+    self.assertEqual(
+        builder.get_check(':Cc').state, CheckState.CHECK_STATE_FINAL)
+
+
 if __name__ == '__main__':
   test_env.main()
@@ -12,6 +12,7 @@ from PB.turboci.graph.orchestrator.v1.check import Check
 from PB.turboci.graph.orchestrator.v1.check_state import CheckState
 from PB.turboci.graph.orchestrator.v1.dependencies import Dependencies
 from PB.turboci.graph.orchestrator.v1.edge import RESOLUTION_SATISFIED, RESOLUTION_UNKNOWN, Edge
+from PB.turboci.graph.orchestrator.v1.query import QueryExpandDepsMode
 from PB.turboci.graph.orchestrator.v1.revision import Revision
 from PB.turboci.graph.orchestrator.v1.stage import Stage
 
@@ -363,6 +364,32 @@ class TestDependencyIndex(test_env.RecipeEngineUnitTest):
 
     self.assertEqual(a.dependencies.resolution, RESOLUTION_SATISFIED)
 
+  def test_walk(self):
+    # A -> {B, C}, B -> D, C -> D, D -> E
+    self.set_dependencies('A', dep_group('B', 'C'))
+    self.set_dependencies('B', dep_group('D'))
+    self.set_dependencies('C', dep_group('D'))
+    self.set_dependencies('D', dep_group('E'))
+    ident = lambda *names: {turboci.from_id(turboci.check_id(n)) for n in names}
+    edges = QueryExpandDepsMode.QUERY_EXPAND_DEPS_MODE_EDGES
+
+    self.assertEqual(self.di.dependencies_of(ident('A'), edges), ident('B', 'C'))
+    self.assertEqual(
+        self.di.dependencies_of(ident('A'), edges, depth=2),
+        ident('B', 'C', 'D'))
+    self.assertEqual(
+        self.di.dependencies_of(ident('A', 'D'), edges, depth=None),
+        ident('B', 'C', 'D', 'E'))
+
+    self.assertEqual(self.di.dependents_of(ident('D'), edges), ident('B', 'C'))
+    self.assertEqual(
+        self.di.dependents_of(ident('E'), edges, depth=None),
+        ident('A', 'B', 'C', 'D'))
+
+    # Unknown nodes have no dependencies, and aren't added to the index.
+    self.assertEqual(self.di.dependencies_of(ident('Z'), edges), set())
+    self.assertNotIn(turboci.from_id(turboci.check_id('Z')), self.di._data)
+
 
 if __name__ == '__main__':
   test_env.main()
@@ -20,6 +20,7 @@ from PB.turboci.graph.orchestrator.v1.check_state import CheckState
 from PB.turboci.graph.orchestrator.v1.dependencies import Dependencies
 from PB.turboci.graph.orchestrator.v1.edge import RESOLUTION_SATISFIED, Edge
 from PB.turboci.graph.orchestrator.v1.query import Query
+from PB.turboci.graph.orchestrator.v1.query_nodes_request import QueryNodesRequest
 from PB.turboci.graph.orchestrator.v1.value_ref import ValueRef
 
 from recipe_engine import turboci
@@ -499,6 +500,37 @@ class SimpleTurboCIFakeTest(turboci_test_helper.TestBaseClass):
     self.assertEqual(len(ret.checks), 2)
     self.assertEqual(self.check_ids(ret.checks), {':Ca', ':Cc'})
 
+  def test_query_filter_option_type_set(self):
+    self.write_nodes(
+        turboci.check('a', kind='CHECK_KIND_ANALYSIS', options=[demoStruct]),
+        turboci.check('b', kind='CHECK_KIND_BUILD', options=[demoTS]),
+        turboci.check('c', kind='CHECK_KIND_BUILD'),
+    )
+
+    def query(*atoms):
+      return self.check_ids(self.query_nodes(
+          turboci.make_query(*atoms)).workplans[0].checks)
+
+    # Checks with an option of any of the types match.
+    by_type = Query.SelectChecks.Predicate(
+        with_option_type=turboci.type_set(demoStruct, demoTS))
+    self.assertEqual(query(by_type), {':Ca', ':Cb'})
+    # Checks without options still match predicates on other fields.
+    self.assertEqual(
+        query(Query.SelectChecks.Predicate(kind='CHECK_KIND_BUILD')),
+        {':Cb', ':Cc'})
+
+    # Later writes are reflected in the results for the same type set.
+    self.write_nodes(
+        turboci.check('d', kind='CHECK_KIND_BUILD', options=[demoStruct]),
+        turboci.check('e', kind='CHECK_KIND_BUILD', options=[demoStruct2]),
+    )
+    self.assertEqual(query(by_type), {':Ca', ':Cb', ':Cd', ':Ce'})
+    self.assertEqual(
+        query(Query.SelectChecks.Predicate(
+            with_option_type=turboci.type_set(demoTS))),
+        {':Cb'})
+
   def test_query_filter_all_options(self):
     self.write_nodes(
         turboci.check('a', kind='CHECK_KIND_ANALYSIS', options=[demoStruct]),
@@ -977,5 +1009,117 @@ class SimpleTurboCIFakeTest(turboci_test_helper.TestBaseClass):
                        (v3.ts.seconds, v3.ts.nanos))
 
 
+  def test_query_snapshot(self):
+    v1 = self.write_nodes(
+        turboci.check('A', kind='CHECK_KIND_BUILD',
+                      options=[demoStruct])).written_version
+    self.write_nodes(
+        turboci.check('A', state='CHECK_STATE_PLANNED', options=[demoTS]),
+        turboci.check('B', kind='CHECK_KIND_TEST'),
+    )
+
+    ret = self.query_nodes(
+        turboci.make_query(
+            Query.SelectChecks(),
+            Query.CollectChecks(options=True),
+        ),
+        version=QueryNodesRequest.VersionRestriction(snapshot=v1),
+        types=[demoStruct, demoTS])
+    self.assertEqual(ret.version, v1)
+    self.assertEqual(self.check_ids(ret.workplans[0].checks), {':CA'})
+    check = ret.workplans[0].checks[0]
+    self.assertEqual(check.state, CheckState.CHECK_STATE_PLANNING)
+    self.assertEqual(check.version, v1)
+    self.assertEqual(
+        [opt.type_url for opt in check.options], [structURL])
+    self.assertEqual(check.options[0].inline, _mkAny(demoStruct))
+
+    # Nodes which didn't exist at the snapshot are absent.
+    ret = self.query_nodes(
+        turboci.make_query(node_set=turboci.collect_check_ids('A', 'B')),
+        version=QueryNodesRequest.VersionRestriction(snapshot=v1))
+    self.assertEqual(self.check_ids(ret.workplans[0].checks), {':CA'})
+    self.assertEqual([ident.check.id for ident in ret.absent], ['B'])
+
+    # The latest revision sees everything.
+    latest = self.query_nodes(turboci.make_query(Query.SelectChecks()))
+    ret = self.query_nodes(
+        turboci.make_query(Query.SelectChecks()),
+        version=QueryNodesRequest.VersionRestriction(snapshot=latest.version))
+    by_id = lambda resp: {c.identifier.id: c for c in resp.workplans[0].checks}
+    self.assertEqual(by_id(ret), by_id(latest))
+
+  def test_query_snapshot_predicates(self):
+    v1 = self.write_nodes(
+        turboci.check('A', kind='CHECK_KIND_BUILD'),
+        turboci.check('B', kind='CHECK_KIND_TEST', options=[demoStruct]),
+    ).written_version
+    self.write_nodes(
+        turboci.check('A', options=[demoStruct]),
+        turboci.check('C', kind='CHECK_KIND_BUILD'),
+    )
+
+    def _query(*atoms):
+      return self.query_nodes(
+          turboci.make_query(*atoms),
+          version=QueryNodesRequest.VersionRestriction(snapshot=v1),
+      ).workplans[0]
+
+    ret = _query(Query.SelectChecks.Predicate(kind='CHECK_KIND_BUILD'))
+    self.assertEqual(self.check_ids(ret.checks), {':CA'})
+    ret = _query(
+        Query.SelectChecks.Predicate(
+            with_option_type=turboci.type_set(demoStruct)))
+    self.assertEqual(self.check_ids(ret.checks), {':CB'})
+
+  def test_query_snapshot_dependents(self):
+    self.write_nodes(
+        turboci.check('A', kind='CHECK_KIND_BUILD'),
+        turboci.check(
+            'B',
+            kind='CHECK_KIND_BUILD',
+            state='CHECK_STATE_PLANNED',
+            deps=dep_group('A')),
+        turboci.check(
+            'C',
+            kind='CHECK_KIND_BUILD',
+            state='CHECK_STATE_PLANNED',
+            deps=dep_group('A')),
+    )
+    query = turboci.make_query(
+        Query.ExpandDependents(mode='QUERY_EXPAND_DEPS_MODE_SATISFIED'),
+        node_set=turboci.collect_check_ids('A'),
+    )
+    v1 = self.query_nodes(query).version
+
+    self.write_nodes(turboci.check('A', state='CHECK_STATE_FINAL'))
+    v2 = self.query_nodes(query).version
+
+    for version, expected in ((v1, {':CA'}), (v2, {':CA', ':CB', ':CC'})):
+      ret = self.query_nodes(
+          query,
+          version=QueryNodesRequest.VersionRestriction(snapshot=version))
+      self.assertEqual(self.check_ids(ret.workplans[0].checks), expected)
+
+    ret = self.query_nodes(
+        turboci.make_query(
+            Query.ExpandDependencies(mode='QUERY_EXPAND_DEPS_MODE_SATISFIED'),
+            node_set=turboci.collect_check_ids('B'),
+        ),
+        version=QueryNodesRequest.VersionRestriction(snapshot=v2))
+    self.assertEqual(self.check_ids(ret.workplans[0].checks), {':CA', ':CB'})
+    check = get_check_by_full_id(ret.workplans[0], ':CB')
+    assert check
+    self.assertEqual(check.state, CheckState.CHECK_STATE_WAITING)
+
+  def test_query_snapshot_future(self):
+    v1 = self.write_nodes(
+        turboci.check('A', kind='CHECK_KIND_BUILD')).written_version
+    future = QueryNodesRequest.VersionRestriction()
+    future.snapshot.ts.seconds = v1.ts.seconds + 1
+    with self.assertRaisesRegex(turboci.InvalidArgumentException,
+                                'newer than the latest revision'):
+      self.query_nodes(turboci.make_query(Query.SelectChecks()), version=future)
+
 if __name__ == '__main__':
   test_env.main()
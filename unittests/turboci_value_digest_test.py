@@ -0,0 +1,97 @@
+#!/usr/bin/env vpython3
+# Copyright 2026 The LUCI Authors
+# Use of this source code is governed under the Apache License, Version 2.0
+# that can be found in the LICENSE file.
+
+from __future__ import annotations
+
+import hashlib
+import random
+
+import test_env
+
+from google.protobuf.any_pb2 import Any
+
+from turboci.utils.value import digest
+from turboci.utils.value.digest import Digest
+
+
+def _any(value: bytes, type_url='type.googleapis.com/test.Value') -> Any:
+  return Any(type_url=type_url, value=value)
+
+
+class DigestTest(test_env.RecipeEngineUnitTest):
+
+  def setUp(self):
+    super().setUp()
+    cache = digest._cache
+    self.addCleanup(setattr, digest, '_cache', cache)
+    digest._cache = digest._DigestCache(max_entries=100, max_bytes=1 << 20)
+    self.rand = random.Random(0)
+
+  def assertDigestOf(self, dgst: Digest, data: Any):
+    serialized = digest.deterministially_serialize_any(data)
+    pb = dgst.to_proto()
+    self.assertEqual(pb.hash, hashlib.sha256(serialized).digest())
+    self.assertEqual(pb.size_bytes, len(serialized))
+
+  def test_compute(self):
+    for size in (0, 1, 127, 128, 10000, 300000):
+      for type_url in ('', 'type.googleapis.com/test.Value'):
+        data = _any(self.rand.randbytes(size), type_url)
+        self.assertDigestOf(Digest.compute(data), data)
+
+  def test_compute_cached(self):
+    data = _any(self.rand.randbytes(10000))
+    dgst = Digest.compute(data)
+    self.assertEqual(len(digest._cache), 1)
+    self.assertEqual(Digest.compute(_any(data.value)), dgst)
+    self.assertEqual(len(digest._cache), 1)
+
+  def test_compute_same_samples(self):
+    # These have the same _cache_key, but different values.
+    value = bytearray(self.rand.randbytes(10000))
+    a = _any(bytes(value))
+    value[2000] ^= 1
+    b = _any(bytes(value))
+
+    dgst_a, dgst_b = Digest.compute(a), Digest.compute(b)
+    self.assertNotEqual(dgst_a, dgst_b)
+    self.assertDigestOf(dgst_a, a)
+    self.assertDigestOf(dgst_b, b)
+    self.assertEqual(Digest.compute(a), dgst_a)
+    self.assertEqual(Digest.compute_many([a, b, a]), [dgst_a, dgst_b, dgst_a])
+
+  def test_compute_many(self):
+    datas = [_any(self.rand.randbytes(size)) for size in (0, 10, 10000)]
+    cached = Digest.compute(datas[1])
+
+    got = Digest.compute_many(datas + datas[::-1])
+    self.assertEqual(got[1], cached)
+    for dgst, data in zip(got, datas + datas[::-1]):
+      self.assertDigestOf(dgst, data)
+    self.assertEqual(len(digest._cache), 3)
+
+  def test_cache_bounds(self):
+    cache = digest._DigestCache(max_entries=2, max_bytes=100)
+    a, b, c = ('', b'a' * 10), ('', b'b' * 10), ('', b'c' * 10)
+    cache.put(a, Digest('A'))
+    cache.put(b, Digest('B'))
+    self.assertEqual(cache.get(a), 'A')
+    cache.put(c, Digest('C'))
+    # b was the least recently used entry.
+    self.assertIsNone(cache.get(b))
+    self.assertEqual(cache.get(a), 'A')
+    self.assertEqual(cache.get(c), 'C')
+
+    # Evicting a (the least recently used entry) makes room for d.
+    cache.put(('', b'd' * 90), Digest('D'))
+    self.assertEqual(len(cache), 2)
+    self.assertIsNone(cache.get(a))
+    self.assertEqual(cache.get(c), 'C')
+    cache.put(('', b'e' * 101), Digest('E'))
+    self.assertIsNone(cache.get(('', b'e' * 101)))
+
+
+if __name__ == '__main__':
+  test_env.main()